@@ -170,15 +170,22 @@ def generate_library(
     non_generated = [
         "__init__.py",
         "_version.py",
+        "bulk.py",
+        "codec.py",
         "config.py",
         "common.py",
+        "dispatch.py",
         "encoding.py",
         "exceptions.py",
+        "mapping_store.py",
+        "response_cache.py",
         "response_handler.py",
         "session/__init__.py",
         "session/base.py",
+        "session/sharding.py",
         "session/sync.py",
         "session/async_.py",
+        "shared_bucket.py",
         "api/__init__.py",
         "aio/__init__.py",
         "aio/api/__init__.py",
@@ -227,6 +234,8 @@ def generate_library(
     # Generate API libraries
     jinja_env = jinja2.Environment(trim_blocks=True, lstrip_blocks=True, keep_trailing_newline=True)
     jinja_env.filters["to_double_quote_list"] = lambda lst: json.dumps(lst)
+    jinja_env.filters["to_tuple"] = to_tuple_literal
+    jinja_env.filters["to_frozenset"] = to_frozenset_literal
 
     # Iterate through the scopes creating standard, asyncio and batch modules for each
     generate_modules(spec, batchable_actions, jinja_env, scopes, template_dir)
@@ -248,7 +257,23 @@ def generate_library(
     _write_generation_report(version_number, api_version_number, is_github_action)
 
 
+def to_tuple_literal(values) -> str:
+    """Python tuple literal for values, in order, without a magic trailing comma so ruff keeps it on one line."""
+    values = [repr(value) for value in values]
+    if len(values) == 1:
+        return f"({values[0]},)"
+    return "(" + ", ".join(values) + ")"
+
+
+def to_frozenset_literal(values) -> str:
+    """frozenset literal for values, in spec order so regenerated output is stable."""
+    if not values:
+        return "frozenset()"
+    return "frozenset({" + ", ".join(json.dumps(value) for value in values) + "})"
+
+
 def generate_modules(spec, batchable_actions, jinja_env, scopes, template_dir):
+    operations = {}
     for scope in scopes:
         print(f"...generating {scope}")
         section = scopes[scope]
@@ -282,7 +307,7 @@ def generate_modules(spec, batchable_actions, jinja_env, scopes, template_dir):
                 )
 
             # Generate API & Asyncio API functions
-            generate_standard_and_async_functions(jinja_env, template_dir, section, output, async_output, spec)
+            generate_standard_and_async_functions(jinja_env, template_dir, section, output, async_output, spec, operations)
 
             # Generate API action batch functions
             generate_action_batch_functions(
@@ -294,6 +319,16 @@ def generate_modules(spec, batchable_actions, jinja_env, scopes, template_dir):
                 spec,
             )
 
+    # Generate the operation descriptor table executed by meraki.dispatch
+    with open("meraki/api/operations.py", "w", encoding="utf-8", newline=None) as operations_output:
+        render_operations_module(jinja_env, template_dir, operations, operations_output)
+
+
+def render_operations_module(jinja_env: jinja2.Environment, template_dir: str, operations: dict, output: open):
+    with open(f"{template_dir}operations_template.jinja2", encoding="utf-8", newline=None) as fp:
+        template = jinja_env.from_string(fp.read())
+        output.write(template.render(operations=operations))
+
 
 def render_class_template(
     jinja_env: jinja2.Environment,
@@ -319,6 +354,7 @@ def generate_standard_and_async_functions(
     output: open,
     async_output: open,
     spec: dict,
+    operations: dict = None,
 ):
     for path, methods in section.items():
         for method, endpoint in methods.items():
@@ -336,11 +372,13 @@ def generate_standard_and_async_functions(
             # Function definition
             definition = ""
             defined_params = set()
+            positional = []
             renamed_params = {}
 
             # Add required params to definition
             for p, values in return_params(operation, all_params, ["required"]).items():
                 defined_params.add(p)
+                positional.append(p)
                 safe_p = safe_param_name(p)
                 if safe_p != p:
                     renamed_params[safe_p] = p
@@ -361,6 +399,7 @@ def generate_standard_and_async_functions(
             for p, values in return_params(operation, all_params, ["path"]).items():
                 if p not in defined_params:
                     defined_params.add(p)
+                    positional.append(p)
                     safe_p = safe_param_name(p)
                     if safe_p != p:
                         renamed_params[safe_p] = p
@@ -381,6 +420,7 @@ def generate_standard_and_async_functions(
             for p in re.findall(r"\{(\w+)\}", path):
                 if p not in defined_params:
                     defined_params.add(p)
+                    positional.append(p)
                     safe_p = safe_param_name(p)
                     if safe_p != p:
                         renamed_params[safe_p] = p
@@ -401,22 +441,11 @@ def generate_standard_and_async_functions(
 
             query_params = return_params(operation, all_params, ["query"])
             array_params = {k: v for k, v in query_params.items() if v["type"] == "array"}
-            body_params = path_params = {}
-
-            # Function body for GET endpoints
-            if method == "get":
-                path_params = return_params(operation, all_params, ["path"])
-
-            # Function body for POST/PUT/PATCH endpoints
-            elif method == "post" or method == "put" or method == "patch":
+            body_params = {}
+            if method == "post" or method == "put" or method == "patch":
                 body_params = return_params(operation, all_params, ["body"])
-                path_params = return_params(operation, all_params, ["path"])
-
-            # Function body for DELETE endpoints
-            elif method == "delete":
-                path_params = return_params(operation, all_params, ["path"])
 
-            # Add **kwargs if optional params OR body/query/array params exist (templates use kwargs.items())
+            # Add **kwargs if optional params OR body/query/array params exist (dispatch.call sorts them by descriptor)
             if return_params(operation, all_params, ["optional"]) or body_params or query_params or array_params:
                 definition += ", **kwargs"
 
@@ -427,12 +456,6 @@ def generate_standard_and_async_functions(
                 for p, values in all_params_for_doc.items():
                     param_descriptions.append(f"{p} ({values['type']}): {values['description']}")
 
-            kwarg_line = ""
-            if return_params(operation, all_params, ["optional"]):
-                kwarg_line = "kwargs.update(locals())"
-            elif return_params(operation, all_params, ["query", "array", "body"]):
-                kwarg_line = "kwargs = locals()"
-
             # Assert valid values for enum
             enum_params = return_params(operation, all_params, ["enum"])
             assert_blocks = list()
@@ -440,7 +463,7 @@ def generate_standard_and_async_functions(
                 for p, values in enum_params.items():
                     assert_blocks.append((p, values["enum"], values.get("nullable", False)))
 
-            # Generate call_line based on method
+            # The session call the operation makes; dispatch.call() makes it from the descriptor below
             if method == "get":
                 pagination_params = return_params(operation, all_params, ["pagination"])
                 if query_params or array_params:
@@ -470,19 +493,32 @@ def generate_standard_and_async_functions(
 
             assert call_line is not None, f"call_line was not set for {operation} (method={method})"
 
-            # Ensure all URL-referenced params get quote lines in the template
-            for p in re.findall(r"\{(\w+)\}", path):
-                if p not in path_params:
-                    path_params[p] = {"type": "string", "in": "path"}
-
-            # Sanitize path_params keys and resource path for Python keywords
-            safe_path_params = {}
-            safe_resource = path
-            for p, v in path_params.items():
-                safe_p = safe_param_name(p)
-                safe_path_params[safe_p] = v
-                if safe_p != p:
-                    safe_resource = safe_resource.replace("{" + p + "}", "{" + safe_p + "}")
+            # Record the operation's descriptor for meraki/api/operations.py
+            if operations is not None:
+                path_names = tuple(re.findall(r"\{(\w+)\}", path))
+                operations[operation] = {
+                    "method": method,
+                    "path": path,
+                    "tags": tags,
+                    "path_params": path_names,
+                    "arguments": tuple(positional) if tuple(positional) != path_names else (),
+                    "query": list(query_params),
+                    "array": list(array_params),
+                    "body": list(body_params),
+                    "paginated": ("prev" if operation in REVERSE_PAGINATION else "next") if "get_pages" in call_line else None,
+                    "enums": {p: values + [None] if nullable else values for p, values, nullable in assert_blocks},
+                }
+
+            # The method delegates to dispatch.call(), which executes the operation's descriptor:
+            # required parameters go positionally, in the order call() maps them to API names
+            call_args = "".join(f", {safe_param_name(p)}" for p in positional)
+            if "get_pages" in call_line:
+                call_args += ", total_pages=total_pages, direction=direction"
+                if operation == "getNetworkEvents":
+                    call_args += ", event_log_end_time=event_log_end_time"
+            if definition.endswith("**kwargs"):
+                call_args += ", **kwargs"
+            dispatch_line = f'return dispatch.call(self._session, "{operation}"{call_args})'
 
             # Record keyword param violations for the generation report
             if renamed_params:
@@ -511,17 +547,7 @@ def generate_standard_and_async_functions(
                     description=description,
                     doc_url=docs_url(operation),
                     descriptions=param_descriptions,
-                    kwarg_line=kwarg_line,
-                    all_params=list(all_params_for_doc.keys()) if all_params_for_doc else [],
-                    assert_blocks=assert_blocks,
-                    tags=tags,
-                    resource=safe_resource,
-                    query_params=query_params,
-                    array_params=array_params,
-                    body_params=body_params,
-                    path_params=safe_path_params,
-                    call_line=call_line,
-                    renamed_params=renamed_params,
+                    call_line=dispatch_line,
                 )
                 output.write("\n\n" + rendered)
                 async_output.write("\n\n" + rendered)
@@ -1,25 +1,7 @@
 import logging
 import os
 
-from meraki.api.administered import Administered
-from meraki.api.appliance import Appliance
-
-# Batch class imports
-from meraki.api.batch import Batch
-from meraki.api.camera import Camera
-from meraki.api.campusGateway import CampusGateway
-from meraki.api.cellularGateway import CellularGateway
-from meraki.api.devices import Devices
-from meraki.api.insight import Insight
-from meraki.api.licensing import Licensing
-from meraki.api.networks import Networks
-from meraki.api.organizations import Organizations
-from meraki.api.sensor import Sensor
-from meraki.api.sm import Sm
-from meraki.api.spaces import Spaces
-from meraki.api.switch import Switch
-from meraki.api.wireless import Wireless
-from meraki.api.wirelessController import WirelessController
+from meraki.common import LazySection, lazy_section_class
 
 # Config import
 from meraki.config import (
@@ -54,8 +36,28 @@ from meraki.config import (
     SMART_FLOW_CACHE_PATH,
     SMART_FLOW_CACHE_TTL,
     SMART_FLOW_LOGGING,
+    JSON_CODEC,
+    STREAM_GET_PAGES,
+    RESPONSE_CACHE,
+    RESPONSE_CACHE_TTL,
+    RESPONSE_CACHE_TTLS,
+    RESPONSE_CACHE_MAX_ENTRIES,
+    RESPONSE_CACHE_PATH,
+    PAGINATION_TIME_SHARDS,
+    BULK_MAXIMUM_WORKERS,
+    SMART_FLOW_SHARED_DIR,
+    SMART_FLOW_SHARE_LIMITER,
+    SMART_FLOW_PRIORITY,
+    SMART_FLOW_HYDRATION_WORKERS,
+    SMART_FLOW_RATE_HALF_LIFE,
+    SMART_FLOW_CALIBRATE_INTERVAL,
+    SMART_FLOW_ENDPOINT_CLASSES,
+    REQUESTS_EGRESSES,
 )
 from meraki.session.sync import RestSession
+from meraki.bulk import BulkResult, run_bulk
+from meraki.dispatch import call as call_operation
+from meraki.smart_flow import priority as smart_flow_priority_block
 from meraki.exceptions import APIError, APIKeyError, APIResponseError, AsyncAPIError
 from meraki._version import __version__  # noqa: F401
 from datetime import datetime
@@ -67,6 +69,7 @@ __all__ = [
     "APIKeyError",
     "APIResponseError",
     "AsyncAPIError",
+    "BulkResult",
     "DashboardAPI",
 ]
 
@@ -104,8 +107,45 @@ class DashboardAPI(object):
     - smart_flow_global_rate (float): max requests per second across all orgs (source IP limit, Meraki default: 100)
     - smart_flow_cache_mode (string): "lazy" (default) or "eager" - how org/network/device mappings are loaded
     - smart_flow_cache_path (string): path to persist smart flow mapping cache across sessions
+    - json_codec (string): JSON codec for request/response bodies: "stdlib" (default), "orjson", "ujson", or "auto" (fastest installed)
+    - stream_get_pages (boolean): list* iterators decode and yield each item as its bytes arrive instead of loading whole pages (requires use_iterator_for_get_pages)
+    - response_cache (string): GET response cache: "" (disabled, default), "memory", "disk", or a shared meraki.response_cache.ResponseCache
+    - response_cache_ttl (float): default seconds a cached GET response stays fresh
+    - response_cache_ttls (dict): per-operation TTL overrides in seconds, e.g. {"getNetworkClients": 0}
+    - response_cache_max_entries (integer): maximum cached responses (least recently used evicted first)
+    - response_cache_path (string): SQLite file for the "disk" response cache
+    - pagination_time_shards (integer): split all-pages pulls of t0/t1 endpoints into this many time windows fetched concurrently; 1 (default) disables
+    - smart_flow_shared_dir (string): directory for token bucket state shared by every process on this host, so worker processes draw from one org and global budget; empty string keeps buckets per process
+    - smart_flow_share_limiter (boolean or string): share one smart flow limiter with the other clients in this process that use the same base URL and API key (True), or the same sharing name (a string)
+    - smart_flow_priority (string or number): smart flow priority class ("interactive", "normal", "batch") or weight for queued requests
+    - smart_flow_hydration_workers (integer): maximum orgs smart flow hydrates at once, in eager mode and when a new org is resolved
+    - smart_flow_rate_half_life (float): seconds for a learned org rate saved in the cache to decay halfway back to smart_flow_org_rate; None or 0 to not reuse learned rates
+    - smart_flow_calibrate_interval (float): seconds between calibrations of each org's smart flow ceiling from its API usage telemetry; None to keep smart_flow_org_rate as the ceiling
+    - smart_flow_endpoint_classes (dict): smart flow budgets for families of heavy operations, keyed by class name, each with a rate and the operations or tags it covers; empty for none
+    - requests_egresses (list): proxy URLs, or dicts of proxy and local_address, to spread requests across, each with its own smart flow global budget; empty to use requests_proxy alone
     """
 
+    # API endpoints by section, each imported on first access
+    administered = LazySection("meraki.api.administered", "Administered")
+    organizations = LazySection("meraki.api.organizations", "Organizations")
+    networks = LazySection("meraki.api.networks", "Networks")
+    devices = LazySection("meraki.api.devices", "Devices")
+    appliance = LazySection("meraki.api.appliance", "Appliance")
+    camera = LazySection("meraki.api.camera", "Camera")
+    cellularGateway = LazySection("meraki.api.cellularGateway", "CellularGateway")
+    insight = LazySection("meraki.api.insight", "Insight")
+    licensing = LazySection("meraki.api.licensing", "Licensing")
+    sensor = LazySection("meraki.api.sensor", "Sensor")
+    sm = LazySection("meraki.api.sm", "Sm")
+    switch = LazySection("meraki.api.switch", "Switch")
+    wireless = LazySection("meraki.api.wireless", "Wireless")
+    spaces = LazySection("meraki.api.spaces", "Spaces")
+    wirelessController = LazySection("meraki.api.wirelessController", "WirelessController")
+    campusGateway = LazySection("meraki.api.campusGateway", "CampusGateway")
+
+    # Batch definitions
+    batch = LazySection("meraki.api.batch", "Batch", pass_session=False)
+
     def __init__(
         self,
         api_key=None,
@@ -139,6 +179,22 @@ class DashboardAPI(object):
         smart_flow_cache_path=SMART_FLOW_CACHE_PATH,
         smart_flow_cache_ttl=SMART_FLOW_CACHE_TTL,
         smart_flow_logging=SMART_FLOW_LOGGING,
+        json_codec=JSON_CODEC,
+        stream_get_pages=STREAM_GET_PAGES,
+        response_cache=RESPONSE_CACHE,
+        response_cache_ttl=RESPONSE_CACHE_TTL,
+        response_cache_ttls=RESPONSE_CACHE_TTLS,
+        response_cache_max_entries=RESPONSE_CACHE_MAX_ENTRIES,
+        response_cache_path=RESPONSE_CACHE_PATH,
+        pagination_time_shards=PAGINATION_TIME_SHARDS,
+        smart_flow_shared_dir=SMART_FLOW_SHARED_DIR,
+        smart_flow_share_limiter=SMART_FLOW_SHARE_LIMITER,
+        smart_flow_priority=SMART_FLOW_PRIORITY,
+        smart_flow_hydration_workers=SMART_FLOW_HYDRATION_WORKERS,
+        smart_flow_rate_half_life=SMART_FLOW_RATE_HALF_LIFE,
+        smart_flow_calibrate_interval=SMART_FLOW_CALIBRATE_INTERVAL,
+        smart_flow_endpoint_classes=SMART_FLOW_ENDPOINT_CLASSES,
+        requests_egresses=REQUESTS_EGRESSES,
     ):
         # Check API key
         api_key = api_key or os.environ.get(API_KEY_ENVIRONMENT_VARIABLE)
@@ -210,37 +266,79 @@ class DashboardAPI(object):
             smart_flow_cache_path=smart_flow_cache_path,
             smart_flow_cache_ttl=smart_flow_cache_ttl,
             smart_flow_logging=smart_flow_logging,
+            json_codec=json_codec,
+            stream_get_pages=stream_get_pages,
+            response_cache=response_cache,
+            response_cache_ttl=response_cache_ttl,
+            response_cache_ttls=response_cache_ttls,
+            response_cache_max_entries=response_cache_max_entries,
+            response_cache_path=response_cache_path,
+            pagination_time_shards=pagination_time_shards,
+            smart_flow_shared_dir=smart_flow_shared_dir,
+            smart_flow_share_limiter=smart_flow_share_limiter,
+            smart_flow_priority=smart_flow_priority,
+            smart_flow_hydration_workers=smart_flow_hydration_workers,
+            smart_flow_rate_half_life=smart_flow_rate_half_life,
+            smart_flow_calibrate_interval=smart_flow_calibrate_interval,
+            smart_flow_endpoint_classes=smart_flow_endpoint_classes,
+            requests_egresses=requests_egresses,
         )
 
-        # API endpoints by section
-        self.administered = Administered(self._session)
-        self.organizations = Organizations(self._session)
-        self.networks = Networks(self._session)
-        self.devices = Devices(self._session)
-        self.appliance = Appliance(self._session)
-        self.camera = Camera(self._session)
-        self.cellularGateway = CellularGateway(self._session)
-        self.insight = Insight(self._session)
-        self.licensing = Licensing(self._session)
-        self.sensor = Sensor(self._session)
-        self.sm = Sm(self._session)
-        self.switch = Switch(self._session)
-        self.wireless = Wireless(self._session)
-        self.spaces = Spaces(self._session)
-        self.wirelessController = WirelessController(self._session)
-        self.campusGateway = CampusGateway(self._session)
-
-        # Batch definitions
-        self.batch = Batch()
-
         # Eager load smart limit cache if enabled (skip if disk cache was fresh)
         if smart_flow_enabled and smart_flow_cache_mode == "eager":
             limiter = self._session._smart_flow
             if limiter and not limiter.cache_fresh:
                 self._eager_load_rate_limit_cache()
 
+    def bulk(self, function, arguments, max_workers=BULK_MAXIMUM_WORKERS, ordered=True):
+        """
+        **Run one API call for many argument sets concurrently, on a bounded thread pool**
+
+        - function (callable): the call to make, e.g. dashboard.networks.getNetwork
+        - arguments (iterable): one argument set per call; a dict is passed as keyword arguments, a tuple as positional arguments, anything else as the single positional argument
+        - max_workers (integer): maximum calls in flight at once
+        - ordered (boolean): yield results in input order? Otherwise each result is yielded as its call completes
+
+        Returns an iterator of BulkResult(index, arguments, result, error). Calls are submitted as it is consumed.
+        A failed call doesn't stop the run: its exception is in error, and result is None. All calls share this
+        session, so smart flow budgets apply across the whole run.
+        """
+
+        return run_bulk(function, arguments, max_workers=max_workers, ordered=ordered)
+
+    def call(self, operation, *args, **kwargs):
+        """
+        **Call an API operation by its operationId, through the generated operation table**
+
+        - operation (string): the operationId, e.g. "getOrganizationNetworks"; the same name as the section method
+        - args: the operation's required parameters, in the section method's order
+        - kwargs: query and body parameters by their API names, plus total_pages/direction for paginated operations
+
+        Behaves like the section method of the same name, without its per-call parameter bookkeeping.
+        """
+
+        return call_operation(self._session, operation, *args, **kwargs)
+
+    def priority(self, value):
+        """
+        **Send the requests made inside a with block at another smart flow priority**
+
+        - value (string or number): a priority class ("interactive", "normal" or "batch") or a positive weight
+
+        Overrides smart_flow_priority for calls made in the block, in this thread or task. It only matters when
+        requests queue for an org's rate budget: queued callers are served by weighted fair queuing, so a higher
+        weight gets a larger share of the budget and jumps ahead of a backlog of lower-weight calls.
+        """
+
+        return smart_flow_priority_block(value)
+
     def _eager_load_rate_limit_cache(self) -> None:
-        """Populate the smart flow's org/network/device cache at startup."""
+        """Populate the smart flow's org/network/device cache at startup.
+
+        Fetches the org list, then queues every org for hydration on the limiter's background
+        threads, smart_flow_hydration_workers at a time, and returns. Requests for an org go
+        ahead while it hydrates; its mappings are learned from each page as it arrives.
+        """
         rate_limiter = self._session._smart_flow
         if not rate_limiter:
             return
@@ -250,23 +348,26 @@ class DashboardAPI(object):
         except Exception:
             return
 
-        for org in orgs:
-            org_id = org["id"]
-            rate_limiter.register_org(org_id)
-
-            try:
-                networks = self.organizations.getOrganizationNetworks(org_id, total_pages="all", perPage=1000)
-                for net in networks:
-                    rate_limiter.register_network(net["id"], org_id)
-            except Exception:
-                pass
-
-            try:
-                devices = self.organizations.getOrganizationInventoryDevices(org_id, total_pages="all", perPage=1000)
-                for device in devices:
-                    if device.get("serial"):
-                        rate_limiter.register_device(device["serial"], org_id)
-            except Exception:
-                pass
+        rate_limiter.hydrate_orgs([org["id"] for org in orgs], self._eager_hydrate_org)
+
+    def _eager_hydrate_org(self, org_id: str) -> None:
+        """Register one org's networks and devices with the smart flow limiter and save the cache."""
+        rate_limiter = self._session._smart_flow
+
+        try:
+            networks = self.organizations.getOrganizationNetworks(org_id, total_pages="all", perPage=1000)
+            rate_limiter.register_networks([net["id"] for net in networks], org_id)
+        except Exception:
+            pass
+
+        try:
+            devices = self.organizations.getOrganizationInventoryDevices(org_id, total_pages="all", perPage=1000)
+            rate_limiter.register_devices([device["serial"] for device in devices if device.get("serial")], org_id)
+        except Exception:
+            pass
 
         rate_limiter.save_cache()
+
+
+def __getattr__(name):
+    return lazy_section_class(DashboardAPI, __name__, name)
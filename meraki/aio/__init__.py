@@ -1,29 +1,13 @@
 import logging
 import os
 
-from meraki.aio.api.administered import AsyncAdministered
-from meraki.aio.api.appliance import AsyncAppliance
-from meraki.aio.api.camera import AsyncCamera
-from meraki.aio.api.campusGateway import AsyncCampusGateway
-from meraki.aio.api.cellularGateway import AsyncCellularGateway
-from meraki.aio.api.devices import AsyncDevices
-from meraki.aio.api.insight import AsyncInsight
-from meraki.aio.api.licensing import AsyncLicensing
-from meraki.aio.api.networks import AsyncNetworks
-from meraki.aio.api.organizations import AsyncOrganizations
-from meraki.aio.api.sensor import AsyncSensor
-from meraki.aio.api.sm import AsyncSm
-from meraki.aio.api.spaces import AsyncSpaces
-from meraki.aio.api.switch import AsyncSwitch
-from meraki.aio.api.wireless import AsyncWireless
-from meraki.aio.api.wirelessController import AsyncWirelessController
+from meraki.common import LazySection, lazy_section_class
+from meraki.dispatch import call as call_operation
+from meraki.smart_flow import priority as smart_flow_priority_block
 from meraki.session.async_ import AsyncRestSession
 from meraki.exceptions import APIKeyError
 from datetime import datetime
 
-# Batch class imports
-from meraki.api.batch import Batch
-
 # Config import
 from meraki.config import (
     API_KEY_ENVIRONMENT_VARIABLE,
@@ -50,6 +34,9 @@ from meraki.config import (
     MERAKI_PYTHON_SDK_CALLER,
     USE_ITERATOR_FOR_GET_PAGES,
     AIO_MAXIMUM_CONCURRENT_REQUESTS,
+    AIO_COALESCE_IDENTICAL_GETS,
+    AIO_DECODE_OFFLOAD_THRESHOLD,
+    AIO_DECODE_OFFLOAD_EXECUTOR,
     VALIDATE_KWARGS,
     SMART_FLOW_ENABLED,
     SMART_FLOW_ORG_RATE,
@@ -58,6 +45,22 @@ from meraki.config import (
     SMART_FLOW_CACHE_PATH,
     SMART_FLOW_CACHE_TTL,
     SMART_FLOW_LOGGING,
+    JSON_CODEC,
+    STREAM_GET_PAGES,
+    RESPONSE_CACHE,
+    RESPONSE_CACHE_TTL,
+    RESPONSE_CACHE_TTLS,
+    RESPONSE_CACHE_MAX_ENTRIES,
+    RESPONSE_CACHE_PATH,
+    PAGINATION_TIME_SHARDS,
+    SMART_FLOW_SHARED_DIR,
+    SMART_FLOW_SHARE_LIMITER,
+    SMART_FLOW_PRIORITY,
+    SMART_FLOW_HYDRATION_WORKERS,
+    SMART_FLOW_RATE_HALF_LIFE,
+    SMART_FLOW_CALIBRATE_INTERVAL,
+    SMART_FLOW_ENDPOINT_CLASSES,
+    REQUESTS_EGRESSES,
 )
 
 
@@ -86,6 +89,9 @@ class AsyncDashboardAPI:
     - inherit_logging_config (boolean): Inherits your own logger instance
     - simulate (boolean): simulate POST/PUT/DELETE calls to prevent changes?
     - maximum_concurrent_requests (integer): number of concurrent API requests for asynchronous class
+    - coalesce_identical_gets (boolean): identical concurrent GETs share one in-flight request and its result
+    - decode_offload_threshold (integer): response bodies of at least this many bytes are decoded off the event loop; 0 disables
+    - decode_offload_executor (string): where offloaded decodes run, "thread" or "process"
     - be_geo_id (string): optional partner identifier for API usage tracking; can also be set as an environment variable BE_GEO_ID
     - caller (string): optional identifier for API usage tracking; can also be set as an environment variable MERAKI_PYTHON_SDK_CALLER
     - use_iterator_for_get_pages (boolean): list* methods will return an iterator with each object instead of a complete list with all items
@@ -95,8 +101,45 @@ class AsyncDashboardAPI:
     - smart_flow_global_rate (float): max requests per second across all orgs (source IP limit, Meraki default: 100)
     - smart_flow_cache_mode (string): "lazy" (default) or "eager" - how org/network/device mappings are loaded
     - smart_flow_cache_path (string): path to persist smart flow mapping cache across sessions
+    - json_codec (string): JSON codec for request/response bodies: "stdlib" (default), "orjson", "ujson", or "auto" (fastest installed)
+    - stream_get_pages (boolean): list* iterators decode and yield each item as its bytes arrive instead of loading whole pages (requires use_iterator_for_get_pages)
+    - response_cache (string): GET response cache: "" (disabled, default), "memory", "disk", or a shared meraki.response_cache.ResponseCache
+    - response_cache_ttl (float): default seconds a cached GET response stays fresh
+    - response_cache_ttls (dict): per-operation TTL overrides in seconds, e.g. {"getNetworkClients": 0}
+    - response_cache_max_entries (integer): maximum cached responses (least recently used evicted first)
+    - response_cache_path (string): SQLite file for the "disk" response cache
+    - pagination_time_shards (integer): split all-pages pulls of t0/t1 endpoints into this many time windows fetched concurrently; 1 (default) disables
+    - smart_flow_shared_dir (string): directory for token bucket state shared by every process on this host, so worker processes draw from one org and global budget; empty string keeps buckets per process
+    - smart_flow_share_limiter (boolean or string): share one smart flow limiter with the other clients in this process that use the same base URL and API key (True), or the same sharing name (a string)
+    - smart_flow_priority (string or number): smart flow priority class ("interactive", "normal", "batch") or weight for queued requests
+    - smart_flow_hydration_workers (integer): maximum orgs smart flow hydrates at once, in eager mode and when a new org is resolved
+    - smart_flow_rate_half_life (float): seconds for a learned org rate saved in the cache to decay halfway back to smart_flow_org_rate; None or 0 to not reuse learned rates
+    - smart_flow_calibrate_interval (float): seconds between calibrations of each org's smart flow ceiling from its API usage telemetry; None to keep smart_flow_org_rate as the ceiling
+    - smart_flow_endpoint_classes (dict): smart flow budgets for families of heavy operations, keyed by class name, each with a rate and the operations or tags it covers; empty for none
+    - requests_egresses (list): proxy URLs, or dicts of proxy and local_address, to spread requests across, each with its own smart flow global budget; empty to use requests_proxy alone
     """
 
+    # API endpoints by section, each imported on first access
+    administered = LazySection("meraki.aio.api.administered", "AsyncAdministered")
+    organizations = LazySection("meraki.aio.api.organizations", "AsyncOrganizations")
+    networks = LazySection("meraki.aio.api.networks", "AsyncNetworks")
+    devices = LazySection("meraki.aio.api.devices", "AsyncDevices")
+    appliance = LazySection("meraki.aio.api.appliance", "AsyncAppliance")
+    camera = LazySection("meraki.aio.api.camera", "AsyncCamera")
+    cellularGateway = LazySection("meraki.aio.api.cellularGateway", "AsyncCellularGateway")
+    insight = LazySection("meraki.aio.api.insight", "AsyncInsight")
+    licensing = LazySection("meraki.aio.api.licensing", "AsyncLicensing")
+    sensor = LazySection("meraki.aio.api.sensor", "AsyncSensor")
+    switch = LazySection("meraki.aio.api.switch", "AsyncSwitch")
+    sm = LazySection("meraki.aio.api.sm", "AsyncSm")
+    wireless = LazySection("meraki.aio.api.wireless", "AsyncWireless")
+    spaces = LazySection("meraki.aio.api.spaces", "AsyncSpaces")
+    wirelessController = LazySection("meraki.aio.api.wirelessController", "AsyncWirelessController")
+    campusGateway = LazySection("meraki.aio.api.campusGateway", "AsyncCampusGateway")
+
+    # Batch definitions
+    batch = LazySection("meraki.api.batch", "Batch", pass_session=False)
+
     def __init__(
         self,
         api_key=None,
@@ -123,6 +166,9 @@ class AsyncDashboardAPI:
         use_iterator_for_get_pages=USE_ITERATOR_FOR_GET_PAGES,
         inherit_logging_config=INHERIT_LOGGING_CONFIG,
         maximum_concurrent_requests=AIO_MAXIMUM_CONCURRENT_REQUESTS,
+        coalesce_identical_gets=AIO_COALESCE_IDENTICAL_GETS,
+        decode_offload_threshold=AIO_DECODE_OFFLOAD_THRESHOLD,
+        decode_offload_executor=AIO_DECODE_OFFLOAD_EXECUTOR,
         validate_kwargs=VALIDATE_KWARGS,
         smart_flow_enabled=SMART_FLOW_ENABLED,
         smart_flow_org_rate=SMART_FLOW_ORG_RATE,
@@ -131,6 +177,22 @@ class AsyncDashboardAPI:
         smart_flow_cache_path=SMART_FLOW_CACHE_PATH,
         smart_flow_cache_ttl=SMART_FLOW_CACHE_TTL,
         smart_flow_logging=SMART_FLOW_LOGGING,
+        json_codec=JSON_CODEC,
+        stream_get_pages=STREAM_GET_PAGES,
+        response_cache=RESPONSE_CACHE,
+        response_cache_ttl=RESPONSE_CACHE_TTL,
+        response_cache_ttls=RESPONSE_CACHE_TTLS,
+        response_cache_max_entries=RESPONSE_CACHE_MAX_ENTRIES,
+        response_cache_path=RESPONSE_CACHE_PATH,
+        pagination_time_shards=PAGINATION_TIME_SHARDS,
+        smart_flow_shared_dir=SMART_FLOW_SHARED_DIR,
+        smart_flow_share_limiter=SMART_FLOW_SHARE_LIMITER,
+        smart_flow_priority=SMART_FLOW_PRIORITY,
+        smart_flow_hydration_workers=SMART_FLOW_HYDRATION_WORKERS,
+        smart_flow_rate_half_life=SMART_FLOW_RATE_HALF_LIFE,
+        smart_flow_calibrate_interval=SMART_FLOW_CALIBRATE_INTERVAL,
+        smart_flow_endpoint_classes=SMART_FLOW_ENDPOINT_CLASSES,
+        requests_egresses=REQUESTS_EGRESSES,
     ):
         # Check API key
         api_key = api_key or os.environ.get(API_KEY_ENVIRONMENT_VARIABLE)
@@ -195,6 +257,9 @@ class AsyncDashboardAPI:
             caller=caller,
             use_iterator_for_get_pages=use_iterator_for_get_pages,
             maximum_concurrent_requests=maximum_concurrent_requests,
+            coalesce_identical_gets=coalesce_identical_gets,
+            decode_offload_threshold=decode_offload_threshold,
+            decode_offload_executor=decode_offload_executor,
             validate_kwargs=validate_kwargs,
             smart_flow_enabled=smart_flow_enabled,
             smart_flow_org_rate=smart_flow_org_rate,
@@ -203,33 +268,28 @@ class AsyncDashboardAPI:
             smart_flow_cache_path=smart_flow_cache_path,
             smart_flow_cache_ttl=smart_flow_cache_ttl,
             smart_flow_logging=smart_flow_logging,
+            json_codec=json_codec,
+            stream_get_pages=stream_get_pages,
+            response_cache=response_cache,
+            response_cache_ttl=response_cache_ttl,
+            response_cache_ttls=response_cache_ttls,
+            response_cache_max_entries=response_cache_max_entries,
+            response_cache_path=response_cache_path,
+            pagination_time_shards=pagination_time_shards,
+            smart_flow_shared_dir=smart_flow_shared_dir,
+            smart_flow_share_limiter=smart_flow_share_limiter,
+            smart_flow_priority=smart_flow_priority,
+            smart_flow_hydration_workers=smart_flow_hydration_workers,
+            smart_flow_rate_half_life=smart_flow_rate_half_life,
+            smart_flow_calibrate_interval=smart_flow_calibrate_interval,
+            smart_flow_endpoint_classes=smart_flow_endpoint_classes,
+            requests_egresses=requests_egresses,
         )
 
         # Store for eager load access
         self._smart_flow_enabled = smart_flow_enabled
         self._smart_flow_cache_mode = smart_flow_cache_mode
 
-        # API endpoints by section
-        self.administered = AsyncAdministered(self._session)
-        self.organizations = AsyncOrganizations(self._session)
-        self.networks = AsyncNetworks(self._session)
-        self.devices = AsyncDevices(self._session)
-        self.appliance = AsyncAppliance(self._session)
-        self.camera = AsyncCamera(self._session)
-        self.cellularGateway = AsyncCellularGateway(self._session)
-        self.insight = AsyncInsight(self._session)
-        self.licensing = AsyncLicensing(self._session)
-        self.sensor = AsyncSensor(self._session)
-        self.switch = AsyncSwitch(self._session)
-        self.sm = AsyncSm(self._session)
-        self.wireless = AsyncWireless(self._session)
-        self.spaces = AsyncSpaces(self._session)
-        self.wirelessController = AsyncWirelessController(self._session)
-        self.campusGateway = AsyncCampusGateway(self._session)
-
-        # Batch definitions
-        self.batch = Batch()
-
     async def __aenter__(self):
         if self._smart_flow_enabled and self._smart_flow_cache_mode == "eager":
             limiter = self._session._smart_flow
@@ -242,13 +302,45 @@ class AsyncDashboardAPI:
         # persist the cache BEFORE closing the httpx client. Closing first would
         # cause those background tasks to fail with "client has been closed".
         # shutdown() performs the final save itself, so it is called instead of
-        # save_cache() to keep the persist exactly once.
-        if self._session._smart_flow:
-            await self._session._smart_flow.shutdown()
+        # save_cache() to keep the persist exactly once. A limiter shared with
+        # other clients (smart_flow_share_limiter) is only shut down by the last one.
+        await self._session.shutdown_smart_flow()
         await self._session.close()
 
+    def call(self, operation, *args, **kwargs):
+        """
+        **Call an API operation by its operationId, through the generated operation table**
+
+        - operation (string): the operationId, e.g. "getOrganizationNetworks"; the same name as the section method
+        - args: the operation's required parameters, in the section method's order
+        - kwargs: query and body parameters by their API names, plus total_pages/direction for paginated operations
+
+        Returns what the section method of the same name returns: await it, or iterate it for paginated
+        operations when use_iterator_for_get_pages is set.
+        """
+
+        return call_operation(self._session, operation, *args, **kwargs)
+
+    def priority(self, value):
+        """
+        **Send the requests made inside a with block at another smart flow priority**
+
+        - value (string or number): a priority class ("interactive", "normal" or "batch") or a positive weight
+
+        Overrides smart_flow_priority for calls made in the block, in this thread or task. It only matters when
+        requests queue for an org's rate budget: queued callers are served by weighted fair queuing, so a higher
+        weight gets a larger share of the budget and jumps ahead of a backlog of lower-weight calls.
+        """
+
+        return smart_flow_priority_block(value)
+
     async def _eager_load_rate_limit_cache(self) -> None:
-        """Populate the smart flow's org/network/device cache at startup."""
+        """Populate the smart flow's org/network/device cache at startup.
+
+        Fetches the org list, then queues every org for hydration on the limiter's background
+        tasks, smart_flow_hydration_workers at a time, and returns. Requests for an org go
+        ahead while it hydrates; its mappings are learned from each page as it arrives.
+        """
         rate_limiter = self._session._smart_flow
         if not rate_limiter:
             return
@@ -258,23 +350,26 @@ class AsyncDashboardAPI:
         except Exception:
             return
 
-        for org in orgs:
-            org_id = org["id"]
-            rate_limiter.register_org(org_id)
-
-            try:
-                networks = await self.organizations.getOrganizationNetworks(org_id, total_pages="all", perPage=1000)
-                for net in networks:
-                    rate_limiter.register_network(net["id"], org_id)
-            except Exception:
-                pass
-
-            try:
-                devices = await self.organizations.getOrganizationInventoryDevices(org_id, total_pages="all", perPage=1000)
-                for device in devices:
-                    if device.get("serial"):
-                        rate_limiter.register_device(device["serial"], org_id)
-            except Exception:
-                pass
+        rate_limiter.hydrate_orgs([org["id"] for org in orgs], self._eager_hydrate_org)
+
+    async def _eager_hydrate_org(self, org_id: str) -> None:
+        """Register one org's networks and devices with the smart flow limiter and save the cache."""
+        rate_limiter = self._session._smart_flow
+
+        try:
+            networks = await self.organizations.getOrganizationNetworks(org_id, total_pages="all", perPage=1000)
+            rate_limiter.register_networks([net["id"] for net in networks], org_id)
+        except Exception:
+            pass
+
+        try:
+            devices = await self.organizations.getOrganizationInventoryDevices(org_id, total_pages="all", perPage=1000)
+            rate_limiter.register_devices([device["serial"] for device in devices if device.get("serial")], org_id)
+        except Exception:
+            pass
 
         await rate_limiter.save_cache()
+
+
+def __getattr__(name):
+    return lazy_section_class(AsyncDashboardAPI, __name__, name)
@@ -1,4 +1,4 @@
-import urllib
+from meraki import dispatch
 
 
 class AsyncAdministered:
@@ -13,13 +13,7 @@ class AsyncAdministered:
 
         """
 
-        metadata = {
-            "tags": ["administered", "monitor", "identities", "me"],
-            "operation": "getAdministeredIdentitiesMe",
-        }
-        resource = "/administered/identities/me"
-
-        return self._session.get(metadata, resource)
+        return dispatch.call(self._session, "getAdministeredIdentitiesMe")
 
     def getAdministeredIdentitiesMeApiKeys(self):
         """
@@ -28,13 +22,7 @@ class AsyncAdministered:
 
         """
 
-        metadata = {
-            "tags": ["administered", "configure", "identities", "me", "api", "keys"],
-            "operation": "getAdministeredIdentitiesMeApiKeys",
-        }
-        resource = "/administered/identities/me/api/keys"
-
-        return self._session.get(metadata, resource)
+        return dispatch.call(self._session, "getAdministeredIdentitiesMeApiKeys")
 
     def generateAdministeredIdentitiesMeApiKeys(self):
         """
@@ -43,13 +31,7 @@ class AsyncAdministered:
 
         """
 
-        metadata = {
-            "tags": ["administered", "configure", "identities", "me", "api", "keys"],
-            "operation": "generateAdministeredIdentitiesMeApiKeys",
-        }
-        resource = "/administered/identities/me/api/keys/generate"
-
-        return self._session.post(metadata, resource)
+        return dispatch.call(self._session, "generateAdministeredIdentitiesMeApiKeys")
 
     def revokeAdministeredIdentitiesMeApiKeys(self, suffix: str):
         """
@@ -59,11 +41,4 @@ class AsyncAdministered:
         - suffix (string): Suffix
         """
 
-        metadata = {
-            "tags": ["administered", "configure", "identities", "me", "api", "keys"],
-            "operation": "revokeAdministeredIdentitiesMeApiKeys",
-        }
-        suffix = urllib.parse.quote(str(suffix), safe="")
-        resource = f"/administered/identities/me/api/keys/{suffix}/revoke"
-
-        return self._session.post(metadata, resource)
+        return dispatch.call(self._session, "revokeAdministeredIdentitiesMeApiKeys", suffix)
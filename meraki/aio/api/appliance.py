@@ -1,4 +1,4 @@
-import urllib
+from meraki import dispatch
 
 
 class AsyncAppliance:
@@ -14,14 +14,7 @@ class AsyncAppliance:
         - serial (string): Serial
         """
 
-        metadata = {
-            "tags": ["appliance", "monitor", "dhcp", "subnets"],
-            "operation": "getDeviceApplianceDhcpSubnets",
-        }
-        serial = urllib.parse.quote(str(serial), safe="")
-        resource = f"/devices/{serial}/appliance/dhcp/subnets"
-
-        return self._session.get(metadata, resource)
+        return dispatch.call(self._session, "getDeviceApplianceDhcpSubnets", serial)
 
     def createDeviceApplianceInterfacesPortsUpdate(self, serial: str, **kwargs):
         """
@@ -36,33 +29,7 @@ class AsyncAppliance:
         - downlink (object): The port's VLAN settings when in LAN mode
         """
 
-        kwargs.update(locals())
-
-        metadata = {
-            "tags": ["appliance", "configure", "interfaces", "ports", "update"],
-            "operation": "createDeviceApplianceInterfacesPortsUpdate",
-        }
-        serial = urllib.parse.quote(str(serial), safe="")
-        resource = f"/devices/{serial}/appliance/interfaces/ports/update"
-
-        body_params = [
-            "interface",
-            "enabled",
-            "personality",
-            "uplink",
-            "downlink",
-        ]
-        payload = {k.strip(): v for k, v in kwargs.items() if k.strip() in body_params}
-
-        if self._session._validate_kwargs:
-            all_params = [] + body_params
-            invalid = [k for k in kwargs if k.strip() not in all_params and k != "self"]
-            if invalid and self._session._logger:
-                self._session._logger.warning(
-                    f"createDeviceApplianceInterfacesPortsUpdate: ignoring unrecognized kwargs: {invalid}"
-                )
-
-        return self._session.post(metadata, resource, payload)
+        return dispatch.call(self._session, "createDeviceApplianceInterfacesPortsUpdate", serial, **kwargs)
 
     def getDeviceAppliancePerformance(self, serial: str, **kwargs):
         """
@@ -75,29 +42,7 @@ class AsyncAppliance:
         - timespan (number): The timespan for which the information will be fetched. If specifying timespan, do not specify parameters t0 and t1. The value must be in seconds and be greater than or equal to 30 minutes and be less than or equal to 14 days. The default is 30 minutes.
         """
 
-        kwargs.update(locals())
-
-        metadata = {
-            "tags": ["appliance", "monitor", "performance"],
-            "operation": "getDeviceAppliancePerformance",
-        }
-        serial = urllib.parse.quote(str(serial), safe="")
-        resource = f"/devices/{serial}/appliance/performance"
-
-        query_params = [
-            "t0",
-            "t1",
-            "timespan",
-        ]
-        params = {k.strip(): v for k, v in kwargs.items() if k.strip() in query_params}
-
-        if self._session._validate_kwargs:
-            all_params = query_params
-            invalid = [k for k in kwargs if k.strip() not in all_params and k != "self"]
-            if invalid and self._session._logger:
-                self._session._logger.warning(f"getDeviceAppliancePerformance: ignoring unrecognized kwargs: {invalid}")
-
-        return self._session.get(metadata, resource, params)
+        return dispatch.call(self._session, "getDeviceAppliancePerformance", serial, **kwargs)
 
     def getDeviceAppliancePrefixesDelegated(self, serial: str):
         """
@@ -107,14 +52,7 @@ class AsyncAppliance:
         - serial (string): Serial
         """
 
-        metadata = {
-            "tags": ["appliance", "monitor", "prefixes", "delegated"],
-            "operation": "getDeviceAppliancePrefixesDelegated",
-        }
-        serial = urllib.parse.quote(str(serial), safe="")
-        resource = f"/devices/{serial}/appliance/prefixes/delegated"
-
-        return self._session.get(metadata, resource)
+        return dispatch.call(self._session, "getDeviceAppliancePrefixesDelegated", serial)
 
     def getDeviceAppliancePrefixesDelegatedVlanAssignments(self, serial: str):
         """
@@ -124,14 +62,7 @@ class AsyncAppliance:
         - serial (string): Serial
         """
 
-        metadata = {
-            "tags": ["appliance", "monitor", "prefixes", "delegated", "vlanAssignments"],
-            "operation": "getDeviceAppliancePrefixesDelegatedVlanAssignments",
-        }
-        serial = urllib.parse.quote(str(serial), safe="")
-        resource = f"/devices/{serial}/appliance/prefixes/delegated/vlanAssignments"
-
-        return self._session.get(metadata, resource)
+        return dispatch.call(self._session, "getDeviceAppliancePrefixesDelegatedVlanAssignments", serial)
 
     def getDeviceApplianceRadioSettings(self, serial: str):
         """
@@ -141,14 +72,7 @@ class AsyncAppliance:
         - serial (string): Serial
         """
 
-        metadata = {
-            "tags": ["appliance", "configure", "radio", "settings"],
-            "operation": "getDeviceApplianceRadioSettings",
-        }
-        serial = urllib.parse.quote(str(serial), safe="")
-        resource = f"/devices/{serial}/appliance/radio/settings"
-
-        return self._session.get(metadata, resource)
+        return dispatch.call(self._session, "getDeviceApplianceRadioSettings", serial)
 
     def updateDeviceApplianceRadioSettings(self, serial: str, **kwargs):
         """
@@ -161,29 +85,7 @@ class AsyncAppliance:
         - fiveGhzSettings (object): Manual radio settings for 5 GHz.
         """
 
-        kwargs.update(locals())
-
-        metadata = {
-            "tags": ["appliance", "configure", "radio", "settings"],
-            "operation": "updateDeviceApplianceRadioSettings",
-        }
-        serial = urllib.parse.quote(str(serial), safe="")
-        resource = f"/devices/{serial}/appliance/radio/settings"
-
-        body_params = [
-            "rfProfileId",
-            "twoFourGhzSettings",
-            "fiveGhzSettings",
-        ]
-        payload = {k.strip(): v for k, v in kwargs.items() if k.strip() in body_params}
-
-        if self._session._validate_kwargs:
-            all_params = [] + body_params
-            invalid = [k for k in kwargs if k.strip() not in all_params and k != "self"]
-            if invalid and self._session._logger:
-                self._session._logger.warning(f"updateDeviceApplianceRadioSettings: ignoring unrecognized kwargs: {invalid}")
-
-        return self._session.put(metadata, resource, payload)
+        return dispatch.call(self._session, "updateDeviceApplianceRadioSettings", serial, **kwargs)
 
     def getDeviceApplianceUplinksSettings(self, serial: str):
         """
@@ -193,14 +95,7 @@ class AsyncAppliance:
         - serial (string): Serial
         """
 
-        metadata = {
-            "tags": ["appliance", "configure", "uplinks", "settings"],
-            "operation": "getDeviceApplianceUplinksSettings",
-        }
-        serial = urllib.parse.quote(str(serial), safe="")
-        resource = f"/devices/{serial}/appliance/uplinks/settings"
-
-        return self._session.get(metadata, resource)
+        return dispatch.call(self._session, "getDeviceApplianceUplinksSettings", serial)
 
     def updateDeviceApplianceUplinksSettings(self, serial: str, interfaces: dict, **kwargs):
         """
@@ -211,27 +106,7 @@ class AsyncAppliance:
         - interfaces (object): Interface settings.
         """
 
-        kwargs = locals()
-
-        metadata = {
-            "tags": ["appliance", "configure", "uplinks", "settings"],
-            "operation": "updateDeviceApplianceUplinksSettings",
-        }
-        serial = urllib.parse.quote(str(serial), safe="")
-        resource = f"/devices/{serial}/appliance/uplinks/settings"
-
-        body_params = [
-            "interfaces",
-        ]
-        payload = {k.strip(): v for k, v in kwargs.items() if k.strip() in body_params}
-
-        if self._session._validate_kwargs:
-            all_params = [] + body_params
-            invalid = [k for k in kwargs if k.strip() not in all_params and k != "self"]
-            if invalid and self._session._logger:
-                self._session._logger.warning(f"updateDeviceApplianceUplinksSettings: ignoring unrecognized kwargs: {invalid}")
-
-        return self._session.put(metadata, resource, payload)
+        return dispatch.call(self._session, "updateDeviceApplianceUplinksSettings", serial, interfaces, **kwargs)
 
     def createDeviceApplianceVmxAuthenticationToken(self, serial: str):
         """
@@ -241,14 +116,7 @@ class AsyncAppliance:
         - serial (string): Serial
         """
 
-        metadata = {
-            "tags": ["appliance", "configure", "vmx", "authenticationToken"],
-            "operation": "createDeviceApplianceVmxAuthenticationToken",
-        }
-        serial = urllib.parse.quote(str(serial), safe="")
-        resource = f"/devices/{serial}/appliance/vmx/authenticationToken"
-
-        return self._session.post(metadata, resource)
+        return dispatch.call(self._session, "createDeviceApplianceVmxAuthenticationToken", serial)
 
     def getNetworkApplianceClientSecurityEvents(
         self, networkId: str, clientId: str, total_pages=1, direction="next", **kwargs
@@ -270,42 +138,15 @@ class AsyncAppliance:
         - sortOrder (string): Sorted order of security events based on event detection time. Order options are 'ascending' or 'descending'. Default is ascending order.
         """
 
-        kwargs.update(locals())
-
-        if "sortOrder" in kwargs:
-            options = ["ascending", "descending"]
-            assert kwargs["sortOrder"] in options, (
-                f'''"sortOrder" cannot be "{kwargs["sortOrder"]}", & must be set to one of: {options}'''
-            )
-
-        metadata = {
-            "tags": ["appliance", "monitor", "clients", "security", "events"],
-            "operation": "getNetworkApplianceClientSecurityEvents",
-        }
-        networkId = urllib.parse.quote(str(networkId), safe="")
-        clientId = urllib.parse.quote(str(clientId), safe="")
-        resource = f"/networks/{networkId}/appliance/clients/{clientId}/security/events"
-
-        query_params = [
-            "t0",
-            "t1",
-            "timespan",
-            "perPage",
-            "startingAfter",
-            "endingBefore",
-            "sortOrder",
-        ]
-        params = {k.strip(): v for k, v in kwargs.items() if k.strip() in query_params}
-
-        if self._session._validate_kwargs:
-            all_params = query_params
-            invalid = [k for k in kwargs if k.strip() not in all_params and k != "self"]
-            if invalid and self._session._logger:
-                self._session._logger.warning(
-                    f"getNetworkApplianceClientSecurityEvents: ignoring unrecognized kwargs: {invalid}"
-                )
-
-        return self._session.get_pages(metadata, resource, params, total_pages, direction)
+        return dispatch.call(
+            self._session,
+            "getNetworkApplianceClientSecurityEvents",
+            networkId,
+            clientId,
+            total_pages=total_pages,
+            direction=direction,
+            **kwargs,
+        )
 
     def getNetworkApplianceConnectivityMonitoringDestinations(self, networkId: str):
         """
@@ -315,14 +156,7 @@ class AsyncAppliance:
         - networkId (string): Network ID
         """
 
-        metadata = {
-            "tags": ["appliance", "configure", "connectivityMonitoringDestinations"],
-            "operation": "getNetworkApplianceConnectivityMonitoringDestinations",
-        }
-        networkId = urllib.parse.quote(str(networkId), safe="")
-        resource = f"/networks/{networkId}/appliance/connectivityMonitoringDestinations"
-
-        return self._session.get(metadata, resource)
+        return dispatch.call(self._session, "getNetworkApplianceConnectivityMonitoringDestinations", networkId)
 
     def updateNetworkApplianceConnectivityMonitoringDestinations(self, networkId: str, **kwargs):
         """
@@ -333,29 +167,7 @@ class AsyncAppliance:
         - destinations (array): The list of connectivity monitoring destinations
         """
 
-        kwargs.update(locals())
-
-        metadata = {
-            "tags": ["appliance", "configure", "connectivityMonitoringDestinations"],
-            "operation": "updateNetworkApplianceConnectivityMonitoringDestinations",
-        }
-        networkId = urllib.parse.quote(str(networkId), safe="")
-        resource = f"/networks/{networkId}/appliance/connectivityMonitoringDestinations"
-
-        body_params = [
-            "destinations",
-        ]
-        payload = {k.strip(): v for k, v in kwargs.items() if k.strip() in body_params}
-
-        if self._session._validate_kwargs:
-            all_params = [] + body_params
-            invalid = [k for k in kwargs if k.strip() not in all_params and k != "self"]
-            if invalid and self._session._logger:
-                self._session._logger.warning(
-                    f"updateNetworkApplianceConnectivityMonitoringDestinations: ignoring unrecognized kwargs: {invalid}"
-                )
-
-        return self._session.put(metadata, resource, payload)
+        return dispatch.call(self._session, "updateNetworkApplianceConnectivityMonitoringDestinations", networkId, **kwargs)
 
     def getNetworkApplianceContentFiltering(self, networkId: str):
         """
@@ -365,14 +177,7 @@ class AsyncAppliance:
         - networkId (string): Network ID
         """
 
-        metadata = {
-            "tags": ["appliance", "configure", "contentFiltering"],
-            "operation": "getNetworkApplianceContentFiltering",
-        }
-        networkId = urllib.parse.quote(str(networkId), safe="")
-        resource = f"/networks/{networkId}/appliance/contentFiltering"
-
-        return self._session.get(metadata, resource)
+        return dispatch.call(self._session, "getNetworkApplianceContentFiltering", networkId)
 
     def updateNetworkApplianceContentFiltering(self, networkId: str, **kwargs):
         """
@@ -386,38 +191,7 @@ class AsyncAppliance:
         - urlCategoryListSize (string): URL category list size which is either 'topSites' or 'fullList'
         """
 
-        kwargs.update(locals())
-
-        if "urlCategoryListSize" in kwargs:
-            options = ["fullList", "topSites"]
-            assert kwargs["urlCategoryListSize"] in options, (
-                f'''"urlCategoryListSize" cannot be "{kwargs["urlCategoryListSize"]}", & must be set to one of: {options}'''
-            )
-
-        metadata = {
-            "tags": ["appliance", "configure", "contentFiltering"],
-            "operation": "updateNetworkApplianceContentFiltering",
-        }
-        networkId = urllib.parse.quote(str(networkId), safe="")
-        resource = f"/networks/{networkId}/appliance/contentFiltering"
-
-        body_params = [
-            "allowedUrlPatterns",
-            "blockedUrlPatterns",
-            "blockedUrlCategories",
-            "urlCategoryListSize",
-        ]
-        payload = {k.strip(): v for k, v in kwargs.items() if k.strip() in body_params}
-
-        if self._session._validate_kwargs:
-            all_params = [] + body_params
-            invalid = [k for k in kwargs if k.strip() not in all_params and k != "self"]
-            if invalid and self._session._logger:
-                self._session._logger.warning(
-                    f"updateNetworkApplianceContentFiltering: ignoring unrecognized kwargs: {invalid}"
-                )
-
-        return self._session.put(metadata, resource, payload)
+        return dispatch.call(self._session, "updateNetworkApplianceContentFiltering", networkId, **kwargs)
 
     def getNetworkApplianceContentFilteringCategories(self, networkId: str):
         """
@@ -427,14 +201,7 @@ class AsyncAppliance:
         - networkId (string): Network ID
         """
 
-        metadata = {
-            "tags": ["appliance", "configure", "contentFiltering", "categories"],
-            "operation": "getNetworkApplianceContentFilteringCategories",
-        }
-        networkId = urllib.parse.quote(str(networkId), safe="")
-        resource = f"/networks/{networkId}/appliance/contentFiltering/categories"
-
-        return self._session.get(metadata, resource)
+        return dispatch.call(self._session, "getNetworkApplianceContentFilteringCategories", networkId)
 
     def updateNetworkApplianceDevicesRedundancy(self, networkId: str, enabled: bool, **kwargs):
         """
@@ -448,36 +215,7 @@ class AsyncAppliance:
         - uplink (object): Uplink configuration
         """
 
-        kwargs.update(locals())
-
-        if "mode" in kwargs:
-            options = ["active-active", "active-passive", "disabled"]
-            assert kwargs["mode"] in options, f'''"mode" cannot be "{kwargs["mode"]}", & must be set to one of: {options}'''
-
-        metadata = {
-            "tags": ["appliance", "configure", "devices", "redundancy"],
-            "operation": "updateNetworkApplianceDevicesRedundancy",
-        }
-        networkId = urllib.parse.quote(str(networkId), safe="")
-        resource = f"/networks/{networkId}/appliance/devices/redundancy"
-
-        body_params = [
-            "enabled",
-            "mode",
-            "designations",
-            "uplink",
-        ]
-        payload = {k.strip(): v for k, v in kwargs.items() if k.strip() in body_params}
-
-        if self._session._validate_kwargs:
-            all_params = [] + body_params
-            invalid = [k for k in kwargs if k.strip() not in all_params and k != "self"]
-            if invalid and self._session._logger:
-                self._session._logger.warning(
-                    f"updateNetworkApplianceDevicesRedundancy: ignoring unrecognized kwargs: {invalid}"
-                )
-
-        return self._session.put(metadata, resource, payload)
+        return dispatch.call(self._session, "updateNetworkApplianceDevicesRedundancy", networkId, enabled, **kwargs)
 
     def createNetworkApplianceDevicesRedundancySwap(self, networkId: str):
         """
@@ -487,14 +225,7 @@ class AsyncAppliance:
         - networkId (string): Network ID
         """
 
-        metadata = {
-            "tags": ["appliance", "configure", "devices", "redundancy", "swap"],
-            "operation": "createNetworkApplianceDevicesRedundancySwap",
-        }
-        networkId = urllib.parse.quote(str(networkId), safe="")
-        resource = f"/networks/{networkId}/appliance/devices/redundancy/swap"
-
-        return self._session.post(metadata, resource)
+        return dispatch.call(self._session, "createNetworkApplianceDevicesRedundancySwap", networkId)
 
     def getNetworkApplianceFirewallCellularFirewallRules(self, networkId: str):
         """
@@ -504,14 +235,7 @@ class AsyncAppliance:
         - networkId (string): Network ID
         """
 
-        metadata = {
-            "tags": ["appliance", "configure", "firewall", "cellularFirewallRules"],
-            "operation": "getNetworkApplianceFirewallCellularFirewallRules",
-        }
-        networkId = urllib.parse.quote(str(networkId), safe="")
-        resource = f"/networks/{networkId}/appliance/firewall/cellularFirewallRules"
-
-        return self._session.get(metadata, resource)
+        return dispatch.call(self._session, "getNetworkApplianceFirewallCellularFirewallRules", networkId)
 
     def updateNetworkApplianceFirewallCellularFirewallRules(self, networkId: str, **kwargs):
         """
@@ -522,29 +246,7 @@ class AsyncAppliance:
         - rules (array): An ordered array of the firewall rules (not including the default rule)
         """
 
-        kwargs.update(locals())
-
-        metadata = {
-            "tags": ["appliance", "configure", "firewall", "cellularFirewallRules"],
-            "operation": "updateNetworkApplianceFirewallCellularFirewallRules",
-        }
-        networkId = urllib.parse.quote(str(networkId), safe="")
-        resource = f"/networks/{networkId}/appliance/firewall/cellularFirewallRules"
-
-        body_params = [
-            "rules",
-        ]
-        payload = {k.strip(): v for k, v in kwargs.items() if k.strip() in body_params}
-
-        if self._session._validate_kwargs:
-            all_params = [] + body_params
-            invalid = [k for k in kwargs if k.strip() not in all_params and k != "self"]
-            if invalid and self._session._logger:
-                self._session._logger.warning(
-                    f"updateNetworkApplianceFirewallCellularFirewallRules: ignoring unrecognized kwargs: {invalid}"
-                )
-
-        return self._session.put(metadata, resource, payload)
+        return dispatch.call(self._session, "updateNetworkApplianceFirewallCellularFirewallRules", networkId, **kwargs)
 
     def getNetworkApplianceFirewallFirewalledServices(self, networkId: str):
         """
@@ -554,14 +256,7 @@ class AsyncAppliance:
         - networkId (string): Network ID
         """
 
-        metadata = {
-            "tags": ["appliance", "configure", "firewall", "firewalledServices"],
-            "operation": "getNetworkApplianceFirewallFirewalledServices",
-        }
-        networkId = urllib.parse.quote(str(networkId), safe="")
-        resource = f"/networks/{networkId}/appliance/firewall/firewalledServices"
-
-        return self._session.get(metadata, resource)
+        return dispatch.call(self._session, "getNetworkApplianceFirewallFirewalledServices", networkId)
 
     def getNetworkApplianceFirewallFirewalledService(self, networkId: str, service: str):
         """
@@ -572,15 +267,7 @@ class AsyncAppliance:
         - service (string): Service
         """
 
-        metadata = {
-            "tags": ["appliance", "configure", "firewall", "firewalledServices"],
-            "operation": "getNetworkApplianceFirewallFirewalledService",
-        }
-        networkId = urllib.parse.quote(str(networkId), safe="")
-        service = urllib.parse.quote(str(service), safe="")
-        resource = f"/networks/{networkId}/appliance/firewall/firewalledServices/{service}"
-
-        return self._session.get(metadata, resource)
+        return dispatch.call(self._session, "getNetworkApplianceFirewallFirewalledService", networkId, service)
 
     def updateNetworkApplianceFirewallFirewalledService(self, networkId: str, service: str, access: str, **kwargs):
         """
@@ -593,37 +280,9 @@ class AsyncAppliance:
         - allowedIps (array): An array of allowed CIDRs that can access the service. This field is required if "access" is set to "restricted". Otherwise this field is ignored
         """
 
-        kwargs.update(locals())
-
-        if "access" in kwargs:
-            options = ["blocked", "restricted", "unrestricted"]
-            assert kwargs["access"] in options, (
-                f'''"access" cannot be "{kwargs["access"]}", & must be set to one of: {options}'''
-            )
-
-        metadata = {
-            "tags": ["appliance", "configure", "firewall", "firewalledServices"],
-            "operation": "updateNetworkApplianceFirewallFirewalledService",
-        }
-        networkId = urllib.parse.quote(str(networkId), safe="")
-        service = urllib.parse.quote(str(service), safe="")
-        resource = f"/networks/{networkId}/appliance/firewall/firewalledServices/{service}"
-
-        body_params = [
-            "access",
-            "allowedIps",
-        ]
-        payload = {k.strip(): v for k, v in kwargs.items() if k.strip() in body_params}
-
-        if self._session._validate_kwargs:
-            all_params = [] + body_params
-            invalid = [k for k in kwargs if k.strip() not in all_params and k != "self"]
-            if invalid and self._session._logger:
-                self._session._logger.warning(
-                    f"updateNetworkApplianceFirewallFirewalledService: ignoring unrecognized kwargs: {invalid}"
-                )
-
-        return self._session.put(metadata, resource, payload)
+        return dispatch.call(
+            self._session, "updateNetworkApplianceFirewallFirewalledService", networkId, service, access, **kwargs
+        )
 
     def getNetworkApplianceFirewallInboundCellularFirewallRules(self, networkId: str):
         """
@@ -633,14 +292,7 @@ class AsyncAppliance:
         - networkId (string): Network ID
         """
 
-        metadata = {
-            "tags": ["appliance", "configure", "firewall", "inboundCellularFirewallRules"],
-            "operation": "getNetworkApplianceFirewallInboundCellularFirewallRules",
-        }
-        networkId = urllib.parse.quote(str(networkId), safe="")
-        resource = f"/networks/{networkId}/appliance/firewall/inboundCellularFirewallRules"
-
-        return self._session.get(metadata, resource)
+        return dispatch.call(self._session, "getNetworkApplianceFirewallInboundCellularFirewallRules", networkId)
 
     def updateNetworkApplianceFirewallInboundCellularFirewallRules(self, networkId: str, **kwargs):
         """
@@ -651,29 +303,7 @@ class AsyncAppliance:
         - rules (array): An ordered array of the firewall rules (not including the default rule)
         """
 
-        kwargs.update(locals())
-
-        metadata = {
-            "tags": ["appliance", "configure", "firewall", "inboundCellularFirewallRules"],
-            "operation": "updateNetworkApplianceFirewallInboundCellularFirewallRules",
-        }
-        networkId = urllib.parse.quote(str(networkId), safe="")
-        resource = f"/networks/{networkId}/appliance/firewall/inboundCellularFirewallRules"
-
-        body_params = [
-            "rules",
-        ]
-        payload = {k.strip(): v for k, v in kwargs.items() if k.strip() in body_params}
-
-        if self._session._validate_kwargs:
-            all_params = [] + body_params
-            invalid = [k for k in kwargs if k.strip() not in all_params and k != "self"]
-            if invalid and self._session._logger:
-                self._session._logger.warning(
-                    f"updateNetworkApplianceFirewallInboundCellularFirewallRules: ignoring unrecognized kwargs: {invalid}"
-                )
-
-        return self._session.put(metadata, resource, payload)
+        return dispatch.call(self._session, "updateNetworkApplianceFirewallInboundCellularFirewallRules", networkId, **kwargs)
 
     def getNetworkApplianceFirewallInboundFirewallRules(self, networkId: str):
         """
@@ -683,14 +313,7 @@ class AsyncAppliance:
         - networkId (string): Network ID
         """
 
-        metadata = {
-            "tags": ["appliance", "configure", "firewall", "inboundFirewallRules"],
-            "operation": "getNetworkApplianceFirewallInboundFirewallRules",
-        }
-        networkId = urllib.parse.quote(str(networkId), safe="")
-        resource = f"/networks/{networkId}/appliance/firewall/inboundFirewallRules"
-
-        return self._session.get(metadata, resource)
+        return dispatch.call(self._session, "getNetworkApplianceFirewallInboundFirewallRules", networkId)
 
     def updateNetworkApplianceFirewallInboundFirewallRules(self, networkId: str, **kwargs):
         """
@@ -702,30 +325,7 @@ class AsyncAppliance:
         - syslogDefaultRule (boolean): Log the special default rule (boolean value - enable only if you've configured a syslog server) (optional)
         """
 
-        kwargs.update(locals())
-
-        metadata = {
-            "tags": ["appliance", "configure", "firewall", "inboundFirewallRules"],
-            "operation": "updateNetworkApplianceFirewallInboundFirewallRules",
-        }
-        networkId = urllib.parse.quote(str(networkId), safe="")
-        resource = f"/networks/{networkId}/appliance/firewall/inboundFirewallRules"
-
-        body_params = [
-            "rules",
-            "syslogDefaultRule",
-        ]
-        payload = {k.strip(): v for k, v in kwargs.items() if k.strip() in body_params}
-
-        if self._session._validate_kwargs:
-            all_params = [] + body_params
-            invalid = [k for k in kwargs if k.strip() not in all_params and k != "self"]
-            if invalid and self._session._logger:
-                self._session._logger.warning(
-                    f"updateNetworkApplianceFirewallInboundFirewallRules: ignoring unrecognized kwargs: {invalid}"
-                )
-
-        return self._session.put(metadata, resource, payload)
+        return dispatch.call(self._session, "updateNetworkApplianceFirewallInboundFirewallRules", networkId, **kwargs)
 
     def getNetworkApplianceFirewallL3FirewallRules(self, networkId: str):
         """
@@ -735,14 +335,7 @@ class AsyncAppliance:
         - networkId (string): Network ID
         """
 
-        metadata = {
-            "tags": ["appliance", "configure", "firewall", "l3FirewallRules"],
-            "operation": "getNetworkApplianceFirewallL3FirewallRules",
-        }
-        networkId = urllib.parse.quote(str(networkId), safe="")
-        resource = f"/networks/{networkId}/appliance/firewall/l3FirewallRules"
-
-        return self._session.get(metadata, resource)
+        return dispatch.call(self._session, "getNetworkApplianceFirewallL3FirewallRules", networkId)
 
     def updateNetworkApplianceFirewallL3FirewallRules(self, networkId: str, **kwargs):
         """
@@ -754,30 +347,7 @@ class AsyncAppliance:
         - syslogDefaultRule (boolean): Log the special default rule (boolean value - enable only if you've configured a syslog server) (optional)
         """
 
-        kwargs.update(locals())
-
-        metadata = {
-            "tags": ["appliance", "configure", "firewall", "l3FirewallRules"],
-            "operation": "updateNetworkApplianceFirewallL3FirewallRules",
-        }
-        networkId = urllib.parse.quote(str(networkId), safe="")
-        resource = f"/networks/{networkId}/appliance/firewall/l3FirewallRules"
-
-        body_params = [
-            "rules",
-            "syslogDefaultRule",
-        ]
-        payload = {k.strip(): v for k, v in kwargs.items() if k.strip() in body_params}
-
-        if self._session._validate_kwargs:
-            all_params = [] + body_params
-            invalid = [k for k in kwargs if k.strip() not in all_params and k != "self"]
-            if invalid and self._session._logger:
-                self._session._logger.warning(
-                    f"updateNetworkApplianceFirewallL3FirewallRules: ignoring unrecognized kwargs: {invalid}"
-                )
-
-        return self._session.put(metadata, resource, payload)
+        return dispatch.call(self._session, "updateNetworkApplianceFirewallL3FirewallRules", networkId, **kwargs)
 
     def getNetworkApplianceFirewallL7FirewallRules(self, networkId: str):
         """
@@ -787,14 +357,7 @@ class AsyncAppliance:
         - networkId (string): Network ID
         """
 
-        metadata = {
-            "tags": ["appliance", "configure", "firewall", "l7FirewallRules"],
-            "operation": "getNetworkApplianceFirewallL7FirewallRules",
-        }
-        networkId = urllib.parse.quote(str(networkId), safe="")
-        resource = f"/networks/{networkId}/appliance/firewall/l7FirewallRules"
-
-        return self._session.get(metadata, resource)
+        return dispatch.call(self._session, "getNetworkApplianceFirewallL7FirewallRules", networkId)
 
     def updateNetworkApplianceFirewallL7FirewallRules(self, networkId: str, **kwargs):
         """
@@ -805,29 +368,7 @@ class AsyncAppliance:
         - rules (array): An ordered array of the MX L7 firewall rules. Each rule is an object with 'policy', 'type', and 'value'. The 'value' shape depends on 'type': object for application/applicationCategory, string for host/port/ipRange, and an array of 2-letter ISO 3166-1 alpha-2 country codes for allowedCountries/blockedCountries. For backward compatibility, request types also accept whitelistedCountries/blacklistedCountries.
         """
 
-        kwargs.update(locals())
-
-        metadata = {
-            "tags": ["appliance", "configure", "firewall", "l7FirewallRules"],
-            "operation": "updateNetworkApplianceFirewallL7FirewallRules",
-        }
-        networkId = urllib.parse.quote(str(networkId), safe="")
-        resource = f"/networks/{networkId}/appliance/firewall/l7FirewallRules"
-
-        body_params = [
-            "rules",
-        ]
-        payload = {k.strip(): v for k, v in kwargs.items() if k.strip() in body_params}
-
-        if self._session._validate_kwargs:
-            all_params = [] + body_params
-            invalid = [k for k in kwargs if k.strip() not in all_params and k != "self"]
-            if invalid and self._session._logger:
-                self._session._logger.warning(
-                    f"updateNetworkApplianceFirewallL7FirewallRules: ignoring unrecognized kwargs: {invalid}"
-                )
-
-        return self._session.put(metadata, resource, payload)
+        return dispatch.call(self._session, "updateNetworkApplianceFirewallL7FirewallRules", networkId, **kwargs)
 
     def getNetworkApplianceFirewallL7FirewallRulesApplicationCategories(self, networkId: str):
         """
@@ -837,14 +378,7 @@ class AsyncAppliance:
         - networkId (string): Network ID
         """
 
-        metadata = {
-            "tags": ["appliance", "configure", "firewall", "l7FirewallRules", "applicationCategories"],
-            "operation": "getNetworkApplianceFirewallL7FirewallRulesApplicationCategories",
-        }
-        networkId = urllib.parse.quote(str(networkId), safe="")
-        resource = f"/networks/{networkId}/appliance/firewall/l7FirewallRules/applicationCategories"
-
-        return self._session.get(metadata, resource)
+        return dispatch.call(self._session, "getNetworkApplianceFirewallL7FirewallRulesApplicationCategories", networkId)
 
     def updateNetworkApplianceFirewallMulticastForwarding(self, networkId: str, rules: list, **kwargs):
         """
@@ -855,29 +389,7 @@ class AsyncAppliance:
         - rules (array): Static multicast forwarding rules. Pass an empty array to clear all rules.
         """
 
-        kwargs = locals()
-
-        metadata = {
-            "tags": ["appliance", "configure", "firewall", "multicastForwarding"],
-            "operation": "updateNetworkApplianceFirewallMulticastForwarding",
-        }
-        networkId = urllib.parse.quote(str(networkId), safe="")
-        resource = f"/networks/{networkId}/appliance/firewall/multicastForwarding"
-
-        body_params = [
-            "rules",
-        ]
-        payload = {k.strip(): v for k, v in kwargs.items() if k.strip() in body_params}
-
-        if self._session._validate_kwargs:
-            all_params = [] + body_params
-            invalid = [k for k in kwargs if k.strip() not in all_params and k != "self"]
-            if invalid and self._session._logger:
-                self._session._logger.warning(
-                    f"updateNetworkApplianceFirewallMulticastForwarding: ignoring unrecognized kwargs: {invalid}"
-                )
-
-        return self._session.put(metadata, resource, payload)
+        return dispatch.call(self._session, "updateNetworkApplianceFirewallMulticastForwarding", networkId, rules, **kwargs)
 
     def getNetworkApplianceFirewallOneToManyNatRules(self, networkId: str):
         """
@@ -887,14 +399,7 @@ class AsyncAppliance:
         - networkId (string): Network ID
         """
 
-        metadata = {
-            "tags": ["appliance", "configure", "firewall", "oneToManyNatRules"],
-            "operation": "getNetworkApplianceFirewallOneToManyNatRules",
-        }
-        networkId = urllib.parse.quote(str(networkId), safe="")
-        resource = f"/networks/{networkId}/appliance/firewall/oneToManyNatRules"
-
-        return self._session.get(metadata, resource)
+        return dispatch.call(self._session, "getNetworkApplianceFirewallOneToManyNatRules", networkId)
 
     def updateNetworkApplianceFirewallOneToManyNatRules(self, networkId: str, rules: list, **kwargs):
         """
@@ -905,29 +410,7 @@ class AsyncAppliance:
         - rules (array): An array of 1:Many nat rules
         """
 
-        kwargs = locals()
-
-        metadata = {
-            "tags": ["appliance", "configure", "firewall", "oneToManyNatRules"],
-            "operation": "updateNetworkApplianceFirewallOneToManyNatRules",
-        }
-        networkId = urllib.parse.quote(str(networkId), safe="")
-        resource = f"/networks/{networkId}/appliance/firewall/oneToManyNatRules"
-
-        body_params = [
-            "rules",
-        ]
-        payload = {k.strip(): v for k, v in kwargs.items() if k.strip() in body_params}
-
-        if self._session._validate_kwargs:
-            all_params = [] + body_params
-            invalid = [k for k in kwargs if k.strip() not in all_params and k != "self"]
-            if invalid and self._session._logger:
-                self._session._logger.warning(
-                    f"updateNetworkApplianceFirewallOneToManyNatRules: ignoring unrecognized kwargs: {invalid}"
-                )
-
-        return self._session.put(metadata, resource, payload)
+        return dispatch.call(self._session, "updateNetworkApplianceFirewallOneToManyNatRules", networkId, rules, **kwargs)
 
     def getNetworkApplianceFirewallOneToOneNatRules(self, networkId: str):
         """
@@ -937,14 +420,7 @@ class AsyncAppliance:
         - networkId (string): Network ID
         """
 
-        metadata = {
-            "tags": ["appliance", "configure", "firewall", "oneToOneNatRules"],
-            "operation": "getNetworkApplianceFirewallOneToOneNatRules",
-        }
-        networkId = urllib.parse.quote(str(networkId), safe="")
-        resource = f"/networks/{networkId}/appliance/firewall/oneToOneNatRules"
-
-        return self._session.get(metadata, resource)
+        return dispatch.call(self._session, "getNetworkApplianceFirewallOneToOneNatRules", networkId)
 
     def updateNetworkApplianceFirewallOneToOneNatRules(self, networkId: str, rules: list, **kwargs):
         """
@@ -955,29 +431,7 @@ class AsyncAppliance:
         - rules (array): An array of 1:1 nat rules
         """
 
-        kwargs = locals()
-
-        metadata = {
-            "tags": ["appliance", "configure", "firewall", "oneToOneNatRules"],
-            "operation": "updateNetworkApplianceFirewallOneToOneNatRules",
-        }
-        networkId = urllib.parse.quote(str(networkId), safe="")
-        resource = f"/networks/{networkId}/appliance/firewall/oneToOneNatRules"
-
-        body_params = [
-            "rules",
-        ]
-        payload = {k.strip(): v for k, v in kwargs.items() if k.strip() in body_params}
-
-        if self._session._validate_kwargs:
-            all_params = [] + body_params
-            invalid = [k for k in kwargs if k.strip() not in all_params and k != "self"]
-            if invalid and self._session._logger:
-                self._session._logger.warning(
-                    f"updateNetworkApplianceFirewallOneToOneNatRules: ignoring unrecognized kwargs: {invalid}"
-                )
-
-        return self._session.put(metadata, resource, payload)
+        return dispatch.call(self._session, "updateNetworkApplianceFirewallOneToOneNatRules", networkId, rules, **kwargs)
 
     def getNetworkApplianceFirewallPortForwardingRules(self, networkId: str):
         """
@@ -987,14 +441,7 @@ class AsyncAppliance:
         - networkId (string): Network ID
         """
 
-        metadata = {
-            "tags": ["appliance", "configure", "firewall", "portForwardingRules"],
-            "operation": "getNetworkApplianceFirewallPortForwardingRules",
-        }
-        networkId = urllib.parse.quote(str(networkId), safe="")
-        resource = f"/networks/{networkId}/appliance/firewall/portForwardingRules"
-
-        return self._session.get(metadata, resource)
+        return dispatch.call(self._session, "getNetworkApplianceFirewallPortForwardingRules", networkId)
 
     def updateNetworkApplianceFirewallPortForwardingRules(self, networkId: str, rules: list, **kwargs):
         """
@@ -1005,29 +452,7 @@ class AsyncAppliance:
         - rules (array): An array of port forwarding params
         """
 
-        kwargs = locals()
-
-        metadata = {
-            "tags": ["appliance", "configure", "firewall", "portForwardingRules"],
-            "operation": "updateNetworkApplianceFirewallPortForwardingRules",
-        }
-        networkId = urllib.parse.quote(str(networkId), safe="")
-        resource = f"/networks/{networkId}/appliance/firewall/portForwardingRules"
-
-        body_params = [
-            "rules",
-        ]
-        payload = {k.strip(): v for k, v in kwargs.items() if k.strip() in body_params}
-
-        if self._session._validate_kwargs:
-            all_params = [] + body_params
-            invalid = [k for k in kwargs if k.strip() not in all_params and k != "self"]
-            if invalid and self._session._logger:
-                self._session._logger.warning(
-                    f"updateNetworkApplianceFirewallPortForwardingRules: ignoring unrecognized kwargs: {invalid}"
-                )
-
-        return self._session.put(metadata, resource, payload)
+        return dispatch.call(self._session, "updateNetworkApplianceFirewallPortForwardingRules", networkId, rules, **kwargs)
 
     def getNetworkApplianceFirewallSettings(self, networkId: str):
         """
@@ -1037,14 +462,7 @@ class AsyncAppliance:
         - networkId (string): Network ID
         """
 
-        metadata = {
-            "tags": ["appliance", "configure", "firewall", "settings"],
-            "operation": "getNetworkApplianceFirewallSettings",
-        }
-        networkId = urllib.parse.quote(str(networkId), safe="")
-        resource = f"/networks/{networkId}/appliance/firewall/settings"
-
-        return self._session.get(metadata, resource)
+        return dispatch.call(self._session, "getNetworkApplianceFirewallSettings", networkId)
 
     def updateNetworkApplianceFirewallSettings(self, networkId: str, **kwargs):
         """
@@ -1055,29 +473,7 @@ class AsyncAppliance:
         - spoofingProtection (object): Spoofing protection settings
         """
 
-        kwargs.update(locals())
-
-        metadata = {
-            "tags": ["appliance", "configure", "firewall", "settings"],
-            "operation": "updateNetworkApplianceFirewallSettings",
-        }
-        networkId = urllib.parse.quote(str(networkId), safe="")
-        resource = f"/networks/{networkId}/appliance/firewall/settings"
-
-        body_params = [
-            "spoofingProtection",
-        ]
-        payload = {k.strip(): v for k, v in kwargs.items() if k.strip() in body_params}
-
-        if self._session._validate_kwargs:
-            all_params = [] + body_params
-            invalid = [k for k in kwargs if k.strip() not in all_params and k != "self"]
-            if invalid and self._session._logger:
-                self._session._logger.warning(
-                    f"updateNetworkApplianceFirewallSettings: ignoring unrecognized kwargs: {invalid}"
-                )
-
-        return self._session.put(metadata, resource, payload)
+        return dispatch.call(self._session, "updateNetworkApplianceFirewallSettings", networkId, **kwargs)
 
     def createNetworkApplianceInterfacesL3(self, networkId: str, ipv4: dict, **kwargs):
         """
@@ -1089,28 +485,7 @@ class AsyncAppliance:
         - port (object): Port configuration
         """
 
-        kwargs.update(locals())
-
-        metadata = {
-            "tags": ["appliance", "configure", "interfaces", "l3"],
-            "operation": "createNetworkApplianceInterfacesL3",
-        }
-        networkId = urllib.parse.quote(str(networkId), safe="")
-        resource = f"/networks/{networkId}/appliance/interfaces/l3"
-
-        body_params = [
-            "port",
-            "ipv4",
-        ]
-        payload = {k.strip(): v for k, v in kwargs.items() if k.strip() in body_params}
-
-        if self._session._validate_kwargs:
-            all_params = [] + body_params
-            invalid = [k for k in kwargs if k.strip() not in all_params and k != "self"]
-            if invalid and self._session._logger:
-                self._session._logger.warning(f"createNetworkApplianceInterfacesL3: ignoring unrecognized kwargs: {invalid}")
-
-        return self._session.post(metadata, resource, payload)
+        return dispatch.call(self._session, "createNetworkApplianceInterfacesL3", networkId, ipv4, **kwargs)
 
     def updateNetworkApplianceInterfacesL3(self, networkId: str, interfaceId: str, **kwargs):
         """
@@ -1123,29 +498,7 @@ class AsyncAppliance:
         - ipv4 (object): IPv4 configuration
         """
 
-        kwargs.update(locals())
-
-        metadata = {
-            "tags": ["appliance", "configure", "interfaces", "l3"],
-            "operation": "updateNetworkApplianceInterfacesL3",
-        }
-        networkId = urllib.parse.quote(str(networkId), safe="")
-        interfaceId = urllib.parse.quote(str(interfaceId), safe="")
-        resource = f"/networks/{networkId}/appliance/interfaces/l3/{interfaceId}"
-
-        body_params = [
-            "port",
-            "ipv4",
-        ]
-        payload = {k.strip(): v for k, v in kwargs.items() if k.strip() in body_params}
-
-        if self._session._validate_kwargs:
-            all_params = [] + body_params
-            invalid = [k for k in kwargs if k.strip() not in all_params and k != "self"]
-            if invalid and self._session._logger:
-                self._session._logger.warning(f"updateNetworkApplianceInterfacesL3: ignoring unrecognized kwargs: {invalid}")
-
-        return self._session.put(metadata, resource, payload)
+        return dispatch.call(self._session, "updateNetworkApplianceInterfacesL3", networkId, interfaceId, **kwargs)
 
     def deleteNetworkApplianceInterfacesL3(self, networkId: str, interfaceId: str):
         """
@@ -1156,15 +509,7 @@ class AsyncAppliance:
         - interfaceId (string): Interface ID
         """
 
-        metadata = {
-            "tags": ["appliance", "configure", "interfaces", "l3"],
-            "operation": "deleteNetworkApplianceInterfacesL3",
-        }
-        networkId = urllib.parse.quote(str(networkId), safe="")
-        interfaceId = urllib.parse.quote(str(interfaceId), safe="")
-        resource = f"/networks/{networkId}/appliance/interfaces/l3/{interfaceId}"
-
-        return self._session.delete(metadata, resource)
+        return dispatch.call(self._session, "deleteNetworkApplianceInterfacesL3", networkId, interfaceId)
 
     def getNetworkAppliancePorts(self, networkId: str):
         """
@@ -1174,14 +519,7 @@ class AsyncAppliance:
         - networkId (string): Network ID
         """
 
-        metadata = {
-            "tags": ["appliance", "configure", "ports"],
-            "operation": "getNetworkAppliancePorts",
-        }
-        networkId = urllib.parse.quote(str(networkId), safe="")
-        resource = f"/networks/{networkId}/appliance/ports"
-
-        return self._session.get(metadata, resource)
+        return dispatch.call(self._session, "getNetworkAppliancePorts", networkId)
 
     def getNetworkAppliancePort(self, networkId: str, portId: str):
         """
@@ -1192,15 +530,7 @@ class AsyncAppliance:
         - portId (string): Port ID
         """
 
-        metadata = {
-            "tags": ["appliance", "configure", "ports"],
-            "operation": "getNetworkAppliancePort",
-        }
-        networkId = urllib.parse.quote(str(networkId), safe="")
-        portId = urllib.parse.quote(str(portId), safe="")
-        resource = f"/networks/{networkId}/appliance/ports/{portId}"
-
-        return self._session.get(metadata, resource)
+        return dispatch.call(self._session, "getNetworkAppliancePort", networkId, portId)
 
     def updateNetworkAppliancePort(self, networkId: str, portId: str, **kwargs):
         """
@@ -1218,34 +548,7 @@ class AsyncAppliance:
         - sgt (object): Security Group Tag settings for the port.
         """
 
-        kwargs.update(locals())
-
-        metadata = {
-            "tags": ["appliance", "configure", "ports"],
-            "operation": "updateNetworkAppliancePort",
-        }
-        networkId = urllib.parse.quote(str(networkId), safe="")
-        portId = urllib.parse.quote(str(portId), safe="")
-        resource = f"/networks/{networkId}/appliance/ports/{portId}"
-
-        body_params = [
-            "enabled",
-            "dropUntaggedTraffic",
-            "type",
-            "vlan",
-            "allowedVlans",
-            "accessPolicy",
-            "sgt",
-        ]
-        payload = {k.strip(): v for k, v in kwargs.items() if k.strip() in body_params}
-
-        if self._session._validate_kwargs:
-            all_params = [] + body_params
-            invalid = [k for k in kwargs if k.strip() not in all_params and k != "self"]
-            if invalid and self._session._logger:
-                self._session._logger.warning(f"updateNetworkAppliancePort: ignoring unrecognized kwargs: {invalid}")
-
-        return self._session.put(metadata, resource, payload)
+        return dispatch.call(self._session, "updateNetworkAppliancePort", networkId, portId, **kwargs)
 
     def getNetworkAppliancePrefixesDelegatedStatics(self, networkId: str):
         """
@@ -1255,14 +558,7 @@ class AsyncAppliance:
         - networkId (string): Network ID
         """
 
-        metadata = {
-            "tags": ["appliance", "configure", "prefixes", "delegated", "statics"],
-            "operation": "getNetworkAppliancePrefixesDelegatedStatics",
-        }
-        networkId = urllib.parse.quote(str(networkId), safe="")
-        resource = f"/networks/{networkId}/appliance/prefixes/delegated/statics"
-
-        return self._session.get(metadata, resource)
+        return dispatch.call(self._session, "getNetworkAppliancePrefixesDelegatedStatics", networkId)
 
     def createNetworkAppliancePrefixesDelegatedStatic(self, networkId: str, prefix: str, origin: dict, **kwargs):
         """
@@ -1275,31 +571,9 @@ class AsyncAppliance:
         - description (string): A name or description for the prefix
         """
 
-        kwargs.update(locals())
-
-        metadata = {
-            "tags": ["appliance", "configure", "prefixes", "delegated", "statics"],
-            "operation": "createNetworkAppliancePrefixesDelegatedStatic",
-        }
-        networkId = urllib.parse.quote(str(networkId), safe="")
-        resource = f"/networks/{networkId}/appliance/prefixes/delegated/statics"
-
-        body_params = [
-            "prefix",
-            "origin",
-            "description",
-        ]
-        payload = {k.strip(): v for k, v in kwargs.items() if k.strip() in body_params}
-
-        if self._session._validate_kwargs:
-            all_params = [] + body_params
-            invalid = [k for k in kwargs if k.strip() not in all_params and k != "self"]
-            if invalid and self._session._logger:
-                self._session._logger.warning(
-                    f"createNetworkAppliancePrefixesDelegatedStatic: ignoring unrecognized kwargs: {invalid}"
-                )
-
-        return self._session.post(metadata, resource, payload)
+        return dispatch.call(
+            self._session, "createNetworkAppliancePrefixesDelegatedStatic", networkId, prefix, origin, **kwargs
+        )
 
     def getNetworkAppliancePrefixesDelegatedStatic(self, networkId: str, staticDelegatedPrefixId: str):
         """
@@ -1310,15 +584,7 @@ class AsyncAppliance:
         - staticDelegatedPrefixId (string): Static delegated prefix ID
         """
 
-        metadata = {
-            "tags": ["appliance", "configure", "prefixes", "delegated", "statics"],
-            "operation": "getNetworkAppliancePrefixesDelegatedStatic",
-        }
-        networkId = urllib.parse.quote(str(networkId), safe="")
-        staticDelegatedPrefixId = urllib.parse.quote(str(staticDelegatedPrefixId), safe="")
-        resource = f"/networks/{networkId}/appliance/prefixes/delegated/statics/{staticDelegatedPrefixId}"
-
-        return self._session.get(metadata, resource)
+        return dispatch.call(self._session, "getNetworkAppliancePrefixesDelegatedStatic", networkId, staticDelegatedPrefixId)
 
     def updateNetworkAppliancePrefixesDelegatedStatic(self, networkId: str, staticDelegatedPrefixId: str, **kwargs):
         """
@@ -1332,32 +598,9 @@ class AsyncAppliance:
         - description (string): A name or description for the prefix
         """
 
-        kwargs.update(locals())
-
-        metadata = {
-            "tags": ["appliance", "configure", "prefixes", "delegated", "statics"],
-            "operation": "updateNetworkAppliancePrefixesDelegatedStatic",
-        }
-        networkId = urllib.parse.quote(str(networkId), safe="")
-        staticDelegatedPrefixId = urllib.parse.quote(str(staticDelegatedPrefixId), safe="")
-        resource = f"/networks/{networkId}/appliance/prefixes/delegated/statics/{staticDelegatedPrefixId}"
-
-        body_params = [
-            "prefix",
-            "origin",
-            "description",
-        ]
-        payload = {k.strip(): v for k, v in kwargs.items() if k.strip() in body_params}
-
-        if self._session._validate_kwargs:
-            all_params = [] + body_params
-            invalid = [k for k in kwargs if k.strip() not in all_params and k != "self"]
-            if invalid and self._session._logger:
-                self._session._logger.warning(
-                    f"updateNetworkAppliancePrefixesDelegatedStatic: ignoring unrecognized kwargs: {invalid}"
-                )
-
-        return self._session.put(metadata, resource, payload)
+        return dispatch.call(
+            self._session, "updateNetworkAppliancePrefixesDelegatedStatic", networkId, staticDelegatedPrefixId, **kwargs
+        )
 
     def deleteNetworkAppliancePrefixesDelegatedStatic(self, networkId: str, staticDelegatedPrefixId: str):
         """
@@ -1368,15 +611,9 @@ class AsyncAppliance:
         - staticDelegatedPrefixId (string): Static delegated prefix ID
         """
 
-        metadata = {
-            "tags": ["appliance", "configure", "prefixes", "delegated", "statics"],
-            "operation": "deleteNetworkAppliancePrefixesDelegatedStatic",
-        }
-        networkId = urllib.parse.quote(str(networkId), safe="")
-        staticDelegatedPrefixId = urllib.parse.quote(str(staticDelegatedPrefixId), safe="")
-        resource = f"/networks/{networkId}/appliance/prefixes/delegated/statics/{staticDelegatedPrefixId}"
-
-        return self._session.delete(metadata, resource)
+        return dispatch.call(
+            self._session, "deleteNetworkAppliancePrefixesDelegatedStatic", networkId, staticDelegatedPrefixId
+        )
 
     def getNetworkApplianceRfProfiles(self, networkId: str):
         """
@@ -1386,14 +623,7 @@ class AsyncAppliance:
         - networkId (string): Network ID
         """
 
-        metadata = {
-            "tags": ["appliance", "configure", "rfProfiles"],
-            "operation": "getNetworkApplianceRfProfiles",
-        }
-        networkId = urllib.parse.quote(str(networkId), safe="")
-        resource = f"/networks/{networkId}/appliance/rfProfiles"
-
-        return self._session.get(metadata, resource)
+        return dispatch.call(self._session, "getNetworkApplianceRfProfiles", networkId)
 
     def createNetworkApplianceRfProfile(self, networkId: str, name: str, **kwargs):
         """
@@ -1407,30 +637,7 @@ class AsyncAppliance:
         - perSsidSettings (object): Per-SSID radio settings by number.
         """
 
-        kwargs.update(locals())
-
-        metadata = {
-            "tags": ["appliance", "configure", "rfProfiles"],
-            "operation": "createNetworkApplianceRfProfile",
-        }
-        networkId = urllib.parse.quote(str(networkId), safe="")
-        resource = f"/networks/{networkId}/appliance/rfProfiles"
-
-        body_params = [
-            "name",
-            "twoFourGhzSettings",
-            "fiveGhzSettings",
-            "perSsidSettings",
-        ]
-        payload = {k.strip(): v for k, v in kwargs.items() if k.strip() in body_params}
-
-        if self._session._validate_kwargs:
-            all_params = [] + body_params
-            invalid = [k for k in kwargs if k.strip() not in all_params and k != "self"]
-            if invalid and self._session._logger:
-                self._session._logger.warning(f"createNetworkApplianceRfProfile: ignoring unrecognized kwargs: {invalid}")
-
-        return self._session.post(metadata, resource, payload)
+        return dispatch.call(self._session, "createNetworkApplianceRfProfile", networkId, name, **kwargs)
 
     def updateNetworkApplianceRfProfile(self, networkId: str, rfProfileId: str, **kwargs):
         """
@@ -1445,31 +652,7 @@ class AsyncAppliance:
         - perSsidSettings (object): Per-SSID radio settings by number.
         """
 
-        kwargs.update(locals())
-
-        metadata = {
-            "tags": ["appliance", "configure", "rfProfiles"],
-            "operation": "updateNetworkApplianceRfProfile",
-        }
-        networkId = urllib.parse.quote(str(networkId), safe="")
-        rfProfileId = urllib.parse.quote(str(rfProfileId), safe="")
-        resource = f"/networks/{networkId}/appliance/rfProfiles/{rfProfileId}"
-
-        body_params = [
-            "name",
-            "twoFourGhzSettings",
-            "fiveGhzSettings",
-            "perSsidSettings",
-        ]
-        payload = {k.strip(): v for k, v in kwargs.items() if k.strip() in body_params}
-
-        if self._session._validate_kwargs:
-            all_params = [] + body_params
-            invalid = [k for k in kwargs if k.strip() not in all_params and k != "self"]
-            if invalid and self._session._logger:
-                self._session._logger.warning(f"updateNetworkApplianceRfProfile: ignoring unrecognized kwargs: {invalid}")
-
-        return self._session.put(metadata, resource, payload)
+        return dispatch.call(self._session, "updateNetworkApplianceRfProfile", networkId, rfProfileId, **kwargs)
 
     def deleteNetworkApplianceRfProfile(self, networkId: str, rfProfileId: str):
         """
@@ -1480,15 +663,7 @@ class AsyncAppliance:
         - rfProfileId (string): Rf profile ID
         """
 
-        metadata = {
-            "tags": ["appliance", "configure", "rfProfiles"],
-            "operation": "deleteNetworkApplianceRfProfile",
-        }
-        networkId = urllib.parse.quote(str(networkId), safe="")
-        rfProfileId = urllib.parse.quote(str(rfProfileId), safe="")
-        resource = f"/networks/{networkId}/appliance/rfProfiles/{rfProfileId}"
-
-        return self._session.delete(metadata, resource)
+        return dispatch.call(self._session, "deleteNetworkApplianceRfProfile", networkId, rfProfileId)
 
     def getNetworkApplianceRfProfile(self, networkId: str, rfProfileId: str):
         """
@@ -1499,15 +674,7 @@ class AsyncAppliance:
         - rfProfileId (string): Rf profile ID
         """
 
-        metadata = {
-            "tags": ["appliance", "configure", "rfProfiles"],
-            "operation": "getNetworkApplianceRfProfile",
-        }
-        networkId = urllib.parse.quote(str(networkId), safe="")
-        rfProfileId = urllib.parse.quote(str(rfProfileId), safe="")
-        resource = f"/networks/{networkId}/appliance/rfProfiles/{rfProfileId}"
-
-        return self._session.get(metadata, resource)
+        return dispatch.call(self._session, "getNetworkApplianceRfProfile", networkId, rfProfileId)
 
     def updateNetworkApplianceSdwanInternetPolicies(self, networkId: str, **kwargs):
         """
@@ -1518,29 +685,7 @@ class AsyncAppliance:
         - wanTrafficUplinkPreferences (array): policies with respective traffic filters for an MX network
         """
 
-        kwargs.update(locals())
-
-        metadata = {
-            "tags": ["appliance", "configure", "sdwan", "internetPolicies"],
-            "operation": "updateNetworkApplianceSdwanInternetPolicies",
-        }
-        networkId = urllib.parse.quote(str(networkId), safe="")
-        resource = f"/networks/{networkId}/appliance/sdwan/internetPolicies"
-
-        body_params = [
-            "wanTrafficUplinkPreferences",
-        ]
-        payload = {k.strip(): v for k, v in kwargs.items() if k.strip() in body_params}
-
-        if self._session._validate_kwargs:
-            all_params = [] + body_params
-            invalid = [k for k in kwargs if k.strip() not in all_params and k != "self"]
-            if invalid and self._session._logger:
-                self._session._logger.warning(
-                    f"updateNetworkApplianceSdwanInternetPolicies: ignoring unrecognized kwargs: {invalid}"
-                )
-
-        return self._session.put(metadata, resource, payload)
+        return dispatch.call(self._session, "updateNetworkApplianceSdwanInternetPolicies", networkId, **kwargs)
 
     def getNetworkApplianceSecurityEvents(self, networkId: str, total_pages=1, direction="next", **kwargs):
         """
@@ -1559,39 +704,14 @@ class AsyncAppliance:
         - sortOrder (string): Sorted order of security events based on event detection time. Order options are 'ascending' or 'descending'. Default is ascending order.
         """
 
-        kwargs.update(locals())
-
-        if "sortOrder" in kwargs:
-            options = ["ascending", "descending"]
-            assert kwargs["sortOrder"] in options, (
-                f'''"sortOrder" cannot be "{kwargs["sortOrder"]}", & must be set to one of: {options}'''
-            )
-
-        metadata = {
-            "tags": ["appliance", "monitor", "security", "events"],
-            "operation": "getNetworkApplianceSecurityEvents",
-        }
-        networkId = urllib.parse.quote(str(networkId), safe="")
-        resource = f"/networks/{networkId}/appliance/security/events"
-
-        query_params = [
-            "t0",
-            "t1",
-            "timespan",
-            "perPage",
-            "startingAfter",
-            "endingBefore",
-            "sortOrder",
-        ]
-        params = {k.strip(): v for k, v in kwargs.items() if k.strip() in query_params}
-
-        if self._session._validate_kwargs:
-            all_params = query_params
-            invalid = [k for k in kwargs if k.strip() not in all_params and k != "self"]
-            if invalid and self._session._logger:
-                self._session._logger.warning(f"getNetworkApplianceSecurityEvents: ignoring unrecognized kwargs: {invalid}")
-
-        return self._session.get_pages(metadata, resource, params, total_pages, direction)
+        return dispatch.call(
+            self._session,
+            "getNetworkApplianceSecurityEvents",
+            networkId,
+            total_pages=total_pages,
+            direction=direction,
+            **kwargs,
+        )
 
     def getNetworkApplianceSecurityIntrusion(self, networkId: str):
         """
@@ -1601,14 +721,7 @@ class AsyncAppliance:
         - networkId (string): Network ID
         """
 
-        metadata = {
-            "tags": ["appliance", "configure", "security", "intrusion"],
-            "operation": "getNetworkApplianceSecurityIntrusion",
-        }
-        networkId = urllib.parse.quote(str(networkId), safe="")
-        resource = f"/networks/{networkId}/appliance/security/intrusion"
-
-        return self._session.get(metadata, resource)
+        return dispatch.call(self._session, "getNetworkApplianceSecurityIntrusion", networkId)
 
     def updateNetworkApplianceSecurityIntrusion(self, networkId: str, **kwargs):
         """
@@ -1621,40 +734,7 @@ class AsyncAppliance:
         - protectedNetworks (object): Set the included/excluded networks from the intrusion engine (optional - omitting will leave current config unchanged). This is available only in 'passthrough' mode
         """
 
-        kwargs.update(locals())
-
-        if "mode" in kwargs:
-            options = ["detection", "disabled", "prevention"]
-            assert kwargs["mode"] in options, f'''"mode" cannot be "{kwargs["mode"]}", & must be set to one of: {options}'''
-        if "idsRulesets" in kwargs:
-            options = ["balanced", "connectivity", "security"]
-            assert kwargs["idsRulesets"] in options, (
-                f'''"idsRulesets" cannot be "{kwargs["idsRulesets"]}", & must be set to one of: {options}'''
-            )
-
-        metadata = {
-            "tags": ["appliance", "configure", "security", "intrusion"],
-            "operation": "updateNetworkApplianceSecurityIntrusion",
-        }
-        networkId = urllib.parse.quote(str(networkId), safe="")
-        resource = f"/networks/{networkId}/appliance/security/intrusion"
-
-        body_params = [
-            "mode",
-            "idsRulesets",
-            "protectedNetworks",
-        ]
-        payload = {k.strip(): v for k, v in kwargs.items() if k.strip() in body_params}
-
-        if self._session._validate_kwargs:
-            all_params = [] + body_params
-            invalid = [k for k in kwargs if k.strip() not in all_params and k != "self"]
-            if invalid and self._session._logger:
-                self._session._logger.warning(
-                    f"updateNetworkApplianceSecurityIntrusion: ignoring unrecognized kwargs: {invalid}"
-                )
-
-        return self._session.put(metadata, resource, payload)
+        return dispatch.call(self._session, "updateNetworkApplianceSecurityIntrusion", networkId, **kwargs)
 
     def getNetworkApplianceSecurityMalware(self, networkId: str):
         """
@@ -1664,14 +744,7 @@ class AsyncAppliance:
         - networkId (string): Network ID
         """
 
-        metadata = {
-            "tags": ["appliance", "configure", "security", "malware"],
-            "operation": "getNetworkApplianceSecurityMalware",
-        }
-        networkId = urllib.parse.quote(str(networkId), safe="")
-        resource = f"/networks/{networkId}/appliance/security/malware"
-
-        return self._session.get(metadata, resource)
+        return dispatch.call(self._session, "getNetworkApplianceSecurityMalware", networkId)
 
     def updateNetworkApplianceSecurityMalware(self, networkId: str, mode: str, **kwargs):
         """
@@ -1684,35 +757,7 @@ class AsyncAppliance:
         - allowedFiles (array): The sha256 digests of files that should be permitted by the malware detection engine. If omitted, the current config will remain unchanged. This is available only if your network supports AMP allow listing
         """
 
-        kwargs.update(locals())
-
-        if "mode" in kwargs:
-            options = ["disabled", "enabled"]
-            assert kwargs["mode"] in options, f'''"mode" cannot be "{kwargs["mode"]}", & must be set to one of: {options}'''
-
-        metadata = {
-            "tags": ["appliance", "configure", "security", "malware"],
-            "operation": "updateNetworkApplianceSecurityMalware",
-        }
-        networkId = urllib.parse.quote(str(networkId), safe="")
-        resource = f"/networks/{networkId}/appliance/security/malware"
-
-        body_params = [
-            "mode",
-            "allowedUrls",
-            "allowedFiles",
-        ]
-        payload = {k.strip(): v for k, v in kwargs.items() if k.strip() in body_params}
-
-        if self._session._validate_kwargs:
-            all_params = [] + body_params
-            invalid = [k for k in kwargs if k.strip() not in all_params and k != "self"]
-            if invalid and self._session._logger:
-                self._session._logger.warning(
-                    f"updateNetworkApplianceSecurityMalware: ignoring unrecognized kwargs: {invalid}"
-                )
-
-        return self._session.put(metadata, resource, payload)
+        return dispatch.call(self._session, "updateNetworkApplianceSecurityMalware", networkId, mode, **kwargs)
 
     def getNetworkApplianceSettings(self, networkId: str):
         """
@@ -1722,14 +767,7 @@ class AsyncAppliance:
         - networkId (string): Network ID
         """
 
-        metadata = {
-            "tags": ["appliance", "configure", "settings"],
-            "operation": "getNetworkApplianceSettings",
-        }
-        networkId = urllib.parse.quote(str(networkId), safe="")
-        resource = f"/networks/{networkId}/appliance/settings"
-
-        return self._session.get(metadata, resource)
+        return dispatch.call(self._session, "getNetworkApplianceSettings", networkId)
 
     def updateNetworkApplianceSettings(self, networkId: str, **kwargs):
         """
@@ -1742,40 +780,7 @@ class AsyncAppliance:
         - dynamicDns (object): Dynamic DNS settings for a network
         """
 
-        kwargs.update(locals())
-
-        if "clientTrackingMethod" in kwargs:
-            options = ["IP address", "MAC address", "Unique client identifier"]
-            assert kwargs["clientTrackingMethod"] in options, (
-                f'''"clientTrackingMethod" cannot be "{kwargs["clientTrackingMethod"]}", & must be set to one of: {options}'''
-            )
-        if "deploymentMode" in kwargs:
-            options = ["passthrough", "routed"]
-            assert kwargs["deploymentMode"] in options, (
-                f'''"deploymentMode" cannot be "{kwargs["deploymentMode"]}", & must be set to one of: {options}'''
-            )
-
-        metadata = {
-            "tags": ["appliance", "configure", "settings"],
-            "operation": "updateNetworkApplianceSettings",
-        }
-        networkId = urllib.parse.quote(str(networkId), safe="")
-        resource = f"/networks/{networkId}/appliance/settings"
-
-        body_params = [
-            "clientTrackingMethod",
-            "deploymentMode",
-            "dynamicDns",
-        ]
-        payload = {k.strip(): v for k, v in kwargs.items() if k.strip() in body_params}
-
-        if self._session._validate_kwargs:
-            all_params = [] + body_params
-            invalid = [k for k in kwargs if k.strip() not in all_params and k != "self"]
-            if invalid and self._session._logger:
-                self._session._logger.warning(f"updateNetworkApplianceSettings: ignoring unrecognized kwargs: {invalid}")
-
-        return self._session.put(metadata, resource, payload)
+        return dispatch.call(self._session, "updateNetworkApplianceSettings", networkId, **kwargs)
 
     def getNetworkApplianceSingleLan(self, networkId: str):
         """
@@ -1785,14 +790,7 @@ class AsyncAppliance:
         - networkId (string): Network ID
         """
 
-        metadata = {
-            "tags": ["appliance", "configure", "singleLan"],
-            "operation": "getNetworkApplianceSingleLan",
-        }
-        networkId = urllib.parse.quote(str(networkId), safe="")
-        resource = f"/networks/{networkId}/appliance/singleLan"
-
-        return self._session.get(metadata, resource)
+        return dispatch.call(self._session, "getNetworkApplianceSingleLan", networkId)
 
     def updateNetworkApplianceSingleLan(self, networkId: str, **kwargs):
         """
@@ -1806,30 +804,7 @@ class AsyncAppliance:
         - mandatoryDhcp (object): Mandatory DHCP will enforce that clients connecting to this LAN must use the IP address assigned by the DHCP server. Clients who use a static IP address won't be able to associate. Only available on firmware versions 17.0 and above
         """
 
-        kwargs.update(locals())
-
-        metadata = {
-            "tags": ["appliance", "configure", "singleLan"],
-            "operation": "updateNetworkApplianceSingleLan",
-        }
-        networkId = urllib.parse.quote(str(networkId), safe="")
-        resource = f"/networks/{networkId}/appliance/singleLan"
-
-        body_params = [
-            "subnet",
-            "applianceIp",
-            "ipv6",
-            "mandatoryDhcp",
-        ]
-        payload = {k.strip(): v for k, v in kwargs.items() if k.strip() in body_params}
-
-        if self._session._validate_kwargs:
-            all_params = [] + body_params
-            invalid = [k for k in kwargs if k.strip() not in all_params and k != "self"]
-            if invalid and self._session._logger:
-                self._session._logger.warning(f"updateNetworkApplianceSingleLan: ignoring unrecognized kwargs: {invalid}")
-
-        return self._session.put(metadata, resource, payload)
+        return dispatch.call(self._session, "updateNetworkApplianceSingleLan", networkId, **kwargs)
 
     def getNetworkApplianceSsids(self, networkId: str):
         """
@@ -1839,14 +814,7 @@ class AsyncAppliance:
         - networkId (string): Network ID
         """
 
-        metadata = {
-            "tags": ["appliance", "configure", "ssids"],
-            "operation": "getNetworkApplianceSsids",
-        }
-        networkId = urllib.parse.quote(str(networkId), safe="")
-        resource = f"/networks/{networkId}/appliance/ssids"
-
-        return self._session.get(metadata, resource)
+        return dispatch.call(self._session, "getNetworkApplianceSsids", networkId)
 
     def getNetworkApplianceSsid(self, networkId: str, number: str):
         """
@@ -1857,15 +825,7 @@ class AsyncAppliance:
         - number (string): Number
         """
 
-        metadata = {
-            "tags": ["appliance", "configure", "ssids"],
-            "operation": "getNetworkApplianceSsid",
-        }
-        networkId = urllib.parse.quote(str(networkId), safe="")
-        number = urllib.parse.quote(str(number), safe="")
-        resource = f"/networks/{networkId}/appliance/ssids/{number}"
-
-        return self._session.get(metadata, resource)
+        return dispatch.call(self._session, "getNetworkApplianceSsid", networkId, number)
 
     def updateNetworkApplianceSsid(self, networkId: str, number: str, **kwargs):
         """
@@ -1887,54 +847,7 @@ class AsyncAppliance:
         - dot11w (object): The current setting for Protected Management Frames (802.11w).
         """
 
-        kwargs.update(locals())
-
-        if "authMode" in kwargs:
-            options = ["8021x-meraki", "8021x-radius", "open", "psk"]
-            assert kwargs["authMode"] in options, (
-                f'''"authMode" cannot be "{kwargs["authMode"]}", & must be set to one of: {options}'''
-            )
-        if "encryptionMode" in kwargs:
-            options = ["wep", "wpa"]
-            assert kwargs["encryptionMode"] in options, (
-                f'''"encryptionMode" cannot be "{kwargs["encryptionMode"]}", & must be set to one of: {options}'''
-            )
-        if "wpaEncryptionMode" in kwargs:
-            options = ["WPA1 and WPA2", "WPA2 only", "WPA3 Transition Mode", "WPA3 only"]
-            assert kwargs["wpaEncryptionMode"] in options, (
-                f'''"wpaEncryptionMode" cannot be "{kwargs["wpaEncryptionMode"]}", & must be set to one of: {options}'''
-            )
-
-        metadata = {
-            "tags": ["appliance", "configure", "ssids"],
-            "operation": "updateNetworkApplianceSsid",
-        }
-        networkId = urllib.parse.quote(str(networkId), safe="")
-        number = urllib.parse.quote(str(number), safe="")
-        resource = f"/networks/{networkId}/appliance/ssids/{number}"
-
-        body_params = [
-            "name",
-            "enabled",
-            "defaultVlanId",
-            "authMode",
-            "psk",
-            "radiusServers",
-            "encryptionMode",
-            "wpaEncryptionMode",
-            "visible",
-            "dhcpEnforcedDeauthentication",
-            "dot11w",
-        ]
-        payload = {k.strip(): v for k, v in kwargs.items() if k.strip() in body_params}
-
-        if self._session._validate_kwargs:
-            all_params = [] + body_params
-            invalid = [k for k in kwargs if k.strip() not in all_params and k != "self"]
-            if invalid and self._session._logger:
-                self._session._logger.warning(f"updateNetworkApplianceSsid: ignoring unrecognized kwargs: {invalid}")
-
-        return self._session.put(metadata, resource, payload)
+        return dispatch.call(self._session, "updateNetworkApplianceSsid", networkId, number, **kwargs)
 
     def getNetworkApplianceStaticRoutes(self, networkId: str):
         """
@@ -1944,14 +857,7 @@ class AsyncAppliance:
         - networkId (string): Network ID
         """
 
-        metadata = {
-            "tags": ["appliance", "configure", "staticRoutes"],
-            "operation": "getNetworkApplianceStaticRoutes",
-        }
-        networkId = urllib.parse.quote(str(networkId), safe="")
-        resource = f"/networks/{networkId}/appliance/staticRoutes"
-
-        return self._session.get(metadata, resource)
+        return dispatch.call(self._session, "getNetworkApplianceStaticRoutes", networkId)
 
     def createNetworkApplianceStaticRoute(self, networkId: str, name: str, subnet: str, gatewayIp: str, **kwargs):
         """
@@ -1965,30 +871,7 @@ class AsyncAppliance:
         - gatewayVlanId (integer): Gateway VLAN ID
         """
 
-        kwargs.update(locals())
-
-        metadata = {
-            "tags": ["appliance", "configure", "staticRoutes"],
-            "operation": "createNetworkApplianceStaticRoute",
-        }
-        networkId = urllib.parse.quote(str(networkId), safe="")
-        resource = f"/networks/{networkId}/appliance/staticRoutes"
-
-        body_params = [
-            "name",
-            "subnet",
-            "gatewayIp",
-            "gatewayVlanId",
-        ]
-        payload = {k.strip(): v for k, v in kwargs.items() if k.strip() in body_params}
-
-        if self._session._validate_kwargs:
-            all_params = [] + body_params
-            invalid = [k for k in kwargs if k.strip() not in all_params and k != "self"]
-            if invalid and self._session._logger:
-                self._session._logger.warning(f"createNetworkApplianceStaticRoute: ignoring unrecognized kwargs: {invalid}")
-
-        return self._session.post(metadata, resource, payload)
+        return dispatch.call(self._session, "createNetworkApplianceStaticRoute", networkId, name, subnet, gatewayIp, **kwargs)
 
     def getNetworkApplianceStaticRoute(self, networkId: str, staticRouteId: str):
         """
@@ -1999,15 +882,7 @@ class AsyncAppliance:
         - staticRouteId (string): Static route ID
         """
 
-        metadata = {
-            "tags": ["appliance", "configure", "staticRoutes"],
-            "operation": "getNetworkApplianceStaticRoute",
-        }
-        networkId = urllib.parse.quote(str(networkId), safe="")
-        staticRouteId = urllib.parse.quote(str(staticRouteId), safe="")
-        resource = f"/networks/{networkId}/appliance/staticRoutes/{staticRouteId}"
-
-        return self._session.get(metadata, resource)
+        return dispatch.call(self._session, "getNetworkApplianceStaticRoute", networkId, staticRouteId)
 
     def updateNetworkApplianceStaticRoute(self, networkId: str, staticRouteId: str, **kwargs):
         """
@@ -2025,34 +900,7 @@ class AsyncAppliance:
         - reservedIpRanges (array): DHCP reserved IP ranges
         """
 
-        kwargs.update(locals())
-
-        metadata = {
-            "tags": ["appliance", "configure", "staticRoutes"],
-            "operation": "updateNetworkApplianceStaticRoute",
-        }
-        networkId = urllib.parse.quote(str(networkId), safe="")
-        staticRouteId = urllib.parse.quote(str(staticRouteId), safe="")
-        resource = f"/networks/{networkId}/appliance/staticRoutes/{staticRouteId}"
-
-        body_params = [
-            "name",
-            "subnet",
-            "gatewayIp",
-            "gatewayVlanId",
-            "enabled",
-            "fixedIpAssignments",
-            "reservedIpRanges",
-        ]
-        payload = {k.strip(): v for k, v in kwargs.items() if k.strip() in body_params}
-
-        if self._session._validate_kwargs:
-            all_params = [] + body_params
-            invalid = [k for k in kwargs if k.strip() not in all_params and k != "self"]
-            if invalid and self._session._logger:
-                self._session._logger.warning(f"updateNetworkApplianceStaticRoute: ignoring unrecognized kwargs: {invalid}")
-
-        return self._session.put(metadata, resource, payload)
+        return dispatch.call(self._session, "updateNetworkApplianceStaticRoute", networkId, staticRouteId, **kwargs)
 
     def deleteNetworkApplianceStaticRoute(self, networkId: str, staticRouteId: str):
         """
@@ -2063,15 +911,7 @@ class AsyncAppliance:
         - staticRouteId (string): Static route ID
         """
 
-        metadata = {
-            "tags": ["appliance", "configure", "staticRoutes"],
-            "operation": "deleteNetworkApplianceStaticRoute",
-        }
-        networkId = urllib.parse.quote(str(networkId), safe="")
-        staticRouteId = urllib.parse.quote(str(staticRouteId), safe="")
-        resource = f"/networks/{networkId}/appliance/staticRoutes/{staticRouteId}"
-
-        return self._session.delete(metadata, resource)
+        return dispatch.call(self._session, "deleteNetworkApplianceStaticRoute", networkId, staticRouteId)
 
     def getNetworkApplianceTrafficShaping(self, networkId: str):
         """
@@ -2081,14 +921,7 @@ class AsyncAppliance:
         - networkId (string): Network ID
         """
 
-        metadata = {
-            "tags": ["appliance", "configure", "trafficShaping"],
-            "operation": "getNetworkApplianceTrafficShaping",
-        }
-        networkId = urllib.parse.quote(str(networkId), safe="")
-        resource = f"/networks/{networkId}/appliance/trafficShaping"
-
-        return self._session.get(metadata, resource)
+        return dispatch.call(self._session, "getNetworkApplianceTrafficShaping", networkId)
 
     def updateNetworkApplianceTrafficShaping(self, networkId: str, globalBandwidthLimits: dict, **kwargs):
         """
@@ -2099,27 +932,7 @@ class AsyncAppliance:
         - globalBandwidthLimits (object): Global per-client bandwidth limit
         """
 
-        kwargs = locals()
-
-        metadata = {
-            "tags": ["appliance", "configure", "trafficShaping"],
-            "operation": "updateNetworkApplianceTrafficShaping",
-        }
-        networkId = urllib.parse.quote(str(networkId), safe="")
-        resource = f"/networks/{networkId}/appliance/trafficShaping"
-
-        body_params = [
-            "globalBandwidthLimits",
-        ]
-        payload = {k.strip(): v for k, v in kwargs.items() if k.strip() in body_params}
-
-        if self._session._validate_kwargs:
-            all_params = [] + body_params
-            invalid = [k for k in kwargs if k.strip() not in all_params and k != "self"]
-            if invalid and self._session._logger:
-                self._session._logger.warning(f"updateNetworkApplianceTrafficShaping: ignoring unrecognized kwargs: {invalid}")
-
-        return self._session.put(metadata, resource, payload)
+        return dispatch.call(self._session, "updateNetworkApplianceTrafficShaping", networkId, globalBandwidthLimits, **kwargs)
 
     def getNetworkApplianceTrafficShapingCustomPerformanceClasses(self, networkId: str):
         """
@@ -2129,14 +942,7 @@ class AsyncAppliance:
         - networkId (string): Network ID
         """
 
-        metadata = {
-            "tags": ["appliance", "configure", "trafficShaping", "customPerformanceClasses"],
-            "operation": "getNetworkApplianceTrafficShapingCustomPerformanceClasses",
-        }
-        networkId = urllib.parse.quote(str(networkId), safe="")
-        resource = f"/networks/{networkId}/appliance/trafficShaping/customPerformanceClasses"
-
-        return self._session.get(metadata, resource)
+        return dispatch.call(self._session, "getNetworkApplianceTrafficShapingCustomPerformanceClasses", networkId)
 
     def createNetworkApplianceTrafficShapingCustomPerformanceClass(self, networkId: str, name: str, **kwargs):
         """
@@ -2150,32 +956,9 @@ class AsyncAppliance:
         - maxLossPercentage (integer): Maximum percentage of packet loss
         """
 
-        kwargs.update(locals())
-
-        metadata = {
-            "tags": ["appliance", "configure", "trafficShaping", "customPerformanceClasses"],
-            "operation": "createNetworkApplianceTrafficShapingCustomPerformanceClass",
-        }
-        networkId = urllib.parse.quote(str(networkId), safe="")
-        resource = f"/networks/{networkId}/appliance/trafficShaping/customPerformanceClasses"
-
-        body_params = [
-            "name",
-            "maxLatency",
-            "maxJitter",
-            "maxLossPercentage",
-        ]
-        payload = {k.strip(): v for k, v in kwargs.items() if k.strip() in body_params}
-
-        if self._session._validate_kwargs:
-            all_params = [] + body_params
-            invalid = [k for k in kwargs if k.strip() not in all_params and k != "self"]
-            if invalid and self._session._logger:
-                self._session._logger.warning(
-                    f"createNetworkApplianceTrafficShapingCustomPerformanceClass: ignoring unrecognized kwargs: {invalid}"
-                )
-
-        return self._session.post(metadata, resource, payload)
+        return dispatch.call(
+            self._session, "createNetworkApplianceTrafficShapingCustomPerformanceClass", networkId, name, **kwargs
+        )
 
     def getNetworkApplianceTrafficShapingCustomPerformanceClass(self, networkId: str, customPerformanceClassId: str):
         """
@@ -2186,15 +969,9 @@ class AsyncAppliance:
         - customPerformanceClassId (string): Custom performance class ID
         """
 
-        metadata = {
-            "tags": ["appliance", "configure", "trafficShaping", "customPerformanceClasses"],
-            "operation": "getNetworkApplianceTrafficShapingCustomPerformanceClass",
-        }
-        networkId = urllib.parse.quote(str(networkId), safe="")
-        customPerformanceClassId = urllib.parse.quote(str(customPerformanceClassId), safe="")
-        resource = f"/networks/{networkId}/appliance/trafficShaping/customPerformanceClasses/{customPerformanceClassId}"
-
-        return self._session.get(metadata, resource)
+        return dispatch.call(
+            self._session, "getNetworkApplianceTrafficShapingCustomPerformanceClass", networkId, customPerformanceClassId
+        )
 
     def updateNetworkApplianceTrafficShapingCustomPerformanceClass(
         self, networkId: str, customPerformanceClassId: str, **kwargs
@@ -2211,33 +988,13 @@ class AsyncAppliance:
         - maxLossPercentage (integer): Maximum percentage of packet loss
         """
 
-        kwargs.update(locals())
-
-        metadata = {
-            "tags": ["appliance", "configure", "trafficShaping", "customPerformanceClasses"],
-            "operation": "updateNetworkApplianceTrafficShapingCustomPerformanceClass",
-        }
-        networkId = urllib.parse.quote(str(networkId), safe="")
-        customPerformanceClassId = urllib.parse.quote(str(customPerformanceClassId), safe="")
-        resource = f"/networks/{networkId}/appliance/trafficShaping/customPerformanceClasses/{customPerformanceClassId}"
-
-        body_params = [
-            "name",
-            "maxLatency",
-            "maxJitter",
-            "maxLossPercentage",
-        ]
-        payload = {k.strip(): v for k, v in kwargs.items() if k.strip() in body_params}
-
-        if self._session._validate_kwargs:
-            all_params = [] + body_params
-            invalid = [k for k in kwargs if k.strip() not in all_params and k != "self"]
-            if invalid and self._session._logger:
-                self._session._logger.warning(
-                    f"updateNetworkApplianceTrafficShapingCustomPerformanceClass: ignoring unrecognized kwargs: {invalid}"
-                )
-
-        return self._session.put(metadata, resource, payload)
+        return dispatch.call(
+            self._session,
+            "updateNetworkApplianceTrafficShapingCustomPerformanceClass",
+            networkId,
+            customPerformanceClassId,
+            **kwargs,
+        )
 
     def deleteNetworkApplianceTrafficShapingCustomPerformanceClass(self, networkId: str, customPerformanceClassId: str):
         """
@@ -2248,15 +1005,9 @@ class AsyncAppliance:
         - customPerformanceClassId (string): Custom performance class ID
         """
 
-        metadata = {
-            "tags": ["appliance", "configure", "trafficShaping", "customPerformanceClasses"],
-            "operation": "deleteNetworkApplianceTrafficShapingCustomPerformanceClass",
-        }
-        networkId = urllib.parse.quote(str(networkId), safe="")
-        customPerformanceClassId = urllib.parse.quote(str(customPerformanceClassId), safe="")
-        resource = f"/networks/{networkId}/appliance/trafficShaping/customPerformanceClasses/{customPerformanceClassId}"
-
-        return self._session.delete(metadata, resource)
+        return dispatch.call(
+            self._session, "deleteNetworkApplianceTrafficShapingCustomPerformanceClass", networkId, customPerformanceClassId
+        )
 
     def updateNetworkApplianceTrafficShapingRules(self, networkId: str, **kwargs):
         """
@@ -2271,30 +1022,7 @@ class AsyncAppliance:
 
         """
 
-        kwargs.update(locals())
-
-        metadata = {
-            "tags": ["appliance", "configure", "trafficShaping", "rules"],
-            "operation": "updateNetworkApplianceTrafficShapingRules",
-        }
-        networkId = urllib.parse.quote(str(networkId), safe="")
-        resource = f"/networks/{networkId}/appliance/trafficShaping/rules"
-
-        body_params = [
-            "defaultRulesEnabled",
-            "rules",
-        ]
-        payload = {k.strip(): v for k, v in kwargs.items() if k.strip() in body_params}
-
-        if self._session._validate_kwargs:
-            all_params = [] + body_params
-            invalid = [k for k in kwargs if k.strip() not in all_params and k != "self"]
-            if invalid and self._session._logger:
-                self._session._logger.warning(
-                    f"updateNetworkApplianceTrafficShapingRules: ignoring unrecognized kwargs: {invalid}"
-                )
-
-        return self._session.put(metadata, resource, payload)
+        return dispatch.call(self._session, "updateNetworkApplianceTrafficShapingRules", networkId, **kwargs)
 
     def getNetworkApplianceTrafficShapingRules(self, networkId: str):
         """
@@ -2304,14 +1032,7 @@ class AsyncAppliance:
         - networkId (string): Network ID
         """
 
-        metadata = {
-            "tags": ["appliance", "configure", "trafficShaping", "rules"],
-            "operation": "getNetworkApplianceTrafficShapingRules",
-        }
-        networkId = urllib.parse.quote(str(networkId), safe="")
-        resource = f"/networks/{networkId}/appliance/trafficShaping/rules"
-
-        return self._session.get(metadata, resource)
+        return dispatch.call(self._session, "getNetworkApplianceTrafficShapingRules", networkId)
 
     def getNetworkApplianceTrafficShapingUplinkBandwidth(self, networkId: str):
         """
@@ -2321,14 +1042,7 @@ class AsyncAppliance:
         - networkId (string): Network ID
         """
 
-        metadata = {
-            "tags": ["appliance", "configure", "trafficShaping", "uplinkBandwidth"],
-            "operation": "getNetworkApplianceTrafficShapingUplinkBandwidth",
-        }
-        networkId = urllib.parse.quote(str(networkId), safe="")
-        resource = f"/networks/{networkId}/appliance/trafficShaping/uplinkBandwidth"
-
-        return self._session.get(metadata, resource)
+        return dispatch.call(self._session, "getNetworkApplianceTrafficShapingUplinkBandwidth", networkId)
 
     def updateNetworkApplianceTrafficShapingUplinkBandwidth(self, networkId: str, **kwargs):
         """
@@ -2339,29 +1053,7 @@ class AsyncAppliance:
         - bandwidthLimits (object): A mapping of uplinks to their bandwidth settings (be sure to check which uplinks are supported for your network)
         """
 
-        kwargs.update(locals())
-
-        metadata = {
-            "tags": ["appliance", "configure", "trafficShaping", "uplinkBandwidth"],
-            "operation": "updateNetworkApplianceTrafficShapingUplinkBandwidth",
-        }
-        networkId = urllib.parse.quote(str(networkId), safe="")
-        resource = f"/networks/{networkId}/appliance/trafficShaping/uplinkBandwidth"
-
-        body_params = [
-            "bandwidthLimits",
-        ]
-        payload = {k.strip(): v for k, v in kwargs.items() if k.strip() in body_params}
-
-        if self._session._validate_kwargs:
-            all_params = [] + body_params
-            invalid = [k for k in kwargs if k.strip() not in all_params and k != "self"]
-            if invalid and self._session._logger:
-                self._session._logger.warning(
-                    f"updateNetworkApplianceTrafficShapingUplinkBandwidth: ignoring unrecognized kwargs: {invalid}"
-                )
-
-        return self._session.put(metadata, resource, payload)
+        return dispatch.call(self._session, "updateNetworkApplianceTrafficShapingUplinkBandwidth", networkId, **kwargs)
 
     def getNetworkApplianceTrafficShapingUplinkSelection(self, networkId: str):
         """
@@ -2371,14 +1063,7 @@ class AsyncAppliance:
         - networkId (string): Network ID
         """
 
-        metadata = {
-            "tags": ["appliance", "configure", "trafficShaping", "uplinkSelection"],
-            "operation": "getNetworkApplianceTrafficShapingUplinkSelection",
-        }
-        networkId = urllib.parse.quote(str(networkId), safe="")
-        resource = f"/networks/{networkId}/appliance/trafficShaping/uplinkSelection"
-
-        return self._session.get(metadata, resource)
+        return dispatch.call(self._session, "getNetworkApplianceTrafficShapingUplinkSelection", networkId)
 
     def updateNetworkApplianceTrafficShapingUplinkSelection(self, networkId: str, **kwargs):
         """
@@ -2394,34 +1079,7 @@ class AsyncAppliance:
         - vpnTrafficUplinkPreferences (array): Array of uplink preference rules for VPN traffic
         """
 
-        kwargs.update(locals())
-
-        metadata = {
-            "tags": ["appliance", "configure", "trafficShaping", "uplinkSelection"],
-            "operation": "updateNetworkApplianceTrafficShapingUplinkSelection",
-        }
-        networkId = urllib.parse.quote(str(networkId), safe="")
-        resource = f"/networks/{networkId}/appliance/trafficShaping/uplinkSelection"
-
-        body_params = [
-            "activeActiveAutoVpnEnabled",
-            "defaultUplink",
-            "loadBalancingEnabled",
-            "failoverAndFailback",
-            "wanTrafficUplinkPreferences",
-            "vpnTrafficUplinkPreferences",
-        ]
-        payload = {k.strip(): v for k, v in kwargs.items() if k.strip() in body_params}
-
-        if self._session._validate_kwargs:
-            all_params = [] + body_params
-            invalid = [k for k in kwargs if k.strip() not in all_params and k != "self"]
-            if invalid and self._session._logger:
-                self._session._logger.warning(
-                    f"updateNetworkApplianceTrafficShapingUplinkSelection: ignoring unrecognized kwargs: {invalid}"
-                )
-
-        return self._session.put(metadata, resource, payload)
+        return dispatch.call(self._session, "updateNetworkApplianceTrafficShapingUplinkSelection", networkId, **kwargs)
 
     def updateNetworkApplianceTrafficShapingVpnExclusions(self, networkId: str, **kwargs):
         """
@@ -2433,30 +1091,7 @@ class AsyncAppliance:
         - majorApplications (array): Major Application based VPN exclusion rules. Pass an empty array to clear existing rules.
         """
 
-        kwargs.update(locals())
-
-        metadata = {
-            "tags": ["appliance", "configure", "trafficShaping", "vpnExclusions"],
-            "operation": "updateNetworkApplianceTrafficShapingVpnExclusions",
-        }
-        networkId = urllib.parse.quote(str(networkId), safe="")
-        resource = f"/networks/{networkId}/appliance/trafficShaping/vpnExclusions"
-
-        body_params = [
-            "custom",
-            "majorApplications",
-        ]
-        payload = {k.strip(): v for k, v in kwargs.items() if k.strip() in body_params}
-
-        if self._session._validate_kwargs:
-            all_params = [] + body_params
-            invalid = [k for k in kwargs if k.strip() not in all_params and k != "self"]
-            if invalid and self._session._logger:
-                self._session._logger.warning(
-                    f"updateNetworkApplianceTrafficShapingVpnExclusions: ignoring unrecognized kwargs: {invalid}"
-                )
-
-        return self._session.put(metadata, resource, payload)
+        return dispatch.call(self._session, "updateNetworkApplianceTrafficShapingVpnExclusions", networkId, **kwargs)
 
     def connectNetworkApplianceUmbrellaAccount(self, networkId: str, api: dict, **kwargs):
         """
@@ -2467,29 +1102,7 @@ class AsyncAppliance:
         - api (object): Umbrella API credentials
         """
 
-        kwargs = locals()
-
-        metadata = {
-            "tags": ["appliance", "configure", "umbrella", "account"],
-            "operation": "connectNetworkApplianceUmbrellaAccount",
-        }
-        networkId = urllib.parse.quote(str(networkId), safe="")
-        resource = f"/networks/{networkId}/appliance/umbrella/account/connect"
-
-        body_params = [
-            "api",
-        ]
-        payload = {k.strip(): v for k, v in kwargs.items() if k.strip() in body_params}
-
-        if self._session._validate_kwargs:
-            all_params = [] + body_params
-            invalid = [k for k in kwargs if k.strip() not in all_params and k != "self"]
-            if invalid and self._session._logger:
-                self._session._logger.warning(
-                    f"connectNetworkApplianceUmbrellaAccount: ignoring unrecognized kwargs: {invalid}"
-                )
-
-        return self._session.post(metadata, resource, payload)
+        return dispatch.call(self._session, "connectNetworkApplianceUmbrellaAccount", networkId, api, **kwargs)
 
     def disconnectNetworkApplianceUmbrellaAccount(self, networkId: str):
         """
@@ -2499,14 +1112,7 @@ class AsyncAppliance:
         - networkId (string): Network ID
         """
 
-        metadata = {
-            "tags": ["appliance", "configure", "umbrella", "account"],
-            "operation": "disconnectNetworkApplianceUmbrellaAccount",
-        }
-        networkId = urllib.parse.quote(str(networkId), safe="")
-        resource = f"/networks/{networkId}/appliance/umbrella/account/disconnect"
-
-        return self._session.post(metadata, resource)
+        return dispatch.call(self._session, "disconnectNetworkApplianceUmbrellaAccount", networkId)
 
     def exclusionsNetworkApplianceUmbrellaDomains(self, networkId: str, domains: list, **kwargs):
         """
@@ -2517,29 +1123,7 @@ class AsyncAppliance:
         - domains (array): Domain names to exclude from Umbrella DNS routing (e.g., 'example.com', 'corp.example.org'). Standard FQDNs only — wildcards are not supported. Values are lowercased before saving. Each call replaces the full exclusion list.
         """
 
-        kwargs = locals()
-
-        metadata = {
-            "tags": ["appliance", "configure", "umbrella", "domains"],
-            "operation": "exclusionsNetworkApplianceUmbrellaDomains",
-        }
-        networkId = urllib.parse.quote(str(networkId), safe="")
-        resource = f"/networks/{networkId}/appliance/umbrella/domains/exclusions"
-
-        body_params = [
-            "domains",
-        ]
-        payload = {k.strip(): v for k, v in kwargs.items() if k.strip() in body_params}
-
-        if self._session._validate_kwargs:
-            all_params = [] + body_params
-            invalid = [k for k in kwargs if k.strip() not in all_params and k != "self"]
-            if invalid and self._session._logger:
-                self._session._logger.warning(
-                    f"exclusionsNetworkApplianceUmbrellaDomains: ignoring unrecognized kwargs: {invalid}"
-                )
-
-        return self._session.put(metadata, resource, payload)
+        return dispatch.call(self._session, "exclusionsNetworkApplianceUmbrellaDomains", networkId, domains, **kwargs)
 
     def addNetworkApplianceUmbrellaPolicies(self, networkId: str, policy: dict, **kwargs):
         """
@@ -2550,27 +1134,7 @@ class AsyncAppliance:
         - policy (object): Umbrella policy to add
         """
 
-        kwargs = locals()
-
-        metadata = {
-            "tags": ["appliance", "configure", "umbrella", "policies"],
-            "operation": "addNetworkApplianceUmbrellaPolicies",
-        }
-        networkId = urllib.parse.quote(str(networkId), safe="")
-        resource = f"/networks/{networkId}/appliance/umbrella/policies/add"
-
-        body_params = [
-            "policy",
-        ]
-        payload = {k.strip(): v for k, v in kwargs.items() if k.strip() in body_params}
-
-        if self._session._validate_kwargs:
-            all_params = [] + body_params
-            invalid = [k for k in kwargs if k.strip() not in all_params and k != "self"]
-            if invalid and self._session._logger:
-                self._session._logger.warning(f"addNetworkApplianceUmbrellaPolicies: ignoring unrecognized kwargs: {invalid}")
-
-        return self._session.post(metadata, resource, payload)
+        return dispatch.call(self._session, "addNetworkApplianceUmbrellaPolicies", networkId, policy, **kwargs)
 
     def removeNetworkApplianceUmbrellaPolicies(self, networkId: str, policy: dict, **kwargs):
         """
@@ -2581,29 +1145,7 @@ class AsyncAppliance:
         - policy (object): Umbrella policy to remove
         """
 
-        kwargs = locals()
-
-        metadata = {
-            "tags": ["appliance", "configure", "umbrella", "policies"],
-            "operation": "removeNetworkApplianceUmbrellaPolicies",
-        }
-        networkId = urllib.parse.quote(str(networkId), safe="")
-        resource = f"/networks/{networkId}/appliance/umbrella/policies/remove"
-
-        body_params = [
-            "policy",
-        ]
-        payload = {k.strip(): v for k, v in kwargs.items() if k.strip() in body_params}
-
-        if self._session._validate_kwargs:
-            all_params = [] + body_params
-            invalid = [k for k in kwargs if k.strip() not in all_params and k != "self"]
-            if invalid and self._session._logger:
-                self._session._logger.warning(
-                    f"removeNetworkApplianceUmbrellaPolicies: ignoring unrecognized kwargs: {invalid}"
-                )
-
-        return self._session.post(metadata, resource, payload)
+        return dispatch.call(self._session, "removeNetworkApplianceUmbrellaPolicies", networkId, policy, **kwargs)
 
     def protectionNetworkApplianceUmbrella(self, networkId: str, enabled: bool, **kwargs):
         """
@@ -2614,27 +1156,7 @@ class AsyncAppliance:
         - enabled (boolean): Enable or disable umbrella protection
         """
 
-        kwargs = locals()
-
-        metadata = {
-            "tags": ["appliance", "configure", "umbrella"],
-            "operation": "protectionNetworkApplianceUmbrella",
-        }
-        networkId = urllib.parse.quote(str(networkId), safe="")
-        resource = f"/networks/{networkId}/appliance/umbrella/protection"
-
-        body_params = [
-            "enabled",
-        ]
-        payload = {k.strip(): v for k, v in kwargs.items() if k.strip() in body_params}
-
-        if self._session._validate_kwargs:
-            all_params = [] + body_params
-            invalid = [k for k in kwargs if k.strip() not in all_params and k != "self"]
-            if invalid and self._session._logger:
-                self._session._logger.warning(f"protectionNetworkApplianceUmbrella: ignoring unrecognized kwargs: {invalid}")
-
-        return self._session.put(metadata, resource, payload)
+        return dispatch.call(self._session, "protectionNetworkApplianceUmbrella", networkId, enabled, **kwargs)
 
     def updateNetworkApplianceUplinksNat(self, networkId: str, uplinks: list, **kwargs):
         """
@@ -2645,27 +1167,7 @@ class AsyncAppliance:
         - uplinks (array): Per-uplink NAT exception configuration on the network.
         """
 
-        kwargs = locals()
-
-        metadata = {
-            "tags": ["appliance", "configure", "uplinks", "nat"],
-            "operation": "updateNetworkApplianceUplinksNat",
-        }
-        networkId = urllib.parse.quote(str(networkId), safe="")
-        resource = f"/networks/{networkId}/appliance/uplinks/nat"
-
-        body_params = [
-            "uplinks",
-        ]
-        payload = {k.strip(): v for k, v in kwargs.items() if k.strip() in body_params}
-
-        if self._session._validate_kwargs:
-            all_params = [] + body_params
-            invalid = [k for k in kwargs if k.strip() not in all_params and k != "self"]
-            if invalid and self._session._logger:
-                self._session._logger.warning(f"updateNetworkApplianceUplinksNat: ignoring unrecognized kwargs: {invalid}")
-
-        return self._session.put(metadata, resource, payload)
+        return dispatch.call(self._session, "updateNetworkApplianceUplinksNat", networkId, uplinks, **kwargs)
 
     def getNetworkApplianceUplinksUsageHistory(self, networkId: str, **kwargs):
         """
@@ -2679,32 +1181,7 @@ class AsyncAppliance:
         - resolution (integer): The time resolution in seconds for returned data. The valid resolutions are: 60, 300, 600, 1800, 3600, 86400. The default is 60.
         """
 
-        kwargs.update(locals())
-
-        metadata = {
-            "tags": ["appliance", "monitor", "uplinks", "usageHistory"],
-            "operation": "getNetworkApplianceUplinksUsageHistory",
-        }
-        networkId = urllib.parse.quote(str(networkId), safe="")
-        resource = f"/networks/{networkId}/appliance/uplinks/usageHistory"
-
-        query_params = [
-            "t0",
-            "t1",
-            "timespan",
-            "resolution",
-        ]
-        params = {k.strip(): v for k, v in kwargs.items() if k.strip() in query_params}
-
-        if self._session._validate_kwargs:
-            all_params = query_params
-            invalid = [k for k in kwargs if k.strip() not in all_params and k != "self"]
-            if invalid and self._session._logger:
-                self._session._logger.warning(
-                    f"getNetworkApplianceUplinksUsageHistory: ignoring unrecognized kwargs: {invalid}"
-                )
-
-        return self._session.get(metadata, resource, params)
+        return dispatch.call(self._session, "getNetworkApplianceUplinksUsageHistory", networkId, **kwargs)
 
     def getNetworkApplianceVlans(self, networkId: str):
         """
@@ -2714,14 +1191,7 @@ class AsyncAppliance:
         - networkId (string): Network ID
         """
 
-        metadata = {
-            "tags": ["appliance", "configure", "vlans"],
-            "operation": "getNetworkApplianceVlans",
-        }
-        networkId = urllib.parse.quote(str(networkId), safe="")
-        resource = f"/networks/{networkId}/appliance/vlans"
-
-        return self._session.get(metadata, resource)
+        return dispatch.call(self._session, "getNetworkApplianceVlans", networkId)
 
     def createNetworkApplianceVlan(self, networkId: str, id: str, name: str, **kwargs):
         """
@@ -2751,62 +1221,7 @@ class AsyncAppliance:
         - uplinks (array): Per-uplink NAT exception override configuration on the VLAN. Applicable only for networks that support NAT exceptions.
         """
 
-        kwargs.update(locals())
-
-        if "templateVlanType" in kwargs:
-            options = ["same", "unique"]
-            assert kwargs["templateVlanType"] in options, (
-                f'''"templateVlanType" cannot be "{kwargs["templateVlanType"]}", & must be set to one of: {options}'''
-            )
-        if "dhcpHandling" in kwargs:
-            options = ["Do not respond to DHCP requests", "Relay DHCP to another server", "Run a DHCP server"]
-            assert kwargs["dhcpHandling"] in options, (
-                f'''"dhcpHandling" cannot be "{kwargs["dhcpHandling"]}", & must be set to one of: {options}'''
-            )
-        if "dhcpLeaseTime" in kwargs:
-            options = ["1 day", "1 hour", "1 week", "12 hours", "30 minutes", "4 hours"]
-            assert kwargs["dhcpLeaseTime"] in options, (
-                f'''"dhcpLeaseTime" cannot be "{kwargs["dhcpLeaseTime"]}", & must be set to one of: {options}'''
-            )
-
-        metadata = {
-            "tags": ["appliance", "configure", "vlans"],
-            "operation": "createNetworkApplianceVlan",
-        }
-        networkId = urllib.parse.quote(str(networkId), safe="")
-        resource = f"/networks/{networkId}/appliance/vlans"
-
-        body_params = [
-            "id",
-            "name",
-            "subnet",
-            "applianceIp",
-            "groupPolicyId",
-            "templateVlanType",
-            "cidr",
-            "mask",
-            "ipv6",
-            "dhcpHandling",
-            "dhcpRelayServerIps",
-            "dhcpLeaseTime",
-            "mandatoryDhcp",
-            "dhcpBootOptionsEnabled",
-            "dhcpBootNextServer",
-            "dhcpBootFilename",
-            "dhcpOptions",
-            "sgt",
-            "vrf",
-            "uplinks",
-        ]
-        payload = {k.strip(): v for k, v in kwargs.items() if k.strip() in body_params}
-
-        if self._session._validate_kwargs:
-            all_params = [] + body_params
-            invalid = [k for k in kwargs if k.strip() not in all_params and k != "self"]
-            if invalid and self._session._logger:
-                self._session._logger.warning(f"createNetworkApplianceVlan: ignoring unrecognized kwargs: {invalid}")
-
-        return self._session.post(metadata, resource, payload)
+        return dispatch.call(self._session, "createNetworkApplianceVlan", networkId, id, name, **kwargs)
 
     def getNetworkApplianceVlansSettings(self, networkId: str):
         """
@@ -2816,14 +1231,7 @@ class AsyncAppliance:
         - networkId (string): Network ID
         """
 
-        metadata = {
-            "tags": ["appliance", "configure", "vlans", "settings"],
-            "operation": "getNetworkApplianceVlansSettings",
-        }
-        networkId = urllib.parse.quote(str(networkId), safe="")
-        resource = f"/networks/{networkId}/appliance/vlans/settings"
-
-        return self._session.get(metadata, resource)
+        return dispatch.call(self._session, "getNetworkApplianceVlansSettings", networkId)
 
     def updateNetworkApplianceVlansSettings(self, networkId: str, **kwargs):
         """
@@ -2834,27 +1242,7 @@ class AsyncAppliance:
         - vlansEnabled (boolean): Boolean indicating whether to enable (true) or disable (false) VLANs for the network
         """
 
-        kwargs.update(locals())
-
-        metadata = {
-            "tags": ["appliance", "configure", "vlans", "settings"],
-            "operation": "updateNetworkApplianceVlansSettings",
-        }
-        networkId = urllib.parse.quote(str(networkId), safe="")
-        resource = f"/networks/{networkId}/appliance/vlans/settings"
-
-        body_params = [
-            "vlansEnabled",
-        ]
-        payload = {k.strip(): v for k, v in kwargs.items() if k.strip() in body_params}
-
-        if self._session._validate_kwargs:
-            all_params = [] + body_params
-            invalid = [k for k in kwargs if k.strip() not in all_params and k != "self"]
-            if invalid and self._session._logger:
-                self._session._logger.warning(f"updateNetworkApplianceVlansSettings: ignoring unrecognized kwargs: {invalid}")
-
-        return self._session.put(metadata, resource, payload)
+        return dispatch.call(self._session, "updateNetworkApplianceVlansSettings", networkId, **kwargs)
 
     def getNetworkApplianceVlan(self, networkId: str, vlanId: str):
         """
@@ -2865,15 +1253,7 @@ class AsyncAppliance:
         - vlanId (string): Vlan ID
         """
 
-        metadata = {
-            "tags": ["appliance", "configure", "vlans"],
-            "operation": "getNetworkApplianceVlan",
-        }
-        networkId = urllib.parse.quote(str(networkId), safe="")
-        vlanId = urllib.parse.quote(str(vlanId), safe="")
-        resource = f"/networks/{networkId}/appliance/vlans/{vlanId}"
-
-        return self._session.get(metadata, resource)
+        return dispatch.call(self._session, "getNetworkApplianceVlan", networkId, vlanId)
 
     def updateNetworkApplianceVlan(self, networkId: str, vlanId: str, **kwargs):
         """
@@ -2907,66 +1287,7 @@ class AsyncAppliance:
         - uplinks (array): Per-uplink NAT exception override configuration on the VLAN. Applicable only for networks that support NAT exceptions.
         """
 
-        kwargs.update(locals())
-
-        if "dhcpHandling" in kwargs:
-            options = ["Do not respond to DHCP requests", "Relay DHCP to another server", "Run a DHCP server"]
-            assert kwargs["dhcpHandling"] in options, (
-                f'''"dhcpHandling" cannot be "{kwargs["dhcpHandling"]}", & must be set to one of: {options}'''
-            )
-        if "dhcpLeaseTime" in kwargs:
-            options = ["1 day", "1 hour", "1 week", "12 hours", "30 minutes", "4 hours"]
-            assert kwargs["dhcpLeaseTime"] in options, (
-                f'''"dhcpLeaseTime" cannot be "{kwargs["dhcpLeaseTime"]}", & must be set to one of: {options}'''
-            )
-        if "templateVlanType" in kwargs:
-            options = ["same", "unique"]
-            assert kwargs["templateVlanType"] in options, (
-                f'''"templateVlanType" cannot be "{kwargs["templateVlanType"]}", & must be set to one of: {options}'''
-            )
-
-        metadata = {
-            "tags": ["appliance", "configure", "vlans"],
-            "operation": "updateNetworkApplianceVlan",
-        }
-        networkId = urllib.parse.quote(str(networkId), safe="")
-        vlanId = urllib.parse.quote(str(vlanId), safe="")
-        resource = f"/networks/{networkId}/appliance/vlans/{vlanId}"
-
-        body_params = [
-            "name",
-            "subnet",
-            "applianceIp",
-            "groupPolicyId",
-            "vpnNatSubnet",
-            "dhcpHandling",
-            "dhcpRelayServerIps",
-            "dhcpLeaseTime",
-            "dhcpBootOptionsEnabled",
-            "dhcpBootNextServer",
-            "dhcpBootFilename",
-            "fixedIpAssignments",
-            "reservedIpRanges",
-            "dnsNameservers",
-            "dhcpOptions",
-            "templateVlanType",
-            "cidr",
-            "mask",
-            "ipv6",
-            "mandatoryDhcp",
-            "sgt",
-            "vrf",
-            "uplinks",
-        ]
-        payload = {k.strip(): v for k, v in kwargs.items() if k.strip() in body_params}
-
-        if self._session._validate_kwargs:
-            all_params = [] + body_params
-            invalid = [k for k in kwargs if k.strip() not in all_params and k != "self"]
-            if invalid and self._session._logger:
-                self._session._logger.warning(f"updateNetworkApplianceVlan: ignoring unrecognized kwargs: {invalid}")
-
-        return self._session.put(metadata, resource, payload)
+        return dispatch.call(self._session, "updateNetworkApplianceVlan", networkId, vlanId, **kwargs)
 
     def deleteNetworkApplianceVlan(self, networkId: str, vlanId: str):
         """
@@ -2977,15 +1298,7 @@ class AsyncAppliance:
         - vlanId (string): Vlan ID
         """
 
-        metadata = {
-            "tags": ["appliance", "configure", "vlans"],
-            "operation": "deleteNetworkApplianceVlan",
-        }
-        networkId = urllib.parse.quote(str(networkId), safe="")
-        vlanId = urllib.parse.quote(str(vlanId), safe="")
-        resource = f"/networks/{networkId}/appliance/vlans/{vlanId}"
-
-        return self._session.delete(metadata, resource)
+        return dispatch.call(self._session, "deleteNetworkApplianceVlan", networkId, vlanId)
 
     def getNetworkApplianceVpnBgp(self, networkId: str):
         """
@@ -2995,14 +1308,7 @@ class AsyncAppliance:
         - networkId (string): Network ID
         """
 
-        metadata = {
-            "tags": ["appliance", "configure", "vpn", "bgp"],
-            "operation": "getNetworkApplianceVpnBgp",
-        }
-        networkId = urllib.parse.quote(str(networkId), safe="")
-        resource = f"/networks/{networkId}/appliance/vpn/bgp"
-
-        return self._session.get(metadata, resource)
+        return dispatch.call(self._session, "getNetworkApplianceVpnBgp", networkId)
 
     def updateNetworkApplianceVpnBgp(self, networkId: str, enabled: bool, **kwargs):
         """
@@ -3017,31 +1323,7 @@ class AsyncAppliance:
         - neighbors (array): List of BGP neighbors. This list replaces the existing set of neighbors. When absent, this field is not updated.
         """
 
-        kwargs.update(locals())
-
-        metadata = {
-            "tags": ["appliance", "configure", "vpn", "bgp"],
-            "operation": "updateNetworkApplianceVpnBgp",
-        }
-        networkId = urllib.parse.quote(str(networkId), safe="")
-        resource = f"/networks/{networkId}/appliance/vpn/bgp"
-
-        body_params = [
-            "enabled",
-            "asNumber",
-            "ibgpHoldTimer",
-            "routerId",
-            "neighbors",
-        ]
-        payload = {k.strip(): v for k, v in kwargs.items() if k.strip() in body_params}
-
-        if self._session._validate_kwargs:
-            all_params = [] + body_params
-            invalid = [k for k in kwargs if k.strip() not in all_params and k != "self"]
-            if invalid and self._session._logger:
-                self._session._logger.warning(f"updateNetworkApplianceVpnBgp: ignoring unrecognized kwargs: {invalid}")
-
-        return self._session.put(metadata, resource, payload)
+        return dispatch.call(self._session, "updateNetworkApplianceVpnBgp", networkId, enabled, **kwargs)
 
     def getNetworkApplianceVpnSiteToSiteVpn(self, networkId: str):
         """
@@ -3051,14 +1333,7 @@ class AsyncAppliance:
         - networkId (string): Network ID
         """
 
-        metadata = {
-            "tags": ["appliance", "configure", "vpn", "siteToSiteVpn"],
-            "operation": "getNetworkApplianceVpnSiteToSiteVpn",
-        }
-        networkId = urllib.parse.quote(str(networkId), safe="")
-        resource = f"/networks/{networkId}/appliance/vpn/siteToSiteVpn"
-
-        return self._session.get(metadata, resource)
+        return dispatch.call(self._session, "getNetworkApplianceVpnSiteToSiteVpn", networkId)
 
     def updateNetworkApplianceVpnSiteToSiteVpn(self, networkId: str, mode: str, **kwargs):
         """
@@ -3074,38 +1349,7 @@ class AsyncAppliance:
         - hostTranslations (array): The list of VPN host translations. Host translations are supported starting from MX firmware version 26.1.2
         """
 
-        kwargs.update(locals())
-
-        if "mode" in kwargs:
-            options = ["hub", "none", "spoke"]
-            assert kwargs["mode"] in options, f'''"mode" cannot be "{kwargs["mode"]}", & must be set to one of: {options}'''
-
-        metadata = {
-            "tags": ["appliance", "configure", "vpn", "siteToSiteVpn"],
-            "operation": "updateNetworkApplianceVpnSiteToSiteVpn",
-        }
-        networkId = urllib.parse.quote(str(networkId), safe="")
-        resource = f"/networks/{networkId}/appliance/vpn/siteToSiteVpn"
-
-        body_params = [
-            "mode",
-            "hubs",
-            "subnets",
-            "sgt",
-            "subnet",
-            "hostTranslations",
-        ]
-        payload = {k.strip(): v for k, v in kwargs.items() if k.strip() in body_params}
-
-        if self._session._validate_kwargs:
-            all_params = [] + body_params
-            invalid = [k for k in kwargs if k.strip() not in all_params and k != "self"]
-            if invalid and self._session._logger:
-                self._session._logger.warning(
-                    f"updateNetworkApplianceVpnSiteToSiteVpn: ignoring unrecognized kwargs: {invalid}"
-                )
-
-        return self._session.put(metadata, resource, payload)
+        return dispatch.call(self._session, "updateNetworkApplianceVpnSiteToSiteVpn", networkId, mode, **kwargs)
 
     def getNetworkApplianceWarmSpare(self, networkId: str):
         """
@@ -3115,14 +1359,7 @@ class AsyncAppliance:
         - networkId (string): Network ID
         """
 
-        metadata = {
-            "tags": ["appliance", "configure", "warmSpare"],
-            "operation": "getNetworkApplianceWarmSpare",
-        }
-        networkId = urllib.parse.quote(str(networkId), safe="")
-        resource = f"/networks/{networkId}/appliance/warmSpare"
-
-        return self._session.get(metadata, resource)
+        return dispatch.call(self._session, "getNetworkApplianceWarmSpare", networkId)
 
     def updateNetworkApplianceWarmSpare(self, networkId: str, enabled: bool, **kwargs):
         """
@@ -3137,31 +1374,7 @@ class AsyncAppliance:
         - virtualIp2 (string): The WAN 2 shared IP
         """
 
-        kwargs.update(locals())
-
-        metadata = {
-            "tags": ["appliance", "configure", "warmSpare"],
-            "operation": "updateNetworkApplianceWarmSpare",
-        }
-        networkId = urllib.parse.quote(str(networkId), safe="")
-        resource = f"/networks/{networkId}/appliance/warmSpare"
-
-        body_params = [
-            "enabled",
-            "spareSerial",
-            "uplinkMode",
-            "virtualIp1",
-            "virtualIp2",
-        ]
-        payload = {k.strip(): v for k, v in kwargs.items() if k.strip() in body_params}
-
-        if self._session._validate_kwargs:
-            all_params = [] + body_params
-            invalid = [k for k in kwargs if k.strip() not in all_params and k != "self"]
-            if invalid and self._session._logger:
-                self._session._logger.warning(f"updateNetworkApplianceWarmSpare: ignoring unrecognized kwargs: {invalid}")
-
-        return self._session.put(metadata, resource, payload)
+        return dispatch.call(self._session, "updateNetworkApplianceWarmSpare", networkId, enabled, **kwargs)
 
     def swapNetworkApplianceWarmSpare(self, networkId: str):
         """
@@ -3171,14 +1384,7 @@ class AsyncAppliance:
         - networkId (string): Network ID
         """
 
-        metadata = {
-            "tags": ["appliance", "configure", "warmSpare"],
-            "operation": "swapNetworkApplianceWarmSpare",
-        }
-        networkId = urllib.parse.quote(str(networkId), safe="")
-        resource = f"/networks/{networkId}/appliance/warmSpare/swap"
-
-        return self._session.post(metadata, resource)
+        return dispatch.call(self._session, "swapNetworkApplianceWarmSpare", networkId)
 
     def getOrganizationApplianceDevicesInterfacesL3(self, organizationId: str, total_pages=1, direction="next", **kwargs):
         """
@@ -3194,40 +1400,14 @@ class AsyncAppliance:
         - endingBefore (string): A token used by the server to indicate the end of the page. Often this is a timestamp or an ID but it is not limited to those. This parameter should not be defined by client applications. The link for the first, last, prev, or next page in the HTTP Link header should define it.
         """
 
-        kwargs.update(locals())
-
-        metadata = {
-            "tags": ["appliance", "configure", "devices", "interfaces", "l3"],
-            "operation": "getOrganizationApplianceDevicesInterfacesL3",
-        }
-        organizationId = urllib.parse.quote(str(organizationId), safe="")
-        resource = f"/organizations/{organizationId}/appliance/devices/interfaces/l3"
-
-        query_params = [
-            "networkIds",
-            "perPage",
-            "startingAfter",
-            "endingBefore",
-        ]
-        params = {k.strip(): v for k, v in kwargs.items() if k.strip() in query_params}
-
-        array_params = [
-            "networkIds",
-        ]
-        for k, v in kwargs.items():
-            if k.strip() in array_params:
-                params[f"{k.strip()}[]"] = kwargs[f"{k}"]
-                params.pop(k.strip())
-
-        if self._session._validate_kwargs:
-            all_params = query_params + array_params
-            invalid = [k for k in kwargs if k.strip() not in all_params and k != "self"]
-            if invalid and self._session._logger:
-                self._session._logger.warning(
-                    f"getOrganizationApplianceDevicesInterfacesL3: ignoring unrecognized kwargs: {invalid}"
-                )
-
-        return self._session.get_pages(metadata, resource, params, total_pages, direction)
+        return dispatch.call(
+            self._session,
+            "getOrganizationApplianceDevicesInterfacesL3",
+            organizationId,
+            total_pages=total_pages,
+            direction=direction,
+            **kwargs,
+        )
 
     def getOrganizationApplianceDevicesInterfacesPortsByDevice(self, organizationId: str, **kwargs):
         """
@@ -3240,41 +1420,7 @@ class AsyncAppliance:
         - numbers (array): Parameter to filter the results by specific ports
         """
 
-        kwargs.update(locals())
-
-        metadata = {
-            "tags": ["appliance", "configure", "devices", "interfaces", "ports", "byDevice"],
-            "operation": "getOrganizationApplianceDevicesInterfacesPortsByDevice",
-        }
-        organizationId = urllib.parse.quote(str(organizationId), safe="")
-        resource = f"/organizations/{organizationId}/appliance/devices/interfaces/ports/byDevice"
-
-        query_params = [
-            "serials",
-            "interfaces",
-            "numbers",
-        ]
-        params = {k.strip(): v for k, v in kwargs.items() if k.strip() in query_params}
-
-        array_params = [
-            "serials",
-            "interfaces",
-            "numbers",
-        ]
-        for k, v in kwargs.items():
-            if k.strip() in array_params:
-                params[f"{k.strip()}[]"] = kwargs[f"{k}"]
-                params.pop(k.strip())
-
-        if self._session._validate_kwargs:
-            all_params = query_params + array_params
-            invalid = [k for k in kwargs if k.strip() not in all_params and k != "self"]
-            if invalid and self._session._logger:
-                self._session._logger.warning(
-                    f"getOrganizationApplianceDevicesInterfacesPortsByDevice: ignoring unrecognized kwargs: {invalid}"
-                )
-
-        return self._session.get(metadata, resource, params)
+        return dispatch.call(self._session, "getOrganizationApplianceDevicesInterfacesPortsByDevice", organizationId, **kwargs)
 
     def getOrganizationApplianceDevicesPortsTransceiversReadingsHistoryByDevice(
         self, organizationId: str, total_pages=1, direction="next", **kwargs
@@ -3298,48 +1444,14 @@ class AsyncAppliance:
         - portIds (array): Optional parameter to filter usage by port ID.
         """
 
-        kwargs.update(locals())
-
-        metadata = {
-            "tags": ["appliance", "monitor", "devices", "ports", "transceivers", "readings", "history", "byDevice"],
-            "operation": "getOrganizationApplianceDevicesPortsTransceiversReadingsHistoryByDevice",
-        }
-        organizationId = urllib.parse.quote(str(organizationId), safe="")
-        resource = f"/organizations/{organizationId}/appliance/devices/ports/transceivers/readings/history/byDevice"
-
-        query_params = [
-            "perPage",
-            "startingAfter",
-            "endingBefore",
-            "t0",
-            "t1",
-            "timespan",
-            "interval",
-            "networkIds",
-            "serials",
-            "portIds",
-        ]
-        params = {k.strip(): v for k, v in kwargs.items() if k.strip() in query_params}
-
-        array_params = [
-            "networkIds",
-            "serials",
-            "portIds",
-        ]
-        for k, v in kwargs.items():
-            if k.strip() in array_params:
-                params[f"{k.strip()}[]"] = kwargs[f"{k}"]
-                params.pop(k.strip())
-
-        if self._session._validate_kwargs:
-            all_params = query_params + array_params
-            invalid = [k for k in kwargs if k.strip() not in all_params and k != "self"]
-            if invalid and self._session._logger:
-                self._session._logger.warning(
-                    f"getOrganizationApplianceDevicesPortsTransceiversReadingsHistoryByDevice: ignoring unrecognized kwargs: {invalid}"
-                )
-
-        return self._session.get_pages(metadata, resource, params, total_pages, direction)
+        return dispatch.call(
+            self._session,
+            "getOrganizationApplianceDevicesPortsTransceiversReadingsHistoryByDevice",
+            organizationId,
+            total_pages=total_pages,
+            direction=direction,
+            **kwargs,
+        )
 
     def getOrganizationApplianceDevicesRedundancyByNetwork(
         self, organizationId: str, total_pages=1, direction="next", **kwargs
@@ -3356,31 +1468,14 @@ class AsyncAppliance:
         - endingBefore (string): A token used by the server to indicate the end of the page. Often this is a timestamp or an ID but it is not limited to those. This parameter should not be defined by client applications. The link for the first, last, prev, or next page in the HTTP Link header should define it.
         """
 
-        kwargs.update(locals())
-
-        metadata = {
-            "tags": ["appliance", "configure", "devices", "redundancy", "byNetwork"],
-            "operation": "getOrganizationApplianceDevicesRedundancyByNetwork",
-        }
-        organizationId = urllib.parse.quote(str(organizationId), safe="")
-        resource = f"/organizations/{organizationId}/appliance/devices/redundancy/byNetwork"
-
-        query_params = [
-            "perPage",
-            "startingAfter",
-            "endingBefore",
-        ]
-        params = {k.strip(): v for k, v in kwargs.items() if k.strip() in query_params}
-
-        if self._session._validate_kwargs:
-            all_params = query_params
-            invalid = [k for k in kwargs if k.strip() not in all_params and k != "self"]
-            if invalid and self._session._logger:
-                self._session._logger.warning(
-                    f"getOrganizationApplianceDevicesRedundancyByNetwork: ignoring unrecognized kwargs: {invalid}"
-                )
-
-        return self._session.get_pages(metadata, resource, params, total_pages, direction)
+        return dispatch.call(
+            self._session,
+            "getOrganizationApplianceDevicesRedundancyByNetwork",
+            organizationId,
+            total_pages=total_pages,
+            direction=direction,
+            **kwargs,
+        )
 
     def getOrganizationApplianceDnsLocalProfiles(self, organizationId: str, **kwargs):
         """
@@ -3391,37 +1486,7 @@ class AsyncAppliance:
         - profileIds (array): Optional parameter to filter the results by profile IDs
         """
 
-        kwargs.update(locals())
-
-        metadata = {
-            "tags": ["appliance", "configure", "dns", "local", "profiles"],
-            "operation": "getOrganizationApplianceDnsLocalProfiles",
-        }
-        organizationId = urllib.parse.quote(str(organizationId), safe="")
-        resource = f"/organizations/{organizationId}/appliance/dns/local/profiles"
-
-        query_params = [
-            "profileIds",
-        ]
-        params = {k.strip(): v for k, v in kwargs.items() if k.strip() in query_params}
-
-        array_params = [
-            "profileIds",
-        ]
-        for k, v in kwargs.items():
-            if k.strip() in array_params:
-                params[f"{k.strip()}[]"] = kwargs[f"{k}"]
-                params.pop(k.strip())
-
-        if self._session._validate_kwargs:
-            all_params = query_params + array_params
-            invalid = [k for k in kwargs if k.strip() not in all_params and k != "self"]
-            if invalid and self._session._logger:
-                self._session._logger.warning(
-                    f"getOrganizationApplianceDnsLocalProfiles: ignoring unrecognized kwargs: {invalid}"
-                )
-
-        return self._session.get(metadata, resource, params)
+        return dispatch.call(self._session, "getOrganizationApplianceDnsLocalProfiles", organizationId, **kwargs)
 
     def createOrganizationApplianceDnsLocalProfile(self, organizationId: str, name: str, **kwargs):
         """
@@ -3432,29 +1497,7 @@ class AsyncAppliance:
         - name (string): Name of profile
         """
 
-        kwargs = locals()
-
-        metadata = {
-            "tags": ["appliance", "configure", "dns", "local", "profiles"],
-            "operation": "createOrganizationApplianceDnsLocalProfile",
-        }
-        organizationId = urllib.parse.quote(str(organizationId), safe="")
-        resource = f"/organizations/{organizationId}/appliance/dns/local/profiles"
-
-        body_params = [
-            "name",
-        ]
-        payload = {k.strip(): v for k, v in kwargs.items() if k.strip() in body_params}
-
-        if self._session._validate_kwargs:
-            all_params = [] + body_params
-            invalid = [k for k in kwargs if k.strip() not in all_params and k != "self"]
-            if invalid and self._session._logger:
-                self._session._logger.warning(
-                    f"createOrganizationApplianceDnsLocalProfile: ignoring unrecognized kwargs: {invalid}"
-                )
-
-        return self._session.post(metadata, resource, payload)
+        return dispatch.call(self._session, "createOrganizationApplianceDnsLocalProfile", organizationId, name, **kwargs)
 
     def getOrganizationApplianceDnsLocalProfilesAssignments(self, organizationId: str, **kwargs):
         """
@@ -3466,39 +1509,7 @@ class AsyncAppliance:
         - networkIds (array): Optional parameter to filter the results by network IDs
         """
 
-        kwargs.update(locals())
-
-        metadata = {
-            "tags": ["appliance", "configure", "dns", "local", "profiles", "assignments"],
-            "operation": "getOrganizationApplianceDnsLocalProfilesAssignments",
-        }
-        organizationId = urllib.parse.quote(str(organizationId), safe="")
-        resource = f"/organizations/{organizationId}/appliance/dns/local/profiles/assignments"
-
-        query_params = [
-            "profileIds",
-            "networkIds",
-        ]
-        params = {k.strip(): v for k, v in kwargs.items() if k.strip() in query_params}
-
-        array_params = [
-            "profileIds",
-            "networkIds",
-        ]
-        for k, v in kwargs.items():
-            if k.strip() in array_params:
-                params[f"{k.strip()}[]"] = kwargs[f"{k}"]
-                params.pop(k.strip())
-
-        if self._session._validate_kwargs:
-            all_params = query_params + array_params
-            invalid = [k for k in kwargs if k.strip() not in all_params and k != "self"]
-            if invalid and self._session._logger:
-                self._session._logger.warning(
-                    f"getOrganizationApplianceDnsLocalProfilesAssignments: ignoring unrecognized kwargs: {invalid}"
-                )
-
-        return self._session.get(metadata, resource, params)
+        return dispatch.call(self._session, "getOrganizationApplianceDnsLocalProfilesAssignments", organizationId, **kwargs)
 
     def bulkOrganizationApplianceDnsLocalProfilesAssignmentsCreate(self, organizationId: str, items: list, **kwargs):
         """
@@ -3509,29 +1520,9 @@ class AsyncAppliance:
         - items (array): List containing the network ID and Profile ID
         """
 
-        kwargs = locals()
-
-        metadata = {
-            "tags": ["appliance", "configure", "dns", "local", "profiles", "assignments"],
-            "operation": "bulkOrganizationApplianceDnsLocalProfilesAssignmentsCreate",
-        }
-        organizationId = urllib.parse.quote(str(organizationId), safe="")
-        resource = f"/organizations/{organizationId}/appliance/dns/local/profiles/assignments/bulkCreate"
-
-        body_params = [
-            "items",
-        ]
-        payload = {k.strip(): v for k, v in kwargs.items() if k.strip() in body_params}
-
-        if self._session._validate_kwargs:
-            all_params = [] + body_params
-            invalid = [k for k in kwargs if k.strip() not in all_params and k != "self"]
-            if invalid and self._session._logger:
-                self._session._logger.warning(
-                    f"bulkOrganizationApplianceDnsLocalProfilesAssignmentsCreate: ignoring unrecognized kwargs: {invalid}"
-                )
-
-        return self._session.post(metadata, resource, payload)
+        return dispatch.call(
+            self._session, "bulkOrganizationApplianceDnsLocalProfilesAssignmentsCreate", organizationId, items, **kwargs
+        )
 
     def createOrganizationApplianceDnsLocalProfilesAssignmentsBulkDelete(self, organizationId: str, items: list, **kwargs):
         """
@@ -3542,29 +1533,9 @@ class AsyncAppliance:
         - items (array): List containing the assignment ID
         """
 
-        kwargs = locals()
-
-        metadata = {
-            "tags": ["appliance", "configure", "dns", "local", "profiles", "assignments", "bulkDelete"],
-            "operation": "createOrganizationApplianceDnsLocalProfilesAssignmentsBulkDelete",
-        }
-        organizationId = urllib.parse.quote(str(organizationId), safe="")
-        resource = f"/organizations/{organizationId}/appliance/dns/local/profiles/assignments/bulkDelete"
-
-        body_params = [
-            "items",
-        ]
-        payload = {k.strip(): v for k, v in kwargs.items() if k.strip() in body_params}
-
-        if self._session._validate_kwargs:
-            all_params = [] + body_params
-            invalid = [k for k in kwargs if k.strip() not in all_params and k != "self"]
-            if invalid and self._session._logger:
-                self._session._logger.warning(
-                    f"createOrganizationApplianceDnsLocalProfilesAssignmentsBulkDelete: ignoring unrecognized kwargs: {invalid}"
-                )
-
-        return self._session.post(metadata, resource, payload)
+        return dispatch.call(
+            self._session, "createOrganizationApplianceDnsLocalProfilesAssignmentsBulkDelete", organizationId, items, **kwargs
+        )
 
     def updateOrganizationApplianceDnsLocalProfile(self, organizationId: str, profileId: str, name: str, **kwargs):
         """
@@ -3576,30 +1547,9 @@ class AsyncAppliance:
         - name (string): Name of profile
         """
 
-        kwargs = locals()
-
-        metadata = {
-            "tags": ["appliance", "configure", "dns", "local", "profiles"],
-            "operation": "updateOrganizationApplianceDnsLocalProfile",
-        }
-        organizationId = urllib.parse.quote(str(organizationId), safe="")
-        profileId = urllib.parse.quote(str(profileId), safe="")
-        resource = f"/organizations/{organizationId}/appliance/dns/local/profiles/{profileId}"
-
-        body_params = [
-            "name",
-        ]
-        payload = {k.strip(): v for k, v in kwargs.items() if k.strip() in body_params}
-
-        if self._session._validate_kwargs:
-            all_params = [] + body_params
-            invalid = [k for k in kwargs if k.strip() not in all_params and k != "self"]
-            if invalid and self._session._logger:
-                self._session._logger.warning(
-                    f"updateOrganizationApplianceDnsLocalProfile: ignoring unrecognized kwargs: {invalid}"
-                )
-
-        return self._session.put(metadata, resource, payload)
+        return dispatch.call(
+            self._session, "updateOrganizationApplianceDnsLocalProfile", organizationId, profileId, name, **kwargs
+        )
 
     def deleteOrganizationApplianceDnsLocalProfile(self, organizationId: str, profileId: str):
         """
@@ -3610,15 +1560,7 @@ class AsyncAppliance:
         - profileId (string): Profile ID
         """
 
-        metadata = {
-            "tags": ["appliance", "configure", "dns", "local", "profiles"],
-            "operation": "deleteOrganizationApplianceDnsLocalProfile",
-        }
-        organizationId = urllib.parse.quote(str(organizationId), safe="")
-        profileId = urllib.parse.quote(str(profileId), safe="")
-        resource = f"/organizations/{organizationId}/appliance/dns/local/profiles/{profileId}"
-
-        return self._session.delete(metadata, resource)
+        return dispatch.call(self._session, "deleteOrganizationApplianceDnsLocalProfile", organizationId, profileId)
 
     def getOrganizationApplianceDnsLocalRecords(self, organizationId: str, **kwargs):
         """
@@ -3629,37 +1571,7 @@ class AsyncAppliance:
         - profileIds (array): Optional parameter to filter the results by profile IDs
         """
 
-        kwargs.update(locals())
-
-        metadata = {
-            "tags": ["appliance", "configure", "dns", "local", "records"],
-            "operation": "getOrganizationApplianceDnsLocalRecords",
-        }
-        organizationId = urllib.parse.quote(str(organizationId), safe="")
-        resource = f"/organizations/{organizationId}/appliance/dns/local/records"
-
-        query_params = [
-            "profileIds",
-        ]
-        params = {k.strip(): v for k, v in kwargs.items() if k.strip() in query_params}
-
-        array_params = [
-            "profileIds",
-        ]
-        for k, v in kwargs.items():
-            if k.strip() in array_params:
-                params[f"{k.strip()}[]"] = kwargs[f"{k}"]
-                params.pop(k.strip())
-
-        if self._session._validate_kwargs:
-            all_params = query_params + array_params
-            invalid = [k for k in kwargs if k.strip() not in all_params and k != "self"]
-            if invalid and self._session._logger:
-                self._session._logger.warning(
-                    f"getOrganizationApplianceDnsLocalRecords: ignoring unrecognized kwargs: {invalid}"
-                )
-
-        return self._session.get(metadata, resource, params)
+        return dispatch.call(self._session, "getOrganizationApplianceDnsLocalRecords", organizationId, **kwargs)
 
     def createOrganizationApplianceDnsLocalRecord(
         self, organizationId: str, hostname: str, address: str, profile: dict, **kwargs
@@ -3674,31 +1586,9 @@ class AsyncAppliance:
         - profile (object): The profile the DNS record is associated with
         """
 
-        kwargs = locals()
-
-        metadata = {
-            "tags": ["appliance", "configure", "dns", "local", "records"],
-            "operation": "createOrganizationApplianceDnsLocalRecord",
-        }
-        organizationId = urllib.parse.quote(str(organizationId), safe="")
-        resource = f"/organizations/{organizationId}/appliance/dns/local/records"
-
-        body_params = [
-            "hostname",
-            "address",
-            "profile",
-        ]
-        payload = {k.strip(): v for k, v in kwargs.items() if k.strip() in body_params}
-
-        if self._session._validate_kwargs:
-            all_params = [] + body_params
-            invalid = [k for k in kwargs if k.strip() not in all_params and k != "self"]
-            if invalid and self._session._logger:
-                self._session._logger.warning(
-                    f"createOrganizationApplianceDnsLocalRecord: ignoring unrecognized kwargs: {invalid}"
-                )
-
-        return self._session.post(metadata, resource, payload)
+        return dispatch.call(
+            self._session, "createOrganizationApplianceDnsLocalRecord", organizationId, hostname, address, profile, **kwargs
+        )
 
     def updateOrganizationApplianceDnsLocalRecord(self, organizationId: str, recordId: str, **kwargs):
         """
@@ -3712,32 +1602,7 @@ class AsyncAppliance:
         - profile (object): The profile the DNS record is associated with
         """
 
-        kwargs.update(locals())
-
-        metadata = {
-            "tags": ["appliance", "configure", "dns", "local", "records"],
-            "operation": "updateOrganizationApplianceDnsLocalRecord",
-        }
-        organizationId = urllib.parse.quote(str(organizationId), safe="")
-        recordId = urllib.parse.quote(str(recordId), safe="")
-        resource = f"/organizations/{organizationId}/appliance/dns/local/records/{recordId}"
-
-        body_params = [
-            "hostname",
-            "address",
-            "profile",
-        ]
-        payload = {k.strip(): v for k, v in kwargs.items() if k.strip() in body_params}
-
-        if self._session._validate_kwargs:
-            all_params = [] + body_params
-            invalid = [k for k in kwargs if k.strip() not in all_params and k != "self"]
-            if invalid and self._session._logger:
-                self._session._logger.warning(
-                    f"updateOrganizationApplianceDnsLocalRecord: ignoring unrecognized kwargs: {invalid}"
-                )
-
-        return self._session.put(metadata, resource, payload)
+        return dispatch.call(self._session, "updateOrganizationApplianceDnsLocalRecord", organizationId, recordId, **kwargs)
 
     def deleteOrganizationApplianceDnsLocalRecord(self, organizationId: str, recordId: str):
         """
@@ -3748,15 +1613,7 @@ class AsyncAppliance:
         - recordId (string): Record ID
         """
 
-        metadata = {
-            "tags": ["appliance", "configure", "dns", "local", "records"],
-            "operation": "deleteOrganizationApplianceDnsLocalRecord",
-        }
-        organizationId = urllib.parse.quote(str(organizationId), safe="")
-        recordId = urllib.parse.quote(str(recordId), safe="")
-        resource = f"/organizations/{organizationId}/appliance/dns/local/records/{recordId}"
-
-        return self._session.delete(metadata, resource)
+        return dispatch.call(self._session, "deleteOrganizationApplianceDnsLocalRecord", organizationId, recordId)
 
     def getOrganizationApplianceDnsSplitProfiles(self, organizationId: str, **kwargs):
         """
@@ -3767,37 +1624,7 @@ class AsyncAppliance:
         - profileIds (array): Optional parameter to filter the results by profile IDs
         """
 
-        kwargs.update(locals())
-
-        metadata = {
-            "tags": ["appliance", "configure", "dns", "split", "profiles"],
-            "operation": "getOrganizationApplianceDnsSplitProfiles",
-        }
-        organizationId = urllib.parse.quote(str(organizationId), safe="")
-        resource = f"/organizations/{organizationId}/appliance/dns/split/profiles"
-
-        query_params = [
-            "profileIds",
-        ]
-        params = {k.strip(): v for k, v in kwargs.items() if k.strip() in query_params}
-
-        array_params = [
-            "profileIds",
-        ]
-        for k, v in kwargs.items():
-            if k.strip() in array_params:
-                params[f"{k.strip()}[]"] = kwargs[f"{k}"]
-                params.pop(k.strip())
-
-        if self._session._validate_kwargs:
-            all_params = query_params + array_params
-            invalid = [k for k in kwargs if k.strip() not in all_params and k != "self"]
-            if invalid and self._session._logger:
-                self._session._logger.warning(
-                    f"getOrganizationApplianceDnsSplitProfiles: ignoring unrecognized kwargs: {invalid}"
-                )
-
-        return self._session.get(metadata, resource, params)
+        return dispatch.call(self._session, "getOrganizationApplianceDnsSplitProfiles", organizationId, **kwargs)
 
     def createOrganizationApplianceDnsSplitProfile(
         self, organizationId: str, name: str, hostnames: list, nameservers: dict, **kwargs
@@ -3812,31 +1639,9 @@ class AsyncAppliance:
         - nameservers (object): Contains the nameserver information for redirection.
         """
 
-        kwargs = locals()
-
-        metadata = {
-            "tags": ["appliance", "configure", "dns", "split", "profiles"],
-            "operation": "createOrganizationApplianceDnsSplitProfile",
-        }
-        organizationId = urllib.parse.quote(str(organizationId), safe="")
-        resource = f"/organizations/{organizationId}/appliance/dns/split/profiles"
-
-        body_params = [
-            "name",
-            "hostnames",
-            "nameservers",
-        ]
-        payload = {k.strip(): v for k, v in kwargs.items() if k.strip() in body_params}
-
-        if self._session._validate_kwargs:
-            all_params = [] + body_params
-            invalid = [k for k in kwargs if k.strip() not in all_params and k != "self"]
-            if invalid and self._session._logger:
-                self._session._logger.warning(
-                    f"createOrganizationApplianceDnsSplitProfile: ignoring unrecognized kwargs: {invalid}"
-                )
-
-        return self._session.post(metadata, resource, payload)
+        return dispatch.call(
+            self._session, "createOrganizationApplianceDnsSplitProfile", organizationId, name, hostnames, nameservers, **kwargs
+        )
 
     def getOrganizationApplianceDnsSplitProfilesAssignments(self, organizationId: str, **kwargs):
         """
@@ -3848,39 +1653,7 @@ class AsyncAppliance:
         - networkIds (array): Optional parameter to filter the results by network IDs
         """
 
-        kwargs.update(locals())
-
-        metadata = {
-            "tags": ["appliance", "configure", "dns", "split", "profiles", "assignments"],
-            "operation": "getOrganizationApplianceDnsSplitProfilesAssignments",
-        }
-        organizationId = urllib.parse.quote(str(organizationId), safe="")
-        resource = f"/organizations/{organizationId}/appliance/dns/split/profiles/assignments"
-
-        query_params = [
-            "profileIds",
-            "networkIds",
-        ]
-        params = {k.strip(): v for k, v in kwargs.items() if k.strip() in query_params}
-
-        array_params = [
-            "profileIds",
-            "networkIds",
-        ]
-        for k, v in kwargs.items():
-            if k.strip() in array_params:
-                params[f"{k.strip()}[]"] = kwargs[f"{k}"]
-                params.pop(k.strip())
-
-        if self._session._validate_kwargs:
-            all_params = query_params + array_params
-            invalid = [k for k in kwargs if k.strip() not in all_params and k != "self"]
-            if invalid and self._session._logger:
-                self._session._logger.warning(
-                    f"getOrganizationApplianceDnsSplitProfilesAssignments: ignoring unrecognized kwargs: {invalid}"
-                )
-
-        return self._session.get(metadata, resource, params)
+        return dispatch.call(self._session, "getOrganizationApplianceDnsSplitProfilesAssignments", organizationId, **kwargs)
 
     def createOrganizationApplianceDnsSplitProfilesAssignmentsBulkCreate(self, organizationId: str, items: list, **kwargs):
         """
@@ -3891,29 +1664,9 @@ class AsyncAppliance:
         - items (array): List containing the network ID and Profile ID
         """
 
-        kwargs = locals()
-
-        metadata = {
-            "tags": ["appliance", "configure", "dns", "split", "profiles", "assignments", "bulkCreate"],
-            "operation": "createOrganizationApplianceDnsSplitProfilesAssignmentsBulkCreate",
-        }
-        organizationId = urllib.parse.quote(str(organizationId), safe="")
-        resource = f"/organizations/{organizationId}/appliance/dns/split/profiles/assignments/bulkCreate"
-
-        body_params = [
-            "items",
-        ]
-        payload = {k.strip(): v for k, v in kwargs.items() if k.strip() in body_params}
-
-        if self._session._validate_kwargs:
-            all_params = [] + body_params
-            invalid = [k for k in kwargs if k.strip() not in all_params and k != "self"]
-            if invalid and self._session._logger:
-                self._session._logger.warning(
-                    f"createOrganizationApplianceDnsSplitProfilesAssignmentsBulkCreate: ignoring unrecognized kwargs: {invalid}"
-                )
-
-        return self._session.post(metadata, resource, payload)
+        return dispatch.call(
+            self._session, "createOrganizationApplianceDnsSplitProfilesAssignmentsBulkCreate", organizationId, items, **kwargs
+        )
 
     def createOrganizationApplianceDnsSplitProfilesAssignmentsBulkDelete(self, organizationId: str, items: list, **kwargs):
         """
@@ -3924,29 +1677,9 @@ class AsyncAppliance:
         - items (array): List containing the assignment ID
         """
 
-        kwargs = locals()
-
-        metadata = {
-            "tags": ["appliance", "configure", "dns", "split", "profiles", "assignments", "bulkDelete"],
-            "operation": "createOrganizationApplianceDnsSplitProfilesAssignmentsBulkDelete",
-        }
-        organizationId = urllib.parse.quote(str(organizationId), safe="")
-        resource = f"/organizations/{organizationId}/appliance/dns/split/profiles/assignments/bulkDelete"
-
-        body_params = [
-            "items",
-        ]
-        payload = {k.strip(): v for k, v in kwargs.items() if k.strip() in body_params}
-
-        if self._session._validate_kwargs:
-            all_params = [] + body_params
-            invalid = [k for k in kwargs if k.strip() not in all_params and k != "self"]
-            if invalid and self._session._logger:
-                self._session._logger.warning(
-                    f"createOrganizationApplianceDnsSplitProfilesAssignmentsBulkDelete: ignoring unrecognized kwargs: {invalid}"
-                )
-
-        return self._session.post(metadata, resource, payload)
+        return dispatch.call(
+            self._session, "createOrganizationApplianceDnsSplitProfilesAssignmentsBulkDelete", organizationId, items, **kwargs
+        )
 
     def updateOrganizationApplianceDnsSplitProfile(self, organizationId: str, profileId: str, **kwargs):
         """
@@ -3960,32 +1693,7 @@ class AsyncAppliance:
         - nameservers (object): Contains the nameserver information for redirection.
         """
 
-        kwargs.update(locals())
-
-        metadata = {
-            "tags": ["appliance", "configure", "dns", "split", "profiles"],
-            "operation": "updateOrganizationApplianceDnsSplitProfile",
-        }
-        organizationId = urllib.parse.quote(str(organizationId), safe="")
-        profileId = urllib.parse.quote(str(profileId), safe="")
-        resource = f"/organizations/{organizationId}/appliance/dns/split/profiles/{profileId}"
-
-        body_params = [
-            "name",
-            "hostnames",
-            "nameservers",
-        ]
-        payload = {k.strip(): v for k, v in kwargs.items() if k.strip() in body_params}
-
-        if self._session._validate_kwargs:
-            all_params = [] + body_params
-            invalid = [k for k in kwargs if k.strip() not in all_params and k != "self"]
-            if invalid and self._session._logger:
-                self._session._logger.warning(
-                    f"updateOrganizationApplianceDnsSplitProfile: ignoring unrecognized kwargs: {invalid}"
-                )
-
-        return self._session.put(metadata, resource, payload)
+        return dispatch.call(self._session, "updateOrganizationApplianceDnsSplitProfile", organizationId, profileId, **kwargs)
 
     def deleteOrganizationApplianceDnsSplitProfile(self, organizationId: str, profileId: str):
         """
@@ -3996,15 +1704,7 @@ class AsyncAppliance:
         - profileId (string): Profile ID
         """
 
-        metadata = {
-            "tags": ["appliance", "configure", "dns", "split", "profiles"],
-            "operation": "deleteOrganizationApplianceDnsSplitProfile",
-        }
-        organizationId = urllib.parse.quote(str(organizationId), safe="")
-        profileId = urllib.parse.quote(str(profileId), safe="")
-        resource = f"/organizations/{organizationId}/appliance/dns/split/profiles/{profileId}"
-
-        return self._session.delete(metadata, resource)
+        return dispatch.call(self._session, "deleteOrganizationApplianceDnsSplitProfile", organizationId, profileId)
 
     def getOrganizationApplianceFirewallMulticastForwardingByNetwork(
         self, organizationId: str, total_pages=1, direction="next", **kwargs
@@ -4022,40 +1722,14 @@ class AsyncAppliance:
         - networkIds (array): Optional parameter to filter the results by network IDs
         """
 
-        kwargs.update(locals())
-
-        metadata = {
-            "tags": ["appliance", "configure", "firewall", "multicastForwarding", "byNetwork"],
-            "operation": "getOrganizationApplianceFirewallMulticastForwardingByNetwork",
-        }
-        organizationId = urllib.parse.quote(str(organizationId), safe="")
-        resource = f"/organizations/{organizationId}/appliance/firewall/multicastForwarding/byNetwork"
-
-        query_params = [
-            "perPage",
-            "startingAfter",
-            "endingBefore",
-            "networkIds",
-        ]
-        params = {k.strip(): v for k, v in kwargs.items() if k.strip() in query_params}
-
-        array_params = [
-            "networkIds",
-        ]
-        for k, v in kwargs.items():
-            if k.strip() in array_params:
-                params[f"{k.strip()}[]"] = kwargs[f"{k}"]
-                params.pop(k.strip())
-
-        if self._session._validate_kwargs:
-            all_params = query_params + array_params
-            invalid = [k for k in kwargs if k.strip() not in all_params and k != "self"]
-            if invalid and self._session._logger:
-                self._session._logger.warning(
-                    f"getOrganizationApplianceFirewallMulticastForwardingByNetwork: ignoring unrecognized kwargs: {invalid}"
-                )
-
-        return self._session.get_pages(metadata, resource, params, total_pages, direction)
+        return dispatch.call(
+            self._session,
+            "getOrganizationApplianceFirewallMulticastForwardingByNetwork",
+            organizationId,
+            total_pages=total_pages,
+            direction=direction,
+            **kwargs,
+        )
 
     def getOrganizationApplianceInterfacesPacketsOverviewsByDevice(
         self, organizationId: str, total_pages=1, direction="next", **kwargs
@@ -4077,45 +1751,14 @@ class AsyncAppliance:
         - serials (array): Optional parameter to filter Secure Routers by their serial numbers
         """
 
-        kwargs.update(locals())
-
-        metadata = {
-            "tags": ["appliance", "monitor", "interfaces", "packets", "overviews", "byDevice"],
-            "operation": "getOrganizationApplianceInterfacesPacketsOverviewsByDevice",
-        }
-        organizationId = urllib.parse.quote(str(organizationId), safe="")
-        resource = f"/organizations/{organizationId}/appliance/interfaces/packets/overviews/byDevice"
-
-        query_params = [
-            "t0",
-            "t1",
-            "timespan",
-            "perPage",
-            "startingAfter",
-            "endingBefore",
-            "networkIds",
-            "serials",
-        ]
-        params = {k.strip(): v for k, v in kwargs.items() if k.strip() in query_params}
-
-        array_params = [
-            "networkIds",
-            "serials",
-        ]
-        for k, v in kwargs.items():
-            if k.strip() in array_params:
-                params[f"{k.strip()}[]"] = kwargs[f"{k}"]
-                params.pop(k.strip())
-
-        if self._session._validate_kwargs:
-            all_params = query_params + array_params
-            invalid = [k for k in kwargs if k.strip() not in all_params and k != "self"]
-            if invalid and self._session._logger:
-                self._session._logger.warning(
-                    f"getOrganizationApplianceInterfacesPacketsOverviewsByDevice: ignoring unrecognized kwargs: {invalid}"
-                )
-
-        return self._session.get_pages(metadata, resource, params, total_pages, direction)
+        return dispatch.call(
+            self._session,
+            "getOrganizationApplianceInterfacesPacketsOverviewsByDevice",
+            organizationId,
+            total_pages=total_pages,
+            direction=direction,
+            **kwargs,
+        )
 
     def getOrganizationApplianceRoutingVrfsSettings(self, organizationId: str):
         """
@@ -4125,14 +1768,7 @@ class AsyncAppliance:
         - organizationId (string): Organization ID
         """
 
-        metadata = {
-            "tags": ["appliance", "configure", "routing", "vrfs", "settings"],
-            "operation": "getOrganizationApplianceRoutingVrfsSettings",
-        }
-        organizationId = urllib.parse.quote(str(organizationId), safe="")
-        resource = f"/organizations/{organizationId}/appliance/routing/vrfs/settings"
-
-        return self._session.get(metadata, resource)
+        return dispatch.call(self._session, "getOrganizationApplianceRoutingVrfsSettings", organizationId)
 
     def updateOrganizationApplianceRoutingVrfsSettings(self, organizationId: str, enabled: bool, **kwargs):
         """
@@ -4143,29 +1779,9 @@ class AsyncAppliance:
         - enabled (boolean): Boolean indicating whether VRFs are enabled for the organization.
         """
 
-        kwargs = locals()
-
-        metadata = {
-            "tags": ["appliance", "configure", "routing", "vrfs", "settings"],
-            "operation": "updateOrganizationApplianceRoutingVrfsSettings",
-        }
-        organizationId = urllib.parse.quote(str(organizationId), safe="")
-        resource = f"/organizations/{organizationId}/appliance/routing/vrfs/settings"
-
-        body_params = [
-            "enabled",
-        ]
-        payload = {k.strip(): v for k, v in kwargs.items() if k.strip() in body_params}
-
-        if self._session._validate_kwargs:
-            all_params = [] + body_params
-            invalid = [k for k in kwargs if k.strip() not in all_params and k != "self"]
-            if invalid and self._session._logger:
-                self._session._logger.warning(
-                    f"updateOrganizationApplianceRoutingVrfsSettings: ignoring unrecognized kwargs: {invalid}"
-                )
-
-        return self._session.put(metadata, resource, payload)
+        return dispatch.call(
+            self._session, "updateOrganizationApplianceRoutingVrfsSettings", organizationId, enabled, **kwargs
+        )
 
     def getOrganizationApplianceSecurityEvents(self, organizationId: str, total_pages=1, direction="next", **kwargs):
         """
@@ -4184,41 +1800,14 @@ class AsyncAppliance:
         - sortOrder (string): Sorted order of security events based on event detection time. Order options are 'ascending' or 'descending'. Default is ascending order.
         """
 
-        kwargs.update(locals())
-
-        if "sortOrder" in kwargs:
-            options = ["ascending", "descending"]
-            assert kwargs["sortOrder"] in options, (
-                f'''"sortOrder" cannot be "{kwargs["sortOrder"]}", & must be set to one of: {options}'''
-            )
-
-        metadata = {
-            "tags": ["appliance", "monitor", "security", "events"],
-            "operation": "getOrganizationApplianceSecurityEvents",
-        }
-        organizationId = urllib.parse.quote(str(organizationId), safe="")
-        resource = f"/organizations/{organizationId}/appliance/security/events"
-
-        query_params = [
-            "t0",
-            "t1",
-            "timespan",
-            "perPage",
-            "startingAfter",
-            "endingBefore",
-            "sortOrder",
-        ]
-        params = {k.strip(): v for k, v in kwargs.items() if k.strip() in query_params}
-
-        if self._session._validate_kwargs:
-            all_params = query_params
-            invalid = [k for k in kwargs if k.strip() not in all_params and k != "self"]
-            if invalid and self._session._logger:
-                self._session._logger.warning(
-                    f"getOrganizationApplianceSecurityEvents: ignoring unrecognized kwargs: {invalid}"
-                )
-
-        return self._session.get_pages(metadata, resource, params, total_pages, direction)
+        return dispatch.call(
+            self._session,
+            "getOrganizationApplianceSecurityEvents",
+            organizationId,
+            total_pages=total_pages,
+            direction=direction,
+            **kwargs,
+        )
 
     def getOrganizationApplianceSecurityIntrusion(self, organizationId: str):
         """
@@ -4228,14 +1817,7 @@ class AsyncAppliance:
         - organizationId (string): Organization ID
         """
 
-        metadata = {
-            "tags": ["appliance", "configure", "security", "intrusion"],
-            "operation": "getOrganizationApplianceSecurityIntrusion",
-        }
-        organizationId = urllib.parse.quote(str(organizationId), safe="")
-        resource = f"/organizations/{organizationId}/appliance/security/intrusion"
-
-        return self._session.get(metadata, resource)
+        return dispatch.call(self._session, "getOrganizationApplianceSecurityIntrusion", organizationId)
 
     def updateOrganizationApplianceSecurityIntrusion(self, organizationId: str, allowedRules: list, **kwargs):
         """
@@ -4246,29 +1828,9 @@ class AsyncAppliance:
         - allowedRules (array): Sets a list of specific SNORT signatures to allow
         """
 
-        kwargs = locals()
-
-        metadata = {
-            "tags": ["appliance", "configure", "security", "intrusion"],
-            "operation": "updateOrganizationApplianceSecurityIntrusion",
-        }
-        organizationId = urllib.parse.quote(str(organizationId), safe="")
-        resource = f"/organizations/{organizationId}/appliance/security/intrusion"
-
-        body_params = [
-            "allowedRules",
-        ]
-        payload = {k.strip(): v for k, v in kwargs.items() if k.strip() in body_params}
-
-        if self._session._validate_kwargs:
-            all_params = [] + body_params
-            invalid = [k for k in kwargs if k.strip() not in all_params and k != "self"]
-            if invalid and self._session._logger:
-                self._session._logger.warning(
-                    f"updateOrganizationApplianceSecurityIntrusion: ignoring unrecognized kwargs: {invalid}"
-                )
-
-        return self._session.put(metadata, resource, payload)
+        return dispatch.call(
+            self._session, "updateOrganizationApplianceSecurityIntrusion", organizationId, allowedRules, **kwargs
+        )
 
     def getOrganizationApplianceTrafficShapingVpnExclusionsByNetwork(
         self, organizationId: str, total_pages=1, direction="next", **kwargs
@@ -4286,40 +1848,14 @@ class AsyncAppliance:
         - networkIds (array): Optional parameter to filter the results by network IDs
         """
 
-        kwargs.update(locals())
-
-        metadata = {
-            "tags": ["appliance", "configure", "trafficShaping", "vpnExclusions", "byNetwork"],
-            "operation": "getOrganizationApplianceTrafficShapingVpnExclusionsByNetwork",
-        }
-        organizationId = urllib.parse.quote(str(organizationId), safe="")
-        resource = f"/organizations/{organizationId}/appliance/trafficShaping/vpnExclusions/byNetwork"
-
-        query_params = [
-            "perPage",
-            "startingAfter",
-            "endingBefore",
-            "networkIds",
-        ]
-        params = {k.strip(): v for k, v in kwargs.items() if k.strip() in query_params}
-
-        array_params = [
-            "networkIds",
-        ]
-        for k, v in kwargs.items():
-            if k.strip() in array_params:
-                params[f"{k.strip()}[]"] = kwargs[f"{k}"]
-                params.pop(k.strip())
-
-        if self._session._validate_kwargs:
-            all_params = query_params + array_params
-            invalid = [k for k in kwargs if k.strip() not in all_params and k != "self"]
-            if invalid and self._session._logger:
-                self._session._logger.warning(
-                    f"getOrganizationApplianceTrafficShapingVpnExclusionsByNetwork: ignoring unrecognized kwargs: {invalid}"
-                )
-
-        return self._session.get_pages(metadata, resource, params, total_pages, direction)
+        return dispatch.call(
+            self._session,
+            "getOrganizationApplianceTrafficShapingVpnExclusionsByNetwork",
+            organizationId,
+            total_pages=total_pages,
+            direction=direction,
+            **kwargs,
+        )
 
     def getOrganizationApplianceUplinkStatuses(self, organizationId: str, total_pages=1, direction="next", **kwargs):
         """
@@ -4337,44 +1873,14 @@ class AsyncAppliance:
         - iccids (array): A list of ICCIDs. The returned devices will be filtered to only include these ICCIDs.
         """
 
-        kwargs.update(locals())
-
-        metadata = {
-            "tags": ["appliance", "monitor", "uplinks", "statuses"],
-            "operation": "getOrganizationApplianceUplinkStatuses",
-        }
-        organizationId = urllib.parse.quote(str(organizationId), safe="")
-        resource = f"/organizations/{organizationId}/appliance/uplink/statuses"
-
-        query_params = [
-            "perPage",
-            "startingAfter",
-            "endingBefore",
-            "networkIds",
-            "serials",
-            "iccids",
-        ]
-        params = {k.strip(): v for k, v in kwargs.items() if k.strip() in query_params}
-
-        array_params = [
-            "networkIds",
-            "serials",
-            "iccids",
-        ]
-        for k, v in kwargs.items():
-            if k.strip() in array_params:
-                params[f"{k.strip()}[]"] = kwargs[f"{k}"]
-                params.pop(k.strip())
-
-        if self._session._validate_kwargs:
-            all_params = query_params + array_params
-            invalid = [k for k in kwargs if k.strip() not in all_params and k != "self"]
-            if invalid and self._session._logger:
-                self._session._logger.warning(
-                    f"getOrganizationApplianceUplinkStatuses: ignoring unrecognized kwargs: {invalid}"
-                )
-
-        return self._session.get_pages(metadata, resource, params, total_pages, direction)
+        return dispatch.call(
+            self._session,
+            "getOrganizationApplianceUplinkStatuses",
+            organizationId,
+            total_pages=total_pages,
+            direction=direction,
+            **kwargs,
+        )
 
     def getOrganizationApplianceUplinksNatByNetwork(self, organizationId: str, total_pages=1, direction="next", **kwargs):
         """
@@ -4391,42 +1897,14 @@ class AsyncAppliance:
         - endingBefore (string): A token used by the server to indicate the end of the page. Often this is a timestamp or an ID but it is not limited to those. This parameter should not be defined by client applications. The link for the first, last, prev, or next page in the HTTP Link header should define it.
         """
 
-        kwargs.update(locals())
-
-        metadata = {
-            "tags": ["appliance", "configure", "uplinks", "nat", "byNetwork"],
-            "operation": "getOrganizationApplianceUplinksNatByNetwork",
-        }
-        organizationId = urllib.parse.quote(str(organizationId), safe="")
-        resource = f"/organizations/{organizationId}/appliance/uplinks/nat/byNetwork"
-
-        query_params = [
-            "networkIds",
-            "interfaces",
-            "perPage",
-            "startingAfter",
-            "endingBefore",
-        ]
-        params = {k.strip(): v for k, v in kwargs.items() if k.strip() in query_params}
-
-        array_params = [
-            "networkIds",
-            "interfaces",
-        ]
-        for k, v in kwargs.items():
-            if k.strip() in array_params:
-                params[f"{k.strip()}[]"] = kwargs[f"{k}"]
-                params.pop(k.strip())
-
-        if self._session._validate_kwargs:
-            all_params = query_params + array_params
-            invalid = [k for k in kwargs if k.strip() not in all_params and k != "self"]
-            if invalid and self._session._logger:
-                self._session._logger.warning(
-                    f"getOrganizationApplianceUplinksNatByNetwork: ignoring unrecognized kwargs: {invalid}"
-                )
-
-        return self._session.get_pages(metadata, resource, params, total_pages, direction)
+        return dispatch.call(
+            self._session,
+            "getOrganizationApplianceUplinksNatByNetwork",
+            organizationId,
+            total_pages=total_pages,
+            direction=direction,
+            **kwargs,
+        )
 
     def getOrganizationApplianceUplinksStatusesOverview(self, organizationId: str, **kwargs):
         """
@@ -4437,37 +1915,7 @@ class AsyncAppliance:
         - networkIds (array): A list of network IDs. The returned devices will be filtered to only include these networks.
         """
 
-        kwargs.update(locals())
-
-        metadata = {
-            "tags": ["appliance", "monitor", "uplinks", "statuses", "overview"],
-            "operation": "getOrganizationApplianceUplinksStatusesOverview",
-        }
-        organizationId = urllib.parse.quote(str(organizationId), safe="")
-        resource = f"/organizations/{organizationId}/appliance/uplinks/statuses/overview"
-
-        query_params = [
-            "networkIds",
-        ]
-        params = {k.strip(): v for k, v in kwargs.items() if k.strip() in query_params}
-
-        array_params = [
-            "networkIds",
-        ]
-        for k, v in kwargs.items():
-            if k.strip() in array_params:
-                params[f"{k.strip()}[]"] = kwargs[f"{k}"]
-                params.pop(k.strip())
-
-        if self._session._validate_kwargs:
-            all_params = query_params + array_params
-            invalid = [k for k in kwargs if k.strip() not in all_params and k != "self"]
-            if invalid and self._session._logger:
-                self._session._logger.warning(
-                    f"getOrganizationApplianceUplinksStatusesOverview: ignoring unrecognized kwargs: {invalid}"
-                )
-
-        return self._session.get(metadata, resource, params)
+        return dispatch.call(self._session, "getOrganizationApplianceUplinksStatusesOverview", organizationId, **kwargs)
 
     def getOrganizationApplianceUplinksUsageByNetwork(self, organizationId: str, **kwargs):
         """
@@ -4480,31 +1928,7 @@ class AsyncAppliance:
         - timespan (number): The timespan for which the information will be fetched. If specifying timespan, do not specify parameters t0 and t1. The value must be in seconds and be less than or equal to 14 days. The default is 1 day.
         """
 
-        kwargs.update(locals())
-
-        metadata = {
-            "tags": ["appliance", "monitor", "uplinks", "usage", "byNetwork"],
-            "operation": "getOrganizationApplianceUplinksUsageByNetwork",
-        }
-        organizationId = urllib.parse.quote(str(organizationId), safe="")
-        resource = f"/organizations/{organizationId}/appliance/uplinks/usage/byNetwork"
-
-        query_params = [
-            "t0",
-            "t1",
-            "timespan",
-        ]
-        params = {k.strip(): v for k, v in kwargs.items() if k.strip() in query_params}
-
-        if self._session._validate_kwargs:
-            all_params = query_params
-            invalid = [k for k in kwargs if k.strip() not in all_params and k != "self"]
-            if invalid and self._session._logger:
-                self._session._logger.warning(
-                    f"getOrganizationApplianceUplinksUsageByNetwork: ignoring unrecognized kwargs: {invalid}"
-                )
-
-        return self._session.get(metadata, resource, params)
+        return dispatch.call(self._session, "getOrganizationApplianceUplinksUsageByNetwork", organizationId, **kwargs)
 
     def getOrganizationApplianceVpnSiteToSiteIpsecPeersSlas(self, organizationId: str):
         """
@@ -4514,14 +1938,7 @@ class AsyncAppliance:
         - organizationId (string): Organization ID
         """
 
-        metadata = {
-            "tags": ["appliance", "configure", "vpn", "siteToSite", "ipsec", "peers", "slas"],
-            "operation": "getOrganizationApplianceVpnSiteToSiteIpsecPeersSlas",
-        }
-        organizationId = urllib.parse.quote(str(organizationId), safe="")
-        resource = f"/organizations/{organizationId}/appliance/vpn/siteToSite/ipsec/peers/slas"
-
-        return self._session.get(metadata, resource)
+        return dispatch.call(self._session, "getOrganizationApplianceVpnSiteToSiteIpsecPeersSlas", organizationId)
 
     def updateOrganizationApplianceVpnSiteToSiteIpsecPeersSlas(self, organizationId: str, **kwargs):
         """
@@ -4532,29 +1949,7 @@ class AsyncAppliance:
         - items (array): List of IPsec SLA policies
         """
 
-        kwargs.update(locals())
-
-        metadata = {
-            "tags": ["appliance", "configure", "vpn", "siteToSite", "ipsec", "peers", "slas"],
-            "operation": "updateOrganizationApplianceVpnSiteToSiteIpsecPeersSlas",
-        }
-        organizationId = urllib.parse.quote(str(organizationId), safe="")
-        resource = f"/organizations/{organizationId}/appliance/vpn/siteToSite/ipsec/peers/slas"
-
-        body_params = [
-            "items",
-        ]
-        payload = {k.strip(): v for k, v in kwargs.items() if k.strip() in body_params}
-
-        if self._session._validate_kwargs:
-            all_params = [] + body_params
-            invalid = [k for k in kwargs if k.strip() not in all_params and k != "self"]
-            if invalid and self._session._logger:
-                self._session._logger.warning(
-                    f"updateOrganizationApplianceVpnSiteToSiteIpsecPeersSlas: ignoring unrecognized kwargs: {invalid}"
-                )
-
-        return self._session.put(metadata, resource, payload)
+        return dispatch.call(self._session, "updateOrganizationApplianceVpnSiteToSiteIpsecPeersSlas", organizationId, **kwargs)
 
     def getOrganizationApplianceVpnStats(self, organizationId: str, total_pages=1, direction="next", **kwargs):
         """
@@ -4573,41 +1968,14 @@ class AsyncAppliance:
         - timespan (number): The timespan for which the information will be fetched. If specifying timespan, do not specify parameters t0 and t1. The value must be in seconds and be less than or equal to 31 days. The default is 1 day.
         """
 
-        kwargs.update(locals())
-
-        metadata = {
-            "tags": ["appliance", "monitor", "vpn", "stats"],
-            "operation": "getOrganizationApplianceVpnStats",
-        }
-        organizationId = urllib.parse.quote(str(organizationId), safe="")
-        resource = f"/organizations/{organizationId}/appliance/vpn/stats"
-
-        query_params = [
-            "perPage",
-            "startingAfter",
-            "endingBefore",
-            "networkIds",
-            "t0",
-            "t1",
-            "timespan",
-        ]
-        params = {k.strip(): v for k, v in kwargs.items() if k.strip() in query_params}
-
-        array_params = [
-            "networkIds",
-        ]
-        for k, v in kwargs.items():
-            if k.strip() in array_params:
-                params[f"{k.strip()}[]"] = kwargs[f"{k}"]
-                params.pop(k.strip())
-
-        if self._session._validate_kwargs:
-            all_params = query_params + array_params
-            invalid = [k for k in kwargs if k.strip() not in all_params and k != "self"]
-            if invalid and self._session._logger:
-                self._session._logger.warning(f"getOrganizationApplianceVpnStats: ignoring unrecognized kwargs: {invalid}")
-
-        return self._session.get_pages(metadata, resource, params, total_pages, direction)
+        return dispatch.call(
+            self._session,
+            "getOrganizationApplianceVpnStats",
+            organizationId,
+            total_pages=total_pages,
+            direction=direction,
+            **kwargs,
+        )
 
     def getOrganizationApplianceVpnStatuses(self, organizationId: str, total_pages=1, direction="next", **kwargs):
         """
@@ -4623,38 +1991,14 @@ class AsyncAppliance:
         - networkIds (array): A list of Meraki network IDs to filter results to contain only specified networks. E.g.: networkIds[]=N_12345678&networkIds[]=L_3456
         """
 
-        kwargs.update(locals())
-
-        metadata = {
-            "tags": ["appliance", "monitor", "vpn", "statuses"],
-            "operation": "getOrganizationApplianceVpnStatuses",
-        }
-        organizationId = urllib.parse.quote(str(organizationId), safe="")
-        resource = f"/organizations/{organizationId}/appliance/vpn/statuses"
-
-        query_params = [
-            "perPage",
-            "startingAfter",
-            "endingBefore",
-            "networkIds",
-        ]
-        params = {k.strip(): v for k, v in kwargs.items() if k.strip() in query_params}
-
-        array_params = [
-            "networkIds",
-        ]
-        for k, v in kwargs.items():
-            if k.strip() in array_params:
-                params[f"{k.strip()}[]"] = kwargs[f"{k}"]
-                params.pop(k.strip())
-
-        if self._session._validate_kwargs:
-            all_params = query_params + array_params
-            invalid = [k for k in kwargs if k.strip() not in all_params and k != "self"]
-            if invalid and self._session._logger:
-                self._session._logger.warning(f"getOrganizationApplianceVpnStatuses: ignoring unrecognized kwargs: {invalid}")
-
-        return self._session.get_pages(metadata, resource, params, total_pages, direction)
+        return dispatch.call(
+            self._session,
+            "getOrganizationApplianceVpnStatuses",
+            organizationId,
+            total_pages=total_pages,
+            direction=direction,
+            **kwargs,
+        )
 
     def getOrganizationApplianceVpnThirdPartyVPNPeers(self, organizationId: str):
         """
@@ -4664,14 +2008,7 @@ class AsyncAppliance:
         - organizationId (string): Organization ID
         """
 
-        metadata = {
-            "tags": ["appliance", "configure", "vpn", "thirdPartyVPNPeers"],
-            "operation": "getOrganizationApplianceVpnThirdPartyVPNPeers",
-        }
-        organizationId = urllib.parse.quote(str(organizationId), safe="")
-        resource = f"/organizations/{organizationId}/appliance/vpn/thirdPartyVPNPeers"
-
-        return self._session.get(metadata, resource)
+        return dispatch.call(self._session, "getOrganizationApplianceVpnThirdPartyVPNPeers", organizationId)
 
     def updateOrganizationApplianceVpnThirdPartyVPNPeers(self, organizationId: str, peers: list, **kwargs):
         """
@@ -4682,29 +2019,9 @@ class AsyncAppliance:
         - peers (array): The list of VPN peers
         """
 
-        kwargs = locals()
-
-        metadata = {
-            "tags": ["appliance", "configure", "vpn", "thirdPartyVPNPeers"],
-            "operation": "updateOrganizationApplianceVpnThirdPartyVPNPeers",
-        }
-        organizationId = urllib.parse.quote(str(organizationId), safe="")
-        resource = f"/organizations/{organizationId}/appliance/vpn/thirdPartyVPNPeers"
-
-        body_params = [
-            "peers",
-        ]
-        payload = {k.strip(): v for k, v in kwargs.items() if k.strip() in body_params}
-
-        if self._session._validate_kwargs:
-            all_params = [] + body_params
-            invalid = [k for k in kwargs if k.strip() not in all_params and k != "self"]
-            if invalid and self._session._logger:
-                self._session._logger.warning(
-                    f"updateOrganizationApplianceVpnThirdPartyVPNPeers: ignoring unrecognized kwargs: {invalid}"
-                )
-
-        return self._session.put(metadata, resource, payload)
+        return dispatch.call(
+            self._session, "updateOrganizationApplianceVpnThirdPartyVPNPeers", organizationId, peers, **kwargs
+        )
 
     def getOrganizationApplianceVpnVpnFirewallRules(self, organizationId: str):
         """
@@ -4714,14 +2031,7 @@ class AsyncAppliance:
         - organizationId (string): Organization ID
         """
 
-        metadata = {
-            "tags": ["appliance", "configure", "vpn", "vpnFirewallRules"],
-            "operation": "getOrganizationApplianceVpnVpnFirewallRules",
-        }
-        organizationId = urllib.parse.quote(str(organizationId), safe="")
-        resource = f"/organizations/{organizationId}/appliance/vpn/vpnFirewallRules"
-
-        return self._session.get(metadata, resource)
+        return dispatch.call(self._session, "getOrganizationApplianceVpnVpnFirewallRules", organizationId)
 
     def updateOrganizationApplianceVpnVpnFirewallRules(self, organizationId: str, **kwargs):
         """
@@ -4733,30 +2043,7 @@ class AsyncAppliance:
         - syslogDefaultRule (boolean): Log the special default rule (boolean value - enable only if you've configured a syslog server) (optional)
         """
 
-        kwargs.update(locals())
-
-        metadata = {
-            "tags": ["appliance", "configure", "vpn", "vpnFirewallRules"],
-            "operation": "updateOrganizationApplianceVpnVpnFirewallRules",
-        }
-        organizationId = urllib.parse.quote(str(organizationId), safe="")
-        resource = f"/organizations/{organizationId}/appliance/vpn/vpnFirewallRules"
-
-        body_params = [
-            "rules",
-            "syslogDefaultRule",
-        ]
-        payload = {k.strip(): v for k, v in kwargs.items() if k.strip() in body_params}
-
-        if self._session._validate_kwargs:
-            all_params = [] + body_params
-            invalid = [k for k in kwargs if k.strip() not in all_params and k != "self"]
-            if invalid and self._session._logger:
-                self._session._logger.warning(
-                    f"updateOrganizationApplianceVpnVpnFirewallRules: ignoring unrecognized kwargs: {invalid}"
-                )
-
-        return self._session.put(metadata, resource, payload)
+        return dispatch.call(self._session, "updateOrganizationApplianceVpnVpnFirewallRules", organizationId, **kwargs)
 
     def assignOrganizationPoliciesGlobalGroupPoliciesApplianceVlans(
         self, organizationId: str, policy: dict, vlans: list, **kwargs
@@ -4770,30 +2057,14 @@ class AsyncAppliance:
         - vlans (array): VLANs to assign
         """
 
-        kwargs = locals()
-
-        metadata = {
-            "tags": ["appliance", "configure", "policies", "global", "group", "vlans"],
-            "operation": "assignOrganizationPoliciesGlobalGroupPoliciesApplianceVlans",
-        }
-        organizationId = urllib.parse.quote(str(organizationId), safe="")
-        resource = f"/organizations/{organizationId}/policies/global/group/policies/appliance/vlans/assign"
-
-        body_params = [
-            "policy",
-            "vlans",
-        ]
-        payload = {k.strip(): v for k, v in kwargs.items() if k.strip() in body_params}
-
-        if self._session._validate_kwargs:
-            all_params = [] + body_params
-            invalid = [k for k in kwargs if k.strip() not in all_params and k != "self"]
-            if invalid and self._session._logger:
-                self._session._logger.warning(
-                    f"assignOrganizationPoliciesGlobalGroupPoliciesApplianceVlans: ignoring unrecognized kwargs: {invalid}"
-                )
-
-        return self._session.post(metadata, resource, payload)
+        return dispatch.call(
+            self._session,
+            "assignOrganizationPoliciesGlobalGroupPoliciesApplianceVlans",
+            organizationId,
+            policy,
+            vlans,
+            **kwargs,
+        )
 
     def getOrganizationPoliciesGlobalGroupPoliciesApplianceVlansAssignments(
         self, organizationId: str, total_pages=1, direction="next", **kwargs
@@ -4813,44 +2084,14 @@ class AsyncAppliance:
         - endingBefore (string): A token used by the server to indicate the end of the page. Often this is a timestamp or an ID but it is not limited to those. This parameter should not be defined by client applications. The link for the first, last, prev, or next page in the HTTP Link header should define it.
         """
 
-        kwargs.update(locals())
-
-        metadata = {
-            "tags": ["appliance", "configure", "policies", "global", "group", "vlans", "assignments"],
-            "operation": "getOrganizationPoliciesGlobalGroupPoliciesApplianceVlansAssignments",
-        }
-        organizationId = urllib.parse.quote(str(organizationId), safe="")
-        resource = f"/organizations/{organizationId}/policies/global/group/policies/appliance/vlans/assignments"
-
-        query_params = [
-            "assignmentIds",
-            "policyIds",
-            "interfaceIds",
-            "perPage",
-            "startingAfter",
-            "endingBefore",
-        ]
-        params = {k.strip(): v for k, v in kwargs.items() if k.strip() in query_params}
-
-        array_params = [
-            "assignmentIds",
-            "policyIds",
-            "interfaceIds",
-        ]
-        for k, v in kwargs.items():
-            if k.strip() in array_params:
-                params[f"{k.strip()}[]"] = kwargs[f"{k}"]
-                params.pop(k.strip())
-
-        if self._session._validate_kwargs:
-            all_params = query_params + array_params
-            invalid = [k for k in kwargs if k.strip() not in all_params and k != "self"]
-            if invalid and self._session._logger:
-                self._session._logger.warning(
-                    f"getOrganizationPoliciesGlobalGroupPoliciesApplianceVlansAssignments: ignoring unrecognized kwargs: {invalid}"
-                )
-
-        return self._session.get_pages(metadata, resource, params, total_pages, direction)
+        return dispatch.call(
+            self._session,
+            "getOrganizationPoliciesGlobalGroupPoliciesApplianceVlansAssignments",
+            organizationId,
+            total_pages=total_pages,
+            direction=direction,
+            **kwargs,
+        )
 
     def getOrganizationPoliciesGlobalGroupPoliciesApplianceVlansAssignmentsByVlan(
         self, organizationId: str, total_pages=1, direction="next", **kwargs
@@ -4870,43 +2111,14 @@ class AsyncAppliance:
         - endingBefore (string): A token used by the server to indicate the end of the page. Often this is a timestamp or an ID but it is not limited to those. This parameter should not be defined by client applications. The link for the first, last, prev, or next page in the HTTP Link header should define it.
         """
 
-        kwargs.update(locals())
-
-        metadata = {
-            "tags": ["appliance", "configure", "policies", "global", "group", "vlans", "assignments", "byVlan"],
-            "operation": "getOrganizationPoliciesGlobalGroupPoliciesApplianceVlansAssignmentsByVlan",
-        }
-        organizationId = urllib.parse.quote(str(organizationId), safe="")
-        resource = f"/organizations/{organizationId}/policies/global/group/policies/appliance/vlans/assignments/byVlan"
-
-        query_params = [
-            "search",
-            "vlanIds",
-            "interfaceIds",
-            "perPage",
-            "startingAfter",
-            "endingBefore",
-        ]
-        params = {k.strip(): v for k, v in kwargs.items() if k.strip() in query_params}
-
-        array_params = [
-            "vlanIds",
-            "interfaceIds",
-        ]
-        for k, v in kwargs.items():
-            if k.strip() in array_params:
-                params[f"{k.strip()}[]"] = kwargs[f"{k}"]
-                params.pop(k.strip())
-
-        if self._session._validate_kwargs:
-            all_params = query_params + array_params
-            invalid = [k for k in kwargs if k.strip() not in all_params and k != "self"]
-            if invalid and self._session._logger:
-                self._session._logger.warning(
-                    f"getOrganizationPoliciesGlobalGroupPoliciesApplianceVlansAssignmentsByVlan: ignoring unrecognized kwargs: {invalid}"
-                )
-
-        return self._session.get_pages(metadata, resource, params, total_pages, direction)
+        return dispatch.call(
+            self._session,
+            "getOrganizationPoliciesGlobalGroupPoliciesApplianceVlansAssignmentsByVlan",
+            organizationId,
+            total_pages=total_pages,
+            direction=direction,
+            **kwargs,
+        )
 
     def removeOrganizationPoliciesGlobalGroupPoliciesApplianceVlans(
         self, organizationId: str, policy: dict, vlans: list, **kwargs
@@ -4920,27 +2132,11 @@ class AsyncAppliance:
         - vlans (array): VLANs to remove
         """
 
-        kwargs = locals()
-
-        metadata = {
-            "tags": ["appliance", "configure", "policies", "global", "group", "vlans"],
-            "operation": "removeOrganizationPoliciesGlobalGroupPoliciesApplianceVlans",
-        }
-        organizationId = urllib.parse.quote(str(organizationId), safe="")
-        resource = f"/organizations/{organizationId}/policies/global/group/policies/appliance/vlans/remove"
-
-        body_params = [
-            "policy",
-            "vlans",
-        ]
-        payload = {k.strip(): v for k, v in kwargs.items() if k.strip() in body_params}
-
-        if self._session._validate_kwargs:
-            all_params = [] + body_params
-            invalid = [k for k in kwargs if k.strip() not in all_params and k != "self"]
-            if invalid and self._session._logger:
-                self._session._logger.warning(
-                    f"removeOrganizationPoliciesGlobalGroupPoliciesApplianceVlans: ignoring unrecognized kwargs: {invalid}"
-                )
-
-        return self._session.post(metadata, resource, payload)
+        return dispatch.call(
+            self._session,
+            "removeOrganizationPoliciesGlobalGroupPoliciesApplianceVlans",
+            organizationId,
+            policy,
+            vlans,
+            **kwargs,
+        )
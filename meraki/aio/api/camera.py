@@ -1,4 +1,4 @@
-import urllib
+from meraki import dispatch
 
 
 class AsyncCamera:
@@ -14,14 +14,7 @@ class AsyncCamera:
         - serial (string): Serial
         """
 
-        metadata = {
-            "tags": ["camera", "monitor", "analytics", "live"],
-            "operation": "getDeviceCameraAnalyticsLive",
-        }
-        serial = urllib.parse.quote(str(serial), safe="")
-        resource = f"/devices/{serial}/camera/analytics/live"
-
-        return self._session.get(metadata, resource)
+        return dispatch.call(self._session, "getDeviceCameraAnalyticsLive", serial)
 
     def getDeviceCameraAnalyticsOverview(self, serial: str, **kwargs):
         """
@@ -35,36 +28,7 @@ class AsyncCamera:
         - objectType (string): [optional] The object type for which analytics will be retrieved. The default object type is person. The available types are [person, vehicle].
         """
 
-        kwargs.update(locals())
-
-        if "objectType" in kwargs:
-            options = ["person", "vehicle"]
-            assert kwargs["objectType"] in options, (
-                f'''"objectType" cannot be "{kwargs["objectType"]}", & must be set to one of: {options}'''
-            )
-
-        metadata = {
-            "tags": ["camera", "monitor", "analytics", "overview"],
-            "operation": "getDeviceCameraAnalyticsOverview",
-        }
-        serial = urllib.parse.quote(str(serial), safe="")
-        resource = f"/devices/{serial}/camera/analytics/overview"
-
-        query_params = [
-            "t0",
-            "t1",
-            "timespan",
-            "objectType",
-        ]
-        params = {k.strip(): v for k, v in kwargs.items() if k.strip() in query_params}
-
-        if self._session._validate_kwargs:
-            all_params = query_params
-            invalid = [k for k in kwargs if k.strip() not in all_params and k != "self"]
-            if invalid and self._session._logger:
-                self._session._logger.warning(f"getDeviceCameraAnalyticsOverview: ignoring unrecognized kwargs: {invalid}")
-
-        return self._session.get(metadata, resource, params)
+        return dispatch.call(self._session, "getDeviceCameraAnalyticsOverview", serial, **kwargs)
 
     def getDeviceCameraAnalyticsRecent(self, serial: str, **kwargs):
         """
@@ -75,33 +39,7 @@ class AsyncCamera:
         - objectType (string): [optional] The object type for which analytics will be retrieved. The default object type is person. The available types are [person, vehicle].
         """
 
-        kwargs.update(locals())
-
-        if "objectType" in kwargs:
-            options = ["person", "vehicle"]
-            assert kwargs["objectType"] in options, (
-                f'''"objectType" cannot be "{kwargs["objectType"]}", & must be set to one of: {options}'''
-            )
-
-        metadata = {
-            "tags": ["camera", "monitor", "analytics", "recent"],
-            "operation": "getDeviceCameraAnalyticsRecent",
-        }
-        serial = urllib.parse.quote(str(serial), safe="")
-        resource = f"/devices/{serial}/camera/analytics/recent"
-
-        query_params = [
-            "objectType",
-        ]
-        params = {k.strip(): v for k, v in kwargs.items() if k.strip() in query_params}
-
-        if self._session._validate_kwargs:
-            all_params = query_params
-            invalid = [k for k in kwargs if k.strip() not in all_params and k != "self"]
-            if invalid and self._session._logger:
-                self._session._logger.warning(f"getDeviceCameraAnalyticsRecent: ignoring unrecognized kwargs: {invalid}")
-
-        return self._session.get(metadata, resource, params)
+        return dispatch.call(self._session, "getDeviceCameraAnalyticsRecent", serial, **kwargs)
 
     def getDeviceCameraAnalyticsZones(self, serial: str):
         """
@@ -111,14 +49,7 @@ class AsyncCamera:
         - serial (string): Serial
         """
 
-        metadata = {
-            "tags": ["camera", "monitor", "analytics", "zones"],
-            "operation": "getDeviceCameraAnalyticsZones",
-        }
-        serial = urllib.parse.quote(str(serial), safe="")
-        resource = f"/devices/{serial}/camera/analytics/zones"
-
-        return self._session.get(metadata, resource)
+        return dispatch.call(self._session, "getDeviceCameraAnalyticsZones", serial)
 
     def getDeviceCameraAnalyticsZoneHistory(self, serial: str, zoneId: str, **kwargs):
         """
@@ -134,38 +65,7 @@ class AsyncCamera:
         - objectType (string): [optional] The object type for which analytics will be retrieved. The default object type is person. The available types are [person, vehicle].
         """
 
-        kwargs.update(locals())
-
-        if "objectType" in kwargs:
-            options = ["person", "vehicle"]
-            assert kwargs["objectType"] in options, (
-                f'''"objectType" cannot be "{kwargs["objectType"]}", & must be set to one of: {options}'''
-            )
-
-        metadata = {
-            "tags": ["camera", "monitor", "analytics", "zones", "history"],
-            "operation": "getDeviceCameraAnalyticsZoneHistory",
-        }
-        serial = urllib.parse.quote(str(serial), safe="")
-        zoneId = urllib.parse.quote(str(zoneId), safe="")
-        resource = f"/devices/{serial}/camera/analytics/zones/{zoneId}/history"
-
-        query_params = [
-            "t0",
-            "t1",
-            "timespan",
-            "resolution",
-            "objectType",
-        ]
-        params = {k.strip(): v for k, v in kwargs.items() if k.strip() in query_params}
-
-        if self._session._validate_kwargs:
-            all_params = query_params
-            invalid = [k for k in kwargs if k.strip() not in all_params and k != "self"]
-            if invalid and self._session._logger:
-                self._session._logger.warning(f"getDeviceCameraAnalyticsZoneHistory: ignoring unrecognized kwargs: {invalid}")
-
-        return self._session.get(metadata, resource, params)
+        return dispatch.call(self._session, "getDeviceCameraAnalyticsZoneHistory", serial, zoneId, **kwargs)
 
     def clipDeviceCamera(self, serial: str, startTimestamp: str, endTimestamp: str, **kwargs):
         """
@@ -178,29 +78,7 @@ class AsyncCamera:
         - imagerId (integer): The imager ID to query. Required for multi-imager cameras (must be between 1 and the imager count). For single-imager cameras, must be omitted or set to 0.
         """
 
-        kwargs.update(locals())
-
-        metadata = {
-            "tags": ["camera", "monitor"],
-            "operation": "clipDeviceCamera",
-        }
-        serial = urllib.parse.quote(str(serial), safe="")
-        resource = f"/devices/{serial}/camera/clip"
-
-        query_params = [
-            "startTimestamp",
-            "endTimestamp",
-            "imagerId",
-        ]
-        params = {k.strip(): v for k, v in kwargs.items() if k.strip() in query_params}
-
-        if self._session._validate_kwargs:
-            all_params = query_params
-            invalid = [k for k in kwargs if k.strip() not in all_params and k != "self"]
-            if invalid and self._session._logger:
-                self._session._logger.warning(f"clipDeviceCamera: ignoring unrecognized kwargs: {invalid}")
-
-        return self._session.get(metadata, resource, params)
+        return dispatch.call(self._session, "clipDeviceCamera", serial, startTimestamp, endTimestamp, **kwargs)
 
     def getDeviceCameraCustomAnalytics(self, serial: str):
         """
@@ -210,14 +88,7 @@ class AsyncCamera:
         - serial (string): Serial
         """
 
-        metadata = {
-            "tags": ["camera", "configure", "customAnalytics"],
-            "operation": "getDeviceCameraCustomAnalytics",
-        }
-        serial = urllib.parse.quote(str(serial), safe="")
-        resource = f"/devices/{serial}/camera/customAnalytics"
-
-        return self._session.get(metadata, resource)
+        return dispatch.call(self._session, "getDeviceCameraCustomAnalytics", serial)
 
     def updateDeviceCameraCustomAnalytics(self, serial: str, **kwargs):
         """
@@ -230,29 +101,7 @@ class AsyncCamera:
         - parameters (array): Parameters for the custom analytics workload
         """
 
-        kwargs.update(locals())
-
-        metadata = {
-            "tags": ["camera", "configure", "customAnalytics"],
-            "operation": "updateDeviceCameraCustomAnalytics",
-        }
-        serial = urllib.parse.quote(str(serial), safe="")
-        resource = f"/devices/{serial}/camera/customAnalytics"
-
-        body_params = [
-            "enabled",
-            "artifactId",
-            "parameters",
-        ]
-        payload = {k.strip(): v for k, v in kwargs.items() if k.strip() in body_params}
-
-        if self._session._validate_kwargs:
-            all_params = [] + body_params
-            invalid = [k for k in kwargs if k.strip() not in all_params and k != "self"]
-            if invalid and self._session._logger:
-                self._session._logger.warning(f"updateDeviceCameraCustomAnalytics: ignoring unrecognized kwargs: {invalid}")
-
-        return self._session.put(metadata, resource, payload)
+        return dispatch.call(self._session, "updateDeviceCameraCustomAnalytics", serial, **kwargs)
 
     def generateDeviceCameraSnapshot(self, serial: str, **kwargs):
         """
@@ -264,28 +113,7 @@ class AsyncCamera:
         - fullframe (boolean): [optional] If set to "true" the snapshot will be taken at full sensor resolution. This will error if used with timestamp.
         """
 
-        kwargs.update(locals())
-
-        metadata = {
-            "tags": ["camera", "monitor"],
-            "operation": "generateDeviceCameraSnapshot",
-        }
-        serial = urllib.parse.quote(str(serial), safe="")
-        resource = f"/devices/{serial}/camera/generateSnapshot"
-
-        body_params = [
-            "timestamp",
-            "fullframe",
-        ]
-        payload = {k.strip(): v for k, v in kwargs.items() if k.strip() in body_params}
-
-        if self._session._validate_kwargs:
-            all_params = [] + body_params
-            invalid = [k for k in kwargs if k.strip() not in all_params and k != "self"]
-            if invalid and self._session._logger:
-                self._session._logger.warning(f"generateDeviceCameraSnapshot: ignoring unrecognized kwargs: {invalid}")
-
-        return self._session.post(metadata, resource, payload)
+        return dispatch.call(self._session, "generateDeviceCameraSnapshot", serial, **kwargs)
 
     def getDeviceCameraQualityAndRetention(self, serial: str):
         """
@@ -295,14 +123,7 @@ class AsyncCamera:
         - serial (string): Serial
         """
 
-        metadata = {
-            "tags": ["camera", "configure", "qualityAndRetention"],
-            "operation": "getDeviceCameraQualityAndRetention",
-        }
-        serial = urllib.parse.quote(str(serial), safe="")
-        resource = f"/devices/{serial}/camera/qualityAndRetention"
-
-        return self._session.get(metadata, resource)
+        return dispatch.call(self._session, "getDeviceCameraQualityAndRetention", serial)
 
     def updateDeviceCameraQualityAndRetention(self, serial: str, **kwargs):
         """
@@ -319,51 +140,7 @@ class AsyncCamera:
         - motionDetectorVersion (integer): The version of the motion detector that will be used by the camera. Only applies to Gen 2 cameras. Defaults to v2.
         """
 
-        kwargs.update(locals())
-
-        if "quality" in kwargs:
-            options = ["Enhanced", "High", "Standard", "Ultra"]
-            assert kwargs["quality"] in options, (
-                f'''"quality" cannot be "{kwargs["quality"]}", & must be set to one of: {options}'''
-            )
-        if "resolution" in kwargs:
-            options = ["1080x1080", "1280x720", "1920x1080", "2112x2112", "2688x1512", "2880x2880", "3840x2160"]
-            assert kwargs["resolution"] in options, (
-                f'''"resolution" cannot be "{kwargs["resolution"]}", & must be set to one of: {options}'''
-            )
-        if "motionDetectorVersion" in kwargs:
-            options = [1, 2]
-            assert kwargs["motionDetectorVersion"] in options, (
-                f'''"motionDetectorVersion" cannot be "{kwargs["motionDetectorVersion"]}", & must be set to one of: {options}'''
-            )
-
-        metadata = {
-            "tags": ["camera", "configure", "qualityAndRetention"],
-            "operation": "updateDeviceCameraQualityAndRetention",
-        }
-        serial = urllib.parse.quote(str(serial), safe="")
-        resource = f"/devices/{serial}/camera/qualityAndRetention"
-
-        body_params = [
-            "profileId",
-            "motionBasedRetentionEnabled",
-            "audioRecordingEnabled",
-            "restrictedBandwidthModeEnabled",
-            "quality",
-            "resolution",
-            "motionDetectorVersion",
-        ]
-        payload = {k.strip(): v for k, v in kwargs.items() if k.strip() in body_params}
-
-        if self._session._validate_kwargs:
-            all_params = [] + body_params
-            invalid = [k for k in kwargs if k.strip() not in all_params and k != "self"]
-            if invalid and self._session._logger:
-                self._session._logger.warning(
-                    f"updateDeviceCameraQualityAndRetention: ignoring unrecognized kwargs: {invalid}"
-                )
-
-        return self._session.put(metadata, resource, payload)
+        return dispatch.call(self._session, "updateDeviceCameraQualityAndRetention", serial, **kwargs)
 
     def getDeviceCameraSense(self, serial: str):
         """
@@ -373,14 +150,7 @@ class AsyncCamera:
         - serial (string): Serial
         """
 
-        metadata = {
-            "tags": ["camera", "configure", "sense"],
-            "operation": "getDeviceCameraSense",
-        }
-        serial = urllib.parse.quote(str(serial), safe="")
-        resource = f"/devices/{serial}/camera/sense"
-
-        return self._session.get(metadata, resource)
+        return dispatch.call(self._session, "getDeviceCameraSense", serial)
 
     def updateDeviceCameraSense(self, serial: str, **kwargs):
         """
@@ -394,30 +164,7 @@ class AsyncCamera:
         - detectionModelId (string): The ID of the object detection model
         """
 
-        kwargs.update(locals())
-
-        metadata = {
-            "tags": ["camera", "configure", "sense"],
-            "operation": "updateDeviceCameraSense",
-        }
-        serial = urllib.parse.quote(str(serial), safe="")
-        resource = f"/devices/{serial}/camera/sense"
-
-        body_params = [
-            "senseEnabled",
-            "mqttBrokerId",
-            "audioDetection",
-            "detectionModelId",
-        ]
-        payload = {k.strip(): v for k, v in kwargs.items() if k.strip() in body_params}
-
-        if self._session._validate_kwargs:
-            all_params = [] + body_params
-            invalid = [k for k in kwargs if k.strip() not in all_params and k != "self"]
-            if invalid and self._session._logger:
-                self._session._logger.warning(f"updateDeviceCameraSense: ignoring unrecognized kwargs: {invalid}")
-
-        return self._session.put(metadata, resource, payload)
+        return dispatch.call(self._session, "updateDeviceCameraSense", serial, **kwargs)
 
     def getDeviceCameraSenseObjectDetectionModels(self, serial: str):
         """
@@ -427,14 +174,7 @@ class AsyncCamera:
         - serial (string): Serial
         """
 
-        metadata = {
-            "tags": ["camera", "configure", "sense", "objectDetectionModels"],
-            "operation": "getDeviceCameraSenseObjectDetectionModels",
-        }
-        serial = urllib.parse.quote(str(serial), safe="")
-        resource = f"/devices/{serial}/camera/sense/objectDetectionModels"
-
-        return self._session.get(metadata, resource)
+        return dispatch.call(self._session, "getDeviceCameraSenseObjectDetectionModels", serial)
 
     def getDeviceCameraVideoSettings(self, serial: str):
         """
@@ -444,14 +184,7 @@ class AsyncCamera:
         - serial (string): Serial
         """
 
-        metadata = {
-            "tags": ["camera", "configure", "video", "settings"],
-            "operation": "getDeviceCameraVideoSettings",
-        }
-        serial = urllib.parse.quote(str(serial), safe="")
-        resource = f"/devices/{serial}/camera/video/settings"
-
-        return self._session.get(metadata, resource)
+        return dispatch.call(self._session, "getDeviceCameraVideoSettings", serial)
 
     def updateDeviceCameraVideoSettings(self, serial: str, **kwargs):
         """
@@ -462,27 +195,7 @@ class AsyncCamera:
         - externalRtspEnabled (boolean): Boolean indicating if external rtsp stream is exposed
         """
 
-        kwargs.update(locals())
-
-        metadata = {
-            "tags": ["camera", "configure", "video", "settings"],
-            "operation": "updateDeviceCameraVideoSettings",
-        }
-        serial = urllib.parse.quote(str(serial), safe="")
-        resource = f"/devices/{serial}/camera/video/settings"
-
-        body_params = [
-            "externalRtspEnabled",
-        ]
-        payload = {k.strip(): v for k, v in kwargs.items() if k.strip() in body_params}
-
-        if self._session._validate_kwargs:
-            all_params = [] + body_params
-            invalid = [k for k in kwargs if k.strip() not in all_params and k != "self"]
-            if invalid and self._session._logger:
-                self._session._logger.warning(f"updateDeviceCameraVideoSettings: ignoring unrecognized kwargs: {invalid}")
-
-        return self._session.put(metadata, resource, payload)
+        return dispatch.call(self._session, "updateDeviceCameraVideoSettings", serial, **kwargs)
 
     def getDeviceCameraVideoLink(self, serial: str, **kwargs):
         """
@@ -493,27 +206,7 @@ class AsyncCamera:
         - timestamp (string): [optional] The video link will start at this time. The timestamp should be a string in ISO8601 format. If no timestamp is specified, we will assume current time.
         """
 
-        kwargs.update(locals())
-
-        metadata = {
-            "tags": ["camera", "configure", "videoLink"],
-            "operation": "getDeviceCameraVideoLink",
-        }
-        serial = urllib.parse.quote(str(serial), safe="")
-        resource = f"/devices/{serial}/camera/videoLink"
-
-        query_params = [
-            "timestamp",
-        ]
-        params = {k.strip(): v for k, v in kwargs.items() if k.strip() in query_params}
-
-        if self._session._validate_kwargs:
-            all_params = query_params
-            invalid = [k for k in kwargs if k.strip() not in all_params and k != "self"]
-            if invalid and self._session._logger:
-                self._session._logger.warning(f"getDeviceCameraVideoLink: ignoring unrecognized kwargs: {invalid}")
-
-        return self._session.get(metadata, resource, params)
+        return dispatch.call(self._session, "getDeviceCameraVideoLink", serial, **kwargs)
 
     def getDeviceCameraWirelessProfiles(self, serial: str):
         """
@@ -523,14 +216,7 @@ class AsyncCamera:
         - serial (string): Serial
         """
 
-        metadata = {
-            "tags": ["camera", "configure", "wirelessProfiles"],
-            "operation": "getDeviceCameraWirelessProfiles",
-        }
-        serial = urllib.parse.quote(str(serial), safe="")
-        resource = f"/devices/{serial}/camera/wirelessProfiles"
-
-        return self._session.get(metadata, resource)
+        return dispatch.call(self._session, "getDeviceCameraWirelessProfiles", serial)
 
     def updateDeviceCameraWirelessProfiles(self, serial: str, ids: dict, **kwargs):
         """
@@ -541,27 +227,7 @@ class AsyncCamera:
         - ids (object): The ids of the wireless profile to assign to the given camera
         """
 
-        kwargs = locals()
-
-        metadata = {
-            "tags": ["camera", "configure", "wirelessProfiles"],
-            "operation": "updateDeviceCameraWirelessProfiles",
-        }
-        serial = urllib.parse.quote(str(serial), safe="")
-        resource = f"/devices/{serial}/camera/wirelessProfiles"
-
-        body_params = [
-            "ids",
-        ]
-        payload = {k.strip(): v for k, v in kwargs.items() if k.strip() in body_params}
-
-        if self._session._validate_kwargs:
-            all_params = [] + body_params
-            invalid = [k for k in kwargs if k.strip() not in all_params and k != "self"]
-            if invalid and self._session._logger:
-                self._session._logger.warning(f"updateDeviceCameraWirelessProfiles: ignoring unrecognized kwargs: {invalid}")
-
-        return self._session.put(metadata, resource, payload)
+        return dispatch.call(self._session, "updateDeviceCameraWirelessProfiles", serial, ids, **kwargs)
 
     def getNetworkCameraQualityRetentionProfiles(self, networkId: str):
         """
@@ -571,14 +237,7 @@ class AsyncCamera:
         - networkId (string): Network ID
         """
 
-        metadata = {
-            "tags": ["camera", "configure", "qualityRetentionProfiles"],
-            "operation": "getNetworkCameraQualityRetentionProfiles",
-        }
-        networkId = urllib.parse.quote(str(networkId), safe="")
-        resource = f"/networks/{networkId}/camera/qualityRetentionProfiles"
-
-        return self._session.get(metadata, resource)
+        return dispatch.call(self._session, "getNetworkCameraQualityRetentionProfiles", networkId)
 
     def createNetworkCameraQualityRetentionProfile(self, networkId: str, name: str, **kwargs):
         """
@@ -598,38 +257,7 @@ class AsyncCamera:
         - videoSettings (object): Video quality and resolution settings for all the camera models.
         """
 
-        kwargs.update(locals())
-
-        metadata = {
-            "tags": ["camera", "configure", "qualityRetentionProfiles"],
-            "operation": "createNetworkCameraQualityRetentionProfile",
-        }
-        networkId = urllib.parse.quote(str(networkId), safe="")
-        resource = f"/networks/{networkId}/camera/qualityRetentionProfiles"
-
-        body_params = [
-            "name",
-            "motionBasedRetentionEnabled",
-            "restrictedBandwidthModeEnabled",
-            "audioRecordingEnabled",
-            "cloudArchiveEnabled",
-            "motionDetectorVersion",
-            "smartRetention",
-            "scheduleId",
-            "maxRetentionDays",
-            "videoSettings",
-        ]
-        payload = {k.strip(): v for k, v in kwargs.items() if k.strip() in body_params}
-
-        if self._session._validate_kwargs:
-            all_params = [] + body_params
-            invalid = [k for k in kwargs if k.strip() not in all_params and k != "self"]
-            if invalid and self._session._logger:
-                self._session._logger.warning(
-                    f"createNetworkCameraQualityRetentionProfile: ignoring unrecognized kwargs: {invalid}"
-                )
-
-        return self._session.post(metadata, resource, payload)
+        return dispatch.call(self._session, "createNetworkCameraQualityRetentionProfile", networkId, name, **kwargs)
 
     def getNetworkCameraQualityRetentionProfile(self, networkId: str, qualityRetentionProfileId: str):
         """
@@ -640,15 +268,7 @@ class AsyncCamera:
         - qualityRetentionProfileId (string): Quality retention profile ID
         """
 
-        metadata = {
-            "tags": ["camera", "configure", "qualityRetentionProfiles"],
-            "operation": "getNetworkCameraQualityRetentionProfile",
-        }
-        networkId = urllib.parse.quote(str(networkId), safe="")
-        qualityRetentionProfileId = urllib.parse.quote(str(qualityRetentionProfileId), safe="")
-        resource = f"/networks/{networkId}/camera/qualityRetentionProfiles/{qualityRetentionProfileId}"
-
-        return self._session.get(metadata, resource)
+        return dispatch.call(self._session, "getNetworkCameraQualityRetentionProfile", networkId, qualityRetentionProfileId)
 
     def updateNetworkCameraQualityRetentionProfile(self, networkId: str, qualityRetentionProfileId: str, **kwargs):
         """
@@ -669,39 +289,9 @@ class AsyncCamera:
         - videoSettings (object): Video quality and resolution settings for all the camera models.
         """
 
-        kwargs.update(locals())
-
-        metadata = {
-            "tags": ["camera", "configure", "qualityRetentionProfiles"],
-            "operation": "updateNetworkCameraQualityRetentionProfile",
-        }
-        networkId = urllib.parse.quote(str(networkId), safe="")
-        qualityRetentionProfileId = urllib.parse.quote(str(qualityRetentionProfileId), safe="")
-        resource = f"/networks/{networkId}/camera/qualityRetentionProfiles/{qualityRetentionProfileId}"
-
-        body_params = [
-            "name",
-            "motionBasedRetentionEnabled",
-            "restrictedBandwidthModeEnabled",
-            "audioRecordingEnabled",
-            "cloudArchiveEnabled",
-            "motionDetectorVersion",
-            "smartRetention",
-            "scheduleId",
-            "maxRetentionDays",
-            "videoSettings",
-        ]
-        payload = {k.strip(): v for k, v in kwargs.items() if k.strip() in body_params}
-
-        if self._session._validate_kwargs:
-            all_params = [] + body_params
-            invalid = [k for k in kwargs if k.strip() not in all_params and k != "self"]
-            if invalid and self._session._logger:
-                self._session._logger.warning(
-                    f"updateNetworkCameraQualityRetentionProfile: ignoring unrecognized kwargs: {invalid}"
-                )
-
-        return self._session.put(metadata, resource, payload)
+        return dispatch.call(
+            self._session, "updateNetworkCameraQualityRetentionProfile", networkId, qualityRetentionProfileId, **kwargs
+        )
 
     def deleteNetworkCameraQualityRetentionProfile(self, networkId: str, qualityRetentionProfileId: str):
         """
@@ -712,15 +302,7 @@ class AsyncCamera:
         - qualityRetentionProfileId (string): Quality retention profile ID
         """
 
-        metadata = {
-            "tags": ["camera", "configure", "qualityRetentionProfiles"],
-            "operation": "deleteNetworkCameraQualityRetentionProfile",
-        }
-        networkId = urllib.parse.quote(str(networkId), safe="")
-        qualityRetentionProfileId = urllib.parse.quote(str(qualityRetentionProfileId), safe="")
-        resource = f"/networks/{networkId}/camera/qualityRetentionProfiles/{qualityRetentionProfileId}"
-
-        return self._session.delete(metadata, resource)
+        return dispatch.call(self._session, "deleteNetworkCameraQualityRetentionProfile", networkId, qualityRetentionProfileId)
 
     def getNetworkCameraSchedules(self, networkId: str):
         """
@@ -730,14 +312,7 @@ class AsyncCamera:
         - networkId (string): Network ID
         """
 
-        metadata = {
-            "tags": ["camera", "configure", "schedules"],
-            "operation": "getNetworkCameraSchedules",
-        }
-        networkId = urllib.parse.quote(str(networkId), safe="")
-        resource = f"/networks/{networkId}/camera/schedules"
-
-        return self._session.get(metadata, resource)
+        return dispatch.call(self._session, "getNetworkCameraSchedules", networkId)
 
     def createNetworkCameraWirelessProfile(self, networkId: str, name: str, ssid: dict, **kwargs):
         """
@@ -750,29 +325,7 @@ class AsyncCamera:
         - identity (object): The identity of the wireless profile. Required for creating wireless profiles in 8021x-radius auth mode.
         """
 
-        kwargs.update(locals())
-
-        metadata = {
-            "tags": ["camera", "configure", "wirelessProfiles"],
-            "operation": "createNetworkCameraWirelessProfile",
-        }
-        networkId = urllib.parse.quote(str(networkId), safe="")
-        resource = f"/networks/{networkId}/camera/wirelessProfiles"
-
-        body_params = [
-            "name",
-            "ssid",
-            "identity",
-        ]
-        payload = {k.strip(): v for k, v in kwargs.items() if k.strip() in body_params}
-
-        if self._session._validate_kwargs:
-            all_params = [] + body_params
-            invalid = [k for k in kwargs if k.strip() not in all_params and k != "self"]
-            if invalid and self._session._logger:
-                self._session._logger.warning(f"createNetworkCameraWirelessProfile: ignoring unrecognized kwargs: {invalid}")
-
-        return self._session.post(metadata, resource, payload)
+        return dispatch.call(self._session, "createNetworkCameraWirelessProfile", networkId, name, ssid, **kwargs)
 
     def getNetworkCameraWirelessProfiles(self, networkId: str):
         """
@@ -782,14 +335,7 @@ class AsyncCamera:
         - networkId (string): Network ID
         """
 
-        metadata = {
-            "tags": ["camera", "configure", "wirelessProfiles"],
-            "operation": "getNetworkCameraWirelessProfiles",
-        }
-        networkId = urllib.parse.quote(str(networkId), safe="")
-        resource = f"/networks/{networkId}/camera/wirelessProfiles"
-
-        return self._session.get(metadata, resource)
+        return dispatch.call(self._session, "getNetworkCameraWirelessProfiles", networkId)
 
     def getNetworkCameraWirelessProfile(self, networkId: str, wirelessProfileId: str):
         """
@@ -800,15 +346,7 @@ class AsyncCamera:
         - wirelessProfileId (string): Wireless profile ID
         """
 
-        metadata = {
-            "tags": ["camera", "configure", "wirelessProfiles"],
-            "operation": "getNetworkCameraWirelessProfile",
-        }
-        networkId = urllib.parse.quote(str(networkId), safe="")
-        wirelessProfileId = urllib.parse.quote(str(wirelessProfileId), safe="")
-        resource = f"/networks/{networkId}/camera/wirelessProfiles/{wirelessProfileId}"
-
-        return self._session.get(metadata, resource)
+        return dispatch.call(self._session, "getNetworkCameraWirelessProfile", networkId, wirelessProfileId)
 
     def updateNetworkCameraWirelessProfile(self, networkId: str, wirelessProfileId: str, **kwargs):
         """
@@ -822,30 +360,7 @@ class AsyncCamera:
         - identity (object): The identity of the wireless profile. Required for creating wireless profiles in 8021x-radius auth mode.
         """
 
-        kwargs.update(locals())
-
-        metadata = {
-            "tags": ["camera", "configure", "wirelessProfiles"],
-            "operation": "updateNetworkCameraWirelessProfile",
-        }
-        networkId = urllib.parse.quote(str(networkId), safe="")
-        wirelessProfileId = urllib.parse.quote(str(wirelessProfileId), safe="")
-        resource = f"/networks/{networkId}/camera/wirelessProfiles/{wirelessProfileId}"
-
-        body_params = [
-            "name",
-            "ssid",
-            "identity",
-        ]
-        payload = {k.strip(): v for k, v in kwargs.items() if k.strip() in body_params}
-
-        if self._session._validate_kwargs:
-            all_params = [] + body_params
-            invalid = [k for k in kwargs if k.strip() not in all_params and k != "self"]
-            if invalid and self._session._logger:
-                self._session._logger.warning(f"updateNetworkCameraWirelessProfile: ignoring unrecognized kwargs: {invalid}")
-
-        return self._session.put(metadata, resource, payload)
+        return dispatch.call(self._session, "updateNetworkCameraWirelessProfile", networkId, wirelessProfileId, **kwargs)
 
     def deleteNetworkCameraWirelessProfile(self, networkId: str, wirelessProfileId: str):
         """
@@ -856,15 +371,7 @@ class AsyncCamera:
         - wirelessProfileId (string): Wireless profile ID
         """
 
-        metadata = {
-            "tags": ["camera", "configure", "wirelessProfiles"],
-            "operation": "deleteNetworkCameraWirelessProfile",
-        }
-        networkId = urllib.parse.quote(str(networkId), safe="")
-        wirelessProfileId = urllib.parse.quote(str(wirelessProfileId), safe="")
-        resource = f"/networks/{networkId}/camera/wirelessProfiles/{wirelessProfileId}"
-
-        return self._session.delete(metadata, resource)
+        return dispatch.call(self._session, "deleteNetworkCameraWirelessProfile", networkId, wirelessProfileId)
 
     def getOrganizationCameraBoundariesAreasByDevice(self, organizationId: str, **kwargs):
         """
@@ -875,37 +382,7 @@ class AsyncCamera:
         - serials (array): A list of serial numbers. The returned cameras will be filtered to only include these serials.
         """
 
-        kwargs.update(locals())
-
-        metadata = {
-            "tags": ["camera", "configure", "boundaries", "areas", "byDevice"],
-            "operation": "getOrganizationCameraBoundariesAreasByDevice",
-        }
-        organizationId = urllib.parse.quote(str(organizationId), safe="")
-        resource = f"/organizations/{organizationId}/camera/boundaries/areas/byDevice"
-
-        query_params = [
-            "serials",
-        ]
-        params = {k.strip(): v for k, v in kwargs.items() if k.strip() in query_params}
-
-        array_params = [
-            "serials",
-        ]
-        for k, v in kwargs.items():
-            if k.strip() in array_params:
-                params[f"{k.strip()}[]"] = kwargs[f"{k}"]
-                params.pop(k.strip())
-
-        if self._session._validate_kwargs:
-            all_params = query_params + array_params
-            invalid = [k for k in kwargs if k.strip() not in all_params and k != "self"]
-            if invalid and self._session._logger:
-                self._session._logger.warning(
-                    f"getOrganizationCameraBoundariesAreasByDevice: ignoring unrecognized kwargs: {invalid}"
-                )
-
-        return self._session.get(metadata, resource, params)
+        return dispatch.call(self._session, "getOrganizationCameraBoundariesAreasByDevice", organizationId, **kwargs)
 
     def getOrganizationCameraBoundariesLinesByDevice(self, organizationId: str, **kwargs):
         """
@@ -916,37 +393,7 @@ class AsyncCamera:
         - serials (array): A list of serial numbers. The returned cameras will be filtered to only include these serials.
         """
 
-        kwargs.update(locals())
-
-        metadata = {
-            "tags": ["camera", "configure", "boundaries", "lines", "byDevice"],
-            "operation": "getOrganizationCameraBoundariesLinesByDevice",
-        }
-        organizationId = urllib.parse.quote(str(organizationId), safe="")
-        resource = f"/organizations/{organizationId}/camera/boundaries/lines/byDevice"
-
-        query_params = [
-            "serials",
-        ]
-        params = {k.strip(): v for k, v in kwargs.items() if k.strip() in query_params}
-
-        array_params = [
-            "serials",
-        ]
-        for k, v in kwargs.items():
-            if k.strip() in array_params:
-                params[f"{k.strip()}[]"] = kwargs[f"{k}"]
-                params.pop(k.strip())
-
-        if self._session._validate_kwargs:
-            all_params = query_params + array_params
-            invalid = [k for k in kwargs if k.strip() not in all_params and k != "self"]
-            if invalid and self._session._logger:
-                self._session._logger.warning(
-                    f"getOrganizationCameraBoundariesLinesByDevice: ignoring unrecognized kwargs: {invalid}"
-                )
-
-        return self._session.get(metadata, resource, params)
+        return dispatch.call(self._session, "getOrganizationCameraBoundariesLinesByDevice", organizationId, **kwargs)
 
     def getOrganizationCameraCustomAnalyticsArtifacts(self, organizationId: str):
         """
@@ -956,14 +403,7 @@ class AsyncCamera:
         - organizationId (string): Organization ID
         """
 
-        metadata = {
-            "tags": ["camera", "configure", "customAnalytics", "artifacts"],
-            "operation": "getOrganizationCameraCustomAnalyticsArtifacts",
-        }
-        organizationId = urllib.parse.quote(str(organizationId), safe="")
-        resource = f"/organizations/{organizationId}/camera/customAnalytics/artifacts"
-
-        return self._session.get(metadata, resource)
+        return dispatch.call(self._session, "getOrganizationCameraCustomAnalyticsArtifacts", organizationId)
 
     def createOrganizationCameraCustomAnalyticsArtifact(self, organizationId: str, **kwargs):
         """
@@ -974,29 +414,7 @@ class AsyncCamera:
         - name (string): Unique name of the artifact
         """
 
-        kwargs.update(locals())
-
-        metadata = {
-            "tags": ["camera", "configure", "customAnalytics", "artifacts"],
-            "operation": "createOrganizationCameraCustomAnalyticsArtifact",
-        }
-        organizationId = urllib.parse.quote(str(organizationId), safe="")
-        resource = f"/organizations/{organizationId}/camera/customAnalytics/artifacts"
-
-        body_params = [
-            "name",
-        ]
-        payload = {k.strip(): v for k, v in kwargs.items() if k.strip() in body_params}
-
-        if self._session._validate_kwargs:
-            all_params = [] + body_params
-            invalid = [k for k in kwargs if k.strip() not in all_params and k != "self"]
-            if invalid and self._session._logger:
-                self._session._logger.warning(
-                    f"createOrganizationCameraCustomAnalyticsArtifact: ignoring unrecognized kwargs: {invalid}"
-                )
-
-        return self._session.post(metadata, resource, payload)
+        return dispatch.call(self._session, "createOrganizationCameraCustomAnalyticsArtifact", organizationId, **kwargs)
 
     def getOrganizationCameraCustomAnalyticsArtifact(self, organizationId: str, artifactId: str):
         """
@@ -1007,15 +425,7 @@ class AsyncCamera:
         - artifactId (string): Artifact ID
         """
 
-        metadata = {
-            "tags": ["camera", "configure", "customAnalytics", "artifacts"],
-            "operation": "getOrganizationCameraCustomAnalyticsArtifact",
-        }
-        organizationId = urllib.parse.quote(str(organizationId), safe="")
-        artifactId = urllib.parse.quote(str(artifactId), safe="")
-        resource = f"/organizations/{organizationId}/camera/customAnalytics/artifacts/{artifactId}"
-
-        return self._session.get(metadata, resource)
+        return dispatch.call(self._session, "getOrganizationCameraCustomAnalyticsArtifact", organizationId, artifactId)
 
     def deleteOrganizationCameraCustomAnalyticsArtifact(self, organizationId: str, artifactId: str):
         """
@@ -1026,15 +436,7 @@ class AsyncCamera:
         - artifactId (string): Artifact ID
         """
 
-        metadata = {
-            "tags": ["camera", "configure", "customAnalytics", "artifacts"],
-            "operation": "deleteOrganizationCameraCustomAnalyticsArtifact",
-        }
-        organizationId = urllib.parse.quote(str(organizationId), safe="")
-        artifactId = urllib.parse.quote(str(artifactId), safe="")
-        resource = f"/organizations/{organizationId}/camera/customAnalytics/artifacts/{artifactId}"
-
-        return self._session.delete(metadata, resource)
+        return dispatch.call(self._session, "deleteOrganizationCameraCustomAnalyticsArtifact", organizationId, artifactId)
 
     def getOrganizationCameraDetectionsHistoryByBoundaryByInterval(
         self, organizationId: str, boundaryIds: list, ranges: list, total_pages=1, direction="next", **kwargs
@@ -1053,43 +455,16 @@ class AsyncCamera:
         - boundaryTypes (array): The detection types. Defaults to 'person'.
         """
 
-        kwargs.update(locals())
-
-        metadata = {
-            "tags": ["camera", "configure", "detections", "history", "byBoundary", "byInterval"],
-            "operation": "getOrganizationCameraDetectionsHistoryByBoundaryByInterval",
-        }
-        organizationId = urllib.parse.quote(str(organizationId), safe="")
-        resource = f"/organizations/{organizationId}/camera/detections/history/byBoundary/byInterval"
-
-        query_params = [
-            "boundaryIds",
-            "ranges",
-            "duration",
-            "perPage",
-            "boundaryTypes",
-        ]
-        params = {k.strip(): v for k, v in kwargs.items() if k.strip() in query_params}
-
-        array_params = [
-            "boundaryIds",
-            "ranges",
-            "boundaryTypes",
-        ]
-        for k, v in kwargs.items():
-            if k.strip() in array_params:
-                params[f"{k.strip()}[]"] = kwargs[f"{k}"]
-                params.pop(k.strip())
-
-        if self._session._validate_kwargs:
-            all_params = query_params + array_params
-            invalid = [k for k in kwargs if k.strip() not in all_params and k != "self"]
-            if invalid and self._session._logger:
-                self._session._logger.warning(
-                    f"getOrganizationCameraDetectionsHistoryByBoundaryByInterval: ignoring unrecognized kwargs: {invalid}"
-                )
-
-        return self._session.get_pages(metadata, resource, params, total_pages, direction)
+        return dispatch.call(
+            self._session,
+            "getOrganizationCameraDetectionsHistoryByBoundaryByInterval",
+            organizationId,
+            boundaryIds,
+            ranges,
+            total_pages=total_pages,
+            direction=direction,
+            **kwargs,
+        )
 
     def getOrganizationCameraOnboardingStatuses(self, organizationId: str, **kwargs):
         """
@@ -1101,39 +476,7 @@ class AsyncCamera:
         - networkIds (array): A list of network IDs. The returned cameras will be filtered to only include these networks.
         """
 
-        kwargs.update(locals())
-
-        metadata = {
-            "tags": ["camera", "configure", "onboarding", "statuses"],
-            "operation": "getOrganizationCameraOnboardingStatuses",
-        }
-        organizationId = urllib.parse.quote(str(organizationId), safe="")
-        resource = f"/organizations/{organizationId}/camera/onboarding/statuses"
-
-        query_params = [
-            "serials",
-            "networkIds",
-        ]
-        params = {k.strip(): v for k, v in kwargs.items() if k.strip() in query_params}
-
-        array_params = [
-            "serials",
-            "networkIds",
-        ]
-        for k, v in kwargs.items():
-            if k.strip() in array_params:
-                params[f"{k.strip()}[]"] = kwargs[f"{k}"]
-                params.pop(k.strip())
-
-        if self._session._validate_kwargs:
-            all_params = query_params + array_params
-            invalid = [k for k in kwargs if k.strip() not in all_params and k != "self"]
-            if invalid and self._session._logger:
-                self._session._logger.warning(
-                    f"getOrganizationCameraOnboardingStatuses: ignoring unrecognized kwargs: {invalid}"
-                )
-
-        return self._session.get(metadata, resource, params)
+        return dispatch.call(self._session, "getOrganizationCameraOnboardingStatuses", organizationId, **kwargs)
 
     def updateOrganizationCameraOnboardingStatuses(self, organizationId: str, **kwargs):
         """
@@ -1145,30 +488,7 @@ class AsyncCamera:
         - wirelessCredentialsSent (boolean): Note whether credentials were sent successfully
         """
 
-        kwargs.update(locals())
-
-        metadata = {
-            "tags": ["camera", "configure", "onboarding", "statuses"],
-            "operation": "updateOrganizationCameraOnboardingStatuses",
-        }
-        organizationId = urllib.parse.quote(str(organizationId), safe="")
-        resource = f"/organizations/{organizationId}/camera/onboarding/statuses"
-
-        body_params = [
-            "serial",
-            "wirelessCredentialsSent",
-        ]
-        payload = {k.strip(): v for k, v in kwargs.items() if k.strip() in body_params}
-
-        if self._session._validate_kwargs:
-            all_params = [] + body_params
-            invalid = [k for k in kwargs if k.strip() not in all_params and k != "self"]
-            if invalid and self._session._logger:
-                self._session._logger.warning(
-                    f"updateOrganizationCameraOnboardingStatuses: ignoring unrecognized kwargs: {invalid}"
-                )
-
-        return self._session.put(metadata, resource, payload)
+        return dispatch.call(self._session, "updateOrganizationCameraOnboardingStatuses", organizationId, **kwargs)
 
     def getOrganizationCameraPermissions(self, organizationId: str):
         """
@@ -1178,14 +498,7 @@ class AsyncCamera:
         - organizationId (string): Organization ID
         """
 
-        metadata = {
-            "tags": ["camera", "configure", "permissions"],
-            "operation": "getOrganizationCameraPermissions",
-        }
-        organizationId = urllib.parse.quote(str(organizationId), safe="")
-        resource = f"/organizations/{organizationId}/camera/permissions"
-
-        return self._session.get(metadata, resource)
+        return dispatch.call(self._session, "getOrganizationCameraPermissions", organizationId)
 
     def getOrganizationCameraPermission(self, organizationId: str, permissionScopeId: str):
         """
@@ -1196,15 +509,7 @@ class AsyncCamera:
         - permissionScopeId (string): Permission scope ID
         """
 
-        metadata = {
-            "tags": ["camera", "configure", "permissions"],
-            "operation": "getOrganizationCameraPermission",
-        }
-        organizationId = urllib.parse.quote(str(organizationId), safe="")
-        permissionScopeId = urllib.parse.quote(str(permissionScopeId), safe="")
-        resource = f"/organizations/{organizationId}/camera/permissions/{permissionScopeId}"
-
-        return self._session.get(metadata, resource)
+        return dispatch.call(self._session, "getOrganizationCameraPermission", organizationId, permissionScopeId)
 
     def getOrganizationCameraRoles(self, organizationId: str):
         """
@@ -1214,14 +519,7 @@ class AsyncCamera:
         - organizationId (string): Organization ID
         """
 
-        metadata = {
-            "tags": ["camera", "configure", "roles"],
-            "operation": "getOrganizationCameraRoles",
-        }
-        organizationId = urllib.parse.quote(str(organizationId), safe="")
-        resource = f"/organizations/{organizationId}/camera/roles"
-
-        return self._session.get(metadata, resource)
+        return dispatch.call(self._session, "getOrganizationCameraRoles", organizationId)
 
     def createOrganizationCameraRole(self, organizationId: str, name: str, **kwargs):
         """
@@ -1235,30 +533,7 @@ class AsyncCamera:
         - appliedOrgWide (array): Permissions to be applied org wide.
         """
 
-        kwargs.update(locals())
-
-        metadata = {
-            "tags": ["camera", "configure", "roles"],
-            "operation": "createOrganizationCameraRole",
-        }
-        organizationId = urllib.parse.quote(str(organizationId), safe="")
-        resource = f"/organizations/{organizationId}/camera/roles"
-
-        body_params = [
-            "name",
-            "appliedOnDevices",
-            "appliedOnNetworks",
-            "appliedOrgWide",
-        ]
-        payload = {k.strip(): v for k, v in kwargs.items() if k.strip() in body_params}
-
-        if self._session._validate_kwargs:
-            all_params = [] + body_params
-            invalid = [k for k in kwargs if k.strip() not in all_params and k != "self"]
-            if invalid and self._session._logger:
-                self._session._logger.warning(f"createOrganizationCameraRole: ignoring unrecognized kwargs: {invalid}")
-
-        return self._session.post(metadata, resource, payload)
+        return dispatch.call(self._session, "createOrganizationCameraRole", organizationId, name, **kwargs)
 
     def getOrganizationCameraRole(self, organizationId: str, roleId: str):
         """
@@ -1269,15 +544,7 @@ class AsyncCamera:
         - roleId (string): Role ID
         """
 
-        metadata = {
-            "tags": ["camera", "configure", "roles"],
-            "operation": "getOrganizationCameraRole",
-        }
-        organizationId = urllib.parse.quote(str(organizationId), safe="")
-        roleId = urllib.parse.quote(str(roleId), safe="")
-        resource = f"/organizations/{organizationId}/camera/roles/{roleId}"
-
-        return self._session.get(metadata, resource)
+        return dispatch.call(self._session, "getOrganizationCameraRole", organizationId, roleId)
 
     def deleteOrganizationCameraRole(self, organizationId: str, roleId: str):
         """
@@ -1288,15 +555,7 @@ class AsyncCamera:
         - roleId (string): Role ID
         """
 
-        metadata = {
-            "tags": ["camera", "configure", "roles"],
-            "operation": "deleteOrganizationCameraRole",
-        }
-        organizationId = urllib.parse.quote(str(organizationId), safe="")
-        roleId = urllib.parse.quote(str(roleId), safe="")
-        resource = f"/organizations/{organizationId}/camera/roles/{roleId}"
-
-        return self._session.delete(metadata, resource)
+        return dispatch.call(self._session, "deleteOrganizationCameraRole", organizationId, roleId)
 
     def updateOrganizationCameraRole(self, organizationId: str, roleId: str, **kwargs):
         """
@@ -1311,28 +570,4 @@ class AsyncCamera:
         - appliedOrgWide (array): Permissions to be applied org wide.
         """
 
-        kwargs.update(locals())
-
-        metadata = {
-            "tags": ["camera", "configure", "roles"],
-            "operation": "updateOrganizationCameraRole",
-        }
-        organizationId = urllib.parse.quote(str(organizationId), safe="")
-        roleId = urllib.parse.quote(str(roleId), safe="")
-        resource = f"/organizations/{organizationId}/camera/roles/{roleId}"
-
-        body_params = [
-            "name",
-            "appliedOnDevices",
-            "appliedOnNetworks",
-            "appliedOrgWide",
-        ]
-        payload = {k.strip(): v for k, v in kwargs.items() if k.strip() in body_params}
-
-        if self._session._validate_kwargs:
-            all_params = [] + body_params
-            invalid = [k for k in kwargs if k.strip() not in all_params and k != "self"]
-            if invalid and self._session._logger:
-                self._session._logger.warning(f"updateOrganizationCameraRole: ignoring unrecognized kwargs: {invalid}")
-
-        return self._session.put(metadata, resource, payload)
+        return dispatch.call(self._session, "updateOrganizationCameraRole", organizationId, roleId, **kwargs)
@@ -1,4 +1,4 @@
-import urllib
+from meraki import dispatch
 
 
 class AsyncCellularGateway:
@@ -14,14 +14,7 @@ class AsyncCellularGateway:
         - serial (string): Serial
         """
 
-        metadata = {
-            "tags": ["cellularGateway", "configure", "lan"],
-            "operation": "getDeviceCellularGatewayLan",
-        }
-        serial = urllib.parse.quote(str(serial), safe="")
-        resource = f"/devices/{serial}/cellularGateway/lan"
-
-        return self._session.get(metadata, resource)
+        return dispatch.call(self._session, "getDeviceCellularGatewayLan", serial)
 
     def updateDeviceCellularGatewayLan(self, serial: str, **kwargs):
         """
@@ -33,28 +26,7 @@ class AsyncCellularGateway:
         - fixedIpAssignments (array): list of all fixed IP assignments for a single MG
         """
 
-        kwargs.update(locals())
-
-        metadata = {
-            "tags": ["cellularGateway", "configure", "lan"],
-            "operation": "updateDeviceCellularGatewayLan",
-        }
-        serial = urllib.parse.quote(str(serial), safe="")
-        resource = f"/devices/{serial}/cellularGateway/lan"
-
-        body_params = [
-            "reservedIpRanges",
-            "fixedIpAssignments",
-        ]
-        payload = {k.strip(): v for k, v in kwargs.items() if k.strip() in body_params}
-
-        if self._session._validate_kwargs:
-            all_params = [] + body_params
-            invalid = [k for k in kwargs if k.strip() not in all_params and k != "self"]
-            if invalid and self._session._logger:
-                self._session._logger.warning(f"updateDeviceCellularGatewayLan: ignoring unrecognized kwargs: {invalid}")
-
-        return self._session.put(metadata, resource, payload)
+        return dispatch.call(self._session, "updateDeviceCellularGatewayLan", serial, **kwargs)
 
     def getDeviceCellularGatewayPortForwardingRules(self, serial: str):
         """
@@ -64,14 +36,7 @@ class AsyncCellularGateway:
         - serial (string): Serial
         """
 
-        metadata = {
-            "tags": ["cellularGateway", "configure", "portForwardingRules"],
-            "operation": "getDeviceCellularGatewayPortForwardingRules",
-        }
-        serial = urllib.parse.quote(str(serial), safe="")
-        resource = f"/devices/{serial}/cellularGateway/portForwardingRules"
-
-        return self._session.get(metadata, resource)
+        return dispatch.call(self._session, "getDeviceCellularGatewayPortForwardingRules", serial)
 
     def updateDeviceCellularGatewayPortForwardingRules(self, serial: str, **kwargs):
         """
@@ -82,29 +47,7 @@ class AsyncCellularGateway:
         - rules (array): An array of port forwarding params
         """
 
-        kwargs.update(locals())
-
-        metadata = {
-            "tags": ["cellularGateway", "configure", "portForwardingRules"],
-            "operation": "updateDeviceCellularGatewayPortForwardingRules",
-        }
-        serial = urllib.parse.quote(str(serial), safe="")
-        resource = f"/devices/{serial}/cellularGateway/portForwardingRules"
-
-        body_params = [
-            "rules",
-        ]
-        payload = {k.strip(): v for k, v in kwargs.items() if k.strip() in body_params}
-
-        if self._session._validate_kwargs:
-            all_params = [] + body_params
-            invalid = [k for k in kwargs if k.strip() not in all_params and k != "self"]
-            if invalid and self._session._logger:
-                self._session._logger.warning(
-                    f"updateDeviceCellularGatewayPortForwardingRules: ignoring unrecognized kwargs: {invalid}"
-                )
-
-        return self._session.put(metadata, resource, payload)
+        return dispatch.call(self._session, "updateDeviceCellularGatewayPortForwardingRules", serial, **kwargs)
 
     def getNetworkCellularGatewayConnectivityMonitoringDestinations(self, networkId: str):
         """
@@ -114,14 +57,7 @@ class AsyncCellularGateway:
         - networkId (string): Network ID
         """
 
-        metadata = {
-            "tags": ["cellularGateway", "configure", "connectivityMonitoringDestinations"],
-            "operation": "getNetworkCellularGatewayConnectivityMonitoringDestinations",
-        }
-        networkId = urllib.parse.quote(str(networkId), safe="")
-        resource = f"/networks/{networkId}/cellularGateway/connectivityMonitoringDestinations"
-
-        return self._session.get(metadata, resource)
+        return dispatch.call(self._session, "getNetworkCellularGatewayConnectivityMonitoringDestinations", networkId)
 
     def updateNetworkCellularGatewayConnectivityMonitoringDestinations(self, networkId: str, **kwargs):
         """
@@ -132,29 +68,9 @@ class AsyncCellularGateway:
         - destinations (array): The list of connectivity monitoring destinations
         """
 
-        kwargs.update(locals())
-
-        metadata = {
-            "tags": ["cellularGateway", "configure", "connectivityMonitoringDestinations"],
-            "operation": "updateNetworkCellularGatewayConnectivityMonitoringDestinations",
-        }
-        networkId = urllib.parse.quote(str(networkId), safe="")
-        resource = f"/networks/{networkId}/cellularGateway/connectivityMonitoringDestinations"
-
-        body_params = [
-            "destinations",
-        ]
-        payload = {k.strip(): v for k, v in kwargs.items() if k.strip() in body_params}
-
-        if self._session._validate_kwargs:
-            all_params = [] + body_params
-            invalid = [k for k in kwargs if k.strip() not in all_params and k != "self"]
-            if invalid and self._session._logger:
-                self._session._logger.warning(
-                    f"updateNetworkCellularGatewayConnectivityMonitoringDestinations: ignoring unrecognized kwargs: {invalid}"
-                )
-
-        return self._session.put(metadata, resource, payload)
+        return dispatch.call(
+            self._session, "updateNetworkCellularGatewayConnectivityMonitoringDestinations", networkId, **kwargs
+        )
 
     def getNetworkCellularGatewayDhcp(self, networkId: str):
         """
@@ -164,14 +80,7 @@ class AsyncCellularGateway:
         - networkId (string): Network ID
         """
 
-        metadata = {
-            "tags": ["cellularGateway", "configure", "dhcp"],
-            "operation": "getNetworkCellularGatewayDhcp",
-        }
-        networkId = urllib.parse.quote(str(networkId), safe="")
-        resource = f"/networks/{networkId}/cellularGateway/dhcp"
-
-        return self._session.get(metadata, resource)
+        return dispatch.call(self._session, "getNetworkCellularGatewayDhcp", networkId)
 
     def updateNetworkCellularGatewayDhcp(self, networkId: str, **kwargs):
         """
@@ -184,29 +93,7 @@ class AsyncCellularGateway:
         - dnsCustomNameservers (array): list of fixed IPs representing the the DNS Name servers when the mode is 'custom'
         """
 
-        kwargs.update(locals())
-
-        metadata = {
-            "tags": ["cellularGateway", "configure", "dhcp"],
-            "operation": "updateNetworkCellularGatewayDhcp",
-        }
-        networkId = urllib.parse.quote(str(networkId), safe="")
-        resource = f"/networks/{networkId}/cellularGateway/dhcp"
-
-        body_params = [
-            "dhcpLeaseTime",
-            "dnsNameservers",
-            "dnsCustomNameservers",
-        ]
-        payload = {k.strip(): v for k, v in kwargs.items() if k.strip() in body_params}
-
-        if self._session._validate_kwargs:
-            all_params = [] + body_params
-            invalid = [k for k in kwargs if k.strip() not in all_params and k != "self"]
-            if invalid and self._session._logger:
-                self._session._logger.warning(f"updateNetworkCellularGatewayDhcp: ignoring unrecognized kwargs: {invalid}")
-
-        return self._session.put(metadata, resource, payload)
+        return dispatch.call(self._session, "updateNetworkCellularGatewayDhcp", networkId, **kwargs)
 
     def getNetworkCellularGatewaySubnetPool(self, networkId: str):
         """
@@ -216,14 +103,7 @@ class AsyncCellularGateway:
         - networkId (string): Network ID
         """
 
-        metadata = {
-            "tags": ["cellularGateway", "configure", "subnetPool"],
-            "operation": "getNetworkCellularGatewaySubnetPool",
-        }
-        networkId = urllib.parse.quote(str(networkId), safe="")
-        resource = f"/networks/{networkId}/cellularGateway/subnetPool"
-
-        return self._session.get(metadata, resource)
+        return dispatch.call(self._session, "getNetworkCellularGatewaySubnetPool", networkId)
 
     def updateNetworkCellularGatewaySubnetPool(self, networkId: str, **kwargs):
         """
@@ -235,30 +115,7 @@ class AsyncCellularGateway:
         - cidr (string): CIDR of the pool of subnets. Each MG in this network will automatically pick a subnet from this pool.
         """
 
-        kwargs.update(locals())
-
-        metadata = {
-            "tags": ["cellularGateway", "configure", "subnetPool"],
-            "operation": "updateNetworkCellularGatewaySubnetPool",
-        }
-        networkId = urllib.parse.quote(str(networkId), safe="")
-        resource = f"/networks/{networkId}/cellularGateway/subnetPool"
-
-        body_params = [
-            "mask",
-            "cidr",
-        ]
-        payload = {k.strip(): v for k, v in kwargs.items() if k.strip() in body_params}
-
-        if self._session._validate_kwargs:
-            all_params = [] + body_params
-            invalid = [k for k in kwargs if k.strip() not in all_params and k != "self"]
-            if invalid and self._session._logger:
-                self._session._logger.warning(
-                    f"updateNetworkCellularGatewaySubnetPool: ignoring unrecognized kwargs: {invalid}"
-                )
-
-        return self._session.put(metadata, resource, payload)
+        return dispatch.call(self._session, "updateNetworkCellularGatewaySubnetPool", networkId, **kwargs)
 
     def getNetworkCellularGatewayUplink(self, networkId: str):
         """
@@ -268,14 +125,7 @@ class AsyncCellularGateway:
         - networkId (string): Network ID
         """
 
-        metadata = {
-            "tags": ["cellularGateway", "configure", "uplink"],
-            "operation": "getNetworkCellularGatewayUplink",
-        }
-        networkId = urllib.parse.quote(str(networkId), safe="")
-        resource = f"/networks/{networkId}/cellularGateway/uplink"
-
-        return self._session.get(metadata, resource)
+        return dispatch.call(self._session, "getNetworkCellularGatewayUplink", networkId)
 
     def updateNetworkCellularGatewayUplink(self, networkId: str, **kwargs):
         """
@@ -286,27 +136,7 @@ class AsyncCellularGateway:
         - bandwidthLimits (object): The bandwidth settings for the 'cellular' uplink
         """
 
-        kwargs.update(locals())
-
-        metadata = {
-            "tags": ["cellularGateway", "configure", "uplink"],
-            "operation": "updateNetworkCellularGatewayUplink",
-        }
-        networkId = urllib.parse.quote(str(networkId), safe="")
-        resource = f"/networks/{networkId}/cellularGateway/uplink"
-
-        body_params = [
-            "bandwidthLimits",
-        ]
-        payload = {k.strip(): v for k, v in kwargs.items() if k.strip() in body_params}
-
-        if self._session._validate_kwargs:
-            all_params = [] + body_params
-            invalid = [k for k in kwargs if k.strip() not in all_params and k != "self"]
-            if invalid and self._session._logger:
-                self._session._logger.warning(f"updateNetworkCellularGatewayUplink: ignoring unrecognized kwargs: {invalid}")
-
-        return self._session.put(metadata, resource, payload)
+        return dispatch.call(self._session, "updateNetworkCellularGatewayUplink", networkId, **kwargs)
 
     def getOrganizationCellularGatewayEsimsInventory(self, organizationId: str, **kwargs):
         """
@@ -317,37 +147,7 @@ class AsyncCellularGateway:
         - eids (array): Optional parameter to filter the results by EID.
         """
 
-        kwargs.update(locals())
-
-        metadata = {
-            "tags": ["cellularGateway", "configure", "esims", "inventory"],
-            "operation": "getOrganizationCellularGatewayEsimsInventory",
-        }
-        organizationId = urllib.parse.quote(str(organizationId), safe="")
-        resource = f"/organizations/{organizationId}/cellularGateway/esims/inventory"
-
-        query_params = [
-            "eids",
-        ]
-        params = {k.strip(): v for k, v in kwargs.items() if k.strip() in query_params}
-
-        array_params = [
-            "eids",
-        ]
-        for k, v in kwargs.items():
-            if k.strip() in array_params:
-                params[f"{k.strip()}[]"] = kwargs[f"{k}"]
-                params.pop(k.strip())
-
-        if self._session._validate_kwargs:
-            all_params = query_params + array_params
-            invalid = [k for k in kwargs if k.strip() not in all_params and k != "self"]
-            if invalid and self._session._logger:
-                self._session._logger.warning(
-                    f"getOrganizationCellularGatewayEsimsInventory: ignoring unrecognized kwargs: {invalid}"
-                )
-
-        return self._session.get(metadata, resource, params)
+        return dispatch.call(self._session, "getOrganizationCellularGatewayEsimsInventory", organizationId, **kwargs)
 
     def updateOrganizationCellularGatewayEsimsInventory(self, organizationId: str, id: str, **kwargs):
         """
@@ -359,30 +159,7 @@ class AsyncCellularGateway:
         - status (string): Status the eSIM will be updated to
         """
 
-        kwargs.update(locals())
-
-        metadata = {
-            "tags": ["cellularGateway", "configure", "esims", "inventory"],
-            "operation": "updateOrganizationCellularGatewayEsimsInventory",
-        }
-        organizationId = urllib.parse.quote(str(organizationId), safe="")
-        id = urllib.parse.quote(str(id), safe="")
-        resource = f"/organizations/{organizationId}/cellularGateway/esims/inventory/{id}"
-
-        body_params = [
-            "status",
-        ]
-        payload = {k.strip(): v for k, v in kwargs.items() if k.strip() in body_params}
-
-        if self._session._validate_kwargs:
-            all_params = [] + body_params
-            invalid = [k for k in kwargs if k.strip() not in all_params and k != "self"]
-            if invalid and self._session._logger:
-                self._session._logger.warning(
-                    f"updateOrganizationCellularGatewayEsimsInventory: ignoring unrecognized kwargs: {invalid}"
-                )
-
-        return self._session.put(metadata, resource, payload)
+        return dispatch.call(self._session, "updateOrganizationCellularGatewayEsimsInventory", organizationId, id, **kwargs)
 
     def getOrganizationCellularGatewayEsimsServiceProviders(self, organizationId: str):
         """
@@ -392,14 +169,7 @@ class AsyncCellularGateway:
         - organizationId (string): Organization ID
         """
 
-        metadata = {
-            "tags": ["cellularGateway", "configure", "esims", "serviceProviders"],
-            "operation": "getOrganizationCellularGatewayEsimsServiceProviders",
-        }
-        organizationId = urllib.parse.quote(str(organizationId), safe="")
-        resource = f"/organizations/{organizationId}/cellularGateway/esims/serviceProviders"
-
-        return self._session.get(metadata, resource)
+        return dispatch.call(self._session, "getOrganizationCellularGatewayEsimsServiceProviders", organizationId)
 
     def getOrganizationCellularGatewayEsimsServiceProvidersAccounts(self, organizationId: str, **kwargs):
         """
@@ -410,37 +180,9 @@ class AsyncCellularGateway:
         - accountIds (array): Optional parameter to filter the results by service provider account IDs.
         """
 
-        kwargs.update(locals())
-
-        metadata = {
-            "tags": ["cellularGateway", "configure", "esims", "serviceProviders", "accounts"],
-            "operation": "getOrganizationCellularGatewayEsimsServiceProvidersAccounts",
-        }
-        organizationId = urllib.parse.quote(str(organizationId), safe="")
-        resource = f"/organizations/{organizationId}/cellularGateway/esims/serviceProviders/accounts"
-
-        query_params = [
-            "accountIds",
-        ]
-        params = {k.strip(): v for k, v in kwargs.items() if k.strip() in query_params}
-
-        array_params = [
-            "accountIds",
-        ]
-        for k, v in kwargs.items():
-            if k.strip() in array_params:
-                params[f"{k.strip()}[]"] = kwargs[f"{k}"]
-                params.pop(k.strip())
-
-        if self._session._validate_kwargs:
-            all_params = query_params + array_params
-            invalid = [k for k in kwargs if k.strip() not in all_params and k != "self"]
-            if invalid and self._session._logger:
-                self._session._logger.warning(
-                    f"getOrganizationCellularGatewayEsimsServiceProvidersAccounts: ignoring unrecognized kwargs: {invalid}"
-                )
-
-        return self._session.get(metadata, resource, params)
+        return dispatch.call(
+            self._session, "getOrganizationCellularGatewayEsimsServiceProvidersAccounts", organizationId, **kwargs
+        )
 
     def createOrganizationCellularGatewayEsimsServiceProvidersAccount(
         self, organizationId: str, accountId: str, apiKey: str, serviceProvider: dict, title: str, username: str, **kwargs
@@ -457,33 +199,17 @@ class AsyncCellularGateway:
         - username (string): Service provider account username
         """
 
-        kwargs = locals()
-
-        metadata = {
-            "tags": ["cellularGateway", "configure", "esims", "serviceProviders", "accounts"],
-            "operation": "createOrganizationCellularGatewayEsimsServiceProvidersAccount",
-        }
-        organizationId = urllib.parse.quote(str(organizationId), safe="")
-        resource = f"/organizations/{organizationId}/cellularGateway/esims/serviceProviders/accounts"
-
-        body_params = [
-            "accountId",
-            "apiKey",
-            "serviceProvider",
-            "title",
-            "username",
-        ]
-        payload = {k.strip(): v for k, v in kwargs.items() if k.strip() in body_params}
-
-        if self._session._validate_kwargs:
-            all_params = [] + body_params
-            invalid = [k for k in kwargs if k.strip() not in all_params and k != "self"]
-            if invalid and self._session._logger:
-                self._session._logger.warning(
-                    f"createOrganizationCellularGatewayEsimsServiceProvidersAccount: ignoring unrecognized kwargs: {invalid}"
-                )
-
-        return self._session.post(metadata, resource, payload)
+        return dispatch.call(
+            self._session,
+            "createOrganizationCellularGatewayEsimsServiceProvidersAccount",
+            organizationId,
+            accountId,
+            apiKey,
+            serviceProvider,
+            title,
+            username,
+            **kwargs,
+        )
 
     def getOrganizationCellularGatewayEsimsServiceProvidersAccountsCommunicationPlans(
         self, organizationId: str, accountIds: list, **kwargs
@@ -496,37 +222,13 @@ class AsyncCellularGateway:
         - accountIds (array): Account IDs that communication plans will be fetched for
         """
 
-        kwargs = locals()
-
-        metadata = {
-            "tags": ["cellularGateway", "configure", "esims", "serviceProviders", "accounts", "communicationPlans"],
-            "operation": "getOrganizationCellularGatewayEsimsServiceProvidersAccountsCommunicationPlans",
-        }
-        organizationId = urllib.parse.quote(str(organizationId), safe="")
-        resource = f"/organizations/{organizationId}/cellularGateway/esims/serviceProviders/accounts/communicationPlans"
-
-        query_params = [
-            "accountIds",
-        ]
-        params = {k.strip(): v for k, v in kwargs.items() if k.strip() in query_params}
-
-        array_params = [
-            "accountIds",
-        ]
-        for k, v in kwargs.items():
-            if k.strip() in array_params:
-                params[f"{k.strip()}[]"] = kwargs[f"{k}"]
-                params.pop(k.strip())
-
-        if self._session._validate_kwargs:
-            all_params = query_params + array_params
-            invalid = [k for k in kwargs if k.strip() not in all_params and k != "self"]
-            if invalid and self._session._logger:
-                self._session._logger.warning(
-                    f"getOrganizationCellularGatewayEsimsServiceProvidersAccountsCommunicationPlans: ignoring unrecognized kwargs: {invalid}"
-                )
-
-        return self._session.get(metadata, resource, params)
+        return dispatch.call(
+            self._session,
+            "getOrganizationCellularGatewayEsimsServiceProvidersAccountsCommunicationPlans",
+            organizationId,
+            accountIds,
+            **kwargs,
+        )
 
     def getOrganizationCellularGatewayEsimsServiceProvidersAccountsRatePlans(
         self, organizationId: str, accountIds: list, **kwargs
@@ -539,37 +241,13 @@ class AsyncCellularGateway:
         - accountIds (array): Account IDs that rate plans will be fetched for
         """
 
-        kwargs = locals()
-
-        metadata = {
-            "tags": ["cellularGateway", "configure", "esims", "serviceProviders", "accounts", "ratePlans"],
-            "operation": "getOrganizationCellularGatewayEsimsServiceProvidersAccountsRatePlans",
-        }
-        organizationId = urllib.parse.quote(str(organizationId), safe="")
-        resource = f"/organizations/{organizationId}/cellularGateway/esims/serviceProviders/accounts/ratePlans"
-
-        query_params = [
-            "accountIds",
-        ]
-        params = {k.strip(): v for k, v in kwargs.items() if k.strip() in query_params}
-
-        array_params = [
-            "accountIds",
-        ]
-        for k, v in kwargs.items():
-            if k.strip() in array_params:
-                params[f"{k.strip()}[]"] = kwargs[f"{k}"]
-                params.pop(k.strip())
-
-        if self._session._validate_kwargs:
-            all_params = query_params + array_params
-            invalid = [k for k in kwargs if k.strip() not in all_params and k != "self"]
-            if invalid and self._session._logger:
-                self._session._logger.warning(
-                    f"getOrganizationCellularGatewayEsimsServiceProvidersAccountsRatePlans: ignoring unrecognized kwargs: {invalid}"
-                )
-
-        return self._session.get(metadata, resource, params)
+        return dispatch.call(
+            self._session,
+            "getOrganizationCellularGatewayEsimsServiceProvidersAccountsRatePlans",
+            organizationId,
+            accountIds,
+            **kwargs,
+        )
 
     def updateOrganizationCellularGatewayEsimsServiceProvidersAccount(self, organizationId: str, accountId: str, **kwargs):
         """
@@ -582,31 +260,9 @@ class AsyncCellularGateway:
         - apiKey (string): Service provider account API key
         """
 
-        kwargs.update(locals())
-
-        metadata = {
-            "tags": ["cellularGateway", "configure", "esims", "serviceProviders", "accounts"],
-            "operation": "updateOrganizationCellularGatewayEsimsServiceProvidersAccount",
-        }
-        organizationId = urllib.parse.quote(str(organizationId), safe="")
-        accountId = urllib.parse.quote(str(accountId), safe="")
-        resource = f"/organizations/{organizationId}/cellularGateway/esims/serviceProviders/accounts/{accountId}"
-
-        body_params = [
-            "title",
-            "apiKey",
-        ]
-        payload = {k.strip(): v for k, v in kwargs.items() if k.strip() in body_params}
-
-        if self._session._validate_kwargs:
-            all_params = [] + body_params
-            invalid = [k for k in kwargs if k.strip() not in all_params and k != "self"]
-            if invalid and self._session._logger:
-                self._session._logger.warning(
-                    f"updateOrganizationCellularGatewayEsimsServiceProvidersAccount: ignoring unrecognized kwargs: {invalid}"
-                )
-
-        return self._session.put(metadata, resource, payload)
+        return dispatch.call(
+            self._session, "updateOrganizationCellularGatewayEsimsServiceProvidersAccount", organizationId, accountId, **kwargs
+        )
 
     def deleteOrganizationCellularGatewayEsimsServiceProvidersAccount(self, organizationId: str, accountId: str):
         """
@@ -617,15 +273,9 @@ class AsyncCellularGateway:
         - accountId (string): Account ID
         """
 
-        metadata = {
-            "tags": ["cellularGateway", "configure", "esims", "serviceProviders", "accounts"],
-            "operation": "deleteOrganizationCellularGatewayEsimsServiceProvidersAccount",
-        }
-        organizationId = urllib.parse.quote(str(organizationId), safe="")
-        accountId = urllib.parse.quote(str(accountId), safe="")
-        resource = f"/organizations/{organizationId}/cellularGateway/esims/serviceProviders/accounts/{accountId}"
-
-        return self._session.delete(metadata, resource)
+        return dispatch.call(
+            self._session, "deleteOrganizationCellularGatewayEsimsServiceProvidersAccount", organizationId, accountId
+        )
 
     def createOrganizationCellularGatewayEsimsSwap(self, organizationId: str, swaps: list, **kwargs):
         """
@@ -636,29 +286,7 @@ class AsyncCellularGateway:
         - swaps (array): Each object represents a swap for one eSIM
         """
 
-        kwargs = locals()
-
-        metadata = {
-            "tags": ["cellularGateway", "configure", "esims", "swap"],
-            "operation": "createOrganizationCellularGatewayEsimsSwap",
-        }
-        organizationId = urllib.parse.quote(str(organizationId), safe="")
-        resource = f"/organizations/{organizationId}/cellularGateway/esims/swap"
-
-        body_params = [
-            "swaps",
-        ]
-        payload = {k.strip(): v for k, v in kwargs.items() if k.strip() in body_params}
-
-        if self._session._validate_kwargs:
-            all_params = [] + body_params
-            invalid = [k for k in kwargs if k.strip() not in all_params and k != "self"]
-            if invalid and self._session._logger:
-                self._session._logger.warning(
-                    f"createOrganizationCellularGatewayEsimsSwap: ignoring unrecognized kwargs: {invalid}"
-                )
-
-        return self._session.post(metadata, resource, payload)
+        return dispatch.call(self._session, "createOrganizationCellularGatewayEsimsSwap", organizationId, swaps, **kwargs)
 
     def updateOrganizationCellularGatewayEsimsSwap(self, id: str, organizationId: str):
         """
@@ -669,15 +297,7 @@ class AsyncCellularGateway:
         - organizationId (string): Organization ID
         """
 
-        metadata = {
-            "tags": ["cellularGateway", "configure", "esims", "swap"],
-            "operation": "updateOrganizationCellularGatewayEsimsSwap",
-        }
-        id = urllib.parse.quote(str(id), safe="")
-        organizationId = urllib.parse.quote(str(organizationId), safe="")
-        resource = f"/organizations/{organizationId}/cellularGateway/esims/swap/{id}"
-
-        return self._session.put(metadata, resource)
+        return dispatch.call(self._session, "updateOrganizationCellularGatewayEsimsSwap", id, organizationId)
 
     def getOrganizationCellularGatewayUplinkStatuses(self, organizationId: str, total_pages=1, direction="next", **kwargs):
         """
@@ -695,41 +315,11 @@ class AsyncCellularGateway:
         - iccids (array): A list of ICCIDs. The returned devices will be filtered to only include these ICCIDs.
         """
 
-        kwargs.update(locals())
-
-        metadata = {
-            "tags": ["cellularGateway", "monitor", "uplink", "statuses"],
-            "operation": "getOrganizationCellularGatewayUplinkStatuses",
-        }
-        organizationId = urllib.parse.quote(str(organizationId), safe="")
-        resource = f"/organizations/{organizationId}/cellularGateway/uplink/statuses"
-
-        query_params = [
-            "perPage",
-            "startingAfter",
-            "endingBefore",
-            "networkIds",
-            "serials",
-            "iccids",
-        ]
-        params = {k.strip(): v for k, v in kwargs.items() if k.strip() in query_params}
-
-        array_params = [
-            "networkIds",
-            "serials",
-            "iccids",
-        ]
-        for k, v in kwargs.items():
-            if k.strip() in array_params:
-                params[f"{k.strip()}[]"] = kwargs[f"{k}"]
-                params.pop(k.strip())
-
-        if self._session._validate_kwargs:
-            all_params = query_params + array_params
-            invalid = [k for k in kwargs if k.strip() not in all_params and k != "self"]
-            if invalid and self._session._logger:
-                self._session._logger.warning(
-                    f"getOrganizationCellularGatewayUplinkStatuses: ignoring unrecognized kwargs: {invalid}"
-                )
-
-        return self._session.get_pages(metadata, resource, params, total_pages, direction)
+        return dispatch.call(
+            self._session,
+            "getOrganizationCellularGatewayUplinkStatuses",
+            organizationId,
+            total_pages=total_pages,
+            direction=direction,
+            **kwargs,
+        )
@@ -1,4 +1,4 @@
-import urllib
+from meraki import dispatch
 
 
 class AsyncDevices:
@@ -14,14 +14,7 @@ class AsyncDevices:
         - serial (string): Serial
         """
 
-        metadata = {
-            "tags": ["devices", "configure"],
-            "operation": "getDevice",
-        }
-        serial = urllib.parse.quote(str(serial), safe="")
-        resource = f"/devices/{serial}"
-
-        return self._session.get(metadata, resource)
+        return dispatch.call(self._session, "getDevice", serial)
 
     def updateDevice(self, serial: str, **kwargs):
         """
@@ -40,35 +33,7 @@ class AsyncDevices:
         - floorPlanId (string): The floor plan to associate to this device. null disassociates the device from the floorplan.
         """
 
-        kwargs.update(locals())
-
-        metadata = {
-            "tags": ["devices", "configure"],
-            "operation": "updateDevice",
-        }
-        serial = urllib.parse.quote(str(serial), safe="")
-        resource = f"/devices/{serial}"
-
-        body_params = [
-            "name",
-            "tags",
-            "lat",
-            "lng",
-            "address",
-            "notes",
-            "moveMapMarker",
-            "switchProfileId",
-            "floorPlanId",
-        ]
-        payload = {k.strip(): v for k, v in kwargs.items() if k.strip() in body_params}
-
-        if self._session._validate_kwargs:
-            all_params = [] + body_params
-            invalid = [k for k in kwargs if k.strip() not in all_params and k != "self"]
-            if invalid and self._session._logger:
-                self._session._logger.warning(f"updateDevice: ignoring unrecognized kwargs: {invalid}")
-
-        return self._session.put(metadata, resource, payload)
+        return dispatch.call(self._session, "updateDevice", serial, **kwargs)
 
     def blinkDeviceLeds(self, serial: str, **kwargs):
         """
@@ -81,29 +46,7 @@ class AsyncDevices:
         - duty (integer): The duty cycle as the percent active. Must be between 10 and 90. Default is 50.
         """
 
-        kwargs.update(locals())
-
-        metadata = {
-            "tags": ["devices", "liveTools"],
-            "operation": "blinkDeviceLeds",
-        }
-        serial = urllib.parse.quote(str(serial), safe="")
-        resource = f"/devices/{serial}/blinkLeds"
-
-        body_params = [
-            "duration",
-            "period",
-            "duty",
-        ]
-        payload = {k.strip(): v for k, v in kwargs.items() if k.strip() in body_params}
-
-        if self._session._validate_kwargs:
-            all_params = [] + body_params
-            invalid = [k for k in kwargs if k.strip() not in all_params and k != "self"]
-            if invalid and self._session._logger:
-                self._session._logger.warning(f"blinkDeviceLeds: ignoring unrecognized kwargs: {invalid}")
-
-        return self._session.post(metadata, resource, payload)
+        return dispatch.call(self._session, "blinkDeviceLeds", serial, **kwargs)
 
     def updateDeviceCellularGeolocations(self, serial: str, enabled: bool, **kwargs):
         """
@@ -114,27 +57,7 @@ class AsyncDevices:
         - enabled (boolean): Required parameter for the state to update the geolocation settings to (true to enable, false to disable)
         """
 
-        kwargs = locals()
-
-        metadata = {
-            "tags": ["devices", "configure", "cellular", "geolocations"],
-            "operation": "updateDeviceCellularGeolocations",
-        }
-        serial = urllib.parse.quote(str(serial), safe="")
-        resource = f"/devices/{serial}/cellular/geolocations"
-
-        body_params = [
-            "enabled",
-        ]
-        payload = {k.strip(): v for k, v in kwargs.items() if k.strip() in body_params}
-
-        if self._session._validate_kwargs:
-            all_params = [] + body_params
-            invalid = [k for k in kwargs if k.strip() not in all_params and k != "self"]
-            if invalid and self._session._logger:
-                self._session._logger.warning(f"updateDeviceCellularGeolocations: ignoring unrecognized kwargs: {invalid}")
-
-        return self._session.put(metadata, resource, payload)
+        return dispatch.call(self._session, "updateDeviceCellularGeolocations", serial, enabled, **kwargs)
 
     def getDeviceCellularSims(self, serial: str):
         """
@@ -144,14 +67,7 @@ class AsyncDevices:
         - serial (string): Serial
         """
 
-        metadata = {
-            "tags": ["devices", "configure", "cellular", "sims"],
-            "operation": "getDeviceCellularSims",
-        }
-        serial = urllib.parse.quote(str(serial), safe="")
-        resource = f"/devices/{serial}/cellular/sims"
-
-        return self._session.get(metadata, resource)
+        return dispatch.call(self._session, "getDeviceCellularSims", serial)
 
     def updateDeviceCellularSims(self, serial: str, **kwargs):
         """
@@ -164,29 +80,7 @@ class AsyncDevices:
         - simFailover (object): SIM Failover settings.
         """
 
-        kwargs.update(locals())
-
-        metadata = {
-            "tags": ["devices", "configure", "cellular", "sims"],
-            "operation": "updateDeviceCellularSims",
-        }
-        serial = urllib.parse.quote(str(serial), safe="")
-        resource = f"/devices/{serial}/cellular/sims"
-
-        body_params = [
-            "sims",
-            "simOrdering",
-            "simFailover",
-        ]
-        payload = {k.strip(): v for k, v in kwargs.items() if k.strip() in body_params}
-
-        if self._session._validate_kwargs:
-            all_params = [] + body_params
-            invalid = [k for k in kwargs if k.strip() not in all_params and k != "self"]
-            if invalid and self._session._logger:
-                self._session._logger.warning(f"updateDeviceCellularSims: ignoring unrecognized kwargs: {invalid}")
-
-        return self._session.put(metadata, resource, payload)
+        return dispatch.call(self._session, "updateDeviceCellularSims", serial, **kwargs)
 
     def createDeviceCellularUplinksBandsMasksUpdate(self, serial: str, slot: str, type: str, masked: list, **kwargs):
         """
@@ -199,38 +93,9 @@ class AsyncDevices:
         - masked (array): Required parameter for the band identifiers to mask for the given SIM slot and signal type. For LTE use bands identifiers like '30', for 5G use band identifiers like 'n30', or use 'all' to mask all bands for that signal type. Maximum 256 bands.
         """
 
-        kwargs = locals()
-
-        if "slot" in kwargs:
-            options = ["sim1", "sim2", "sim3"]
-            assert kwargs["slot"] in options, f'''"slot" cannot be "{kwargs["slot"]}", & must be set to one of: {options}'''
-        if "type" in kwargs:
-            options = ["5GNSA", "5GSA", "LTE"]
-            assert kwargs["type"] in options, f'''"type" cannot be "{kwargs["type"]}", & must be set to one of: {options}'''
-
-        metadata = {
-            "tags": ["devices", "configure", "cellular", "uplinks", "bands", "masks", "update"],
-            "operation": "createDeviceCellularUplinksBandsMasksUpdate",
-        }
-        serial = urllib.parse.quote(str(serial), safe="")
-        resource = f"/devices/{serial}/cellular/uplinks/bands/masks/update"
-
-        body_params = [
-            "slot",
-            "type",
-            "masked",
-        ]
-        payload = {k.strip(): v for k, v in kwargs.items() if k.strip() in body_params}
-
-        if self._session._validate_kwargs:
-            all_params = [] + body_params
-            invalid = [k for k in kwargs if k.strip() not in all_params and k != "self"]
-            if invalid and self._session._logger:
-                self._session._logger.warning(
-                    f"createDeviceCellularUplinksBandsMasksUpdate: ignoring unrecognized kwargs: {invalid}"
-                )
-
-        return self._session.post(metadata, resource, payload)
+        return dispatch.call(
+            self._session, "createDeviceCellularUplinksBandsMasksUpdate", serial, slot, type, masked, **kwargs
+        )
 
     def getDeviceClients(self, serial: str, **kwargs):
         """
@@ -242,28 +107,7 @@ class AsyncDevices:
         - timespan (number): The timespan for which the information will be fetched. If specifying timespan, do not specify parameter t0. The value must be in seconds and be less than or equal to 31 days. The default is 1 day.
         """
 
-        kwargs.update(locals())
-
-        metadata = {
-            "tags": ["devices", "monitor", "clients"],
-            "operation": "getDeviceClients",
-        }
-        serial = urllib.parse.quote(str(serial), safe="")
-        resource = f"/devices/{serial}/clients"
-
-        query_params = [
-            "t0",
-            "timespan",
-        ]
-        params = {k.strip(): v for k, v in kwargs.items() if k.strip() in query_params}
-
-        if self._session._validate_kwargs:
-            all_params = query_params
-            invalid = [k for k in kwargs if k.strip() not in all_params and k != "self"]
-            if invalid and self._session._logger:
-                self._session._logger.warning(f"getDeviceClients: ignoring unrecognized kwargs: {invalid}")
-
-        return self._session.get(metadata, resource, params)
+        return dispatch.call(self._session, "getDeviceClients", serial, **kwargs)
 
     def createDeviceLiveToolsArpTable(self, serial: str, **kwargs):
         """
@@ -274,27 +118,7 @@ class AsyncDevices:
         - callback (object): Details for the callback. Please include either an httpServerId OR url and sharedSecret
         """
 
-        kwargs.update(locals())
-
-        metadata = {
-            "tags": ["devices", "liveTools", "arpTable"],
-            "operation": "createDeviceLiveToolsArpTable",
-        }
-        serial = urllib.parse.quote(str(serial), safe="")
-        resource = f"/devices/{serial}/liveTools/arpTable"
-
-        body_params = [
-            "callback",
-        ]
-        payload = {k.strip(): v for k, v in kwargs.items() if k.strip() in body_params}
-
-        if self._session._validate_kwargs:
-            all_params = [] + body_params
-            invalid = [k for k in kwargs if k.strip() not in all_params and k != "self"]
-            if invalid and self._session._logger:
-                self._session._logger.warning(f"createDeviceLiveToolsArpTable: ignoring unrecognized kwargs: {invalid}")
-
-        return self._session.post(metadata, resource, payload)
+        return dispatch.call(self._session, "createDeviceLiveToolsArpTable", serial, **kwargs)
 
     def getDeviceLiveToolsArpTable(self, serial: str, arpTableId: str):
         """
@@ -305,15 +129,7 @@ class AsyncDevices:
         - arpTableId (string): Arp table ID
         """
 
-        metadata = {
-            "tags": ["devices", "liveTools", "arpTable"],
-            "operation": "getDeviceLiveToolsArpTable",
-        }
-        serial = urllib.parse.quote(str(serial), safe="")
-        arpTableId = urllib.parse.quote(str(arpTableId), safe="")
-        resource = f"/devices/{serial}/liveTools/arpTable/{arpTableId}"
-
-        return self._session.get(metadata, resource)
+        return dispatch.call(self._session, "getDeviceLiveToolsArpTable", serial, arpTableId)
 
     def createDeviceLiveToolsCableTest(self, serial: str, ports: list, **kwargs):
         """
@@ -325,28 +141,7 @@ class AsyncDevices:
         - callback (object): Details for the callback. Please include either an httpServerId OR url and sharedSecret
         """
 
-        kwargs.update(locals())
-
-        metadata = {
-            "tags": ["devices", "liveTools", "cableTest"],
-            "operation": "createDeviceLiveToolsCableTest",
-        }
-        serial = urllib.parse.quote(str(serial), safe="")
-        resource = f"/devices/{serial}/liveTools/cableTest"
-
-        body_params = [
-            "ports",
-            "callback",
-        ]
-        payload = {k.strip(): v for k, v in kwargs.items() if k.strip() in body_params}
-
-        if self._session._validate_kwargs:
-            all_params = [] + body_params
-            invalid = [k for k in kwargs if k.strip() not in all_params and k != "self"]
-            if invalid and self._session._logger:
-                self._session._logger.warning(f"createDeviceLiveToolsCableTest: ignoring unrecognized kwargs: {invalid}")
-
-        return self._session.post(metadata, resource, payload)
+        return dispatch.call(self._session, "createDeviceLiveToolsCableTest", serial, ports, **kwargs)
 
     def getDeviceLiveToolsCableTest(self, serial: str, id: str):
         """
@@ -357,15 +152,7 @@ class AsyncDevices:
         - id (string): ID
         """
 
-        metadata = {
-            "tags": ["devices", "liveTools", "cableTest"],
-            "operation": "getDeviceLiveToolsCableTest",
-        }
-        serial = urllib.parse.quote(str(serial), safe="")
-        id = urllib.parse.quote(str(id), safe="")
-        resource = f"/devices/{serial}/liveTools/cableTest/{id}"
-
-        return self._session.get(metadata, resource)
+        return dispatch.call(self._session, "getDeviceLiveToolsCableTest", serial, id)
 
     def createDeviceLiveToolsLedsBlink(self, serial: str, duration: int, **kwargs):
         """
@@ -377,28 +164,7 @@ class AsyncDevices:
         - callback (object): Details for the callback. Please include either an httpServerId OR url and sharedSecret
         """
 
-        kwargs.update(locals())
-
-        metadata = {
-            "tags": ["devices", "liveTools", "leds", "blink"],
-            "operation": "createDeviceLiveToolsLedsBlink",
-        }
-        serial = urllib.parse.quote(str(serial), safe="")
-        resource = f"/devices/{serial}/liveTools/leds/blink"
-
-        body_params = [
-            "duration",
-            "callback",
-        ]
-        payload = {k.strip(): v for k, v in kwargs.items() if k.strip() in body_params}
-
-        if self._session._validate_kwargs:
-            all_params = [] + body_params
-            invalid = [k for k in kwargs if k.strip() not in all_params and k != "self"]
-            if invalid and self._session._logger:
-                self._session._logger.warning(f"createDeviceLiveToolsLedsBlink: ignoring unrecognized kwargs: {invalid}")
-
-        return self._session.post(metadata, resource, payload)
+        return dispatch.call(self._session, "createDeviceLiveToolsLedsBlink", serial, duration, **kwargs)
 
     def getDeviceLiveToolsLedsBlink(self, serial: str, ledsBlinkId: str):
         """
@@ -409,15 +175,7 @@ class AsyncDevices:
         - ledsBlinkId (string): Leds blink ID
         """
 
-        metadata = {
-            "tags": ["devices", "liveTools", "leds", "blink"],
-            "operation": "getDeviceLiveToolsLedsBlink",
-        }
-        serial = urllib.parse.quote(str(serial), safe="")
-        ledsBlinkId = urllib.parse.quote(str(ledsBlinkId), safe="")
-        resource = f"/devices/{serial}/liveTools/leds/blink/{ledsBlinkId}"
-
-        return self._session.get(metadata, resource)
+        return dispatch.call(self._session, "getDeviceLiveToolsLedsBlink", serial, ledsBlinkId)
 
     def createDeviceLiveToolsMacTable(self, serial: str, **kwargs):
         """
@@ -429,28 +187,7 @@ class AsyncDevices:
         - callback (object): Details for the callback. Please include either an httpServerId OR url and sharedSecret
         """
 
-        kwargs.update(locals())
-
-        metadata = {
-            "tags": ["devices", "liveTools", "macTable"],
-            "operation": "createDeviceLiveToolsMacTable",
-        }
-        serial = urllib.parse.quote(str(serial), safe="")
-        resource = f"/devices/{serial}/liveTools/macTable"
-
-        body_params = [
-            "mac",
-            "callback",
-        ]
-        payload = {k.strip(): v for k, v in kwargs.items() if k.strip() in body_params}
-
-        if self._session._validate_kwargs:
-            all_params = [] + body_params
-            invalid = [k for k in kwargs if k.strip() not in all_params and k != "self"]
-            if invalid and self._session._logger:
-                self._session._logger.warning(f"createDeviceLiveToolsMacTable: ignoring unrecognized kwargs: {invalid}")
-
-        return self._session.post(metadata, resource, payload)
+        return dispatch.call(self._session, "createDeviceLiveToolsMacTable", serial, **kwargs)
 
     def getDeviceLiveToolsMacTable(self, serial: str, macTableId: str):
         """
@@ -461,15 +198,7 @@ class AsyncDevices:
         - macTableId (string): Mac table ID
         """
 
-        metadata = {
-            "tags": ["devices", "liveTools", "macTable"],
-            "operation": "getDeviceLiveToolsMacTable",
-        }
-        serial = urllib.parse.quote(str(serial), safe="")
-        macTableId = urllib.parse.quote(str(macTableId), safe="")
-        resource = f"/devices/{serial}/liveTools/macTable/{macTableId}"
-
-        return self._session.get(metadata, resource)
+        return dispatch.call(self._session, "getDeviceLiveToolsMacTable", serial, macTableId)
 
     def createDeviceLiveToolsMulticastRouting(self, serial: str, **kwargs):
         """
@@ -480,29 +209,7 @@ class AsyncDevices:
         - callback (object): Details for the callback. Please include either an httpServerId OR url and sharedSecret
         """
 
-        kwargs.update(locals())
-
-        metadata = {
-            "tags": ["devices", "liveTools", "multicastRouting"],
-            "operation": "createDeviceLiveToolsMulticastRouting",
-        }
-        serial = urllib.parse.quote(str(serial), safe="")
-        resource = f"/devices/{serial}/liveTools/multicastRouting"
-
-        body_params = [
-            "callback",
-        ]
-        payload = {k.strip(): v for k, v in kwargs.items() if k.strip() in body_params}
-
-        if self._session._validate_kwargs:
-            all_params = [] + body_params
-            invalid = [k for k in kwargs if k.strip() not in all_params and k != "self"]
-            if invalid and self._session._logger:
-                self._session._logger.warning(
-                    f"createDeviceLiveToolsMulticastRouting: ignoring unrecognized kwargs: {invalid}"
-                )
-
-        return self._session.post(metadata, resource, payload)
+        return dispatch.call(self._session, "createDeviceLiveToolsMulticastRouting", serial, **kwargs)
 
     def getDeviceLiveToolsMulticastRouting(self, serial: str, multicastRoutingId: str):
         """
@@ -513,15 +220,7 @@ class AsyncDevices:
         - multicastRoutingId (string): Multicast routing ID
         """
 
-        metadata = {
-            "tags": ["devices", "liveTools", "multicastRouting"],
-            "operation": "getDeviceLiveToolsMulticastRouting",
-        }
-        serial = urllib.parse.quote(str(serial), safe="")
-        multicastRoutingId = urllib.parse.quote(str(multicastRoutingId), safe="")
-        resource = f"/devices/{serial}/liveTools/multicastRouting/{multicastRoutingId}"
-
-        return self._session.get(metadata, resource)
+        return dispatch.call(self._session, "getDeviceLiveToolsMulticastRouting", serial, multicastRoutingId)
 
     def createDeviceLiveToolsPing(self, serial: str, target: str, **kwargs):
         """
@@ -534,29 +233,7 @@ class AsyncDevices:
         - callback (object): Details for the callback. Please include either an httpServerId OR url and sharedSecret
         """
 
-        kwargs.update(locals())
-
-        metadata = {
-            "tags": ["devices", "liveTools", "ping"],
-            "operation": "createDeviceLiveToolsPing",
-        }
-        serial = urllib.parse.quote(str(serial), safe="")
-        resource = f"/devices/{serial}/liveTools/ping"
-
-        body_params = [
-            "target",
-            "count",
-            "callback",
-        ]
-        payload = {k.strip(): v for k, v in kwargs.items() if k.strip() in body_params}
-
-        if self._session._validate_kwargs:
-            all_params = [] + body_params
-            invalid = [k for k in kwargs if k.strip() not in all_params and k != "self"]
-            if invalid and self._session._logger:
-                self._session._logger.warning(f"createDeviceLiveToolsPing: ignoring unrecognized kwargs: {invalid}")
-
-        return self._session.post(metadata, resource, payload)
+        return dispatch.call(self._session, "createDeviceLiveToolsPing", serial, target, **kwargs)
 
     def getDeviceLiveToolsPing(self, serial: str, id: str):
         """
@@ -567,15 +244,7 @@ class AsyncDevices:
         - id (string): ID
         """
 
-        metadata = {
-            "tags": ["devices", "liveTools", "ping"],
-            "operation": "getDeviceLiveToolsPing",
-        }
-        serial = urllib.parse.quote(str(serial), safe="")
-        id = urllib.parse.quote(str(id), safe="")
-        resource = f"/devices/{serial}/liveTools/ping/{id}"
-
-        return self._session.get(metadata, resource)
+        return dispatch.call(self._session, "getDeviceLiveToolsPing", serial, id)
 
     def createDeviceLiveToolsPingDevice(self, serial: str, **kwargs):
         """
@@ -587,28 +256,7 @@ class AsyncDevices:
         - callback (object): Details for the callback. Please include either an httpServerId OR url and sharedSecret
         """
 
-        kwargs.update(locals())
-
-        metadata = {
-            "tags": ["devices", "liveTools", "pingDevice"],
-            "operation": "createDeviceLiveToolsPingDevice",
-        }
-        serial = urllib.parse.quote(str(serial), safe="")
-        resource = f"/devices/{serial}/liveTools/pingDevice"
-
-        body_params = [
-            "count",
-            "callback",
-        ]
-        payload = {k.strip(): v for k, v in kwargs.items() if k.strip() in body_params}
-
-        if self._session._validate_kwargs:
-            all_params = [] + body_params
-            invalid = [k for k in kwargs if k.strip() not in all_params and k != "self"]
-            if invalid and self._session._logger:
-                self._session._logger.warning(f"createDeviceLiveToolsPingDevice: ignoring unrecognized kwargs: {invalid}")
-
-        return self._session.post(metadata, resource, payload)
+        return dispatch.call(self._session, "createDeviceLiveToolsPingDevice", serial, **kwargs)
 
     def getDeviceLiveToolsPingDevice(self, serial: str, id: str):
         """
@@ -619,15 +267,7 @@ class AsyncDevices:
         - id (string): ID
         """
 
-        metadata = {
-            "tags": ["devices", "liveTools", "pingDevice"],
-            "operation": "getDeviceLiveToolsPingDevice",
-        }
-        serial = urllib.parse.quote(str(serial), safe="")
-        id = urllib.parse.quote(str(id), safe="")
-        resource = f"/devices/{serial}/liveTools/pingDevice/{id}"
-
-        return self._session.get(metadata, resource)
+        return dispatch.call(self._session, "getDeviceLiveToolsPingDevice", serial, id)
 
     def createDeviceLiveToolsPortsCycle(self, serial: str, ports: list, **kwargs):
         """
@@ -639,28 +279,7 @@ class AsyncDevices:
         - callback (object): Details for the callback. Please include either an httpServerId OR url and sharedSecret
         """
 
-        kwargs.update(locals())
-
-        metadata = {
-            "tags": ["devices", "liveTools", "ports", "cycle"],
-            "operation": "createDeviceLiveToolsPortsCycle",
-        }
-        serial = urllib.parse.quote(str(serial), safe="")
-        resource = f"/devices/{serial}/liveTools/ports/cycle"
-
-        body_params = [
-            "ports",
-            "callback",
-        ]
-        payload = {k.strip(): v for k, v in kwargs.items() if k.strip() in body_params}
-
-        if self._session._validate_kwargs:
-            all_params = [] + body_params
-            invalid = [k for k in kwargs if k.strip() not in all_params and k != "self"]
-            if invalid and self._session._logger:
-                self._session._logger.warning(f"createDeviceLiveToolsPortsCycle: ignoring unrecognized kwargs: {invalid}")
-
-        return self._session.post(metadata, resource, payload)
+        return dispatch.call(self._session, "createDeviceLiveToolsPortsCycle", serial, ports, **kwargs)
 
     def getDeviceLiveToolsPortsCycle(self, serial: str, id: str):
         """
@@ -671,15 +290,7 @@ class AsyncDevices:
         - id (string): ID
         """
 
-        metadata = {
-            "tags": ["devices", "liveTools", "ports", "cycle"],
-            "operation": "getDeviceLiveToolsPortsCycle",
-        }
-        serial = urllib.parse.quote(str(serial), safe="")
-        id = urllib.parse.quote(str(id), safe="")
-        resource = f"/devices/{serial}/liveTools/ports/cycle/{id}"
-
-        return self._session.get(metadata, resource)
+        return dispatch.call(self._session, "getDeviceLiveToolsPortsCycle", serial, id)
 
     def createDeviceLiveToolsPortsStatus(self, serial: str, **kwargs):
         """
@@ -690,27 +301,7 @@ class AsyncDevices:
         - callback (object): Details for the callback. Please include either an httpServerId OR url and sharedSecret
         """
 
-        kwargs.update(locals())
-
-        metadata = {
-            "tags": ["devices", "liveTools", "ports", "status"],
-            "operation": "createDeviceLiveToolsPortsStatus",
-        }
-        serial = urllib.parse.quote(str(serial), safe="")
-        resource = f"/devices/{serial}/liveTools/ports/status"
-
-        body_params = [
-            "callback",
-        ]
-        payload = {k.strip(): v for k, v in kwargs.items() if k.strip() in body_params}
-
-        if self._session._validate_kwargs:
-            all_params = [] + body_params
-            invalid = [k for k in kwargs if k.strip() not in all_params and k != "self"]
-            if invalid and self._session._logger:
-                self._session._logger.warning(f"createDeviceLiveToolsPortsStatus: ignoring unrecognized kwargs: {invalid}")
-
-        return self._session.post(metadata, resource, payload)
+        return dispatch.call(self._session, "createDeviceLiveToolsPortsStatus", serial, **kwargs)
 
     def getDeviceLiveToolsPortsStatus(self, serial: str, jobId: str):
         """
@@ -721,15 +312,7 @@ class AsyncDevices:
         - jobId (string): Job ID
         """
 
-        metadata = {
-            "tags": ["devices", "liveTools", "ports", "status"],
-            "operation": "getDeviceLiveToolsPortsStatus",
-        }
-        serial = urllib.parse.quote(str(serial), safe="")
-        jobId = urllib.parse.quote(str(jobId), safe="")
-        resource = f"/devices/{serial}/liveTools/ports/status/{jobId}"
-
-        return self._session.get(metadata, resource)
+        return dispatch.call(self._session, "getDeviceLiveToolsPortsStatus", serial, jobId)
 
     def createDeviceLiveToolsPowerUsage(self, serial: str, **kwargs):
         """
@@ -740,27 +323,7 @@ class AsyncDevices:
         - callback (object): Details for the callback. Please include either an httpServerId OR url and sharedSecret
         """
 
-        kwargs.update(locals())
-
-        metadata = {
-            "tags": ["devices", "liveTools", "power", "usage"],
-            "operation": "createDeviceLiveToolsPowerUsage",
-        }
-        serial = urllib.parse.quote(str(serial), safe="")
-        resource = f"/devices/{serial}/liveTools/power/usage"
-
-        body_params = [
-            "callback",
-        ]
-        payload = {k.strip(): v for k, v in kwargs.items() if k.strip() in body_params}
-
-        if self._session._validate_kwargs:
-            all_params = [] + body_params
-            invalid = [k for k in kwargs if k.strip() not in all_params and k != "self"]
-            if invalid and self._session._logger:
-                self._session._logger.warning(f"createDeviceLiveToolsPowerUsage: ignoring unrecognized kwargs: {invalid}")
-
-        return self._session.post(metadata, resource, payload)
+        return dispatch.call(self._session, "createDeviceLiveToolsPowerUsage", serial, **kwargs)
 
     def getDeviceLiveToolsPowerUsage(self, serial: str, jobId: str):
         """
@@ -771,15 +334,7 @@ class AsyncDevices:
         - jobId (string): Job ID
         """
 
-        metadata = {
-            "tags": ["devices", "liveTools", "power", "usage"],
-            "operation": "getDeviceLiveToolsPowerUsage",
-        }
-        serial = urllib.parse.quote(str(serial), safe="")
-        jobId = urllib.parse.quote(str(jobId), safe="")
-        resource = f"/devices/{serial}/liveTools/power/usage/{jobId}"
-
-        return self._session.get(metadata, resource)
+        return dispatch.call(self._session, "getDeviceLiveToolsPowerUsage", serial, jobId)
 
     def createDeviceLiveToolsRoutingTableLookup(self, serial: str, **kwargs):
         """
@@ -794,53 +349,7 @@ class AsyncDevices:
         - callback (object): Details for the callback. Please include either an httpServerId OR url and sharedSecret
         """
 
-        kwargs.update(locals())
-
-        if "type" in kwargs:
-            options = [
-                "BGP",
-                "EIGRP",
-                "HSRP",
-                "IGRP",
-                "ISIS",
-                "LISP",
-                "NAT",
-                "ND",
-                "NHRP",
-                "OMP",
-                "OSPF",
-                "RIP",
-                "default WAN",
-                "direct",
-                "static",
-            ]
-            assert kwargs["type"] in options, f'''"type" cannot be "{kwargs["type"]}", & must be set to one of: {options}'''
-
-        metadata = {
-            "tags": ["devices", "liveTools", "routingTable", "lookups"],
-            "operation": "createDeviceLiveToolsRoutingTableLookup",
-        }
-        serial = urllib.parse.quote(str(serial), safe="")
-        resource = f"/devices/{serial}/liveTools/routingTable/lookups"
-
-        body_params = [
-            "type",
-            "destination",
-            "nextHop",
-            "vpn",
-            "callback",
-        ]
-        payload = {k.strip(): v for k, v in kwargs.items() if k.strip() in body_params}
-
-        if self._session._validate_kwargs:
-            all_params = [] + body_params
-            invalid = [k for k in kwargs if k.strip() not in all_params and k != "self"]
-            if invalid and self._session._logger:
-                self._session._logger.warning(
-                    f"createDeviceLiveToolsRoutingTableLookup: ignoring unrecognized kwargs: {invalid}"
-                )
-
-        return self._session.post(metadata, resource, payload)
+        return dispatch.call(self._session, "createDeviceLiveToolsRoutingTableLookup", serial, **kwargs)
 
     def getDeviceLiveToolsRoutingTableLookup(self, serial: str, id: str):
         """
@@ -851,15 +360,7 @@ class AsyncDevices:
         - id (string): ID
         """
 
-        metadata = {
-            "tags": ["devices", "liveTools", "routingTable", "lookups"],
-            "operation": "getDeviceLiveToolsRoutingTableLookup",
-        }
-        serial = urllib.parse.quote(str(serial), safe="")
-        id = urllib.parse.quote(str(id), safe="")
-        resource = f"/devices/{serial}/liveTools/routingTable/lookups/{id}"
-
-        return self._session.get(metadata, resource)
+        return dispatch.call(self._session, "getDeviceLiveToolsRoutingTableLookup", serial, id)
 
     def createDeviceLiveToolsRoutingTableSummary(self, serial: str, **kwargs):
         """
@@ -870,29 +371,7 @@ class AsyncDevices:
         - callback (object): Details for the callback. Please include either an httpServerId OR url and sharedSecret
         """
 
-        kwargs.update(locals())
-
-        metadata = {
-            "tags": ["devices", "liveTools", "routingTable", "summaries"],
-            "operation": "createDeviceLiveToolsRoutingTableSummary",
-        }
-        serial = urllib.parse.quote(str(serial), safe="")
-        resource = f"/devices/{serial}/liveTools/routingTable/summaries"
-
-        body_params = [
-            "callback",
-        ]
-        payload = {k.strip(): v for k, v in kwargs.items() if k.strip() in body_params}
-
-        if self._session._validate_kwargs:
-            all_params = [] + body_params
-            invalid = [k for k in kwargs if k.strip() not in all_params and k != "self"]
-            if invalid and self._session._logger:
-                self._session._logger.warning(
-                    f"createDeviceLiveToolsRoutingTableSummary: ignoring unrecognized kwargs: {invalid}"
-                )
-
-        return self._session.post(metadata, resource, payload)
+        return dispatch.call(self._session, "createDeviceLiveToolsRoutingTableSummary", serial, **kwargs)
 
     def getDeviceLiveToolsRoutingTableSummary(self, serial: str, id: str):
         """
@@ -903,15 +382,7 @@ class AsyncDevices:
         - id (string): ID
         """
 
-        metadata = {
-            "tags": ["devices", "liveTools", "routingTable", "summaries"],
-            "operation": "getDeviceLiveToolsRoutingTableSummary",
-        }
-        serial = urllib.parse.quote(str(serial), safe="")
-        id = urllib.parse.quote(str(id), safe="")
-        resource = f"/devices/{serial}/liveTools/routingTable/summaries/{id}"
-
-        return self._session.get(metadata, resource)
+        return dispatch.call(self._session, "getDeviceLiveToolsRoutingTableSummary", serial, id)
 
     def createDeviceLiveToolsThroughputTest(self, serial: str, **kwargs):
         """
@@ -922,27 +393,7 @@ class AsyncDevices:
         - callback (object): Details for the callback. Please include either an httpServerId OR url and sharedSecret
         """
 
-        kwargs.update(locals())
-
-        metadata = {
-            "tags": ["devices", "liveTools", "throughputTest"],
-            "operation": "createDeviceLiveToolsThroughputTest",
-        }
-        serial = urllib.parse.quote(str(serial), safe="")
-        resource = f"/devices/{serial}/liveTools/throughputTest"
-
-        body_params = [
-            "callback",
-        ]
-        payload = {k.strip(): v for k, v in kwargs.items() if k.strip() in body_params}
-
-        if self._session._validate_kwargs:
-            all_params = [] + body_params
-            invalid = [k for k in kwargs if k.strip() not in all_params and k != "self"]
-            if invalid and self._session._logger:
-                self._session._logger.warning(f"createDeviceLiveToolsThroughputTest: ignoring unrecognized kwargs: {invalid}")
-
-        return self._session.post(metadata, resource, payload)
+        return dispatch.call(self._session, "createDeviceLiveToolsThroughputTest", serial, **kwargs)
 
     def getDeviceLiveToolsThroughputTest(self, serial: str, throughputTestId: str):
         """
@@ -953,15 +404,7 @@ class AsyncDevices:
         - throughputTestId (string): Throughput test ID
         """
 
-        metadata = {
-            "tags": ["devices", "liveTools", "throughputTest"],
-            "operation": "getDeviceLiveToolsThroughputTest",
-        }
-        serial = urllib.parse.quote(str(serial), safe="")
-        throughputTestId = urllib.parse.quote(str(throughputTestId), safe="")
-        resource = f"/devices/{serial}/liveTools/throughputTest/{throughputTestId}"
-
-        return self._session.get(metadata, resource)
+        return dispatch.call(self._session, "getDeviceLiveToolsThroughputTest", serial, throughputTestId)
 
     def createDeviceLiveToolsWakeOnLan(self, serial: str, vlanId: int, mac: str, **kwargs):
         """
@@ -974,29 +417,7 @@ class AsyncDevices:
         - callback (object): Details for the callback. Please include either an httpServerId OR url and sharedSecret
         """
 
-        kwargs.update(locals())
-
-        metadata = {
-            "tags": ["devices", "liveTools", "wakeOnLan"],
-            "operation": "createDeviceLiveToolsWakeOnLan",
-        }
-        serial = urllib.parse.quote(str(serial), safe="")
-        resource = f"/devices/{serial}/liveTools/wakeOnLan"
-
-        body_params = [
-            "vlanId",
-            "mac",
-            "callback",
-        ]
-        payload = {k.strip(): v for k, v in kwargs.items() if k.strip() in body_params}
-
-        if self._session._validate_kwargs:
-            all_params = [] + body_params
-            invalid = [k for k in kwargs if k.strip() not in all_params and k != "self"]
-            if invalid and self._session._logger:
-                self._session._logger.warning(f"createDeviceLiveToolsWakeOnLan: ignoring unrecognized kwargs: {invalid}")
-
-        return self._session.post(metadata, resource, payload)
+        return dispatch.call(self._session, "createDeviceLiveToolsWakeOnLan", serial, vlanId, mac, **kwargs)
 
     def getDeviceLiveToolsWakeOnLan(self, serial: str, wakeOnLanId: str):
         """
@@ -1007,15 +428,7 @@ class AsyncDevices:
         - wakeOnLanId (string): Wake on lan ID
         """
 
-        metadata = {
-            "tags": ["devices", "liveTools", "wakeOnLan"],
-            "operation": "getDeviceLiveToolsWakeOnLan",
-        }
-        serial = urllib.parse.quote(str(serial), safe="")
-        wakeOnLanId = urllib.parse.quote(str(wakeOnLanId), safe="")
-        resource = f"/devices/{serial}/liveTools/wakeOnLan/{wakeOnLanId}"
-
-        return self._session.get(metadata, resource)
+        return dispatch.call(self._session, "getDeviceLiveToolsWakeOnLan", serial, wakeOnLanId)
 
     def getDeviceLldpCdp(self, serial: str):
         """
@@ -1025,14 +438,7 @@ class AsyncDevices:
         - serial (string): Serial
         """
 
-        metadata = {
-            "tags": ["devices", "monitor", "lldpCdp"],
-            "operation": "getDeviceLldpCdp",
-        }
-        serial = urllib.parse.quote(str(serial), safe="")
-        resource = f"/devices/{serial}/lldpCdp"
-
-        return self._session.get(metadata, resource)
+        return dispatch.call(self._session, "getDeviceLldpCdp", serial)
 
     def getDeviceLossAndLatencyHistory(self, serial: str, ip: str, **kwargs):
         """
@@ -1048,38 +454,7 @@ class AsyncDevices:
         - uplink (string): The WAN uplink used to obtain the requested stats. Valid uplinks are wan1, wan2, wan3, cellular, wan4. The default is wan1.
         """
 
-        kwargs.update(locals())
-
-        if "uplink" in kwargs:
-            options = ["cellular", "wan1", "wan2", "wan3", "wan4"]
-            assert kwargs["uplink"] in options, (
-                f'''"uplink" cannot be "{kwargs["uplink"]}", & must be set to one of: {options}'''
-            )
-
-        metadata = {
-            "tags": ["devices", "monitor", "uplinks", "lossAndLatencyHistory"],
-            "operation": "getDeviceLossAndLatencyHistory",
-        }
-        serial = urllib.parse.quote(str(serial), safe="")
-        resource = f"/devices/{serial}/lossAndLatencyHistory"
-
-        query_params = [
-            "t0",
-            "t1",
-            "timespan",
-            "resolution",
-            "uplink",
-            "ip",
-        ]
-        params = {k.strip(): v for k, v in kwargs.items() if k.strip() in query_params}
-
-        if self._session._validate_kwargs:
-            all_params = query_params
-            invalid = [k for k in kwargs if k.strip() not in all_params and k != "self"]
-            if invalid and self._session._logger:
-                self._session._logger.warning(f"getDeviceLossAndLatencyHistory: ignoring unrecognized kwargs: {invalid}")
-
-        return self._session.get(metadata, resource, params)
+        return dispatch.call(self._session, "getDeviceLossAndLatencyHistory", serial, ip, **kwargs)
 
     def getDeviceManagementInterface(self, serial: str):
         """
@@ -1089,14 +464,7 @@ class AsyncDevices:
         - serial (string): Serial
         """
 
-        metadata = {
-            "tags": ["devices", "configure", "managementInterface"],
-            "operation": "getDeviceManagementInterface",
-        }
-        serial = urllib.parse.quote(str(serial), safe="")
-        resource = f"/devices/{serial}/managementInterface"
-
-        return self._session.get(metadata, resource)
+        return dispatch.call(self._session, "getDeviceManagementInterface", serial)
 
     def updateDeviceManagementInterface(self, serial: str, **kwargs):
         """
@@ -1108,28 +476,7 @@ class AsyncDevices:
         - wan2 (object): WAN 2 settings (only for MX devices)
         """
 
-        kwargs.update(locals())
-
-        metadata = {
-            "tags": ["devices", "configure", "managementInterface"],
-            "operation": "updateDeviceManagementInterface",
-        }
-        serial = urllib.parse.quote(str(serial), safe="")
-        resource = f"/devices/{serial}/managementInterface"
-
-        body_params = [
-            "wan1",
-            "wan2",
-        ]
-        payload = {k.strip(): v for k, v in kwargs.items() if k.strip() in body_params}
-
-        if self._session._validate_kwargs:
-            all_params = [] + body_params
-            invalid = [k for k in kwargs if k.strip() not in all_params and k != "self"]
-            if invalid and self._session._logger:
-                self._session._logger.warning(f"updateDeviceManagementInterface: ignoring unrecognized kwargs: {invalid}")
-
-        return self._session.put(metadata, resource, payload)
+        return dispatch.call(self._session, "updateDeviceManagementInterface", serial, **kwargs)
 
     def rebootDevice(self, serial: str):
         """
@@ -1139,11 +486,4 @@ class AsyncDevices:
         - serial (string): Serial
         """
 
-        metadata = {
-            "tags": ["devices", "liveTools"],
-            "operation": "rebootDevice",
-        }
-        serial = urllib.parse.quote(str(serial), safe="")
-        resource = f"/devices/{serial}/reboot"
-
-        return self._session.post(metadata, resource)
+        return dispatch.call(self._session, "rebootDevice", serial)
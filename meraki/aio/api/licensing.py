@@ -1,4 +1,4 @@
-import urllib
+from meraki import dispatch
 
 
 class AsyncLicensing:
@@ -14,36 +14,7 @@ class AsyncLicensing:
         - skus (array): Filter to entitlements with the specified SKUs
         """
 
-        kwargs.update(locals())
-
-        metadata = {
-            "tags": ["licensing", "configure", "subscription", "entitlements"],
-            "operation": "getAdministeredLicensingSubscriptionEntitlements",
-        }
-        resource = "/administered/licensing/subscription/entitlements"
-
-        query_params = [
-            "skus",
-        ]
-        params = {k.strip(): v for k, v in kwargs.items() if k.strip() in query_params}
-
-        array_params = [
-            "skus",
-        ]
-        for k, v in kwargs.items():
-            if k.strip() in array_params:
-                params[f"{k.strip()}[]"] = kwargs[f"{k}"]
-                params.pop(k.strip())
-
-        if self._session._validate_kwargs:
-            all_params = query_params + array_params
-            invalid = [k for k in kwargs if k.strip() not in all_params and k != "self"]
-            if invalid and self._session._logger:
-                self._session._logger.warning(
-                    f"getAdministeredLicensingSubscriptionEntitlements: ignoring unrecognized kwargs: {invalid}"
-                )
-
-        return self._session.get(metadata, resource, params)
+        return dispatch.call(self._session, "getAdministeredLicensingSubscriptionEntitlements", **kwargs)
 
     def getAdministeredLicensingSubscriptionSubscriptions(
         self, organizationIds: list, total_pages=1, direction="next", **kwargs
@@ -67,50 +38,14 @@ class AsyncLicensing:
         - endDate (object or string): Filter subscriptions by end date, ISO 8601 format. To filter with a range of dates, use 'endDate[<option>]=?' in the request. Accepted options include lt, gt, lte, gte. (object supports: gt, gte, lt, lte, neq)
         """
 
-        kwargs.update(locals())
-
-        metadata = {
-            "tags": ["licensing", "configure", "subscription", "subscriptions"],
-            "operation": "getAdministeredLicensingSubscriptionSubscriptions",
-        }
-        resource = "/administered/licensing/subscription/subscriptions"
-
-        query_params = [
-            "perPage",
-            "startingAfter",
-            "endingBefore",
-            "subscriptionIds",
-            "organizationIds",
-            "statuses",
-            "productTypes",
-            "skus",
-            "name",
-            "startDate",
-            "endDate",
-        ]
-        params = {k.strip(): v for k, v in kwargs.items() if k.strip() in query_params}
-
-        array_params = [
-            "subscriptionIds",
-            "organizationIds",
-            "statuses",
-            "productTypes",
-            "skus",
-        ]
-        for k, v in kwargs.items():
-            if k.strip() in array_params:
-                params[f"{k.strip()}[]"] = kwargs[f"{k}"]
-                params.pop(k.strip())
-
-        if self._session._validate_kwargs:
-            all_params = query_params + array_params
-            invalid = [k for k in kwargs if k.strip() not in all_params and k != "self"]
-            if invalid and self._session._logger:
-                self._session._logger.warning(
-                    f"getAdministeredLicensingSubscriptionSubscriptions: ignoring unrecognized kwargs: {invalid}"
-                )
-
-        return self._session.get_pages(metadata, resource, params, total_pages, direction)
+        return dispatch.call(
+            self._session,
+            "getAdministeredLicensingSubscriptionSubscriptions",
+            organizationIds,
+            total_pages=total_pages,
+            direction=direction,
+            **kwargs,
+        )
 
     def claimAdministeredLicensingSubscriptionSubscriptions(self, claimKey: str, organizationId: str, **kwargs):
         """
@@ -124,36 +59,9 @@ class AsyncLicensing:
         - description (string): Extra details or notes about the subscription
         """
 
-        kwargs.update(locals())
-
-        metadata = {
-            "tags": ["licensing", "configure", "subscription", "subscriptions"],
-            "operation": "claimAdministeredLicensingSubscriptionSubscriptions",
-        }
-        resource = "/administered/licensing/subscription/subscriptions/claim"
-
-        query_params = [
-            "validate",
-        ]
-        params = {k.strip(): v for k, v in kwargs.items() if k.strip() in query_params}
-
-        body_params = [
-            "claimKey",
-            "organizationId",
-            "name",
-            "description",
-        ]
-        payload = {k.strip(): v for k, v in kwargs.items() if k.strip() in body_params}
-
-        if self._session._validate_kwargs:
-            all_params = query_params + body_params
-            invalid = [k for k in kwargs if k.strip() not in all_params and k != "self"]
-            if invalid and self._session._logger:
-                self._session._logger.warning(
-                    f"claimAdministeredLicensingSubscriptionSubscriptions: ignoring unrecognized kwargs: {invalid}"
-                )
-
-        return self._session.post(metadata, resource, payload, params=params)
+        return dispatch.call(
+            self._session, "claimAdministeredLicensingSubscriptionSubscriptions", claimKey, organizationId, **kwargs
+        )
 
     def validateAdministeredLicensingSubscriptionSubscriptionsClaimKey(self, claimKey: str, **kwargs):
         """
@@ -163,28 +71,9 @@ class AsyncLicensing:
         - claimKey (string): The subscription's claim key
         """
 
-        kwargs = locals()
-
-        metadata = {
-            "tags": ["licensing", "configure", "subscription", "subscriptions", "claimKey"],
-            "operation": "validateAdministeredLicensingSubscriptionSubscriptionsClaimKey",
-        }
-        resource = "/administered/licensing/subscription/subscriptions/claimKey/validate"
-
-        body_params = [
-            "claimKey",
-        ]
-        payload = {k.strip(): v for k, v in kwargs.items() if k.strip() in body_params}
-
-        if self._session._validate_kwargs:
-            all_params = [] + body_params
-            invalid = [k for k in kwargs if k.strip() not in all_params and k != "self"]
-            if invalid and self._session._logger:
-                self._session._logger.warning(
-                    f"validateAdministeredLicensingSubscriptionSubscriptionsClaimKey: ignoring unrecognized kwargs: {invalid}"
-                )
-
-        return self._session.post(metadata, resource, payload)
+        return dispatch.call(
+            self._session, "validateAdministeredLicensingSubscriptionSubscriptionsClaimKey", claimKey, **kwargs
+        )
 
     def getAdministeredLicensingSubscriptionSubscriptionsComplianceStatuses(self, organizationIds: list, **kwargs):
         """
@@ -195,38 +84,9 @@ class AsyncLicensing:
         - subscriptionIds (array): Subscription ids
         """
 
-        kwargs.update(locals())
-
-        metadata = {
-            "tags": ["licensing", "configure", "subscription", "subscriptions", "compliance", "statuses"],
-            "operation": "getAdministeredLicensingSubscriptionSubscriptionsComplianceStatuses",
-        }
-        resource = "/administered/licensing/subscription/subscriptions/compliance/statuses"
-
-        query_params = [
-            "organizationIds",
-            "subscriptionIds",
-        ]
-        params = {k.strip(): v for k, v in kwargs.items() if k.strip() in query_params}
-
-        array_params = [
-            "organizationIds",
-            "subscriptionIds",
-        ]
-        for k, v in kwargs.items():
-            if k.strip() in array_params:
-                params[f"{k.strip()}[]"] = kwargs[f"{k}"]
-                params.pop(k.strip())
-
-        if self._session._validate_kwargs:
-            all_params = query_params + array_params
-            invalid = [k for k in kwargs if k.strip() not in all_params and k != "self"]
-            if invalid and self._session._logger:
-                self._session._logger.warning(
-                    f"getAdministeredLicensingSubscriptionSubscriptionsComplianceStatuses: ignoring unrecognized kwargs: {invalid}"
-                )
-
-        return self._session.get(metadata, resource, params)
+        return dispatch.call(
+            self._session, "getAdministeredLicensingSubscriptionSubscriptionsComplianceStatuses", organizationIds, **kwargs
+        )
 
     def bindAdministeredLicensingSubscriptionSubscription(self, subscriptionId: str, **kwargs):
         """
@@ -238,34 +98,7 @@ class AsyncLicensing:
         - networkIds (array): List of network ids to bind to the subscription
         """
 
-        kwargs.update(locals())
-
-        metadata = {
-            "tags": ["licensing", "configure", "subscription", "subscriptions"],
-            "operation": "bindAdministeredLicensingSubscriptionSubscription",
-        }
-        subscriptionId = urllib.parse.quote(str(subscriptionId), safe="")
-        resource = f"/administered/licensing/subscription/subscriptions/{subscriptionId}/bind"
-
-        query_params = [
-            "validate",
-        ]
-        params = {k.strip(): v for k, v in kwargs.items() if k.strip() in query_params}
-
-        body_params = [
-            "networkIds",
-        ]
-        payload = {k.strip(): v for k, v in kwargs.items() if k.strip() in body_params}
-
-        if self._session._validate_kwargs:
-            all_params = query_params + body_params
-            invalid = [k for k in kwargs if k.strip() not in all_params and k != "self"]
-            if invalid and self._session._logger:
-                self._session._logger.warning(
-                    f"bindAdministeredLicensingSubscriptionSubscription: ignoring unrecognized kwargs: {invalid}"
-                )
-
-        return self._session.post(metadata, resource, payload, params=params)
+        return dispatch.call(self._session, "bindAdministeredLicensingSubscriptionSubscription", subscriptionId, **kwargs)
 
     def getOrganizationLicensingCotermLicenses(self, organizationId: str, total_pages=1, direction="next", **kwargs):
         """
@@ -282,33 +115,14 @@ class AsyncLicensing:
         - expired (boolean): Filter for licenses that are expired
         """
 
-        kwargs.update(locals())
-
-        metadata = {
-            "tags": ["licensing", "configure", "coterm", "licenses"],
-            "operation": "getOrganizationLicensingCotermLicenses",
-        }
-        organizationId = urllib.parse.quote(str(organizationId), safe="")
-        resource = f"/organizations/{organizationId}/licensing/coterm/licenses"
-
-        query_params = [
-            "perPage",
-            "startingAfter",
-            "endingBefore",
-            "invalidated",
-            "expired",
-        ]
-        params = {k.strip(): v for k, v in kwargs.items() if k.strip() in query_params}
-
-        if self._session._validate_kwargs:
-            all_params = query_params
-            invalid = [k for k in kwargs if k.strip() not in all_params and k != "self"]
-            if invalid and self._session._logger:
-                self._session._logger.warning(
-                    f"getOrganizationLicensingCotermLicenses: ignoring unrecognized kwargs: {invalid}"
-                )
-
-        return self._session.get_pages(metadata, resource, params, total_pages, direction)
+        return dispatch.call(
+            self._session,
+            "getOrganizationLicensingCotermLicenses",
+            organizationId,
+            total_pages=total_pages,
+            direction=direction,
+            **kwargs,
+        )
 
     def moveOrganizationLicensingCotermLicenses(self, organizationId: str, destination: dict, licenses: list, **kwargs):
         """
@@ -320,27 +134,6 @@ class AsyncLicensing:
         - licenses (array): The list of licenses to move
         """
 
-        kwargs = locals()
-
-        metadata = {
-            "tags": ["licensing", "configure", "coterm", "licenses"],
-            "operation": "moveOrganizationLicensingCotermLicenses",
-        }
-        organizationId = urllib.parse.quote(str(organizationId), safe="")
-        resource = f"/organizations/{organizationId}/licensing/coterm/licenses/move"
-
-        body_params = [
-            "destination",
-            "licenses",
-        ]
-        payload = {k.strip(): v for k, v in kwargs.items() if k.strip() in body_params}
-
-        if self._session._validate_kwargs:
-            all_params = [] + body_params
-            invalid = [k for k in kwargs if k.strip() not in all_params and k != "self"]
-            if invalid and self._session._logger:
-                self._session._logger.warning(
-                    f"moveOrganizationLicensingCotermLicenses: ignoring unrecognized kwargs: {invalid}"
-                )
-
-        return self._session.post(metadata, resource, payload)
+        return dispatch.call(
+            self._session, "moveOrganizationLicensingCotermLicenses", organizationId, destination, licenses, **kwargs
+        )
@@ -1,4 +1,4 @@
-import urllib
+from meraki import dispatch
 
 
 class AsyncNetworks:
@@ -14,14 +14,7 @@ class AsyncNetworks:
         - networkId (string): Network ID
         """
 
-        metadata = {
-            "tags": ["networks", "configure"],
-            "operation": "getNetwork",
-        }
-        networkId = urllib.parse.quote(str(networkId), safe="")
-        resource = f"/networks/{networkId}"
-
-        return self._session.get(metadata, resource)
+        return dispatch.call(self._session, "getNetwork", networkId)
 
     def updateNetwork(self, networkId: str, **kwargs):
         """
@@ -36,31 +29,7 @@ class AsyncNetworks:
         - notes (string): Add any notes or additional information about this network here.
         """
 
-        kwargs.update(locals())
-
-        metadata = {
-            "tags": ["networks", "configure"],
-            "operation": "updateNetwork",
-        }
-        networkId = urllib.parse.quote(str(networkId), safe="")
-        resource = f"/networks/{networkId}"
-
-        body_params = [
-            "name",
-            "timeZone",
-            "tags",
-            "enrollmentString",
-            "notes",
-        ]
-        payload = {k.strip(): v for k, v in kwargs.items() if k.strip() in body_params}
-
-        if self._session._validate_kwargs:
-            all_params = [] + body_params
-            invalid = [k for k in kwargs if k.strip() not in all_params and k != "self"]
-            if invalid and self._session._logger:
-                self._session._logger.warning(f"updateNetwork: ignoring unrecognized kwargs: {invalid}")
-
-        return self._session.put(metadata, resource, payload)
+        return dispatch.call(self._session, "updateNetwork", networkId, **kwargs)
 
     def deleteNetwork(self, networkId: str):
         """
@@ -70,14 +39,7 @@ class AsyncNetworks:
         - networkId (string): Network ID
         """
 
-        metadata = {
-            "tags": ["networks", "configure"],
-            "operation": "deleteNetwork",
-        }
-        networkId = urllib.parse.quote(str(networkId), safe="")
-        resource = f"/networks/{networkId}"
-
-        return self._session.delete(metadata, resource)
+        return dispatch.call(self._session, "deleteNetwork", networkId)
 
     def getNetworkAlertsHistory(self, networkId: str, total_pages=1, direction="next", **kwargs):
         """
@@ -92,29 +54,9 @@ class AsyncNetworks:
         - endingBefore (string): A token used by the server to indicate the end of the page. Often this is a timestamp or an ID but it is not limited to those. This parameter should not be defined by client applications. The link for the first, last, prev, or next page in the HTTP Link header should define it.
         """
 
-        kwargs.update(locals())
-
-        metadata = {
-            "tags": ["networks", "monitor", "alerts", "history"],
-            "operation": "getNetworkAlertsHistory",
-        }
-        networkId = urllib.parse.quote(str(networkId), safe="")
-        resource = f"/networks/{networkId}/alerts/history"
-
-        query_params = [
-            "perPage",
-            "startingAfter",
-            "endingBefore",
-        ]
-        params = {k.strip(): v for k, v in kwargs.items() if k.strip() in query_params}
-
-        if self._session._validate_kwargs:
-            all_params = query_params
-            invalid = [k for k in kwargs if k.strip() not in all_params and k != "self"]
-            if invalid and self._session._logger:
-                self._session._logger.warning(f"getNetworkAlertsHistory: ignoring unrecognized kwargs: {invalid}")
-
-        return self._session.get_pages(metadata, resource, params, total_pages, direction)
+        return dispatch.call(
+            self._session, "getNetworkAlertsHistory", networkId, total_pages=total_pages, direction=direction, **kwargs
+        )
 
     def getNetworkAlertsSettings(self, networkId: str):
         """
@@ -124,14 +66,7 @@ class AsyncNetworks:
         - networkId (string): Network ID
         """
 
-        metadata = {
-            "tags": ["networks", "configure", "alerts", "settings"],
-            "operation": "getNetworkAlertsSettings",
-        }
-        networkId = urllib.parse.quote(str(networkId), safe="")
-        resource = f"/networks/{networkId}/alerts/settings"
-
-        return self._session.get(metadata, resource)
+        return dispatch.call(self._session, "getNetworkAlertsSettings", networkId)
 
     def updateNetworkAlertsSettings(self, networkId: str, **kwargs):
         """
@@ -144,29 +79,7 @@ class AsyncNetworks:
         - muting (object): Mute alerts under certain conditions
         """
 
-        kwargs.update(locals())
-
-        metadata = {
-            "tags": ["networks", "configure", "alerts", "settings"],
-            "operation": "updateNetworkAlertsSettings",
-        }
-        networkId = urllib.parse.quote(str(networkId), safe="")
-        resource = f"/networks/{networkId}/alerts/settings"
-
-        body_params = [
-            "defaultDestinations",
-            "alerts",
-            "muting",
-        ]
-        payload = {k.strip(): v for k, v in kwargs.items() if k.strip() in body_params}
-
-        if self._session._validate_kwargs:
-            all_params = [] + body_params
-            invalid = [k for k in kwargs if k.strip() not in all_params and k != "self"]
-            if invalid and self._session._logger:
-                self._session._logger.warning(f"updateNetworkAlertsSettings: ignoring unrecognized kwargs: {invalid}")
-
-        return self._session.put(metadata, resource, payload)
+        return dispatch.call(self._session, "updateNetworkAlertsSettings", networkId, **kwargs)
 
     def bindNetwork(self, networkId: str, configTemplateId: str, **kwargs):
         """
@@ -178,28 +91,7 @@ class AsyncNetworks:
         - autoBind (boolean): Optional boolean indicating whether the network's switches should automatically bind to profiles of the same model. Defaults to false if left unspecified. This option only affects switch networks and switch templates. Auto-bind is not valid unless the switch template has at least one profile and has at most one profile per switch model.
         """
 
-        kwargs.update(locals())
-
-        metadata = {
-            "tags": ["networks", "configure"],
-            "operation": "bindNetwork",
-        }
-        networkId = urllib.parse.quote(str(networkId), safe="")
-        resource = f"/networks/{networkId}/bind"
-
-        body_params = [
-            "configTemplateId",
-            "autoBind",
-        ]
-        payload = {k.strip(): v for k, v in kwargs.items() if k.strip() in body_params}
-
-        if self._session._validate_kwargs:
-            all_params = [] + body_params
-            invalid = [k for k in kwargs if k.strip() not in all_params and k != "self"]
-            if invalid and self._session._logger:
-                self._session._logger.warning(f"bindNetwork: ignoring unrecognized kwargs: {invalid}")
-
-        return self._session.post(metadata, resource, payload)
+        return dispatch.call(self._session, "bindNetwork", networkId, configTemplateId, **kwargs)
 
     def getNetworkBluetoothClients(self, networkId: str, total_pages=1, direction="next", **kwargs):
         """
@@ -217,32 +109,9 @@ class AsyncNetworks:
         - includeConnectivityHistory (boolean): Include the connectivity history for this client
         """
 
-        kwargs.update(locals())
-
-        metadata = {
-            "tags": ["networks", "monitor", "bluetoothClients"],
-            "operation": "getNetworkBluetoothClients",
-        }
-        networkId = urllib.parse.quote(str(networkId), safe="")
-        resource = f"/networks/{networkId}/bluetoothClients"
-
-        query_params = [
-            "t0",
-            "timespan",
-            "perPage",
-            "startingAfter",
-            "endingBefore",
-            "includeConnectivityHistory",
-        ]
-        params = {k.strip(): v for k, v in kwargs.items() if k.strip() in query_params}
-
-        if self._session._validate_kwargs:
-            all_params = query_params
-            invalid = [k for k in kwargs if k.strip() not in all_params and k != "self"]
-            if invalid and self._session._logger:
-                self._session._logger.warning(f"getNetworkBluetoothClients: ignoring unrecognized kwargs: {invalid}")
-
-        return self._session.get_pages(metadata, resource, params, total_pages, direction)
+        return dispatch.call(
+            self._session, "getNetworkBluetoothClients", networkId, total_pages=total_pages, direction=direction, **kwargs
+        )
 
     def getNetworkBluetoothClient(self, networkId: str, bluetoothClientId: str, **kwargs):
         """
@@ -255,29 +124,7 @@ class AsyncNetworks:
         - connectivityHistoryTimespan (integer): The timespan, in seconds, for the connectivityHistory data. By default 1 day, 86400, will be used.
         """
 
-        kwargs.update(locals())
-
-        metadata = {
-            "tags": ["networks", "monitor", "bluetoothClients"],
-            "operation": "getNetworkBluetoothClient",
-        }
-        networkId = urllib.parse.quote(str(networkId), safe="")
-        bluetoothClientId = urllib.parse.quote(str(bluetoothClientId), safe="")
-        resource = f"/networks/{networkId}/bluetoothClients/{bluetoothClientId}"
-
-        query_params = [
-            "includeConnectivityHistory",
-            "connectivityHistoryTimespan",
-        ]
-        params = {k.strip(): v for k, v in kwargs.items() if k.strip() in query_params}
-
-        if self._session._validate_kwargs:
-            all_params = query_params
-            invalid = [k for k in kwargs if k.strip() not in all_params and k != "self"]
-            if invalid and self._session._logger:
-                self._session._logger.warning(f"getNetworkBluetoothClient: ignoring unrecognized kwargs: {invalid}")
-
-        return self._session.get(metadata, resource, params)
+        return dispatch.call(self._session, "getNetworkBluetoothClient", networkId, bluetoothClientId, **kwargs)
 
     def getNetworkClients(self, networkId: str, total_pages=1, direction="next", **kwargs):
         """
@@ -305,51 +152,9 @@ class AsyncNetworks:
         - recentDeviceConnections (array): Filters clients based on recent connection type. Can be one of 'Wired' or 'Wireless'.
         """
 
-        kwargs.update(locals())
-
-        metadata = {
-            "tags": ["networks", "monitor", "clients"],
-            "operation": "getNetworkClients",
-        }
-        networkId = urllib.parse.quote(str(networkId), safe="")
-        resource = f"/networks/{networkId}/clients"
-
-        query_params = [
-            "t0",
-            "timespan",
-            "perPage",
-            "startingAfter",
-            "endingBefore",
-            "statuses",
-            "ip",
-            "ip6",
-            "ip6Local",
-            "mac",
-            "os",
-            "pskGroup",
-            "description",
-            "vlan",
-            "namedVlan",
-            "recentDeviceConnections",
-        ]
-        params = {k.strip(): v for k, v in kwargs.items() if k.strip() in query_params}
-
-        array_params = [
-            "statuses",
-            "recentDeviceConnections",
-        ]
-        for k, v in kwargs.items():
-            if k.strip() in array_params:
-                params[f"{k.strip()}[]"] = kwargs[f"{k}"]
-                params.pop(k.strip())
-
-        if self._session._validate_kwargs:
-            all_params = query_params + array_params
-            invalid = [k for k in kwargs if k.strip() not in all_params and k != "self"]
-            if invalid and self._session._logger:
-                self._session._logger.warning(f"getNetworkClients: ignoring unrecognized kwargs: {invalid}")
-
-        return self._session.get_pages(metadata, resource, params, total_pages, direction)
+        return dispatch.call(
+            self._session, "getNetworkClients", networkId, total_pages=total_pages, direction=direction, **kwargs
+        )
 
     def getNetworkClientsApplicationUsage(self, networkId: str, clients: str, total_pages=1, direction="next", **kwargs):
         """
@@ -369,40 +174,15 @@ class AsyncNetworks:
         - timespan (number): The timespan for which the information will be fetched. If specifying timespan, do not specify parameters t0 and t1. The value must be in seconds and be less than or equal to 31 days. The default is 1 day.
         """
 
-        kwargs.update(locals())
-
-        if "ssidNumber" in kwargs:
-            options = [0, 1, 2, 3, 4, 5, 6, 7, 8, 9, 10, 11, 12, 13, 14]
-            assert kwargs["ssidNumber"] in options, (
-                f'''"ssidNumber" cannot be "{kwargs["ssidNumber"]}", & must be set to one of: {options}'''
-            )
-
-        metadata = {
-            "tags": ["networks", "monitor", "clients", "applicationUsage"],
-            "operation": "getNetworkClientsApplicationUsage",
-        }
-        networkId = urllib.parse.quote(str(networkId), safe="")
-        resource = f"/networks/{networkId}/clients/applicationUsage"
-
-        query_params = [
-            "clients",
-            "ssidNumber",
-            "perPage",
-            "startingAfter",
-            "endingBefore",
-            "t0",
-            "t1",
-            "timespan",
-        ]
-        params = {k.strip(): v for k, v in kwargs.items() if k.strip() in query_params}
-
-        if self._session._validate_kwargs:
-            all_params = query_params
-            invalid = [k for k in kwargs if k.strip() not in all_params and k != "self"]
-            if invalid and self._session._logger:
-                self._session._logger.warning(f"getNetworkClientsApplicationUsage: ignoring unrecognized kwargs: {invalid}")
-
-        return self._session.get_pages(metadata, resource, params, total_pages, direction)
+        return dispatch.call(
+            self._session,
+            "getNetworkClientsApplicationUsage",
+            networkId,
+            clients,
+            total_pages=total_pages,
+            direction=direction,
+            **kwargs,
+        )
 
     def getNetworkClientsBandwidthUsageHistory(self, networkId: str, total_pages=1, direction="next", **kwargs):
         """
@@ -420,34 +200,14 @@ class AsyncNetworks:
         - endingBefore (string): A token used by the server to indicate the end of the page. Often this is a timestamp or an ID but it is not limited to those. This parameter should not be defined by client applications. The link for the first, last, prev, or next page in the HTTP Link header should define it.
         """
 
-        kwargs.update(locals())
-
-        metadata = {
-            "tags": ["networks", "monitor", "clients", "bandwidthUsageHistory"],
-            "operation": "getNetworkClientsBandwidthUsageHistory",
-        }
-        networkId = urllib.parse.quote(str(networkId), safe="")
-        resource = f"/networks/{networkId}/clients/bandwidthUsageHistory"
-
-        query_params = [
-            "t0",
-            "t1",
-            "timespan",
-            "perPage",
-            "startingAfter",
-            "endingBefore",
-        ]
-        params = {k.strip(): v for k, v in kwargs.items() if k.strip() in query_params}
-
-        if self._session._validate_kwargs:
-            all_params = query_params
-            invalid = [k for k in kwargs if k.strip() not in all_params and k != "self"]
-            if invalid and self._session._logger:
-                self._session._logger.warning(
-                    f"getNetworkClientsBandwidthUsageHistory: ignoring unrecognized kwargs: {invalid}"
-                )
-
-        return self._session.get_pages(metadata, resource, params, total_pages, direction)
+        return dispatch.call(
+            self._session,
+            "getNetworkClientsBandwidthUsageHistory",
+            networkId,
+            total_pages=total_pages,
+            direction=direction,
+            **kwargs,
+        )
 
     def getNetworkClientsOverview(self, networkId: str, **kwargs):
         """
@@ -461,30 +221,7 @@ class AsyncNetworks:
         - resolution (integer): The time resolution in seconds for returned data. The valid resolutions are: 7200, 86400, 604800, 2629746. The default is 604800.
         """
 
-        kwargs.update(locals())
-
-        metadata = {
-            "tags": ["networks", "monitor", "clients", "overview"],
-            "operation": "getNetworkClientsOverview",
-        }
-        networkId = urllib.parse.quote(str(networkId), safe="")
-        resource = f"/networks/{networkId}/clients/overview"
-
-        query_params = [
-            "t0",
-            "t1",
-            "timespan",
-            "resolution",
-        ]
-        params = {k.strip(): v for k, v in kwargs.items() if k.strip() in query_params}
-
-        if self._session._validate_kwargs:
-            all_params = query_params
-            invalid = [k for k in kwargs if k.strip() not in all_params and k != "self"]
-            if invalid and self._session._logger:
-                self._session._logger.warning(f"getNetworkClientsOverview: ignoring unrecognized kwargs: {invalid}")
-
-        return self._session.get(metadata, resource, params)
+        return dispatch.call(self._session, "getNetworkClientsOverview", networkId, **kwargs)
 
     def provisionNetworkClients(self, networkId: str, clients: list, devicePolicy: str, **kwargs):
         """
@@ -499,37 +236,7 @@ class AsyncNetworks:
         - policiesBySsid (object): An object, describing the policy-connection associations for each active SSID within the network. Keys should be the number of enabled SSIDs, mapping to an object describing the client's policy
         """
 
-        kwargs.update(locals())
-
-        if "devicePolicy" in kwargs:
-            options = ["Allowed", "Blocked", "Group policy", "Normal", "Per connection"]
-            assert kwargs["devicePolicy"] in options, (
-                f'''"devicePolicy" cannot be "{kwargs["devicePolicy"]}", & must be set to one of: {options}'''
-            )
-
-        metadata = {
-            "tags": ["networks", "configure", "clients"],
-            "operation": "provisionNetworkClients",
-        }
-        networkId = urllib.parse.quote(str(networkId), safe="")
-        resource = f"/networks/{networkId}/clients/provision"
-
-        body_params = [
-            "clients",
-            "devicePolicy",
-            "groupPolicyId",
-            "policiesBySecurityAppliance",
-            "policiesBySsid",
-        ]
-        payload = {k.strip(): v for k, v in kwargs.items() if k.strip() in body_params}
-
-        if self._session._validate_kwargs:
-            all_params = [] + body_params
-            invalid = [k for k in kwargs if k.strip() not in all_params and k != "self"]
-            if invalid and self._session._logger:
-                self._session._logger.warning(f"provisionNetworkClients: ignoring unrecognized kwargs: {invalid}")
-
-        return self._session.post(metadata, resource, payload)
+        return dispatch.call(self._session, "provisionNetworkClients", networkId, clients, devicePolicy, **kwargs)
 
     def getNetworkClientsUsageHistories(self, networkId: str, clients: str, total_pages=1, direction="next", **kwargs):
         """
@@ -549,40 +256,15 @@ class AsyncNetworks:
         - timespan (number): The timespan for which the information will be fetched. If specifying timespan, do not specify parameters t0 and t1. The value must be in seconds and be less than or equal to 31 days. The default is 1 day.
         """
 
-        kwargs.update(locals())
-
-        if "ssidNumber" in kwargs:
-            options = [0, 1, 2, 3, 4, 5, 6, 7, 8, 9, 10, 11, 12, 13, 14]
-            assert kwargs["ssidNumber"] in options, (
-                f'''"ssidNumber" cannot be "{kwargs["ssidNumber"]}", & must be set to one of: {options}'''
-            )
-
-        metadata = {
-            "tags": ["networks", "monitor", "clients", "usageHistories"],
-            "operation": "getNetworkClientsUsageHistories",
-        }
-        networkId = urllib.parse.quote(str(networkId), safe="")
-        resource = f"/networks/{networkId}/clients/usageHistories"
-
-        query_params = [
-            "clients",
-            "ssidNumber",
-            "perPage",
-            "startingAfter",
-            "endingBefore",
-            "t0",
-            "t1",
-            "timespan",
-        ]
-        params = {k.strip(): v for k, v in kwargs.items() if k.strip() in query_params}
-
-        if self._session._validate_kwargs:
-            all_params = query_params
-            invalid = [k for k in kwargs if k.strip() not in all_params and k != "self"]
-            if invalid and self._session._logger:
-                self._session._logger.warning(f"getNetworkClientsUsageHistories: ignoring unrecognized kwargs: {invalid}")
-
-        return self._session.get_pages(metadata, resource, params, total_pages, direction)
+        return dispatch.call(
+            self._session,
+            "getNetworkClientsUsageHistories",
+            networkId,
+            clients,
+            total_pages=total_pages,
+            direction=direction,
+            **kwargs,
+        )
 
     def getNetworkClient(self, networkId: str, clientId: str):
         """
@@ -593,15 +275,7 @@ class AsyncNetworks:
         - clientId (string): Client ID
         """
 
-        metadata = {
-            "tags": ["networks", "monitor", "clients"],
-            "operation": "getNetworkClient",
-        }
-        networkId = urllib.parse.quote(str(networkId), safe="")
-        clientId = urllib.parse.quote(str(clientId), safe="")
-        resource = f"/networks/{networkId}/clients/{clientId}"
-
-        return self._session.get(metadata, resource)
+        return dispatch.call(self._session, "getNetworkClient", networkId, clientId)
 
     def getNetworkClientPolicy(self, networkId: str, clientId: str):
         """
@@ -612,15 +286,7 @@ class AsyncNetworks:
         - clientId (string): Client ID
         """
 
-        metadata = {
-            "tags": ["networks", "configure", "clients", "policy"],
-            "operation": "getNetworkClientPolicy",
-        }
-        networkId = urllib.parse.quote(str(networkId), safe="")
-        clientId = urllib.parse.quote(str(clientId), safe="")
-        resource = f"/networks/{networkId}/clients/{clientId}/policy"
-
-        return self._session.get(metadata, resource)
+        return dispatch.call(self._session, "getNetworkClientPolicy", networkId, clientId)
 
     def updateNetworkClientPolicy(self, networkId: str, clientId: str, devicePolicy: str, **kwargs):
         """
@@ -633,29 +299,7 @@ class AsyncNetworks:
         - groupPolicyId (string): [Optional] If 'devicePolicy' is set to 'Group policy' this param is used to specify the group policy ID.
         """
 
-        kwargs.update(locals())
-
-        metadata = {
-            "tags": ["networks", "configure", "clients", "policy"],
-            "operation": "updateNetworkClientPolicy",
-        }
-        networkId = urllib.parse.quote(str(networkId), safe="")
-        clientId = urllib.parse.quote(str(clientId), safe="")
-        resource = f"/networks/{networkId}/clients/{clientId}/policy"
-
-        body_params = [
-            "devicePolicy",
-            "groupPolicyId",
-        ]
-        payload = {k.strip(): v for k, v in kwargs.items() if k.strip() in body_params}
-
-        if self._session._validate_kwargs:
-            all_params = [] + body_params
-            invalid = [k for k in kwargs if k.strip() not in all_params and k != "self"]
-            if invalid and self._session._logger:
-                self._session._logger.warning(f"updateNetworkClientPolicy: ignoring unrecognized kwargs: {invalid}")
-
-        return self._session.put(metadata, resource, payload)
+        return dispatch.call(self._session, "updateNetworkClientPolicy", networkId, clientId, devicePolicy, **kwargs)
 
     def getNetworkClientSplashAuthorizationStatus(self, networkId: str, clientId: str):
         """
@@ -666,15 +310,7 @@ class AsyncNetworks:
         - clientId (string): Client ID
         """
 
-        metadata = {
-            "tags": ["networks", "configure", "clients", "splashAuthorizationStatus"],
-            "operation": "getNetworkClientSplashAuthorizationStatus",
-        }
-        networkId = urllib.parse.quote(str(networkId), safe="")
-        clientId = urllib.parse.quote(str(clientId), safe="")
-        resource = f"/networks/{networkId}/clients/{clientId}/splashAuthorizationStatus"
-
-        return self._session.get(metadata, resource)
+        return dispatch.call(self._session, "getNetworkClientSplashAuthorizationStatus", networkId, clientId)
 
     def updateNetworkClientSplashAuthorizationStatus(self, networkId: str, clientId: str, ssids: dict, **kwargs):
         """
@@ -686,30 +322,9 @@ class AsyncNetworks:
         - ssids (object): The target SSIDs. Each SSID must be enabled and must have Click-through splash enabled. For each SSID where isAuthorized is true, the expiration time will automatically be set according to the SSID's splash frequency. Not all networks support configuring all SSIDs
         """
 
-        kwargs = locals()
-
-        metadata = {
-            "tags": ["networks", "configure", "clients", "splashAuthorizationStatus"],
-            "operation": "updateNetworkClientSplashAuthorizationStatus",
-        }
-        networkId = urllib.parse.quote(str(networkId), safe="")
-        clientId = urllib.parse.quote(str(clientId), safe="")
-        resource = f"/networks/{networkId}/clients/{clientId}/splashAuthorizationStatus"
-
-        body_params = [
-            "ssids",
-        ]
-        payload = {k.strip(): v for k, v in kwargs.items() if k.strip() in body_params}
-
-        if self._session._validate_kwargs:
-            all_params = [] + body_params
-            invalid = [k for k in kwargs if k.strip() not in all_params and k != "self"]
-            if invalid and self._session._logger:
-                self._session._logger.warning(
-                    f"updateNetworkClientSplashAuthorizationStatus: ignoring unrecognized kwargs: {invalid}"
-                )
-
-        return self._session.put(metadata, resource, payload)
+        return dispatch.call(
+            self._session, "updateNetworkClientSplashAuthorizationStatus", networkId, clientId, ssids, **kwargs
+        )
 
     def getNetworkClientTrafficHistory(self, networkId: str, clientId: str, total_pages=1, direction="next", **kwargs):
         """
@@ -725,30 +340,15 @@ class AsyncNetworks:
         - endingBefore (string): A token used by the server to indicate the end of the page. Often this is a timestamp or an ID but it is not limited to those. This parameter should not be defined by client applications. The link for the first, last, prev, or next page in the HTTP Link header should define it.
         """
 
-        kwargs.update(locals())
-
-        metadata = {
-            "tags": ["networks", "monitor", "clients", "trafficHistory"],
-            "operation": "getNetworkClientTrafficHistory",
-        }
-        networkId = urllib.parse.quote(str(networkId), safe="")
-        clientId = urllib.parse.quote(str(clientId), safe="")
-        resource = f"/networks/{networkId}/clients/{clientId}/trafficHistory"
-
-        query_params = [
-            "perPage",
-            "startingAfter",
-            "endingBefore",
-        ]
-        params = {k.strip(): v for k, v in kwargs.items() if k.strip() in query_params}
-
-        if self._session._validate_kwargs:
-            all_params = query_params
-            invalid = [k for k in kwargs if k.strip() not in all_params and k != "self"]
-            if invalid and self._session._logger:
-                self._session._logger.warning(f"getNetworkClientTrafficHistory: ignoring unrecognized kwargs: {invalid}")
-
-        return self._session.get_pages(metadata, resource, params, total_pages, direction)
+        return dispatch.call(
+            self._session,
+            "getNetworkClientTrafficHistory",
+            networkId,
+            clientId,
+            total_pages=total_pages,
+            direction=direction,
+            **kwargs,
+        )
 
     def getNetworkClientUsageHistory(self, networkId: str, clientId: str):
         """
@@ -759,15 +359,7 @@ class AsyncNetworks:
         - clientId (string): Client ID
         """
 
-        metadata = {
-            "tags": ["networks", "monitor", "clients", "usageHistory"],
-            "operation": "getNetworkClientUsageHistory",
-        }
-        networkId = urllib.parse.quote(str(networkId), safe="")
-        clientId = urllib.parse.quote(str(clientId), safe="")
-        resource = f"/networks/{networkId}/clients/{clientId}/usageHistory"
-
-        return self._session.get(metadata, resource)
+        return dispatch.call(self._session, "getNetworkClientUsageHistory", networkId, clientId)
 
     def getNetworkDevices(self, networkId: str):
         """
@@ -777,14 +369,7 @@ class AsyncNetworks:
         - networkId (string): Network ID
         """
 
-        metadata = {
-            "tags": ["networks", "configure", "devices"],
-            "operation": "getNetworkDevices",
-        }
-        networkId = urllib.parse.quote(str(networkId), safe="")
-        resource = f"/networks/{networkId}/devices"
-
-        return self._session.get(metadata, resource)
+        return dispatch.call(self._session, "getNetworkDevices", networkId)
 
     def claimNetworkDevices(self, networkId: str, serials: list, **kwargs):
         """
@@ -797,33 +382,7 @@ class AsyncNetworks:
         - detailsByDevice (array): Optional details for claimed devices (currently only used for Catalyst devices)
         """
 
-        kwargs.update(locals())
-
-        metadata = {
-            "tags": ["networks", "configure", "devices"],
-            "operation": "claimNetworkDevices",
-        }
-        networkId = urllib.parse.quote(str(networkId), safe="")
-        resource = f"/networks/{networkId}/devices/claim"
-
-        query_params = [
-            "addAtomically",
-        ]
-        params = {k.strip(): v for k, v in kwargs.items() if k.strip() in query_params}
-
-        body_params = [
-            "serials",
-            "detailsByDevice",
-        ]
-        payload = {k.strip(): v for k, v in kwargs.items() if k.strip() in body_params}
-
-        if self._session._validate_kwargs:
-            all_params = query_params + body_params
-            invalid = [k for k in kwargs if k.strip() not in all_params and k != "self"]
-            if invalid and self._session._logger:
-                self._session._logger.warning(f"claimNetworkDevices: ignoring unrecognized kwargs: {invalid}")
-
-        return self._session.post(metadata, resource, payload, params=params)
+        return dispatch.call(self._session, "claimNetworkDevices", networkId, serials, **kwargs)
 
     def vmxNetworkDevicesClaim(self, networkId: str, size: str, **kwargs):
         """
@@ -834,31 +393,7 @@ class AsyncNetworks:
         - size (string): The size of the vMX you claim. It can be one of: small, medium, large, xlarge, 100
         """
 
-        kwargs = locals()
-
-        if "size" in kwargs:
-            options = ["100", "large", "medium", "small", "xlarge"]
-            assert kwargs["size"] in options, f'''"size" cannot be "{kwargs["size"]}", & must be set to one of: {options}'''
-
-        metadata = {
-            "tags": ["networks", "configure", "devices", "claim"],
-            "operation": "vmxNetworkDevicesClaim",
-        }
-        networkId = urllib.parse.quote(str(networkId), safe="")
-        resource = f"/networks/{networkId}/devices/claim/vmx"
-
-        body_params = [
-            "size",
-        ]
-        payload = {k.strip(): v for k, v in kwargs.items() if k.strip() in body_params}
-
-        if self._session._validate_kwargs:
-            all_params = [] + body_params
-            invalid = [k for k in kwargs if k.strip() not in all_params and k != "self"]
-            if invalid and self._session._logger:
-                self._session._logger.warning(f"vmxNetworkDevicesClaim: ignoring unrecognized kwargs: {invalid}")
-
-        return self._session.post(metadata, resource, payload)
+        return dispatch.call(self._session, "vmxNetworkDevicesClaim", networkId, size, **kwargs)
 
     def removeNetworkDevices(self, networkId: str, serial: str, **kwargs):
         """
@@ -869,27 +404,7 @@ class AsyncNetworks:
         - serial (string): The serial of a device
         """
 
-        kwargs = locals()
-
-        metadata = {
-            "tags": ["networks", "configure", "devices"],
-            "operation": "removeNetworkDevices",
-        }
-        networkId = urllib.parse.quote(str(networkId), safe="")
-        resource = f"/networks/{networkId}/devices/remove"
-
-        body_params = [
-            "serial",
-        ]
-        payload = {k.strip(): v for k, v in kwargs.items() if k.strip() in body_params}
-
-        if self._session._validate_kwargs:
-            all_params = [] + body_params
-            invalid = [k for k in kwargs if k.strip() not in all_params and k != "self"]
-            if invalid and self._session._logger:
-                self._session._logger.warning(f"removeNetworkDevices: ignoring unrecognized kwargs: {invalid}")
-
-        return self._session.post(metadata, resource, payload)
+        return dispatch.call(self._session, "removeNetworkDevices", networkId, serial, **kwargs)
 
     def updateNetworkDevicesSyslogServers(self, networkId: str, servers: list, **kwargs):
         """
@@ -900,27 +415,7 @@ class AsyncNetworks:
         - servers (array): A list of the syslog servers for this network; suggested maximum array size is 10
         """
 
-        kwargs = locals()
-
-        metadata = {
-            "tags": ["networks", "configure", "devices", "syslog", "servers"],
-            "operation": "updateNetworkDevicesSyslogServers",
-        }
-        networkId = urllib.parse.quote(str(networkId), safe="")
-        resource = f"/networks/{networkId}/devices/syslog/servers"
-
-        body_params = [
-            "servers",
-        ]
-        payload = {k.strip(): v for k, v in kwargs.items() if k.strip() in body_params}
-
-        if self._session._validate_kwargs:
-            all_params = [] + body_params
-            invalid = [k for k in kwargs if k.strip() not in all_params and k != "self"]
-            if invalid and self._session._logger:
-                self._session._logger.warning(f"updateNetworkDevicesSyslogServers: ignoring unrecognized kwargs: {invalid}")
-
-        return self._session.put(metadata, resource, payload)
+        return dispatch.call(self._session, "updateNetworkDevicesSyslogServers", networkId, servers, **kwargs)
 
     def getNetworkEvents(self, networkId: str, total_pages=1, direction="prev", event_log_end_time=None, **kwargs):
         """
@@ -950,68 +445,15 @@ class AsyncNetworks:
         - endingBefore (string): A token used by the server to indicate the end of the page. Often this is a timestamp or an ID but it is not limited to those. This parameter should not be defined by client applications. The link for the first, last, prev, or next page in the HTTP Link header should define it.
         """
 
-        kwargs.update(locals())
-
-        if "productType" in kwargs:
-            options = [
-                "appliance",
-                "camera",
-                "campusGateway",
-                "cellularGateway",
-                "secureConnect",
-                "switch",
-                "systemsManager",
-                "wireless",
-                "wirelessController",
-            ]
-            assert kwargs["productType"] in options, (
-                f'''"productType" cannot be "{kwargs["productType"]}", & must be set to one of: {options}'''
-            )
-
-        metadata = {
-            "tags": ["networks", "monitor", "events"],
-            "operation": "getNetworkEvents",
-        }
-        networkId = urllib.parse.quote(str(networkId), safe="")
-        resource = f"/networks/{networkId}/events"
-
-        query_params = [
-            "productType",
-            "includedEventTypes",
-            "excludedEventTypes",
-            "deviceMac",
-            "deviceSerial",
-            "deviceName",
-            "clientIp",
-            "clientMac",
-            "clientName",
-            "smDeviceMac",
-            "smDeviceName",
-            "eventDetails",
-            "eventSeverity",
-            "isCatalyst",
-            "perPage",
-            "startingAfter",
-            "endingBefore",
-        ]
-        params = {k.strip(): v for k, v in kwargs.items() if k.strip() in query_params}
-
-        array_params = [
-            "includedEventTypes",
-            "excludedEventTypes",
-        ]
-        for k, v in kwargs.items():
-            if k.strip() in array_params:
-                params[f"{k.strip()}[]"] = kwargs[f"{k}"]
-                params.pop(k.strip())
-
-        if self._session._validate_kwargs:
-            all_params = query_params + array_params
-            invalid = [k for k in kwargs if k.strip() not in all_params and k != "self"]
-            if invalid and self._session._logger:
-                self._session._logger.warning(f"getNetworkEvents: ignoring unrecognized kwargs: {invalid}")
-
-        return self._session.get_pages(metadata, resource, params, total_pages, direction, event_log_end_time)
+        return dispatch.call(
+            self._session,
+            "getNetworkEvents",
+            networkId,
+            total_pages=total_pages,
+            direction=direction,
+            event_log_end_time=event_log_end_time,
+            **kwargs,
+        )
 
     def getNetworkEventsEventTypes(self, networkId: str):
         """
@@ -1021,14 +463,7 @@ class AsyncNetworks:
         - networkId (string): Network ID
         """
 
-        metadata = {
-            "tags": ["networks", "monitor", "events", "eventTypes"],
-            "operation": "getNetworkEventsEventTypes",
-        }
-        networkId = urllib.parse.quote(str(networkId), safe="")
-        resource = f"/networks/{networkId}/events/eventTypes"
-
-        return self._session.get(metadata, resource)
+        return dispatch.call(self._session, "getNetworkEventsEventTypes", networkId)
 
     def getNetworkFirmwareUpgrades(self, networkId: str):
         """
@@ -1038,14 +473,7 @@ class AsyncNetworks:
         - networkId (string): Network ID
         """
 
-        metadata = {
-            "tags": ["networks", "configure", "firmwareUpgrades"],
-            "operation": "getNetworkFirmwareUpgrades",
-        }
-        networkId = urllib.parse.quote(str(networkId), safe="")
-        resource = f"/networks/{networkId}/firmwareUpgrades"
-
-        return self._session.get(metadata, resource)
+        return dispatch.call(self._session, "getNetworkFirmwareUpgrades", networkId)
 
     def updateNetworkFirmwareUpgrades(self, networkId: str, **kwargs):
         """
@@ -1058,29 +486,7 @@ class AsyncNetworks:
         - products (object): Contains information about the network to update
         """
 
-        kwargs.update(locals())
-
-        metadata = {
-            "tags": ["networks", "configure", "firmwareUpgrades"],
-            "operation": "updateNetworkFirmwareUpgrades",
-        }
-        networkId = urllib.parse.quote(str(networkId), safe="")
-        resource = f"/networks/{networkId}/firmwareUpgrades"
-
-        body_params = [
-            "upgradeWindow",
-            "timezone",
-            "products",
-        ]
-        payload = {k.strip(): v for k, v in kwargs.items() if k.strip() in body_params}
-
-        if self._session._validate_kwargs:
-            all_params = [] + body_params
-            invalid = [k for k in kwargs if k.strip() not in all_params and k != "self"]
-            if invalid and self._session._logger:
-                self._session._logger.warning(f"updateNetworkFirmwareUpgrades: ignoring unrecognized kwargs: {invalid}")
-
-        return self._session.put(metadata, resource, payload)
+        return dispatch.call(self._session, "updateNetworkFirmwareUpgrades", networkId, **kwargs)
 
     def createNetworkFirmwareUpgradesRollback(self, networkId: str, reasons: list, **kwargs):
         """
@@ -1095,48 +501,7 @@ class AsyncNetworks:
         - predownload (object): Predownload settings for the firmware upgrade
         """
 
-        kwargs.update(locals())
-
-        if "product" in kwargs:
-            options = [
-                "appliance",
-                "camera",
-                "cellularGateway",
-                "secureConnect",
-                "switch",
-                "switchCatalyst",
-                "wireless",
-                "wirelessController",
-            ]
-            assert kwargs["product"] in options, (
-                f'''"product" cannot be "{kwargs["product"]}", & must be set to one of: {options}'''
-            )
-
-        metadata = {
-            "tags": ["networks", "configure", "firmwareUpgrades", "rollbacks"],
-            "operation": "createNetworkFirmwareUpgradesRollback",
-        }
-        networkId = urllib.parse.quote(str(networkId), safe="")
-        resource = f"/networks/{networkId}/firmwareUpgrades/rollbacks"
-
-        body_params = [
-            "product",
-            "time",
-            "reasons",
-            "toVersion",
-            "predownload",
-        ]
-        payload = {k.strip(): v for k, v in kwargs.items() if k.strip() in body_params}
-
-        if self._session._validate_kwargs:
-            all_params = [] + body_params
-            invalid = [k for k in kwargs if k.strip() not in all_params and k != "self"]
-            if invalid and self._session._logger:
-                self._session._logger.warning(
-                    f"createNetworkFirmwareUpgradesRollback: ignoring unrecognized kwargs: {invalid}"
-                )
-
-        return self._session.post(metadata, resource, payload)
+        return dispatch.call(self._session, "createNetworkFirmwareUpgradesRollback", networkId, reasons, **kwargs)
 
     def getNetworkFirmwareUpgradesStagedEvents(self, networkId: str):
         """
@@ -1146,14 +511,7 @@ class AsyncNetworks:
         - networkId (string): Network ID
         """
 
-        metadata = {
-            "tags": ["networks", "configure", "firmwareUpgrades", "staged", "events"],
-            "operation": "getNetworkFirmwareUpgradesStagedEvents",
-        }
-        networkId = urllib.parse.quote(str(networkId), safe="")
-        resource = f"/networks/{networkId}/firmwareUpgrades/staged/events"
-
-        return self._session.get(metadata, resource)
+        return dispatch.call(self._session, "getNetworkFirmwareUpgradesStagedEvents", networkId)
 
     def createNetworkFirmwareUpgradesStagedEvent(self, networkId: str, stages: list, **kwargs):
         """
@@ -1165,30 +523,7 @@ class AsyncNetworks:
         - products (object): Contains firmware upgrade version information
         """
 
-        kwargs.update(locals())
-
-        metadata = {
-            "tags": ["networks", "configure", "firmwareUpgrades", "staged", "events"],
-            "operation": "createNetworkFirmwareUpgradesStagedEvent",
-        }
-        networkId = urllib.parse.quote(str(networkId), safe="")
-        resource = f"/networks/{networkId}/firmwareUpgrades/staged/events"
-
-        body_params = [
-            "products",
-            "stages",
-        ]
-        payload = {k.strip(): v for k, v in kwargs.items() if k.strip() in body_params}
-
-        if self._session._validate_kwargs:
-            all_params = [] + body_params
-            invalid = [k for k in kwargs if k.strip() not in all_params and k != "self"]
-            if invalid and self._session._logger:
-                self._session._logger.warning(
-                    f"createNetworkFirmwareUpgradesStagedEvent: ignoring unrecognized kwargs: {invalid}"
-                )
-
-        return self._session.post(metadata, resource, payload)
+        return dispatch.call(self._session, "createNetworkFirmwareUpgradesStagedEvent", networkId, stages, **kwargs)
 
     def updateNetworkFirmwareUpgradesStagedEvents(self, networkId: str, stages: list, **kwargs):
         """
@@ -1199,29 +534,7 @@ class AsyncNetworks:
         - stages (array): All firmware upgrade stages in the network with their start time.
         """
 
-        kwargs = locals()
-
-        metadata = {
-            "tags": ["networks", "configure", "firmwareUpgrades", "staged", "events"],
-            "operation": "updateNetworkFirmwareUpgradesStagedEvents",
-        }
-        networkId = urllib.parse.quote(str(networkId), safe="")
-        resource = f"/networks/{networkId}/firmwareUpgrades/staged/events"
-
-        body_params = [
-            "stages",
-        ]
-        payload = {k.strip(): v for k, v in kwargs.items() if k.strip() in body_params}
-
-        if self._session._validate_kwargs:
-            all_params = [] + body_params
-            invalid = [k for k in kwargs if k.strip() not in all_params and k != "self"]
-            if invalid and self._session._logger:
-                self._session._logger.warning(
-                    f"updateNetworkFirmwareUpgradesStagedEvents: ignoring unrecognized kwargs: {invalid}"
-                )
-
-        return self._session.put(metadata, resource, payload)
+        return dispatch.call(self._session, "updateNetworkFirmwareUpgradesStagedEvents", networkId, stages, **kwargs)
 
     def deferNetworkFirmwareUpgradesStagedEvents(self, networkId: str):
         """
@@ -1231,14 +544,7 @@ class AsyncNetworks:
         - networkId (string): Network ID
         """
 
-        metadata = {
-            "tags": ["networks", "configure", "firmwareUpgrades", "staged", "events"],
-            "operation": "deferNetworkFirmwareUpgradesStagedEvents",
-        }
-        networkId = urllib.parse.quote(str(networkId), safe="")
-        resource = f"/networks/{networkId}/firmwareUpgrades/staged/events/defer"
-
-        return self._session.post(metadata, resource)
+        return dispatch.call(self._session, "deferNetworkFirmwareUpgradesStagedEvents", networkId)
 
     def rollbacksNetworkFirmwareUpgradesStagedEvents(self, networkId: str, stages: list, **kwargs):
         """
@@ -1250,30 +556,7 @@ class AsyncNetworks:
         - reasons (array): The reason for rolling back the staged upgrade
         """
 
-        kwargs.update(locals())
-
-        metadata = {
-            "tags": ["networks", "configure", "firmwareUpgrades", "staged", "events"],
-            "operation": "rollbacksNetworkFirmwareUpgradesStagedEvents",
-        }
-        networkId = urllib.parse.quote(str(networkId), safe="")
-        resource = f"/networks/{networkId}/firmwareUpgrades/staged/events/rollbacks"
-
-        body_params = [
-            "stages",
-            "reasons",
-        ]
-        payload = {k.strip(): v for k, v in kwargs.items() if k.strip() in body_params}
-
-        if self._session._validate_kwargs:
-            all_params = [] + body_params
-            invalid = [k for k in kwargs if k.strip() not in all_params and k != "self"]
-            if invalid and self._session._logger:
-                self._session._logger.warning(
-                    f"rollbacksNetworkFirmwareUpgradesStagedEvents: ignoring unrecognized kwargs: {invalid}"
-                )
-
-        return self._session.post(metadata, resource, payload)
+        return dispatch.call(self._session, "rollbacksNetworkFirmwareUpgradesStagedEvents", networkId, stages, **kwargs)
 
     def getNetworkFirmwareUpgradesStagedGroups(self, networkId: str):
         """
@@ -1283,14 +566,7 @@ class AsyncNetworks:
         - networkId (string): Network ID
         """
 
-        metadata = {
-            "tags": ["networks", "configure", "firmwareUpgrades", "staged", "groups"],
-            "operation": "getNetworkFirmwareUpgradesStagedGroups",
-        }
-        networkId = urllib.parse.quote(str(networkId), safe="")
-        resource = f"/networks/{networkId}/firmwareUpgrades/staged/groups"
-
-        return self._session.get(metadata, resource)
+        return dispatch.call(self._session, "getNetworkFirmwareUpgradesStagedGroups", networkId)
 
     def createNetworkFirmwareUpgradesStagedGroup(self, networkId: str, name: str, isDefault: bool, **kwargs):
         """
@@ -1304,32 +580,7 @@ class AsyncNetworks:
         - assignedDevices (object): The devices and Switch Stacks assigned to the Group
         """
 
-        kwargs.update(locals())
-
-        metadata = {
-            "tags": ["networks", "configure", "firmwareUpgrades", "staged", "groups"],
-            "operation": "createNetworkFirmwareUpgradesStagedGroup",
-        }
-        networkId = urllib.parse.quote(str(networkId), safe="")
-        resource = f"/networks/{networkId}/firmwareUpgrades/staged/groups"
-
-        body_params = [
-            "name",
-            "description",
-            "isDefault",
-            "assignedDevices",
-        ]
-        payload = {k.strip(): v for k, v in kwargs.items() if k.strip() in body_params}
-
-        if self._session._validate_kwargs:
-            all_params = [] + body_params
-            invalid = [k for k in kwargs if k.strip() not in all_params and k != "self"]
-            if invalid and self._session._logger:
-                self._session._logger.warning(
-                    f"createNetworkFirmwareUpgradesStagedGroup: ignoring unrecognized kwargs: {invalid}"
-                )
-
-        return self._session.post(metadata, resource, payload)
+        return dispatch.call(self._session, "createNetworkFirmwareUpgradesStagedGroup", networkId, name, isDefault, **kwargs)
 
     def getNetworkFirmwareUpgradesStagedGroup(self, networkId: str, groupId: str):
         """
@@ -1340,15 +591,7 @@ class AsyncNetworks:
         - groupId (string): Group ID
         """
 
-        metadata = {
-            "tags": ["networks", "configure", "firmwareUpgrades", "staged", "groups"],
-            "operation": "getNetworkFirmwareUpgradesStagedGroup",
-        }
-        networkId = urllib.parse.quote(str(networkId), safe="")
-        groupId = urllib.parse.quote(str(groupId), safe="")
-        resource = f"/networks/{networkId}/firmwareUpgrades/staged/groups/{groupId}"
-
-        return self._session.get(metadata, resource)
+        return dispatch.call(self._session, "getNetworkFirmwareUpgradesStagedGroup", networkId, groupId)
 
     def updateNetworkFirmwareUpgradesStagedGroup(self, networkId: str, groupId: str, name: str, isDefault: bool, **kwargs):
         """
@@ -1363,33 +606,9 @@ class AsyncNetworks:
         - assignedDevices (object): The devices and Switch Stacks assigned to the Group
         """
 
-        kwargs.update(locals())
-
-        metadata = {
-            "tags": ["networks", "configure", "firmwareUpgrades", "staged", "groups"],
-            "operation": "updateNetworkFirmwareUpgradesStagedGroup",
-        }
-        networkId = urllib.parse.quote(str(networkId), safe="")
-        groupId = urllib.parse.quote(str(groupId), safe="")
-        resource = f"/networks/{networkId}/firmwareUpgrades/staged/groups/{groupId}"
-
-        body_params = [
-            "name",
-            "description",
-            "isDefault",
-            "assignedDevices",
-        ]
-        payload = {k.strip(): v for k, v in kwargs.items() if k.strip() in body_params}
-
-        if self._session._validate_kwargs:
-            all_params = [] + body_params
-            invalid = [k for k in kwargs if k.strip() not in all_params and k != "self"]
-            if invalid and self._session._logger:
-                self._session._logger.warning(
-                    f"updateNetworkFirmwareUpgradesStagedGroup: ignoring unrecognized kwargs: {invalid}"
-                )
-
-        return self._session.put(metadata, resource, payload)
+        return dispatch.call(
+            self._session, "updateNetworkFirmwareUpgradesStagedGroup", networkId, groupId, name, isDefault, **kwargs
+        )
 
     def deleteNetworkFirmwareUpgradesStagedGroup(self, networkId: str, groupId: str):
         """
@@ -1400,15 +619,7 @@ class AsyncNetworks:
         - groupId (string): Group ID
         """
 
-        metadata = {
-            "tags": ["networks", "configure", "firmwareUpgrades", "staged", "groups"],
-            "operation": "deleteNetworkFirmwareUpgradesStagedGroup",
-        }
-        networkId = urllib.parse.quote(str(networkId), safe="")
-        groupId = urllib.parse.quote(str(groupId), safe="")
-        resource = f"/networks/{networkId}/firmwareUpgrades/staged/groups/{groupId}"
-
-        return self._session.delete(metadata, resource)
+        return dispatch.call(self._session, "deleteNetworkFirmwareUpgradesStagedGroup", networkId, groupId)
 
     def getNetworkFirmwareUpgradesStagedStages(self, networkId: str):
         """
@@ -1418,14 +629,7 @@ class AsyncNetworks:
         - networkId (string): Network ID
         """
 
-        metadata = {
-            "tags": ["networks", "configure", "firmwareUpgrades", "staged", "stages"],
-            "operation": "getNetworkFirmwareUpgradesStagedStages",
-        }
-        networkId = urllib.parse.quote(str(networkId), safe="")
-        resource = f"/networks/{networkId}/firmwareUpgrades/staged/stages"
-
-        return self._session.get(metadata, resource)
+        return dispatch.call(self._session, "getNetworkFirmwareUpgradesStagedStages", networkId)
 
     def updateNetworkFirmwareUpgradesStagedStages(self, networkId: str, **kwargs):
         """
@@ -1436,29 +640,7 @@ class AsyncNetworks:
         - _json (array): Array of Staged Upgrade Groups
         """
 
-        kwargs.update(locals())
-
-        metadata = {
-            "tags": ["networks", "configure", "firmwareUpgrades", "staged", "stages"],
-            "operation": "updateNetworkFirmwareUpgradesStagedStages",
-        }
-        networkId = urllib.parse.quote(str(networkId), safe="")
-        resource = f"/networks/{networkId}/firmwareUpgrades/staged/stages"
-
-        body_params = [
-            "_json",
-        ]
-        payload = {k.strip(): v for k, v in kwargs.items() if k.strip() in body_params}
-
-        if self._session._validate_kwargs:
-            all_params = [] + body_params
-            invalid = [k for k in kwargs if k.strip() not in all_params and k != "self"]
-            if invalid and self._session._logger:
-                self._session._logger.warning(
-                    f"updateNetworkFirmwareUpgradesStagedStages: ignoring unrecognized kwargs: {invalid}"
-                )
-
-        return self._session.put(metadata, resource, payload)
+        return dispatch.call(self._session, "updateNetworkFirmwareUpgradesStagedStages", networkId, **kwargs)
 
     def getNetworkFloorPlans(self, networkId: str):
         """
@@ -1468,14 +650,7 @@ class AsyncNetworks:
         - networkId (string): Network ID
         """
 
-        metadata = {
-            "tags": ["networks", "configure", "floorPlans"],
-            "operation": "getNetworkFloorPlans",
-        }
-        networkId = urllib.parse.quote(str(networkId), safe="")
-        resource = f"/networks/{networkId}/floorPlans"
-
-        return self._session.get(metadata, resource)
+        return dispatch.call(self._session, "getNetworkFloorPlans", networkId)
 
     def createNetworkFloorPlan(self, networkId: str, name: str, imageContents: str, **kwargs):
         """
@@ -1493,34 +668,7 @@ class AsyncNetworks:
         - floorNumber (number): The floor number of the floors within the building
         """
 
-        kwargs.update(locals())
-
-        metadata = {
-            "tags": ["networks", "configure", "floorPlans"],
-            "operation": "createNetworkFloorPlan",
-        }
-        networkId = urllib.parse.quote(str(networkId), safe="")
-        resource = f"/networks/{networkId}/floorPlans"
-
-        body_params = [
-            "name",
-            "center",
-            "bottomLeftCorner",
-            "bottomRightCorner",
-            "topLeftCorner",
-            "topRightCorner",
-            "floorNumber",
-            "imageContents",
-        ]
-        payload = {k.strip(): v for k, v in kwargs.items() if k.strip() in body_params}
-
-        if self._session._validate_kwargs:
-            all_params = [] + body_params
-            invalid = [k for k in kwargs if k.strip() not in all_params and k != "self"]
-            if invalid and self._session._logger:
-                self._session._logger.warning(f"createNetworkFloorPlan: ignoring unrecognized kwargs: {invalid}")
-
-        return self._session.post(metadata, resource, payload)
+        return dispatch.call(self._session, "createNetworkFloorPlan", networkId, name, imageContents, **kwargs)
 
     def batchNetworkFloorPlansAutoLocateJobs(self, networkId: str, jobs: list, **kwargs):
         """
@@ -1531,27 +679,7 @@ class AsyncNetworks:
         - jobs (array): The list of auto locate jobs to be scheduled. Up to 100 jobs can be provided in a request.
         """
 
-        kwargs = locals()
-
-        metadata = {
-            "tags": ["networks", "configure", "floorPlans", "autoLocate", "jobs"],
-            "operation": "batchNetworkFloorPlansAutoLocateJobs",
-        }
-        networkId = urllib.parse.quote(str(networkId), safe="")
-        resource = f"/networks/{networkId}/floorPlans/autoLocate/jobs/batch"
-
-        body_params = [
-            "jobs",
-        ]
-        payload = {k.strip(): v for k, v in kwargs.items() if k.strip() in body_params}
-
-        if self._session._validate_kwargs:
-            all_params = [] + body_params
-            invalid = [k for k in kwargs if k.strip() not in all_params and k != "self"]
-            if invalid and self._session._logger:
-                self._session._logger.warning(f"batchNetworkFloorPlansAutoLocateJobs: ignoring unrecognized kwargs: {invalid}")
-
-        return self._session.post(metadata, resource, payload)
+        return dispatch.call(self._session, "batchNetworkFloorPlansAutoLocateJobs", networkId, jobs, **kwargs)
 
     def cancelNetworkFloorPlansAutoLocateJob(self, networkId: str, jobId: str):
         """
@@ -1562,15 +690,7 @@ class AsyncNetworks:
         - jobId (string): Job ID
         """
 
-        metadata = {
-            "tags": ["networks", "configure", "floorPlans", "autoLocate", "jobs"],
-            "operation": "cancelNetworkFloorPlansAutoLocateJob",
-        }
-        networkId = urllib.parse.quote(str(networkId), safe="")
-        jobId = urllib.parse.quote(str(jobId), safe="")
-        resource = f"/networks/{networkId}/floorPlans/autoLocate/jobs/{jobId}/cancel"
-
-        return self._session.post(metadata, resource)
+        return dispatch.call(self._session, "cancelNetworkFloorPlansAutoLocateJob", networkId, jobId)
 
     def publishNetworkFloorPlansAutoLocateJob(self, networkId: str, jobId: str, **kwargs):
         """
@@ -1582,30 +702,7 @@ class AsyncNetworks:
         - devices (array): The list of devices to publish positions for
         """
 
-        kwargs.update(locals())
-
-        metadata = {
-            "tags": ["networks", "configure", "floorPlans", "autoLocate", "jobs"],
-            "operation": "publishNetworkFloorPlansAutoLocateJob",
-        }
-        networkId = urllib.parse.quote(str(networkId), safe="")
-        jobId = urllib.parse.quote(str(jobId), safe="")
-        resource = f"/networks/{networkId}/floorPlans/autoLocate/jobs/{jobId}/publish"
-
-        body_params = [
-            "devices",
-        ]
-        payload = {k.strip(): v for k, v in kwargs.items() if k.strip() in body_params}
-
-        if self._session._validate_kwargs:
-            all_params = [] + body_params
-            invalid = [k for k in kwargs if k.strip() not in all_params and k != "self"]
-            if invalid and self._session._logger:
-                self._session._logger.warning(
-                    f"publishNetworkFloorPlansAutoLocateJob: ignoring unrecognized kwargs: {invalid}"
-                )
-
-        return self._session.post(metadata, resource, payload)
+        return dispatch.call(self._session, "publishNetworkFloorPlansAutoLocateJob", networkId, jobId, **kwargs)
 
     def recalculateNetworkFloorPlansAutoLocateJob(self, networkId: str, jobId: str, **kwargs):
         """
@@ -1617,30 +714,7 @@ class AsyncNetworks:
         - devices (array): The list of devices to update anchor positions for
         """
 
-        kwargs.update(locals())
-
-        metadata = {
-            "tags": ["networks", "configure", "floorPlans", "autoLocate", "jobs"],
-            "operation": "recalculateNetworkFloorPlansAutoLocateJob",
-        }
-        networkId = urllib.parse.quote(str(networkId), safe="")
-        jobId = urllib.parse.quote(str(jobId), safe="")
-        resource = f"/networks/{networkId}/floorPlans/autoLocate/jobs/{jobId}/recalculate"
-
-        body_params = [
-            "devices",
-        ]
-        payload = {k.strip(): v for k, v in kwargs.items() if k.strip() in body_params}
-
-        if self._session._validate_kwargs:
-            all_params = [] + body_params
-            invalid = [k for k in kwargs if k.strip() not in all_params and k != "self"]
-            if invalid and self._session._logger:
-                self._session._logger.warning(
-                    f"recalculateNetworkFloorPlansAutoLocateJob: ignoring unrecognized kwargs: {invalid}"
-                )
-
-        return self._session.post(metadata, resource, payload)
+        return dispatch.call(self._session, "recalculateNetworkFloorPlansAutoLocateJob", networkId, jobId, **kwargs)
 
     def batchNetworkFloorPlansDevicesUpdate(self, networkId: str, assignments: list, **kwargs):
         """
@@ -1651,27 +725,7 @@ class AsyncNetworks:
         - assignments (array): List of floorplan assignments to update. Up to 100 floor plan assignments can be provided in a request.
         """
 
-        kwargs = locals()
-
-        metadata = {
-            "tags": ["networks", "configure", "floorPlans", "devices"],
-            "operation": "batchNetworkFloorPlansDevicesUpdate",
-        }
-        networkId = urllib.parse.quote(str(networkId), safe="")
-        resource = f"/networks/{networkId}/floorPlans/devices/batchUpdate"
-
-        body_params = [
-            "assignments",
-        ]
-        payload = {k.strip(): v for k, v in kwargs.items() if k.strip() in body_params}
-
-        if self._session._validate_kwargs:
-            all_params = [] + body_params
-            invalid = [k for k in kwargs if k.strip() not in all_params and k != "self"]
-            if invalid and self._session._logger:
-                self._session._logger.warning(f"batchNetworkFloorPlansDevicesUpdate: ignoring unrecognized kwargs: {invalid}")
-
-        return self._session.post(metadata, resource, payload)
+        return dispatch.call(self._session, "batchNetworkFloorPlansDevicesUpdate", networkId, assignments, **kwargs)
 
     def getNetworkFloorPlan(self, networkId: str, floorPlanId: str):
         """
@@ -1682,15 +736,7 @@ class AsyncNetworks:
         - floorPlanId (string): Floor plan ID
         """
 
-        metadata = {
-            "tags": ["networks", "configure", "floorPlans"],
-            "operation": "getNetworkFloorPlan",
-        }
-        networkId = urllib.parse.quote(str(networkId), safe="")
-        floorPlanId = urllib.parse.quote(str(floorPlanId), safe="")
-        resource = f"/networks/{networkId}/floorPlans/{floorPlanId}"
-
-        return self._session.get(metadata, resource)
+        return dispatch.call(self._session, "getNetworkFloorPlan", networkId, floorPlanId)
 
     def updateNetworkFloorPlan(self, networkId: str, floorPlanId: str, **kwargs):
         """
@@ -1709,35 +755,7 @@ class AsyncNetworks:
         - imageContents (string): The file contents (a base 64 encoded string) of your new image. Supported formats are PNG, GIF, and JPG. Note that all images are saved as PNG files, regardless of the format they are uploaded in. If you upload a new image, and you do NOT specify any new geolocation fields ('center, 'topLeftCorner', etc), the floor plan will be recentered with no rotation in order to maintain the aspect ratio of your new image.
         """
 
-        kwargs.update(locals())
-
-        metadata = {
-            "tags": ["networks", "configure", "floorPlans"],
-            "operation": "updateNetworkFloorPlan",
-        }
-        networkId = urllib.parse.quote(str(networkId), safe="")
-        floorPlanId = urllib.parse.quote(str(floorPlanId), safe="")
-        resource = f"/networks/{networkId}/floorPlans/{floorPlanId}"
-
-        body_params = [
-            "name",
-            "center",
-            "bottomLeftCorner",
-            "bottomRightCorner",
-            "topLeftCorner",
-            "topRightCorner",
-            "floorNumber",
-            "imageContents",
-        ]
-        payload = {k.strip(): v for k, v in kwargs.items() if k.strip() in body_params}
-
-        if self._session._validate_kwargs:
-            all_params = [] + body_params
-            invalid = [k for k in kwargs if k.strip() not in all_params and k != "self"]
-            if invalid and self._session._logger:
-                self._session._logger.warning(f"updateNetworkFloorPlan: ignoring unrecognized kwargs: {invalid}")
-
-        return self._session.put(metadata, resource, payload)
+        return dispatch.call(self._session, "updateNetworkFloorPlan", networkId, floorPlanId, **kwargs)
 
     def deleteNetworkFloorPlan(self, networkId: str, floorPlanId: str):
         """
@@ -1748,15 +766,7 @@ class AsyncNetworks:
         - floorPlanId (string): Floor plan ID
         """
 
-        metadata = {
-            "tags": ["networks", "configure", "floorPlans"],
-            "operation": "deleteNetworkFloorPlan",
-        }
-        networkId = urllib.parse.quote(str(networkId), safe="")
-        floorPlanId = urllib.parse.quote(str(floorPlanId), safe="")
-        resource = f"/networks/{networkId}/floorPlans/{floorPlanId}"
-
-        return self._session.delete(metadata, resource)
+        return dispatch.call(self._session, "deleteNetworkFloorPlan", networkId, floorPlanId)
 
     def getNetworkGroupPolicies(self, networkId: str):
         """
@@ -1766,14 +776,7 @@ class AsyncNetworks:
         - networkId (string): Network ID
         """
 
-        metadata = {
-            "tags": ["networks", "configure", "groupPolicies"],
-            "operation": "getNetworkGroupPolicies",
-        }
-        networkId = urllib.parse.quote(str(networkId), safe="")
-        resource = f"/networks/{networkId}/groupPolicies"
-
-        return self._session.get(metadata, resource)
+        return dispatch.call(self._session, "getNetworkGroupPolicies", networkId)
 
     def createNetworkGroupPolicy(self, networkId: str, name: str, **kwargs):
         """
@@ -1794,40 +797,7 @@ class AsyncNetworks:
         - bonjourForwarding (object): The Bonjour settings for your group policy. Only valid if your network has a wireless configuration.
         """
 
-        kwargs.update(locals())
-
-        if "splashAuthSettings" in kwargs:
-            options = ["bypass", "network default"]
-            assert kwargs["splashAuthSettings"] in options, (
-                f'''"splashAuthSettings" cannot be "{kwargs["splashAuthSettings"]}", & must be set to one of: {options}'''
-            )
-
-        metadata = {
-            "tags": ["networks", "configure", "groupPolicies"],
-            "operation": "createNetworkGroupPolicy",
-        }
-        networkId = urllib.parse.quote(str(networkId), safe="")
-        resource = f"/networks/{networkId}/groupPolicies"
-
-        body_params = [
-            "name",
-            "scheduling",
-            "bandwidth",
-            "firewallAndTrafficShaping",
-            "contentFiltering",
-            "splashAuthSettings",
-            "vlanTagging",
-            "bonjourForwarding",
-        ]
-        payload = {k.strip(): v for k, v in kwargs.items() if k.strip() in body_params}
-
-        if self._session._validate_kwargs:
-            all_params = [] + body_params
-            invalid = [k for k in kwargs if k.strip() not in all_params and k != "self"]
-            if invalid and self._session._logger:
-                self._session._logger.warning(f"createNetworkGroupPolicy: ignoring unrecognized kwargs: {invalid}")
-
-        return self._session.post(metadata, resource, payload)
+        return dispatch.call(self._session, "createNetworkGroupPolicy", networkId, name, **kwargs)
 
     def getNetworkGroupPolicy(self, networkId: str, groupPolicyId: str):
         """
@@ -1838,15 +808,7 @@ class AsyncNetworks:
         - groupPolicyId (string): Group policy ID
         """
 
-        metadata = {
-            "tags": ["networks", "configure", "groupPolicies"],
-            "operation": "getNetworkGroupPolicy",
-        }
-        networkId = urllib.parse.quote(str(networkId), safe="")
-        groupPolicyId = urllib.parse.quote(str(groupPolicyId), safe="")
-        resource = f"/networks/{networkId}/groupPolicies/{groupPolicyId}"
-
-        return self._session.get(metadata, resource)
+        return dispatch.call(self._session, "getNetworkGroupPolicy", networkId, groupPolicyId)
 
     def updateNetworkGroupPolicy(self, networkId: str, groupPolicyId: str, **kwargs):
         """
@@ -1868,41 +830,7 @@ class AsyncNetworks:
         - bonjourForwarding (object): The Bonjour settings for your group policy. Only valid if your network has a wireless configuration.
         """
 
-        kwargs.update(locals())
-
-        if "splashAuthSettings" in kwargs:
-            options = ["bypass", "network default"]
-            assert kwargs["splashAuthSettings"] in options, (
-                f'''"splashAuthSettings" cannot be "{kwargs["splashAuthSettings"]}", & must be set to one of: {options}'''
-            )
-
-        metadata = {
-            "tags": ["networks", "configure", "groupPolicies"],
-            "operation": "updateNetworkGroupPolicy",
-        }
-        networkId = urllib.parse.quote(str(networkId), safe="")
-        groupPolicyId = urllib.parse.quote(str(groupPolicyId), safe="")
-        resource = f"/networks/{networkId}/groupPolicies/{groupPolicyId}"
-
-        body_params = [
-            "name",
-            "scheduling",
-            "bandwidth",
-            "firewallAndTrafficShaping",
-            "contentFiltering",
-            "splashAuthSettings",
-            "vlanTagging",
-            "bonjourForwarding",
-        ]
-        payload = {k.strip(): v for k, v in kwargs.items() if k.strip() in body_params}
-
-        if self._session._validate_kwargs:
-            all_params = [] + body_params
-            invalid = [k for k in kwargs if k.strip() not in all_params and k != "self"]
-            if invalid and self._session._logger:
-                self._session._logger.warning(f"updateNetworkGroupPolicy: ignoring unrecognized kwargs: {invalid}")
-
-        return self._session.put(metadata, resource, payload)
+        return dispatch.call(self._session, "updateNetworkGroupPolicy", networkId, groupPolicyId, **kwargs)
 
     def deleteNetworkGroupPolicy(self, networkId: str, groupPolicyId: str, **kwargs):
         """
@@ -1914,28 +842,7 @@ class AsyncNetworks:
         - force (boolean): If true, the system deletes the GP even if there are active clients using the GP. After deletion, active clients that were assigned to that Group Policy will be left without any policy applied. Default is false.
         """
 
-        kwargs.update(locals())
-
-        metadata = {
-            "tags": ["networks", "configure", "groupPolicies"],
-            "operation": "deleteNetworkGroupPolicy",
-        }
-        networkId = urllib.parse.quote(str(networkId), safe="")
-        groupPolicyId = urllib.parse.quote(str(groupPolicyId), safe="")
-        resource = f"/networks/{networkId}/groupPolicies/{groupPolicyId}"
-
-        query_params = [
-            "force",
-        ]
-        params = {k.strip(): v for k, v in kwargs.items() if k.strip() in query_params}
-
-        if self._session._validate_kwargs:
-            all_params = query_params
-            invalid = [k for k in kwargs if k.strip() not in all_params and k != "self"]
-            if invalid and self._session._logger:
-                self._session._logger.warning(f"deleteNetworkGroupPolicy: ignoring unrecognized kwargs: {invalid}")
-
-        return self._session.delete(metadata, resource, params)
+        return dispatch.call(self._session, "deleteNetworkGroupPolicy", networkId, groupPolicyId, **kwargs)
 
     def getNetworkHealthAlerts(self, networkId: str):
         """
@@ -1945,14 +852,7 @@ class AsyncNetworks:
         - networkId (string): Network ID
         """
 
-        metadata = {
-            "tags": ["networks", "configure", "health", "alerts"],
-            "operation": "getNetworkHealthAlerts",
-        }
-        networkId = urllib.parse.quote(str(networkId), safe="")
-        resource = f"/networks/{networkId}/health/alerts"
-
-        return self._session.get(metadata, resource)
+        return dispatch.call(self._session, "getNetworkHealthAlerts", networkId)
 
     def getNetworkMerakiAuthUsers(self, networkId: str):
         """
@@ -1962,14 +862,7 @@ class AsyncNetworks:
         - networkId (string): Network ID
         """
 
-        metadata = {
-            "tags": ["networks", "configure", "merakiAuthUsers"],
-            "operation": "getNetworkMerakiAuthUsers",
-        }
-        networkId = urllib.parse.quote(str(networkId), safe="")
-        resource = f"/networks/{networkId}/merakiAuthUsers"
-
-        return self._session.get(metadata, resource)
+        return dispatch.call(self._session, "getNetworkMerakiAuthUsers", networkId)
 
     def createNetworkMerakiAuthUser(self, networkId: str, email: str, authorizations: list, **kwargs):
         """
@@ -1986,39 +879,7 @@ class AsyncNetworks:
         - isAdmin (boolean): Whether or not the user is a Dashboard administrator.
         """
 
-        kwargs.update(locals())
-
-        if "accountType" in kwargs:
-            options = ["802.1X", "Client VPN", "Guest"]
-            assert kwargs["accountType"] in options, (
-                f'''"accountType" cannot be "{kwargs["accountType"]}", & must be set to one of: {options}'''
-            )
-
-        metadata = {
-            "tags": ["networks", "configure", "merakiAuthUsers"],
-            "operation": "createNetworkMerakiAuthUser",
-        }
-        networkId = urllib.parse.quote(str(networkId), safe="")
-        resource = f"/networks/{networkId}/merakiAuthUsers"
-
-        body_params = [
-            "email",
-            "name",
-            "password",
-            "accountType",
-            "emailPasswordToUser",
-            "isAdmin",
-            "authorizations",
-        ]
-        payload = {k.strip(): v for k, v in kwargs.items() if k.strip() in body_params}
-
-        if self._session._validate_kwargs:
-            all_params = [] + body_params
-            invalid = [k for k in kwargs if k.strip() not in all_params and k != "self"]
-            if invalid and self._session._logger:
-                self._session._logger.warning(f"createNetworkMerakiAuthUser: ignoring unrecognized kwargs: {invalid}")
-
-        return self._session.post(metadata, resource, payload)
+        return dispatch.call(self._session, "createNetworkMerakiAuthUser", networkId, email, authorizations, **kwargs)
 
     def getNetworkMerakiAuthUser(self, networkId: str, merakiAuthUserId: str):
         """
@@ -2029,15 +890,7 @@ class AsyncNetworks:
         - merakiAuthUserId (string): Meraki auth user ID
         """
 
-        metadata = {
-            "tags": ["networks", "configure", "merakiAuthUsers"],
-            "operation": "getNetworkMerakiAuthUser",
-        }
-        networkId = urllib.parse.quote(str(networkId), safe="")
-        merakiAuthUserId = urllib.parse.quote(str(merakiAuthUserId), safe="")
-        resource = f"/networks/{networkId}/merakiAuthUsers/{merakiAuthUserId}"
-
-        return self._session.get(metadata, resource)
+        return dispatch.call(self._session, "getNetworkMerakiAuthUser", networkId, merakiAuthUserId)
 
     def deleteNetworkMerakiAuthUser(self, networkId: str, merakiAuthUserId: str, **kwargs):
         """
@@ -2049,28 +902,7 @@ class AsyncNetworks:
         - delete (boolean): If the ID supplied is for a splash guest or client VPN user, and that user is not authorized for any other networks in the organization, then also delete the user. 802.1X RADIUS users are always deleted regardless of this optional attribute.
         """
 
-        kwargs.update(locals())
-
-        metadata = {
-            "tags": ["networks", "configure", "merakiAuthUsers"],
-            "operation": "deleteNetworkMerakiAuthUser",
-        }
-        networkId = urllib.parse.quote(str(networkId), safe="")
-        merakiAuthUserId = urllib.parse.quote(str(merakiAuthUserId), safe="")
-        resource = f"/networks/{networkId}/merakiAuthUsers/{merakiAuthUserId}"
-
-        query_params = [
-            "delete",
-        ]
-        params = {k.strip(): v for k, v in kwargs.items() if k.strip() in query_params}
-
-        if self._session._validate_kwargs:
-            all_params = query_params
-            invalid = [k for k in kwargs if k.strip() not in all_params and k != "self"]
-            if invalid and self._session._logger:
-                self._session._logger.warning(f"deleteNetworkMerakiAuthUser: ignoring unrecognized kwargs: {invalid}")
-
-        return self._session.delete(metadata, resource, params)
+        return dispatch.call(self._session, "deleteNetworkMerakiAuthUser", networkId, merakiAuthUserId, **kwargs)
 
     def updateNetworkMerakiAuthUser(self, networkId: str, merakiAuthUserId: str, **kwargs):
         """
@@ -2085,31 +917,7 @@ class AsyncNetworks:
         - authorizations (array): Authorization zones and expiration dates for the user.
         """
 
-        kwargs.update(locals())
-
-        metadata = {
-            "tags": ["networks", "configure", "merakiAuthUsers"],
-            "operation": "updateNetworkMerakiAuthUser",
-        }
-        networkId = urllib.parse.quote(str(networkId), safe="")
-        merakiAuthUserId = urllib.parse.quote(str(merakiAuthUserId), safe="")
-        resource = f"/networks/{networkId}/merakiAuthUsers/{merakiAuthUserId}"
-
-        body_params = [
-            "name",
-            "password",
-            "emailPasswordToUser",
-            "authorizations",
-        ]
-        payload = {k.strip(): v for k, v in kwargs.items() if k.strip() in body_params}
-
-        if self._session._validate_kwargs:
-            all_params = [] + body_params
-            invalid = [k for k in kwargs if k.strip() not in all_params and k != "self"]
-            if invalid and self._session._logger:
-                self._session._logger.warning(f"updateNetworkMerakiAuthUser: ignoring unrecognized kwargs: {invalid}")
-
-        return self._session.put(metadata, resource, payload)
+        return dispatch.call(self._session, "updateNetworkMerakiAuthUser", networkId, merakiAuthUserId, **kwargs)
 
     def getNetworkMqttBrokers(self, networkId: str):
         """
@@ -2119,14 +927,7 @@ class AsyncNetworks:
         - networkId (string): Network ID
         """
 
-        metadata = {
-            "tags": ["networks", "configure", "mqttBrokers"],
-            "operation": "getNetworkMqttBrokers",
-        }
-        networkId = urllib.parse.quote(str(networkId), safe="")
-        resource = f"/networks/{networkId}/mqttBrokers"
-
-        return self._session.get(metadata, resource)
+        return dispatch.call(self._session, "getNetworkMqttBrokers", networkId)
 
     def createNetworkMqttBroker(self, networkId: str, name: str, host: str, port: int, **kwargs):
         """
@@ -2141,31 +942,7 @@ class AsyncNetworks:
         - authentication (object): Authentication settings of the MQTT broker
         """
 
-        kwargs.update(locals())
-
-        metadata = {
-            "tags": ["networks", "configure", "mqttBrokers"],
-            "operation": "createNetworkMqttBroker",
-        }
-        networkId = urllib.parse.quote(str(networkId), safe="")
-        resource = f"/networks/{networkId}/mqttBrokers"
-
-        body_params = [
-            "name",
-            "host",
-            "port",
-            "security",
-            "authentication",
-        ]
-        payload = {k.strip(): v for k, v in kwargs.items() if k.strip() in body_params}
-
-        if self._session._validate_kwargs:
-            all_params = [] + body_params
-            invalid = [k for k in kwargs if k.strip() not in all_params and k != "self"]
-            if invalid and self._session._logger:
-                self._session._logger.warning(f"createNetworkMqttBroker: ignoring unrecognized kwargs: {invalid}")
-
-        return self._session.post(metadata, resource, payload)
+        return dispatch.call(self._session, "createNetworkMqttBroker", networkId, name, host, port, **kwargs)
 
     def getNetworkMqttBroker(self, networkId: str, mqttBrokerId: str):
         """
@@ -2176,15 +953,7 @@ class AsyncNetworks:
         - mqttBrokerId (string): Mqtt broker ID
         """
 
-        metadata = {
-            "tags": ["networks", "configure", "mqttBrokers"],
-            "operation": "getNetworkMqttBroker",
-        }
-        networkId = urllib.parse.quote(str(networkId), safe="")
-        mqttBrokerId = urllib.parse.quote(str(mqttBrokerId), safe="")
-        resource = f"/networks/{networkId}/mqttBrokers/{mqttBrokerId}"
-
-        return self._session.get(metadata, resource)
+        return dispatch.call(self._session, "getNetworkMqttBroker", networkId, mqttBrokerId)
 
     def updateNetworkMqttBroker(self, networkId: str, mqttBrokerId: str, **kwargs):
         """
@@ -2200,32 +969,7 @@ class AsyncNetworks:
         - authentication (object): Authentication settings of the MQTT broker
         """
 
-        kwargs.update(locals())
-
-        metadata = {
-            "tags": ["networks", "configure", "mqttBrokers"],
-            "operation": "updateNetworkMqttBroker",
-        }
-        networkId = urllib.parse.quote(str(networkId), safe="")
-        mqttBrokerId = urllib.parse.quote(str(mqttBrokerId), safe="")
-        resource = f"/networks/{networkId}/mqttBrokers/{mqttBrokerId}"
-
-        body_params = [
-            "name",
-            "host",
-            "port",
-            "security",
-            "authentication",
-        ]
-        payload = {k.strip(): v for k, v in kwargs.items() if k.strip() in body_params}
-
-        if self._session._validate_kwargs:
-            all_params = [] + body_params
-            invalid = [k for k in kwargs if k.strip() not in all_params and k != "self"]
-            if invalid and self._session._logger:
-                self._session._logger.warning(f"updateNetworkMqttBroker: ignoring unrecognized kwargs: {invalid}")
-
-        return self._session.put(metadata, resource, payload)
+        return dispatch.call(self._session, "updateNetworkMqttBroker", networkId, mqttBrokerId, **kwargs)
 
     def deleteNetworkMqttBroker(self, networkId: str, mqttBrokerId: str):
         """
@@ -2236,15 +980,7 @@ class AsyncNetworks:
         - mqttBrokerId (string): Mqtt broker ID
         """
 
-        metadata = {
-            "tags": ["networks", "configure", "mqttBrokers"],
-            "operation": "deleteNetworkMqttBroker",
-        }
-        networkId = urllib.parse.quote(str(networkId), safe="")
-        mqttBrokerId = urllib.parse.quote(str(mqttBrokerId), safe="")
-        resource = f"/networks/{networkId}/mqttBrokers/{mqttBrokerId}"
-
-        return self._session.delete(metadata, resource)
+        return dispatch.call(self._session, "deleteNetworkMqttBroker", networkId, mqttBrokerId)
 
     def getNetworkNetflow(self, networkId: str):
         """
@@ -2254,14 +990,7 @@ class AsyncNetworks:
         - networkId (string): Network ID
         """
 
-        metadata = {
-            "tags": ["networks", "configure", "netflow"],
-            "operation": "getNetworkNetflow",
-        }
-        networkId = urllib.parse.quote(str(networkId), safe="")
-        resource = f"/networks/{networkId}/netflow"
-
-        return self._session.get(metadata, resource)
+        return dispatch.call(self._session, "getNetworkNetflow", networkId)
 
     def updateNetworkNetflow(self, networkId: str, **kwargs):
         """
@@ -2276,31 +1005,7 @@ class AsyncNetworks:
         - etaDstPort (integer): The port that the Encrypted Traffic Analytics collector will be listening on.
         """
 
-        kwargs.update(locals())
-
-        metadata = {
-            "tags": ["networks", "configure", "netflow"],
-            "operation": "updateNetworkNetflow",
-        }
-        networkId = urllib.parse.quote(str(networkId), safe="")
-        resource = f"/networks/{networkId}/netflow"
-
-        body_params = [
-            "reportingEnabled",
-            "collectorIp",
-            "collectorPort",
-            "etaEnabled",
-            "etaDstPort",
-        ]
-        payload = {k.strip(): v for k, v in kwargs.items() if k.strip() in body_params}
-
-        if self._session._validate_kwargs:
-            all_params = [] + body_params
-            invalid = [k for k in kwargs if k.strip() not in all_params and k != "self"]
-            if invalid and self._session._logger:
-                self._session._logger.warning(f"updateNetworkNetflow: ignoring unrecognized kwargs: {invalid}")
-
-        return self._session.put(metadata, resource, payload)
+        return dispatch.call(self._session, "updateNetworkNetflow", networkId, **kwargs)
 
     def getNetworkNetworkHealthChannelUtilization(self, networkId: str, total_pages=1, direction="next", **kwargs):
         """
@@ -2319,35 +1024,14 @@ class AsyncNetworks:
         - endingBefore (string): A token used by the server to indicate the end of the page. Often this is a timestamp or an ID but it is not limited to those. This parameter should not be defined by client applications. The link for the first, last, prev, or next page in the HTTP Link header should define it.
         """
 
-        kwargs.update(locals())
-
-        metadata = {
-            "tags": ["networks", "monitor", "networkHealth", "channelUtilization"],
-            "operation": "getNetworkNetworkHealthChannelUtilization",
-        }
-        networkId = urllib.parse.quote(str(networkId), safe="")
-        resource = f"/networks/{networkId}/networkHealth/channelUtilization"
-
-        query_params = [
-            "t0",
-            "t1",
-            "timespan",
-            "resolution",
-            "perPage",
-            "startingAfter",
-            "endingBefore",
-        ]
-        params = {k.strip(): v for k, v in kwargs.items() if k.strip() in query_params}
-
-        if self._session._validate_kwargs:
-            all_params = query_params
-            invalid = [k for k in kwargs if k.strip() not in all_params and k != "self"]
-            if invalid and self._session._logger:
-                self._session._logger.warning(
-                    f"getNetworkNetworkHealthChannelUtilization: ignoring unrecognized kwargs: {invalid}"
-                )
-
-        return self._session.get_pages(metadata, resource, params, total_pages, direction)
+        return dispatch.call(
+            self._session,
+            "getNetworkNetworkHealthChannelUtilization",
+            networkId,
+            total_pages=total_pages,
+            direction=direction,
+            **kwargs,
+        )
 
     def getNetworkPiiPiiKeys(self, networkId: str, **kwargs):
         """
@@ -2363,32 +1047,7 @@ class AsyncNetworks:
         - bluetoothMac (string): The MAC of a Bluetooth client
         """
 
-        kwargs.update(locals())
-
-        metadata = {
-            "tags": ["networks", "configure", "pii", "piiKeys"],
-            "operation": "getNetworkPiiPiiKeys",
-        }
-        networkId = urllib.parse.quote(str(networkId), safe="")
-        resource = f"/networks/{networkId}/pii/piiKeys"
-
-        query_params = [
-            "username",
-            "email",
-            "mac",
-            "serial",
-            "imei",
-            "bluetoothMac",
-        ]
-        params = {k.strip(): v for k, v in kwargs.items() if k.strip() in query_params}
-
-        if self._session._validate_kwargs:
-            all_params = query_params
-            invalid = [k for k in kwargs if k.strip() not in all_params and k != "self"]
-            if invalid and self._session._logger:
-                self._session._logger.warning(f"getNetworkPiiPiiKeys: ignoring unrecognized kwargs: {invalid}")
-
-        return self._session.get(metadata, resource, params)
+        return dispatch.call(self._session, "getNetworkPiiPiiKeys", networkId, **kwargs)
 
     def getNetworkPiiRequests(self, networkId: str):
         """
@@ -2398,14 +1057,7 @@ class AsyncNetworks:
         - networkId (string): Network ID
         """
 
-        metadata = {
-            "tags": ["networks", "configure", "pii", "requests"],
-            "operation": "getNetworkPiiRequests",
-        }
-        networkId = urllib.parse.quote(str(networkId), safe="")
-        resource = f"/networks/{networkId}/pii/requests"
-
-        return self._session.get(metadata, resource)
+        return dispatch.call(self._session, "getNetworkPiiRequests", networkId)
 
     def createNetworkPiiRequest(self, networkId: str, **kwargs):
         """
@@ -2422,37 +1074,7 @@ class AsyncNetworks:
         - smUserId (string): The sm_user_id of a Systems Manager user. The only way to "restrict processing" or "delete" a Systems Manager user. Must include "user" in the dataset for a "delete" request to destroy the user.
         """
 
-        kwargs.update(locals())
-
-        if "type" in kwargs:
-            options = ["delete", "restrict processing"]
-            assert kwargs["type"] in options, f'''"type" cannot be "{kwargs["type"]}", & must be set to one of: {options}'''
-
-        metadata = {
-            "tags": ["networks", "configure", "pii", "requests"],
-            "operation": "createNetworkPiiRequest",
-        }
-        networkId = urllib.parse.quote(str(networkId), safe="")
-        resource = f"/networks/{networkId}/pii/requests"
-
-        body_params = [
-            "type",
-            "datasets",
-            "username",
-            "email",
-            "mac",
-            "smDeviceId",
-            "smUserId",
-        ]
-        payload = {k.strip(): v for k, v in kwargs.items() if k.strip() in body_params}
-
-        if self._session._validate_kwargs:
-            all_params = [] + body_params
-            invalid = [k for k in kwargs if k.strip() not in all_params and k != "self"]
-            if invalid and self._session._logger:
-                self._session._logger.warning(f"createNetworkPiiRequest: ignoring unrecognized kwargs: {invalid}")
-
-        return self._session.post(metadata, resource, payload)
+        return dispatch.call(self._session, "createNetworkPiiRequest", networkId, **kwargs)
 
     def getNetworkPiiRequest(self, networkId: str, requestId: str):
         """
@@ -2463,15 +1085,7 @@ class AsyncNetworks:
         - requestId (string): Request ID
         """
 
-        metadata = {
-            "tags": ["networks", "configure", "pii", "requests"],
-            "operation": "getNetworkPiiRequest",
-        }
-        networkId = urllib.parse.quote(str(networkId), safe="")
-        requestId = urllib.parse.quote(str(requestId), safe="")
-        resource = f"/networks/{networkId}/pii/requests/{requestId}"
-
-        return self._session.get(metadata, resource)
+        return dispatch.call(self._session, "getNetworkPiiRequest", networkId, requestId)
 
     def deleteNetworkPiiRequest(self, networkId: str, requestId: str):
         """
@@ -2482,15 +1096,7 @@ class AsyncNetworks:
         - requestId (string): Request ID
         """
 
-        metadata = {
-            "tags": ["networks", "configure", "pii", "requests"],
-            "operation": "deleteNetworkPiiRequest",
-        }
-        networkId = urllib.parse.quote(str(networkId), safe="")
-        requestId = urllib.parse.quote(str(requestId), safe="")
-        resource = f"/networks/{networkId}/pii/requests/{requestId}"
-
-        return self._session.delete(metadata, resource)
+        return dispatch.call(self._session, "deleteNetworkPiiRequest", networkId, requestId)
 
     def getNetworkPiiSmDevicesForKey(self, networkId: str, **kwargs):
         """
@@ -2506,32 +1112,7 @@ class AsyncNetworks:
         - bluetoothMac (string): The MAC of a Bluetooth client
         """
 
-        kwargs.update(locals())
-
-        metadata = {
-            "tags": ["networks", "configure", "pii", "smDevicesForKey"],
-            "operation": "getNetworkPiiSmDevicesForKey",
-        }
-        networkId = urllib.parse.quote(str(networkId), safe="")
-        resource = f"/networks/{networkId}/pii/smDevicesForKey"
-
-        query_params = [
-            "username",
-            "email",
-            "mac",
-            "serial",
-            "imei",
-            "bluetoothMac",
-        ]
-        params = {k.strip(): v for k, v in kwargs.items() if k.strip() in query_params}
-
-        if self._session._validate_kwargs:
-            all_params = query_params
-            invalid = [k for k in kwargs if k.strip() not in all_params and k != "self"]
-            if invalid and self._session._logger:
-                self._session._logger.warning(f"getNetworkPiiSmDevicesForKey: ignoring unrecognized kwargs: {invalid}")
-
-        return self._session.get(metadata, resource, params)
+        return dispatch.call(self._session, "getNetworkPiiSmDevicesForKey", networkId, **kwargs)
 
     def getNetworkPiiSmOwnersForKey(self, networkId: str, **kwargs):
         """
@@ -2547,32 +1128,7 @@ class AsyncNetworks:
         - bluetoothMac (string): The MAC of a Bluetooth client
         """
 
-        kwargs.update(locals())
-
-        metadata = {
-            "tags": ["networks", "configure", "pii", "smOwnersForKey"],
-            "operation": "getNetworkPiiSmOwnersForKey",
-        }
-        networkId = urllib.parse.quote(str(networkId), safe="")
-        resource = f"/networks/{networkId}/pii/smOwnersForKey"
-
-        query_params = [
-            "username",
-            "email",
-            "mac",
-            "serial",
-            "imei",
-            "bluetoothMac",
-        ]
-        params = {k.strip(): v for k, v in kwargs.items() if k.strip() in query_params}
-
-        if self._session._validate_kwargs:
-            all_params = query_params
-            invalid = [k for k in kwargs if k.strip() not in all_params and k != "self"]
-            if invalid and self._session._logger:
-                self._session._logger.warning(f"getNetworkPiiSmOwnersForKey: ignoring unrecognized kwargs: {invalid}")
-
-        return self._session.get(metadata, resource, params)
+        return dispatch.call(self._session, "getNetworkPiiSmOwnersForKey", networkId, **kwargs)
 
     def getNetworkPoliciesByClient(self, networkId: str, total_pages=1, direction="next", **kwargs):
         """
@@ -2589,31 +1145,9 @@ class AsyncNetworks:
         - timespan (number): The timespan for which the information will be fetched. If specifying timespan, do not specify parameter t0. The value must be in seconds and be less than or equal to 31 days. The default is 1 day.
         """
 
-        kwargs.update(locals())
-
-        metadata = {
-            "tags": ["networks", "configure", "policies", "byClient"],
-            "operation": "getNetworkPoliciesByClient",
-        }
-        networkId = urllib.parse.quote(str(networkId), safe="")
-        resource = f"/networks/{networkId}/policies/byClient"
-
-        query_params = [
-            "perPage",
-            "startingAfter",
-            "endingBefore",
-            "t0",
-            "timespan",
-        ]
-        params = {k.strip(): v for k, v in kwargs.items() if k.strip() in query_params}
-
-        if self._session._validate_kwargs:
-            all_params = query_params
-            invalid = [k for k in kwargs if k.strip() not in all_params and k != "self"]
-            if invalid and self._session._logger:
-                self._session._logger.warning(f"getNetworkPoliciesByClient: ignoring unrecognized kwargs: {invalid}")
-
-        return self._session.get_pages(metadata, resource, params, total_pages, direction)
+        return dispatch.call(
+            self._session, "getNetworkPoliciesByClient", networkId, total_pages=total_pages, direction=direction, **kwargs
+        )
 
     def getNetworkSettings(self, networkId: str):
         """
@@ -2623,14 +1157,7 @@ class AsyncNetworks:
         - networkId (string): Network ID
         """
 
-        metadata = {
-            "tags": ["networks", "configure", "settings"],
-            "operation": "getNetworkSettings",
-        }
-        networkId = urllib.parse.quote(str(networkId), safe="")
-        resource = f"/networks/{networkId}/settings"
-
-        return self._session.get(metadata, resource)
+        return dispatch.call(self._session, "getNetworkSettings", networkId)
 
     def updateNetworkSettings(self, networkId: str, **kwargs):
         """
@@ -2645,31 +1172,7 @@ class AsyncNetworks:
         - namedVlans (object): A hash of Named VLANs options applied to the Network.
         """
 
-        kwargs.update(locals())
-
-        metadata = {
-            "tags": ["networks", "configure", "settings"],
-            "operation": "updateNetworkSettings",
-        }
-        networkId = urllib.parse.quote(str(networkId), safe="")
-        resource = f"/networks/{networkId}/settings"
-
-        body_params = [
-            "localStatusPageEnabled",
-            "remoteStatusPageEnabled",
-            "localStatusPage",
-            "securePort",
-            "namedVlans",
-        ]
-        payload = {k.strip(): v for k, v in kwargs.items() if k.strip() in body_params}
-
-        if self._session._validate_kwargs:
-            all_params = [] + body_params
-            invalid = [k for k in kwargs if k.strip() not in all_params and k != "self"]
-            if invalid and self._session._logger:
-                self._session._logger.warning(f"updateNetworkSettings: ignoring unrecognized kwargs: {invalid}")
-
-        return self._session.put(metadata, resource, payload)
+        return dispatch.call(self._session, "updateNetworkSettings", networkId, **kwargs)
 
     def getNetworkSnmp(self, networkId: str):
         """
@@ -2679,14 +1182,7 @@ class AsyncNetworks:
         - networkId (string): Network ID
         """
 
-        metadata = {
-            "tags": ["networks", "configure", "snmp"],
-            "operation": "getNetworkSnmp",
-        }
-        networkId = urllib.parse.quote(str(networkId), safe="")
-        resource = f"/networks/{networkId}/snmp"
-
-        return self._session.get(metadata, resource)
+        return dispatch.call(self._session, "getNetworkSnmp", networkId)
 
     def updateNetworkSnmp(self, networkId: str, **kwargs):
         """
@@ -2701,37 +1197,7 @@ class AsyncNetworks:
         - privacy (object): SNMPv3 privacy settings. Only relevant if 'access' is set to 'users'.
         """
 
-        kwargs.update(locals())
-
-        if "access" in kwargs:
-            options = ["community", "none", "users"]
-            assert kwargs["access"] in options, (
-                f'''"access" cannot be "{kwargs["access"]}", & must be set to one of: {options}'''
-            )
-
-        metadata = {
-            "tags": ["networks", "configure", "snmp"],
-            "operation": "updateNetworkSnmp",
-        }
-        networkId = urllib.parse.quote(str(networkId), safe="")
-        resource = f"/networks/{networkId}/snmp"
-
-        body_params = [
-            "access",
-            "communityString",
-            "users",
-            "authentication",
-            "privacy",
-        ]
-        payload = {k.strip(): v for k, v in kwargs.items() if k.strip() in body_params}
-
-        if self._session._validate_kwargs:
-            all_params = [] + body_params
-            invalid = [k for k in kwargs if k.strip() not in all_params and k != "self"]
-            if invalid and self._session._logger:
-                self._session._logger.warning(f"updateNetworkSnmp: ignoring unrecognized kwargs: {invalid}")
-
-        return self._session.put(metadata, resource, payload)
+        return dispatch.call(self._session, "updateNetworkSnmp", networkId, **kwargs)
 
     def getNetworkSplashLoginAttempts(self, networkId: str, **kwargs):
         """
@@ -2744,35 +1210,7 @@ class AsyncNetworks:
         - timespan (integer): The timespan, in seconds, for the login attempts. The period will be from [timespan] seconds ago until now. The maximum timespan is 3 months
         """
 
-        kwargs.update(locals())
-
-        if "ssidNumber" in kwargs:
-            options = [0, 1, 2, 3, 4, 5, 6, 7, 8, 9, 10, 11, 12, 13, 14]
-            assert kwargs["ssidNumber"] in options, (
-                f'''"ssidNumber" cannot be "{kwargs["ssidNumber"]}", & must be set to one of: {options}'''
-            )
-
-        metadata = {
-            "tags": ["networks", "monitor", "splashLoginAttempts"],
-            "operation": "getNetworkSplashLoginAttempts",
-        }
-        networkId = urllib.parse.quote(str(networkId), safe="")
-        resource = f"/networks/{networkId}/splashLoginAttempts"
-
-        query_params = [
-            "ssidNumber",
-            "loginIdentifier",
-            "timespan",
-        ]
-        params = {k.strip(): v for k, v in kwargs.items() if k.strip() in query_params}
-
-        if self._session._validate_kwargs:
-            all_params = query_params
-            invalid = [k for k in kwargs if k.strip() not in all_params and k != "self"]
-            if invalid and self._session._logger:
-                self._session._logger.warning(f"getNetworkSplashLoginAttempts: ignoring unrecognized kwargs: {invalid}")
-
-        return self._session.get(metadata, resource, params)
+        return dispatch.call(self._session, "getNetworkSplashLoginAttempts", networkId, **kwargs)
 
     def splitNetwork(self, networkId: str):
         """
@@ -2782,14 +1220,7 @@ class AsyncNetworks:
         - networkId (string): Network ID
         """
 
-        metadata = {
-            "tags": ["networks", "configure"],
-            "operation": "splitNetwork",
-        }
-        networkId = urllib.parse.quote(str(networkId), safe="")
-        resource = f"/networks/{networkId}/split"
-
-        return self._session.post(metadata, resource)
+        return dispatch.call(self._session, "splitNetwork", networkId)
 
     def getNetworkSyslogServers(self, networkId: str):
         """
@@ -2799,14 +1230,7 @@ class AsyncNetworks:
         - networkId (string): Network ID
         """
 
-        metadata = {
-            "tags": ["networks", "configure", "syslogServers"],
-            "operation": "getNetworkSyslogServers",
-        }
-        networkId = urllib.parse.quote(str(networkId), safe="")
-        resource = f"/networks/{networkId}/syslogServers"
-
-        return self._session.get(metadata, resource)
+        return dispatch.call(self._session, "getNetworkSyslogServers", networkId)
 
     def updateNetworkSyslogServers(self, networkId: str, servers: list, **kwargs):
         """
@@ -2817,27 +1241,7 @@ class AsyncNetworks:
         - servers (array): A list of the syslog servers for this network
         """
 
-        kwargs = locals()
-
-        metadata = {
-            "tags": ["networks", "configure", "syslogServers"],
-            "operation": "updateNetworkSyslogServers",
-        }
-        networkId = urllib.parse.quote(str(networkId), safe="")
-        resource = f"/networks/{networkId}/syslogServers"
-
-        body_params = [
-            "servers",
-        ]
-        payload = {k.strip(): v for k, v in kwargs.items() if k.strip() in body_params}
-
-        if self._session._validate_kwargs:
-            all_params = [] + body_params
-            invalid = [k for k in kwargs if k.strip() not in all_params and k != "self"]
-            if invalid and self._session._logger:
-                self._session._logger.warning(f"updateNetworkSyslogServers: ignoring unrecognized kwargs: {invalid}")
-
-        return self._session.put(metadata, resource, payload)
+        return dispatch.call(self._session, "updateNetworkSyslogServers", networkId, servers, **kwargs)
 
     def getNetworkTopologyLinkLayer(self, networkId: str):
         """
@@ -2847,14 +1251,7 @@ class AsyncNetworks:
         - networkId (string): Network ID
         """
 
-        metadata = {
-            "tags": ["networks", "monitor", "topology", "linkLayer"],
-            "operation": "getNetworkTopologyLinkLayer",
-        }
-        networkId = urllib.parse.quote(str(networkId), safe="")
-        resource = f"/networks/{networkId}/topology/linkLayer"
-
-        return self._session.get(metadata, resource)
+        return dispatch.call(self._session, "getNetworkTopologyLinkLayer", networkId)
 
     def getNetworkTraffic(self, networkId: str, **kwargs):
         """
@@ -2867,35 +1264,7 @@ class AsyncNetworks:
         - deviceType (string): Filter the data by device type: 'combined', 'wireless', 'switch' or 'appliance'. Defaults to 'combined'. When using 'combined', for each rule the data will come from the device type with the most usage.
         """
 
-        kwargs.update(locals())
-
-        if "deviceType" in kwargs:
-            options = ["appliance", "combined", "switch", "wireless"]
-            assert kwargs["deviceType"] in options, (
-                f'''"deviceType" cannot be "{kwargs["deviceType"]}", & must be set to one of: {options}'''
-            )
-
-        metadata = {
-            "tags": ["networks", "monitor", "traffic"],
-            "operation": "getNetworkTraffic",
-        }
-        networkId = urllib.parse.quote(str(networkId), safe="")
-        resource = f"/networks/{networkId}/traffic"
-
-        query_params = [
-            "t0",
-            "timespan",
-            "deviceType",
-        ]
-        params = {k.strip(): v for k, v in kwargs.items() if k.strip() in query_params}
-
-        if self._session._validate_kwargs:
-            all_params = query_params
-            invalid = [k for k in kwargs if k.strip() not in all_params and k != "self"]
-            if invalid and self._session._logger:
-                self._session._logger.warning(f"getNetworkTraffic: ignoring unrecognized kwargs: {invalid}")
-
-        return self._session.get(metadata, resource, params)
+        return dispatch.call(self._session, "getNetworkTraffic", networkId, **kwargs)
 
     def getNetworkTrafficAnalysis(self, networkId: str):
         """
@@ -2905,14 +1274,7 @@ class AsyncNetworks:
         - networkId (string): Network ID
         """
 
-        metadata = {
-            "tags": ["networks", "configure", "trafficAnalysis"],
-            "operation": "getNetworkTrafficAnalysis",
-        }
-        networkId = urllib.parse.quote(str(networkId), safe="")
-        resource = f"/networks/{networkId}/trafficAnalysis"
-
-        return self._session.get(metadata, resource)
+        return dispatch.call(self._session, "getNetworkTrafficAnalysis", networkId)
 
     def updateNetworkTrafficAnalysis(self, networkId: str, **kwargs):
         """
@@ -2926,32 +1288,7 @@ class AsyncNetworks:
             - customPieChartItems (array): The list of items that make up the custom pie chart for traffic reporting.
         """
 
-        kwargs.update(locals())
-
-        if "mode" in kwargs:
-            options = ["basic", "detailed", "disabled"]
-            assert kwargs["mode"] in options, f'''"mode" cannot be "{kwargs["mode"]}", & must be set to one of: {options}'''
-
-        metadata = {
-            "tags": ["networks", "configure", "trafficAnalysis"],
-            "operation": "updateNetworkTrafficAnalysis",
-        }
-        networkId = urllib.parse.quote(str(networkId), safe="")
-        resource = f"/networks/{networkId}/trafficAnalysis"
-
-        body_params = [
-            "mode",
-            "customPieChartItems",
-        ]
-        payload = {k.strip(): v for k, v in kwargs.items() if k.strip() in body_params}
-
-        if self._session._validate_kwargs:
-            all_params = [] + body_params
-            invalid = [k for k in kwargs if k.strip() not in all_params and k != "self"]
-            if invalid and self._session._logger:
-                self._session._logger.warning(f"updateNetworkTrafficAnalysis: ignoring unrecognized kwargs: {invalid}")
-
-        return self._session.put(metadata, resource, payload)
+        return dispatch.call(self._session, "updateNetworkTrafficAnalysis", networkId, **kwargs)
 
     def getNetworkTrafficShapingApplicationCategories(self, networkId: str):
         """
@@ -2961,14 +1298,7 @@ class AsyncNetworks:
         - networkId (string): Network ID
         """
 
-        metadata = {
-            "tags": ["networks", "configure", "trafficShaping", "applicationCategories"],
-            "operation": "getNetworkTrafficShapingApplicationCategories",
-        }
-        networkId = urllib.parse.quote(str(networkId), safe="")
-        resource = f"/networks/{networkId}/trafficShaping/applicationCategories"
-
-        return self._session.get(metadata, resource)
+        return dispatch.call(self._session, "getNetworkTrafficShapingApplicationCategories", networkId)
 
     def getNetworkTrafficShapingDscpTaggingOptions(self, networkId: str):
         """
@@ -2978,14 +1308,7 @@ class AsyncNetworks:
         - networkId (string): Network ID
         """
 
-        metadata = {
-            "tags": ["networks", "configure", "trafficShaping", "dscpTaggingOptions"],
-            "operation": "getNetworkTrafficShapingDscpTaggingOptions",
-        }
-        networkId = urllib.parse.quote(str(networkId), safe="")
-        resource = f"/networks/{networkId}/trafficShaping/dscpTaggingOptions"
-
-        return self._session.get(metadata, resource)
+        return dispatch.call(self._session, "getNetworkTrafficShapingDscpTaggingOptions", networkId)
 
     def unbindNetwork(self, networkId: str, **kwargs):
         """
@@ -2996,27 +1319,7 @@ class AsyncNetworks:
         - retainConfigs (boolean): Optional boolean to retain all the current configs given by the template.
         """
 
-        kwargs.update(locals())
-
-        metadata = {
-            "tags": ["networks", "configure"],
-            "operation": "unbindNetwork",
-        }
-        networkId = urllib.parse.quote(str(networkId), safe="")
-        resource = f"/networks/{networkId}/unbind"
-
-        body_params = [
-            "retainConfigs",
-        ]
-        payload = {k.strip(): v for k, v in kwargs.items() if k.strip() in body_params}
-
-        if self._session._validate_kwargs:
-            all_params = [] + body_params
-            invalid = [k for k in kwargs if k.strip() not in all_params and k != "self"]
-            if invalid and self._session._logger:
-                self._session._logger.warning(f"unbindNetwork: ignoring unrecognized kwargs: {invalid}")
-
-        return self._session.post(metadata, resource, payload)
+        return dispatch.call(self._session, "unbindNetwork", networkId, **kwargs)
 
     def getNetworkVlanProfiles(self, networkId: str):
         """
@@ -3026,14 +1329,7 @@ class AsyncNetworks:
         - networkId (string): Network ID
         """
 
-        metadata = {
-            "tags": ["networks", "configure", "vlanProfiles"],
-            "operation": "getNetworkVlanProfiles",
-        }
-        networkId = urllib.parse.quote(str(networkId), safe="")
-        resource = f"/networks/{networkId}/vlanProfiles"
-
-        return self._session.get(metadata, resource)
+        return dispatch.call(self._session, "getNetworkVlanProfiles", networkId)
 
     def createNetworkVlanProfile(self, networkId: str, name: str, vlanNames: list, vlanGroups: list, iname: str, **kwargs):
         """
@@ -3047,30 +1343,9 @@ class AsyncNetworks:
         - iname (string): IName of the profile
         """
 
-        kwargs = locals()
-
-        metadata = {
-            "tags": ["networks", "configure", "vlanProfiles"],
-            "operation": "createNetworkVlanProfile",
-        }
-        networkId = urllib.parse.quote(str(networkId), safe="")
-        resource = f"/networks/{networkId}/vlanProfiles"
-
-        body_params = [
-            "name",
-            "vlanNames",
-            "vlanGroups",
-            "iname",
-        ]
-        payload = {k.strip(): v for k, v in kwargs.items() if k.strip() in body_params}
-
-        if self._session._validate_kwargs:
-            all_params = [] + body_params
-            invalid = [k for k in kwargs if k.strip() not in all_params and k != "self"]
-            if invalid and self._session._logger:
-                self._session._logger.warning(f"createNetworkVlanProfile: ignoring unrecognized kwargs: {invalid}")
-
-        return self._session.post(metadata, resource, payload)
+        return dispatch.call(
+            self._session, "createNetworkVlanProfile", networkId, name, vlanNames, vlanGroups, iname, **kwargs
+        )
 
     def getNetworkVlanProfilesAssignmentsByDevice(self, networkId: str, total_pages=1, direction="next", **kwargs):
         """
@@ -3088,44 +1363,14 @@ class AsyncNetworks:
         - stackIds (array): Optional parameter to filter devices by Switch Stack ids.
         """
 
-        kwargs.update(locals())
-
-        metadata = {
-            "tags": ["networks", "configure", "vlanProfiles", "assignments", "byDevice"],
-            "operation": "getNetworkVlanProfilesAssignmentsByDevice",
-        }
-        networkId = urllib.parse.quote(str(networkId), safe="")
-        resource = f"/networks/{networkId}/vlanProfiles/assignments/byDevice"
-
-        query_params = [
-            "perPage",
-            "startingAfter",
-            "endingBefore",
-            "serials",
-            "productTypes",
-            "stackIds",
-        ]
-        params = {k.strip(): v for k, v in kwargs.items() if k.strip() in query_params}
-
-        array_params = [
-            "serials",
-            "productTypes",
-            "stackIds",
-        ]
-        for k, v in kwargs.items():
-            if k.strip() in array_params:
-                params[f"{k.strip()}[]"] = kwargs[f"{k}"]
-                params.pop(k.strip())
-
-        if self._session._validate_kwargs:
-            all_params = query_params + array_params
-            invalid = [k for k in kwargs if k.strip() not in all_params and k != "self"]
-            if invalid and self._session._logger:
-                self._session._logger.warning(
-                    f"getNetworkVlanProfilesAssignmentsByDevice: ignoring unrecognized kwargs: {invalid}"
-                )
-
-        return self._session.get_pages(metadata, resource, params, total_pages, direction)
+        return dispatch.call(
+            self._session,
+            "getNetworkVlanProfilesAssignmentsByDevice",
+            networkId,
+            total_pages=total_pages,
+            direction=direction,
+            **kwargs,
+        )
 
     def reassignNetworkVlanProfilesAssignments(self, networkId: str, serials: list, stackIds: list, **kwargs):
         """
@@ -3138,31 +1383,7 @@ class AsyncNetworks:
         - vlanProfile (object): The VLAN Profile
         """
 
-        kwargs.update(locals())
-
-        metadata = {
-            "tags": ["networks", "configure", "vlanProfiles", "assignments"],
-            "operation": "reassignNetworkVlanProfilesAssignments",
-        }
-        networkId = urllib.parse.quote(str(networkId), safe="")
-        resource = f"/networks/{networkId}/vlanProfiles/assignments/reassign"
-
-        body_params = [
-            "vlanProfile",
-            "serials",
-            "stackIds",
-        ]
-        payload = {k.strip(): v for k, v in kwargs.items() if k.strip() in body_params}
-
-        if self._session._validate_kwargs:
-            all_params = [] + body_params
-            invalid = [k for k in kwargs if k.strip() not in all_params and k != "self"]
-            if invalid and self._session._logger:
-                self._session._logger.warning(
-                    f"reassignNetworkVlanProfilesAssignments: ignoring unrecognized kwargs: {invalid}"
-                )
-
-        return self._session.post(metadata, resource, payload)
+        return dispatch.call(self._session, "reassignNetworkVlanProfilesAssignments", networkId, serials, stackIds, **kwargs)
 
     def getNetworkVlanProfile(self, networkId: str, iname: str):
         """
@@ -3173,15 +1394,7 @@ class AsyncNetworks:
         - iname (string): Iname
         """
 
-        metadata = {
-            "tags": ["networks", "configure", "vlanProfiles"],
-            "operation": "getNetworkVlanProfile",
-        }
-        networkId = urllib.parse.quote(str(networkId), safe="")
-        iname = urllib.parse.quote(str(iname), safe="")
-        resource = f"/networks/{networkId}/vlanProfiles/{iname}"
-
-        return self._session.get(metadata, resource)
+        return dispatch.call(self._session, "getNetworkVlanProfile", networkId, iname)
 
     def updateNetworkVlanProfile(self, networkId: str, iname: str, name: str, vlanNames: list, vlanGroups: list, **kwargs):
         """
@@ -3195,30 +1408,9 @@ class AsyncNetworks:
         - vlanGroups (array): An array of VLAN groups
         """
 
-        kwargs = locals()
-
-        metadata = {
-            "tags": ["networks", "configure", "vlanProfiles"],
-            "operation": "updateNetworkVlanProfile",
-        }
-        networkId = urllib.parse.quote(str(networkId), safe="")
-        iname = urllib.parse.quote(str(iname), safe="")
-        resource = f"/networks/{networkId}/vlanProfiles/{iname}"
-
-        body_params = [
-            "name",
-            "vlanNames",
-            "vlanGroups",
-        ]
-        payload = {k.strip(): v for k, v in kwargs.items() if k.strip() in body_params}
-
-        if self._session._validate_kwargs:
-            all_params = [] + body_params
-            invalid = [k for k in kwargs if k.strip() not in all_params and k != "self"]
-            if invalid and self._session._logger:
-                self._session._logger.warning(f"updateNetworkVlanProfile: ignoring unrecognized kwargs: {invalid}")
-
-        return self._session.put(metadata, resource, payload)
+        return dispatch.call(
+            self._session, "updateNetworkVlanProfile", networkId, iname, name, vlanNames, vlanGroups, **kwargs
+        )
 
     def deleteNetworkVlanProfile(self, networkId: str, iname: str):
         """
@@ -3229,15 +1421,7 @@ class AsyncNetworks:
         - iname (string): Iname
         """
 
-        metadata = {
-            "tags": ["networks", "configure", "vlanProfiles"],
-            "operation": "deleteNetworkVlanProfile",
-        }
-        networkId = urllib.parse.quote(str(networkId), safe="")
-        iname = urllib.parse.quote(str(iname), safe="")
-        resource = f"/networks/{networkId}/vlanProfiles/{iname}"
-
-        return self._session.delete(metadata, resource)
+        return dispatch.call(self._session, "deleteNetworkVlanProfile", networkId, iname)
 
     def getNetworkWebhooksHttpServers(self, networkId: str):
         """
@@ -3247,14 +1431,7 @@ class AsyncNetworks:
         - networkId (string): Network ID
         """
 
-        metadata = {
-            "tags": ["networks", "configure", "webhooks", "httpServers"],
-            "operation": "getNetworkWebhooksHttpServers",
-        }
-        networkId = urllib.parse.quote(str(networkId), safe="")
-        resource = f"/networks/{networkId}/webhooks/httpServers"
-
-        return self._session.get(metadata, resource)
+        return dispatch.call(self._session, "getNetworkWebhooksHttpServers", networkId)
 
     def createNetworkWebhooksHttpServer(self, networkId: str, name: str, url: str, **kwargs):
         """
@@ -3268,30 +1445,7 @@ class AsyncNetworks:
         - payloadTemplate (object): The payload template to use when posting data to the HTTP server.
         """
 
-        kwargs.update(locals())
-
-        metadata = {
-            "tags": ["networks", "configure", "webhooks", "httpServers"],
-            "operation": "createNetworkWebhooksHttpServer",
-        }
-        networkId = urllib.parse.quote(str(networkId), safe="")
-        resource = f"/networks/{networkId}/webhooks/httpServers"
-
-        body_params = [
-            "name",
-            "url",
-            "sharedSecret",
-            "payloadTemplate",
-        ]
-        payload = {k.strip(): v for k, v in kwargs.items() if k.strip() in body_params}
-
-        if self._session._validate_kwargs:
-            all_params = [] + body_params
-            invalid = [k for k in kwargs if k.strip() not in all_params and k != "self"]
-            if invalid and self._session._logger:
-                self._session._logger.warning(f"createNetworkWebhooksHttpServer: ignoring unrecognized kwargs: {invalid}")
-
-        return self._session.post(metadata, resource, payload)
+        return dispatch.call(self._session, "createNetworkWebhooksHttpServer", networkId, name, url, **kwargs)
 
     def getNetworkWebhooksHttpServer(self, networkId: str, httpServerId: str):
         """
@@ -3302,15 +1456,7 @@ class AsyncNetworks:
         - httpServerId (string): Http server ID
         """
 
-        metadata = {
-            "tags": ["networks", "configure", "webhooks", "httpServers"],
-            "operation": "getNetworkWebhooksHttpServer",
-        }
-        networkId = urllib.parse.quote(str(networkId), safe="")
-        httpServerId = urllib.parse.quote(str(httpServerId), safe="")
-        resource = f"/networks/{networkId}/webhooks/httpServers/{httpServerId}"
-
-        return self._session.get(metadata, resource)
+        return dispatch.call(self._session, "getNetworkWebhooksHttpServer", networkId, httpServerId)
 
     def updateNetworkWebhooksHttpServer(self, networkId: str, httpServerId: str, **kwargs):
         """
@@ -3324,30 +1470,7 @@ class AsyncNetworks:
         - payloadTemplate (object): The payload template to use when posting data to the HTTP server.
         """
 
-        kwargs.update(locals())
-
-        metadata = {
-            "tags": ["networks", "configure", "webhooks", "httpServers"],
-            "operation": "updateNetworkWebhooksHttpServer",
-        }
-        networkId = urllib.parse.quote(str(networkId), safe="")
-        httpServerId = urllib.parse.quote(str(httpServerId), safe="")
-        resource = f"/networks/{networkId}/webhooks/httpServers/{httpServerId}"
-
-        body_params = [
-            "name",
-            "sharedSecret",
-            "payloadTemplate",
-        ]
-        payload = {k.strip(): v for k, v in kwargs.items() if k.strip() in body_params}
-
-        if self._session._validate_kwargs:
-            all_params = [] + body_params
-            invalid = [k for k in kwargs if k.strip() not in all_params and k != "self"]
-            if invalid and self._session._logger:
-                self._session._logger.warning(f"updateNetworkWebhooksHttpServer: ignoring unrecognized kwargs: {invalid}")
-
-        return self._session.put(metadata, resource, payload)
+        return dispatch.call(self._session, "updateNetworkWebhooksHttpServer", networkId, httpServerId, **kwargs)
 
     def deleteNetworkWebhooksHttpServer(self, networkId: str, httpServerId: str):
         """
@@ -3358,15 +1481,7 @@ class AsyncNetworks:
         - httpServerId (string): Http server ID
         """
 
-        metadata = {
-            "tags": ["networks", "configure", "webhooks", "httpServers"],
-            "operation": "deleteNetworkWebhooksHttpServer",
-        }
-        networkId = urllib.parse.quote(str(networkId), safe="")
-        httpServerId = urllib.parse.quote(str(httpServerId), safe="")
-        resource = f"/networks/{networkId}/webhooks/httpServers/{httpServerId}"
-
-        return self._session.delete(metadata, resource)
+        return dispatch.call(self._session, "deleteNetworkWebhooksHttpServer", networkId, httpServerId)
 
     def getNetworkWebhooksPayloadTemplates(self, networkId: str):
         """
@@ -3376,14 +1491,7 @@ class AsyncNetworks:
         - networkId (string): Network ID
         """
 
-        metadata = {
-            "tags": ["networks", "configure", "webhooks", "payloadTemplates"],
-            "operation": "getNetworkWebhooksPayloadTemplates",
-        }
-        networkId = urllib.parse.quote(str(networkId), safe="")
-        resource = f"/networks/{networkId}/webhooks/payloadTemplates"
-
-        return self._session.get(metadata, resource)
+        return dispatch.call(self._session, "getNetworkWebhooksPayloadTemplates", networkId)
 
     def createNetworkWebhooksPayloadTemplate(self, networkId: str, name: str, **kwargs):
         """
@@ -3398,31 +1506,7 @@ class AsyncNetworks:
         - headersFile (string): A Base64 encoded file containing the liquid template used with the webhook headers.
         """
 
-        kwargs.update(locals())
-
-        metadata = {
-            "tags": ["networks", "configure", "webhooks", "payloadTemplates"],
-            "operation": "createNetworkWebhooksPayloadTemplate",
-        }
-        networkId = urllib.parse.quote(str(networkId), safe="")
-        resource = f"/networks/{networkId}/webhooks/payloadTemplates"
-
-        body_params = [
-            "name",
-            "body",
-            "headers",
-            "bodyFile",
-            "headersFile",
-        ]
-        payload = {k.strip(): v for k, v in kwargs.items() if k.strip() in body_params}
-
-        if self._session._validate_kwargs:
-            all_params = [] + body_params
-            invalid = [k for k in kwargs if k.strip() not in all_params and k != "self"]
-            if invalid and self._session._logger:
-                self._session._logger.warning(f"createNetworkWebhooksPayloadTemplate: ignoring unrecognized kwargs: {invalid}")
-
-        return self._session.post(metadata, resource, payload)
+        return dispatch.call(self._session, "createNetworkWebhooksPayloadTemplate", networkId, name, **kwargs)
 
     def getNetworkWebhooksPayloadTemplate(self, networkId: str, payloadTemplateId: str):
         """
@@ -3433,15 +1517,7 @@ class AsyncNetworks:
         - payloadTemplateId (string): Payload template ID
         """
 
-        metadata = {
-            "tags": ["networks", "configure", "webhooks", "payloadTemplates"],
-            "operation": "getNetworkWebhooksPayloadTemplate",
-        }
-        networkId = urllib.parse.quote(str(networkId), safe="")
-        payloadTemplateId = urllib.parse.quote(str(payloadTemplateId), safe="")
-        resource = f"/networks/{networkId}/webhooks/payloadTemplates/{payloadTemplateId}"
-
-        return self._session.get(metadata, resource)
+        return dispatch.call(self._session, "getNetworkWebhooksPayloadTemplate", networkId, payloadTemplateId)
 
     def deleteNetworkWebhooksPayloadTemplate(self, networkId: str, payloadTemplateId: str):
         """
@@ -3452,15 +1528,7 @@ class AsyncNetworks:
         - payloadTemplateId (string): Payload template ID
         """
 
-        metadata = {
-            "tags": ["networks", "configure", "webhooks", "payloadTemplates"],
-            "operation": "deleteNetworkWebhooksPayloadTemplate",
-        }
-        networkId = urllib.parse.quote(str(networkId), safe="")
-        payloadTemplateId = urllib.parse.quote(str(payloadTemplateId), safe="")
-        resource = f"/networks/{networkId}/webhooks/payloadTemplates/{payloadTemplateId}"
-
-        return self._session.delete(metadata, resource)
+        return dispatch.call(self._session, "deleteNetworkWebhooksPayloadTemplate", networkId, payloadTemplateId)
 
     def updateNetworkWebhooksPayloadTemplate(self, networkId: str, payloadTemplateId: str, **kwargs):
         """
@@ -3476,32 +1544,7 @@ class AsyncNetworks:
         - headersFile (string): A file containing the liquid template used with the webhook headers.
         """
 
-        kwargs.update(locals())
-
-        metadata = {
-            "tags": ["networks", "configure", "webhooks", "payloadTemplates"],
-            "operation": "updateNetworkWebhooksPayloadTemplate",
-        }
-        networkId = urllib.parse.quote(str(networkId), safe="")
-        payloadTemplateId = urllib.parse.quote(str(payloadTemplateId), safe="")
-        resource = f"/networks/{networkId}/webhooks/payloadTemplates/{payloadTemplateId}"
-
-        body_params = [
-            "name",
-            "body",
-            "headers",
-            "bodyFile",
-            "headersFile",
-        ]
-        payload = {k.strip(): v for k, v in kwargs.items() if k.strip() in body_params}
-
-        if self._session._validate_kwargs:
-            all_params = [] + body_params
-            invalid = [k for k in kwargs if k.strip() not in all_params and k != "self"]
-            if invalid and self._session._logger:
-                self._session._logger.warning(f"updateNetworkWebhooksPayloadTemplate: ignoring unrecognized kwargs: {invalid}")
-
-        return self._session.put(metadata, resource, payload)
+        return dispatch.call(self._session, "updateNetworkWebhooksPayloadTemplate", networkId, payloadTemplateId, **kwargs)
 
     def createNetworkWebhooksWebhookTest(self, networkId: str, url: str, **kwargs):
         """
@@ -3516,31 +1559,7 @@ class AsyncNetworks:
         - alertTypeId (string): The type of alert which the test webhook will send. Optional. Defaults to power_supply_down.
         """
 
-        kwargs.update(locals())
-
-        metadata = {
-            "tags": ["networks", "configure", "webhooks", "webhookTests"],
-            "operation": "createNetworkWebhooksWebhookTest",
-        }
-        networkId = urllib.parse.quote(str(networkId), safe="")
-        resource = f"/networks/{networkId}/webhooks/webhookTests"
-
-        body_params = [
-            "url",
-            "sharedSecret",
-            "payloadTemplateId",
-            "payloadTemplateName",
-            "alertTypeId",
-        ]
-        payload = {k.strip(): v for k, v in kwargs.items() if k.strip() in body_params}
-
-        if self._session._validate_kwargs:
-            all_params = [] + body_params
-            invalid = [k for k in kwargs if k.strip() not in all_params and k != "self"]
-            if invalid and self._session._logger:
-                self._session._logger.warning(f"createNetworkWebhooksWebhookTest: ignoring unrecognized kwargs: {invalid}")
-
-        return self._session.post(metadata, resource, payload)
+        return dispatch.call(self._session, "createNetworkWebhooksWebhookTest", networkId, url, **kwargs)
 
     def getNetworkWebhooksWebhookTest(self, networkId: str, webhookTestId: str):
         """
@@ -3551,12 +1570,4 @@ class AsyncNetworks:
         - webhookTestId (string): Webhook test ID
         """
 
-        metadata = {
-            "tags": ["networks", "configure", "webhooks", "webhookTests"],
-            "operation": "getNetworkWebhooksWebhookTest",
-        }
-        networkId = urllib.parse.quote(str(networkId), safe="")
-        webhookTestId = urllib.parse.quote(str(webhookTestId), safe="")
-        resource = f"/networks/{networkId}/webhooks/webhookTests/{webhookTestId}"
-
-        return self._session.get(metadata, resource)
+        return dispatch.call(self._session, "getNetworkWebhooksWebhookTest", networkId, webhookTestId)
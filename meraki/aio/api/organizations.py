@@ -1,4 +1,4 @@
-import urllib
+from meraki import dispatch
 
 
 class AsyncOrganizations:
@@ -18,28 +18,7 @@ class AsyncOrganizations:
         - endingBefore (string): A token used by the server to indicate the end of the page. Often this is a timestamp or an ID but it is not limited to those. This parameter should not be defined by client applications. The link for the first, last, prev, or next page in the HTTP Link header should define it.
         """
 
-        kwargs.update(locals())
-
-        metadata = {
-            "tags": ["organizations", "configure"],
-            "operation": "getOrganizations",
-        }
-        resource = "/organizations"
-
-        query_params = [
-            "perPage",
-            "startingAfter",
-            "endingBefore",
-        ]
-        params = {k.strip(): v for k, v in kwargs.items() if k.strip() in query_params}
-
-        if self._session._validate_kwargs:
-            all_params = query_params
-            invalid = [k for k in kwargs if k.strip() not in all_params and k != "self"]
-            if invalid and self._session._logger:
-                self._session._logger.warning(f"getOrganizations: ignoring unrecognized kwargs: {invalid}")
-
-        return self._session.get_pages(metadata, resource, params, total_pages, direction)
+        return dispatch.call(self._session, "getOrganizations", total_pages=total_pages, direction=direction, **kwargs)
 
     def createOrganization(self, name: str, **kwargs):
         """
@@ -50,27 +29,7 @@ class AsyncOrganizations:
         - management (object): Information about the organization's management system
         """
 
-        kwargs.update(locals())
-
-        metadata = {
-            "tags": ["organizations", "configure"],
-            "operation": "createOrganization",
-        }
-        resource = "/organizations"
-
-        body_params = [
-            "name",
-            "management",
-        ]
-        payload = {k.strip(): v for k, v in kwargs.items() if k.strip() in body_params}
-
-        if self._session._validate_kwargs:
-            all_params = [] + body_params
-            invalid = [k for k in kwargs if k.strip() not in all_params and k != "self"]
-            if invalid and self._session._logger:
-                self._session._logger.warning(f"createOrganization: ignoring unrecognized kwargs: {invalid}")
-
-        return self._session.post(metadata, resource, payload)
+        return dispatch.call(self._session, "createOrganization", name, **kwargs)
 
     def getOrganization(self, organizationId: str):
         """
@@ -80,14 +39,7 @@ class AsyncOrganizations:
         - organizationId (string): Organization ID
         """
 
-        metadata = {
-            "tags": ["organizations", "configure"],
-            "operation": "getOrganization",
-        }
-        organizationId = urllib.parse.quote(str(organizationId), safe="")
-        resource = f"/organizations/{organizationId}"
-
-        return self._session.get(metadata, resource)
+        return dispatch.call(self._session, "getOrganization", organizationId)
 
     def updateOrganization(self, organizationId: str, **kwargs):
         """
@@ -101,30 +53,7 @@ class AsyncOrganizations:
         - privacy (object): Privacy-related settings for the organization.
         """
 
-        kwargs.update(locals())
-
-        metadata = {
-            "tags": ["organizations", "configure"],
-            "operation": "updateOrganization",
-        }
-        organizationId = urllib.parse.quote(str(organizationId), safe="")
-        resource = f"/organizations/{organizationId}"
-
-        body_params = [
-            "name",
-            "management",
-            "api",
-            "privacy",
-        ]
-        payload = {k.strip(): v for k, v in kwargs.items() if k.strip() in body_params}
-
-        if self._session._validate_kwargs:
-            all_params = [] + body_params
-            invalid = [k for k in kwargs if k.strip() not in all_params and k != "self"]
-            if invalid and self._session._logger:
-                self._session._logger.warning(f"updateOrganization: ignoring unrecognized kwargs: {invalid}")
-
-        return self._session.put(metadata, resource, payload)
+        return dispatch.call(self._session, "updateOrganization", organizationId, **kwargs)
 
     def deleteOrganization(self, organizationId: str):
         """
@@ -134,14 +63,7 @@ class AsyncOrganizations:
         - organizationId (string): Organization ID
         """
 
-        metadata = {
-            "tags": ["organizations", "configure"],
-            "operation": "deleteOrganization",
-        }
-        organizationId = urllib.parse.quote(str(organizationId), safe="")
-        resource = f"/organizations/{organizationId}"
-
-        return self._session.delete(metadata, resource)
+        return dispatch.call(self._session, "deleteOrganization", organizationId)
 
     def createOrganizationActionBatch(self, organizationId: str, actions: list, **kwargs):
         """
@@ -155,30 +77,7 @@ class AsyncOrganizations:
         - callback (object): Details for the callback. Please include either an httpServerId OR url and sharedSecret
         """
 
-        kwargs.update(locals())
-
-        metadata = {
-            "tags": ["organizations", "configure", "actionBatches"],
-            "operation": "createOrganizationActionBatch",
-        }
-        organizationId = urllib.parse.quote(str(organizationId), safe="")
-        resource = f"/organizations/{organizationId}/actionBatches"
-
-        body_params = [
-            "confirmed",
-            "synchronous",
-            "actions",
-            "callback",
-        ]
-        payload = {k.strip(): v for k, v in kwargs.items() if k.strip() in body_params}
-
-        if self._session._validate_kwargs:
-            all_params = [] + body_params
-            invalid = [k for k in kwargs if k.strip() not in all_params and k != "self"]
-            if invalid and self._session._logger:
-                self._session._logger.warning(f"createOrganizationActionBatch: ignoring unrecognized kwargs: {invalid}")
-
-        return self._session.post(metadata, resource, payload)
+        return dispatch.call(self._session, "createOrganizationActionBatch", organizationId, actions, **kwargs)
 
     def getOrganizationActionBatches(self, organizationId: str, **kwargs):
         """
@@ -189,33 +88,7 @@ class AsyncOrganizations:
         - status (string): Filter batches by status. Valid types are pending, completed, and failed.
         """
 
-        kwargs.update(locals())
-
-        if "status" in kwargs:
-            options = ["completed", "failed", "pending"]
-            assert kwargs["status"] in options, (
-                f'''"status" cannot be "{kwargs["status"]}", & must be set to one of: {options}'''
-            )
-
-        metadata = {
-            "tags": ["organizations", "configure", "actionBatches"],
-            "operation": "getOrganizationActionBatches",
-        }
-        organizationId = urllib.parse.quote(str(organizationId), safe="")
-        resource = f"/organizations/{organizationId}/actionBatches"
-
-        query_params = [
-            "status",
-        ]
-        params = {k.strip(): v for k, v in kwargs.items() if k.strip() in query_params}
-
-        if self._session._validate_kwargs:
-            all_params = query_params
-            invalid = [k for k in kwargs if k.strip() not in all_params and k != "self"]
-            if invalid and self._session._logger:
-                self._session._logger.warning(f"getOrganizationActionBatches: ignoring unrecognized kwargs: {invalid}")
-
-        return self._session.get(metadata, resource, params)
+        return dispatch.call(self._session, "getOrganizationActionBatches", organizationId, **kwargs)
 
     def getOrganizationActionBatch(self, organizationId: str, actionBatchId: str):
         """
@@ -226,15 +99,7 @@ class AsyncOrganizations:
         - actionBatchId (string): Action batch ID
         """
 
-        metadata = {
-            "tags": ["organizations", "configure", "actionBatches"],
-            "operation": "getOrganizationActionBatch",
-        }
-        organizationId = urllib.parse.quote(str(organizationId), safe="")
-        actionBatchId = urllib.parse.quote(str(actionBatchId), safe="")
-        resource = f"/organizations/{organizationId}/actionBatches/{actionBatchId}"
-
-        return self._session.get(metadata, resource)
+        return dispatch.call(self._session, "getOrganizationActionBatch", organizationId, actionBatchId)
 
     def deleteOrganizationActionBatch(self, organizationId: str, actionBatchId: str):
         """
@@ -245,15 +110,7 @@ class AsyncOrganizations:
         - actionBatchId (string): Action batch ID
         """
 
-        metadata = {
-            "tags": ["organizations", "configure", "actionBatches"],
-            "operation": "deleteOrganizationActionBatch",
-        }
-        organizationId = urllib.parse.quote(str(organizationId), safe="")
-        actionBatchId = urllib.parse.quote(str(actionBatchId), safe="")
-        resource = f"/organizations/{organizationId}/actionBatches/{actionBatchId}"
-
-        return self._session.delete(metadata, resource)
+        return dispatch.call(self._session, "deleteOrganizationActionBatch", organizationId, actionBatchId)
 
     def updateOrganizationActionBatch(self, organizationId: str, actionBatchId: str, **kwargs):
         """
@@ -266,29 +123,7 @@ class AsyncOrganizations:
         - synchronous (boolean): Set to true to force the batch to run synchronous. There can be at most 20 actions in synchronous batch.
         """
 
-        kwargs.update(locals())
-
-        metadata = {
-            "tags": ["organizations", "configure", "actionBatches"],
-            "operation": "updateOrganizationActionBatch",
-        }
-        organizationId = urllib.parse.quote(str(organizationId), safe="")
-        actionBatchId = urllib.parse.quote(str(actionBatchId), safe="")
-        resource = f"/organizations/{organizationId}/actionBatches/{actionBatchId}"
-
-        body_params = [
-            "confirmed",
-            "synchronous",
-        ]
-        payload = {k.strip(): v for k, v in kwargs.items() if k.strip() in body_params}
-
-        if self._session._validate_kwargs:
-            all_params = [] + body_params
-            invalid = [k for k in kwargs if k.strip() not in all_params and k != "self"]
-            if invalid and self._session._logger:
-                self._session._logger.warning(f"updateOrganizationActionBatch: ignoring unrecognized kwargs: {invalid}")
-
-        return self._session.put(metadata, resource, payload)
+        return dispatch.call(self._session, "updateOrganizationActionBatch", organizationId, actionBatchId, **kwargs)
 
     def getOrganizationAdaptivePolicyAcls(self, organizationId: str):
         """
@@ -298,14 +133,7 @@ class AsyncOrganizations:
         - organizationId (string): Organization ID
         """
 
-        metadata = {
-            "tags": ["organizations", "configure", "adaptivePolicy", "acls"],
-            "operation": "getOrganizationAdaptivePolicyAcls",
-        }
-        organizationId = urllib.parse.quote(str(organizationId), safe="")
-        resource = f"/organizations/{organizationId}/adaptivePolicy/acls"
-
-        return self._session.get(metadata, resource)
+        return dispatch.call(self._session, "getOrganizationAdaptivePolicyAcls", organizationId)
 
     def createOrganizationAdaptivePolicyAcl(self, organizationId: str, name: str, rules: list, ipVersion: str, **kwargs):
         """
@@ -319,36 +147,9 @@ class AsyncOrganizations:
         - description (string): Description of the adaptive policy ACL
         """
 
-        kwargs.update(locals())
-
-        if "ipVersion" in kwargs:
-            options = ["any", "ipv4", "ipv6"]
-            assert kwargs["ipVersion"] in options, (
-                f'''"ipVersion" cannot be "{kwargs["ipVersion"]}", & must be set to one of: {options}'''
-            )
-
-        metadata = {
-            "tags": ["organizations", "configure", "adaptivePolicy", "acls"],
-            "operation": "createOrganizationAdaptivePolicyAcl",
-        }
-        organizationId = urllib.parse.quote(str(organizationId), safe="")
-        resource = f"/organizations/{organizationId}/adaptivePolicy/acls"
-
-        body_params = [
-            "name",
-            "description",
-            "rules",
-            "ipVersion",
-        ]
-        payload = {k.strip(): v for k, v in kwargs.items() if k.strip() in body_params}
-
-        if self._session._validate_kwargs:
-            all_params = [] + body_params
-            invalid = [k for k in kwargs if k.strip() not in all_params and k != "self"]
-            if invalid and self._session._logger:
-                self._session._logger.warning(f"createOrganizationAdaptivePolicyAcl: ignoring unrecognized kwargs: {invalid}")
-
-        return self._session.post(metadata, resource, payload)
+        return dispatch.call(
+            self._session, "createOrganizationAdaptivePolicyAcl", organizationId, name, rules, ipVersion, **kwargs
+        )
 
     def getOrganizationAdaptivePolicyAcl(self, organizationId: str, aclId: str):
         """
@@ -359,15 +160,7 @@ class AsyncOrganizations:
         - aclId (string): Acl ID
         """
 
-        metadata = {
-            "tags": ["organizations", "configure", "adaptivePolicy", "acls"],
-            "operation": "getOrganizationAdaptivePolicyAcl",
-        }
-        organizationId = urllib.parse.quote(str(organizationId), safe="")
-        aclId = urllib.parse.quote(str(aclId), safe="")
-        resource = f"/organizations/{organizationId}/adaptivePolicy/acls/{aclId}"
-
-        return self._session.get(metadata, resource)
+        return dispatch.call(self._session, "getOrganizationAdaptivePolicyAcl", organizationId, aclId)
 
     def updateOrganizationAdaptivePolicyAcl(self, organizationId: str, aclId: str, **kwargs):
         """
@@ -382,37 +175,7 @@ class AsyncOrganizations:
         - ipVersion (string): IP version of adpative policy ACL. One of: 'any', 'ipv4' or 'ipv6'
         """
 
-        kwargs.update(locals())
-
-        if "ipVersion" in kwargs:
-            options = ["any", "ipv4", "ipv6"]
-            assert kwargs["ipVersion"] in options, (
-                f'''"ipVersion" cannot be "{kwargs["ipVersion"]}", & must be set to one of: {options}'''
-            )
-
-        metadata = {
-            "tags": ["organizations", "configure", "adaptivePolicy", "acls"],
-            "operation": "updateOrganizationAdaptivePolicyAcl",
-        }
-        organizationId = urllib.parse.quote(str(organizationId), safe="")
-        aclId = urllib.parse.quote(str(aclId), safe="")
-        resource = f"/organizations/{organizationId}/adaptivePolicy/acls/{aclId}"
-
-        body_params = [
-            "name",
-            "description",
-            "rules",
-            "ipVersion",
-        ]
-        payload = {k.strip(): v for k, v in kwargs.items() if k.strip() in body_params}
-
-        if self._session._validate_kwargs:
-            all_params = [] + body_params
-            invalid = [k for k in kwargs if k.strip() not in all_params and k != "self"]
-            if invalid and self._session._logger:
-                self._session._logger.warning(f"updateOrganizationAdaptivePolicyAcl: ignoring unrecognized kwargs: {invalid}")
-
-        return self._session.put(metadata, resource, payload)
+        return dispatch.call(self._session, "updateOrganizationAdaptivePolicyAcl", organizationId, aclId, **kwargs)
 
     def deleteOrganizationAdaptivePolicyAcl(self, organizationId: str, aclId: str):
         """
@@ -423,15 +186,7 @@ class AsyncOrganizations:
         - aclId (string): Acl ID
         """
 
-        metadata = {
-            "tags": ["organizations", "configure", "adaptivePolicy", "acls"],
-            "operation": "deleteOrganizationAdaptivePolicyAcl",
-        }
-        organizationId = urllib.parse.quote(str(organizationId), safe="")
-        aclId = urllib.parse.quote(str(aclId), safe="")
-        resource = f"/organizations/{organizationId}/adaptivePolicy/acls/{aclId}"
-
-        return self._session.delete(metadata, resource)
+        return dispatch.call(self._session, "deleteOrganizationAdaptivePolicyAcl", organizationId, aclId)
 
     def getOrganizationAdaptivePolicyGroups(self, organizationId: str):
         """
@@ -441,14 +196,7 @@ class AsyncOrganizations:
         - organizationId (string): Organization ID
         """
 
-        metadata = {
-            "tags": ["organizations", "configure", "adaptivePolicy", "groups"],
-            "operation": "getOrganizationAdaptivePolicyGroups",
-        }
-        organizationId = urllib.parse.quote(str(organizationId), safe="")
-        resource = f"/organizations/{organizationId}/adaptivePolicy/groups"
-
-        return self._session.get(metadata, resource)
+        return dispatch.call(self._session, "getOrganizationAdaptivePolicyGroups", organizationId)
 
     def createOrganizationAdaptivePolicyGroup(self, organizationId: str, name: str, sgt: int, **kwargs):
         """
@@ -462,32 +210,7 @@ class AsyncOrganizations:
         - policyObjects (array): The policy objects that belong to this group; traffic from addresses specified by these policy objects will be tagged with this group's SGT value if no other tagging scheme is being used (each requires one unique attribute) (default: [])
         """
 
-        kwargs.update(locals())
-
-        metadata = {
-            "tags": ["organizations", "configure", "adaptivePolicy", "groups"],
-            "operation": "createOrganizationAdaptivePolicyGroup",
-        }
-        organizationId = urllib.parse.quote(str(organizationId), safe="")
-        resource = f"/organizations/{organizationId}/adaptivePolicy/groups"
-
-        body_params = [
-            "name",
-            "sgt",
-            "description",
-            "policyObjects",
-        ]
-        payload = {k.strip(): v for k, v in kwargs.items() if k.strip() in body_params}
-
-        if self._session._validate_kwargs:
-            all_params = [] + body_params
-            invalid = [k for k in kwargs if k.strip() not in all_params and k != "self"]
-            if invalid and self._session._logger:
-                self._session._logger.warning(
-                    f"createOrganizationAdaptivePolicyGroup: ignoring unrecognized kwargs: {invalid}"
-                )
-
-        return self._session.post(metadata, resource, payload)
+        return dispatch.call(self._session, "createOrganizationAdaptivePolicyGroup", organizationId, name, sgt, **kwargs)
 
     def getOrganizationAdaptivePolicyGroup(self, organizationId: str, id: str):
         """
@@ -498,15 +221,7 @@ class AsyncOrganizations:
         - id (string): ID
         """
 
-        metadata = {
-            "tags": ["organizations", "configure", "adaptivePolicy", "groups"],
-            "operation": "getOrganizationAdaptivePolicyGroup",
-        }
-        organizationId = urllib.parse.quote(str(organizationId), safe="")
-        id = urllib.parse.quote(str(id), safe="")
-        resource = f"/organizations/{organizationId}/adaptivePolicy/groups/{id}"
-
-        return self._session.get(metadata, resource)
+        return dispatch.call(self._session, "getOrganizationAdaptivePolicyGroup", organizationId, id)
 
     def updateOrganizationAdaptivePolicyGroup(self, organizationId: str, id: str, **kwargs):
         """
@@ -521,33 +236,7 @@ class AsyncOrganizations:
         - policyObjects (array): The policy objects that belong to this group; traffic from addresses specified by these policy objects will be tagged with this group's SGT value if no other tagging scheme is being used (each requires one unique attribute)
         """
 
-        kwargs.update(locals())
-
-        metadata = {
-            "tags": ["organizations", "configure", "adaptivePolicy", "groups"],
-            "operation": "updateOrganizationAdaptivePolicyGroup",
-        }
-        organizationId = urllib.parse.quote(str(organizationId), safe="")
-        id = urllib.parse.quote(str(id), safe="")
-        resource = f"/organizations/{organizationId}/adaptivePolicy/groups/{id}"
-
-        body_params = [
-            "name",
-            "sgt",
-            "description",
-            "policyObjects",
-        ]
-        payload = {k.strip(): v for k, v in kwargs.items() if k.strip() in body_params}
-
-        if self._session._validate_kwargs:
-            all_params = [] + body_params
-            invalid = [k for k in kwargs if k.strip() not in all_params and k != "self"]
-            if invalid and self._session._logger:
-                self._session._logger.warning(
-                    f"updateOrganizationAdaptivePolicyGroup: ignoring unrecognized kwargs: {invalid}"
-                )
-
-        return self._session.put(metadata, resource, payload)
+        return dispatch.call(self._session, "updateOrganizationAdaptivePolicyGroup", organizationId, id, **kwargs)
 
     def deleteOrganizationAdaptivePolicyGroup(self, organizationId: str, id: str):
         """
@@ -558,15 +247,7 @@ class AsyncOrganizations:
         - id (string): ID
         """
 
-        metadata = {
-            "tags": ["organizations", "configure", "adaptivePolicy", "groups"],
-            "operation": "deleteOrganizationAdaptivePolicyGroup",
-        }
-        organizationId = urllib.parse.quote(str(organizationId), safe="")
-        id = urllib.parse.quote(str(id), safe="")
-        resource = f"/organizations/{organizationId}/adaptivePolicy/groups/{id}"
-
-        return self._session.delete(metadata, resource)
+        return dispatch.call(self._session, "deleteOrganizationAdaptivePolicyGroup", organizationId, id)
 
     def getOrganizationAdaptivePolicyOverview(self, organizationId: str):
         """
@@ -576,14 +257,7 @@ class AsyncOrganizations:
         - organizationId (string): Organization ID
         """
 
-        metadata = {
-            "tags": ["organizations", "monitor", "adaptivePolicy", "overview"],
-            "operation": "getOrganizationAdaptivePolicyOverview",
-        }
-        organizationId = urllib.parse.quote(str(organizationId), safe="")
-        resource = f"/organizations/{organizationId}/adaptivePolicy/overview"
-
-        return self._session.get(metadata, resource)
+        return dispatch.call(self._session, "getOrganizationAdaptivePolicyOverview", organizationId)
 
     def getOrganizationAdaptivePolicyPolicies(self, organizationId: str):
         """
@@ -593,14 +267,7 @@ class AsyncOrganizations:
         - organizationId (string): Organization ID
         """
 
-        metadata = {
-            "tags": ["organizations", "configure", "adaptivePolicy", "policies"],
-            "operation": "getOrganizationAdaptivePolicyPolicies",
-        }
-        organizationId = urllib.parse.quote(str(organizationId), safe="")
-        resource = f"/organizations/{organizationId}/adaptivePolicy/policies"
-
-        return self._session.get(metadata, resource)
+        return dispatch.call(self._session, "getOrganizationAdaptivePolicyPolicies", organizationId)
 
     def createOrganizationAdaptivePolicyPolicy(self, organizationId: str, sourceGroup: dict, destinationGroup: dict, **kwargs):
         """
@@ -614,38 +281,9 @@ class AsyncOrganizations:
         - lastEntryRule (string): The rule to apply if there is no matching ACL (default: "default")
         """
 
-        kwargs.update(locals())
-
-        if "lastEntryRule" in kwargs:
-            options = ["allow", "default", "deny"]
-            assert kwargs["lastEntryRule"] in options, (
-                f'''"lastEntryRule" cannot be "{kwargs["lastEntryRule"]}", & must be set to one of: {options}'''
-            )
-
-        metadata = {
-            "tags": ["organizations", "configure", "adaptivePolicy", "policies"],
-            "operation": "createOrganizationAdaptivePolicyPolicy",
-        }
-        organizationId = urllib.parse.quote(str(organizationId), safe="")
-        resource = f"/organizations/{organizationId}/adaptivePolicy/policies"
-
-        body_params = [
-            "sourceGroup",
-            "destinationGroup",
-            "acls",
-            "lastEntryRule",
-        ]
-        payload = {k.strip(): v for k, v in kwargs.items() if k.strip() in body_params}
-
-        if self._session._validate_kwargs:
-            all_params = [] + body_params
-            invalid = [k for k in kwargs if k.strip() not in all_params and k != "self"]
-            if invalid and self._session._logger:
-                self._session._logger.warning(
-                    f"createOrganizationAdaptivePolicyPolicy: ignoring unrecognized kwargs: {invalid}"
-                )
-
-        return self._session.post(metadata, resource, payload)
+        return dispatch.call(
+            self._session, "createOrganizationAdaptivePolicyPolicy", organizationId, sourceGroup, destinationGroup, **kwargs
+        )
 
     def getOrganizationAdaptivePolicyPolicy(self, organizationId: str, id: str):
         """
@@ -656,15 +294,7 @@ class AsyncOrganizations:
         - id (string): ID
         """
 
-        metadata = {
-            "tags": ["organizations", "configure", "adaptivePolicy", "policies"],
-            "operation": "getOrganizationAdaptivePolicyPolicy",
-        }
-        organizationId = urllib.parse.quote(str(organizationId), safe="")
-        id = urllib.parse.quote(str(id), safe="")
-        resource = f"/organizations/{organizationId}/adaptivePolicy/policies/{id}"
-
-        return self._session.get(metadata, resource)
+        return dispatch.call(self._session, "getOrganizationAdaptivePolicyPolicy", organizationId, id)
 
     def updateOrganizationAdaptivePolicyPolicy(self, organizationId: str, id: str, **kwargs):
         """
@@ -679,39 +309,7 @@ class AsyncOrganizations:
         - lastEntryRule (string): The rule to apply if there is no matching ACL
         """
 
-        kwargs.update(locals())
-
-        if "lastEntryRule" in kwargs:
-            options = ["allow", "default", "deny"]
-            assert kwargs["lastEntryRule"] in options, (
-                f'''"lastEntryRule" cannot be "{kwargs["lastEntryRule"]}", & must be set to one of: {options}'''
-            )
-
-        metadata = {
-            "tags": ["organizations", "configure", "adaptivePolicy", "policies"],
-            "operation": "updateOrganizationAdaptivePolicyPolicy",
-        }
-        organizationId = urllib.parse.quote(str(organizationId), safe="")
-        id = urllib.parse.quote(str(id), safe="")
-        resource = f"/organizations/{organizationId}/adaptivePolicy/policies/{id}"
-
-        body_params = [
-            "sourceGroup",
-            "destinationGroup",
-            "acls",
-            "lastEntryRule",
-        ]
-        payload = {k.strip(): v for k, v in kwargs.items() if k.strip() in body_params}
-
-        if self._session._validate_kwargs:
-            all_params = [] + body_params
-            invalid = [k for k in kwargs if k.strip() not in all_params and k != "self"]
-            if invalid and self._session._logger:
-                self._session._logger.warning(
-                    f"updateOrganizationAdaptivePolicyPolicy: ignoring unrecognized kwargs: {invalid}"
-                )
-
-        return self._session.put(metadata, resource, payload)
+        return dispatch.call(self._session, "updateOrganizationAdaptivePolicyPolicy", organizationId, id, **kwargs)
 
     def deleteOrganizationAdaptivePolicyPolicy(self, organizationId: str, id: str):
         """
@@ -722,15 +320,7 @@ class AsyncOrganizations:
         - id (string): ID
         """
 
-        metadata = {
-            "tags": ["organizations", "configure", "adaptivePolicy", "policies"],
-            "operation": "deleteOrganizationAdaptivePolicyPolicy",
-        }
-        organizationId = urllib.parse.quote(str(organizationId), safe="")
-        id = urllib.parse.quote(str(id), safe="")
-        resource = f"/organizations/{organizationId}/adaptivePolicy/policies/{id}"
-
-        return self._session.delete(metadata, resource)
+        return dispatch.call(self._session, "deleteOrganizationAdaptivePolicyPolicy", organizationId, id)
 
     def getOrganizationAdaptivePolicySettings(self, organizationId: str):
         """
@@ -740,14 +330,7 @@ class AsyncOrganizations:
         - organizationId (string): Organization ID
         """
 
-        metadata = {
-            "tags": ["organizations", "configure", "adaptivePolicy", "settings"],
-            "operation": "getOrganizationAdaptivePolicySettings",
-        }
-        organizationId = urllib.parse.quote(str(organizationId), safe="")
-        resource = f"/organizations/{organizationId}/adaptivePolicy/settings"
-
-        return self._session.get(metadata, resource)
+        return dispatch.call(self._session, "getOrganizationAdaptivePolicySettings", organizationId)
 
     def updateOrganizationAdaptivePolicySettings(self, organizationId: str, **kwargs):
         """
@@ -758,29 +341,7 @@ class AsyncOrganizations:
         - enabledNetworks (array): List of network IDs with adaptive policy enabled
         """
 
-        kwargs.update(locals())
-
-        metadata = {
-            "tags": ["organizations", "configure", "adaptivePolicy", "settings"],
-            "operation": "updateOrganizationAdaptivePolicySettings",
-        }
-        organizationId = urllib.parse.quote(str(organizationId), safe="")
-        resource = f"/organizations/{organizationId}/adaptivePolicy/settings"
-
-        body_params = [
-            "enabledNetworks",
-        ]
-        payload = {k.strip(): v for k, v in kwargs.items() if k.strip() in body_params}
-
-        if self._session._validate_kwargs:
-            all_params = [] + body_params
-            invalid = [k for k in kwargs if k.strip() not in all_params and k != "self"]
-            if invalid and self._session._logger:
-                self._session._logger.warning(
-                    f"updateOrganizationAdaptivePolicySettings: ignoring unrecognized kwargs: {invalid}"
-                )
-
-        return self._session.put(metadata, resource, payload)
+        return dispatch.call(self._session, "updateOrganizationAdaptivePolicySettings", organizationId, **kwargs)
 
     def getOrganizationAdmins(self, organizationId: str, **kwargs):
         """
@@ -791,35 +352,7 @@ class AsyncOrganizations:
         - networkIds (array): Optional parameter to filter the result set by the included set of network IDs
         """
 
-        kwargs.update(locals())
-
-        metadata = {
-            "tags": ["organizations", "configure", "admins"],
-            "operation": "getOrganizationAdmins",
-        }
-        organizationId = urllib.parse.quote(str(organizationId), safe="")
-        resource = f"/organizations/{organizationId}/admins"
-
-        query_params = [
-            "networkIds",
-        ]
-        params = {k.strip(): v for k, v in kwargs.items() if k.strip() in query_params}
-
-        array_params = [
-            "networkIds",
-        ]
-        for k, v in kwargs.items():
-            if k.strip() in array_params:
-                params[f"{k.strip()}[]"] = kwargs[f"{k}"]
-                params.pop(k.strip())
-
-        if self._session._validate_kwargs:
-            all_params = query_params + array_params
-            invalid = [k for k in kwargs if k.strip() not in all_params and k != "self"]
-            if invalid and self._session._logger:
-                self._session._logger.warning(f"getOrganizationAdmins: ignoring unrecognized kwargs: {invalid}")
-
-        return self._session.get(metadata, resource, params)
+        return dispatch.call(self._session, "getOrganizationAdmins", organizationId, **kwargs)
 
     def createOrganizationAdmin(self, organizationId: str, email: str, name: str, orgAccess: str, **kwargs):
         """
@@ -835,43 +368,7 @@ class AsyncOrganizations:
         - authenticationMethod (string): No longer used as of Cisco SecureX end-of-life. Can be one of 'Email'. The default is Email authentication.
         """
 
-        kwargs.update(locals())
-
-        if "orgAccess" in kwargs:
-            options = ["enterprise", "full", "none", "read-only"]
-            assert kwargs["orgAccess"] in options, (
-                f'''"orgAccess" cannot be "{kwargs["orgAccess"]}", & must be set to one of: {options}'''
-            )
-        if "authenticationMethod" in kwargs:
-            options = ["Email"]
-            assert kwargs["authenticationMethod"] in options, (
-                f'''"authenticationMethod" cannot be "{kwargs["authenticationMethod"]}", & must be set to one of: {options}'''
-            )
-
-        metadata = {
-            "tags": ["organizations", "configure", "admins"],
-            "operation": "createOrganizationAdmin",
-        }
-        organizationId = urllib.parse.quote(str(organizationId), safe="")
-        resource = f"/organizations/{organizationId}/admins"
-
-        body_params = [
-            "email",
-            "name",
-            "orgAccess",
-            "tags",
-            "networks",
-            "authenticationMethod",
-        ]
-        payload = {k.strip(): v for k, v in kwargs.items() if k.strip() in body_params}
-
-        if self._session._validate_kwargs:
-            all_params = [] + body_params
-            invalid = [k for k in kwargs if k.strip() not in all_params and k != "self"]
-            if invalid and self._session._logger:
-                self._session._logger.warning(f"createOrganizationAdmin: ignoring unrecognized kwargs: {invalid}")
-
-        return self._session.post(metadata, resource, payload)
+        return dispatch.call(self._session, "createOrganizationAdmin", organizationId, email, name, orgAccess, **kwargs)
 
     def updateOrganizationAdmin(self, organizationId: str, adminId: str, **kwargs):
         """
@@ -886,37 +383,7 @@ class AsyncOrganizations:
         - networks (array): The list of networks that the dashboard administrator has privileges on
         """
 
-        kwargs.update(locals())
-
-        if "orgAccess" in kwargs:
-            options = ["enterprise", "full", "none", "read-only"]
-            assert kwargs["orgAccess"] in options, (
-                f'''"orgAccess" cannot be "{kwargs["orgAccess"]}", & must be set to one of: {options}'''
-            )
-
-        metadata = {
-            "tags": ["organizations", "configure", "admins"],
-            "operation": "updateOrganizationAdmin",
-        }
-        organizationId = urllib.parse.quote(str(organizationId), safe="")
-        adminId = urllib.parse.quote(str(adminId), safe="")
-        resource = f"/organizations/{organizationId}/admins/{adminId}"
-
-        body_params = [
-            "name",
-            "orgAccess",
-            "tags",
-            "networks",
-        ]
-        payload = {k.strip(): v for k, v in kwargs.items() if k.strip() in body_params}
-
-        if self._session._validate_kwargs:
-            all_params = [] + body_params
-            invalid = [k for k in kwargs if k.strip() not in all_params and k != "self"]
-            if invalid and self._session._logger:
-                self._session._logger.warning(f"updateOrganizationAdmin: ignoring unrecognized kwargs: {invalid}")
-
-        return self._session.put(metadata, resource, payload)
+        return dispatch.call(self._session, "updateOrganizationAdmin", organizationId, adminId, **kwargs)
 
     def deleteOrganizationAdmin(self, organizationId: str, adminId: str):
         """
@@ -927,15 +394,7 @@ class AsyncOrganizations:
         - adminId (string): Admin ID
         """
 
-        metadata = {
-            "tags": ["organizations", "configure", "admins"],
-            "operation": "deleteOrganizationAdmin",
-        }
-        organizationId = urllib.parse.quote(str(organizationId), safe="")
-        adminId = urllib.parse.quote(str(adminId), safe="")
-        resource = f"/organizations/{organizationId}/admins/{adminId}"
-
-        return self._session.delete(metadata, resource)
+        return dispatch.call(self._session, "deleteOrganizationAdmin", organizationId, adminId)
 
     def getOrganizationAlertsProfiles(self, organizationId: str):
         """
@@ -945,14 +404,7 @@ class AsyncOrganizations:
         - organizationId (string): Organization ID
         """
 
-        metadata = {
-            "tags": ["organizations", "configure", "alerts", "profiles"],
-            "operation": "getOrganizationAlertsProfiles",
-        }
-        organizationId = urllib.parse.quote(str(organizationId), safe="")
-        resource = f"/organizations/{organizationId}/alerts/profiles"
-
-        return self._session.get(metadata, resource)
+        return dispatch.call(self._session, "getOrganizationAlertsProfiles", organizationId)
 
     def createOrganizationAlertsProfile(
         self, organizationId: str, type: str, alertCondition: dict, recipients: dict, networkTags: list, **kwargs
@@ -969,44 +421,16 @@ class AsyncOrganizations:
         - description (string): User supplied description of the alert
         """
 
-        kwargs.update(locals())
-
-        if "type" in kwargs:
-            options = [
-                "appOutage",
-                "voipJitter",
-                "voipMos",
-                "voipPacketLoss",
-                "wanLatency",
-                "wanPacketLoss",
-                "wanStatus",
-                "wanUtilization",
-            ]
-            assert kwargs["type"] in options, f'''"type" cannot be "{kwargs["type"]}", & must be set to one of: {options}'''
-
-        metadata = {
-            "tags": ["organizations", "configure", "alerts", "profiles"],
-            "operation": "createOrganizationAlertsProfile",
-        }
-        organizationId = urllib.parse.quote(str(organizationId), safe="")
-        resource = f"/organizations/{organizationId}/alerts/profiles"
-
-        body_params = [
-            "type",
-            "alertCondition",
-            "recipients",
-            "networkTags",
-            "description",
-        ]
-        payload = {k.strip(): v for k, v in kwargs.items() if k.strip() in body_params}
-
-        if self._session._validate_kwargs:
-            all_params = [] + body_params
-            invalid = [k for k in kwargs if k.strip() not in all_params and k != "self"]
-            if invalid and self._session._logger:
-                self._session._logger.warning(f"createOrganizationAlertsProfile: ignoring unrecognized kwargs: {invalid}")
-
-        return self._session.post(metadata, resource, payload)
+        return dispatch.call(
+            self._session,
+            "createOrganizationAlertsProfile",
+            organizationId,
+            type,
+            alertCondition,
+            recipients,
+            networkTags,
+            **kwargs,
+        )
 
     def updateOrganizationAlertsProfile(self, organizationId: str, alertConfigId: str, **kwargs):
         """
@@ -1023,46 +447,7 @@ class AsyncOrganizations:
         - description (string): User supplied description of the alert
         """
 
-        kwargs.update(locals())
-
-        if "type" in kwargs:
-            options = [
-                "appOutage",
-                "voipJitter",
-                "voipMos",
-                "voipPacketLoss",
-                "wanLatency",
-                "wanPacketLoss",
-                "wanStatus",
-                "wanUtilization",
-            ]
-            assert kwargs["type"] in options, f'''"type" cannot be "{kwargs["type"]}", & must be set to one of: {options}'''
-
-        metadata = {
-            "tags": ["organizations", "configure", "alerts", "profiles"],
-            "operation": "updateOrganizationAlertsProfile",
-        }
-        organizationId = urllib.parse.quote(str(organizationId), safe="")
-        alertConfigId = urllib.parse.quote(str(alertConfigId), safe="")
-        resource = f"/organizations/{organizationId}/alerts/profiles/{alertConfigId}"
-
-        body_params = [
-            "enabled",
-            "type",
-            "alertCondition",
-            "recipients",
-            "networkTags",
-            "description",
-        ]
-        payload = {k.strip(): v for k, v in kwargs.items() if k.strip() in body_params}
-
-        if self._session._validate_kwargs:
-            all_params = [] + body_params
-            invalid = [k for k in kwargs if k.strip() not in all_params and k != "self"]
-            if invalid and self._session._logger:
-                self._session._logger.warning(f"updateOrganizationAlertsProfile: ignoring unrecognized kwargs: {invalid}")
-
-        return self._session.put(metadata, resource, payload)
+        return dispatch.call(self._session, "updateOrganizationAlertsProfile", organizationId, alertConfigId, **kwargs)
 
     def deleteOrganizationAlertsProfile(self, organizationId: str, alertConfigId: str):
         """
@@ -1073,15 +458,7 @@ class AsyncOrganizations:
         - alertConfigId (string): Alert config ID
         """
 
-        metadata = {
-            "tags": ["organizations", "configure", "alerts", "profiles"],
-            "operation": "deleteOrganizationAlertsProfile",
-        }
-        organizationId = urllib.parse.quote(str(organizationId), safe="")
-        alertConfigId = urllib.parse.quote(str(alertConfigId), safe="")
-        resource = f"/organizations/{organizationId}/alerts/profiles/{alertConfigId}"
-
-        return self._session.delete(metadata, resource)
+        return dispatch.call(self._session, "deleteOrganizationAlertsProfile", organizationId, alertConfigId)
 
     def getOrganizationApiRestProvisioningPipelinesJobs(self, organizationId: str, total_pages=1, direction="next", **kwargs):
         """
@@ -1098,47 +475,14 @@ class AsyncOrganizations:
         - status (string): If provided, filters jobs by status
         """
 
-        kwargs.update(locals())
-
-        if "status" in kwargs:
-            options = ["complete", "deferred", "failed", "new", "ready", "running", "scheduled"]
-            assert kwargs["status"] in options, (
-                f'''"status" cannot be "{kwargs["status"]}", & must be set to one of: {options}'''
-            )
-
-        metadata = {
-            "tags": ["organizations", "configure", "api", "rest", "provisioning", "pipelines", "jobs"],
-            "operation": "getOrganizationApiRestProvisioningPipelinesJobs",
-        }
-        organizationId = urllib.parse.quote(str(organizationId), safe="")
-        resource = f"/organizations/{organizationId}/api/rest/provisioning/pipelines/jobs"
-
-        query_params = [
-            "perPage",
-            "startingAfter",
-            "endingBefore",
-            "pipelineIds",
-            "status",
-        ]
-        params = {k.strip(): v for k, v in kwargs.items() if k.strip() in query_params}
-
-        array_params = [
-            "pipelineIds",
-        ]
-        for k, v in kwargs.items():
-            if k.strip() in array_params:
-                params[f"{k.strip()}[]"] = kwargs[f"{k}"]
-                params.pop(k.strip())
-
-        if self._session._validate_kwargs:
-            all_params = query_params + array_params
-            invalid = [k for k in kwargs if k.strip() not in all_params and k != "self"]
-            if invalid and self._session._logger:
-                self._session._logger.warning(
-                    f"getOrganizationApiRestProvisioningPipelinesJobs: ignoring unrecognized kwargs: {invalid}"
-                )
-
-        return self._session.get_pages(metadata, resource, params, total_pages, direction)
+        return dispatch.call(
+            self._session,
+            "getOrganizationApiRestProvisioningPipelinesJobs",
+            organizationId,
+            total_pages=total_pages,
+            direction=direction,
+            **kwargs,
+        )
 
     def getOrganizationApiRestProvisioningPipelinesJobsOverviewsByPipeline(self, organizationId: str, **kwargs):
         """
@@ -1149,47 +493,9 @@ class AsyncOrganizations:
         - pipelineIds (array): Pipeline IDs to retrieve overviews for
         """
 
-        kwargs.update(locals())
-
-        metadata = {
-            "tags": [
-                "organizations",
-                "configure",
-                "api",
-                "rest",
-                "provisioning",
-                "pipelines",
-                "jobs",
-                "overviews",
-                "byPipeline",
-            ],
-            "operation": "getOrganizationApiRestProvisioningPipelinesJobsOverviewsByPipeline",
-        }
-        organizationId = urllib.parse.quote(str(organizationId), safe="")
-        resource = f"/organizations/{organizationId}/api/rest/provisioning/pipelines/jobs/overviews/byPipeline"
-
-        query_params = [
-            "pipelineIds",
-        ]
-        params = {k.strip(): v for k, v in kwargs.items() if k.strip() in query_params}
-
-        array_params = [
-            "pipelineIds",
-        ]
-        for k, v in kwargs.items():
-            if k.strip() in array_params:
-                params[f"{k.strip()}[]"] = kwargs[f"{k}"]
-                params.pop(k.strip())
-
-        if self._session._validate_kwargs:
-            all_params = query_params + array_params
-            invalid = [k for k in kwargs if k.strip() not in all_params and k != "self"]
-            if invalid and self._session._logger:
-                self._session._logger.warning(
-                    f"getOrganizationApiRestProvisioningPipelinesJobsOverviewsByPipeline: ignoring unrecognized kwargs: {invalid}"
-                )
-
-        return self._session.get(metadata, resource, params)
+        return dispatch.call(
+            self._session, "getOrganizationApiRestProvisioningPipelinesJobsOverviewsByPipeline", organizationId, **kwargs
+        )
 
     def getOrganizationApiRequests(self, organizationId: str, total_pages=1, direction="next", **kwargs):
         """
@@ -1215,59 +521,9 @@ class AsyncOrganizations:
         - operationIds (array): Filter the results by one or more operation IDs for the API request
         """
 
-        kwargs.update(locals())
-
-        if "method" in kwargs:
-            options = ["DELETE", "GET", "POST", "PUT"]
-            assert kwargs["method"] in options, (
-                f'''"method" cannot be "{kwargs["method"]}", & must be set to one of: {options}'''
-            )
-        if "version" in kwargs:
-            options = [0, 1]
-            assert kwargs["version"] in options, (
-                f'''"version" cannot be "{kwargs["version"]}", & must be set to one of: {options}'''
-            )
-
-        metadata = {
-            "tags": ["organizations", "monitor", "apiRequests"],
-            "operation": "getOrganizationApiRequests",
-        }
-        organizationId = urllib.parse.quote(str(organizationId), safe="")
-        resource = f"/organizations/{organizationId}/apiRequests"
-
-        query_params = [
-            "t0",
-            "t1",
-            "timespan",
-            "perPage",
-            "startingAfter",
-            "endingBefore",
-            "adminId",
-            "path",
-            "method",
-            "responseCode",
-            "sourceIp",
-            "userAgent",
-            "version",
-            "operationIds",
-        ]
-        params = {k.strip(): v for k, v in kwargs.items() if k.strip() in query_params}
-
-        array_params = [
-            "operationIds",
-        ]
-        for k, v in kwargs.items():
-            if k.strip() in array_params:
-                params[f"{k.strip()}[]"] = kwargs[f"{k}"]
-                params.pop(k.strip())
-
-        if self._session._validate_kwargs:
-            all_params = query_params + array_params
-            invalid = [k for k in kwargs if k.strip() not in all_params and k != "self"]
-            if invalid and self._session._logger:
-                self._session._logger.warning(f"getOrganizationApiRequests: ignoring unrecognized kwargs: {invalid}")
-
-        return self._session.get_pages(metadata, resource, params, total_pages, direction)
+        return dispatch.call(
+            self._session, "getOrganizationApiRequests", organizationId, total_pages=total_pages, direction=direction, **kwargs
+        )
 
     def getOrganizationApiRequestsOverview(self, organizationId: str, **kwargs):
         """
@@ -1280,29 +536,7 @@ class AsyncOrganizations:
         - timespan (number): The timespan for which the information will be fetched. If specifying timespan, do not specify parameters t0 and t1. The value must be in seconds and be less than or equal to 31 days. The default is 31 days.
         """
 
-        kwargs.update(locals())
-
-        metadata = {
-            "tags": ["organizations", "monitor", "apiRequests", "overview"],
-            "operation": "getOrganizationApiRequestsOverview",
-        }
-        organizationId = urllib.parse.quote(str(organizationId), safe="")
-        resource = f"/organizations/{organizationId}/apiRequests/overview"
-
-        query_params = [
-            "t0",
-            "t1",
-            "timespan",
-        ]
-        params = {k.strip(): v for k, v in kwargs.items() if k.strip() in query_params}
-
-        if self._session._validate_kwargs:
-            all_params = query_params
-            invalid = [k for k in kwargs if k.strip() not in all_params and k != "self"]
-            if invalid and self._session._logger:
-                self._session._logger.warning(f"getOrganizationApiRequestsOverview: ignoring unrecognized kwargs: {invalid}")
-
-        return self._session.get(metadata, resource, params)
+        return dispatch.call(self._session, "getOrganizationApiRequestsOverview", organizationId, **kwargs)
 
     def getOrganizationApiRequestsOverviewResponseCodesByInterval(self, organizationId: str, **kwargs):
         """
@@ -1321,53 +555,9 @@ class AsyncOrganizations:
         - userAgent (string): Filter by user agent string for API request. This will filter by a complete or partial match.
         """
 
-        kwargs.update(locals())
-
-        if "version" in kwargs:
-            options = [0, 1]
-            assert kwargs["version"] in options, (
-                f'''"version" cannot be "{kwargs["version"]}", & must be set to one of: {options}'''
-            )
-
-        metadata = {
-            "tags": ["organizations", "monitor", "apiRequests", "overview", "responseCodes", "byInterval"],
-            "operation": "getOrganizationApiRequestsOverviewResponseCodesByInterval",
-        }
-        organizationId = urllib.parse.quote(str(organizationId), safe="")
-        resource = f"/organizations/{organizationId}/apiRequests/overview/responseCodes/byInterval"
-
-        query_params = [
-            "t0",
-            "t1",
-            "timespan",
-            "interval",
-            "version",
-            "operationIds",
-            "sourceIps",
-            "adminIds",
-            "userAgent",
-        ]
-        params = {k.strip(): v for k, v in kwargs.items() if k.strip() in query_params}
-
-        array_params = [
-            "operationIds",
-            "sourceIps",
-            "adminIds",
-        ]
-        for k, v in kwargs.items():
-            if k.strip() in array_params:
-                params[f"{k.strip()}[]"] = kwargs[f"{k}"]
-                params.pop(k.strip())
-
-        if self._session._validate_kwargs:
-            all_params = query_params + array_params
-            invalid = [k for k in kwargs if k.strip() not in all_params and k != "self"]
-            if invalid and self._session._logger:
-                self._session._logger.warning(
-                    f"getOrganizationApiRequestsOverviewResponseCodesByInterval: ignoring unrecognized kwargs: {invalid}"
-                )
-
-        return self._session.get(metadata, resource, params)
+        return dispatch.call(
+            self._session, "getOrganizationApiRequestsOverviewResponseCodesByInterval", organizationId, **kwargs
+        )
 
     def getOrganizationAssuranceAlerts(self, organizationId: str, total_pages=1, direction="next", **kwargs):
         """
@@ -1397,71 +587,14 @@ class AsyncOrganizations:
         - suppressAlertsForOfflineNodes (boolean): When set to true the api will only return connectivity alerts for a given device if that device is in an offline state. This only applies to devices. This is ignored when resolved is true. Example:  If a Switch has a VLan Mismatch and is Unreachable. only the Unreachable alert will be returned. Defaults to false.
         """
 
-        kwargs.update(locals())
-
-        if "sortOrder" in kwargs:
-            options = ["ascending", "descending"]
-            assert kwargs["sortOrder"] in options, (
-                f'''"sortOrder" cannot be "{kwargs["sortOrder"]}", & must be set to one of: {options}'''
-            )
-        if "category" in kwargs:
-            options = ["configuration", "connectivity", "device_health", "experience_metrics", "insights"]
-            assert kwargs["category"] in options, (
-                f'''"category" cannot be "{kwargs["category"]}", & must be set to one of: {options}'''
-            )
-        if "sortBy" in kwargs:
-            options = ["category", "dismissedAt", "resolvedAt", "severity", "startedAt"]
-            assert kwargs["sortBy"] in options, (
-                f'''"sortBy" cannot be "{kwargs["sortBy"]}", & must be set to one of: {options}'''
-            )
-
-        metadata = {
-            "tags": ["organizations", "monitor", "alerts"],
-            "operation": "getOrganizationAssuranceAlerts",
-        }
-        organizationId = urllib.parse.quote(str(organizationId), safe="")
-        resource = f"/organizations/{organizationId}/assurance/alerts"
-
-        query_params = [
-            "perPage",
-            "startingAfter",
-            "endingBefore",
-            "sortOrder",
-            "networkId",
-            "severity",
-            "types",
-            "tsStart",
-            "tsEnd",
-            "category",
-            "sortBy",
-            "serials",
-            "deviceTypes",
-            "deviceTags",
-            "active",
-            "dismissed",
-            "resolved",
-            "suppressAlertsForOfflineNodes",
-        ]
-        params = {k.strip(): v for k, v in kwargs.items() if k.strip() in query_params}
-
-        array_params = [
-            "types",
-            "serials",
-            "deviceTypes",
-            "deviceTags",
-        ]
-        for k, v in kwargs.items():
-            if k.strip() in array_params:
-                params[f"{k.strip()}[]"] = kwargs[f"{k}"]
-                params.pop(k.strip())
-
-        if self._session._validate_kwargs:
-            all_params = query_params + array_params
-            invalid = [k for k in kwargs if k.strip() not in all_params and k != "self"]
-            if invalid and self._session._logger:
-                self._session._logger.warning(f"getOrganizationAssuranceAlerts: ignoring unrecognized kwargs: {invalid}")
-
-        return self._session.get_pages(metadata, resource, params, total_pages, direction)
+        return dispatch.call(
+            self._session,
+            "getOrganizationAssuranceAlerts",
+            organizationId,
+            total_pages=total_pages,
+            direction=direction,
+            **kwargs,
+        )
 
     def dismissOrganizationAssuranceAlerts(self, organizationId: str, alertIds: list, **kwargs):
         """
@@ -1472,27 +605,7 @@ class AsyncOrganizations:
         - alertIds (array): Array of alert IDs in this organization to dismiss. Missing or inaccessible alert IDs return 404.
         """
 
-        kwargs = locals()
-
-        metadata = {
-            "tags": ["organizations", "monitor", "alerts"],
-            "operation": "dismissOrganizationAssuranceAlerts",
-        }
-        organizationId = urllib.parse.quote(str(organizationId), safe="")
-        resource = f"/organizations/{organizationId}/assurance/alerts/dismiss"
-
-        body_params = [
-            "alertIds",
-        ]
-        payload = {k.strip(): v for k, v in kwargs.items() if k.strip() in body_params}
-
-        if self._session._validate_kwargs:
-            all_params = [] + body_params
-            invalid = [k for k in kwargs if k.strip() not in all_params and k != "self"]
-            if invalid and self._session._logger:
-                self._session._logger.warning(f"dismissOrganizationAssuranceAlerts: ignoring unrecognized kwargs: {invalid}")
-
-        return self._session.post(metadata, resource, payload)
+        return dispatch.call(self._session, "dismissOrganizationAssuranceAlerts", organizationId, alertIds, **kwargs)
 
     def getOrganizationAssuranceAlertsOverview(self, organizationId: str, **kwargs):
         """
@@ -1515,58 +628,7 @@ class AsyncOrganizations:
         - suppressAlertsForOfflineNodes (boolean): When set to true the api will only return connectivity alerts for a given device if that device is in an offline state. This only applies to devices. This is ignored when resolved is true. Example:  If a Switch has a VLan Mismatch and is Unreachable. only the Unreachable alert will be returned. Defaults to false.
         """
 
-        kwargs.update(locals())
-
-        if "category" in kwargs:
-            options = ["configuration", "connectivity", "device_health", "experience_metrics", "insights"]
-            assert kwargs["category"] in options, (
-                f'''"category" cannot be "{kwargs["category"]}", & must be set to one of: {options}'''
-            )
-
-        metadata = {
-            "tags": ["organizations", "monitor", "alerts", "overview"],
-            "operation": "getOrganizationAssuranceAlertsOverview",
-        }
-        organizationId = urllib.parse.quote(str(organizationId), safe="")
-        resource = f"/organizations/{organizationId}/assurance/alerts/overview"
-
-        query_params = [
-            "networkId",
-            "severity",
-            "types",
-            "tsStart",
-            "tsEnd",
-            "category",
-            "serials",
-            "deviceTypes",
-            "deviceTags",
-            "active",
-            "dismissed",
-            "resolved",
-            "suppressAlertsForOfflineNodes",
-        ]
-        params = {k.strip(): v for k, v in kwargs.items() if k.strip() in query_params}
-
-        array_params = [
-            "types",
-            "serials",
-            "deviceTypes",
-            "deviceTags",
-        ]
-        for k, v in kwargs.items():
-            if k.strip() in array_params:
-                params[f"{k.strip()}[]"] = kwargs[f"{k}"]
-                params.pop(k.strip())
-
-        if self._session._validate_kwargs:
-            all_params = query_params + array_params
-            invalid = [k for k in kwargs if k.strip() not in all_params and k != "self"]
-            if invalid and self._session._logger:
-                self._session._logger.warning(
-                    f"getOrganizationAssuranceAlertsOverview: ignoring unrecognized kwargs: {invalid}"
-                )
-
-        return self._session.get(metadata, resource, params)
+        return dispatch.call(self._session, "getOrganizationAssuranceAlertsOverview", organizationId, **kwargs)
 
     def getOrganizationAssuranceAlertsOverviewByNetwork(self, organizationId: str, total_pages=1, direction="next", **kwargs):
         """
@@ -1595,67 +657,14 @@ class AsyncOrganizations:
         - suppressAlertsForOfflineNodes (boolean): When set to true the api will only return connectivity alerts for a given device if that device is in an offline state. This only applies to devices. This is ignored when resolved is true. Example:  If a Switch has a VLan Mismatch and is Unreachable. only the Unreachable alert will be returned. Defaults to false.
         """
 
-        kwargs.update(locals())
-
-        if "sortOrder" in kwargs:
-            options = ["ascending", "descending"]
-            assert kwargs["sortOrder"] in options, (
-                f'''"sortOrder" cannot be "{kwargs["sortOrder"]}", & must be set to one of: {options}'''
-            )
-        if "category" in kwargs:
-            options = ["configuration", "connectivity", "device_health", "experience_metrics", "insights"]
-            assert kwargs["category"] in options, (
-                f'''"category" cannot be "{kwargs["category"]}", & must be set to one of: {options}'''
-            )
-
-        metadata = {
-            "tags": ["organizations", "monitor", "alerts", "overview", "byNetwork"],
-            "operation": "getOrganizationAssuranceAlertsOverviewByNetwork",
-        }
-        organizationId = urllib.parse.quote(str(organizationId), safe="")
-        resource = f"/organizations/{organizationId}/assurance/alerts/overview/byNetwork"
-
-        query_params = [
-            "perPage",
-            "startingAfter",
-            "endingBefore",
-            "sortOrder",
-            "networkId",
-            "severity",
-            "types",
-            "tsStart",
-            "tsEnd",
-            "category",
-            "serials",
-            "deviceTypes",
-            "deviceTags",
-            "active",
-            "dismissed",
-            "resolved",
-            "suppressAlertsForOfflineNodes",
-        ]
-        params = {k.strip(): v for k, v in kwargs.items() if k.strip() in query_params}
-
-        array_params = [
-            "types",
-            "serials",
-            "deviceTypes",
-            "deviceTags",
-        ]
-        for k, v in kwargs.items():
-            if k.strip() in array_params:
-                params[f"{k.strip()}[]"] = kwargs[f"{k}"]
-                params.pop(k.strip())
-
-        if self._session._validate_kwargs:
-            all_params = query_params + array_params
-            invalid = [k for k in kwargs if k.strip() not in all_params and k != "self"]
-            if invalid and self._session._logger:
-                self._session._logger.warning(
-                    f"getOrganizationAssuranceAlertsOverviewByNetwork: ignoring unrecognized kwargs: {invalid}"
-                )
-
-        return self._session.get_pages(metadata, resource, params, total_pages, direction)
+        return dispatch.call(
+            self._session,
+            "getOrganizationAssuranceAlertsOverviewByNetwork",
+            organizationId,
+            total_pages=total_pages,
+            direction=direction,
+            **kwargs,
+        )
 
     def getOrganizationAssuranceAlertsOverviewByType(self, organizationId: str, total_pages=1, direction="next", **kwargs):
         """
@@ -1687,75 +696,14 @@ class AsyncOrganizations:
         - suppressAlertsForOfflineNodes (boolean): When set to true the api will only return connectivity alerts for a given device if that device is in an offline state. This only applies to devices. This is ignored when resolved is true. Example:  If a Switch has a VLan Mismatch and is Unreachable. only the Unreachable alert will be returned. Defaults to false.
         """
 
-        kwargs.update(locals())
-
-        if "sortOrder" in kwargs:
-            options = ["ascending", "descending"]
-            assert kwargs["sortOrder"] in options, (
-                f'''"sortOrder" cannot be "{kwargs["sortOrder"]}", & must be set to one of: {options}'''
-            )
-        if "category" in kwargs:
-            options = ["configuration", "connectivity", "device_health", "experience_metrics", "insights"]
-            assert kwargs["category"] in options, (
-                f'''"category" cannot be "{kwargs["category"]}", & must be set to one of: {options}'''
-            )
-        if "sortBy" in kwargs:
-            options = ["count", "lastAlertedAt", "networkCount", "severity", "startedAt"]
-            assert kwargs["sortBy"] in options, (
-                f'''"sortBy" cannot be "{kwargs["sortBy"]}", & must be set to one of: {options}'''
-            )
-
-        metadata = {
-            "tags": ["organizations", "monitor", "alerts", "overview", "byType"],
-            "operation": "getOrganizationAssuranceAlertsOverviewByType",
-        }
-        organizationId = urllib.parse.quote(str(organizationId), safe="")
-        resource = f"/organizations/{organizationId}/assurance/alerts/overview/byType"
-
-        query_params = [
-            "perPage",
-            "startingAfter",
-            "endingBefore",
-            "sortOrder",
-            "networkId",
-            "severity",
-            "types",
-            "tsStart",
-            "tsEnd",
-            "category",
-            "sortBy",
-            "serials",
-            "deviceTypes",
-            "deviceTags",
-            "active",
-            "dismissed",
-            "resolved",
-            "includeDeviceTags",
-            "includeNetworks",
-            "suppressAlertsForOfflineNodes",
-        ]
-        params = {k.strip(): v for k, v in kwargs.items() if k.strip() in query_params}
-
-        array_params = [
-            "types",
-            "serials",
-            "deviceTypes",
-            "deviceTags",
-        ]
-        for k, v in kwargs.items():
-            if k.strip() in array_params:
-                params[f"{k.strip()}[]"] = kwargs[f"{k}"]
-                params.pop(k.strip())
-
-        if self._session._validate_kwargs:
-            all_params = query_params + array_params
-            invalid = [k for k in kwargs if k.strip() not in all_params and k != "self"]
-            if invalid and self._session._logger:
-                self._session._logger.warning(
-                    f"getOrganizationAssuranceAlertsOverviewByType: ignoring unrecognized kwargs: {invalid}"
-                )
-
-        return self._session.get_pages(metadata, resource, params, total_pages, direction)
+        return dispatch.call(
+            self._session,
+            "getOrganizationAssuranceAlertsOverviewByType",
+            organizationId,
+            total_pages=total_pages,
+            direction=direction,
+            **kwargs,
+        )
 
     def getOrganizationAssuranceAlertsOverviewHistorical(
         self, organizationId: str, segmentDuration: int, tsStart: str, **kwargs
@@ -1776,53 +724,14 @@ class AsyncOrganizations:
         - deviceTypes (array): Optional parameter to filter by device types
         """
 
-        kwargs.update(locals())
-
-        if "category" in kwargs:
-            options = ["configuration", "connectivity", "device_health", "experience_metrics", "insights"]
-            assert kwargs["category"] in options, (
-                f'''"category" cannot be "{kwargs["category"]}", & must be set to one of: {options}'''
-            )
-
-        metadata = {
-            "tags": ["organizations", "monitor", "alerts", "overview", "historical"],
-            "operation": "getOrganizationAssuranceAlertsOverviewHistorical",
-        }
-        organizationId = urllib.parse.quote(str(organizationId), safe="")
-        resource = f"/organizations/{organizationId}/assurance/alerts/overview/historical"
-
-        query_params = [
-            "segmentDuration",
-            "networkId",
-            "severity",
-            "types",
-            "tsStart",
-            "tsEnd",
-            "category",
-            "serials",
-            "deviceTypes",
-        ]
-        params = {k.strip(): v for k, v in kwargs.items() if k.strip() in query_params}
-
-        array_params = [
-            "types",
-            "serials",
-            "deviceTypes",
-        ]
-        for k, v in kwargs.items():
-            if k.strip() in array_params:
-                params[f"{k.strip()}[]"] = kwargs[f"{k}"]
-                params.pop(k.strip())
-
-        if self._session._validate_kwargs:
-            all_params = query_params + array_params
-            invalid = [k for k in kwargs if k.strip() not in all_params and k != "self"]
-            if invalid and self._session._logger:
-                self._session._logger.warning(
-                    f"getOrganizationAssuranceAlertsOverviewHistorical: ignoring unrecognized kwargs: {invalid}"
-                )
-
-        return self._session.get(metadata, resource, params)
+        return dispatch.call(
+            self._session,
+            "getOrganizationAssuranceAlertsOverviewHistorical",
+            organizationId,
+            segmentDuration,
+            tsStart,
+            **kwargs,
+        )
 
     def restoreOrganizationAssuranceAlerts(self, organizationId: str, alertIds: list, **kwargs):
         """
@@ -1833,27 +742,7 @@ class AsyncOrganizations:
         - alertIds (array): Array of alert IDs in this organization to restore. Missing or inaccessible alert IDs return 404.
         """
 
-        kwargs = locals()
-
-        metadata = {
-            "tags": ["organizations", "monitor", "alerts"],
-            "operation": "restoreOrganizationAssuranceAlerts",
-        }
-        organizationId = urllib.parse.quote(str(organizationId), safe="")
-        resource = f"/organizations/{organizationId}/assurance/alerts/restore"
-
-        body_params = [
-            "alertIds",
-        ]
-        payload = {k.strip(): v for k, v in kwargs.items() if k.strip() in body_params}
-
-        if self._session._validate_kwargs:
-            all_params = [] + body_params
-            invalid = [k for k in kwargs if k.strip() not in all_params and k != "self"]
-            if invalid and self._session._logger:
-                self._session._logger.warning(f"restoreOrganizationAssuranceAlerts: ignoring unrecognized kwargs: {invalid}")
-
-        return self._session.post(metadata, resource, payload)
+        return dispatch.call(self._session, "restoreOrganizationAssuranceAlerts", organizationId, alertIds, **kwargs)
 
     def getOrganizationAssuranceAlertsTaxonomyCategories(self, organizationId: str):
         """
@@ -1863,14 +752,7 @@ class AsyncOrganizations:
         - organizationId (string): Organization ID
         """
 
-        metadata = {
-            "tags": ["organizations", "monitor", "alerts", "taxonomy", "categories"],
-            "operation": "getOrganizationAssuranceAlertsTaxonomyCategories",
-        }
-        organizationId = urllib.parse.quote(str(organizationId), safe="")
-        resource = f"/organizations/{organizationId}/assurance/alerts/taxonomy/categories"
-
-        return self._session.get(metadata, resource)
+        return dispatch.call(self._session, "getOrganizationAssuranceAlertsTaxonomyCategories", organizationId)
 
     def getOrganizationAssuranceAlertsTaxonomyTypes(self, organizationId: str):
         """
@@ -1880,14 +762,7 @@ class AsyncOrganizations:
         - organizationId (string): Organization ID
         """
 
-        metadata = {
-            "tags": ["organizations", "monitor", "alerts", "taxonomy", "types"],
-            "operation": "getOrganizationAssuranceAlertsTaxonomyTypes",
-        }
-        organizationId = urllib.parse.quote(str(organizationId), safe="")
-        resource = f"/organizations/{organizationId}/assurance/alerts/taxonomy/types"
-
-        return self._session.get(metadata, resource)
+        return dispatch.call(self._session, "getOrganizationAssuranceAlertsTaxonomyTypes", organizationId)
 
     def getOrganizationAssuranceAlert(self, organizationId: str, id: str):
         """
@@ -1898,15 +773,7 @@ class AsyncOrganizations:
         - id (string): ID
         """
 
-        metadata = {
-            "tags": ["organizations", "monitor", "alerts"],
-            "operation": "getOrganizationAssuranceAlert",
-        }
-        organizationId = urllib.parse.quote(str(organizationId), safe="")
-        id = urllib.parse.quote(str(id), safe="")
-        resource = f"/organizations/{organizationId}/assurance/alerts/{id}"
-
-        return self._session.get(metadata, resource)
+        return dispatch.call(self._session, "getOrganizationAssuranceAlert", organizationId, id)
 
     def getOrganizationBrandingPolicies(self, organizationId: str):
         """
@@ -1916,14 +783,7 @@ class AsyncOrganizations:
         - organizationId (string): Organization ID
         """
 
-        metadata = {
-            "tags": ["organizations", "configure", "brandingPolicies"],
-            "operation": "getOrganizationBrandingPolicies",
-        }
-        organizationId = urllib.parse.quote(str(organizationId), safe="")
-        resource = f"/organizations/{organizationId}/brandingPolicies"
-
-        return self._session.get(metadata, resource)
+        return dispatch.call(self._session, "getOrganizationBrandingPolicies", organizationId)
 
     def createOrganizationBrandingPolicy(self, organizationId: str, name: str, **kwargs):
         """
@@ -1942,31 +802,7 @@ class AsyncOrganizations:
                - customLogo (object): Properties describing the custom logo attached to the branding policy.
         """
 
-        kwargs.update(locals())
-
-        metadata = {
-            "tags": ["organizations", "configure", "brandingPolicies"],
-            "operation": "createOrganizationBrandingPolicy",
-        }
-        organizationId = urllib.parse.quote(str(organizationId), safe="")
-        resource = f"/organizations/{organizationId}/brandingPolicies"
-
-        body_params = [
-            "name",
-            "enabled",
-            "adminSettings",
-            "helpSettings",
-            "customLogo",
-        ]
-        payload = {k.strip(): v for k, v in kwargs.items() if k.strip() in body_params}
-
-        if self._session._validate_kwargs:
-            all_params = [] + body_params
-            invalid = [k for k in kwargs if k.strip() not in all_params and k != "self"]
-            if invalid and self._session._logger:
-                self._session._logger.warning(f"createOrganizationBrandingPolicy: ignoring unrecognized kwargs: {invalid}")
-
-        return self._session.post(metadata, resource, payload)
+        return dispatch.call(self._session, "createOrganizationBrandingPolicy", organizationId, name, **kwargs)
 
     def getOrganizationBrandingPoliciesPriorities(self, organizationId: str):
         """
@@ -1976,14 +812,7 @@ class AsyncOrganizations:
         - organizationId (string): Organization ID
         """
 
-        metadata = {
-            "tags": ["organizations", "configure", "brandingPolicies", "priorities"],
-            "operation": "getOrganizationBrandingPoliciesPriorities",
-        }
-        organizationId = urllib.parse.quote(str(organizationId), safe="")
-        resource = f"/organizations/{organizationId}/brandingPolicies/priorities"
-
-        return self._session.get(metadata, resource)
+        return dispatch.call(self._session, "getOrganizationBrandingPoliciesPriorities", organizationId)
 
     def updateOrganizationBrandingPoliciesPriorities(self, organizationId: str, **kwargs):
         """
@@ -1995,29 +824,7 @@ class AsyncOrganizations:
 
         """
 
-        kwargs.update(locals())
-
-        metadata = {
-            "tags": ["organizations", "configure", "brandingPolicies", "priorities"],
-            "operation": "updateOrganizationBrandingPoliciesPriorities",
-        }
-        organizationId = urllib.parse.quote(str(organizationId), safe="")
-        resource = f"/organizations/{organizationId}/brandingPolicies/priorities"
-
-        body_params = [
-            "brandingPolicyIds",
-        ]
-        payload = {k.strip(): v for k, v in kwargs.items() if k.strip() in body_params}
-
-        if self._session._validate_kwargs:
-            all_params = [] + body_params
-            invalid = [k for k in kwargs if k.strip() not in all_params and k != "self"]
-            if invalid and self._session._logger:
-                self._session._logger.warning(
-                    f"updateOrganizationBrandingPoliciesPriorities: ignoring unrecognized kwargs: {invalid}"
-                )
-
-        return self._session.put(metadata, resource, payload)
+        return dispatch.call(self._session, "updateOrganizationBrandingPoliciesPriorities", organizationId, **kwargs)
 
     def getOrganizationBrandingPolicy(self, organizationId: str, brandingPolicyId: str):
         """
@@ -2028,15 +835,7 @@ class AsyncOrganizations:
         - brandingPolicyId (string): Branding policy ID
         """
 
-        metadata = {
-            "tags": ["organizations", "configure", "brandingPolicies"],
-            "operation": "getOrganizationBrandingPolicy",
-        }
-        organizationId = urllib.parse.quote(str(organizationId), safe="")
-        brandingPolicyId = urllib.parse.quote(str(brandingPolicyId), safe="")
-        resource = f"/organizations/{organizationId}/brandingPolicies/{brandingPolicyId}"
-
-        return self._session.get(metadata, resource)
+        return dispatch.call(self._session, "getOrganizationBrandingPolicy", organizationId, brandingPolicyId)
 
     def updateOrganizationBrandingPolicy(self, organizationId: str, brandingPolicyId: str, name: str, **kwargs):
         """
@@ -2056,32 +855,9 @@ class AsyncOrganizations:
           - customLogo (object): Properties describing the custom logo attached to the branding policy.
         """
 
-        kwargs.update(locals())
-
-        metadata = {
-            "tags": ["organizations", "configure", "brandingPolicies"],
-            "operation": "updateOrganizationBrandingPolicy",
-        }
-        organizationId = urllib.parse.quote(str(organizationId), safe="")
-        brandingPolicyId = urllib.parse.quote(str(brandingPolicyId), safe="")
-        resource = f"/organizations/{organizationId}/brandingPolicies/{brandingPolicyId}"
-
-        body_params = [
-            "name",
-            "enabled",
-            "adminSettings",
-            "helpSettings",
-            "customLogo",
-        ]
-        payload = {k.strip(): v for k, v in kwargs.items() if k.strip() in body_params}
-
-        if self._session._validate_kwargs:
-            all_params = [] + body_params
-            invalid = [k for k in kwargs if k.strip() not in all_params and k != "self"]
-            if invalid and self._session._logger:
-                self._session._logger.warning(f"updateOrganizationBrandingPolicy: ignoring unrecognized kwargs: {invalid}")
-
-        return self._session.put(metadata, resource, payload)
+        return dispatch.call(
+            self._session, "updateOrganizationBrandingPolicy", organizationId, brandingPolicyId, name, **kwargs
+        )
 
     def deleteOrganizationBrandingPolicy(self, organizationId: str, brandingPolicyId: str):
         """
@@ -2092,15 +868,7 @@ class AsyncOrganizations:
         - brandingPolicyId (string): Branding policy ID
         """
 
-        metadata = {
-            "tags": ["organizations", "configure", "brandingPolicies"],
-            "operation": "deleteOrganizationBrandingPolicy",
-        }
-        organizationId = urllib.parse.quote(str(organizationId), safe="")
-        brandingPolicyId = urllib.parse.quote(str(brandingPolicyId), safe="")
-        resource = f"/organizations/{organizationId}/brandingPolicies/{brandingPolicyId}"
-
-        return self._session.delete(metadata, resource)
+        return dispatch.call(self._session, "deleteOrganizationBrandingPolicy", organizationId, brandingPolicyId)
 
     def claimIntoOrganization(self, organizationId: str, **kwargs):
         """
@@ -2113,29 +881,7 @@ class AsyncOrganizations:
         - licenses (array): The licenses that should be claimed
         """
 
-        kwargs.update(locals())
-
-        metadata = {
-            "tags": ["organizations", "configure"],
-            "operation": "claimIntoOrganization",
-        }
-        organizationId = urllib.parse.quote(str(organizationId), safe="")
-        resource = f"/organizations/{organizationId}/claim"
-
-        body_params = [
-            "orders",
-            "serials",
-            "licenses",
-        ]
-        payload = {k.strip(): v for k, v in kwargs.items() if k.strip() in body_params}
-
-        if self._session._validate_kwargs:
-            all_params = [] + body_params
-            invalid = [k for k in kwargs if k.strip() not in all_params and k != "self"]
-            if invalid and self._session._logger:
-                self._session._logger.warning(f"claimIntoOrganization: ignoring unrecognized kwargs: {invalid}")
-
-        return self._session.post(metadata, resource, payload)
+        return dispatch.call(self._session, "claimIntoOrganization", organizationId, **kwargs)
 
     def getOrganizationClientsBandwidthUsageHistory(self, organizationId: str, **kwargs):
         """
@@ -2152,35 +898,7 @@ class AsyncOrganizations:
         - timespan (number): The timespan for which the information will be fetched. If specifying timespan, do not specify parameters t0 and t1. The value must be in seconds and be less than or equal to 186 days. The default is 1 day.
         """
 
-        kwargs.update(locals())
-
-        metadata = {
-            "tags": ["organizations", "monitor", "clients", "bandwidthUsageHistory"],
-            "operation": "getOrganizationClientsBandwidthUsageHistory",
-        }
-        organizationId = urllib.parse.quote(str(organizationId), safe="")
-        resource = f"/organizations/{organizationId}/clients/bandwidthUsageHistory"
-
-        query_params = [
-            "networkTag",
-            "deviceTag",
-            "ssidName",
-            "usageUplink",
-            "t0",
-            "t1",
-            "timespan",
-        ]
-        params = {k.strip(): v for k, v in kwargs.items() if k.strip() in query_params}
-
-        if self._session._validate_kwargs:
-            all_params = query_params
-            invalid = [k for k in kwargs if k.strip() not in all_params and k != "self"]
-            if invalid and self._session._logger:
-                self._session._logger.warning(
-                    f"getOrganizationClientsBandwidthUsageHistory: ignoring unrecognized kwargs: {invalid}"
-                )
-
-        return self._session.get(metadata, resource, params)
+        return dispatch.call(self._session, "getOrganizationClientsBandwidthUsageHistory", organizationId, **kwargs)
 
     def getOrganizationClientsOverview(self, organizationId: str, **kwargs):
         """
@@ -2193,29 +911,7 @@ class AsyncOrganizations:
         - timespan (number): The timespan for which the information will be fetched. If specifying timespan, do not specify parameters t0 and t1. The value must be in seconds and be less than or equal to 31 days. The default is 1 day.
         """
 
-        kwargs.update(locals())
-
-        metadata = {
-            "tags": ["organizations", "monitor", "clients", "overview"],
-            "operation": "getOrganizationClientsOverview",
-        }
-        organizationId = urllib.parse.quote(str(organizationId), safe="")
-        resource = f"/organizations/{organizationId}/clients/overview"
-
-        query_params = [
-            "t0",
-            "t1",
-            "timespan",
-        ]
-        params = {k.strip(): v for k, v in kwargs.items() if k.strip() in query_params}
-
-        if self._session._validate_kwargs:
-            all_params = query_params
-            invalid = [k for k in kwargs if k.strip() not in all_params and k != "self"]
-            if invalid and self._session._logger:
-                self._session._logger.warning(f"getOrganizationClientsOverview: ignoring unrecognized kwargs: {invalid}")
-
-        return self._session.get(metadata, resource, params)
+        return dispatch.call(self._session, "getOrganizationClientsOverview", organizationId, **kwargs)
 
     def getOrganizationClientsSearch(self, organizationId: str, mac: str, total_pages=1, direction="next", **kwargs):
         """
@@ -2231,30 +927,15 @@ class AsyncOrganizations:
         - endingBefore (string): A token used by the server to indicate the end of the page. Often this is a timestamp or an ID but it is not limited to those. This parameter should not be defined by client applications. The link for the first, last, prev, or next page in the HTTP Link header should define it.
         """
 
-        kwargs.update(locals())
-
-        metadata = {
-            "tags": ["organizations", "configure", "clients", "search"],
-            "operation": "getOrganizationClientsSearch",
-        }
-        organizationId = urllib.parse.quote(str(organizationId), safe="")
-        resource = f"/organizations/{organizationId}/clients/search"
-
-        query_params = [
-            "perPage",
-            "startingAfter",
-            "endingBefore",
-            "mac",
-        ]
-        params = {k.strip(): v for k, v in kwargs.items() if k.strip() in query_params}
-
-        if self._session._validate_kwargs:
-            all_params = query_params
-            invalid = [k for k in kwargs if k.strip() not in all_params and k != "self"]
-            if invalid and self._session._logger:
-                self._session._logger.warning(f"getOrganizationClientsSearch: ignoring unrecognized kwargs: {invalid}")
-
-        return self._session.get_pages(metadata, resource, params, total_pages, direction)
+        return dispatch.call(
+            self._session,
+            "getOrganizationClientsSearch",
+            organizationId,
+            mac,
+            total_pages=total_pages,
+            direction=direction,
+            **kwargs,
+        )
 
     def cloneOrganization(self, organizationId: str, name: str, **kwargs):
         """
@@ -2265,27 +946,7 @@ class AsyncOrganizations:
         - name (string): The name of the new organization
         """
 
-        kwargs = locals()
-
-        metadata = {
-            "tags": ["organizations", "configure"],
-            "operation": "cloneOrganization",
-        }
-        organizationId = urllib.parse.quote(str(organizationId), safe="")
-        resource = f"/organizations/{organizationId}/clone"
-
-        body_params = [
-            "name",
-        ]
-        payload = {k.strip(): v for k, v in kwargs.items() if k.strip() in body_params}
-
-        if self._session._validate_kwargs:
-            all_params = [] + body_params
-            invalid = [k for k in kwargs if k.strip() not in all_params and k != "self"]
-            if invalid and self._session._logger:
-                self._session._logger.warning(f"cloneOrganization: ignoring unrecognized kwargs: {invalid}")
-
-        return self._session.post(metadata, resource, payload)
+        return dispatch.call(self._session, "cloneOrganization", organizationId, name, **kwargs)
 
     def getOrganizationConfigTemplates(self, organizationId: str):
         """
@@ -2295,14 +956,7 @@ class AsyncOrganizations:
         - organizationId (string): Organization ID
         """
 
-        metadata = {
-            "tags": ["organizations", "configure", "configTemplates"],
-            "operation": "getOrganizationConfigTemplates",
-        }
-        organizationId = urllib.parse.quote(str(organizationId), safe="")
-        resource = f"/organizations/{organizationId}/configTemplates"
-
-        return self._session.get(metadata, resource)
+        return dispatch.call(self._session, "getOrganizationConfigTemplates", organizationId)
 
     def createOrganizationConfigTemplate(self, organizationId: str, name: str, **kwargs):
         """
@@ -2315,29 +969,7 @@ class AsyncOrganizations:
         - copyFromNetworkId (string): The ID of the network or config template to copy configuration from
         """
 
-        kwargs.update(locals())
-
-        metadata = {
-            "tags": ["organizations", "configure", "configTemplates"],
-            "operation": "createOrganizationConfigTemplate",
-        }
-        organizationId = urllib.parse.quote(str(organizationId), safe="")
-        resource = f"/organizations/{organizationId}/configTemplates"
-
-        body_params = [
-            "name",
-            "timeZone",
-            "copyFromNetworkId",
-        ]
-        payload = {k.strip(): v for k, v in kwargs.items() if k.strip() in body_params}
-
-        if self._session._validate_kwargs:
-            all_params = [] + body_params
-            invalid = [k for k in kwargs if k.strip() not in all_params and k != "self"]
-            if invalid and self._session._logger:
-                self._session._logger.warning(f"createOrganizationConfigTemplate: ignoring unrecognized kwargs: {invalid}")
-
-        return self._session.post(metadata, resource, payload)
+        return dispatch.call(self._session, "createOrganizationConfigTemplate", organizationId, name, **kwargs)
 
     def getOrganizationConfigTemplate(self, organizationId: str, configTemplateId: str):
         """
@@ -2348,15 +980,7 @@ class AsyncOrganizations:
         - configTemplateId (string): Config template ID
         """
 
-        metadata = {
-            "tags": ["organizations", "configure", "configTemplates"],
-            "operation": "getOrganizationConfigTemplate",
-        }
-        organizationId = urllib.parse.quote(str(organizationId), safe="")
-        configTemplateId = urllib.parse.quote(str(configTemplateId), safe="")
-        resource = f"/organizations/{organizationId}/configTemplates/{configTemplateId}"
-
-        return self._session.get(metadata, resource)
+        return dispatch.call(self._session, "getOrganizationConfigTemplate", organizationId, configTemplateId)
 
     def updateOrganizationConfigTemplate(self, organizationId: str, configTemplateId: str, **kwargs):
         """
@@ -2369,29 +993,7 @@ class AsyncOrganizations:
         - timeZone (string): The timezone of the configuration template. For a list of allowed timezones, please see the 'TZ' column in the table in <a target='_blank' href='https://en.wikipedia.org/wiki/List_of_tz_database_time_zones'>this article.</a>
         """
 
-        kwargs.update(locals())
-
-        metadata = {
-            "tags": ["organizations", "configure", "configTemplates"],
-            "operation": "updateOrganizationConfigTemplate",
-        }
-        organizationId = urllib.parse.quote(str(organizationId), safe="")
-        configTemplateId = urllib.parse.quote(str(configTemplateId), safe="")
-        resource = f"/organizations/{organizationId}/configTemplates/{configTemplateId}"
-
-        body_params = [
-            "name",
-            "timeZone",
-        ]
-        payload = {k.strip(): v for k, v in kwargs.items() if k.strip() in body_params}
-
-        if self._session._validate_kwargs:
-            all_params = [] + body_params
-            invalid = [k for k in kwargs if k.strip() not in all_params and k != "self"]
-            if invalid and self._session._logger:
-                self._session._logger.warning(f"updateOrganizationConfigTemplate: ignoring unrecognized kwargs: {invalid}")
-
-        return self._session.put(metadata, resource, payload)
+        return dispatch.call(self._session, "updateOrganizationConfigTemplate", organizationId, configTemplateId, **kwargs)
 
     def deleteOrganizationConfigTemplate(self, organizationId: str, configTemplateId: str):
         """
@@ -2402,15 +1004,7 @@ class AsyncOrganizations:
         - configTemplateId (string): Config template ID
         """
 
-        metadata = {
-            "tags": ["organizations", "configure", "configTemplates"],
-            "operation": "deleteOrganizationConfigTemplate",
-        }
-        organizationId = urllib.parse.quote(str(organizationId), safe="")
-        configTemplateId = urllib.parse.quote(str(configTemplateId), safe="")
-        resource = f"/organizations/{organizationId}/configTemplates/{configTemplateId}"
-
-        return self._session.delete(metadata, resource)
+        return dispatch.call(self._session, "deleteOrganizationConfigTemplate", organizationId, configTemplateId)
 
     def getOrganizationConfigurationChanges(self, organizationId: str, total_pages=1, direction="prev", **kwargs):
         """
@@ -2430,34 +1024,14 @@ class AsyncOrganizations:
         - adminId (string): Filters on the given Admin
         """
 
-        kwargs.update(locals())
-
-        metadata = {
-            "tags": ["organizations", "monitor", "configurationChanges"],
-            "operation": "getOrganizationConfigurationChanges",
-        }
-        organizationId = urllib.parse.quote(str(organizationId), safe="")
-        resource = f"/organizations/{organizationId}/configurationChanges"
-
-        query_params = [
-            "t0",
-            "t1",
-            "timespan",
-            "perPage",
-            "startingAfter",
-            "endingBefore",
-            "networkId",
-            "adminId",
-        ]
-        params = {k.strip(): v for k, v in kwargs.items() if k.strip() in query_params}
-
-        if self._session._validate_kwargs:
-            all_params = query_params
-            invalid = [k for k in kwargs if k.strip() not in all_params and k != "self"]
-            if invalid and self._session._logger:
-                self._session._logger.warning(f"getOrganizationConfigurationChanges: ignoring unrecognized kwargs: {invalid}")
-
-        return self._session.get_pages(metadata, resource, params, total_pages, direction)
+        return dispatch.call(
+            self._session,
+            "getOrganizationConfigurationChanges",
+            organizationId,
+            total_pages=total_pages,
+            direction=direction,
+            **kwargs,
+        )
 
     def getOrganizationDevices(self, organizationId: str, total_pages=1, direction="next", **kwargs):
         """
@@ -2486,64 +1060,9 @@ class AsyncOrganizations:
         - models (array): Optional parameter to filter devices by one or more models. All returned devices will have a model that is an exact match.
         """
 
-        kwargs.update(locals())
-
-        if "tagsFilterType" in kwargs:
-            options = ["withAllTags", "withAnyTags"]
-            assert kwargs["tagsFilterType"] in options, (
-                f'''"tagsFilterType" cannot be "{kwargs["tagsFilterType"]}", & must be set to one of: {options}'''
-            )
-
-        metadata = {
-            "tags": ["organizations", "configure", "devices"],
-            "operation": "getOrganizationDevices",
-        }
-        organizationId = urllib.parse.quote(str(organizationId), safe="")
-        resource = f"/organizations/{organizationId}/devices"
-
-        query_params = [
-            "perPage",
-            "startingAfter",
-            "endingBefore",
-            "configurationUpdatedAfter",
-            "networkIds",
-            "productTypes",
-            "tags",
-            "tagsFilterType",
-            "name",
-            "mac",
-            "serial",
-            "model",
-            "macs",
-            "serials",
-            "sensorMetrics",
-            "sensorAlertProfileIds",
-            "models",
-        ]
-        params = {k.strip(): v for k, v in kwargs.items() if k.strip() in query_params}
-
-        array_params = [
-            "networkIds",
-            "productTypes",
-            "tags",
-            "macs",
-            "serials",
-            "sensorMetrics",
-            "sensorAlertProfileIds",
-            "models",
-        ]
-        for k, v in kwargs.items():
-            if k.strip() in array_params:
-                params[f"{k.strip()}[]"] = kwargs[f"{k}"]
-                params.pop(k.strip())
-
-        if self._session._validate_kwargs:
-            all_params = query_params + array_params
-            invalid = [k for k in kwargs if k.strip() not in all_params and k != "self"]
-            if invalid and self._session._logger:
-                self._session._logger.warning(f"getOrganizationDevices: ignoring unrecognized kwargs: {invalid}")
-
-        return self._session.get_pages(metadata, resource, params, total_pages, direction)
+        return dispatch.call(
+            self._session, "getOrganizationDevices", organizationId, total_pages=total_pages, direction=direction, **kwargs
+        )
 
     def getOrganizationDevicesAvailabilities(self, organizationId: str, total_pages=1, direction="next", **kwargs):
         """
@@ -2564,53 +1083,14 @@ class AsyncOrganizations:
         - statuses (array): Optional parameter to filter device availabilities by device status. This filter uses multiple exact matches.
         """
 
-        kwargs.update(locals())
-
-        if "tagsFilterType" in kwargs:
-            options = ["withAllTags", "withAnyTags"]
-            assert kwargs["tagsFilterType"] in options, (
-                f'''"tagsFilterType" cannot be "{kwargs["tagsFilterType"]}", & must be set to one of: {options}'''
-            )
-
-        metadata = {
-            "tags": ["organizations", "monitor", "devices", "availabilities"],
-            "operation": "getOrganizationDevicesAvailabilities",
-        }
-        organizationId = urllib.parse.quote(str(organizationId), safe="")
-        resource = f"/organizations/{organizationId}/devices/availabilities"
-
-        query_params = [
-            "perPage",
-            "startingAfter",
-            "endingBefore",
-            "networkIds",
-            "productTypes",
-            "serials",
-            "tags",
-            "tagsFilterType",
-            "statuses",
-        ]
-        params = {k.strip(): v for k, v in kwargs.items() if k.strip() in query_params}
-
-        array_params = [
-            "networkIds",
-            "productTypes",
-            "serials",
-            "tags",
-            "statuses",
-        ]
-        for k, v in kwargs.items():
-            if k.strip() in array_params:
-                params[f"{k.strip()}[]"] = kwargs[f"{k}"]
-                params.pop(k.strip())
-
-        if self._session._validate_kwargs:
-            all_params = query_params + array_params
-            invalid = [k for k in kwargs if k.strip() not in all_params and k != "self"]
-            if invalid and self._session._logger:
-                self._session._logger.warning(f"getOrganizationDevicesAvailabilities: ignoring unrecognized kwargs: {invalid}")
-
-        return self._session.get_pages(metadata, resource, params, total_pages, direction)
+        return dispatch.call(
+            self._session,
+            "getOrganizationDevicesAvailabilities",
+            organizationId,
+            total_pages=total_pages,
+            direction=direction,
+            **kwargs,
+        )
 
     def getOrganizationDevicesAvailabilitiesChangeHistory(
         self, organizationId: str, total_pages=1, direction="next", **kwargs
@@ -2634,49 +1114,14 @@ class AsyncOrganizations:
         - statuses (array): Optional parameter to filter device availabilities history by device statuses
         """
 
-        kwargs.update(locals())
-
-        metadata = {
-            "tags": ["organizations", "monitor", "devices", "availabilities", "changeHistory"],
-            "operation": "getOrganizationDevicesAvailabilitiesChangeHistory",
-        }
-        organizationId = urllib.parse.quote(str(organizationId), safe="")
-        resource = f"/organizations/{organizationId}/devices/availabilities/changeHistory"
-
-        query_params = [
-            "perPage",
-            "startingAfter",
-            "endingBefore",
-            "t0",
-            "t1",
-            "timespan",
-            "serials",
-            "productTypes",
-            "networkIds",
-            "statuses",
-        ]
-        params = {k.strip(): v for k, v in kwargs.items() if k.strip() in query_params}
-
-        array_params = [
-            "serials",
-            "productTypes",
-            "networkIds",
-            "statuses",
-        ]
-        for k, v in kwargs.items():
-            if k.strip() in array_params:
-                params[f"{k.strip()}[]"] = kwargs[f"{k}"]
-                params.pop(k.strip())
-
-        if self._session._validate_kwargs:
-            all_params = query_params + array_params
-            invalid = [k for k in kwargs if k.strip() not in all_params and k != "self"]
-            if invalid and self._session._logger:
-                self._session._logger.warning(
-                    f"getOrganizationDevicesAvailabilitiesChangeHistory: ignoring unrecognized kwargs: {invalid}"
-                )
-
-        return self._session.get_pages(metadata, resource, params, total_pages, direction)
+        return dispatch.call(
+            self._session,
+            "getOrganizationDevicesAvailabilitiesChangeHistory",
+            organizationId,
+            total_pages=total_pages,
+            direction=direction,
+            **kwargs,
+        )
 
     def getOrganizationDevicesCellularDataDevices(self, organizationId: str, total_pages=1, direction="next", **kwargs):
         """
@@ -2700,54 +1145,14 @@ class AsyncOrganizations:
         - endingBefore (string): A token used by the server to indicate the end of the page. Often this is a timestamp or an ID but it is not limited to those. This parameter should not be defined by client applications. The link for the first, last, prev, or next page in the HTTP Link header should define it.
         """
 
-        kwargs.update(locals())
-
-        metadata = {
-            "tags": ["organizations", "monitor", "devices", "cellular", "data"],
-            "operation": "getOrganizationDevicesCellularDataDevices",
-        }
-        organizationId = urllib.parse.quote(str(organizationId), safe="")
-        resource = f"/organizations/{organizationId}/devices/cellular/data/devices"
-
-        query_params = [
-            "includeAssigned",
-            "includedSerials",
-            "excludedSerials",
-            "includedProfileIds",
-            "excludedProfileIds",
-            "deviceTypes",
-            "slots",
-            "name",
-            "serials",
-            "perPage",
-            "startingAfter",
-            "endingBefore",
-        ]
-        params = {k.strip(): v for k, v in kwargs.items() if k.strip() in query_params}
-
-        array_params = [
-            "includedSerials",
-            "excludedSerials",
-            "includedProfileIds",
-            "excludedProfileIds",
-            "deviceTypes",
-            "slots",
-            "serials",
-        ]
-        for k, v in kwargs.items():
-            if k.strip() in array_params:
-                params[f"{k.strip()}[]"] = kwargs[f"{k}"]
-                params.pop(k.strip())
-
-        if self._session._validate_kwargs:
-            all_params = query_params + array_params
-            invalid = [k for k in kwargs if k.strip() not in all_params and k != "self"]
-            if invalid and self._session._logger:
-                self._session._logger.warning(
-                    f"getOrganizationDevicesCellularDataDevices: ignoring unrecognized kwargs: {invalid}"
-                )
-
-        return self._session.get_pages(metadata, resource, params, total_pages, direction)
+        return dispatch.call(
+            self._session,
+            "getOrganizationDevicesCellularDataDevices",
+            organizationId,
+            total_pages=total_pages,
+            direction=direction,
+            **kwargs,
+        )
 
     def getOrganizationDevicesCellularDataProfiles(self, organizationId: str, total_pages=1, direction="next", **kwargs):
         """
@@ -2764,42 +1169,14 @@ class AsyncOrganizations:
         - endingBefore (string): A token used by the server to indicate the end of the page. Often this is a timestamp or an ID but it is not limited to those. This parameter should not be defined by client applications. The link for the first, last, prev, or next page in the HTTP Link header should define it.
         """
 
-        kwargs.update(locals())
-
-        metadata = {
-            "tags": ["organizations", "configure", "devices", "cellular", "data", "profiles"],
-            "operation": "getOrganizationDevicesCellularDataProfiles",
-        }
-        organizationId = urllib.parse.quote(str(organizationId), safe="")
-        resource = f"/organizations/{organizationId}/devices/cellular/data/profiles"
-
-        query_params = [
-            "profileIds",
-            "serials",
-            "perPage",
-            "startingAfter",
-            "endingBefore",
-        ]
-        params = {k.strip(): v for k, v in kwargs.items() if k.strip() in query_params}
-
-        array_params = [
-            "profileIds",
-            "serials",
-        ]
-        for k, v in kwargs.items():
-            if k.strip() in array_params:
-                params[f"{k.strip()}[]"] = kwargs[f"{k}"]
-                params.pop(k.strip())
-
-        if self._session._validate_kwargs:
-            all_params = query_params + array_params
-            invalid = [k for k in kwargs if k.strip() not in all_params and k != "self"]
-            if invalid and self._session._logger:
-                self._session._logger.warning(
-                    f"getOrganizationDevicesCellularDataProfiles: ignoring unrecognized kwargs: {invalid}"
-                )
-
-        return self._session.get_pages(metadata, resource, params, total_pages, direction)
+        return dispatch.call(
+            self._session,
+            "getOrganizationDevicesCellularDataProfiles",
+            organizationId,
+            total_pages=total_pages,
+            direction=direction,
+            **kwargs,
+        )
 
     def createOrganizationDevicesCellularDataProfile(
         self, organizationId: str, name: str, description: str, rules: list, **kwargs
@@ -2814,31 +1191,9 @@ class AsyncOrganizations:
         - rules (array): The rules associated with this profile. At least one rule and no more than two rules may be defined for a profile.
         """
 
-        kwargs = locals()
-
-        metadata = {
-            "tags": ["organizations", "configure", "devices", "cellular", "data", "profiles"],
-            "operation": "createOrganizationDevicesCellularDataProfile",
-        }
-        organizationId = urllib.parse.quote(str(organizationId), safe="")
-        resource = f"/organizations/{organizationId}/devices/cellular/data/profiles"
-
-        body_params = [
-            "name",
-            "description",
-            "rules",
-        ]
-        payload = {k.strip(): v for k, v in kwargs.items() if k.strip() in body_params}
-
-        if self._session._validate_kwargs:
-            all_params = [] + body_params
-            invalid = [k for k in kwargs if k.strip() not in all_params and k != "self"]
-            if invalid and self._session._logger:
-                self._session._logger.warning(
-                    f"createOrganizationDevicesCellularDataProfile: ignoring unrecognized kwargs: {invalid}"
-                )
-
-        return self._session.post(metadata, resource, payload)
+        return dispatch.call(
+            self._session, "createOrganizationDevicesCellularDataProfile", organizationId, name, description, rules, **kwargs
+        )
 
     def getOrganizationDevicesCellularDataProfilesAssignments(
         self, organizationId: str, total_pages=1, direction="next", **kwargs
@@ -2857,42 +1212,14 @@ class AsyncOrganizations:
         - endingBefore (string): A token used by the server to indicate the end of the page. Often this is a timestamp or an ID but it is not limited to those. This parameter should not be defined by client applications. The link for the first, last, prev, or next page in the HTTP Link header should define it.
         """
 
-        kwargs.update(locals())
-
-        metadata = {
-            "tags": ["organizations", "configure", "devices", "cellular", "data", "profiles", "assignments"],
-            "operation": "getOrganizationDevicesCellularDataProfilesAssignments",
-        }
-        organizationId = urllib.parse.quote(str(organizationId), safe="")
-        resource = f"/organizations/{organizationId}/devices/cellular/data/profiles/assignments"
-
-        query_params = [
-            "profileIds",
-            "serials",
-            "perPage",
-            "startingAfter",
-            "endingBefore",
-        ]
-        params = {k.strip(): v for k, v in kwargs.items() if k.strip() in query_params}
-
-        array_params = [
-            "profileIds",
-            "serials",
-        ]
-        for k, v in kwargs.items():
-            if k.strip() in array_params:
-                params[f"{k.strip()}[]"] = kwargs[f"{k}"]
-                params.pop(k.strip())
-
-        if self._session._validate_kwargs:
-            all_params = query_params + array_params
-            invalid = [k for k in kwargs if k.strip() not in all_params and k != "self"]
-            if invalid and self._session._logger:
-                self._session._logger.warning(
-                    f"getOrganizationDevicesCellularDataProfilesAssignments: ignoring unrecognized kwargs: {invalid}"
-                )
-
-        return self._session.get_pages(metadata, resource, params, total_pages, direction)
+        return dispatch.call(
+            self._session,
+            "getOrganizationDevicesCellularDataProfilesAssignments",
+            organizationId,
+            total_pages=total_pages,
+            direction=direction,
+            **kwargs,
+        )
 
     def batchOrganizationDevicesCellularDataProfilesAssignmentsCreate(self, organizationId: str, items: list, **kwargs):
         """
@@ -2903,29 +1230,9 @@ class AsyncOrganizations:
         - items (array): List of device-to-profile assignments to create.
         """
 
-        kwargs = locals()
-
-        metadata = {
-            "tags": ["organizations", "configure", "devices", "cellular", "data", "profiles", "assignments"],
-            "operation": "batchOrganizationDevicesCellularDataProfilesAssignmentsCreate",
-        }
-        organizationId = urllib.parse.quote(str(organizationId), safe="")
-        resource = f"/organizations/{organizationId}/devices/cellular/data/profiles/assignments/batchCreate"
-
-        body_params = [
-            "items",
-        ]
-        payload = {k.strip(): v for k, v in kwargs.items() if k.strip() in body_params}
-
-        if self._session._validate_kwargs:
-            all_params = [] + body_params
-            invalid = [k for k in kwargs if k.strip() not in all_params and k != "self"]
-            if invalid and self._session._logger:
-                self._session._logger.warning(
-                    f"batchOrganizationDevicesCellularDataProfilesAssignmentsCreate: ignoring unrecognized kwargs: {invalid}"
-                )
-
-        return self._session.post(metadata, resource, payload)
+        return dispatch.call(
+            self._session, "batchOrganizationDevicesCellularDataProfilesAssignmentsCreate", organizationId, items, **kwargs
+        )
 
     def bulkOrganizationDevicesCellularDataProfilesAssignmentsDelete(self, organizationId: str, items: list, **kwargs):
         """
@@ -2936,29 +1243,9 @@ class AsyncOrganizations:
         - items (array): List of device-to-profile assignments to remove.
         """
 
-        kwargs = locals()
-
-        metadata = {
-            "tags": ["organizations", "configure", "devices", "cellular", "data", "profiles", "assignments"],
-            "operation": "bulkOrganizationDevicesCellularDataProfilesAssignmentsDelete",
-        }
-        organizationId = urllib.parse.quote(str(organizationId), safe="")
-        resource = f"/organizations/{organizationId}/devices/cellular/data/profiles/assignments/bulkDelete"
-
-        body_params = [
-            "items",
-        ]
-        payload = {k.strip(): v for k, v in kwargs.items() if k.strip() in body_params}
-
-        if self._session._validate_kwargs:
-            all_params = [] + body_params
-            invalid = [k for k in kwargs if k.strip() not in all_params and k != "self"]
-            if invalid and self._session._logger:
-                self._session._logger.warning(
-                    f"bulkOrganizationDevicesCellularDataProfilesAssignmentsDelete: ignoring unrecognized kwargs: {invalid}"
-                )
-
-        return self._session.post(metadata, resource, payload)
+        return dispatch.call(
+            self._session, "bulkOrganizationDevicesCellularDataProfilesAssignmentsDelete", organizationId, items, **kwargs
+        )
 
     def updateOrganizationDevicesCellularDataProfile(self, organizationId: str, rules: list, profileId: str, **kwargs):
         """
@@ -2971,32 +1258,9 @@ class AsyncOrganizations:
         - description (string): New description of the profile.
         """
 
-        kwargs.update(locals())
-
-        metadata = {
-            "tags": ["organizations", "configure", "devices", "cellular", "data", "profiles"],
-            "operation": "updateOrganizationDevicesCellularDataProfile",
-        }
-        organizationId = urllib.parse.quote(str(organizationId), safe="")
-        profileId = urllib.parse.quote(str(profileId), safe="")
-        resource = f"/organizations/{organizationId}/devices/cellular/data/profiles/{profileId}"
-
-        body_params = [
-            "profileId",
-            "description",
-            "rules",
-        ]
-        payload = {k.strip(): v for k, v in kwargs.items() if k.strip() in body_params}
-
-        if self._session._validate_kwargs:
-            all_params = [] + body_params
-            invalid = [k for k in kwargs if k.strip() not in all_params and k != "self"]
-            if invalid and self._session._logger:
-                self._session._logger.warning(
-                    f"updateOrganizationDevicesCellularDataProfile: ignoring unrecognized kwargs: {invalid}"
-                )
-
-        return self._session.put(metadata, resource, payload)
+        return dispatch.call(
+            self._session, "updateOrganizationDevicesCellularDataProfile", organizationId, rules, profileId, **kwargs
+        )
 
     def deleteOrganizationDevicesCellularDataProfile(self, organizationId: str, profileId: str):
         """
@@ -3007,15 +1271,7 @@ class AsyncOrganizations:
         - profileId (string): Profile ID
         """
 
-        metadata = {
-            "tags": ["organizations", "configure", "devices", "cellular", "data", "profiles"],
-            "operation": "deleteOrganizationDevicesCellularDataProfile",
-        }
-        organizationId = urllib.parse.quote(str(organizationId), safe="")
-        profileId = urllib.parse.quote(str(profileId), safe="")
-        resource = f"/organizations/{organizationId}/devices/cellular/data/profiles/{profileId}"
-
-        return self._session.delete(metadata, resource)
+        return dispatch.call(self._session, "deleteOrganizationDevicesCellularDataProfile", organizationId, profileId)
 
     def getOrganizationDevicesCellularDataUsageByDevice(self, organizationId: str, total_pages=1, direction="next", **kwargs):
         """
@@ -3031,40 +1287,14 @@ class AsyncOrganizations:
         - endingBefore (string): A token used by the server to indicate the end of the page. Often this is a timestamp or an ID but it is not limited to those. This parameter should not be defined by client applications. The link for the first, last, prev, or next page in the HTTP Link header should define it.
         """
 
-        kwargs.update(locals())
-
-        metadata = {
-            "tags": ["organizations", "monitor", "devices", "cellular", "data", "usage", "byDevice"],
-            "operation": "getOrganizationDevicesCellularDataUsageByDevice",
-        }
-        organizationId = urllib.parse.quote(str(organizationId), safe="")
-        resource = f"/organizations/{organizationId}/devices/cellular/data/usage/byDevice"
-
-        query_params = [
-            "serials",
-            "perPage",
-            "startingAfter",
-            "endingBefore",
-        ]
-        params = {k.strip(): v for k, v in kwargs.items() if k.strip() in query_params}
-
-        array_params = [
-            "serials",
-        ]
-        for k, v in kwargs.items():
-            if k.strip() in array_params:
-                params[f"{k.strip()}[]"] = kwargs[f"{k}"]
-                params.pop(k.strip())
-
-        if self._session._validate_kwargs:
-            all_params = query_params + array_params
-            invalid = [k for k in kwargs if k.strip() not in all_params and k != "self"]
-            if invalid and self._session._logger:
-                self._session._logger.warning(
-                    f"getOrganizationDevicesCellularDataUsageByDevice: ignoring unrecognized kwargs: {invalid}"
-                )
-
-        return self._session.get_pages(metadata, resource, params, total_pages, direction)
+        return dispatch.call(
+            self._session,
+            "getOrganizationDevicesCellularDataUsageByDevice",
+            organizationId,
+            total_pages=total_pages,
+            direction=direction,
+            **kwargs,
+        )
 
     def getOrganizationDevicesCellularDataUsageHistoryByDeviceByInterval(
         self, organizationId: str, serials: list, total_pages=1, direction="next", **kwargs
@@ -3086,44 +1316,15 @@ class AsyncOrganizations:
         - interval (integer): The time interval in seconds for returned data. The valid intervals are: 300, 1200, 14400, 86400. The default is 86400. Interval is calculated if time params are provided.
         """
 
-        kwargs.update(locals())
-
-        metadata = {
-            "tags": ["organizations", "monitor", "devices", "cellular", "data", "usage", "history", "byDevice", "byInterval"],
-            "operation": "getOrganizationDevicesCellularDataUsageHistoryByDeviceByInterval",
-        }
-        organizationId = urllib.parse.quote(str(organizationId), safe="")
-        resource = f"/organizations/{organizationId}/devices/cellular/data/usage/history/byDevice/byInterval"
-
-        query_params = [
-            "serials",
-            "perPage",
-            "startingAfter",
-            "endingBefore",
-            "t0",
-            "t1",
-            "timespan",
-            "interval",
-        ]
-        params = {k.strip(): v for k, v in kwargs.items() if k.strip() in query_params}
-
-        array_params = [
-            "serials",
-        ]
-        for k, v in kwargs.items():
-            if k.strip() in array_params:
-                params[f"{k.strip()}[]"] = kwargs[f"{k}"]
-                params.pop(k.strip())
-
-        if self._session._validate_kwargs:
-            all_params = query_params + array_params
-            invalid = [k for k in kwargs if k.strip() not in all_params and k != "self"]
-            if invalid and self._session._logger:
-                self._session._logger.warning(
-                    f"getOrganizationDevicesCellularDataUsageHistoryByDeviceByInterval: ignoring unrecognized kwargs: {invalid}"
-                )
-
-        return self._session.get_pages(metadata, resource, params, total_pages, direction)
+        return dispatch.call(
+            self._session,
+            "getOrganizationDevicesCellularDataUsageHistoryByDeviceByInterval",
+            organizationId,
+            serials,
+            total_pages=total_pages,
+            direction=direction,
+            **kwargs,
+        )
 
     def getOrganizationDevicesCellularGeolocations(self, organizationId: str, total_pages=1, direction="next", **kwargs):
         """
@@ -3139,40 +1340,14 @@ class AsyncOrganizations:
         - endingBefore (string): A token used by the server to indicate the end of the page. Often this is a timestamp or an ID but it is not limited to those. This parameter should not be defined by client applications. The link for the first, last, prev, or next page in the HTTP Link header should define it.
         """
 
-        kwargs.update(locals())
-
-        metadata = {
-            "tags": ["organizations", "monitor", "devices", "cellular", "geolocations"],
-            "operation": "getOrganizationDevicesCellularGeolocations",
-        }
-        organizationId = urllib.parse.quote(str(organizationId), safe="")
-        resource = f"/organizations/{organizationId}/devices/cellular/geolocations"
-
-        query_params = [
-            "serials",
-            "perPage",
-            "startingAfter",
-            "endingBefore",
-        ]
-        params = {k.strip(): v for k, v in kwargs.items() if k.strip() in query_params}
-
-        array_params = [
-            "serials",
-        ]
-        for k, v in kwargs.items():
-            if k.strip() in array_params:
-                params[f"{k.strip()}[]"] = kwargs[f"{k}"]
-                params.pop(k.strip())
-
-        if self._session._validate_kwargs:
-            all_params = query_params + array_params
-            invalid = [k for k in kwargs if k.strip() not in all_params and k != "self"]
-            if invalid and self._session._logger:
-                self._session._logger.warning(
-                    f"getOrganizationDevicesCellularGeolocations: ignoring unrecognized kwargs: {invalid}"
-                )
-
-        return self._session.get_pages(metadata, resource, params, total_pages, direction)
+        return dispatch.call(
+            self._session,
+            "getOrganizationDevicesCellularGeolocations",
+            organizationId,
+            total_pages=total_pages,
+            direction=direction,
+            **kwargs,
+        )
 
     def getOrganizationDevicesCellularUplinksBandsByDevice(
         self, organizationId: str, total_pages=1, direction="next", **kwargs
@@ -3190,40 +1365,14 @@ class AsyncOrganizations:
         - endingBefore (string): A token used by the server to indicate the end of the page. Often this is a timestamp or an ID but it is not limited to those. This parameter should not be defined by client applications. The link for the first, last, prev, or next page in the HTTP Link header should define it.
         """
 
-        kwargs.update(locals())
-
-        metadata = {
-            "tags": ["organizations", "monitor", "devices", "cellular", "uplinks", "bands", "byDevice"],
-            "operation": "getOrganizationDevicesCellularUplinksBandsByDevice",
-        }
-        organizationId = urllib.parse.quote(str(organizationId), safe="")
-        resource = f"/organizations/{organizationId}/devices/cellular/uplinks/bands/byDevice"
-
-        query_params = [
-            "serials",
-            "perPage",
-            "startingAfter",
-            "endingBefore",
-        ]
-        params = {k.strip(): v for k, v in kwargs.items() if k.strip() in query_params}
-
-        array_params = [
-            "serials",
-        ]
-        for k, v in kwargs.items():
-            if k.strip() in array_params:
-                params[f"{k.strip()}[]"] = kwargs[f"{k}"]
-                params.pop(k.strip())
-
-        if self._session._validate_kwargs:
-            all_params = query_params + array_params
-            invalid = [k for k in kwargs if k.strip() not in all_params and k != "self"]
-            if invalid and self._session._logger:
-                self._session._logger.warning(
-                    f"getOrganizationDevicesCellularUplinksBandsByDevice: ignoring unrecognized kwargs: {invalid}"
-                )
-
-        return self._session.get_pages(metadata, resource, params, total_pages, direction)
+        return dispatch.call(
+            self._session,
+            "getOrganizationDevicesCellularUplinksBandsByDevice",
+            organizationId,
+            total_pages=total_pages,
+            direction=direction,
+            **kwargs,
+        )
 
     def getOrganizationDevicesCellularUplinksTowersByDevice(
         self, organizationId: str, total_pages=1, direction="next", **kwargs
@@ -3241,40 +1390,14 @@ class AsyncOrganizations:
         - endingBefore (string): A token used by the server to indicate the end of the page. Often this is a timestamp or an ID but it is not limited to those. This parameter should not be defined by client applications. The link for the first, last, prev, or next page in the HTTP Link header should define it.
         """
 
-        kwargs.update(locals())
-
-        metadata = {
-            "tags": ["organizations", "monitor", "devices", "cellular", "uplinks", "towers", "byDevice"],
-            "operation": "getOrganizationDevicesCellularUplinksTowersByDevice",
-        }
-        organizationId = urllib.parse.quote(str(organizationId), safe="")
-        resource = f"/organizations/{organizationId}/devices/cellular/uplinks/towers/byDevice"
-
-        query_params = [
-            "serials",
-            "perPage",
-            "startingAfter",
-            "endingBefore",
-        ]
-        params = {k.strip(): v for k, v in kwargs.items() if k.strip() in query_params}
-
-        array_params = [
-            "serials",
-        ]
-        for k, v in kwargs.items():
-            if k.strip() in array_params:
-                params[f"{k.strip()}[]"] = kwargs[f"{k}"]
-                params.pop(k.strip())
-
-        if self._session._validate_kwargs:
-            all_params = query_params + array_params
-            invalid = [k for k in kwargs if k.strip() not in all_params and k != "self"]
-            if invalid and self._session._logger:
-                self._session._logger.warning(
-                    f"getOrganizationDevicesCellularUplinksTowersByDevice: ignoring unrecognized kwargs: {invalid}"
-                )
-
-        return self._session.get_pages(metadata, resource, params, total_pages, direction)
+        return dispatch.call(
+            self._session,
+            "getOrganizationDevicesCellularUplinksTowersByDevice",
+            organizationId,
+            total_pages=total_pages,
+            direction=direction,
+            **kwargs,
+        )
 
     def createOrganizationDevicesControllerMigration(self, organizationId: str, serials: list, target: str, **kwargs):
         """
@@ -3286,36 +1409,9 @@ class AsyncOrganizations:
         - target (string): The controller or management mode to which the devices will be migrated
         """
 
-        kwargs = locals()
-
-        if "target" in kwargs:
-            options = ["wirelessController"]
-            assert kwargs["target"] in options, (
-                f'''"target" cannot be "{kwargs["target"]}", & must be set to one of: {options}'''
-            )
-
-        metadata = {
-            "tags": ["organizations", "configure", "devices", "controller", "migrations"],
-            "operation": "createOrganizationDevicesControllerMigration",
-        }
-        organizationId = urllib.parse.quote(str(organizationId), safe="")
-        resource = f"/organizations/{organizationId}/devices/controller/migrations"
-
-        body_params = [
-            "serials",
-            "target",
-        ]
-        payload = {k.strip(): v for k, v in kwargs.items() if k.strip() in body_params}
-
-        if self._session._validate_kwargs:
-            all_params = [] + body_params
-            invalid = [k for k in kwargs if k.strip() not in all_params and k != "self"]
-            if invalid and self._session._logger:
-                self._session._logger.warning(
-                    f"createOrganizationDevicesControllerMigration: ignoring unrecognized kwargs: {invalid}"
-                )
-
-        return self._session.post(metadata, resource, payload)
+        return dispatch.call(
+            self._session, "createOrganizationDevicesControllerMigration", organizationId, serials, target, **kwargs
+        )
 
     def getOrganizationDevicesControllerMigrations(self, organizationId: str, total_pages=1, direction="next", **kwargs):
         """
@@ -3333,49 +1429,14 @@ class AsyncOrganizations:
         - endingBefore (string): A token used by the server to indicate the end of the page. Often this is a timestamp or an ID but it is not limited to those. This parameter should not be defined by client applications. The link for the first, last, prev, or next page in the HTTP Link header should define it.
         """
 
-        kwargs.update(locals())
-
-        if "target" in kwargs:
-            options = ["wirelessController"]
-            assert kwargs["target"] in options, (
-                f'''"target" cannot be "{kwargs["target"]}", & must be set to one of: {options}'''
-            )
-
-        metadata = {
-            "tags": ["organizations", "configure", "devices", "controller", "migrations"],
-            "operation": "getOrganizationDevicesControllerMigrations",
-        }
-        organizationId = urllib.parse.quote(str(organizationId), safe="")
-        resource = f"/organizations/{organizationId}/devices/controller/migrations"
-
-        query_params = [
-            "serials",
-            "networkIds",
-            "target",
-            "perPage",
-            "startingAfter",
-            "endingBefore",
-        ]
-        params = {k.strip(): v for k, v in kwargs.items() if k.strip() in query_params}
-
-        array_params = [
-            "serials",
-            "networkIds",
-        ]
-        for k, v in kwargs.items():
-            if k.strip() in array_params:
-                params[f"{k.strip()}[]"] = kwargs[f"{k}"]
-                params.pop(k.strip())
-
-        if self._session._validate_kwargs:
-            all_params = query_params + array_params
-            invalid = [k for k in kwargs if k.strip() not in all_params and k != "self"]
-            if invalid and self._session._logger:
-                self._session._logger.warning(
-                    f"getOrganizationDevicesControllerMigrations: ignoring unrecognized kwargs: {invalid}"
-                )
-
-        return self._session.get_pages(metadata, resource, params, total_pages, direction)
+        return dispatch.call(
+            self._session,
+            "getOrganizationDevicesControllerMigrations",
+            organizationId,
+            total_pages=total_pages,
+            direction=direction,
+            **kwargs,
+        )
 
     def bulkUpdateOrganizationDevicesDetails(self, organizationId: str, serials: list, details: list, **kwargs):
         """
@@ -3387,28 +1448,7 @@ class AsyncOrganizations:
         - details (array): An array of details
         """
 
-        kwargs = locals()
-
-        metadata = {
-            "tags": ["organizations", "configure", "devices", "details", "bulkUpdate"],
-            "operation": "bulkUpdateOrganizationDevicesDetails",
-        }
-        organizationId = urllib.parse.quote(str(organizationId), safe="")
-        resource = f"/organizations/{organizationId}/devices/details/bulkUpdate"
-
-        body_params = [
-            "serials",
-            "details",
-        ]
-        payload = {k.strip(): v for k, v in kwargs.items() if k.strip() in body_params}
-
-        if self._session._validate_kwargs:
-            all_params = [] + body_params
-            invalid = [k for k in kwargs if k.strip() not in all_params and k != "self"]
-            if invalid and self._session._logger:
-                self._session._logger.warning(f"bulkUpdateOrganizationDevicesDetails: ignoring unrecognized kwargs: {invalid}")
-
-        return self._session.post(metadata, resource, payload)
+        return dispatch.call(self._session, "bulkUpdateOrganizationDevicesDetails", organizationId, serials, details, **kwargs)
 
     def getOrganizationDevicesOverviewByModel(self, organizationId: str, **kwargs):
         """
@@ -3421,41 +1461,7 @@ class AsyncOrganizations:
         - productTypes (array): Optional parameter to filter device by device product types. This filter uses multiple exact matches.
         """
 
-        kwargs.update(locals())
-
-        metadata = {
-            "tags": ["organizations", "configure", "devices", "overview", "byModel"],
-            "operation": "getOrganizationDevicesOverviewByModel",
-        }
-        organizationId = urllib.parse.quote(str(organizationId), safe="")
-        resource = f"/organizations/{organizationId}/devices/overview/byModel"
-
-        query_params = [
-            "models",
-            "networkIds",
-            "productTypes",
-        ]
-        params = {k.strip(): v for k, v in kwargs.items() if k.strip() in query_params}
-
-        array_params = [
-            "models",
-            "networkIds",
-            "productTypes",
-        ]
-        for k, v in kwargs.items():
-            if k.strip() in array_params:
-                params[f"{k.strip()}[]"] = kwargs[f"{k}"]
-                params.pop(k.strip())
-
-        if self._session._validate_kwargs:
-            all_params = query_params + array_params
-            invalid = [k for k in kwargs if k.strip() not in all_params and k != "self"]
-            if invalid and self._session._logger:
-                self._session._logger.warning(
-                    f"getOrganizationDevicesOverviewByModel: ignoring unrecognized kwargs: {invalid}"
-                )
-
-        return self._session.get(metadata, resource, params)
+        return dispatch.call(self._session, "getOrganizationDevicesOverviewByModel", organizationId, **kwargs)
 
     def getOrganizationDevicesPacketCaptureCaptures(self, organizationId: str, total_pages=1, direction="next", **kwargs):
         """
@@ -3484,65 +1490,14 @@ class AsyncOrganizations:
         - sortOrder (string): Sorted order of entries. Order options are 'ascending' and 'descending'. Default is 'descending'.
         """
 
-        kwargs.update(locals())
-
-        if "sortOrder" in kwargs:
-            options = ["ascending", "descending"]
-            assert kwargs["sortOrder"] in options, (
-                f'''"sortOrder" cannot be "{kwargs["sortOrder"]}", & must be set to one of: {options}'''
-            )
-
-        metadata = {
-            "tags": ["organizations", "configure", "devices", "packetCapture", "captures"],
-            "operation": "getOrganizationDevicesPacketCaptureCaptures",
-        }
-        organizationId = urllib.parse.quote(str(organizationId), safe="")
-        resource = f"/organizations/{organizationId}/devices/packetCapture/captures"
-
-        query_params = [
-            "captureIds",
-            "networkIds",
-            "serials",
-            "process",
-            "captureStatus",
-            "name",
-            "clientMac",
-            "notes",
-            "deviceName",
-            "adminName",
-            "t0",
-            "t1",
-            "timespan",
-            "perPage",
-            "startingAfter",
-            "endingBefore",
-            "sortOrder",
-        ]
-        params = {k.strip(): v for k, v in kwargs.items() if k.strip() in query_params}
-
-        array_params = [
-            "captureIds",
-            "networkIds",
-            "serials",
-            "process",
-            "captureStatus",
-            "name",
-            "clientMac",
-        ]
-        for k, v in kwargs.items():
-            if k.strip() in array_params:
-                params[f"{k.strip()}[]"] = kwargs[f"{k}"]
-                params.pop(k.strip())
-
-        if self._session._validate_kwargs:
-            all_params = query_params + array_params
-            invalid = [k for k in kwargs if k.strip() not in all_params and k != "self"]
-            if invalid and self._session._logger:
-                self._session._logger.warning(
-                    f"getOrganizationDevicesPacketCaptureCaptures: ignoring unrecognized kwargs: {invalid}"
-                )
-
-        return self._session.get_pages(metadata, resource, params, total_pages, direction)
+        return dispatch.call(
+            self._session,
+            "getOrganizationDevicesPacketCaptureCaptures",
+            organizationId,
+            total_pages=total_pages,
+            direction=direction,
+            **kwargs,
+        )
 
     def createOrganizationDevicesPacketCaptureCapture(self, organizationId: str, serials: list, name: str, **kwargs):
         """
@@ -3562,38 +1517,9 @@ class AsyncOrganizations:
         - advanced (object): Advanced filters for IOSXE devices (supported for Campus Gateway devices only)
         """
 
-        kwargs.update(locals())
-
-        metadata = {
-            "tags": ["organizations", "configure", "devices", "packetCapture", "captures"],
-            "operation": "createOrganizationDevicesPacketCaptureCapture",
-        }
-        organizationId = urllib.parse.quote(str(organizationId), safe="")
-        resource = f"/organizations/{organizationId}/devices/packetCapture/captures"
-
-        body_params = [
-            "serials",
-            "name",
-            "outputType",
-            "destination",
-            "ports",
-            "notes",
-            "duration",
-            "filterExpression",
-            "interface",
-            "advanced",
-        ]
-        payload = {k.strip(): v for k, v in kwargs.items() if k.strip() in body_params}
-
-        if self._session._validate_kwargs:
-            all_params = [] + body_params
-            invalid = [k for k in kwargs if k.strip() not in all_params and k != "self"]
-            if invalid and self._session._logger:
-                self._session._logger.warning(
-                    f"createOrganizationDevicesPacketCaptureCapture: ignoring unrecognized kwargs: {invalid}"
-                )
-
-        return self._session.post(metadata, resource, payload)
+        return dispatch.call(
+            self._session, "createOrganizationDevicesPacketCaptureCapture", organizationId, serials, name, **kwargs
+        )
 
     def bulkOrganizationDevicesPacketCaptureCapturesCreate(self, organizationId: str, devices: list, name: str, **kwargs):
         """
@@ -3609,34 +1535,9 @@ class AsyncOrganizations:
         - advanced (object): Advanced capture options (optional)
         """
 
-        kwargs.update(locals())
-
-        metadata = {
-            "tags": ["organizations", "configure", "devices", "packetCapture", "captures"],
-            "operation": "bulkOrganizationDevicesPacketCaptureCapturesCreate",
-        }
-        organizationId = urllib.parse.quote(str(organizationId), safe="")
-        resource = f"/organizations/{organizationId}/devices/packetCapture/captures/bulkCreate"
-
-        body_params = [
-            "devices",
-            "notes",
-            "duration",
-            "filterExpression",
-            "name",
-            "advanced",
-        ]
-        payload = {k.strip(): v for k, v in kwargs.items() if k.strip() in body_params}
-
-        if self._session._validate_kwargs:
-            all_params = [] + body_params
-            invalid = [k for k in kwargs if k.strip() not in all_params and k != "self"]
-            if invalid and self._session._logger:
-                self._session._logger.warning(
-                    f"bulkOrganizationDevicesPacketCaptureCapturesCreate: ignoring unrecognized kwargs: {invalid}"
-                )
-
-        return self._session.post(metadata, resource, payload)
+        return dispatch.call(
+            self._session, "bulkOrganizationDevicesPacketCaptureCapturesCreate", organizationId, devices, name, **kwargs
+        )
 
     def bulkOrganizationDevicesPacketCaptureCapturesDelete(self, organizationId: str, captureIds: list, **kwargs):
         """
@@ -3647,29 +1548,9 @@ class AsyncOrganizations:
         - captureIds (array): Delete the packet captures of the specified capture ids
         """
 
-        kwargs = locals()
-
-        metadata = {
-            "tags": ["organizations", "configure", "devices", "packetCapture", "captures"],
-            "operation": "bulkOrganizationDevicesPacketCaptureCapturesDelete",
-        }
-        organizationId = urllib.parse.quote(str(organizationId), safe="")
-        resource = f"/organizations/{organizationId}/devices/packetCapture/captures/bulkDelete"
-
-        body_params = [
-            "captureIds",
-        ]
-        payload = {k.strip(): v for k, v in kwargs.items() if k.strip() in body_params}
-
-        if self._session._validate_kwargs:
-            all_params = [] + body_params
-            invalid = [k for k in kwargs if k.strip() not in all_params and k != "self"]
-            if invalid and self._session._logger:
-                self._session._logger.warning(
-                    f"bulkOrganizationDevicesPacketCaptureCapturesDelete: ignoring unrecognized kwargs: {invalid}"
-                )
-
-        return self._session.post(metadata, resource, payload)
+        return dispatch.call(
+            self._session, "bulkOrganizationDevicesPacketCaptureCapturesDelete", organizationId, captureIds, **kwargs
+        )
 
     def deleteOrganizationDevicesPacketCaptureCapture(self, organizationId: str, captureId: str):
         """
@@ -3680,15 +1561,7 @@ class AsyncOrganizations:
         - captureId (string): Capture ID
         """
 
-        metadata = {
-            "tags": ["organizations", "configure", "devices", "packetCapture", "captures"],
-            "operation": "deleteOrganizationDevicesPacketCaptureCapture",
-        }
-        organizationId = urllib.parse.quote(str(organizationId), safe="")
-        captureId = urllib.parse.quote(str(captureId), safe="")
-        resource = f"/organizations/{organizationId}/devices/packetCapture/captures/{captureId}"
-
-        return self._session.delete(metadata, resource)
+        return dispatch.call(self._session, "deleteOrganizationDevicesPacketCaptureCapture", organizationId, captureId)
 
     def generateOrganizationDevicesPacketCaptureCaptureDownloadUrl(self, organizationId: str, captureId: str):
         """
@@ -3699,15 +1572,9 @@ class AsyncOrganizations:
         - captureId (string): Capture ID
         """
 
-        metadata = {
-            "tags": ["organizations", "configure", "devices", "packetCapture", "captures", "downloadUrl"],
-            "operation": "generateOrganizationDevicesPacketCaptureCaptureDownloadUrl",
-        }
-        organizationId = urllib.parse.quote(str(organizationId), safe="")
-        captureId = urllib.parse.quote(str(captureId), safe="")
-        resource = f"/organizations/{organizationId}/devices/packetCapture/captures/{captureId}/downloadUrl/generate"
-
-        return self._session.post(metadata, resource)
+        return dispatch.call(
+            self._session, "generateOrganizationDevicesPacketCaptureCaptureDownloadUrl", organizationId, captureId
+        )
 
     def stopOrganizationDevicesPacketCaptureCapture(self, organizationId: str, captureId: str, serials: list, **kwargs):
         """
@@ -3719,30 +1586,9 @@ class AsyncOrganizations:
         - serials (array): The serial(s) of the device(s) to stop the capture on
         """
 
-        kwargs = locals()
-
-        metadata = {
-            "tags": ["organizations", "configure", "devices", "packetCapture", "captures"],
-            "operation": "stopOrganizationDevicesPacketCaptureCapture",
-        }
-        organizationId = urllib.parse.quote(str(organizationId), safe="")
-        captureId = urllib.parse.quote(str(captureId), safe="")
-        resource = f"/organizations/{organizationId}/devices/packetCapture/captures/{captureId}/stop"
-
-        body_params = [
-            "serials",
-        ]
-        payload = {k.strip(): v for k, v in kwargs.items() if k.strip() in body_params}
-
-        if self._session._validate_kwargs:
-            all_params = [] + body_params
-            invalid = [k for k in kwargs if k.strip() not in all_params and k != "self"]
-            if invalid and self._session._logger:
-                self._session._logger.warning(
-                    f"stopOrganizationDevicesPacketCaptureCapture: ignoring unrecognized kwargs: {invalid}"
-                )
-
-        return self._session.post(metadata, resource, payload)
+        return dispatch.call(
+            self._session, "stopOrganizationDevicesPacketCaptureCapture", organizationId, captureId, serials, **kwargs
+        )
 
     def getOrganizationDevicesPacketCaptureSchedules(self, organizationId: str, **kwargs):
         """
@@ -3755,41 +1601,7 @@ class AsyncOrganizations:
         - deviceIds (array): Return the scheduled packet captures of the specified device(s)
         """
 
-        kwargs.update(locals())
-
-        metadata = {
-            "tags": ["organizations", "configure", "devices", "packetCapture", "schedules"],
-            "operation": "getOrganizationDevicesPacketCaptureSchedules",
-        }
-        organizationId = urllib.parse.quote(str(organizationId), safe="")
-        resource = f"/organizations/{organizationId}/devices/packetCapture/schedules"
-
-        query_params = [
-            "scheduleIds",
-            "networkIds",
-            "deviceIds",
-        ]
-        params = {k.strip(): v for k, v in kwargs.items() if k.strip() in query_params}
-
-        array_params = [
-            "scheduleIds",
-            "networkIds",
-            "deviceIds",
-        ]
-        for k, v in kwargs.items():
-            if k.strip() in array_params:
-                params[f"{k.strip()}[]"] = kwargs[f"{k}"]
-                params.pop(k.strip())
-
-        if self._session._validate_kwargs:
-            all_params = query_params + array_params
-            invalid = [k for k in kwargs if k.strip() not in all_params and k != "self"]
-            if invalid and self._session._logger:
-                self._session._logger.warning(
-                    f"getOrganizationDevicesPacketCaptureSchedules: ignoring unrecognized kwargs: {invalid}"
-                )
-
-        return self._session.get(metadata, resource, params)
+        return dispatch.call(self._session, "getOrganizationDevicesPacketCaptureSchedules", organizationId, **kwargs)
 
     def createOrganizationDevicesPacketCaptureSchedule(self, organizationId: str, devices: list, **kwargs):
         """
@@ -3806,35 +1618,9 @@ class AsyncOrganizations:
         - schedule (object): Schedule details
         """
 
-        kwargs.update(locals())
-
-        metadata = {
-            "tags": ["organizations", "configure", "devices", "packetCapture", "schedules"],
-            "operation": "createOrganizationDevicesPacketCaptureSchedule",
-        }
-        organizationId = urllib.parse.quote(str(organizationId), safe="")
-        resource = f"/organizations/{organizationId}/devices/packetCapture/schedules"
-
-        body_params = [
-            "devices",
-            "name",
-            "notes",
-            "duration",
-            "filterExpression",
-            "enabled",
-            "schedule",
-        ]
-        payload = {k.strip(): v for k, v in kwargs.items() if k.strip() in body_params}
-
-        if self._session._validate_kwargs:
-            all_params = [] + body_params
-            invalid = [k for k in kwargs if k.strip() not in all_params and k != "self"]
-            if invalid and self._session._logger:
-                self._session._logger.warning(
-                    f"createOrganizationDevicesPacketCaptureSchedule: ignoring unrecognized kwargs: {invalid}"
-                )
-
-        return self._session.post(metadata, resource, payload)
+        return dispatch.call(
+            self._session, "createOrganizationDevicesPacketCaptureSchedule", organizationId, devices, **kwargs
+        )
 
     def reorderOrganizationDevicesPacketCaptureSchedules(self, organizationId: str, order: list, **kwargs):
         """
@@ -3845,29 +1631,9 @@ class AsyncOrganizations:
         - order (array): Array of schedule IDs and their priorities to reorder.
         """
 
-        kwargs = locals()
-
-        metadata = {
-            "tags": ["organizations", "configure", "devices", "packetCapture", "schedules"],
-            "operation": "reorderOrganizationDevicesPacketCaptureSchedules",
-        }
-        organizationId = urllib.parse.quote(str(organizationId), safe="")
-        resource = f"/organizations/{organizationId}/devices/packetCapture/schedules/reorder"
-
-        body_params = [
-            "order",
-        ]
-        payload = {k.strip(): v for k, v in kwargs.items() if k.strip() in body_params}
-
-        if self._session._validate_kwargs:
-            all_params = [] + body_params
-            invalid = [k for k in kwargs if k.strip() not in all_params and k != "self"]
-            if invalid and self._session._logger:
-                self._session._logger.warning(
-                    f"reorderOrganizationDevicesPacketCaptureSchedules: ignoring unrecognized kwargs: {invalid}"
-                )
-
-        return self._session.post(metadata, resource, payload)
+        return dispatch.call(
+            self._session, "reorderOrganizationDevicesPacketCaptureSchedules", organizationId, order, **kwargs
+        )
 
     def updateOrganizationDevicesPacketCaptureSchedule(self, organizationId: str, scheduleId: str, devices: list, **kwargs):
         """
@@ -3885,36 +1651,9 @@ class AsyncOrganizations:
         - schedule (object): Schedule details
         """
 
-        kwargs.update(locals())
-
-        metadata = {
-            "tags": ["organizations", "configure", "devices", "packetCapture", "schedules"],
-            "operation": "updateOrganizationDevicesPacketCaptureSchedule",
-        }
-        organizationId = urllib.parse.quote(str(organizationId), safe="")
-        scheduleId = urllib.parse.quote(str(scheduleId), safe="")
-        resource = f"/organizations/{organizationId}/devices/packetCapture/schedules/{scheduleId}"
-
-        body_params = [
-            "devices",
-            "name",
-            "notes",
-            "duration",
-            "filterExpression",
-            "enabled",
-            "schedule",
-        ]
-        payload = {k.strip(): v for k, v in kwargs.items() if k.strip() in body_params}
-
-        if self._session._validate_kwargs:
-            all_params = [] + body_params
-            invalid = [k for k in kwargs if k.strip() not in all_params and k != "self"]
-            if invalid and self._session._logger:
-                self._session._logger.warning(
-                    f"updateOrganizationDevicesPacketCaptureSchedule: ignoring unrecognized kwargs: {invalid}"
-                )
-
-        return self._session.put(metadata, resource, payload)
+        return dispatch.call(
+            self._session, "updateOrganizationDevicesPacketCaptureSchedule", organizationId, scheduleId, devices, **kwargs
+        )
 
     def deleteOrganizationDevicesPacketCaptureSchedule(self, organizationId: str, scheduleId: str):
         """
@@ -3925,17 +1664,7 @@ class AsyncOrganizations:
         - scheduleId (string): Delete the capture schedules of the specified capture schedule id
         """
 
-        kwargs = locals()
-
-        metadata = {
-            "tags": ["organizations", "configure", "devices", "packetCapture", "schedules"],
-            "operation": "deleteOrganizationDevicesPacketCaptureSchedule",
-        }
-        organizationId = urllib.parse.quote(str(organizationId), safe="")
-        scheduleId = urllib.parse.quote(str(scheduleId), safe="")
-        resource = f"/organizations/{organizationId}/devices/packetCapture/schedules/{scheduleId}"
-
-        return self._session.delete(metadata, resource)
+        return dispatch.call(self._session, "deleteOrganizationDevicesPacketCaptureSchedule", organizationId, scheduleId)
 
     def getOrganizationDevicesPowerModulesStatusesByDevice(
         self, organizationId: str, total_pages=1, direction="next", **kwargs
@@ -3957,53 +1686,14 @@ class AsyncOrganizations:
         - tagsFilterType (string): An optional parameter of value 'withAnyTags' or 'withAllTags' to indicate whether to return devices which contain ANY or ALL of the included tags. If no type is included, 'withAnyTags' will be selected.
         """
 
-        kwargs.update(locals())
-
-        if "tagsFilterType" in kwargs:
-            options = ["withAllTags", "withAnyTags"]
-            assert kwargs["tagsFilterType"] in options, (
-                f'''"tagsFilterType" cannot be "{kwargs["tagsFilterType"]}", & must be set to one of: {options}'''
-            )
-
-        metadata = {
-            "tags": ["organizations", "monitor", "devices", "powerModules", "statuses", "byDevice"],
-            "operation": "getOrganizationDevicesPowerModulesStatusesByDevice",
-        }
-        organizationId = urllib.parse.quote(str(organizationId), safe="")
-        resource = f"/organizations/{organizationId}/devices/powerModules/statuses/byDevice"
-
-        query_params = [
-            "perPage",
-            "startingAfter",
-            "endingBefore",
-            "networkIds",
-            "productTypes",
-            "serials",
-            "tags",
-            "tagsFilterType",
-        ]
-        params = {k.strip(): v for k, v in kwargs.items() if k.strip() in query_params}
-
-        array_params = [
-            "networkIds",
-            "productTypes",
-            "serials",
-            "tags",
-        ]
-        for k, v in kwargs.items():
-            if k.strip() in array_params:
-                params[f"{k.strip()}[]"] = kwargs[f"{k}"]
-                params.pop(k.strip())
-
-        if self._session._validate_kwargs:
-            all_params = query_params + array_params
-            invalid = [k for k in kwargs if k.strip() not in all_params and k != "self"]
-            if invalid and self._session._logger:
-                self._session._logger.warning(
-                    f"getOrganizationDevicesPowerModulesStatusesByDevice: ignoring unrecognized kwargs: {invalid}"
-                )
-
-        return self._session.get_pages(metadata, resource, params, total_pages, direction)
+        return dispatch.call(
+            self._session,
+            "getOrganizationDevicesPowerModulesStatusesByDevice",
+            organizationId,
+            total_pages=total_pages,
+            direction=direction,
+            **kwargs,
+        )
 
     def getOrganizationDevicesProvisioningStatuses(self, organizationId: str, total_pages=1, direction="next", **kwargs):
         """
@@ -4024,59 +1714,14 @@ class AsyncOrganizations:
         - tagsFilterType (string): An optional parameter of value 'withAnyTags' or 'withAllTags' to indicate whether to return devices which contain ANY or ALL of the included tags. If no type is included, 'withAnyTags' will be selected.
         """
 
-        kwargs.update(locals())
-
-        if "status" in kwargs:
-            options = ["complete", "incomplete", "unprovisioned"]
-            assert kwargs["status"] in options, (
-                f'''"status" cannot be "{kwargs["status"]}", & must be set to one of: {options}'''
-            )
-        if "tagsFilterType" in kwargs:
-            options = ["withAllTags", "withAnyTags"]
-            assert kwargs["tagsFilterType"] in options, (
-                f'''"tagsFilterType" cannot be "{kwargs["tagsFilterType"]}", & must be set to one of: {options}'''
-            )
-
-        metadata = {
-            "tags": ["organizations", "monitor", "devices", "provisioning", "statuses"],
-            "operation": "getOrganizationDevicesProvisioningStatuses",
-        }
-        organizationId = urllib.parse.quote(str(organizationId), safe="")
-        resource = f"/organizations/{organizationId}/devices/provisioning/statuses"
-
-        query_params = [
-            "perPage",
-            "startingAfter",
-            "endingBefore",
-            "networkIds",
-            "productTypes",
-            "serials",
-            "status",
-            "tags",
-            "tagsFilterType",
-        ]
-        params = {k.strip(): v for k, v in kwargs.items() if k.strip() in query_params}
-
-        array_params = [
-            "networkIds",
-            "productTypes",
-            "serials",
-            "tags",
-        ]
-        for k, v in kwargs.items():
-            if k.strip() in array_params:
-                params[f"{k.strip()}[]"] = kwargs[f"{k}"]
-                params.pop(k.strip())
-
-        if self._session._validate_kwargs:
-            all_params = query_params + array_params
-            invalid = [k for k in kwargs if k.strip() not in all_params and k != "self"]
-            if invalid and self._session._logger:
-                self._session._logger.warning(
-                    f"getOrganizationDevicesProvisioningStatuses: ignoring unrecognized kwargs: {invalid}"
-                )
-
-        return self._session.get_pages(metadata, resource, params, total_pages, direction)
+        return dispatch.call(
+            self._session,
+            "getOrganizationDevicesProvisioningStatuses",
+            organizationId,
+            total_pages=total_pages,
+            direction=direction,
+            **kwargs,
+        )
 
     def getOrganizationDevicesStatuses(self, organizationId: str, total_pages=1, direction="next", **kwargs):
         """
@@ -4098,55 +1743,14 @@ class AsyncOrganizations:
         - tagsFilterType (string): An optional parameter of value 'withAnyTags' or 'withAllTags' to indicate whether to return devices which contain ANY or ALL of the included tags. If no type is included, 'withAnyTags' will be selected.
         """
 
-        kwargs.update(locals())
-
-        if "tagsFilterType" in kwargs:
-            options = ["withAllTags", "withAnyTags"]
-            assert kwargs["tagsFilterType"] in options, (
-                f'''"tagsFilterType" cannot be "{kwargs["tagsFilterType"]}", & must be set to one of: {options}'''
-            )
-
-        metadata = {
-            "tags": ["organizations", "monitor", "devices", "statuses"],
-            "operation": "getOrganizationDevicesStatuses",
-        }
-        organizationId = urllib.parse.quote(str(organizationId), safe="")
-        resource = f"/organizations/{organizationId}/devices/statuses"
-
-        query_params = [
-            "perPage",
-            "startingAfter",
-            "endingBefore",
-            "networkIds",
-            "serials",
-            "statuses",
-            "productTypes",
-            "models",
-            "tags",
-            "tagsFilterType",
-        ]
-        params = {k.strip(): v for k, v in kwargs.items() if k.strip() in query_params}
-
-        array_params = [
-            "networkIds",
-            "serials",
-            "statuses",
-            "productTypes",
-            "models",
-            "tags",
-        ]
-        for k, v in kwargs.items():
-            if k.strip() in array_params:
-                params[f"{k.strip()}[]"] = kwargs[f"{k}"]
-                params.pop(k.strip())
-
-        if self._session._validate_kwargs:
-            all_params = query_params + array_params
-            invalid = [k for k in kwargs if k.strip() not in all_params and k != "self"]
-            if invalid and self._session._logger:
-                self._session._logger.warning(f"getOrganizationDevicesStatuses: ignoring unrecognized kwargs: {invalid}")
-
-        return self._session.get_pages(metadata, resource, params, total_pages, direction)
+        return dispatch.call(
+            self._session,
+            "getOrganizationDevicesStatuses",
+            organizationId,
+            total_pages=total_pages,
+            direction=direction,
+            **kwargs,
+        )
 
     def getOrganizationDevicesStatusesOverview(self, organizationId: str, **kwargs):
         """
@@ -4158,39 +1762,7 @@ class AsyncOrganizations:
         - networkIds (array): An optional parameter to filter device statuses by network.
         """
 
-        kwargs.update(locals())
-
-        metadata = {
-            "tags": ["organizations", "monitor", "devices", "statuses", "overview"],
-            "operation": "getOrganizationDevicesStatusesOverview",
-        }
-        organizationId = urllib.parse.quote(str(organizationId), safe="")
-        resource = f"/organizations/{organizationId}/devices/statuses/overview"
-
-        query_params = [
-            "productTypes",
-            "networkIds",
-        ]
-        params = {k.strip(): v for k, v in kwargs.items() if k.strip() in query_params}
-
-        array_params = [
-            "productTypes",
-            "networkIds",
-        ]
-        for k, v in kwargs.items():
-            if k.strip() in array_params:
-                params[f"{k.strip()}[]"] = kwargs[f"{k}"]
-                params.pop(k.strip())
-
-        if self._session._validate_kwargs:
-            all_params = query_params + array_params
-            invalid = [k for k in kwargs if k.strip() not in all_params and k != "self"]
-            if invalid and self._session._logger:
-                self._session._logger.warning(
-                    f"getOrganizationDevicesStatusesOverview: ignoring unrecognized kwargs: {invalid}"
-                )
-
-        return self._session.get(metadata, resource, params)
+        return dispatch.call(self._session, "getOrganizationDevicesStatusesOverview", organizationId, **kwargs)
 
     def getOrganizationDevicesSyslogServersByNetwork(self, organizationId: str, total_pages=1, direction="next", **kwargs):
         """
@@ -4206,40 +1778,14 @@ class AsyncOrganizations:
         - networkIds (array): IDs of the networks for which to fetch syslog servers; suggested maximum array size is 100
         """
 
-        kwargs.update(locals())
-
-        metadata = {
-            "tags": ["organizations", "configure", "devices", "syslog", "servers", "byNetwork"],
-            "operation": "getOrganizationDevicesSyslogServersByNetwork",
-        }
-        organizationId = urllib.parse.quote(str(organizationId), safe="")
-        resource = f"/organizations/{organizationId}/devices/syslog/servers/byNetwork"
-
-        query_params = [
-            "perPage",
-            "startingAfter",
-            "endingBefore",
-            "networkIds",
-        ]
-        params = {k.strip(): v for k, v in kwargs.items() if k.strip() in query_params}
-
-        array_params = [
-            "networkIds",
-        ]
-        for k, v in kwargs.items():
-            if k.strip() in array_params:
-                params[f"{k.strip()}[]"] = kwargs[f"{k}"]
-                params.pop(k.strip())
-
-        if self._session._validate_kwargs:
-            all_params = query_params + array_params
-            invalid = [k for k in kwargs if k.strip() not in all_params and k != "self"]
-            if invalid and self._session._logger:
-                self._session._logger.warning(
-                    f"getOrganizationDevicesSyslogServersByNetwork: ignoring unrecognized kwargs: {invalid}"
-                )
-
-        return self._session.get_pages(metadata, resource, params, total_pages, direction)
+        return dispatch.call(
+            self._session,
+            "getOrganizationDevicesSyslogServersByNetwork",
+            organizationId,
+            total_pages=total_pages,
+            direction=direction,
+            **kwargs,
+        )
 
     def getOrganizationDevicesSyslogServersRolesByNetwork(
         self, organizationId: str, total_pages=1, direction="next", **kwargs
@@ -4257,40 +1803,14 @@ class AsyncOrganizations:
         - networkIds (array): IDs of the networks for which to fetch valid syslog server roles; suggested maximum array size is 100
         """
 
-        kwargs.update(locals())
-
-        metadata = {
-            "tags": ["organizations", "configure", "devices", "syslog", "servers", "roles", "byNetwork"],
-            "operation": "getOrganizationDevicesSyslogServersRolesByNetwork",
-        }
-        organizationId = urllib.parse.quote(str(organizationId), safe="")
-        resource = f"/organizations/{organizationId}/devices/syslog/servers/roles/byNetwork"
-
-        query_params = [
-            "perPage",
-            "startingAfter",
-            "endingBefore",
-            "networkIds",
-        ]
-        params = {k.strip(): v for k, v in kwargs.items() if k.strip() in query_params}
-
-        array_params = [
-            "networkIds",
-        ]
-        for k, v in kwargs.items():
-            if k.strip() in array_params:
-                params[f"{k.strip()}[]"] = kwargs[f"{k}"]
-                params.pop(k.strip())
-
-        if self._session._validate_kwargs:
-            all_params = query_params + array_params
-            invalid = [k for k in kwargs if k.strip() not in all_params and k != "self"]
-            if invalid and self._session._logger:
-                self._session._logger.warning(
-                    f"getOrganizationDevicesSyslogServersRolesByNetwork: ignoring unrecognized kwargs: {invalid}"
-                )
-
-        return self._session.get_pages(metadata, resource, params, total_pages, direction)
+        return dispatch.call(
+            self._session,
+            "getOrganizationDevicesSyslogServersRolesByNetwork",
+            organizationId,
+            total_pages=total_pages,
+            direction=direction,
+            **kwargs,
+        )
 
     def getOrganizationDevicesSystemMemoryUsageHistoryByInterval(
         self, organizationId: str, total_pages=1, direction="next", **kwargs
@@ -4314,48 +1834,14 @@ class AsyncOrganizations:
         - productTypes (array): Optional parameter to filter device statuses by product type. Valid types are wireless, appliance, switch, systemsManager, camera, cellularGateway, sensor, wirelessController, campusGateway, and secureConnect.
         """
 
-        kwargs.update(locals())
-
-        metadata = {
-            "tags": ["organizations", "monitor", "devices", "system", "memory", "usage", "history", "byInterval"],
-            "operation": "getOrganizationDevicesSystemMemoryUsageHistoryByInterval",
-        }
-        organizationId = urllib.parse.quote(str(organizationId), safe="")
-        resource = f"/organizations/{organizationId}/devices/system/memory/usage/history/byInterval"
-
-        query_params = [
-            "perPage",
-            "startingAfter",
-            "endingBefore",
-            "t0",
-            "t1",
-            "timespan",
-            "interval",
-            "networkIds",
-            "serials",
-            "productTypes",
-        ]
-        params = {k.strip(): v for k, v in kwargs.items() if k.strip() in query_params}
-
-        array_params = [
-            "networkIds",
-            "serials",
-            "productTypes",
-        ]
-        for k, v in kwargs.items():
-            if k.strip() in array_params:
-                params[f"{k.strip()}[]"] = kwargs[f"{k}"]
-                params.pop(k.strip())
-
-        if self._session._validate_kwargs:
-            all_params = query_params + array_params
-            invalid = [k for k in kwargs if k.strip() not in all_params and k != "self"]
-            if invalid and self._session._logger:
-                self._session._logger.warning(
-                    f"getOrganizationDevicesSystemMemoryUsageHistoryByInterval: ignoring unrecognized kwargs: {invalid}"
-                )
-
-        return self._session.get_pages(metadata, resource, params, total_pages, direction)
+        return dispatch.call(
+            self._session,
+            "getOrganizationDevicesSystemMemoryUsageHistoryByInterval",
+            organizationId,
+            total_pages=total_pages,
+            direction=direction,
+            **kwargs,
+        )
 
     def getOrganizationDevicesUplinksAddressesByDevice(self, organizationId: str, total_pages=1, direction="next", **kwargs):
         """
@@ -4375,53 +1861,14 @@ class AsyncOrganizations:
         - tagsFilterType (string): An optional parameter of value 'withAnyTags' or 'withAllTags' to indicate whether to return devices which contain ANY or ALL of the included tags. If no type is included, 'withAnyTags' will be selected.
         """
 
-        kwargs.update(locals())
-
-        if "tagsFilterType" in kwargs:
-            options = ["withAllTags", "withAnyTags"]
-            assert kwargs["tagsFilterType"] in options, (
-                f'''"tagsFilterType" cannot be "{kwargs["tagsFilterType"]}", & must be set to one of: {options}'''
-            )
-
-        metadata = {
-            "tags": ["organizations", "monitor", "devices", "uplinks", "addresses", "byDevice"],
-            "operation": "getOrganizationDevicesUplinksAddressesByDevice",
-        }
-        organizationId = urllib.parse.quote(str(organizationId), safe="")
-        resource = f"/organizations/{organizationId}/devices/uplinks/addresses/byDevice"
-
-        query_params = [
-            "perPage",
-            "startingAfter",
-            "endingBefore",
-            "networkIds",
-            "productTypes",
-            "serials",
-            "tags",
-            "tagsFilterType",
-        ]
-        params = {k.strip(): v for k, v in kwargs.items() if k.strip() in query_params}
-
-        array_params = [
-            "networkIds",
-            "productTypes",
-            "serials",
-            "tags",
-        ]
-        for k, v in kwargs.items():
-            if k.strip() in array_params:
-                params[f"{k.strip()}[]"] = kwargs[f"{k}"]
-                params.pop(k.strip())
-
-        if self._session._validate_kwargs:
-            all_params = query_params + array_params
-            invalid = [k for k in kwargs if k.strip() not in all_params and k != "self"]
-            if invalid and self._session._logger:
-                self._session._logger.warning(
-                    f"getOrganizationDevicesUplinksAddressesByDevice: ignoring unrecognized kwargs: {invalid}"
-                )
-
-        return self._session.get_pages(metadata, resource, params, total_pages, direction)
+        return dispatch.call(
+            self._session,
+            "getOrganizationDevicesUplinksAddressesByDevice",
+            organizationId,
+            total_pages=total_pages,
+            direction=direction,
+            **kwargs,
+        )
 
     def getOrganizationDevicesUplinksLossAndLatency(self, organizationId: str, **kwargs):
         """
@@ -4436,39 +1883,7 @@ class AsyncOrganizations:
         - ip (string): Optional filter for a specific destination IP. Default will return all destination IPs.
         """
 
-        kwargs.update(locals())
-
-        if "uplink" in kwargs:
-            options = ["cellular", "wan1", "wan2", "wan3"]
-            assert kwargs["uplink"] in options, (
-                f'''"uplink" cannot be "{kwargs["uplink"]}", & must be set to one of: {options}'''
-            )
-
-        metadata = {
-            "tags": ["organizations", "monitor", "devices", "uplinks", "uplinksLossAndLatency"],
-            "operation": "getOrganizationDevicesUplinksLossAndLatency",
-        }
-        organizationId = urllib.parse.quote(str(organizationId), safe="")
-        resource = f"/organizations/{organizationId}/devices/uplinksLossAndLatency"
-
-        query_params = [
-            "t0",
-            "t1",
-            "timespan",
-            "uplink",
-            "ip",
-        ]
-        params = {k.strip(): v for k, v in kwargs.items() if k.strip() in query_params}
-
-        if self._session._validate_kwargs:
-            all_params = query_params
-            invalid = [k for k in kwargs if k.strip() not in all_params and k != "self"]
-            if invalid and self._session._logger:
-                self._session._logger.warning(
-                    f"getOrganizationDevicesUplinksLossAndLatency: ignoring unrecognized kwargs: {invalid}"
-                )
-
-        return self._session.get(metadata, resource, params)
+        return dispatch.call(self._session, "getOrganizationDevicesUplinksLossAndLatency", organizationId, **kwargs)
 
     def getOrganizationEarlyAccessFeatures(self, organizationId: str):
         """
@@ -4478,14 +1893,7 @@ class AsyncOrganizations:
         - organizationId (string): Organization ID
         """
 
-        metadata = {
-            "tags": ["organizations", "configure", "earlyAccess", "features"],
-            "operation": "getOrganizationEarlyAccessFeatures",
-        }
-        organizationId = urllib.parse.quote(str(organizationId), safe="")
-        resource = f"/organizations/{organizationId}/earlyAccess/features"
-
-        return self._session.get(metadata, resource)
+        return dispatch.call(self._session, "getOrganizationEarlyAccessFeatures", organizationId)
 
     def getOrganizationEarlyAccessFeaturesOptIns(self, organizationId: str):
         """
@@ -4495,14 +1903,7 @@ class AsyncOrganizations:
         - organizationId (string): Organization ID
         """
 
-        metadata = {
-            "tags": ["organizations", "configure", "earlyAccess", "features", "optIns"],
-            "operation": "getOrganizationEarlyAccessFeaturesOptIns",
-        }
-        organizationId = urllib.parse.quote(str(organizationId), safe="")
-        resource = f"/organizations/{organizationId}/earlyAccess/features/optIns"
-
-        return self._session.get(metadata, resource)
+        return dispatch.call(self._session, "getOrganizationEarlyAccessFeaturesOptIns", organizationId)
 
     def createOrganizationEarlyAccessFeaturesOptIn(self, organizationId: str, shortName: str, **kwargs):
         """
@@ -4514,30 +1915,7 @@ class AsyncOrganizations:
         - limitScopeToNetworks (array): A list of network IDs to apply the opt-in to
         """
 
-        kwargs.update(locals())
-
-        metadata = {
-            "tags": ["organizations", "configure", "earlyAccess", "features", "optIns"],
-            "operation": "createOrganizationEarlyAccessFeaturesOptIn",
-        }
-        organizationId = urllib.parse.quote(str(organizationId), safe="")
-        resource = f"/organizations/{organizationId}/earlyAccess/features/optIns"
-
-        body_params = [
-            "shortName",
-            "limitScopeToNetworks",
-        ]
-        payload = {k.strip(): v for k, v in kwargs.items() if k.strip() in body_params}
-
-        if self._session._validate_kwargs:
-            all_params = [] + body_params
-            invalid = [k for k in kwargs if k.strip() not in all_params and k != "self"]
-            if invalid and self._session._logger:
-                self._session._logger.warning(
-                    f"createOrganizationEarlyAccessFeaturesOptIn: ignoring unrecognized kwargs: {invalid}"
-                )
-
-        return self._session.post(metadata, resource, payload)
+        return dispatch.call(self._session, "createOrganizationEarlyAccessFeaturesOptIn", organizationId, shortName, **kwargs)
 
     def getOrganizationEarlyAccessFeaturesOptIn(self, organizationId: str, optInId: str):
         """
@@ -4548,15 +1926,7 @@ class AsyncOrganizations:
         - optInId (string): Opt in ID
         """
 
-        metadata = {
-            "tags": ["organizations", "configure", "earlyAccess", "features", "optIns"],
-            "operation": "getOrganizationEarlyAccessFeaturesOptIn",
-        }
-        organizationId = urllib.parse.quote(str(organizationId), safe="")
-        optInId = urllib.parse.quote(str(optInId), safe="")
-        resource = f"/organizations/{organizationId}/earlyAccess/features/optIns/{optInId}"
-
-        return self._session.get(metadata, resource)
+        return dispatch.call(self._session, "getOrganizationEarlyAccessFeaturesOptIn", organizationId, optInId)
 
     def updateOrganizationEarlyAccessFeaturesOptIn(self, organizationId: str, optInId: str, **kwargs):
         """
@@ -4568,30 +1938,7 @@ class AsyncOrganizations:
         - limitScopeToNetworks (array): A list of network IDs to apply the opt-in to
         """
 
-        kwargs.update(locals())
-
-        metadata = {
-            "tags": ["organizations", "configure", "earlyAccess", "features", "optIns"],
-            "operation": "updateOrganizationEarlyAccessFeaturesOptIn",
-        }
-        organizationId = urllib.parse.quote(str(organizationId), safe="")
-        optInId = urllib.parse.quote(str(optInId), safe="")
-        resource = f"/organizations/{organizationId}/earlyAccess/features/optIns/{optInId}"
-
-        body_params = [
-            "limitScopeToNetworks",
-        ]
-        payload = {k.strip(): v for k, v in kwargs.items() if k.strip() in body_params}
-
-        if self._session._validate_kwargs:
-            all_params = [] + body_params
-            invalid = [k for k in kwargs if k.strip() not in all_params and k != "self"]
-            if invalid and self._session._logger:
-                self._session._logger.warning(
-                    f"updateOrganizationEarlyAccessFeaturesOptIn: ignoring unrecognized kwargs: {invalid}"
-                )
-
-        return self._session.put(metadata, resource, payload)
+        return dispatch.call(self._session, "updateOrganizationEarlyAccessFeaturesOptIn", organizationId, optInId, **kwargs)
 
     def deleteOrganizationEarlyAccessFeaturesOptIn(self, organizationId: str, optInId: str):
         """
@@ -4602,15 +1949,7 @@ class AsyncOrganizations:
         - optInId (string): Opt in ID
         """
 
-        metadata = {
-            "tags": ["organizations", "configure", "earlyAccess", "features", "optIns"],
-            "operation": "deleteOrganizationEarlyAccessFeaturesOptIn",
-        }
-        organizationId = urllib.parse.quote(str(organizationId), safe="")
-        optInId = urllib.parse.quote(str(optInId), safe="")
-        resource = f"/organizations/{organizationId}/earlyAccess/features/optIns/{optInId}"
-
-        return self._session.delete(metadata, resource)
+        return dispatch.call(self._session, "deleteOrganizationEarlyAccessFeaturesOptIn", organizationId, optInId)
 
     def getOrganizationFirmwareUpgrades(self, organizationId: str, total_pages=1, direction="next", **kwargs):
         """
@@ -4627,40 +1966,14 @@ class AsyncOrganizations:
         - productTypes (array): Optional parameter to filter the upgrade by product type.
         """
 
-        kwargs.update(locals())
-
-        metadata = {
-            "tags": ["organizations", "configure", "firmware", "upgrades"],
-            "operation": "getOrganizationFirmwareUpgrades",
-        }
-        organizationId = urllib.parse.quote(str(organizationId), safe="")
-        resource = f"/organizations/{organizationId}/firmware/upgrades"
-
-        query_params = [
-            "perPage",
-            "startingAfter",
-            "endingBefore",
-            "status",
-            "productTypes",
-        ]
-        params = {k.strip(): v for k, v in kwargs.items() if k.strip() in query_params}
-
-        array_params = [
-            "status",
-            "productTypes",
-        ]
-        for k, v in kwargs.items():
-            if k.strip() in array_params:
-                params[f"{k.strip()}[]"] = kwargs[f"{k}"]
-                params.pop(k.strip())
-
-        if self._session._validate_kwargs:
-            all_params = query_params + array_params
-            invalid = [k for k in kwargs if k.strip() not in all_params and k != "self"]
-            if invalid and self._session._logger:
-                self._session._logger.warning(f"getOrganizationFirmwareUpgrades: ignoring unrecognized kwargs: {invalid}")
-
-        return self._session.get_pages(metadata, resource, params, total_pages, direction)
+        return dispatch.call(
+            self._session,
+            "getOrganizationFirmwareUpgrades",
+            organizationId,
+            total_pages=total_pages,
+            direction=direction,
+            **kwargs,
+        )
 
     def getOrganizationFirmwareUpgradesByDevice(self, organizationId: str, total_pages=1, direction="next", **kwargs):
         """
@@ -4682,50 +1995,14 @@ class AsyncOrganizations:
         - limitPerDevice (integer): Optional parameter to limit the number of upgrade statuses returned per device. If omitted, a value of 5 is used.
         """
 
-        kwargs.update(locals())
-
-        metadata = {
-            "tags": ["organizations", "configure", "firmware", "upgrades", "byDevice"],
-            "operation": "getOrganizationFirmwareUpgradesByDevice",
-        }
-        organizationId = urllib.parse.quote(str(organizationId), safe="")
-        resource = f"/organizations/{organizationId}/firmware/upgrades/byDevice"
-
-        query_params = [
-            "perPage",
-            "startingAfter",
-            "endingBefore",
-            "networkIds",
-            "serials",
-            "macs",
-            "firmwareUpgradeBatchIds",
-            "upgradeStatuses",
-            "currentUpgradesOnly",
-            "limitPerDevice",
-        ]
-        params = {k.strip(): v for k, v in kwargs.items() if k.strip() in query_params}
-
-        array_params = [
-            "networkIds",
-            "serials",
-            "macs",
-            "firmwareUpgradeBatchIds",
-            "upgradeStatuses",
-        ]
-        for k, v in kwargs.items():
-            if k.strip() in array_params:
-                params[f"{k.strip()}[]"] = kwargs[f"{k}"]
-                params.pop(k.strip())
-
-        if self._session._validate_kwargs:
-            all_params = query_params + array_params
-            invalid = [k for k in kwargs if k.strip() not in all_params and k != "self"]
-            if invalid and self._session._logger:
-                self._session._logger.warning(
-                    f"getOrganizationFirmwareUpgradesByDevice: ignoring unrecognized kwargs: {invalid}"
-                )
-
-        return self._session.get_pages(metadata, resource, params, total_pages, direction)
+        return dispatch.call(
+            self._session,
+            "getOrganizationFirmwareUpgradesByDevice",
+            organizationId,
+            total_pages=total_pages,
+            direction=direction,
+            **kwargs,
+        )
 
     def getOrganizationFloorPlansAutoLocateDevices(self, organizationId: str, total_pages=1, direction="next", **kwargs):
         """
@@ -4742,42 +2019,14 @@ class AsyncOrganizations:
         - floorPlanIds (array): Optional parameter to filter devices by one or more floorplan IDs
         """
 
-        kwargs.update(locals())
-
-        metadata = {
-            "tags": ["organizations", "configure", "floorPlans", "autoLocate", "devices"],
-            "operation": "getOrganizationFloorPlansAutoLocateDevices",
-        }
-        organizationId = urllib.parse.quote(str(organizationId), safe="")
-        resource = f"/organizations/{organizationId}/floorPlans/autoLocate/devices"
-
-        query_params = [
-            "perPage",
-            "startingAfter",
-            "endingBefore",
-            "networkIds",
-            "floorPlanIds",
-        ]
-        params = {k.strip(): v for k, v in kwargs.items() if k.strip() in query_params}
-
-        array_params = [
-            "networkIds",
-            "floorPlanIds",
-        ]
-        for k, v in kwargs.items():
-            if k.strip() in array_params:
-                params[f"{k.strip()}[]"] = kwargs[f"{k}"]
-                params.pop(k.strip())
-
-        if self._session._validate_kwargs:
-            all_params = query_params + array_params
-            invalid = [k for k in kwargs if k.strip() not in all_params and k != "self"]
-            if invalid and self._session._logger:
-                self._session._logger.warning(
-                    f"getOrganizationFloorPlansAutoLocateDevices: ignoring unrecognized kwargs: {invalid}"
-                )
-
-        return self._session.get_pages(metadata, resource, params, total_pages, direction)
+        return dispatch.call(
+            self._session,
+            "getOrganizationFloorPlansAutoLocateDevices",
+            organizationId,
+            total_pages=total_pages,
+            direction=direction,
+            **kwargs,
+        )
 
     def getOrganizationFloorPlansAutoLocateStatuses(self, organizationId: str, total_pages=1, direction="next", **kwargs):
         """
@@ -4794,42 +2043,14 @@ class AsyncOrganizations:
         - floorPlanIds (array): Optional parameter to filter floorplans by one or more floorplan IDs
         """
 
-        kwargs.update(locals())
-
-        metadata = {
-            "tags": ["organizations", "configure", "floorPlans", "autoLocate", "statuses"],
-            "operation": "getOrganizationFloorPlansAutoLocateStatuses",
-        }
-        organizationId = urllib.parse.quote(str(organizationId), safe="")
-        resource = f"/organizations/{organizationId}/floorPlans/autoLocate/statuses"
-
-        query_params = [
-            "perPage",
-            "startingAfter",
-            "endingBefore",
-            "networkIds",
-            "floorPlanIds",
-        ]
-        params = {k.strip(): v for k, v in kwargs.items() if k.strip() in query_params}
-
-        array_params = [
-            "networkIds",
-            "floorPlanIds",
-        ]
-        for k, v in kwargs.items():
-            if k.strip() in array_params:
-                params[f"{k.strip()}[]"] = kwargs[f"{k}"]
-                params.pop(k.strip())
-
-        if self._session._validate_kwargs:
-            all_params = query_params + array_params
-            invalid = [k for k in kwargs if k.strip() not in all_params and k != "self"]
-            if invalid and self._session._logger:
-                self._session._logger.warning(
-                    f"getOrganizationFloorPlansAutoLocateStatuses: ignoring unrecognized kwargs: {invalid}"
-                )
-
-        return self._session.get_pages(metadata, resource, params, total_pages, direction)
+        return dispatch.call(
+            self._session,
+            "getOrganizationFloorPlansAutoLocateStatuses",
+            organizationId,
+            total_pages=total_pages,
+            direction=direction,
+            **kwargs,
+        )
 
     def getOrganizationIntegrationsDeployable(self, organizationId: str):
         """
@@ -4839,14 +2060,7 @@ class AsyncOrganizations:
         - organizationId (string): Organization ID
         """
 
-        metadata = {
-            "tags": ["organizations", "configure", "integrations", "deployable"],
-            "operation": "getOrganizationIntegrationsDeployable",
-        }
-        organizationId = urllib.parse.quote(str(organizationId), safe="")
-        resource = f"/organizations/{organizationId}/integrations/deployable"
-
-        return self._session.get(metadata, resource)
+        return dispatch.call(self._session, "getOrganizationIntegrationsDeployable", organizationId)
 
     def getOrganizationIntegrationsDeployed(self, organizationId: str):
         """
@@ -4856,14 +2070,7 @@ class AsyncOrganizations:
         - organizationId (string): Organization ID
         """
 
-        metadata = {
-            "tags": ["organizations", "configure", "integrations", "deployed"],
-            "operation": "getOrganizationIntegrationsDeployed",
-        }
-        organizationId = urllib.parse.quote(str(organizationId), safe="")
-        resource = f"/organizations/{organizationId}/integrations/deployed"
-
-        return self._session.get(metadata, resource)
+        return dispatch.call(self._session, "getOrganizationIntegrationsDeployed", organizationId)
 
     def getOrganizationIntegrationsXdrNetworks(self, organizationId: str, total_pages=1, direction="next", **kwargs):
         """
@@ -4879,40 +2086,14 @@ class AsyncOrganizations:
         - endingBefore (string): A token used by the server to indicate the end of the page. Often this is a timestamp or an ID but it is not limited to those. This parameter should not be defined by client applications. The link for the first, last, prev, or next page in the HTTP Link header should define it.
         """
 
-        kwargs.update(locals())
-
-        metadata = {
-            "tags": ["organizations", "configure", "integrations", "xdr", "networks"],
-            "operation": "getOrganizationIntegrationsXdrNetworks",
-        }
-        organizationId = urllib.parse.quote(str(organizationId), safe="")
-        resource = f"/organizations/{organizationId}/integrations/xdr/networks"
-
-        query_params = [
-            "networkIds",
-            "perPage",
-            "startingAfter",
-            "endingBefore",
-        ]
-        params = {k.strip(): v for k, v in kwargs.items() if k.strip() in query_params}
-
-        array_params = [
-            "networkIds",
-        ]
-        for k, v in kwargs.items():
-            if k.strip() in array_params:
-                params[f"{k.strip()}[]"] = kwargs[f"{k}"]
-                params.pop(k.strip())
-
-        if self._session._validate_kwargs:
-            all_params = query_params + array_params
-            invalid = [k for k in kwargs if k.strip() not in all_params and k != "self"]
-            if invalid and self._session._logger:
-                self._session._logger.warning(
-                    f"getOrganizationIntegrationsXdrNetworks: ignoring unrecognized kwargs: {invalid}"
-                )
-
-        return self._session.get_pages(metadata, resource, params, total_pages, direction)
+        return dispatch.call(
+            self._session,
+            "getOrganizationIntegrationsXdrNetworks",
+            organizationId,
+            total_pages=total_pages,
+            direction=direction,
+            **kwargs,
+        )
 
     def disableOrganizationIntegrationsXdrNetworks(self, organizationId: str, networks: list, **kwargs):
         """
@@ -4923,29 +2104,7 @@ class AsyncOrganizations:
         - networks (array): List containing the network ID and the product type to disable XDR on
         """
 
-        kwargs = locals()
-
-        metadata = {
-            "tags": ["organizations", "configure", "integrations", "xdr", "networks"],
-            "operation": "disableOrganizationIntegrationsXdrNetworks",
-        }
-        organizationId = urllib.parse.quote(str(organizationId), safe="")
-        resource = f"/organizations/{organizationId}/integrations/xdr/networks/disable"
-
-        body_params = [
-            "networks",
-        ]
-        payload = {k.strip(): v for k, v in kwargs.items() if k.strip() in body_params}
-
-        if self._session._validate_kwargs:
-            all_params = [] + body_params
-            invalid = [k for k in kwargs if k.strip() not in all_params and k != "self"]
-            if invalid and self._session._logger:
-                self._session._logger.warning(
-                    f"disableOrganizationIntegrationsXdrNetworks: ignoring unrecognized kwargs: {invalid}"
-                )
-
-        return self._session.post(metadata, resource, payload)
+        return dispatch.call(self._session, "disableOrganizationIntegrationsXdrNetworks", organizationId, networks, **kwargs)
 
     def enableOrganizationIntegrationsXdrNetworks(self, organizationId: str, networks: list, **kwargs):
         """
@@ -4956,29 +2115,7 @@ class AsyncOrganizations:
         - networks (array): List containing the network ID and the product type to enable XDR on
         """
 
-        kwargs = locals()
-
-        metadata = {
-            "tags": ["organizations", "configure", "integrations", "xdr", "networks"],
-            "operation": "enableOrganizationIntegrationsXdrNetworks",
-        }
-        organizationId = urllib.parse.quote(str(organizationId), safe="")
-        resource = f"/organizations/{organizationId}/integrations/xdr/networks/enable"
-
-        body_params = [
-            "networks",
-        ]
-        payload = {k.strip(): v for k, v in kwargs.items() if k.strip() in body_params}
-
-        if self._session._validate_kwargs:
-            all_params = [] + body_params
-            invalid = [k for k in kwargs if k.strip() not in all_params and k != "self"]
-            if invalid and self._session._logger:
-                self._session._logger.warning(
-                    f"enableOrganizationIntegrationsXdrNetworks: ignoring unrecognized kwargs: {invalid}"
-                )
-
-        return self._session.post(metadata, resource, payload)
+        return dispatch.call(self._session, "enableOrganizationIntegrationsXdrNetworks", organizationId, networks, **kwargs)
 
     def claimIntoOrganizationInventory(self, organizationId: str, **kwargs):
         """
@@ -4991,29 +2128,7 @@ class AsyncOrganizations:
         - licenses (array): The licenses that should be claimed
         """
 
-        kwargs.update(locals())
-
-        metadata = {
-            "tags": ["organizations", "configure", "inventory"],
-            "operation": "claimIntoOrganizationInventory",
-        }
-        organizationId = urllib.parse.quote(str(organizationId), safe="")
-        resource = f"/organizations/{organizationId}/inventory/claim"
-
-        body_params = [
-            "orders",
-            "serials",
-            "licenses",
-        ]
-        payload = {k.strip(): v for k, v in kwargs.items() if k.strip() in body_params}
-
-        if self._session._validate_kwargs:
-            all_params = [] + body_params
-            invalid = [k for k in kwargs if k.strip() not in all_params and k != "self"]
-            if invalid and self._session._logger:
-                self._session._logger.warning(f"claimIntoOrganizationInventory: ignoring unrecognized kwargs: {invalid}")
-
-        return self._session.post(metadata, resource, payload)
+        return dispatch.call(self._session, "claimIntoOrganizationInventory", organizationId, **kwargs)
 
     def getOrganizationInventoryDevices(self, organizationId: str, total_pages=1, direction="next", **kwargs):
         """
@@ -5039,66 +2154,14 @@ class AsyncOrganizations:
         - eoxStatuses (array): Filter devices by EoX status. Accepted values are 'endOfSale', 'endOfSupport', 'nearEndOfSupport', or 'null'. Use 'null' to filter for devices with no EOX data. Supports multiple values for multi-select filtering.
         """
 
-        kwargs.update(locals())
-
-        if "usedState" in kwargs:
-            options = ["unused", "used"]
-            assert kwargs["usedState"] in options, (
-                f'''"usedState" cannot be "{kwargs["usedState"]}", & must be set to one of: {options}'''
-            )
-        if "tagsFilterType" in kwargs:
-            options = ["withAllTags", "withAnyTags"]
-            assert kwargs["tagsFilterType"] in options, (
-                f'''"tagsFilterType" cannot be "{kwargs["tagsFilterType"]}", & must be set to one of: {options}'''
-            )
-
-        metadata = {
-            "tags": ["organizations", "configure", "inventory", "devices"],
-            "operation": "getOrganizationInventoryDevices",
-        }
-        organizationId = urllib.parse.quote(str(organizationId), safe="")
-        resource = f"/organizations/{organizationId}/inventory/devices"
-
-        query_params = [
-            "perPage",
-            "startingAfter",
-            "endingBefore",
-            "usedState",
-            "search",
-            "macs",
-            "networkIds",
-            "serials",
-            "models",
-            "orderNumbers",
-            "tags",
-            "tagsFilterType",
-            "productTypes",
-            "eoxStatuses",
-        ]
-        params = {k.strip(): v for k, v in kwargs.items() if k.strip() in query_params}
-
-        array_params = [
-            "macs",
-            "networkIds",
-            "serials",
-            "models",
-            "orderNumbers",
-            "tags",
-            "productTypes",
-            "eoxStatuses",
-        ]
-        for k, v in kwargs.items():
-            if k.strip() in array_params:
-                params[f"{k.strip()}[]"] = kwargs[f"{k}"]
-                params.pop(k.strip())
-
-        if self._session._validate_kwargs:
-            all_params = query_params + array_params
-            invalid = [k for k in kwargs if k.strip() not in all_params and k != "self"]
-            if invalid and self._session._logger:
-                self._session._logger.warning(f"getOrganizationInventoryDevices: ignoring unrecognized kwargs: {invalid}")
-
-        return self._session.get_pages(metadata, resource, params, total_pages, direction)
+        return dispatch.call(
+            self._session,
+            "getOrganizationInventoryDevices",
+            organizationId,
+            total_pages=total_pages,
+            direction=direction,
+            **kwargs,
+        )
 
     def getOrganizationInventoryDevicesEoxOverview(self, organizationId: str):
         """
@@ -5108,14 +2171,7 @@ class AsyncOrganizations:
         - organizationId (string): Organization ID
         """
 
-        metadata = {
-            "tags": ["organizations", "configure", "inventory", "devices", "eox"],
-            "operation": "getOrganizationInventoryDevicesEoxOverview",
-        }
-        organizationId = urllib.parse.quote(str(organizationId), safe="")
-        resource = f"/organizations/{organizationId}/inventory/devices/eox/overview"
-
-        return self._session.get(metadata, resource)
+        return dispatch.call(self._session, "getOrganizationInventoryDevicesEoxOverview", organizationId)
 
     def createOrganizationInventoryDevicesSwapsBulk(self, organizationId: str, swaps: list, **kwargs):
         """
@@ -5126,29 +2182,7 @@ class AsyncOrganizations:
         - swaps (array): List of replacments to perform
         """
 
-        kwargs = locals()
-
-        metadata = {
-            "tags": ["organizations", "configure", "inventory", "devices", "swaps", "bulk"],
-            "operation": "createOrganizationInventoryDevicesSwapsBulk",
-        }
-        organizationId = urllib.parse.quote(str(organizationId), safe="")
-        resource = f"/organizations/{organizationId}/inventory/devices/swaps/bulk"
-
-        body_params = [
-            "swaps",
-        ]
-        payload = {k.strip(): v for k, v in kwargs.items() if k.strip() in body_params}
-
-        if self._session._validate_kwargs:
-            all_params = [] + body_params
-            invalid = [k for k in kwargs if k.strip() not in all_params and k != "self"]
-            if invalid and self._session._logger:
-                self._session._logger.warning(
-                    f"createOrganizationInventoryDevicesSwapsBulk: ignoring unrecognized kwargs: {invalid}"
-                )
-
-        return self._session.post(metadata, resource, payload)
+        return dispatch.call(self._session, "createOrganizationInventoryDevicesSwapsBulk", organizationId, swaps, **kwargs)
 
     def getOrganizationInventoryDevicesSwapsBulk(self, organizationId: str, id: str):
         """
@@ -5159,15 +2193,7 @@ class AsyncOrganizations:
         - id (string): ID
         """
 
-        metadata = {
-            "tags": ["organizations", "configure", "inventory", "devices", "swaps", "bulk"],
-            "operation": "getOrganizationInventoryDevicesSwapsBulk",
-        }
-        organizationId = urllib.parse.quote(str(organizationId), safe="")
-        id = urllib.parse.quote(str(id), safe="")
-        resource = f"/organizations/{organizationId}/inventory/devices/swaps/bulk/{id}"
-
-        return self._session.get(metadata, resource)
+        return dispatch.call(self._session, "getOrganizationInventoryDevicesSwapsBulk", organizationId, id)
 
     def getOrganizationInventoryDevice(self, organizationId: str, serial: str):
         """
@@ -5178,15 +2204,7 @@ class AsyncOrganizations:
         - serial (string): Serial
         """
 
-        metadata = {
-            "tags": ["organizations", "configure", "inventory", "devices"],
-            "operation": "getOrganizationInventoryDevice",
-        }
-        organizationId = urllib.parse.quote(str(organizationId), safe="")
-        serial = urllib.parse.quote(str(serial), safe="")
-        resource = f"/organizations/{organizationId}/inventory/devices/{serial}"
-
-        return self._session.get(metadata, resource)
+        return dispatch.call(self._session, "getOrganizationInventoryDevice", organizationId, serial)
 
     def claimOrganizationInventoryOrders(self, organizationId: str, claimId: str, **kwargs):
         """
@@ -5198,28 +2216,7 @@ class AsyncOrganizations:
         - subscriptions (array): The individual subscriptions to claim
         """
 
-        kwargs.update(locals())
-
-        metadata = {
-            "tags": ["organizations", "configure", "inventory", "orders"],
-            "operation": "claimOrganizationInventoryOrders",
-        }
-        organizationId = urllib.parse.quote(str(organizationId), safe="")
-        resource = f"/organizations/{organizationId}/inventory/orders/claim"
-
-        body_params = [
-            "claimId",
-            "subscriptions",
-        ]
-        payload = {k.strip(): v for k, v in kwargs.items() if k.strip() in body_params}
-
-        if self._session._validate_kwargs:
-            all_params = [] + body_params
-            invalid = [k for k in kwargs if k.strip() not in all_params and k != "self"]
-            if invalid and self._session._logger:
-                self._session._logger.warning(f"claimOrganizationInventoryOrders: ignoring unrecognized kwargs: {invalid}")
-
-        return self._session.post(metadata, resource, payload)
+        return dispatch.call(self._session, "claimOrganizationInventoryOrders", organizationId, claimId, **kwargs)
 
     def previewOrganizationInventoryOrders(self, organizationId: str, claimId: str, **kwargs):
         """
@@ -5230,27 +2227,7 @@ class AsyncOrganizations:
         - claimId (string): The unique order claim id
         """
 
-        kwargs = locals()
-
-        metadata = {
-            "tags": ["organizations", "configure", "inventory", "orders"],
-            "operation": "previewOrganizationInventoryOrders",
-        }
-        organizationId = urllib.parse.quote(str(organizationId), safe="")
-        resource = f"/organizations/{organizationId}/inventory/orders/preview"
-
-        body_params = [
-            "claimId",
-        ]
-        payload = {k.strip(): v for k, v in kwargs.items() if k.strip() in body_params}
-
-        if self._session._validate_kwargs:
-            all_params = [] + body_params
-            invalid = [k for k in kwargs if k.strip() not in all_params and k != "self"]
-            if invalid and self._session._logger:
-                self._session._logger.warning(f"previewOrganizationInventoryOrders: ignoring unrecognized kwargs: {invalid}")
-
-        return self._session.post(metadata, resource, payload)
+        return dispatch.call(self._session, "previewOrganizationInventoryOrders", organizationId, claimId, **kwargs)
 
     def releaseFromOrganizationInventory(self, organizationId: str, **kwargs):
         """
@@ -5261,27 +2238,7 @@ class AsyncOrganizations:
         - serials (array): Serials of the devices that should be released
         """
 
-        kwargs.update(locals())
-
-        metadata = {
-            "tags": ["organizations", "configure", "inventory"],
-            "operation": "releaseFromOrganizationInventory",
-        }
-        organizationId = urllib.parse.quote(str(organizationId), safe="")
-        resource = f"/organizations/{organizationId}/inventory/release"
-
-        body_params = [
-            "serials",
-        ]
-        payload = {k.strip(): v for k, v in kwargs.items() if k.strip() in body_params}
-
-        if self._session._validate_kwargs:
-            all_params = [] + body_params
-            invalid = [k for k in kwargs if k.strip() not in all_params and k != "self"]
-            if invalid and self._session._logger:
-                self._session._logger.warning(f"releaseFromOrganizationInventory: ignoring unrecognized kwargs: {invalid}")
-
-        return self._session.post(metadata, resource, payload)
+        return dispatch.call(self._session, "releaseFromOrganizationInventory", organizationId, **kwargs)
 
     def getOrganizationLicenses(self, organizationId: str, total_pages=1, direction="next", **kwargs):
         """
@@ -5299,36 +2256,9 @@ class AsyncOrganizations:
         - state (string): Filter the licenses to those in a particular state. Can be one of 'active', 'expired', 'expiring', 'recentlyQueued', 'unused' or 'unusedActive'
         """
 
-        kwargs.update(locals())
-
-        if "state" in kwargs:
-            options = ["active", "expired", "expiring", "recentlyQueued", "unused", "unusedActive"]
-            assert kwargs["state"] in options, f'''"state" cannot be "{kwargs["state"]}", & must be set to one of: {options}'''
-
-        metadata = {
-            "tags": ["organizations", "configure", "licenses"],
-            "operation": "getOrganizationLicenses",
-        }
-        organizationId = urllib.parse.quote(str(organizationId), safe="")
-        resource = f"/organizations/{organizationId}/licenses"
-
-        query_params = [
-            "perPage",
-            "startingAfter",
-            "endingBefore",
-            "deviceSerial",
-            "networkId",
-            "state",
-        ]
-        params = {k.strip(): v for k, v in kwargs.items() if k.strip() in query_params}
-
-        if self._session._validate_kwargs:
-            all_params = query_params
-            invalid = [k for k in kwargs if k.strip() not in all_params and k != "self"]
-            if invalid and self._session._logger:
-                self._session._logger.warning(f"getOrganizationLicenses: ignoring unrecognized kwargs: {invalid}")
-
-        return self._session.get_pages(metadata, resource, params, total_pages, direction)
+        return dispatch.call(
+            self._session, "getOrganizationLicenses", organizationId, total_pages=total_pages, direction=direction, **kwargs
+        )
 
     def assignOrganizationLicensesSeats(self, organizationId: str, licenseId: str, networkId: str, seatCount: int, **kwargs):
         """
@@ -5341,29 +2271,9 @@ class AsyncOrganizations:
         - seatCount (integer): The number of seats to assign to the SM network. Must be less than or equal to the total number of seats of the license
         """
 
-        kwargs = locals()
-
-        metadata = {
-            "tags": ["organizations", "configure", "licenses"],
-            "operation": "assignOrganizationLicensesSeats",
-        }
-        organizationId = urllib.parse.quote(str(organizationId), safe="")
-        resource = f"/organizations/{organizationId}/licenses/assignSeats"
-
-        body_params = [
-            "licenseId",
-            "networkId",
-            "seatCount",
-        ]
-        payload = {k.strip(): v for k, v in kwargs.items() if k.strip() in body_params}
-
-        if self._session._validate_kwargs:
-            all_params = [] + body_params
-            invalid = [k for k in kwargs if k.strip() not in all_params and k != "self"]
-            if invalid and self._session._logger:
-                self._session._logger.warning(f"assignOrganizationLicensesSeats: ignoring unrecognized kwargs: {invalid}")
-
-        return self._session.post(metadata, resource, payload)
+        return dispatch.call(
+            self._session, "assignOrganizationLicensesSeats", organizationId, licenseId, networkId, seatCount, **kwargs
+        )
 
     def moveOrganizationLicenses(self, organizationId: str, destOrganizationId: str, licenseIds: list, **kwargs):
         """
@@ -5375,28 +2285,9 @@ class AsyncOrganizations:
         - licenseIds (array): A list of IDs of licenses to move to the new organization
         """
 
-        kwargs = locals()
-
-        metadata = {
-            "tags": ["organizations", "configure", "licenses"],
-            "operation": "moveOrganizationLicenses",
-        }
-        organizationId = urllib.parse.quote(str(organizationId), safe="")
-        resource = f"/organizations/{organizationId}/licenses/move"
-
-        body_params = [
-            "destOrganizationId",
-            "licenseIds",
-        ]
-        payload = {k.strip(): v for k, v in kwargs.items() if k.strip() in body_params}
-
-        if self._session._validate_kwargs:
-            all_params = [] + body_params
-            invalid = [k for k in kwargs if k.strip() not in all_params and k != "self"]
-            if invalid and self._session._logger:
-                self._session._logger.warning(f"moveOrganizationLicenses: ignoring unrecognized kwargs: {invalid}")
-
-        return self._session.post(metadata, resource, payload)
+        return dispatch.call(
+            self._session, "moveOrganizationLicenses", organizationId, destOrganizationId, licenseIds, **kwargs
+        )
 
     def moveOrganizationLicensesSeats(
         self, organizationId: str, destOrganizationId: str, licenseId: str, seatCount: int, **kwargs
@@ -5411,29 +2302,9 @@ class AsyncOrganizations:
         - seatCount (integer): The number of seats to move to the new organization. Must be less than or equal to the total number of seats of the license
         """
 
-        kwargs = locals()
-
-        metadata = {
-            "tags": ["organizations", "configure", "licenses"],
-            "operation": "moveOrganizationLicensesSeats",
-        }
-        organizationId = urllib.parse.quote(str(organizationId), safe="")
-        resource = f"/organizations/{organizationId}/licenses/moveSeats"
-
-        body_params = [
-            "destOrganizationId",
-            "licenseId",
-            "seatCount",
-        ]
-        payload = {k.strip(): v for k, v in kwargs.items() if k.strip() in body_params}
-
-        if self._session._validate_kwargs:
-            all_params = [] + body_params
-            invalid = [k for k in kwargs if k.strip() not in all_params and k != "self"]
-            if invalid and self._session._logger:
-                self._session._logger.warning(f"moveOrganizationLicensesSeats: ignoring unrecognized kwargs: {invalid}")
-
-        return self._session.post(metadata, resource, payload)
+        return dispatch.call(
+            self._session, "moveOrganizationLicensesSeats", organizationId, destOrganizationId, licenseId, seatCount, **kwargs
+        )
 
     def getOrganizationLicensesOverview(self, organizationId: str):
         """
@@ -5443,14 +2314,7 @@ class AsyncOrganizations:
         - organizationId (string): Organization ID
         """
 
-        metadata = {
-            "tags": ["organizations", "monitor", "licenses", "overview"],
-            "operation": "getOrganizationLicensesOverview",
-        }
-        organizationId = urllib.parse.quote(str(organizationId), safe="")
-        resource = f"/organizations/{organizationId}/licenses/overview"
-
-        return self._session.get(metadata, resource)
+        return dispatch.call(self._session, "getOrganizationLicensesOverview", organizationId)
 
     def renewOrganizationLicensesSeats(self, organizationId: str, licenseIdToRenew: str, unusedLicenseId: str, **kwargs):
         """
@@ -5462,28 +2326,9 @@ class AsyncOrganizations:
         - unusedLicenseId (string): The SM license to use to renew the seats on 'licenseIdToRenew'. This license must have at least as many seats available as there are seats on 'licenseIdToRenew'
         """
 
-        kwargs = locals()
-
-        metadata = {
-            "tags": ["organizations", "configure", "licenses"],
-            "operation": "renewOrganizationLicensesSeats",
-        }
-        organizationId = urllib.parse.quote(str(organizationId), safe="")
-        resource = f"/organizations/{organizationId}/licenses/renewSeats"
-
-        body_params = [
-            "licenseIdToRenew",
-            "unusedLicenseId",
-        ]
-        payload = {k.strip(): v for k, v in kwargs.items() if k.strip() in body_params}
-
-        if self._session._validate_kwargs:
-            all_params = [] + body_params
-            invalid = [k for k in kwargs if k.strip() not in all_params and k != "self"]
-            if invalid and self._session._logger:
-                self._session._logger.warning(f"renewOrganizationLicensesSeats: ignoring unrecognized kwargs: {invalid}")
-
-        return self._session.post(metadata, resource, payload)
+        return dispatch.call(
+            self._session, "renewOrganizationLicensesSeats", organizationId, licenseIdToRenew, unusedLicenseId, **kwargs
+        )
 
     def getOrganizationLicense(self, organizationId: str, licenseId: str):
         """
@@ -5494,15 +2339,7 @@ class AsyncOrganizations:
         - licenseId (string): License ID
         """
 
-        metadata = {
-            "tags": ["organizations", "configure", "licenses"],
-            "operation": "getOrganizationLicense",
-        }
-        organizationId = urllib.parse.quote(str(organizationId), safe="")
-        licenseId = urllib.parse.quote(str(licenseId), safe="")
-        resource = f"/organizations/{organizationId}/licenses/{licenseId}"
-
-        return self._session.get(metadata, resource)
+        return dispatch.call(self._session, "getOrganizationLicense", organizationId, licenseId)
 
     def updateOrganizationLicense(self, organizationId: str, licenseId: str, **kwargs):
         """
@@ -5514,28 +2351,7 @@ class AsyncOrganizations:
         - deviceSerial (string): The serial number of the device to assign this license to. Set this to  null to unassign the license. If a different license is already active on the device, this parameter will control queueing/dequeuing this license.
         """
 
-        kwargs.update(locals())
-
-        metadata = {
-            "tags": ["organizations", "configure", "licenses"],
-            "operation": "updateOrganizationLicense",
-        }
-        organizationId = urllib.parse.quote(str(organizationId), safe="")
-        licenseId = urllib.parse.quote(str(licenseId), safe="")
-        resource = f"/organizations/{organizationId}/licenses/{licenseId}"
-
-        body_params = [
-            "deviceSerial",
-        ]
-        payload = {k.strip(): v for k, v in kwargs.items() if k.strip() in body_params}
-
-        if self._session._validate_kwargs:
-            all_params = [] + body_params
-            invalid = [k for k in kwargs if k.strip() not in all_params and k != "self"]
-            if invalid and self._session._logger:
-                self._session._logger.warning(f"updateOrganizationLicense: ignoring unrecognized kwargs: {invalid}")
-
-        return self._session.put(metadata, resource, payload)
+        return dispatch.call(self._session, "updateOrganizationLicense", organizationId, licenseId, **kwargs)
 
     def getOrganizationLoginSecurity(self, organizationId: str):
         """
@@ -5545,14 +2361,7 @@ class AsyncOrganizations:
         - organizationId (string): Organization ID
         """
 
-        metadata = {
-            "tags": ["organizations", "configure", "loginSecurity"],
-            "operation": "getOrganizationLoginSecurity",
-        }
-        organizationId = urllib.parse.quote(str(organizationId), safe="")
-        resource = f"/organizations/{organizationId}/loginSecurity"
-
-        return self._session.get(metadata, resource)
+        return dispatch.call(self._session, "getOrganizationLoginSecurity", organizationId)
 
     def updateOrganizationLoginSecurity(self, organizationId: str, **kwargs):
         """
@@ -5577,41 +2386,7 @@ class AsyncOrganizations:
         - apiAuthentication (object): Details for indicating whether organization will restrict access to API (but not Dashboard) to certain IP addresses.
         """
 
-        kwargs.update(locals())
-
-        metadata = {
-            "tags": ["organizations", "configure", "loginSecurity"],
-            "operation": "updateOrganizationLoginSecurity",
-        }
-        organizationId = urllib.parse.quote(str(organizationId), safe="")
-        resource = f"/organizations/{organizationId}/loginSecurity"
-
-        body_params = [
-            "enforcePasswordExpiration",
-            "passwordExpirationDays",
-            "enforceDifferentPasswords",
-            "numDifferentPasswords",
-            "enforceStrongPasswords",
-            "minimumPasswordLength",
-            "enforceAccountLockout",
-            "accountLockoutAttempts",
-            "enforceIdleTimeout",
-            "idleTimeoutMinutes",
-            "enforceTwoFactorAuth",
-            "enforceLoginIpRanges",
-            "loginIpRanges",
-            "enforceLockedIpSessions",
-            "apiAuthentication",
-        ]
-        payload = {k.strip(): v for k, v in kwargs.items() if k.strip() in body_params}
-
-        if self._session._validate_kwargs:
-            all_params = [] + body_params
-            invalid = [k for k in kwargs if k.strip() not in all_params and k != "self"]
-            if invalid and self._session._logger:
-                self._session._logger.warning(f"updateOrganizationLoginSecurity: ignoring unrecognized kwargs: {invalid}")
-
-        return self._session.put(metadata, resource, payload)
+        return dispatch.call(self._session, "updateOrganizationLoginSecurity", organizationId, **kwargs)
 
     def getOrganizationNetworks(self, organizationId: str, total_pages=1, direction="next", **kwargs):
         """
@@ -5631,49 +2406,9 @@ class AsyncOrganizations:
         - endingBefore (string): A token used by the server to indicate the end of the page. Often this is a timestamp or an ID but it is not limited to those. This parameter should not be defined by client applications. The link for the first, last, prev, or next page in the HTTP Link header should define it.
         """
 
-        kwargs.update(locals())
-
-        if "tagsFilterType" in kwargs:
-            options = ["withAllTags", "withAnyTags"]
-            assert kwargs["tagsFilterType"] in options, (
-                f'''"tagsFilterType" cannot be "{kwargs["tagsFilterType"]}", & must be set to one of: {options}'''
-            )
-
-        metadata = {
-            "tags": ["organizations", "configure", "networks"],
-            "operation": "getOrganizationNetworks",
-        }
-        organizationId = urllib.parse.quote(str(organizationId), safe="")
-        resource = f"/organizations/{organizationId}/networks"
-
-        query_params = [
-            "configTemplateId",
-            "isBoundToConfigTemplate",
-            "tags",
-            "tagsFilterType",
-            "productTypes",
-            "perPage",
-            "startingAfter",
-            "endingBefore",
-        ]
-        params = {k.strip(): v for k, v in kwargs.items() if k.strip() in query_params}
-
-        array_params = [
-            "tags",
-            "productTypes",
-        ]
-        for k, v in kwargs.items():
-            if k.strip() in array_params:
-                params[f"{k.strip()}[]"] = kwargs[f"{k}"]
-                params.pop(k.strip())
-
-        if self._session._validate_kwargs:
-            all_params = query_params + array_params
-            invalid = [k for k in kwargs if k.strip() not in all_params and k != "self"]
-            if invalid and self._session._logger:
-                self._session._logger.warning(f"getOrganizationNetworks: ignoring unrecognized kwargs: {invalid}")
-
-        return self._session.get_pages(metadata, resource, params, total_pages, direction)
+        return dispatch.call(
+            self._session, "getOrganizationNetworks", organizationId, total_pages=total_pages, direction=direction, **kwargs
+        )
 
     def createOrganizationNetwork(self, organizationId: str, name: str, productTypes: list, **kwargs):
         """
@@ -5689,32 +2424,7 @@ class AsyncOrganizations:
         - notes (string): Add any notes or additional information about this network here.
         """
 
-        kwargs.update(locals())
-
-        metadata = {
-            "tags": ["organizations", "configure", "networks"],
-            "operation": "createOrganizationNetwork",
-        }
-        organizationId = urllib.parse.quote(str(organizationId), safe="")
-        resource = f"/organizations/{organizationId}/networks"
-
-        body_params = [
-            "name",
-            "productTypes",
-            "tags",
-            "timeZone",
-            "copyFromNetworkId",
-            "notes",
-        ]
-        payload = {k.strip(): v for k, v in kwargs.items() if k.strip() in body_params}
-
-        if self._session._validate_kwargs:
-            all_params = [] + body_params
-            invalid = [k for k in kwargs if k.strip() not in all_params and k != "self"]
-            if invalid and self._session._logger:
-                self._session._logger.warning(f"createOrganizationNetwork: ignoring unrecognized kwargs: {invalid}")
-
-        return self._session.post(metadata, resource, payload)
+        return dispatch.call(self._session, "createOrganizationNetwork", organizationId, name, productTypes, **kwargs)
 
     def combineOrganizationNetworks(self, organizationId: str, name: str, networkIds: list, **kwargs):
         """
@@ -5727,29 +2437,7 @@ class AsyncOrganizations:
         - enrollmentString (string): A unique identifier which can be used for device enrollment or easy access through the Meraki SM Registration page or the Self Service Portal. Please note that changing this field may cause existing bookmarks to break. All networks that are part of this combined network will have their enrollment string appended by '-network_type'. If left empty, all exisitng enrollment strings will be deleted.
         """
 
-        kwargs.update(locals())
-
-        metadata = {
-            "tags": ["organizations", "configure", "networks"],
-            "operation": "combineOrganizationNetworks",
-        }
-        organizationId = urllib.parse.quote(str(organizationId), safe="")
-        resource = f"/organizations/{organizationId}/networks/combine"
-
-        body_params = [
-            "name",
-            "networkIds",
-            "enrollmentString",
-        ]
-        payload = {k.strip(): v for k, v in kwargs.items() if k.strip() in body_params}
-
-        if self._session._validate_kwargs:
-            all_params = [] + body_params
-            invalid = [k for k in kwargs if k.strip() not in all_params and k != "self"]
-            if invalid and self._session._logger:
-                self._session._logger.warning(f"combineOrganizationNetworks: ignoring unrecognized kwargs: {invalid}")
-
-        return self._session.post(metadata, resource, payload)
+        return dispatch.call(self._session, "combineOrganizationNetworks", organizationId, name, networkIds, **kwargs)
 
     def createNetworkMove(self, organizationId: str, network: dict, organizations: dict, **kwargs):
         """
@@ -5762,29 +2450,7 @@ class AsyncOrganizations:
         - simulate (boolean): If true, simulates the network move and validates the operation without committing changes. The network will remain in the source organization.
         """
 
-        kwargs.update(locals())
-
-        metadata = {
-            "tags": ["organizations", "configure", "networks"],
-            "operation": "createNetworkMove",
-        }
-        organizationId = urllib.parse.quote(str(organizationId), safe="")
-        resource = f"/organizations/{organizationId}/networks/moves"
-
-        body_params = [
-            "network",
-            "organizations",
-            "simulate",
-        ]
-        payload = {k.strip(): v for k, v in kwargs.items() if k.strip() in body_params}
-
-        if self._session._validate_kwargs:
-            all_params = [] + body_params
-            invalid = [k for k in kwargs if k.strip() not in all_params and k != "self"]
-            if invalid and self._session._logger:
-                self._session._logger.warning(f"createNetworkMove: ignoring unrecognized kwargs: {invalid}")
-
-        return self._session.post(metadata, resource, payload)
+        return dispatch.call(self._session, "createNetworkMove", organizationId, network, organizations, **kwargs)
 
     def getNetworkMoves(self, organizationId: str, total_pages=1, direction="next", **kwargs):
         """
@@ -5800,38 +2466,9 @@ class AsyncOrganizations:
         - moveIds (array): Array of network move operation IDs to include. If not specified, all network moves will be returned.
         """
 
-        kwargs.update(locals())
-
-        metadata = {
-            "tags": ["organizations", "configure", "networks", "moves"],
-            "operation": "getNetworkMoves",
-        }
-        organizationId = urllib.parse.quote(str(organizationId), safe="")
-        resource = f"/organizations/{organizationId}/networks/moves"
-
-        query_params = [
-            "perPage",
-            "startingAfter",
-            "endingBefore",
-            "moveIds",
-        ]
-        params = {k.strip(): v for k, v in kwargs.items() if k.strip() in query_params}
-
-        array_params = [
-            "moveIds",
-        ]
-        for k, v in kwargs.items():
-            if k.strip() in array_params:
-                params[f"{k.strip()}[]"] = kwargs[f"{k}"]
-                params.pop(k.strip())
-
-        if self._session._validate_kwargs:
-            all_params = query_params + array_params
-            invalid = [k for k in kwargs if k.strip() not in all_params and k != "self"]
-            if invalid and self._session._logger:
-                self._session._logger.warning(f"getNetworkMoves: ignoring unrecognized kwargs: {invalid}")
-
-        return self._session.get_pages(metadata, resource, params, total_pages, direction)
+        return dispatch.call(
+            self._session, "getNetworkMoves", organizationId, total_pages=total_pages, direction=direction, **kwargs
+        )
 
     def getOrganizationOpenapiSpec(self, organizationId: str, **kwargs):
         """
@@ -5842,33 +2479,7 @@ class AsyncOrganizations:
         - version (integer): OpenAPI Specification version to return. Default is 2
         """
 
-        kwargs.update(locals())
-
-        if "version" in kwargs:
-            options = [2, 3]
-            assert kwargs["version"] in options, (
-                f'''"version" cannot be "{kwargs["version"]}", & must be set to one of: {options}'''
-            )
-
-        metadata = {
-            "tags": ["organizations", "monitor", "openapiSpec"],
-            "operation": "getOrganizationOpenapiSpec",
-        }
-        organizationId = urllib.parse.quote(str(organizationId), safe="")
-        resource = f"/organizations/{organizationId}/openapiSpec"
-
-        query_params = [
-            "version",
-        ]
-        params = {k.strip(): v for k, v in kwargs.items() if k.strip() in query_params}
-
-        if self._session._validate_kwargs:
-            all_params = query_params
-            invalid = [k for k in kwargs if k.strip() not in all_params and k != "self"]
-            if invalid and self._session._logger:
-                self._session._logger.warning(f"getOrganizationOpenapiSpec: ignoring unrecognized kwargs: {invalid}")
-
-        return self._session.get(metadata, resource, params)
+        return dispatch.call(self._session, "getOrganizationOpenapiSpec", organizationId, **kwargs)
 
     def getOrganizationPoliciesAssignmentsByClient(
         self, organizationId: str, networkIds: list, total_pages=1, direction="next", **kwargs
@@ -5889,43 +2500,15 @@ class AsyncOrganizations:
         - includeUndetectedClients (boolean): Include provisioned clients that have not associated to the network. Default: false
         """
 
-        kwargs.update(locals())
-
-        metadata = {
-            "tags": ["organizations", "configure", "policies", "assignments", "byClient"],
-            "operation": "getOrganizationPoliciesAssignmentsByClient",
-        }
-        organizationId = urllib.parse.quote(str(organizationId), safe="")
-        resource = f"/organizations/{organizationId}/policies/assignments/byClient"
-
-        query_params = [
-            "perPage",
-            "startingAfter",
-            "endingBefore",
-            "t0",
-            "timespan",
-            "includeUndetectedClients",
-            "networkIds",
-        ]
-        params = {k.strip(): v for k, v in kwargs.items() if k.strip() in query_params}
-
-        array_params = [
-            "networkIds",
-        ]
-        for k, v in kwargs.items():
-            if k.strip() in array_params:
-                params[f"{k.strip()}[]"] = kwargs[f"{k}"]
-                params.pop(k.strip())
-
-        if self._session._validate_kwargs:
-            all_params = query_params + array_params
-            invalid = [k for k in kwargs if k.strip() not in all_params and k != "self"]
-            if invalid and self._session._logger:
-                self._session._logger.warning(
-                    f"getOrganizationPoliciesAssignmentsByClient: ignoring unrecognized kwargs: {invalid}"
-                )
-
-        return self._session.get_pages(metadata, resource, params, total_pages, direction)
+        return dispatch.call(
+            self._session,
+            "getOrganizationPoliciesAssignmentsByClient",
+            organizationId,
+            networkIds,
+            total_pages=total_pages,
+            direction=direction,
+            **kwargs,
+        )
 
     def getOrganizationPoliciesGlobalFirewallApplicationCategories(self, organizationId: str):
         """
@@ -5935,14 +2518,7 @@ class AsyncOrganizations:
         - organizationId (string): Organization ID
         """
 
-        metadata = {
-            "tags": ["organizations", "configure", "policies", "global", "firewall", "applicationCategories"],
-            "operation": "getOrganizationPoliciesGlobalFirewallApplicationCategories",
-        }
-        organizationId = urllib.parse.quote(str(organizationId), safe="")
-        resource = f"/organizations/{organizationId}/policies/global/firewall/applicationCategories"
-
-        return self._session.get(metadata, resource)
+        return dispatch.call(self._session, "getOrganizationPoliciesGlobalFirewallApplicationCategories", organizationId)
 
     def getOrganizationPoliciesGlobalFirewallRulesets(self, organizationId: str, total_pages=1, direction="next", **kwargs):
         """
@@ -5959,41 +2535,14 @@ class AsyncOrganizations:
         - endingBefore (string): A token used by the server to indicate the end of the page. Often this is a timestamp or an ID but it is not limited to those. This parameter should not be defined by client applications. The link for the first, last, prev, or next page in the HTTP Link header should define it.
         """
 
-        kwargs.update(locals())
-
-        metadata = {
-            "tags": ["organizations", "configure", "policies", "global", "firewall", "rulesets"],
-            "operation": "getOrganizationPoliciesGlobalFirewallRulesets",
-        }
-        organizationId = urllib.parse.quote(str(organizationId), safe="")
-        resource = f"/organizations/{organizationId}/policies/global/firewall/rulesets"
-
-        query_params = [
-            "rulesetIds",
-            "name",
-            "perPage",
-            "startingAfter",
-            "endingBefore",
-        ]
-        params = {k.strip(): v for k, v in kwargs.items() if k.strip() in query_params}
-
-        array_params = [
-            "rulesetIds",
-        ]
-        for k, v in kwargs.items():
-            if k.strip() in array_params:
-                params[f"{k.strip()}[]"] = kwargs[f"{k}"]
-                params.pop(k.strip())
-
-        if self._session._validate_kwargs:
-            all_params = query_params + array_params
-            invalid = [k for k in kwargs if k.strip() not in all_params and k != "self"]
-            if invalid and self._session._logger:
-                self._session._logger.warning(
-                    f"getOrganizationPoliciesGlobalFirewallRulesets: ignoring unrecognized kwargs: {invalid}"
-                )
-
-        return self._session.get_pages(metadata, resource, params, total_pages, direction)
+        return dispatch.call(
+            self._session,
+            "getOrganizationPoliciesGlobalFirewallRulesets",
+            organizationId,
+            total_pages=total_pages,
+            direction=direction,
+            **kwargs,
+        )
 
     def createOrganizationPoliciesGlobalFirewallRuleset(self, organizationId: str, name: str, **kwargs):
         """
@@ -6005,30 +2554,7 @@ class AsyncOrganizations:
         - description (string): Description of the firewall ruleset
         """
 
-        kwargs.update(locals())
-
-        metadata = {
-            "tags": ["organizations", "configure", "policies", "global", "firewall", "rulesets"],
-            "operation": "createOrganizationPoliciesGlobalFirewallRuleset",
-        }
-        organizationId = urllib.parse.quote(str(organizationId), safe="")
-        resource = f"/organizations/{organizationId}/policies/global/firewall/rulesets"
-
-        body_params = [
-            "name",
-            "description",
-        ]
-        payload = {k.strip(): v for k, v in kwargs.items() if k.strip() in body_params}
-
-        if self._session._validate_kwargs:
-            all_params = [] + body_params
-            invalid = [k for k in kwargs if k.strip() not in all_params and k != "self"]
-            if invalid and self._session._logger:
-                self._session._logger.warning(
-                    f"createOrganizationPoliciesGlobalFirewallRuleset: ignoring unrecognized kwargs: {invalid}"
-                )
-
-        return self._session.post(metadata, resource, payload)
+        return dispatch.call(self._session, "createOrganizationPoliciesGlobalFirewallRuleset", organizationId, name, **kwargs)
 
     def createOrganizationPoliciesGlobalFirewallRulesetsRule(
         self, organizationId: str, name: str, rulesetId: str, policy: str, sources: dict, destinations: dict, **kwargs
@@ -6048,42 +2574,17 @@ class AsyncOrganizations:
         - description (string): Description of the firewall rule
         """
 
-        kwargs.update(locals())
-
-        if "policy" in kwargs:
-            options = ["allow", "deny"]
-            assert kwargs["policy"] in options, (
-                f'''"policy" cannot be "{kwargs["policy"]}", & must be set to one of: {options}'''
-            )
-
-        metadata = {
-            "tags": ["organizations", "configure", "policies", "global", "firewall", "rulesets", "rules"],
-            "operation": "createOrganizationPoliciesGlobalFirewallRulesetsRule",
-        }
-        organizationId = urllib.parse.quote(str(organizationId), safe="")
-        resource = f"/organizations/{organizationId}/policies/global/firewall/rulesets/rules"
-
-        body_params = [
-            "name",
-            "rulesetId",
-            "policy",
-            "enabled",
-            "priority",
-            "description",
-            "sources",
-            "destinations",
-        ]
-        payload = {k.strip(): v for k, v in kwargs.items() if k.strip() in body_params}
-
-        if self._session._validate_kwargs:
-            all_params = [] + body_params
-            invalid = [k for k in kwargs if k.strip() not in all_params and k != "self"]
-            if invalid and self._session._logger:
-                self._session._logger.warning(
-                    f"createOrganizationPoliciesGlobalFirewallRulesetsRule: ignoring unrecognized kwargs: {invalid}"
-                )
-
-        return self._session.post(metadata, resource, payload)
+        return dispatch.call(
+            self._session,
+            "createOrganizationPoliciesGlobalFirewallRulesetsRule",
+            organizationId,
+            name,
+            rulesetId,
+            policy,
+            sources,
+            destinations,
+            **kwargs,
+        )
 
     def getOrganizationPoliciesGlobalFirewallRulesetsRules(
         self, organizationId: str, total_pages=1, direction="next", **kwargs
@@ -6102,42 +2603,14 @@ class AsyncOrganizations:
         - endingBefore (string): A token used by the server to indicate the end of the page. Often this is a timestamp or an ID but it is not limited to those. This parameter should not be defined by client applications. The link for the first, last, prev, or next page in the HTTP Link header should define it.
         """
 
-        kwargs.update(locals())
-
-        metadata = {
-            "tags": ["organizations", "configure", "policies", "global", "firewall", "rulesets", "rules"],
-            "operation": "getOrganizationPoliciesGlobalFirewallRulesetsRules",
-        }
-        organizationId = urllib.parse.quote(str(organizationId), safe="")
-        resource = f"/organizations/{organizationId}/policies/global/firewall/rulesets/rules"
-
-        query_params = [
-            "rulesetIds",
-            "ruleIds",
-            "perPage",
-            "startingAfter",
-            "endingBefore",
-        ]
-        params = {k.strip(): v for k, v in kwargs.items() if k.strip() in query_params}
-
-        array_params = [
-            "rulesetIds",
-            "ruleIds",
-        ]
-        for k, v in kwargs.items():
-            if k.strip() in array_params:
-                params[f"{k.strip()}[]"] = kwargs[f"{k}"]
-                params.pop(k.strip())
-
-        if self._session._validate_kwargs:
-            all_params = query_params + array_params
-            invalid = [k for k in kwargs if k.strip() not in all_params and k != "self"]
-            if invalid and self._session._logger:
-                self._session._logger.warning(
-                    f"getOrganizationPoliciesGlobalFirewallRulesetsRules: ignoring unrecognized kwargs: {invalid}"
-                )
-
-        return self._session.get_pages(metadata, resource, params, total_pages, direction)
+        return dispatch.call(
+            self._session,
+            "getOrganizationPoliciesGlobalFirewallRulesetsRules",
+            organizationId,
+            total_pages=total_pages,
+            direction=direction,
+            **kwargs,
+        )
 
     def deleteOrganizationPoliciesGlobalFirewallRulesetsRule(self, organizationId: str, ruleId: str):
         """
@@ -6148,15 +2621,7 @@ class AsyncOrganizations:
         - ruleId (string): Rule ID
         """
 
-        metadata = {
-            "tags": ["organizations", "configure", "policies", "global", "firewall", "rulesets", "rules"],
-            "operation": "deleteOrganizationPoliciesGlobalFirewallRulesetsRule",
-        }
-        organizationId = urllib.parse.quote(str(organizationId), safe="")
-        ruleId = urllib.parse.quote(str(ruleId), safe="")
-        resource = f"/organizations/{organizationId}/policies/global/firewall/rulesets/rules/{ruleId}"
-
-        return self._session.delete(metadata, resource)
+        return dispatch.call(self._session, "deleteOrganizationPoliciesGlobalFirewallRulesetsRule", organizationId, ruleId)
 
     def updateOrganizationPoliciesGlobalFirewallRulesetsRule(self, organizationId: str, ruleId: str, **kwargs):
         """
@@ -6175,43 +2640,9 @@ class AsyncOrganizations:
         - destinations (object): Destination traffic criteria. Each source or destination bloc is capped separately per rule at 100 total segment values. The count is segments_values_count: the sum of all values across every segment type in that bloc. Ports use a separate cap of 100.
         """
 
-        kwargs.update(locals())
-
-        if "policy" in kwargs:
-            options = ["allow", "deny"]
-            assert kwargs["policy"] in options, (
-                f'''"policy" cannot be "{kwargs["policy"]}", & must be set to one of: {options}'''
-            )
-
-        metadata = {
-            "tags": ["organizations", "configure", "policies", "global", "firewall", "rulesets", "rules"],
-            "operation": "updateOrganizationPoliciesGlobalFirewallRulesetsRule",
-        }
-        organizationId = urllib.parse.quote(str(organizationId), safe="")
-        ruleId = urllib.parse.quote(str(ruleId), safe="")
-        resource = f"/organizations/{organizationId}/policies/global/firewall/rulesets/rules/{ruleId}"
-
-        body_params = [
-            "name",
-            "rulesetId",
-            "policy",
-            "enabled",
-            "priority",
-            "description",
-            "sources",
-            "destinations",
-        ]
-        payload = {k.strip(): v for k, v in kwargs.items() if k.strip() in body_params}
-
-        if self._session._validate_kwargs:
-            all_params = [] + body_params
-            invalid = [k for k in kwargs if k.strip() not in all_params and k != "self"]
-            if invalid and self._session._logger:
-                self._session._logger.warning(
-                    f"updateOrganizationPoliciesGlobalFirewallRulesetsRule: ignoring unrecognized kwargs: {invalid}"
-                )
-
-        return self._session.put(metadata, resource, payload)
+        return dispatch.call(
+            self._session, "updateOrganizationPoliciesGlobalFirewallRulesetsRule", organizationId, ruleId, **kwargs
+        )
 
     def updateOrganizationPoliciesGlobalFirewallRuleset(self, organizationId: str, rulesetId: str, **kwargs):
         """
@@ -6224,31 +2655,9 @@ class AsyncOrganizations:
         - description (string): Description of the firewall ruleset
         """
 
-        kwargs.update(locals())
-
-        metadata = {
-            "tags": ["organizations", "configure", "policies", "global", "firewall", "rulesets"],
-            "operation": "updateOrganizationPoliciesGlobalFirewallRuleset",
-        }
-        organizationId = urllib.parse.quote(str(organizationId), safe="")
-        rulesetId = urllib.parse.quote(str(rulesetId), safe="")
-        resource = f"/organizations/{organizationId}/policies/global/firewall/rulesets/{rulesetId}"
-
-        body_params = [
-            "name",
-            "description",
-        ]
-        payload = {k.strip(): v for k, v in kwargs.items() if k.strip() in body_params}
-
-        if self._session._validate_kwargs:
-            all_params = [] + body_params
-            invalid = [k for k in kwargs if k.strip() not in all_params and k != "self"]
-            if invalid and self._session._logger:
-                self._session._logger.warning(
-                    f"updateOrganizationPoliciesGlobalFirewallRuleset: ignoring unrecognized kwargs: {invalid}"
-                )
-
-        return self._session.put(metadata, resource, payload)
+        return dispatch.call(
+            self._session, "updateOrganizationPoliciesGlobalFirewallRuleset", organizationId, rulesetId, **kwargs
+        )
 
     def deleteOrganizationPoliciesGlobalFirewallRuleset(self, organizationId: str, rulesetId: str):
         """
@@ -6259,15 +2668,7 @@ class AsyncOrganizations:
         - rulesetId (string): Ruleset ID
         """
 
-        metadata = {
-            "tags": ["organizations", "configure", "policies", "global", "firewall", "rulesets"],
-            "operation": "deleteOrganizationPoliciesGlobalFirewallRuleset",
-        }
-        organizationId = urllib.parse.quote(str(organizationId), safe="")
-        rulesetId = urllib.parse.quote(str(rulesetId), safe="")
-        resource = f"/organizations/{organizationId}/policies/global/firewall/rulesets/{rulesetId}"
-
-        return self._session.delete(metadata, resource)
+        return dispatch.call(self._session, "deleteOrganizationPoliciesGlobalFirewallRuleset", organizationId, rulesetId)
 
     def getOrganizationPoliciesGlobalGroupPolicies(self, organizationId: str, total_pages=1, direction="next", **kwargs):
         """
@@ -6284,41 +2685,14 @@ class AsyncOrganizations:
         - endingBefore (string): A token used by the server to indicate the end of the page. Often this is a timestamp or an ID but it is not limited to those. This parameter should not be defined by client applications. The link for the first, last, prev, or next page in the HTTP Link header should define it.
         """
 
-        kwargs.update(locals())
-
-        metadata = {
-            "tags": ["organizations", "configure", "policies", "global", "group"],
-            "operation": "getOrganizationPoliciesGlobalGroupPolicies",
-        }
-        organizationId = urllib.parse.quote(str(organizationId), safe="")
-        resource = f"/organizations/{organizationId}/policies/global/group/policies"
-
-        query_params = [
-            "name",
-            "policyIds",
-            "perPage",
-            "startingAfter",
-            "endingBefore",
-        ]
-        params = {k.strip(): v for k, v in kwargs.items() if k.strip() in query_params}
-
-        array_params = [
-            "policyIds",
-        ]
-        for k, v in kwargs.items():
-            if k.strip() in array_params:
-                params[f"{k.strip()}[]"] = kwargs[f"{k}"]
-                params.pop(k.strip())
-
-        if self._session._validate_kwargs:
-            all_params = query_params + array_params
-            invalid = [k for k in kwargs if k.strip() not in all_params and k != "self"]
-            if invalid and self._session._logger:
-                self._session._logger.warning(
-                    f"getOrganizationPoliciesGlobalGroupPolicies: ignoring unrecognized kwargs: {invalid}"
-                )
-
-        return self._session.get_pages(metadata, resource, params, total_pages, direction)
+        return dispatch.call(
+            self._session,
+            "getOrganizationPoliciesGlobalGroupPolicies",
+            organizationId,
+            total_pages=total_pages,
+            direction=direction,
+            **kwargs,
+        )
 
     def createOrganizationPoliciesGlobalGroupPolicy(self, organizationId: str, name: str, **kwargs):
         """
@@ -6330,30 +2704,7 @@ class AsyncOrganizations:
         - description (string): Description of the policy
         """
 
-        kwargs.update(locals())
-
-        metadata = {
-            "tags": ["organizations", "configure", "policies", "global", "group"],
-            "operation": "createOrganizationPoliciesGlobalGroupPolicy",
-        }
-        organizationId = urllib.parse.quote(str(organizationId), safe="")
-        resource = f"/organizations/{organizationId}/policies/global/group/policies"
-
-        body_params = [
-            "name",
-            "description",
-        ]
-        payload = {k.strip(): v for k, v in kwargs.items() if k.strip() in body_params}
-
-        if self._session._validate_kwargs:
-            all_params = [] + body_params
-            invalid = [k for k in kwargs if k.strip() not in all_params and k != "self"]
-            if invalid and self._session._logger:
-                self._session._logger.warning(
-                    f"createOrganizationPoliciesGlobalGroupPolicy: ignoring unrecognized kwargs: {invalid}"
-                )
-
-        return self._session.post(metadata, resource, payload)
+        return dispatch.call(self._session, "createOrganizationPoliciesGlobalGroupPolicy", organizationId, name, **kwargs)
 
     def assignOrganizationPoliciesGlobalGroupPoliciesAdaptivePolicyGroups(
         self, organizationId: str, policy: dict, adaptivePolicyGroups: list, **kwargs
@@ -6367,30 +2718,14 @@ class AsyncOrganizations:
         - adaptivePolicyGroups (array): Adaptive policy groups to assign
         """
 
-        kwargs = locals()
-
-        metadata = {
-            "tags": ["organizations", "configure", "policies", "global", "group", "adaptivePolicyGroups"],
-            "operation": "assignOrganizationPoliciesGlobalGroupPoliciesAdaptivePolicyGroups",
-        }
-        organizationId = urllib.parse.quote(str(organizationId), safe="")
-        resource = f"/organizations/{organizationId}/policies/global/group/policies/adaptivePolicyGroups/assign"
-
-        body_params = [
-            "policy",
-            "adaptivePolicyGroups",
-        ]
-        payload = {k.strip(): v for k, v in kwargs.items() if k.strip() in body_params}
-
-        if self._session._validate_kwargs:
-            all_params = [] + body_params
-            invalid = [k for k in kwargs if k.strip() not in all_params and k != "self"]
-            if invalid and self._session._logger:
-                self._session._logger.warning(
-                    f"assignOrganizationPoliciesGlobalGroupPoliciesAdaptivePolicyGroups: ignoring unrecognized kwargs: {invalid}"
-                )
-
-        return self._session.post(metadata, resource, payload)
+        return dispatch.call(
+            self._session,
+            "assignOrganizationPoliciesGlobalGroupPoliciesAdaptivePolicyGroups",
+            organizationId,
+            policy,
+            adaptivePolicyGroups,
+            **kwargs,
+        )
 
     def getOrganizationPoliciesGlobalGroupPoliciesAdaptivePolicyGroupsAssignments(
         self, organizationId: str, total_pages=1, direction="next", **kwargs
@@ -6410,44 +2745,14 @@ class AsyncOrganizations:
         - endingBefore (string): A token used by the server to indicate the end of the page. Often this is a timestamp or an ID but it is not limited to those. This parameter should not be defined by client applications. The link for the first, last, prev, or next page in the HTTP Link header should define it.
         """
 
-        kwargs.update(locals())
-
-        metadata = {
-            "tags": ["organizations", "configure", "policies", "global", "group", "adaptivePolicyGroups", "assignments"],
-            "operation": "getOrganizationPoliciesGlobalGroupPoliciesAdaptivePolicyGroupsAssignments",
-        }
-        organizationId = urllib.parse.quote(str(organizationId), safe="")
-        resource = f"/organizations/{organizationId}/policies/global/group/policies/adaptivePolicyGroups/assignments"
-
-        query_params = [
-            "assignmentIds",
-            "policyIds",
-            "adaptivePolicyGroupIds",
-            "perPage",
-            "startingAfter",
-            "endingBefore",
-        ]
-        params = {k.strip(): v for k, v in kwargs.items() if k.strip() in query_params}
-
-        array_params = [
-            "assignmentIds",
-            "policyIds",
-            "adaptivePolicyGroupIds",
-        ]
-        for k, v in kwargs.items():
-            if k.strip() in array_params:
-                params[f"{k.strip()}[]"] = kwargs[f"{k}"]
-                params.pop(k.strip())
-
-        if self._session._validate_kwargs:
-            all_params = query_params + array_params
-            invalid = [k for k in kwargs if k.strip() not in all_params and k != "self"]
-            if invalid and self._session._logger:
-                self._session._logger.warning(
-                    f"getOrganizationPoliciesGlobalGroupPoliciesAdaptivePolicyGroupsAssignments: ignoring unrecognized kwargs: {invalid}"
-                )
-
-        return self._session.get_pages(metadata, resource, params, total_pages, direction)
+        return dispatch.call(
+            self._session,
+            "getOrganizationPoliciesGlobalGroupPoliciesAdaptivePolicyGroupsAssignments",
+            organizationId,
+            total_pages=total_pages,
+            direction=direction,
+            **kwargs,
+        )
 
     def removeOrganizationPoliciesGlobalGroupPoliciesAdaptivePolicyGroups(
         self, organizationId: str, policy: dict, adaptivePolicyGroups: list, **kwargs
@@ -6461,30 +2766,14 @@ class AsyncOrganizations:
         - adaptivePolicyGroups (array): Adaptive policy groups to remove
         """
 
-        kwargs = locals()
-
-        metadata = {
-            "tags": ["organizations", "configure", "policies", "global", "group", "adaptivePolicyGroups"],
-            "operation": "removeOrganizationPoliciesGlobalGroupPoliciesAdaptivePolicyGroups",
-        }
-        organizationId = urllib.parse.quote(str(organizationId), safe="")
-        resource = f"/organizations/{organizationId}/policies/global/group/policies/adaptivePolicyGroups/remove"
-
-        body_params = [
-            "policy",
-            "adaptivePolicyGroups",
-        ]
-        payload = {k.strip(): v for k, v in kwargs.items() if k.strip() in body_params}
-
-        if self._session._validate_kwargs:
-            all_params = [] + body_params
-            invalid = [k for k in kwargs if k.strip() not in all_params and k != "self"]
-            if invalid and self._session._logger:
-                self._session._logger.warning(
-                    f"removeOrganizationPoliciesGlobalGroupPoliciesAdaptivePolicyGroups: ignoring unrecognized kwargs: {invalid}"
-                )
-
-        return self._session.post(metadata, resource, payload)
+        return dispatch.call(
+            self._session,
+            "removeOrganizationPoliciesGlobalGroupPoliciesAdaptivePolicyGroups",
+            organizationId,
+            policy,
+            adaptivePolicyGroups,
+            **kwargs,
+        )
 
     def getOrganizationPoliciesGlobalGroupPoliciesFirewallRulesetsAssignments(
         self, organizationId: str, total_pages=1, direction="next", **kwargs
@@ -6504,44 +2793,14 @@ class AsyncOrganizations:
         - endingBefore (string): A token used by the server to indicate the end of the page. Often this is a timestamp or an ID but it is not limited to those. This parameter should not be defined by client applications. The link for the first, last, prev, or next page in the HTTP Link header should define it.
         """
 
-        kwargs.update(locals())
-
-        metadata = {
-            "tags": ["organizations", "configure", "policies", "global", "group", "firewall", "rulesets", "assignments"],
-            "operation": "getOrganizationPoliciesGlobalGroupPoliciesFirewallRulesetsAssignments",
-        }
-        organizationId = urllib.parse.quote(str(organizationId), safe="")
-        resource = f"/organizations/{organizationId}/policies/global/group/policies/firewall/rulesets/assignments"
-
-        query_params = [
-            "rulesetIds",
-            "policyIds",
-            "assignmentIds",
-            "perPage",
-            "startingAfter",
-            "endingBefore",
-        ]
-        params = {k.strip(): v for k, v in kwargs.items() if k.strip() in query_params}
-
-        array_params = [
-            "rulesetIds",
-            "policyIds",
-            "assignmentIds",
-        ]
-        for k, v in kwargs.items():
-            if k.strip() in array_params:
-                params[f"{k.strip()}[]"] = kwargs[f"{k}"]
-                params.pop(k.strip())
-
-        if self._session._validate_kwargs:
-            all_params = query_params + array_params
-            invalid = [k for k in kwargs if k.strip() not in all_params and k != "self"]
-            if invalid and self._session._logger:
-                self._session._logger.warning(
-                    f"getOrganizationPoliciesGlobalGroupPoliciesFirewallRulesetsAssignments: ignoring unrecognized kwargs: {invalid}"
-                )
-
-        return self._session.get_pages(metadata, resource, params, total_pages, direction)
+        return dispatch.call(
+            self._session,
+            "getOrganizationPoliciesGlobalGroupPoliciesFirewallRulesetsAssignments",
+            organizationId,
+            total_pages=total_pages,
+            direction=direction,
+            **kwargs,
+        )
 
     def createOrganizationPoliciesGlobalGroupPoliciesFirewallRulesetsAssignment(
         self, organizationId: str, rulesetId: str, policyId: str, **kwargs
@@ -6556,31 +2815,14 @@ class AsyncOrganizations:
         - priority (integer): Priority of the ruleset assignment (lower numbers = higher priority)
         """
 
-        kwargs.update(locals())
-
-        metadata = {
-            "tags": ["organizations", "configure", "policies", "global", "group", "firewall", "rulesets", "assignments"],
-            "operation": "createOrganizationPoliciesGlobalGroupPoliciesFirewallRulesetsAssignment",
-        }
-        organizationId = urllib.parse.quote(str(organizationId), safe="")
-        resource = f"/organizations/{organizationId}/policies/global/group/policies/firewall/rulesets/assignments"
-
-        body_params = [
-            "rulesetId",
-            "policyId",
-            "priority",
-        ]
-        payload = {k.strip(): v for k, v in kwargs.items() if k.strip() in body_params}
-
-        if self._session._validate_kwargs:
-            all_params = [] + body_params
-            invalid = [k for k in kwargs if k.strip() not in all_params and k != "self"]
-            if invalid and self._session._logger:
-                self._session._logger.warning(
-                    f"createOrganizationPoliciesGlobalGroupPoliciesFirewallRulesetsAssignment: ignoring unrecognized kwargs: {invalid}"
-                )
-
-        return self._session.post(metadata, resource, payload)
+        return dispatch.call(
+            self._session,
+            "createOrganizationPoliciesGlobalGroupPoliciesFirewallRulesetsAssignment",
+            organizationId,
+            rulesetId,
+            policyId,
+            **kwargs,
+        )
 
     def updateOrganizationPoliciesGlobalGroupPoliciesFirewallRulesetsAssignment(
         self, organizationId: str, assignmentId: str, **kwargs
@@ -6596,35 +2838,14 @@ class AsyncOrganizations:
         - priority (integer): Priority of the ruleset assignment (lower numbers = higher priority)
         """
 
-        kwargs.update(locals())
-
-        metadata = {
-            "tags": ["organizations", "configure", "policies", "global", "group", "firewall", "rulesets", "assignments"],
-            "operation": "updateOrganizationPoliciesGlobalGroupPoliciesFirewallRulesetsAssignment",
-        }
-        organizationId = urllib.parse.quote(str(organizationId), safe="")
-        assignmentId = urllib.parse.quote(str(assignmentId), safe="")
-        resource = (
-            f"/organizations/{organizationId}/policies/global/group/policies/firewall/rulesets/assignments/{assignmentId}"
+        return dispatch.call(
+            self._session,
+            "updateOrganizationPoliciesGlobalGroupPoliciesFirewallRulesetsAssignment",
+            organizationId,
+            assignmentId,
+            **kwargs,
         )
 
-        body_params = [
-            "rulesetId",
-            "policyId",
-            "priority",
-        ]
-        payload = {k.strip(): v for k, v in kwargs.items() if k.strip() in body_params}
-
-        if self._session._validate_kwargs:
-            all_params = [] + body_params
-            invalid = [k for k in kwargs if k.strip() not in all_params and k != "self"]
-            if invalid and self._session._logger:
-                self._session._logger.warning(
-                    f"updateOrganizationPoliciesGlobalGroupPoliciesFirewallRulesetsAssignment: ignoring unrecognized kwargs: {invalid}"
-                )
-
-        return self._session.put(metadata, resource, payload)
-
     def deleteOrganizationPoliciesGlobalGroupPoliciesFirewallRulesetsAssignment(self, organizationId: str, assignmentId: str):
         """
         **Delete an Organization-Wide Policy Ruleset Assignment**
@@ -6634,18 +2855,13 @@ class AsyncOrganizations:
         - assignmentId (string): Assignment ID
         """
 
-        metadata = {
-            "tags": ["organizations", "configure", "policies", "global", "group", "firewall", "rulesets", "assignments"],
-            "operation": "deleteOrganizationPoliciesGlobalGroupPoliciesFirewallRulesetsAssignment",
-        }
-        organizationId = urllib.parse.quote(str(organizationId), safe="")
-        assignmentId = urllib.parse.quote(str(assignmentId), safe="")
-        resource = (
-            f"/organizations/{organizationId}/policies/global/group/policies/firewall/rulesets/assignments/{assignmentId}"
+        return dispatch.call(
+            self._session,
+            "deleteOrganizationPoliciesGlobalGroupPoliciesFirewallRulesetsAssignment",
+            organizationId,
+            assignmentId,
         )
 
-        return self._session.delete(metadata, resource)
-
     def updateOrganizationPoliciesGlobalGroupPolicy(self, organizationId: str, policyId: str, **kwargs):
         """
         **Update an Organization-Wide Policy**
@@ -6657,31 +2873,7 @@ class AsyncOrganizations:
         - description (string): Description of the policy
         """
 
-        kwargs.update(locals())
-
-        metadata = {
-            "tags": ["organizations", "configure", "policies", "global", "group"],
-            "operation": "updateOrganizationPoliciesGlobalGroupPolicy",
-        }
-        organizationId = urllib.parse.quote(str(organizationId), safe="")
-        policyId = urllib.parse.quote(str(policyId), safe="")
-        resource = f"/organizations/{organizationId}/policies/global/group/policies/{policyId}"
-
-        body_params = [
-            "name",
-            "description",
-        ]
-        payload = {k.strip(): v for k, v in kwargs.items() if k.strip() in body_params}
-
-        if self._session._validate_kwargs:
-            all_params = [] + body_params
-            invalid = [k for k in kwargs if k.strip() not in all_params and k != "self"]
-            if invalid and self._session._logger:
-                self._session._logger.warning(
-                    f"updateOrganizationPoliciesGlobalGroupPolicy: ignoring unrecognized kwargs: {invalid}"
-                )
-
-        return self._session.put(metadata, resource, payload)
+        return dispatch.call(self._session, "updateOrganizationPoliciesGlobalGroupPolicy", organizationId, policyId, **kwargs)
 
     def deleteOrganizationPoliciesGlobalGroupPolicy(self, organizationId: str, policyId: str):
         """
@@ -6692,15 +2884,7 @@ class AsyncOrganizations:
         - policyId (string): Policy ID
         """
 
-        metadata = {
-            "tags": ["organizations", "configure", "policies", "global", "group"],
-            "operation": "deleteOrganizationPoliciesGlobalGroupPolicy",
-        }
-        organizationId = urllib.parse.quote(str(organizationId), safe="")
-        policyId = urllib.parse.quote(str(policyId), safe="")
-        resource = f"/organizations/{organizationId}/policies/global/group/policies/{policyId}"
-
-        return self._session.delete(metadata, resource)
+        return dispatch.call(self._session, "deleteOrganizationPoliciesGlobalGroupPolicy", organizationId, policyId)
 
     def getOrganizationPolicyObjects(self, organizationId: str, total_pages=1, direction="next", **kwargs):
         """
@@ -6715,29 +2899,14 @@ class AsyncOrganizations:
         - endingBefore (string): A token used by the server to indicate the end of the page. Often this is a timestamp or an ID but it is not limited to those. This parameter should not be defined by client applications. The link for the first, last, prev, or next page in the HTTP Link header should define it.
         """
 
-        kwargs.update(locals())
-
-        metadata = {
-            "tags": ["organizations", "configure", "policyObjects"],
-            "operation": "getOrganizationPolicyObjects",
-        }
-        organizationId = urllib.parse.quote(str(organizationId), safe="")
-        resource = f"/organizations/{organizationId}/policyObjects"
-
-        query_params = [
-            "perPage",
-            "startingAfter",
-            "endingBefore",
-        ]
-        params = {k.strip(): v for k, v in kwargs.items() if k.strip() in query_params}
-
-        if self._session._validate_kwargs:
-            all_params = query_params
-            invalid = [k for k in kwargs if k.strip() not in all_params and k != "self"]
-            if invalid and self._session._logger:
-                self._session._logger.warning(f"getOrganizationPolicyObjects: ignoring unrecognized kwargs: {invalid}")
-
-        return self._session.get_pages(metadata, resource, params, total_pages, direction)
+        return dispatch.call(
+            self._session,
+            "getOrganizationPolicyObjects",
+            organizationId,
+            total_pages=total_pages,
+            direction=direction,
+            **kwargs,
+        )
 
     def createOrganizationPolicyObject(self, organizationId: str, name: str, category: str, type: str, **kwargs):
         """
@@ -6755,38 +2924,7 @@ class AsyncOrganizations:
         - groupIds (array): The IDs of policy object groups the policy object belongs to
         """
 
-        kwargs.update(locals())
-
-        if "type" in kwargs:
-            options = ["adaptivePolicyIpv4Cidr", "cidr", "fqdn"]
-            assert kwargs["type"] in options, f'''"type" cannot be "{kwargs["type"]}", & must be set to one of: {options}'''
-
-        metadata = {
-            "tags": ["organizations", "configure", "policyObjects"],
-            "operation": "createOrganizationPolicyObject",
-        }
-        organizationId = urllib.parse.quote(str(organizationId), safe="")
-        resource = f"/organizations/{organizationId}/policyObjects"
-
-        body_params = [
-            "name",
-            "category",
-            "type",
-            "cidr",
-            "fqdn",
-            "mask",
-            "ip",
-            "groupIds",
-        ]
-        payload = {k.strip(): v for k, v in kwargs.items() if k.strip() in body_params}
-
-        if self._session._validate_kwargs:
-            all_params = [] + body_params
-            invalid = [k for k in kwargs if k.strip() not in all_params and k != "self"]
-            if invalid and self._session._logger:
-                self._session._logger.warning(f"createOrganizationPolicyObject: ignoring unrecognized kwargs: {invalid}")
-
-        return self._session.post(metadata, resource, payload)
+        return dispatch.call(self._session, "createOrganizationPolicyObject", organizationId, name, category, type, **kwargs)
 
     def getOrganizationPolicyObjectsGroups(self, organizationId: str, total_pages=1, direction="next", **kwargs):
         """
@@ -6801,29 +2939,14 @@ class AsyncOrganizations:
         - endingBefore (string): A token used by the server to indicate the end of the page. Often this is a timestamp or an ID but it is not limited to those. This parameter should not be defined by client applications. The link for the first, last, prev, or next page in the HTTP Link header should define it.
         """
 
-        kwargs.update(locals())
-
-        metadata = {
-            "tags": ["organizations", "configure", "policyObjects", "groups"],
-            "operation": "getOrganizationPolicyObjectsGroups",
-        }
-        organizationId = urllib.parse.quote(str(organizationId), safe="")
-        resource = f"/organizations/{organizationId}/policyObjects/groups"
-
-        query_params = [
-            "perPage",
-            "startingAfter",
-            "endingBefore",
-        ]
-        params = {k.strip(): v for k, v in kwargs.items() if k.strip() in query_params}
-
-        if self._session._validate_kwargs:
-            all_params = query_params
-            invalid = [k for k in kwargs if k.strip() not in all_params and k != "self"]
-            if invalid and self._session._logger:
-                self._session._logger.warning(f"getOrganizationPolicyObjectsGroups: ignoring unrecognized kwargs: {invalid}")
-
-        return self._session.get_pages(metadata, resource, params, total_pages, direction)
+        return dispatch.call(
+            self._session,
+            "getOrganizationPolicyObjectsGroups",
+            organizationId,
+            total_pages=total_pages,
+            direction=direction,
+            **kwargs,
+        )
 
     def createOrganizationPolicyObjectsGroup(self, organizationId: str, name: str, **kwargs):
         """
@@ -6836,29 +2959,7 @@ class AsyncOrganizations:
         - objectIds (array): A list of Policy Object ID's that this NetworkObjectGroup should be associated to (note: these ID's will replace the existing associated Policy Objects)
         """
 
-        kwargs.update(locals())
-
-        metadata = {
-            "tags": ["organizations", "configure", "policyObjects", "groups"],
-            "operation": "createOrganizationPolicyObjectsGroup",
-        }
-        organizationId = urllib.parse.quote(str(organizationId), safe="")
-        resource = f"/organizations/{organizationId}/policyObjects/groups"
-
-        body_params = [
-            "name",
-            "category",
-            "objectIds",
-        ]
-        payload = {k.strip(): v for k, v in kwargs.items() if k.strip() in body_params}
-
-        if self._session._validate_kwargs:
-            all_params = [] + body_params
-            invalid = [k for k in kwargs if k.strip() not in all_params and k != "self"]
-            if invalid and self._session._logger:
-                self._session._logger.warning(f"createOrganizationPolicyObjectsGroup: ignoring unrecognized kwargs: {invalid}")
-
-        return self._session.post(metadata, resource, payload)
+        return dispatch.call(self._session, "createOrganizationPolicyObjectsGroup", organizationId, name, **kwargs)
 
     def getOrganizationPolicyObjectsGroup(self, organizationId: str, policyObjectGroupId: str):
         """
@@ -6869,15 +2970,7 @@ class AsyncOrganizations:
         - policyObjectGroupId (string): Policy object group ID
         """
 
-        metadata = {
-            "tags": ["organizations", "configure", "policyObjects", "groups"],
-            "operation": "getOrganizationPolicyObjectsGroup",
-        }
-        organizationId = urllib.parse.quote(str(organizationId), safe="")
-        policyObjectGroupId = urllib.parse.quote(str(policyObjectGroupId), safe="")
-        resource = f"/organizations/{organizationId}/policyObjects/groups/{policyObjectGroupId}"
-
-        return self._session.get(metadata, resource)
+        return dispatch.call(self._session, "getOrganizationPolicyObjectsGroup", organizationId, policyObjectGroupId)
 
     def updateOrganizationPolicyObjectsGroup(self, organizationId: str, policyObjectGroupId: str, **kwargs):
         """
@@ -6890,29 +2983,9 @@ class AsyncOrganizations:
         - objectIds (array): A list of Policy Object ID's that this NetworkObjectGroup should be associated to (note: these ID's will replace the existing associated Policy Objects)
         """
 
-        kwargs.update(locals())
-
-        metadata = {
-            "tags": ["organizations", "configure", "policyObjects", "groups"],
-            "operation": "updateOrganizationPolicyObjectsGroup",
-        }
-        organizationId = urllib.parse.quote(str(organizationId), safe="")
-        policyObjectGroupId = urllib.parse.quote(str(policyObjectGroupId), safe="")
-        resource = f"/organizations/{organizationId}/policyObjects/groups/{policyObjectGroupId}"
-
-        body_params = [
-            "name",
-            "objectIds",
-        ]
-        payload = {k.strip(): v for k, v in kwargs.items() if k.strip() in body_params}
-
-        if self._session._validate_kwargs:
-            all_params = [] + body_params
-            invalid = [k for k in kwargs if k.strip() not in all_params and k != "self"]
-            if invalid and self._session._logger:
-                self._session._logger.warning(f"updateOrganizationPolicyObjectsGroup: ignoring unrecognized kwargs: {invalid}")
-
-        return self._session.put(metadata, resource, payload)
+        return dispatch.call(
+            self._session, "updateOrganizationPolicyObjectsGroup", organizationId, policyObjectGroupId, **kwargs
+        )
 
     def deleteOrganizationPolicyObjectsGroup(self, organizationId: str, policyObjectGroupId: str):
         """
@@ -6923,15 +2996,7 @@ class AsyncOrganizations:
         - policyObjectGroupId (string): Policy object group ID
         """
 
-        metadata = {
-            "tags": ["organizations", "configure", "policyObjects", "groups"],
-            "operation": "deleteOrganizationPolicyObjectsGroup",
-        }
-        organizationId = urllib.parse.quote(str(organizationId), safe="")
-        policyObjectGroupId = urllib.parse.quote(str(policyObjectGroupId), safe="")
-        resource = f"/organizations/{organizationId}/policyObjects/groups/{policyObjectGroupId}"
-
-        return self._session.delete(metadata, resource)
+        return dispatch.call(self._session, "deleteOrganizationPolicyObjectsGroup", organizationId, policyObjectGroupId)
 
     def getOrganizationPolicyObject(self, organizationId: str, policyObjectId: str):
         """
@@ -6942,15 +3007,7 @@ class AsyncOrganizations:
         - policyObjectId (string): Policy object ID
         """
 
-        metadata = {
-            "tags": ["organizations", "configure", "policyObjects"],
-            "operation": "getOrganizationPolicyObject",
-        }
-        organizationId = urllib.parse.quote(str(organizationId), safe="")
-        policyObjectId = urllib.parse.quote(str(policyObjectId), safe="")
-        resource = f"/organizations/{organizationId}/policyObjects/{policyObjectId}"
-
-        return self._session.get(metadata, resource)
+        return dispatch.call(self._session, "getOrganizationPolicyObject", organizationId, policyObjectId)
 
     def updateOrganizationPolicyObject(self, organizationId: str, policyObjectId: str, **kwargs):
         """
@@ -6967,33 +3024,7 @@ class AsyncOrganizations:
         - groupIds (array): The IDs of policy object groups the policy object belongs to
         """
 
-        kwargs.update(locals())
-
-        metadata = {
-            "tags": ["organizations", "configure", "policyObjects"],
-            "operation": "updateOrganizationPolicyObject",
-        }
-        organizationId = urllib.parse.quote(str(organizationId), safe="")
-        policyObjectId = urllib.parse.quote(str(policyObjectId), safe="")
-        resource = f"/organizations/{organizationId}/policyObjects/{policyObjectId}"
-
-        body_params = [
-            "name",
-            "cidr",
-            "fqdn",
-            "mask",
-            "ip",
-            "groupIds",
-        ]
-        payload = {k.strip(): v for k, v in kwargs.items() if k.strip() in body_params}
-
-        if self._session._validate_kwargs:
-            all_params = [] + body_params
-            invalid = [k for k in kwargs if k.strip() not in all_params and k != "self"]
-            if invalid and self._session._logger:
-                self._session._logger.warning(f"updateOrganizationPolicyObject: ignoring unrecognized kwargs: {invalid}")
-
-        return self._session.put(metadata, resource, payload)
+        return dispatch.call(self._session, "updateOrganizationPolicyObject", organizationId, policyObjectId, **kwargs)
 
     def deleteOrganizationPolicyObject(self, organizationId: str, policyObjectId: str):
         """
@@ -7004,15 +3035,7 @@ class AsyncOrganizations:
         - policyObjectId (string): Policy object ID
         """
 
-        metadata = {
-            "tags": ["organizations", "configure", "policyObjects"],
-            "operation": "deleteOrganizationPolicyObject",
-        }
-        organizationId = urllib.parse.quote(str(organizationId), safe="")
-        policyObjectId = urllib.parse.quote(str(policyObjectId), safe="")
-        resource = f"/organizations/{organizationId}/policyObjects/{policyObjectId}"
-
-        return self._session.delete(metadata, resource)
+        return dispatch.call(self._session, "deleteOrganizationPolicyObject", organizationId, policyObjectId)
 
     def getOrganizationSaml(self, organizationId: str):
         """
@@ -7022,14 +3045,7 @@ class AsyncOrganizations:
         - organizationId (string): Organization ID
         """
 
-        metadata = {
-            "tags": ["organizations", "configure", "saml"],
-            "operation": "getOrganizationSaml",
-        }
-        organizationId = urllib.parse.quote(str(organizationId), safe="")
-        resource = f"/organizations/{organizationId}/saml"
-
-        return self._session.get(metadata, resource)
+        return dispatch.call(self._session, "getOrganizationSaml", organizationId)
 
     def updateOrganizationSaml(self, organizationId: str, **kwargs):
         """
@@ -7041,28 +3057,7 @@ class AsyncOrganizations:
         - spInitiated (object): SP-Initiated SSO settings
         """
 
-        kwargs.update(locals())
-
-        metadata = {
-            "tags": ["organizations", "configure", "saml"],
-            "operation": "updateOrganizationSaml",
-        }
-        organizationId = urllib.parse.quote(str(organizationId), safe="")
-        resource = f"/organizations/{organizationId}/saml"
-
-        body_params = [
-            "enabled",
-            "spInitiated",
-        ]
-        payload = {k.strip(): v for k, v in kwargs.items() if k.strip() in body_params}
-
-        if self._session._validate_kwargs:
-            all_params = [] + body_params
-            invalid = [k for k in kwargs if k.strip() not in all_params and k != "self"]
-            if invalid and self._session._logger:
-                self._session._logger.warning(f"updateOrganizationSaml: ignoring unrecognized kwargs: {invalid}")
-
-        return self._session.put(metadata, resource, payload)
+        return dispatch.call(self._session, "updateOrganizationSaml", organizationId, **kwargs)
 
     def getOrganizationSamlIdps(self, organizationId: str):
         """
@@ -7072,14 +3067,7 @@ class AsyncOrganizations:
         - organizationId (string): Organization ID
         """
 
-        metadata = {
-            "tags": ["organizations", "configure", "saml", "idps"],
-            "operation": "getOrganizationSamlIdps",
-        }
-        organizationId = urllib.parse.quote(str(organizationId), safe="")
-        resource = f"/organizations/{organizationId}/saml/idps"
-
-        return self._session.get(metadata, resource)
+        return dispatch.call(self._session, "getOrganizationSamlIdps", organizationId)
 
     def createOrganizationSamlIdp(self, organizationId: str, x509certSha1Fingerprint: str, **kwargs):
         """
@@ -7092,29 +3080,7 @@ class AsyncOrganizations:
         - sloLogoutUrl (string): Dashboard will redirect users to this URL when they sign out.
         """
 
-        kwargs.update(locals())
-
-        metadata = {
-            "tags": ["organizations", "configure", "saml", "idps"],
-            "operation": "createOrganizationSamlIdp",
-        }
-        organizationId = urllib.parse.quote(str(organizationId), safe="")
-        resource = f"/organizations/{organizationId}/saml/idps"
-
-        body_params = [
-            "x509certSha1Fingerprint",
-            "ssoLoginUrl",
-            "sloLogoutUrl",
-        ]
-        payload = {k.strip(): v for k, v in kwargs.items() if k.strip() in body_params}
-
-        if self._session._validate_kwargs:
-            all_params = [] + body_params
-            invalid = [k for k in kwargs if k.strip() not in all_params and k != "self"]
-            if invalid and self._session._logger:
-                self._session._logger.warning(f"createOrganizationSamlIdp: ignoring unrecognized kwargs: {invalid}")
-
-        return self._session.post(metadata, resource, payload)
+        return dispatch.call(self._session, "createOrganizationSamlIdp", organizationId, x509certSha1Fingerprint, **kwargs)
 
     def updateOrganizationSamlIdp(self, organizationId: str, idpId: str, **kwargs):
         """
@@ -7128,30 +3094,7 @@ class AsyncOrganizations:
         - sloLogoutUrl (string): Dashboard will redirect users to this URL when they sign out.
         """
 
-        kwargs.update(locals())
-
-        metadata = {
-            "tags": ["organizations", "configure", "saml", "idps"],
-            "operation": "updateOrganizationSamlIdp",
-        }
-        organizationId = urllib.parse.quote(str(organizationId), safe="")
-        idpId = urllib.parse.quote(str(idpId), safe="")
-        resource = f"/organizations/{organizationId}/saml/idps/{idpId}"
-
-        body_params = [
-            "x509certSha1Fingerprint",
-            "ssoLoginUrl",
-            "sloLogoutUrl",
-        ]
-        payload = {k.strip(): v for k, v in kwargs.items() if k.strip() in body_params}
-
-        if self._session._validate_kwargs:
-            all_params = [] + body_params
-            invalid = [k for k in kwargs if k.strip() not in all_params and k != "self"]
-            if invalid and self._session._logger:
-                self._session._logger.warning(f"updateOrganizationSamlIdp: ignoring unrecognized kwargs: {invalid}")
-
-        return self._session.put(metadata, resource, payload)
+        return dispatch.call(self._session, "updateOrganizationSamlIdp", organizationId, idpId, **kwargs)
 
     def getOrganizationSamlIdp(self, organizationId: str, idpId: str):
         """
@@ -7162,15 +3105,7 @@ class AsyncOrganizations:
         - idpId (string): Idp ID
         """
 
-        metadata = {
-            "tags": ["organizations", "configure", "saml", "idps"],
-            "operation": "getOrganizationSamlIdp",
-        }
-        organizationId = urllib.parse.quote(str(organizationId), safe="")
-        idpId = urllib.parse.quote(str(idpId), safe="")
-        resource = f"/organizations/{organizationId}/saml/idps/{idpId}"
-
-        return self._session.get(metadata, resource)
+        return dispatch.call(self._session, "getOrganizationSamlIdp", organizationId, idpId)
 
     def deleteOrganizationSamlIdp(self, organizationId: str, idpId: str):
         """
@@ -7181,15 +3116,7 @@ class AsyncOrganizations:
         - idpId (string): Idp ID
         """
 
-        metadata = {
-            "tags": ["organizations", "configure", "saml", "idps"],
-            "operation": "deleteOrganizationSamlIdp",
-        }
-        organizationId = urllib.parse.quote(str(organizationId), safe="")
-        idpId = urllib.parse.quote(str(idpId), safe="")
-        resource = f"/organizations/{organizationId}/saml/idps/{idpId}"
-
-        return self._session.delete(metadata, resource)
+        return dispatch.call(self._session, "deleteOrganizationSamlIdp", organizationId, idpId)
 
     def getOrganizationSamlRoles(self, organizationId: str):
         """
@@ -7199,14 +3126,7 @@ class AsyncOrganizations:
         - organizationId (string): Organization ID
         """
 
-        metadata = {
-            "tags": ["organizations", "configure", "samlRoles"],
-            "operation": "getOrganizationSamlRoles",
-        }
-        organizationId = urllib.parse.quote(str(organizationId), safe="")
-        resource = f"/organizations/{organizationId}/samlRoles"
-
-        return self._session.get(metadata, resource)
+        return dispatch.call(self._session, "getOrganizationSamlRoles", organizationId)
 
     def createOrganizationSamlRole(self, organizationId: str, role: str, orgAccess: str, **kwargs):
         """
@@ -7220,30 +3140,7 @@ class AsyncOrganizations:
         - networks (array): The list of networks that the SAML administrator has privileges on
         """
 
-        kwargs.update(locals())
-
-        metadata = {
-            "tags": ["organizations", "configure", "samlRoles"],
-            "operation": "createOrganizationSamlRole",
-        }
-        organizationId = urllib.parse.quote(str(organizationId), safe="")
-        resource = f"/organizations/{organizationId}/samlRoles"
-
-        body_params = [
-            "role",
-            "orgAccess",
-            "tags",
-            "networks",
-        ]
-        payload = {k.strip(): v for k, v in kwargs.items() if k.strip() in body_params}
-
-        if self._session._validate_kwargs:
-            all_params = [] + body_params
-            invalid = [k for k in kwargs if k.strip() not in all_params and k != "self"]
-            if invalid and self._session._logger:
-                self._session._logger.warning(f"createOrganizationSamlRole: ignoring unrecognized kwargs: {invalid}")
-
-        return self._session.post(metadata, resource, payload)
+        return dispatch.call(self._session, "createOrganizationSamlRole", organizationId, role, orgAccess, **kwargs)
 
     def getOrganizationSamlRole(self, organizationId: str, samlRoleId: str):
         """
@@ -7254,15 +3151,7 @@ class AsyncOrganizations:
         - samlRoleId (string): Saml role ID
         """
 
-        metadata = {
-            "tags": ["organizations", "configure", "samlRoles"],
-            "operation": "getOrganizationSamlRole",
-        }
-        organizationId = urllib.parse.quote(str(organizationId), safe="")
-        samlRoleId = urllib.parse.quote(str(samlRoleId), safe="")
-        resource = f"/organizations/{organizationId}/samlRoles/{samlRoleId}"
-
-        return self._session.get(metadata, resource)
+        return dispatch.call(self._session, "getOrganizationSamlRole", organizationId, samlRoleId)
 
     def updateOrganizationSamlRole(self, organizationId: str, samlRoleId: str, **kwargs):
         """
@@ -7277,31 +3166,7 @@ class AsyncOrganizations:
         - networks (array): The list of networks that the SAML administrator has privileges on
         """
 
-        kwargs.update(locals())
-
-        metadata = {
-            "tags": ["organizations", "configure", "samlRoles"],
-            "operation": "updateOrganizationSamlRole",
-        }
-        organizationId = urllib.parse.quote(str(organizationId), safe="")
-        samlRoleId = urllib.parse.quote(str(samlRoleId), safe="")
-        resource = f"/organizations/{organizationId}/samlRoles/{samlRoleId}"
-
-        body_params = [
-            "role",
-            "orgAccess",
-            "tags",
-            "networks",
-        ]
-        payload = {k.strip(): v for k, v in kwargs.items() if k.strip() in body_params}
-
-        if self._session._validate_kwargs:
-            all_params = [] + body_params
-            invalid = [k for k in kwargs if k.strip() not in all_params and k != "self"]
-            if invalid and self._session._logger:
-                self._session._logger.warning(f"updateOrganizationSamlRole: ignoring unrecognized kwargs: {invalid}")
-
-        return self._session.put(metadata, resource, payload)
+        return dispatch.call(self._session, "updateOrganizationSamlRole", organizationId, samlRoleId, **kwargs)
 
     def deleteOrganizationSamlRole(self, organizationId: str, samlRoleId: str):
         """
@@ -7312,15 +3177,7 @@ class AsyncOrganizations:
         - samlRoleId (string): Saml role ID
         """
 
-        metadata = {
-            "tags": ["organizations", "configure", "samlRoles"],
-            "operation": "deleteOrganizationSamlRole",
-        }
-        organizationId = urllib.parse.quote(str(organizationId), safe="")
-        samlRoleId = urllib.parse.quote(str(samlRoleId), safe="")
-        resource = f"/organizations/{organizationId}/samlRoles/{samlRoleId}"
-
-        return self._session.delete(metadata, resource)
+        return dispatch.call(self._session, "deleteOrganizationSamlRole", organizationId, samlRoleId)
 
     def getOrganizationSaseConnectors(self, organizationId: str):
         """
@@ -7330,14 +3187,7 @@ class AsyncOrganizations:
         - organizationId (string): Organization ID
         """
 
-        metadata = {
-            "tags": ["organizations", "configure", "sase", "connectors"],
-            "operation": "getOrganizationSaseConnectors",
-        }
-        organizationId = urllib.parse.quote(str(organizationId), safe="")
-        resource = f"/organizations/{organizationId}/sase/connectors"
-
-        return self._session.get(metadata, resource)
+        return dispatch.call(self._session, "getOrganizationSaseConnectors", organizationId)
 
     def batchOrganizationSaseConnectorsDelete(self, organizationId: str, **kwargs):
         """
@@ -7348,29 +3198,7 @@ class AsyncOrganizations:
         - items (array): List of connectors to delete (maximum 20 items)
         """
 
-        kwargs.update(locals())
-
-        metadata = {
-            "tags": ["organizations", "configure", "sase", "connectors"],
-            "operation": "batchOrganizationSaseConnectorsDelete",
-        }
-        organizationId = urllib.parse.quote(str(organizationId), safe="")
-        resource = f"/organizations/{organizationId}/sase/connectors/batchDelete"
-
-        body_params = [
-            "items",
-        ]
-        payload = {k.strip(): v for k, v in kwargs.items() if k.strip() in body_params}
-
-        if self._session._validate_kwargs:
-            all_params = [] + body_params
-            invalid = [k for k in kwargs if k.strip() not in all_params and k != "self"]
-            if invalid and self._session._logger:
-                self._session._logger.warning(
-                    f"batchOrganizationSaseConnectorsDelete: ignoring unrecognized kwargs: {invalid}"
-                )
-
-        return self._session.post(metadata, resource, payload)
+        return dispatch.call(self._session, "batchOrganizationSaseConnectorsDelete", organizationId, **kwargs)
 
     def createOrganizationSaseIntegration(self, organizationId: str, api: dict, **kwargs):
         """
@@ -7381,27 +3209,7 @@ class AsyncOrganizations:
         - api (object): API credentials
         """
 
-        kwargs = locals()
-
-        metadata = {
-            "tags": ["organizations", "configure", "sase", "integrations"],
-            "operation": "createOrganizationSaseIntegration",
-        }
-        organizationId = urllib.parse.quote(str(organizationId), safe="")
-        resource = f"/organizations/{organizationId}/sase/integrations"
-
-        body_params = [
-            "api",
-        ]
-        payload = {k.strip(): v for k, v in kwargs.items() if k.strip() in body_params}
-
-        if self._session._validate_kwargs:
-            all_params = [] + body_params
-            invalid = [k for k in kwargs if k.strip() not in all_params and k != "self"]
-            if invalid and self._session._logger:
-                self._session._logger.warning(f"createOrganizationSaseIntegration: ignoring unrecognized kwargs: {invalid}")
-
-        return self._session.post(metadata, resource, payload)
+        return dispatch.call(self._session, "createOrganizationSaseIntegration", organizationId, api, **kwargs)
 
     def getOrganizationSaseIntegration(self, organizationId: str, integrationId: str):
         """
@@ -7412,15 +3220,7 @@ class AsyncOrganizations:
         - integrationId (string): Integration ID
         """
 
-        metadata = {
-            "tags": ["organizations", "configure", "sase", "integrations"],
-            "operation": "getOrganizationSaseIntegration",
-        }
-        organizationId = urllib.parse.quote(str(organizationId), safe="")
-        integrationId = urllib.parse.quote(str(integrationId), safe="")
-        resource = f"/organizations/{organizationId}/sase/integrations/{integrationId}"
-
-        return self._session.get(metadata, resource)
+        return dispatch.call(self._session, "getOrganizationSaseIntegration", organizationId, integrationId)
 
     def deleteOrganizationSaseIntegration(self, organizationId: str, integrationId: str):
         """
@@ -7431,15 +3231,7 @@ class AsyncOrganizations:
         - integrationId (string): Integration ID
         """
 
-        metadata = {
-            "tags": ["organizations", "configure", "sase", "integrations"],
-            "operation": "deleteOrganizationSaseIntegration",
-        }
-        organizationId = urllib.parse.quote(str(organizationId), safe="")
-        integrationId = urllib.parse.quote(str(integrationId), safe="")
-        resource = f"/organizations/{organizationId}/sase/integrations/{integrationId}"
-
-        return self._session.delete(metadata, resource)
+        return dispatch.call(self._session, "deleteOrganizationSaseIntegration", organizationId, integrationId)
 
     def getOrganizationSaseNetworksEligible(self, organizationId: str, total_pages=1, direction="next", **kwargs):
         """
@@ -7455,30 +3247,14 @@ class AsyncOrganizations:
         - search (string): If provided, filters results by network name
         """
 
-        kwargs.update(locals())
-
-        metadata = {
-            "tags": ["organizations", "configure", "sase", "networks", "eligible"],
-            "operation": "getOrganizationSaseNetworksEligible",
-        }
-        organizationId = urllib.parse.quote(str(organizationId), safe="")
-        resource = f"/organizations/{organizationId}/sase/networks/eligible"
-
-        query_params = [
-            "perPage",
-            "startingAfter",
-            "endingBefore",
-            "search",
-        ]
-        params = {k.strip(): v for k, v in kwargs.items() if k.strip() in query_params}
-
-        if self._session._validate_kwargs:
-            all_params = query_params
-            invalid = [k for k in kwargs if k.strip() not in all_params and k != "self"]
-            if invalid and self._session._logger:
-                self._session._logger.warning(f"getOrganizationSaseNetworksEligible: ignoring unrecognized kwargs: {invalid}")
-
-        return self._session.get_pages(metadata, resource, params, total_pages, direction)
+        return dispatch.call(
+            self._session,
+            "getOrganizationSaseNetworksEligible",
+            organizationId,
+            total_pages=total_pages,
+            direction=direction,
+            **kwargs,
+        )
 
     def getOrganizationSaseRegions(self, organizationId: str):
         """
@@ -7488,14 +3264,7 @@ class AsyncOrganizations:
         - organizationId (string): Organization ID
         """
 
-        metadata = {
-            "tags": ["organizations", "configure", "sase", "regions"],
-            "operation": "getOrganizationSaseRegions",
-        }
-        organizationId = urllib.parse.quote(str(organizationId), safe="")
-        resource = f"/organizations/{organizationId}/sase/regions"
-
-        return self._session.get(metadata, resource)
+        return dispatch.call(self._session, "getOrganizationSaseRegions", organizationId)
 
     def getOrganizationSaseSites(self, organizationId: str, total_pages=1, direction="next", **kwargs):
         """
@@ -7513,38 +3282,9 @@ class AsyncOrganizations:
         - siteId (string): If provided, returns only the site matching this ID
         """
 
-        kwargs.update(locals())
-
-        if "status" in kwargs:
-            options = ["bad NAT", "bad tunnel", "dormant", "good", "many bad tunnels", "no registry", "offline"]
-            assert kwargs["status"] in options, (
-                f'''"status" cannot be "{kwargs["status"]}", & must be set to one of: {options}'''
-            )
-
-        metadata = {
-            "tags": ["organizations", "configure", "sase", "sites"],
-            "operation": "getOrganizationSaseSites",
-        }
-        organizationId = urllib.parse.quote(str(organizationId), safe="")
-        resource = f"/organizations/{organizationId}/sase/sites"
-
-        query_params = [
-            "perPage",
-            "startingAfter",
-            "endingBefore",
-            "search",
-            "status",
-            "siteId",
-        ]
-        params = {k.strip(): v for k, v in kwargs.items() if k.strip() in query_params}
-
-        if self._session._validate_kwargs:
-            all_params = query_params
-            invalid = [k for k in kwargs if k.strip() not in all_params and k != "self"]
-            if invalid and self._session._logger:
-                self._session._logger.warning(f"getOrganizationSaseSites: ignoring unrecognized kwargs: {invalid}")
-
-        return self._session.get_pages(metadata, resource, params, total_pages, direction)
+        return dispatch.call(
+            self._session, "getOrganizationSaseSites", organizationId, total_pages=total_pages, direction=direction, **kwargs
+        )
 
     def attachOrganizationSaseSites(self, organizationId: str, items: list, **kwargs):
         """
@@ -7555,27 +3295,7 @@ class AsyncOrganizations:
         - items (array): List of Meraki SD-WAN sites with the associated regions to be attached.
         """
 
-        kwargs = locals()
-
-        metadata = {
-            "tags": ["organizations", "configure", "sase", "sites"],
-            "operation": "attachOrganizationSaseSites",
-        }
-        organizationId = urllib.parse.quote(str(organizationId), safe="")
-        resource = f"/organizations/{organizationId}/sase/sites/attach"
-
-        body_params = [
-            "items",
-        ]
-        payload = {k.strip(): v for k, v in kwargs.items() if k.strip() in body_params}
-
-        if self._session._validate_kwargs:
-            all_params = [] + body_params
-            invalid = [k for k in kwargs if k.strip() not in all_params and k != "self"]
-            if invalid and self._session._logger:
-                self._session._logger.warning(f"attachOrganizationSaseSites: ignoring unrecognized kwargs: {invalid}")
-
-        return self._session.post(metadata, resource, payload)
+        return dispatch.call(self._session, "attachOrganizationSaseSites", organizationId, items, **kwargs)
 
     def getOrganizationSaseSitesConnectivityHistoryBySite(self, organizationId: str, **kwargs):
         """
@@ -7587,38 +3307,7 @@ class AsyncOrganizations:
         - timespan (string): Timespan for the status data (e.g., '-2hours')
         """
 
-        kwargs.update(locals())
-
-        metadata = {
-            "tags": ["organizations", "monitor", "sase", "sites", "connectivity", "history", "bySite"],
-            "operation": "getOrganizationSaseSitesConnectivityHistoryBySite",
-        }
-        organizationId = urllib.parse.quote(str(organizationId), safe="")
-        resource = f"/organizations/{organizationId}/sase/sites/connectivity/history/bySite"
-
-        query_params = [
-            "siteIds",
-            "timespan",
-        ]
-        params = {k.strip(): v for k, v in kwargs.items() if k.strip() in query_params}
-
-        array_params = [
-            "siteIds",
-        ]
-        for k, v in kwargs.items():
-            if k.strip() in array_params:
-                params[f"{k.strip()}[]"] = kwargs[f"{k}"]
-                params.pop(k.strip())
-
-        if self._session._validate_kwargs:
-            all_params = query_params + array_params
-            invalid = [k for k in kwargs if k.strip() not in all_params and k != "self"]
-            if invalid and self._session._logger:
-                self._session._logger.warning(
-                    f"getOrganizationSaseSitesConnectivityHistoryBySite: ignoring unrecognized kwargs: {invalid}"
-                )
-
-        return self._session.get(metadata, resource, params)
+        return dispatch.call(self._session, "getOrganizationSaseSitesConnectivityHistoryBySite", organizationId, **kwargs)
 
     def getOrganizationSaseSitesConnectivityOverview(self, organizationId: str):
         """
@@ -7628,14 +3317,7 @@ class AsyncOrganizations:
         - organizationId (string): Organization ID
         """
 
-        metadata = {
-            "tags": ["organizations", "configure", "sase", "sites", "connectivity", "overview"],
-            "operation": "getOrganizationSaseSitesConnectivityOverview",
-        }
-        organizationId = urllib.parse.quote(str(organizationId), safe="")
-        resource = f"/organizations/{organizationId}/sase/sites/connectivity/overview"
-
-        return self._session.get(metadata, resource)
+        return dispatch.call(self._session, "getOrganizationSaseSitesConnectivityOverview", organizationId)
 
     def detachOrganizationSaseSites(self, organizationId: str, **kwargs):
         """
@@ -7646,16 +3328,7 @@ class AsyncOrganizations:
         - items (array): List of Secure Access sites to be detached.
         """
 
-        kwargs.update(locals())
-
-        metadata = {
-            "tags": ["organizations", "configure", "sase", "sites"],
-            "operation": "detachOrganizationSaseSites",
-        }
-        organizationId = urllib.parse.quote(str(organizationId), safe="")
-        resource = f"/organizations/{organizationId}/sase/sites/detach"
-
-        return self._session.delete(metadata, resource)
+        return dispatch.call(self._session, "detachOrganizationSaseSites", organizationId, **kwargs)
 
     def updateOrganizationSaseSite(self, organizationId: str, siteId: str, **kwargs):
         """
@@ -7667,29 +3340,7 @@ class AsyncOrganizations:
         - routing (object): Routing configuration for the site
         """
 
-        kwargs.update(locals())
-
-        metadata = {
-            "tags": ["organizations", "configure", "sase", "sites"],
-            "operation": "updateOrganizationSaseSite",
-        }
-        organizationId = urllib.parse.quote(str(organizationId), safe="")
-        siteId = urllib.parse.quote(str(siteId), safe="")
-        resource = f"/organizations/{organizationId}/sase/sites/{siteId}"
-
-        body_params = [
-            "siteId",
-            "routing",
-        ]
-        payload = {k.strip(): v for k, v in kwargs.items() if k.strip() in body_params}
-
-        if self._session._validate_kwargs:
-            all_params = [] + body_params
-            invalid = [k for k in kwargs if k.strip() not in all_params and k != "self"]
-            if invalid and self._session._logger:
-                self._session._logger.warning(f"updateOrganizationSaseSite: ignoring unrecognized kwargs: {invalid}")
-
-        return self._session.put(metadata, resource, payload)
+        return dispatch.call(self._session, "updateOrganizationSaseSite", organizationId, siteId, **kwargs)
 
     def getOrganizationSnmp(self, organizationId: str):
         """
@@ -7699,14 +3350,7 @@ class AsyncOrganizations:
         - organizationId (string): Organization ID
         """
 
-        metadata = {
-            "tags": ["organizations", "configure", "snmp"],
-            "operation": "getOrganizationSnmp",
-        }
-        organizationId = urllib.parse.quote(str(organizationId), safe="")
-        resource = f"/organizations/{organizationId}/snmp"
-
-        return self._session.get(metadata, resource)
+        return dispatch.call(self._session, "getOrganizationSnmp", organizationId)
 
     def updateOrganizationSnmp(self, organizationId: str, **kwargs):
         """
@@ -7723,44 +3367,7 @@ class AsyncOrganizations:
         - peerIps (array): The list of IPv4 addresses that are allowed to access the SNMP server.
         """
 
-        kwargs.update(locals())
-
-        if "v3AuthMode" in kwargs:
-            options = ["MD5", "SHA"]
-            assert kwargs["v3AuthMode"] in options, (
-                f'''"v3AuthMode" cannot be "{kwargs["v3AuthMode"]}", & must be set to one of: {options}'''
-            )
-        if "v3PrivMode" in kwargs:
-            options = ["AES128", "DES"]
-            assert kwargs["v3PrivMode"] in options, (
-                f'''"v3PrivMode" cannot be "{kwargs["v3PrivMode"]}", & must be set to one of: {options}'''
-            )
-
-        metadata = {
-            "tags": ["organizations", "configure", "snmp"],
-            "operation": "updateOrganizationSnmp",
-        }
-        organizationId = urllib.parse.quote(str(organizationId), safe="")
-        resource = f"/organizations/{organizationId}/snmp"
-
-        body_params = [
-            "v2cEnabled",
-            "v3Enabled",
-            "v3AuthMode",
-            "v3AuthPass",
-            "v3PrivMode",
-            "v3PrivPass",
-            "peerIps",
-        ]
-        payload = {k.strip(): v for k, v in kwargs.items() if k.strip() in body_params}
-
-        if self._session._validate_kwargs:
-            all_params = [] + body_params
-            invalid = [k for k in kwargs if k.strip() not in all_params and k != "self"]
-            if invalid and self._session._logger:
-                self._session._logger.warning(f"updateOrganizationSnmp: ignoring unrecognized kwargs: {invalid}")
-
-        return self._session.put(metadata, resource, payload)
+        return dispatch.call(self._session, "updateOrganizationSnmp", organizationId, **kwargs)
 
     def getOrganizationSplashAsset(self, organizationId: str, id: str):
         """
@@ -7771,15 +3378,7 @@ class AsyncOrganizations:
         - id (string): ID
         """
 
-        metadata = {
-            "tags": ["organizations", "configure", "splash", "assets"],
-            "operation": "getOrganizationSplashAsset",
-        }
-        organizationId = urllib.parse.quote(str(organizationId), safe="")
-        id = urllib.parse.quote(str(id), safe="")
-        resource = f"/organizations/{organizationId}/splash/assets/{id}"
-
-        return self._session.get(metadata, resource)
+        return dispatch.call(self._session, "getOrganizationSplashAsset", organizationId, id)
 
     def deleteOrganizationSplashAsset(self, organizationId: str, id: str):
         """
@@ -7790,15 +3389,7 @@ class AsyncOrganizations:
         - id (string): ID
         """
 
-        metadata = {
-            "tags": ["organizations", "configure", "splash", "assets"],
-            "operation": "deleteOrganizationSplashAsset",
-        }
-        organizationId = urllib.parse.quote(str(organizationId), safe="")
-        id = urllib.parse.quote(str(id), safe="")
-        resource = f"/organizations/{organizationId}/splash/assets/{id}"
-
-        return self._session.delete(metadata, resource)
+        return dispatch.call(self._session, "deleteOrganizationSplashAsset", organizationId, id)
 
     def getOrganizationSplashThemes(self, organizationId: str):
         """
@@ -7808,14 +3399,7 @@ class AsyncOrganizations:
         - organizationId (string): Organization ID
         """
 
-        metadata = {
-            "tags": ["organizations", "configure", "splash", "themes"],
-            "operation": "getOrganizationSplashThemes",
-        }
-        organizationId = urllib.parse.quote(str(organizationId), safe="")
-        resource = f"/organizations/{organizationId}/splash/themes"
-
-        return self._session.get(metadata, resource)
+        return dispatch.call(self._session, "getOrganizationSplashThemes", organizationId)
 
     def createOrganizationSplashTheme(self, organizationId: str, **kwargs):
         """
@@ -7827,28 +3411,7 @@ class AsyncOrganizations:
         - baseTheme (string): base theme id
         """
 
-        kwargs.update(locals())
-
-        metadata = {
-            "tags": ["organizations", "configure", "splash", "themes"],
-            "operation": "createOrganizationSplashTheme",
-        }
-        organizationId = urllib.parse.quote(str(organizationId), safe="")
-        resource = f"/organizations/{organizationId}/splash/themes"
-
-        body_params = [
-            "name",
-            "baseTheme",
-        ]
-        payload = {k.strip(): v for k, v in kwargs.items() if k.strip() in body_params}
-
-        if self._session._validate_kwargs:
-            all_params = [] + body_params
-            invalid = [k for k in kwargs if k.strip() not in all_params and k != "self"]
-            if invalid and self._session._logger:
-                self._session._logger.warning(f"createOrganizationSplashTheme: ignoring unrecognized kwargs: {invalid}")
-
-        return self._session.post(metadata, resource, payload)
+        return dispatch.call(self._session, "createOrganizationSplashTheme", organizationId, **kwargs)
 
     def deleteOrganizationSplashTheme(self, organizationId: str, id: str):
         """
@@ -7859,15 +3422,7 @@ class AsyncOrganizations:
         - id (string): ID
         """
 
-        metadata = {
-            "tags": ["organizations", "configure", "splash", "themes"],
-            "operation": "deleteOrganizationSplashTheme",
-        }
-        organizationId = urllib.parse.quote(str(organizationId), safe="")
-        id = urllib.parse.quote(str(id), safe="")
-        resource = f"/organizations/{organizationId}/splash/themes/{id}"
-
-        return self._session.delete(metadata, resource)
+        return dispatch.call(self._session, "deleteOrganizationSplashTheme", organizationId, id)
 
     def createOrganizationSplashThemeAsset(self, organizationId: str, themeIdentifier: str, **kwargs):
         """
@@ -7880,29 +3435,7 @@ class AsyncOrganizations:
         - content (string): a file containing the asset content
         """
 
-        kwargs.update(locals())
-
-        metadata = {
-            "tags": ["organizations", "configure", "splash", "themes", "assets"],
-            "operation": "createOrganizationSplashThemeAsset",
-        }
-        organizationId = urllib.parse.quote(str(organizationId), safe="")
-        themeIdentifier = urllib.parse.quote(str(themeIdentifier), safe="")
-        resource = f"/organizations/{organizationId}/splash/themes/{themeIdentifier}/assets"
-
-        body_params = [
-            "name",
-            "content",
-        ]
-        payload = {k.strip(): v for k, v in kwargs.items() if k.strip() in body_params}
-
-        if self._session._validate_kwargs:
-            all_params = [] + body_params
-            invalid = [k for k in kwargs if k.strip() not in all_params and k != "self"]
-            if invalid and self._session._logger:
-                self._session._logger.warning(f"createOrganizationSplashThemeAsset: ignoring unrecognized kwargs: {invalid}")
-
-        return self._session.post(metadata, resource, payload)
+        return dispatch.call(self._session, "createOrganizationSplashThemeAsset", organizationId, themeIdentifier, **kwargs)
 
     def getOrganizationSummaryTopAppliancesByUtilization(self, organizationId: str, **kwargs):
         """
@@ -7920,36 +3453,7 @@ class AsyncOrganizations:
         - timespan (number): The timespan for which the information will be fetched. If specifying timespan, do not specify parameters t0 and t1. The value must be in seconds and be greater than or equal to 25 minutes and be less than or equal to 186 days. The default is 1 day.
         """
 
-        kwargs.update(locals())
-
-        metadata = {
-            "tags": ["organizations", "monitor", "summary", "top", "appliances", "byUtilization"],
-            "operation": "getOrganizationSummaryTopAppliancesByUtilization",
-        }
-        organizationId = urllib.parse.quote(str(organizationId), safe="")
-        resource = f"/organizations/{organizationId}/summary/top/appliances/byUtilization"
-
-        query_params = [
-            "networkTag",
-            "deviceTag",
-            "quantity",
-            "ssidName",
-            "usageUplink",
-            "t0",
-            "t1",
-            "timespan",
-        ]
-        params = {k.strip(): v for k, v in kwargs.items() if k.strip() in query_params}
-
-        if self._session._validate_kwargs:
-            all_params = query_params
-            invalid = [k for k in kwargs if k.strip() not in all_params and k != "self"]
-            if invalid and self._session._logger:
-                self._session._logger.warning(
-                    f"getOrganizationSummaryTopAppliancesByUtilization: ignoring unrecognized kwargs: {invalid}"
-                )
-
-        return self._session.get(metadata, resource, params)
+        return dispatch.call(self._session, "getOrganizationSummaryTopAppliancesByUtilization", organizationId, **kwargs)
 
     def getOrganizationSummaryTopApplicationsByUsage(self, organizationId: str, **kwargs):
         """
@@ -7968,37 +3472,7 @@ class AsyncOrganizations:
         - timespan (number): The timespan for which the information will be fetched. If specifying timespan, do not specify parameters t0 and t1. The value must be in seconds and be greater than or equal to 25 minutes and be less than or equal to 186 days. The default is 1 day.
         """
 
-        kwargs.update(locals())
-
-        metadata = {
-            "tags": ["organizations", "monitor", "summary", "top", "applications", "byUsage"],
-            "operation": "getOrganizationSummaryTopApplicationsByUsage",
-        }
-        organizationId = urllib.parse.quote(str(organizationId), safe="")
-        resource = f"/organizations/{organizationId}/summary/top/applications/byUsage"
-
-        query_params = [
-            "networkTag",
-            "device",
-            "networkId",
-            "quantity",
-            "ssidName",
-            "usageUplink",
-            "t0",
-            "t1",
-            "timespan",
-        ]
-        params = {k.strip(): v for k, v in kwargs.items() if k.strip() in query_params}
-
-        if self._session._validate_kwargs:
-            all_params = query_params
-            invalid = [k for k in kwargs if k.strip() not in all_params and k != "self"]
-            if invalid and self._session._logger:
-                self._session._logger.warning(
-                    f"getOrganizationSummaryTopApplicationsByUsage: ignoring unrecognized kwargs: {invalid}"
-                )
-
-        return self._session.get(metadata, resource, params)
+        return dispatch.call(self._session, "getOrganizationSummaryTopApplicationsByUsage", organizationId, **kwargs)
 
     def getOrganizationSummaryTopApplicationsCategoriesByUsage(self, organizationId: str, **kwargs):
         """
@@ -8017,37 +3491,7 @@ class AsyncOrganizations:
         - timespan (number): The timespan for which the information will be fetched. If specifying timespan, do not specify parameters t0 and t1. The value must be in seconds and be greater than or equal to 25 minutes and be less than or equal to 186 days. The default is 1 day.
         """
 
-        kwargs.update(locals())
-
-        metadata = {
-            "tags": ["organizations", "monitor", "summary", "top", "applications", "categories", "byUsage"],
-            "operation": "getOrganizationSummaryTopApplicationsCategoriesByUsage",
-        }
-        organizationId = urllib.parse.quote(str(organizationId), safe="")
-        resource = f"/organizations/{organizationId}/summary/top/applications/categories/byUsage"
-
-        query_params = [
-            "networkTag",
-            "deviceTag",
-            "networkId",
-            "quantity",
-            "ssidName",
-            "usageUplink",
-            "t0",
-            "t1",
-            "timespan",
-        ]
-        params = {k.strip(): v for k, v in kwargs.items() if k.strip() in query_params}
-
-        if self._session._validate_kwargs:
-            all_params = query_params
-            invalid = [k for k in kwargs if k.strip() not in all_params and k != "self"]
-            if invalid and self._session._logger:
-                self._session._logger.warning(
-                    f"getOrganizationSummaryTopApplicationsCategoriesByUsage: ignoring unrecognized kwargs: {invalid}"
-                )
-
-        return self._session.get(metadata, resource, params)
+        return dispatch.call(self._session, "getOrganizationSummaryTopApplicationsCategoriesByUsage", organizationId, **kwargs)
 
     def getOrganizationSummaryTopClientsByUsage(self, organizationId: str, **kwargs):
         """
@@ -8065,36 +3509,7 @@ class AsyncOrganizations:
         - timespan (number): The timespan for which the information will be fetched. If specifying timespan, do not specify parameters t0 and t1. The value must be in seconds and be greater than or equal to 8 hours and be less than or equal to 186 days. The default is 1 day.
         """
 
-        kwargs.update(locals())
-
-        metadata = {
-            "tags": ["organizations", "monitor", "summary", "top", "clients", "byUsage"],
-            "operation": "getOrganizationSummaryTopClientsByUsage",
-        }
-        organizationId = urllib.parse.quote(str(organizationId), safe="")
-        resource = f"/organizations/{organizationId}/summary/top/clients/byUsage"
-
-        query_params = [
-            "networkTag",
-            "deviceTag",
-            "quantity",
-            "ssidName",
-            "usageUplink",
-            "t0",
-            "t1",
-            "timespan",
-        ]
-        params = {k.strip(): v for k, v in kwargs.items() if k.strip() in query_params}
-
-        if self._session._validate_kwargs:
-            all_params = query_params
-            invalid = [k for k in kwargs if k.strip() not in all_params and k != "self"]
-            if invalid and self._session._logger:
-                self._session._logger.warning(
-                    f"getOrganizationSummaryTopClientsByUsage: ignoring unrecognized kwargs: {invalid}"
-                )
-
-        return self._session.get(metadata, resource, params)
+        return dispatch.call(self._session, "getOrganizationSummaryTopClientsByUsage", organizationId, **kwargs)
 
     def getOrganizationSummaryTopClientsManufacturersByUsage(self, organizationId: str, **kwargs):
         """
@@ -8112,36 +3527,7 @@ class AsyncOrganizations:
         - timespan (number): The timespan for which the information will be fetched. If specifying timespan, do not specify parameters t0 and t1. The value must be in seconds and be less than or equal to 186 days. The default is 1 day.
         """
 
-        kwargs.update(locals())
-
-        metadata = {
-            "tags": ["organizations", "monitor", "summary", "top", "clients", "manufacturers", "byUsage"],
-            "operation": "getOrganizationSummaryTopClientsManufacturersByUsage",
-        }
-        organizationId = urllib.parse.quote(str(organizationId), safe="")
-        resource = f"/organizations/{organizationId}/summary/top/clients/manufacturers/byUsage"
-
-        query_params = [
-            "networkTag",
-            "deviceTag",
-            "quantity",
-            "ssidName",
-            "usageUplink",
-            "t0",
-            "t1",
-            "timespan",
-        ]
-        params = {k.strip(): v for k, v in kwargs.items() if k.strip() in query_params}
-
-        if self._session._validate_kwargs:
-            all_params = query_params
-            invalid = [k for k in kwargs if k.strip() not in all_params and k != "self"]
-            if invalid and self._session._logger:
-                self._session._logger.warning(
-                    f"getOrganizationSummaryTopClientsManufacturersByUsage: ignoring unrecognized kwargs: {invalid}"
-                )
-
-        return self._session.get(metadata, resource, params)
+        return dispatch.call(self._session, "getOrganizationSummaryTopClientsManufacturersByUsage", organizationId, **kwargs)
 
     def getOrganizationSummaryTopDevicesByUsage(self, organizationId: str, **kwargs):
         """
@@ -8159,36 +3545,7 @@ class AsyncOrganizations:
         - timespan (number): The timespan for which the information will be fetched. If specifying timespan, do not specify parameters t0 and t1. The value must be in seconds and be greater than or equal to 8 hours and be less than or equal to 186 days. The default is 1 day.
         """
 
-        kwargs.update(locals())
-
-        metadata = {
-            "tags": ["organizations", "monitor", "summary", "top", "devices", "byUsage"],
-            "operation": "getOrganizationSummaryTopDevicesByUsage",
-        }
-        organizationId = urllib.parse.quote(str(organizationId), safe="")
-        resource = f"/organizations/{organizationId}/summary/top/devices/byUsage"
-
-        query_params = [
-            "networkTag",
-            "deviceTag",
-            "quantity",
-            "ssidName",
-            "usageUplink",
-            "t0",
-            "t1",
-            "timespan",
-        ]
-        params = {k.strip(): v for k, v in kwargs.items() if k.strip() in query_params}
-
-        if self._session._validate_kwargs:
-            all_params = query_params
-            invalid = [k for k in kwargs if k.strip() not in all_params and k != "self"]
-            if invalid and self._session._logger:
-                self._session._logger.warning(
-                    f"getOrganizationSummaryTopDevicesByUsage: ignoring unrecognized kwargs: {invalid}"
-                )
-
-        return self._session.get(metadata, resource, params)
+        return dispatch.call(self._session, "getOrganizationSummaryTopDevicesByUsage", organizationId, **kwargs)
 
     def getOrganizationSummaryTopDevicesModelsByUsage(self, organizationId: str, **kwargs):
         """
@@ -8206,36 +3563,7 @@ class AsyncOrganizations:
         - timespan (number): The timespan for which the information will be fetched. If specifying timespan, do not specify parameters t0 and t1. The value must be in seconds and be greater than or equal to 8 hours and be less than or equal to 186 days. The default is 1 day.
         """
 
-        kwargs.update(locals())
-
-        metadata = {
-            "tags": ["organizations", "monitor", "summary", "top", "devices", "models", "byUsage"],
-            "operation": "getOrganizationSummaryTopDevicesModelsByUsage",
-        }
-        organizationId = urllib.parse.quote(str(organizationId), safe="")
-        resource = f"/organizations/{organizationId}/summary/top/devices/models/byUsage"
-
-        query_params = [
-            "networkTag",
-            "deviceTag",
-            "quantity",
-            "ssidName",
-            "usageUplink",
-            "t0",
-            "t1",
-            "timespan",
-        ]
-        params = {k.strip(): v for k, v in kwargs.items() if k.strip() in query_params}
-
-        if self._session._validate_kwargs:
-            all_params = query_params
-            invalid = [k for k in kwargs if k.strip() not in all_params and k != "self"]
-            if invalid and self._session._logger:
-                self._session._logger.warning(
-                    f"getOrganizationSummaryTopDevicesModelsByUsage: ignoring unrecognized kwargs: {invalid}"
-                )
-
-        return self._session.get(metadata, resource, params)
+        return dispatch.call(self._session, "getOrganizationSummaryTopDevicesModelsByUsage", organizationId, **kwargs)
 
     def getOrganizationSummaryTopNetworksByStatus(self, organizationId: str, total_pages=1, direction="next", **kwargs):
         """
@@ -8255,36 +3583,14 @@ class AsyncOrganizations:
         - endingBefore (string): A token used by the server to indicate the end of the page. Often this is a timestamp or an ID but it is not limited to those. This parameter should not be defined by client applications. The link for the first, last, prev, or next page in the HTTP Link header should define it.
         """
 
-        kwargs.update(locals())
-
-        metadata = {
-            "tags": ["organizations", "monitor", "summary", "top", "networks", "byStatus"],
-            "operation": "getOrganizationSummaryTopNetworksByStatus",
-        }
-        organizationId = urllib.parse.quote(str(organizationId), safe="")
-        resource = f"/organizations/{organizationId}/summary/top/networks/byStatus"
-
-        query_params = [
-            "networkTag",
-            "deviceTag",
-            "quantity",
-            "ssidName",
-            "usageUplink",
-            "perPage",
-            "startingAfter",
-            "endingBefore",
-        ]
-        params = {k.strip(): v for k, v in kwargs.items() if k.strip() in query_params}
-
-        if self._session._validate_kwargs:
-            all_params = query_params
-            invalid = [k for k in kwargs if k.strip() not in all_params and k != "self"]
-            if invalid and self._session._logger:
-                self._session._logger.warning(
-                    f"getOrganizationSummaryTopNetworksByStatus: ignoring unrecognized kwargs: {invalid}"
-                )
-
-        return self._session.get_pages(metadata, resource, params, total_pages, direction)
+        return dispatch.call(
+            self._session,
+            "getOrganizationSummaryTopNetworksByStatus",
+            organizationId,
+            total_pages=total_pages,
+            direction=direction,
+            **kwargs,
+        )
 
     def getOrganizationSummaryTopSsidsByUsage(self, organizationId: str, **kwargs):
         """
@@ -8302,36 +3608,7 @@ class AsyncOrganizations:
         - timespan (number): The timespan for which the information will be fetched. If specifying timespan, do not specify parameters t0 and t1. The value must be in seconds and be greater than or equal to 8 hours and be less than or equal to 186 days. The default is 1 day.
         """
 
-        kwargs.update(locals())
-
-        metadata = {
-            "tags": ["organizations", "monitor", "summary", "top", "ssids", "byUsage"],
-            "operation": "getOrganizationSummaryTopSsidsByUsage",
-        }
-        organizationId = urllib.parse.quote(str(organizationId), safe="")
-        resource = f"/organizations/{organizationId}/summary/top/ssids/byUsage"
-
-        query_params = [
-            "networkTag",
-            "deviceTag",
-            "quantity",
-            "ssidName",
-            "usageUplink",
-            "t0",
-            "t1",
-            "timespan",
-        ]
-        params = {k.strip(): v for k, v in kwargs.items() if k.strip() in query_params}
-
-        if self._session._validate_kwargs:
-            all_params = query_params
-            invalid = [k for k in kwargs if k.strip() not in all_params and k != "self"]
-            if invalid and self._session._logger:
-                self._session._logger.warning(
-                    f"getOrganizationSummaryTopSsidsByUsage: ignoring unrecognized kwargs: {invalid}"
-                )
-
-        return self._session.get(metadata, resource, params)
+        return dispatch.call(self._session, "getOrganizationSummaryTopSsidsByUsage", organizationId, **kwargs)
 
     def getOrganizationSummaryTopSwitchesByEnergyUsage(self, organizationId: str, **kwargs):
         """
@@ -8349,36 +3626,7 @@ class AsyncOrganizations:
         - timespan (number): The timespan for which the information will be fetched. If specifying timespan, do not specify parameters t0 and t1. The value must be in seconds and be greater than or equal to 25 minutes and be less than or equal to 186 days. The default is 1 day.
         """
 
-        kwargs.update(locals())
-
-        metadata = {
-            "tags": ["organizations", "monitor", "summary", "top", "switches", "byEnergyUsage"],
-            "operation": "getOrganizationSummaryTopSwitchesByEnergyUsage",
-        }
-        organizationId = urllib.parse.quote(str(organizationId), safe="")
-        resource = f"/organizations/{organizationId}/summary/top/switches/byEnergyUsage"
-
-        query_params = [
-            "networkTag",
-            "deviceTag",
-            "quantity",
-            "ssidName",
-            "usageUplink",
-            "t0",
-            "t1",
-            "timespan",
-        ]
-        params = {k.strip(): v for k, v in kwargs.items() if k.strip() in query_params}
-
-        if self._session._validate_kwargs:
-            all_params = query_params
-            invalid = [k for k in kwargs if k.strip() not in all_params and k != "self"]
-            if invalid and self._session._logger:
-                self._session._logger.warning(
-                    f"getOrganizationSummaryTopSwitchesByEnergyUsage: ignoring unrecognized kwargs: {invalid}"
-                )
-
-        return self._session.get(metadata, resource, params)
+        return dispatch.call(self._session, "getOrganizationSummaryTopSwitchesByEnergyUsage", organizationId, **kwargs)
 
     def getOrganizationUplinksStatuses(self, organizationId: str, total_pages=1, direction="next", **kwargs):
         """
@@ -8396,42 +3644,14 @@ class AsyncOrganizations:
         - iccids (array): A list of ICCIDs. The returned devices will be filtered to only include these ICCIDs.
         """
 
-        kwargs.update(locals())
-
-        metadata = {
-            "tags": ["organizations", "monitor", "uplinks", "statuses"],
-            "operation": "getOrganizationUplinksStatuses",
-        }
-        organizationId = urllib.parse.quote(str(organizationId), safe="")
-        resource = f"/organizations/{organizationId}/uplinks/statuses"
-
-        query_params = [
-            "perPage",
-            "startingAfter",
-            "endingBefore",
-            "networkIds",
-            "serials",
-            "iccids",
-        ]
-        params = {k.strip(): v for k, v in kwargs.items() if k.strip() in query_params}
-
-        array_params = [
-            "networkIds",
-            "serials",
-            "iccids",
-        ]
-        for k, v in kwargs.items():
-            if k.strip() in array_params:
-                params[f"{k.strip()}[]"] = kwargs[f"{k}"]
-                params.pop(k.strip())
-
-        if self._session._validate_kwargs:
-            all_params = query_params + array_params
-            invalid = [k for k in kwargs if k.strip() not in all_params and k != "self"]
-            if invalid and self._session._logger:
-                self._session._logger.warning(f"getOrganizationUplinksStatuses: ignoring unrecognized kwargs: {invalid}")
-
-        return self._session.get_pages(metadata, resource, params, total_pages, direction)
+        return dispatch.call(
+            self._session,
+            "getOrganizationUplinksStatuses",
+            organizationId,
+            total_pages=total_pages,
+            direction=direction,
+            **kwargs,
+        )
 
     def getOrganizationWebhooksAlertTypes(self, organizationId: str, **kwargs):
         """
@@ -8442,33 +3662,7 @@ class AsyncOrganizations:
         - productType (string): Filter sample alerts to a specific product type
         """
 
-        kwargs.update(locals())
-
-        if "productType" in kwargs:
-            options = ["appliance", "camera", "cellularGateway", "platform", "sensor", "sm", "switch", "wireless"]
-            assert kwargs["productType"] in options, (
-                f'''"productType" cannot be "{kwargs["productType"]}", & must be set to one of: {options}'''
-            )
-
-        metadata = {
-            "tags": ["organizations", "monitor", "webhooks", "alertTypes"],
-            "operation": "getOrganizationWebhooksAlertTypes",
-        }
-        organizationId = urllib.parse.quote(str(organizationId), safe="")
-        resource = f"/organizations/{organizationId}/webhooks/alertTypes"
-
-        query_params = [
-            "productType",
-        ]
-        params = {k.strip(): v for k, v in kwargs.items() if k.strip() in query_params}
-
-        if self._session._validate_kwargs:
-            all_params = query_params
-            invalid = [k for k in kwargs if k.strip() not in all_params and k != "self"]
-            if invalid and self._session._logger:
-                self._session._logger.warning(f"getOrganizationWebhooksAlertTypes: ignoring unrecognized kwargs: {invalid}")
-
-        return self._session.get(metadata, resource, params)
+        return dispatch.call(self._session, "getOrganizationWebhooksAlertTypes", organizationId, **kwargs)
 
     def getOrganizationWebhooksCallbacksStatus(self, organizationId: str, callbackId: str):
         """
@@ -8479,15 +3673,7 @@ class AsyncOrganizations:
         - callbackId (string): Callback ID
         """
 
-        metadata = {
-            "tags": ["organizations", "configure", "webhooks", "callbacks", "statuses"],
-            "operation": "getOrganizationWebhooksCallbacksStatus",
-        }
-        organizationId = urllib.parse.quote(str(organizationId), safe="")
-        callbackId = urllib.parse.quote(str(callbackId), safe="")
-        resource = f"/organizations/{organizationId}/webhooks/callbacks/statuses/{callbackId}"
-
-        return self._session.get(metadata, resource)
+        return dispatch.call(self._session, "getOrganizationWebhooksCallbacksStatus", organizationId, callbackId)
 
     def getOrganizationWebhooksLogs(self, organizationId: str, total_pages=1, direction="next", **kwargs):
         """
@@ -8506,30 +3692,11 @@ class AsyncOrganizations:
         - url (string): The URL the webhook was sent to
         """
 
-        kwargs.update(locals())
-
-        metadata = {
-            "tags": ["organizations", "monitor", "webhooks", "logs"],
-            "operation": "getOrganizationWebhooksLogs",
-        }
-        organizationId = urllib.parse.quote(str(organizationId), safe="")
-        resource = f"/organizations/{organizationId}/webhooks/logs"
-
-        query_params = [
-            "t0",
-            "t1",
-            "timespan",
-            "perPage",
-            "startingAfter",
-            "endingBefore",
-            "url",
-        ]
-        params = {k.strip(): v for k, v in kwargs.items() if k.strip() in query_params}
-
-        if self._session._validate_kwargs:
-            all_params = query_params
-            invalid = [k for k in kwargs if k.strip() not in all_params and k != "self"]
-            if invalid and self._session._logger:
-                self._session._logger.warning(f"getOrganizationWebhooksLogs: ignoring unrecognized kwargs: {invalid}")
-
-        return self._session.get_pages(metadata, resource, params, total_pages, direction)
+        return dispatch.call(
+            self._session,
+            "getOrganizationWebhooksLogs",
+            organizationId,
+            total_pages=total_pages,
+            direction=direction,
+            **kwargs,
+        )
@@ -1,4 +1,4 @@
-import urllib
+from meraki import dispatch
 
 
 class AsyncSm:
@@ -15,29 +15,7 @@ class AsyncSm:
         - ids (array): The ids of the devices to attempt activation lock bypass.
         """
 
-        kwargs = locals()
-
-        metadata = {
-            "tags": ["sm", "configure", "bypassActivationLockAttempts"],
-            "operation": "createNetworkSmBypassActivationLockAttempt",
-        }
-        networkId = urllib.parse.quote(str(networkId), safe="")
-        resource = f"/networks/{networkId}/sm/bypassActivationLockAttempts"
-
-        body_params = [
-            "ids",
-        ]
-        payload = {k.strip(): v for k, v in kwargs.items() if k.strip() in body_params}
-
-        if self._session._validate_kwargs:
-            all_params = [] + body_params
-            invalid = [k for k in kwargs if k.strip() not in all_params and k != "self"]
-            if invalid and self._session._logger:
-                self._session._logger.warning(
-                    f"createNetworkSmBypassActivationLockAttempt: ignoring unrecognized kwargs: {invalid}"
-                )
-
-        return self._session.post(metadata, resource, payload)
+        return dispatch.call(self._session, "createNetworkSmBypassActivationLockAttempt", networkId, ids, **kwargs)
 
     def getNetworkSmBypassActivationLockAttempt(self, networkId: str, attemptId: str):
         """
@@ -48,15 +26,7 @@ class AsyncSm:
         - attemptId (string): Attempt ID
         """
 
-        metadata = {
-            "tags": ["sm", "configure", "bypassActivationLockAttempts"],
-            "operation": "getNetworkSmBypassActivationLockAttempt",
-        }
-        networkId = urllib.parse.quote(str(networkId), safe="")
-        attemptId = urllib.parse.quote(str(attemptId), safe="")
-        resource = f"/networks/{networkId}/sm/bypassActivationLockAttempts/{attemptId}"
-
-        return self._session.get(metadata, resource)
+        return dispatch.call(self._session, "getNetworkSmBypassActivationLockAttempt", networkId, attemptId)
 
     def getNetworkSmDevices(self, networkId: str, total_pages=1, direction="next", **kwargs):
         """
@@ -84,50 +54,9 @@ class AsyncSm:
             - endingBefore (string): A token used by the server to indicate the end of the page. Often this is a timestamp or an ID but it is not limited to those. This parameter should not be defined by client applications. The link for the first, last, prev, or next page in the HTTP Link header should define it.
         """
 
-        kwargs.update(locals())
-
-        metadata = {
-            "tags": ["sm", "configure", "devices"],
-            "operation": "getNetworkSmDevices",
-        }
-        networkId = urllib.parse.quote(str(networkId), safe="")
-        resource = f"/networks/{networkId}/sm/devices"
-
-        query_params = [
-            "fields",
-            "wifiMacs",
-            "serials",
-            "ids",
-            "uuids",
-            "systemTypes",
-            "scope",
-            "perPage",
-            "startingAfter",
-            "endingBefore",
-        ]
-        params = {k.strip(): v for k, v in kwargs.items() if k.strip() in query_params}
-
-        array_params = [
-            "fields",
-            "wifiMacs",
-            "serials",
-            "ids",
-            "uuids",
-            "systemTypes",
-            "scope",
-        ]
-        for k, v in kwargs.items():
-            if k.strip() in array_params:
-                params[f"{k.strip()}[]"] = kwargs[f"{k}"]
-                params.pop(k.strip())
-
-        if self._session._validate_kwargs:
-            all_params = query_params + array_params
-            invalid = [k for k in kwargs if k.strip() not in all_params and k != "self"]
-            if invalid and self._session._logger:
-                self._session._logger.warning(f"getNetworkSmDevices: ignoring unrecognized kwargs: {invalid}")
-
-        return self._session.get_pages(metadata, resource, params, total_pages, direction)
+        return dispatch.call(
+            self._session, "getNetworkSmDevices", networkId, total_pages=total_pages, direction=direction, **kwargs
+        )
 
     def checkinNetworkSmDevices(self, networkId: str, **kwargs):
         """
@@ -141,30 +70,7 @@ class AsyncSm:
         - scope (array): The scope (one of all, none, withAny, withAll, withoutAny, or withoutAll) and a set of tags of the devices to be checked-in.
         """
 
-        kwargs.update(locals())
-
-        metadata = {
-            "tags": ["sm", "configure", "devices"],
-            "operation": "checkinNetworkSmDevices",
-        }
-        networkId = urllib.parse.quote(str(networkId), safe="")
-        resource = f"/networks/{networkId}/sm/devices/checkin"
-
-        body_params = [
-            "wifiMacs",
-            "ids",
-            "serials",
-            "scope",
-        ]
-        payload = {k.strip(): v for k, v in kwargs.items() if k.strip() in body_params}
-
-        if self._session._validate_kwargs:
-            all_params = [] + body_params
-            invalid = [k for k in kwargs if k.strip() not in all_params and k != "self"]
-            if invalid and self._session._logger:
-                self._session._logger.warning(f"checkinNetworkSmDevices: ignoring unrecognized kwargs: {invalid}")
-
-        return self._session.post(metadata, resource, payload)
+        return dispatch.call(self._session, "checkinNetworkSmDevices", networkId, **kwargs)
 
     def updateNetworkSmDevicesFields(self, networkId: str, deviceFields: dict, **kwargs):
         """
@@ -178,30 +84,7 @@ class AsyncSm:
         - serial (string): The serial of the device to be modified.
         """
 
-        kwargs.update(locals())
-
-        metadata = {
-            "tags": ["sm", "configure", "devices", "fields"],
-            "operation": "updateNetworkSmDevicesFields",
-        }
-        networkId = urllib.parse.quote(str(networkId), safe="")
-        resource = f"/networks/{networkId}/sm/devices/fields"
-
-        body_params = [
-            "wifiMac",
-            "id",
-            "serial",
-            "deviceFields",
-        ]
-        payload = {k.strip(): v for k, v in kwargs.items() if k.strip() in body_params}
-
-        if self._session._validate_kwargs:
-            all_params = [] + body_params
-            invalid = [k for k in kwargs if k.strip() not in all_params and k != "self"]
-            if invalid and self._session._logger:
-                self._session._logger.warning(f"updateNetworkSmDevicesFields: ignoring unrecognized kwargs: {invalid}")
-
-        return self._session.put(metadata, resource, payload)
+        return dispatch.call(self._session, "updateNetworkSmDevicesFields", networkId, deviceFields, **kwargs)
 
     def lockNetworkSmDevices(self, networkId: str, **kwargs):
         """
@@ -216,31 +99,7 @@ class AsyncSm:
         - pin (integer): The pin number for locking macOS devices (a six digit number). Required only for macOS devices.
         """
 
-        kwargs.update(locals())
-
-        metadata = {
-            "tags": ["sm", "configure", "devices"],
-            "operation": "lockNetworkSmDevices",
-        }
-        networkId = urllib.parse.quote(str(networkId), safe="")
-        resource = f"/networks/{networkId}/sm/devices/lock"
-
-        body_params = [
-            "wifiMacs",
-            "ids",
-            "serials",
-            "scope",
-            "pin",
-        ]
-        payload = {k.strip(): v for k, v in kwargs.items() if k.strip() in body_params}
-
-        if self._session._validate_kwargs:
-            all_params = [] + body_params
-            invalid = [k for k in kwargs if k.strip() not in all_params and k != "self"]
-            if invalid and self._session._logger:
-                self._session._logger.warning(f"lockNetworkSmDevices: ignoring unrecognized kwargs: {invalid}")
-
-        return self._session.post(metadata, resource, payload)
+        return dispatch.call(self._session, "lockNetworkSmDevices", networkId, **kwargs)
 
     def modifyNetworkSmDevicesTags(self, networkId: str, tags: list, updateAction: str, **kwargs):
         """
@@ -256,32 +115,7 @@ class AsyncSm:
         - scope (array): The scope (one of all, none, withAny, withAll, withoutAny, or withoutAll) and a set of tags of the devices to be modified.
         """
 
-        kwargs.update(locals())
-
-        metadata = {
-            "tags": ["sm", "configure", "devices"],
-            "operation": "modifyNetworkSmDevicesTags",
-        }
-        networkId = urllib.parse.quote(str(networkId), safe="")
-        resource = f"/networks/{networkId}/sm/devices/modifyTags"
-
-        body_params = [
-            "wifiMacs",
-            "ids",
-            "serials",
-            "scope",
-            "tags",
-            "updateAction",
-        ]
-        payload = {k.strip(): v for k, v in kwargs.items() if k.strip() in body_params}
-
-        if self._session._validate_kwargs:
-            all_params = [] + body_params
-            invalid = [k for k in kwargs if k.strip() not in all_params and k != "self"]
-            if invalid and self._session._logger:
-                self._session._logger.warning(f"modifyNetworkSmDevicesTags: ignoring unrecognized kwargs: {invalid}")
-
-        return self._session.post(metadata, resource, payload)
+        return dispatch.call(self._session, "modifyNetworkSmDevicesTags", networkId, tags, updateAction, **kwargs)
 
     def moveNetworkSmDevices(self, networkId: str, newNetwork: str, **kwargs):
         """
@@ -296,31 +130,7 @@ class AsyncSm:
         - scope (array): The scope (one of all, none, withAny, withAll, withoutAny, or withoutAll) and a set of tags of the devices to be moved.
         """
 
-        kwargs.update(locals())
-
-        metadata = {
-            "tags": ["sm", "configure", "devices"],
-            "operation": "moveNetworkSmDevices",
-        }
-        networkId = urllib.parse.quote(str(networkId), safe="")
-        resource = f"/networks/{networkId}/sm/devices/move"
-
-        body_params = [
-            "wifiMacs",
-            "ids",
-            "serials",
-            "scope",
-            "newNetwork",
-        ]
-        payload = {k.strip(): v for k, v in kwargs.items() if k.strip() in body_params}
-
-        if self._session._validate_kwargs:
-            all_params = [] + body_params
-            invalid = [k for k in kwargs if k.strip() not in all_params and k != "self"]
-            if invalid and self._session._logger:
-                self._session._logger.warning(f"moveNetworkSmDevices: ignoring unrecognized kwargs: {invalid}")
-
-        return self._session.post(metadata, resource, payload)
+        return dispatch.call(self._session, "moveNetworkSmDevices", networkId, newNetwork, **kwargs)
 
     def rebootNetworkSmDevices(self, networkId: str, **kwargs):
         """
@@ -338,34 +148,7 @@ class AsyncSm:
         - requestRequiresNetworkTether (boolean): Whether or not the request requires network tethering. Available for macOS and supervised iOS or tvOS
         """
 
-        kwargs.update(locals())
-
-        metadata = {
-            "tags": ["sm", "configure", "devices"],
-            "operation": "rebootNetworkSmDevices",
-        }
-        networkId = urllib.parse.quote(str(networkId), safe="")
-        resource = f"/networks/{networkId}/sm/devices/reboot"
-
-        body_params = [
-            "wifiMacs",
-            "ids",
-            "serials",
-            "scope",
-            "kextPaths",
-            "notifyUser",
-            "rebuildKernelCache",
-            "requestRequiresNetworkTether",
-        ]
-        payload = {k.strip(): v for k, v in kwargs.items() if k.strip() in body_params}
-
-        if self._session._validate_kwargs:
-            all_params = [] + body_params
-            invalid = [k for k in kwargs if k.strip() not in all_params and k != "self"]
-            if invalid and self._session._logger:
-                self._session._logger.warning(f"rebootNetworkSmDevices: ignoring unrecognized kwargs: {invalid}")
-
-        return self._session.post(metadata, resource, payload)
+        return dispatch.call(self._session, "rebootNetworkSmDevices", networkId, **kwargs)
 
     def shutdownNetworkSmDevices(self, networkId: str, **kwargs):
         """
@@ -379,30 +162,7 @@ class AsyncSm:
         - scope (array): The scope (one of all, none, withAny, withAll, withoutAny, or withoutAll) and a set of tags of the endpoints to be shutdown.
         """
 
-        kwargs.update(locals())
-
-        metadata = {
-            "tags": ["sm", "configure", "devices"],
-            "operation": "shutdownNetworkSmDevices",
-        }
-        networkId = urllib.parse.quote(str(networkId), safe="")
-        resource = f"/networks/{networkId}/sm/devices/shutdown"
-
-        body_params = [
-            "wifiMacs",
-            "ids",
-            "serials",
-            "scope",
-        ]
-        payload = {k.strip(): v for k, v in kwargs.items() if k.strip() in body_params}
-
-        if self._session._validate_kwargs:
-            all_params = [] + body_params
-            invalid = [k for k in kwargs if k.strip() not in all_params and k != "self"]
-            if invalid and self._session._logger:
-                self._session._logger.warning(f"shutdownNetworkSmDevices: ignoring unrecognized kwargs: {invalid}")
-
-        return self._session.post(metadata, resource, payload)
+        return dispatch.call(self._session, "shutdownNetworkSmDevices", networkId, **kwargs)
 
     def wipeNetworkSmDevices(self, networkId: str, **kwargs):
         """
@@ -416,30 +176,7 @@ class AsyncSm:
         - pin (integer): The pin number (a six digit value) for wiping a macOS device. Required only for macOS devices.
         """
 
-        kwargs.update(locals())
-
-        metadata = {
-            "tags": ["sm", "configure", "devices"],
-            "operation": "wipeNetworkSmDevices",
-        }
-        networkId = urllib.parse.quote(str(networkId), safe="")
-        resource = f"/networks/{networkId}/sm/devices/wipe"
-
-        body_params = [
-            "wifiMac",
-            "id",
-            "serial",
-            "pin",
-        ]
-        payload = {k.strip(): v for k, v in kwargs.items() if k.strip() in body_params}
-
-        if self._session._validate_kwargs:
-            all_params = [] + body_params
-            invalid = [k for k in kwargs if k.strip() not in all_params and k != "self"]
-            if invalid and self._session._logger:
-                self._session._logger.warning(f"wipeNetworkSmDevices: ignoring unrecognized kwargs: {invalid}")
-
-        return self._session.post(metadata, resource, payload)
+        return dispatch.call(self._session, "wipeNetworkSmDevices", networkId, **kwargs)
 
     def getNetworkSmDeviceCellularUsageHistory(self, networkId: str, deviceId: str):
         """
@@ -450,15 +187,7 @@ class AsyncSm:
         - deviceId (string): Device ID
         """
 
-        metadata = {
-            "tags": ["sm", "monitor", "devices", "cellularUsageHistory"],
-            "operation": "getNetworkSmDeviceCellularUsageHistory",
-        }
-        networkId = urllib.parse.quote(str(networkId), safe="")
-        deviceId = urllib.parse.quote(str(deviceId), safe="")
-        resource = f"/networks/{networkId}/sm/devices/{deviceId}/cellularUsageHistory"
-
-        return self._session.get(metadata, resource)
+        return dispatch.call(self._session, "getNetworkSmDeviceCellularUsageHistory", networkId, deviceId)
 
     def getNetworkSmDeviceCerts(self, networkId: str, deviceId: str):
         """
@@ -469,15 +198,7 @@ class AsyncSm:
         - deviceId (string): Device ID
         """
 
-        metadata = {
-            "tags": ["sm", "configure", "devices", "certs"],
-            "operation": "getNetworkSmDeviceCerts",
-        }
-        networkId = urllib.parse.quote(str(networkId), safe="")
-        deviceId = urllib.parse.quote(str(deviceId), safe="")
-        resource = f"/networks/{networkId}/sm/devices/{deviceId}/certs"
-
-        return self._session.get(metadata, resource)
+        return dispatch.call(self._session, "getNetworkSmDeviceCerts", networkId, deviceId)
 
     def getNetworkSmDeviceConnectivity(self, networkId: str, deviceId: str, total_pages=1, direction="next", **kwargs):
         """
@@ -493,30 +214,15 @@ class AsyncSm:
         - endingBefore (string): A token used by the server to indicate the end of the page. Often this is a timestamp or an ID but it is not limited to those. This parameter should not be defined by client applications. The link for the first, last, prev, or next page in the HTTP Link header should define it.
         """
 
-        kwargs.update(locals())
-
-        metadata = {
-            "tags": ["sm", "monitor", "devices", "connectivity"],
-            "operation": "getNetworkSmDeviceConnectivity",
-        }
-        networkId = urllib.parse.quote(str(networkId), safe="")
-        deviceId = urllib.parse.quote(str(deviceId), safe="")
-        resource = f"/networks/{networkId}/sm/devices/{deviceId}/connectivity"
-
-        query_params = [
-            "perPage",
-            "startingAfter",
-            "endingBefore",
-        ]
-        params = {k.strip(): v for k, v in kwargs.items() if k.strip() in query_params}
-
-        if self._session._validate_kwargs:
-            all_params = query_params
-            invalid = [k for k in kwargs if k.strip() not in all_params and k != "self"]
-            if invalid and self._session._logger:
-                self._session._logger.warning(f"getNetworkSmDeviceConnectivity: ignoring unrecognized kwargs: {invalid}")
-
-        return self._session.get_pages(metadata, resource, params, total_pages, direction)
+        return dispatch.call(
+            self._session,
+            "getNetworkSmDeviceConnectivity",
+            networkId,
+            deviceId,
+            total_pages=total_pages,
+            direction=direction,
+            **kwargs,
+        )
 
     def getNetworkSmDeviceDesktopLogs(self, networkId: str, deviceId: str, total_pages=1, direction="next", **kwargs):
         """
@@ -532,30 +238,15 @@ class AsyncSm:
         - endingBefore (string): A token used by the server to indicate the end of the page. Often this is a timestamp or an ID but it is not limited to those. This parameter should not be defined by client applications. The link for the first, last, prev, or next page in the HTTP Link header should define it.
         """
 
-        kwargs.update(locals())
-
-        metadata = {
-            "tags": ["sm", "monitor", "devices", "desktopLogs"],
-            "operation": "getNetworkSmDeviceDesktopLogs",
-        }
-        networkId = urllib.parse.quote(str(networkId), safe="")
-        deviceId = urllib.parse.quote(str(deviceId), safe="")
-        resource = f"/networks/{networkId}/sm/devices/{deviceId}/desktopLogs"
-
-        query_params = [
-            "perPage",
-            "startingAfter",
-            "endingBefore",
-        ]
-        params = {k.strip(): v for k, v in kwargs.items() if k.strip() in query_params}
-
-        if self._session._validate_kwargs:
-            all_params = query_params
-            invalid = [k for k in kwargs if k.strip() not in all_params and k != "self"]
-            if invalid and self._session._logger:
-                self._session._logger.warning(f"getNetworkSmDeviceDesktopLogs: ignoring unrecognized kwargs: {invalid}")
-
-        return self._session.get_pages(metadata, resource, params, total_pages, direction)
+        return dispatch.call(
+            self._session,
+            "getNetworkSmDeviceDesktopLogs",
+            networkId,
+            deviceId,
+            total_pages=total_pages,
+            direction=direction,
+            **kwargs,
+        )
 
     def getNetworkSmDeviceDeviceCommandLogs(self, networkId: str, deviceId: str, total_pages=1, direction="next", **kwargs):
         """
@@ -571,30 +262,15 @@ class AsyncSm:
         - endingBefore (string): A token used by the server to indicate the end of the page. Often this is a timestamp or an ID but it is not limited to those. This parameter should not be defined by client applications. The link for the first, last, prev, or next page in the HTTP Link header should define it.
         """
 
-        kwargs.update(locals())
-
-        metadata = {
-            "tags": ["sm", "monitor", "devices", "deviceCommandLogs"],
-            "operation": "getNetworkSmDeviceDeviceCommandLogs",
-        }
-        networkId = urllib.parse.quote(str(networkId), safe="")
-        deviceId = urllib.parse.quote(str(deviceId), safe="")
-        resource = f"/networks/{networkId}/sm/devices/{deviceId}/deviceCommandLogs"
-
-        query_params = [
-            "perPage",
-            "startingAfter",
-            "endingBefore",
-        ]
-        params = {k.strip(): v for k, v in kwargs.items() if k.strip() in query_params}
-
-        if self._session._validate_kwargs:
-            all_params = query_params
-            invalid = [k for k in kwargs if k.strip() not in all_params and k != "self"]
-            if invalid and self._session._logger:
-                self._session._logger.warning(f"getNetworkSmDeviceDeviceCommandLogs: ignoring unrecognized kwargs: {invalid}")
-
-        return self._session.get_pages(metadata, resource, params, total_pages, direction)
+        return dispatch.call(
+            self._session,
+            "getNetworkSmDeviceDeviceCommandLogs",
+            networkId,
+            deviceId,
+            total_pages=total_pages,
+            direction=direction,
+            **kwargs,
+        )
 
     def getNetworkSmDeviceDeviceProfiles(self, networkId: str, deviceId: str):
         """
@@ -605,15 +281,7 @@ class AsyncSm:
         - deviceId (string): Device ID
         """
 
-        metadata = {
-            "tags": ["sm", "configure", "devices", "deviceProfiles"],
-            "operation": "getNetworkSmDeviceDeviceProfiles",
-        }
-        networkId = urllib.parse.quote(str(networkId), safe="")
-        deviceId = urllib.parse.quote(str(deviceId), safe="")
-        resource = f"/networks/{networkId}/sm/devices/{deviceId}/deviceProfiles"
-
-        return self._session.get(metadata, resource)
+        return dispatch.call(self._session, "getNetworkSmDeviceDeviceProfiles", networkId, deviceId)
 
     def installNetworkSmDeviceApps(self, networkId: str, deviceId: str, appIds: list, **kwargs):
         """
@@ -626,29 +294,7 @@ class AsyncSm:
         - force (boolean): By default, installation of an app which is believed to already be present on the device will be skipped. If you'd like to force the installation of the app, set this parameter to true.
         """
 
-        kwargs.update(locals())
-
-        metadata = {
-            "tags": ["sm", "configure", "devices"],
-            "operation": "installNetworkSmDeviceApps",
-        }
-        networkId = urllib.parse.quote(str(networkId), safe="")
-        deviceId = urllib.parse.quote(str(deviceId), safe="")
-        resource = f"/networks/{networkId}/sm/devices/{deviceId}/installApps"
-
-        body_params = [
-            "appIds",
-            "force",
-        ]
-        payload = {k.strip(): v for k, v in kwargs.items() if k.strip() in body_params}
-
-        if self._session._validate_kwargs:
-            all_params = [] + body_params
-            invalid = [k for k in kwargs if k.strip() not in all_params and k != "self"]
-            if invalid and self._session._logger:
-                self._session._logger.warning(f"installNetworkSmDeviceApps: ignoring unrecognized kwargs: {invalid}")
-
-        return self._session.post(metadata, resource, payload)
+        return dispatch.call(self._session, "installNetworkSmDeviceApps", networkId, deviceId, appIds, **kwargs)
 
     def getNetworkSmDeviceNetworkAdapters(self, networkId: str, deviceId: str):
         """
@@ -659,15 +305,7 @@ class AsyncSm:
         - deviceId (string): Device ID
         """
 
-        metadata = {
-            "tags": ["sm", "configure", "devices", "networkAdapters"],
-            "operation": "getNetworkSmDeviceNetworkAdapters",
-        }
-        networkId = urllib.parse.quote(str(networkId), safe="")
-        deviceId = urllib.parse.quote(str(deviceId), safe="")
-        resource = f"/networks/{networkId}/sm/devices/{deviceId}/networkAdapters"
-
-        return self._session.get(metadata, resource)
+        return dispatch.call(self._session, "getNetworkSmDeviceNetworkAdapters", networkId, deviceId)
 
     def getNetworkSmDevicePerformanceHistory(self, networkId: str, deviceId: str, total_pages=1, direction="next", **kwargs):
         """
@@ -683,30 +321,15 @@ class AsyncSm:
         - endingBefore (string): A token used by the server to indicate the end of the page. Often this is a timestamp or an ID but it is not limited to those. This parameter should not be defined by client applications. The link for the first, last, prev, or next page in the HTTP Link header should define it.
         """
 
-        kwargs.update(locals())
-
-        metadata = {
-            "tags": ["sm", "monitor", "devices", "performanceHistory"],
-            "operation": "getNetworkSmDevicePerformanceHistory",
-        }
-        networkId = urllib.parse.quote(str(networkId), safe="")
-        deviceId = urllib.parse.quote(str(deviceId), safe="")
-        resource = f"/networks/{networkId}/sm/devices/{deviceId}/performanceHistory"
-
-        query_params = [
-            "perPage",
-            "startingAfter",
-            "endingBefore",
-        ]
-        params = {k.strip(): v for k, v in kwargs.items() if k.strip() in query_params}
-
-        if self._session._validate_kwargs:
-            all_params = query_params
-            invalid = [k for k in kwargs if k.strip() not in all_params and k != "self"]
-            if invalid and self._session._logger:
-                self._session._logger.warning(f"getNetworkSmDevicePerformanceHistory: ignoring unrecognized kwargs: {invalid}")
-
-        return self._session.get_pages(metadata, resource, params, total_pages, direction)
+        return dispatch.call(
+            self._session,
+            "getNetworkSmDevicePerformanceHistory",
+            networkId,
+            deviceId,
+            total_pages=total_pages,
+            direction=direction,
+            **kwargs,
+        )
 
     def refreshNetworkSmDeviceDetails(self, networkId: str, deviceId: str):
         """
@@ -717,15 +340,7 @@ class AsyncSm:
         - deviceId (string): Device ID
         """
 
-        metadata = {
-            "tags": ["sm", "configure", "devices"],
-            "operation": "refreshNetworkSmDeviceDetails",
-        }
-        networkId = urllib.parse.quote(str(networkId), safe="")
-        deviceId = urllib.parse.quote(str(deviceId), safe="")
-        resource = f"/networks/{networkId}/sm/devices/{deviceId}/refreshDetails"
-
-        return self._session.post(metadata, resource)
+        return dispatch.call(self._session, "refreshNetworkSmDeviceDetails", networkId, deviceId)
 
     def getNetworkSmDeviceRestrictions(self, networkId: str, deviceId: str):
         """
@@ -736,15 +351,7 @@ class AsyncSm:
         - deviceId (string): Device ID
         """
 
-        metadata = {
-            "tags": ["sm", "configure", "devices", "restrictions"],
-            "operation": "getNetworkSmDeviceRestrictions",
-        }
-        networkId = urllib.parse.quote(str(networkId), safe="")
-        deviceId = urllib.parse.quote(str(deviceId), safe="")
-        resource = f"/networks/{networkId}/sm/devices/{deviceId}/restrictions"
-
-        return self._session.get(metadata, resource)
+        return dispatch.call(self._session, "getNetworkSmDeviceRestrictions", networkId, deviceId)
 
     def getNetworkSmDeviceSecurityCenters(self, networkId: str, deviceId: str):
         """
@@ -755,15 +362,7 @@ class AsyncSm:
         - deviceId (string): Device ID
         """
 
-        metadata = {
-            "tags": ["sm", "configure", "devices", "securityCenters"],
-            "operation": "getNetworkSmDeviceSecurityCenters",
-        }
-        networkId = urllib.parse.quote(str(networkId), safe="")
-        deviceId = urllib.parse.quote(str(deviceId), safe="")
-        resource = f"/networks/{networkId}/sm/devices/{deviceId}/securityCenters"
-
-        return self._session.get(metadata, resource)
+        return dispatch.call(self._session, "getNetworkSmDeviceSecurityCenters", networkId, deviceId)
 
     def getNetworkSmDeviceSoftwares(self, networkId: str, deviceId: str):
         """
@@ -774,15 +373,7 @@ class AsyncSm:
         - deviceId (string): Device ID
         """
 
-        metadata = {
-            "tags": ["sm", "configure", "devices", "softwares"],
-            "operation": "getNetworkSmDeviceSoftwares",
-        }
-        networkId = urllib.parse.quote(str(networkId), safe="")
-        deviceId = urllib.parse.quote(str(deviceId), safe="")
-        resource = f"/networks/{networkId}/sm/devices/{deviceId}/softwares"
-
-        return self._session.get(metadata, resource)
+        return dispatch.call(self._session, "getNetworkSmDeviceSoftwares", networkId, deviceId)
 
     def unenrollNetworkSmDevice(self, networkId: str, deviceId: str):
         """
@@ -793,15 +384,7 @@ class AsyncSm:
         - deviceId (string): Device ID
         """
 
-        metadata = {
-            "tags": ["sm", "configure", "devices"],
-            "operation": "unenrollNetworkSmDevice",
-        }
-        networkId = urllib.parse.quote(str(networkId), safe="")
-        deviceId = urllib.parse.quote(str(deviceId), safe="")
-        resource = f"/networks/{networkId}/sm/devices/{deviceId}/unenroll"
-
-        return self._session.post(metadata, resource)
+        return dispatch.call(self._session, "unenrollNetworkSmDevice", networkId, deviceId)
 
     def uninstallNetworkSmDeviceApps(self, networkId: str, deviceId: str, appIds: list, **kwargs):
         """
@@ -813,28 +396,7 @@ class AsyncSm:
         - appIds (array): ids of applications to be uninstalled
         """
 
-        kwargs = locals()
-
-        metadata = {
-            "tags": ["sm", "configure", "devices"],
-            "operation": "uninstallNetworkSmDeviceApps",
-        }
-        networkId = urllib.parse.quote(str(networkId), safe="")
-        deviceId = urllib.parse.quote(str(deviceId), safe="")
-        resource = f"/networks/{networkId}/sm/devices/{deviceId}/uninstallApps"
-
-        body_params = [
-            "appIds",
-        ]
-        payload = {k.strip(): v for k, v in kwargs.items() if k.strip() in body_params}
-
-        if self._session._validate_kwargs:
-            all_params = [] + body_params
-            invalid = [k for k in kwargs if k.strip() not in all_params and k != "self"]
-            if invalid and self._session._logger:
-                self._session._logger.warning(f"uninstallNetworkSmDeviceApps: ignoring unrecognized kwargs: {invalid}")
-
-        return self._session.post(metadata, resource, payload)
+        return dispatch.call(self._session, "uninstallNetworkSmDeviceApps", networkId, deviceId, appIds, **kwargs)
 
     def getNetworkSmDeviceWlanLists(self, networkId: str, deviceId: str):
         """
@@ -845,15 +407,7 @@ class AsyncSm:
         - deviceId (string): Device ID
         """
 
-        metadata = {
-            "tags": ["sm", "configure", "devices", "wlanLists"],
-            "operation": "getNetworkSmDeviceWlanLists",
-        }
-        networkId = urllib.parse.quote(str(networkId), safe="")
-        deviceId = urllib.parse.quote(str(deviceId), safe="")
-        resource = f"/networks/{networkId}/sm/devices/{deviceId}/wlanLists"
-
-        return self._session.get(metadata, resource)
+        return dispatch.call(self._session, "getNetworkSmDeviceWlanLists", networkId, deviceId)
 
     def getNetworkSmProfiles(self, networkId: str, **kwargs):
         """
@@ -864,35 +418,7 @@ class AsyncSm:
         - payloadTypes (array): Filter by payload types
         """
 
-        kwargs.update(locals())
-
-        metadata = {
-            "tags": ["sm", "configure", "profiles"],
-            "operation": "getNetworkSmProfiles",
-        }
-        networkId = urllib.parse.quote(str(networkId), safe="")
-        resource = f"/networks/{networkId}/sm/profiles"
-
-        query_params = [
-            "payloadTypes",
-        ]
-        params = {k.strip(): v for k, v in kwargs.items() if k.strip() in query_params}
-
-        array_params = [
-            "payloadTypes",
-        ]
-        for k, v in kwargs.items():
-            if k.strip() in array_params:
-                params[f"{k.strip()}[]"] = kwargs[f"{k}"]
-                params.pop(k.strip())
-
-        if self._session._validate_kwargs:
-            all_params = query_params + array_params
-            invalid = [k for k in kwargs if k.strip() not in all_params and k != "self"]
-            if invalid and self._session._logger:
-                self._session._logger.warning(f"getNetworkSmProfiles: ignoring unrecognized kwargs: {invalid}")
-
-        return self._session.get(metadata, resource, params)
+        return dispatch.call(self._session, "getNetworkSmProfiles", networkId, **kwargs)
 
     def getNetworkSmTargetGroups(self, networkId: str, **kwargs):
         """
@@ -903,27 +429,7 @@ class AsyncSm:
         - withDetails (boolean): Boolean indicating if the the ids of the devices or users scoped by the target group should be included in the response
         """
 
-        kwargs.update(locals())
-
-        metadata = {
-            "tags": ["sm", "configure", "targetGroups"],
-            "operation": "getNetworkSmTargetGroups",
-        }
-        networkId = urllib.parse.quote(str(networkId), safe="")
-        resource = f"/networks/{networkId}/sm/targetGroups"
-
-        query_params = [
-            "withDetails",
-        ]
-        params = {k.strip(): v for k, v in kwargs.items() if k.strip() in query_params}
-
-        if self._session._validate_kwargs:
-            all_params = query_params
-            invalid = [k for k in kwargs if k.strip() not in all_params and k != "self"]
-            if invalid and self._session._logger:
-                self._session._logger.warning(f"getNetworkSmTargetGroups: ignoring unrecognized kwargs: {invalid}")
-
-        return self._session.get(metadata, resource, params)
+        return dispatch.call(self._session, "getNetworkSmTargetGroups", networkId, **kwargs)
 
     def createNetworkSmTargetGroup(self, networkId: str, **kwargs):
         """
@@ -935,28 +441,7 @@ class AsyncSm:
         - scope (string): The scope and tag options of the target group. Comma separated values beginning with one of withAny, withAll, withoutAny, withoutAll, all, none, followed by tags. Default to none if empty.
         """
 
-        kwargs.update(locals())
-
-        metadata = {
-            "tags": ["sm", "configure", "targetGroups"],
-            "operation": "createNetworkSmTargetGroup",
-        }
-        networkId = urllib.parse.quote(str(networkId), safe="")
-        resource = f"/networks/{networkId}/sm/targetGroups"
-
-        body_params = [
-            "name",
-            "scope",
-        ]
-        payload = {k.strip(): v for k, v in kwargs.items() if k.strip() in body_params}
-
-        if self._session._validate_kwargs:
-            all_params = [] + body_params
-            invalid = [k for k in kwargs if k.strip() not in all_params and k != "self"]
-            if invalid and self._session._logger:
-                self._session._logger.warning(f"createNetworkSmTargetGroup: ignoring unrecognized kwargs: {invalid}")
-
-        return self._session.post(metadata, resource, payload)
+        return dispatch.call(self._session, "createNetworkSmTargetGroup", networkId, **kwargs)
 
     def getNetworkSmTargetGroup(self, networkId: str, targetGroupId: str, **kwargs):
         """
@@ -968,28 +453,7 @@ class AsyncSm:
         - withDetails (boolean): Boolean indicating if the the ids of the devices or users scoped by the target group should be included in the response
         """
 
-        kwargs.update(locals())
-
-        metadata = {
-            "tags": ["sm", "configure", "targetGroups"],
-            "operation": "getNetworkSmTargetGroup",
-        }
-        networkId = urllib.parse.quote(str(networkId), safe="")
-        targetGroupId = urllib.parse.quote(str(targetGroupId), safe="")
-        resource = f"/networks/{networkId}/sm/targetGroups/{targetGroupId}"
-
-        query_params = [
-            "withDetails",
-        ]
-        params = {k.strip(): v for k, v in kwargs.items() if k.strip() in query_params}
-
-        if self._session._validate_kwargs:
-            all_params = query_params
-            invalid = [k for k in kwargs if k.strip() not in all_params and k != "self"]
-            if invalid and self._session._logger:
-                self._session._logger.warning(f"getNetworkSmTargetGroup: ignoring unrecognized kwargs: {invalid}")
-
-        return self._session.get(metadata, resource, params)
+        return dispatch.call(self._session, "getNetworkSmTargetGroup", networkId, targetGroupId, **kwargs)
 
     def updateNetworkSmTargetGroup(self, networkId: str, targetGroupId: str, **kwargs):
         """
@@ -1002,29 +466,7 @@ class AsyncSm:
         - scope (string): The scope and tag options of the target group. Comma separated values beginning with one of withAny, withAll, withoutAny, withoutAll, all, none, followed by tags. Default to none if empty.
         """
 
-        kwargs.update(locals())
-
-        metadata = {
-            "tags": ["sm", "configure", "targetGroups"],
-            "operation": "updateNetworkSmTargetGroup",
-        }
-        networkId = urllib.parse.quote(str(networkId), safe="")
-        targetGroupId = urllib.parse.quote(str(targetGroupId), safe="")
-        resource = f"/networks/{networkId}/sm/targetGroups/{targetGroupId}"
-
-        body_params = [
-            "name",
-            "scope",
-        ]
-        payload = {k.strip(): v for k, v in kwargs.items() if k.strip() in body_params}
-
-        if self._session._validate_kwargs:
-            all_params = [] + body_params
-            invalid = [k for k in kwargs if k.strip() not in all_params and k != "self"]
-            if invalid and self._session._logger:
-                self._session._logger.warning(f"updateNetworkSmTargetGroup: ignoring unrecognized kwargs: {invalid}")
-
-        return self._session.put(metadata, resource, payload)
+        return dispatch.call(self._session, "updateNetworkSmTargetGroup", networkId, targetGroupId, **kwargs)
 
     def deleteNetworkSmTargetGroup(self, networkId: str, targetGroupId: str):
         """
@@ -1035,15 +477,7 @@ class AsyncSm:
         - targetGroupId (string): Target group ID
         """
 
-        metadata = {
-            "tags": ["sm", "configure", "targetGroups"],
-            "operation": "deleteNetworkSmTargetGroup",
-        }
-        networkId = urllib.parse.quote(str(networkId), safe="")
-        targetGroupId = urllib.parse.quote(str(targetGroupId), safe="")
-        resource = f"/networks/{networkId}/sm/targetGroups/{targetGroupId}"
-
-        return self._session.delete(metadata, resource)
+        return dispatch.call(self._session, "deleteNetworkSmTargetGroup", networkId, targetGroupId)
 
     def getNetworkSmTrustedAccessConfigs(self, networkId: str, total_pages=1, direction="next", **kwargs):
         """
@@ -1058,29 +492,14 @@ class AsyncSm:
         - endingBefore (string): A token used by the server to indicate the end of the page. Often this is a timestamp or an ID but it is not limited to those. This parameter should not be defined by client applications. The link for the first, last, prev, or next page in the HTTP Link header should define it.
         """
 
-        kwargs.update(locals())
-
-        metadata = {
-            "tags": ["sm", "configure", "trustedAccessConfigs"],
-            "operation": "getNetworkSmTrustedAccessConfigs",
-        }
-        networkId = urllib.parse.quote(str(networkId), safe="")
-        resource = f"/networks/{networkId}/sm/trustedAccessConfigs"
-
-        query_params = [
-            "perPage",
-            "startingAfter",
-            "endingBefore",
-        ]
-        params = {k.strip(): v for k, v in kwargs.items() if k.strip() in query_params}
-
-        if self._session._validate_kwargs:
-            all_params = query_params
-            invalid = [k for k in kwargs if k.strip() not in all_params and k != "self"]
-            if invalid and self._session._logger:
-                self._session._logger.warning(f"getNetworkSmTrustedAccessConfigs: ignoring unrecognized kwargs: {invalid}")
-
-        return self._session.get_pages(metadata, resource, params, total_pages, direction)
+        return dispatch.call(
+            self._session,
+            "getNetworkSmTrustedAccessConfigs",
+            networkId,
+            total_pages=total_pages,
+            direction=direction,
+            **kwargs,
+        )
 
     def getNetworkSmUserAccessDevices(self, networkId: str, total_pages=1, direction="next", **kwargs):
         """
@@ -1095,29 +514,9 @@ class AsyncSm:
         - endingBefore (string): A token used by the server to indicate the end of the page. Often this is a timestamp or an ID but it is not limited to those. This parameter should not be defined by client applications. The link for the first, last, prev, or next page in the HTTP Link header should define it.
         """
 
-        kwargs.update(locals())
-
-        metadata = {
-            "tags": ["sm", "configure", "userAccessDevices"],
-            "operation": "getNetworkSmUserAccessDevices",
-        }
-        networkId = urllib.parse.quote(str(networkId), safe="")
-        resource = f"/networks/{networkId}/sm/userAccessDevices"
-
-        query_params = [
-            "perPage",
-            "startingAfter",
-            "endingBefore",
-        ]
-        params = {k.strip(): v for k, v in kwargs.items() if k.strip() in query_params}
-
-        if self._session._validate_kwargs:
-            all_params = query_params
-            invalid = [k for k in kwargs if k.strip() not in all_params and k != "self"]
-            if invalid and self._session._logger:
-                self._session._logger.warning(f"getNetworkSmUserAccessDevices: ignoring unrecognized kwargs: {invalid}")
-
-        return self._session.get_pages(metadata, resource, params, total_pages, direction)
+        return dispatch.call(
+            self._session, "getNetworkSmUserAccessDevices", networkId, total_pages=total_pages, direction=direction, **kwargs
+        )
 
     def deleteNetworkSmUserAccessDevice(self, networkId: str, userAccessDeviceId: str):
         """
@@ -1128,15 +527,7 @@ class AsyncSm:
         - userAccessDeviceId (string): User access device ID
         """
 
-        metadata = {
-            "tags": ["sm", "configure", "userAccessDevices"],
-            "operation": "deleteNetworkSmUserAccessDevice",
-        }
-        networkId = urllib.parse.quote(str(networkId), safe="")
-        userAccessDeviceId = urllib.parse.quote(str(userAccessDeviceId), safe="")
-        resource = f"/networks/{networkId}/sm/userAccessDevices/{userAccessDeviceId}"
-
-        return self._session.delete(metadata, resource)
+        return dispatch.call(self._session, "deleteNetworkSmUserAccessDevice", networkId, userAccessDeviceId)
 
     def getNetworkSmUsers(self, networkId: str, **kwargs):
         """
@@ -1150,41 +541,7 @@ class AsyncSm:
         - scope (array): Specifiy a scope (one of all, none, withAny, withAll, withoutAny, withoutAll) and a set of tags.
         """
 
-        kwargs.update(locals())
-
-        metadata = {
-            "tags": ["sm", "configure"],
-            "operation": "getNetworkSmUsers",
-        }
-        networkId = urllib.parse.quote(str(networkId), safe="")
-        resource = f"/networks/{networkId}/sm/users"
-
-        query_params = [
-            "ids",
-            "usernames",
-            "emails",
-            "scope",
-        ]
-        params = {k.strip(): v for k, v in kwargs.items() if k.strip() in query_params}
-
-        array_params = [
-            "ids",
-            "usernames",
-            "emails",
-            "scope",
-        ]
-        for k, v in kwargs.items():
-            if k.strip() in array_params:
-                params[f"{k.strip()}[]"] = kwargs[f"{k}"]
-                params.pop(k.strip())
-
-        if self._session._validate_kwargs:
-            all_params = query_params + array_params
-            invalid = [k for k in kwargs if k.strip() not in all_params and k != "self"]
-            if invalid and self._session._logger:
-                self._session._logger.warning(f"getNetworkSmUsers: ignoring unrecognized kwargs: {invalid}")
-
-        return self._session.get(metadata, resource, params)
+        return dispatch.call(self._session, "getNetworkSmUsers", networkId, **kwargs)
 
     def getNetworkSmUserDeviceProfiles(self, networkId: str, userId: str):
         """
@@ -1195,15 +552,7 @@ class AsyncSm:
         - userId (string): User ID
         """
 
-        metadata = {
-            "tags": ["sm", "configure", "deviceProfiles"],
-            "operation": "getNetworkSmUserDeviceProfiles",
-        }
-        networkId = urllib.parse.quote(str(networkId), safe="")
-        userId = urllib.parse.quote(str(userId), safe="")
-        resource = f"/networks/{networkId}/sm/users/{userId}/deviceProfiles"
-
-        return self._session.get(metadata, resource)
+        return dispatch.call(self._session, "getNetworkSmUserDeviceProfiles", networkId, userId)
 
     def getNetworkSmUserSoftwares(self, networkId: str, userId: str):
         """
@@ -1214,15 +563,7 @@ class AsyncSm:
         - userId (string): User ID
         """
 
-        metadata = {
-            "tags": ["sm", "configure", "softwares"],
-            "operation": "getNetworkSmUserSoftwares",
-        }
-        networkId = urllib.parse.quote(str(networkId), safe="")
-        userId = urllib.parse.quote(str(userId), safe="")
-        resource = f"/networks/{networkId}/sm/users/{userId}/softwares"
-
-        return self._session.get(metadata, resource)
+        return dispatch.call(self._session, "getNetworkSmUserSoftwares", networkId, userId)
 
     def getOrganizationSmAdminsRoles(self, organizationId: str, total_pages=1, direction="next", **kwargs):
         """
@@ -1237,29 +578,14 @@ class AsyncSm:
         - endingBefore (string): A token used by the server to indicate the end of the page. Often this is a timestamp or an ID but it is not limited to those. This parameter should not be defined by client applications. The link for the first, last, prev, or next page in the HTTP Link header should define it.
         """
 
-        kwargs.update(locals())
-
-        metadata = {
-            "tags": ["sm", "configure", "admins", "roles"],
-            "operation": "getOrganizationSmAdminsRoles",
-        }
-        organizationId = urllib.parse.quote(str(organizationId), safe="")
-        resource = f"/organizations/{organizationId}/sm/admins/roles"
-
-        query_params = [
-            "perPage",
-            "startingAfter",
-            "endingBefore",
-        ]
-        params = {k.strip(): v for k, v in kwargs.items() if k.strip() in query_params}
-
-        if self._session._validate_kwargs:
-            all_params = query_params
-            invalid = [k for k in kwargs if k.strip() not in all_params and k != "self"]
-            if invalid and self._session._logger:
-                self._session._logger.warning(f"getOrganizationSmAdminsRoles: ignoring unrecognized kwargs: {invalid}")
-
-        return self._session.get_pages(metadata, resource, params, total_pages, direction)
+        return dispatch.call(
+            self._session,
+            "getOrganizationSmAdminsRoles",
+            organizationId,
+            total_pages=total_pages,
+            direction=direction,
+            **kwargs,
+        )
 
     def createOrganizationSmAdminsRole(self, organizationId: str, name: str, **kwargs):
         """
@@ -1272,33 +598,7 @@ class AsyncSm:
         - tags (array): The tags of the Limited Access Role
         """
 
-        kwargs.update(locals())
-
-        if "scope" in kwargs:
-            options = ["all_tags", "some", "without_all_tags", "without_some"]
-            assert kwargs["scope"] in options, f'''"scope" cannot be "{kwargs["scope"]}", & must be set to one of: {options}'''
-
-        metadata = {
-            "tags": ["sm", "configure", "admins", "roles"],
-            "operation": "createOrganizationSmAdminsRole",
-        }
-        organizationId = urllib.parse.quote(str(organizationId), safe="")
-        resource = f"/organizations/{organizationId}/sm/admins/roles"
-
-        body_params = [
-            "name",
-            "scope",
-            "tags",
-        ]
-        payload = {k.strip(): v for k, v in kwargs.items() if k.strip() in body_params}
-
-        if self._session._validate_kwargs:
-            all_params = [] + body_params
-            invalid = [k for k in kwargs if k.strip() not in all_params and k != "self"]
-            if invalid and self._session._logger:
-                self._session._logger.warning(f"createOrganizationSmAdminsRole: ignoring unrecognized kwargs: {invalid}")
-
-        return self._session.post(metadata, resource, payload)
+        return dispatch.call(self._session, "createOrganizationSmAdminsRole", organizationId, name, **kwargs)
 
     def getOrganizationSmAdminsRole(self, organizationId: str, roleId: str):
         """
@@ -1309,15 +609,7 @@ class AsyncSm:
         - roleId (string): Role ID
         """
 
-        metadata = {
-            "tags": ["sm", "configure", "admins", "roles"],
-            "operation": "getOrganizationSmAdminsRole",
-        }
-        organizationId = urllib.parse.quote(str(organizationId), safe="")
-        roleId = urllib.parse.quote(str(roleId), safe="")
-        resource = f"/organizations/{organizationId}/sm/admins/roles/{roleId}"
-
-        return self._session.get(metadata, resource)
+        return dispatch.call(self._session, "getOrganizationSmAdminsRole", organizationId, roleId)
 
     def updateOrganizationSmAdminsRole(self, organizationId: str, roleId: str, **kwargs):
         """
@@ -1331,34 +623,7 @@ class AsyncSm:
         - tags (array): The tags of the Limited Access Role
         """
 
-        kwargs.update(locals())
-
-        if "scope" in kwargs:
-            options = ["all_tags", "some", "without_all_tags", "without_some"]
-            assert kwargs["scope"] in options, f'''"scope" cannot be "{kwargs["scope"]}", & must be set to one of: {options}'''
-
-        metadata = {
-            "tags": ["sm", "configure", "admins", "roles"],
-            "operation": "updateOrganizationSmAdminsRole",
-        }
-        organizationId = urllib.parse.quote(str(organizationId), safe="")
-        roleId = urllib.parse.quote(str(roleId), safe="")
-        resource = f"/organizations/{organizationId}/sm/admins/roles/{roleId}"
-
-        body_params = [
-            "name",
-            "scope",
-            "tags",
-        ]
-        payload = {k.strip(): v for k, v in kwargs.items() if k.strip() in body_params}
-
-        if self._session._validate_kwargs:
-            all_params = [] + body_params
-            invalid = [k for k in kwargs if k.strip() not in all_params and k != "self"]
-            if invalid and self._session._logger:
-                self._session._logger.warning(f"updateOrganizationSmAdminsRole: ignoring unrecognized kwargs: {invalid}")
-
-        return self._session.put(metadata, resource, payload)
+        return dispatch.call(self._session, "updateOrganizationSmAdminsRole", organizationId, roleId, **kwargs)
 
     def deleteOrganizationSmAdminsRole(self, organizationId: str, roleId: str):
         """
@@ -1369,15 +634,7 @@ class AsyncSm:
         - roleId (string): Role ID
         """
 
-        metadata = {
-            "tags": ["sm", "configure", "admins", "roles"],
-            "operation": "deleteOrganizationSmAdminsRole",
-        }
-        organizationId = urllib.parse.quote(str(organizationId), safe="")
-        roleId = urllib.parse.quote(str(roleId), safe="")
-        resource = f"/organizations/{organizationId}/sm/admins/roles/{roleId}"
-
-        return self._session.delete(metadata, resource)
+        return dispatch.call(self._session, "deleteOrganizationSmAdminsRole", organizationId, roleId)
 
     def getOrganizationSmApnsCert(self, organizationId: str):
         """
@@ -1387,14 +644,7 @@ class AsyncSm:
         - organizationId (string): Organization ID
         """
 
-        metadata = {
-            "tags": ["sm", "configure", "apnsCert"],
-            "operation": "getOrganizationSmApnsCert",
-        }
-        organizationId = urllib.parse.quote(str(organizationId), safe="")
-        resource = f"/organizations/{organizationId}/sm/apnsCert"
-
-        return self._session.get(metadata, resource)
+        return dispatch.call(self._session, "getOrganizationSmApnsCert", organizationId)
 
     def updateOrganizationSmSentryPoliciesAssignments(self, organizationId: str, items: list, **kwargs):
         """
@@ -1405,29 +655,7 @@ class AsyncSm:
         - items (array): Sentry Group Policies for the Organization keyed by Network Id
         """
 
-        kwargs = locals()
-
-        metadata = {
-            "tags": ["sm", "configure", "sentry", "policies", "assignments"],
-            "operation": "updateOrganizationSmSentryPoliciesAssignments",
-        }
-        organizationId = urllib.parse.quote(str(organizationId), safe="")
-        resource = f"/organizations/{organizationId}/sm/sentry/policies/assignments"
-
-        body_params = [
-            "items",
-        ]
-        payload = {k.strip(): v for k, v in kwargs.items() if k.strip() in body_params}
-
-        if self._session._validate_kwargs:
-            all_params = [] + body_params
-            invalid = [k for k in kwargs if k.strip() not in all_params and k != "self"]
-            if invalid and self._session._logger:
-                self._session._logger.warning(
-                    f"updateOrganizationSmSentryPoliciesAssignments: ignoring unrecognized kwargs: {invalid}"
-                )
-
-        return self._session.put(metadata, resource, payload)
+        return dispatch.call(self._session, "updateOrganizationSmSentryPoliciesAssignments", organizationId, items, **kwargs)
 
     def getOrganizationSmSentryPoliciesAssignmentsByNetwork(
         self, organizationId: str, total_pages=1, direction="next", **kwargs
@@ -1445,40 +673,14 @@ class AsyncSm:
         - networkIds (array): Optional parameter to filter Sentry Policies by Network Id
         """
 
-        kwargs.update(locals())
-
-        metadata = {
-            "tags": ["sm", "configure", "sentry", "policies", "assignments", "byNetwork"],
-            "operation": "getOrganizationSmSentryPoliciesAssignmentsByNetwork",
-        }
-        organizationId = urllib.parse.quote(str(organizationId), safe="")
-        resource = f"/organizations/{organizationId}/sm/sentry/policies/assignments/byNetwork"
-
-        query_params = [
-            "perPage",
-            "startingAfter",
-            "endingBefore",
-            "networkIds",
-        ]
-        params = {k.strip(): v for k, v in kwargs.items() if k.strip() in query_params}
-
-        array_params = [
-            "networkIds",
-        ]
-        for k, v in kwargs.items():
-            if k.strip() in array_params:
-                params[f"{k.strip()}[]"] = kwargs[f"{k}"]
-                params.pop(k.strip())
-
-        if self._session._validate_kwargs:
-            all_params = query_params + array_params
-            invalid = [k for k in kwargs if k.strip() not in all_params and k != "self"]
-            if invalid and self._session._logger:
-                self._session._logger.warning(
-                    f"getOrganizationSmSentryPoliciesAssignmentsByNetwork: ignoring unrecognized kwargs: {invalid}"
-                )
-
-        return self._session.get_pages(metadata, resource, params, total_pages, direction)
+        return dispatch.call(
+            self._session,
+            "getOrganizationSmSentryPoliciesAssignmentsByNetwork",
+            organizationId,
+            total_pages=total_pages,
+            direction=direction,
+            **kwargs,
+        )
 
     def getOrganizationSmVppAccounts(self, organizationId: str):
         """
@@ -1488,14 +690,7 @@ class AsyncSm:
         - organizationId (string): Organization ID
         """
 
-        metadata = {
-            "tags": ["sm", "configure", "vppAccounts"],
-            "operation": "getOrganizationSmVppAccounts",
-        }
-        organizationId = urllib.parse.quote(str(organizationId), safe="")
-        resource = f"/organizations/{organizationId}/sm/vppAccounts"
-
-        return self._session.get(metadata, resource)
+        return dispatch.call(self._session, "getOrganizationSmVppAccounts", organizationId)
 
     def getOrganizationSmVppAccount(self, organizationId: str, vppAccountId: str):
         """
@@ -1506,12 +701,4 @@ class AsyncSm:
         - vppAccountId (string): Vpp account ID
         """
 
-        metadata = {
-            "tags": ["sm", "configure", "vppAccounts"],
-            "operation": "getOrganizationSmVppAccount",
-        }
-        organizationId = urllib.parse.quote(str(organizationId), safe="")
-        vppAccountId = urllib.parse.quote(str(vppAccountId), safe="")
-        resource = f"/organizations/{organizationId}/sm/vppAccounts/{vppAccountId}"
-
-        return self._session.get(metadata, resource)
+        return dispatch.call(self._session, "getOrganizationSmVppAccount", organizationId, vppAccountId)
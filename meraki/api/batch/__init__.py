@@ -1,28 +1,21 @@
-from meraki.api.batch.organizations import ActionBatchOrganizations
-from meraki.api.batch.networks import ActionBatchNetworks
-from meraki.api.batch.devices import ActionBatchDevices
-from meraki.api.batch.appliance import ActionBatchAppliance
-from meraki.api.batch.camera import ActionBatchCamera
-from meraki.api.batch.cellularGateway import ActionBatchCellularGateway
-from meraki.api.batch.insight import ActionBatchInsight
-from meraki.api.batch.sensor import ActionBatchSensor
-from meraki.api.batch.sm import ActionBatchSm
-from meraki.api.batch.switch import ActionBatchSwitch
-from meraki.api.batch.wireless import ActionBatchWireless
+from meraki.common import LazySection, lazy_section_class
 
 
 # Batch class
 class Batch:
-    def __init__(self):
-        # Action Batch helper API endpoints by section
-        self.organizations = ActionBatchOrganizations()
-        self.networks = ActionBatchNetworks()
-        self.devices = ActionBatchDevices()
-        self.appliance = ActionBatchAppliance()
-        self.camera = ActionBatchCamera()
-        self.cellularGateway = ActionBatchCellularGateway()
-        self.insight = ActionBatchInsight()
-        self.sensor = ActionBatchSensor()
-        self.sm = ActionBatchSm()
-        self.switch = ActionBatchSwitch()
-        self.wireless = ActionBatchWireless()
+    # Action Batch helper API endpoints by section, each imported on first access
+    organizations = LazySection("meraki.api.batch.organizations", "ActionBatchOrganizations", pass_session=False)
+    networks = LazySection("meraki.api.batch.networks", "ActionBatchNetworks", pass_session=False)
+    devices = LazySection("meraki.api.batch.devices", "ActionBatchDevices", pass_session=False)
+    appliance = LazySection("meraki.api.batch.appliance", "ActionBatchAppliance", pass_session=False)
+    camera = LazySection("meraki.api.batch.camera", "ActionBatchCamera", pass_session=False)
+    cellularGateway = LazySection("meraki.api.batch.cellularGateway", "ActionBatchCellularGateway", pass_session=False)
+    insight = LazySection("meraki.api.batch.insight", "ActionBatchInsight", pass_session=False)
+    sensor = LazySection("meraki.api.batch.sensor", "ActionBatchSensor", pass_session=False)
+    sm = LazySection("meraki.api.batch.sm", "ActionBatchSm", pass_session=False)
+    switch = LazySection("meraki.api.batch.switch", "ActionBatchSwitch", pass_session=False)
+    wireless = LazySection("meraki.api.batch.wireless", "ActionBatchWireless", pass_session=False)
+
+
+def __getattr__(name):
+    return lazy_section_class(Batch, __name__, name)
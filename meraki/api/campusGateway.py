@@ -1,4 +1,4 @@
-import urllib
+from meraki import dispatch
 
 
 class CampusGateway(object):
@@ -23,33 +23,17 @@ class CampusGateway(object):
         - notes (string): Notes about cluster with max size of 511 characters allowed
         """
 
-        kwargs.update(locals())
-
-        metadata = {
-            "tags": ["campusGateway", "configure", "clusters"],
-            "operation": "createNetworkCampusGatewayCluster",
-        }
-        networkId = urllib.parse.quote(str(networkId), safe="")
-        resource = f"/networks/{networkId}/campusGateway/clusters"
-
-        body_params = [
-            "name",
-            "uplinks",
-            "tunnels",
-            "nameservers",
-            "portChannels",
-            "devices",
-            "notes",
-        ]
-        payload = {k.strip(): v for k, v in kwargs.items() if k.strip() in body_params}
-
-        if self._session._validate_kwargs:
-            all_params = [] + body_params
-            invalid = [k for k in kwargs if k.strip() not in all_params and k != "self"]
-            if invalid and self._session._logger:
-                self._session._logger.warning(f"createNetworkCampusGatewayCluster: ignoring unrecognized kwargs: {invalid}")
-
-        return self._session.post(metadata, resource, payload)
+        return dispatch.call(
+            self._session,
+            "createNetworkCampusGatewayCluster",
+            networkId,
+            name,
+            uplinks,
+            tunnels,
+            nameservers,
+            portChannels,
+            **kwargs,
+        )
 
     def updateNetworkCampusGatewayCluster(self, networkId: str, clusterId: str, **kwargs):
         """
@@ -67,34 +51,7 @@ class CampusGateway(object):
         - notes (string): Notes about cluster with max size of 511 characters allowed
         """
 
-        kwargs.update(locals())
-
-        metadata = {
-            "tags": ["campusGateway", "configure", "clusters"],
-            "operation": "updateNetworkCampusGatewayCluster",
-        }
-        networkId = urllib.parse.quote(str(networkId), safe="")
-        clusterId = urllib.parse.quote(str(clusterId), safe="")
-        resource = f"/networks/{networkId}/campusGateway/clusters/{clusterId}"
-
-        body_params = [
-            "name",
-            "uplinks",
-            "tunnels",
-            "nameservers",
-            "portChannels",
-            "devices",
-            "notes",
-        ]
-        payload = {k.strip(): v for k, v in kwargs.items() if k.strip() in body_params}
-
-        if self._session._validate_kwargs:
-            all_params = [] + body_params
-            invalid = [k for k in kwargs if k.strip() not in all_params and k != "self"]
-            if invalid and self._session._logger:
-                self._session._logger.warning(f"updateNetworkCampusGatewayCluster: ignoring unrecognized kwargs: {invalid}")
-
-        return self._session.put(metadata, resource, payload)
+        return dispatch.call(self._session, "updateNetworkCampusGatewayCluster", networkId, clusterId, **kwargs)
 
     def getOrganizationCampusGatewayClusters(self, organizationId: str, total_pages=1, direction="next", **kwargs):
         """
@@ -110,38 +67,14 @@ class CampusGateway(object):
         - endingBefore (string): A token used by the server to indicate the end of the page. Often this is a timestamp or an ID but it is not limited to those. This parameter should not be defined by client applications. The link for the first, last, prev, or next page in the HTTP Link header should define it.
         """
 
-        kwargs.update(locals())
-
-        metadata = {
-            "tags": ["campusGateway", "configure", "clusters"],
-            "operation": "getOrganizationCampusGatewayClusters",
-        }
-        organizationId = urllib.parse.quote(str(organizationId), safe="")
-        resource = f"/organizations/{organizationId}/campusGateway/clusters"
-
-        query_params = [
-            "networkIds",
-            "perPage",
-            "startingAfter",
-            "endingBefore",
-        ]
-        params = {k.strip(): v for k, v in kwargs.items() if k.strip() in query_params}
-
-        array_params = [
-            "networkIds",
-        ]
-        for k, v in kwargs.items():
-            if k.strip() in array_params:
-                params[f"{k.strip()}[]"] = kwargs[f"{k}"]
-                params.pop(k.strip())
-
-        if self._session._validate_kwargs:
-            all_params = query_params + array_params
-            invalid = [k for k in kwargs if k.strip() not in all_params and k != "self"]
-            if invalid and self._session._logger:
-                self._session._logger.warning(f"getOrganizationCampusGatewayClusters: ignoring unrecognized kwargs: {invalid}")
-
-        return self._session.get_pages(metadata, resource, params, total_pages, direction)
+        return dispatch.call(
+            self._session,
+            "getOrganizationCampusGatewayClusters",
+            organizationId,
+            total_pages=total_pages,
+            direction=direction,
+            **kwargs,
+        )
 
     def getOrganizationCampusGatewayDevicesUplinksLocalOverridesByDevice(
         self, organizationId: str, total_pages=1, direction="next", **kwargs
@@ -159,37 +92,11 @@ class CampusGateway(object):
         - endingBefore (string): A token used by the server to indicate the end of the page. Often this is a timestamp or an ID but it is not limited to those. This parameter should not be defined by client applications. The link for the first, last, prev, or next page in the HTTP Link header should define it.
         """
 
-        kwargs.update(locals())
-
-        metadata = {
-            "tags": ["campusGateway", "configure", "devices", "uplinks", "localOverrides", "byDevice"],
-            "operation": "getOrganizationCampusGatewayDevicesUplinksLocalOverridesByDevice",
-        }
-        organizationId = urllib.parse.quote(str(organizationId), safe="")
-        resource = f"/organizations/{organizationId}/campusGateway/devices/uplinks/localOverrides/byDevice"
-
-        query_params = [
-            "serials",
-            "perPage",
-            "startingAfter",
-            "endingBefore",
-        ]
-        params = {k.strip(): v for k, v in kwargs.items() if k.strip() in query_params}
-
-        array_params = [
-            "serials",
-        ]
-        for k, v in kwargs.items():
-            if k.strip() in array_params:
-                params[f"{k.strip()}[]"] = kwargs[f"{k}"]
-                params.pop(k.strip())
-
-        if self._session._validate_kwargs:
-            all_params = query_params + array_params
-            invalid = [k for k in kwargs if k.strip() not in all_params and k != "self"]
-            if invalid and self._session._logger:
-                self._session._logger.warning(
-                    f"getOrganizationCampusGatewayDevicesUplinksLocalOverridesByDevice: ignoring unrecognized kwargs: {invalid}"
-                )
-
-        return self._session.get_pages(metadata, resource, params, total_pages, direction)
+        return dispatch.call(
+            self._session,
+            "getOrganizationCampusGatewayDevicesUplinksLocalOverridesByDevice",
+            organizationId,
+            total_pages=total_pages,
+            direction=direction,
+            **kwargs,
+        )
@@ -1,4 +1,4 @@
-import urllib
+from meraki import dispatch
 
 
 class Insight(object):
@@ -19,33 +19,7 @@ class Insight(object):
         - resolution (integer): The time resolution in seconds for returned data. The valid resolutions are: 60, 300, 3600, 86400. The default is 300.
         """
 
-        kwargs.update(locals())
-
-        metadata = {
-            "tags": ["insight", "monitor", "applications", "healthByTime"],
-            "operation": "getNetworkInsightApplicationHealthByTime",
-        }
-        networkId = urllib.parse.quote(str(networkId), safe="")
-        applicationId = urllib.parse.quote(str(applicationId), safe="")
-        resource = f"/networks/{networkId}/insight/applications/{applicationId}/healthByTime"
-
-        query_params = [
-            "t0",
-            "t1",
-            "timespan",
-            "resolution",
-        ]
-        params = {k.strip(): v for k, v in kwargs.items() if k.strip() in query_params}
-
-        if self._session._validate_kwargs:
-            all_params = query_params
-            invalid = [k for k in kwargs if k.strip() not in all_params and k != "self"]
-            if invalid and self._session._logger:
-                self._session._logger.warning(
-                    f"getNetworkInsightApplicationHealthByTime: ignoring unrecognized kwargs: {invalid}"
-                )
-
-        return self._session.get(metadata, resource, params)
+        return dispatch.call(self._session, "getNetworkInsightApplicationHealthByTime", networkId, applicationId, **kwargs)
 
     def getOrganizationInsightApplications(self, organizationId: str):
         """
@@ -55,14 +29,7 @@ class Insight(object):
         - organizationId (string): Organization ID
         """
 
-        metadata = {
-            "tags": ["insight", "configure", "applications"],
-            "operation": "getOrganizationInsightApplications",
-        }
-        organizationId = urllib.parse.quote(str(organizationId), safe="")
-        resource = f"/organizations/{organizationId}/insight/applications"
-
-        return self._session.get(metadata, resource)
+        return dispatch.call(self._session, "getOrganizationInsightApplications", organizationId)
 
     def getOrganizationInsightMonitoredMediaServers(self, organizationId: str):
         """
@@ -72,14 +39,7 @@ class Insight(object):
         - organizationId (string): Organization ID
         """
 
-        metadata = {
-            "tags": ["insight", "configure", "monitoredMediaServers"],
-            "operation": "getOrganizationInsightMonitoredMediaServers",
-        }
-        organizationId = urllib.parse.quote(str(organizationId), safe="")
-        resource = f"/organizations/{organizationId}/insight/monitoredMediaServers"
-
-        return self._session.get(metadata, resource)
+        return dispatch.call(self._session, "getOrganizationInsightMonitoredMediaServers", organizationId)
 
     def createOrganizationInsightMonitoredMediaServer(self, organizationId: str, name: str, address: str, **kwargs):
         """
@@ -92,31 +52,9 @@ class Insight(object):
         - bestEffortMonitoringEnabled (boolean): Indicates that if the media server doesn't respond to ICMP pings, the nearest hop will be used in its stead.
         """
 
-        kwargs.update(locals())
-
-        metadata = {
-            "tags": ["insight", "configure", "monitoredMediaServers"],
-            "operation": "createOrganizationInsightMonitoredMediaServer",
-        }
-        organizationId = urllib.parse.quote(str(organizationId), safe="")
-        resource = f"/organizations/{organizationId}/insight/monitoredMediaServers"
-
-        body_params = [
-            "name",
-            "address",
-            "bestEffortMonitoringEnabled",
-        ]
-        payload = {k.strip(): v for k, v in kwargs.items() if k.strip() in body_params}
-
-        if self._session._validate_kwargs:
-            all_params = [] + body_params
-            invalid = [k for k in kwargs if k.strip() not in all_params and k != "self"]
-            if invalid and self._session._logger:
-                self._session._logger.warning(
-                    f"createOrganizationInsightMonitoredMediaServer: ignoring unrecognized kwargs: {invalid}"
-                )
-
-        return self._session.post(metadata, resource, payload)
+        return dispatch.call(
+            self._session, "createOrganizationInsightMonitoredMediaServer", organizationId, name, address, **kwargs
+        )
 
     def getOrganizationInsightMonitoredMediaServer(self, organizationId: str, monitoredMediaServerId: str):
         """
@@ -127,15 +65,9 @@ class Insight(object):
         - monitoredMediaServerId (string): Monitored media server ID
         """
 
-        metadata = {
-            "tags": ["insight", "configure", "monitoredMediaServers"],
-            "operation": "getOrganizationInsightMonitoredMediaServer",
-        }
-        organizationId = urllib.parse.quote(str(organizationId), safe="")
-        monitoredMediaServerId = urllib.parse.quote(str(monitoredMediaServerId), safe="")
-        resource = f"/organizations/{organizationId}/insight/monitoredMediaServers/{monitoredMediaServerId}"
-
-        return self._session.get(metadata, resource)
+        return dispatch.call(
+            self._session, "getOrganizationInsightMonitoredMediaServer", organizationId, monitoredMediaServerId
+        )
 
     def updateOrganizationInsightMonitoredMediaServer(self, organizationId: str, monitoredMediaServerId: str, **kwargs):
         """
@@ -149,32 +81,9 @@ class Insight(object):
         - bestEffortMonitoringEnabled (boolean): Indicates that if the media server doesn't respond to ICMP pings, the nearest hop will be used in its stead.
         """
 
-        kwargs.update(locals())
-
-        metadata = {
-            "tags": ["insight", "configure", "monitoredMediaServers"],
-            "operation": "updateOrganizationInsightMonitoredMediaServer",
-        }
-        organizationId = urllib.parse.quote(str(organizationId), safe="")
-        monitoredMediaServerId = urllib.parse.quote(str(monitoredMediaServerId), safe="")
-        resource = f"/organizations/{organizationId}/insight/monitoredMediaServers/{monitoredMediaServerId}"
-
-        body_params = [
-            "name",
-            "address",
-            "bestEffortMonitoringEnabled",
-        ]
-        payload = {k.strip(): v for k, v in kwargs.items() if k.strip() in body_params}
-
-        if self._session._validate_kwargs:
-            all_params = [] + body_params
-            invalid = [k for k in kwargs if k.strip() not in all_params and k != "self"]
-            if invalid and self._session._logger:
-                self._session._logger.warning(
-                    f"updateOrganizationInsightMonitoredMediaServer: ignoring unrecognized kwargs: {invalid}"
-                )
-
-        return self._session.put(metadata, resource, payload)
+        return dispatch.call(
+            self._session, "updateOrganizationInsightMonitoredMediaServer", organizationId, monitoredMediaServerId, **kwargs
+        )
 
     def deleteOrganizationInsightMonitoredMediaServer(self, organizationId: str, monitoredMediaServerId: str):
         """
@@ -185,12 +94,6 @@ class Insight(object):
         - monitoredMediaServerId (string): Monitored media server ID
         """
 
-        metadata = {
-            "tags": ["insight", "configure", "monitoredMediaServers"],
-            "operation": "deleteOrganizationInsightMonitoredMediaServer",
-        }
-        organizationId = urllib.parse.quote(str(organizationId), safe="")
-        monitoredMediaServerId = urllib.parse.quote(str(monitoredMediaServerId), safe="")
-        resource = f"/organizations/{organizationId}/insight/monitoredMediaServers/{monitoredMediaServerId}"
-
-        return self._session.delete(metadata, resource)
+        return dispatch.call(
+            self._session, "deleteOrganizationInsightMonitoredMediaServer", organizationId, monitoredMediaServerId
+        )
@@ -0,0 +1,8430 @@
+from meraki.dispatch import Operation
+
+# One descriptor per operationId, executed by meraki.dispatch.call
+OPERATIONS = {
+    "getAdministeredIdentitiesMe": Operation(
+        "get",
+        "/administered/identities/me",
+        ("administered", "monitor", "identities", "me"),
+        (),
+    ),
+    "getAdministeredIdentitiesMeApiKeys": Operation(
+        "get",
+        "/administered/identities/me/api/keys",
+        ("administered", "configure", "identities", "me", "api", "keys"),
+        (),
+    ),
+    "generateAdministeredIdentitiesMeApiKeys": Operation(
+        "post",
+        "/administered/identities/me/api/keys/generate",
+        ("administered", "configure", "identities", "me", "api", "keys"),
+        (),
+    ),
+    "revokeAdministeredIdentitiesMeApiKeys": Operation(
+        "post",
+        "/administered/identities/me/api/keys/{suffix}/revoke",
+        ("administered", "configure", "identities", "me", "api", "keys"),
+        ("suffix",),
+    ),
+    "getOrganizations": Operation(
+        "get",
+        "/organizations",
+        ("organizations", "configure"),
+        (),
+        query=frozenset({"perPage", "startingAfter", "endingBefore"}),
+        paginated="next",
+    ),
+    "createOrganization": Operation(
+        "post",
+        "/organizations",
+        ("organizations", "configure"),
+        (),
+        arguments=("name",),
+        body=frozenset({"name", "management"}),
+    ),
+    "getOrganization": Operation(
+        "get",
+        "/organizations/{organizationId}",
+        ("organizations", "configure"),
+        ("organizationId",),
+    ),
+    "updateOrganization": Operation(
+        "put",
+        "/organizations/{organizationId}",
+        ("organizations", "configure"),
+        ("organizationId",),
+        body=frozenset({"name", "management", "api", "privacy"}),
+    ),
+    "deleteOrganization": Operation(
+        "delete",
+        "/organizations/{organizationId}",
+        ("organizations", "configure"),
+        ("organizationId",),
+    ),
+    "createOrganizationActionBatch": Operation(
+        "post",
+        "/organizations/{organizationId}/actionBatches",
+        ("organizations", "configure", "actionBatches"),
+        ("organizationId",),
+        arguments=("organizationId", "actions"),
+        body=frozenset({"confirmed", "synchronous", "actions", "callback"}),
+    ),
+    "getOrganizationActionBatches": Operation(
+        "get",
+        "/organizations/{organizationId}/actionBatches",
+        ("organizations", "configure", "actionBatches"),
+        ("organizationId",),
+        query=frozenset({"status"}),
+        enums={
+            "status": ("completed", "failed", "pending"),
+        },
+    ),
+    "getOrganizationActionBatch": Operation(
+        "get",
+        "/organizations/{organizationId}/actionBatches/{actionBatchId}",
+        ("organizations", "configure", "actionBatches"),
+        ("organizationId", "actionBatchId"),
+    ),
+    "deleteOrganizationActionBatch": Operation(
+        "delete",
+        "/organizations/{organizationId}/actionBatches/{actionBatchId}",
+        ("organizations", "configure", "actionBatches"),
+        ("organizationId", "actionBatchId"),
+    ),
+    "updateOrganizationActionBatch": Operation(
+        "put",
+        "/organizations/{organizationId}/actionBatches/{actionBatchId}",
+        ("organizations", "configure", "actionBatches"),
+        ("organizationId", "actionBatchId"),
+        body=frozenset({"confirmed", "synchronous"}),
+    ),
+    "getOrganizationAdaptivePolicyAcls": Operation(
+        "get",
+        "/organizations/{organizationId}/adaptivePolicy/acls",
+        ("organizations", "configure", "adaptivePolicy", "acls"),
+        ("organizationId",),
+    ),
+    "createOrganizationAdaptivePolicyAcl": Operation(
+        "post",
+        "/organizations/{organizationId}/adaptivePolicy/acls",
+        ("organizations", "configure", "adaptivePolicy", "acls"),
+        ("organizationId",),
+        arguments=("organizationId", "name", "rules", "ipVersion"),
+        body=frozenset({"name", "description", "rules", "ipVersion"}),
+        enums={
+            "ipVersion": ("any", "ipv4", "ipv6"),
+        },
+    ),
+    "getOrganizationAdaptivePolicyAcl": Operation(
+        "get",
+        "/organizations/{organizationId}/adaptivePolicy/acls/{aclId}",
+        ("organizations", "configure", "adaptivePolicy", "acls"),
+        ("organizationId", "aclId"),
+    ),
+    "updateOrganizationAdaptivePolicyAcl": Operation(
+        "put",
+        "/organizations/{organizationId}/adaptivePolicy/acls/{aclId}",
+        ("organizations", "configure", "adaptivePolicy", "acls"),
+        ("organizationId", "aclId"),
+        body=frozenset({"name", "description", "rules", "ipVersion"}),
+        enums={
+            "ipVersion": ("any", "ipv4", "ipv6"),
+        },
+    ),
+    "deleteOrganizationAdaptivePolicyAcl": Operation(
+        "delete",
+        "/organizations/{organizationId}/adaptivePolicy/acls/{aclId}",
+        ("organizations", "configure", "adaptivePolicy", "acls"),
+        ("organizationId", "aclId"),
+    ),
+    "getOrganizationAdaptivePolicyGroups": Operation(
+        "get",
+        "/organizations/{organizationId}/adaptivePolicy/groups",
+        ("organizations", "configure", "adaptivePolicy", "groups"),
+        ("organizationId",),
+    ),
+    "createOrganizationAdaptivePolicyGroup": Operation(
+        "post",
+        "/organizations/{organizationId}/adaptivePolicy/groups",
+        ("organizations", "configure", "adaptivePolicy", "groups"),
+        ("organizationId",),
+        arguments=("organizationId", "name", "sgt"),
+        body=frozenset({"name", "sgt", "description", "policyObjects"}),
+    ),
+    "getOrganizationAdaptivePolicyGroup": Operation(
+        "get",
+        "/organizations/{organizationId}/adaptivePolicy/groups/{id}",
+        ("organizations", "configure", "adaptivePolicy", "groups"),
+        ("organizationId", "id"),
+    ),
+    "updateOrganizationAdaptivePolicyGroup": Operation(
+        "put",
+        "/organizations/{organizationId}/adaptivePolicy/groups/{id}",
+        ("organizations", "configure", "adaptivePolicy", "groups"),
+        ("organizationId", "id"),
+        body=frozenset({"name", "sgt", "description", "policyObjects"}),
+    ),
+    "deleteOrganizationAdaptivePolicyGroup": Operation(
+        "delete",
+        "/organizations/{organizationId}/adaptivePolicy/groups/{id}",
+        ("organizations", "configure", "adaptivePolicy", "groups"),
+        ("organizationId", "id"),
+    ),
+    "getOrganizationAdaptivePolicyOverview": Operation(
+        "get",
+        "/organizations/{organizationId}/adaptivePolicy/overview",
+        ("organizations", "monitor", "adaptivePolicy", "overview"),
+        ("organizationId",),
+    ),
+    "getOrganizationAdaptivePolicyPolicies": Operation(
+        "get",
+        "/organizations/{organizationId}/adaptivePolicy/policies",
+        ("organizations", "configure", "adaptivePolicy", "policies"),
+        ("organizationId",),
+    ),
+    "createOrganizationAdaptivePolicyPolicy": Operation(
+        "post",
+        "/organizations/{organizationId}/adaptivePolicy/policies",
+        ("organizations", "configure", "adaptivePolicy", "policies"),
+        ("organizationId",),
+        arguments=("organizationId", "sourceGroup", "destinationGroup"),
+        body=frozenset({"sourceGroup", "destinationGroup", "acls", "lastEntryRule"}),
+        enums={
+            "lastEntryRule": ("allow", "default", "deny"),
+        },
+    ),
+    "getOrganizationAdaptivePolicyPolicy": Operation(
+        "get",
+        "/organizations/{organizationId}/adaptivePolicy/policies/{id}",
+        ("organizations", "configure", "adaptivePolicy", "policies"),
+        ("organizationId", "id"),
+    ),
+    "updateOrganizationAdaptivePolicyPolicy": Operation(
+        "put",
+        "/organizations/{organizationId}/adaptivePolicy/policies/{id}",
+        ("organizations", "configure", "adaptivePolicy", "policies"),
+        ("organizationId", "id"),
+        body=frozenset({"sourceGroup", "destinationGroup", "acls", "lastEntryRule"}),
+        enums={
+            "lastEntryRule": ("allow", "default", "deny"),
+        },
+    ),
+    "deleteOrganizationAdaptivePolicyPolicy": Operation(
+        "delete",
+        "/organizations/{organizationId}/adaptivePolicy/policies/{id}",
+        ("organizations", "configure", "adaptivePolicy", "policies"),
+        ("organizationId", "id"),
+    ),
+    "getOrganizationAdaptivePolicySettings": Operation(
+        "get",
+        "/organizations/{organizationId}/adaptivePolicy/settings",
+        ("organizations", "configure", "adaptivePolicy", "settings"),
+        ("organizationId",),
+    ),
+    "updateOrganizationAdaptivePolicySettings": Operation(
+        "put",
+        "/organizations/{organizationId}/adaptivePolicy/settings",
+        ("organizations", "configure", "adaptivePolicy", "settings"),
+        ("organizationId",),
+        body=frozenset({"enabledNetworks"}),
+    ),
+    "getOrganizationAdmins": Operation(
+        "get",
+        "/organizations/{organizationId}/admins",
+        ("organizations", "configure", "admins"),
+        ("organizationId",),
+        query=frozenset({"networkIds"}),
+        array=frozenset({"networkIds"}),
+    ),
+    "createOrganizationAdmin": Operation(
+        "post",
+        "/organizations/{organizationId}/admins",
+        ("organizations", "configure", "admins"),
+        ("organizationId",),
+        arguments=("organizationId", "email", "name", "orgAccess"),
+        body=frozenset({"email", "name", "orgAccess", "tags", "networks", "authenticationMethod"}),
+        enums={
+            "orgAccess": ("enterprise", "full", "none", "read-only"),
+            "authenticationMethod": ("Email",),
+        },
+    ),
+    "updateOrganizationAdmin": Operation(
+        "put",
+        "/organizations/{organizationId}/admins/{adminId}",
+        ("organizations", "configure", "admins"),
+        ("organizationId", "adminId"),
+        body=frozenset({"name", "orgAccess", "tags", "networks"}),
+        enums={
+            "orgAccess": ("enterprise", "full", "none", "read-only"),
+        },
+    ),
+    "deleteOrganizationAdmin": Operation(
+        "delete",
+        "/organizations/{organizationId}/admins/{adminId}",
+        ("organizations", "configure", "admins"),
+        ("organizationId", "adminId"),
+    ),
+    "getOrganizationAlertsProfiles": Operation(
+        "get",
+        "/organizations/{organizationId}/alerts/profiles",
+        ("organizations", "configure", "alerts", "profiles"),
+        ("organizationId",),
+    ),
+    "createOrganizationAlertsProfile": Operation(
+        "post",
+        "/organizations/{organizationId}/alerts/profiles",
+        ("organizations", "configure", "alerts", "profiles"),
+        ("organizationId",),
+        arguments=("organizationId", "type", "alertCondition", "recipients", "networkTags"),
+        body=frozenset({"type", "alertCondition", "recipients", "networkTags", "description"}),
+        enums={
+            "type": (
+                "appOutage",
+                "voipJitter",
+                "voipMos",
+                "voipPacketLoss",
+                "wanLatency",
+                "wanPacketLoss",
+                "wanStatus",
+                "wanUtilization",
+            ),
+        },
+    ),
+    "updateOrganizationAlertsProfile": Operation(
+        "put",
+        "/organizations/{organizationId}/alerts/profiles/{alertConfigId}",
+        ("organizations", "configure", "alerts", "profiles"),
+        ("organizationId", "alertConfigId"),
+        body=frozenset({"enabled", "type", "alertCondition", "recipients", "networkTags", "description"}),
+        enums={
+            "type": (
+                "appOutage",
+                "voipJitter",
+                "voipMos",
+                "voipPacketLoss",
+                "wanLatency",
+                "wanPacketLoss",
+                "wanStatus",
+                "wanUtilization",
+            ),
+        },
+    ),
+    "deleteOrganizationAlertsProfile": Operation(
+        "delete",
+        "/organizations/{organizationId}/alerts/profiles/{alertConfigId}",
+        ("organizations", "configure", "alerts", "profiles"),
+        ("organizationId", "alertConfigId"),
+    ),
+    "getOrganizationApiRestProvisioningPipelinesJobs": Operation(
+        "get",
+        "/organizations/{organizationId}/api/rest/provisioning/pipelines/jobs",
+        ("organizations", "configure", "api", "rest", "provisioning", "pipelines", "jobs"),
+        ("organizationId",),
+        query=frozenset({"perPage", "startingAfter", "endingBefore", "pipelineIds", "status"}),
+        array=frozenset({"pipelineIds"}),
+        paginated="next",
+        enums={
+            "status": ("complete", "deferred", "failed", "new", "ready", "running", "scheduled"),
+        },
+    ),
+    "getOrganizationApiRestProvisioningPipelinesJobsOverviewsByPipeline": Operation(
+        "get",
+        "/organizations/{organizationId}/api/rest/provisioning/pipelines/jobs/overviews/byPipeline",
+        ("organizations", "configure", "api", "rest", "provisioning", "pipelines", "jobs", "overviews", "byPipeline"),
+        ("organizationId",),
+        query=frozenset({"pipelineIds"}),
+        array=frozenset({"pipelineIds"}),
+    ),
+    "getOrganizationApiRequests": Operation(
+        "get",
+        "/organizations/{organizationId}/apiRequests",
+        ("organizations", "monitor", "apiRequests"),
+        ("organizationId",),
+        query=frozenset(
+            {
+                "t0",
+                "t1",
+                "timespan",
+                "perPage",
+                "startingAfter",
+                "endingBefore",
+                "adminId",
+                "path",
+                "method",
+                "responseCode",
+                "sourceIp",
+                "userAgent",
+                "version",
+                "operationIds",
+            }
+        ),
+        array=frozenset({"operationIds"}),
+        paginated="next",
+        enums={
+            "method": ("DELETE", "GET", "POST", "PUT"),
+            "version": (0, 1),
+        },
+    ),
+    "getOrganizationApiRequestsOverview": Operation(
+        "get",
+        "/organizations/{organizationId}/apiRequests/overview",
+        ("organizations", "monitor", "apiRequests", "overview"),
+        ("organizationId",),
+        query=frozenset({"t0", "t1", "timespan"}),
+    ),
+    "getOrganizationApiRequestsOverviewResponseCodesByInterval": Operation(
+        "get",
+        "/organizations/{organizationId}/apiRequests/overview/responseCodes/byInterval",
+        ("organizations", "monitor", "apiRequests", "overview", "responseCodes", "byInterval"),
+        ("organizationId",),
+        query=frozenset({"t0", "t1", "timespan", "interval", "version", "operationIds", "sourceIps", "adminIds", "userAgent"}),
+        array=frozenset({"operationIds", "sourceIps", "adminIds"}),
+        enums={
+            "version": (0, 1),
+        },
+    ),
+    "getOrganizationAssuranceAlerts": Operation(
+        "get",
+        "/organizations/{organizationId}/assurance/alerts",
+        ("organizations", "monitor", "alerts"),
+        ("organizationId",),
+        query=frozenset(
+            {
+                "perPage",
+                "startingAfter",
+                "endingBefore",
+                "sortOrder",
+                "networkId",
+                "severity",
+                "types",
+                "tsStart",
+                "tsEnd",
+                "category",
+                "sortBy",
+                "serials",
+                "deviceTypes",
+                "deviceTags",
+                "active",
+                "dismissed",
+                "resolved",
+                "suppressAlertsForOfflineNodes",
+            }
+        ),
+        array=frozenset({"types", "serials", "deviceTypes", "deviceTags"}),
+        paginated="next",
+        enums={
+            "sortOrder": ("ascending", "descending"),
+            "category": ("configuration", "connectivity", "device_health", "experience_metrics", "insights"),
+            "sortBy": ("category", "dismissedAt", "resolvedAt", "severity", "startedAt"),
+        },
+    ),
+    "dismissOrganizationAssuranceAlerts": Operation(
+        "post",
+        "/organizations/{organizationId}/assurance/alerts/dismiss",
+        ("organizations", "monitor", "alerts"),
+        ("organizationId",),
+        arguments=("organizationId", "alertIds"),
+        body=frozenset({"alertIds"}),
+    ),
+    "getOrganizationAssuranceAlertsOverview": Operation(
+        "get",
+        "/organizations/{organizationId}/assurance/alerts/overview",
+        ("organizations", "monitor", "alerts", "overview"),
+        ("organizationId",),
+        query=frozenset(
+            {
+                "networkId",
+                "severity",
+                "types",
+                "tsStart",
+                "tsEnd",
+                "category",
+                "serials",
+                "deviceTypes",
+                "deviceTags",
+                "active",
+                "dismissed",
+                "resolved",
+                "suppressAlertsForOfflineNodes",
+            }
+        ),
+        array=frozenset({"types", "serials", "deviceTypes", "deviceTags"}),
+        enums={
+            "category": ("configuration", "connectivity", "device_health", "experience_metrics", "insights"),
+        },
+    ),
+    "getOrganizationAssuranceAlertsOverviewByNetwork": Operation(
+        "get",
+        "/organizations/{organizationId}/assurance/alerts/overview/byNetwork",
+        ("organizations", "monitor", "alerts", "overview", "byNetwork"),
+        ("organizationId",),
+        query=frozenset(
+            {
+                "perPage",
+                "startingAfter",
+                "endingBefore",
+                "sortOrder",
+                "networkId",
+                "severity",
+                "types",
+                "tsStart",
+                "tsEnd",
+                "category",
+                "serials",
+                "deviceTypes",
+                "deviceTags",
+                "active",
+                "dismissed",
+                "resolved",
+                "suppressAlertsForOfflineNodes",
+            }
+        ),
+        array=frozenset({"types", "serials", "deviceTypes", "deviceTags"}),
+        paginated="next",
+        enums={
+            "sortOrder": ("ascending", "descending"),
+            "category": ("configuration", "connectivity", "device_health", "experience_metrics", "insights"),
+        },
+    ),
+    "getOrganizationAssuranceAlertsOverviewByType": Operation(
+        "get",
+        "/organizations/{organizationId}/assurance/alerts/overview/byType",
+        ("organizations", "monitor", "alerts", "overview", "byType"),
+        ("organizationId",),
+        query=frozenset(
+            {
+                "perPage",
+                "startingAfter",
+                "endingBefore",
+                "sortOrder",
+                "networkId",
+                "severity",
+                "types",
+                "tsStart",
+                "tsEnd",
+                "category",
+                "sortBy",
+                "serials",
+                "deviceTypes",
+                "deviceTags",
+                "active",
+                "dismissed",
+                "resolved",
+                "includeDeviceTags",
+                "includeNetworks",
+                "suppressAlertsForOfflineNodes",
+            }
+        ),
+        array=frozenset({"types", "serials", "deviceTypes", "deviceTags"}),
+        paginated="next",
+        enums={
+            "sortOrder": ("ascending", "descending"),
+            "category": ("configuration", "connectivity", "device_health", "experience_metrics", "insights"),
+            "sortBy": ("count", "lastAlertedAt", "networkCount", "severity", "startedAt"),
+        },
+    ),
+    "getOrganizationAssuranceAlertsOverviewHistorical": Operation(
+        "get",
+        "/organizations/{organizationId}/assurance/alerts/overview/historical",
+        ("organizations", "monitor", "alerts", "overview", "historical"),
+        ("organizationId",),
+        arguments=("organizationId", "segmentDuration", "tsStart"),
+        query=frozenset(
+            {"segmentDuration", "networkId", "severity", "types", "tsStart", "tsEnd", "category", "serials", "deviceTypes"}
+        ),
+        array=frozenset({"types", "serials", "deviceTypes"}),
+        enums={
+            "category": ("configuration", "connectivity", "device_health", "experience_metrics", "insights"),
+        },
+    ),
+    "restoreOrganizationAssuranceAlerts": Operation(
+        "post",
+        "/organizations/{organizationId}/assurance/alerts/restore",
+        ("organizations", "monitor", "alerts"),
+        ("organizationId",),
+        arguments=("organizationId", "alertIds"),
+        body=frozenset({"alertIds"}),
+    ),
+    "getOrganizationAssuranceAlertsTaxonomyCategories": Operation(
+        "get",
+        "/organizations/{organizationId}/assurance/alerts/taxonomy/categories",
+        ("organizations", "monitor", "alerts", "taxonomy", "categories"),
+        ("organizationId",),
+    ),
+    "getOrganizationAssuranceAlertsTaxonomyTypes": Operation(
+        "get",
+        "/organizations/{organizationId}/assurance/alerts/taxonomy/types",
+        ("organizations", "monitor", "alerts", "taxonomy", "types"),
+        ("organizationId",),
+    ),
+    "getOrganizationAssuranceAlert": Operation(
+        "get",
+        "/organizations/{organizationId}/assurance/alerts/{id}",
+        ("organizations", "monitor", "alerts"),
+        ("organizationId", "id"),
+    ),
+    "getOrganizationBrandingPolicies": Operation(
+        "get",
+        "/organizations/{organizationId}/brandingPolicies",
+        ("organizations", "configure", "brandingPolicies"),
+        ("organizationId",),
+    ),
+    "createOrganizationBrandingPolicy": Operation(
+        "post",
+        "/organizations/{organizationId}/brandingPolicies",
+        ("organizations", "configure", "brandingPolicies"),
+        ("organizationId",),
+        arguments=("organizationId", "name"),
+        body=frozenset({"name", "enabled", "adminSettings", "helpSettings", "customLogo"}),
+    ),
+    "getOrganizationBrandingPoliciesPriorities": Operation(
+        "get",
+        "/organizations/{organizationId}/brandingPolicies/priorities",
+        ("organizations", "configure", "brandingPolicies", "priorities"),
+        ("organizationId",),
+    ),
+    "updateOrganizationBrandingPoliciesPriorities": Operation(
+        "put",
+        "/organizations/{organizationId}/brandingPolicies/priorities",
+        ("organizations", "configure", "brandingPolicies", "priorities"),
+        ("organizationId",),
+        body=frozenset({"brandingPolicyIds"}),
+    ),
+    "getOrganizationBrandingPolicy": Operation(
+        "get",
+        "/organizations/{organizationId}/brandingPolicies/{brandingPolicyId}",
+        ("organizations", "configure", "brandingPolicies"),
+        ("organizationId", "brandingPolicyId"),
+    ),
+    "updateOrganizationBrandingPolicy": Operation(
+        "put",
+        "/organizations/{organizationId}/brandingPolicies/{brandingPolicyId}",
+        ("organizations", "configure", "brandingPolicies"),
+        ("organizationId", "brandingPolicyId"),
+        arguments=("organizationId", "brandingPolicyId", "name"),
+        body=frozenset({"name", "enabled", "adminSettings", "helpSettings", "customLogo"}),
+    ),
+    "deleteOrganizationBrandingPolicy": Operation(
+        "delete",
+        "/organizations/{organizationId}/brandingPolicies/{brandingPolicyId}",
+        ("organizations", "configure", "brandingPolicies"),
+        ("organizationId", "brandingPolicyId"),
+    ),
+    "claimIntoOrganization": Operation(
+        "post",
+        "/organizations/{organizationId}/claim",
+        ("organizations", "configure"),
+        ("organizationId",),
+        body=frozenset({"orders", "serials", "licenses"}),
+    ),
+    "getOrganizationClientsBandwidthUsageHistory": Operation(
+        "get",
+        "/organizations/{organizationId}/clients/bandwidthUsageHistory",
+        ("organizations", "monitor", "clients", "bandwidthUsageHistory"),
+        ("organizationId",),
+        query=frozenset({"networkTag", "deviceTag", "ssidName", "usageUplink", "t0", "t1", "timespan"}),
+    ),
+    "getOrganizationClientsOverview": Operation(
+        "get",
+        "/organizations/{organizationId}/clients/overview",
+        ("organizations", "monitor", "clients", "overview"),
+        ("organizationId",),
+        query=frozenset({"t0", "t1", "timespan"}),
+    ),
+    "getOrganizationClientsSearch": Operation(
+        "get",
+        "/organizations/{organizationId}/clients/search",
+        ("organizations", "configure", "clients", "search"),
+        ("organizationId",),
+        arguments=("organizationId", "mac"),
+        query=frozenset({"perPage", "startingAfter", "endingBefore", "mac"}),
+        paginated="next",
+    ),
+    "cloneOrganization": Operation(
+        "post",
+        "/organizations/{organizationId}/clone",
+        ("organizations", "configure"),
+        ("organizationId",),
+        arguments=("organizationId", "name"),
+        body=frozenset({"name"}),
+    ),
+    "getOrganizationConfigTemplates": Operation(
+        "get",
+        "/organizations/{organizationId}/configTemplates",
+        ("organizations", "configure", "configTemplates"),
+        ("organizationId",),
+    ),
+    "createOrganizationConfigTemplate": Operation(
+        "post",
+        "/organizations/{organizationId}/configTemplates",
+        ("organizations", "configure", "configTemplates"),
+        ("organizationId",),
+        arguments=("organizationId", "name"),
+        body=frozenset({"name", "timeZone", "copyFromNetworkId"}),
+    ),
+    "getOrganizationConfigTemplate": Operation(
+        "get",
+        "/organizations/{organizationId}/configTemplates/{configTemplateId}",
+        ("organizations", "configure", "configTemplates"),
+        ("organizationId", "configTemplateId"),
+    ),
+    "updateOrganizationConfigTemplate": Operation(
+        "put",
+        "/organizations/{organizationId}/configTemplates/{configTemplateId}",
+        ("organizations", "configure", "configTemplates"),
+        ("organizationId", "configTemplateId"),
+        body=frozenset({"name", "timeZone"}),
+    ),
+    "deleteOrganizationConfigTemplate": Operation(
+        "delete",
+        "/organizations/{organizationId}/configTemplates/{configTemplateId}",
+        ("organizations", "configure", "configTemplates"),
+        ("organizationId", "configTemplateId"),
+    ),
+    "getOrganizationConfigurationChanges": Operation(
+        "get",
+        "/organizations/{organizationId}/configurationChanges",
+        ("organizations", "monitor", "configurationChanges"),
+        ("organizationId",),
+        query=frozenset({"t0", "t1", "timespan", "perPage", "startingAfter", "endingBefore", "networkId", "adminId"}),
+        paginated="prev",
+    ),
+    "getOrganizationDevices": Operation(
+        "get",
+        "/organizations/{organizationId}/devices",
+        ("organizations", "configure", "devices"),
+        ("organizationId",),
+        query=frozenset(
+            {
+                "perPage",
+                "startingAfter",
+                "endingBefore",
+                "configurationUpdatedAfter",
+                "networkIds",
+                "productTypes",
+                "tags",
+                "tagsFilterType",
+                "name",
+                "mac",
+                "serial",
+                "model",
+                "macs",
+                "serials",
+                "sensorMetrics",
+                "sensorAlertProfileIds",
+                "models",
+            }
+        ),
+        array=frozenset(
+            {"networkIds", "productTypes", "tags", "macs", "serials", "sensorMetrics", "sensorAlertProfileIds", "models"}
+        ),
+        paginated="next",
+        enums={
+            "tagsFilterType": ("withAllTags", "withAnyTags"),
+        },
+    ),
+    "getOrganizationDevicesAvailabilities": Operation(
+        "get",
+        "/organizations/{organizationId}/devices/availabilities",
+        ("organizations", "monitor", "devices", "availabilities"),
+        ("organizationId",),
+        query=frozenset(
+            {
+                "perPage",
+                "startingAfter",
+                "endingBefore",
+                "networkIds",
+                "productTypes",
+                "serials",
+                "tags",
+                "tagsFilterType",
+                "statuses",
+            }
+        ),
+        array=frozenset({"networkIds", "productTypes", "serials", "tags", "statuses"}),
+        paginated="next",
+        enums={
+            "tagsFilterType": ("withAllTags", "withAnyTags"),
+        },
+    ),
+    "getOrganizationDevicesAvailabilitiesChangeHistory": Operation(
+        "get",
+        "/organizations/{organizationId}/devices/availabilities/changeHistory",
+        ("organizations", "monitor", "devices", "availabilities", "changeHistory"),
+        ("organizationId",),
+        query=frozenset(
+            {
+                "perPage",
+                "startingAfter",
+                "endingBefore",
+                "t0",
+                "t1",
+                "timespan",
+                "serials",
+                "productTypes",
+                "networkIds",
+                "statuses",
+            }
+        ),
+        array=frozenset({"serials", "productTypes", "networkIds", "statuses"}),
+        paginated="next",
+    ),
+    "getOrganizationDevicesCellularDataDevices": Operation(
+        "get",
+        "/organizations/{organizationId}/devices/cellular/data/devices",
+        ("organizations", "monitor", "devices", "cellular", "data"),
+        ("organizationId",),
+        query=frozenset(
+            {
+                "includeAssigned",
+                "includedSerials",
+                "excludedSerials",
+                "includedProfileIds",
+                "excludedProfileIds",
+                "deviceTypes",
+                "slots",
+                "name",
+                "serials",
+                "perPage",
+                "startingAfter",
+                "endingBefore",
+            }
+        ),
+        array=frozenset(
+            {
+                "includedSerials",
+                "excludedSerials",
+                "includedProfileIds",
+                "excludedProfileIds",
+                "deviceTypes",
+                "slots",
+                "serials",
+            }
+        ),
+        paginated="next",
+    ),
+    "getOrganizationDevicesCellularDataProfiles": Operation(
+        "get",
+        "/organizations/{organizationId}/devices/cellular/data/profiles",
+        ("organizations", "configure", "devices", "cellular", "data", "profiles"),
+        ("organizationId",),
+        query=frozenset({"profileIds", "serials", "perPage", "startingAfter", "endingBefore"}),
+        array=frozenset({"profileIds", "serials"}),
+        paginated="next",
+    ),
+    "createOrganizationDevicesCellularDataProfile": Operation(
+        "post",
+        "/organizations/{organizationId}/devices/cellular/data/profiles",
+        ("organizations", "configure", "devices", "cellular", "data", "profiles"),
+        ("organizationId",),
+        arguments=("organizationId", "name", "description", "rules"),
+        body=frozenset({"name", "description", "rules"}),
+    ),
+    "getOrganizationDevicesCellularDataProfilesAssignments": Operation(
+        "get",
+        "/organizations/{organizationId}/devices/cellular/data/profiles/assignments",
+        ("organizations", "configure", "devices", "cellular", "data", "profiles", "assignments"),
+        ("organizationId",),
+        query=frozenset({"profileIds", "serials", "perPage", "startingAfter", "endingBefore"}),
+        array=frozenset({"profileIds", "serials"}),
+        paginated="next",
+    ),
+    "batchOrganizationDevicesCellularDataProfilesAssignmentsCreate": Operation(
+        "post",
+        "/organizations/{organizationId}/devices/cellular/data/profiles/assignments/batchCreate",
+        ("organizations", "configure", "devices", "cellular", "data", "profiles", "assignments"),
+        ("organizationId",),
+        arguments=("organizationId", "items"),
+        body=frozenset({"items"}),
+    ),
+    "bulkOrganizationDevicesCellularDataProfilesAssignmentsDelete": Operation(
+        "post",
+        "/organizations/{organizationId}/devices/cellular/data/profiles/assignments/bulkDelete",
+        ("organizations", "configure", "devices", "cellular", "data", "profiles", "assignments"),
+        ("organizationId",),
+        arguments=("organizationId", "items"),
+        body=frozenset({"items"}),
+    ),
+    "updateOrganizationDevicesCellularDataProfile": Operation(
+        "put",
+        "/organizations/{organizationId}/devices/cellular/data/profiles/{profileId}",
+        ("organizations", "configure", "devices", "cellular", "data", "profiles"),
+        ("organizationId", "profileId"),
+        arguments=("organizationId", "rules", "profileId"),
+        body=frozenset({"profileId", "description", "rules"}),
+    ),
+    "deleteOrganizationDevicesCellularDataProfile": Operation(
+        "delete",
+        "/organizations/{organizationId}/devices/cellular/data/profiles/{profileId}",
+        ("organizations", "configure", "devices", "cellular", "data", "profiles"),
+        ("organizationId", "profileId"),
+    ),
+    "getOrganizationDevicesCellularDataUsageByDevice": Operation(
+        "get",
+        "/organizations/{organizationId}/devices/cellular/data/usage/byDevice",
+        ("organizations", "monitor", "devices", "cellular", "data", "usage", "byDevice"),
+        ("organizationId",),
+        query=frozenset({"serials", "perPage", "startingAfter", "endingBefore"}),
+        array=frozenset({"serials"}),
+        paginated="next",
+    ),
+    "getOrganizationDevicesCellularDataUsageHistoryByDeviceByInterval": Operation(
+        "get",
+        "/organizations/{organizationId}/devices/cellular/data/usage/history/byDevice/byInterval",
+        ("organizations", "monitor", "devices", "cellular", "data", "usage", "history", "byDevice", "byInterval"),
+        ("organizationId",),
+        arguments=("organizationId", "serials"),
+        query=frozenset({"serials", "perPage", "startingAfter", "endingBefore", "t0", "t1", "timespan", "interval"}),
+        array=frozenset({"serials"}),
+        paginated="next",
+    ),
+    "getOrganizationDevicesCellularGeolocations": Operation(
+        "get",
+        "/organizations/{organizationId}/devices/cellular/geolocations",
+        ("organizations", "monitor", "devices", "cellular", "geolocations"),
+        ("organizationId",),
+        query=frozenset({"serials", "perPage", "startingAfter", "endingBefore"}),
+        array=frozenset({"serials"}),
+        paginated="next",
+    ),
+    "getOrganizationDevicesCellularUplinksBandsByDevice": Operation(
+        "get",
+        "/organizations/{organizationId}/devices/cellular/uplinks/bands/byDevice",
+        ("organizations", "monitor", "devices", "cellular", "uplinks", "bands", "byDevice"),
+        ("organizationId",),
+        query=frozenset({"serials", "perPage", "startingAfter", "endingBefore"}),
+        array=frozenset({"serials"}),
+        paginated="next",
+    ),
+    "getOrganizationDevicesCellularUplinksTowersByDevice": Operation(
+        "get",
+        "/organizations/{organizationId}/devices/cellular/uplinks/towers/byDevice",
+        ("organizations", "monitor", "devices", "cellular", "uplinks", "towers", "byDevice"),
+        ("organizationId",),
+        query=frozenset({"serials", "perPage", "startingAfter", "endingBefore"}),
+        array=frozenset({"serials"}),
+        paginated="next",
+    ),
+    "createOrganizationDevicesControllerMigration": Operation(
+        "post",
+        "/organizations/{organizationId}/devices/controller/migrations",
+        ("organizations", "configure", "devices", "controller", "migrations"),
+        ("organizationId",),
+        arguments=("organizationId", "serials", "target"),
+        body=frozenset({"serials", "target"}),
+        enums={
+            "target": ("wirelessController",),
+        },
+    ),
+    "getOrganizationDevicesControllerMigrations": Operation(
+        "get",
+        "/organizations/{organizationId}/devices/controller/migrations",
+        ("organizations", "configure", "devices", "controller", "migrations"),
+        ("organizationId",),
+        query=frozenset({"serials", "networkIds", "target", "perPage", "startingAfter", "endingBefore"}),
+        array=frozenset({"serials", "networkIds"}),
+        paginated="next",
+        enums={
+            "target": ("wirelessController",),
+        },
+    ),
+    "bulkUpdateOrganizationDevicesDetails": Operation(
+        "post",
+        "/organizations/{organizationId}/devices/details/bulkUpdate",
+        ("organizations", "configure", "devices", "details", "bulkUpdate"),
+        ("organizationId",),
+        arguments=("organizationId", "serials", "details"),
+        body=frozenset({"serials", "details"}),
+    ),
+    "getOrganizationDevicesOverviewByModel": Operation(
+        "get",
+        "/organizations/{organizationId}/devices/overview/byModel",
+        ("organizations", "configure", "devices", "overview", "byModel"),
+        ("organizationId",),
+        query=frozenset({"models", "networkIds", "productTypes"}),
+        array=frozenset({"models", "networkIds", "productTypes"}),
+    ),
+    "getOrganizationDevicesPacketCaptureCaptures": Operation(
+        "get",
+        "/organizations/{organizationId}/devices/packetCapture/captures",
+        ("organizations", "configure", "devices", "packetCapture", "captures"),
+        ("organizationId",),
+        query=frozenset(
+            {
+                "captureIds",
+                "networkIds",
+                "serials",
+                "process",
+                "captureStatus",
+                "name",
+                "clientMac",
+                "notes",
+                "deviceName",
+                "adminName",
+                "t0",
+                "t1",
+                "timespan",
+                "perPage",
+                "startingAfter",
+                "endingBefore",
+                "sortOrder",
+            }
+        ),
+        array=frozenset({"captureIds", "networkIds", "serials", "process", "captureStatus", "name", "clientMac"}),
+        paginated="next",
+        enums={
+            "sortOrder": ("ascending", "descending"),
+        },
+    ),
+    "createOrganizationDevicesPacketCaptureCapture": Operation(
+        "post",
+        "/organizations/{organizationId}/devices/packetCapture/captures",
+        ("organizations", "configure", "devices", "packetCapture", "captures"),
+        ("organizationId",),
+        arguments=("organizationId", "serials", "name"),
+        body=frozenset(
+            {
+                "serials",
+                "name",
+                "outputType",
+                "destination",
+                "ports",
+                "notes",
+                "duration",
+                "filterExpression",
+                "interface",
+                "advanced",
+            }
+        ),
+    ),
+    "bulkOrganizationDevicesPacketCaptureCapturesCreate": Operation(
+        "post",
+        "/organizations/{organizationId}/devices/packetCapture/captures/bulkCreate",
+        ("organizations", "configure", "devices", "packetCapture", "captures"),
+        ("organizationId",),
+        arguments=("organizationId", "devices", "name"),
+        body=frozenset({"devices", "notes", "duration", "filterExpression", "name", "advanced"}),
+    ),
+    "bulkOrganizationDevicesPacketCaptureCapturesDelete": Operation(
+        "post",
+        "/organizations/{organizationId}/devices/packetCapture/captures/bulkDelete",
+        ("organizations", "configure", "devices", "packetCapture", "captures"),
+        ("organizationId",),
+        arguments=("organizationId", "captureIds"),
+        body=frozenset({"captureIds"}),
+    ),
+    "deleteOrganizationDevicesPacketCaptureCapture": Operation(
+        "delete",
+        "/organizations/{organizationId}/devices/packetCapture/captures/{captureId}",
+        ("organizations", "configure", "devices", "packetCapture", "captures"),
+        ("organizationId", "captureId"),
+    ),
+    "generateOrganizationDevicesPacketCaptureCaptureDownloadUrl": Operation(
+        "post",
+        "/organizations/{organizationId}/devices/packetCapture/captures/{captureId}/downloadUrl/generate",
+        ("organizations", "configure", "devices", "packetCapture", "captures", "downloadUrl"),
+        ("organizationId", "captureId"),
+    ),
+    "stopOrganizationDevicesPacketCaptureCapture": Operation(
+        "post",
+        "/organizations/{organizationId}/devices/packetCapture/captures/{captureId}/stop",
+        ("organizations", "configure", "devices", "packetCapture", "captures"),
+        ("organizationId", "captureId"),
+        arguments=("organizationId", "captureId", "serials"),
+        body=frozenset({"serials"}),
+    ),
+    "getOrganizationDevicesPacketCaptureSchedules": Operation(
+        "get",
+        "/organizations/{organizationId}/devices/packetCapture/schedules",
+        ("organizations", "configure", "devices", "packetCapture", "schedules"),
+        ("organizationId",),
+        query=frozenset({"scheduleIds", "networkIds", "deviceIds"}),
+        array=frozenset({"scheduleIds", "networkIds", "deviceIds"}),
+    ),
+    "createOrganizationDevicesPacketCaptureSchedule": Operation(
+        "post",
+        "/organizations/{organizationId}/devices/packetCapture/schedules",
+        ("organizations", "configure", "devices", "packetCapture", "schedules"),
+        ("organizationId",),
+        arguments=("organizationId", "devices"),
+        body=frozenset({"devices", "name", "notes", "duration", "filterExpression", "enabled", "schedule"}),
+    ),
+    "reorderOrganizationDevicesPacketCaptureSchedules": Operation(
+        "post",
+        "/organizations/{organizationId}/devices/packetCapture/schedules/reorder",
+        ("organizations", "configure", "devices", "packetCapture", "schedules"),
+        ("organizationId",),
+        arguments=("organizationId", "order"),
+        body=frozenset({"order"}),
+    ),
+    "updateOrganizationDevicesPacketCaptureSchedule": Operation(
+        "put",
+        "/organizations/{organizationId}/devices/packetCapture/schedules/{scheduleId}",
+        ("organizations", "configure", "devices", "packetCapture", "schedules"),
+        ("organizationId", "scheduleId"),
+        arguments=("organizationId", "scheduleId", "devices"),
+        body=frozenset({"devices", "name", "notes", "duration", "filterExpression", "enabled", "schedule"}),
+    ),
+    "deleteOrganizationDevicesPacketCaptureSchedule": Operation(
+        "delete",
+        "/organizations/{organizationId}/devices/packetCapture/schedules/{scheduleId}",
+        ("organizations", "configure", "devices", "packetCapture", "schedules"),
+        ("organizationId", "scheduleId"),
+    ),
+    "getOrganizationDevicesPowerModulesStatusesByDevice": Operation(
+        "get",
+        "/organizations/{organizationId}/devices/powerModules/statuses/byDevice",
+        ("organizations", "monitor", "devices", "powerModules", "statuses", "byDevice"),
+        ("organizationId",),
+        query=frozenset(
+            {"perPage", "startingAfter", "endingBefore", "networkIds", "productTypes", "serials", "tags", "tagsFilterType"}
+        ),
+        array=frozenset({"networkIds", "productTypes", "serials", "tags"}),
+        paginated="next",
+        enums={
+            "tagsFilterType": ("withAllTags", "withAnyTags"),
+        },
+    ),
+    "getOrganizationDevicesProvisioningStatuses": Operation(
+        "get",
+        "/organizations/{organizationId}/devices/provisioning/statuses",
+        ("organizations", "monitor", "devices", "provisioning", "statuses"),
+        ("organizationId",),
+        query=frozenset(
+            {
+                "perPage",
+                "startingAfter",
+                "endingBefore",
+                "networkIds",
+                "productTypes",
+                "serials",
+                "status",
+                "tags",
+                "tagsFilterType",
+            }
+        ),
+        array=frozenset({"networkIds", "productTypes", "serials", "tags"}),
+        paginated="next",
+        enums={
+            "status": ("complete", "incomplete", "unprovisioned"),
+            "tagsFilterType": ("withAllTags", "withAnyTags"),
+        },
+    ),
+    "getOrganizationDevicesStatuses": Operation(
+        "get",
+        "/organizations/{organizationId}/devices/statuses",
+        ("organizations", "monitor", "devices", "statuses"),
+        ("organizationId",),
+        query=frozenset(
+            {
+                "perPage",
+                "startingAfter",
+                "endingBefore",
+                "networkIds",
+                "serials",
+                "statuses",
+                "productTypes",
+                "models",
+                "tags",
+                "tagsFilterType",
+            }
+        ),
+        array=frozenset({"networkIds", "serials", "statuses", "productTypes", "models", "tags"}),
+        paginated="next",
+        enums={
+            "tagsFilterType": ("withAllTags", "withAnyTags"),
+        },
+    ),
+    "getOrganizationDevicesStatusesOverview": Operation(
+        "get",
+        "/organizations/{organizationId}/devices/statuses/overview",
+        ("organizations", "monitor", "devices", "statuses", "overview"),
+        ("organizationId",),
+        query=frozenset({"productTypes", "networkIds"}),
+        array=frozenset({"productTypes", "networkIds"}),
+    ),
+    "getOrganizationDevicesSyslogServersByNetwork": Operation(
+        "get",
+        "/organizations/{organizationId}/devices/syslog/servers/byNetwork",
+        ("organizations", "configure", "devices", "syslog", "servers", "byNetwork"),
+        ("organizationId",),
+        query=frozenset({"perPage", "startingAfter", "endingBefore", "networkIds"}),
+        array=frozenset({"networkIds"}),
+        paginated="next",
+    ),
+    "getOrganizationDevicesSyslogServersRolesByNetwork": Operation(
+        "get",
+        "/organizations/{organizationId}/devices/syslog/servers/roles/byNetwork",
+        ("organizations", "configure", "devices", "syslog", "servers", "roles", "byNetwork"),
+        ("organizationId",),
+        query=frozenset({"perPage", "startingAfter", "endingBefore", "networkIds"}),
+        array=frozenset({"networkIds"}),
+        paginated="next",
+    ),
+    "getOrganizationDevicesSystemMemoryUsageHistoryByInterval": Operation(
+        "get",
+        "/organizations/{organizationId}/devices/system/memory/usage/history/byInterval",
+        ("organizations", "monitor", "devices", "system", "memory", "usage", "history", "byInterval"),
+        ("organizationId",),
+        query=frozenset(
+            {
+                "perPage",
+                "startingAfter",
+                "endingBefore",
+                "t0",
+                "t1",
+                "timespan",
+                "interval",
+                "networkIds",
+                "serials",
+                "productTypes",
+            }
+        ),
+        array=frozenset({"networkIds", "serials", "productTypes"}),
+        paginated="next",
+    ),
+    "getOrganizationDevicesUplinksAddressesByDevice": Operation(
+        "get",
+        "/organizations/{organizationId}/devices/uplinks/addresses/byDevice",
+        ("organizations", "monitor", "devices", "uplinks", "addresses", "byDevice"),
+        ("organizationId",),
+        query=frozenset(
+            {"perPage", "startingAfter", "endingBefore", "networkIds", "productTypes", "serials", "tags", "tagsFilterType"}
+        ),
+        array=frozenset({"networkIds", "productTypes", "serials", "tags"}),
+        paginated="next",
+        enums={
+            "tagsFilterType": ("withAllTags", "withAnyTags"),
+        },
+    ),
+    "getOrganizationDevicesUplinksLossAndLatency": Operation(
+        "get",
+        "/organizations/{organizationId}/devices/uplinksLossAndLatency",
+        ("organizations", "monitor", "devices", "uplinks", "uplinksLossAndLatency"),
+        ("organizationId",),
+        query=frozenset({"t0", "t1", "timespan", "uplink", "ip"}),
+        enums={
+            "uplink": ("cellular", "wan1", "wan2", "wan3"),
+        },
+    ),
+    "getOrganizationEarlyAccessFeatures": Operation(
+        "get",
+        "/organizations/{organizationId}/earlyAccess/features",
+        ("organizations", "configure", "earlyAccess", "features"),
+        ("organizationId",),
+    ),
+    "getOrganizationEarlyAccessFeaturesOptIns": Operation(
+        "get",
+        "/organizations/{organizationId}/earlyAccess/features/optIns",
+        ("organizations", "configure", "earlyAccess", "features", "optIns"),
+        ("organizationId",),
+    ),
+    "createOrganizationEarlyAccessFeaturesOptIn": Operation(
+        "post",
+        "/organizations/{organizationId}/earlyAccess/features/optIns",
+        ("organizations", "configure", "earlyAccess", "features", "optIns"),
+        ("organizationId",),
+        arguments=("organizationId", "shortName"),
+        body=frozenset({"shortName", "limitScopeToNetworks"}),
+    ),
+    "getOrganizationEarlyAccessFeaturesOptIn": Operation(
+        "get",
+        "/organizations/{organizationId}/earlyAccess/features/optIns/{optInId}",
+        ("organizations", "configure", "earlyAccess", "features", "optIns"),
+        ("organizationId", "optInId"),
+    ),
+    "updateOrganizationEarlyAccessFeaturesOptIn": Operation(
+        "put",
+        "/organizations/{organizationId}/earlyAccess/features/optIns/{optInId}",
+        ("organizations", "configure", "earlyAccess", "features", "optIns"),
+        ("organizationId", "optInId"),
+        body=frozenset({"limitScopeToNetworks"}),
+    ),
+    "deleteOrganizationEarlyAccessFeaturesOptIn": Operation(
+        "delete",
+        "/organizations/{organizationId}/earlyAccess/features/optIns/{optInId}",
+        ("organizations", "configure", "earlyAccess", "features", "optIns"),
+        ("organizationId", "optInId"),
+    ),
+    "getOrganizationFirmwareUpgrades": Operation(
+        "get",
+        "/organizations/{organizationId}/firmware/upgrades",
+        ("organizations", "configure", "firmware", "upgrades"),
+        ("organizationId",),
+        query=frozenset({"perPage", "startingAfter", "endingBefore", "status", "productTypes"}),
+        array=frozenset({"status", "productTypes"}),
+        paginated="next",
+    ),
+    "getOrganizationFirmwareUpgradesByDevice": Operation(
+        "get",
+        "/organizations/{organizationId}/firmware/upgrades/byDevice",
+        ("organizations", "configure", "firmware", "upgrades", "byDevice"),
+        ("organizationId",),
+        query=frozenset(
+            {
+                "perPage",
+                "startingAfter",
+                "endingBefore",
+                "networkIds",
+                "serials",
+                "macs",
+                "firmwareUpgradeBatchIds",
+                "upgradeStatuses",
+                "currentUpgradesOnly",
+                "limitPerDevice",
+            }
+        ),
+        array=frozenset({"networkIds", "serials", "macs", "firmwareUpgradeBatchIds", "upgradeStatuses"}),
+        paginated="next",
+    ),
+    "getOrganizationFloorPlansAutoLocateDevices": Operation(
+        "get",
+        "/organizations/{organizationId}/floorPlans/autoLocate/devices",
+        ("organizations", "configure", "floorPlans", "autoLocate", "devices"),
+        ("organizationId",),
+        query=frozenset({"perPage", "startingAfter", "endingBefore", "networkIds", "floorPlanIds"}),
+        array=frozenset({"networkIds", "floorPlanIds"}),
+        paginated="next",
+    ),
+    "getOrganizationFloorPlansAutoLocateStatuses": Operation(
+        "get",
+        "/organizations/{organizationId}/floorPlans/autoLocate/statuses",
+        ("organizations", "configure", "floorPlans", "autoLocate", "statuses"),
+        ("organizationId",),
+        query=frozenset({"perPage", "startingAfter", "endingBefore", "networkIds", "floorPlanIds"}),
+        array=frozenset({"networkIds", "floorPlanIds"}),
+        paginated="next",
+    ),
+    "getOrganizationIntegrationsDeployable": Operation(
+        "get",
+        "/organizations/{organizationId}/integrations/deployable",
+        ("organizations", "configure", "integrations", "deployable"),
+        ("organizationId",),
+    ),
+    "getOrganizationIntegrationsDeployed": Operation(
+        "get",
+        "/organizations/{organizationId}/integrations/deployed",
+        ("organizations", "configure", "integrations", "deployed"),
+        ("organizationId",),
+    ),
+    "getOrganizationIntegrationsXdrNetworks": Operation(
+        "get",
+        "/organizations/{organizationId}/integrations/xdr/networks",
+        ("organizations", "configure", "integrations", "xdr", "networks"),
+        ("organizationId",),
+        query=frozenset({"networkIds", "perPage", "startingAfter", "endingBefore"}),
+        array=frozenset({"networkIds"}),
+        paginated="next",
+    ),
+    "disableOrganizationIntegrationsXdrNetworks": Operation(
+        "post",
+        "/organizations/{organizationId}/integrations/xdr/networks/disable",
+        ("organizations", "configure", "integrations", "xdr", "networks"),
+        ("organizationId",),
+        arguments=("organizationId", "networks"),
+        body=frozenset({"networks"}),
+    ),
+    "enableOrganizationIntegrationsXdrNetworks": Operation(
+        "post",
+        "/organizations/{organizationId}/integrations/xdr/networks/enable",
+        ("organizations", "configure", "integrations", "xdr", "networks"),
+        ("organizationId",),
+        arguments=("organizationId", "networks"),
+        body=frozenset({"networks"}),
+    ),
+    "claimIntoOrganizationInventory": Operation(
+        "post",
+        "/organizations/{organizationId}/inventory/claim",
+        ("organizations", "configure", "inventory"),
+        ("organizationId",),
+        body=frozenset({"orders", "serials", "licenses"}),
+    ),
+    "getOrganizationInventoryDevices": Operation(
+        "get",
+        "/organizations/{organizationId}/inventory/devices",
+        ("organizations", "configure", "inventory", "devices"),
+        ("organizationId",),
+        query=frozenset(
+            {
+                "perPage",
+                "startingAfter",
+                "endingBefore",
+                "usedState",
+                "search",
+                "macs",
+                "networkIds",
+                "serials",
+                "models",
+                "orderNumbers",
+                "tags",
+                "tagsFilterType",
+                "productTypes",
+                "eoxStatuses",
+            }
+        ),
+        array=frozenset({"macs", "networkIds", "serials", "models", "orderNumbers", "tags", "productTypes", "eoxStatuses"}),
+        paginated="next",
+        enums={
+            "usedState": ("unused", "used"),
+            "tagsFilterType": ("withAllTags", "withAnyTags"),
+        },
+    ),
+    "getOrganizationInventoryDevicesEoxOverview": Operation(
+        "get",
+        "/organizations/{organizationId}/inventory/devices/eox/overview",
+        ("organizations", "configure", "inventory", "devices", "eox"),
+        ("organizationId",),
+    ),
+    "createOrganizationInventoryDevicesSwapsBulk": Operation(
+        "post",
+        "/organizations/{organizationId}/inventory/devices/swaps/bulk",
+        ("organizations", "configure", "inventory", "devices", "swaps", "bulk"),
+        ("organizationId",),
+        arguments=("organizationId", "swaps"),
+        body=frozenset({"swaps"}),
+    ),
+    "getOrganizationInventoryDevicesSwapsBulk": Operation(
+        "get",
+        "/organizations/{organizationId}/inventory/devices/swaps/bulk/{id}",
+        ("organizations", "configure", "inventory", "devices", "swaps", "bulk"),
+        ("organizationId", "id"),
+    ),
+    "getOrganizationInventoryDevice": Operation(
+        "get",
+        "/organizations/{organizationId}/inventory/devices/{serial}",
+        ("organizations", "configure", "inventory", "devices"),
+        ("organizationId", "serial"),
+    ),
+    "claimOrganizationInventoryOrders": Operation(
+        "post",
+        "/organizations/{organizationId}/inventory/orders/claim",
+        ("organizations", "configure", "inventory", "orders"),
+        ("organizationId",),
+        arguments=("organizationId", "claimId"),
+        body=frozenset({"claimId", "subscriptions"}),
+    ),
+    "previewOrganizationInventoryOrders": Operation(
+        "post",
+        "/organizations/{organizationId}/inventory/orders/preview",
+        ("organizations", "configure", "inventory", "orders"),
+        ("organizationId",),
+        arguments=("organizationId", "claimId"),
+        body=frozenset({"claimId"}),
+    ),
+    "releaseFromOrganizationInventory": Operation(
+        "post",
+        "/organizations/{organizationId}/inventory/release",
+        ("organizations", "configure", "inventory"),
+        ("organizationId",),
+        body=frozenset({"serials"}),
+    ),
+    "getOrganizationLicenses": Operation(
+        "get",
+        "/organizations/{organizationId}/licenses",
+        ("organizations", "configure", "licenses"),
+        ("organizationId",),
+        query=frozenset({"perPage", "startingAfter", "endingBefore", "deviceSerial", "networkId", "state"}),
+        paginated="next",
+        enums={
+            "state": ("active", "expired", "expiring", "recentlyQueued", "unused", "unusedActive"),
+        },
+    ),
+    "assignOrganizationLicensesSeats": Operation(
+        "post",
+        "/organizations/{organizationId}/licenses/assignSeats",
+        ("organizations", "configure", "licenses"),
+        ("organizationId",),
+        arguments=("organizationId", "licenseId", "networkId", "seatCount"),
+        body=frozenset({"licenseId", "networkId", "seatCount"}),
+    ),
+    "moveOrganizationLicenses": Operation(
+        "post",
+        "/organizations/{organizationId}/licenses/move",
+        ("organizations", "configure", "licenses"),
+        ("organizationId",),
+        arguments=("organizationId", "destOrganizationId", "licenseIds"),
+        body=frozenset({"destOrganizationId", "licenseIds"}),
+    ),
+    "moveOrganizationLicensesSeats": Operation(
+        "post",
+        "/organizations/{organizationId}/licenses/moveSeats",
+        ("organizations", "configure", "licenses"),
+        ("organizationId",),
+        arguments=("organizationId", "destOrganizationId", "licenseId", "seatCount"),
+        body=frozenset({"destOrganizationId", "licenseId", "seatCount"}),
+    ),
+    "getOrganizationLicensesOverview": Operation(
+        "get",
+        "/organizations/{organizationId}/licenses/overview",
+        ("organizations", "monitor", "licenses", "overview"),
+        ("organizationId",),
+    ),
+    "renewOrganizationLicensesSeats": Operation(
+        "post",
+        "/organizations/{organizationId}/licenses/renewSeats",
+        ("organizations", "configure", "licenses"),
+        ("organizationId",),
+        arguments=("organizationId", "licenseIdToRenew", "unusedLicenseId"),
+        body=frozenset({"licenseIdToRenew", "unusedLicenseId"}),
+    ),
+    "getOrganizationLicense": Operation(
+        "get",
+        "/organizations/{organizationId}/licenses/{licenseId}",
+        ("organizations", "configure", "licenses"),
+        ("organizationId", "licenseId"),
+    ),
+    "updateOrganizationLicense": Operation(
+        "put",
+        "/organizations/{organizationId}/licenses/{licenseId}",
+        ("organizations", "configure", "licenses"),
+        ("organizationId", "licenseId"),
+        body=frozenset({"deviceSerial"}),
+    ),
+    "getOrganizationLoginSecurity": Operation(
+        "get",
+        "/organizations/{organizationId}/loginSecurity",
+        ("organizations", "configure", "loginSecurity"),
+        ("organizationId",),
+    ),
+    "updateOrganizationLoginSecurity": Operation(
+        "put",
+        "/organizations/{organizationId}/loginSecurity",
+        ("organizations", "configure", "loginSecurity"),
+        ("organizationId",),
+        body=frozenset(
+            {
+                "enforcePasswordExpiration",
+                "passwordExpirationDays",
+                "enforceDifferentPasswords",
+                "numDifferentPasswords",
+                "enforceStrongPasswords",
+                "minimumPasswordLength",
+                "enforceAccountLockout",
+                "accountLockoutAttempts",
+                "enforceIdleTimeout",
+                "idleTimeoutMinutes",
+                "enforceTwoFactorAuth",
+                "enforceLoginIpRanges",
+                "loginIpRanges",
+                "enforceLockedIpSessions",
+                "apiAuthentication",
+            }
+        ),
+    ),
+    "getOrganizationNetworks": Operation(
+        "get",
+        "/organizations/{organizationId}/networks",
+        ("organizations", "configure", "networks"),
+        ("organizationId",),
+        query=frozenset(
+            {
+                "configTemplateId",
+                "isBoundToConfigTemplate",
+                "tags",
+                "tagsFilterType",
+                "productTypes",
+                "perPage",
+                "startingAfter",
+                "endingBefore",
+            }
+        ),
+        array=frozenset({"tags", "productTypes"}),
+        paginated="next",
+        enums={
+            "tagsFilterType": ("withAllTags", "withAnyTags"),
+        },
+    ),
+    "createOrganizationNetwork": Operation(
+        "post",
+        "/organizations/{organizationId}/networks",
+        ("organizations", "configure", "networks"),
+        ("organizationId",),
+        arguments=("organizationId", "name", "productTypes"),
+        body=frozenset({"name", "productTypes", "tags", "timeZone", "copyFromNetworkId", "notes"}),
+    ),
+    "combineOrganizationNetworks": Operation(
+        "post",
+        "/organizations/{organizationId}/networks/combine",
+        ("organizations", "configure", "networks"),
+        ("organizationId",),
+        arguments=("organizationId", "name", "networkIds"),
+        body=frozenset({"name", "networkIds", "enrollmentString"}),
+    ),
+    "createNetworkMove": Operation(
+        "post",
+        "/organizations/{organizationId}/networks/moves",
+        ("organizations", "configure", "networks"),
+        ("organizationId",),
+        arguments=("organizationId", "network", "organizations"),
+        body=frozenset({"network", "organizations", "simulate"}),
+    ),
+    "getNetworkMoves": Operation(
+        "get",
+        "/organizations/{organizationId}/networks/moves",
+        ("organizations", "configure", "networks", "moves"),
+        ("organizationId",),
+        query=frozenset({"perPage", "startingAfter", "endingBefore", "moveIds"}),
+        array=frozenset({"moveIds"}),
+        paginated="next",
+    ),
+    "getOrganizationOpenapiSpec": Operation(
+        "get",
+        "/organizations/{organizationId}/openapiSpec",
+        ("organizations", "monitor", "openapiSpec"),
+        ("organizationId",),
+        query=frozenset({"version"}),
+        enums={
+            "version": (2, 3),
+        },
+    ),
+    "getOrganizationPoliciesAssignmentsByClient": Operation(
+        "get",
+        "/organizations/{organizationId}/policies/assignments/byClient",
+        ("organizations", "configure", "policies", "assignments", "byClient"),
+        ("organizationId",),
+        arguments=("organizationId", "networkIds"),
+        query=frozenset(
+            {"perPage", "startingAfter", "endingBefore", "t0", "timespan", "includeUndetectedClients", "networkIds"}
+        ),
+        array=frozenset({"networkIds"}),
+        paginated="next",
+    ),
+    "getOrganizationPoliciesGlobalFirewallApplicationCategories": Operation(
+        "get",
+        "/organizations/{organizationId}/policies/global/firewall/applicationCategories",
+        ("organizations", "configure", "policies", "global", "firewall", "applicationCategories"),
+        ("organizationId",),
+    ),
+    "getOrganizationPoliciesGlobalFirewallRulesets": Operation(
+        "get",
+        "/organizations/{organizationId}/policies/global/firewall/rulesets",
+        ("organizations", "configure", "policies", "global", "firewall", "rulesets"),
+        ("organizationId",),
+        query=frozenset({"rulesetIds", "name", "perPage", "startingAfter", "endingBefore"}),
+        array=frozenset({"rulesetIds"}),
+        paginated="next",
+    ),
+    "createOrganizationPoliciesGlobalFirewallRuleset": Operation(
+        "post",
+        "/organizations/{organizationId}/policies/global/firewall/rulesets",
+        ("organizations", "configure", "policies", "global", "firewall", "rulesets"),
+        ("organizationId",),
+        arguments=("organizationId", "name"),
+        body=frozenset({"name", "description"}),
+    ),
+    "createOrganizationPoliciesGlobalFirewallRulesetsRule": Operation(
+        "post",
+        "/organizations/{organizationId}/policies/global/firewall/rulesets/rules",
+        ("organizations", "configure", "policies", "global", "firewall", "rulesets", "rules"),
+        ("organizationId",),
+        arguments=("organizationId", "name", "rulesetId", "policy", "sources", "destinations"),
+        body=frozenset({"name", "rulesetId", "policy", "enabled", "priority", "description", "sources", "destinations"}),
+        enums={
+            "policy": ("allow", "deny"),
+        },
+    ),
+    "getOrganizationPoliciesGlobalFirewallRulesetsRules": Operation(
+        "get",
+        "/organizations/{organizationId}/policies/global/firewall/rulesets/rules",
+        ("organizations", "configure", "policies", "global", "firewall", "rulesets", "rules"),
+        ("organizationId",),
+        query=frozenset({"rulesetIds", "ruleIds", "perPage", "startingAfter", "endingBefore"}),
+        array=frozenset({"rulesetIds", "ruleIds"}),
+        paginated="next",
+    ),
+    "deleteOrganizationPoliciesGlobalFirewallRulesetsRule": Operation(
+        "delete",
+        "/organizations/{organizationId}/policies/global/firewall/rulesets/rules/{ruleId}",
+        ("organizations", "configure", "policies", "global", "firewall", "rulesets", "rules"),
+        ("organizationId", "ruleId"),
+    ),
+    "updateOrganizationPoliciesGlobalFirewallRulesetsRule": Operation(
+        "put",
+        "/organizations/{organizationId}/policies/global/firewall/rulesets/rules/{ruleId}",
+        ("organizations", "configure", "policies", "global", "firewall", "rulesets", "rules"),
+        ("organizationId", "ruleId"),
+        body=frozenset({"name", "rulesetId", "policy", "enabled", "priority", "description", "sources", "destinations"}),
+        enums={
+            "policy": ("allow", "deny"),
+        },
+    ),
+    "updateOrganizationPoliciesGlobalFirewallRuleset": Operation(
+        "put",
+        "/organizations/{organizationId}/policies/global/firewall/rulesets/{rulesetId}",
+        ("organizations", "configure", "policies", "global", "firewall", "rulesets"),
+        ("organizationId", "rulesetId"),
+        body=frozenset({"name", "description"}),
+    ),
+    "deleteOrganizationPoliciesGlobalFirewallRuleset": Operation(
+        "delete",
+        "/organizations/{organizationId}/policies/global/firewall/rulesets/{rulesetId}",
+        ("organizations", "configure", "policies", "global", "firewall", "rulesets"),
+        ("organizationId", "rulesetId"),
+    ),
+    "getOrganizationPoliciesGlobalGroupPolicies": Operation(
+        "get",
+        "/organizations/{organizationId}/policies/global/group/policies",
+        ("organizations", "configure", "policies", "global", "group"),
+        ("organizationId",),
+        query=frozenset({"name", "policyIds", "perPage", "startingAfter", "endingBefore"}),
+        array=frozenset({"policyIds"}),
+        paginated="next",
+    ),
+    "createOrganizationPoliciesGlobalGroupPolicy": Operation(
+        "post",
+        "/organizations/{organizationId}/policies/global/group/policies",
+        ("organizations", "configure", "policies", "global", "group"),
+        ("organizationId",),
+        arguments=("organizationId", "name"),
+        body=frozenset({"name", "description"}),
+    ),
+    "assignOrganizationPoliciesGlobalGroupPoliciesAdaptivePolicyGroups": Operation(
+        "post",
+        "/organizations/{organizationId}/policies/global/group/policies/adaptivePolicyGroups/assign",
+        ("organizations", "configure", "policies", "global", "group", "adaptivePolicyGroups"),
+        ("organizationId",),
+        arguments=("organizationId", "policy", "adaptivePolicyGroups"),
+        body=frozenset({"policy", "adaptivePolicyGroups"}),
+    ),
+    "getOrganizationPoliciesGlobalGroupPoliciesAdaptivePolicyGroupsAssignments": Operation(
+        "get",
+        "/organizations/{organizationId}/policies/global/group/policies/adaptivePolicyGroups/assignments",
+        ("organizations", "configure", "policies", "global", "group", "adaptivePolicyGroups", "assignments"),
+        ("organizationId",),
+        query=frozenset({"assignmentIds", "policyIds", "adaptivePolicyGroupIds", "perPage", "startingAfter", "endingBefore"}),
+        array=frozenset({"assignmentIds", "policyIds", "adaptivePolicyGroupIds"}),
+        paginated="next",
+    ),
+    "removeOrganizationPoliciesGlobalGroupPoliciesAdaptivePolicyGroups": Operation(
+        "post",
+        "/organizations/{organizationId}/policies/global/group/policies/adaptivePolicyGroups/remove",
+        ("organizations", "configure", "policies", "global", "group", "adaptivePolicyGroups"),
+        ("organizationId",),
+        arguments=("organizationId", "policy", "adaptivePolicyGroups"),
+        body=frozenset({"policy", "adaptivePolicyGroups"}),
+    ),
+    "getOrganizationPoliciesGlobalGroupPoliciesFirewallRulesetsAssignments": Operation(
+        "get",
+        "/organizations/{organizationId}/policies/global/group/policies/firewall/rulesets/assignments",
+        ("organizations", "configure", "policies", "global", "group", "firewall", "rulesets", "assignments"),
+        ("organizationId",),
+        query=frozenset({"rulesetIds", "policyIds", "assignmentIds", "perPage", "startingAfter", "endingBefore"}),
+        array=frozenset({"rulesetIds", "policyIds", "assignmentIds"}),
+        paginated="next",
+    ),
+    "createOrganizationPoliciesGlobalGroupPoliciesFirewallRulesetsAssignment": Operation(
+        "post",
+        "/organizations/{organizationId}/policies/global/group/policies/firewall/rulesets/assignments",
+        ("organizations", "configure", "policies", "global", "group", "firewall", "rulesets", "assignments"),
+        ("organizationId",),
+        arguments=("organizationId", "rulesetId", "policyId"),
+        body=frozenset({"rulesetId", "policyId", "priority"}),
+    ),
+    "updateOrganizationPoliciesGlobalGroupPoliciesFirewallRulesetsAssignment": Operation(
+        "put",
+        "/organizations/{organizationId}/policies/global/group/policies/firewall/rulesets/assignments/{assignmentId}",
+        ("organizations", "configure", "policies", "global", "group", "firewall", "rulesets", "assignments"),
+        ("organizationId", "assignmentId"),
+        body=frozenset({"rulesetId", "policyId", "priority"}),
+    ),
+    "deleteOrganizationPoliciesGlobalGroupPoliciesFirewallRulesetsAssignment": Operation(
+        "delete",
+        "/organizations/{organizationId}/policies/global/group/policies/firewall/rulesets/assignments/{assignmentId}",
+        ("organizations", "configure", "policies", "global", "group", "firewall", "rulesets", "assignments"),
+        ("organizationId", "assignmentId"),
+    ),
+    "updateOrganizationPoliciesGlobalGroupPolicy": Operation(
+        "put",
+        "/organizations/{organizationId}/policies/global/group/policies/{policyId}",
+        ("organizations", "configure", "policies", "global", "group"),
+        ("organizationId", "policyId"),
+        body=frozenset({"name", "description"}),
+    ),
+    "deleteOrganizationPoliciesGlobalGroupPolicy": Operation(
+        "delete",
+        "/organizations/{organizationId}/policies/global/group/policies/{policyId}",
+        ("organizations", "configure", "policies", "global", "group"),
+        ("organizationId", "policyId"),
+    ),
+    "getOrganizationPolicyObjects": Operation(
+        "get",
+        "/organizations/{organizationId}/policyObjects",
+        ("organizations", "configure", "policyObjects"),
+        ("organizationId",),
+        query=frozenset({"perPage", "startingAfter", "endingBefore"}),
+        paginated="next",
+    ),
+    "createOrganizationPolicyObject": Operation(
+        "post",
+        "/organizations/{organizationId}/policyObjects",
+        ("organizations", "configure", "policyObjects"),
+        ("organizationId",),
+        arguments=("organizationId", "name", "category", "type"),
+        body=frozenset({"name", "category", "type", "cidr", "fqdn", "mask", "ip", "groupIds"}),
+        enums={
+            "type": ("adaptivePolicyIpv4Cidr", "cidr", "fqdn"),
+        },
+    ),
+    "getOrganizationPolicyObjectsGroups": Operation(
+        "get",
+        "/organizations/{organizationId}/policyObjects/groups",
+        ("organizations", "configure", "policyObjects", "groups"),
+        ("organizationId",),
+        query=frozenset({"perPage", "startingAfter", "endingBefore"}),
+        paginated="next",
+    ),
+    "createOrganizationPolicyObjectsGroup": Operation(
+        "post",
+        "/organizations/{organizationId}/policyObjects/groups",
+        ("organizations", "configure", "policyObjects", "groups"),
+        ("organizationId",),
+        arguments=("organizationId", "name"),
+        body=frozenset({"name", "category", "objectIds"}),
+    ),
+    "getOrganizationPolicyObjectsGroup": Operation(
+        "get",
+        "/organizations/{organizationId}/policyObjects/groups/{policyObjectGroupId}",
+        ("organizations", "configure", "policyObjects", "groups"),
+        ("organizationId", "policyObjectGroupId"),
+    ),
+    "updateOrganizationPolicyObjectsGroup": Operation(
+        "put",
+        "/organizations/{organizationId}/policyObjects/groups/{policyObjectGroupId}",
+        ("organizations", "configure", "policyObjects", "groups"),
+        ("organizationId", "policyObjectGroupId"),
+        body=frozenset({"name", "objectIds"}),
+    ),
+    "deleteOrganizationPolicyObjectsGroup": Operation(
+        "delete",
+        "/organizations/{organizationId}/policyObjects/groups/{policyObjectGroupId}",
+        ("organizations", "configure", "policyObjects", "groups"),
+        ("organizationId", "policyObjectGroupId"),
+    ),
+    "getOrganizationPolicyObject": Operation(
+        "get",
+        "/organizations/{organizationId}/policyObjects/{policyObjectId}",
+        ("organizations", "configure", "policyObjects"),
+        ("organizationId", "policyObjectId"),
+    ),
+    "updateOrganizationPolicyObject": Operation(
+        "put",
+        "/organizations/{organizationId}/policyObjects/{policyObjectId}",
+        ("organizations", "configure", "policyObjects"),
+        ("organizationId", "policyObjectId"),
+        body=frozenset({"name", "cidr", "fqdn", "mask", "ip", "groupIds"}),
+    ),
+    "deleteOrganizationPolicyObject": Operation(
+        "delete",
+        "/organizations/{organizationId}/policyObjects/{policyObjectId}",
+        ("organizations", "configure", "policyObjects"),
+        ("organizationId", "policyObjectId"),
+    ),
+    "getOrganizationSaml": Operation(
+        "get",
+        "/organizations/{organizationId}/saml",
+        ("organizations", "configure", "saml"),
+        ("organizationId",),
+    ),
+    "updateOrganizationSaml": Operation(
+        "put",
+        "/organizations/{organizationId}/saml",
+        ("organizations", "configure", "saml"),
+        ("organizationId",),
+        body=frozenset({"enabled", "spInitiated"}),
+    ),
+    "getOrganizationSamlIdps": Operation(
+        "get",
+        "/organizations/{organizationId}/saml/idps",
+        ("organizations", "configure", "saml", "idps"),
+        ("organizationId",),
+    ),
+    "createOrganizationSamlIdp": Operation(
+        "post",
+        "/organizations/{organizationId}/saml/idps",
+        ("organizations", "configure", "saml", "idps"),
+        ("organizationId",),
+        arguments=("organizationId", "x509certSha1Fingerprint"),
+        body=frozenset({"x509certSha1Fingerprint", "ssoLoginUrl", "sloLogoutUrl"}),
+    ),
+    "updateOrganizationSamlIdp": Operation(
+        "put",
+        "/organizations/{organizationId}/saml/idps/{idpId}",
+        ("organizations", "configure", "saml", "idps"),
+        ("organizationId", "idpId"),
+        body=frozenset({"x509certSha1Fingerprint", "ssoLoginUrl", "sloLogoutUrl"}),
+    ),
+    "getOrganizationSamlIdp": Operation(
+        "get",
+        "/organizations/{organizationId}/saml/idps/{idpId}",
+        ("organizations", "configure", "saml", "idps"),
+        ("organizationId", "idpId"),
+    ),
+    "deleteOrganizationSamlIdp": Operation(
+        "delete",
+        "/organizations/{organizationId}/saml/idps/{idpId}",
+        ("organizations", "configure", "saml", "idps"),
+        ("organizationId", "idpId"),
+    ),
+    "getOrganizationSamlRoles": Operation(
+        "get",
+        "/organizations/{organizationId}/samlRoles",
+        ("organizations", "configure", "samlRoles"),
+        ("organizationId",),
+    ),
+    "createOrganizationSamlRole": Operation(
+        "post",
+        "/organizations/{organizationId}/samlRoles",
+        ("organizations", "configure", "samlRoles"),
+        ("organizationId",),
+        arguments=("organizationId", "role", "orgAccess"),
+        body=frozenset({"role", "orgAccess", "tags", "networks"}),
+    ),
+    "getOrganizationSamlRole": Operation(
+        "get",
+        "/organizations/{organizationId}/samlRoles/{samlRoleId}",
+        ("organizations", "configure", "samlRoles"),
+        ("organizationId", "samlRoleId"),
+    ),
+    "updateOrganizationSamlRole": Operation(
+        "put",
+        "/organizations/{organizationId}/samlRoles/{samlRoleId}",
+        ("organizations", "configure", "samlRoles"),
+        ("organizationId", "samlRoleId"),
+        body=frozenset({"role", "orgAccess", "tags", "networks"}),
+    ),
+    "deleteOrganizationSamlRole": Operation(
+        "delete",
+        "/organizations/{organizationId}/samlRoles/{samlRoleId}",
+        ("organizations", "configure", "samlRoles"),
+        ("organizationId", "samlRoleId"),
+    ),
+    "getOrganizationSaseConnectors": Operation(
+        "get",
+        "/organizations/{organizationId}/sase/connectors",
+        ("organizations", "configure", "sase", "connectors"),
+        ("organizationId",),
+    ),
+    "batchOrganizationSaseConnectorsDelete": Operation(
+        "post",
+        "/organizations/{organizationId}/sase/connectors/batchDelete",
+        ("organizations", "configure", "sase", "connectors"),
+        ("organizationId",),
+        body=frozenset({"items"}),
+    ),
+    "createOrganizationSaseIntegration": Operation(
+        "post",
+        "/organizations/{organizationId}/sase/integrations",
+        ("organizations", "configure", "sase", "integrations"),
+        ("organizationId",),
+        arguments=("organizationId", "api"),
+        body=frozenset({"api"}),
+    ),
+    "getOrganizationSaseIntegration": Operation(
+        "get",
+        "/organizations/{organizationId}/sase/integrations/{integrationId}",
+        ("organizations", "configure", "sase", "integrations"),
+        ("organizationId", "integrationId"),
+    ),
+    "deleteOrganizationSaseIntegration": Operation(
+        "delete",
+        "/organizations/{organizationId}/sase/integrations/{integrationId}",
+        ("organizations", "configure", "sase", "integrations"),
+        ("organizationId", "integrationId"),
+    ),
+    "getOrganizationSaseNetworksEligible": Operation(
+        "get",
+        "/organizations/{organizationId}/sase/networks/eligible",
+        ("organizations", "configure", "sase", "networks", "eligible"),
+        ("organizationId",),
+        query=frozenset({"perPage", "startingAfter", "endingBefore", "search"}),
+        paginated="next",
+    ),
+    "getOrganizationSaseRegions": Operation(
+        "get",
+        "/organizations/{organizationId}/sase/regions",
+        ("organizations", "configure", "sase", "regions"),
+        ("organizationId",),
+    ),
+    "getOrganizationSaseSites": Operation(
+        "get",
+        "/organizations/{organizationId}/sase/sites",
+        ("organizations", "configure", "sase", "sites"),
+        ("organizationId",),
+        query=frozenset({"perPage", "startingAfter", "endingBefore", "search", "status", "siteId"}),
+        paginated="next",
+        enums={
+            "status": ("bad NAT", "bad tunnel", "dormant", "good", "many bad tunnels", "no registry", "offline"),
+        },
+    ),
+    "attachOrganizationSaseSites": Operation(
+        "post",
+        "/organizations/{organizationId}/sase/sites/attach",
+        ("organizations", "configure", "sase", "sites"),
+        ("organizationId",),
+        arguments=("organizationId", "items"),
+        body=frozenset({"items"}),
+    ),
+    "getOrganizationSaseSitesConnectivityHistoryBySite": Operation(
+        "get",
+        "/organizations/{organizationId}/sase/sites/connectivity/history/bySite",
+        ("organizations", "monitor", "sase", "sites", "connectivity", "history", "bySite"),
+        ("organizationId",),
+        query=frozenset({"siteIds", "timespan"}),
+        array=frozenset({"siteIds"}),
+    ),
+    "getOrganizationSaseSitesConnectivityOverview": Operation(
+        "get",
+        "/organizations/{organizationId}/sase/sites/connectivity/overview",
+        ("organizations", "configure", "sase", "sites", "connectivity", "overview"),
+        ("organizationId",),
+    ),
+    "detachOrganizationSaseSites": Operation(
+        "delete",
+        "/organizations/{organizationId}/sase/sites/detach",
+        ("organizations", "configure", "sase", "sites"),
+        ("organizationId",),
+    ),
+    "updateOrganizationSaseSite": Operation(
+        "put",
+        "/organizations/{organizationId}/sase/sites/{siteId}",
+        ("organizations", "configure", "sase", "sites"),
+        ("organizationId", "siteId"),
+        body=frozenset({"siteId", "routing"}),
+    ),
+    "getOrganizationSnmp": Operation(
+        "get",
+        "/organizations/{organizationId}/snmp",
+        ("organizations", "configure", "snmp"),
+        ("organizationId",),
+    ),
+    "updateOrganizationSnmp": Operation(
+        "put",
+        "/organizations/{organizationId}/snmp",
+        ("organizations", "configure", "snmp"),
+        ("organizationId",),
+        body=frozenset({"v2cEnabled", "v3Enabled", "v3AuthMode", "v3AuthPass", "v3PrivMode", "v3PrivPass", "peerIps"}),
+        enums={
+            "v3AuthMode": ("MD5", "SHA"),
+            "v3PrivMode": ("AES128", "DES"),
+        },
+    ),
+    "getOrganizationSplashAsset": Operation(
+        "get",
+        "/organizations/{organizationId}/splash/assets/{id}",
+        ("organizations", "configure", "splash", "assets"),
+        ("organizationId", "id"),
+    ),
+    "deleteOrganizationSplashAsset": Operation(
+        "delete",
+        "/organizations/{organizationId}/splash/assets/{id}",
+        ("organizations", "configure", "splash", "assets"),
+        ("organizationId", "id"),
+    ),
+    "getOrganizationSplashThemes": Operation(
+        "get",
+        "/organizations/{organizationId}/splash/themes",
+        ("organizations", "configure", "splash", "themes"),
+        ("organizationId",),
+    ),
+    "createOrganizationSplashTheme": Operation(
+        "post",
+        "/organizations/{organizationId}/splash/themes",
+        ("organizations", "configure", "splash", "themes"),
+        ("organizationId",),
+        body=frozenset({"name", "baseTheme"}),
+    ),
+    "deleteOrganizationSplashTheme": Operation(
+        "delete",
+        "/organizations/{organizationId}/splash/themes/{id}",
+        ("organizations", "configure", "splash", "themes"),
+        ("organizationId", "id"),
+    ),
+    "createOrganizationSplashThemeAsset": Operation(
+        "post",
+        "/organizations/{organizationId}/splash/themes/{themeIdentifier}/assets",
+        ("organizations", "configure", "splash", "themes", "assets"),
+        ("organizationId", "themeIdentifier"),
+        body=frozenset({"name", "content"}),
+    ),
+    "getOrganizationSummaryTopAppliancesByUtilization": Operation(
+        "get",
+        "/organizations/{organizationId}/summary/top/appliances/byUtilization",
+        ("organizations", "monitor", "summary", "top", "appliances", "byUtilization"),
+        ("organizationId",),
+        query=frozenset({"networkTag", "deviceTag", "quantity", "ssidName", "usageUplink", "t0", "t1", "timespan"}),
+    ),
+    "getOrganizationSummaryTopApplicationsByUsage": Operation(
+        "get",
+        "/organizations/{organizationId}/summary/top/applications/byUsage",
+        ("organizations", "monitor", "summary", "top", "applications", "byUsage"),
+        ("organizationId",),
+        query=frozenset({"networkTag", "device", "networkId", "quantity", "ssidName", "usageUplink", "t0", "t1", "timespan"}),
+    ),
+    "getOrganizationSummaryTopApplicationsCategoriesByUsage": Operation(
+        "get",
+        "/organizations/{organizationId}/summary/top/applications/categories/byUsage",
+        ("organizations", "monitor", "summary", "top", "applications", "categories", "byUsage"),
+        ("organizationId",),
+        query=frozenset(
+            {"networkTag", "deviceTag", "networkId", "quantity", "ssidName", "usageUplink", "t0", "t1", "timespan"}
+        ),
+    ),
+    "getOrganizationSummaryTopClientsByUsage": Operation(
+        "get",
+        "/organizations/{organizationId}/summary/top/clients/byUsage",
+        ("organizations", "monitor", "summary", "top", "clients", "byUsage"),
+        ("organizationId",),
+        query=frozenset({"networkTag", "deviceTag", "quantity", "ssidName", "usageUplink", "t0", "t1", "timespan"}),
+    ),
+    "getOrganizationSummaryTopClientsManufacturersByUsage": Operation(
+        "get",
+        "/organizations/{organizationId}/summary/top/clients/manufacturers/byUsage",
+        ("organizations", "monitor", "summary", "top", "clients", "manufacturers", "byUsage"),
+        ("organizationId",),
+        query=frozenset({"networkTag", "deviceTag", "quantity", "ssidName", "usageUplink", "t0", "t1", "timespan"}),
+    ),
+    "getOrganizationSummaryTopDevicesByUsage": Operation(
+        "get",
+        "/organizations/{organizationId}/summary/top/devices/byUsage",
+        ("organizations", "monitor", "summary", "top", "devices", "byUsage"),
+        ("organizationId",),
+        query=frozenset({"networkTag", "deviceTag", "quantity", "ssidName", "usageUplink", "t0", "t1", "timespan"}),
+    ),
+    "getOrganizationSummaryTopDevicesModelsByUsage": Operation(
+        "get",
+        "/organizations/{organizationId}/summary/top/devices/models/byUsage",
+        ("organizations", "monitor", "summary", "top", "devices", "models", "byUsage"),
+        ("organizationId",),
+        query=frozenset({"networkTag", "deviceTag", "quantity", "ssidName", "usageUplink", "t0", "t1", "timespan"}),
+    ),
+    "getOrganizationSummaryTopNetworksByStatus": Operation(
+        "get",
+        "/organizations/{organizationId}/summary/top/networks/byStatus",
+        ("organizations", "monitor", "summary", "top", "networks", "byStatus"),
+        ("organizationId",),
+        query=frozenset(
+            {"networkTag", "deviceTag", "quantity", "ssidName", "usageUplink", "perPage", "startingAfter", "endingBefore"}
+        ),
+        paginated="next",
+    ),
+    "getOrganizationSummaryTopSsidsByUsage": Operation(
+        "get",
+        "/organizations/{organizationId}/summary/top/ssids/byUsage",
+        ("organizations", "monitor", "summary", "top", "ssids", "byUsage"),
+        ("organizationId",),
+        query=frozenset({"networkTag", "deviceTag", "quantity", "ssidName", "usageUplink", "t0", "t1", "timespan"}),
+    ),
+    "getOrganizationSummaryTopSwitchesByEnergyUsage": Operation(
+        "get",
+        "/organizations/{organizationId}/summary/top/switches/byEnergyUsage",
+        ("organizations", "monitor", "summary", "top", "switches", "byEnergyUsage"),
+        ("organizationId",),
+        query=frozenset({"networkTag", "deviceTag", "quantity", "ssidName", "usageUplink", "t0", "t1", "timespan"}),
+    ),
+    "getOrganizationUplinksStatuses": Operation(
+        "get",
+        "/organizations/{organizationId}/uplinks/statuses",
+        ("organizations", "monitor", "uplinks", "statuses"),
+        ("organizationId",),
+        query=frozenset({"perPage", "startingAfter", "endingBefore", "networkIds", "serials", "iccids"}),
+        array=frozenset({"networkIds", "serials", "iccids"}),
+        paginated="next",
+    ),
+    "getOrganizationWebhooksAlertTypes": Operation(
+        "get",
+        "/organizations/{organizationId}/webhooks/alertTypes",
+        ("organizations", "monitor", "webhooks", "alertTypes"),
+        ("organizationId",),
+        query=frozenset({"productType"}),
+        enums={
+            "productType": ("appliance", "camera", "cellularGateway", "platform", "sensor", "sm", "switch", "wireless"),
+        },
+    ),
+    "getOrganizationWebhooksCallbacksStatus": Operation(
+        "get",
+        "/organizations/{organizationId}/webhooks/callbacks/statuses/{callbackId}",
+        ("organizations", "configure", "webhooks", "callbacks", "statuses"),
+        ("organizationId", "callbackId"),
+    ),
+    "getOrganizationWebhooksLogs": Operation(
+        "get",
+        "/organizations/{organizationId}/webhooks/logs",
+        ("organizations", "monitor", "webhooks", "logs"),
+        ("organizationId",),
+        query=frozenset({"t0", "t1", "timespan", "perPage", "startingAfter", "endingBefore", "url"}),
+        paginated="next",
+    ),
+    "getNetwork": Operation(
+        "get",
+        "/networks/{networkId}",
+        ("networks", "configure"),
+        ("networkId",),
+    ),
+    "updateNetwork": Operation(
+        "put",
+        "/networks/{networkId}",
+        ("networks", "configure"),
+        ("networkId",),
+        body=frozenset({"name", "timeZone", "tags", "enrollmentString", "notes"}),
+    ),
+    "deleteNetwork": Operation(
+        "delete",
+        "/networks/{networkId}",
+        ("networks", "configure"),
+        ("networkId",),
+    ),
+    "getNetworkAlertsHistory": Operation(
+        "get",
+        "/networks/{networkId}/alerts/history",
+        ("networks", "monitor", "alerts", "history"),
+        ("networkId",),
+        query=frozenset({"perPage", "startingAfter", "endingBefore"}),
+        paginated="next",
+    ),
+    "getNetworkAlertsSettings": Operation(
+        "get",
+        "/networks/{networkId}/alerts/settings",
+        ("networks", "configure", "alerts", "settings"),
+        ("networkId",),
+    ),
+    "updateNetworkAlertsSettings": Operation(
+        "put",
+        "/networks/{networkId}/alerts/settings",
+        ("networks", "configure", "alerts", "settings"),
+        ("networkId",),
+        body=frozenset({"defaultDestinations", "alerts", "muting"}),
+    ),
+    "bindNetwork": Operation(
+        "post",
+        "/networks/{networkId}/bind",
+        ("networks", "configure"),
+        ("networkId",),
+        arguments=("networkId", "configTemplateId"),
+        body=frozenset({"configTemplateId", "autoBind"}),
+    ),
+    "getNetworkBluetoothClients": Operation(
+        "get",
+        "/networks/{networkId}/bluetoothClients",
+        ("networks", "monitor", "bluetoothClients"),
+        ("networkId",),
+        query=frozenset({"t0", "timespan", "perPage", "startingAfter", "endingBefore", "includeConnectivityHistory"}),
+        paginated="next",
+    ),
+    "getNetworkBluetoothClient": Operation(
+        "get",
+        "/networks/{networkId}/bluetoothClients/{bluetoothClientId}",
+        ("networks", "monitor", "bluetoothClients"),
+        ("networkId", "bluetoothClientId"),
+        query=frozenset({"includeConnectivityHistory", "connectivityHistoryTimespan"}),
+    ),
+    "getNetworkClients": Operation(
+        "get",
+        "/networks/{networkId}/clients",
+        ("networks", "monitor", "clients"),
+        ("networkId",),
+        query=frozenset(
+            {
+                "t0",
+                "timespan",
+                "perPage",
+                "startingAfter",
+                "endingBefore",
+                "statuses",
+                "ip",
+                "ip6",
+                "ip6Local",
+                "mac",
+                "os",
+                "pskGroup",
+                "description",
+                "vlan",
+                "namedVlan",
+                "recentDeviceConnections",
+            }
+        ),
+        array=frozenset({"statuses", "recentDeviceConnections"}),
+        paginated="next",
+    ),
+    "getNetworkClientsApplicationUsage": Operation(
+        "get",
+        "/networks/{networkId}/clients/applicationUsage",
+        ("networks", "monitor", "clients", "applicationUsage"),
+        ("networkId",),
+        arguments=("networkId", "clients"),
+        query=frozenset({"clients", "ssidNumber", "perPage", "startingAfter", "endingBefore", "t0", "t1", "timespan"}),
+        paginated="next",
+        enums={
+            "ssidNumber": (0, 1, 2, 3, 4, 5, 6, 7, 8, 9, 10, 11, 12, 13, 14),
+        },
+    ),
+    "getNetworkClientsBandwidthUsageHistory": Operation(
+        "get",
+        "/networks/{networkId}/clients/bandwidthUsageHistory",
+        ("networks", "monitor", "clients", "bandwidthUsageHistory"),
+        ("networkId",),
+        query=frozenset({"t0", "t1", "timespan", "perPage", "startingAfter", "endingBefore"}),
+        paginated="next",
+    ),
+    "getNetworkClientsOverview": Operation(
+        "get",
+        "/networks/{networkId}/clients/overview",
+        ("networks", "monitor", "clients", "overview"),
+        ("networkId",),
+        query=frozenset({"t0", "t1", "timespan", "resolution"}),
+    ),
+    "provisionNetworkClients": Operation(
+        "post",
+        "/networks/{networkId}/clients/provision",
+        ("networks", "configure", "clients"),
+        ("networkId",),
+        arguments=("networkId", "clients", "devicePolicy"),
+        body=frozenset({"clients", "devicePolicy", "groupPolicyId", "policiesBySecurityAppliance", "policiesBySsid"}),
+        enums={
+            "devicePolicy": ("Allowed", "Blocked", "Group policy", "Normal", "Per connection"),
+        },
+    ),
+    "getNetworkClientsUsageHistories": Operation(
+        "get",
+        "/networks/{networkId}/clients/usageHistories",
+        ("networks", "monitor", "clients", "usageHistories"),
+        ("networkId",),
+        arguments=("networkId", "clients"),
+        query=frozenset({"clients", "ssidNumber", "perPage", "startingAfter", "endingBefore", "t0", "t1", "timespan"}),
+        paginated="next",
+        enums={
+            "ssidNumber": (0, 1, 2, 3, 4, 5, 6, 7, 8, 9, 10, 11, 12, 13, 14),
+        },
+    ),
+    "getNetworkClient": Operation(
+        "get",
+        "/networks/{networkId}/clients/{clientId}",
+        ("networks", "monitor", "clients"),
+        ("networkId", "clientId"),
+    ),
+    "getNetworkClientPolicy": Operation(
+        "get",
+        "/networks/{networkId}/clients/{clientId}/policy",
+        ("networks", "configure", "clients", "policy"),
+        ("networkId", "clientId"),
+    ),
+    "updateNetworkClientPolicy": Operation(
+        "put",
+        "/networks/{networkId}/clients/{clientId}/policy",
+        ("networks", "configure", "clients", "policy"),
+        ("networkId", "clientId"),
+        arguments=("networkId", "clientId", "devicePolicy"),
+        body=frozenset({"devicePolicy", "groupPolicyId"}),
+    ),
+    "getNetworkClientSplashAuthorizationStatus": Operation(
+        "get",
+        "/networks/{networkId}/clients/{clientId}/splashAuthorizationStatus",
+        ("networks", "configure", "clients", "splashAuthorizationStatus"),
+        ("networkId", "clientId"),
+    ),
+    "updateNetworkClientSplashAuthorizationStatus": Operation(
+        "put",
+        "/networks/{networkId}/clients/{clientId}/splashAuthorizationStatus",
+        ("networks", "configure", "clients", "splashAuthorizationStatus"),
+        ("networkId", "clientId"),
+        arguments=("networkId", "clientId", "ssids"),
+        body=frozenset({"ssids"}),
+    ),
+    "getNetworkClientTrafficHistory": Operation(
+        "get",
+        "/networks/{networkId}/clients/{clientId}/trafficHistory",
+        ("networks", "monitor", "clients", "trafficHistory"),
+        ("networkId", "clientId"),
+        query=frozenset({"perPage", "startingAfter", "endingBefore"}),
+        paginated="next",
+    ),
+    "getNetworkClientUsageHistory": Operation(
+        "get",
+        "/networks/{networkId}/clients/{clientId}/usageHistory",
+        ("networks", "monitor", "clients", "usageHistory"),
+        ("networkId", "clientId"),
+    ),
+    "getNetworkDevices": Operation(
+        "get",
+        "/networks/{networkId}/devices",
+        ("networks", "configure", "devices"),
+        ("networkId",),
+    ),
+    "claimNetworkDevices": Operation(
+        "post",
+        "/networks/{networkId}/devices/claim",
+        ("networks", "configure", "devices"),
+        ("networkId",),
+        arguments=("networkId", "serials"),
+        query=frozenset({"addAtomically"}),
+        body=frozenset({"serials", "detailsByDevice"}),
+    ),
+    "vmxNetworkDevicesClaim": Operation(
+        "post",
+        "/networks/{networkId}/devices/claim/vmx",
+        ("networks", "configure", "devices", "claim"),
+        ("networkId",),
+        arguments=("networkId", "size"),
+        body=frozenset({"size"}),
+        enums={
+            "size": ("100", "large", "medium", "small", "xlarge"),
+        },
+    ),
+    "removeNetworkDevices": Operation(
+        "post",
+        "/networks/{networkId}/devices/remove",
+        ("networks", "configure", "devices"),
+        ("networkId",),
+        arguments=("networkId", "serial"),
+        body=frozenset({"serial"}),
+    ),
+    "updateNetworkDevicesSyslogServers": Operation(
+        "put",
+        "/networks/{networkId}/devices/syslog/servers",
+        ("networks", "configure", "devices", "syslog", "servers"),
+        ("networkId",),
+        arguments=("networkId", "servers"),
+        body=frozenset({"servers"}),
+    ),
+    "getNetworkEvents": Operation(
+        "get",
+        "/networks/{networkId}/events",
+        ("networks", "monitor", "events"),
+        ("networkId",),
+        query=frozenset(
+            {
+                "productType",
+                "includedEventTypes",
+                "excludedEventTypes",
+                "deviceMac",
+                "deviceSerial",
+                "deviceName",
+                "clientIp",
+                "clientMac",
+                "clientName",
+                "smDeviceMac",
+                "smDeviceName",
+                "eventDetails",
+                "eventSeverity",
+                "isCatalyst",
+                "perPage",
+                "startingAfter",
+                "endingBefore",
+            }
+        ),
+        array=frozenset({"includedEventTypes", "excludedEventTypes"}),
+        paginated="prev",
+        enums={
+            "productType": (
+                "appliance",
+                "camera",
+                "campusGateway",
+                "cellularGateway",
+                "secureConnect",
+                "switch",
+                "systemsManager",
+                "wireless",
+                "wirelessController",
+            ),
+        },
+    ),
+    "getNetworkEventsEventTypes": Operation(
+        "get",
+        "/networks/{networkId}/events/eventTypes",
+        ("networks", "monitor", "events", "eventTypes"),
+        ("networkId",),
+    ),
+    "getNetworkFirmwareUpgrades": Operation(
+        "get",
+        "/networks/{networkId}/firmwareUpgrades",
+        ("networks", "configure", "firmwareUpgrades"),
+        ("networkId",),
+    ),
+    "updateNetworkFirmwareUpgrades": Operation(
+        "put",
+        "/networks/{networkId}/firmwareUpgrades",
+        ("networks", "configure", "firmwareUpgrades"),
+        ("networkId",),
+        body=frozenset({"upgradeWindow", "timezone", "products"}),
+    ),
+    "createNetworkFirmwareUpgradesRollback": Operation(
+        "post",
+        "/networks/{networkId}/firmwareUpgrades/rollbacks",
+        ("networks", "configure", "firmwareUpgrades", "rollbacks"),
+        ("networkId",),
+        arguments=("networkId", "reasons"),
+        body=frozenset({"product", "time", "reasons", "toVersion", "predownload"}),
+        enums={
+            "product": (
+                "appliance",
+                "camera",
+                "cellularGateway",
+                "secureConnect",
+                "switch",
+                "switchCatalyst",
+                "wireless",
+                "wirelessController",
+            ),
+        },
+    ),
+    "getNetworkFirmwareUpgradesStagedEvents": Operation(
+        "get",
+        "/networks/{networkId}/firmwareUpgrades/staged/events",
+        ("networks", "configure", "firmwareUpgrades", "staged", "events"),
+        ("networkId",),
+    ),
+    "createNetworkFirmwareUpgradesStagedEvent": Operation(
+        "post",
+        "/networks/{networkId}/firmwareUpgrades/staged/events",
+        ("networks", "configure", "firmwareUpgrades", "staged", "events"),
+        ("networkId",),
+        arguments=("networkId", "stages"),
+        body=frozenset({"products", "stages"}),
+    ),
+    "updateNetworkFirmwareUpgradesStagedEvents": Operation(
+        "put",
+        "/networks/{networkId}/firmwareUpgrades/staged/events",
+        ("networks", "configure", "firmwareUpgrades", "staged", "events"),
+        ("networkId",),
+        arguments=("networkId", "stages"),
+        body=frozenset({"stages"}),
+    ),
+    "deferNetworkFirmwareUpgradesStagedEvents": Operation(
+        "post",
+        "/networks/{networkId}/firmwareUpgrades/staged/events/defer",
+        ("networks", "configure", "firmwareUpgrades", "staged", "events"),
+        ("networkId",),
+    ),
+    "rollbacksNetworkFirmwareUpgradesStagedEvents": Operation(
+        "post",
+        "/networks/{networkId}/firmwareUpgrades/staged/events/rollbacks",
+        ("networks", "configure", "firmwareUpgrades", "staged", "events"),
+        ("networkId",),
+        arguments=("networkId", "stages"),
+        body=frozenset({"stages", "reasons"}),
+    ),
+    "getNetworkFirmwareUpgradesStagedGroups": Operation(
+        "get",
+        "/networks/{networkId}/firmwareUpgrades/staged/groups",
+        ("networks", "configure", "firmwareUpgrades", "staged", "groups"),
+        ("networkId",),
+    ),
+    "createNetworkFirmwareUpgradesStagedGroup": Operation(
+        "post",
+        "/networks/{networkId}/firmwareUpgrades/staged/groups",
+        ("networks", "configure", "firmwareUpgrades", "staged", "groups"),
+        ("networkId",),
+        arguments=("networkId", "name", "isDefault"),
+        body=frozenset({"name", "description", "isDefault", "assignedDevices"}),
+    ),
+    "getNetworkFirmwareUpgradesStagedGroup": Operation(
+        "get",
+        "/networks/{networkId}/firmwareUpgrades/staged/groups/{groupId}",
+        ("networks", "configure", "firmwareUpgrades", "staged", "groups"),
+        ("networkId", "groupId"),
+    ),
+    "updateNetworkFirmwareUpgradesStagedGroup": Operation(
+        "put",
+        "/networks/{networkId}/firmwareUpgrades/staged/groups/{groupId}",
+        ("networks", "configure", "firmwareUpgrades", "staged", "groups"),
+        ("networkId", "groupId"),
+        arguments=("networkId", "groupId", "name", "isDefault"),
+        body=frozenset({"name", "description", "isDefault", "assignedDevices"}),
+    ),
+    "deleteNetworkFirmwareUpgradesStagedGroup": Operation(
+        "delete",
+        "/networks/{networkId}/firmwareUpgrades/staged/groups/{groupId}",
+        ("networks", "configure", "firmwareUpgrades", "staged", "groups"),
+        ("networkId", "groupId"),
+    ),
+    "getNetworkFirmwareUpgradesStagedStages": Operation(
+        "get",
+        "/networks/{networkId}/firmwareUpgrades/staged/stages",
+        ("networks", "configure", "firmwareUpgrades", "staged", "stages"),
+        ("networkId",),
+    ),
+    "updateNetworkFirmwareUpgradesStagedStages": Operation(
+        "put",
+        "/networks/{networkId}/firmwareUpgrades/staged/stages",
+        ("networks", "configure", "firmwareUpgrades", "staged", "stages"),
+        ("networkId",),
+        body=frozenset({"_json"}),
+    ),
+    "getNetworkFloorPlans": Operation(
+        "get",
+        "/networks/{networkId}/floorPlans",
+        ("networks", "configure", "floorPlans"),
+        ("networkId",),
+    ),
+    "createNetworkFloorPlan": Operation(
+        "post",
+        "/networks/{networkId}/floorPlans",
+        ("networks", "configure", "floorPlans"),
+        ("networkId",),
+        arguments=("networkId", "name", "imageContents"),
+        body=frozenset(
+            {
+                "name",
+                "center",
+                "bottomLeftCorner",
+                "bottomRightCorner",
+                "topLeftCorner",
+                "topRightCorner",
+                "floorNumber",
+                "imageContents",
+            }
+        ),
+    ),
+    "batchNetworkFloorPlansAutoLocateJobs": Operation(
+        "post",
+        "/networks/{networkId}/floorPlans/autoLocate/jobs/batch",
+        ("networks", "configure", "floorPlans", "autoLocate", "jobs"),
+        ("networkId",),
+        arguments=("networkId", "jobs"),
+        body=frozenset({"jobs"}),
+    ),
+    "cancelNetworkFloorPlansAutoLocateJob": Operation(
+        "post",
+        "/networks/{networkId}/floorPlans/autoLocate/jobs/{jobId}/cancel",
+        ("networks", "configure", "floorPlans", "autoLocate", "jobs"),
+        ("networkId", "jobId"),
+    ),
+    "publishNetworkFloorPlansAutoLocateJob": Operation(
+        "post",
+        "/networks/{networkId}/floorPlans/autoLocate/jobs/{jobId}/publish",
+        ("networks", "configure", "floorPlans", "autoLocate", "jobs"),
+        ("networkId", "jobId"),
+        body=frozenset({"devices"}),
+    ),
+    "recalculateNetworkFloorPlansAutoLocateJob": Operation(
+        "post",
+        "/networks/{networkId}/floorPlans/autoLocate/jobs/{jobId}/recalculate",
+        ("networks", "configure", "floorPlans", "autoLocate", "jobs"),
+        ("networkId", "jobId"),
+        body=frozenset({"devices"}),
+    ),
+    "batchNetworkFloorPlansDevicesUpdate": Operation(
+        "post",
+        "/networks/{networkId}/floorPlans/devices/batchUpdate",
+        ("networks", "configure", "floorPlans", "devices"),
+        ("networkId",),
+        arguments=("networkId", "assignments"),
+        body=frozenset({"assignments"}),
+    ),
+    "getNetworkFloorPlan": Operation(
+        "get",
+        "/networks/{networkId}/floorPlans/{floorPlanId}",
+        ("networks", "configure", "floorPlans"),
+        ("networkId", "floorPlanId"),
+    ),
+    "updateNetworkFloorPlan": Operation(
+        "put",
+        "/networks/{networkId}/floorPlans/{floorPlanId}",
+        ("networks", "configure", "floorPlans"),
+        ("networkId", "floorPlanId"),
+        body=frozenset(
+            {
+                "name",
+                "center",
+                "bottomLeftCorner",
+                "bottomRightCorner",
+                "topLeftCorner",
+                "topRightCorner",
+                "floorNumber",
+                "imageContents",
+            }
+        ),
+    ),
+    "deleteNetworkFloorPlan": Operation(
+        "delete",
+        "/networks/{networkId}/floorPlans/{floorPlanId}",
+        ("networks", "configure", "floorPlans"),
+        ("networkId", "floorPlanId"),
+    ),
+    "getNetworkGroupPolicies": Operation(
+        "get",
+        "/networks/{networkId}/groupPolicies",
+        ("networks", "configure", "groupPolicies"),
+        ("networkId",),
+    ),
+    "createNetworkGroupPolicy": Operation(
+        "post",
+        "/networks/{networkId}/groupPolicies",
+        ("networks", "configure", "groupPolicies"),
+        ("networkId",),
+        arguments=("networkId", "name"),
+        body=frozenset(
+            {
+                "name",
+                "scheduling",
+                "bandwidth",
+                "firewallAndTrafficShaping",
+                "contentFiltering",
+                "splashAuthSettings",
+                "vlanTagging",
+                "bonjourForwarding",
+            }
+        ),
+        enums={
+            "splashAuthSettings": ("bypass", "network default"),
+        },
+    ),
+    "getNetworkGroupPolicy": Operation(
+        "get",
+        "/networks/{networkId}/groupPolicies/{groupPolicyId}",
+        ("networks", "configure", "groupPolicies"),
+        ("networkId", "groupPolicyId"),
+    ),
+    "updateNetworkGroupPolicy": Operation(
+        "put",
+        "/networks/{networkId}/groupPolicies/{groupPolicyId}",
+        ("networks", "configure", "groupPolicies"),
+        ("networkId", "groupPolicyId"),
+        body=frozenset(
+            {
+                "name",
+                "scheduling",
+                "bandwidth",
+                "firewallAndTrafficShaping",
+                "contentFiltering",
+                "splashAuthSettings",
+                "vlanTagging",
+                "bonjourForwarding",
+            }
+        ),
+        enums={
+            "splashAuthSettings": ("bypass", "network default"),
+        },
+    ),
+    "deleteNetworkGroupPolicy": Operation(
+        "delete",
+        "/networks/{networkId}/groupPolicies/{groupPolicyId}",
+        ("networks", "configure", "groupPolicies"),
+        ("networkId", "groupPolicyId"),
+        query=frozenset({"force"}),
+    ),
+    "getNetworkHealthAlerts": Operation(
+        "get",
+        "/networks/{networkId}/health/alerts",
+        ("networks", "configure", "health", "alerts"),
+        ("networkId",),
+    ),
+    "getNetworkMerakiAuthUsers": Operation(
+        "get",
+        "/networks/{networkId}/merakiAuthUsers",
+        ("networks", "configure", "merakiAuthUsers"),
+        ("networkId",),
+    ),
+    "createNetworkMerakiAuthUser": Operation(
+        "post",
+        "/networks/{networkId}/merakiAuthUsers",
+        ("networks", "configure", "merakiAuthUsers"),
+        ("networkId",),
+        arguments=("networkId", "email", "authorizations"),
+        body=frozenset({"email", "name", "password", "accountType", "emailPasswordToUser", "isAdmin", "authorizations"}),
+        enums={
+            "accountType": ("802.1X", "Client VPN", "Guest"),
+        },
+    ),
+    "getNetworkMerakiAuthUser": Operation(
+        "get",
+        "/networks/{networkId}/merakiAuthUsers/{merakiAuthUserId}",
+        ("networks", "configure", "merakiAuthUsers"),
+        ("networkId", "merakiAuthUserId"),
+    ),
+    "deleteNetworkMerakiAuthUser": Operation(
+        "delete",
+        "/networks/{networkId}/merakiAuthUsers/{merakiAuthUserId}",
+        ("networks", "configure", "merakiAuthUsers"),
+        ("networkId", "merakiAuthUserId"),
+        query=frozenset({"delete"}),
+    ),
+    "updateNetworkMerakiAuthUser": Operation(
+        "put",
+        "/networks/{networkId}/merakiAuthUsers/{merakiAuthUserId}",
+        ("networks", "configure", "merakiAuthUsers"),
+        ("networkId", "merakiAuthUserId"),
+        body=frozenset({"name", "password", "emailPasswordToUser", "authorizations"}),
+    ),
+    "getNetworkMqttBrokers": Operation(
+        "get",
+        "/networks/{networkId}/mqttBrokers",
+        ("networks", "configure", "mqttBrokers"),
+        ("networkId",),
+    ),
+    "createNetworkMqttBroker": Operation(
+        "post",
+        "/networks/{networkId}/mqttBrokers",
+        ("networks", "configure", "mqttBrokers"),
+        ("networkId",),
+        arguments=("networkId", "name", "host", "port"),
+        body=frozenset({"name", "host", "port", "security", "authentication"}),
+    ),
+    "getNetworkMqttBroker": Operation(
+        "get",
+        "/networks/{networkId}/mqttBrokers/{mqttBrokerId}",
+        ("networks", "configure", "mqttBrokers"),
+        ("networkId", "mqttBrokerId"),
+    ),
+    "updateNetworkMqttBroker": Operation(
+        "put",
+        "/networks/{networkId}/mqttBrokers/{mqttBrokerId}",
+        ("networks", "configure", "mqttBrokers"),
+        ("networkId", "mqttBrokerId"),
+        body=frozenset({"name", "host", "port", "security", "authentication"}),
+    ),
+    "deleteNetworkMqttBroker": Operation(
+        "delete",
+        "/networks/{networkId}/mqttBrokers/{mqttBrokerId}",
+        ("networks", "configure", "mqttBrokers"),
+        ("networkId", "mqttBrokerId"),
+    ),
+    "getNetworkNetflow": Operation(
+        "get",
+        "/networks/{networkId}/netflow",
+        ("networks", "configure", "netflow"),
+        ("networkId",),
+    ),
+    "updateNetworkNetflow": Operation(
+        "put",
+        "/networks/{networkId}/netflow",
+        ("networks", "configure", "netflow"),
+        ("networkId",),
+        body=frozenset({"reportingEnabled", "collectorIp", "collectorPort", "etaEnabled", "etaDstPort"}),
+    ),
+    "getNetworkNetworkHealthChannelUtilization": Operation(
+        "get",
+        "/networks/{networkId}/networkHealth/channelUtilization",
+        ("networks", "monitor", "networkHealth", "channelUtilization"),
+        ("networkId",),
+        query=frozenset({"t0", "t1", "timespan", "resolution", "perPage", "startingAfter", "endingBefore"}),
+        paginated="next",
+    ),
+    "getNetworkPiiPiiKeys": Operation(
+        "get",
+        "/networks/{networkId}/pii/piiKeys",
+        ("networks", "configure", "pii", "piiKeys"),
+        ("networkId",),
+        query=frozenset({"username", "email", "mac", "serial", "imei", "bluetoothMac"}),
+    ),
+    "getNetworkPiiRequests": Operation(
+        "get",
+        "/networks/{networkId}/pii/requests",
+        ("networks", "configure", "pii", "requests"),
+        ("networkId",),
+    ),
+    "createNetworkPiiRequest": Operation(
+        "post",
+        "/networks/{networkId}/pii/requests",
+        ("networks", "configure", "pii", "requests"),
+        ("networkId",),
+        body=frozenset({"type", "datasets", "username", "email", "mac", "smDeviceId", "smUserId"}),
+        enums={
+            "type": ("delete", "restrict processing"),
+        },
+    ),
+    "getNetworkPiiRequest": Operation(
+        "get",
+        "/networks/{networkId}/pii/requests/{requestId}",
+        ("networks", "configure", "pii", "requests"),
+        ("networkId", "requestId"),
+    ),
+    "deleteNetworkPiiRequest": Operation(
+        "delete",
+        "/networks/{networkId}/pii/requests/{requestId}",
+        ("networks", "configure", "pii", "requests"),
+        ("networkId", "requestId"),
+    ),
+    "getNetworkPiiSmDevicesForKey": Operation(
+        "get",
+        "/networks/{networkId}/pii/smDevicesForKey",
+        ("networks", "configure", "pii", "smDevicesForKey"),
+        ("networkId",),
+        query=frozenset({"username", "email", "mac", "serial", "imei", "bluetoothMac"}),
+    ),
+    "getNetworkPiiSmOwnersForKey": Operation(
+        "get",
+        "/networks/{networkId}/pii/smOwnersForKey",
+        ("networks", "configure", "pii", "smOwnersForKey"),
+        ("networkId",),
+        query=frozenset({"username", "email", "mac", "serial", "imei", "bluetoothMac"}),
+    ),
+    "getNetworkPoliciesByClient": Operation(
+        "get",
+        "/networks/{networkId}/policies/byClient",
+        ("networks", "configure", "policies", "byClient"),
+        ("networkId",),
+        query=frozenset({"perPage", "startingAfter", "endingBefore", "t0", "timespan"}),
+        paginated="next",
+    ),
+    "getNetworkSettings": Operation(
+        "get",
+        "/networks/{networkId}/settings",
+        ("networks", "configure", "settings"),
+        ("networkId",),
+    ),
+    "updateNetworkSettings": Operation(
+        "put",
+        "/networks/{networkId}/settings",
+        ("networks", "configure", "settings"),
+        ("networkId",),
+        body=frozenset({"localStatusPageEnabled", "remoteStatusPageEnabled", "localStatusPage", "securePort", "namedVlans"}),
+    ),
+    "getNetworkSnmp": Operation(
+        "get",
+        "/networks/{networkId}/snmp",
+        ("networks", "configure", "snmp"),
+        ("networkId",),
+    ),
+    "updateNetworkSnmp": Operation(
+        "put",
+        "/networks/{networkId}/snmp",
+        ("networks", "configure", "snmp"),
+        ("networkId",),
+        body=frozenset({"access", "communityString", "users", "authentication", "privacy"}),
+        enums={
+            "access": ("community", "none", "users"),
+        },
+    ),
+    "getNetworkSplashLoginAttempts": Operation(
+        "get",
+        "/networks/{networkId}/splashLoginAttempts",
+        ("networks", "monitor", "splashLoginAttempts"),
+        ("networkId",),
+        query=frozenset({"ssidNumber", "loginIdentifier", "timespan"}),
+        enums={
+            "ssidNumber": (0, 1, 2, 3, 4, 5, 6, 7, 8, 9, 10, 11, 12, 13, 14),
+        },
+    ),
+    "splitNetwork": Operation(
+        "post",
+        "/networks/{networkId}/split",
+        ("networks", "configure"),
+        ("networkId",),
+    ),
+    "getNetworkSyslogServers": Operation(
+        "get",
+        "/networks/{networkId}/syslogServers",
+        ("networks", "configure", "syslogServers"),
+        ("networkId",),
+    ),
+    "updateNetworkSyslogServers": Operation(
+        "put",
+        "/networks/{networkId}/syslogServers",
+        ("networks", "configure", "syslogServers"),
+        ("networkId",),
+        arguments=("networkId", "servers"),
+        body=frozenset({"servers"}),
+    ),
+    "getNetworkTopologyLinkLayer": Operation(
+        "get",
+        "/networks/{networkId}/topology/linkLayer",
+        ("networks", "monitor", "topology", "linkLayer"),
+        ("networkId",),
+    ),
+    "getNetworkTraffic": Operation(
+        "get",
+        "/networks/{networkId}/traffic",
+        ("networks", "monitor", "traffic"),
+        ("networkId",),
+        query=frozenset({"t0", "timespan", "deviceType"}),
+        enums={
+            "deviceType": ("appliance", "combined", "switch", "wireless"),
+        },
+    ),
+    "getNetworkTrafficAnalysis": Operation(
+        "get",
+        "/networks/{networkId}/trafficAnalysis",
+        ("networks", "configure", "trafficAnalysis"),
+        ("networkId",),
+    ),
+    "updateNetworkTrafficAnalysis": Operation(
+        "put",
+        "/networks/{networkId}/trafficAnalysis",
+        ("networks", "configure", "trafficAnalysis"),
+        ("networkId",),
+        body=frozenset({"mode", "customPieChartItems"}),
+        enums={
+            "mode": ("basic", "detailed", "disabled"),
+        },
+    ),
+    "getNetworkTrafficShapingApplicationCategories": Operation(
+        "get",
+        "/networks/{networkId}/trafficShaping/applicationCategories",
+        ("networks", "configure", "trafficShaping", "applicationCategories"),
+        ("networkId",),
+    ),
+    "getNetworkTrafficShapingDscpTaggingOptions": Operation(
+        "get",
+        "/networks/{networkId}/trafficShaping/dscpTaggingOptions",
+        ("networks", "configure", "trafficShaping", "dscpTaggingOptions"),
+        ("networkId",),
+    ),
+    "unbindNetwork": Operation(
+        "post",
+        "/networks/{networkId}/unbind",
+        ("networks", "configure"),
+        ("networkId",),
+        body=frozenset({"retainConfigs"}),
+    ),
+    "getNetworkVlanProfiles": Operation(
+        "get",
+        "/networks/{networkId}/vlanProfiles",
+        ("networks", "configure", "vlanProfiles"),
+        ("networkId",),
+    ),
+    "createNetworkVlanProfile": Operation(
+        "post",
+        "/networks/{networkId}/vlanProfiles",
+        ("networks", "configure", "vlanProfiles"),
+        ("networkId",),
+        arguments=("networkId", "name", "vlanNames", "vlanGroups", "iname"),
+        body=frozenset({"name", "vlanNames", "vlanGroups", "iname"}),
+    ),
+    "getNetworkVlanProfilesAssignmentsByDevice": Operation(
+        "get",
+        "/networks/{networkId}/vlanProfiles/assignments/byDevice",
+        ("networks", "configure", "vlanProfiles", "assignments", "byDevice"),
+        ("networkId",),
+        query=frozenset({"perPage", "startingAfter", "endingBefore", "serials", "productTypes", "stackIds"}),
+        array=frozenset({"serials", "productTypes", "stackIds"}),
+        paginated="next",
+    ),
+    "reassignNetworkVlanProfilesAssignments": Operation(
+        "post",
+        "/networks/{networkId}/vlanProfiles/assignments/reassign",
+        ("networks", "configure", "vlanProfiles", "assignments"),
+        ("networkId",),
+        arguments=("networkId", "serials", "stackIds"),
+        body=frozenset({"vlanProfile", "serials", "stackIds"}),
+    ),
+    "getNetworkVlanProfile": Operation(
+        "get",
+        "/networks/{networkId}/vlanProfiles/{iname}",
+        ("networks", "configure", "vlanProfiles"),
+        ("networkId", "iname"),
+    ),
+    "updateNetworkVlanProfile": Operation(
+        "put",
+        "/networks/{networkId}/vlanProfiles/{iname}",
+        ("networks", "configure", "vlanProfiles"),
+        ("networkId", "iname"),
+        arguments=("networkId", "iname", "name", "vlanNames", "vlanGroups"),
+        body=frozenset({"name", "vlanNames", "vlanGroups"}),
+    ),
+    "deleteNetworkVlanProfile": Operation(
+        "delete",
+        "/networks/{networkId}/vlanProfiles/{iname}",
+        ("networks", "configure", "vlanProfiles"),
+        ("networkId", "iname"),
+    ),
+    "getNetworkWebhooksHttpServers": Operation(
+        "get",
+        "/networks/{networkId}/webhooks/httpServers",
+        ("networks", "configure", "webhooks", "httpServers"),
+        ("networkId",),
+    ),
+    "createNetworkWebhooksHttpServer": Operation(
+        "post",
+        "/networks/{networkId}/webhooks/httpServers",
+        ("networks", "configure", "webhooks", "httpServers"),
+        ("networkId",),
+        arguments=("networkId", "name", "url"),
+        body=frozenset({"name", "url", "sharedSecret", "payloadTemplate"}),
+    ),
+    "getNetworkWebhooksHttpServer": Operation(
+        "get",
+        "/networks/{networkId}/webhooks/httpServers/{httpServerId}",
+        ("networks", "configure", "webhooks", "httpServers"),
+        ("networkId", "httpServerId"),
+    ),
+    "updateNetworkWebhooksHttpServer": Operation(
+        "put",
+        "/networks/{networkId}/webhooks/httpServers/{httpServerId}",
+        ("networks", "configure", "webhooks", "httpServers"),
+        ("networkId", "httpServerId"),
+        body=frozenset({"name", "sharedSecret", "payloadTemplate"}),
+    ),
+    "deleteNetworkWebhooksHttpServer": Operation(
+        "delete",
+        "/networks/{networkId}/webhooks/httpServers/{httpServerId}",
+        ("networks", "configure", "webhooks", "httpServers"),
+        ("networkId", "httpServerId"),
+    ),
+    "getNetworkWebhooksPayloadTemplates": Operation(
+        "get",
+        "/networks/{networkId}/webhooks/payloadTemplates",
+        ("networks", "configure", "webhooks", "payloadTemplates"),
+        ("networkId",),
+    ),
+    "createNetworkWebhooksPayloadTemplate": Operation(
+        "post",
+        "/networks/{networkId}/webhooks/payloadTemplates",
+        ("networks", "configure", "webhooks", "payloadTemplates"),
+        ("networkId",),
+        arguments=("networkId", "name"),
+        body=frozenset({"name", "body", "headers", "bodyFile", "headersFile"}),
+    ),
+    "getNetworkWebhooksPayloadTemplate": Operation(
+        "get",
+        "/networks/{networkId}/webhooks/payloadTemplates/{payloadTemplateId}",
+        ("networks", "configure", "webhooks", "payloadTemplates"),
+        ("networkId", "payloadTemplateId"),
+    ),
+    "deleteNetworkWebhooksPayloadTemplate": Operation(
+        "delete",
+        "/networks/{networkId}/webhooks/payloadTemplates/{payloadTemplateId}",
+        ("networks", "configure", "webhooks", "payloadTemplates"),
+        ("networkId", "payloadTemplateId"),
+    ),
+    "updateNetworkWebhooksPayloadTemplate": Operation(
+        "put",
+        "/networks/{networkId}/webhooks/payloadTemplates/{payloadTemplateId}",
+        ("networks", "configure", "webhooks", "payloadTemplates"),
+        ("networkId", "payloadTemplateId"),
+        body=frozenset({"name", "body", "headers", "bodyFile", "headersFile"}),
+    ),
+    "createNetworkWebhooksWebhookTest": Operation(
+        "post",
+        "/networks/{networkId}/webhooks/webhookTests",
+        ("networks", "configure", "webhooks", "webhookTests"),
+        ("networkId",),
+        arguments=("networkId", "url"),
+        body=frozenset({"url", "sharedSecret", "payloadTemplateId", "payloadTemplateName", "alertTypeId"}),
+    ),
+    "getNetworkWebhooksWebhookTest": Operation(
+        "get",
+        "/networks/{networkId}/webhooks/webhookTests/{webhookTestId}",
+        ("networks", "configure", "webhooks", "webhookTests"),
+        ("networkId", "webhookTestId"),
+    ),
+    "getDevice": Operation(
+        "get",
+        "/devices/{serial}",
+        ("devices", "configure"),
+        ("serial",),
+    ),
+    "updateDevice": Operation(
+        "put",
+        "/devices/{serial}",
+        ("devices", "configure"),
+        ("serial",),
+        body=frozenset({"name", "tags", "lat", "lng", "address", "notes", "moveMapMarker", "switchProfileId", "floorPlanId"}),
+    ),
+    "blinkDeviceLeds": Operation(
+        "post",
+        "/devices/{serial}/blinkLeds",
+        ("devices", "liveTools"),
+        ("serial",),
+        body=frozenset({"duration", "period", "duty"}),
+    ),
+    "updateDeviceCellularGeolocations": Operation(
+        "put",
+        "/devices/{serial}/cellular/geolocations",
+        ("devices", "configure", "cellular", "geolocations"),
+        ("serial",),
+        arguments=("serial", "enabled"),
+        body=frozenset({"enabled"}),
+    ),
+    "getDeviceCellularSims": Operation(
+        "get",
+        "/devices/{serial}/cellular/sims",
+        ("devices", "configure", "cellular", "sims"),
+        ("serial",),
+    ),
+    "updateDeviceCellularSims": Operation(
+        "put",
+        "/devices/{serial}/cellular/sims",
+        ("devices", "configure", "cellular", "sims"),
+        ("serial",),
+        body=frozenset({"sims", "simOrdering", "simFailover"}),
+    ),
+    "createDeviceCellularUplinksBandsMasksUpdate": Operation(
+        "post",
+        "/devices/{serial}/cellular/uplinks/bands/masks/update",
+        ("devices", "configure", "cellular", "uplinks", "bands", "masks", "update"),
+        ("serial",),
+        arguments=("serial", "slot", "type", "masked"),
+        body=frozenset({"slot", "type", "masked"}),
+        enums={
+            "slot": ("sim1", "sim2", "sim3"),
+            "type": ("5GNSA", "5GSA", "LTE"),
+        },
+    ),
+    "getDeviceClients": Operation(
+        "get",
+        "/devices/{serial}/clients",
+        ("devices", "monitor", "clients"),
+        ("serial",),
+        query=frozenset({"t0", "timespan"}),
+    ),
+    "createDeviceLiveToolsArpTable": Operation(
+        "post",
+        "/devices/{serial}/liveTools/arpTable",
+        ("devices", "liveTools", "arpTable"),
+        ("serial",),
+        body=frozenset({"callback"}),
+    ),
+    "getDeviceLiveToolsArpTable": Operation(
+        "get",
+        "/devices/{serial}/liveTools/arpTable/{arpTableId}",
+        ("devices", "liveTools", "arpTable"),
+        ("serial", "arpTableId"),
+    ),
+    "createDeviceLiveToolsCableTest": Operation(
+        "post",
+        "/devices/{serial}/liveTools/cableTest",
+        ("devices", "liveTools", "cableTest"),
+        ("serial",),
+        arguments=("serial", "ports"),
+        body=frozenset({"ports", "callback"}),
+    ),
+    "getDeviceLiveToolsCableTest": Operation(
+        "get",
+        "/devices/{serial}/liveTools/cableTest/{id}",
+        ("devices", "liveTools", "cableTest"),
+        ("serial", "id"),
+    ),
+    "createDeviceLiveToolsLedsBlink": Operation(
+        "post",
+        "/devices/{serial}/liveTools/leds/blink",
+        ("devices", "liveTools", "leds", "blink"),
+        ("serial",),
+        arguments=("serial", "duration"),
+        body=frozenset({"duration", "callback"}),
+    ),
+    "getDeviceLiveToolsLedsBlink": Operation(
+        "get",
+        "/devices/{serial}/liveTools/leds/blink/{ledsBlinkId}",
+        ("devices", "liveTools", "leds", "blink"),
+        ("serial", "ledsBlinkId"),
+    ),
+    "createDeviceLiveToolsMacTable": Operation(
+        "post",
+        "/devices/{serial}/liveTools/macTable",
+        ("devices", "liveTools", "macTable"),
+        ("serial",),
+        body=frozenset({"mac", "callback"}),
+    ),
+    "getDeviceLiveToolsMacTable": Operation(
+        "get",
+        "/devices/{serial}/liveTools/macTable/{macTableId}",
+        ("devices", "liveTools", "macTable"),
+        ("serial", "macTableId"),
+    ),
+    "createDeviceLiveToolsMulticastRouting": Operation(
+        "post",
+        "/devices/{serial}/liveTools/multicastRouting",
+        ("devices", "liveTools", "multicastRouting"),
+        ("serial",),
+        body=frozenset({"callback"}),
+    ),
+    "getDeviceLiveToolsMulticastRouting": Operation(
+        "get",
+        "/devices/{serial}/liveTools/multicastRouting/{multicastRoutingId}",
+        ("devices", "liveTools", "multicastRouting"),
+        ("serial", "multicastRoutingId"),
+    ),
+    "createDeviceLiveToolsPing": Operation(
+        "post",
+        "/devices/{serial}/liveTools/ping",
+        ("devices", "liveTools", "ping"),
+        ("serial",),
+        arguments=("serial", "target"),
+        body=frozenset({"target", "count", "callback"}),
+    ),
+    "getDeviceLiveToolsPing": Operation(
+        "get",
+        "/devices/{serial}/liveTools/ping/{id}",
+        ("devices", "liveTools", "ping"),
+        ("serial", "id"),
+    ),
+    "createDeviceLiveToolsPingDevice": Operation(
+        "post",
+        "/devices/{serial}/liveTools/pingDevice",
+        ("devices", "liveTools", "pingDevice"),
+        ("serial",),
+        body=frozenset({"count", "callback"}),
+    ),
+    "getDeviceLiveToolsPingDevice": Operation(
+        "get",
+        "/devices/{serial}/liveTools/pingDevice/{id}",
+        ("devices", "liveTools", "pingDevice"),
+        ("serial", "id"),
+    ),
+    "createDeviceLiveToolsPortsCycle": Operation(
+        "post",
+        "/devices/{serial}/liveTools/ports/cycle",
+        ("devices", "liveTools", "ports", "cycle"),
+        ("serial",),
+        arguments=("serial", "ports"),
+        body=frozenset({"ports", "callback"}),
+    ),
+    "getDeviceLiveToolsPortsCycle": Operation(
+        "get",
+        "/devices/{serial}/liveTools/ports/cycle/{id}",
+        ("devices", "liveTools", "ports", "cycle"),
+        ("serial", "id"),
+    ),
+    "createDeviceLiveToolsPortsStatus": Operation(
+        "post",
+        "/devices/{serial}/liveTools/ports/status",
+        ("devices", "liveTools", "ports", "status"),
+        ("serial",),
+        body=frozenset({"callback"}),
+    ),
+    "getDeviceLiveToolsPortsStatus": Operation(
+        "get",
+        "/devices/{serial}/liveTools/ports/status/{jobId}",
+        ("devices", "liveTools", "ports", "status"),
+        ("serial", "jobId"),
+    ),
+    "createDeviceLiveToolsPowerUsage": Operation(
+        "post",
+        "/devices/{serial}/liveTools/power/usage",
+        ("devices", "liveTools", "power", "usage"),
+        ("serial",),
+        body=frozenset({"callback"}),
+    ),
+    "getDeviceLiveToolsPowerUsage": Operation(
+        "get",
+        "/devices/{serial}/liveTools/power/usage/{jobId}",
+        ("devices", "liveTools", "power", "usage"),
+        ("serial", "jobId"),
+    ),
+    "createDeviceLiveToolsRoutingTableLookup": Operation(
+        "post",
+        "/devices/{serial}/liveTools/routingTable/lookups",
+        ("devices", "liveTools", "routingTable", "lookups"),
+        ("serial",),
+        body=frozenset({"type", "destination", "nextHop", "vpn", "callback"}),
+        enums={
+            "type": (
+                "BGP",
+                "EIGRP",
+                "HSRP",
+                "IGRP",
+                "ISIS",
+                "LISP",
+                "NAT",
+                "ND",
+                "NHRP",
+                "OMP",
+                "OSPF",
+                "RIP",
+                "default WAN",
+                "direct",
+                "static",
+            ),
+        },
+    ),
+    "getDeviceLiveToolsRoutingTableLookup": Operation(
+        "get",
+        "/devices/{serial}/liveTools/routingTable/lookups/{id}",
+        ("devices", "liveTools", "routingTable", "lookups"),
+        ("serial", "id"),
+    ),
+    "createDeviceLiveToolsRoutingTableSummary": Operation(
+        "post",
+        "/devices/{serial}/liveTools/routingTable/summaries",
+        ("devices", "liveTools", "routingTable", "summaries"),
+        ("serial",),
+        body=frozenset({"callback"}),
+    ),
+    "getDeviceLiveToolsRoutingTableSummary": Operation(
+        "get",
+        "/devices/{serial}/liveTools/routingTable/summaries/{id}",
+        ("devices", "liveTools", "routingTable", "summaries"),
+        ("serial", "id"),
+    ),
+    "createDeviceLiveToolsThroughputTest": Operation(
+        "post",
+        "/devices/{serial}/liveTools/throughputTest",
+        ("devices", "liveTools", "throughputTest"),
+        ("serial",),
+        body=frozenset({"callback"}),
+    ),
+    "getDeviceLiveToolsThroughputTest": Operation(
+        "get",
+        "/devices/{serial}/liveTools/throughputTest/{throughputTestId}",
+        ("devices", "liveTools", "throughputTest"),
+        ("serial", "throughputTestId"),
+    ),
+    "createDeviceLiveToolsWakeOnLan": Operation(
+        "post",
+        "/devices/{serial}/liveTools/wakeOnLan",
+        ("devices", "liveTools", "wakeOnLan"),
+        ("serial",),
+        arguments=("serial", "vlanId", "mac"),
+        body=frozenset({"vlanId", "mac", "callback"}),
+    ),
+    "getDeviceLiveToolsWakeOnLan": Operation(
+        "get",
+        "/devices/{serial}/liveTools/wakeOnLan/{wakeOnLanId}",
+        ("devices", "liveTools", "wakeOnLan"),
+        ("serial", "wakeOnLanId"),
+    ),
+    "getDeviceLldpCdp": Operation(
+        "get",
+        "/devices/{serial}/lldpCdp",
+        ("devices", "monitor", "lldpCdp"),
+        ("serial",),
+    ),
+    "getDeviceLossAndLatencyHistory": Operation(
+        "get",
+        "/devices/{serial}/lossAndLatencyHistory",
+        ("devices", "monitor", "uplinks", "lossAndLatencyHistory"),
+        ("serial",),
+        arguments=("serial", "ip"),
+        query=frozenset({"t0", "t1", "timespan", "resolution", "uplink", "ip"}),
+        enums={
+            "uplink": ("cellular", "wan1", "wan2", "wan3", "wan4"),
+        },
+    ),
+    "getDeviceManagementInterface": Operation(
+        "get",
+        "/devices/{serial}/managementInterface",
+        ("devices", "configure", "managementInterface"),
+        ("serial",),
+    ),
+    "updateDeviceManagementInterface": Operation(
+        "put",
+        "/devices/{serial}/managementInterface",
+        ("devices", "configure", "managementInterface"),
+        ("serial",),
+        body=frozenset({"wan1", "wan2"}),
+    ),
+    "rebootDevice": Operation(
+        "post",
+        "/devices/{serial}/reboot",
+        ("devices", "liveTools"),
+        ("serial",),
+    ),
+    "getDeviceApplianceDhcpSubnets": Operation(
+        "get",
+        "/devices/{serial}/appliance/dhcp/subnets",
+        ("appliance", "monitor", "dhcp", "subnets"),
+        ("serial",),
+    ),
+    "createDeviceApplianceInterfacesPortsUpdate": Operation(
+        "post",
+        "/devices/{serial}/appliance/interfaces/ports/update",
+        ("appliance", "configure", "interfaces", "ports", "update"),
+        ("serial",),
+        body=frozenset({"interface", "enabled", "personality", "uplink", "downlink"}),
+    ),
+    "getDeviceAppliancePerformance": Operation(
+        "get",
+        "/devices/{serial}/appliance/performance",
+        ("appliance", "monitor", "performance"),
+        ("serial",),
+        query=frozenset({"t0", "t1", "timespan"}),
+    ),
+    "getDeviceAppliancePrefixesDelegated": Operation(
+        "get",
+        "/devices/{serial}/appliance/prefixes/delegated",
+        ("appliance", "monitor", "prefixes", "delegated"),
+        ("serial",),
+    ),
+    "getDeviceAppliancePrefixesDelegatedVlanAssignments": Operation(
+        "get",
+        "/devices/{serial}/appliance/prefixes/delegated/vlanAssignments",
+        ("appliance", "monitor", "prefixes", "delegated", "vlanAssignments"),
+        ("serial",),
+    ),
+    "getDeviceApplianceRadioSettings": Operation(
+        "get",
+        "/devices/{serial}/appliance/radio/settings",
+        ("appliance", "configure", "radio", "settings"),
+        ("serial",),
+    ),
+    "updateDeviceApplianceRadioSettings": Operation(
+        "put",
+        "/devices/{serial}/appliance/radio/settings",
+        ("appliance", "configure", "radio", "settings"),
+        ("serial",),
+        body=frozenset({"rfProfileId", "twoFourGhzSettings", "fiveGhzSettings"}),
+    ),
+    "getDeviceApplianceUplinksSettings": Operation(
+        "get",
+        "/devices/{serial}/appliance/uplinks/settings",
+        ("appliance", "configure", "uplinks", "settings"),
+        ("serial",),
+    ),
+    "updateDeviceApplianceUplinksSettings": Operation(
+        "put",
+        "/devices/{serial}/appliance/uplinks/settings",
+        ("appliance", "configure", "uplinks", "settings"),
+        ("serial",),
+        arguments=("serial", "interfaces"),
+        body=frozenset({"interfaces"}),
+    ),
+    "createDeviceApplianceVmxAuthenticationToken": Operation(
+        "post",
+        "/devices/{serial}/appliance/vmx/authenticationToken",
+        ("appliance", "configure", "vmx", "authenticationToken"),
+        ("serial",),
+    ),
+    "getNetworkApplianceClientSecurityEvents": Operation(
+        "get",
+        "/networks/{networkId}/appliance/clients/{clientId}/security/events",
+        ("appliance", "monitor", "clients", "security", "events"),
+        ("networkId", "clientId"),
+        query=frozenset({"t0", "t1", "timespan", "perPage", "startingAfter", "endingBefore", "sortOrder"}),
+        paginated="next",
+        enums={
+            "sortOrder": ("ascending", "descending"),
+        },
+    ),
+    "getNetworkApplianceConnectivityMonitoringDestinations": Operation(
+        "get",
+        "/networks/{networkId}/appliance/connectivityMonitoringDestinations",
+        ("appliance", "configure", "connectivityMonitoringDestinations"),
+        ("networkId",),
+    ),
+    "updateNetworkApplianceConnectivityMonitoringDestinations": Operation(
+        "put",
+        "/networks/{networkId}/appliance/connectivityMonitoringDestinations",
+        ("appliance", "configure", "connectivityMonitoringDestinations"),
+        ("networkId",),
+        body=frozenset({"destinations"}),
+    ),
+    "getNetworkApplianceContentFiltering": Operation(
+        "get",
+        "/networks/{networkId}/appliance/contentFiltering",
+        ("appliance", "configure", "contentFiltering"),
+        ("networkId",),
+    ),
+    "updateNetworkApplianceContentFiltering": Operation(
+        "put",
+        "/networks/{networkId}/appliance/contentFiltering",
+        ("appliance", "configure", "contentFiltering"),
+        ("networkId",),
+        body=frozenset({"allowedUrlPatterns", "blockedUrlPatterns", "blockedUrlCategories", "urlCategoryListSize"}),
+        enums={
+            "urlCategoryListSize": ("fullList", "topSites"),
+        },
+    ),
+    "getNetworkApplianceContentFilteringCategories": Operation(
+        "get",
+        "/networks/{networkId}/appliance/contentFiltering/categories",
+        ("appliance", "configure", "contentFiltering", "categories"),
+        ("networkId",),
+    ),
+    "updateNetworkApplianceDevicesRedundancy": Operation(
+        "put",
+        "/networks/{networkId}/appliance/devices/redundancy",
+        ("appliance", "configure", "devices", "redundancy"),
+        ("networkId",),
+        arguments=("networkId", "enabled"),
+        body=frozenset({"enabled", "mode", "designations", "uplink"}),
+        enums={
+            "mode": ("active-active", "active-passive", "disabled"),
+        },
+    ),
+    "createNetworkApplianceDevicesRedundancySwap": Operation(
+        "post",
+        "/networks/{networkId}/appliance/devices/redundancy/swap",
+        ("appliance", "configure", "devices", "redundancy", "swap"),
+        ("networkId",),
+    ),
+    "getNetworkApplianceFirewallCellularFirewallRules": Operation(
+        "get",
+        "/networks/{networkId}/appliance/firewall/cellularFirewallRules",
+        ("appliance", "configure", "firewall", "cellularFirewallRules"),
+        ("networkId",),
+    ),
+    "updateNetworkApplianceFirewallCellularFirewallRules": Operation(
+        "put",
+        "/networks/{networkId}/appliance/firewall/cellularFirewallRules",
+        ("appliance", "configure", "firewall", "cellularFirewallRules"),
+        ("networkId",),
+        body=frozenset({"rules"}),
+    ),
+    "getNetworkApplianceFirewallFirewalledServices": Operation(
+        "get",
+        "/networks/{networkId}/appliance/firewall/firewalledServices",
+        ("appliance", "configure", "firewall", "firewalledServices"),
+        ("networkId",),
+    ),
+    "getNetworkApplianceFirewallFirewalledService": Operation(
+        "get",
+        "/networks/{networkId}/appliance/firewall/firewalledServices/{service}",
+        ("appliance", "configure", "firewall", "firewalledServices"),
+        ("networkId", "service"),
+    ),
+    "updateNetworkApplianceFirewallFirewalledService": Operation(
+        "put",
+        "/networks/{networkId}/appliance/firewall/firewalledServices/{service}",
+        ("appliance", "configure", "firewall", "firewalledServices"),
+        ("networkId", "service"),
+        arguments=("networkId", "service", "access"),
+        body=frozenset({"access", "allowedIps"}),
+        enums={
+            "access": ("blocked", "restricted", "unrestricted"),
+        },
+    ),
+    "getNetworkApplianceFirewallInboundCellularFirewallRules": Operation(
+        "get",
+        "/networks/{networkId}/appliance/firewall/inboundCellularFirewallRules",
+        ("appliance", "configure", "firewall", "inboundCellularFirewallRules"),
+        ("networkId",),
+    ),
+    "updateNetworkApplianceFirewallInboundCellularFirewallRules": Operation(
+        "put",
+        "/networks/{networkId}/appliance/firewall/inboundCellularFirewallRules",
+        ("appliance", "configure", "firewall", "inboundCellularFirewallRules"),
+        ("networkId",),
+        body=frozenset({"rules"}),
+    ),
+    "getNetworkApplianceFirewallInboundFirewallRules": Operation(
+        "get",
+        "/networks/{networkId}/appliance/firewall/inboundFirewallRules",
+        ("appliance", "configure", "firewall", "inboundFirewallRules"),
+        ("networkId",),
+    ),
+    "updateNetworkApplianceFirewallInboundFirewallRules": Operation(
+        "put",
+        "/networks/{networkId}/appliance/firewall/inboundFirewallRules",
+        ("appliance", "configure", "firewall", "inboundFirewallRules"),
+        ("networkId",),
+        body=frozenset({"rules", "syslogDefaultRule"}),
+    ),
+    "getNetworkApplianceFirewallL3FirewallRules": Operation(
+        "get",
+        "/networks/{networkId}/appliance/firewall/l3FirewallRules",
+        ("appliance", "configure", "firewall", "l3FirewallRules"),
+        ("networkId",),
+    ),
+    "updateNetworkApplianceFirewallL3FirewallRules": Operation(
+        "put",
+        "/networks/{networkId}/appliance/firewall/l3FirewallRules",
+        ("appliance", "configure", "firewall", "l3FirewallRules"),
+        ("networkId",),
+        body=frozenset({"rules", "syslogDefaultRule"}),
+    ),
+    "getNetworkApplianceFirewallL7FirewallRules": Operation(
+        "get",
+        "/networks/{networkId}/appliance/firewall/l7FirewallRules",
+        ("appliance", "configure", "firewall", "l7FirewallRules"),
+        ("networkId",),
+    ),
+    "updateNetworkApplianceFirewallL7FirewallRules": Operation(
+        "put",
+        "/networks/{networkId}/appliance/firewall/l7FirewallRules",
+        ("appliance", "configure", "firewall", "l7FirewallRules"),
+        ("networkId",),
+        body=frozenset({"rules"}),
+    ),
+    "getNetworkApplianceFirewallL7FirewallRulesApplicationCategories": Operation(
+        "get",
+        "/networks/{networkId}/appliance/firewall/l7FirewallRules/applicationCategories",
+        ("appliance", "configure", "firewall", "l7FirewallRules", "applicationCategories"),
+        ("networkId",),
+    ),
+    "updateNetworkApplianceFirewallMulticastForwarding": Operation(
+        "put",
+        "/networks/{networkId}/appliance/firewall/multicastForwarding",
+        ("appliance", "configure", "firewall", "multicastForwarding"),
+        ("networkId",),
+        arguments=("networkId", "rules"),
+        body=frozenset({"rules"}),
+    ),
+    "getNetworkApplianceFirewallOneToManyNatRules": Operation(
+        "get",
+        "/networks/{networkId}/appliance/firewall/oneToManyNatRules",
+        ("appliance", "configure", "firewall", "oneToManyNatRules"),
+        ("networkId",),
+    ),
+    "updateNetworkApplianceFirewallOneToManyNatRules": Operation(
+        "put",
+        "/networks/{networkId}/appliance/firewall/oneToManyNatRules",
+        ("appliance", "configure", "firewall", "oneToManyNatRules"),
+        ("networkId",),
+        arguments=("networkId", "rules"),
+        body=frozenset({"rules"}),
+    ),
+    "getNetworkApplianceFirewallOneToOneNatRules": Operation(
+        "get",
+        "/networks/{networkId}/appliance/firewall/oneToOneNatRules",
+        ("appliance", "configure", "firewall", "oneToOneNatRules"),
+        ("networkId",),
+    ),
+    "updateNetworkApplianceFirewallOneToOneNatRules": Operation(
+        "put",
+        "/networks/{networkId}/appliance/firewall/oneToOneNatRules",
+        ("appliance", "configure", "firewall", "oneToOneNatRules"),
+        ("networkId",),
+        arguments=("networkId", "rules"),
+        body=frozenset({"rules"}),
+    ),
+    "getNetworkApplianceFirewallPortForwardingRules": Operation(
+        "get",
+        "/networks/{networkId}/appliance/firewall/portForwardingRules",
+        ("appliance", "configure", "firewall", "portForwardingRules"),
+        ("networkId",),
+    ),
+    "updateNetworkApplianceFirewallPortForwardingRules": Operation(
+        "put",
+        "/networks/{networkId}/appliance/firewall/portForwardingRules",
+        ("appliance", "configure", "firewall", "portForwardingRules"),
+        ("networkId",),
+        arguments=("networkId", "rules"),
+        body=frozenset({"rules"}),
+    ),
+    "getNetworkApplianceFirewallSettings": Operation(
+        "get",
+        "/networks/{networkId}/appliance/firewall/settings",
+        ("appliance", "configure", "firewall", "settings"),
+        ("networkId",),
+    ),
+    "updateNetworkApplianceFirewallSettings": Operation(
+        "put",
+        "/networks/{networkId}/appliance/firewall/settings",
+        ("appliance", "configure", "firewall", "settings"),
+        ("networkId",),
+        body=frozenset({"spoofingProtection"}),
+    ),
+    "createNetworkApplianceInterfacesL3": Operation(
+        "post",
+        "/networks/{networkId}/appliance/interfaces/l3",
+        ("appliance", "configure", "interfaces", "l3"),
+        ("networkId",),
+        arguments=("networkId", "ipv4"),
+        body=frozenset({"port", "ipv4"}),
+    ),
+    "updateNetworkApplianceInterfacesL3": Operation(
+        "put",
+        "/networks/{networkId}/appliance/interfaces/l3/{interfaceId}",
+        ("appliance", "configure", "interfaces", "l3"),
+        ("networkId", "interfaceId"),
+        body=frozenset({"port", "ipv4"}),
+    ),
+    "deleteNetworkApplianceInterfacesL3": Operation(
+        "delete",
+        "/networks/{networkId}/appliance/interfaces/l3/{interfaceId}",
+        ("appliance", "configure", "interfaces", "l3"),
+        ("networkId", "interfaceId"),
+    ),
+    "getNetworkAppliancePorts": Operation(
+        "get",
+        "/networks/{networkId}/appliance/ports",
+        ("appliance", "configure", "ports"),
+        ("networkId",),
+    ),
+    "getNetworkAppliancePort": Operation(
+        "get",
+        "/networks/{networkId}/appliance/ports/{portId}",
+        ("appliance", "configure", "ports"),
+        ("networkId", "portId"),
+    ),
+    "updateNetworkAppliancePort": Operation(
+        "put",
+        "/networks/{networkId}/appliance/ports/{portId}",
+        ("appliance", "configure", "ports"),
+        ("networkId", "portId"),
+        body=frozenset({"enabled", "dropUntaggedTraffic", "type", "vlan", "allowedVlans", "accessPolicy", "sgt"}),
+    ),
+    "getNetworkAppliancePrefixesDelegatedStatics": Operation(
+        "get",
+        "/networks/{networkId}/appliance/prefixes/delegated/statics",
+        ("appliance", "configure", "prefixes", "delegated", "statics"),
+        ("networkId",),
+    ),
+    "createNetworkAppliancePrefixesDelegatedStatic": Operation(
+        "post",
+        "/networks/{networkId}/appliance/prefixes/delegated/statics",
+        ("appliance", "configure", "prefixes", "delegated", "statics"),
+        ("networkId",),
+        arguments=("networkId", "prefix", "origin"),
+        body=frozenset({"prefix", "origin", "description"}),
+    ),
+    "getNetworkAppliancePrefixesDelegatedStatic": Operation(
+        "get",
+        "/networks/{networkId}/appliance/prefixes/delegated/statics/{staticDelegatedPrefixId}",
+        ("appliance", "configure", "prefixes", "delegated", "statics"),
+        ("networkId", "staticDelegatedPrefixId"),
+    ),
+    "updateNetworkAppliancePrefixesDelegatedStatic": Operation(
+        "put",
+        "/networks/{networkId}/appliance/prefixes/delegated/statics/{staticDelegatedPrefixId}",
+        ("appliance", "configure", "prefixes", "delegated", "statics"),
+        ("networkId", "staticDelegatedPrefixId"),
+        body=frozenset({"prefix", "origin", "description"}),
+    ),
+    "deleteNetworkAppliancePrefixesDelegatedStatic": Operation(
+        "delete",
+        "/networks/{networkId}/appliance/prefixes/delegated/statics/{staticDelegatedPrefixId}",
+        ("appliance", "configure", "prefixes", "delegated", "statics"),
+        ("networkId", "staticDelegatedPrefixId"),
+    ),
+    "getNetworkApplianceRfProfiles": Operation(
+        "get",
+        "/networks/{networkId}/appliance/rfProfiles",
+        ("appliance", "configure", "rfProfiles"),
+        ("networkId",),
+    ),
+    "createNetworkApplianceRfProfile": Operation(
+        "post",
+        "/networks/{networkId}/appliance/rfProfiles",
+        ("appliance", "configure", "rfProfiles"),
+        ("networkId",),
+        arguments=("networkId", "name"),
+        body=frozenset({"name", "twoFourGhzSettings", "fiveGhzSettings", "perSsidSettings"}),
+    ),
+    "updateNetworkApplianceRfProfile": Operation(
+        "put",
+        "/networks/{networkId}/appliance/rfProfiles/{rfProfileId}",
+        ("appliance", "configure", "rfProfiles"),
+        ("networkId", "rfProfileId"),
+        body=frozenset({"name", "twoFourGhzSettings", "fiveGhzSettings", "perSsidSettings"}),
+    ),
+    "deleteNetworkApplianceRfProfile": Operation(
+        "delete",
+        "/networks/{networkId}/appliance/rfProfiles/{rfProfileId}",
+        ("appliance", "configure", "rfProfiles"),
+        ("networkId", "rfProfileId"),
+    ),
+    "getNetworkApplianceRfProfile": Operation(
+        "get",
+        "/networks/{networkId}/appliance/rfProfiles/{rfProfileId}",
+        ("appliance", "configure", "rfProfiles"),
+        ("networkId", "rfProfileId"),
+    ),
+    "updateNetworkApplianceSdwanInternetPolicies": Operation(
+        "put",
+        "/networks/{networkId}/appliance/sdwan/internetPolicies",
+        ("appliance", "configure", "sdwan", "internetPolicies"),
+        ("networkId",),
+        body=frozenset({"wanTrafficUplinkPreferences"}),
+    ),
+    "getNetworkApplianceSecurityEvents": Operation(
+        "get",
+        "/networks/{networkId}/appliance/security/events",
+        ("appliance", "monitor", "security", "events"),
+        ("networkId",),
+        query=frozenset({"t0", "t1", "timespan", "perPage", "startingAfter", "endingBefore", "sortOrder"}),
+        paginated="next",
+        enums={
+            "sortOrder": ("ascending", "descending"),
+        },
+    ),
+    "getNetworkApplianceSecurityIntrusion": Operation(
+        "get",
+        "/networks/{networkId}/appliance/security/intrusion",
+        ("appliance", "configure", "security", "intrusion"),
+        ("networkId",),
+    ),
+    "updateNetworkApplianceSecurityIntrusion": Operation(
+        "put",
+        "/networks/{networkId}/appliance/security/intrusion",
+        ("appliance", "configure", "security", "intrusion"),
+        ("networkId",),
+        body=frozenset({"mode", "idsRulesets", "protectedNetworks"}),
+        enums={
+            "mode": ("detection", "disabled", "prevention"),
+            "idsRulesets": ("balanced", "connectivity", "security"),
+        },
+    ),
+    "getNetworkApplianceSecurityMalware": Operation(
+        "get",
+        "/networks/{networkId}/appliance/security/malware",
+        ("appliance", "configure", "security", "malware"),
+        ("networkId",),
+    ),
+    "updateNetworkApplianceSecurityMalware": Operation(
+        "put",
+        "/networks/{networkId}/appliance/security/malware",
+        ("appliance", "configure", "security", "malware"),
+        ("networkId",),
+        arguments=("networkId", "mode"),
+        body=frozenset({"mode", "allowedUrls", "allowedFiles"}),
+        enums={
+            "mode": ("disabled", "enabled"),
+        },
+    ),
+    "getNetworkApplianceSettings": Operation(
+        "get",
+        "/networks/{networkId}/appliance/settings",
+        ("appliance", "configure", "settings"),
+        ("networkId",),
+    ),
+    "updateNetworkApplianceSettings": Operation(
+        "put",
+        "/networks/{networkId}/appliance/settings",
+        ("appliance", "configure", "settings"),
+        ("networkId",),
+        body=frozenset({"clientTrackingMethod", "deploymentMode", "dynamicDns"}),
+        enums={
+            "clientTrackingMethod": ("IP address", "MAC address", "Unique client identifier"),
+            "deploymentMode": ("passthrough", "routed"),
+        },
+    ),
+    "getNetworkApplianceSingleLan": Operation(
+        "get",
+        "/networks/{networkId}/appliance/singleLan",
+        ("appliance", "configure", "singleLan"),
+        ("networkId",),
+    ),
+    "updateNetworkApplianceSingleLan": Operation(
+        "put",
+        "/networks/{networkId}/appliance/singleLan",
+        ("appliance", "configure", "singleLan"),
+        ("networkId",),
+        body=frozenset({"subnet", "applianceIp", "ipv6", "mandatoryDhcp"}),
+    ),
+    "getNetworkApplianceSsids": Operation(
+        "get",
+        "/networks/{networkId}/appliance/ssids",
+        ("appliance", "configure", "ssids"),
+        ("networkId",),
+    ),
+    "getNetworkApplianceSsid": Operation(
+        "get",
+        "/networks/{networkId}/appliance/ssids/{number}",
+        ("appliance", "configure", "ssids"),
+        ("networkId", "number"),
+    ),
+    "updateNetworkApplianceSsid": Operation(
+        "put",
+        "/networks/{networkId}/appliance/ssids/{number}",
+        ("appliance", "configure", "ssids"),
+        ("networkId", "number"),
+        body=frozenset(
+            {
+                "name",
+                "enabled",
+                "defaultVlanId",
+                "authMode",
+                "psk",
+                "radiusServers",
+                "encryptionMode",
+                "wpaEncryptionMode",
+                "visible",
+                "dhcpEnforcedDeauthentication",
+                "dot11w",
+            }
+        ),
+        enums={
+            "authMode": ("8021x-meraki", "8021x-radius", "open", "psk"),
+            "encryptionMode": ("wep", "wpa"),
+            "wpaEncryptionMode": ("WPA1 and WPA2", "WPA2 only", "WPA3 Transition Mode", "WPA3 only"),
+        },
+    ),
+    "getNetworkApplianceStaticRoutes": Operation(
+        "get",
+        "/networks/{networkId}/appliance/staticRoutes",
+        ("appliance", "configure", "staticRoutes"),
+        ("networkId",),
+    ),
+    "createNetworkApplianceStaticRoute": Operation(
+        "post",
+        "/networks/{networkId}/appliance/staticRoutes",
+        ("appliance", "configure", "staticRoutes"),
+        ("networkId",),
+        arguments=("networkId", "name", "subnet", "gatewayIp"),
+        body=frozenset({"name", "subnet", "gatewayIp", "gatewayVlanId"}),
+    ),
+    "getNetworkApplianceStaticRoute": Operation(
+        "get",
+        "/networks/{networkId}/appliance/staticRoutes/{staticRouteId}",
+        ("appliance", "configure", "staticRoutes"),
+        ("networkId", "staticRouteId"),
+    ),
+    "updateNetworkApplianceStaticRoute": Operation(
+        "put",
+        "/networks/{networkId}/appliance/staticRoutes/{staticRouteId}",
+        ("appliance", "configure", "staticRoutes"),
+        ("networkId", "staticRouteId"),
+        body=frozenset({"name", "subnet", "gatewayIp", "gatewayVlanId", "enabled", "fixedIpAssignments", "reservedIpRanges"}),
+    ),
+    "deleteNetworkApplianceStaticRoute": Operation(
+        "delete",
+        "/networks/{networkId}/appliance/staticRoutes/{staticRouteId}",
+        ("appliance", "configure", "staticRoutes"),
+        ("networkId", "staticRouteId"),
+    ),
+    "getNetworkApplianceTrafficShaping": Operation(
+        "get",
+        "/networks/{networkId}/appliance/trafficShaping",
+        ("appliance", "configure", "trafficShaping"),
+        ("networkId",),
+    ),
+    "updateNetworkApplianceTrafficShaping": Operation(
+        "put",
+        "/networks/{networkId}/appliance/trafficShaping",
+        ("appliance", "configure", "trafficShaping"),
+        ("networkId",),
+        arguments=("networkId", "globalBandwidthLimits"),
+        body=frozenset({"globalBandwidthLimits"}),
+    ),
+    "getNetworkApplianceTrafficShapingCustomPerformanceClasses": Operation(
+        "get",
+        "/networks/{networkId}/appliance/trafficShaping/customPerformanceClasses",
+        ("appliance", "configure", "trafficShaping", "customPerformanceClasses"),
+        ("networkId",),
+    ),
+    "createNetworkApplianceTrafficShapingCustomPerformanceClass": Operation(
+        "post",
+        "/networks/{networkId}/appliance/trafficShaping/customPerformanceClasses",
+        ("appliance", "configure", "trafficShaping", "customPerformanceClasses"),
+        ("networkId",),
+        arguments=("networkId", "name"),
+        body=frozenset({"name", "maxLatency", "maxJitter", "maxLossPercentage"}),
+    ),
+    "getNetworkApplianceTrafficShapingCustomPerformanceClass": Operation(
+        "get",
+        "/networks/{networkId}/appliance/trafficShaping/customPerformanceClasses/{customPerformanceClassId}",
+        ("appliance", "configure", "trafficShaping", "customPerformanceClasses"),
+        ("networkId", "customPerformanceClassId"),
+    ),
+    "updateNetworkApplianceTrafficShapingCustomPerformanceClass": Operation(
+        "put",
+        "/networks/{networkId}/appliance/trafficShaping/customPerformanceClasses/{customPerformanceClassId}",
+        ("appliance", "configure", "trafficShaping", "customPerformanceClasses"),
+        ("networkId", "customPerformanceClassId"),
+        body=frozenset({"name", "maxLatency", "maxJitter", "maxLossPercentage"}),
+    ),
+    "deleteNetworkApplianceTrafficShapingCustomPerformanceClass": Operation(
+        "delete",
+        "/networks/{networkId}/appliance/trafficShaping/customPerformanceClasses/{customPerformanceClassId}",
+        ("appliance", "configure", "trafficShaping", "customPerformanceClasses"),
+        ("networkId", "customPerformanceClassId"),
+    ),
+    "updateNetworkApplianceTrafficShapingRules": Operation(
+        "put",
+        "/networks/{networkId}/appliance/trafficShaping/rules",
+        ("appliance", "configure", "trafficShaping", "rules"),
+        ("networkId",),
+        body=frozenset({"defaultRulesEnabled", "rules"}),
+    ),
+    "getNetworkApplianceTrafficShapingRules": Operation(
+        "get",
+        "/networks/{networkId}/appliance/trafficShaping/rules",
+        ("appliance", "configure", "trafficShaping", "rules"),
+        ("networkId",),
+    ),
+    "getNetworkApplianceTrafficShapingUplinkBandwidth": Operation(
+        "get",
+        "/networks/{networkId}/appliance/trafficShaping/uplinkBandwidth",
+        ("appliance", "configure", "trafficShaping", "uplinkBandwidth"),
+        ("networkId",),
+    ),
+    "updateNetworkApplianceTrafficShapingUplinkBandwidth": Operation(
+        "put",
+        "/networks/{networkId}/appliance/trafficShaping/uplinkBandwidth",
+        ("appliance", "configure", "trafficShaping", "uplinkBandwidth"),
+        ("networkId",),
+        body=frozenset({"bandwidthLimits"}),
+    ),
+    "getNetworkApplianceTrafficShapingUplinkSelection": Operation(
+        "get",
+        "/networks/{networkId}/appliance/trafficShaping/uplinkSelection",
+        ("appliance", "configure", "trafficShaping", "uplinkSelection"),
+        ("networkId",),
+    ),
+    "updateNetworkApplianceTrafficShapingUplinkSelection": Operation(
+        "put",
+        "/networks/{networkId}/appliance/trafficShaping/uplinkSelection",
+        ("appliance", "configure", "trafficShaping", "uplinkSelection"),
+        ("networkId",),
+        body=frozenset(
+            {
+                "activeActiveAutoVpnEnabled",
+                "defaultUplink",
+                "loadBalancingEnabled",
+                "failoverAndFailback",
+                "wanTrafficUplinkPreferences",
+                "vpnTrafficUplinkPreferences",
+            }
+        ),
+    ),
+    "updateNetworkApplianceTrafficShapingVpnExclusions": Operation(
+        "put",
+        "/networks/{networkId}/appliance/trafficShaping/vpnExclusions",
+        ("appliance", "configure", "trafficShaping", "vpnExclusions"),
+        ("networkId",),
+        body=frozenset({"custom", "majorApplications"}),
+    ),
+    "connectNetworkApplianceUmbrellaAccount": Operation(
+        "post",
+        "/networks/{networkId}/appliance/umbrella/account/connect",
+        ("appliance", "configure", "umbrella", "account"),
+        ("networkId",),
+        arguments=("networkId", "api"),
+        body=frozenset({"api"}),
+    ),
+    "disconnectNetworkApplianceUmbrellaAccount": Operation(
+        "post",
+        "/networks/{networkId}/appliance/umbrella/account/disconnect",
+        ("appliance", "configure", "umbrella", "account"),
+        ("networkId",),
+    ),
+    "exclusionsNetworkApplianceUmbrellaDomains": Operation(
+        "put",
+        "/networks/{networkId}/appliance/umbrella/domains/exclusions",
+        ("appliance", "configure", "umbrella", "domains"),
+        ("networkId",),
+        arguments=("networkId", "domains"),
+        body=frozenset({"domains"}),
+    ),
+    "addNetworkApplianceUmbrellaPolicies": Operation(
+        "post",
+        "/networks/{networkId}/appliance/umbrella/policies/add",
+        ("appliance", "configure", "umbrella", "policies"),
+        ("networkId",),
+        arguments=("networkId", "policy"),
+        body=frozenset({"policy"}),
+    ),
+    "removeNetworkApplianceUmbrellaPolicies": Operation(
+        "post",
+        "/networks/{networkId}/appliance/umbrella/policies/remove",
+        ("appliance", "configure", "umbrella", "policies"),
+        ("networkId",),
+        arguments=("networkId", "policy"),
+        body=frozenset({"policy"}),
+    ),
+    "protectionNetworkApplianceUmbrella": Operation(
+        "put",
+        "/networks/{networkId}/appliance/umbrella/protection",
+        ("appliance", "configure", "umbrella"),
+        ("networkId",),
+        arguments=("networkId", "enabled"),
+        body=frozenset({"enabled"}),
+    ),
+    "updateNetworkApplianceUplinksNat": Operation(
+        "put",
+        "/networks/{networkId}/appliance/uplinks/nat",
+        ("appliance", "configure", "uplinks", "nat"),
+        ("networkId",),
+        arguments=("networkId", "uplinks"),
+        body=frozenset({"uplinks"}),
+    ),
+    "getNetworkApplianceUplinksUsageHistory": Operation(
+        "get",
+        "/networks/{networkId}/appliance/uplinks/usageHistory",
+        ("appliance", "monitor", "uplinks", "usageHistory"),
+        ("networkId",),
+        query=frozenset({"t0", "t1", "timespan", "resolution"}),
+    ),
+    "getNetworkApplianceVlans": Operation(
+        "get",
+        "/networks/{networkId}/appliance/vlans",
+        ("appliance", "configure", "vlans"),
+        ("networkId",),
+    ),
+    "createNetworkApplianceVlan": Operation(
+        "post",
+        "/networks/{networkId}/appliance/vlans",
+        ("appliance", "configure", "vlans"),
+        ("networkId",),
+        arguments=("networkId", "id", "name"),
+        body=frozenset(
+            {
+                "id",
+                "name",
+                "subnet",
+                "applianceIp",
+                "groupPolicyId",
+                "templateVlanType",
+                "cidr",
+                "mask",
+                "ipv6",
+                "dhcpHandling",
+                "dhcpRelayServerIps",
+                "dhcpLeaseTime",
+                "mandatoryDhcp",
+                "dhcpBootOptionsEnabled",
+                "dhcpBootNextServer",
+                "dhcpBootFilename",
+                "dhcpOptions",
+                "sgt",
+                "vrf",
+                "uplinks",
+            }
+        ),
+        enums={
+            "templateVlanType": ("same", "unique"),
+            "dhcpHandling": ("Do not respond to DHCP requests", "Relay DHCP to another server", "Run a DHCP server"),
+            "dhcpLeaseTime": ("1 day", "1 hour", "1 week", "12 hours", "30 minutes", "4 hours"),
+        },
+    ),
+    "getNetworkApplianceVlansSettings": Operation(
+        "get",
+        "/networks/{networkId}/appliance/vlans/settings",
+        ("appliance", "configure", "vlans", "settings"),
+        ("networkId",),
+    ),
+    "updateNetworkApplianceVlansSettings": Operation(
+        "put",
+        "/networks/{networkId}/appliance/vlans/settings",
+        ("appliance", "configure", "vlans", "settings"),
+        ("networkId",),
+        body=frozenset({"vlansEnabled"}),
+    ),
+    "getNetworkApplianceVlan": Operation(
+        "get",
+        "/networks/{networkId}/appliance/vlans/{vlanId}",
+        ("appliance", "configure", "vlans"),
+        ("networkId", "vlanId"),
+    ),
+    "updateNetworkApplianceVlan": Operation(
+        "put",
+        "/networks/{networkId}/appliance/vlans/{vlanId}",
+        ("appliance", "configure", "vlans"),
+        ("networkId", "vlanId"),
+        body=frozenset(
+            {
+                "name",
+                "subnet",
+                "applianceIp",
+                "groupPolicyId",
+                "vpnNatSubnet",
+                "dhcpHandling",
+                "dhcpRelayServerIps",
+                "dhcpLeaseTime",
+                "dhcpBootOptionsEnabled",
+                "dhcpBootNextServer",
+                "dhcpBootFilename",
+                "fixedIpAssignments",
+                "reservedIpRanges",
+                "dnsNameservers",
+                "dhcpOptions",
+                "templateVlanType",
+                "cidr",
+                "mask",
+                "ipv6",
+                "mandatoryDhcp",
+                "sgt",
+                "vrf",
+                "uplinks",
+            }
+        ),
+        enums={
+            "dhcpHandling": ("Do not respond to DHCP requests", "Relay DHCP to another server", "Run a DHCP server"),
+            "dhcpLeaseTime": ("1 day", "1 hour", "1 week", "12 hours", "30 minutes", "4 hours"),
+            "templateVlanType": ("same", "unique"),
+        },
+    ),
+    "deleteNetworkApplianceVlan": Operation(
+        "delete",
+        "/networks/{networkId}/appliance/vlans/{vlanId}",
+        ("appliance", "configure", "vlans"),
+        ("networkId", "vlanId"),
+    ),
+    "getNetworkApplianceVpnBgp": Operation(
+        "get",
+        "/networks/{networkId}/appliance/vpn/bgp",
+        ("appliance", "configure", "vpn", "bgp"),
+        ("networkId",),
+    ),
+    "updateNetworkApplianceVpnBgp": Operation(
+        "put",
+        "/networks/{networkId}/appliance/vpn/bgp",
+        ("appliance", "configure", "vpn", "bgp"),
+        ("networkId",),
+        arguments=("networkId", "enabled"),
+        body=frozenset({"enabled", "asNumber", "ibgpHoldTimer", "routerId", "neighbors"}),
+    ),
+    "getNetworkApplianceVpnSiteToSiteVpn": Operation(
+        "get",
+        "/networks/{networkId}/appliance/vpn/siteToSiteVpn",
+        ("appliance", "configure", "vpn", "siteToSiteVpn"),
+        ("networkId",),
+    ),
+    "updateNetworkApplianceVpnSiteToSiteVpn": Operation(
+        "put",
+        "/networks/{networkId}/appliance/vpn/siteToSiteVpn",
+        ("appliance", "configure", "vpn", "siteToSiteVpn"),
+        ("networkId",),
+        arguments=("networkId", "mode"),
+        body=frozenset({"mode", "hubs", "subnets", "sgt", "subnet", "hostTranslations"}),
+        enums={
+            "mode": ("hub", "none", "spoke"),
+        },
+    ),
+    "getNetworkApplianceWarmSpare": Operation(
+        "get",
+        "/networks/{networkId}/appliance/warmSpare",
+        ("appliance", "configure", "warmSpare"),
+        ("networkId",),
+    ),
+    "updateNetworkApplianceWarmSpare": Operation(
+        "put",
+        "/networks/{networkId}/appliance/warmSpare",
+        ("appliance", "configure", "warmSpare"),
+        ("networkId",),
+        arguments=("networkId", "enabled"),
+        body=frozenset({"enabled", "spareSerial", "uplinkMode", "virtualIp1", "virtualIp2"}),
+    ),
+    "swapNetworkApplianceWarmSpare": Operation(
+        "post",
+        "/networks/{networkId}/appliance/warmSpare/swap",
+        ("appliance", "configure", "warmSpare"),
+        ("networkId",),
+    ),
+    "getOrganizationApplianceDevicesInterfacesL3": Operation(
+        "get",
+        "/organizations/{organizationId}/appliance/devices/interfaces/l3",
+        ("appliance", "configure", "devices", "interfaces", "l3"),
+        ("organizationId",),
+        query=frozenset({"networkIds", "perPage", "startingAfter", "endingBefore"}),
+        array=frozenset({"networkIds"}),
+        paginated="next",
+    ),
+    "getOrganizationApplianceDevicesInterfacesPortsByDevice": Operation(
+        "get",
+        "/organizations/{organizationId}/appliance/devices/interfaces/ports/byDevice",
+        ("appliance", "configure", "devices", "interfaces", "ports", "byDevice"),
+        ("organizationId",),
+        query=frozenset({"serials", "interfaces", "numbers"}),
+        array=frozenset({"serials", "interfaces", "numbers"}),
+    ),
+    "getOrganizationApplianceDevicesPortsTransceiversReadingsHistoryByDevice": Operation(
+        "get",
+        "/organizations/{organizationId}/appliance/devices/ports/transceivers/readings/history/byDevice",
+        ("appliance", "monitor", "devices", "ports", "transceivers", "readings", "history", "byDevice"),
+        ("organizationId",),
+        query=frozenset(
+            {
+                "perPage",
+                "startingAfter",
+                "endingBefore",
+                "t0",
+                "t1",
+                "timespan",
+                "interval",
+                "networkIds",
+                "serials",
+                "portIds",
+            }
+        ),
+        array=frozenset({"networkIds", "serials", "portIds"}),
+        paginated="next",
+    ),
+    "getOrganizationApplianceDevicesRedundancyByNetwork": Operation(
+        "get",
+        "/organizations/{organizationId}/appliance/devices/redundancy/byNetwork",
+        ("appliance", "configure", "devices", "redundancy", "byNetwork"),
+        ("organizationId",),
+        query=frozenset({"perPage", "startingAfter", "endingBefore"}),
+        paginated="next",
+    ),
+    "getOrganizationApplianceDnsLocalProfiles": Operation(
+        "get",
+        "/organizations/{organizationId}/appliance/dns/local/profiles",
+        ("appliance", "configure", "dns", "local", "profiles"),
+        ("organizationId",),
+        query=frozenset({"profileIds"}),
+        array=frozenset({"profileIds"}),
+    ),
+    "createOrganizationApplianceDnsLocalProfile": Operation(
+        "post",
+        "/organizations/{organizationId}/appliance/dns/local/profiles",
+        ("appliance", "configure", "dns", "local", "profiles"),
+        ("organizationId",),
+        arguments=("organizationId", "name"),
+        body=frozenset({"name"}),
+    ),
+    "getOrganizationApplianceDnsLocalProfilesAssignments": Operation(
+        "get",
+        "/organizations/{organizationId}/appliance/dns/local/profiles/assignments",
+        ("appliance", "configure", "dns", "local", "profiles", "assignments"),
+        ("organizationId",),
+        query=frozenset({"profileIds", "networkIds"}),
+        array=frozenset({"profileIds", "networkIds"}),
+    ),
+    "bulkOrganizationApplianceDnsLocalProfilesAssignmentsCreate": Operation(
+        "post",
+        "/organizations/{organizationId}/appliance/dns/local/profiles/assignments/bulkCreate",
+        ("appliance", "configure", "dns", "local", "profiles", "assignments"),
+        ("organizationId",),
+        arguments=("organizationId", "items"),
+        body=frozenset({"items"}),
+    ),
+    "createOrganizationApplianceDnsLocalProfilesAssignmentsBulkDelete": Operation(
+        "post",
+        "/organizations/{organizationId}/appliance/dns/local/profiles/assignments/bulkDelete",
+        ("appliance", "configure", "dns", "local", "profiles", "assignments", "bulkDelete"),
+        ("organizationId",),
+        arguments=("organizationId", "items"),
+        body=frozenset({"items"}),
+    ),
+    "updateOrganizationApplianceDnsLocalProfile": Operation(
+        "put",
+        "/organizations/{organizationId}/appliance/dns/local/profiles/{profileId}",
+        ("appliance", "configure", "dns", "local", "profiles"),
+        ("organizationId", "profileId"),
+        arguments=("organizationId", "profileId", "name"),
+        body=frozenset({"name"}),
+    ),
+    "deleteOrganizationApplianceDnsLocalProfile": Operation(
+        "delete",
+        "/organizations/{organizationId}/appliance/dns/local/profiles/{profileId}",
+        ("appliance", "configure", "dns", "local", "profiles"),
+        ("organizationId", "profileId"),
+    ),
+    "getOrganizationApplianceDnsLocalRecords": Operation(
+        "get",
+        "/organizations/{organizationId}/appliance/dns/local/records",
+        ("appliance", "configure", "dns", "local", "records"),
+        ("organizationId",),
+        query=frozenset({"profileIds"}),
+        array=frozenset({"profileIds"}),
+    ),
+    "createOrganizationApplianceDnsLocalRecord": Operation(
+        "post",
+        "/organizations/{organizationId}/appliance/dns/local/records",
+        ("appliance", "configure", "dns", "local", "records"),
+        ("organizationId",),
+        arguments=("organizationId", "hostname", "address", "profile"),
+        body=frozenset({"hostname", "address", "profile"}),
+    ),
+    "updateOrganizationApplianceDnsLocalRecord": Operation(
+        "put",
+        "/organizations/{organizationId}/appliance/dns/local/records/{recordId}",
+        ("appliance", "configure", "dns", "local", "records"),
+        ("organizationId", "recordId"),
+        body=frozenset({"hostname", "address", "profile"}),
+    ),
+    "deleteOrganizationApplianceDnsLocalRecord": Operation(
+        "delete",
+        "/organizations/{organizationId}/appliance/dns/local/records/{recordId}",
+        ("appliance", "configure", "dns", "local", "records"),
+        ("organizationId", "recordId"),
+    ),
+    "getOrganizationApplianceDnsSplitProfiles": Operation(
+        "get",
+        "/organizations/{organizationId}/appliance/dns/split/profiles",
+        ("appliance", "configure", "dns", "split", "profiles"),
+        ("organizationId",),
+        query=frozenset({"profileIds"}),
+        array=frozenset({"profileIds"}),
+    ),
+    "createOrganizationApplianceDnsSplitProfile": Operation(
+        "post",
+        "/organizations/{organizationId}/appliance/dns/split/profiles",
+        ("appliance", "configure", "dns", "split", "profiles"),
+        ("organizationId",),
+        arguments=("organizationId", "name", "hostnames", "nameservers"),
+        body=frozenset({"name", "hostnames", "nameservers"}),
+    ),
+    "getOrganizationApplianceDnsSplitProfilesAssignments": Operation(
+        "get",
+        "/organizations/{organizationId}/appliance/dns/split/profiles/assignments",
+        ("appliance", "configure", "dns", "split", "profiles", "assignments"),
+        ("organizationId",),
+        query=frozenset({"profileIds", "networkIds"}),
+        array=frozenset({"profileIds", "networkIds"}),
+    ),
+    "createOrganizationApplianceDnsSplitProfilesAssignmentsBulkCreate": Operation(
+        "post",
+        "/organizations/{organizationId}/appliance/dns/split/profiles/assignments/bulkCreate",
+        ("appliance", "configure", "dns", "split", "profiles", "assignments", "bulkCreate"),
+        ("organizationId",),
+        arguments=("organizationId", "items"),
+        body=frozenset({"items"}),
+    ),
+    "createOrganizationApplianceDnsSplitProfilesAssignmentsBulkDelete": Operation(
+        "post",
+        "/organizations/{organizationId}/appliance/dns/split/profiles/assignments/bulkDelete",
+        ("appliance", "configure", "dns", "split", "profiles", "assignments", "bulkDelete"),
+        ("organizationId",),
+        arguments=("organizationId", "items"),
+        body=frozenset({"items"}),
+    ),
+    "updateOrganizationApplianceDnsSplitProfile": Operation(
+        "put",
+        "/organizations/{organizationId}/appliance/dns/split/profiles/{profileId}",
+        ("appliance", "configure", "dns", "split", "profiles"),
+        ("organizationId", "profileId"),
+        body=frozenset({"name", "hostnames", "nameservers"}),
+    ),
+    "deleteOrganizationApplianceDnsSplitProfile": Operation(
+        "delete",
+        "/organizations/{organizationId}/appliance/dns/split/profiles/{profileId}",
+        ("appliance", "configure", "dns", "split", "profiles"),
+        ("organizationId", "profileId"),
+    ),
+    "getOrganizationApplianceFirewallMulticastForwardingByNetwork": Operation(
+        "get",
+        "/organizations/{organizationId}/appliance/firewall/multicastForwarding/byNetwork",
+        ("appliance", "configure", "firewall", "multicastForwarding", "byNetwork"),
+        ("organizationId",),
+        query=frozenset({"perPage", "startingAfter", "endingBefore", "networkIds"}),
+        array=frozenset({"networkIds"}),
+        paginated="next",
+    ),
+    "getOrganizationApplianceInterfacesPacketsOverviewsByDevice": Operation(
+        "get",
+        "/organizations/{organizationId}/appliance/interfaces/packets/overviews/byDevice",
+        ("appliance", "monitor", "interfaces", "packets", "overviews", "byDevice"),
+        ("organizationId",),
+        query=frozenset({"t0", "t1", "timespan", "perPage", "startingAfter", "endingBefore", "networkIds", "serials"}),
+        array=frozenset({"networkIds", "serials"}),
+        paginated="next",
+    ),
+    "getOrganizationApplianceRoutingVrfsSettings": Operation(
+        "get",
+        "/organizations/{organizationId}/appliance/routing/vrfs/settings",
+        ("appliance", "configure", "routing", "vrfs", "settings"),
+        ("organizationId",),
+    ),
+    "updateOrganizationApplianceRoutingVrfsSettings": Operation(
+        "put",
+        "/organizations/{organizationId}/appliance/routing/vrfs/settings",
+        ("appliance", "configure", "routing", "vrfs", "settings"),
+        ("organizationId",),
+        arguments=("organizationId", "enabled"),
+        body=frozenset({"enabled"}),
+    ),
+    "getOrganizationApplianceSecurityEvents": Operation(
+        "get",
+        "/organizations/{organizationId}/appliance/security/events",
+        ("appliance", "monitor", "security", "events"),
+        ("organizationId",),
+        query=frozenset({"t0", "t1", "timespan", "perPage", "startingAfter", "endingBefore", "sortOrder"}),
+        paginated="next",
+        enums={
+            "sortOrder": ("ascending", "descending"),
+        },
+    ),
+    "getOrganizationApplianceSecurityIntrusion": Operation(
+        "get",
+        "/organizations/{organizationId}/appliance/security/intrusion",
+        ("appliance", "configure", "security", "intrusion"),
+        ("organizationId",),
+    ),
+    "updateOrganizationApplianceSecurityIntrusion": Operation(
+        "put",
+        "/organizations/{organizationId}/appliance/security/intrusion",
+        ("appliance", "configure", "security", "intrusion"),
+        ("organizationId",),
+        arguments=("organizationId", "allowedRules"),
+        body=frozenset({"allowedRules"}),
+    ),
+    "getOrganizationApplianceTrafficShapingVpnExclusionsByNetwork": Operation(
+        "get",
+        "/organizations/{organizationId}/appliance/trafficShaping/vpnExclusions/byNetwork",
+        ("appliance", "configure", "trafficShaping", "vpnExclusions", "byNetwork"),
+        ("organizationId",),
+        query=frozenset({"perPage", "startingAfter", "endingBefore", "networkIds"}),
+        array=frozenset({"networkIds"}),
+        paginated="next",
+    ),
+    "getOrganizationApplianceUplinkStatuses": Operation(
+        "get",
+        "/organizations/{organizationId}/appliance/uplink/statuses",
+        ("appliance", "monitor", "uplinks", "statuses"),
+        ("organizationId",),
+        query=frozenset({"perPage", "startingAfter", "endingBefore", "networkIds", "serials", "iccids"}),
+        array=frozenset({"networkIds", "serials", "iccids"}),
+        paginated="next",
+    ),
+    "getOrganizationApplianceUplinksNatByNetwork": Operation(
+        "get",
+        "/organizations/{organizationId}/appliance/uplinks/nat/byNetwork",
+        ("appliance", "configure", "uplinks", "nat", "byNetwork"),
+        ("organizationId",),
+        query=frozenset({"networkIds", "interfaces", "perPage", "startingAfter", "endingBefore"}),
+        array=frozenset({"networkIds", "interfaces"}),
+        paginated="next",
+    ),
+    "getOrganizationApplianceUplinksStatusesOverview": Operation(
+        "get",
+        "/organizations/{organizationId}/appliance/uplinks/statuses/overview",
+        ("appliance", "monitor", "uplinks", "statuses", "overview"),
+        ("organizationId",),
+        query=frozenset({"networkIds"}),
+        array=frozenset({"networkIds"}),
+    ),
+    "getOrganizationApplianceUplinksUsageByNetwork": Operation(
+        "get",
+        "/organizations/{organizationId}/appliance/uplinks/usage/byNetwork",
+        ("appliance", "monitor", "uplinks", "usage", "byNetwork"),
+        ("organizationId",),
+        query=frozenset({"t0", "t1", "timespan"}),
+    ),
+    "getOrganizationApplianceVpnSiteToSiteIpsecPeersSlas": Operation(
+        "get",
+        "/organizations/{organizationId}/appliance/vpn/siteToSite/ipsec/peers/slas",
+        ("appliance", "configure", "vpn", "siteToSite", "ipsec", "peers", "slas"),
+        ("organizationId",),
+    ),
+    "updateOrganizationApplianceVpnSiteToSiteIpsecPeersSlas": Operation(
+        "put",
+        "/organizations/{organizationId}/appliance/vpn/siteToSite/ipsec/peers/slas",
+        ("appliance", "configure", "vpn", "siteToSite", "ipsec", "peers", "slas"),
+        ("organizationId",),
+        body=frozenset({"items"}),
+    ),
+    "getOrganizationApplianceVpnStats": Operation(
+        "get",
+        "/organizations/{organizationId}/appliance/vpn/stats",
+        ("appliance", "monitor", "vpn", "stats"),
+        ("organizationId",),
+        query=frozenset({"perPage", "startingAfter", "endingBefore", "networkIds", "t0", "t1", "timespan"}),
+        array=frozenset({"networkIds"}),
+        paginated="next",
+    ),
+    "getOrganizationApplianceVpnStatuses": Operation(
+        "get",
+        "/organizations/{organizationId}/appliance/vpn/statuses",
+        ("appliance", "monitor", "vpn", "statuses"),
+        ("organizationId",),
+        query=frozenset({"perPage", "startingAfter", "endingBefore", "networkIds"}),
+        array=frozenset({"networkIds"}),
+        paginated="next",
+    ),
+    "getOrganizationApplianceVpnThirdPartyVPNPeers": Operation(
+        "get",
+        "/organizations/{organizationId}/appliance/vpn/thirdPartyVPNPeers",
+        ("appliance", "configure", "vpn", "thirdPartyVPNPeers"),
+        ("organizationId",),
+    ),
+    "updateOrganizationApplianceVpnThirdPartyVPNPeers": Operation(
+        "put",
+        "/organizations/{organizationId}/appliance/vpn/thirdPartyVPNPeers",
+        ("appliance", "configure", "vpn", "thirdPartyVPNPeers"),
+        ("organizationId",),
+        arguments=("organizationId", "peers"),
+        body=frozenset({"peers"}),
+    ),
+    "getOrganizationApplianceVpnVpnFirewallRules": Operation(
+        "get",
+        "/organizations/{organizationId}/appliance/vpn/vpnFirewallRules",
+        ("appliance", "configure", "vpn", "vpnFirewallRules"),
+        ("organizationId",),
+    ),
+    "updateOrganizationApplianceVpnVpnFirewallRules": Operation(
+        "put",
+        "/organizations/{organizationId}/appliance/vpn/vpnFirewallRules",
+        ("appliance", "configure", "vpn", "vpnFirewallRules"),
+        ("organizationId",),
+        body=frozenset({"rules", "syslogDefaultRule"}),
+    ),
+    "assignOrganizationPoliciesGlobalGroupPoliciesApplianceVlans": Operation(
+        "post",
+        "/organizations/{organizationId}/policies/global/group/policies/appliance/vlans/assign",
+        ("appliance", "configure", "policies", "global", "group", "vlans"),
+        ("organizationId",),
+        arguments=("organizationId", "policy", "vlans"),
+        body=frozenset({"policy", "vlans"}),
+    ),
+    "getOrganizationPoliciesGlobalGroupPoliciesApplianceVlansAssignments": Operation(
+        "get",
+        "/organizations/{organizationId}/policies/global/group/policies/appliance/vlans/assignments",
+        ("appliance", "configure", "policies", "global", "group", "vlans", "assignments"),
+        ("organizationId",),
+        query=frozenset({"assignmentIds", "policyIds", "interfaceIds", "perPage", "startingAfter", "endingBefore"}),
+        array=frozenset({"assignmentIds", "policyIds", "interfaceIds"}),
+        paginated="next",
+    ),
+    "getOrganizationPoliciesGlobalGroupPoliciesApplianceVlansAssignmentsByVlan": Operation(
+        "get",
+        "/organizations/{organizationId}/policies/global/group/policies/appliance/vlans/assignments/byVlan",
+        ("appliance", "configure", "policies", "global", "group", "vlans", "assignments", "byVlan"),
+        ("organizationId",),
+        query=frozenset({"search", "vlanIds", "interfaceIds", "perPage", "startingAfter", "endingBefore"}),
+        array=frozenset({"vlanIds", "interfaceIds"}),
+        paginated="next",
+    ),
+    "removeOrganizationPoliciesGlobalGroupPoliciesApplianceVlans": Operation(
+        "post",
+        "/organizations/{organizationId}/policies/global/group/policies/appliance/vlans/remove",
+        ("appliance", "configure", "policies", "global", "group", "vlans"),
+        ("organizationId",),
+        arguments=("organizationId", "policy", "vlans"),
+        body=frozenset({"policy", "vlans"}),
+    ),
+    "getDeviceCameraAnalyticsLive": Operation(
+        "get",
+        "/devices/{serial}/camera/analytics/live",
+        ("camera", "monitor", "analytics", "live"),
+        ("serial",),
+    ),
+    "getDeviceCameraAnalyticsOverview": Operation(
+        "get",
+        "/devices/{serial}/camera/analytics/overview",
+        ("camera", "monitor", "analytics", "overview"),
+        ("serial",),
+        query=frozenset({"t0", "t1", "timespan", "objectType"}),
+        enums={
+            "objectType": ("person", "vehicle"),
+        },
+    ),
+    "getDeviceCameraAnalyticsRecent": Operation(
+        "get",
+        "/devices/{serial}/camera/analytics/recent",
+        ("camera", "monitor", "analytics", "recent"),
+        ("serial",),
+        query=frozenset({"objectType"}),
+        enums={
+            "objectType": ("person", "vehicle"),
+        },
+    ),
+    "getDeviceCameraAnalyticsZones": Operation(
+        "get",
+        "/devices/{serial}/camera/analytics/zones",
+        ("camera", "monitor", "analytics", "zones"),
+        ("serial",),
+    ),
+    "getDeviceCameraAnalyticsZoneHistory": Operation(
+        "get",
+        "/devices/{serial}/camera/analytics/zones/{zoneId}/history",
+        ("camera", "monitor", "analytics", "zones", "history"),
+        ("serial", "zoneId"),
+        query=frozenset({"t0", "t1", "timespan", "resolution", "objectType"}),
+        enums={
+            "objectType": ("person", "vehicle"),
+        },
+    ),
+    "clipDeviceCamera": Operation(
+        "get",
+        "/devices/{serial}/camera/clip",
+        ("camera", "monitor"),
+        ("serial",),
+        arguments=("serial", "startTimestamp", "endTimestamp"),
+        query=frozenset({"startTimestamp", "endTimestamp", "imagerId"}),
+    ),
+    "getDeviceCameraCustomAnalytics": Operation(
+        "get",
+        "/devices/{serial}/camera/customAnalytics",
+        ("camera", "configure", "customAnalytics"),
+        ("serial",),
+    ),
+    "updateDeviceCameraCustomAnalytics": Operation(
+        "put",
+        "/devices/{serial}/camera/customAnalytics",
+        ("camera", "configure", "customAnalytics"),
+        ("serial",),
+        body=frozenset({"enabled", "artifactId", "parameters"}),
+    ),
+    "generateDeviceCameraSnapshot": Operation(
+        "post",
+        "/devices/{serial}/camera/generateSnapshot",
+        ("camera", "monitor"),
+        ("serial",),
+        body=frozenset({"timestamp", "fullframe"}),
+    ),
+    "getDeviceCameraQualityAndRetention": Operation(
+        "get",
+        "/devices/{serial}/camera/qualityAndRetention",
+        ("camera", "configure", "qualityAndRetention"),
+        ("serial",),
+    ),
+    "updateDeviceCameraQualityAndRetention": Operation(
+        "put",
+        "/devices/{serial}/camera/qualityAndRetention",
+        ("camera", "configure", "qualityAndRetention"),
+        ("serial",),
+        body=frozenset(
+            {
+                "profileId",
+                "motionBasedRetentionEnabled",
+                "audioRecordingEnabled",
+                "restrictedBandwidthModeEnabled",
+                "quality",
+                "resolution",
+                "motionDetectorVersion",
+            }
+        ),
+        enums={
+            "quality": ("Enhanced", "High", "Standard", "Ultra"),
+            "resolution": ("1080x1080", "1280x720", "1920x1080", "2112x2112", "2688x1512", "2880x2880", "3840x2160"),
+            "motionDetectorVersion": (1, 2),
+        },
+    ),
+    "getDeviceCameraSense": Operation(
+        "get",
+        "/devices/{serial}/camera/sense",
+        ("camera", "configure", "sense"),
+        ("serial",),
+    ),
+    "updateDeviceCameraSense": Operation(
+        "put",
+        "/devices/{serial}/camera/sense",
+        ("camera", "configure", "sense"),
+        ("serial",),
+        body=frozenset({"senseEnabled", "mqttBrokerId", "audioDetection", "detectionModelId"}),
+    ),
+    "getDeviceCameraSenseObjectDetectionModels": Operation(
+        "get",
+        "/devices/{serial}/camera/sense/objectDetectionModels",
+        ("camera", "configure", "sense", "objectDetectionModels"),
+        ("serial",),
+    ),
+    "getDeviceCameraVideoSettings": Operation(
+        "get",
+        "/devices/{serial}/camera/video/settings",
+        ("camera", "configure", "video", "settings"),
+        ("serial",),
+    ),
+    "updateDeviceCameraVideoSettings": Operation(
+        "put",
+        "/devices/{serial}/camera/video/settings",
+        ("camera", "configure", "video", "settings"),
+        ("serial",),
+        body=frozenset({"externalRtspEnabled"}),
+    ),
+    "getDeviceCameraVideoLink": Operation(
+        "get",
+        "/devices/{serial}/camera/videoLink",
+        ("camera", "configure", "videoLink"),
+        ("serial",),
+        query=frozenset({"timestamp"}),
+    ),
+    "getDeviceCameraWirelessProfiles": Operation(
+        "get",
+        "/devices/{serial}/camera/wirelessProfiles",
+        ("camera", "configure", "wirelessProfiles"),
+        ("serial",),
+    ),
+    "updateDeviceCameraWirelessProfiles": Operation(
+        "put",
+        "/devices/{serial}/camera/wirelessProfiles",
+        ("camera", "configure", "wirelessProfiles"),
+        ("serial",),
+        arguments=("serial", "ids"),
+        body=frozenset({"ids"}),
+    ),
+    "getNetworkCameraQualityRetentionProfiles": Operation(
+        "get",
+        "/networks/{networkId}/camera/qualityRetentionProfiles",
+        ("camera", "configure", "qualityRetentionProfiles"),
+        ("networkId",),
+    ),
+    "createNetworkCameraQualityRetentionProfile": Operation(
+        "post",
+        "/networks/{networkId}/camera/qualityRetentionProfiles",
+        ("camera", "configure", "qualityRetentionProfiles"),
+        ("networkId",),
+        arguments=("networkId", "name"),
+        body=frozenset(
+            {
+                "name",
+                "motionBasedRetentionEnabled",
+                "restrictedBandwidthModeEnabled",
+                "audioRecordingEnabled",
+                "cloudArchiveEnabled",
+                "motionDetectorVersion",
+                "smartRetention",
+                "scheduleId",
+                "maxRetentionDays",
+                "videoSettings",
+            }
+        ),
+    ),
+    "getNetworkCameraQualityRetentionProfile": Operation(
+        "get",
+        "/networks/{networkId}/camera/qualityRetentionProfiles/{qualityRetentionProfileId}",
+        ("camera", "configure", "qualityRetentionProfiles"),
+        ("networkId", "qualityRetentionProfileId"),
+    ),
+    "updateNetworkCameraQualityRetentionProfile": Operation(
+        "put",
+        "/networks/{networkId}/camera/qualityRetentionProfiles/{qualityRetentionProfileId}",
+        ("camera", "configure", "qualityRetentionProfiles"),
+        ("networkId", "qualityRetentionProfileId"),
+        body=frozenset(
+            {
+                "name",
+                "motionBasedRetentionEnabled",
+                "restrictedBandwidthModeEnabled",
+                "audioRecordingEnabled",
+                "cloudArchiveEnabled",
+                "motionDetectorVersion",
+                "smartRetention",
+                "scheduleId",
+                "maxRetentionDays",
+                "videoSettings",
+            }
+        ),
+    ),
+    "deleteNetworkCameraQualityRetentionProfile": Operation(
+        "delete",
+        "/networks/{networkId}/camera/qualityRetentionProfiles/{qualityRetentionProfileId}",
+        ("camera", "configure", "qualityRetentionProfiles"),
+        ("networkId", "qualityRetentionProfileId"),
+    ),
+    "getNetworkCameraSchedules": Operation(
+        "get",
+        "/networks/{networkId}/camera/schedules",
+        ("camera", "configure", "schedules"),
+        ("networkId",),
+    ),
+    "createNetworkCameraWirelessProfile": Operation(
+        "post",
+        "/networks/{networkId}/camera/wirelessProfiles",
+        ("camera", "configure", "wirelessProfiles"),
+        ("networkId",),
+        arguments=("networkId", "name", "ssid"),
+        body=frozenset({"name", "ssid", "identity"}),
+    ),
+    "getNetworkCameraWirelessProfiles": Operation(
+        "get",
+        "/networks/{networkId}/camera/wirelessProfiles",
+        ("camera", "configure", "wirelessProfiles"),
+        ("networkId",),
+    ),
+    "getNetworkCameraWirelessProfile": Operation(
+        "get",
+        "/networks/{networkId}/camera/wirelessProfiles/{wirelessProfileId}",
+        ("camera", "configure", "wirelessProfiles"),
+        ("networkId", "wirelessProfileId"),
+    ),
+    "updateNetworkCameraWirelessProfile": Operation(
+        "put",
+        "/networks/{networkId}/camera/wirelessProfiles/{wirelessProfileId}",
+        ("camera", "configure", "wirelessProfiles"),
+        ("networkId", "wirelessProfileId"),
+        body=frozenset({"name", "ssid", "identity"}),
+    ),
+    "deleteNetworkCameraWirelessProfile": Operation(
+        "delete",
+        "/networks/{networkId}/camera/wirelessProfiles/{wirelessProfileId}",
+        ("camera", "configure", "wirelessProfiles"),
+        ("networkId", "wirelessProfileId"),
+    ),
+    "getOrganizationCameraBoundariesAreasByDevice": Operation(
+        "get",
+        "/organizations/{organizationId}/camera/boundaries/areas/byDevice",
+        ("camera", "configure", "boundaries", "areas", "byDevice"),
+        ("organizationId",),
+        query=frozenset({"serials"}),
+        array=frozenset({"serials"}),
+    ),
+    "getOrganizationCameraBoundariesLinesByDevice": Operation(
+        "get",
+        "/organizations/{organizationId}/camera/boundaries/lines/byDevice",
+        ("camera", "configure", "boundaries", "lines", "byDevice"),
+        ("organizationId",),
+        query=frozenset({"serials"}),
+        array=frozenset({"serials"}),
+    ),
+    "getOrganizationCameraCustomAnalyticsArtifacts": Operation(
+        "get",
+        "/organizations/{organizationId}/camera/customAnalytics/artifacts",
+        ("camera", "configure", "customAnalytics", "artifacts"),
+        ("organizationId",),
+    ),
+    "createOrganizationCameraCustomAnalyticsArtifact": Operation(
+        "post",
+        "/organizations/{organizationId}/camera/customAnalytics/artifacts",
+        ("camera", "configure", "customAnalytics", "artifacts"),
+        ("organizationId",),
+        body=frozenset({"name"}),
+    ),
+    "getOrganizationCameraCustomAnalyticsArtifact": Operation(
+        "get",
+        "/organizations/{organizationId}/camera/customAnalytics/artifacts/{artifactId}",
+        ("camera", "configure", "customAnalytics", "artifacts"),
+        ("organizationId", "artifactId"),
+    ),
+    "deleteOrganizationCameraCustomAnalyticsArtifact": Operation(
+        "delete",
+        "/organizations/{organizationId}/camera/customAnalytics/artifacts/{artifactId}",
+        ("camera", "configure", "customAnalytics", "artifacts"),
+        ("organizationId", "artifactId"),
+    ),
+    "getOrganizationCameraDetectionsHistoryByBoundaryByInterval": Operation(
+        "get",
+        "/organizations/{organizationId}/camera/detections/history/byBoundary/byInterval",
+        ("camera", "configure", "detections", "history", "byBoundary", "byInterval"),
+        ("organizationId",),
+        arguments=("organizationId", "boundaryIds", "ranges"),
+        query=frozenset({"boundaryIds", "ranges", "duration", "perPage", "boundaryTypes"}),
+        array=frozenset({"boundaryIds", "ranges", "boundaryTypes"}),
+        paginated="next",
+    ),
+    "getOrganizationCameraOnboardingStatuses": Operation(
+        "get",
+        "/organizations/{organizationId}/camera/onboarding/statuses",
+        ("camera", "configure", "onboarding", "statuses"),
+        ("organizationId",),
+        query=frozenset({"serials", "networkIds"}),
+        array=frozenset({"serials", "networkIds"}),
+    ),
+    "updateOrganizationCameraOnboardingStatuses": Operation(
+        "put",
+        "/organizations/{organizationId}/camera/onboarding/statuses",
+        ("camera", "configure", "onboarding", "statuses"),
+        ("organizationId",),
+        body=frozenset({"serial", "wirelessCredentialsSent"}),
+    ),
+    "getOrganizationCameraPermissions": Operation(
+        "get",
+        "/organizations/{organizationId}/camera/permissions",
+        ("camera", "configure", "permissions"),
+        ("organizationId",),
+    ),
+    "getOrganizationCameraPermission": Operation(
+        "get",
+        "/organizations/{organizationId}/camera/permissions/{permissionScopeId}",
+        ("camera", "configure", "permissions"),
+        ("organizationId", "permissionScopeId"),
+    ),
+    "getOrganizationCameraRoles": Operation(
+        "get",
+        "/organizations/{organizationId}/camera/roles",
+        ("camera", "configure", "roles"),
+        ("organizationId",),
+    ),
+    "createOrganizationCameraRole": Operation(
+        "post",
+        "/organizations/{organizationId}/camera/roles",
+        ("camera", "configure", "roles"),
+        ("organizationId",),
+        arguments=("organizationId", "name"),
+        body=frozenset({"name", "appliedOnDevices", "appliedOnNetworks", "appliedOrgWide"}),
+    ),
+    "getOrganizationCameraRole": Operation(
+        "get",
+        "/organizations/{organizationId}/camera/roles/{roleId}",
+        ("camera", "configure", "roles"),
+        ("organizationId", "roleId"),
+    ),
+    "deleteOrganizationCameraRole": Operation(
+        "delete",
+        "/organizations/{organizationId}/camera/roles/{roleId}",
+        ("camera", "configure", "roles"),
+        ("organizationId", "roleId"),
+    ),
+    "updateOrganizationCameraRole": Operation(
+        "put",
+        "/organizations/{organizationId}/camera/roles/{roleId}",
+        ("camera", "configure", "roles"),
+        ("organizationId", "roleId"),
+        body=frozenset({"name", "appliedOnDevices", "appliedOnNetworks", "appliedOrgWide"}),
+    ),
+    "getDeviceCellularGatewayLan": Operation(
+        "get",
+        "/devices/{serial}/cellularGateway/lan",
+        ("cellularGateway", "configure", "lan"),
+        ("serial",),
+    ),
+    "updateDeviceCellularGatewayLan": Operation(
+        "put",
+        "/devices/{serial}/cellularGateway/lan",
+        ("cellularGateway", "configure", "lan"),
+        ("serial",),
+        body=frozenset({"reservedIpRanges", "fixedIpAssignments"}),
+    ),
+    "getDeviceCellularGatewayPortForwardingRules": Operation(
+        "get",
+        "/devices/{serial}/cellularGateway/portForwardingRules",
+        ("cellularGateway", "configure", "portForwardingRules"),
+        ("serial",),
+    ),
+    "updateDeviceCellularGatewayPortForwardingRules": Operation(
+        "put",
+        "/devices/{serial}/cellularGateway/portForwardingRules",
+        ("cellularGateway", "configure", "portForwardingRules"),
+        ("serial",),
+        body=frozenset({"rules"}),
+    ),
+    "getNetworkCellularGatewayConnectivityMonitoringDestinations": Operation(
+        "get",
+        "/networks/{networkId}/cellularGateway/connectivityMonitoringDestinations",
+        ("cellularGateway", "configure", "connectivityMonitoringDestinations"),
+        ("networkId",),
+    ),
+    "updateNetworkCellularGatewayConnectivityMonitoringDestinations": Operation(
+        "put",
+        "/networks/{networkId}/cellularGateway/connectivityMonitoringDestinations",
+        ("cellularGateway", "configure", "connectivityMonitoringDestinations"),
+        ("networkId",),
+        body=frozenset({"destinations"}),
+    ),
+    "getNetworkCellularGatewayDhcp": Operation(
+        "get",
+        "/networks/{networkId}/cellularGateway/dhcp",
+        ("cellularGateway", "configure", "dhcp"),
+        ("networkId",),
+    ),
+    "updateNetworkCellularGatewayDhcp": Operation(
+        "put",
+        "/networks/{networkId}/cellularGateway/dhcp",
+        ("cellularGateway", "configure", "dhcp"),
+        ("networkId",),
+        body=frozenset({"dhcpLeaseTime", "dnsNameservers", "dnsCustomNameservers"}),
+    ),
+    "getNetworkCellularGatewaySubnetPool": Operation(
+        "get",
+        "/networks/{networkId}/cellularGateway/subnetPool",
+        ("cellularGateway", "configure", "subnetPool"),
+        ("networkId",),
+    ),
+    "updateNetworkCellularGatewaySubnetPool": Operation(
+        "put",
+        "/networks/{networkId}/cellularGateway/subnetPool",
+        ("cellularGateway", "configure", "subnetPool"),
+        ("networkId",),
+        body=frozenset({"mask", "cidr"}),
+    ),
+    "getNetworkCellularGatewayUplink": Operation(
+        "get",
+        "/networks/{networkId}/cellularGateway/uplink",
+        ("cellularGateway", "configure", "uplink"),
+        ("networkId",),
+    ),
+    "updateNetworkCellularGatewayUplink": Operation(
+        "put",
+        "/networks/{networkId}/cellularGateway/uplink",
+        ("cellularGateway", "configure", "uplink"),
+        ("networkId",),
+        body=frozenset({"bandwidthLimits"}),
+    ),
+    "getOrganizationCellularGatewayEsimsInventory": Operation(
+        "get",
+        "/organizations/{organizationId}/cellularGateway/esims/inventory",
+        ("cellularGateway", "configure", "esims", "inventory"),
+        ("organizationId",),
+        query=frozenset({"eids"}),
+        array=frozenset({"eids"}),
+    ),
+    "updateOrganizationCellularGatewayEsimsInventory": Operation(
+        "put",
+        "/organizations/{organizationId}/cellularGateway/esims/inventory/{id}",
+        ("cellularGateway", "configure", "esims", "inventory"),
+        ("organizationId", "id"),
+        body=frozenset({"status"}),
+    ),
+    "getOrganizationCellularGatewayEsimsServiceProviders": Operation(
+        "get",
+        "/organizations/{organizationId}/cellularGateway/esims/serviceProviders",
+        ("cellularGateway", "configure", "esims", "serviceProviders"),
+        ("organizationId",),
+    ),
+    "getOrganizationCellularGatewayEsimsServiceProvidersAccounts": Operation(
+        "get",
+        "/organizations/{organizationId}/cellularGateway/esims/serviceProviders/accounts",
+        ("cellularGateway", "configure", "esims", "serviceProviders", "accounts"),
+        ("organizationId",),
+        query=frozenset({"accountIds"}),
+        array=frozenset({"accountIds"}),
+    ),
+    "createOrganizationCellularGatewayEsimsServiceProvidersAccount": Operation(
+        "post",
+        "/organizations/{organizationId}/cellularGateway/esims/serviceProviders/accounts",
+        ("cellularGateway", "configure", "esims", "serviceProviders", "accounts"),
+        ("organizationId",),
+        arguments=("organizationId", "accountId", "apiKey", "serviceProvider", "title", "username"),
+        body=frozenset({"accountId", "apiKey", "serviceProvider", "title", "username"}),
+    ),
+    "getOrganizationCellularGatewayEsimsServiceProvidersAccountsCommunicationPlans": Operation(
+        "get",
+        "/organizations/{organizationId}/cellularGateway/esims/serviceProviders/accounts/communicationPlans",
+        ("cellularGateway", "configure", "esims", "serviceProviders", "accounts", "communicationPlans"),
+        ("organizationId",),
+        arguments=("organizationId", "accountIds"),
+        query=frozenset({"accountIds"}),
+        array=frozenset({"accountIds"}),
+    ),
+    "getOrganizationCellularGatewayEsimsServiceProvidersAccountsRatePlans": Operation(
+        "get",
+        "/organizations/{organizationId}/cellularGateway/esims/serviceProviders/accounts/ratePlans",
+        ("cellularGateway", "configure", "esims", "serviceProviders", "accounts", "ratePlans"),
+        ("organizationId",),
+        arguments=("organizationId", "accountIds"),
+        query=frozenset({"accountIds"}),
+        array=frozenset({"accountIds"}),
+    ),
+    "updateOrganizationCellularGatewayEsimsServiceProvidersAccount": Operation(
+        "put",
+        "/organizations/{organizationId}/cellularGateway/esims/serviceProviders/accounts/{accountId}",
+        ("cellularGateway", "configure", "esims", "serviceProviders", "accounts"),
+        ("organizationId", "accountId"),
+        body=frozenset({"title", "apiKey"}),
+    ),
+    "deleteOrganizationCellularGatewayEsimsServiceProvidersAccount": Operation(
+        "delete",
+        "/organizations/{organizationId}/cellularGateway/esims/serviceProviders/accounts/{accountId}",
+        ("cellularGateway", "configure", "esims", "serviceProviders", "accounts"),
+        ("organizationId", "accountId"),
+    ),
+    "createOrganizationCellularGatewayEsimsSwap": Operation(
+        "post",
+        "/organizations/{organizationId}/cellularGateway/esims/swap",
+        ("cellularGateway", "configure", "esims", "swap"),
+        ("organizationId",),
+        arguments=("organizationId", "swaps"),
+        body=frozenset({"swaps"}),
+    ),
+    "updateOrganizationCellularGatewayEsimsSwap": Operation(
+        "put",
+        "/organizations/{organizationId}/cellularGateway/esims/swap/{id}",
+        ("cellularGateway", "configure", "esims", "swap"),
+        ("organizationId", "id"),
+        arguments=("id", "organizationId"),
+    ),
+    "getOrganizationCellularGatewayUplinkStatuses": Operation(
+        "get",
+        "/organizations/{organizationId}/cellularGateway/uplink/statuses",
+        ("cellularGateway", "monitor", "uplink", "statuses"),
+        ("organizationId",),
+        query=frozenset({"perPage", "startingAfter", "endingBefore", "networkIds", "serials", "iccids"}),
+        array=frozenset({"networkIds", "serials", "iccids"}),
+        paginated="next",
+    ),
+    "getNetworkInsightApplicationHealthByTime": Operation(
+        "get",
+        "/networks/{networkId}/insight/applications/{applicationId}/healthByTime",
+        ("insight", "monitor", "applications", "healthByTime"),
+        ("networkId", "applicationId"),
+        query=frozenset({"t0", "t1", "timespan", "resolution"}),
+    ),
+    "getOrganizationInsightApplications": Operation(
+        "get",
+        "/organizations/{organizationId}/insight/applications",
+        ("insight", "configure", "applications"),
+        ("organizationId",),
+    ),
+    "getOrganizationInsightMonitoredMediaServers": Operation(
+        "get",
+        "/organizations/{organizationId}/insight/monitoredMediaServers",
+        ("insight", "configure", "monitoredMediaServers"),
+        ("organizationId",),
+    ),
+    "createOrganizationInsightMonitoredMediaServer": Operation(
+        "post",
+        "/organizations/{organizationId}/insight/monitoredMediaServers",
+        ("insight", "configure", "monitoredMediaServers"),
+        ("organizationId",),
+        arguments=("organizationId", "name", "address"),
+        body=frozenset({"name", "address", "bestEffortMonitoringEnabled"}),
+    ),
+    "getOrganizationInsightMonitoredMediaServer": Operation(
+        "get",
+        "/organizations/{organizationId}/insight/monitoredMediaServers/{monitoredMediaServerId}",
+        ("insight", "configure", "monitoredMediaServers"),
+        ("organizationId", "monitoredMediaServerId"),
+    ),
+    "updateOrganizationInsightMonitoredMediaServer": Operation(
+        "put",
+        "/organizations/{organizationId}/insight/monitoredMediaServers/{monitoredMediaServerId}",
+        ("insight", "configure", "monitoredMediaServers"),
+        ("organizationId", "monitoredMediaServerId"),
+        body=frozenset({"name", "address", "bestEffortMonitoringEnabled"}),
+    ),
+    "deleteOrganizationInsightMonitoredMediaServer": Operation(
+        "delete",
+        "/organizations/{organizationId}/insight/monitoredMediaServers/{monitoredMediaServerId}",
+        ("insight", "configure", "monitoredMediaServers"),
+        ("organizationId", "monitoredMediaServerId"),
+    ),
+    "getAdministeredLicensingSubscriptionEntitlements": Operation(
+        "get",
+        "/administered/licensing/subscription/entitlements",
+        ("licensing", "configure", "subscription", "entitlements"),
+        (),
+        query=frozenset({"skus"}),
+        array=frozenset({"skus"}),
+    ),
+    "getAdministeredLicensingSubscriptionSubscriptions": Operation(
+        "get",
+        "/administered/licensing/subscription/subscriptions",
+        ("licensing", "configure", "subscription", "subscriptions"),
+        (),
+        arguments=("organizationIds",),
+        query=frozenset(
+            {
+                "perPage",
+                "startingAfter",
+                "endingBefore",
+                "subscriptionIds",
+                "organizationIds",
+                "statuses",
+                "productTypes",
+                "skus",
+                "name",
+                "startDate",
+                "endDate",
+            }
+        ),
+        array=frozenset({"subscriptionIds", "organizationIds", "statuses", "productTypes", "skus"}),
+        paginated="next",
+    ),
+    "claimAdministeredLicensingSubscriptionSubscriptions": Operation(
+        "post",
+        "/administered/licensing/subscription/subscriptions/claim",
+        ("licensing", "configure", "subscription", "subscriptions"),
+        (),
+        arguments=("claimKey", "organizationId"),
+        query=frozenset({"validate"}),
+        body=frozenset({"claimKey", "organizationId", "name", "description"}),
+    ),
+    "validateAdministeredLicensingSubscriptionSubscriptionsClaimKey": Operation(
+        "post",
+        "/administered/licensing/subscription/subscriptions/claimKey/validate",
+        ("licensing", "configure", "subscription", "subscriptions", "claimKey"),
+        (),
+        arguments=("claimKey",),
+        body=frozenset({"claimKey"}),
+    ),
+    "getAdministeredLicensingSubscriptionSubscriptionsComplianceStatuses": Operation(
+        "get",
+        "/administered/licensing/subscription/subscriptions/compliance/statuses",
+        ("licensing", "configure", "subscription", "subscriptions", "compliance", "statuses"),
+        (),
+        arguments=("organizationIds",),
+        query=frozenset({"organizationIds", "subscriptionIds"}),
+        array=frozenset({"organizationIds", "subscriptionIds"}),
+    ),
+    "bindAdministeredLicensingSubscriptionSubscription": Operation(
+        "post",
+        "/administered/licensing/subscription/subscriptions/{subscriptionId}/bind",
+        ("licensing", "configure", "subscription", "subscriptions"),
+        ("subscriptionId",),
+        query=frozenset({"validate"}),
+        body=frozenset({"networkIds"}),
+    ),
+    "getOrganizationLicensingCotermLicenses": Operation(
+        "get",
+        "/organizations/{organizationId}/licensing/coterm/licenses",
+        ("licensing", "configure", "coterm", "licenses"),
+        ("organizationId",),
+        query=frozenset({"perPage", "startingAfter", "endingBefore", "invalidated", "expired"}),
+        paginated="next",
+    ),
+    "moveOrganizationLicensingCotermLicenses": Operation(
+        "post",
+        "/organizations/{organizationId}/licensing/coterm/licenses/move",
+        ("licensing", "configure", "coterm", "licenses"),
+        ("organizationId",),
+        arguments=("organizationId", "destination", "licenses"),
+        body=frozenset({"destination", "licenses"}),
+    ),
+    "getDeviceSensorCommands": Operation(
+        "get",
+        "/devices/{serial}/sensor/commands",
+        ("sensor", "configure", "commands"),
+        ("serial",),
+        query=frozenset({"operations", "perPage", "startingAfter", "endingBefore", "sortOrder", "t0", "t1", "timespan"}),
+        array=frozenset({"operations"}),
+        paginated="next",
+        enums={
+            "sortOrder": ("ascending", "descending"),
+        },
+    ),
+    "createDeviceSensorCommand": Operation(
+        "post",
+        "/devices/{serial}/sensor/commands",
+        ("sensor", "configure", "commands"),
+        ("serial",),
+        arguments=("serial", "operation"),
+        body=frozenset({"operation"}),
+        enums={
+            "operation": ("cycleDownstreamPower", "disableDownstreamPower", "enableDownstreamPower", "refreshData"),
+        },
+    ),
+    "getDeviceSensorCommand": Operation(
+        "get",
+        "/devices/{serial}/sensor/commands/{commandId}",
+        ("sensor", "configure", "commands"),
+        ("serial", "commandId"),
+    ),
+    "getDeviceSensorRelationships": Operation(
+        "get",
+        "/devices/{serial}/sensor/relationships",
+        ("sensor", "configure", "relationships"),
+        ("serial",),
+    ),
+    "updateDeviceSensorRelationships": Operation(
+        "put",
+        "/devices/{serial}/sensor/relationships",
+        ("sensor", "configure", "relationships"),
+        ("serial",),
+        body=frozenset({"livestream"}),
+    ),
+    "getNetworkSensorAlertsCurrentOverviewByMetric": Operation(
+        "get",
+        "/networks/{networkId}/sensor/alerts/current/overview/byMetric",
+        ("sensor", "monitor", "alerts", "current", "overview", "byMetric"),
+        ("networkId",),
+    ),
+    "getNetworkSensorAlertsOverviewByMetric": Operation(
+        "get",
+        "/networks/{networkId}/sensor/alerts/overview/byMetric",
+        ("sensor", "monitor", "alerts", "overview", "byMetric"),
+        ("networkId",),
+        query=frozenset({"t0", "t1", "timespan", "interval"}),
+    ),
+    "getNetworkSensorAlertsProfiles": Operation(
+        "get",
+        "/networks/{networkId}/sensor/alerts/profiles",
+        ("sensor", "configure", "alerts", "profiles"),
+        ("networkId",),
+    ),
+    "createNetworkSensorAlertsProfile": Operation(
+        "post",
+        "/networks/{networkId}/sensor/alerts/profiles",
+        ("sensor", "configure", "alerts", "profiles"),
+        ("networkId",),
+        arguments=("networkId", "name", "conditions"),
+        body=frozenset({"name", "schedule", "conditions", "recipients", "serials", "includeSensorUrl", "message"}),
+    ),
+    "getNetworkSensorAlertsProfile": Operation(
+        "get",
+        "/networks/{networkId}/sensor/alerts/profiles/{id}",
+        ("sensor", "configure", "alerts", "profiles"),
+        ("networkId", "id"),
+    ),
+    "updateNetworkSensorAlertsProfile": Operation(
+        "put",
+        "/networks/{networkId}/sensor/alerts/profiles/{id}",
+        ("sensor", "configure", "alerts", "profiles"),
+        ("networkId", "id"),
+        body=frozenset({"name", "schedule", "conditions", "recipients", "serials", "includeSensorUrl", "message"}),
+    ),
+    "deleteNetworkSensorAlertsProfile": Operation(
+        "delete",
+        "/networks/{networkId}/sensor/alerts/profiles/{id}",
+        ("sensor", "configure", "alerts", "profiles"),
+        ("networkId", "id"),
+    ),
+    "getNetworkSensorMqttBrokers": Operation(
+        "get",
+        "/networks/{networkId}/sensor/mqttBrokers",
+        ("sensor", "configure", "mqttBrokers"),
+        ("networkId",),
+    ),
+    "getNetworkSensorMqttBroker": Operation(
+        "get",
+        "/networks/{networkId}/sensor/mqttBrokers/{mqttBrokerId}",
+        ("sensor", "configure", "mqttBrokers"),
+        ("networkId", "mqttBrokerId"),
+    ),
+    "updateNetworkSensorMqttBroker": Operation(
+        "put",
+        "/networks/{networkId}/sensor/mqttBrokers/{mqttBrokerId}",
+        ("sensor", "configure", "mqttBrokers"),
+        ("networkId", "mqttBrokerId"),
+        arguments=("networkId", "mqttBrokerId", "enabled"),
+        body=frozenset({"enabled"}),
+    ),
+    "getNetworkSensorRelationships": Operation(
+        "get",
+        "/networks/{networkId}/sensor/relationships",
+        ("sensor", "configure", "relationships"),
+        ("networkId",),
+    ),
+    "getOrganizationSensorGatewaysConnectionsLatest": Operation(
+        "get",
+        "/organizations/{organizationId}/sensor/gateways/connections/latest",
+        ("sensor", "monitor", "gateways", "connections", "latest"),
+        ("organizationId",),
+        query=frozenset({"sensorSerials", "perPage", "startingAfter", "endingBefore"}),
+        array=frozenset({"sensorSerials"}),
+        paginated="next",
+    ),
+    "getOrganizationSensorReadingsHistory": Operation(
+        "get",
+        "/organizations/{organizationId}/sensor/readings/history",
+        ("sensor", "monitor", "readings", "history"),
+        ("organizationId",),
+        query=frozenset(
+            {"perPage", "startingAfter", "endingBefore", "t0", "t1", "timespan", "networkIds", "serials", "metrics"}
+        ),
+        array=frozenset({"networkIds", "serials", "metrics"}),
+        paginated="next",
+    ),
+    "getOrganizationSensorReadingsLatest": Operation(
+        "get",
+        "/organizations/{organizationId}/sensor/readings/latest",
+        ("sensor", "monitor", "readings", "latest"),
+        ("organizationId",),
+        query=frozenset({"perPage", "startingAfter", "endingBefore", "networkIds", "serials", "metrics"}),
+        array=frozenset({"networkIds", "serials", "metrics"}),
+        paginated="next",
+    ),
+    "createNetworkSmBypassActivationLockAttempt": Operation(
+        "post",
+        "/networks/{networkId}/sm/bypassActivationLockAttempts",
+        ("sm", "configure", "bypassActivationLockAttempts"),
+        ("networkId",),
+        arguments=("networkId", "ids"),
+        body=frozenset({"ids"}),
+    ),
+    "getNetworkSmBypassActivationLockAttempt": Operation(
+        "get",
+        "/networks/{networkId}/sm/bypassActivationLockAttempts/{attemptId}",
+        ("sm", "configure", "bypassActivationLockAttempts"),
+        ("networkId", "attemptId"),
+    ),
+    "getNetworkSmDevices": Operation(
+        "get",
+        "/networks/{networkId}/sm/devices",
+        ("sm", "configure", "devices"),
+        ("networkId",),
+        query=frozenset(
+            {
+                "fields",
+                "wifiMacs",
+                "serials",
+                "ids",
+                "uuids",
+                "systemTypes",
+                "scope",
+                "perPage",
+                "startingAfter",
+                "endingBefore",
+            }
+        ),
+        array=frozenset({"fields", "wifiMacs", "serials", "ids", "uuids", "systemTypes", "scope"}),
+        paginated="next",
+    ),
+    "checkinNetworkSmDevices": Operation(
+        "post",
+        "/networks/{networkId}/sm/devices/checkin",
+        ("sm", "configure", "devices"),
+        ("networkId",),
+        body=frozenset({"wifiMacs", "ids", "serials", "scope"}),
+    ),
+    "updateNetworkSmDevicesFields": Operation(
+        "put",
+        "/networks/{networkId}/sm/devices/fields",
+        ("sm", "configure", "devices", "fields"),
+        ("networkId",),
+        arguments=("networkId", "deviceFields"),
+        body=frozenset({"wifiMac", "id", "serial", "deviceFields"}),
+    ),
+    "lockNetworkSmDevices": Operation(
+        "post",
+        "/networks/{networkId}/sm/devices/lock",
+        ("sm", "configure", "devices"),
+        ("networkId",),
+        body=frozenset({"wifiMacs", "ids", "serials", "scope", "pin"}),
+    ),
+    "modifyNetworkSmDevicesTags": Operation(
+        "post",
+        "/networks/{networkId}/sm/devices/modifyTags",
+        ("sm", "configure", "devices"),
+        ("networkId",),
+        arguments=("networkId", "tags", "updateAction"),
+        body=frozenset({"wifiMacs", "ids", "serials", "scope", "tags", "updateAction"}),
+    ),
+    "moveNetworkSmDevices": Operation(
+        "post",
+        "/networks/{networkId}/sm/devices/move",
+        ("sm", "configure", "devices"),
+        ("networkId",),
+        arguments=("networkId", "newNetwork"),
+        body=frozenset({"wifiMacs", "ids", "serials", "scope", "newNetwork"}),
+    ),
+    "rebootNetworkSmDevices": Operation(
+        "post",
+        "/networks/{networkId}/sm/devices/reboot",
+        ("sm", "configure", "devices"),
+        ("networkId",),
+        body=frozenset(
+            {
+                "wifiMacs",
+                "ids",
+                "serials",
+                "scope",
+                "kextPaths",
+                "notifyUser",
+                "rebuildKernelCache",
+                "requestRequiresNetworkTether",
+            }
+        ),
+    ),
+    "shutdownNetworkSmDevices": Operation(
+        "post",
+        "/networks/{networkId}/sm/devices/shutdown",
+        ("sm", "configure", "devices"),
+        ("networkId",),
+        body=frozenset({"wifiMacs", "ids", "serials", "scope"}),
+    ),
+    "wipeNetworkSmDevices": Operation(
+        "post",
+        "/networks/{networkId}/sm/devices/wipe",
+        ("sm", "configure", "devices"),
+        ("networkId",),
+        body=frozenset({"wifiMac", "id", "serial", "pin"}),
+    ),
+    "getNetworkSmDeviceCellularUsageHistory": Operation(
+        "get",
+        "/networks/{networkId}/sm/devices/{deviceId}/cellularUsageHistory",
+        ("sm", "monitor", "devices", "cellularUsageHistory"),
+        ("networkId", "deviceId"),
+    ),
+    "getNetworkSmDeviceCerts": Operation(
+        "get",
+        "/networks/{networkId}/sm/devices/{deviceId}/certs",
+        ("sm", "configure", "devices", "certs"),
+        ("networkId", "deviceId"),
+    ),
+    "getNetworkSmDeviceConnectivity": Operation(
+        "get",
+        "/networks/{networkId}/sm/devices/{deviceId}/connectivity",
+        ("sm", "monitor", "devices", "connectivity"),
+        ("networkId", "deviceId"),
+        query=frozenset({"perPage", "startingAfter", "endingBefore"}),
+        paginated="next",
+    ),
+    "getNetworkSmDeviceDesktopLogs": Operation(
+        "get",
+        "/networks/{networkId}/sm/devices/{deviceId}/desktopLogs",
+        ("sm", "monitor", "devices", "desktopLogs"),
+        ("networkId", "deviceId"),
+        query=frozenset({"perPage", "startingAfter", "endingBefore"}),
+        paginated="next",
+    ),
+    "getNetworkSmDeviceDeviceCommandLogs": Operation(
+        "get",
+        "/networks/{networkId}/sm/devices/{deviceId}/deviceCommandLogs",
+        ("sm", "monitor", "devices", "deviceCommandLogs"),
+        ("networkId", "deviceId"),
+        query=frozenset({"perPage", "startingAfter", "endingBefore"}),
+        paginated="next",
+    ),
+    "getNetworkSmDeviceDeviceProfiles": Operation(
+        "get",
+        "/networks/{networkId}/sm/devices/{deviceId}/deviceProfiles",
+        ("sm", "configure", "devices", "deviceProfiles"),
+        ("networkId", "deviceId"),
+    ),
+    "installNetworkSmDeviceApps": Operation(
+        "post",
+        "/networks/{networkId}/sm/devices/{deviceId}/installApps",
+        ("sm", "configure", "devices"),
+        ("networkId", "deviceId"),
+        arguments=("networkId", "deviceId", "appIds"),
+        body=frozenset({"appIds", "force"}),
+    ),
+    "getNetworkSmDeviceNetworkAdapters": Operation(
+        "get",
+        "/networks/{networkId}/sm/devices/{deviceId}/networkAdapters",
+        ("sm", "configure", "devices", "networkAdapters"),
+        ("networkId", "deviceId"),
+    ),
+    "getNetworkSmDevicePerformanceHistory": Operation(
+        "get",
+        "/networks/{networkId}/sm/devices/{deviceId}/performanceHistory",
+        ("sm", "monitor", "devices", "performanceHistory"),
+        ("networkId", "deviceId"),
+        query=frozenset({"perPage", "startingAfter", "endingBefore"}),
+        paginated="next",
+    ),
+    "refreshNetworkSmDeviceDetails": Operation(
+        "post",
+        "/networks/{networkId}/sm/devices/{deviceId}/refreshDetails",
+        ("sm", "configure", "devices"),
+        ("networkId", "deviceId"),
+    ),
+    "getNetworkSmDeviceRestrictions": Operation(
+        "get",
+        "/networks/{networkId}/sm/devices/{deviceId}/restrictions",
+        ("sm", "configure", "devices", "restrictions"),
+        ("networkId", "deviceId"),
+    ),
+    "getNetworkSmDeviceSecurityCenters": Operation(
+        "get",
+        "/networks/{networkId}/sm/devices/{deviceId}/securityCenters",
+        ("sm", "configure", "devices", "securityCenters"),
+        ("networkId", "deviceId"),
+    ),
+    "getNetworkSmDeviceSoftwares": Operation(
+        "get",
+        "/networks/{networkId}/sm/devices/{deviceId}/softwares",
+        ("sm", "configure", "devices", "softwares"),
+        ("networkId", "deviceId"),
+    ),
+    "unenrollNetworkSmDevice": Operation(
+        "post",
+        "/networks/{networkId}/sm/devices/{deviceId}/unenroll",
+        ("sm", "configure", "devices"),
+        ("networkId", "deviceId"),
+    ),
+    "uninstallNetworkSmDeviceApps": Operation(
+        "post",
+        "/networks/{networkId}/sm/devices/{deviceId}/uninstallApps",
+        ("sm", "configure", "devices"),
+        ("networkId", "deviceId"),
+        arguments=("networkId", "deviceId", "appIds"),
+        body=frozenset({"appIds"}),
+    ),
+    "getNetworkSmDeviceWlanLists": Operation(
+        "get",
+        "/networks/{networkId}/sm/devices/{deviceId}/wlanLists",
+        ("sm", "configure", "devices", "wlanLists"),
+        ("networkId", "deviceId"),
+    ),
+    "getNetworkSmProfiles": Operation(
+        "get",
+        "/networks/{networkId}/sm/profiles",
+        ("sm", "configure", "profiles"),
+        ("networkId",),
+        query=frozenset({"payloadTypes"}),
+        array=frozenset({"payloadTypes"}),
+    ),
+    "getNetworkSmTargetGroups": Operation(
+        "get",
+        "/networks/{networkId}/sm/targetGroups",
+        ("sm", "configure", "targetGroups"),
+        ("networkId",),
+        query=frozenset({"withDetails"}),
+    ),
+    "createNetworkSmTargetGroup": Operation(
+        "post",
+        "/networks/{networkId}/sm/targetGroups",
+        ("sm", "configure", "targetGroups"),
+        ("networkId",),
+        body=frozenset({"name", "scope"}),
+    ),
+    "getNetworkSmTargetGroup": Operation(
+        "get",
+        "/networks/{networkId}/sm/targetGroups/{targetGroupId}",
+        ("sm", "configure", "targetGroups"),
+        ("networkId", "targetGroupId"),
+        query=frozenset({"withDetails"}),
+    ),
+    "updateNetworkSmTargetGroup": Operation(
+        "put",
+        "/networks/{networkId}/sm/targetGroups/{targetGroupId}",
+        ("sm", "configure", "targetGroups"),
+        ("networkId", "targetGroupId"),
+        body=frozenset({"name", "scope"}),
+    ),
+    "deleteNetworkSmTargetGroup": Operation(
+        "delete",
+        "/networks/{networkId}/sm/targetGroups/{targetGroupId}",
+        ("sm", "configure", "targetGroups"),
+        ("networkId", "targetGroupId"),
+    ),
+    "getNetworkSmTrustedAccessConfigs": Operation(
+        "get",
+        "/networks/{networkId}/sm/trustedAccessConfigs",
+        ("sm", "configure", "trustedAccessConfigs"),
+        ("networkId",),
+        query=frozenset({"perPage", "startingAfter", "endingBefore"}),
+        paginated="next",
+    ),
+    "getNetworkSmUserAccessDevices": Operation(
+        "get",
+        "/networks/{networkId}/sm/userAccessDevices",
+        ("sm", "configure", "userAccessDevices"),
+        ("networkId",),
+        query=frozenset({"perPage", "startingAfter", "endingBefore"}),
+        paginated="next",
+    ),
+    "deleteNetworkSmUserAccessDevice": Operation(
+        "delete",
+        "/networks/{networkId}/sm/userAccessDevices/{userAccessDeviceId}",
+        ("sm", "configure", "userAccessDevices"),
+        ("networkId", "userAccessDeviceId"),
+    ),
+    "getNetworkSmUsers": Operation(
+        "get",
+        "/networks/{networkId}/sm/users",
+        ("sm", "configure"),
+        ("networkId",),
+        query=frozenset({"ids", "usernames", "emails", "scope"}),
+        array=frozenset({"ids", "usernames", "emails", "scope"}),
+    ),
+    "getNetworkSmUserDeviceProfiles": Operation(
+        "get",
+        "/networks/{networkId}/sm/users/{userId}/deviceProfiles",
+        ("sm", "configure", "deviceProfiles"),
+        ("networkId", "userId"),
+    ),
+    "getNetworkSmUserSoftwares": Operation(
+        "get",
+        "/networks/{networkId}/sm/users/{userId}/softwares",
+        ("sm", "configure", "softwares"),
+        ("networkId", "userId"),
+    ),
+    "getOrganizationSmAdminsRoles": Operation(
+        "get",
+        "/organizations/{organizationId}/sm/admins/roles",
+        ("sm", "configure", "admins", "roles"),
+        ("organizationId",),
+        query=frozenset({"perPage", "startingAfter", "endingBefore"}),
+        paginated="next",
+    ),
+    "createOrganizationSmAdminsRole": Operation(
+        "post",
+        "/organizations/{organizationId}/sm/admins/roles",
+        ("sm", "configure", "admins", "roles"),
+        ("organizationId",),
+        arguments=("organizationId", "name"),
+        body=frozenset({"name", "scope", "tags"}),
+        enums={
+            "scope": ("all_tags", "some", "without_all_tags", "without_some"),
+        },
+    ),
+    "getOrganizationSmAdminsRole": Operation(
+        "get",
+        "/organizations/{organizationId}/sm/admins/roles/{roleId}",
+        ("sm", "configure", "admins", "roles"),
+        ("organizationId", "roleId"),
+    ),
+    "updateOrganizationSmAdminsRole": Operation(
+        "put",
+        "/organizations/{organizationId}/sm/admins/roles/{roleId}",
+        ("sm", "configure", "admins", "roles"),
+        ("organizationId", "roleId"),
+        body=frozenset({"name", "scope", "tags"}),
+        enums={
+            "scope": ("all_tags", "some", "without_all_tags", "without_some"),
+        },
+    ),
+    "deleteOrganizationSmAdminsRole": Operation(
+        "delete",
+        "/organizations/{organizationId}/sm/admins/roles/{roleId}",
+        ("sm", "configure", "admins", "roles"),
+        ("organizationId", "roleId"),
+    ),
+    "getOrganizationSmApnsCert": Operation(
+        "get",
+        "/organizations/{organizationId}/sm/apnsCert",
+        ("sm", "configure", "apnsCert"),
+        ("organizationId",),
+    ),
+    "updateOrganizationSmSentryPoliciesAssignments": Operation(
+        "put",
+        "/organizations/{organizationId}/sm/sentry/policies/assignments",
+        ("sm", "configure", "sentry", "policies", "assignments"),
+        ("organizationId",),
+        arguments=("organizationId", "items"),
+        body=frozenset({"items"}),
+    ),
+    "getOrganizationSmSentryPoliciesAssignmentsByNetwork": Operation(
+        "get",
+        "/organizations/{organizationId}/sm/sentry/policies/assignments/byNetwork",
+        ("sm", "configure", "sentry", "policies", "assignments", "byNetwork"),
+        ("organizationId",),
+        query=frozenset({"perPage", "startingAfter", "endingBefore", "networkIds"}),
+        array=frozenset({"networkIds"}),
+        paginated="next",
+    ),
+    "getOrganizationSmVppAccounts": Operation(
+        "get",
+        "/organizations/{organizationId}/sm/vppAccounts",
+        ("sm", "configure", "vppAccounts"),
+        ("organizationId",),
+    ),
+    "getOrganizationSmVppAccount": Operation(
+        "get",
+        "/organizations/{organizationId}/sm/vppAccounts/{vppAccountId}",
+        ("sm", "configure", "vppAccounts"),
+        ("organizationId", "vppAccountId"),
+    ),
+    "getDeviceSwitchPorts": Operation(
+        "get",
+        "/devices/{serial}/switch/ports",
+        ("switch", "configure", "ports"),
+        ("serial",),
+    ),
+    "cycleDeviceSwitchPorts": Operation(
+        "post",
+        "/devices/{serial}/switch/ports/cycle",
+        ("switch", "liveTools", "ports"),
+        ("serial",),
+        arguments=("serial", "ports"),
+        body=frozenset({"ports"}),
+    ),
+    "getDeviceSwitchPortsStatuses": Operation(
+        "get",
+        "/devices/{serial}/switch/ports/statuses",
+        ("switch", "monitor", "ports", "statuses"),
+        ("serial",),
+        query=frozenset({"t0", "timespan"}),
+    ),
+    "getDeviceSwitchPortsStatusesPackets": Operation(
+        "get",
+        "/devices/{serial}/switch/ports/statuses/packets",
+        ("switch", "monitor", "ports", "statuses", "packets"),
+        ("serial",),
+        query=frozenset({"t0", "timespan"}),
+    ),
+    "getDeviceSwitchPort": Operation(
+        "get",
+        "/devices/{serial}/switch/ports/{portId}",
+        ("switch", "configure", "ports"),
+        ("serial", "portId"),
+    ),
+    "updateDeviceSwitchPort": Operation(
+        "put",
+        "/devices/{serial}/switch/ports/{portId}",
+        ("switch", "configure", "ports"),
+        ("serial", "portId"),
+        body=frozenset(
+            {
+                "name",
+                "tags",
+                "enabled",
+                "poeEnabled",
+                "type",
+                "vlan",
+                "voiceVlan",
+                "allowedVlans",
+                "isolationEnabled",
+                "rstpEnabled",
+                "stpGuard",
+                "stpPortFastTrunk",
+                "linkNegotiation",
+                "portScheduleId",
+                "udld",
+                "accessPolicyType",
+                "accessPolicyNumber",
+                "macAllowList",
+                "macWhitelistLimit",
+                "stickyMacAllowList",
+                "stickyMacAllowListLimit",
+                "stormControlEnabled",
+                "adaptivePolicyGroupId",
+                "peerSgtCapable",
+                "flexibleStackingEnabled",
+                "daiTrusted",
+                "profile",
+                "dot3az",
+                "highSpeed",
+            }
+        ),
+        enums={
+            "type": ("access", "dad", "routed", "stack", "svl", "trunk"),
+            "stpGuard": ("bpdu guard", "disabled", "loop guard", "root guard"),
+            "udld": ("Alert only", "Enforce"),
+            "accessPolicyType": ("Custom access policy", "MAC allow list", "Open", "Sticky MAC allow list"),
+        },
+    ),
+    "getDeviceSwitchRoutingInterfaces": Operation(
+        "get",
+        "/devices/{serial}/switch/routing/interfaces",
+        ("switch", "configure", "routing", "interfaces"),
+        ("serial",),
+        query=frozenset({"mode", "protocol"}),
+        enums={
+            "mode": ("loopback", "oob_management", "routed", "vlan"),
+            "protocol": ("ipv4", "ipv6"),
+        },
+    ),
+    "createDeviceSwitchRoutingInterface": Operation(
+        "post",
+        "/devices/{serial}/switch/routing/interfaces",
+        ("switch", "configure", "routing", "interfaces"),
+        ("serial",),
+        arguments=("serial", "name"),
+        body=frozenset(
+            {
+                "name",
+                "mode",
+                "subnet",
+                "switchPortId",
+                "interfaceIp",
+                "mtu",
+                "multicastRouting",
+                "vlanId",
+                "defaultGateway",
+                "ospfSettings",
+                "ipv6",
+                "vrf",
+                "loopback",
+            }
+        ),
+        enums={
+            "mode": ("loopback", "oob_management", "routed", "vlan"),
+            "multicastRouting": ("IGMP snooping querier", "disabled", "enabled"),
+        },
+    ),
+    "getDeviceSwitchRoutingInterface": Operation(
+        "get",
+        "/devices/{serial}/switch/routing/interfaces/{interfaceId}",
+        ("switch", "configure", "routing", "interfaces"),
+        ("serial", "interfaceId"),
+    ),
+    "updateDeviceSwitchRoutingInterface": Operation(
+        "put",
+        "/devices/{serial}/switch/routing/interfaces/{interfaceId}",
+        ("switch", "configure", "routing", "interfaces"),
+        ("serial", "interfaceId"),
+        body=frozenset(
+            {
+                "name",
+                "subnet",
+                "switchPortId",
+                "interfaceIp",
+                "mtu",
+                "multicastRouting",
+                "vlanId",
+                "defaultGateway",
+                "ospfSettings",
+                "ipv6",
+                "vrf",
+                "loopback",
+            }
+        ),
+        enums={
+            "multicastRouting": ("IGMP snooping querier", "disabled", "enabled"),
+        },
+    ),
+    "deleteDeviceSwitchRoutingInterface": Operation(
+        "delete",
+        "/devices/{serial}/switch/routing/interfaces/{interfaceId}",
+        ("switch", "configure", "routing", "interfaces"),
+        ("serial", "interfaceId"),
+    ),
+    "getDeviceSwitchRoutingInterfaceDhcp": Operation(
+        "get",
+        "/devices/{serial}/switch/routing/interfaces/{interfaceId}/dhcp",
+        ("switch", "configure", "routing", "interfaces", "dhcp"),
+        ("serial", "interfaceId"),
+    ),
+    "updateDeviceSwitchRoutingInterfaceDhcp": Operation(
+        "put",
+        "/devices/{serial}/switch/routing/interfaces/{interfaceId}/dhcp",
+        ("switch", "configure", "routing", "interfaces", "dhcp"),
+        ("serial", "interfaceId"),
+        body=frozenset(
+            {
+                "dhcpMode",
+                "dhcpRelayServerIps",
+                "dhcpLeaseTime",
+                "dnsNameserversOption",
+                "dnsCustomNameservers",
+                "bootOptionsEnabled",
+                "bootNextServer",
+                "bootFileName",
+                "dhcpOptions",
+                "reservedIpRanges",
+                "fixedIpAssignments",
+            }
+        ),
+        enums={
+            "dhcpMode": ("dhcpDisabled", "dhcpRelay", "dhcpServer"),
+            "dhcpLeaseTime": ("1 day", "1 hour", "1 week", "12 hours", "30 minutes", "4 hours"),
+            "dnsNameserversOption": ("custom", "googlePublicDns", "openDns"),
+        },
+    ),
+    "getDeviceSwitchRoutingStaticRoutes": Operation(
+        "get",
+        "/devices/{serial}/switch/routing/staticRoutes",
+        ("switch", "configure", "routing", "staticRoutes"),
+        ("serial",),
+    ),
+    "createDeviceSwitchRoutingStaticRoute": Operation(
+        "post",
+        "/devices/{serial}/switch/routing/staticRoutes",
+        ("switch", "configure", "routing", "staticRoutes"),
+        ("serial",),
+        arguments=("serial", "subnet", "nextHopIp"),
+        body=frozenset({"name", "subnet", "nextHopIp", "advertiseViaOspfEnabled", "preferOverOspfRoutesEnabled", "vrf"}),
+    ),
+    "getDeviceSwitchRoutingStaticRoute": Operation(
+        "get",
+        "/devices/{serial}/switch/routing/staticRoutes/{staticRouteId}",
+        ("switch", "configure", "routing", "staticRoutes"),
+        ("serial", "staticRouteId"),
+    ),
+    "updateDeviceSwitchRoutingStaticRoute": Operation(
+        "put",
+        "/devices/{serial}/switch/routing/staticRoutes/{staticRouteId}",
+        ("switch", "configure", "routing", "staticRoutes"),
+        ("serial", "staticRouteId"),
+        body=frozenset(
+            {
+                "name",
+                "subnet",
+                "nextHopIp",
+                "managementNextHop",
+                "advertiseViaOspfEnabled",
+                "preferOverOspfRoutesEnabled",
+                "vrf",
+            }
+        ),
+    ),
+    "deleteDeviceSwitchRoutingStaticRoute": Operation(
+        "delete",
+        "/devices/{serial}/switch/routing/staticRoutes/{staticRouteId}",
+        ("switch", "configure", "routing", "staticRoutes"),
+        ("serial", "staticRouteId"),
+    ),
+    "getDeviceSwitchWarmSpare": Operation(
+        "get",
+        "/devices/{serial}/switch/warmSpare",
+        ("switch", "configure", "warmSpare"),
+        ("serial",),
+    ),
+    "updateDeviceSwitchWarmSpare": Operation(
+        "put",
+        "/devices/{serial}/switch/warmSpare",
+        ("switch", "configure", "warmSpare"),
+        ("serial",),
+        arguments=("serial", "enabled"),
+        body=frozenset({"enabled", "spareSerial"}),
+    ),
+    "getNetworkSwitchAccessControlLists": Operation(
+        "get",
+        "/networks/{networkId}/switch/accessControlLists",
+        ("switch", "configure", "accessControlLists"),
+        ("networkId",),
+    ),
+    "updateNetworkSwitchAccessControlLists": Operation(
+        "put",
+        "/networks/{networkId}/switch/accessControlLists",
+        ("switch", "configure", "accessControlLists"),
+        ("networkId",),
+        arguments=("networkId", "rules"),
+        body=frozenset({"rules"}),
+    ),
+    "getNetworkSwitchAccessPolicies": Operation(
+        "get",
+        "/networks/{networkId}/switch/accessPolicies",
+        ("switch", "configure", "accessPolicies"),
+        ("networkId",),
+    ),
+    "createNetworkSwitchAccessPolicy": Operation(
+        "post",
+        "/networks/{networkId}/switch/accessPolicies",
+        ("switch", "configure", "accessPolicies"),
+        ("networkId",),
+        arguments=("networkId", "name", "radiusServers", "radiusAccountingEnabled"),
+        body=frozenset(
+            {
+                "name",
+                "radiusServers",
+                "radius",
+                "guestPortBouncing",
+                "radiusTestingEnabled",
+                "radiusCoaSupportEnabled",
+                "radiusAccountingEnabled",
+                "radiusAccountingServers",
+                "radiusGroupAttribute",
+                "hostMode",
+                "accessPolicyType",
+                "increaseAccessSpeed",
+                "guestVlanId",
+                "dot1x",
+                "voiceVlanClients",
+                "urlRedirectWalledGardenEnabled",
+                "urlRedirectWalledGardenRanges",
+                "guestGroupPolicyId",
+                "guestSgtId",
+            }
+        ),
+        enums={
+            "hostMode": ("Multi-Auth", "Multi-Domain", "Multi-Host", "Single-Host"),
+            "accessPolicyType": ("802.1x", "Hybrid authentication", "MAC authentication bypass"),
+        },
+    ),
+    "getNetworkSwitchAccessPolicy": Operation(
+        "get",
+        "/networks/{networkId}/switch/accessPolicies/{accessPolicyNumber}",
+        ("switch", "configure", "accessPolicies"),
+        ("networkId", "accessPolicyNumber"),
+    ),
+    "updateNetworkSwitchAccessPolicy": Operation(
+        "put",
+        "/networks/{networkId}/switch/accessPolicies/{accessPolicyNumber}",
+        ("switch", "configure", "accessPolicies"),
+        ("networkId", "accessPolicyNumber"),
+        body=frozenset(
+            {
+                "name",
+                "radiusServers",
+                "radius",
+                "guestPortBouncing",
+                "radiusTestingEnabled",
+                "radiusCoaSupportEnabled",
+                "radiusAccountingEnabled",
+                "radiusAccountingServers",
+                "radiusGroupAttribute",
+                "hostMode",
+                "accessPolicyType",
+                "increaseAccessSpeed",
+                "guestVlanId",
+                "dot1x",
+                "voiceVlanClients",
+                "urlRedirectWalledGardenEnabled",
+                "urlRedirectWalledGardenRanges",
+                "guestGroupPolicyId",
+                "guestSgtId",
+            }
+        ),
+        enums={
+            "hostMode": ("Multi-Auth", "Multi-Domain", "Multi-Host", "Single-Host"),
+            "accessPolicyType": ("802.1x", "Hybrid authentication", "MAC authentication bypass"),
+        },
+    ),
+    "deleteNetworkSwitchAccessPolicy": Operation(
+        "delete",
+        "/networks/{networkId}/switch/accessPolicies/{accessPolicyNumber}",
+        ("switch", "configure", "accessPolicies"),
+        ("networkId", "accessPolicyNumber"),
+    ),
+    "getNetworkSwitchAlternateManagementInterface": Operation(
+        "get",
+        "/networks/{networkId}/switch/alternateManagementInterface",
+        ("switch", "configure", "alternateManagementInterface"),
+        ("networkId",),
+    ),
+    "updateNetworkSwitchAlternateManagementInterface": Operation(
+        "put",
+        "/networks/{networkId}/switch/alternateManagementInterface",
+        ("switch", "configure", "alternateManagementInterface"),
+        ("networkId",),
+        body=frozenset({"enabled", "vlanId", "protocols", "switches"}),
+    ),
+    "getNetworkSwitchDhcpV4ServersSeen": Operation(
+        "get",
+        "/networks/{networkId}/switch/dhcp/v4/servers/seen",
+        ("switch", "configure", "dhcp", "v4", "servers", "seen"),
+        ("networkId",),
+        query=frozenset({"t0", "timespan", "perPage", "startingAfter", "endingBefore"}),
+        paginated="next",
+    ),
+    "getNetworkSwitchDhcpServerPolicy": Operation(
+        "get",
+        "/networks/{networkId}/switch/dhcpServerPolicy",
+        ("switch", "configure", "dhcpServerPolicy"),
+        ("networkId",),
+    ),
+    "updateNetworkSwitchDhcpServerPolicy": Operation(
+        "put",
+        "/networks/{networkId}/switch/dhcpServerPolicy",
+        ("switch", "configure", "dhcpServerPolicy"),
+        ("networkId",),
+        body=frozenset({"alerts", "defaultPolicy", "allowedServers", "blockedServers", "arpInspection"}),
+        enums={
+            "defaultPolicy": ("allow", "block"),
+        },
+    ),
+    "getNetworkSwitchDhcpServerPolicyArpInspectionTrustedServers": Operation(
+        "get",
+        "/networks/{networkId}/switch/dhcpServerPolicy/arpInspection/trustedServers",
+        ("switch", "configure", "dhcpServerPolicy", "arpInspection", "trustedServers"),
+        ("networkId",),
+        query=frozenset({"perPage", "startingAfter", "endingBefore"}),
+        paginated="next",
+    ),
+    "createNetworkSwitchDhcpServerPolicyArpInspectionTrustedServer": Operation(
+        "post",
+        "/networks/{networkId}/switch/dhcpServerPolicy/arpInspection/trustedServers",
+        ("switch", "configure", "dhcpServerPolicy", "arpInspection", "trustedServers"),
+        ("networkId",),
+        arguments=("networkId", "mac", "vlan", "ipv4"),
+        body=frozenset({"mac", "vlan", "ipv4"}),
+    ),
+    "updateNetworkSwitchDhcpServerPolicyArpInspectionTrustedServer": Operation(
+        "put",
+        "/networks/{networkId}/switch/dhcpServerPolicy/arpInspection/trustedServers/{trustedServerId}",
+        ("switch", "configure", "dhcpServerPolicy", "arpInspection", "trustedServers"),
+        ("networkId", "trustedServerId"),
+        body=frozenset({"mac", "vlan", "ipv4"}),
+    ),
+    "deleteNetworkSwitchDhcpServerPolicyArpInspectionTrustedServer": Operation(
+        "delete",
+        "/networks/{networkId}/switch/dhcpServerPolicy/arpInspection/trustedServers/{trustedServerId}",
+        ("switch", "configure", "dhcpServerPolicy", "arpInspection", "trustedServers"),
+        ("networkId", "trustedServerId"),
+    ),
+    "getNetworkSwitchDhcpServerPolicyArpInspectionWarningsByDevice": Operation(
+        "get",
+        "/networks/{networkId}/switch/dhcpServerPolicy/arpInspection/warnings/byDevice",
+        ("switch", "configure", "dhcpServerPolicy", "arpInspection", "warnings", "byDevice"),
+        ("networkId",),
+        query=frozenset({"perPage", "startingAfter", "endingBefore"}),
+        paginated="next",
+    ),
+    "getNetworkSwitchDscpToCosMappings": Operation(
+        "get",
+        "/networks/{networkId}/switch/dscpToCosMappings",
+        ("switch", "configure", "dscpToCosMappings"),
+        ("networkId",),
+    ),
+    "updateNetworkSwitchDscpToCosMappings": Operation(
+        "put",
+        "/networks/{networkId}/switch/dscpToCosMappings",
+        ("switch", "configure", "dscpToCosMappings"),
+        ("networkId",),
+        arguments=("networkId", "mappings"),
+        body=frozenset({"mappings"}),
+    ),
+    "getNetworkSwitchLinkAggregations": Operation(
+        "get",
+        "/networks/{networkId}/switch/linkAggregations",
+        ("switch", "configure", "linkAggregations"),
+        ("networkId",),
+    ),
+    "createNetworkSwitchLinkAggregation": Operation(
+        "post",
+        "/networks/{networkId}/switch/linkAggregations",
+        ("switch", "configure", "linkAggregations"),
+        ("networkId",),
+        body=frozenset({"switchPorts", "switchProfilePorts"}),
+    ),
+    "updateNetworkSwitchLinkAggregation": Operation(
+        "put",
+        "/networks/{networkId}/switch/linkAggregations/{linkAggregationId}",
+        ("switch", "configure", "linkAggregations"),
+        ("networkId", "linkAggregationId"),
+        body=frozenset({"switchPorts", "switchProfilePorts"}),
+    ),
+    "deleteNetworkSwitchLinkAggregation": Operation(
+        "delete",
+        "/networks/{networkId}/switch/linkAggregations/{linkAggregationId}",
+        ("switch", "configure", "linkAggregations"),
+        ("networkId", "linkAggregationId"),
+    ),
+    "getNetworkSwitchMtu": Operation(
+        "get",
+        "/networks/{networkId}/switch/mtu",
+        ("switch", "configure", "mtu"),
+        ("networkId",),
+    ),
+    "updateNetworkSwitchMtu": Operation(
+        "put",
+        "/networks/{networkId}/switch/mtu",
+        ("switch", "configure", "mtu"),
+        ("networkId",),
+        body=frozenset({"defaultMtuSize", "overrides"}),
+    ),
+    "getNetworkSwitchPortSchedules": Operation(
+        "get",
+        "/networks/{networkId}/switch/portSchedules",
+        ("switch", "configure", "portSchedules"),
+        ("networkId",),
+    ),
+    "createNetworkSwitchPortSchedule": Operation(
+        "post",
+        "/networks/{networkId}/switch/portSchedules",
+        ("switch", "configure", "portSchedules"),
+        ("networkId",),
+        arguments=("networkId", "name"),
+        body=frozenset({"name", "portSchedule"}),
+    ),
+    "deleteNetworkSwitchPortSchedule": Operation(
+        "delete",
+        "/networks/{networkId}/switch/portSchedules/{portScheduleId}",
+        ("switch", "configure", "portSchedules"),
+        ("networkId", "portScheduleId"),
+    ),
+    "updateNetworkSwitchPortSchedule": Operation(
+        "put",
+        "/networks/{networkId}/switch/portSchedules/{portScheduleId}",
+        ("switch", "configure", "portSchedules"),
+        ("networkId", "portScheduleId"),
+        body=frozenset({"name", "portSchedule"}),
+    ),
+    "getNetworkSwitchQosRules": Operation(
+        "get",
+        "/networks/{networkId}/switch/qosRules",
+        ("switch", "configure", "qosRules"),
+        ("networkId",),
+    ),
+    "createNetworkSwitchQosRule": Operation(
+        "post",
+        "/networks/{networkId}/switch/qosRules",
+        ("switch", "configure", "qosRules"),
+        ("networkId",),
+        arguments=("networkId", "vlan"),
+        body=frozenset({"vlan", "protocol", "srcPort", "srcPortRange", "dstPort", "dstPortRange", "dscp"}),
+        enums={
+            "protocol": ("ANY", "TCP", "UDP"),
+        },
+    ),
+    "getNetworkSwitchQosRulesOrder": Operation(
+        "get",
+        "/networks/{networkId}/switch/qosRules/order",
+        ("switch", "configure", "qosRules", "order"),
+        ("networkId",),
+    ),
+    "updateNetworkSwitchQosRulesOrder": Operation(
+        "put",
+        "/networks/{networkId}/switch/qosRules/order",
+        ("switch", "configure", "qosRules", "order"),
+        ("networkId",),
+        arguments=("networkId", "ruleIds"),
+        body=frozenset({"ruleIds"}),
+    ),
+    "getNetworkSwitchQosRule": Operation(
+        "get",
+        "/networks/{networkId}/switch/qosRules/{qosRuleId}",
+        ("switch", "configure", "qosRules"),
+        ("networkId", "qosRuleId"),
+    ),
+    "deleteNetworkSwitchQosRule": Operation(
+        "delete",
+        "/networks/{networkId}/switch/qosRules/{qosRuleId}",
+        ("switch", "configure", "qosRules"),
+        ("networkId", "qosRuleId"),
+    ),
+    "updateNetworkSwitchQosRule": Operation(
+        "put",
+        "/networks/{networkId}/switch/qosRules/{qosRuleId}",
+        ("switch", "configure", "qosRules"),
+        ("networkId", "qosRuleId"),
+        body=frozenset({"vlan", "protocol", "srcPort", "srcPortRange", "dstPort", "dstPortRange", "dscp"}),
+        enums={
+            "protocol": ("ANY", "TCP", "UDP"),
+        },
+    ),
+    "getNetworkSwitchRoutingMulticast": Operation(
+        "get",
+        "/networks/{networkId}/switch/routing/multicast",
+        ("switch", "configure", "routing", "multicast"),
+        ("networkId",),
+    ),
+    "updateNetworkSwitchRoutingMulticast": Operation(
+        "put",
+        "/networks/{networkId}/switch/routing/multicast",
+        ("switch", "configure", "routing", "multicast"),
+        ("networkId",),
+        body=frozenset({"defaultSettings", "overrides"}),
+    ),
+    "getNetworkSwitchRoutingMulticastRendezvousPoints": Operation(
+        "get",
+        "/networks/{networkId}/switch/routing/multicast/rendezvousPoints",
+        ("switch", "configure", "routing", "multicast", "rendezvousPoints"),
+        ("networkId",),
+    ),
+    "createNetworkSwitchRoutingMulticastRendezvousPoint": Operation(
+        "post",
+        "/networks/{networkId}/switch/routing/multicast/rendezvousPoints",
+        ("switch", "configure", "routing", "multicast", "rendezvousPoints"),
+        ("networkId",),
+        arguments=("networkId", "interfaceIp", "multicastGroup"),
+        body=frozenset({"interfaceIp", "multicastGroup", "vrf"}),
+    ),
+    "getNetworkSwitchRoutingMulticastRendezvousPoint": Operation(
+        "get",
+        "/networks/{networkId}/switch/routing/multicast/rendezvousPoints/{rendezvousPointId}",
+        ("switch", "configure", "routing", "multicast", "rendezvousPoints"),
+        ("networkId", "rendezvousPointId"),
+    ),
+    "deleteNetworkSwitchRoutingMulticastRendezvousPoint": Operation(
+        "delete",
+        "/networks/{networkId}/switch/routing/multicast/rendezvousPoints/{rendezvousPointId}",
+        ("switch", "configure", "routing", "multicast", "rendezvousPoints"),
+        ("networkId", "rendezvousPointId"),
+    ),
+    "updateNetworkSwitchRoutingMulticastRendezvousPoint": Operation(
+        "put",
+        "/networks/{networkId}/switch/routing/multicast/rendezvousPoints/{rendezvousPointId}",
+        ("switch", "configure", "routing", "multicast", "rendezvousPoints"),
+        ("networkId", "rendezvousPointId"),
+        arguments=("networkId", "rendezvousPointId", "interfaceIp", "multicastGroup"),
+        body=frozenset({"interfaceIp", "multicastGroup", "vrf"}),
+    ),
+    "getNetworkSwitchRoutingOspf": Operation(
+        "get",
+        "/networks/{networkId}/switch/routing/ospf",
+        ("switch", "configure", "routing", "ospf"),
+        ("networkId",),
+        query=frozenset({"vrf"}),
+    ),
+    "updateNetworkSwitchRoutingOspf": Operation(
+        "put",
+        "/networks/{networkId}/switch/routing/ospf",
+        ("switch", "configure", "routing", "ospf"),
+        ("networkId",),
+        query=frozenset({"vrf"}),
+        body=frozenset(
+            {
+                "enabled",
+                "helloTimerInSeconds",
+                "deadTimerInSeconds",
+                "areas",
+                "v3",
+                "md5AuthenticationEnabled",
+                "md5AuthenticationKey",
+            }
+        ),
+    ),
+    "getNetworkSwitchSettings": Operation(
+        "get",
+        "/networks/{networkId}/switch/settings",
+        ("switch", "configure", "settings"),
+        ("networkId",),
+    ),
+    "updateNetworkSwitchSettings": Operation(
+        "put",
+        "/networks/{networkId}/switch/settings",
+        ("switch", "configure", "settings"),
+        ("networkId",),
+        body=frozenset(
+            {
+                "vlan",
+                "useCombinedPower",
+                "powerExceptions",
+                "uplinkClientSampling",
+                "macBlocklist",
+                "portChannelFallback",
+                "uplinkSelection",
+            }
+        ),
+    ),
+    "getNetworkSwitchStacks": Operation(
+        "get",
+        "/networks/{networkId}/switch/stacks",
+        ("switch", "configure", "stacks"),
+        ("networkId",),
+    ),
+    "createNetworkSwitchStack": Operation(
+        "post",
+        "/networks/{networkId}/switch/stacks",
+        ("switch", "configure", "stacks"),
+        ("networkId",),
+        arguments=("networkId", "name", "serials"),
+        body=frozenset({"name", "serials"}),
+    ),
+    "updateNetworkSwitchStack": Operation(
+        "put",
+        "/networks/{networkId}/switch/stacks/{switchStackId}",
+        ("switch", "configure", "stacks"),
+        ("networkId", "switchStackId"),
+        body=frozenset({"name", "members"}),
+    ),
+    "getNetworkSwitchStack": Operation(
+        "get",
+        "/networks/{networkId}/switch/stacks/{switchStackId}",
+        ("switch", "configure", "stacks"),
+        ("networkId", "switchStackId"),
+    ),
+    "deleteNetworkSwitchStack": Operation(
+        "delete",
+        "/networks/{networkId}/switch/stacks/{switchStackId}",
+        ("switch", "configure", "stacks"),
+        ("networkId", "switchStackId"),
+    ),
+    "addNetworkSwitchStack": Operation(
+        "post",
+        "/networks/{networkId}/switch/stacks/{switchStackId}/add",
+        ("switch", "configure", "stacks"),
+        ("networkId", "switchStackId"),
+        arguments=("networkId", "switchStackId", "serial"),
+        body=frozenset({"serial"}),
+    ),
+    "removeNetworkSwitchStack": Operation(
+        "post",
+        "/networks/{networkId}/switch/stacks/{switchStackId}/remove",
+        ("switch", "configure", "stacks"),
+        ("networkId", "switchStackId"),
+        arguments=("networkId", "switchStackId", "serial"),
+        body=frozenset({"serial"}),
+    ),
+    "getNetworkSwitchStackRoutingInterfaces": Operation(
+        "get",
+        "/networks/{networkId}/switch/stacks/{switchStackId}/routing/interfaces",
+        ("switch", "configure", "stacks", "routing", "interfaces"),
+        ("networkId", "switchStackId"),
+        query=frozenset({"mode", "protocol"}),
+        enums={
+            "mode": ("loopback", "oob_management", "routed", "vlan"),
+            "protocol": ("ipv4", "ipv6"),
+        },
+    ),
+    "createNetworkSwitchStackRoutingInterface": Operation(
+        "post",
+        "/networks/{networkId}/switch/stacks/{switchStackId}/routing/interfaces",
+        ("switch", "configure", "stacks", "routing", "interfaces"),
+        ("networkId", "switchStackId"),
+        arguments=("networkId", "switchStackId", "name"),
+        body=frozenset(
+            {
+                "name",
+                "mode",
+                "subnet",
+                "switchPortId",
+                "interfaceIp",
+                "mtu",
+                "multicastRouting",
+                "vlanId",
+                "defaultGateway",
+                "ospfSettings",
+                "ipv6",
+                "vrf",
+                "loopback",
+            }
+        ),
+        enums={
+            "mode": ("loopback", "oob_management", "routed", "vlan"),
+            "multicastRouting": ("IGMP snooping querier", "disabled", "enabled"),
+        },
+    ),
+    "getNetworkSwitchStackRoutingInterface": Operation(
+        "get",
+        "/networks/{networkId}/switch/stacks/{switchStackId}/routing/interfaces/{interfaceId}",
+        ("switch", "configure", "stacks", "routing", "interfaces"),
+        ("networkId", "switchStackId", "interfaceId"),
+    ),
+    "updateNetworkSwitchStackRoutingInterface": Operation(
+        "put",
+        "/networks/{networkId}/switch/stacks/{switchStackId}/routing/interfaces/{interfaceId}",
+        ("switch", "configure", "stacks", "routing", "interfaces"),
+        ("networkId", "switchStackId", "interfaceId"),
+        body=frozenset(
+            {
+                "name",
+                "subnet",
+                "switchPortId",
+                "interfaceIp",
+                "mtu",
+                "multicastRouting",
+                "vlanId",
+                "defaultGateway",
+                "ospfSettings",
+                "ipv6",
+                "vrf",
+                "loopback",
+            }
+        ),
+        enums={
+            "multicastRouting": ("IGMP snooping querier", "disabled", "enabled"),
+        },
+    ),
+    "deleteNetworkSwitchStackRoutingInterface": Operation(
+        "delete",
+        "/networks/{networkId}/switch/stacks/{switchStackId}/routing/interfaces/{interfaceId}",
+        ("switch", "configure", "stacks", "routing", "interfaces"),
+        ("networkId", "switchStackId", "interfaceId"),
+    ),
+    "getNetworkSwitchStackRoutingInterfaceDhcp": Operation(
+        "get",
+        "/networks/{networkId}/switch/stacks/{switchStackId}/routing/interfaces/{interfaceId}/dhcp",
+        ("switch", "configure", "stacks", "routing", "interfaces", "dhcp"),
+        ("networkId", "switchStackId", "interfaceId"),
+    ),
+    "updateNetworkSwitchStackRoutingInterfaceDhcp": Operation(
+        "put",
+        "/networks/{networkId}/switch/stacks/{switchStackId}/routing/interfaces/{interfaceId}/dhcp",
+        ("switch", "configure", "stacks", "routing", "interfaces", "dhcp"),
+        ("networkId", "switchStackId", "interfaceId"),
+        body=frozenset(
+            {
+                "dhcpMode",
+                "dhcpRelayServerIps",
+                "dhcpLeaseTime",
+                "dnsNameserversOption",
+                "dnsCustomNameservers",
+                "bootOptionsEnabled",
+                "bootNextServer",
+                "bootFileName",
+                "dhcpOptions",
+                "reservedIpRanges",
+                "fixedIpAssignments",
+            }
+        ),
+        enums={
+            "dhcpMode": ("dhcpDisabled", "dhcpRelay", "dhcpServer"),
+            "dhcpLeaseTime": ("1 day", "1 hour", "1 week", "12 hours", "30 minutes", "4 hours"),
+            "dnsNameserversOption": ("custom", "googlePublicDns", "openDns"),
+        },
+    ),
+    "getNetworkSwitchStackRoutingStaticRoutes": Operation(
+        "get",
+        "/networks/{networkId}/switch/stacks/{switchStackId}/routing/staticRoutes",
+        ("switch", "configure", "stacks", "routing", "staticRoutes"),
+        ("networkId", "switchStackId"),
+    ),
+    "createNetworkSwitchStackRoutingStaticRoute": Operation(
+        "post",
+        "/networks/{networkId}/switch/stacks/{switchStackId}/routing/staticRoutes",
+        ("switch", "configure", "stacks", "routing", "staticRoutes"),
+        ("networkId", "switchStackId"),
+        arguments=("networkId", "switchStackId", "subnet", "nextHopIp"),
+        body=frozenset({"name", "subnet", "nextHopIp", "advertiseViaOspfEnabled", "preferOverOspfRoutesEnabled", "vrf"}),
+    ),
+    "getNetworkSwitchStackRoutingStaticRoute": Operation(
+        "get",
+        "/networks/{networkId}/switch/stacks/{switchStackId}/routing/staticRoutes/{staticRouteId}",
+        ("switch", "configure", "stacks", "routing", "staticRoutes"),
+        ("networkId", "switchStackId", "staticRouteId"),
+    ),
+    "updateNetworkSwitchStackRoutingStaticRoute": Operation(
+        "put",
+        "/networks/{networkId}/switch/stacks/{switchStackId}/routing/staticRoutes/{staticRouteId}",
+        ("switch", "configure", "stacks", "routing", "staticRoutes"),
+        ("networkId", "switchStackId", "staticRouteId"),
+        body=frozenset(
+            {
+                "name",
+                "subnet",
+                "nextHopIp",
+                "managementNextHop",
+                "advertiseViaOspfEnabled",
+                "preferOverOspfRoutesEnabled",
+                "vrf",
+            }
+        ),
+    ),
+    "deleteNetworkSwitchStackRoutingStaticRoute": Operation(
+        "delete",
+        "/networks/{networkId}/switch/stacks/{switchStackId}/routing/staticRoutes/{staticRouteId}",
+        ("switch", "configure", "stacks", "routing", "staticRoutes"),
+        ("networkId", "switchStackId", "staticRouteId"),
+    ),
+    "getNetworkSwitchStormControl": Operation(
+        "get",
+        "/networks/{networkId}/switch/stormControl",
+        ("switch", "configure", "stormControl"),
+        ("networkId",),
+    ),
+    "updateNetworkSwitchStormControl": Operation(
+        "put",
+        "/networks/{networkId}/switch/stormControl",
+        ("switch", "configure", "stormControl"),
+        ("networkId",),
+        body=frozenset(
+            {"broadcastThreshold", "multicastThreshold", "unknownUnicastThreshold", "treatTheseTrafficTypesAsOneThreshold"}
+        ),
+    ),
+    "getNetworkSwitchStp": Operation(
+        "get",
+        "/networks/{networkId}/switch/stp",
+        ("switch", "configure", "stp"),
+        ("networkId",),
+    ),
+    "updateNetworkSwitchStp": Operation(
+        "put",
+        "/networks/{networkId}/switch/stp",
+        ("switch", "configure", "stp"),
+        ("networkId",),
+        body=frozenset({"rstpEnabled", "stpBridgePriority"}),
+    ),
+    "getOrganizationConfigTemplateSwitchProfiles": Operation(
+        "get",
+        "/organizations/{organizationId}/configTemplates/{configTemplateId}/switch/profiles",
+        ("switch", "configure", "configTemplates", "profiles"),
+        ("organizationId", "configTemplateId"),
+    ),
+    "getOrganizationConfigTemplateSwitchProfilePorts": Operation(
+        "get",
+        "/organizations/{organizationId}/configTemplates/{configTemplateId}/switch/profiles/{profileId}/ports",
+        ("switch", "configure", "configTemplates", "profiles", "ports"),
+        ("organizationId", "configTemplateId", "profileId"),
+    ),
+    "getOrganizationConfigTemplateSwitchProfilePort": Operation(
+        "get",
+        "/organizations/{organizationId}/configTemplates/{configTemplateId}/switch/profiles/{profileId}/ports/{portId}",
+        ("switch", "configure", "configTemplates", "profiles", "ports"),
+        ("organizationId", "configTemplateId", "profileId", "portId"),
+    ),
+    "updateOrganizationConfigTemplateSwitchProfilePort": Operation(
+        "put",
+        "/organizations/{organizationId}/configTemplates/{configTemplateId}/switch/profiles/{profileId}/ports/{portId}",
+        ("switch", "configure", "configTemplates", "profiles", "ports"),
+        ("organizationId", "configTemplateId", "profileId", "portId"),
+        body=frozenset(
+            {
+                "name",
+                "tags",
+                "enabled",
+                "poeEnabled",
+                "type",
+                "vlan",
+                "voiceVlan",
+                "allowedVlans",
+                "isolationEnabled",
+                "rstpEnabled",
+                "stpGuard",
+                "stpPortFastTrunk",
+                "linkNegotiation",
+                "portScheduleId",
+                "udld",
+                "accessPolicyType",
+                "accessPolicyNumber",
+                "macAllowList",
+                "macWhitelistLimit",
+                "stickyMacAllowList",
+                "stickyMacAllowListLimit",
+                "stormControlEnabled",
+                "flexibleStackingEnabled",
+                "daiTrusted",
+                "profile",
+                "dot3az",
+                "highSpeed",
+            }
+        ),
+        enums={
+            "type": ("access", "dad", "routed", "stack", "svl", "trunk"),
+            "stpGuard": ("bpdu guard", "disabled", "loop guard", "root guard"),
+            "udld": ("Alert only", "Enforce"),
+            "accessPolicyType": ("Custom access policy", "MAC allow list", "Open", "Sticky MAC allow list"),
+        },
+    ),
+    "getOrganizationSummarySwitchPowerHistory": Operation(
+        "get",
+        "/organizations/{organizationId}/summary/switch/power/history",
+        ("switch", "monitor", "summary", "power", "history"),
+        ("organizationId",),
+        query=frozenset({"t0", "t1", "timespan"}),
+    ),
+    "cloneOrganizationSwitchDevices": Operation(
+        "post",
+        "/organizations/{organizationId}/switch/devices/clone",
+        ("switch", "configure", "devices"),
+        ("organizationId",),
+        arguments=("organizationId", "sourceSerial", "targetSerials"),
+        body=frozenset({"sourceSerial", "targetSerials"}),
+    ),
+    "getOrganizationSwitchPortsBySwitch": Operation(
+        "get",
+        "/organizations/{organizationId}/switch/ports/bySwitch",
+        ("switch", "configure", "ports", "bySwitch"),
+        ("organizationId",),
+        query=frozenset(
+            {
+                "perPage",
+                "startingAfter",
+                "endingBefore",
+                "configurationUpdatedAfter",
+                "mac",
+                "macs",
+                "name",
+                "networkIds",
+                "portProfileIds",
+                "serial",
+                "serials",
+            }
+        ),
+        array=frozenset({"macs", "networkIds", "portProfileIds", "serials"}),
+        paginated="next",
+    ),
+    "getOrganizationSwitchPortsClientsOverviewByDevice": Operation(
+        "get",
+        "/organizations/{organizationId}/switch/ports/clients/overview/byDevice",
+        ("switch", "monitor", "ports", "clients", "overview", "byDevice"),
+        ("organizationId",),
+        query=frozenset(
+            {
+                "t0",
+                "timespan",
+                "perPage",
+                "startingAfter",
+                "endingBefore",
+                "configurationUpdatedAfter",
+                "mac",
+                "macs",
+                "name",
+                "networkIds",
+                "portProfileIds",
+                "serial",
+                "serials",
+            }
+        ),
+        array=frozenset({"macs", "networkIds", "portProfileIds", "serials"}),
+        paginated="next",
+    ),
+    "getOrganizationSwitchPortsOverview": Operation(
+        "get",
+        "/organizations/{organizationId}/switch/ports/overview",
+        ("switch", "monitor", "ports", "overview"),
+        ("organizationId",),
+        query=frozenset({"t0", "t1", "timespan"}),
+    ),
+    "getOrganizationSwitchPortsStatusesBySwitch": Operation(
+        "get",
+        "/organizations/{organizationId}/switch/ports/statuses/bySwitch",
+        ("switch", "monitor", "ports", "statuses", "bySwitch"),
+        ("organizationId",),
+        query=frozenset(
+            {
+                "perPage",
+                "startingAfter",
+                "endingBefore",
+                "configurationUpdatedAfter",
+                "mac",
+                "macs",
+                "name",
+                "networkIds",
+                "portProfileIds",
+                "serial",
+                "serials",
+            }
+        ),
+        array=frozenset({"macs", "networkIds", "portProfileIds", "serials"}),
+        paginated="next",
+    ),
+    "getOrganizationSwitchPortsTopologyDiscoveryByDevice": Operation(
+        "get",
+        "/organizations/{organizationId}/switch/ports/topology/discovery/byDevice",
+        ("switch", "monitor", "ports", "topology", "discovery", "byDevice"),
+        ("organizationId",),
+        query=frozenset(
+            {
+                "t0",
+                "timespan",
+                "perPage",
+                "startingAfter",
+                "endingBefore",
+                "configurationUpdatedAfter",
+                "mac",
+                "macs",
+                "name",
+                "networkIds",
+                "portProfileIds",
+                "serial",
+                "serials",
+            }
+        ),
+        array=frozenset({"macs", "networkIds", "portProfileIds", "serials"}),
+        paginated="next",
+    ),
+    "getOrganizationSwitchPortsUsageHistoryByDeviceByInterval": Operation(
+        "get",
+        "/organizations/{organizationId}/switch/ports/usage/history/byDevice/byInterval",
+        ("switch", "monitor", "ports", "usage", "history", "byDevice", "byInterval"),
+        ("organizationId",),
+        query=frozenset(
+            {
+                "t0",
+                "t1",
+                "timespan",
+                "interval",
+                "perPage",
+                "startingAfter",
+                "endingBefore",
+                "configurationUpdatedAfter",
+                "mac",
+                "macs",
+                "name",
+                "networkIds",
+                "portProfileIds",
+                "serial",
+                "serials",
+            }
+        ),
+        array=frozenset({"macs", "networkIds", "portProfileIds", "serials"}),
+        paginated="next",
+    ),
+    "updateDeviceWirelessAlternateManagementInterfaceIpv6": Operation(
+        "put",
+        "/devices/{serial}/wireless/alternateManagementInterface/ipv6",
+        ("wireless", "configure", "alternateManagementInterface", "ipv6"),
+        ("serial",),
+        body=frozenset({"addresses"}),
+    ),
+    "getDeviceWirelessBluetoothSettings": Operation(
+        "get",
+        "/devices/{serial}/wireless/bluetooth/settings",
+        ("wireless", "configure", "bluetooth", "settings"),
+        ("serial",),
+    ),
+    "updateDeviceWirelessBluetoothSettings": Operation(
+        "put",
+        "/devices/{serial}/wireless/bluetooth/settings",
+        ("wireless", "configure", "bluetooth", "settings"),
+        ("serial",),
+        body=frozenset({"uuid", "major", "minor"}),
+    ),
+    "getDeviceWirelessConnectionStats": Operation(
+        "get",
+        "/devices/{serial}/wireless/connectionStats",
+        ("wireless", "monitor", "connectionStats"),
+        ("serial",),
+        query=frozenset({"t0", "t1", "timespan", "band", "ssid", "apTag"}),
+        enums={
+            "band": ("2.4", "5", "6"),
+            "ssid": (0, 1, 2, 3, 4, 5, 6, 7, 8, 9, 10, 11, 12, 13, 14),
+        },
+    ),
+    "getDeviceWirelessElectronicShelfLabel": Operation(
+        "get",
+        "/devices/{serial}/wireless/electronicShelfLabel",
+        ("wireless", "configure", "electronicShelfLabel"),
+        ("serial",),
+    ),
+    "updateDeviceWirelessElectronicShelfLabel": Operation(
+        "put",
+        "/devices/{serial}/wireless/electronicShelfLabel",
+        ("wireless", "configure", "electronicShelfLabel"),
+        ("serial",),
+        body=frozenset({"channel", "enabled"}),
+    ),
+    "getDeviceWirelessLatencyStats": Operation(
+        "get",
+        "/devices/{serial}/wireless/latencyStats",
+        ("wireless", "monitor", "latencyStats"),
+        ("serial",),
+        query=frozenset({"t0", "t1", "timespan", "band", "ssid", "apTag", "vlan", "fields"}),
+        enums={
+            "band": ("2.4", "5", "6"),
+            "ssid": (0, 1, 2, 3, 4, 5, 6, 7, 8, 9, 10, 11, 12, 13, 14),
+        },
+    ),
+    "getDeviceWirelessRadioSettings": Operation(
+        "get",
+        "/devices/{serial}/wireless/radio/settings",
+        ("wireless", "configure", "radio", "settings"),
+        ("serial",),
+    ),
+    "updateDeviceWirelessRadioSettings": Operation(
+        "put",
+        "/devices/{serial}/wireless/radio/settings",
+        ("wireless", "configure", "radio", "settings"),
+        ("serial",),
+        body=frozenset({"rfProfileId", "twoFourGhzSettings", "fiveGhzSettings"}),
+    ),
+    "getDeviceWirelessStatus": Operation(
+        "get",
+        "/devices/{serial}/wireless/status",
+        ("wireless", "monitor", "status"),
+        ("serial",),
+    ),
+    "createDeviceWirelessZigbeeEnrollment": Operation(
+        "post",
+        "/devices/{serial}/wireless/zigbee/enrollments",
+        ("wireless", "configure", "zigbee", "enrollments"),
+        ("serial",),
+    ),
+    "getDeviceWirelessZigbeeEnrollment": Operation(
+        "get",
+        "/devices/{serial}/wireless/zigbee/enrollments/{enrollmentId}",
+        ("wireless", "configure", "zigbee", "enrollments"),
+        ("serial", "enrollmentId"),
+    ),
+    "getNetworkWirelessAirMarshal": Operation(
+        "get",
+        "/networks/{networkId}/wireless/airMarshal",
+        ("wireless", "monitor", "airMarshal"),
+        ("networkId",),
+        query=frozenset({"t0", "timespan"}),
+    ),
+    "createNetworkWirelessAirMarshalRule": Operation(
+        "post",
+        "/networks/{networkId}/wireless/airMarshal/rules",
+        ("wireless", "configure", "airMarshal", "rules"),
+        ("networkId",),
+        arguments=("networkId", "type", "match"),
+        body=frozenset({"type", "match"}),
+        enums={
+            "type": ("alert", "allow", "block"),
+        },
+    ),
+    "updateNetworkWirelessAirMarshalRule": Operation(
+        "put",
+        "/networks/{networkId}/wireless/airMarshal/rules/{ruleId}",
+        ("wireless", "configure", "airMarshal", "rules"),
+        ("networkId", "ruleId"),
+        body=frozenset({"type", "match"}),
+        enums={
+            "type": ("alert", "allow", "block"),
+        },
+    ),
+    "deleteNetworkWirelessAirMarshalRule": Operation(
+        "delete",
+        "/networks/{networkId}/wireless/airMarshal/rules/{ruleId}",
+        ("wireless", "configure", "airMarshal", "rules"),
+        ("networkId", "ruleId"),
+    ),
+    "updateNetworkWirelessAirMarshalSettings": Operation(
+        "put",
+        "/networks/{networkId}/wireless/airMarshal/settings",
+        ("wireless", "configure", "airMarshal", "settings"),
+        ("networkId",),
+        arguments=("networkId", "defaultPolicy"),
+        body=frozenset({"defaultPolicy"}),
+        enums={
+            "defaultPolicy": ("allow", "block"),
+        },
+    ),
+    "getNetworkWirelessAlternateManagementInterface": Operation(
+        "get",
+        "/networks/{networkId}/wireless/alternateManagementInterface",
+        ("wireless", "configure", "alternateManagementInterface"),
+        ("networkId",),
+    ),
+    "updateNetworkWirelessAlternateManagementInterface": Operation(
+        "put",
+        "/networks/{networkId}/wireless/alternateManagementInterface",
+        ("wireless", "configure", "alternateManagementInterface"),
+        ("networkId",),
+        body=frozenset({"enabled", "vlanId", "protocols", "accessPoints"}),
+    ),
+    "getNetworkWirelessBilling": Operation(
+        "get",
+        "/networks/{networkId}/wireless/billing",
+        ("wireless", "configure", "billing"),
+        ("networkId",),
+    ),
+    "updateNetworkWirelessBilling": Operation(
+        "put",
+        "/networks/{networkId}/wireless/billing",
+        ("wireless", "configure", "billing"),
+        ("networkId",),
+        body=frozenset({"currency", "plans"}),
+    ),
+    "getNetworkWirelessBluetoothSettings": Operation(
+        "get",
+        "/networks/{networkId}/wireless/bluetooth/settings",
+        ("wireless", "configure", "bluetooth", "settings"),
+        ("networkId",),
+    ),
+    "updateNetworkWirelessBluetoothSettings": Operation(
+        "put",
+        "/networks/{networkId}/wireless/bluetooth/settings",
+        ("wireless", "configure", "bluetooth", "settings"),
+        ("networkId",),
+        body=frozenset({"scanningEnabled", "advertisingEnabled", "uuid", "majorMinorAssignmentMode", "major", "minor"}),
+        enums={
+            "majorMinorAssignmentMode": ("Non-unique", "Unique"),
+        },
+    ),
+    "getNetworkWirelessChannelUtilizationHistory": Operation(
+        "get",
+        "/networks/{networkId}/wireless/channelUtilizationHistory",
+        ("wireless", "monitor", "channelUtilizationHistory"),
+        ("networkId",),
+        query=frozenset({"t0", "t1", "timespan", "resolution", "autoResolution", "clientId", "deviceSerial", "apTag", "band"}),
+        enums={
+            "band": ("2.4", "5", "6"),
+        },
+    ),
+    "getNetworkWirelessClientCountHistory": Operation(
+        "get",
+        "/networks/{networkId}/wireless/clientCountHistory",
+        ("wireless", "monitor", "clientCountHistory"),
+        ("networkId",),
+        query=frozenset(
+            {"t0", "t1", "timespan", "resolution", "autoResolution", "clientId", "deviceSerial", "apTag", "band", "ssid"}
+        ),
+        enums={
+            "band": ("2.4", "5", "6"),
+        },
+    ),
+    "getNetworkWirelessClientsConnectionStats": Operation(
+        "get",
+        "/networks/{networkId}/wireless/clients/connectionStats",
+        ("wireless", "monitor", "clients", "connectionStats"),
+        ("networkId",),
+        query=frozenset({"t0", "t1", "timespan", "band", "ssid", "apTag"}),
+        enums={
+            "band": ("2.4", "5", "6"),
+            "ssid": (0, 1, 2, 3, 4, 5, 6, 7, 8, 9, 10, 11, 12, 13, 14),
+        },
+    ),
+    "getNetworkWirelessClientsLatencyStats": Operation(
+        "get",
+        "/networks/{networkId}/wireless/clients/latencyStats",
+        ("wireless", "monitor", "clients", "latencyStats"),
+        ("networkId",),
+        query=frozenset({"t0", "t1", "timespan", "band", "ssid", "apTag", "vlan", "fields"}),
+        enums={
+            "band": ("2.4", "5", "6"),
+            "ssid": (0, 1, 2, 3, 4, 5, 6, 7, 8, 9, 10, 11, 12, 13, 14),
+        },
+    ),
+    "getNetworkWirelessClientConnectionStats": Operation(
+        "get",
+        "/networks/{networkId}/wireless/clients/{clientId}/connectionStats",
+        ("wireless", "monitor", "clients", "connectionStats"),
+        ("networkId", "clientId"),
+        query=frozenset({"t0", "t1", "timespan", "band", "ssid", "apTag"}),
+        enums={
+            "band": ("2.4", "5", "6"),
+            "ssid": (0, 1, 2, 3, 4, 5, 6, 7, 8, 9, 10, 11, 12, 13, 14),
+        },
+    ),
+    "getNetworkWirelessClientConnectivityEvents": Operation(
+        "get",
+        "/networks/{networkId}/wireless/clients/{clientId}/connectivityEvents",
+        ("wireless", "monitor", "clients", "connectivityEvents"),
+        ("networkId", "clientId"),
+        query=frozenset(
+            {
+                "perPage",
+                "startingAfter",
+                "endingBefore",
+                "sortOrder",
+                "t0",
+                "t1",
+                "timespan",
+                "types",
+                "band",
+                "ssidNumber",
+                "includedSeverities",
+                "deviceSerial",
+            }
+        ),
+        array=frozenset({"types", "includedSeverities"}),
+        paginated="next",
+        enums={
+            "sortOrder": ("ascending", "descending"),
+            "band": ("2.4", "5", "6"),
+            "ssidNumber": (0, 1, 2, 3, 4, 5, 6, 7, 8, 9, 10, 11, 12, 13, 14),
+        },
+    ),
+    "getNetworkWirelessClientLatencyHistory": Operation(
+        "get",
+        "/networks/{networkId}/wireless/clients/{clientId}/latencyHistory",
+        ("wireless", "monitor", "clients", "latencyHistory"),
+        ("networkId", "clientId"),
+        query=frozenset({"t0", "t1", "timespan", "resolution"}),
+    ),
+    "getNetworkWirelessClientLatencyStats": Operation(
+        "get",
+        "/networks/{networkId}/wireless/clients/{clientId}/latencyStats",
+        ("wireless", "monitor", "clients", "latencyStats"),
+        ("networkId", "clientId"),
+        query=frozenset({"t0", "t1", "timespan", "band", "ssid", "apTag", "vlan", "fields"}),
+        enums={
+            "band": ("2.4", "5", "6"),
+            "ssid": (0, 1, 2, 3, 4, 5, 6, 7, 8, 9, 10, 11, 12, 13, 14),
+        },
+    ),
+    "getNetworkWirelessConnectionStats": Operation(
+        "get",
+        "/networks/{networkId}/wireless/connectionStats",
+        ("wireless", "monitor", "connectionStats"),
+        ("networkId",),
+        query=frozenset({"t0", "t1", "timespan", "band", "ssid", "apTag"}),
+        enums={
+            "band": ("2.4", "5", "6"),
+            "ssid": (0, 1, 2, 3, 4, 5, 6, 7, 8, 9, 10, 11, 12, 13, 14),
+        },
+    ),
+    "getNetworkWirelessDataRateHistory": Operation(
+        "get",
+        "/networks/{networkId}/wireless/dataRateHistory",
+        ("wireless", "monitor", "dataRateHistory"),
+        ("networkId",),
+        query=frozenset(
+            {"t0", "t1", "timespan", "resolution", "autoResolution", "clientId", "deviceSerial", "apTag", "band", "ssid"}
+        ),
+        enums={
+            "band": ("2.4", "5", "6"),
+        },
+    ),
+    "getNetworkWirelessDevicesConnectionStats": Operation(
+        "get",
+        "/networks/{networkId}/wireless/devices/connectionStats",
+        ("wireless", "monitor", "devices", "connectionStats"),
+        ("networkId",),
+        query=frozenset({"t0", "t1", "timespan", "band", "ssid", "apTag"}),
+        enums={
+            "band": ("2.4", "5", "6"),
+            "ssid": (0, 1, 2, 3, 4, 5, 6, 7, 8, 9, 10, 11, 12, 13, 14),
+        },
+    ),
+    "getNetworkWirelessDevicesLatencyStats": Operation(
+        "get",
+        "/networks/{networkId}/wireless/devices/latencyStats",
+        ("wireless", "monitor", "devices", "latencyStats"),
+        ("networkId",),
+        query=frozenset({"t0", "t1", "timespan", "band", "ssid", "apTag", "vlan", "fields"}),
+        enums={
+            "band": ("2.4", "5", "6"),
+            "ssid": (0, 1, 2, 3, 4, 5, 6, 7, 8, 9, 10, 11, 12, 13, 14),
+        },
+    ),
+    "getNetworkWirelessElectronicShelfLabel": Operation(
+        "get",
+        "/networks/{networkId}/wireless/electronicShelfLabel",
+        ("wireless", "configure", "electronicShelfLabel"),
+        ("networkId",),
+    ),
+    "updateNetworkWirelessElectronicShelfLabel": Operation(
+        "put",
+        "/networks/{networkId}/wireless/electronicShelfLabel",
+        ("wireless", "configure", "electronicShelfLabel"),
+        ("networkId",),
+        body=frozenset({"hostname", "enabled", "mode"}),
+        enums={
+            "mode": ("Bluetooth", "high frequency"),
+        },
+    ),
+    "getNetworkWirelessElectronicShelfLabelConfiguredDevices": Operation(
+        "get",
+        "/networks/{networkId}/wireless/electronicShelfLabel/configuredDevices",
+        ("wireless", "configure", "electronicShelfLabel", "configuredDevices"),
+        ("networkId",),
+    ),
+    "getNetworkWirelessEthernetPortsProfiles": Operation(
+        "get",
+        "/networks/{networkId}/wireless/ethernet/ports/profiles",
+        ("wireless", "configure", "ethernet", "ports", "profiles"),
+        ("networkId",),
+    ),
+    "createNetworkWirelessEthernetPortsProfile": Operation(
+        "post",
+        "/networks/{networkId}/wireless/ethernet/ports/profiles",
+        ("wireless", "configure", "ethernet", "ports", "profiles"),
+        ("networkId",),
+        arguments=("networkId", "name", "ports"),
+        body=frozenset({"name", "ports", "usbPorts"}),
+    ),
+    "assignNetworkWirelessEthernetPortsProfiles": Operation(
+        "post",
+        "/networks/{networkId}/wireless/ethernet/ports/profiles/assign",
+        ("wireless", "configure", "ethernet", "ports", "profiles"),
+        ("networkId",),
+        arguments=("networkId", "serials", "profileId"),
+        body=frozenset({"serials", "profileId"}),
+    ),
+    "setNetworkWirelessEthernetPortsProfilesDefault": Operation(
+        "post",
+        "/networks/{networkId}/wireless/ethernet/ports/profiles/setDefault",
+        ("wireless", "configure", "ethernet", "ports", "profiles"),
+        ("networkId",),
+        arguments=("networkId", "profileId"),
+        body=frozenset({"profileId"}),
+    ),
+    "getNetworkWirelessEthernetPortsProfile": Operation(
+        "get",
+        "/networks/{networkId}/wireless/ethernet/ports/profiles/{profileId}",
+        ("wireless", "configure", "ethernet", "ports", "profiles"),
+        ("networkId", "profileId"),
+    ),
+    "updateNetworkWirelessEthernetPortsProfile": Operation(
+        "put",
+        "/networks/{networkId}/wireless/ethernet/ports/profiles/{profileId}",
+        ("wireless", "configure", "ethernet", "ports", "profiles"),
+        ("networkId", "profileId"),
+        body=frozenset({"name", "ports", "usbPorts"}),
+    ),
+    "deleteNetworkWirelessEthernetPortsProfile": Operation(
+        "delete",
+        "/networks/{networkId}/wireless/ethernet/ports/profiles/{profileId}",
+        ("wireless", "configure", "ethernet", "ports", "profiles"),
+        ("networkId", "profileId"),
+    ),
+    "getNetworkWirelessFailedConnections": Operation(
+        "get",
+        "/networks/{networkId}/wireless/failedConnections",
+        ("wireless", "monitor", "failedConnections"),
+        ("networkId",),
+        query=frozenset({"t0", "t1", "timespan", "band", "ssid", "apTag", "serial", "clientId"}),
+        enums={
+            "band": ("2.4", "5", "6"),
+            "ssid": (0, 1, 2, 3, 4, 5, 6, 7, 8, 9, 10, 11, 12, 13, 14),
+        },
+    ),
+    "getNetworkWirelessLatencyHistory": Operation(
+        "get",
+        "/networks/{networkId}/wireless/latencyHistory",
+        ("wireless", "monitor", "latencyHistory"),
+        ("networkId",),
+        query=frozenset(
+            {
+                "t0",
+                "t1",
+                "timespan",
+                "resolution",
+                "autoResolution",
+                "clientId",
+                "deviceSerial",
+                "apTag",
+                "band",
+                "ssid",
+                "accessCategory",
+            }
+        ),
+        enums={
+            "band": ("2.4", "5", "6"),
+            "accessCategory": ("backgroundTraffic", "bestEffortTraffic", "videoTraffic", "voiceTraffic"),
+        },
+    ),
+    "getNetworkWirelessLatencyStats": Operation(
+        "get",
+        "/networks/{networkId}/wireless/latencyStats",
+        ("wireless", "monitor", "latencyStats"),
+        ("networkId",),
+        query=frozenset({"t0", "t1", "timespan", "band", "ssid", "apTag", "vlan", "fields"}),
+        enums={
+            "band": ("2.4", "5", "6"),
+            "ssid": (0, 1, 2, 3, 4, 5, 6, 7, 8, 9, 10, 11, 12, 13, 14),
+        },
+    ),
+    "updateNetworkWirelessLocationScanning": Operation(
+        "put",
+        "/networks/{networkId}/wireless/location/scanning",
+        ("wireless", "configure", "location", "scanning"),
+        ("networkId",),
+        body=frozenset({"enabled", "api"}),
+    ),
+    "getNetworkWirelessMeshStatuses": Operation(
+        "get",
+        "/networks/{networkId}/wireless/meshStatuses",
+        ("wireless", "monitor", "meshStatuses"),
+        ("networkId",),
+        query=frozenset({"perPage", "startingAfter", "endingBefore"}),
+        paginated="next",
+    ),
+    "updateNetworkWirelessRadioRrm": Operation(
+        "put",
+        "/networks/{networkId}/wireless/radio/rrm",
+        ("wireless", "configure", "radio", "rrm"),
+        ("networkId",),
+        body=frozenset({"busyHour", "channel", "fra", "ai"}),
+    ),
+    "getNetworkWirelessRfProfiles": Operation(
+        "get",
+        "/networks/{networkId}/wireless/rfProfiles",
+        ("wireless", "configure", "rfProfiles"),
+        ("networkId",),
+        query=frozenset({"includeTemplateProfiles"}),
+    ),
+    "createNetworkWirelessRfProfile": Operation(
+        "post",
+        "/networks/{networkId}/wireless/rfProfiles",
+        ("wireless", "configure", "rfProfiles"),
+        ("networkId",),
+        arguments=("networkId", "name", "bandSelectionType"),
+        body=frozenset(
+            {
+                "name",
+                "clientBalancingEnabled",
+                "minBitrateType",
+                "bandSelectionType",
+                "apBandSettings",
+                "twoFourGhzSettings",
+                "fiveGhzSettings",
+                "sixGhzSettings",
+                "transmission",
+                "perSsidSettings",
+                "flexRadios",
+            }
+        ),
+        enums={
+            "minBitrateType": ("band", "ssid"),
+            "bandSelectionType": ("ap", "ssid"),
+        },
+    ),
+    "updateNetworkWirelessRfProfile": Operation(
+        "put",
+        "/networks/{networkId}/wireless/rfProfiles/{rfProfileId}",
+        ("wireless", "configure", "rfProfiles"),
+        ("networkId", "rfProfileId"),
+        body=frozenset(
+            {
+                "name",
+                "isIndoorDefault",
+                "isOutdoorDefault",
+                "clientBalancingEnabled",
+                "minBitrateType",
+                "bandSelectionType",
+                "apBandSettings",
+                "twoFourGhzSettings",
+                "fiveGhzSettings",
+                "sixGhzSettings",
+                "transmission",
+                "perSsidSettings",
+                "flexRadios",
+            }
+        ),
+        enums={
+            "minBitrateType": ("band", "ssid"),
+            "bandSelectionType": ("ap", "ssid"),
+        },
+    ),
+    "deleteNetworkWirelessRfProfile": Operation(
+        "delete",
+        "/networks/{networkId}/wireless/rfProfiles/{rfProfileId}",
+        ("wireless", "configure", "rfProfiles"),
+        ("networkId", "rfProfileId"),
+    ),
+    "getNetworkWirelessRfProfile": Operation(
+        "get",
+        "/networks/{networkId}/wireless/rfProfiles/{rfProfileId}",
+        ("wireless", "configure", "rfProfiles"),
+        ("networkId", "rfProfileId"),
+    ),
+    "getNetworkWirelessSettings": Operation(
+        "get",
+        "/networks/{networkId}/wireless/settings",
+        ("wireless", "configure", "settings"),
+        ("networkId",),
+    ),
+    "updateNetworkWirelessSettings": Operation(
+        "put",
+        "/networks/{networkId}/wireless/settings",
+        ("wireless", "configure", "settings"),
+        ("networkId",),
+        body=frozenset(
+            {
+                "meshingEnabled",
+                "ipv6BridgeEnabled",
+                "locationAnalyticsEnabled",
+                "upgradeStrategy",
+                "upgrade",
+                "ledLightsOn",
+                "multicastToUnicastConversion",
+                "namedVlans",
+            }
+        ),
+        enums={
+            "upgradeStrategy": ("minimizeClientDowntime", "minimizeUpgradeTime"),
+        },
+    ),
+    "getNetworkWirelessSignalQualityHistory": Operation(
+        "get",
+        "/networks/{networkId}/wireless/signalQualityHistory",
+        ("wireless", "monitor", "signalQualityHistory"),
+        ("networkId",),
+        query=frozenset(
+            {"t0", "t1", "timespan", "resolution", "autoResolution", "clientId", "deviceSerial", "apTag", "band", "ssid"}
+        ),
+        enums={
+            "band": ("2.4", "5", "6"),
+        },
+    ),
+    "getNetworkWirelessSsids": Operation(
+        "get",
+        "/networks/{networkId}/wireless/ssids",
+        ("wireless", "configure", "ssids"),
+        ("networkId",),
+    ),
+    "getNetworkWirelessSsid": Operation(
+        "get",
+        "/networks/{networkId}/wireless/ssids/{number}",
+        ("wireless", "configure", "ssids"),
+        ("networkId", "number"),
+    ),
+    "updateNetworkWirelessSsid": Operation(
+        "put",
+        "/networks/{networkId}/wireless/ssids/{number}",
+        ("wireless", "configure", "ssids"),
+        ("networkId", "number"),
+        body=frozenset(
+            {
+                "name",
+                "enabled",
+                "authMode",
+                "enterpriseAdminAccess",
+                "ssidAdminAccessible",
+                "encryptionMode",
+                "psk",
+                "wpaEncryptionMode",
+                "dot11w",
+                "dot11r",
+                "splashPage",
+                "splashGuestSponsorDomains",
+                "oauth",
+                "localRadius",
+                "ldap",
+                "activeDirectory",
+                "radiusServers",
+                "radiusProxyEnabled",
+                "radiusTestingEnabled",
+                "radiusCalledStationId",
+                "radiusAuthenticationNasId",
+                "radiusServerTimeout",
+                "radiusServerAttemptsLimit",
+                "radiusFallbackEnabled",
+                "radiusRadsec",
+                "radiusCoaEnabled",
+                "radiusFailoverPolicy",
+                "radiusLoadBalancingPolicy",
+                "radiusAccountingEnabled",
+                "radiusAccountingServers",
+                "radiusAccountingInterimInterval",
+                "radiusAttributeForGroupPolicies",
+                "ipAssignmentMode",
+                "useVlanTagging",
+                "concentratorNetworkId",
+                "secondaryConcentratorNetworkId",
+                "disassociateClientsOnVpnFailover",
+                "vlanId",
+                "defaultVlanId",
+                "apTagsAndVlanIds",
+                "walledGardenEnabled",
+                "walledGardenRanges",
+                "gre",
+                "radiusOverride",
+                "radiusGuestVlanEnabled",
+                "radiusGuestVlanId",
+                "minBitrate",
+                "bandSelection",
+                "perClientBandwidthLimitUp",
+                "perClientBandwidthLimitDown",
+                "perSsidBandwidthLimitUp",
+                "perSsidBandwidthLimitDown",
+                "lanIsolationEnabled",
+                "visible",
+                "availableOnAllAps",
+                "availabilityTags",
+                "adaptivePolicyGroupId",
+                "mandatoryDhcpEnabled",
+                "adultContentFilteringEnabled",
+                "dnsRewrite",
+                "speedBurst",
+                "namedVlans",
+                "security",
+                "localAuthFallback",
+                "radiusAccountingStartDelay",
+            }
+        ),
+        enums={
+            "authMode": (
+                "8021x-entra",
+                "8021x-google",
+                "8021x-localradius",
+                "8021x-meraki",
+                "8021x-nac",
+                "8021x-radius",
+                "ipsk-with-nac",
+                "ipsk-with-radius",
+                "ipsk-with-radius-easy-psk",
+                "ipsk-without-radius",
+                "open",
+                "open-enhanced",
+                "open-enhanced-with-radius",
+                "open-with-nac",
+                "open-with-radius",
+                "psk",
+            ),
+            "enterpriseAdminAccess": ("access disabled", "access enabled"),
+            "encryptionMode": ("open", "wep", "wpa", "wpa-eap"),
+            "wpaEncryptionMode": (
+                "WPA1 and WPA2",
+                "WPA1 only",
+                "WPA2 only",
+                "WPA3 192-bit Security",
+                "WPA3 Transition Mode",
+                "WPA3 only",
+            ),
+            "splashPage": (
+                "Billing",
+                "Cisco ISE",
+                "Click-through splash page",
+                "Facebook Wi-Fi",
+                "Google Apps domain",
+                "Google OAuth",
+                "Microsoft Entra ID",
+                "None",
+                "Password-protected with Active Directory",
+                "Password-protected with LDAP",
+                "Password-protected with Meraki RADIUS",
+                "Password-protected with custom RADIUS",
+                "SMS authentication",
+                "Sponsored guest",
+                "Systems Manager Sentry",
+            ),
+            "radiusFailoverPolicy": ("Allow access", "Deny access"),
+            "radiusLoadBalancingPolicy": ("Round robin", "Strict priority order"),
+            "radiusAttributeForGroupPolicies": ("Airespace-ACL-Name", "Aruba-User-Role", "Filter-Id", "Reply-Message"),
+        },
+    ),
+    "getNetworkWirelessSsidBonjourForwarding": Operation(
+        "get",
+        "/networks/{networkId}/wireless/ssids/{number}/bonjourForwarding",
+        ("wireless", "configure", "ssids", "bonjourForwarding"),
+        ("networkId", "number"),
+    ),
+    "updateNetworkWirelessSsidBonjourForwarding": Operation(
+        "put",
+        "/networks/{networkId}/wireless/ssids/{number}/bonjourForwarding",
+        ("wireless", "configure", "ssids", "bonjourForwarding"),
+        ("networkId", "number"),
+        body=frozenset({"enabled", "rules", "exception"}),
+    ),
+    "getNetworkWirelessSsidDeviceTypeGroupPolicies": Operation(
+        "get",
+        "/networks/{networkId}/wireless/ssids/{number}/deviceTypeGroupPolicies",
+        ("wireless", "configure", "ssids", "deviceTypeGroupPolicies"),
+        ("networkId", "number"),
+    ),
+    "updateNetworkWirelessSsidDeviceTypeGroupPolicies": Operation(
+        "put",
+        "/networks/{networkId}/wireless/ssids/{number}/deviceTypeGroupPolicies",
+        ("wireless", "configure", "ssids", "deviceTypeGroupPolicies"),
+        ("networkId", "number"),
+        body=frozenset({"enabled", "deviceTypePolicies"}),
+    ),
+    "getNetworkWirelessSsidEapOverride": Operation(
+        "get",
+        "/networks/{networkId}/wireless/ssids/{number}/eapOverride",
+        ("wireless", "configure", "ssids", "eapOverride"),
+        ("networkId", "number"),
+    ),
+    "updateNetworkWirelessSsidEapOverride": Operation(
+        "put",
+        "/networks/{networkId}/wireless/ssids/{number}/eapOverride",
+        ("wireless", "configure", "ssids", "eapOverride"),
+        ("networkId", "number"),
+        body=frozenset({"timeout", "identity", "maxRetries", "eapolKey"}),
+    ),
+    "getNetworkWirelessSsidFirewallL3FirewallRules": Operation(
+        "get",
+        "/networks/{networkId}/wireless/ssids/{number}/firewall/l3FirewallRules",
+        ("wireless", "configure", "ssids", "firewall", "l3FirewallRules"),
+        ("networkId", "number"),
+    ),
+    "updateNetworkWirelessSsidFirewallL3FirewallRules": Operation(
+        "put",
+        "/networks/{networkId}/wireless/ssids/{number}/firewall/l3FirewallRules",
+        ("wireless", "configure", "ssids", "firewall", "l3FirewallRules"),
+        ("networkId", "number"),
+        body=frozenset({"rules", "allowLanAccess"}),
+    ),
+    "getNetworkWirelessSsidFirewallL7FirewallRules": Operation(
+        "get",
+        "/networks/{networkId}/wireless/ssids/{number}/firewall/l7FirewallRules",
+        ("wireless", "configure", "ssids", "firewall", "l7FirewallRules"),
+        ("networkId", "number"),
+    ),
+    "updateNetworkWirelessSsidFirewallL7FirewallRules": Operation(
+        "put",
+        "/networks/{networkId}/wireless/ssids/{number}/firewall/l7FirewallRules",
+        ("wireless", "configure", "ssids", "firewall", "l7FirewallRules"),
+        ("networkId", "number"),
+        body=frozenset({"rules"}),
+    ),
+    "getNetworkWirelessSsidHotspot20": Operation(
+        "get",
+        "/networks/{networkId}/wireless/ssids/{number}/hotspot20",
+        ("wireless", "configure", "ssids", "hotspot20"),
+        ("networkId", "number"),
+    ),
+    "updateNetworkWirelessSsidHotspot20": Operation(
+        "put",
+        "/networks/{networkId}/wireless/ssids/{number}/hotspot20",
+        ("wireless", "configure", "ssids", "hotspot20"),
+        ("networkId", "number"),
+        body=frozenset(
+            {"enabled", "operator", "venue", "networkAccessType", "domains", "roamConsortOis", "mccMncs", "naiRealms"}
+        ),
+        enums={
+            "networkAccessType": (
+                "Chargeable public network",
+                "Emergency services only network",
+                "Free public network",
+                "Personal device network",
+                "Private network",
+                "Private network with guest access",
+                "Test or experimental",
+                "Wildcard",
+            ),
+        },
+    ),
+    "getNetworkWirelessSsidIdentityPsks": Operation(
+        "get",
+        "/networks/{networkId}/wireless/ssids/{number}/identityPsks",
+        ("wireless", "configure", "ssids", "identityPsks"),
+        ("networkId", "number"),
+    ),
+    "createNetworkWirelessSsidIdentityPsk": Operation(
+        "post",
+        "/networks/{networkId}/wireless/ssids/{number}/identityPsks",
+        ("wireless", "configure", "ssids", "identityPsks"),
+        ("networkId", "number"),
+        arguments=("networkId", "number", "name", "groupPolicyId"),
+        body=frozenset({"name", "passphrase", "groupPolicyId", "expiresAt"}),
+    ),
+    "getNetworkWirelessSsidIdentityPsk": Operation(
+        "get",
+        "/networks/{networkId}/wireless/ssids/{number}/identityPsks/{identityPskId}",
+        ("wireless", "configure", "ssids", "identityPsks"),
+        ("networkId", "number", "identityPskId"),
+    ),
+    "updateNetworkWirelessSsidIdentityPsk": Operation(
+        "put",
+        "/networks/{networkId}/wireless/ssids/{number}/identityPsks/{identityPskId}",
+        ("wireless", "configure", "ssids", "identityPsks"),
+        ("networkId", "number", "identityPskId"),
+        body=frozenset({"name", "passphrase", "groupPolicyId", "expiresAt"}),
+    ),
+    "deleteNetworkWirelessSsidIdentityPsk": Operation(
+        "delete",
+        "/networks/{networkId}/wireless/ssids/{number}/identityPsks/{identityPskId}",
+        ("wireless", "configure", "ssids", "identityPsks"),
+        ("networkId", "number", "identityPskId"),
+    ),
+    "updateNetworkWirelessSsidOpenRoaming": Operation(
+        "put",
+        "/networks/{networkId}/wireless/ssids/{number}/openRoaming",
+        ("wireless", "configure", "ssids", "openRoaming"),
+        ("networkId", "number"),
+        body=frozenset({"enabled", "tenantId"}),
+    ),
+    "getNetworkWirelessSsidSchedules": Operation(
+        "get",
+        "/networks/{networkId}/wireless/ssids/{number}/schedules",
+        ("wireless", "configure", "ssids", "schedules"),
+        ("networkId", "number"),
+    ),
+    "updateNetworkWirelessSsidSchedules": Operation(
+        "put",
+        "/networks/{networkId}/wireless/ssids/{number}/schedules",
+        ("wireless", "configure", "ssids", "schedules"),
+        ("networkId", "number"),
+        body=frozenset({"enabled", "ranges", "rangesInSeconds"}),
+    ),
+    "getNetworkWirelessSsidSplashSettings": Operation(
+        "get",
+        "/networks/{networkId}/wireless/ssids/{number}/splash/settings",
+        ("wireless", "configure", "ssids", "splash", "settings"),
+        ("networkId", "number"),
+    ),
+    "updateNetworkWirelessSsidSplashSettings": Operation(
+        "put",
+        "/networks/{networkId}/wireless/ssids/{number}/splash/settings",
+        ("wireless", "configure", "ssids", "splash", "settings"),
+        ("networkId", "number"),
+        body=frozenset(
+            {
+                "splashUrl",
+                "useSplashUrl",
+                "splashTimeout",
+                "redirectUrl",
+                "useRedirectUrl",
+                "welcomeMessage",
+                "userConsent",
+                "themeId",
+                "splashLogo",
+                "splashImage",
+                "splashPrepaidFront",
+                "blockAllTrafficBeforeSignOn",
+                "controllerDisconnectionBehavior",
+                "allowSimultaneousLogins",
+                "guestSponsorship",
+                "billing",
+                "sentryEnrollment",
+                "selfRegistration",
+            }
+        ),
+        enums={
+            "splashTimeout": (30, 60, 120, 240, 480, 720, 1080, 1440, 2880, 5760, 7200, 10080, 20160, 43200, 86400, 129600),
+            "controllerDisconnectionBehavior": ("default", "open", "restricted"),
+        },
+    ),
+    "updateNetworkWirelessSsidTrafficShapingRules": Operation(
+        "put",
+        "/networks/{networkId}/wireless/ssids/{number}/trafficShaping/rules",
+        ("wireless", "configure", "ssids", "trafficShaping", "rules"),
+        ("networkId", "number"),
+        body=frozenset({"trafficShapingEnabled", "defaultRulesEnabled", "rules"}),
+    ),
+    "getNetworkWirelessSsidTrafficShapingRules": Operation(
+        "get",
+        "/networks/{networkId}/wireless/ssids/{number}/trafficShaping/rules",
+        ("wireless", "configure", "ssids", "trafficShaping", "rules"),
+        ("networkId", "number"),
+    ),
+    "getNetworkWirelessSsidVpn": Operation(
+        "get",
+        "/networks/{networkId}/wireless/ssids/{number}/vpn",
+        ("wireless", "configure", "ssids", "vpn"),
+        ("networkId", "number"),
+    ),
+    "updateNetworkWirelessSsidVpn": Operation(
+        "put",
+        "/networks/{networkId}/wireless/ssids/{number}/vpn",
+        ("wireless", "configure", "ssids", "vpn"),
+        ("networkId", "number"),
+        body=frozenset({"concentrator", "splitTunnel", "failover"}),
+    ),
+    "getNetworkWirelessUsageHistory": Operation(
+        "get",
+        "/networks/{networkId}/wireless/usageHistory",
+        ("wireless", "monitor", "usageHistory"),
+        ("networkId",),
+        query=frozenset(
+            {"t0", "t1", "timespan", "resolution", "autoResolution", "clientId", "deviceSerial", "apTag", "band", "ssid"}
+        ),
+        enums={
+            "band": ("2.4", "5", "6"),
+        },
+    ),
+    "updateNetworkWirelessZigbee": Operation(
+        "put",
+        "/networks/{networkId}/wireless/zigbee",
+        ("wireless", "configure", "zigbee"),
+        ("networkId",),
+        body=frozenset({"enabled", "iotController", "lockManagement", "defaults"}),
+    ),
+    "getOrganizationWirelessAirMarshalRules": Operation(
+        "get",
+        "/organizations/{organizationId}/wireless/airMarshal/rules",
+        ("wireless", "configure", "airMarshal", "rules"),
+        ("organizationId",),
+        query=frozenset({"networkIds", "perPage", "startingAfter", "endingBefore"}),
+        array=frozenset({"networkIds"}),
+        paginated="next",
+    ),
+    "getOrganizationWirelessAirMarshalSettingsByNetwork": Operation(
+        "get",
+        "/organizations/{organizationId}/wireless/airMarshal/settings/byNetwork",
+        ("wireless", "configure", "airMarshal", "settings", "byNetwork"),
+        ("organizationId",),
+        query=frozenset({"networkIds", "perPage", "startingAfter", "endingBefore"}),
+        array=frozenset({"networkIds"}),
+        paginated="next",
+    ),
+    "getOrganizationWirelessClientsOverviewByDevice": Operation(
+        "get",
+        "/organizations/{organizationId}/wireless/clients/overview/byDevice",
+        ("wireless", "monitor", "clients", "overview", "byDevice"),
+        ("organizationId",),
+        query=frozenset({"networkIds", "serials", "campusGatewayClusterIds", "perPage", "startingAfter", "endingBefore"}),
+        array=frozenset({"networkIds", "serials", "campusGatewayClusterIds"}),
+        paginated="next",
+    ),
+    "getOrganizationWirelessDevicesChannelUtilizationByDevice": Operation(
+        "get",
+        "/organizations/{organizationId}/wireless/devices/channelUtilization/byDevice",
+        ("wireless", "monitor", "devices", "channelUtilization", "byDevice"),
+        ("organizationId",),
+        query=frozenset(
+            {"networkIds", "serials", "perPage", "startingAfter", "endingBefore", "t0", "t1", "timespan", "interval"}
+        ),
+        array=frozenset({"networkIds", "serials"}),
+        paginated="next",
+    ),
+    "getOrganizationWirelessDevicesChannelUtilizationByNetwork": Operation(
+        "get",
+        "/organizations/{organizationId}/wireless/devices/channelUtilization/byNetwork",
+        ("wireless", "monitor", "devices", "channelUtilization", "byNetwork"),
+        ("organizationId",),
+        query=frozenset(
+            {"networkIds", "serials", "perPage", "startingAfter", "endingBefore", "t0", "t1", "timespan", "interval"}
+        ),
+        array=frozenset({"networkIds", "serials"}),
+        paginated="next",
+    ),
+    "getOrganizationWirelessDevicesChannelUtilizationHistoryByDeviceByInterval": Operation(
+        "get",
+        "/organizations/{organizationId}/wireless/devices/channelUtilization/history/byDevice/byInterval",
+        ("wireless", "monitor", "devices", "channelUtilization", "history", "byDevice", "byInterval"),
+        ("organizationId",),
+        query=frozenset(
+            {"networkIds", "serials", "perPage", "startingAfter", "endingBefore", "t0", "t1", "timespan", "interval"}
+        ),
+        array=frozenset({"networkIds", "serials"}),
+        paginated="next",
+    ),
+    "getOrganizationWirelessDevicesChannelUtilizationHistoryByNetworkByInterval": Operation(
+        "get",
+        "/organizations/{organizationId}/wireless/devices/channelUtilization/history/byNetwork/byInterval",
+        ("wireless", "monitor", "devices", "channelUtilization", "history", "byNetwork", "byInterval"),
+        ("organizationId",),
+        query=frozenset(
+            {"networkIds", "serials", "perPage", "startingAfter", "endingBefore", "t0", "t1", "timespan", "interval"}
+        ),
+        array=frozenset({"networkIds", "serials"}),
+        paginated="next",
+    ),
+    "getOrganizationWirelessDevicesEthernetStatuses": Operation(
+        "get",
+        "/organizations/{organizationId}/wireless/devices/ethernet/statuses",
+        ("wireless", "monitor", "devices", "ethernet", "statuses"),
+        ("organizationId",),
+        query=frozenset({"perPage", "startingAfter", "endingBefore", "networkIds"}),
+        array=frozenset({"networkIds"}),
+        paginated="next",
+    ),
+    "getOrganizationWirelessDevicesPacketLossByClient": Operation(
+        "get",
+        "/organizations/{organizationId}/wireless/devices/packetLoss/byClient",
+        ("wireless", "monitor", "devices", "packetLoss", "byClient"),
+        ("organizationId",),
+        query=frozenset(
+            {"networkIds", "ssids", "bands", "macs", "perPage", "startingAfter", "endingBefore", "t0", "t1", "timespan"}
+        ),
+        array=frozenset({"networkIds", "ssids", "bands", "macs"}),
+        paginated="next",
+    ),
+    "getOrganizationWirelessDevicesPacketLossByDevice": Operation(
+        "get",
+        "/organizations/{organizationId}/wireless/devices/packetLoss/byDevice",
+        ("wireless", "monitor", "devices", "packetLoss", "byDevice"),
+        ("organizationId",),
+        query=frozenset(
+            {"networkIds", "serials", "ssids", "bands", "perPage", "startingAfter", "endingBefore", "t0", "t1", "timespan"}
+        ),
+        array=frozenset({"networkIds", "serials", "ssids", "bands"}),
+        paginated="next",
+    ),
+    "getOrganizationWirelessDevicesPacketLossByNetwork": Operation(
+        "get",
+        "/organizations/{organizationId}/wireless/devices/packetLoss/byNetwork",
+        ("wireless", "monitor", "devices", "packetLoss", "byNetwork"),
+        ("organizationId",),
+        query=frozenset(
+            {"networkIds", "serials", "ssids", "bands", "perPage", "startingAfter", "endingBefore", "t0", "t1", "timespan"}
+        ),
+        array=frozenset({"networkIds", "serials", "ssids", "bands"}),
+        paginated="next",
+    ),
+    "getOrganizationWirelessDevicesPowerModeHistory": Operation(
+        "get",
+        "/organizations/{organizationId}/wireless/devices/power/mode/history",
+        ("wireless", "monitor", "devices", "power", "mode", "history"),
+        ("organizationId",),
+        query=frozenset({"t0", "t1", "timespan", "perPage", "startingAfter", "endingBefore", "networkIds", "serials"}),
+        array=frozenset({"networkIds", "serials"}),
+        paginated="next",
+    ),
+    "getOrganizationWirelessDevicesProvisioningDeployments": Operation(
+        "get",
+        "/organizations/{organizationId}/wireless/devices/provisioning/deployments",
+        ("wireless", "configure", "devices", "provisioning", "deployments"),
+        ("organizationId",),
+        query=frozenset({"perPage", "startingAfter", "endingBefore", "search", "sortBy", "sortOrder", "deploymentType"}),
+        paginated="next",
+        enums={
+            "sortBy": ("afterAction", "createdAt", "deploymentId", "name", "status"),
+            "sortOrder": ("asc", "desc"),
+            "deploymentType": ("deploy", "replace"),
+        },
+    ),
+    "createOrganizationWirelessDevicesProvisioningDeployment": Operation(
+        "post",
+        "/organizations/{organizationId}/wireless/devices/provisioning/deployments",
+        ("wireless", "configure", "devices", "provisioning", "deployments"),
+        ("organizationId",),
+        arguments=("organizationId", "items"),
+        body=frozenset({"items", "meta"}),
+    ),
+    "updateOrganizationWirelessDevicesProvisioningDeployments": Operation(
+        "put",
+        "/organizations/{organizationId}/wireless/devices/provisioning/deployments",
+        ("wireless", "configure", "devices", "provisioning", "deployments"),
+        ("organizationId",),
+        arguments=("organizationId", "items"),
+        body=frozenset({"items", "meta"}),
+    ),
+    "deleteOrganizationWirelessDevicesProvisioningDeployment": Operation(
+        "delete",
+        "/organizations/{organizationId}/wireless/devices/provisioning/deployments/{deploymentId}",
+        ("wireless", "configure", "devices", "provisioning", "deployments"),
+        ("organizationId", "deploymentId"),
+    ),
+    "getOrganizationWirelessDevicesRadsecCertificatesAuthorities": Operation(
+        "get",
+        "/organizations/{organizationId}/wireless/devices/radsec/certificates/authorities",
+        ("wireless", "configure", "devices", "radsec", "certificates", "authorities"),
+        ("organizationId",),
+        query=frozenset({"certificateAuthorityIds"}),
+        array=frozenset({"certificateAuthorityIds"}),
+    ),
+    "updateOrganizationWirelessDevicesRadsecCertificatesAuthorities": Operation(
+        "put",
+        "/organizations/{organizationId}/wireless/devices/radsec/certificates/authorities",
+        ("wireless", "configure", "devices", "radsec", "certificates", "authorities"),
+        ("organizationId",),
+        body=frozenset({"status", "certificateAuthorityId"}),
+    ),
+    "createOrganizationWirelessDevicesRadsecCertificatesAuthority": Operation(
+        "post",
+        "/organizations/{organizationId}/wireless/devices/radsec/certificates/authorities",
+        ("wireless", "configure", "devices", "radsec", "certificates", "authorities"),
+        ("organizationId",),
+    ),
+    "getOrganizationWirelessDevicesRadsecCertificatesAuthoritiesCrls": Operation(
+        "get",
+        "/organizations/{organizationId}/wireless/devices/radsec/certificates/authorities/crls",
+        ("wireless", "configure", "devices", "radsec", "certificates", "authorities", "crls"),
+        ("organizationId",),
+        query=frozenset({"certificateAuthorityIds"}),
+        array=frozenset({"certificateAuthorityIds"}),
+    ),
+    "getOrganizationWirelessDevicesRadsecCertificatesAuthoritiesCrlsDeltas": Operation(
+        "get",
+        "/organizations/{organizationId}/wireless/devices/radsec/certificates/authorities/crls/deltas",
+        ("wireless", "configure", "devices", "radsec", "certificates", "authorities", "crls", "deltas"),
+        ("organizationId",),
+        query=frozenset({"certificateAuthorityIds"}),
+        array=frozenset({"certificateAuthorityIds"}),
+    ),
+    "getOrganizationWirelessDevicesSystemCpuLoadHistory": Operation(
+        "get",
+        "/organizations/{organizationId}/wireless/devices/system/cpu/load/history",
+        ("wireless", "monitor", "devices", "system", "cpu", "load", "history"),
+        ("organizationId",),
+        query=frozenset({"t0", "t1", "timespan", "perPage", "startingAfter", "endingBefore", "networkIds", "serials"}),
+        array=frozenset({"networkIds", "serials"}),
+        paginated="next",
+    ),
+    "getOrganizationWirelessDevicesWirelessControllersByDevice": Operation(
+        "get",
+        "/organizations/{organizationId}/wireless/devices/wirelessControllers/byDevice",
+        ("wireless", "monitor", "devices", "wirelessControllers", "byDevice"),
+        ("organizationId",),
+        query=frozenset({"networkIds", "serials", "controllerSerials", "perPage", "startingAfter", "endingBefore"}),
+        array=frozenset({"networkIds", "serials", "controllerSerials"}),
+        paginated="next",
+    ),
+    "getOrganizationWirelessLocationScanningByNetwork": Operation(
+        "get",
+        "/organizations/{organizationId}/wireless/location/scanning/byNetwork",
+        ("wireless", "configure", "location", "scanning", "byNetwork"),
+        ("organizationId",),
+        query=frozenset({"perPage", "startingAfter", "endingBefore", "networkIds"}),
+        array=frozenset({"networkIds"}),
+        paginated="next",
+    ),
+    "getOrganizationWirelessLocationScanningReceivers": Operation(
+        "get",
+        "/organizations/{organizationId}/wireless/location/scanning/receivers",
+        ("wireless", "configure", "location", "scanning", "receivers"),
+        ("organizationId",),
+        query=frozenset({"perPage", "startingAfter", "endingBefore", "networkIds"}),
+        array=frozenset({"networkIds"}),
+        paginated="next",
+    ),
+    "createOrganizationWirelessLocationScanningReceiver": Operation(
+        "post",
+        "/organizations/{organizationId}/wireless/location/scanning/receivers",
+        ("wireless", "configure", "location", "scanning", "receivers"),
+        ("organizationId",),
+        arguments=("organizationId", "network", "url", "version", "radio", "sharedSecret"),
+        body=frozenset({"network", "url", "version", "radio", "sharedSecret"}),
+    ),
+    "updateOrganizationWirelessLocationScanningReceiver": Operation(
+        "put",
+        "/organizations/{organizationId}/wireless/location/scanning/receivers/{receiverId}",
+        ("wireless", "configure", "location", "scanning", "receivers"),
+        ("organizationId", "receiverId"),
+        body=frozenset({"url", "version", "radio"}),
+    ),
+    "deleteOrganizationWirelessLocationScanningReceiver": Operation(
+        "delete",
+        "/organizations/{organizationId}/wireless/location/scanning/receivers/{receiverId}",
+        ("wireless", "configure", "location", "scanning", "receivers"),
+        ("organizationId", "receiverId"),
+    ),
+    "getOrganizationWirelessMqttSettings": Operation(
+        "get",
+        "/organizations/{organizationId}/wireless/mqtt/settings",
+        ("wireless", "configure", "mqtt", "settings"),
+        ("organizationId",),
+        query=frozenset({"perPage", "startingAfter", "endingBefore", "networkIds"}),
+        array=frozenset({"networkIds"}),
+        paginated="next",
+    ),
+    "updateOrganizationWirelessMqttSettings": Operation(
+        "put",
+        "/organizations/{organizationId}/wireless/mqtt/settings",
+        ("wireless", "configure", "mqtt", "settings"),
+        ("organizationId",),
+        arguments=("organizationId", "network", "mqtt"),
+        body=frozenset({"network", "mqtt", "ble", "wifi"}),
+    ),
+    "recalculateOrganizationWirelessRadioAutoRfChannels": Operation(
+        "post",
+        "/organizations/{organizationId}/wireless/radio/autoRf/channels/recalculate",
+        ("wireless", "configure", "radio", "autoRf", "channels"),
+        ("organizationId",),
+        arguments=("organizationId", "networkIds"),
+        body=frozenset({"networkIds"}),
+    ),
+    "getOrganizationWirelessRadioRrmByNetwork": Operation(
+        "get",
+        "/organizations/{organizationId}/wireless/radio/rrm/byNetwork",
+        ("wireless", "configure", "radio", "rrm", "byNetwork"),
+        ("organizationId",),
+        query=frozenset({"networkIds", "startingAfter", "endingBefore", "perPage", "sortOrder"}),
+        array=frozenset({"networkIds"}),
+        paginated="next",
+        enums={
+            "sortOrder": ("ascending", "descending"),
+        },
+    ),
+    "getOrganizationWirelessRfProfilesAssignmentsByDevice": Operation(
+        "get",
+        "/organizations/{organizationId}/wireless/rfProfiles/assignments/byDevice",
+        ("wireless", "configure", "rfProfiles", "assignments", "byDevice"),
+        ("organizationId",),
+        query=frozenset(
+            {
+                "perPage",
+                "startingAfter",
+                "endingBefore",
+                "networkIds",
+                "productTypes",
+                "name",
+                "mac",
+                "serial",
+                "model",
+                "macs",
+                "serials",
+                "models",
+            }
+        ),
+        array=frozenset({"networkIds", "productTypes", "macs", "serials", "models"}),
+        paginated="next",
+    ),
+    "getOrganizationWirelessSsidsFirewallIsolationAllowlistEntries": Operation(
+        "get",
+        "/organizations/{organizationId}/wireless/ssids/firewall/isolation/allowlist/entries",
+        ("wireless", "configure", "ssids", "firewall", "isolation", "allowlist", "entries"),
+        ("organizationId",),
+        query=frozenset({"perPage", "startingAfter", "endingBefore", "networkIds", "ssids"}),
+        array=frozenset({"networkIds", "ssids"}),
+        paginated="next",
+    ),
+    "createOrganizationWirelessSsidsFirewallIsolationAllowlistEntry": Operation(
+        "post",
+        "/organizations/{organizationId}/wireless/ssids/firewall/isolation/allowlist/entries",
+        ("wireless", "configure", "ssids", "firewall", "isolation", "allowlist", "entries"),
+        ("organizationId",),
+        arguments=("organizationId", "client", "ssid", "network"),
+        body=frozenset({"description", "client", "ssid", "network"}),
+    ),
+    "deleteOrganizationWirelessSsidsFirewallIsolationAllowlistEntry": Operation(
+        "delete",
+        "/organizations/{organizationId}/wireless/ssids/firewall/isolation/allowlist/entries/{entryId}",
+        ("wireless", "configure", "ssids", "firewall", "isolation", "allowlist", "entries"),
+        ("organizationId", "entryId"),
+    ),
+    "updateOrganizationWirelessSsidsFirewallIsolationAllowlistEntry": Operation(
+        "put",
+        "/organizations/{organizationId}/wireless/ssids/firewall/isolation/allowlist/entries/{entryId}",
+        ("wireless", "configure", "ssids", "firewall", "isolation", "allowlist", "entries"),
+        ("organizationId", "entryId"),
+        body=frozenset({"description", "client"}),
+    ),
+    "getOrganizationWirelessSsidsOpenRoamingByNetwork": Operation(
+        "get",
+        "/organizations/{organizationId}/wireless/ssids/openRoaming/byNetwork",
+        ("wireless", "configure", "ssids", "openRoaming", "byNetwork"),
+        ("organizationId",),
+        query=frozenset({"perPage", "startingAfter", "endingBefore", "networkIds", "includeDisabledSsids"}),
+        array=frozenset({"networkIds"}),
+        paginated="next",
+    ),
+    "getOrganizationWirelessSsidsStatusesByDevice": Operation(
+        "get",
+        "/organizations/{organizationId}/wireless/ssids/statuses/byDevice",
+        ("wireless", "monitor", "ssids", "statuses", "byDevice"),
+        ("organizationId",),
+        query=frozenset({"networkIds", "serials", "bssids", "hideDisabled", "perPage", "startingAfter", "endingBefore"}),
+        array=frozenset({"networkIds", "serials", "bssids"}),
+        paginated="next",
+    ),
+    "getOrganizationWirelessZigbeeByNetwork": Operation(
+        "get",
+        "/organizations/{organizationId}/wireless/zigbee/byNetwork",
+        ("wireless", "configure", "zigbee", "byNetwork"),
+        ("organizationId",),
+        query=frozenset({"perPage", "startingAfter", "endingBefore", "networkIds"}),
+        array=frozenset({"networkIds"}),
+        paginated="next",
+    ),
+    "getOrganizationWirelessZigbeeDevices": Operation(
+        "get",
+        "/organizations/{organizationId}/wireless/zigbee/devices",
+        ("wireless", "configure", "zigbee", "devices"),
+        ("organizationId",),
+        query=frozenset({"perPage", "startingAfter", "endingBefore", "networkIds", "isEnrolled", "search"}),
+        array=frozenset({"networkIds"}),
+        paginated="next",
+    ),
+    "updateOrganizationWirelessZigbeeDevice": Operation(
+        "put",
+        "/organizations/{organizationId}/wireless/zigbee/devices/{id}",
+        ("wireless", "configure", "zigbee", "devices"),
+        ("organizationId", "id"),
+        arguments=("organizationId", "id", "enrolled"),
+        body=frozenset({"enrolled", "channel"}),
+    ),
+    "createOrganizationWirelessZigbeeDisenrollment": Operation(
+        "post",
+        "/organizations/{organizationId}/wireless/zigbee/disenrollments",
+        ("wireless", "configure", "zigbee", "disenrollments"),
+        ("organizationId",),
+        body=frozenset({"doorLockIds"}),
+    ),
+    "getOrganizationWirelessZigbeeDisenrollment": Operation(
+        "get",
+        "/organizations/{organizationId}/wireless/zigbee/disenrollments/{disenrollmentId}",
+        ("wireless", "configure", "zigbee", "disenrollments"),
+        ("organizationId", "disenrollmentId"),
+    ),
+    "getOrganizationWirelessZigbeeDoorLocks": Operation(
+        "get",
+        "/organizations/{organizationId}/wireless/zigbee/doorLocks",
+        ("wireless", "configure", "zigbee", "doorLocks"),
+        ("organizationId",),
+        query=frozenset({"networkIds", "serial", "perPage", "startingAfter", "endingBefore"}),
+        array=frozenset({"networkIds"}),
+        paginated="next",
+    ),
+    "updateOrganizationWirelessZigbeeDoorLock": Operation(
+        "put",
+        "/organizations/{organizationId}/wireless/zigbee/doorLocks/{doorLockId}",
+        ("wireless", "configure", "zigbee", "doorLocks"),
+        ("organizationId", "doorLockId"),
+        body=frozenset({"name"}),
+    ),
+    "getOrganizationSpacesIntegrateStatus": Operation(
+        "get",
+        "/organizations/{organizationId}/spaces/integrate/status",
+        ("spaces", "configure", "integrate", "status"),
+        ("organizationId",),
+    ),
+    "removeOrganizationSpacesIntegration": Operation(
+        "post",
+        "/organizations/{organizationId}/spaces/integration/remove",
+        ("spaces", "configure", "integration"),
+        ("organizationId",),
+    ),
+    "getOrganizationWirelessControllerAvailabilitiesChangeHistory": Operation(
+        "get",
+        "/organizations/{organizationId}/wirelessController/availabilities/changeHistory",
+        ("wirelessController", "monitor", "availabilities", "changeHistory"),
+        ("organizationId",),
+        query=frozenset({"serials", "t0", "t1", "timespan", "perPage", "startingAfter", "endingBefore"}),
+        array=frozenset({"serials"}),
+        paginated="next",
+    ),
+    "getOrganizationWirelessControllerClientsOverviewHistoryByDeviceByInterval": Operation(
+        "get",
+        "/organizations/{organizationId}/wirelessController/clients/overview/history/byDevice/byInterval",
+        ("wirelessController", "monitor", "clients", "overview", "history", "byDevice", "byInterval"),
+        ("organizationId",),
+        query=frozenset(
+            {"networkIds", "serials", "t0", "t1", "timespan", "perPage", "startingAfter", "endingBefore", "resolution"}
+        ),
+        array=frozenset({"networkIds", "serials"}),
+        paginated="next",
+    ),
+    "getOrganizationWirelessControllerConnections": Operation(
+        "get",
+        "/organizations/{organizationId}/wirelessController/connections",
+        ("wirelessController", "monitor", "connections"),
+        ("organizationId",),
+        query=frozenset({"networkIds", "controllerSerials", "perPage", "startingAfter", "endingBefore"}),
+        array=frozenset({"networkIds", "controllerSerials"}),
+        paginated="next",
+    ),
+    "getOrganizationWirelessControllerDevicesInterfacesL2ByDevice": Operation(
+        "get",
+        "/organizations/{organizationId}/wirelessController/devices/interfaces/l2/byDevice",
+        ("wirelessController", "monitor", "devices", "interfaces", "l2", "byDevice"),
+        ("organizationId",),
+        query=frozenset({"serials", "t0", "t1", "timespan", "perPage", "startingAfter", "endingBefore"}),
+        array=frozenset({"serials"}),
+        paginated="next",
+    ),
+    "getOrganizationWirelessControllerDevicesInterfacesL2StatusesChangeHistoryByDevice": Operation(
+        "get",
+        "/organizations/{organizationId}/wirelessController/devices/interfaces/l2/statuses/changeHistory/byDevice",
+        ("wirelessController", "monitor", "devices", "interfaces", "l2", "statuses", "changeHistory", "byDevice"),
+        ("organizationId",),
+        query=frozenset(
+            {"serials", "includeInterfacesWithoutChanges", "t0", "t1", "timespan", "perPage", "startingAfter", "endingBefore"}
+        ),
+        array=frozenset({"serials"}),
+        paginated="next",
+    ),
+    "getOrganizationWirelessControllerDevicesInterfacesL2UsageHistoryByInterval": Operation(
+        "get",
+        "/organizations/{organizationId}/wirelessController/devices/interfaces/l2/usage/history/byInterval",
+        ("wirelessController", "monitor", "devices", "interfaces", "l2", "usage", "history", "byInterval"),
+        ("organizationId",),
+        query=frozenset({"serials", "t0", "t1", "timespan", "perPage", "startingAfter", "endingBefore"}),
+        array=frozenset({"serials"}),
+        paginated="next",
+    ),
+    "getOrganizationWirelessControllerDevicesInterfacesL3ByDevice": Operation(
+        "get",
+        "/organizations/{organizationId}/wirelessController/devices/interfaces/l3/byDevice",
+        ("wirelessController", "monitor", "devices", "interfaces", "l3", "byDevice"),
+        ("organizationId",),
+        query=frozenset({"serials", "t0", "t1", "timespan", "perPage", "startingAfter", "endingBefore"}),
+        array=frozenset({"serials"}),
+        paginated="next",
+    ),
+    "getOrganizationWirelessControllerDevicesInterfacesL3StatusesChangeHistoryByDevice": Operation(
+        "get",
+        "/organizations/{organizationId}/wirelessController/devices/interfaces/l3/statuses/changeHistory/byDevice",
+        ("wirelessController", "monitor", "devices", "interfaces", "l3", "statuses", "changeHistory", "byDevice"),
+        ("organizationId",),
+        query=frozenset(
+            {"serials", "includeInterfacesWithoutChanges", "t0", "t1", "timespan", "perPage", "startingAfter", "endingBefore"}
+        ),
+        array=frozenset({"serials"}),
+        paginated="next",
+    ),
+    "getOrganizationWirelessControllerDevicesInterfacesL3UsageHistoryByInterval": Operation(
+        "get",
+        "/organizations/{organizationId}/wirelessController/devices/interfaces/l3/usage/history/byInterval",
+        ("wirelessController", "monitor", "devices", "interfaces", "l3", "usage", "history", "byInterval"),
+        ("organizationId",),
+        query=frozenset({"serials", "t0", "t1", "timespan", "perPage", "startingAfter", "endingBefore"}),
+        array=frozenset({"serials"}),
+        paginated="next",
+    ),
+    "getOrganizationWirelessControllerDevicesInterfacesPacketsOverviewByDevice": Operation(
+        "get",
+        "/organizations/{organizationId}/wirelessController/devices/interfaces/packets/overview/byDevice",
+        ("wirelessController", "monitor", "devices", "interfaces", "packets", "overview", "byDevice"),
+        ("organizationId",),
+        query=frozenset({"serials", "names", "t0", "t1", "timespan", "perPage", "startingAfter", "endingBefore"}),
+        array=frozenset({"serials", "names"}),
+        paginated="next",
+    ),
+    "getOrganizationWirelessControllerDevicesInterfacesUsageHistoryByInterval": Operation(
+        "get",
+        "/organizations/{organizationId}/wirelessController/devices/interfaces/usage/history/byInterval",
+        ("wirelessController", "monitor", "devices", "interfaces", "usage", "history", "byInterval"),
+        ("organizationId",),
+        query=frozenset({"serials", "names", "t0", "t1", "timespan", "perPage", "startingAfter", "endingBefore"}),
+        array=frozenset({"serials", "names"}),
+        paginated="next",
+    ),
+    "getOrganizationWirelessControllerDevicesRedundancyFailoverHistory": Operation(
+        "get",
+        "/organizations/{organizationId}/wirelessController/devices/redundancy/failover/history",
+        ("wirelessController", "monitor", "devices", "redundancy", "failover", "history"),
+        ("organizationId",),
+        query=frozenset({"serials", "t0", "t1", "timespan", "perPage", "startingAfter", "endingBefore"}),
+        array=frozenset({"serials"}),
+        paginated="next",
+    ),
+    "getOrganizationWirelessControllerDevicesRedundancyStatuses": Operation(
+        "get",
+        "/organizations/{organizationId}/wirelessController/devices/redundancy/statuses",
+        ("wirelessController", "monitor", "devices", "redundancy", "statuses"),
+        ("organizationId",),
+        query=frozenset({"serials", "perPage", "startingAfter", "endingBefore"}),
+        array=frozenset({"serials"}),
+        paginated="next",
+    ),
+    "getOrganizationWirelessControllerDevicesSystemUtilizationHistoryByInterval": Operation(
+        "get",
+        "/organizations/{organizationId}/wirelessController/devices/system/utilization/history/byInterval",
+        ("wirelessController", "monitor", "devices", "system", "utilization", "history", "byInterval"),
+        ("organizationId",),
+        query=frozenset({"serials", "t0", "t1", "timespan", "perPage", "startingAfter", "endingBefore"}),
+        array=frozenset({"serials"}),
+        paginated="next",
+    ),
+    "getOrganizationWirelessControllerOverviewByDevice": Operation(
+        "get",
+        "/organizations/{organizationId}/wirelessController/overview/byDevice",
+        ("wirelessController", "monitor", "overview", "byDevice"),
+        ("organizationId",),
+        query=frozenset({"networkIds", "serials", "perPage", "startingAfter", "endingBefore"}),
+        array=frozenset({"networkIds", "serials"}),
+        paginated="next",
+    ),
+    "createNetworkCampusGatewayCluster": Operation(
+        "post",
+        "/networks/{networkId}/campusGateway/clusters",
+        ("campusGateway", "configure", "clusters"),
+        ("networkId",),
+        arguments=("networkId", "name", "uplinks", "tunnels", "nameservers", "portChannels"),
+        body=frozenset({"name", "uplinks", "tunnels", "nameservers", "portChannels", "devices", "notes"}),
+    ),
+    "updateNetworkCampusGatewayCluster": Operation(
+        "put",
+        "/networks/{networkId}/campusGateway/clusters/{clusterId}",
+        ("campusGateway", "configure", "clusters"),
+        ("networkId", "clusterId"),
+        body=frozenset({"name", "uplinks", "tunnels", "nameservers", "portChannels", "devices", "notes"}),
+    ),
+    "getOrganizationCampusGatewayClusters": Operation(
+        "get",
+        "/organizations/{organizationId}/campusGateway/clusters",
+        ("campusGateway", "configure", "clusters"),
+        ("organizationId",),
+        query=frozenset({"networkIds", "perPage", "startingAfter", "endingBefore"}),
+        array=frozenset({"networkIds"}),
+        paginated="next",
+    ),
+    "getOrganizationCampusGatewayDevicesUplinksLocalOverridesByDevice": Operation(
+        "get",
+        "/organizations/{organizationId}/campusGateway/devices/uplinks/localOverrides/byDevice",
+        ("campusGateway", "configure", "devices", "uplinks", "localOverrides", "byDevice"),
+        ("organizationId",),
+        query=frozenset({"serials", "perPage", "startingAfter", "endingBefore"}),
+        array=frozenset({"serials"}),
+        paginated="next",
+    ),
+}
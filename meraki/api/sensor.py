@@ -1,4 +1,4 @@
-import urllib
+from meraki import dispatch
 
 
 class Sensor(object):
@@ -24,48 +24,9 @@ class Sensor(object):
         - timespan (number): The timespan for which the information will be fetched. If specifying timespan, do not specify parameters t0 and t1. The value must be in seconds and be less than or equal to 30 days. The default is 30 days.
         """
 
-        kwargs.update(locals())
-
-        if "sortOrder" in kwargs:
-            options = ["ascending", "descending"]
-            assert kwargs["sortOrder"] in options, (
-                f'''"sortOrder" cannot be "{kwargs["sortOrder"]}", & must be set to one of: {options}'''
-            )
-
-        metadata = {
-            "tags": ["sensor", "configure", "commands"],
-            "operation": "getDeviceSensorCommands",
-        }
-        serial = urllib.parse.quote(str(serial), safe="")
-        resource = f"/devices/{serial}/sensor/commands"
-
-        query_params = [
-            "operations",
-            "perPage",
-            "startingAfter",
-            "endingBefore",
-            "sortOrder",
-            "t0",
-            "t1",
-            "timespan",
-        ]
-        params = {k.strip(): v for k, v in kwargs.items() if k.strip() in query_params}
-
-        array_params = [
-            "operations",
-        ]
-        for k, v in kwargs.items():
-            if k.strip() in array_params:
-                params[f"{k.strip()}[]"] = kwargs[f"{k}"]
-                params.pop(k.strip())
-
-        if self._session._validate_kwargs:
-            all_params = query_params + array_params
-            invalid = [k for k in kwargs if k.strip() not in all_params and k != "self"]
-            if invalid and self._session._logger:
-                self._session._logger.warning(f"getDeviceSensorCommands: ignoring unrecognized kwargs: {invalid}")
-
-        return self._session.get_pages(metadata, resource, params, total_pages, direction)
+        return dispatch.call(
+            self._session, "getDeviceSensorCommands", serial, total_pages=total_pages, direction=direction, **kwargs
+        )
 
     def createDeviceSensorCommand(self, serial: str, operation: str, **kwargs):
         """
@@ -76,33 +37,7 @@ class Sensor(object):
         - operation (string): Operation to run on the sensor. 'enableDownstreamPower', 'disableDownstreamPower', and 'cycleDownstreamPower' turn power on/off to the device that is connected downstream of an MT40 power monitor. 'refreshData' causes an MT15 or MT40 device to upload its latest readings so that they are immediately available in the Dashboard API.
         """
 
-        kwargs = locals()
-
-        if "operation" in kwargs:
-            options = ["cycleDownstreamPower", "disableDownstreamPower", "enableDownstreamPower", "refreshData"]
-            assert kwargs["operation"] in options, (
-                f'''"operation" cannot be "{kwargs["operation"]}", & must be set to one of: {options}'''
-            )
-
-        metadata = {
-            "tags": ["sensor", "configure", "commands"],
-            "operation": "createDeviceSensorCommand",
-        }
-        serial = urllib.parse.quote(str(serial), safe="")
-        resource = f"/devices/{serial}/sensor/commands"
-
-        body_params = [
-            "operation",
-        ]
-        payload = {k.strip(): v for k, v in kwargs.items() if k.strip() in body_params}
-
-        if self._session._validate_kwargs:
-            all_params = [] + body_params
-            invalid = [k for k in kwargs if k.strip() not in all_params and k != "self"]
-            if invalid and self._session._logger:
-                self._session._logger.warning(f"createDeviceSensorCommand: ignoring unrecognized kwargs: {invalid}")
-
-        return self._session.post(metadata, resource, payload)
+        return dispatch.call(self._session, "createDeviceSensorCommand", serial, operation, **kwargs)
 
     def getDeviceSensorCommand(self, serial: str, commandId: str):
         """
@@ -113,15 +48,7 @@ class Sensor(object):
         - commandId (string): Command ID
         """
 
-        metadata = {
-            "tags": ["sensor", "configure", "commands"],
-            "operation": "getDeviceSensorCommand",
-        }
-        serial = urllib.parse.quote(str(serial), safe="")
-        commandId = urllib.parse.quote(str(commandId), safe="")
-        resource = f"/devices/{serial}/sensor/commands/{commandId}"
-
-        return self._session.get(metadata, resource)
+        return dispatch.call(self._session, "getDeviceSensorCommand", serial, commandId)
 
     def getDeviceSensorRelationships(self, serial: str):
         """
@@ -131,14 +58,7 @@ class Sensor(object):
         - serial (string): Serial
         """
 
-        metadata = {
-            "tags": ["sensor", "configure", "relationships"],
-            "operation": "getDeviceSensorRelationships",
-        }
-        serial = urllib.parse.quote(str(serial), safe="")
-        resource = f"/devices/{serial}/sensor/relationships"
-
-        return self._session.get(metadata, resource)
+        return dispatch.call(self._session, "getDeviceSensorRelationships", serial)
 
     def updateDeviceSensorRelationships(self, serial: str, **kwargs):
         """
@@ -149,27 +69,7 @@ class Sensor(object):
         - livestream (object): A role defined between an MT sensor and an MV camera that adds the camera's livestream to the sensor's details page. Snapshots from the camera will also appear in alert notifications that the sensor triggers.
         """
 
-        kwargs.update(locals())
-
-        metadata = {
-            "tags": ["sensor", "configure", "relationships"],
-            "operation": "updateDeviceSensorRelationships",
-        }
-        serial = urllib.parse.quote(str(serial), safe="")
-        resource = f"/devices/{serial}/sensor/relationships"
-
-        body_params = [
-            "livestream",
-        ]
-        payload = {k.strip(): v for k, v in kwargs.items() if k.strip() in body_params}
-
-        if self._session._validate_kwargs:
-            all_params = [] + body_params
-            invalid = [k for k in kwargs if k.strip() not in all_params and k != "self"]
-            if invalid and self._session._logger:
-                self._session._logger.warning(f"updateDeviceSensorRelationships: ignoring unrecognized kwargs: {invalid}")
-
-        return self._session.put(metadata, resource, payload)
+        return dispatch.call(self._session, "updateDeviceSensorRelationships", serial, **kwargs)
 
     def getNetworkSensorAlertsCurrentOverviewByMetric(self, networkId: str):
         """
@@ -179,14 +79,7 @@ class Sensor(object):
         - networkId (string): Network ID
         """
 
-        metadata = {
-            "tags": ["sensor", "monitor", "alerts", "current", "overview", "byMetric"],
-            "operation": "getNetworkSensorAlertsCurrentOverviewByMetric",
-        }
-        networkId = urllib.parse.quote(str(networkId), safe="")
-        resource = f"/networks/{networkId}/sensor/alerts/current/overview/byMetric"
-
-        return self._session.get(metadata, resource)
+        return dispatch.call(self._session, "getNetworkSensorAlertsCurrentOverviewByMetric", networkId)
 
     def getNetworkSensorAlertsOverviewByMetric(self, networkId: str, **kwargs):
         """
@@ -200,32 +93,7 @@ class Sensor(object):
         - interval (integer): The time interval in seconds for returned data. The valid intervals are: 900, 3600, 86400, 604800, 2629746. The default is 604800. Interval is calculated if time params are provided.
         """
 
-        kwargs.update(locals())
-
-        metadata = {
-            "tags": ["sensor", "monitor", "alerts", "overview", "byMetric"],
-            "operation": "getNetworkSensorAlertsOverviewByMetric",
-        }
-        networkId = urllib.parse.quote(str(networkId), safe="")
-        resource = f"/networks/{networkId}/sensor/alerts/overview/byMetric"
-
-        query_params = [
-            "t0",
-            "t1",
-            "timespan",
-            "interval",
-        ]
-        params = {k.strip(): v for k, v in kwargs.items() if k.strip() in query_params}
-
-        if self._session._validate_kwargs:
-            all_params = query_params
-            invalid = [k for k in kwargs if k.strip() not in all_params and k != "self"]
-            if invalid and self._session._logger:
-                self._session._logger.warning(
-                    f"getNetworkSensorAlertsOverviewByMetric: ignoring unrecognized kwargs: {invalid}"
-                )
-
-        return self._session.get(metadata, resource, params)
+        return dispatch.call(self._session, "getNetworkSensorAlertsOverviewByMetric", networkId, **kwargs)
 
     def getNetworkSensorAlertsProfiles(self, networkId: str):
         """
@@ -235,14 +103,7 @@ class Sensor(object):
         - networkId (string): Network ID
         """
 
-        metadata = {
-            "tags": ["sensor", "configure", "alerts", "profiles"],
-            "operation": "getNetworkSensorAlertsProfiles",
-        }
-        networkId = urllib.parse.quote(str(networkId), safe="")
-        resource = f"/networks/{networkId}/sensor/alerts/profiles"
-
-        return self._session.get(metadata, resource)
+        return dispatch.call(self._session, "getNetworkSensorAlertsProfiles", networkId)
 
     def createNetworkSensorAlertsProfile(self, networkId: str, name: str, conditions: list, **kwargs):
         """
@@ -259,33 +120,7 @@ class Sensor(object):
         - message (string): A custom message that will appear in email and text message alerts.
         """
 
-        kwargs.update(locals())
-
-        metadata = {
-            "tags": ["sensor", "configure", "alerts", "profiles"],
-            "operation": "createNetworkSensorAlertsProfile",
-        }
-        networkId = urllib.parse.quote(str(networkId), safe="")
-        resource = f"/networks/{networkId}/sensor/alerts/profiles"
-
-        body_params = [
-            "name",
-            "schedule",
-            "conditions",
-            "recipients",
-            "serials",
-            "includeSensorUrl",
-            "message",
-        ]
-        payload = {k.strip(): v for k, v in kwargs.items() if k.strip() in body_params}
-
-        if self._session._validate_kwargs:
-            all_params = [] + body_params
-            invalid = [k for k in kwargs if k.strip() not in all_params and k != "self"]
-            if invalid and self._session._logger:
-                self._session._logger.warning(f"createNetworkSensorAlertsProfile: ignoring unrecognized kwargs: {invalid}")
-
-        return self._session.post(metadata, resource, payload)
+        return dispatch.call(self._session, "createNetworkSensorAlertsProfile", networkId, name, conditions, **kwargs)
 
     def getNetworkSensorAlertsProfile(self, networkId: str, id: str):
         """
@@ -296,15 +131,7 @@ class Sensor(object):
         - id (string): ID
         """
 
-        metadata = {
-            "tags": ["sensor", "configure", "alerts", "profiles"],
-            "operation": "getNetworkSensorAlertsProfile",
-        }
-        networkId = urllib.parse.quote(str(networkId), safe="")
-        id = urllib.parse.quote(str(id), safe="")
-        resource = f"/networks/{networkId}/sensor/alerts/profiles/{id}"
-
-        return self._session.get(metadata, resource)
+        return dispatch.call(self._session, "getNetworkSensorAlertsProfile", networkId, id)
 
     def updateNetworkSensorAlertsProfile(self, networkId: str, id: str, **kwargs):
         """
@@ -322,34 +149,7 @@ class Sensor(object):
         - message (string): A custom message that will appear in email and text message alerts.
         """
 
-        kwargs.update(locals())
-
-        metadata = {
-            "tags": ["sensor", "configure", "alerts", "profiles"],
-            "operation": "updateNetworkSensorAlertsProfile",
-        }
-        networkId = urllib.parse.quote(str(networkId), safe="")
-        id = urllib.parse.quote(str(id), safe="")
-        resource = f"/networks/{networkId}/sensor/alerts/profiles/{id}"
-
-        body_params = [
-            "name",
-            "schedule",
-            "conditions",
-            "recipients",
-            "serials",
-            "includeSensorUrl",
-            "message",
-        ]
-        payload = {k.strip(): v for k, v in kwargs.items() if k.strip() in body_params}
-
-        if self._session._validate_kwargs:
-            all_params = [] + body_params
-            invalid = [k for k in kwargs if k.strip() not in all_params and k != "self"]
-            if invalid and self._session._logger:
-                self._session._logger.warning(f"updateNetworkSensorAlertsProfile: ignoring unrecognized kwargs: {invalid}")
-
-        return self._session.put(metadata, resource, payload)
+        return dispatch.call(self._session, "updateNetworkSensorAlertsProfile", networkId, id, **kwargs)
 
     def deleteNetworkSensorAlertsProfile(self, networkId: str, id: str):
         """
@@ -360,15 +160,7 @@ class Sensor(object):
         - id (string): ID
         """
 
-        metadata = {
-            "tags": ["sensor", "configure", "alerts", "profiles"],
-            "operation": "deleteNetworkSensorAlertsProfile",
-        }
-        networkId = urllib.parse.quote(str(networkId), safe="")
-        id = urllib.parse.quote(str(id), safe="")
-        resource = f"/networks/{networkId}/sensor/alerts/profiles/{id}"
-
-        return self._session.delete(metadata, resource)
+        return dispatch.call(self._session, "deleteNetworkSensorAlertsProfile", networkId, id)
 
     def getNetworkSensorMqttBrokers(self, networkId: str):
         """
@@ -378,14 +170,7 @@ class Sensor(object):
         - networkId (string): Network ID
         """
 
-        metadata = {
-            "tags": ["sensor", "configure", "mqttBrokers"],
-            "operation": "getNetworkSensorMqttBrokers",
-        }
-        networkId = urllib.parse.quote(str(networkId), safe="")
-        resource = f"/networks/{networkId}/sensor/mqttBrokers"
-
-        return self._session.get(metadata, resource)
+        return dispatch.call(self._session, "getNetworkSensorMqttBrokers", networkId)
 
     def getNetworkSensorMqttBroker(self, networkId: str, mqttBrokerId: str):
         """
@@ -396,15 +181,7 @@ class Sensor(object):
         - mqttBrokerId (string): Mqtt broker ID
         """
 
-        metadata = {
-            "tags": ["sensor", "configure", "mqttBrokers"],
-            "operation": "getNetworkSensorMqttBroker",
-        }
-        networkId = urllib.parse.quote(str(networkId), safe="")
-        mqttBrokerId = urllib.parse.quote(str(mqttBrokerId), safe="")
-        resource = f"/networks/{networkId}/sensor/mqttBrokers/{mqttBrokerId}"
-
-        return self._session.get(metadata, resource)
+        return dispatch.call(self._session, "getNetworkSensorMqttBroker", networkId, mqttBrokerId)
 
     def updateNetworkSensorMqttBroker(self, networkId: str, mqttBrokerId: str, enabled: bool, **kwargs):
         """
@@ -416,28 +193,7 @@ class Sensor(object):
         - enabled (boolean): Set to true to enable MQTT broker for sensor network
         """
 
-        kwargs = locals()
-
-        metadata = {
-            "tags": ["sensor", "configure", "mqttBrokers"],
-            "operation": "updateNetworkSensorMqttBroker",
-        }
-        networkId = urllib.parse.quote(str(networkId), safe="")
-        mqttBrokerId = urllib.parse.quote(str(mqttBrokerId), safe="")
-        resource = f"/networks/{networkId}/sensor/mqttBrokers/{mqttBrokerId}"
-
-        body_params = [
-            "enabled",
-        ]
-        payload = {k.strip(): v for k, v in kwargs.items() if k.strip() in body_params}
-
-        if self._session._validate_kwargs:
-            all_params = [] + body_params
-            invalid = [k for k in kwargs if k.strip() not in all_params and k != "self"]
-            if invalid and self._session._logger:
-                self._session._logger.warning(f"updateNetworkSensorMqttBroker: ignoring unrecognized kwargs: {invalid}")
-
-        return self._session.put(metadata, resource, payload)
+        return dispatch.call(self._session, "updateNetworkSensorMqttBroker", networkId, mqttBrokerId, enabled, **kwargs)
 
     def getNetworkSensorRelationships(self, networkId: str):
         """
@@ -447,14 +203,7 @@ class Sensor(object):
         - networkId (string): Network ID
         """
 
-        metadata = {
-            "tags": ["sensor", "configure", "relationships"],
-            "operation": "getNetworkSensorRelationships",
-        }
-        networkId = urllib.parse.quote(str(networkId), safe="")
-        resource = f"/networks/{networkId}/sensor/relationships"
-
-        return self._session.get(metadata, resource)
+        return dispatch.call(self._session, "getNetworkSensorRelationships", networkId)
 
     def getOrganizationSensorGatewaysConnectionsLatest(self, organizationId: str, total_pages=1, direction="next", **kwargs):
         """
@@ -470,40 +219,14 @@ class Sensor(object):
         - endingBefore (string): A token used by the server to indicate the end of the page. Often this is a timestamp or an ID but it is not limited to those. This parameter should not be defined by client applications. The link for the first, last, prev, or next page in the HTTP Link header should define it.
         """
 
-        kwargs.update(locals())
-
-        metadata = {
-            "tags": ["sensor", "monitor", "gateways", "connections", "latest"],
-            "operation": "getOrganizationSensorGatewaysConnectionsLatest",
-        }
-        organizationId = urllib.parse.quote(str(organizationId), safe="")
-        resource = f"/organizations/{organizationId}/sensor/gateways/connections/latest"
-
-        query_params = [
-            "sensorSerials",
-            "perPage",
-            "startingAfter",
-            "endingBefore",
-        ]
-        params = {k.strip(): v for k, v in kwargs.items() if k.strip() in query_params}
-
-        array_params = [
-            "sensorSerials",
-        ]
-        for k, v in kwargs.items():
-            if k.strip() in array_params:
-                params[f"{k.strip()}[]"] = kwargs[f"{k}"]
-                params.pop(k.strip())
-
-        if self._session._validate_kwargs:
-            all_params = query_params + array_params
-            invalid = [k for k in kwargs if k.strip() not in all_params and k != "self"]
-            if invalid and self._session._logger:
-                self._session._logger.warning(
-                    f"getOrganizationSensorGatewaysConnectionsLatest: ignoring unrecognized kwargs: {invalid}"
-                )
-
-        return self._session.get_pages(metadata, resource, params, total_pages, direction)
+        return dispatch.call(
+            self._session,
+            "getOrganizationSensorGatewaysConnectionsLatest",
+            organizationId,
+            total_pages=total_pages,
+            direction=direction,
+            **kwargs,
+        )
 
     def getOrganizationSensorReadingsHistory(self, organizationId: str, total_pages=1, direction="next", **kwargs):
         """
@@ -524,45 +247,14 @@ class Sensor(object):
         - metrics (array): Types of sensor readings to retrieve. If no metrics are supplied, all available types of readings will be retrieved.
         """
 
-        kwargs.update(locals())
-
-        metadata = {
-            "tags": ["sensor", "monitor", "readings", "history"],
-            "operation": "getOrganizationSensorReadingsHistory",
-        }
-        organizationId = urllib.parse.quote(str(organizationId), safe="")
-        resource = f"/organizations/{organizationId}/sensor/readings/history"
-
-        query_params = [
-            "perPage",
-            "startingAfter",
-            "endingBefore",
-            "t0",
-            "t1",
-            "timespan",
-            "networkIds",
-            "serials",
-            "metrics",
-        ]
-        params = {k.strip(): v for k, v in kwargs.items() if k.strip() in query_params}
-
-        array_params = [
-            "networkIds",
-            "serials",
-            "metrics",
-        ]
-        for k, v in kwargs.items():
-            if k.strip() in array_params:
-                params[f"{k.strip()}[]"] = kwargs[f"{k}"]
-                params.pop(k.strip())
-
-        if self._session._validate_kwargs:
-            all_params = query_params + array_params
-            invalid = [k for k in kwargs if k.strip() not in all_params and k != "self"]
-            if invalid and self._session._logger:
-                self._session._logger.warning(f"getOrganizationSensorReadingsHistory: ignoring unrecognized kwargs: {invalid}")
-
-        return self._session.get_pages(metadata, resource, params, total_pages, direction)
+        return dispatch.call(
+            self._session,
+            "getOrganizationSensorReadingsHistory",
+            organizationId,
+            total_pages=total_pages,
+            direction=direction,
+            **kwargs,
+        )
 
     def getOrganizationSensorReadingsLatest(self, organizationId: str, total_pages=1, direction="next", **kwargs):
         """
@@ -580,39 +272,11 @@ class Sensor(object):
         - metrics (array): Types of sensor readings to retrieve. If no metrics are supplied, all available types of readings will be retrieved.
         """
 
-        kwargs.update(locals())
-
-        metadata = {
-            "tags": ["sensor", "monitor", "readings", "latest"],
-            "operation": "getOrganizationSensorReadingsLatest",
-        }
-        organizationId = urllib.parse.quote(str(organizationId), safe="")
-        resource = f"/organizations/{organizationId}/sensor/readings/latest"
-
-        query_params = [
-            "perPage",
-            "startingAfter",
-            "endingBefore",
-            "networkIds",
-            "serials",
-            "metrics",
-        ]
-        params = {k.strip(): v for k, v in kwargs.items() if k.strip() in query_params}
-
-        array_params = [
-            "networkIds",
-            "serials",
-            "metrics",
-        ]
-        for k, v in kwargs.items():
-            if k.strip() in array_params:
-                params[f"{k.strip()}[]"] = kwargs[f"{k}"]
-                params.pop(k.strip())
-
-        if self._session._validate_kwargs:
-            all_params = query_params + array_params
-            invalid = [k for k in kwargs if k.strip() not in all_params and k != "self"]
-            if invalid and self._session._logger:
-                self._session._logger.warning(f"getOrganizationSensorReadingsLatest: ignoring unrecognized kwargs: {invalid}")
-
-        return self._session.get_pages(metadata, resource, params, total_pages, direction)
+        return dispatch.call(
+            self._session,
+            "getOrganizationSensorReadingsLatest",
+            organizationId,
+            total_pages=total_pages,
+            direction=direction,
+            **kwargs,
+        )
@@ -1,4 +1,4 @@
-import urllib
+from meraki import dispatch
 
 
 class Spaces(object):
@@ -14,14 +14,7 @@ class Spaces(object):
         - organizationId (string): Organization ID
         """
 
-        metadata = {
-            "tags": ["spaces", "configure", "integrate", "status"],
-            "operation": "getOrganizationSpacesIntegrateStatus",
-        }
-        organizationId = urllib.parse.quote(str(organizationId), safe="")
-        resource = f"/organizations/{organizationId}/spaces/integrate/status"
-
-        return self._session.get(metadata, resource)
+        return dispatch.call(self._session, "getOrganizationSpacesIntegrateStatus", organizationId)
 
     def removeOrganizationSpacesIntegration(self, organizationId: str):
         """
@@ -31,11 +24,4 @@ class Spaces(object):
         - organizationId (string): Organization ID
         """
 
-        metadata = {
-            "tags": ["spaces", "configure", "integration"],
-            "operation": "removeOrganizationSpacesIntegration",
-        }
-        organizationId = urllib.parse.quote(str(organizationId), safe="")
-        resource = f"/organizations/{organizationId}/spaces/integration/remove"
-
-        return self._session.post(metadata, resource)
+        return dispatch.call(self._session, "removeOrganizationSpacesIntegration", organizationId)
@@ -1,4 +1,4 @@
-import urllib
+from meraki import dispatch
 
 
 class Switch(object):
@@ -14,14 +14,7 @@ class Switch(object):
         - serial (string): Serial
         """
 
-        metadata = {
-            "tags": ["switch", "configure", "ports"],
-            "operation": "getDeviceSwitchPorts",
-        }
-        serial = urllib.parse.quote(str(serial), safe="")
-        resource = f"/devices/{serial}/switch/ports"
-
-        return self._session.get(metadata, resource)
+        return dispatch.call(self._session, "getDeviceSwitchPorts", serial)
 
     def cycleDeviceSwitchPorts(self, serial: str, ports: list, **kwargs):
         """
@@ -32,27 +25,7 @@ class Switch(object):
         - ports (array): List of switch ports
         """
 
-        kwargs = locals()
-
-        metadata = {
-            "tags": ["switch", "liveTools", "ports"],
-            "operation": "cycleDeviceSwitchPorts",
-        }
-        serial = urllib.parse.quote(str(serial), safe="")
-        resource = f"/devices/{serial}/switch/ports/cycle"
-
-        body_params = [
-            "ports",
-        ]
-        payload = {k.strip(): v for k, v in kwargs.items() if k.strip() in body_params}
-
-        if self._session._validate_kwargs:
-            all_params = [] + body_params
-            invalid = [k for k in kwargs if k.strip() not in all_params and k != "self"]
-            if invalid and self._session._logger:
-                self._session._logger.warning(f"cycleDeviceSwitchPorts: ignoring unrecognized kwargs: {invalid}")
-
-        return self._session.post(metadata, resource, payload)
+        return dispatch.call(self._session, "cycleDeviceSwitchPorts", serial, ports, **kwargs)
 
     def getDeviceSwitchPortsStatuses(self, serial: str, **kwargs):
         """
@@ -64,28 +37,7 @@ class Switch(object):
         - timespan (number): The timespan for which the information will be fetched. If specifying timespan, do not specify parameter t0. The value must be in seconds and be less than or equal to 31 days. The default is 1 day.
         """
 
-        kwargs.update(locals())
-
-        metadata = {
-            "tags": ["switch", "monitor", "ports", "statuses"],
-            "operation": "getDeviceSwitchPortsStatuses",
-        }
-        serial = urllib.parse.quote(str(serial), safe="")
-        resource = f"/devices/{serial}/switch/ports/statuses"
-
-        query_params = [
-            "t0",
-            "timespan",
-        ]
-        params = {k.strip(): v for k, v in kwargs.items() if k.strip() in query_params}
-
-        if self._session._validate_kwargs:
-            all_params = query_params
-            invalid = [k for k in kwargs if k.strip() not in all_params and k != "self"]
-            if invalid and self._session._logger:
-                self._session._logger.warning(f"getDeviceSwitchPortsStatuses: ignoring unrecognized kwargs: {invalid}")
-
-        return self._session.get(metadata, resource, params)
+        return dispatch.call(self._session, "getDeviceSwitchPortsStatuses", serial, **kwargs)
 
     def getDeviceSwitchPortsStatusesPackets(self, serial: str, **kwargs):
         """
@@ -97,28 +49,7 @@ class Switch(object):
         - timespan (number): The timespan for which the information will be fetched. If specifying timespan, do not specify t0. The value must be in seconds and be less than or equal to 86400 seconds (1 day). The default is 1 day.
         """
 
-        kwargs.update(locals())
-
-        metadata = {
-            "tags": ["switch", "monitor", "ports", "statuses", "packets"],
-            "operation": "getDeviceSwitchPortsStatusesPackets",
-        }
-        serial = urllib.parse.quote(str(serial), safe="")
-        resource = f"/devices/{serial}/switch/ports/statuses/packets"
-
-        query_params = [
-            "t0",
-            "timespan",
-        ]
-        params = {k.strip(): v for k, v in kwargs.items() if k.strip() in query_params}
-
-        if self._session._validate_kwargs:
-            all_params = query_params
-            invalid = [k for k in kwargs if k.strip() not in all_params and k != "self"]
-            if invalid and self._session._logger:
-                self._session._logger.warning(f"getDeviceSwitchPortsStatusesPackets: ignoring unrecognized kwargs: {invalid}")
-
-        return self._session.get(metadata, resource, params)
+        return dispatch.call(self._session, "getDeviceSwitchPortsStatusesPackets", serial, **kwargs)
 
     def getDeviceSwitchPort(self, serial: str, portId: str):
         """
@@ -129,15 +60,7 @@ class Switch(object):
         - portId (string): Port ID
         """
 
-        metadata = {
-            "tags": ["switch", "configure", "ports"],
-            "operation": "getDeviceSwitchPort",
-        }
-        serial = urllib.parse.quote(str(serial), safe="")
-        portId = urllib.parse.quote(str(portId), safe="")
-        resource = f"/devices/{serial}/switch/ports/{portId}"
-
-        return self._session.get(metadata, resource)
+        return dispatch.call(self._session, "getDeviceSwitchPort", serial, portId)
 
     def updateDeviceSwitchPort(self, serial: str, portId: str, **kwargs):
         """
@@ -178,73 +101,7 @@ class Switch(object):
         - highSpeed (object): High speed port enablement settings for C9500-32QC
         """
 
-        kwargs.update(locals())
-
-        if "type" in kwargs:
-            options = ["access", "dad", "routed", "stack", "svl", "trunk"]
-            assert kwargs["type"] in options, f'''"type" cannot be "{kwargs["type"]}", & must be set to one of: {options}'''
-        if "stpGuard" in kwargs:
-            options = ["bpdu guard", "disabled", "loop guard", "root guard"]
-            assert kwargs["stpGuard"] in options, (
-                f'''"stpGuard" cannot be "{kwargs["stpGuard"]}", & must be set to one of: {options}'''
-            )
-        if "udld" in kwargs:
-            options = ["Alert only", "Enforce"]
-            assert kwargs["udld"] in options, f'''"udld" cannot be "{kwargs["udld"]}", & must be set to one of: {options}'''
-        if "accessPolicyType" in kwargs:
-            options = ["Custom access policy", "MAC allow list", "Open", "Sticky MAC allow list"]
-            assert kwargs["accessPolicyType"] in options, (
-                f'''"accessPolicyType" cannot be "{kwargs["accessPolicyType"]}", & must be set to one of: {options}'''
-            )
-
-        metadata = {
-            "tags": ["switch", "configure", "ports"],
-            "operation": "updateDeviceSwitchPort",
-        }
-        serial = urllib.parse.quote(str(serial), safe="")
-        portId = urllib.parse.quote(str(portId), safe="")
-        resource = f"/devices/{serial}/switch/ports/{portId}"
-
-        body_params = [
-            "name",
-            "tags",
-            "enabled",
-            "poeEnabled",
-            "type",
-            "vlan",
-            "voiceVlan",
-            "allowedVlans",
-            "isolationEnabled",
-            "rstpEnabled",
-            "stpGuard",
-            "stpPortFastTrunk",
-            "linkNegotiation",
-            "portScheduleId",
-            "udld",
-            "accessPolicyType",
-            "accessPolicyNumber",
-            "macAllowList",
-            "macWhitelistLimit",
-            "stickyMacAllowList",
-            "stickyMacAllowListLimit",
-            "stormControlEnabled",
-            "adaptivePolicyGroupId",
-            "peerSgtCapable",
-            "flexibleStackingEnabled",
-            "daiTrusted",
-            "profile",
-            "dot3az",
-            "highSpeed",
-        ]
-        payload = {k.strip(): v for k, v in kwargs.items() if k.strip() in body_params}
-
-        if self._session._validate_kwargs:
-            all_params = [] + body_params
-            invalid = [k for k in kwargs if k.strip() not in all_params and k != "self"]
-            if invalid and self._session._logger:
-                self._session._logger.warning(f"updateDeviceSwitchPort: ignoring unrecognized kwargs: {invalid}")
-
-        return self._session.put(metadata, resource, payload)
+        return dispatch.call(self._session, "updateDeviceSwitchPort", serial, portId, **kwargs)
 
     def getDeviceSwitchRoutingInterfaces(self, serial: str, **kwargs):
         """
@@ -256,37 +113,7 @@ class Switch(object):
         - protocol (string): Optional parameter to filter L3 interfaces by protocol.
         """
 
-        kwargs.update(locals())
-
-        if "mode" in kwargs:
-            options = ["loopback", "oob_management", "routed", "vlan"]
-            assert kwargs["mode"] in options, f'''"mode" cannot be "{kwargs["mode"]}", & must be set to one of: {options}'''
-        if "protocol" in kwargs:
-            options = ["ipv4", "ipv6"]
-            assert kwargs["protocol"] in options, (
-                f'''"protocol" cannot be "{kwargs["protocol"]}", & must be set to one of: {options}'''
-            )
-
-        metadata = {
-            "tags": ["switch", "configure", "routing", "interfaces"],
-            "operation": "getDeviceSwitchRoutingInterfaces",
-        }
-        serial = urllib.parse.quote(str(serial), safe="")
-        resource = f"/devices/{serial}/switch/routing/interfaces"
-
-        query_params = [
-            "mode",
-            "protocol",
-        ]
-        params = {k.strip(): v for k, v in kwargs.items() if k.strip() in query_params}
-
-        if self._session._validate_kwargs:
-            all_params = query_params
-            invalid = [k for k in kwargs if k.strip() not in all_params and k != "self"]
-            if invalid and self._session._logger:
-                self._session._logger.warning(f"getDeviceSwitchRoutingInterfaces: ignoring unrecognized kwargs: {invalid}")
-
-        return self._session.get(metadata, resource, params)
+        return dispatch.call(self._session, "getDeviceSwitchRoutingInterfaces", serial, **kwargs)
 
     def createDeviceSwitchRoutingInterface(self, serial: str, name: str, **kwargs):
         """
@@ -309,48 +136,7 @@ class Switch(object):
         - loopback (object): The loopback settings of the interface.
         """
 
-        kwargs.update(locals())
-
-        if "mode" in kwargs:
-            options = ["loopback", "oob_management", "routed", "vlan"]
-            assert kwargs["mode"] in options, f'''"mode" cannot be "{kwargs["mode"]}", & must be set to one of: {options}'''
-        if "multicastRouting" in kwargs:
-            options = ["IGMP snooping querier", "disabled", "enabled"]
-            assert kwargs["multicastRouting"] in options, (
-                f'''"multicastRouting" cannot be "{kwargs["multicastRouting"]}", & must be set to one of: {options}'''
-            )
-
-        metadata = {
-            "tags": ["switch", "configure", "routing", "interfaces"],
-            "operation": "createDeviceSwitchRoutingInterface",
-        }
-        serial = urllib.parse.quote(str(serial), safe="")
-        resource = f"/devices/{serial}/switch/routing/interfaces"
-
-        body_params = [
-            "name",
-            "mode",
-            "subnet",
-            "switchPortId",
-            "interfaceIp",
-            "mtu",
-            "multicastRouting",
-            "vlanId",
-            "defaultGateway",
-            "ospfSettings",
-            "ipv6",
-            "vrf",
-            "loopback",
-        ]
-        payload = {k.strip(): v for k, v in kwargs.items() if k.strip() in body_params}
-
-        if self._session._validate_kwargs:
-            all_params = [] + body_params
-            invalid = [k for k in kwargs if k.strip() not in all_params and k != "self"]
-            if invalid and self._session._logger:
-                self._session._logger.warning(f"createDeviceSwitchRoutingInterface: ignoring unrecognized kwargs: {invalid}")
-
-        return self._session.post(metadata, resource, payload)
+        return dispatch.call(self._session, "createDeviceSwitchRoutingInterface", serial, name, **kwargs)
 
     def getDeviceSwitchRoutingInterface(self, serial: str, interfaceId: str):
         """
@@ -361,15 +147,7 @@ class Switch(object):
         - interfaceId (string): Interface ID
         """
 
-        metadata = {
-            "tags": ["switch", "configure", "routing", "interfaces"],
-            "operation": "getDeviceSwitchRoutingInterface",
-        }
-        serial = urllib.parse.quote(str(serial), safe="")
-        interfaceId = urllib.parse.quote(str(interfaceId), safe="")
-        resource = f"/devices/{serial}/switch/routing/interfaces/{interfaceId}"
-
-        return self._session.get(metadata, resource)
+        return dispatch.call(self._session, "getDeviceSwitchRoutingInterface", serial, interfaceId)
 
     def updateDeviceSwitchRoutingInterface(self, serial: str, interfaceId: str, **kwargs):
         """
@@ -392,45 +170,7 @@ class Switch(object):
         - loopback (object): The loopback settings of the interface.
         """
 
-        kwargs.update(locals())
-
-        if "multicastRouting" in kwargs:
-            options = ["IGMP snooping querier", "disabled", "enabled"]
-            assert kwargs["multicastRouting"] in options, (
-                f'''"multicastRouting" cannot be "{kwargs["multicastRouting"]}", & must be set to one of: {options}'''
-            )
-
-        metadata = {
-            "tags": ["switch", "configure", "routing", "interfaces"],
-            "operation": "updateDeviceSwitchRoutingInterface",
-        }
-        serial = urllib.parse.quote(str(serial), safe="")
-        interfaceId = urllib.parse.quote(str(interfaceId), safe="")
-        resource = f"/devices/{serial}/switch/routing/interfaces/{interfaceId}"
-
-        body_params = [
-            "name",
-            "subnet",
-            "switchPortId",
-            "interfaceIp",
-            "mtu",
-            "multicastRouting",
-            "vlanId",
-            "defaultGateway",
-            "ospfSettings",
-            "ipv6",
-            "vrf",
-            "loopback",
-        ]
-        payload = {k.strip(): v for k, v in kwargs.items() if k.strip() in body_params}
-
-        if self._session._validate_kwargs:
-            all_params = [] + body_params
-            invalid = [k for k in kwargs if k.strip() not in all_params and k != "self"]
-            if invalid and self._session._logger:
-                self._session._logger.warning(f"updateDeviceSwitchRoutingInterface: ignoring unrecognized kwargs: {invalid}")
-
-        return self._session.put(metadata, resource, payload)
+        return dispatch.call(self._session, "updateDeviceSwitchRoutingInterface", serial, interfaceId, **kwargs)
 
     def deleteDeviceSwitchRoutingInterface(self, serial: str, interfaceId: str):
         """
@@ -441,15 +181,7 @@ class Switch(object):
         - interfaceId (string): Interface ID
         """
 
-        metadata = {
-            "tags": ["switch", "configure", "routing", "interfaces"],
-            "operation": "deleteDeviceSwitchRoutingInterface",
-        }
-        serial = urllib.parse.quote(str(serial), safe="")
-        interfaceId = urllib.parse.quote(str(interfaceId), safe="")
-        resource = f"/devices/{serial}/switch/routing/interfaces/{interfaceId}"
-
-        return self._session.delete(metadata, resource)
+        return dispatch.call(self._session, "deleteDeviceSwitchRoutingInterface", serial, interfaceId)
 
     def getDeviceSwitchRoutingInterfaceDhcp(self, serial: str, interfaceId: str):
         """
@@ -460,15 +192,7 @@ class Switch(object):
         - interfaceId (string): Interface ID
         """
 
-        metadata = {
-            "tags": ["switch", "configure", "routing", "interfaces", "dhcp"],
-            "operation": "getDeviceSwitchRoutingInterfaceDhcp",
-        }
-        serial = urllib.parse.quote(str(serial), safe="")
-        interfaceId = urllib.parse.quote(str(interfaceId), safe="")
-        resource = f"/devices/{serial}/switch/routing/interfaces/{interfaceId}/dhcp"
-
-        return self._session.get(metadata, resource)
+        return dispatch.call(self._session, "getDeviceSwitchRoutingInterfaceDhcp", serial, interfaceId)
 
     def updateDeviceSwitchRoutingInterfaceDhcp(self, serial: str, interfaceId: str, **kwargs):
         """
@@ -495,56 +219,7 @@ class Switch(object):
          - fixedIpAssignments (array): Array of DHCP fixed IP assignments for the DHCP server running on the switch interface
         """
 
-        kwargs.update(locals())
-
-        if "dhcpMode" in kwargs:
-            options = ["dhcpDisabled", "dhcpRelay", "dhcpServer"]
-            assert kwargs["dhcpMode"] in options, (
-                f'''"dhcpMode" cannot be "{kwargs["dhcpMode"]}", & must be set to one of: {options}'''
-            )
-        if "dhcpLeaseTime" in kwargs:
-            options = ["1 day", "1 hour", "1 week", "12 hours", "30 minutes", "4 hours"]
-            assert kwargs["dhcpLeaseTime"] in options, (
-                f'''"dhcpLeaseTime" cannot be "{kwargs["dhcpLeaseTime"]}", & must be set to one of: {options}'''
-            )
-        if "dnsNameserversOption" in kwargs:
-            options = ["custom", "googlePublicDns", "openDns"]
-            assert kwargs["dnsNameserversOption"] in options, (
-                f'''"dnsNameserversOption" cannot be "{kwargs["dnsNameserversOption"]}", & must be set to one of: {options}'''
-            )
-
-        metadata = {
-            "tags": ["switch", "configure", "routing", "interfaces", "dhcp"],
-            "operation": "updateDeviceSwitchRoutingInterfaceDhcp",
-        }
-        serial = urllib.parse.quote(str(serial), safe="")
-        interfaceId = urllib.parse.quote(str(interfaceId), safe="")
-        resource = f"/devices/{serial}/switch/routing/interfaces/{interfaceId}/dhcp"
-
-        body_params = [
-            "dhcpMode",
-            "dhcpRelayServerIps",
-            "dhcpLeaseTime",
-            "dnsNameserversOption",
-            "dnsCustomNameservers",
-            "bootOptionsEnabled",
-            "bootNextServer",
-            "bootFileName",
-            "dhcpOptions",
-            "reservedIpRanges",
-            "fixedIpAssignments",
-        ]
-        payload = {k.strip(): v for k, v in kwargs.items() if k.strip() in body_params}
-
-        if self._session._validate_kwargs:
-            all_params = [] + body_params
-            invalid = [k for k in kwargs if k.strip() not in all_params and k != "self"]
-            if invalid and self._session._logger:
-                self._session._logger.warning(
-                    f"updateDeviceSwitchRoutingInterfaceDhcp: ignoring unrecognized kwargs: {invalid}"
-                )
-
-        return self._session.put(metadata, resource, payload)
+        return dispatch.call(self._session, "updateDeviceSwitchRoutingInterfaceDhcp", serial, interfaceId, **kwargs)
 
     def getDeviceSwitchRoutingStaticRoutes(self, serial: str):
         """
@@ -554,14 +229,7 @@ class Switch(object):
         - serial (string): Serial
         """
 
-        metadata = {
-            "tags": ["switch", "configure", "routing", "staticRoutes"],
-            "operation": "getDeviceSwitchRoutingStaticRoutes",
-        }
-        serial = urllib.parse.quote(str(serial), safe="")
-        resource = f"/devices/{serial}/switch/routing/staticRoutes"
-
-        return self._session.get(metadata, resource)
+        return dispatch.call(self._session, "getDeviceSwitchRoutingStaticRoutes", serial)
 
     def createDeviceSwitchRoutingStaticRoute(self, serial: str, subnet: str, nextHopIp: str, **kwargs):
         """
@@ -577,32 +245,7 @@ class Switch(object):
         - vrf (object): The VRF settings of the interface. Requires IOS XE 17.18 or higher
         """
 
-        kwargs.update(locals())
-
-        metadata = {
-            "tags": ["switch", "configure", "routing", "staticRoutes"],
-            "operation": "createDeviceSwitchRoutingStaticRoute",
-        }
-        serial = urllib.parse.quote(str(serial), safe="")
-        resource = f"/devices/{serial}/switch/routing/staticRoutes"
-
-        body_params = [
-            "name",
-            "subnet",
-            "nextHopIp",
-            "advertiseViaOspfEnabled",
-            "preferOverOspfRoutesEnabled",
-            "vrf",
-        ]
-        payload = {k.strip(): v for k, v in kwargs.items() if k.strip() in body_params}
-
-        if self._session._validate_kwargs:
-            all_params = [] + body_params
-            invalid = [k for k in kwargs if k.strip() not in all_params and k != "self"]
-            if invalid and self._session._logger:
-                self._session._logger.warning(f"createDeviceSwitchRoutingStaticRoute: ignoring unrecognized kwargs: {invalid}")
-
-        return self._session.post(metadata, resource, payload)
+        return dispatch.call(self._session, "createDeviceSwitchRoutingStaticRoute", serial, subnet, nextHopIp, **kwargs)
 
     def getDeviceSwitchRoutingStaticRoute(self, serial: str, staticRouteId: str):
         """
@@ -613,15 +256,7 @@ class Switch(object):
         - staticRouteId (string): Static route ID
         """
 
-        metadata = {
-            "tags": ["switch", "configure", "routing", "staticRoutes"],
-            "operation": "getDeviceSwitchRoutingStaticRoute",
-        }
-        serial = urllib.parse.quote(str(serial), safe="")
-        staticRouteId = urllib.parse.quote(str(staticRouteId), safe="")
-        resource = f"/devices/{serial}/switch/routing/staticRoutes/{staticRouteId}"
-
-        return self._session.get(metadata, resource)
+        return dispatch.call(self._session, "getDeviceSwitchRoutingStaticRoute", serial, staticRouteId)
 
     def updateDeviceSwitchRoutingStaticRoute(self, serial: str, staticRouteId: str, **kwargs):
         """
@@ -639,34 +274,7 @@ class Switch(object):
         - vrf (object): The VRF settings of the interface. Requires IOS XE 17.18 or higher
         """
 
-        kwargs.update(locals())
-
-        metadata = {
-            "tags": ["switch", "configure", "routing", "staticRoutes"],
-            "operation": "updateDeviceSwitchRoutingStaticRoute",
-        }
-        serial = urllib.parse.quote(str(serial), safe="")
-        staticRouteId = urllib.parse.quote(str(staticRouteId), safe="")
-        resource = f"/devices/{serial}/switch/routing/staticRoutes/{staticRouteId}"
-
-        body_params = [
-            "name",
-            "subnet",
-            "nextHopIp",
-            "managementNextHop",
-            "advertiseViaOspfEnabled",
-            "preferOverOspfRoutesEnabled",
-            "vrf",
-        ]
-        payload = {k.strip(): v for k, v in kwargs.items() if k.strip() in body_params}
-
-        if self._session._validate_kwargs:
-            all_params = [] + body_params
-            invalid = [k for k in kwargs if k.strip() not in all_params and k != "self"]
-            if invalid and self._session._logger:
-                self._session._logger.warning(f"updateDeviceSwitchRoutingStaticRoute: ignoring unrecognized kwargs: {invalid}")
-
-        return self._session.put(metadata, resource, payload)
+        return dispatch.call(self._session, "updateDeviceSwitchRoutingStaticRoute", serial, staticRouteId, **kwargs)
 
     def deleteDeviceSwitchRoutingStaticRoute(self, serial: str, staticRouteId: str):
         """
@@ -677,15 +285,7 @@ class Switch(object):
         - staticRouteId (string): Static route ID
         """
 
-        metadata = {
-            "tags": ["switch", "configure", "routing", "staticRoutes"],
-            "operation": "deleteDeviceSwitchRoutingStaticRoute",
-        }
-        serial = urllib.parse.quote(str(serial), safe="")
-        staticRouteId = urllib.parse.quote(str(staticRouteId), safe="")
-        resource = f"/devices/{serial}/switch/routing/staticRoutes/{staticRouteId}"
-
-        return self._session.delete(metadata, resource)
+        return dispatch.call(self._session, "deleteDeviceSwitchRoutingStaticRoute", serial, staticRouteId)
 
     def getDeviceSwitchWarmSpare(self, serial: str):
         """
@@ -695,14 +295,7 @@ class Switch(object):
         - serial (string): Serial
         """
 
-        metadata = {
-            "tags": ["switch", "configure", "warmSpare"],
-            "operation": "getDeviceSwitchWarmSpare",
-        }
-        serial = urllib.parse.quote(str(serial), safe="")
-        resource = f"/devices/{serial}/switch/warmSpare"
-
-        return self._session.get(metadata, resource)
+        return dispatch.call(self._session, "getDeviceSwitchWarmSpare", serial)
 
     def updateDeviceSwitchWarmSpare(self, serial: str, enabled: bool, **kwargs):
         """
@@ -714,28 +307,7 @@ class Switch(object):
         - spareSerial (string): Serial number of the warm spare switch
         """
 
-        kwargs.update(locals())
-
-        metadata = {
-            "tags": ["switch", "configure", "warmSpare"],
-            "operation": "updateDeviceSwitchWarmSpare",
-        }
-        serial = urllib.parse.quote(str(serial), safe="")
-        resource = f"/devices/{serial}/switch/warmSpare"
-
-        body_params = [
-            "enabled",
-            "spareSerial",
-        ]
-        payload = {k.strip(): v for k, v in kwargs.items() if k.strip() in body_params}
-
-        if self._session._validate_kwargs:
-            all_params = [] + body_params
-            invalid = [k for k in kwargs if k.strip() not in all_params and k != "self"]
-            if invalid and self._session._logger:
-                self._session._logger.warning(f"updateDeviceSwitchWarmSpare: ignoring unrecognized kwargs: {invalid}")
-
-        return self._session.put(metadata, resource, payload)
+        return dispatch.call(self._session, "updateDeviceSwitchWarmSpare", serial, enabled, **kwargs)
 
     def getNetworkSwitchAccessControlLists(self, networkId: str):
         """
@@ -745,14 +317,7 @@ class Switch(object):
         - networkId (string): Network ID
         """
 
-        metadata = {
-            "tags": ["switch", "configure", "accessControlLists"],
-            "operation": "getNetworkSwitchAccessControlLists",
-        }
-        networkId = urllib.parse.quote(str(networkId), safe="")
-        resource = f"/networks/{networkId}/switch/accessControlLists"
-
-        return self._session.get(metadata, resource)
+        return dispatch.call(self._session, "getNetworkSwitchAccessControlLists", networkId)
 
     def updateNetworkSwitchAccessControlLists(self, networkId: str, rules: list, **kwargs):
         """
@@ -763,29 +328,7 @@ class Switch(object):
         - rules (array): An ordered array of the access control list rules (not including the default rule). An empty array will clear the rules.
         """
 
-        kwargs = locals()
-
-        metadata = {
-            "tags": ["switch", "configure", "accessControlLists"],
-            "operation": "updateNetworkSwitchAccessControlLists",
-        }
-        networkId = urllib.parse.quote(str(networkId), safe="")
-        resource = f"/networks/{networkId}/switch/accessControlLists"
-
-        body_params = [
-            "rules",
-        ]
-        payload = {k.strip(): v for k, v in kwargs.items() if k.strip() in body_params}
-
-        if self._session._validate_kwargs:
-            all_params = [] + body_params
-            invalid = [k for k in kwargs if k.strip() not in all_params and k != "self"]
-            if invalid and self._session._logger:
-                self._session._logger.warning(
-                    f"updateNetworkSwitchAccessControlLists: ignoring unrecognized kwargs: {invalid}"
-                )
-
-        return self._session.put(metadata, resource, payload)
+        return dispatch.call(self._session, "updateNetworkSwitchAccessControlLists", networkId, rules, **kwargs)
 
     def getNetworkSwitchAccessPolicies(self, networkId: str):
         """
@@ -795,14 +338,7 @@ class Switch(object):
         - networkId (string): Network ID
         """
 
-        metadata = {
-            "tags": ["switch", "configure", "accessPolicies"],
-            "operation": "getNetworkSwitchAccessPolicies",
-        }
-        networkId = urllib.parse.quote(str(networkId), safe="")
-        resource = f"/networks/{networkId}/switch/accessPolicies"
-
-        return self._session.get(metadata, resource)
+        return dispatch.call(self._session, "getNetworkSwitchAccessPolicies", networkId)
 
     def createNetworkSwitchAccessPolicy(
         self, networkId: str, name: str, radiusServers: list, radiusAccountingEnabled: bool, **kwargs
@@ -833,56 +369,9 @@ class Switch(object):
         - guestSgtId (integer): Security Group Tag ID for guest group policy
         """
 
-        kwargs.update(locals())
-
-        if "hostMode" in kwargs:
-            options = ["Multi-Auth", "Multi-Domain", "Multi-Host", "Single-Host"]
-            assert kwargs["hostMode"] in options, (
-                f'''"hostMode" cannot be "{kwargs["hostMode"]}", & must be set to one of: {options}'''
-            )
-        if "accessPolicyType" in kwargs:
-            options = ["802.1x", "Hybrid authentication", "MAC authentication bypass"]
-            assert kwargs["accessPolicyType"] in options, (
-                f'''"accessPolicyType" cannot be "{kwargs["accessPolicyType"]}", & must be set to one of: {options}'''
-            )
-
-        metadata = {
-            "tags": ["switch", "configure", "accessPolicies"],
-            "operation": "createNetworkSwitchAccessPolicy",
-        }
-        networkId = urllib.parse.quote(str(networkId), safe="")
-        resource = f"/networks/{networkId}/switch/accessPolicies"
-
-        body_params = [
-            "name",
-            "radiusServers",
-            "radius",
-            "guestPortBouncing",
-            "radiusTestingEnabled",
-            "radiusCoaSupportEnabled",
-            "radiusAccountingEnabled",
-            "radiusAccountingServers",
-            "radiusGroupAttribute",
-            "hostMode",
-            "accessPolicyType",
-            "increaseAccessSpeed",
-            "guestVlanId",
-            "dot1x",
-            "voiceVlanClients",
-            "urlRedirectWalledGardenEnabled",
-            "urlRedirectWalledGardenRanges",
-            "guestGroupPolicyId",
-            "guestSgtId",
-        ]
-        payload = {k.strip(): v for k, v in kwargs.items() if k.strip() in body_params}
-
-        if self._session._validate_kwargs:
-            all_params = [] + body_params
-            invalid = [k for k in kwargs if k.strip() not in all_params and k != "self"]
-            if invalid and self._session._logger:
-                self._session._logger.warning(f"createNetworkSwitchAccessPolicy: ignoring unrecognized kwargs: {invalid}")
-
-        return self._session.post(metadata, resource, payload)
+        return dispatch.call(
+            self._session, "createNetworkSwitchAccessPolicy", networkId, name, radiusServers, radiusAccountingEnabled, **kwargs
+        )
 
     def getNetworkSwitchAccessPolicy(self, networkId: str, accessPolicyNumber: str):
         """
@@ -893,15 +382,7 @@ class Switch(object):
         - accessPolicyNumber (string): Access policy number
         """
 
-        metadata = {
-            "tags": ["switch", "configure", "accessPolicies"],
-            "operation": "getNetworkSwitchAccessPolicy",
-        }
-        networkId = urllib.parse.quote(str(networkId), safe="")
-        accessPolicyNumber = urllib.parse.quote(str(accessPolicyNumber), safe="")
-        resource = f"/networks/{networkId}/switch/accessPolicies/{accessPolicyNumber}"
-
-        return self._session.get(metadata, resource)
+        return dispatch.call(self._session, "getNetworkSwitchAccessPolicy", networkId, accessPolicyNumber)
 
     def updateNetworkSwitchAccessPolicy(self, networkId: str, accessPolicyNumber: str, **kwargs):
         """
@@ -931,57 +412,7 @@ class Switch(object):
         - guestSgtId (integer): Security Group Tag ID for guest group policy
         """
 
-        kwargs.update(locals())
-
-        if "hostMode" in kwargs:
-            options = ["Multi-Auth", "Multi-Domain", "Multi-Host", "Single-Host"]
-            assert kwargs["hostMode"] in options, (
-                f'''"hostMode" cannot be "{kwargs["hostMode"]}", & must be set to one of: {options}'''
-            )
-        if "accessPolicyType" in kwargs:
-            options = ["802.1x", "Hybrid authentication", "MAC authentication bypass"]
-            assert kwargs["accessPolicyType"] in options, (
-                f'''"accessPolicyType" cannot be "{kwargs["accessPolicyType"]}", & must be set to one of: {options}'''
-            )
-
-        metadata = {
-            "tags": ["switch", "configure", "accessPolicies"],
-            "operation": "updateNetworkSwitchAccessPolicy",
-        }
-        networkId = urllib.parse.quote(str(networkId), safe="")
-        accessPolicyNumber = urllib.parse.quote(str(accessPolicyNumber), safe="")
-        resource = f"/networks/{networkId}/switch/accessPolicies/{accessPolicyNumber}"
-
-        body_params = [
-            "name",
-            "radiusServers",
-            "radius",
-            "guestPortBouncing",
-            "radiusTestingEnabled",
-            "radiusCoaSupportEnabled",
-            "radiusAccountingEnabled",
-            "radiusAccountingServers",
-            "radiusGroupAttribute",
-            "hostMode",
-            "accessPolicyType",
-            "increaseAccessSpeed",
-            "guestVlanId",
-            "dot1x",
-            "voiceVlanClients",
-            "urlRedirectWalledGardenEnabled",
-            "urlRedirectWalledGardenRanges",
-            "guestGroupPolicyId",
-            "guestSgtId",
-        ]
-        payload = {k.strip(): v for k, v in kwargs.items() if k.strip() in body_params}
-
-        if self._session._validate_kwargs:
-            all_params = [] + body_params
-            invalid = [k for k in kwargs if k.strip() not in all_params and k != "self"]
-            if invalid and self._session._logger:
-                self._session._logger.warning(f"updateNetworkSwitchAccessPolicy: ignoring unrecognized kwargs: {invalid}")
-
-        return self._session.put(metadata, resource, payload)
+        return dispatch.call(self._session, "updateNetworkSwitchAccessPolicy", networkId, accessPolicyNumber, **kwargs)
 
     def deleteNetworkSwitchAccessPolicy(self, networkId: str, accessPolicyNumber: str):
         """
@@ -992,15 +423,7 @@ class Switch(object):
         - accessPolicyNumber (string): Access policy number
         """
 
-        metadata = {
-            "tags": ["switch", "configure", "accessPolicies"],
-            "operation": "deleteNetworkSwitchAccessPolicy",
-        }
-        networkId = urllib.parse.quote(str(networkId), safe="")
-        accessPolicyNumber = urllib.parse.quote(str(accessPolicyNumber), safe="")
-        resource = f"/networks/{networkId}/switch/accessPolicies/{accessPolicyNumber}"
-
-        return self._session.delete(metadata, resource)
+        return dispatch.call(self._session, "deleteNetworkSwitchAccessPolicy", networkId, accessPolicyNumber)
 
     def getNetworkSwitchAlternateManagementInterface(self, networkId: str):
         """
@@ -1010,14 +433,7 @@ class Switch(object):
         - networkId (string): Network ID
         """
 
-        metadata = {
-            "tags": ["switch", "configure", "alternateManagementInterface"],
-            "operation": "getNetworkSwitchAlternateManagementInterface",
-        }
-        networkId = urllib.parse.quote(str(networkId), safe="")
-        resource = f"/networks/{networkId}/switch/alternateManagementInterface"
-
-        return self._session.get(metadata, resource)
+        return dispatch.call(self._session, "getNetworkSwitchAlternateManagementInterface", networkId)
 
     def updateNetworkSwitchAlternateManagementInterface(self, networkId: str, **kwargs):
         """
@@ -1031,32 +447,7 @@ class Switch(object):
         - switches (array): Array of switch serial number and IP assignment. If parameter is present, it cannot have empty body. Note: switches parameter is not applicable for template networks, in other words, do not put 'switches' in the body when updating template networks. Also, an empty 'switches' array will remove all previous assignments
         """
 
-        kwargs.update(locals())
-
-        metadata = {
-            "tags": ["switch", "configure", "alternateManagementInterface"],
-            "operation": "updateNetworkSwitchAlternateManagementInterface",
-        }
-        networkId = urllib.parse.quote(str(networkId), safe="")
-        resource = f"/networks/{networkId}/switch/alternateManagementInterface"
-
-        body_params = [
-            "enabled",
-            "vlanId",
-            "protocols",
-            "switches",
-        ]
-        payload = {k.strip(): v for k, v in kwargs.items() if k.strip() in body_params}
-
-        if self._session._validate_kwargs:
-            all_params = [] + body_params
-            invalid = [k for k in kwargs if k.strip() not in all_params and k != "self"]
-            if invalid and self._session._logger:
-                self._session._logger.warning(
-                    f"updateNetworkSwitchAlternateManagementInterface: ignoring unrecognized kwargs: {invalid}"
-                )
-
-        return self._session.put(metadata, resource, payload)
+        return dispatch.call(self._session, "updateNetworkSwitchAlternateManagementInterface", networkId, **kwargs)
 
     def getNetworkSwitchDhcpV4ServersSeen(self, networkId: str, total_pages=1, direction="next", **kwargs):
         """
@@ -1073,31 +464,14 @@ class Switch(object):
         - endingBefore (string): A token used by the server to indicate the end of the page. Often this is a timestamp or an ID but it is not limited to those. This parameter should not be defined by client applications. The link for the first, last, prev, or next page in the HTTP Link header should define it.
         """
 
-        kwargs.update(locals())
-
-        metadata = {
-            "tags": ["switch", "configure", "dhcp", "v4", "servers", "seen"],
-            "operation": "getNetworkSwitchDhcpV4ServersSeen",
-        }
-        networkId = urllib.parse.quote(str(networkId), safe="")
-        resource = f"/networks/{networkId}/switch/dhcp/v4/servers/seen"
-
-        query_params = [
-            "t0",
-            "timespan",
-            "perPage",
-            "startingAfter",
-            "endingBefore",
-        ]
-        params = {k.strip(): v for k, v in kwargs.items() if k.strip() in query_params}
-
-        if self._session._validate_kwargs:
-            all_params = query_params
-            invalid = [k for k in kwargs if k.strip() not in all_params and k != "self"]
-            if invalid and self._session._logger:
-                self._session._logger.warning(f"getNetworkSwitchDhcpV4ServersSeen: ignoring unrecognized kwargs: {invalid}")
-
-        return self._session.get_pages(metadata, resource, params, total_pages, direction)
+        return dispatch.call(
+            self._session,
+            "getNetworkSwitchDhcpV4ServersSeen",
+            networkId,
+            total_pages=total_pages,
+            direction=direction,
+            **kwargs,
+        )
 
     def getNetworkSwitchDhcpServerPolicy(self, networkId: str):
         """
@@ -1107,14 +481,7 @@ class Switch(object):
         - networkId (string): Network ID
         """
 
-        metadata = {
-            "tags": ["switch", "configure", "dhcpServerPolicy"],
-            "operation": "getNetworkSwitchDhcpServerPolicy",
-        }
-        networkId = urllib.parse.quote(str(networkId), safe="")
-        resource = f"/networks/{networkId}/switch/dhcpServerPolicy"
-
-        return self._session.get(metadata, resource)
+        return dispatch.call(self._session, "getNetworkSwitchDhcpServerPolicy", networkId)
 
     def updateNetworkSwitchDhcpServerPolicy(self, networkId: str, **kwargs):
         """
@@ -1129,37 +496,7 @@ class Switch(object):
         - arpInspection (object): Dynamic ARP Inspection settings
         """
 
-        kwargs.update(locals())
-
-        if "defaultPolicy" in kwargs:
-            options = ["allow", "block"]
-            assert kwargs["defaultPolicy"] in options, (
-                f'''"defaultPolicy" cannot be "{kwargs["defaultPolicy"]}", & must be set to one of: {options}'''
-            )
-
-        metadata = {
-            "tags": ["switch", "configure", "dhcpServerPolicy"],
-            "operation": "updateNetworkSwitchDhcpServerPolicy",
-        }
-        networkId = urllib.parse.quote(str(networkId), safe="")
-        resource = f"/networks/{networkId}/switch/dhcpServerPolicy"
-
-        body_params = [
-            "alerts",
-            "defaultPolicy",
-            "allowedServers",
-            "blockedServers",
-            "arpInspection",
-        ]
-        payload = {k.strip(): v for k, v in kwargs.items() if k.strip() in body_params}
-
-        if self._session._validate_kwargs:
-            all_params = [] + body_params
-            invalid = [k for k in kwargs if k.strip() not in all_params and k != "self"]
-            if invalid and self._session._logger:
-                self._session._logger.warning(f"updateNetworkSwitchDhcpServerPolicy: ignoring unrecognized kwargs: {invalid}")
-
-        return self._session.put(metadata, resource, payload)
+        return dispatch.call(self._session, "updateNetworkSwitchDhcpServerPolicy", networkId, **kwargs)
 
     def getNetworkSwitchDhcpServerPolicyArpInspectionTrustedServers(
         self, networkId: str, total_pages=1, direction="next", **kwargs
@@ -1176,31 +513,14 @@ class Switch(object):
         - endingBefore (string): A token used by the server to indicate the end of the page. Often this is a timestamp or an ID but it is not limited to those. This parameter should not be defined by client applications. The link for the first, last, prev, or next page in the HTTP Link header should define it.
         """
 
-        kwargs.update(locals())
-
-        metadata = {
-            "tags": ["switch", "configure", "dhcpServerPolicy", "arpInspection", "trustedServers"],
-            "operation": "getNetworkSwitchDhcpServerPolicyArpInspectionTrustedServers",
-        }
-        networkId = urllib.parse.quote(str(networkId), safe="")
-        resource = f"/networks/{networkId}/switch/dhcpServerPolicy/arpInspection/trustedServers"
-
-        query_params = [
-            "perPage",
-            "startingAfter",
-            "endingBefore",
-        ]
-        params = {k.strip(): v for k, v in kwargs.items() if k.strip() in query_params}
-
-        if self._session._validate_kwargs:
-            all_params = query_params
-            invalid = [k for k in kwargs if k.strip() not in all_params and k != "self"]
-            if invalid and self._session._logger:
-                self._session._logger.warning(
-                    f"getNetworkSwitchDhcpServerPolicyArpInspectionTrustedServers: ignoring unrecognized kwargs: {invalid}"
-                )
-
-        return self._session.get_pages(metadata, resource, params, total_pages, direction)
+        return dispatch.call(
+            self._session,
+            "getNetworkSwitchDhcpServerPolicyArpInspectionTrustedServers",
+            networkId,
+            total_pages=total_pages,
+            direction=direction,
+            **kwargs,
+        )
 
     def createNetworkSwitchDhcpServerPolicyArpInspectionTrustedServer(
         self, networkId: str, mac: str, vlan: int, ipv4: dict, **kwargs
@@ -1215,31 +535,15 @@ class Switch(object):
         - ipv4 (object): The IPv4 attributes of the trusted server being added
         """
 
-        kwargs = locals()
-
-        metadata = {
-            "tags": ["switch", "configure", "dhcpServerPolicy", "arpInspection", "trustedServers"],
-            "operation": "createNetworkSwitchDhcpServerPolicyArpInspectionTrustedServer",
-        }
-        networkId = urllib.parse.quote(str(networkId), safe="")
-        resource = f"/networks/{networkId}/switch/dhcpServerPolicy/arpInspection/trustedServers"
-
-        body_params = [
-            "mac",
-            "vlan",
-            "ipv4",
-        ]
-        payload = {k.strip(): v for k, v in kwargs.items() if k.strip() in body_params}
-
-        if self._session._validate_kwargs:
-            all_params = [] + body_params
-            invalid = [k for k in kwargs if k.strip() not in all_params and k != "self"]
-            if invalid and self._session._logger:
-                self._session._logger.warning(
-                    f"createNetworkSwitchDhcpServerPolicyArpInspectionTrustedServer: ignoring unrecognized kwargs: {invalid}"
-                )
-
-        return self._session.post(metadata, resource, payload)
+        return dispatch.call(
+            self._session,
+            "createNetworkSwitchDhcpServerPolicyArpInspectionTrustedServer",
+            networkId,
+            mac,
+            vlan,
+            ipv4,
+            **kwargs,
+        )
 
     def updateNetworkSwitchDhcpServerPolicyArpInspectionTrustedServer(self, networkId: str, trustedServerId: str, **kwargs):
         """
@@ -1253,32 +557,13 @@ class Switch(object):
         - ipv4 (object): The updated IPv4 attributes of the trusted server
         """
 
-        kwargs.update(locals())
-
-        metadata = {
-            "tags": ["switch", "configure", "dhcpServerPolicy", "arpInspection", "trustedServers"],
-            "operation": "updateNetworkSwitchDhcpServerPolicyArpInspectionTrustedServer",
-        }
-        networkId = urllib.parse.quote(str(networkId), safe="")
-        trustedServerId = urllib.parse.quote(str(trustedServerId), safe="")
-        resource = f"/networks/{networkId}/switch/dhcpServerPolicy/arpInspection/trustedServers/{trustedServerId}"
-
-        body_params = [
-            "mac",
-            "vlan",
-            "ipv4",
-        ]
-        payload = {k.strip(): v for k, v in kwargs.items() if k.strip() in body_params}
-
-        if self._session._validate_kwargs:
-            all_params = [] + body_params
-            invalid = [k for k in kwargs if k.strip() not in all_params and k != "self"]
-            if invalid and self._session._logger:
-                self._session._logger.warning(
-                    f"updateNetworkSwitchDhcpServerPolicyArpInspectionTrustedServer: ignoring unrecognized kwargs: {invalid}"
-                )
-
-        return self._session.put(metadata, resource, payload)
+        return dispatch.call(
+            self._session,
+            "updateNetworkSwitchDhcpServerPolicyArpInspectionTrustedServer",
+            networkId,
+            trustedServerId,
+            **kwargs,
+        )
 
     def deleteNetworkSwitchDhcpServerPolicyArpInspectionTrustedServer(self, networkId: str, trustedServerId: str):
         """
@@ -1289,15 +574,9 @@ class Switch(object):
         - trustedServerId (string): Trusted server ID
         """
 
-        metadata = {
-            "tags": ["switch", "configure", "dhcpServerPolicy", "arpInspection", "trustedServers"],
-            "operation": "deleteNetworkSwitchDhcpServerPolicyArpInspectionTrustedServer",
-        }
-        networkId = urllib.parse.quote(str(networkId), safe="")
-        trustedServerId = urllib.parse.quote(str(trustedServerId), safe="")
-        resource = f"/networks/{networkId}/switch/dhcpServerPolicy/arpInspection/trustedServers/{trustedServerId}"
-
-        return self._session.delete(metadata, resource)
+        return dispatch.call(
+            self._session, "deleteNetworkSwitchDhcpServerPolicyArpInspectionTrustedServer", networkId, trustedServerId
+        )
 
     def getNetworkSwitchDhcpServerPolicyArpInspectionWarningsByDevice(
         self, networkId: str, total_pages=1, direction="next", **kwargs
@@ -1314,31 +593,14 @@ class Switch(object):
         - endingBefore (string): A token used by the server to indicate the end of the page. Often this is a timestamp or an ID but it is not limited to those. This parameter should not be defined by client applications. The link for the first, last, prev, or next page in the HTTP Link header should define it.
         """
 
-        kwargs.update(locals())
-
-        metadata = {
-            "tags": ["switch", "configure", "dhcpServerPolicy", "arpInspection", "warnings", "byDevice"],
-            "operation": "getNetworkSwitchDhcpServerPolicyArpInspectionWarningsByDevice",
-        }
-        networkId = urllib.parse.quote(str(networkId), safe="")
-        resource = f"/networks/{networkId}/switch/dhcpServerPolicy/arpInspection/warnings/byDevice"
-
-        query_params = [
-            "perPage",
-            "startingAfter",
-            "endingBefore",
-        ]
-        params = {k.strip(): v for k, v in kwargs.items() if k.strip() in query_params}
-
-        if self._session._validate_kwargs:
-            all_params = query_params
-            invalid = [k for k in kwargs if k.strip() not in all_params and k != "self"]
-            if invalid and self._session._logger:
-                self._session._logger.warning(
-                    f"getNetworkSwitchDhcpServerPolicyArpInspectionWarningsByDevice: ignoring unrecognized kwargs: {invalid}"
-                )
-
-        return self._session.get_pages(metadata, resource, params, total_pages, direction)
+        return dispatch.call(
+            self._session,
+            "getNetworkSwitchDhcpServerPolicyArpInspectionWarningsByDevice",
+            networkId,
+            total_pages=total_pages,
+            direction=direction,
+            **kwargs,
+        )
 
     def getNetworkSwitchDscpToCosMappings(self, networkId: str):
         """
@@ -1348,14 +610,7 @@ class Switch(object):
         - networkId (string): Network ID
         """
 
-        metadata = {
-            "tags": ["switch", "configure", "dscpToCosMappings"],
-            "operation": "getNetworkSwitchDscpToCosMappings",
-        }
-        networkId = urllib.parse.quote(str(networkId), safe="")
-        resource = f"/networks/{networkId}/switch/dscpToCosMappings"
-
-        return self._session.get(metadata, resource)
+        return dispatch.call(self._session, "getNetworkSwitchDscpToCosMappings", networkId)
 
     def updateNetworkSwitchDscpToCosMappings(self, networkId: str, mappings: list, **kwargs):
         """
@@ -1366,27 +621,7 @@ class Switch(object):
         - mappings (array): An array of DSCP to CoS mappings. An empty array will reset the mappings to default.
         """
 
-        kwargs = locals()
-
-        metadata = {
-            "tags": ["switch", "configure", "dscpToCosMappings"],
-            "operation": "updateNetworkSwitchDscpToCosMappings",
-        }
-        networkId = urllib.parse.quote(str(networkId), safe="")
-        resource = f"/networks/{networkId}/switch/dscpToCosMappings"
-
-        body_params = [
-            "mappings",
-        ]
-        payload = {k.strip(): v for k, v in kwargs.items() if k.strip() in body_params}
-
-        if self._session._validate_kwargs:
-            all_params = [] + body_params
-            invalid = [k for k in kwargs if k.strip() not in all_params and k != "self"]
-            if invalid and self._session._logger:
-                self._session._logger.warning(f"updateNetworkSwitchDscpToCosMappings: ignoring unrecognized kwargs: {invalid}")
-
-        return self._session.put(metadata, resource, payload)
+        return dispatch.call(self._session, "updateNetworkSwitchDscpToCosMappings", networkId, mappings, **kwargs)
 
     def getNetworkSwitchLinkAggregations(self, networkId: str):
         """
@@ -1396,14 +631,7 @@ class Switch(object):
         - networkId (string): Network ID
         """
 
-        metadata = {
-            "tags": ["switch", "configure", "linkAggregations"],
-            "operation": "getNetworkSwitchLinkAggregations",
-        }
-        networkId = urllib.parse.quote(str(networkId), safe="")
-        resource = f"/networks/{networkId}/switch/linkAggregations"
-
-        return self._session.get(metadata, resource)
+        return dispatch.call(self._session, "getNetworkSwitchLinkAggregations", networkId)
 
     def createNetworkSwitchLinkAggregation(self, networkId: str, **kwargs):
         """
@@ -1415,28 +643,7 @@ class Switch(object):
         - switchProfilePorts (array): Array of switch profile ports for creating aggregation group. Minimum 2 and maximum 8 ports are supported.
         """
 
-        kwargs.update(locals())
-
-        metadata = {
-            "tags": ["switch", "configure", "linkAggregations"],
-            "operation": "createNetworkSwitchLinkAggregation",
-        }
-        networkId = urllib.parse.quote(str(networkId), safe="")
-        resource = f"/networks/{networkId}/switch/linkAggregations"
-
-        body_params = [
-            "switchPorts",
-            "switchProfilePorts",
-        ]
-        payload = {k.strip(): v for k, v in kwargs.items() if k.strip() in body_params}
-
-        if self._session._validate_kwargs:
-            all_params = [] + body_params
-            invalid = [k for k in kwargs if k.strip() not in all_params and k != "self"]
-            if invalid and self._session._logger:
-                self._session._logger.warning(f"createNetworkSwitchLinkAggregation: ignoring unrecognized kwargs: {invalid}")
-
-        return self._session.post(metadata, resource, payload)
+        return dispatch.call(self._session, "createNetworkSwitchLinkAggregation", networkId, **kwargs)
 
     def updateNetworkSwitchLinkAggregation(self, networkId: str, linkAggregationId: str, **kwargs):
         """
@@ -1449,29 +656,7 @@ class Switch(object):
         - switchProfilePorts (array): Array of switch profile ports for updating aggregation group. Minimum 2 and maximum 8 ports are supported.
         """
 
-        kwargs.update(locals())
-
-        metadata = {
-            "tags": ["switch", "configure", "linkAggregations"],
-            "operation": "updateNetworkSwitchLinkAggregation",
-        }
-        networkId = urllib.parse.quote(str(networkId), safe="")
-        linkAggregationId = urllib.parse.quote(str(linkAggregationId), safe="")
-        resource = f"/networks/{networkId}/switch/linkAggregations/{linkAggregationId}"
-
-        body_params = [
-            "switchPorts",
-            "switchProfilePorts",
-        ]
-        payload = {k.strip(): v for k, v in kwargs.items() if k.strip() in body_params}
-
-        if self._session._validate_kwargs:
-            all_params = [] + body_params
-            invalid = [k for k in kwargs if k.strip() not in all_params and k != "self"]
-            if invalid and self._session._logger:
-                self._session._logger.warning(f"updateNetworkSwitchLinkAggregation: ignoring unrecognized kwargs: {invalid}")
-
-        return self._session.put(metadata, resource, payload)
+        return dispatch.call(self._session, "updateNetworkSwitchLinkAggregation", networkId, linkAggregationId, **kwargs)
 
     def deleteNetworkSwitchLinkAggregation(self, networkId: str, linkAggregationId: str):
         """
@@ -1482,15 +667,7 @@ class Switch(object):
         - linkAggregationId (string): Link aggregation ID
         """
 
-        metadata = {
-            "tags": ["switch", "configure", "linkAggregations"],
-            "operation": "deleteNetworkSwitchLinkAggregation",
-        }
-        networkId = urllib.parse.quote(str(networkId), safe="")
-        linkAggregationId = urllib.parse.quote(str(linkAggregationId), safe="")
-        resource = f"/networks/{networkId}/switch/linkAggregations/{linkAggregationId}"
-
-        return self._session.delete(metadata, resource)
+        return dispatch.call(self._session, "deleteNetworkSwitchLinkAggregation", networkId, linkAggregationId)
 
     def getNetworkSwitchMtu(self, networkId: str):
         """
@@ -1500,14 +677,7 @@ class Switch(object):
         - networkId (string): Network ID
         """
 
-        metadata = {
-            "tags": ["switch", "configure", "mtu"],
-            "operation": "getNetworkSwitchMtu",
-        }
-        networkId = urllib.parse.quote(str(networkId), safe="")
-        resource = f"/networks/{networkId}/switch/mtu"
-
-        return self._session.get(metadata, resource)
+        return dispatch.call(self._session, "getNetworkSwitchMtu", networkId)
 
     def updateNetworkSwitchMtu(self, networkId: str, **kwargs):
         """
@@ -1519,28 +689,7 @@ class Switch(object):
         - overrides (array): Override MTU size for individual switches or switch templates. An empty array will clear overrides.
         """
 
-        kwargs.update(locals())
-
-        metadata = {
-            "tags": ["switch", "configure", "mtu"],
-            "operation": "updateNetworkSwitchMtu",
-        }
-        networkId = urllib.parse.quote(str(networkId), safe="")
-        resource = f"/networks/{networkId}/switch/mtu"
-
-        body_params = [
-            "defaultMtuSize",
-            "overrides",
-        ]
-        payload = {k.strip(): v for k, v in kwargs.items() if k.strip() in body_params}
-
-        if self._session._validate_kwargs:
-            all_params = [] + body_params
-            invalid = [k for k in kwargs if k.strip() not in all_params and k != "self"]
-            if invalid and self._session._logger:
-                self._session._logger.warning(f"updateNetworkSwitchMtu: ignoring unrecognized kwargs: {invalid}")
-
-        return self._session.put(metadata, resource, payload)
+        return dispatch.call(self._session, "updateNetworkSwitchMtu", networkId, **kwargs)
 
     def getNetworkSwitchPortSchedules(self, networkId: str):
         """
@@ -1550,14 +699,7 @@ class Switch(object):
         - networkId (string): Network ID
         """
 
-        metadata = {
-            "tags": ["switch", "configure", "portSchedules"],
-            "operation": "getNetworkSwitchPortSchedules",
-        }
-        networkId = urllib.parse.quote(str(networkId), safe="")
-        resource = f"/networks/{networkId}/switch/portSchedules"
-
-        return self._session.get(metadata, resource)
+        return dispatch.call(self._session, "getNetworkSwitchPortSchedules", networkId)
 
     def createNetworkSwitchPortSchedule(self, networkId: str, name: str, **kwargs):
         """
@@ -1572,28 +714,7 @@ class Switch(object):
 
         """
 
-        kwargs.update(locals())
-
-        metadata = {
-            "tags": ["switch", "configure", "portSchedules"],
-            "operation": "createNetworkSwitchPortSchedule",
-        }
-        networkId = urllib.parse.quote(str(networkId), safe="")
-        resource = f"/networks/{networkId}/switch/portSchedules"
-
-        body_params = [
-            "name",
-            "portSchedule",
-        ]
-        payload = {k.strip(): v for k, v in kwargs.items() if k.strip() in body_params}
-
-        if self._session._validate_kwargs:
-            all_params = [] + body_params
-            invalid = [k for k in kwargs if k.strip() not in all_params and k != "self"]
-            if invalid and self._session._logger:
-                self._session._logger.warning(f"createNetworkSwitchPortSchedule: ignoring unrecognized kwargs: {invalid}")
-
-        return self._session.post(metadata, resource, payload)
+        return dispatch.call(self._session, "createNetworkSwitchPortSchedule", networkId, name, **kwargs)
 
     def deleteNetworkSwitchPortSchedule(self, networkId: str, portScheduleId: str):
         """
@@ -1604,15 +725,7 @@ class Switch(object):
         - portScheduleId (string): Port schedule ID
         """
 
-        metadata = {
-            "tags": ["switch", "configure", "portSchedules"],
-            "operation": "deleteNetworkSwitchPortSchedule",
-        }
-        networkId = urllib.parse.quote(str(networkId), safe="")
-        portScheduleId = urllib.parse.quote(str(portScheduleId), safe="")
-        resource = f"/networks/{networkId}/switch/portSchedules/{portScheduleId}"
-
-        return self._session.delete(metadata, resource)
+        return dispatch.call(self._session, "deleteNetworkSwitchPortSchedule", networkId, portScheduleId)
 
     def updateNetworkSwitchPortSchedule(self, networkId: str, portScheduleId: str, **kwargs):
         """
@@ -1628,29 +741,7 @@ class Switch(object):
 
         """
 
-        kwargs.update(locals())
-
-        metadata = {
-            "tags": ["switch", "configure", "portSchedules"],
-            "operation": "updateNetworkSwitchPortSchedule",
-        }
-        networkId = urllib.parse.quote(str(networkId), safe="")
-        portScheduleId = urllib.parse.quote(str(portScheduleId), safe="")
-        resource = f"/networks/{networkId}/switch/portSchedules/{portScheduleId}"
-
-        body_params = [
-            "name",
-            "portSchedule",
-        ]
-        payload = {k.strip(): v for k, v in kwargs.items() if k.strip() in body_params}
-
-        if self._session._validate_kwargs:
-            all_params = [] + body_params
-            invalid = [k for k in kwargs if k.strip() not in all_params and k != "self"]
-            if invalid and self._session._logger:
-                self._session._logger.warning(f"updateNetworkSwitchPortSchedule: ignoring unrecognized kwargs: {invalid}")
-
-        return self._session.put(metadata, resource, payload)
+        return dispatch.call(self._session, "updateNetworkSwitchPortSchedule", networkId, portScheduleId, **kwargs)
 
     def getNetworkSwitchQosRules(self, networkId: str):
         """
@@ -1660,14 +751,7 @@ class Switch(object):
         - networkId (string): Network ID
         """
 
-        metadata = {
-            "tags": ["switch", "configure", "qosRules"],
-            "operation": "getNetworkSwitchQosRules",
-        }
-        networkId = urllib.parse.quote(str(networkId), safe="")
-        resource = f"/networks/{networkId}/switch/qosRules"
-
-        return self._session.get(metadata, resource)
+        return dispatch.call(self._session, "getNetworkSwitchQosRules", networkId)
 
     def createNetworkSwitchQosRule(self, networkId: str, vlan: int, **kwargs):
         """
@@ -1684,39 +768,7 @@ class Switch(object):
         - dscp (integer): DSCP tag for the incoming packet. Set this to -1 to trust incoming DSCP. Default value is 0
         """
 
-        kwargs.update(locals())
-
-        if "protocol" in kwargs:
-            options = ["ANY", "TCP", "UDP"]
-            assert kwargs["protocol"] in options, (
-                f'''"protocol" cannot be "{kwargs["protocol"]}", & must be set to one of: {options}'''
-            )
-
-        metadata = {
-            "tags": ["switch", "configure", "qosRules"],
-            "operation": "createNetworkSwitchQosRule",
-        }
-        networkId = urllib.parse.quote(str(networkId), safe="")
-        resource = f"/networks/{networkId}/switch/qosRules"
-
-        body_params = [
-            "vlan",
-            "protocol",
-            "srcPort",
-            "srcPortRange",
-            "dstPort",
-            "dstPortRange",
-            "dscp",
-        ]
-        payload = {k.strip(): v for k, v in kwargs.items() if k.strip() in body_params}
-
-        if self._session._validate_kwargs:
-            all_params = [] + body_params
-            invalid = [k for k in kwargs if k.strip() not in all_params and k != "self"]
-            if invalid and self._session._logger:
-                self._session._logger.warning(f"createNetworkSwitchQosRule: ignoring unrecognized kwargs: {invalid}")
-
-        return self._session.post(metadata, resource, payload)
+        return dispatch.call(self._session, "createNetworkSwitchQosRule", networkId, vlan, **kwargs)
 
     def getNetworkSwitchQosRulesOrder(self, networkId: str):
         """
@@ -1726,14 +778,7 @@ class Switch(object):
         - networkId (string): Network ID
         """
 
-        metadata = {
-            "tags": ["switch", "configure", "qosRules", "order"],
-            "operation": "getNetworkSwitchQosRulesOrder",
-        }
-        networkId = urllib.parse.quote(str(networkId), safe="")
-        resource = f"/networks/{networkId}/switch/qosRules/order"
-
-        return self._session.get(metadata, resource)
+        return dispatch.call(self._session, "getNetworkSwitchQosRulesOrder", networkId)
 
     def updateNetworkSwitchQosRulesOrder(self, networkId: str, ruleIds: list, **kwargs):
         """
@@ -1744,27 +789,7 @@ class Switch(object):
         - ruleIds (array): A list of quality of service rule IDs arranged in order in which they should be processed by the switch.
         """
 
-        kwargs = locals()
-
-        metadata = {
-            "tags": ["switch", "configure", "qosRules", "order"],
-            "operation": "updateNetworkSwitchQosRulesOrder",
-        }
-        networkId = urllib.parse.quote(str(networkId), safe="")
-        resource = f"/networks/{networkId}/switch/qosRules/order"
-
-        body_params = [
-            "ruleIds",
-        ]
-        payload = {k.strip(): v for k, v in kwargs.items() if k.strip() in body_params}
-
-        if self._session._validate_kwargs:
-            all_params = [] + body_params
-            invalid = [k for k in kwargs if k.strip() not in all_params and k != "self"]
-            if invalid and self._session._logger:
-                self._session._logger.warning(f"updateNetworkSwitchQosRulesOrder: ignoring unrecognized kwargs: {invalid}")
-
-        return self._session.put(metadata, resource, payload)
+        return dispatch.call(self._session, "updateNetworkSwitchQosRulesOrder", networkId, ruleIds, **kwargs)
 
     def getNetworkSwitchQosRule(self, networkId: str, qosRuleId: str):
         """
@@ -1775,15 +800,7 @@ class Switch(object):
         - qosRuleId (string): Qos rule ID
         """
 
-        metadata = {
-            "tags": ["switch", "configure", "qosRules"],
-            "operation": "getNetworkSwitchQosRule",
-        }
-        networkId = urllib.parse.quote(str(networkId), safe="")
-        qosRuleId = urllib.parse.quote(str(qosRuleId), safe="")
-        resource = f"/networks/{networkId}/switch/qosRules/{qosRuleId}"
-
-        return self._session.get(metadata, resource)
+        return dispatch.call(self._session, "getNetworkSwitchQosRule", networkId, qosRuleId)
 
     def deleteNetworkSwitchQosRule(self, networkId: str, qosRuleId: str):
         """
@@ -1794,15 +811,7 @@ class Switch(object):
         - qosRuleId (string): Qos rule ID
         """
 
-        metadata = {
-            "tags": ["switch", "configure", "qosRules"],
-            "operation": "deleteNetworkSwitchQosRule",
-        }
-        networkId = urllib.parse.quote(str(networkId), safe="")
-        qosRuleId = urllib.parse.quote(str(qosRuleId), safe="")
-        resource = f"/networks/{networkId}/switch/qosRules/{qosRuleId}"
-
-        return self._session.delete(metadata, resource)
+        return dispatch.call(self._session, "deleteNetworkSwitchQosRule", networkId, qosRuleId)
 
     def updateNetworkSwitchQosRule(self, networkId: str, qosRuleId: str, **kwargs):
         """
@@ -1820,40 +829,7 @@ class Switch(object):
         - dscp (integer): DSCP tag that should be assigned to incoming packet. Set this to -1 to trust incoming DSCP. Default value is 0
         """
 
-        kwargs.update(locals())
-
-        if "protocol" in kwargs:
-            options = ["ANY", "TCP", "UDP"]
-            assert kwargs["protocol"] in options, (
-                f'''"protocol" cannot be "{kwargs["protocol"]}", & must be set to one of: {options}'''
-            )
-
-        metadata = {
-            "tags": ["switch", "configure", "qosRules"],
-            "operation": "updateNetworkSwitchQosRule",
-        }
-        networkId = urllib.parse.quote(str(networkId), safe="")
-        qosRuleId = urllib.parse.quote(str(qosRuleId), safe="")
-        resource = f"/networks/{networkId}/switch/qosRules/{qosRuleId}"
-
-        body_params = [
-            "vlan",
-            "protocol",
-            "srcPort",
-            "srcPortRange",
-            "dstPort",
-            "dstPortRange",
-            "dscp",
-        ]
-        payload = {k.strip(): v for k, v in kwargs.items() if k.strip() in body_params}
-
-        if self._session._validate_kwargs:
-            all_params = [] + body_params
-            invalid = [k for k in kwargs if k.strip() not in all_params and k != "self"]
-            if invalid and self._session._logger:
-                self._session._logger.warning(f"updateNetworkSwitchQosRule: ignoring unrecognized kwargs: {invalid}")
-
-        return self._session.put(metadata, resource, payload)
+        return dispatch.call(self._session, "updateNetworkSwitchQosRule", networkId, qosRuleId, **kwargs)
 
     def getNetworkSwitchRoutingMulticast(self, networkId: str):
         """
@@ -1863,14 +839,7 @@ class Switch(object):
         - networkId (string): Network ID
         """
 
-        metadata = {
-            "tags": ["switch", "configure", "routing", "multicast"],
-            "operation": "getNetworkSwitchRoutingMulticast",
-        }
-        networkId = urllib.parse.quote(str(networkId), safe="")
-        resource = f"/networks/{networkId}/switch/routing/multicast"
-
-        return self._session.get(metadata, resource)
+        return dispatch.call(self._session, "getNetworkSwitchRoutingMulticast", networkId)
 
     def updateNetworkSwitchRoutingMulticast(self, networkId: str, **kwargs):
         """
@@ -1882,28 +851,7 @@ class Switch(object):
         - overrides (array): Array of paired switches/stacks/profiles and corresponding multicast settings. An empty array will clear the multicast settings.
         """
 
-        kwargs.update(locals())
-
-        metadata = {
-            "tags": ["switch", "configure", "routing", "multicast"],
-            "operation": "updateNetworkSwitchRoutingMulticast",
-        }
-        networkId = urllib.parse.quote(str(networkId), safe="")
-        resource = f"/networks/{networkId}/switch/routing/multicast"
-
-        body_params = [
-            "defaultSettings",
-            "overrides",
-        ]
-        payload = {k.strip(): v for k, v in kwargs.items() if k.strip() in body_params}
-
-        if self._session._validate_kwargs:
-            all_params = [] + body_params
-            invalid = [k for k in kwargs if k.strip() not in all_params and k != "self"]
-            if invalid and self._session._logger:
-                self._session._logger.warning(f"updateNetworkSwitchRoutingMulticast: ignoring unrecognized kwargs: {invalid}")
-
-        return self._session.put(metadata, resource, payload)
+        return dispatch.call(self._session, "updateNetworkSwitchRoutingMulticast", networkId, **kwargs)
 
     def getNetworkSwitchRoutingMulticastRendezvousPoints(self, networkId: str):
         """
@@ -1913,14 +861,7 @@ class Switch(object):
         - networkId (string): Network ID
         """
 
-        metadata = {
-            "tags": ["switch", "configure", "routing", "multicast", "rendezvousPoints"],
-            "operation": "getNetworkSwitchRoutingMulticastRendezvousPoints",
-        }
-        networkId = urllib.parse.quote(str(networkId), safe="")
-        resource = f"/networks/{networkId}/switch/routing/multicast/rendezvousPoints"
-
-        return self._session.get(metadata, resource)
+        return dispatch.call(self._session, "getNetworkSwitchRoutingMulticastRendezvousPoints", networkId)
 
     def createNetworkSwitchRoutingMulticastRendezvousPoint(
         self, networkId: str, interfaceIp: str, multicastGroup: str, **kwargs
@@ -1935,31 +876,14 @@ class Switch(object):
         - vrf (object): The VRF with PIM enabled L3 interface
         """
 
-        kwargs.update(locals())
-
-        metadata = {
-            "tags": ["switch", "configure", "routing", "multicast", "rendezvousPoints"],
-            "operation": "createNetworkSwitchRoutingMulticastRendezvousPoint",
-        }
-        networkId = urllib.parse.quote(str(networkId), safe="")
-        resource = f"/networks/{networkId}/switch/routing/multicast/rendezvousPoints"
-
-        body_params = [
-            "interfaceIp",
-            "multicastGroup",
-            "vrf",
-        ]
-        payload = {k.strip(): v for k, v in kwargs.items() if k.strip() in body_params}
-
-        if self._session._validate_kwargs:
-            all_params = [] + body_params
-            invalid = [k for k in kwargs if k.strip() not in all_params and k != "self"]
-            if invalid and self._session._logger:
-                self._session._logger.warning(
-                    f"createNetworkSwitchRoutingMulticastRendezvousPoint: ignoring unrecognized kwargs: {invalid}"
-                )
-
-        return self._session.post(metadata, resource, payload)
+        return dispatch.call(
+            self._session,
+            "createNetworkSwitchRoutingMulticastRendezvousPoint",
+            networkId,
+            interfaceIp,
+            multicastGroup,
+            **kwargs,
+        )
 
     def getNetworkSwitchRoutingMulticastRendezvousPoint(self, networkId: str, rendezvousPointId: str):
         """
@@ -1970,15 +894,7 @@ class Switch(object):
         - rendezvousPointId (string): Rendezvous point ID
         """
 
-        metadata = {
-            "tags": ["switch", "configure", "routing", "multicast", "rendezvousPoints"],
-            "operation": "getNetworkSwitchRoutingMulticastRendezvousPoint",
-        }
-        networkId = urllib.parse.quote(str(networkId), safe="")
-        rendezvousPointId = urllib.parse.quote(str(rendezvousPointId), safe="")
-        resource = f"/networks/{networkId}/switch/routing/multicast/rendezvousPoints/{rendezvousPointId}"
-
-        return self._session.get(metadata, resource)
+        return dispatch.call(self._session, "getNetworkSwitchRoutingMulticastRendezvousPoint", networkId, rendezvousPointId)
 
     def deleteNetworkSwitchRoutingMulticastRendezvousPoint(self, networkId: str, rendezvousPointId: str):
         """
@@ -1989,15 +905,7 @@ class Switch(object):
         - rendezvousPointId (string): Rendezvous point ID
         """
 
-        metadata = {
-            "tags": ["switch", "configure", "routing", "multicast", "rendezvousPoints"],
-            "operation": "deleteNetworkSwitchRoutingMulticastRendezvousPoint",
-        }
-        networkId = urllib.parse.quote(str(networkId), safe="")
-        rendezvousPointId = urllib.parse.quote(str(rendezvousPointId), safe="")
-        resource = f"/networks/{networkId}/switch/routing/multicast/rendezvousPoints/{rendezvousPointId}"
-
-        return self._session.delete(metadata, resource)
+        return dispatch.call(self._session, "deleteNetworkSwitchRoutingMulticastRendezvousPoint", networkId, rendezvousPointId)
 
     def updateNetworkSwitchRoutingMulticastRendezvousPoint(
         self, networkId: str, rendezvousPointId: str, interfaceIp: str, multicastGroup: str, **kwargs
@@ -2013,32 +921,15 @@ class Switch(object):
         - vrf (object): The VRF with PIM enabled L3 interface
         """
 
-        kwargs.update(locals())
-
-        metadata = {
-            "tags": ["switch", "configure", "routing", "multicast", "rendezvousPoints"],
-            "operation": "updateNetworkSwitchRoutingMulticastRendezvousPoint",
-        }
-        networkId = urllib.parse.quote(str(networkId), safe="")
-        rendezvousPointId = urllib.parse.quote(str(rendezvousPointId), safe="")
-        resource = f"/networks/{networkId}/switch/routing/multicast/rendezvousPoints/{rendezvousPointId}"
-
-        body_params = [
-            "interfaceIp",
-            "multicastGroup",
-            "vrf",
-        ]
-        payload = {k.strip(): v for k, v in kwargs.items() if k.strip() in body_params}
-
-        if self._session._validate_kwargs:
-            all_params = [] + body_params
-            invalid = [k for k in kwargs if k.strip() not in all_params and k != "self"]
-            if invalid and self._session._logger:
-                self._session._logger.warning(
-                    f"updateNetworkSwitchRoutingMulticastRendezvousPoint: ignoring unrecognized kwargs: {invalid}"
-                )
-
-        return self._session.put(metadata, resource, payload)
+        return dispatch.call(
+            self._session,
+            "updateNetworkSwitchRoutingMulticastRendezvousPoint",
+            networkId,
+            rendezvousPointId,
+            interfaceIp,
+            multicastGroup,
+            **kwargs,
+        )
 
     def getNetworkSwitchRoutingOspf(self, networkId: str, **kwargs):
         """
@@ -2049,27 +940,7 @@ class Switch(object):
         - vrf (string): The VRF to return the OSPF routing configuration for. When not provided, the default VRF is used. Included on networks with IOS XE 17.18 or higher
         """
 
-        kwargs.update(locals())
-
-        metadata = {
-            "tags": ["switch", "configure", "routing", "ospf"],
-            "operation": "getNetworkSwitchRoutingOspf",
-        }
-        networkId = urllib.parse.quote(str(networkId), safe="")
-        resource = f"/networks/{networkId}/switch/routing/ospf"
-
-        query_params = [
-            "vrf",
-        ]
-        params = {k.strip(): v for k, v in kwargs.items() if k.strip() in query_params}
-
-        if self._session._validate_kwargs:
-            all_params = query_params
-            invalid = [k for k in kwargs if k.strip() not in all_params and k != "self"]
-            if invalid and self._session._logger:
-                self._session._logger.warning(f"getNetworkSwitchRoutingOspf: ignoring unrecognized kwargs: {invalid}")
-
-        return self._session.get(metadata, resource, params)
+        return dispatch.call(self._session, "getNetworkSwitchRoutingOspf", networkId, **kwargs)
 
     def updateNetworkSwitchRoutingOspf(self, networkId: str, **kwargs):
         """
@@ -2087,38 +958,7 @@ class Switch(object):
         - md5AuthenticationKey (object): MD5 authentication credentials. This param is only relevant if md5AuthenticationEnabled is true
         """
 
-        kwargs.update(locals())
-
-        metadata = {
-            "tags": ["switch", "configure", "routing", "ospf"],
-            "operation": "updateNetworkSwitchRoutingOspf",
-        }
-        networkId = urllib.parse.quote(str(networkId), safe="")
-        resource = f"/networks/{networkId}/switch/routing/ospf"
-
-        query_params = [
-            "vrf",
-        ]
-        params = {k.strip(): v for k, v in kwargs.items() if k.strip() in query_params}
-
-        body_params = [
-            "enabled",
-            "helloTimerInSeconds",
-            "deadTimerInSeconds",
-            "areas",
-            "v3",
-            "md5AuthenticationEnabled",
-            "md5AuthenticationKey",
-        ]
-        payload = {k.strip(): v for k, v in kwargs.items() if k.strip() in body_params}
-
-        if self._session._validate_kwargs:
-            all_params = query_params + body_params
-            invalid = [k for k in kwargs if k.strip() not in all_params and k != "self"]
-            if invalid and self._session._logger:
-                self._session._logger.warning(f"updateNetworkSwitchRoutingOspf: ignoring unrecognized kwargs: {invalid}")
-
-        return self._session.put(metadata, resource, payload, params=params)
+        return dispatch.call(self._session, "updateNetworkSwitchRoutingOspf", networkId, **kwargs)
 
     def getNetworkSwitchSettings(self, networkId: str):
         """
@@ -2128,14 +968,7 @@ class Switch(object):
         - networkId (string): Network ID
         """
 
-        metadata = {
-            "tags": ["switch", "configure", "settings"],
-            "operation": "getNetworkSwitchSettings",
-        }
-        networkId = urllib.parse.quote(str(networkId), safe="")
-        resource = f"/networks/{networkId}/switch/settings"
-
-        return self._session.get(metadata, resource)
+        return dispatch.call(self._session, "getNetworkSwitchSettings", networkId)
 
     def updateNetworkSwitchSettings(self, networkId: str, **kwargs):
         """
@@ -2152,33 +985,7 @@ class Switch(object):
         - uplinkSelection (object): Settings related to uplink selection on IOS-XE switches.
         """
 
-        kwargs.update(locals())
-
-        metadata = {
-            "tags": ["switch", "configure", "settings"],
-            "operation": "updateNetworkSwitchSettings",
-        }
-        networkId = urllib.parse.quote(str(networkId), safe="")
-        resource = f"/networks/{networkId}/switch/settings"
-
-        body_params = [
-            "vlan",
-            "useCombinedPower",
-            "powerExceptions",
-            "uplinkClientSampling",
-            "macBlocklist",
-            "portChannelFallback",
-            "uplinkSelection",
-        ]
-        payload = {k.strip(): v for k, v in kwargs.items() if k.strip() in body_params}
-
-        if self._session._validate_kwargs:
-            all_params = [] + body_params
-            invalid = [k for k in kwargs if k.strip() not in all_params and k != "self"]
-            if invalid and self._session._logger:
-                self._session._logger.warning(f"updateNetworkSwitchSettings: ignoring unrecognized kwargs: {invalid}")
-
-        return self._session.put(metadata, resource, payload)
+        return dispatch.call(self._session, "updateNetworkSwitchSettings", networkId, **kwargs)
 
     def getNetworkSwitchStacks(self, networkId: str):
         """
@@ -2188,14 +995,7 @@ class Switch(object):
         - networkId (string): Network ID
         """
 
-        metadata = {
-            "tags": ["switch", "configure", "stacks"],
-            "operation": "getNetworkSwitchStacks",
-        }
-        networkId = urllib.parse.quote(str(networkId), safe="")
-        resource = f"/networks/{networkId}/switch/stacks"
-
-        return self._session.get(metadata, resource)
+        return dispatch.call(self._session, "getNetworkSwitchStacks", networkId)
 
     def createNetworkSwitchStack(self, networkId: str, name: str, serials: list, **kwargs):
         """
@@ -2207,28 +1007,7 @@ class Switch(object):
         - serials (array): An array of switch serials to be added into the new stack
         """
 
-        kwargs = locals()
-
-        metadata = {
-            "tags": ["switch", "configure", "stacks"],
-            "operation": "createNetworkSwitchStack",
-        }
-        networkId = urllib.parse.quote(str(networkId), safe="")
-        resource = f"/networks/{networkId}/switch/stacks"
-
-        body_params = [
-            "name",
-            "serials",
-        ]
-        payload = {k.strip(): v for k, v in kwargs.items() if k.strip() in body_params}
-
-        if self._session._validate_kwargs:
-            all_params = [] + body_params
-            invalid = [k for k in kwargs if k.strip() not in all_params and k != "self"]
-            if invalid and self._session._logger:
-                self._session._logger.warning(f"createNetworkSwitchStack: ignoring unrecognized kwargs: {invalid}")
-
-        return self._session.post(metadata, resource, payload)
+        return dispatch.call(self._session, "createNetworkSwitchStack", networkId, name, serials, **kwargs)
 
     def updateNetworkSwitchStack(self, networkId: str, switchStackId: str, **kwargs):
         """
@@ -2241,29 +1020,7 @@ class Switch(object):
         - members (array): The complete list of switches that should be in the stack. Minimum 2 and maximum 8 members. Omitting this field leaves stack membership unchanged.
         """
 
-        kwargs.update(locals())
-
-        metadata = {
-            "tags": ["switch", "configure", "stacks"],
-            "operation": "updateNetworkSwitchStack",
-        }
-        networkId = urllib.parse.quote(str(networkId), safe="")
-        switchStackId = urllib.parse.quote(str(switchStackId), safe="")
-        resource = f"/networks/{networkId}/switch/stacks/{switchStackId}"
-
-        body_params = [
-            "name",
-            "members",
-        ]
-        payload = {k.strip(): v for k, v in kwargs.items() if k.strip() in body_params}
-
-        if self._session._validate_kwargs:
-            all_params = [] + body_params
-            invalid = [k for k in kwargs if k.strip() not in all_params and k != "self"]
-            if invalid and self._session._logger:
-                self._session._logger.warning(f"updateNetworkSwitchStack: ignoring unrecognized kwargs: {invalid}")
-
-        return self._session.put(metadata, resource, payload)
+        return dispatch.call(self._session, "updateNetworkSwitchStack", networkId, switchStackId, **kwargs)
 
     def getNetworkSwitchStack(self, networkId: str, switchStackId: str):
         """
@@ -2274,15 +1031,7 @@ class Switch(object):
         - switchStackId (string): Switch stack ID
         """
 
-        metadata = {
-            "tags": ["switch", "configure", "stacks"],
-            "operation": "getNetworkSwitchStack",
-        }
-        networkId = urllib.parse.quote(str(networkId), safe="")
-        switchStackId = urllib.parse.quote(str(switchStackId), safe="")
-        resource = f"/networks/{networkId}/switch/stacks/{switchStackId}"
-
-        return self._session.get(metadata, resource)
+        return dispatch.call(self._session, "getNetworkSwitchStack", networkId, switchStackId)
 
     def deleteNetworkSwitchStack(self, networkId: str, switchStackId: str):
         """
@@ -2293,15 +1042,7 @@ class Switch(object):
         - switchStackId (string): Switch stack ID
         """
 
-        metadata = {
-            "tags": ["switch", "configure", "stacks"],
-            "operation": "deleteNetworkSwitchStack",
-        }
-        networkId = urllib.parse.quote(str(networkId), safe="")
-        switchStackId = urllib.parse.quote(str(switchStackId), safe="")
-        resource = f"/networks/{networkId}/switch/stacks/{switchStackId}"
-
-        return self._session.delete(metadata, resource)
+        return dispatch.call(self._session, "deleteNetworkSwitchStack", networkId, switchStackId)
 
     def addNetworkSwitchStack(self, networkId: str, switchStackId: str, serial: str, **kwargs):
         """
@@ -2313,28 +1054,7 @@ class Switch(object):
         - serial (string): The serial of the switch to be added
         """
 
-        kwargs = locals()
-
-        metadata = {
-            "tags": ["switch", "configure", "stacks"],
-            "operation": "addNetworkSwitchStack",
-        }
-        networkId = urllib.parse.quote(str(networkId), safe="")
-        switchStackId = urllib.parse.quote(str(switchStackId), safe="")
-        resource = f"/networks/{networkId}/switch/stacks/{switchStackId}/add"
-
-        body_params = [
-            "serial",
-        ]
-        payload = {k.strip(): v for k, v in kwargs.items() if k.strip() in body_params}
-
-        if self._session._validate_kwargs:
-            all_params = [] + body_params
-            invalid = [k for k in kwargs if k.strip() not in all_params and k != "self"]
-            if invalid and self._session._logger:
-                self._session._logger.warning(f"addNetworkSwitchStack: ignoring unrecognized kwargs: {invalid}")
-
-        return self._session.post(metadata, resource, payload)
+        return dispatch.call(self._session, "addNetworkSwitchStack", networkId, switchStackId, serial, **kwargs)
 
     def removeNetworkSwitchStack(self, networkId: str, switchStackId: str, serial: str, **kwargs):
         """
@@ -2346,28 +1066,7 @@ class Switch(object):
         - serial (string): The serial of the switch to be removed
         """
 
-        kwargs = locals()
-
-        metadata = {
-            "tags": ["switch", "configure", "stacks"],
-            "operation": "removeNetworkSwitchStack",
-        }
-        networkId = urllib.parse.quote(str(networkId), safe="")
-        switchStackId = urllib.parse.quote(str(switchStackId), safe="")
-        resource = f"/networks/{networkId}/switch/stacks/{switchStackId}/remove"
-
-        body_params = [
-            "serial",
-        ]
-        payload = {k.strip(): v for k, v in kwargs.items() if k.strip() in body_params}
-
-        if self._session._validate_kwargs:
-            all_params = [] + body_params
-            invalid = [k for k in kwargs if k.strip() not in all_params and k != "self"]
-            if invalid and self._session._logger:
-                self._session._logger.warning(f"removeNetworkSwitchStack: ignoring unrecognized kwargs: {invalid}")
-
-        return self._session.post(metadata, resource, payload)
+        return dispatch.call(self._session, "removeNetworkSwitchStack", networkId, switchStackId, serial, **kwargs)
 
     def getNetworkSwitchStackRoutingInterfaces(self, networkId: str, switchStackId: str, **kwargs):
         """
@@ -2380,40 +1079,7 @@ class Switch(object):
         - protocol (string): Optional parameter to filter L3 interfaces by protocol.
         """
 
-        kwargs.update(locals())
-
-        if "mode" in kwargs:
-            options = ["loopback", "oob_management", "routed", "vlan"]
-            assert kwargs["mode"] in options, f'''"mode" cannot be "{kwargs["mode"]}", & must be set to one of: {options}'''
-        if "protocol" in kwargs:
-            options = ["ipv4", "ipv6"]
-            assert kwargs["protocol"] in options, (
-                f'''"protocol" cannot be "{kwargs["protocol"]}", & must be set to one of: {options}'''
-            )
-
-        metadata = {
-            "tags": ["switch", "configure", "stacks", "routing", "interfaces"],
-            "operation": "getNetworkSwitchStackRoutingInterfaces",
-        }
-        networkId = urllib.parse.quote(str(networkId), safe="")
-        switchStackId = urllib.parse.quote(str(switchStackId), safe="")
-        resource = f"/networks/{networkId}/switch/stacks/{switchStackId}/routing/interfaces"
-
-        query_params = [
-            "mode",
-            "protocol",
-        ]
-        params = {k.strip(): v for k, v in kwargs.items() if k.strip() in query_params}
-
-        if self._session._validate_kwargs:
-            all_params = query_params
-            invalid = [k for k in kwargs if k.strip() not in all_params and k != "self"]
-            if invalid and self._session._logger:
-                self._session._logger.warning(
-                    f"getNetworkSwitchStackRoutingInterfaces: ignoring unrecognized kwargs: {invalid}"
-                )
-
-        return self._session.get(metadata, resource, params)
+        return dispatch.call(self._session, "getNetworkSwitchStackRoutingInterfaces", networkId, switchStackId, **kwargs)
 
     def createNetworkSwitchStackRoutingInterface(self, networkId: str, switchStackId: str, name: str, **kwargs):
         """
@@ -2437,51 +1103,9 @@ class Switch(object):
         - loopback (object): The loopback settings of the interface.
         """
 
-        kwargs.update(locals())
-
-        if "mode" in kwargs:
-            options = ["loopback", "oob_management", "routed", "vlan"]
-            assert kwargs["mode"] in options, f'''"mode" cannot be "{kwargs["mode"]}", & must be set to one of: {options}'''
-        if "multicastRouting" in kwargs:
-            options = ["IGMP snooping querier", "disabled", "enabled"]
-            assert kwargs["multicastRouting"] in options, (
-                f'''"multicastRouting" cannot be "{kwargs["multicastRouting"]}", & must be set to one of: {options}'''
-            )
-
-        metadata = {
-            "tags": ["switch", "configure", "stacks", "routing", "interfaces"],
-            "operation": "createNetworkSwitchStackRoutingInterface",
-        }
-        networkId = urllib.parse.quote(str(networkId), safe="")
-        switchStackId = urllib.parse.quote(str(switchStackId), safe="")
-        resource = f"/networks/{networkId}/switch/stacks/{switchStackId}/routing/interfaces"
-
-        body_params = [
-            "name",
-            "mode",
-            "subnet",
-            "switchPortId",
-            "interfaceIp",
-            "mtu",
-            "multicastRouting",
-            "vlanId",
-            "defaultGateway",
-            "ospfSettings",
-            "ipv6",
-            "vrf",
-            "loopback",
-        ]
-        payload = {k.strip(): v for k, v in kwargs.items() if k.strip() in body_params}
-
-        if self._session._validate_kwargs:
-            all_params = [] + body_params
-            invalid = [k for k in kwargs if k.strip() not in all_params and k != "self"]
-            if invalid and self._session._logger:
-                self._session._logger.warning(
-                    f"createNetworkSwitchStackRoutingInterface: ignoring unrecognized kwargs: {invalid}"
-                )
-
-        return self._session.post(metadata, resource, payload)
+        return dispatch.call(
+            self._session, "createNetworkSwitchStackRoutingInterface", networkId, switchStackId, name, **kwargs
+        )
 
     def getNetworkSwitchStackRoutingInterface(self, networkId: str, switchStackId: str, interfaceId: str):
         """
@@ -2493,16 +1117,7 @@ class Switch(object):
         - interfaceId (string): Interface ID
         """
 
-        metadata = {
-            "tags": ["switch", "configure", "stacks", "routing", "interfaces"],
-            "operation": "getNetworkSwitchStackRoutingInterface",
-        }
-        networkId = urllib.parse.quote(str(networkId), safe="")
-        switchStackId = urllib.parse.quote(str(switchStackId), safe="")
-        interfaceId = urllib.parse.quote(str(interfaceId), safe="")
-        resource = f"/networks/{networkId}/switch/stacks/{switchStackId}/routing/interfaces/{interfaceId}"
-
-        return self._session.get(metadata, resource)
+        return dispatch.call(self._session, "getNetworkSwitchStackRoutingInterface", networkId, switchStackId, interfaceId)
 
     def updateNetworkSwitchStackRoutingInterface(self, networkId: str, switchStackId: str, interfaceId: str, **kwargs):
         """
@@ -2526,48 +1141,9 @@ class Switch(object):
         - loopback (object): The loopback settings of the interface.
         """
 
-        kwargs.update(locals())
-
-        if "multicastRouting" in kwargs:
-            options = ["IGMP snooping querier", "disabled", "enabled"]
-            assert kwargs["multicastRouting"] in options, (
-                f'''"multicastRouting" cannot be "{kwargs["multicastRouting"]}", & must be set to one of: {options}'''
-            )
-
-        metadata = {
-            "tags": ["switch", "configure", "stacks", "routing", "interfaces"],
-            "operation": "updateNetworkSwitchStackRoutingInterface",
-        }
-        networkId = urllib.parse.quote(str(networkId), safe="")
-        switchStackId = urllib.parse.quote(str(switchStackId), safe="")
-        interfaceId = urllib.parse.quote(str(interfaceId), safe="")
-        resource = f"/networks/{networkId}/switch/stacks/{switchStackId}/routing/interfaces/{interfaceId}"
-
-        body_params = [
-            "name",
-            "subnet",
-            "switchPortId",
-            "interfaceIp",
-            "mtu",
-            "multicastRouting",
-            "vlanId",
-            "defaultGateway",
-            "ospfSettings",
-            "ipv6",
-            "vrf",
-            "loopback",
-        ]
-        payload = {k.strip(): v for k, v in kwargs.items() if k.strip() in body_params}
-
-        if self._session._validate_kwargs:
-            all_params = [] + body_params
-            invalid = [k for k in kwargs if k.strip() not in all_params and k != "self"]
-            if invalid and self._session._logger:
-                self._session._logger.warning(
-                    f"updateNetworkSwitchStackRoutingInterface: ignoring unrecognized kwargs: {invalid}"
-                )
-
-        return self._session.put(metadata, resource, payload)
+        return dispatch.call(
+            self._session, "updateNetworkSwitchStackRoutingInterface", networkId, switchStackId, interfaceId, **kwargs
+        )
 
     def deleteNetworkSwitchStackRoutingInterface(self, networkId: str, switchStackId: str, interfaceId: str):
         """
@@ -2579,16 +1155,7 @@ class Switch(object):
         - interfaceId (string): Interface ID
         """
 
-        metadata = {
-            "tags": ["switch", "configure", "stacks", "routing", "interfaces"],
-            "operation": "deleteNetworkSwitchStackRoutingInterface",
-        }
-        networkId = urllib.parse.quote(str(networkId), safe="")
-        switchStackId = urllib.parse.quote(str(switchStackId), safe="")
-        interfaceId = urllib.parse.quote(str(interfaceId), safe="")
-        resource = f"/networks/{networkId}/switch/stacks/{switchStackId}/routing/interfaces/{interfaceId}"
-
-        return self._session.delete(metadata, resource)
+        return dispatch.call(self._session, "deleteNetworkSwitchStackRoutingInterface", networkId, switchStackId, interfaceId)
 
     def getNetworkSwitchStackRoutingInterfaceDhcp(self, networkId: str, switchStackId: str, interfaceId: str):
         """
@@ -2600,16 +1167,7 @@ class Switch(object):
         - interfaceId (string): Interface ID
         """
 
-        metadata = {
-            "tags": ["switch", "configure", "stacks", "routing", "interfaces", "dhcp"],
-            "operation": "getNetworkSwitchStackRoutingInterfaceDhcp",
-        }
-        networkId = urllib.parse.quote(str(networkId), safe="")
-        switchStackId = urllib.parse.quote(str(switchStackId), safe="")
-        interfaceId = urllib.parse.quote(str(interfaceId), safe="")
-        resource = f"/networks/{networkId}/switch/stacks/{switchStackId}/routing/interfaces/{interfaceId}/dhcp"
-
-        return self._session.get(metadata, resource)
+        return dispatch.call(self._session, "getNetworkSwitchStackRoutingInterfaceDhcp", networkId, switchStackId, interfaceId)
 
     def updateNetworkSwitchStackRoutingInterfaceDhcp(self, networkId: str, switchStackId: str, interfaceId: str, **kwargs):
         """
@@ -2638,57 +1196,9 @@ class Switch(object):
         - fixedIpAssignments (array): Array of DHCP fixed IP assignments for the DHCP server running on the switch stack interface
         """
 
-        kwargs.update(locals())
-
-        if "dhcpMode" in kwargs:
-            options = ["dhcpDisabled", "dhcpRelay", "dhcpServer"]
-            assert kwargs["dhcpMode"] in options, (
-                f'''"dhcpMode" cannot be "{kwargs["dhcpMode"]}", & must be set to one of: {options}'''
-            )
-        if "dhcpLeaseTime" in kwargs:
-            options = ["1 day", "1 hour", "1 week", "12 hours", "30 minutes", "4 hours"]
-            assert kwargs["dhcpLeaseTime"] in options, (
-                f'''"dhcpLeaseTime" cannot be "{kwargs["dhcpLeaseTime"]}", & must be set to one of: {options}'''
-            )
-        if "dnsNameserversOption" in kwargs:
-            options = ["custom", "googlePublicDns", "openDns"]
-            assert kwargs["dnsNameserversOption"] in options, (
-                f'''"dnsNameserversOption" cannot be "{kwargs["dnsNameserversOption"]}", & must be set to one of: {options}'''
-            )
-
-        metadata = {
-            "tags": ["switch", "configure", "stacks", "routing", "interfaces", "dhcp"],
-            "operation": "updateNetworkSwitchStackRoutingInterfaceDhcp",
-        }
-        networkId = urllib.parse.quote(str(networkId), safe="")
-        switchStackId = urllib.parse.quote(str(switchStackId), safe="")
-        interfaceId = urllib.parse.quote(str(interfaceId), safe="")
-        resource = f"/networks/{networkId}/switch/stacks/{switchStackId}/routing/interfaces/{interfaceId}/dhcp"
-
-        body_params = [
-            "dhcpMode",
-            "dhcpRelayServerIps",
-            "dhcpLeaseTime",
-            "dnsNameserversOption",
-            "dnsCustomNameservers",
-            "bootOptionsEnabled",
-            "bootNextServer",
-            "bootFileName",
-            "dhcpOptions",
-            "reservedIpRanges",
-            "fixedIpAssignments",
-        ]
-        payload = {k.strip(): v for k, v in kwargs.items() if k.strip() in body_params}
-
-        if self._session._validate_kwargs:
-            all_params = [] + body_params
-            invalid = [k for k in kwargs if k.strip() not in all_params and k != "self"]
-            if invalid and self._session._logger:
-                self._session._logger.warning(
-                    f"updateNetworkSwitchStackRoutingInterfaceDhcp: ignoring unrecognized kwargs: {invalid}"
-                )
-
-        return self._session.put(metadata, resource, payload)
+        return dispatch.call(
+            self._session, "updateNetworkSwitchStackRoutingInterfaceDhcp", networkId, switchStackId, interfaceId, **kwargs
+        )
 
     def getNetworkSwitchStackRoutingStaticRoutes(self, networkId: str, switchStackId: str):
         """
@@ -2699,15 +1209,7 @@ class Switch(object):
         - switchStackId (string): Switch stack ID
         """
 
-        metadata = {
-            "tags": ["switch", "configure", "stacks", "routing", "staticRoutes"],
-            "operation": "getNetworkSwitchStackRoutingStaticRoutes",
-        }
-        networkId = urllib.parse.quote(str(networkId), safe="")
-        switchStackId = urllib.parse.quote(str(switchStackId), safe="")
-        resource = f"/networks/{networkId}/switch/stacks/{switchStackId}/routing/staticRoutes"
-
-        return self._session.get(metadata, resource)
+        return dispatch.call(self._session, "getNetworkSwitchStackRoutingStaticRoutes", networkId, switchStackId)
 
     def createNetworkSwitchStackRoutingStaticRoute(
         self, networkId: str, switchStackId: str, subnet: str, nextHopIp: str, **kwargs
@@ -2726,35 +1228,9 @@ class Switch(object):
         - vrf (object): The VRF settings of the interface. Requires IOS XE 17.18 or higher
         """
 
-        kwargs.update(locals())
-
-        metadata = {
-            "tags": ["switch", "configure", "stacks", "routing", "staticRoutes"],
-            "operation": "createNetworkSwitchStackRoutingStaticRoute",
-        }
-        networkId = urllib.parse.quote(str(networkId), safe="")
-        switchStackId = urllib.parse.quote(str(switchStackId), safe="")
-        resource = f"/networks/{networkId}/switch/stacks/{switchStackId}/routing/staticRoutes"
-
-        body_params = [
-            "name",
-            "subnet",
-            "nextHopIp",
-            "advertiseViaOspfEnabled",
-            "preferOverOspfRoutesEnabled",
-            "vrf",
-        ]
-        payload = {k.strip(): v for k, v in kwargs.items() if k.strip() in body_params}
-
-        if self._session._validate_kwargs:
-            all_params = [] + body_params
-            invalid = [k for k in kwargs if k.strip() not in all_params and k != "self"]
-            if invalid and self._session._logger:
-                self._session._logger.warning(
-                    f"createNetworkSwitchStackRoutingStaticRoute: ignoring unrecognized kwargs: {invalid}"
-                )
-
-        return self._session.post(metadata, resource, payload)
+        return dispatch.call(
+            self._session, "createNetworkSwitchStackRoutingStaticRoute", networkId, switchStackId, subnet, nextHopIp, **kwargs
+        )
 
     def getNetworkSwitchStackRoutingStaticRoute(self, networkId: str, switchStackId: str, staticRouteId: str):
         """
@@ -2766,16 +1242,7 @@ class Switch(object):
         - staticRouteId (string): Static route ID
         """
 
-        metadata = {
-            "tags": ["switch", "configure", "stacks", "routing", "staticRoutes"],
-            "operation": "getNetworkSwitchStackRoutingStaticRoute",
-        }
-        networkId = urllib.parse.quote(str(networkId), safe="")
-        switchStackId = urllib.parse.quote(str(switchStackId), safe="")
-        staticRouteId = urllib.parse.quote(str(staticRouteId), safe="")
-        resource = f"/networks/{networkId}/switch/stacks/{switchStackId}/routing/staticRoutes/{staticRouteId}"
-
-        return self._session.get(metadata, resource)
+        return dispatch.call(self._session, "getNetworkSwitchStackRoutingStaticRoute", networkId, switchStackId, staticRouteId)
 
     def updateNetworkSwitchStackRoutingStaticRoute(self, networkId: str, switchStackId: str, staticRouteId: str, **kwargs):
         """
@@ -2794,37 +1261,9 @@ class Switch(object):
         - vrf (object): The VRF settings of the interface. Requires IOS XE 17.18 or higher
         """
 
-        kwargs.update(locals())
-
-        metadata = {
-            "tags": ["switch", "configure", "stacks", "routing", "staticRoutes"],
-            "operation": "updateNetworkSwitchStackRoutingStaticRoute",
-        }
-        networkId = urllib.parse.quote(str(networkId), safe="")
-        switchStackId = urllib.parse.quote(str(switchStackId), safe="")
-        staticRouteId = urllib.parse.quote(str(staticRouteId), safe="")
-        resource = f"/networks/{networkId}/switch/stacks/{switchStackId}/routing/staticRoutes/{staticRouteId}"
-
-        body_params = [
-            "name",
-            "subnet",
-            "nextHopIp",
-            "managementNextHop",
-            "advertiseViaOspfEnabled",
-            "preferOverOspfRoutesEnabled",
-            "vrf",
-        ]
-        payload = {k.strip(): v for k, v in kwargs.items() if k.strip() in body_params}
-
-        if self._session._validate_kwargs:
-            all_params = [] + body_params
-            invalid = [k for k in kwargs if k.strip() not in all_params and k != "self"]
-            if invalid and self._session._logger:
-                self._session._logger.warning(
-                    f"updateNetworkSwitchStackRoutingStaticRoute: ignoring unrecognized kwargs: {invalid}"
-                )
-
-        return self._session.put(metadata, resource, payload)
+        return dispatch.call(
+            self._session, "updateNetworkSwitchStackRoutingStaticRoute", networkId, switchStackId, staticRouteId, **kwargs
+        )
 
     def deleteNetworkSwitchStackRoutingStaticRoute(self, networkId: str, switchStackId: str, staticRouteId: str):
         """
@@ -2836,16 +1275,9 @@ class Switch(object):
         - staticRouteId (string): Static route ID
         """
 
-        metadata = {
-            "tags": ["switch", "configure", "stacks", "routing", "staticRoutes"],
-            "operation": "deleteNetworkSwitchStackRoutingStaticRoute",
-        }
-        networkId = urllib.parse.quote(str(networkId), safe="")
-        switchStackId = urllib.parse.quote(str(switchStackId), safe="")
-        staticRouteId = urllib.parse.quote(str(staticRouteId), safe="")
-        resource = f"/networks/{networkId}/switch/stacks/{switchStackId}/routing/staticRoutes/{staticRouteId}"
-
-        return self._session.delete(metadata, resource)
+        return dispatch.call(
+            self._session, "deleteNetworkSwitchStackRoutingStaticRoute", networkId, switchStackId, staticRouteId
+        )
 
     def getNetworkSwitchStormControl(self, networkId: str):
         """
@@ -2855,14 +1287,7 @@ class Switch(object):
         - networkId (string): Network ID
         """
 
-        metadata = {
-            "tags": ["switch", "configure", "stormControl"],
-            "operation": "getNetworkSwitchStormControl",
-        }
-        networkId = urllib.parse.quote(str(networkId), safe="")
-        resource = f"/networks/{networkId}/switch/stormControl"
-
-        return self._session.get(metadata, resource)
+        return dispatch.call(self._session, "getNetworkSwitchStormControl", networkId)
 
     def updateNetworkSwitchStormControl(self, networkId: str, **kwargs):
         """
@@ -2876,30 +1301,7 @@ class Switch(object):
         - treatTheseTrafficTypesAsOneThreshold (array): Grouped traffic types
         """
 
-        kwargs.update(locals())
-
-        metadata = {
-            "tags": ["switch", "configure", "stormControl"],
-            "operation": "updateNetworkSwitchStormControl",
-        }
-        networkId = urllib.parse.quote(str(networkId), safe="")
-        resource = f"/networks/{networkId}/switch/stormControl"
-
-        body_params = [
-            "broadcastThreshold",
-            "multicastThreshold",
-            "unknownUnicastThreshold",
-            "treatTheseTrafficTypesAsOneThreshold",
-        ]
-        payload = {k.strip(): v for k, v in kwargs.items() if k.strip() in body_params}
-
-        if self._session._validate_kwargs:
-            all_params = [] + body_params
-            invalid = [k for k in kwargs if k.strip() not in all_params and k != "self"]
-            if invalid and self._session._logger:
-                self._session._logger.warning(f"updateNetworkSwitchStormControl: ignoring unrecognized kwargs: {invalid}")
-
-        return self._session.put(metadata, resource, payload)
+        return dispatch.call(self._session, "updateNetworkSwitchStormControl", networkId, **kwargs)
 
     def getNetworkSwitchStp(self, networkId: str):
         """
@@ -2909,14 +1311,7 @@ class Switch(object):
         - networkId (string): Network ID
         """
 
-        metadata = {
-            "tags": ["switch", "configure", "stp"],
-            "operation": "getNetworkSwitchStp",
-        }
-        networkId = urllib.parse.quote(str(networkId), safe="")
-        resource = f"/networks/{networkId}/switch/stp"
-
-        return self._session.get(metadata, resource)
+        return dispatch.call(self._session, "getNetworkSwitchStp", networkId)
 
     def updateNetworkSwitchStp(self, networkId: str, **kwargs):
         """
@@ -2928,28 +1323,7 @@ class Switch(object):
         - stpBridgePriority (array): STP bridge priority for switches/stacks or switch templates. An empty array will clear the STP bridge priority settings.
         """
 
-        kwargs.update(locals())
-
-        metadata = {
-            "tags": ["switch", "configure", "stp"],
-            "operation": "updateNetworkSwitchStp",
-        }
-        networkId = urllib.parse.quote(str(networkId), safe="")
-        resource = f"/networks/{networkId}/switch/stp"
-
-        body_params = [
-            "rstpEnabled",
-            "stpBridgePriority",
-        ]
-        payload = {k.strip(): v for k, v in kwargs.items() if k.strip() in body_params}
-
-        if self._session._validate_kwargs:
-            all_params = [] + body_params
-            invalid = [k for k in kwargs if k.strip() not in all_params and k != "self"]
-            if invalid and self._session._logger:
-                self._session._logger.warning(f"updateNetworkSwitchStp: ignoring unrecognized kwargs: {invalid}")
-
-        return self._session.put(metadata, resource, payload)
+        return dispatch.call(self._session, "updateNetworkSwitchStp", networkId, **kwargs)
 
     def getOrganizationConfigTemplateSwitchProfiles(self, organizationId: str, configTemplateId: str):
         """
@@ -2960,15 +1334,7 @@ class Switch(object):
         - configTemplateId (string): Config template ID
         """
 
-        metadata = {
-            "tags": ["switch", "configure", "configTemplates", "profiles"],
-            "operation": "getOrganizationConfigTemplateSwitchProfiles",
-        }
-        organizationId = urllib.parse.quote(str(organizationId), safe="")
-        configTemplateId = urllib.parse.quote(str(configTemplateId), safe="")
-        resource = f"/organizations/{organizationId}/configTemplates/{configTemplateId}/switch/profiles"
-
-        return self._session.get(metadata, resource)
+        return dispatch.call(self._session, "getOrganizationConfigTemplateSwitchProfiles", organizationId, configTemplateId)
 
     def getOrganizationConfigTemplateSwitchProfilePorts(self, organizationId: str, configTemplateId: str, profileId: str):
         """
@@ -2980,16 +1346,9 @@ class Switch(object):
         - profileId (string): Profile ID
         """
 
-        metadata = {
-            "tags": ["switch", "configure", "configTemplates", "profiles", "ports"],
-            "operation": "getOrganizationConfigTemplateSwitchProfilePorts",
-        }
-        organizationId = urllib.parse.quote(str(organizationId), safe="")
-        configTemplateId = urllib.parse.quote(str(configTemplateId), safe="")
-        profileId = urllib.parse.quote(str(profileId), safe="")
-        resource = f"/organizations/{organizationId}/configTemplates/{configTemplateId}/switch/profiles/{profileId}/ports"
-
-        return self._session.get(metadata, resource)
+        return dispatch.call(
+            self._session, "getOrganizationConfigTemplateSwitchProfilePorts", organizationId, configTemplateId, profileId
+        )
 
     def getOrganizationConfigTemplateSwitchProfilePort(
         self, organizationId: str, configTemplateId: str, profileId: str, portId: str
@@ -3004,20 +1363,15 @@ class Switch(object):
         - portId (string): Port ID
         """
 
-        metadata = {
-            "tags": ["switch", "configure", "configTemplates", "profiles", "ports"],
-            "operation": "getOrganizationConfigTemplateSwitchProfilePort",
-        }
-        organizationId = urllib.parse.quote(str(organizationId), safe="")
-        configTemplateId = urllib.parse.quote(str(configTemplateId), safe="")
-        profileId = urllib.parse.quote(str(profileId), safe="")
-        portId = urllib.parse.quote(str(portId), safe="")
-        resource = (
-            f"/organizations/{organizationId}/configTemplates/{configTemplateId}/switch/profiles/{profileId}/ports/{portId}"
+        return dispatch.call(
+            self._session,
+            "getOrganizationConfigTemplateSwitchProfilePort",
+            organizationId,
+            configTemplateId,
+            profileId,
+            portId,
         )
 
-        return self._session.get(metadata, resource)
-
     def updateOrganizationConfigTemplateSwitchProfilePort(
         self, organizationId: str, configTemplateId: str, profileId: str, portId: str, **kwargs
     ):
@@ -3059,78 +1413,16 @@ class Switch(object):
         - highSpeed (object): High speed port enablement settings for C9500-32QC
         """
 
-        kwargs.update(locals())
-
-        if "type" in kwargs:
-            options = ["access", "dad", "routed", "stack", "svl", "trunk"]
-            assert kwargs["type"] in options, f'''"type" cannot be "{kwargs["type"]}", & must be set to one of: {options}'''
-        if "stpGuard" in kwargs:
-            options = ["bpdu guard", "disabled", "loop guard", "root guard"]
-            assert kwargs["stpGuard"] in options, (
-                f'''"stpGuard" cannot be "{kwargs["stpGuard"]}", & must be set to one of: {options}'''
-            )
-        if "udld" in kwargs:
-            options = ["Alert only", "Enforce"]
-            assert kwargs["udld"] in options, f'''"udld" cannot be "{kwargs["udld"]}", & must be set to one of: {options}'''
-        if "accessPolicyType" in kwargs:
-            options = ["Custom access policy", "MAC allow list", "Open", "Sticky MAC allow list"]
-            assert kwargs["accessPolicyType"] in options, (
-                f'''"accessPolicyType" cannot be "{kwargs["accessPolicyType"]}", & must be set to one of: {options}'''
-            )
-
-        metadata = {
-            "tags": ["switch", "configure", "configTemplates", "profiles", "ports"],
-            "operation": "updateOrganizationConfigTemplateSwitchProfilePort",
-        }
-        organizationId = urllib.parse.quote(str(organizationId), safe="")
-        configTemplateId = urllib.parse.quote(str(configTemplateId), safe="")
-        profileId = urllib.parse.quote(str(profileId), safe="")
-        portId = urllib.parse.quote(str(portId), safe="")
-        resource = (
-            f"/organizations/{organizationId}/configTemplates/{configTemplateId}/switch/profiles/{profileId}/ports/{portId}"
+        return dispatch.call(
+            self._session,
+            "updateOrganizationConfigTemplateSwitchProfilePort",
+            organizationId,
+            configTemplateId,
+            profileId,
+            portId,
+            **kwargs,
         )
 
-        body_params = [
-            "name",
-            "tags",
-            "enabled",
-            "poeEnabled",
-            "type",
-            "vlan",
-            "voiceVlan",
-            "allowedVlans",
-            "isolationEnabled",
-            "rstpEnabled",
-            "stpGuard",
-            "stpPortFastTrunk",
-            "linkNegotiation",
-            "portScheduleId",
-            "udld",
-            "accessPolicyType",
-            "accessPolicyNumber",
-            "macAllowList",
-            "macWhitelistLimit",
-            "stickyMacAllowList",
-            "stickyMacAllowListLimit",
-            "stormControlEnabled",
-            "flexibleStackingEnabled",
-            "daiTrusted",
-            "profile",
-            "dot3az",
-            "highSpeed",
-        ]
-        payload = {k.strip(): v for k, v in kwargs.items() if k.strip() in body_params}
-
-        if self._session._validate_kwargs:
-            all_params = [] + body_params
-            invalid = [k for k in kwargs if k.strip() not in all_params and k != "self"]
-            if invalid and self._session._logger:
-                self._session._logger.warning(
-                    f"updateOrganizationConfigTemplateSwitchProfilePort: ignoring unrecognized kwargs: {invalid}"
-                )
-
-        return self._session.put(metadata, resource, payload)
-
     def getOrganizationSummarySwitchPowerHistory(self, organizationId: str, **kwargs):
         """
         **Returns the total PoE power draw for all switch ports in the organization over the requested timespan (by default the last 24 hours)**
@@ -3142,31 +1434,7 @@ class Switch(object):
         - timespan (number): The timespan for which the information will be fetched. If specifying timespan, do not specify parameters t0 and t1. The value must be in seconds and be less than or equal to 186 days. The default is 1 day.
         """
 
-        kwargs.update(locals())
-
-        metadata = {
-            "tags": ["switch", "monitor", "summary", "power", "history"],
-            "operation": "getOrganizationSummarySwitchPowerHistory",
-        }
-        organizationId = urllib.parse.quote(str(organizationId), safe="")
-        resource = f"/organizations/{organizationId}/summary/switch/power/history"
-
-        query_params = [
-            "t0",
-            "t1",
-            "timespan",
-        ]
-        params = {k.strip(): v for k, v in kwargs.items() if k.strip() in query_params}
-
-        if self._session._validate_kwargs:
-            all_params = query_params
-            invalid = [k for k in kwargs if k.strip() not in all_params and k != "self"]
-            if invalid and self._session._logger:
-                self._session._logger.warning(
-                    f"getOrganizationSummarySwitchPowerHistory: ignoring unrecognized kwargs: {invalid}"
-                )
-
-        return self._session.get(metadata, resource, params)
+        return dispatch.call(self._session, "getOrganizationSummarySwitchPowerHistory", organizationId, **kwargs)
 
     def cloneOrganizationSwitchDevices(self, organizationId: str, sourceSerial: str, targetSerials: list, **kwargs):
         """
@@ -3178,28 +1446,9 @@ class Switch(object):
         - targetSerials (array): Array of serial numbers of one or more target switches (must be on a network not bound to a template)
         """
 
-        kwargs = locals()
-
-        metadata = {
-            "tags": ["switch", "configure", "devices"],
-            "operation": "cloneOrganizationSwitchDevices",
-        }
-        organizationId = urllib.parse.quote(str(organizationId), safe="")
-        resource = f"/organizations/{organizationId}/switch/devices/clone"
-
-        body_params = [
-            "sourceSerial",
-            "targetSerials",
-        ]
-        payload = {k.strip(): v for k, v in kwargs.items() if k.strip() in body_params}
-
-        if self._session._validate_kwargs:
-            all_params = [] + body_params
-            invalid = [k for k in kwargs if k.strip() not in all_params and k != "self"]
-            if invalid and self._session._logger:
-                self._session._logger.warning(f"cloneOrganizationSwitchDevices: ignoring unrecognized kwargs: {invalid}")
-
-        return self._session.post(metadata, resource, payload)
+        return dispatch.call(
+            self._session, "cloneOrganizationSwitchDevices", organizationId, sourceSerial, targetSerials, **kwargs
+        )
 
     def getOrganizationSwitchPortsBySwitch(self, organizationId: str, total_pages=1, direction="next", **kwargs):
         """
@@ -3222,48 +1471,14 @@ class Switch(object):
         - serials (array): Optional parameter to filter items to switches that have one of the provided serials.
         """
 
-        kwargs.update(locals())
-
-        metadata = {
-            "tags": ["switch", "configure", "ports", "bySwitch"],
-            "operation": "getOrganizationSwitchPortsBySwitch",
-        }
-        organizationId = urllib.parse.quote(str(organizationId), safe="")
-        resource = f"/organizations/{organizationId}/switch/ports/bySwitch"
-
-        query_params = [
-            "perPage",
-            "startingAfter",
-            "endingBefore",
-            "configurationUpdatedAfter",
-            "mac",
-            "macs",
-            "name",
-            "networkIds",
-            "portProfileIds",
-            "serial",
-            "serials",
-        ]
-        params = {k.strip(): v for k, v in kwargs.items() if k.strip() in query_params}
-
-        array_params = [
-            "macs",
-            "networkIds",
-            "portProfileIds",
-            "serials",
-        ]
-        for k, v in kwargs.items():
-            if k.strip() in array_params:
-                params[f"{k.strip()}[]"] = kwargs[f"{k}"]
-                params.pop(k.strip())
-
-        if self._session._validate_kwargs:
-            all_params = query_params + array_params
-            invalid = [k for k in kwargs if k.strip() not in all_params and k != "self"]
-            if invalid and self._session._logger:
-                self._session._logger.warning(f"getOrganizationSwitchPortsBySwitch: ignoring unrecognized kwargs: {invalid}")
-
-        return self._session.get_pages(metadata, resource, params, total_pages, direction)
+        return dispatch.call(
+            self._session,
+            "getOrganizationSwitchPortsBySwitch",
+            organizationId,
+            total_pages=total_pages,
+            direction=direction,
+            **kwargs,
+        )
 
     def getOrganizationSwitchPortsClientsOverviewByDevice(
         self, organizationId: str, total_pages=1, direction="next", **kwargs
@@ -3290,52 +1505,14 @@ class Switch(object):
         - serials (array): Optional parameter to filter items to switches that have one of the provided serials.
         """
 
-        kwargs.update(locals())
-
-        metadata = {
-            "tags": ["switch", "monitor", "ports", "clients", "overview", "byDevice"],
-            "operation": "getOrganizationSwitchPortsClientsOverviewByDevice",
-        }
-        organizationId = urllib.parse.quote(str(organizationId), safe="")
-        resource = f"/organizations/{organizationId}/switch/ports/clients/overview/byDevice"
-
-        query_params = [
-            "t0",
-            "timespan",
-            "perPage",
-            "startingAfter",
-            "endingBefore",
-            "configurationUpdatedAfter",
-            "mac",
-            "macs",
-            "name",
-            "networkIds",
-            "portProfileIds",
-            "serial",
-            "serials",
-        ]
-        params = {k.strip(): v for k, v in kwargs.items() if k.strip() in query_params}
-
-        array_params = [
-            "macs",
-            "networkIds",
-            "portProfileIds",
-            "serials",
-        ]
-        for k, v in kwargs.items():
-            if k.strip() in array_params:
-                params[f"{k.strip()}[]"] = kwargs[f"{k}"]
-                params.pop(k.strip())
-
-        if self._session._validate_kwargs:
-            all_params = query_params + array_params
-            invalid = [k for k in kwargs if k.strip() not in all_params and k != "self"]
-            if invalid and self._session._logger:
-                self._session._logger.warning(
-                    f"getOrganizationSwitchPortsClientsOverviewByDevice: ignoring unrecognized kwargs: {invalid}"
-                )
-
-        return self._session.get_pages(metadata, resource, params, total_pages, direction)
+        return dispatch.call(
+            self._session,
+            "getOrganizationSwitchPortsClientsOverviewByDevice",
+            organizationId,
+            total_pages=total_pages,
+            direction=direction,
+            **kwargs,
+        )
 
     def getOrganizationSwitchPortsOverview(self, organizationId: str, **kwargs):
         """
@@ -3348,29 +1525,7 @@ class Switch(object):
         - timespan (number): The timespan for which the information will be fetched. If specifying timespan, do not specify parameters t0 and t1. The value must be in seconds and be greater than or equal to 12 hours and be less than or equal to 186 days. The default is 1 day.
         """
 
-        kwargs.update(locals())
-
-        metadata = {
-            "tags": ["switch", "monitor", "ports", "overview"],
-            "operation": "getOrganizationSwitchPortsOverview",
-        }
-        organizationId = urllib.parse.quote(str(organizationId), safe="")
-        resource = f"/organizations/{organizationId}/switch/ports/overview"
-
-        query_params = [
-            "t0",
-            "t1",
-            "timespan",
-        ]
-        params = {k.strip(): v for k, v in kwargs.items() if k.strip() in query_params}
-
-        if self._session._validate_kwargs:
-            all_params = query_params
-            invalid = [k for k in kwargs if k.strip() not in all_params and k != "self"]
-            if invalid and self._session._logger:
-                self._session._logger.warning(f"getOrganizationSwitchPortsOverview: ignoring unrecognized kwargs: {invalid}")
-
-        return self._session.get(metadata, resource, params)
+        return dispatch.call(self._session, "getOrganizationSwitchPortsOverview", organizationId, **kwargs)
 
     def getOrganizationSwitchPortsStatusesBySwitch(self, organizationId: str, total_pages=1, direction="next", **kwargs):
         """
@@ -3393,50 +1548,14 @@ class Switch(object):
         - serials (array): Optional parameter to filter items to switches that have one of the provided serials.
         """
 
-        kwargs.update(locals())
-
-        metadata = {
-            "tags": ["switch", "monitor", "ports", "statuses", "bySwitch"],
-            "operation": "getOrganizationSwitchPortsStatusesBySwitch",
-        }
-        organizationId = urllib.parse.quote(str(organizationId), safe="")
-        resource = f"/organizations/{organizationId}/switch/ports/statuses/bySwitch"
-
-        query_params = [
-            "perPage",
-            "startingAfter",
-            "endingBefore",
-            "configurationUpdatedAfter",
-            "mac",
-            "macs",
-            "name",
-            "networkIds",
-            "portProfileIds",
-            "serial",
-            "serials",
-        ]
-        params = {k.strip(): v for k, v in kwargs.items() if k.strip() in query_params}
-
-        array_params = [
-            "macs",
-            "networkIds",
-            "portProfileIds",
-            "serials",
-        ]
-        for k, v in kwargs.items():
-            if k.strip() in array_params:
-                params[f"{k.strip()}[]"] = kwargs[f"{k}"]
-                params.pop(k.strip())
-
-        if self._session._validate_kwargs:
-            all_params = query_params + array_params
-            invalid = [k for k in kwargs if k.strip() not in all_params and k != "self"]
-            if invalid and self._session._logger:
-                self._session._logger.warning(
-                    f"getOrganizationSwitchPortsStatusesBySwitch: ignoring unrecognized kwargs: {invalid}"
-                )
-
-        return self._session.get_pages(metadata, resource, params, total_pages, direction)
+        return dispatch.call(
+            self._session,
+            "getOrganizationSwitchPortsStatusesBySwitch",
+            organizationId,
+            total_pages=total_pages,
+            direction=direction,
+            **kwargs,
+        )
 
     def getOrganizationSwitchPortsTopologyDiscoveryByDevice(
         self, organizationId: str, total_pages=1, direction="next", **kwargs
@@ -3463,52 +1582,14 @@ class Switch(object):
         - serials (array): Optional parameter to filter items to switches that have one of the provided serials.
         """
 
-        kwargs.update(locals())
-
-        metadata = {
-            "tags": ["switch", "monitor", "ports", "topology", "discovery", "byDevice"],
-            "operation": "getOrganizationSwitchPortsTopologyDiscoveryByDevice",
-        }
-        organizationId = urllib.parse.quote(str(organizationId), safe="")
-        resource = f"/organizations/{organizationId}/switch/ports/topology/discovery/byDevice"
-
-        query_params = [
-            "t0",
-            "timespan",
-            "perPage",
-            "startingAfter",
-            "endingBefore",
-            "configurationUpdatedAfter",
-            "mac",
-            "macs",
-            "name",
-            "networkIds",
-            "portProfileIds",
-            "serial",
-            "serials",
-        ]
-        params = {k.strip(): v for k, v in kwargs.items() if k.strip() in query_params}
-
-        array_params = [
-            "macs",
-            "networkIds",
-            "portProfileIds",
-            "serials",
-        ]
-        for k, v in kwargs.items():
-            if k.strip() in array_params:
-                params[f"{k.strip()}[]"] = kwargs[f"{k}"]
-                params.pop(k.strip())
-
-        if self._session._validate_kwargs:
-            all_params = query_params + array_params
-            invalid = [k for k in kwargs if k.strip() not in all_params and k != "self"]
-            if invalid and self._session._logger:
-                self._session._logger.warning(
-                    f"getOrganizationSwitchPortsTopologyDiscoveryByDevice: ignoring unrecognized kwargs: {invalid}"
-                )
-
-        return self._session.get_pages(metadata, resource, params, total_pages, direction)
+        return dispatch.call(
+            self._session,
+            "getOrganizationSwitchPortsTopologyDiscoveryByDevice",
+            organizationId,
+            total_pages=total_pages,
+            direction=direction,
+            **kwargs,
+        )
 
     def getOrganizationSwitchPortsUsageHistoryByDeviceByInterval(
         self, organizationId: str, total_pages=1, direction="next", **kwargs
@@ -3537,51 +1618,11 @@ class Switch(object):
         - serials (array): Optional parameter to filter items to switches that have one of the provided serials.
         """
 
-        kwargs.update(locals())
-
-        metadata = {
-            "tags": ["switch", "monitor", "ports", "usage", "history", "byDevice", "byInterval"],
-            "operation": "getOrganizationSwitchPortsUsageHistoryByDeviceByInterval",
-        }
-        organizationId = urllib.parse.quote(str(organizationId), safe="")
-        resource = f"/organizations/{organizationId}/switch/ports/usage/history/byDevice/byInterval"
-
-        query_params = [
-            "t0",
-            "t1",
-            "timespan",
-            "interval",
-            "perPage",
-            "startingAfter",
-            "endingBefore",
-            "configurationUpdatedAfter",
-            "mac",
-            "macs",
-            "name",
-            "networkIds",
-            "portProfileIds",
-            "serial",
-            "serials",
-        ]
-        params = {k.strip(): v for k, v in kwargs.items() if k.strip() in query_params}
-
-        array_params = [
-            "macs",
-            "networkIds",
-            "portProfileIds",
-            "serials",
-        ]
-        for k, v in kwargs.items():
-            if k.strip() in array_params:
-                params[f"{k.strip()}[]"] = kwargs[f"{k}"]
-                params.pop(k.strip())
-
-        if self._session._validate_kwargs:
-            all_params = query_params + array_params
-            invalid = [k for k in kwargs if k.strip() not in all_params and k != "self"]
-            if invalid and self._session._logger:
-                self._session._logger.warning(
-                    f"getOrganizationSwitchPortsUsageHistoryByDeviceByInterval: ignoring unrecognized kwargs: {invalid}"
-                )
-
-        return self._session.get_pages(metadata, resource, params, total_pages, direction)
+        return dispatch.call(
+            self._session,
+            "getOrganizationSwitchPortsUsageHistoryByDeviceByInterval",
+            organizationId,
+            total_pages=total_pages,
+            direction=direction,
+            **kwargs,
+        )
@@ -1,4 +1,4 @@
-import urllib
+from meraki import dispatch
 
 
 class Wireless(object):
@@ -15,29 +15,7 @@ class Wireless(object):
         - addresses (array): configured alternate management interface addresses
         """
 
-        kwargs.update(locals())
-
-        metadata = {
-            "tags": ["wireless", "configure", "alternateManagementInterface", "ipv6"],
-            "operation": "updateDeviceWirelessAlternateManagementInterfaceIpv6",
-        }
-        serial = urllib.parse.quote(str(serial), safe="")
-        resource = f"/devices/{serial}/wireless/alternateManagementInterface/ipv6"
-
-        body_params = [
-            "addresses",
-        ]
-        payload = {k.strip(): v for k, v in kwargs.items() if k.strip() in body_params}
-
-        if self._session._validate_kwargs:
-            all_params = [] + body_params
-            invalid = [k for k in kwargs if k.strip() not in all_params and k != "self"]
-            if invalid and self._session._logger:
-                self._session._logger.warning(
-                    f"updateDeviceWirelessAlternateManagementInterfaceIpv6: ignoring unrecognized kwargs: {invalid}"
-                )
-
-        return self._session.put(metadata, resource, payload)
+        return dispatch.call(self._session, "updateDeviceWirelessAlternateManagementInterfaceIpv6", serial, **kwargs)
 
     def getDeviceWirelessBluetoothSettings(self, serial: str):
         """
@@ -47,14 +25,7 @@ class Wireless(object):
         - serial (string): Serial
         """
 
-        metadata = {
-            "tags": ["wireless", "configure", "bluetooth", "settings"],
-            "operation": "getDeviceWirelessBluetoothSettings",
-        }
-        serial = urllib.parse.quote(str(serial), safe="")
-        resource = f"/devices/{serial}/wireless/bluetooth/settings"
-
-        return self._session.get(metadata, resource)
+        return dispatch.call(self._session, "getDeviceWirelessBluetoothSettings", serial)
 
     def updateDeviceWirelessBluetoothSettings(self, serial: str, **kwargs):
         """
@@ -70,31 +41,7 @@ class Wireless(object):
           Dashboard's automatically generated value.
         """
 
-        kwargs.update(locals())
-
-        metadata = {
-            "tags": ["wireless", "configure", "bluetooth", "settings"],
-            "operation": "updateDeviceWirelessBluetoothSettings",
-        }
-        serial = urllib.parse.quote(str(serial), safe="")
-        resource = f"/devices/{serial}/wireless/bluetooth/settings"
-
-        body_params = [
-            "uuid",
-            "major",
-            "minor",
-        ]
-        payload = {k.strip(): v for k, v in kwargs.items() if k.strip() in body_params}
-
-        if self._session._validate_kwargs:
-            all_params = [] + body_params
-            invalid = [k for k in kwargs if k.strip() not in all_params and k != "self"]
-            if invalid and self._session._logger:
-                self._session._logger.warning(
-                    f"updateDeviceWirelessBluetoothSettings: ignoring unrecognized kwargs: {invalid}"
-                )
-
-        return self._session.put(metadata, resource, payload)
+        return dispatch.call(self._session, "updateDeviceWirelessBluetoothSettings", serial, **kwargs)
 
     def getDeviceWirelessConnectionStats(self, serial: str, **kwargs):
         """
@@ -110,39 +57,7 @@ class Wireless(object):
         - apTag (string): Filter results by AP Tag
         """
 
-        kwargs.update(locals())
-
-        if "band" in kwargs:
-            options = ["2.4", "5", "6"]
-            assert kwargs["band"] in options, f'''"band" cannot be "{kwargs["band"]}", & must be set to one of: {options}'''
-        if "ssid" in kwargs:
-            options = [0, 1, 2, 3, 4, 5, 6, 7, 8, 9, 10, 11, 12, 13, 14]
-            assert kwargs["ssid"] in options, f'''"ssid" cannot be "{kwargs["ssid"]}", & must be set to one of: {options}'''
-
-        metadata = {
-            "tags": ["wireless", "monitor", "connectionStats"],
-            "operation": "getDeviceWirelessConnectionStats",
-        }
-        serial = urllib.parse.quote(str(serial), safe="")
-        resource = f"/devices/{serial}/wireless/connectionStats"
-
-        query_params = [
-            "t0",
-            "t1",
-            "timespan",
-            "band",
-            "ssid",
-            "apTag",
-        ]
-        params = {k.strip(): v for k, v in kwargs.items() if k.strip() in query_params}
-
-        if self._session._validate_kwargs:
-            all_params = query_params
-            invalid = [k for k in kwargs if k.strip() not in all_params and k != "self"]
-            if invalid and self._session._logger:
-                self._session._logger.warning(f"getDeviceWirelessConnectionStats: ignoring unrecognized kwargs: {invalid}")
-
-        return self._session.get(metadata, resource, params)
+        return dispatch.call(self._session, "getDeviceWirelessConnectionStats", serial, **kwargs)
 
     def getDeviceWirelessElectronicShelfLabel(self, serial: str):
         """
@@ -152,14 +67,7 @@ class Wireless(object):
         - serial (string): Serial
         """
 
-        metadata = {
-            "tags": ["wireless", "configure", "electronicShelfLabel"],
-            "operation": "getDeviceWirelessElectronicShelfLabel",
-        }
-        serial = urllib.parse.quote(str(serial), safe="")
-        resource = f"/devices/{serial}/wireless/electronicShelfLabel"
-
-        return self._session.get(metadata, resource)
+        return dispatch.call(self._session, "getDeviceWirelessElectronicShelfLabel", serial)
 
     def updateDeviceWirelessElectronicShelfLabel(self, serial: str, **kwargs):
         """
@@ -171,30 +79,7 @@ class Wireless(object):
         - enabled (boolean): Turn ESL features on and off for this device
         """
 
-        kwargs.update(locals())
-
-        metadata = {
-            "tags": ["wireless", "configure", "electronicShelfLabel"],
-            "operation": "updateDeviceWirelessElectronicShelfLabel",
-        }
-        serial = urllib.parse.quote(str(serial), safe="")
-        resource = f"/devices/{serial}/wireless/electronicShelfLabel"
-
-        body_params = [
-            "channel",
-            "enabled",
-        ]
-        payload = {k.strip(): v for k, v in kwargs.items() if k.strip() in body_params}
-
-        if self._session._validate_kwargs:
-            all_params = [] + body_params
-            invalid = [k for k in kwargs if k.strip() not in all_params and k != "self"]
-            if invalid and self._session._logger:
-                self._session._logger.warning(
-                    f"updateDeviceWirelessElectronicShelfLabel: ignoring unrecognized kwargs: {invalid}"
-                )
-
-        return self._session.put(metadata, resource, payload)
+        return dispatch.call(self._session, "updateDeviceWirelessElectronicShelfLabel", serial, **kwargs)
 
     def getDeviceWirelessLatencyStats(self, serial: str, **kwargs):
         """
@@ -212,41 +97,7 @@ class Wireless(object):
         - fields (string): Partial selection: If present, this call will return only the selected fields of ["rawDistribution", "avg"]. All fields will be returned by default. Selected fields must be entered as a comma separated string.
         """
 
-        kwargs.update(locals())
-
-        if "band" in kwargs:
-            options = ["2.4", "5", "6"]
-            assert kwargs["band"] in options, f'''"band" cannot be "{kwargs["band"]}", & must be set to one of: {options}'''
-        if "ssid" in kwargs:
-            options = [0, 1, 2, 3, 4, 5, 6, 7, 8, 9, 10, 11, 12, 13, 14]
-            assert kwargs["ssid"] in options, f'''"ssid" cannot be "{kwargs["ssid"]}", & must be set to one of: {options}'''
-
-        metadata = {
-            "tags": ["wireless", "monitor", "latencyStats"],
-            "operation": "getDeviceWirelessLatencyStats",
-        }
-        serial = urllib.parse.quote(str(serial), safe="")
-        resource = f"/devices/{serial}/wireless/latencyStats"
-
-        query_params = [
-            "t0",
-            "t1",
-            "timespan",
-            "band",
-            "ssid",
-            "apTag",
-            "vlan",
-            "fields",
-        ]
-        params = {k.strip(): v for k, v in kwargs.items() if k.strip() in query_params}
-
-        if self._session._validate_kwargs:
-            all_params = query_params
-            invalid = [k for k in kwargs if k.strip() not in all_params and k != "self"]
-            if invalid and self._session._logger:
-                self._session._logger.warning(f"getDeviceWirelessLatencyStats: ignoring unrecognized kwargs: {invalid}")
-
-        return self._session.get(metadata, resource, params)
+        return dispatch.call(self._session, "getDeviceWirelessLatencyStats", serial, **kwargs)
 
     def getDeviceWirelessRadioSettings(self, serial: str):
         """
@@ -256,14 +107,7 @@ class Wireless(object):
         - serial (string): Serial
         """
 
-        metadata = {
-            "tags": ["wireless", "configure", "radio", "settings"],
-            "operation": "getDeviceWirelessRadioSettings",
-        }
-        serial = urllib.parse.quote(str(serial), safe="")
-        resource = f"/devices/{serial}/wireless/radio/settings"
-
-        return self._session.get(metadata, resource)
+        return dispatch.call(self._session, "getDeviceWirelessRadioSettings", serial)
 
     def updateDeviceWirelessRadioSettings(self, serial: str, **kwargs):
         """
@@ -276,29 +120,7 @@ class Wireless(object):
         - fiveGhzSettings (object): Manual radio settings for 5 GHz.
         """
 
-        kwargs.update(locals())
-
-        metadata = {
-            "tags": ["wireless", "configure", "radio", "settings"],
-            "operation": "updateDeviceWirelessRadioSettings",
-        }
-        serial = urllib.parse.quote(str(serial), safe="")
-        resource = f"/devices/{serial}/wireless/radio/settings"
-
-        body_params = [
-            "rfProfileId",
-            "twoFourGhzSettings",
-            "fiveGhzSettings",
-        ]
-        payload = {k.strip(): v for k, v in kwargs.items() if k.strip() in body_params}
-
-        if self._session._validate_kwargs:
-            all_params = [] + body_params
-            invalid = [k for k in kwargs if k.strip() not in all_params and k != "self"]
-            if invalid and self._session._logger:
-                self._session._logger.warning(f"updateDeviceWirelessRadioSettings: ignoring unrecognized kwargs: {invalid}")
-
-        return self._session.put(metadata, resource, payload)
+        return dispatch.call(self._session, "updateDeviceWirelessRadioSettings", serial, **kwargs)
 
     def getDeviceWirelessStatus(self, serial: str):
         """
@@ -308,14 +130,7 @@ class Wireless(object):
         - serial (string): Serial
         """
 
-        metadata = {
-            "tags": ["wireless", "monitor", "status"],
-            "operation": "getDeviceWirelessStatus",
-        }
-        serial = urllib.parse.quote(str(serial), safe="")
-        resource = f"/devices/{serial}/wireless/status"
-
-        return self._session.get(metadata, resource)
+        return dispatch.call(self._session, "getDeviceWirelessStatus", serial)
 
     def createDeviceWirelessZigbeeEnrollment(self, serial: str):
         """
@@ -325,14 +140,7 @@ class Wireless(object):
         - serial (string): Serial
         """
 
-        metadata = {
-            "tags": ["wireless", "configure", "zigbee", "enrollments"],
-            "operation": "createDeviceWirelessZigbeeEnrollment",
-        }
-        serial = urllib.parse.quote(str(serial), safe="")
-        resource = f"/devices/{serial}/wireless/zigbee/enrollments"
-
-        return self._session.post(metadata, resource)
+        return dispatch.call(self._session, "createDeviceWirelessZigbeeEnrollment", serial)
 
     def getDeviceWirelessZigbeeEnrollment(self, serial: str, enrollmentId: str):
         """
@@ -343,15 +151,7 @@ class Wireless(object):
         - enrollmentId (string): Enrollment ID
         """
 
-        metadata = {
-            "tags": ["wireless", "configure", "zigbee", "enrollments"],
-            "operation": "getDeviceWirelessZigbeeEnrollment",
-        }
-        serial = urllib.parse.quote(str(serial), safe="")
-        enrollmentId = urllib.parse.quote(str(enrollmentId), safe="")
-        resource = f"/devices/{serial}/wireless/zigbee/enrollments/{enrollmentId}"
-
-        return self._session.get(metadata, resource)
+        return dispatch.call(self._session, "getDeviceWirelessZigbeeEnrollment", serial, enrollmentId)
 
     def getNetworkWirelessAirMarshal(self, networkId: str, **kwargs):
         """
@@ -363,28 +163,7 @@ class Wireless(object):
         - timespan (number): The timespan for which the information will be fetched. If specifying timespan, do not specify parameter t0. The value must be in seconds and be less than or equal to 31 days. The default is 7 days.
         """
 
-        kwargs.update(locals())
-
-        metadata = {
-            "tags": ["wireless", "monitor", "airMarshal"],
-            "operation": "getNetworkWirelessAirMarshal",
-        }
-        networkId = urllib.parse.quote(str(networkId), safe="")
-        resource = f"/networks/{networkId}/wireless/airMarshal"
-
-        query_params = [
-            "t0",
-            "timespan",
-        ]
-        params = {k.strip(): v for k, v in kwargs.items() if k.strip() in query_params}
-
-        if self._session._validate_kwargs:
-            all_params = query_params
-            invalid = [k for k in kwargs if k.strip() not in all_params and k != "self"]
-            if invalid and self._session._logger:
-                self._session._logger.warning(f"getNetworkWirelessAirMarshal: ignoring unrecognized kwargs: {invalid}")
-
-        return self._session.get(metadata, resource, params)
+        return dispatch.call(self._session, "getNetworkWirelessAirMarshal", networkId, **kwargs)
 
     def createNetworkWirelessAirMarshalRule(self, networkId: str, type: str, match: dict, **kwargs):
         """
@@ -396,32 +175,7 @@ class Wireless(object):
         - match (object): Object describing the rule specification.
         """
 
-        kwargs = locals()
-
-        if "type" in kwargs:
-            options = ["alert", "allow", "block"]
-            assert kwargs["type"] in options, f'''"type" cannot be "{kwargs["type"]}", & must be set to one of: {options}'''
-
-        metadata = {
-            "tags": ["wireless", "configure", "airMarshal", "rules"],
-            "operation": "createNetworkWirelessAirMarshalRule",
-        }
-        networkId = urllib.parse.quote(str(networkId), safe="")
-        resource = f"/networks/{networkId}/wireless/airMarshal/rules"
-
-        body_params = [
-            "type",
-            "match",
-        ]
-        payload = {k.strip(): v for k, v in kwargs.items() if k.strip() in body_params}
-
-        if self._session._validate_kwargs:
-            all_params = [] + body_params
-            invalid = [k for k in kwargs if k.strip() not in all_params and k != "self"]
-            if invalid and self._session._logger:
-                self._session._logger.warning(f"createNetworkWirelessAirMarshalRule: ignoring unrecognized kwargs: {invalid}")
-
-        return self._session.post(metadata, resource, payload)
+        return dispatch.call(self._session, "createNetworkWirelessAirMarshalRule", networkId, type, match, **kwargs)
 
     def updateNetworkWirelessAirMarshalRule(self, networkId: str, ruleId: str, **kwargs):
         """
@@ -434,33 +188,7 @@ class Wireless(object):
         - match (object): Object describing the rule specification.
         """
 
-        kwargs.update(locals())
-
-        if "type" in kwargs:
-            options = ["alert", "allow", "block"]
-            assert kwargs["type"] in options, f'''"type" cannot be "{kwargs["type"]}", & must be set to one of: {options}'''
-
-        metadata = {
-            "tags": ["wireless", "configure", "airMarshal", "rules"],
-            "operation": "updateNetworkWirelessAirMarshalRule",
-        }
-        networkId = urllib.parse.quote(str(networkId), safe="")
-        ruleId = urllib.parse.quote(str(ruleId), safe="")
-        resource = f"/networks/{networkId}/wireless/airMarshal/rules/{ruleId}"
-
-        body_params = [
-            "type",
-            "match",
-        ]
-        payload = {k.strip(): v for k, v in kwargs.items() if k.strip() in body_params}
-
-        if self._session._validate_kwargs:
-            all_params = [] + body_params
-            invalid = [k for k in kwargs if k.strip() not in all_params and k != "self"]
-            if invalid and self._session._logger:
-                self._session._logger.warning(f"updateNetworkWirelessAirMarshalRule: ignoring unrecognized kwargs: {invalid}")
-
-        return self._session.put(metadata, resource, payload)
+        return dispatch.call(self._session, "updateNetworkWirelessAirMarshalRule", networkId, ruleId, **kwargs)
 
     def deleteNetworkWirelessAirMarshalRule(self, networkId: str, ruleId: str):
         """
@@ -471,15 +199,7 @@ class Wireless(object):
         - ruleId (string): Rule ID
         """
 
-        metadata = {
-            "tags": ["wireless", "configure", "airMarshal", "rules"],
-            "operation": "deleteNetworkWirelessAirMarshalRule",
-        }
-        networkId = urllib.parse.quote(str(networkId), safe="")
-        ruleId = urllib.parse.quote(str(ruleId), safe="")
-        resource = f"/networks/{networkId}/wireless/airMarshal/rules/{ruleId}"
-
-        return self._session.delete(metadata, resource)
+        return dispatch.call(self._session, "deleteNetworkWirelessAirMarshalRule", networkId, ruleId)
 
     def updateNetworkWirelessAirMarshalSettings(self, networkId: str, defaultPolicy: str, **kwargs):
         """
@@ -490,35 +210,7 @@ class Wireless(object):
         - defaultPolicy (string): Allows clients to access rogue networks. Blocked by default.
         """
 
-        kwargs = locals()
-
-        if "defaultPolicy" in kwargs:
-            options = ["allow", "block"]
-            assert kwargs["defaultPolicy"] in options, (
-                f'''"defaultPolicy" cannot be "{kwargs["defaultPolicy"]}", & must be set to one of: {options}'''
-            )
-
-        metadata = {
-            "tags": ["wireless", "configure", "airMarshal", "settings"],
-            "operation": "updateNetworkWirelessAirMarshalSettings",
-        }
-        networkId = urllib.parse.quote(str(networkId), safe="")
-        resource = f"/networks/{networkId}/wireless/airMarshal/settings"
-
-        body_params = [
-            "defaultPolicy",
-        ]
-        payload = {k.strip(): v for k, v in kwargs.items() if k.strip() in body_params}
-
-        if self._session._validate_kwargs:
-            all_params = [] + body_params
-            invalid = [k for k in kwargs if k.strip() not in all_params and k != "self"]
-            if invalid and self._session._logger:
-                self._session._logger.warning(
-                    f"updateNetworkWirelessAirMarshalSettings: ignoring unrecognized kwargs: {invalid}"
-                )
-
-        return self._session.put(metadata, resource, payload)
+        return dispatch.call(self._session, "updateNetworkWirelessAirMarshalSettings", networkId, defaultPolicy, **kwargs)
 
     def getNetworkWirelessAlternateManagementInterface(self, networkId: str):
         """
@@ -528,14 +220,7 @@ class Wireless(object):
         - networkId (string): Network ID
         """
 
-        metadata = {
-            "tags": ["wireless", "configure", "alternateManagementInterface"],
-            "operation": "getNetworkWirelessAlternateManagementInterface",
-        }
-        networkId = urllib.parse.quote(str(networkId), safe="")
-        resource = f"/networks/{networkId}/wireless/alternateManagementInterface"
-
-        return self._session.get(metadata, resource)
+        return dispatch.call(self._session, "getNetworkWirelessAlternateManagementInterface", networkId)
 
     def updateNetworkWirelessAlternateManagementInterface(self, networkId: str, **kwargs):
         """
@@ -549,32 +234,7 @@ class Wireless(object):
         - accessPoints (array): Array of access point serial number and IP assignment. Note: accessPoints IP assignment is not applicable for template networks, in other words, do not put 'accessPoints' in the body when updating template networks. Also, an empty 'accessPoints' array will remove all previous static IP assignments
         """
 
-        kwargs.update(locals())
-
-        metadata = {
-            "tags": ["wireless", "configure", "alternateManagementInterface"],
-            "operation": "updateNetworkWirelessAlternateManagementInterface",
-        }
-        networkId = urllib.parse.quote(str(networkId), safe="")
-        resource = f"/networks/{networkId}/wireless/alternateManagementInterface"
-
-        body_params = [
-            "enabled",
-            "vlanId",
-            "protocols",
-            "accessPoints",
-        ]
-        payload = {k.strip(): v for k, v in kwargs.items() if k.strip() in body_params}
-
-        if self._session._validate_kwargs:
-            all_params = [] + body_params
-            invalid = [k for k in kwargs if k.strip() not in all_params and k != "self"]
-            if invalid and self._session._logger:
-                self._session._logger.warning(
-                    f"updateNetworkWirelessAlternateManagementInterface: ignoring unrecognized kwargs: {invalid}"
-                )
-
-        return self._session.put(metadata, resource, payload)
+        return dispatch.call(self._session, "updateNetworkWirelessAlternateManagementInterface", networkId, **kwargs)
 
     def getNetworkWirelessBilling(self, networkId: str):
         """
@@ -584,14 +244,7 @@ class Wireless(object):
         - networkId (string): Network ID
         """
 
-        metadata = {
-            "tags": ["wireless", "configure", "billing"],
-            "operation": "getNetworkWirelessBilling",
-        }
-        networkId = urllib.parse.quote(str(networkId), safe="")
-        resource = f"/networks/{networkId}/wireless/billing"
-
-        return self._session.get(metadata, resource)
+        return dispatch.call(self._session, "getNetworkWirelessBilling", networkId)
 
     def updateNetworkWirelessBilling(self, networkId: str, **kwargs):
         """
@@ -603,28 +256,7 @@ class Wireless(object):
         - plans (array): Array of billing plans in the node group. (Can configure a maximum of 5)
         """
 
-        kwargs.update(locals())
-
-        metadata = {
-            "tags": ["wireless", "configure", "billing"],
-            "operation": "updateNetworkWirelessBilling",
-        }
-        networkId = urllib.parse.quote(str(networkId), safe="")
-        resource = f"/networks/{networkId}/wireless/billing"
-
-        body_params = [
-            "currency",
-            "plans",
-        ]
-        payload = {k.strip(): v for k, v in kwargs.items() if k.strip() in body_params}
-
-        if self._session._validate_kwargs:
-            all_params = [] + body_params
-            invalid = [k for k in kwargs if k.strip() not in all_params and k != "self"]
-            if invalid and self._session._logger:
-                self._session._logger.warning(f"updateNetworkWirelessBilling: ignoring unrecognized kwargs: {invalid}")
-
-        return self._session.put(metadata, resource, payload)
+        return dispatch.call(self._session, "updateNetworkWirelessBilling", networkId, **kwargs)
 
     def getNetworkWirelessBluetoothSettings(self, networkId: str):
         """
@@ -634,14 +266,7 @@ class Wireless(object):
         - networkId (string): Network ID
         """
 
-        metadata = {
-            "tags": ["wireless", "configure", "bluetooth", "settings"],
-            "operation": "getNetworkWirelessBluetoothSettings",
-        }
-        networkId = urllib.parse.quote(str(networkId), safe="")
-        resource = f"/networks/{networkId}/wireless/bluetooth/settings"
-
-        return self._session.get(metadata, resource)
+        return dispatch.call(self._session, "getNetworkWirelessBluetoothSettings", networkId)
 
     def updateNetworkWirelessBluetoothSettings(self, networkId: str, **kwargs):
         """
@@ -657,40 +282,7 @@ class Wireless(object):
         - minor (integer): The minor number to be used in the beacon identifier. Only valid in 'Non-unique' mode.
         """
 
-        kwargs.update(locals())
-
-        if "majorMinorAssignmentMode" in kwargs:
-            options = ["Non-unique", "Unique"]
-            assert kwargs["majorMinorAssignmentMode"] in options, (
-                f'''"majorMinorAssignmentMode" cannot be "{kwargs["majorMinorAssignmentMode"]}", & must be set to one of: {options}'''
-            )
-
-        metadata = {
-            "tags": ["wireless", "configure", "bluetooth", "settings"],
-            "operation": "updateNetworkWirelessBluetoothSettings",
-        }
-        networkId = urllib.parse.quote(str(networkId), safe="")
-        resource = f"/networks/{networkId}/wireless/bluetooth/settings"
-
-        body_params = [
-            "scanningEnabled",
-            "advertisingEnabled",
-            "uuid",
-            "majorMinorAssignmentMode",
-            "major",
-            "minor",
-        ]
-        payload = {k.strip(): v for k, v in kwargs.items() if k.strip() in body_params}
-
-        if self._session._validate_kwargs:
-            all_params = [] + body_params
-            invalid = [k for k in kwargs if k.strip() not in all_params and k != "self"]
-            if invalid and self._session._logger:
-                self._session._logger.warning(
-                    f"updateNetworkWirelessBluetoothSettings: ignoring unrecognized kwargs: {invalid}"
-                )
-
-        return self._session.put(metadata, resource, payload)
+        return dispatch.call(self._session, "updateNetworkWirelessBluetoothSettings", networkId, **kwargs)
 
     def getNetworkWirelessChannelUtilizationHistory(self, networkId: str, **kwargs):
         """
@@ -709,41 +301,7 @@ class Wireless(object):
         - band (string): Filter results by band (either '2.4', '5' or '6').
         """
 
-        kwargs.update(locals())
-
-        if "band" in kwargs:
-            options = ["2.4", "5", "6"]
-            assert kwargs["band"] in options, f'''"band" cannot be "{kwargs["band"]}", & must be set to one of: {options}'''
-
-        metadata = {
-            "tags": ["wireless", "monitor", "channelUtilizationHistory"],
-            "operation": "getNetworkWirelessChannelUtilizationHistory",
-        }
-        networkId = urllib.parse.quote(str(networkId), safe="")
-        resource = f"/networks/{networkId}/wireless/channelUtilizationHistory"
-
-        query_params = [
-            "t0",
-            "t1",
-            "timespan",
-            "resolution",
-            "autoResolution",
-            "clientId",
-            "deviceSerial",
-            "apTag",
-            "band",
-        ]
-        params = {k.strip(): v for k, v in kwargs.items() if k.strip() in query_params}
-
-        if self._session._validate_kwargs:
-            all_params = query_params
-            invalid = [k for k in kwargs if k.strip() not in all_params and k != "self"]
-            if invalid and self._session._logger:
-                self._session._logger.warning(
-                    f"getNetworkWirelessChannelUtilizationHistory: ignoring unrecognized kwargs: {invalid}"
-                )
-
-        return self._session.get(metadata, resource, params)
+        return dispatch.call(self._session, "getNetworkWirelessChannelUtilizationHistory", networkId, **kwargs)
 
     def getNetworkWirelessClientCountHistory(self, networkId: str, **kwargs):
         """
@@ -763,40 +321,7 @@ class Wireless(object):
         - ssid (integer): Filter results by SSID number.
         """
 
-        kwargs.update(locals())
-
-        if "band" in kwargs:
-            options = ["2.4", "5", "6"]
-            assert kwargs["band"] in options, f'''"band" cannot be "{kwargs["band"]}", & must be set to one of: {options}'''
-
-        metadata = {
-            "tags": ["wireless", "monitor", "clientCountHistory"],
-            "operation": "getNetworkWirelessClientCountHistory",
-        }
-        networkId = urllib.parse.quote(str(networkId), safe="")
-        resource = f"/networks/{networkId}/wireless/clientCountHistory"
-
-        query_params = [
-            "t0",
-            "t1",
-            "timespan",
-            "resolution",
-            "autoResolution",
-            "clientId",
-            "deviceSerial",
-            "apTag",
-            "band",
-            "ssid",
-        ]
-        params = {k.strip(): v for k, v in kwargs.items() if k.strip() in query_params}
-
-        if self._session._validate_kwargs:
-            all_params = query_params
-            invalid = [k for k in kwargs if k.strip() not in all_params and k != "self"]
-            if invalid and self._session._logger:
-                self._session._logger.warning(f"getNetworkWirelessClientCountHistory: ignoring unrecognized kwargs: {invalid}")
-
-        return self._session.get(metadata, resource, params)
+        return dispatch.call(self._session, "getNetworkWirelessClientCountHistory", networkId, **kwargs)
 
     def getNetworkWirelessClientsConnectionStats(self, networkId: str, **kwargs):
         """
@@ -812,41 +337,7 @@ class Wireless(object):
         - apTag (string): Filter results by AP Tag
         """
 
-        kwargs.update(locals())
-
-        if "band" in kwargs:
-            options = ["2.4", "5", "6"]
-            assert kwargs["band"] in options, f'''"band" cannot be "{kwargs["band"]}", & must be set to one of: {options}'''
-        if "ssid" in kwargs:
-            options = [0, 1, 2, 3, 4, 5, 6, 7, 8, 9, 10, 11, 12, 13, 14]
-            assert kwargs["ssid"] in options, f'''"ssid" cannot be "{kwargs["ssid"]}", & must be set to one of: {options}'''
-
-        metadata = {
-            "tags": ["wireless", "monitor", "clients", "connectionStats"],
-            "operation": "getNetworkWirelessClientsConnectionStats",
-        }
-        networkId = urllib.parse.quote(str(networkId), safe="")
-        resource = f"/networks/{networkId}/wireless/clients/connectionStats"
-
-        query_params = [
-            "t0",
-            "t1",
-            "timespan",
-            "band",
-            "ssid",
-            "apTag",
-        ]
-        params = {k.strip(): v for k, v in kwargs.items() if k.strip() in query_params}
-
-        if self._session._validate_kwargs:
-            all_params = query_params
-            invalid = [k for k in kwargs if k.strip() not in all_params and k != "self"]
-            if invalid and self._session._logger:
-                self._session._logger.warning(
-                    f"getNetworkWirelessClientsConnectionStats: ignoring unrecognized kwargs: {invalid}"
-                )
-
-        return self._session.get(metadata, resource, params)
+        return dispatch.call(self._session, "getNetworkWirelessClientsConnectionStats", networkId, **kwargs)
 
     def getNetworkWirelessClientsLatencyStats(self, networkId: str, **kwargs):
         """
@@ -864,43 +355,7 @@ class Wireless(object):
         - fields (string): Partial selection: If present, this call will return only the selected fields of ["rawDistribution", "avg"]. All fields will be returned by default. Selected fields must be entered as a comma separated string.
         """
 
-        kwargs.update(locals())
-
-        if "band" in kwargs:
-            options = ["2.4", "5", "6"]
-            assert kwargs["band"] in options, f'''"band" cannot be "{kwargs["band"]}", & must be set to one of: {options}'''
-        if "ssid" in kwargs:
-            options = [0, 1, 2, 3, 4, 5, 6, 7, 8, 9, 10, 11, 12, 13, 14]
-            assert kwargs["ssid"] in options, f'''"ssid" cannot be "{kwargs["ssid"]}", & must be set to one of: {options}'''
-
-        metadata = {
-            "tags": ["wireless", "monitor", "clients", "latencyStats"],
-            "operation": "getNetworkWirelessClientsLatencyStats",
-        }
-        networkId = urllib.parse.quote(str(networkId), safe="")
-        resource = f"/networks/{networkId}/wireless/clients/latencyStats"
-
-        query_params = [
-            "t0",
-            "t1",
-            "timespan",
-            "band",
-            "ssid",
-            "apTag",
-            "vlan",
-            "fields",
-        ]
-        params = {k.strip(): v for k, v in kwargs.items() if k.strip() in query_params}
-
-        if self._session._validate_kwargs:
-            all_params = query_params
-            invalid = [k for k in kwargs if k.strip() not in all_params and k != "self"]
-            if invalid and self._session._logger:
-                self._session._logger.warning(
-                    f"getNetworkWirelessClientsLatencyStats: ignoring unrecognized kwargs: {invalid}"
-                )
-
-        return self._session.get(metadata, resource, params)
+        return dispatch.call(self._session, "getNetworkWirelessClientsLatencyStats", networkId, **kwargs)
 
     def getNetworkWirelessClientConnectionStats(self, networkId: str, clientId: str, **kwargs):
         """
@@ -917,42 +372,7 @@ class Wireless(object):
         - apTag (string): Filter results by AP Tag
         """
 
-        kwargs.update(locals())
-
-        if "band" in kwargs:
-            options = ["2.4", "5", "6"]
-            assert kwargs["band"] in options, f'''"band" cannot be "{kwargs["band"]}", & must be set to one of: {options}'''
-        if "ssid" in kwargs:
-            options = [0, 1, 2, 3, 4, 5, 6, 7, 8, 9, 10, 11, 12, 13, 14]
-            assert kwargs["ssid"] in options, f'''"ssid" cannot be "{kwargs["ssid"]}", & must be set to one of: {options}'''
-
-        metadata = {
-            "tags": ["wireless", "monitor", "clients", "connectionStats"],
-            "operation": "getNetworkWirelessClientConnectionStats",
-        }
-        networkId = urllib.parse.quote(str(networkId), safe="")
-        clientId = urllib.parse.quote(str(clientId), safe="")
-        resource = f"/networks/{networkId}/wireless/clients/{clientId}/connectionStats"
-
-        query_params = [
-            "t0",
-            "t1",
-            "timespan",
-            "band",
-            "ssid",
-            "apTag",
-        ]
-        params = {k.strip(): v for k, v in kwargs.items() if k.strip() in query_params}
-
-        if self._session._validate_kwargs:
-            all_params = query_params
-            invalid = [k for k in kwargs if k.strip() not in all_params and k != "self"]
-            if invalid and self._session._logger:
-                self._session._logger.warning(
-                    f"getNetworkWirelessClientConnectionStats: ignoring unrecognized kwargs: {invalid}"
-                )
-
-        return self._session.get(metadata, resource, params)
+        return dispatch.call(self._session, "getNetworkWirelessClientConnectionStats", networkId, clientId, **kwargs)
 
     def getNetworkWirelessClientConnectivityEvents(
         self, networkId: str, clientId: str, total_pages=1, direction="next", **kwargs
@@ -979,64 +399,15 @@ class Wireless(object):
         - deviceSerial (string): Filter results by an AP's serial number.
         """
 
-        kwargs.update(locals())
-
-        if "sortOrder" in kwargs:
-            options = ["ascending", "descending"]
-            assert kwargs["sortOrder"] in options, (
-                f'''"sortOrder" cannot be "{kwargs["sortOrder"]}", & must be set to one of: {options}'''
-            )
-        if "band" in kwargs:
-            options = ["2.4", "5", "6"]
-            assert kwargs["band"] in options, f'''"band" cannot be "{kwargs["band"]}", & must be set to one of: {options}'''
-        if "ssidNumber" in kwargs:
-            options = [0, 1, 2, 3, 4, 5, 6, 7, 8, 9, 10, 11, 12, 13, 14]
-            assert kwargs["ssidNumber"] in options, (
-                f'''"ssidNumber" cannot be "{kwargs["ssidNumber"]}", & must be set to one of: {options}'''
-            )
-
-        metadata = {
-            "tags": ["wireless", "monitor", "clients", "connectivityEvents"],
-            "operation": "getNetworkWirelessClientConnectivityEvents",
-        }
-        networkId = urllib.parse.quote(str(networkId), safe="")
-        clientId = urllib.parse.quote(str(clientId), safe="")
-        resource = f"/networks/{networkId}/wireless/clients/{clientId}/connectivityEvents"
-
-        query_params = [
-            "perPage",
-            "startingAfter",
-            "endingBefore",
-            "sortOrder",
-            "t0",
-            "t1",
-            "timespan",
-            "types",
-            "band",
-            "ssidNumber",
-            "includedSeverities",
-            "deviceSerial",
-        ]
-        params = {k.strip(): v for k, v in kwargs.items() if k.strip() in query_params}
-
-        array_params = [
-            "types",
-            "includedSeverities",
-        ]
-        for k, v in kwargs.items():
-            if k.strip() in array_params:
-                params[f"{k.strip()}[]"] = kwargs[f"{k}"]
-                params.pop(k.strip())
-
-        if self._session._validate_kwargs:
-            all_params = query_params + array_params
-            invalid = [k for k in kwargs if k.strip() not in all_params and k != "self"]
-            if invalid and self._session._logger:
-                self._session._logger.warning(
-                    f"getNetworkWirelessClientConnectivityEvents: ignoring unrecognized kwargs: {invalid}"
-                )
-
-        return self._session.get_pages(metadata, resource, params, total_pages, direction)
+        return dispatch.call(
+            self._session,
+            "getNetworkWirelessClientConnectivityEvents",
+            networkId,
+            clientId,
+            total_pages=total_pages,
+            direction=direction,
+            **kwargs,
+        )
 
     def getNetworkWirelessClientLatencyHistory(self, networkId: str, clientId: str, **kwargs):
         """
@@ -1051,33 +422,7 @@ class Wireless(object):
         - resolution (integer): The time resolution in seconds for returned data. The valid resolutions are: 86400. The default is 86400.
         """
 
-        kwargs.update(locals())
-
-        metadata = {
-            "tags": ["wireless", "monitor", "clients", "latencyHistory"],
-            "operation": "getNetworkWirelessClientLatencyHistory",
-        }
-        networkId = urllib.parse.quote(str(networkId), safe="")
-        clientId = urllib.parse.quote(str(clientId), safe="")
-        resource = f"/networks/{networkId}/wireless/clients/{clientId}/latencyHistory"
-
-        query_params = [
-            "t0",
-            "t1",
-            "timespan",
-            "resolution",
-        ]
-        params = {k.strip(): v for k, v in kwargs.items() if k.strip() in query_params}
-
-        if self._session._validate_kwargs:
-            all_params = query_params
-            invalid = [k for k in kwargs if k.strip() not in all_params and k != "self"]
-            if invalid and self._session._logger:
-                self._session._logger.warning(
-                    f"getNetworkWirelessClientLatencyHistory: ignoring unrecognized kwargs: {invalid}"
-                )
-
-        return self._session.get(metadata, resource, params)
+        return dispatch.call(self._session, "getNetworkWirelessClientLatencyHistory", networkId, clientId, **kwargs)
 
     def getNetworkWirelessClientLatencyStats(self, networkId: str, clientId: str, **kwargs):
         """
@@ -1096,42 +441,7 @@ class Wireless(object):
         - fields (string): Partial selection: If present, this call will return only the selected fields of ["rawDistribution", "avg"]. All fields will be returned by default. Selected fields must be entered as a comma separated string.
         """
 
-        kwargs.update(locals())
-
-        if "band" in kwargs:
-            options = ["2.4", "5", "6"]
-            assert kwargs["band"] in options, f'''"band" cannot be "{kwargs["band"]}", & must be set to one of: {options}'''
-        if "ssid" in kwargs:
-            options = [0, 1, 2, 3, 4, 5, 6, 7, 8, 9, 10, 11, 12, 13, 14]
-            assert kwargs["ssid"] in options, f'''"ssid" cannot be "{kwargs["ssid"]}", & must be set to one of: {options}'''
-
-        metadata = {
-            "tags": ["wireless", "monitor", "clients", "latencyStats"],
-            "operation": "getNetworkWirelessClientLatencyStats",
-        }
-        networkId = urllib.parse.quote(str(networkId), safe="")
-        clientId = urllib.parse.quote(str(clientId), safe="")
-        resource = f"/networks/{networkId}/wireless/clients/{clientId}/latencyStats"
-
-        query_params = [
-            "t0",
-            "t1",
-            "timespan",
-            "band",
-            "ssid",
-            "apTag",
-            "vlan",
-            "fields",
-        ]
-        params = {k.strip(): v for k, v in kwargs.items() if k.strip() in query_params}
-
-        if self._session._validate_kwargs:
-            all_params = query_params
-            invalid = [k for k in kwargs if k.strip() not in all_params and k != "self"]
-            if invalid and self._session._logger:
-                self._session._logger.warning(f"getNetworkWirelessClientLatencyStats: ignoring unrecognized kwargs: {invalid}")
-
-        return self._session.get(metadata, resource, params)
+        return dispatch.call(self._session, "getNetworkWirelessClientLatencyStats", networkId, clientId, **kwargs)
 
     def getNetworkWirelessConnectionStats(self, networkId: str, **kwargs):
         """
@@ -1147,39 +457,7 @@ class Wireless(object):
         - apTag (string): Filter results by AP Tag
         """
 
-        kwargs.update(locals())
-
-        if "band" in kwargs:
-            options = ["2.4", "5", "6"]
-            assert kwargs["band"] in options, f'''"band" cannot be "{kwargs["band"]}", & must be set to one of: {options}'''
-        if "ssid" in kwargs:
-            options = [0, 1, 2, 3, 4, 5, 6, 7, 8, 9, 10, 11, 12, 13, 14]
-            assert kwargs["ssid"] in options, f'''"ssid" cannot be "{kwargs["ssid"]}", & must be set to one of: {options}'''
-
-        metadata = {
-            "tags": ["wireless", "monitor", "connectionStats"],
-            "operation": "getNetworkWirelessConnectionStats",
-        }
-        networkId = urllib.parse.quote(str(networkId), safe="")
-        resource = f"/networks/{networkId}/wireless/connectionStats"
-
-        query_params = [
-            "t0",
-            "t1",
-            "timespan",
-            "band",
-            "ssid",
-            "apTag",
-        ]
-        params = {k.strip(): v for k, v in kwargs.items() if k.strip() in query_params}
-
-        if self._session._validate_kwargs:
-            all_params = query_params
-            invalid = [k for k in kwargs if k.strip() not in all_params and k != "self"]
-            if invalid and self._session._logger:
-                self._session._logger.warning(f"getNetworkWirelessConnectionStats: ignoring unrecognized kwargs: {invalid}")
-
-        return self._session.get(metadata, resource, params)
+        return dispatch.call(self._session, "getNetworkWirelessConnectionStats", networkId, **kwargs)
 
     def getNetworkWirelessDataRateHistory(self, networkId: str, **kwargs):
         """
@@ -1199,40 +477,7 @@ class Wireless(object):
         - ssid (integer): Filter results by SSID number.
         """
 
-        kwargs.update(locals())
-
-        if "band" in kwargs:
-            options = ["2.4", "5", "6"]
-            assert kwargs["band"] in options, f'''"band" cannot be "{kwargs["band"]}", & must be set to one of: {options}'''
-
-        metadata = {
-            "tags": ["wireless", "monitor", "dataRateHistory"],
-            "operation": "getNetworkWirelessDataRateHistory",
-        }
-        networkId = urllib.parse.quote(str(networkId), safe="")
-        resource = f"/networks/{networkId}/wireless/dataRateHistory"
-
-        query_params = [
-            "t0",
-            "t1",
-            "timespan",
-            "resolution",
-            "autoResolution",
-            "clientId",
-            "deviceSerial",
-            "apTag",
-            "band",
-            "ssid",
-        ]
-        params = {k.strip(): v for k, v in kwargs.items() if k.strip() in query_params}
-
-        if self._session._validate_kwargs:
-            all_params = query_params
-            invalid = [k for k in kwargs if k.strip() not in all_params and k != "self"]
-            if invalid and self._session._logger:
-                self._session._logger.warning(f"getNetworkWirelessDataRateHistory: ignoring unrecognized kwargs: {invalid}")
-
-        return self._session.get(metadata, resource, params)
+        return dispatch.call(self._session, "getNetworkWirelessDataRateHistory", networkId, **kwargs)
 
     def getNetworkWirelessDevicesConnectionStats(self, networkId: str, **kwargs):
         """
@@ -1248,41 +493,7 @@ class Wireless(object):
         - apTag (string): Filter results by AP Tag
         """
 
-        kwargs.update(locals())
-
-        if "band" in kwargs:
-            options = ["2.4", "5", "6"]
-            assert kwargs["band"] in options, f'''"band" cannot be "{kwargs["band"]}", & must be set to one of: {options}'''
-        if "ssid" in kwargs:
-            options = [0, 1, 2, 3, 4, 5, 6, 7, 8, 9, 10, 11, 12, 13, 14]
-            assert kwargs["ssid"] in options, f'''"ssid" cannot be "{kwargs["ssid"]}", & must be set to one of: {options}'''
-
-        metadata = {
-            "tags": ["wireless", "monitor", "devices", "connectionStats"],
-            "operation": "getNetworkWirelessDevicesConnectionStats",
-        }
-        networkId = urllib.parse.quote(str(networkId), safe="")
-        resource = f"/networks/{networkId}/wireless/devices/connectionStats"
-
-        query_params = [
-            "t0",
-            "t1",
-            "timespan",
-            "band",
-            "ssid",
-            "apTag",
-        ]
-        params = {k.strip(): v for k, v in kwargs.items() if k.strip() in query_params}
-
-        if self._session._validate_kwargs:
-            all_params = query_params
-            invalid = [k for k in kwargs if k.strip() not in all_params and k != "self"]
-            if invalid and self._session._logger:
-                self._session._logger.warning(
-                    f"getNetworkWirelessDevicesConnectionStats: ignoring unrecognized kwargs: {invalid}"
-                )
-
-        return self._session.get(metadata, resource, params)
+        return dispatch.call(self._session, "getNetworkWirelessDevicesConnectionStats", networkId, **kwargs)
 
     def getNetworkWirelessDevicesLatencyStats(self, networkId: str, **kwargs):
         """
@@ -1300,43 +511,7 @@ class Wireless(object):
         - fields (string): Partial selection: If present, this call will return only the selected fields of ["rawDistribution", "avg"]. All fields will be returned by default. Selected fields must be entered as a comma separated string.
         """
 
-        kwargs.update(locals())
-
-        if "band" in kwargs:
-            options = ["2.4", "5", "6"]
-            assert kwargs["band"] in options, f'''"band" cannot be "{kwargs["band"]}", & must be set to one of: {options}'''
-        if "ssid" in kwargs:
-            options = [0, 1, 2, 3, 4, 5, 6, 7, 8, 9, 10, 11, 12, 13, 14]
-            assert kwargs["ssid"] in options, f'''"ssid" cannot be "{kwargs["ssid"]}", & must be set to one of: {options}'''
-
-        metadata = {
-            "tags": ["wireless", "monitor", "devices", "latencyStats"],
-            "operation": "getNetworkWirelessDevicesLatencyStats",
-        }
-        networkId = urllib.parse.quote(str(networkId), safe="")
-        resource = f"/networks/{networkId}/wireless/devices/latencyStats"
-
-        query_params = [
-            "t0",
-            "t1",
-            "timespan",
-            "band",
-            "ssid",
-            "apTag",
-            "vlan",
-            "fields",
-        ]
-        params = {k.strip(): v for k, v in kwargs.items() if k.strip() in query_params}
-
-        if self._session._validate_kwargs:
-            all_params = query_params
-            invalid = [k for k in kwargs if k.strip() not in all_params and k != "self"]
-            if invalid and self._session._logger:
-                self._session._logger.warning(
-                    f"getNetworkWirelessDevicesLatencyStats: ignoring unrecognized kwargs: {invalid}"
-                )
-
-        return self._session.get(metadata, resource, params)
+        return dispatch.call(self._session, "getNetworkWirelessDevicesLatencyStats", networkId, **kwargs)
 
     def getNetworkWirelessElectronicShelfLabel(self, networkId: str):
         """
@@ -1346,14 +521,7 @@ class Wireless(object):
         - networkId (string): Network ID
         """
 
-        metadata = {
-            "tags": ["wireless", "configure", "electronicShelfLabel"],
-            "operation": "getNetworkWirelessElectronicShelfLabel",
-        }
-        networkId = urllib.parse.quote(str(networkId), safe="")
-        resource = f"/networks/{networkId}/wireless/electronicShelfLabel"
-
-        return self._session.get(metadata, resource)
+        return dispatch.call(self._session, "getNetworkWirelessElectronicShelfLabel", networkId)
 
     def updateNetworkWirelessElectronicShelfLabel(self, networkId: str, **kwargs):
         """
@@ -1366,35 +534,7 @@ class Wireless(object):
         - mode (string): Electronic shelf label mode of the network. Valid options are 'Bluetooth', 'high frequency'
         """
 
-        kwargs.update(locals())
-
-        if "mode" in kwargs:
-            options = ["Bluetooth", "high frequency"]
-            assert kwargs["mode"] in options, f'''"mode" cannot be "{kwargs["mode"]}", & must be set to one of: {options}'''
-
-        metadata = {
-            "tags": ["wireless", "configure", "electronicShelfLabel"],
-            "operation": "updateNetworkWirelessElectronicShelfLabel",
-        }
-        networkId = urllib.parse.quote(str(networkId), safe="")
-        resource = f"/networks/{networkId}/wireless/electronicShelfLabel"
-
-        body_params = [
-            "hostname",
-            "enabled",
-            "mode",
-        ]
-        payload = {k.strip(): v for k, v in kwargs.items() if k.strip() in body_params}
-
-        if self._session._validate_kwargs:
-            all_params = [] + body_params
-            invalid = [k for k in kwargs if k.strip() not in all_params and k != "self"]
-            if invalid and self._session._logger:
-                self._session._logger.warning(
-                    f"updateNetworkWirelessElectronicShelfLabel: ignoring unrecognized kwargs: {invalid}"
-                )
-
-        return self._session.put(metadata, resource, payload)
+        return dispatch.call(self._session, "updateNetworkWirelessElectronicShelfLabel", networkId, **kwargs)
 
     def getNetworkWirelessElectronicShelfLabelConfiguredDevices(self, networkId: str):
         """
@@ -1404,14 +544,7 @@ class Wireless(object):
         - networkId (string): Network ID
         """
 
-        metadata = {
-            "tags": ["wireless", "configure", "electronicShelfLabel", "configuredDevices"],
-            "operation": "getNetworkWirelessElectronicShelfLabelConfiguredDevices",
-        }
-        networkId = urllib.parse.quote(str(networkId), safe="")
-        resource = f"/networks/{networkId}/wireless/electronicShelfLabel/configuredDevices"
-
-        return self._session.get(metadata, resource)
+        return dispatch.call(self._session, "getNetworkWirelessElectronicShelfLabelConfiguredDevices", networkId)
 
     def getNetworkWirelessEthernetPortsProfiles(self, networkId: str):
         """
@@ -1421,14 +554,7 @@ class Wireless(object):
         - networkId (string): Network ID
         """
 
-        metadata = {
-            "tags": ["wireless", "configure", "ethernet", "ports", "profiles"],
-            "operation": "getNetworkWirelessEthernetPortsProfiles",
-        }
-        networkId = urllib.parse.quote(str(networkId), safe="")
-        resource = f"/networks/{networkId}/wireless/ethernet/ports/profiles"
-
-        return self._session.get(metadata, resource)
+        return dispatch.call(self._session, "getNetworkWirelessEthernetPortsProfiles", networkId)
 
     def createNetworkWirelessEthernetPortsProfile(self, networkId: str, name: str, ports: list, **kwargs):
         """
@@ -1441,31 +567,7 @@ class Wireless(object):
         - usbPorts (array): AP usb ports configuration
         """
 
-        kwargs.update(locals())
-
-        metadata = {
-            "tags": ["wireless", "configure", "ethernet", "ports", "profiles"],
-            "operation": "createNetworkWirelessEthernetPortsProfile",
-        }
-        networkId = urllib.parse.quote(str(networkId), safe="")
-        resource = f"/networks/{networkId}/wireless/ethernet/ports/profiles"
-
-        body_params = [
-            "name",
-            "ports",
-            "usbPorts",
-        ]
-        payload = {k.strip(): v for k, v in kwargs.items() if k.strip() in body_params}
-
-        if self._session._validate_kwargs:
-            all_params = [] + body_params
-            invalid = [k for k in kwargs if k.strip() not in all_params and k != "self"]
-            if invalid and self._session._logger:
-                self._session._logger.warning(
-                    f"createNetworkWirelessEthernetPortsProfile: ignoring unrecognized kwargs: {invalid}"
-                )
-
-        return self._session.post(metadata, resource, payload)
+        return dispatch.call(self._session, "createNetworkWirelessEthernetPortsProfile", networkId, name, ports, **kwargs)
 
     def assignNetworkWirelessEthernetPortsProfiles(self, networkId: str, serials: list, profileId: str, **kwargs):
         """
@@ -1477,30 +579,9 @@ class Wireless(object):
         - profileId (string): AP profile ID
         """
 
-        kwargs = locals()
-
-        metadata = {
-            "tags": ["wireless", "configure", "ethernet", "ports", "profiles"],
-            "operation": "assignNetworkWirelessEthernetPortsProfiles",
-        }
-        networkId = urllib.parse.quote(str(networkId), safe="")
-        resource = f"/networks/{networkId}/wireless/ethernet/ports/profiles/assign"
-
-        body_params = [
-            "serials",
-            "profileId",
-        ]
-        payload = {k.strip(): v for k, v in kwargs.items() if k.strip() in body_params}
-
-        if self._session._validate_kwargs:
-            all_params = [] + body_params
-            invalid = [k for k in kwargs if k.strip() not in all_params and k != "self"]
-            if invalid and self._session._logger:
-                self._session._logger.warning(
-                    f"assignNetworkWirelessEthernetPortsProfiles: ignoring unrecognized kwargs: {invalid}"
-                )
-
-        return self._session.post(metadata, resource, payload)
+        return dispatch.call(
+            self._session, "assignNetworkWirelessEthernetPortsProfiles", networkId, serials, profileId, **kwargs
+        )
 
     def setNetworkWirelessEthernetPortsProfilesDefault(self, networkId: str, profileId: str, **kwargs):
         """
@@ -1511,29 +592,7 @@ class Wireless(object):
         - profileId (string): AP profile ID
         """
 
-        kwargs = locals()
-
-        metadata = {
-            "tags": ["wireless", "configure", "ethernet", "ports", "profiles"],
-            "operation": "setNetworkWirelessEthernetPortsProfilesDefault",
-        }
-        networkId = urllib.parse.quote(str(networkId), safe="")
-        resource = f"/networks/{networkId}/wireless/ethernet/ports/profiles/setDefault"
-
-        body_params = [
-            "profileId",
-        ]
-        payload = {k.strip(): v for k, v in kwargs.items() if k.strip() in body_params}
-
-        if self._session._validate_kwargs:
-            all_params = [] + body_params
-            invalid = [k for k in kwargs if k.strip() not in all_params and k != "self"]
-            if invalid and self._session._logger:
-                self._session._logger.warning(
-                    f"setNetworkWirelessEthernetPortsProfilesDefault: ignoring unrecognized kwargs: {invalid}"
-                )
-
-        return self._session.post(metadata, resource, payload)
+        return dispatch.call(self._session, "setNetworkWirelessEthernetPortsProfilesDefault", networkId, profileId, **kwargs)
 
     def getNetworkWirelessEthernetPortsProfile(self, networkId: str, profileId: str):
         """
@@ -1544,15 +603,7 @@ class Wireless(object):
         - profileId (string): Profile ID
         """
 
-        metadata = {
-            "tags": ["wireless", "configure", "ethernet", "ports", "profiles"],
-            "operation": "getNetworkWirelessEthernetPortsProfile",
-        }
-        networkId = urllib.parse.quote(str(networkId), safe="")
-        profileId = urllib.parse.quote(str(profileId), safe="")
-        resource = f"/networks/{networkId}/wireless/ethernet/ports/profiles/{profileId}"
-
-        return self._session.get(metadata, resource)
+        return dispatch.call(self._session, "getNetworkWirelessEthernetPortsProfile", networkId, profileId)
 
     def updateNetworkWirelessEthernetPortsProfile(self, networkId: str, profileId: str, **kwargs):
         """
@@ -1566,32 +617,7 @@ class Wireless(object):
         - usbPorts (array): AP usb ports configuration
         """
 
-        kwargs.update(locals())
-
-        metadata = {
-            "tags": ["wireless", "configure", "ethernet", "ports", "profiles"],
-            "operation": "updateNetworkWirelessEthernetPortsProfile",
-        }
-        networkId = urllib.parse.quote(str(networkId), safe="")
-        profileId = urllib.parse.quote(str(profileId), safe="")
-        resource = f"/networks/{networkId}/wireless/ethernet/ports/profiles/{profileId}"
-
-        body_params = [
-            "name",
-            "ports",
-            "usbPorts",
-        ]
-        payload = {k.strip(): v for k, v in kwargs.items() if k.strip() in body_params}
-
-        if self._session._validate_kwargs:
-            all_params = [] + body_params
-            invalid = [k for k in kwargs if k.strip() not in all_params and k != "self"]
-            if invalid and self._session._logger:
-                self._session._logger.warning(
-                    f"updateNetworkWirelessEthernetPortsProfile: ignoring unrecognized kwargs: {invalid}"
-                )
-
-        return self._session.put(metadata, resource, payload)
+        return dispatch.call(self._session, "updateNetworkWirelessEthernetPortsProfile", networkId, profileId, **kwargs)
 
     def deleteNetworkWirelessEthernetPortsProfile(self, networkId: str, profileId: str):
         """
@@ -1602,15 +628,7 @@ class Wireless(object):
         - profileId (string): Profile ID
         """
 
-        metadata = {
-            "tags": ["wireless", "configure", "ethernet", "ports", "profiles"],
-            "operation": "deleteNetworkWirelessEthernetPortsProfile",
-        }
-        networkId = urllib.parse.quote(str(networkId), safe="")
-        profileId = urllib.parse.quote(str(profileId), safe="")
-        resource = f"/networks/{networkId}/wireless/ethernet/ports/profiles/{profileId}"
-
-        return self._session.delete(metadata, resource)
+        return dispatch.call(self._session, "deleteNetworkWirelessEthernetPortsProfile", networkId, profileId)
 
     def getNetworkWirelessFailedConnections(self, networkId: str, **kwargs):
         """
@@ -1628,41 +646,7 @@ class Wireless(object):
         - clientId (string): Filter by client MAC
         """
 
-        kwargs.update(locals())
-
-        if "band" in kwargs:
-            options = ["2.4", "5", "6"]
-            assert kwargs["band"] in options, f'''"band" cannot be "{kwargs["band"]}", & must be set to one of: {options}'''
-        if "ssid" in kwargs:
-            options = [0, 1, 2, 3, 4, 5, 6, 7, 8, 9, 10, 11, 12, 13, 14]
-            assert kwargs["ssid"] in options, f'''"ssid" cannot be "{kwargs["ssid"]}", & must be set to one of: {options}'''
-
-        metadata = {
-            "tags": ["wireless", "monitor", "failedConnections"],
-            "operation": "getNetworkWirelessFailedConnections",
-        }
-        networkId = urllib.parse.quote(str(networkId), safe="")
-        resource = f"/networks/{networkId}/wireless/failedConnections"
-
-        query_params = [
-            "t0",
-            "t1",
-            "timespan",
-            "band",
-            "ssid",
-            "apTag",
-            "serial",
-            "clientId",
-        ]
-        params = {k.strip(): v for k, v in kwargs.items() if k.strip() in query_params}
-
-        if self._session._validate_kwargs:
-            all_params = query_params
-            invalid = [k for k in kwargs if k.strip() not in all_params and k != "self"]
-            if invalid and self._session._logger:
-                self._session._logger.warning(f"getNetworkWirelessFailedConnections: ignoring unrecognized kwargs: {invalid}")
-
-        return self._session.get(metadata, resource, params)
+        return dispatch.call(self._session, "getNetworkWirelessFailedConnections", networkId, **kwargs)
 
     def getNetworkWirelessLatencyHistory(self, networkId: str, **kwargs):
         """
@@ -1683,46 +667,7 @@ class Wireless(object):
         - accessCategory (string): Filter by access category.
         """
 
-        kwargs.update(locals())
-
-        if "band" in kwargs:
-            options = ["2.4", "5", "6"]
-            assert kwargs["band"] in options, f'''"band" cannot be "{kwargs["band"]}", & must be set to one of: {options}'''
-        if "accessCategory" in kwargs:
-            options = ["backgroundTraffic", "bestEffortTraffic", "videoTraffic", "voiceTraffic"]
-            assert kwargs["accessCategory"] in options, (
-                f'''"accessCategory" cannot be "{kwargs["accessCategory"]}", & must be set to one of: {options}'''
-            )
-
-        metadata = {
-            "tags": ["wireless", "monitor", "latencyHistory"],
-            "operation": "getNetworkWirelessLatencyHistory",
-        }
-        networkId = urllib.parse.quote(str(networkId), safe="")
-        resource = f"/networks/{networkId}/wireless/latencyHistory"
-
-        query_params = [
-            "t0",
-            "t1",
-            "timespan",
-            "resolution",
-            "autoResolution",
-            "clientId",
-            "deviceSerial",
-            "apTag",
-            "band",
-            "ssid",
-            "accessCategory",
-        ]
-        params = {k.strip(): v for k, v in kwargs.items() if k.strip() in query_params}
-
-        if self._session._validate_kwargs:
-            all_params = query_params
-            invalid = [k for k in kwargs if k.strip() not in all_params and k != "self"]
-            if invalid and self._session._logger:
-                self._session._logger.warning(f"getNetworkWirelessLatencyHistory: ignoring unrecognized kwargs: {invalid}")
-
-        return self._session.get(metadata, resource, params)
+        return dispatch.call(self._session, "getNetworkWirelessLatencyHistory", networkId, **kwargs)
 
     def getNetworkWirelessLatencyStats(self, networkId: str, **kwargs):
         """
@@ -1740,41 +685,7 @@ class Wireless(object):
         - fields (string): Partial selection: If present, this call will return only the selected fields of ["rawDistribution", "avg"]. All fields will be returned by default. Selected fields must be entered as a comma separated string.
         """
 
-        kwargs.update(locals())
-
-        if "band" in kwargs:
-            options = ["2.4", "5", "6"]
-            assert kwargs["band"] in options, f'''"band" cannot be "{kwargs["band"]}", & must be set to one of: {options}'''
-        if "ssid" in kwargs:
-            options = [0, 1, 2, 3, 4, 5, 6, 7, 8, 9, 10, 11, 12, 13, 14]
-            assert kwargs["ssid"] in options, f'''"ssid" cannot be "{kwargs["ssid"]}", & must be set to one of: {options}'''
-
-        metadata = {
-            "tags": ["wireless", "monitor", "latencyStats"],
-            "operation": "getNetworkWirelessLatencyStats",
-        }
-        networkId = urllib.parse.quote(str(networkId), safe="")
-        resource = f"/networks/{networkId}/wireless/latencyStats"
-
-        query_params = [
-            "t0",
-            "t1",
-            "timespan",
-            "band",
-            "ssid",
-            "apTag",
-            "vlan",
-            "fields",
-        ]
-        params = {k.strip(): v for k, v in kwargs.items() if k.strip() in query_params}
-
-        if self._session._validate_kwargs:
-            all_params = query_params
-            invalid = [k for k in kwargs if k.strip() not in all_params and k != "self"]
-            if invalid and self._session._logger:
-                self._session._logger.warning(f"getNetworkWirelessLatencyStats: ignoring unrecognized kwargs: {invalid}")
-
-        return self._session.get(metadata, resource, params)
+        return dispatch.call(self._session, "getNetworkWirelessLatencyStats", networkId, **kwargs)
 
     def updateNetworkWirelessLocationScanning(self, networkId: str, **kwargs):
         """
@@ -1786,30 +697,7 @@ class Wireless(object):
         - api (object): Enable push API for scanning events, analytics must be enabled
         """
 
-        kwargs.update(locals())
-
-        metadata = {
-            "tags": ["wireless", "configure", "location", "scanning"],
-            "operation": "updateNetworkWirelessLocationScanning",
-        }
-        networkId = urllib.parse.quote(str(networkId), safe="")
-        resource = f"/networks/{networkId}/wireless/location/scanning"
-
-        body_params = [
-            "enabled",
-            "api",
-        ]
-        payload = {k.strip(): v for k, v in kwargs.items() if k.strip() in body_params}
-
-        if self._session._validate_kwargs:
-            all_params = [] + body_params
-            invalid = [k for k in kwargs if k.strip() not in all_params and k != "self"]
-            if invalid and self._session._logger:
-                self._session._logger.warning(
-                    f"updateNetworkWirelessLocationScanning: ignoring unrecognized kwargs: {invalid}"
-                )
-
-        return self._session.put(metadata, resource, payload)
+        return dispatch.call(self._session, "updateNetworkWirelessLocationScanning", networkId, **kwargs)
 
     def getNetworkWirelessMeshStatuses(self, networkId: str, total_pages=1, direction="next", **kwargs):
         """
@@ -1824,29 +712,9 @@ class Wireless(object):
         - endingBefore (string): A token used by the server to indicate the end of the page. Often this is a timestamp or an ID but it is not limited to those. This parameter should not be defined by client applications. The link for the first, last, prev, or next page in the HTTP Link header should define it.
         """
 
-        kwargs.update(locals())
-
-        metadata = {
-            "tags": ["wireless", "monitor", "meshStatuses"],
-            "operation": "getNetworkWirelessMeshStatuses",
-        }
-        networkId = urllib.parse.quote(str(networkId), safe="")
-        resource = f"/networks/{networkId}/wireless/meshStatuses"
-
-        query_params = [
-            "perPage",
-            "startingAfter",
-            "endingBefore",
-        ]
-        params = {k.strip(): v for k, v in kwargs.items() if k.strip() in query_params}
-
-        if self._session._validate_kwargs:
-            all_params = query_params
-            invalid = [k for k in kwargs if k.strip() not in all_params and k != "self"]
-            if invalid and self._session._logger:
-                self._session._logger.warning(f"getNetworkWirelessMeshStatuses: ignoring unrecognized kwargs: {invalid}")
-
-        return self._session.get_pages(metadata, resource, params, total_pages, direction)
+        return dispatch.call(
+            self._session, "getNetworkWirelessMeshStatuses", networkId, total_pages=total_pages, direction=direction, **kwargs
+        )
 
     def updateNetworkWirelessRadioRrm(self, networkId: str, **kwargs):
         """
@@ -1860,30 +728,7 @@ class Wireless(object):
         - ai (object): AI settings
         """
 
-        kwargs.update(locals())
-
-        metadata = {
-            "tags": ["wireless", "configure", "radio", "rrm"],
-            "operation": "updateNetworkWirelessRadioRrm",
-        }
-        networkId = urllib.parse.quote(str(networkId), safe="")
-        resource = f"/networks/{networkId}/wireless/radio/rrm"
-
-        body_params = [
-            "busyHour",
-            "channel",
-            "fra",
-            "ai",
-        ]
-        payload = {k.strip(): v for k, v in kwargs.items() if k.strip() in body_params}
-
-        if self._session._validate_kwargs:
-            all_params = [] + body_params
-            invalid = [k for k in kwargs if k.strip() not in all_params and k != "self"]
-            if invalid and self._session._logger:
-                self._session._logger.warning(f"updateNetworkWirelessRadioRrm: ignoring unrecognized kwargs: {invalid}")
-
-        return self._session.put(metadata, resource, payload)
+        return dispatch.call(self._session, "updateNetworkWirelessRadioRrm", networkId, **kwargs)
 
     def getNetworkWirelessRfProfiles(self, networkId: str, **kwargs):
         """
@@ -1894,27 +739,7 @@ class Wireless(object):
         - includeTemplateProfiles (boolean): If the network is bound to a template, this parameter controls whether or not the non-basic RF profiles defined on the template should be included in the response alongside the non-basic profiles defined on the bound network. Defaults to false.
         """
 
-        kwargs.update(locals())
-
-        metadata = {
-            "tags": ["wireless", "configure", "rfProfiles"],
-            "operation": "getNetworkWirelessRfProfiles",
-        }
-        networkId = urllib.parse.quote(str(networkId), safe="")
-        resource = f"/networks/{networkId}/wireless/rfProfiles"
-
-        query_params = [
-            "includeTemplateProfiles",
-        ]
-        params = {k.strip(): v for k, v in kwargs.items() if k.strip() in query_params}
-
-        if self._session._validate_kwargs:
-            all_params = query_params
-            invalid = [k for k in kwargs if k.strip() not in all_params and k != "self"]
-            if invalid and self._session._logger:
-                self._session._logger.warning(f"getNetworkWirelessRfProfiles: ignoring unrecognized kwargs: {invalid}")
-
-        return self._session.get(metadata, resource, params)
+        return dispatch.call(self._session, "getNetworkWirelessRfProfiles", networkId, **kwargs)
 
     def createNetworkWirelessRfProfile(self, networkId: str, name: str, bandSelectionType: str, **kwargs):
         """
@@ -1935,48 +760,7 @@ class Wireless(object):
         - flexRadios (object): Flex radio settings.
         """
 
-        kwargs.update(locals())
-
-        if "minBitrateType" in kwargs:
-            options = ["band", "ssid"]
-            assert kwargs["minBitrateType"] in options, (
-                f'''"minBitrateType" cannot be "{kwargs["minBitrateType"]}", & must be set to one of: {options}'''
-            )
-        if "bandSelectionType" in kwargs:
-            options = ["ap", "ssid"]
-            assert kwargs["bandSelectionType"] in options, (
-                f'''"bandSelectionType" cannot be "{kwargs["bandSelectionType"]}", & must be set to one of: {options}'''
-            )
-
-        metadata = {
-            "tags": ["wireless", "configure", "rfProfiles"],
-            "operation": "createNetworkWirelessRfProfile",
-        }
-        networkId = urllib.parse.quote(str(networkId), safe="")
-        resource = f"/networks/{networkId}/wireless/rfProfiles"
-
-        body_params = [
-            "name",
-            "clientBalancingEnabled",
-            "minBitrateType",
-            "bandSelectionType",
-            "apBandSettings",
-            "twoFourGhzSettings",
-            "fiveGhzSettings",
-            "sixGhzSettings",
-            "transmission",
-            "perSsidSettings",
-            "flexRadios",
-        ]
-        payload = {k.strip(): v for k, v in kwargs.items() if k.strip() in body_params}
-
-        if self._session._validate_kwargs:
-            all_params = [] + body_params
-            invalid = [k for k in kwargs if k.strip() not in all_params and k != "self"]
-            if invalid and self._session._logger:
-                self._session._logger.warning(f"createNetworkWirelessRfProfile: ignoring unrecognized kwargs: {invalid}")
-
-        return self._session.post(metadata, resource, payload)
+        return dispatch.call(self._session, "createNetworkWirelessRfProfile", networkId, name, bandSelectionType, **kwargs)
 
     def updateNetworkWirelessRfProfile(self, networkId: str, rfProfileId: str, **kwargs):
         """
@@ -2000,51 +784,7 @@ class Wireless(object):
         - flexRadios (object): Flex radio settings.
         """
 
-        kwargs.update(locals())
-
-        if "minBitrateType" in kwargs:
-            options = ["band", "ssid"]
-            assert kwargs["minBitrateType"] in options, (
-                f'''"minBitrateType" cannot be "{kwargs["minBitrateType"]}", & must be set to one of: {options}'''
-            )
-        if "bandSelectionType" in kwargs:
-            options = ["ap", "ssid"]
-            assert kwargs["bandSelectionType"] in options, (
-                f'''"bandSelectionType" cannot be "{kwargs["bandSelectionType"]}", & must be set to one of: {options}'''
-            )
-
-        metadata = {
-            "tags": ["wireless", "configure", "rfProfiles"],
-            "operation": "updateNetworkWirelessRfProfile",
-        }
-        networkId = urllib.parse.quote(str(networkId), safe="")
-        rfProfileId = urllib.parse.quote(str(rfProfileId), safe="")
-        resource = f"/networks/{networkId}/wireless/rfProfiles/{rfProfileId}"
-
-        body_params = [
-            "name",
-            "isIndoorDefault",
-            "isOutdoorDefault",
-            "clientBalancingEnabled",
-            "minBitrateType",
-            "bandSelectionType",
-            "apBandSettings",
-            "twoFourGhzSettings",
-            "fiveGhzSettings",
-            "sixGhzSettings",
-            "transmission",
-            "perSsidSettings",
-            "flexRadios",
-        ]
-        payload = {k.strip(): v for k, v in kwargs.items() if k.strip() in body_params}
-
-        if self._session._validate_kwargs:
-            all_params = [] + body_params
-            invalid = [k for k in kwargs if k.strip() not in all_params and k != "self"]
-            if invalid and self._session._logger:
-                self._session._logger.warning(f"updateNetworkWirelessRfProfile: ignoring unrecognized kwargs: {invalid}")
-
-        return self._session.put(metadata, resource, payload)
+        return dispatch.call(self._session, "updateNetworkWirelessRfProfile", networkId, rfProfileId, **kwargs)
 
     def deleteNetworkWirelessRfProfile(self, networkId: str, rfProfileId: str):
         """
@@ -2055,15 +795,7 @@ class Wireless(object):
         - rfProfileId (string): Rf profile ID
         """
 
-        metadata = {
-            "tags": ["wireless", "configure", "rfProfiles"],
-            "operation": "deleteNetworkWirelessRfProfile",
-        }
-        networkId = urllib.parse.quote(str(networkId), safe="")
-        rfProfileId = urllib.parse.quote(str(rfProfileId), safe="")
-        resource = f"/networks/{networkId}/wireless/rfProfiles/{rfProfileId}"
-
-        return self._session.delete(metadata, resource)
+        return dispatch.call(self._session, "deleteNetworkWirelessRfProfile", networkId, rfProfileId)
 
     def getNetworkWirelessRfProfile(self, networkId: str, rfProfileId: str):
         """
@@ -2074,15 +806,7 @@ class Wireless(object):
         - rfProfileId (string): Rf profile ID
         """
 
-        metadata = {
-            "tags": ["wireless", "configure", "rfProfiles"],
-            "operation": "getNetworkWirelessRfProfile",
-        }
-        networkId = urllib.parse.quote(str(networkId), safe="")
-        rfProfileId = urllib.parse.quote(str(rfProfileId), safe="")
-        resource = f"/networks/{networkId}/wireless/rfProfiles/{rfProfileId}"
-
-        return self._session.get(metadata, resource)
+        return dispatch.call(self._session, "getNetworkWirelessRfProfile", networkId, rfProfileId)
 
     def getNetworkWirelessSettings(self, networkId: str):
         """
@@ -2092,14 +816,7 @@ class Wireless(object):
         - networkId (string): Network ID
         """
 
-        metadata = {
-            "tags": ["wireless", "configure", "settings"],
-            "operation": "getNetworkWirelessSettings",
-        }
-        networkId = urllib.parse.quote(str(networkId), safe="")
-        resource = f"/networks/{networkId}/wireless/settings"
-
-        return self._session.get(metadata, resource)
+        return dispatch.call(self._session, "getNetworkWirelessSettings", networkId)
 
     def updateNetworkWirelessSettings(self, networkId: str, **kwargs):
         """
@@ -2117,40 +834,7 @@ class Wireless(object):
         - namedVlans (object): Named VLAN settings for wireless networks.
         """
 
-        kwargs.update(locals())
-
-        if "upgradeStrategy" in kwargs:
-            options = ["minimizeClientDowntime", "minimizeUpgradeTime"]
-            assert kwargs["upgradeStrategy"] in options, (
-                f'''"upgradeStrategy" cannot be "{kwargs["upgradeStrategy"]}", & must be set to one of: {options}'''
-            )
-
-        metadata = {
-            "tags": ["wireless", "configure", "settings"],
-            "operation": "updateNetworkWirelessSettings",
-        }
-        networkId = urllib.parse.quote(str(networkId), safe="")
-        resource = f"/networks/{networkId}/wireless/settings"
-
-        body_params = [
-            "meshingEnabled",
-            "ipv6BridgeEnabled",
-            "locationAnalyticsEnabled",
-            "upgradeStrategy",
-            "upgrade",
-            "ledLightsOn",
-            "multicastToUnicastConversion",
-            "namedVlans",
-        ]
-        payload = {k.strip(): v for k, v in kwargs.items() if k.strip() in body_params}
-
-        if self._session._validate_kwargs:
-            all_params = [] + body_params
-            invalid = [k for k in kwargs if k.strip() not in all_params and k != "self"]
-            if invalid and self._session._logger:
-                self._session._logger.warning(f"updateNetworkWirelessSettings: ignoring unrecognized kwargs: {invalid}")
-
-        return self._session.put(metadata, resource, payload)
+        return dispatch.call(self._session, "updateNetworkWirelessSettings", networkId, **kwargs)
 
     def getNetworkWirelessSignalQualityHistory(self, networkId: str, **kwargs):
         """
@@ -2170,42 +854,7 @@ class Wireless(object):
         - ssid (integer): Filter results by SSID number.
         """
 
-        kwargs.update(locals())
-
-        if "band" in kwargs:
-            options = ["2.4", "5", "6"]
-            assert kwargs["band"] in options, f'''"band" cannot be "{kwargs["band"]}", & must be set to one of: {options}'''
-
-        metadata = {
-            "tags": ["wireless", "monitor", "signalQualityHistory"],
-            "operation": "getNetworkWirelessSignalQualityHistory",
-        }
-        networkId = urllib.parse.quote(str(networkId), safe="")
-        resource = f"/networks/{networkId}/wireless/signalQualityHistory"
-
-        query_params = [
-            "t0",
-            "t1",
-            "timespan",
-            "resolution",
-            "autoResolution",
-            "clientId",
-            "deviceSerial",
-            "apTag",
-            "band",
-            "ssid",
-        ]
-        params = {k.strip(): v for k, v in kwargs.items() if k.strip() in query_params}
-
-        if self._session._validate_kwargs:
-            all_params = query_params
-            invalid = [k for k in kwargs if k.strip() not in all_params and k != "self"]
-            if invalid and self._session._logger:
-                self._session._logger.warning(
-                    f"getNetworkWirelessSignalQualityHistory: ignoring unrecognized kwargs: {invalid}"
-                )
-
-        return self._session.get(metadata, resource, params)
+        return dispatch.call(self._session, "getNetworkWirelessSignalQualityHistory", networkId, **kwargs)
 
     def getNetworkWirelessSsids(self, networkId: str):
         """
@@ -2215,14 +864,7 @@ class Wireless(object):
         - networkId (string): Network ID
         """
 
-        metadata = {
-            "tags": ["wireless", "configure", "ssids"],
-            "operation": "getNetworkWirelessSsids",
-        }
-        networkId = urllib.parse.quote(str(networkId), safe="")
-        resource = f"/networks/{networkId}/wireless/ssids"
-
-        return self._session.get(metadata, resource)
+        return dispatch.call(self._session, "getNetworkWirelessSsids", networkId)
 
     def getNetworkWirelessSsid(self, networkId: str, number: str):
         """
@@ -2233,15 +875,7 @@ class Wireless(object):
         - number (string): Number
         """
 
-        metadata = {
-            "tags": ["wireless", "configure", "ssids"],
-            "operation": "getNetworkWirelessSsid",
-        }
-        networkId = urllib.parse.quote(str(networkId), safe="")
-        number = urllib.parse.quote(str(number), safe="")
-        resource = f"/networks/{networkId}/wireless/ssids/{number}"
-
-        return self._session.get(metadata, resource)
+        return dispatch.call(self._session, "getNetworkWirelessSsid", networkId, number)
 
     def updateNetworkWirelessSsid(self, networkId: str, number: str, **kwargs):
         """
@@ -2317,166 +951,7 @@ class Wireless(object):
         - radiusAccountingStartDelay (integer): The delay (in seconds) before sending the first RADIUS accounting start message. Must be between 0 and 60 seconds.
         """
 
-        kwargs.update(locals())
-
-        if "authMode" in kwargs:
-            options = [
-                "8021x-entra",
-                "8021x-google",
-                "8021x-localradius",
-                "8021x-meraki",
-                "8021x-nac",
-                "8021x-radius",
-                "ipsk-with-nac",
-                "ipsk-with-radius",
-                "ipsk-with-radius-easy-psk",
-                "ipsk-without-radius",
-                "open",
-                "open-enhanced",
-                "open-enhanced-with-radius",
-                "open-with-nac",
-                "open-with-radius",
-                "psk",
-            ]
-            assert kwargs["authMode"] in options, (
-                f'''"authMode" cannot be "{kwargs["authMode"]}", & must be set to one of: {options}'''
-            )
-        if "enterpriseAdminAccess" in kwargs:
-            options = ["access disabled", "access enabled"]
-            assert kwargs["enterpriseAdminAccess"] in options, (
-                f'''"enterpriseAdminAccess" cannot be "{kwargs["enterpriseAdminAccess"]}", & must be set to one of: {options}'''
-            )
-        if "encryptionMode" in kwargs:
-            options = ["open", "wep", "wpa", "wpa-eap"]
-            assert kwargs["encryptionMode"] in options, (
-                f'''"encryptionMode" cannot be "{kwargs["encryptionMode"]}", & must be set to one of: {options}'''
-            )
-        if "wpaEncryptionMode" in kwargs:
-            options = ["WPA1 and WPA2", "WPA1 only", "WPA2 only", "WPA3 192-bit Security", "WPA3 Transition Mode", "WPA3 only"]
-            assert kwargs["wpaEncryptionMode"] in options, (
-                f'''"wpaEncryptionMode" cannot be "{kwargs["wpaEncryptionMode"]}", & must be set to one of: {options}'''
-            )
-        if "splashPage" in kwargs:
-            options = [
-                "Billing",
-                "Cisco ISE",
-                "Click-through splash page",
-                "Facebook Wi-Fi",
-                "Google Apps domain",
-                "Google OAuth",
-                "Microsoft Entra ID",
-                "None",
-                "Password-protected with Active Directory",
-                "Password-protected with LDAP",
-                "Password-protected with Meraki RADIUS",
-                "Password-protected with custom RADIUS",
-                "SMS authentication",
-                "Sponsored guest",
-                "Systems Manager Sentry",
-            ]
-            assert kwargs["splashPage"] in options, (
-                f'''"splashPage" cannot be "{kwargs["splashPage"]}", & must be set to one of: {options}'''
-            )
-        if "radiusFailoverPolicy" in kwargs:
-            options = ["Allow access", "Deny access"]
-            assert kwargs["radiusFailoverPolicy"] in options, (
-                f'''"radiusFailoverPolicy" cannot be "{kwargs["radiusFailoverPolicy"]}", & must be set to one of: {options}'''
-            )
-        if "radiusLoadBalancingPolicy" in kwargs:
-            options = ["Round robin", "Strict priority order"]
-            assert kwargs["radiusLoadBalancingPolicy"] in options, (
-                f'''"radiusLoadBalancingPolicy" cannot be "{kwargs["radiusLoadBalancingPolicy"]}", & must be set to one of: {options}'''
-            )
-        if "radiusAttributeForGroupPolicies" in kwargs:
-            options = ["Airespace-ACL-Name", "Aruba-User-Role", "Filter-Id", "Reply-Message"]
-            assert kwargs["radiusAttributeForGroupPolicies"] in options, (
-                f'''"radiusAttributeForGroupPolicies" cannot be "{kwargs["radiusAttributeForGroupPolicies"]}", & must be set to one of: {options}'''
-            )
-
-        metadata = {
-            "tags": ["wireless", "configure", "ssids"],
-            "operation": "updateNetworkWirelessSsid",
-        }
-        networkId = urllib.parse.quote(str(networkId), safe="")
-        number = urllib.parse.quote(str(number), safe="")
-        resource = f"/networks/{networkId}/wireless/ssids/{number}"
-
-        body_params = [
-            "name",
-            "enabled",
-            "authMode",
-            "enterpriseAdminAccess",
-            "ssidAdminAccessible",
-            "encryptionMode",
-            "psk",
-            "wpaEncryptionMode",
-            "dot11w",
-            "dot11r",
-            "splashPage",
-            "splashGuestSponsorDomains",
-            "oauth",
-            "localRadius",
-            "ldap",
-            "activeDirectory",
-            "radiusServers",
-            "radiusProxyEnabled",
-            "radiusTestingEnabled",
-            "radiusCalledStationId",
-            "radiusAuthenticationNasId",
-            "radiusServerTimeout",
-            "radiusServerAttemptsLimit",
-            "radiusFallbackEnabled",
-            "radiusRadsec",
-            "radiusCoaEnabled",
-            "radiusFailoverPolicy",
-            "radiusLoadBalancingPolicy",
-            "radiusAccountingEnabled",
-            "radiusAccountingServers",
-            "radiusAccountingInterimInterval",
-            "radiusAttributeForGroupPolicies",
-            "ipAssignmentMode",
-            "useVlanTagging",
-            "concentratorNetworkId",
-            "secondaryConcentratorNetworkId",
-            "disassociateClientsOnVpnFailover",
-            "vlanId",
-            "defaultVlanId",
-            "apTagsAndVlanIds",
-            "walledGardenEnabled",
-            "walledGardenRanges",
-            "gre",
-            "radiusOverride",
-            "radiusGuestVlanEnabled",
-            "radiusGuestVlanId",
-            "minBitrate",
-            "bandSelection",
-            "perClientBandwidthLimitUp",
-            "perClientBandwidthLimitDown",
-            "perSsidBandwidthLimitUp",
-            "perSsidBandwidthLimitDown",
-            "lanIsolationEnabled",
-            "visible",
-            "availableOnAllAps",
-            "availabilityTags",
-            "adaptivePolicyGroupId",
-            "mandatoryDhcpEnabled",
-            "adultContentFilteringEnabled",
-            "dnsRewrite",
-            "speedBurst",
-            "namedVlans",
-            "security",
-            "localAuthFallback",
-            "radiusAccountingStartDelay",
-        ]
-        payload = {k.strip(): v for k, v in kwargs.items() if k.strip() in body_params}
-
-        if self._session._validate_kwargs:
-            all_params = [] + body_params
-            invalid = [k for k in kwargs if k.strip() not in all_params and k != "self"]
-            if invalid and self._session._logger:
-                self._session._logger.warning(f"updateNetworkWirelessSsid: ignoring unrecognized kwargs: {invalid}")
-
-        return self._session.put(metadata, resource, payload)
+        return dispatch.call(self._session, "updateNetworkWirelessSsid", networkId, number, **kwargs)
 
     def getNetworkWirelessSsidBonjourForwarding(self, networkId: str, number: str):
         """
@@ -2487,15 +962,7 @@ class Wireless(object):
         - number (string): Number
         """
 
-        metadata = {
-            "tags": ["wireless", "configure", "ssids", "bonjourForwarding"],
-            "operation": "getNetworkWirelessSsidBonjourForwarding",
-        }
-        networkId = urllib.parse.quote(str(networkId), safe="")
-        number = urllib.parse.quote(str(number), safe="")
-        resource = f"/networks/{networkId}/wireless/ssids/{number}/bonjourForwarding"
-
-        return self._session.get(metadata, resource)
+        return dispatch.call(self._session, "getNetworkWirelessSsidBonjourForwarding", networkId, number)
 
     def updateNetworkWirelessSsidBonjourForwarding(self, networkId: str, number: str, **kwargs):
         """
@@ -2509,32 +976,7 @@ class Wireless(object):
         - exception (object): Bonjour forwarding exception
         """
 
-        kwargs.update(locals())
-
-        metadata = {
-            "tags": ["wireless", "configure", "ssids", "bonjourForwarding"],
-            "operation": "updateNetworkWirelessSsidBonjourForwarding",
-        }
-        networkId = urllib.parse.quote(str(networkId), safe="")
-        number = urllib.parse.quote(str(number), safe="")
-        resource = f"/networks/{networkId}/wireless/ssids/{number}/bonjourForwarding"
-
-        body_params = [
-            "enabled",
-            "rules",
-            "exception",
-        ]
-        payload = {k.strip(): v for k, v in kwargs.items() if k.strip() in body_params}
-
-        if self._session._validate_kwargs:
-            all_params = [] + body_params
-            invalid = [k for k in kwargs if k.strip() not in all_params and k != "self"]
-            if invalid and self._session._logger:
-                self._session._logger.warning(
-                    f"updateNetworkWirelessSsidBonjourForwarding: ignoring unrecognized kwargs: {invalid}"
-                )
-
-        return self._session.put(metadata, resource, payload)
+        return dispatch.call(self._session, "updateNetworkWirelessSsidBonjourForwarding", networkId, number, **kwargs)
 
     def getNetworkWirelessSsidDeviceTypeGroupPolicies(self, networkId: str, number: str):
         """
@@ -2545,15 +987,7 @@ class Wireless(object):
         - number (string): Number
         """
 
-        metadata = {
-            "tags": ["wireless", "configure", "ssids", "deviceTypeGroupPolicies"],
-            "operation": "getNetworkWirelessSsidDeviceTypeGroupPolicies",
-        }
-        networkId = urllib.parse.quote(str(networkId), safe="")
-        number = urllib.parse.quote(str(number), safe="")
-        resource = f"/networks/{networkId}/wireless/ssids/{number}/deviceTypeGroupPolicies"
-
-        return self._session.get(metadata, resource)
+        return dispatch.call(self._session, "getNetworkWirelessSsidDeviceTypeGroupPolicies", networkId, number)
 
     def updateNetworkWirelessSsidDeviceTypeGroupPolicies(self, networkId: str, number: str, **kwargs):
         """
@@ -2566,31 +1000,7 @@ class Wireless(object):
         - deviceTypePolicies (array): List of device type policies.
         """
 
-        kwargs.update(locals())
-
-        metadata = {
-            "tags": ["wireless", "configure", "ssids", "deviceTypeGroupPolicies"],
-            "operation": "updateNetworkWirelessSsidDeviceTypeGroupPolicies",
-        }
-        networkId = urllib.parse.quote(str(networkId), safe="")
-        number = urllib.parse.quote(str(number), safe="")
-        resource = f"/networks/{networkId}/wireless/ssids/{number}/deviceTypeGroupPolicies"
-
-        body_params = [
-            "enabled",
-            "deviceTypePolicies",
-        ]
-        payload = {k.strip(): v for k, v in kwargs.items() if k.strip() in body_params}
-
-        if self._session._validate_kwargs:
-            all_params = [] + body_params
-            invalid = [k for k in kwargs if k.strip() not in all_params and k != "self"]
-            if invalid and self._session._logger:
-                self._session._logger.warning(
-                    f"updateNetworkWirelessSsidDeviceTypeGroupPolicies: ignoring unrecognized kwargs: {invalid}"
-                )
-
-        return self._session.put(metadata, resource, payload)
+        return dispatch.call(self._session, "updateNetworkWirelessSsidDeviceTypeGroupPolicies", networkId, number, **kwargs)
 
     def getNetworkWirelessSsidEapOverride(self, networkId: str, number: str):
         """
@@ -2601,15 +1011,7 @@ class Wireless(object):
         - number (string): Number
         """
 
-        metadata = {
-            "tags": ["wireless", "configure", "ssids", "eapOverride"],
-            "operation": "getNetworkWirelessSsidEapOverride",
-        }
-        networkId = urllib.parse.quote(str(networkId), safe="")
-        number = urllib.parse.quote(str(number), safe="")
-        resource = f"/networks/{networkId}/wireless/ssids/{number}/eapOverride"
-
-        return self._session.get(metadata, resource)
+        return dispatch.call(self._session, "getNetworkWirelessSsidEapOverride", networkId, number)
 
     def updateNetworkWirelessSsidEapOverride(self, networkId: str, number: str, **kwargs):
         """
@@ -2624,31 +1026,7 @@ class Wireless(object):
         - eapolKey (object): EAPOL Key settings.
         """
 
-        kwargs.update(locals())
-
-        metadata = {
-            "tags": ["wireless", "configure", "ssids", "eapOverride"],
-            "operation": "updateNetworkWirelessSsidEapOverride",
-        }
-        networkId = urllib.parse.quote(str(networkId), safe="")
-        number = urllib.parse.quote(str(number), safe="")
-        resource = f"/networks/{networkId}/wireless/ssids/{number}/eapOverride"
-
-        body_params = [
-            "timeout",
-            "identity",
-            "maxRetries",
-            "eapolKey",
-        ]
-        payload = {k.strip(): v for k, v in kwargs.items() if k.strip() in body_params}
-
-        if self._session._validate_kwargs:
-            all_params = [] + body_params
-            invalid = [k for k in kwargs if k.strip() not in all_params and k != "self"]
-            if invalid and self._session._logger:
-                self._session._logger.warning(f"updateNetworkWirelessSsidEapOverride: ignoring unrecognized kwargs: {invalid}")
-
-        return self._session.put(metadata, resource, payload)
+        return dispatch.call(self._session, "updateNetworkWirelessSsidEapOverride", networkId, number, **kwargs)
 
     def getNetworkWirelessSsidFirewallL3FirewallRules(self, networkId: str, number: str):
         """
@@ -2659,15 +1037,7 @@ class Wireless(object):
         - number (string): Number
         """
 
-        metadata = {
-            "tags": ["wireless", "configure", "ssids", "firewall", "l3FirewallRules"],
-            "operation": "getNetworkWirelessSsidFirewallL3FirewallRules",
-        }
-        networkId = urllib.parse.quote(str(networkId), safe="")
-        number = urllib.parse.quote(str(number), safe="")
-        resource = f"/networks/{networkId}/wireless/ssids/{number}/firewall/l3FirewallRules"
-
-        return self._session.get(metadata, resource)
+        return dispatch.call(self._session, "getNetworkWirelessSsidFirewallL3FirewallRules", networkId, number)
 
     def updateNetworkWirelessSsidFirewallL3FirewallRules(self, networkId: str, number: str, **kwargs):
         """
@@ -2680,31 +1050,7 @@ class Wireless(object):
         - allowLanAccess (boolean): Allow wireless client access to local LAN (boolean value - true allows access and false denies access) (optional)
         """
 
-        kwargs.update(locals())
-
-        metadata = {
-            "tags": ["wireless", "configure", "ssids", "firewall", "l3FirewallRules"],
-            "operation": "updateNetworkWirelessSsidFirewallL3FirewallRules",
-        }
-        networkId = urllib.parse.quote(str(networkId), safe="")
-        number = urllib.parse.quote(str(number), safe="")
-        resource = f"/networks/{networkId}/wireless/ssids/{number}/firewall/l3FirewallRules"
-
-        body_params = [
-            "rules",
-            "allowLanAccess",
-        ]
-        payload = {k.strip(): v for k, v in kwargs.items() if k.strip() in body_params}
-
-        if self._session._validate_kwargs:
-            all_params = [] + body_params
-            invalid = [k for k in kwargs if k.strip() not in all_params and k != "self"]
-            if invalid and self._session._logger:
-                self._session._logger.warning(
-                    f"updateNetworkWirelessSsidFirewallL3FirewallRules: ignoring unrecognized kwargs: {invalid}"
-                )
-
-        return self._session.put(metadata, resource, payload)
+        return dispatch.call(self._session, "updateNetworkWirelessSsidFirewallL3FirewallRules", networkId, number, **kwargs)
 
     def getNetworkWirelessSsidFirewallL7FirewallRules(self, networkId: str, number: str):
         """
@@ -2715,15 +1061,7 @@ class Wireless(object):
         - number (string): Number
         """
 
-        metadata = {
-            "tags": ["wireless", "configure", "ssids", "firewall", "l7FirewallRules"],
-            "operation": "getNetworkWirelessSsidFirewallL7FirewallRules",
-        }
-        networkId = urllib.parse.quote(str(networkId), safe="")
-        number = urllib.parse.quote(str(number), safe="")
-        resource = f"/networks/{networkId}/wireless/ssids/{number}/firewall/l7FirewallRules"
-
-        return self._session.get(metadata, resource)
+        return dispatch.call(self._session, "getNetworkWirelessSsidFirewallL7FirewallRules", networkId, number)
 
     def updateNetworkWirelessSsidFirewallL7FirewallRules(self, networkId: str, number: str, **kwargs):
         """
@@ -2735,30 +1073,7 @@ class Wireless(object):
         - rules (array): An array of L7 firewall rules for this SSID. Rules will get applied in the same order user has specified in request. Empty array will clear the L7 firewall rule configuration.
         """
 
-        kwargs.update(locals())
-
-        metadata = {
-            "tags": ["wireless", "configure", "ssids", "firewall", "l7FirewallRules"],
-            "operation": "updateNetworkWirelessSsidFirewallL7FirewallRules",
-        }
-        networkId = urllib.parse.quote(str(networkId), safe="")
-        number = urllib.parse.quote(str(number), safe="")
-        resource = f"/networks/{networkId}/wireless/ssids/{number}/firewall/l7FirewallRules"
-
-        body_params = [
-            "rules",
-        ]
-        payload = {k.strip(): v for k, v in kwargs.items() if k.strip() in body_params}
-
-        if self._session._validate_kwargs:
-            all_params = [] + body_params
-            invalid = [k for k in kwargs if k.strip() not in all_params and k != "self"]
-            if invalid and self._session._logger:
-                self._session._logger.warning(
-                    f"updateNetworkWirelessSsidFirewallL7FirewallRules: ignoring unrecognized kwargs: {invalid}"
-                )
-
-        return self._session.put(metadata, resource, payload)
+        return dispatch.call(self._session, "updateNetworkWirelessSsidFirewallL7FirewallRules", networkId, number, **kwargs)
 
     def getNetworkWirelessSsidHotspot20(self, networkId: str, number: str):
         """
@@ -2769,15 +1084,7 @@ class Wireless(object):
         - number (string): Number
         """
 
-        metadata = {
-            "tags": ["wireless", "configure", "ssids", "hotspot20"],
-            "operation": "getNetworkWirelessSsidHotspot20",
-        }
-        networkId = urllib.parse.quote(str(networkId), safe="")
-        number = urllib.parse.quote(str(number), safe="")
-        resource = f"/networks/{networkId}/wireless/ssids/{number}/hotspot20"
-
-        return self._session.get(metadata, resource)
+        return dispatch.call(self._session, "getNetworkWirelessSsidHotspot20", networkId, number)
 
     def updateNetworkWirelessSsidHotspot20(self, networkId: str, number: str, **kwargs):
         """
@@ -2796,50 +1103,7 @@ class Wireless(object):
         - naiRealms (array): An array of NAI realms
         """
 
-        kwargs.update(locals())
-
-        if "networkAccessType" in kwargs:
-            options = [
-                "Chargeable public network",
-                "Emergency services only network",
-                "Free public network",
-                "Personal device network",
-                "Private network",
-                "Private network with guest access",
-                "Test or experimental",
-                "Wildcard",
-            ]
-            assert kwargs["networkAccessType"] in options, (
-                f'''"networkAccessType" cannot be "{kwargs["networkAccessType"]}", & must be set to one of: {options}'''
-            )
-
-        metadata = {
-            "tags": ["wireless", "configure", "ssids", "hotspot20"],
-            "operation": "updateNetworkWirelessSsidHotspot20",
-        }
-        networkId = urllib.parse.quote(str(networkId), safe="")
-        number = urllib.parse.quote(str(number), safe="")
-        resource = f"/networks/{networkId}/wireless/ssids/{number}/hotspot20"
-
-        body_params = [
-            "enabled",
-            "operator",
-            "venue",
-            "networkAccessType",
-            "domains",
-            "roamConsortOis",
-            "mccMncs",
-            "naiRealms",
-        ]
-        payload = {k.strip(): v for k, v in kwargs.items() if k.strip() in body_params}
-
-        if self._session._validate_kwargs:
-            all_params = [] + body_params
-            invalid = [k for k in kwargs if k.strip() not in all_params and k != "self"]
-            if invalid and self._session._logger:
-                self._session._logger.warning(f"updateNetworkWirelessSsidHotspot20: ignoring unrecognized kwargs: {invalid}")
-
-        return self._session.put(metadata, resource, payload)
+        return dispatch.call(self._session, "updateNetworkWirelessSsidHotspot20", networkId, number, **kwargs)
 
     def getNetworkWirelessSsidIdentityPsks(self, networkId: str, number: str):
         """
@@ -2850,15 +1114,7 @@ class Wireless(object):
         - number (string): Number
         """
 
-        metadata = {
-            "tags": ["wireless", "configure", "ssids", "identityPsks"],
-            "operation": "getNetworkWirelessSsidIdentityPsks",
-        }
-        networkId = urllib.parse.quote(str(networkId), safe="")
-        number = urllib.parse.quote(str(number), safe="")
-        resource = f"/networks/{networkId}/wireless/ssids/{number}/identityPsks"
-
-        return self._session.get(metadata, resource)
+        return dispatch.call(self._session, "getNetworkWirelessSsidIdentityPsks", networkId, number)
 
     def createNetworkWirelessSsidIdentityPsk(self, networkId: str, number: str, name: str, groupPolicyId: str, **kwargs):
         """
@@ -2873,31 +1129,9 @@ class Wireless(object):
         - expiresAt (string): Timestamp for when the Identity PSK expires. Will not expire if left blank.
         """
 
-        kwargs.update(locals())
-
-        metadata = {
-            "tags": ["wireless", "configure", "ssids", "identityPsks"],
-            "operation": "createNetworkWirelessSsidIdentityPsk",
-        }
-        networkId = urllib.parse.quote(str(networkId), safe="")
-        number = urllib.parse.quote(str(number), safe="")
-        resource = f"/networks/{networkId}/wireless/ssids/{number}/identityPsks"
-
-        body_params = [
-            "name",
-            "passphrase",
-            "groupPolicyId",
-            "expiresAt",
-        ]
-        payload = {k.strip(): v for k, v in kwargs.items() if k.strip() in body_params}
-
-        if self._session._validate_kwargs:
-            all_params = [] + body_params
-            invalid = [k for k in kwargs if k.strip() not in all_params and k != "self"]
-            if invalid and self._session._logger:
-                self._session._logger.warning(f"createNetworkWirelessSsidIdentityPsk: ignoring unrecognized kwargs: {invalid}")
-
-        return self._session.post(metadata, resource, payload)
+        return dispatch.call(
+            self._session, "createNetworkWirelessSsidIdentityPsk", networkId, number, name, groupPolicyId, **kwargs
+        )
 
     def getNetworkWirelessSsidIdentityPsk(self, networkId: str, number: str, identityPskId: str):
         """
@@ -2909,16 +1143,7 @@ class Wireless(object):
         - identityPskId (string): Identity psk ID
         """
 
-        metadata = {
-            "tags": ["wireless", "configure", "ssids", "identityPsks"],
-            "operation": "getNetworkWirelessSsidIdentityPsk",
-        }
-        networkId = urllib.parse.quote(str(networkId), safe="")
-        number = urllib.parse.quote(str(number), safe="")
-        identityPskId = urllib.parse.quote(str(identityPskId), safe="")
-        resource = f"/networks/{networkId}/wireless/ssids/{number}/identityPsks/{identityPskId}"
-
-        return self._session.get(metadata, resource)
+        return dispatch.call(self._session, "getNetworkWirelessSsidIdentityPsk", networkId, number, identityPskId)
 
     def updateNetworkWirelessSsidIdentityPsk(self, networkId: str, number: str, identityPskId: str, **kwargs):
         """
@@ -2934,32 +1159,7 @@ class Wireless(object):
         - expiresAt (string): Timestamp for when the Identity PSK expires, or 'null' to never expire
         """
 
-        kwargs.update(locals())
-
-        metadata = {
-            "tags": ["wireless", "configure", "ssids", "identityPsks"],
-            "operation": "updateNetworkWirelessSsidIdentityPsk",
-        }
-        networkId = urllib.parse.quote(str(networkId), safe="")
-        number = urllib.parse.quote(str(number), safe="")
-        identityPskId = urllib.parse.quote(str(identityPskId), safe="")
-        resource = f"/networks/{networkId}/wireless/ssids/{number}/identityPsks/{identityPskId}"
-
-        body_params = [
-            "name",
-            "passphrase",
-            "groupPolicyId",
-            "expiresAt",
-        ]
-        payload = {k.strip(): v for k, v in kwargs.items() if k.strip() in body_params}
-
-        if self._session._validate_kwargs:
-            all_params = [] + body_params
-            invalid = [k for k in kwargs if k.strip() not in all_params and k != "self"]
-            if invalid and self._session._logger:
-                self._session._logger.warning(f"updateNetworkWirelessSsidIdentityPsk: ignoring unrecognized kwargs: {invalid}")
-
-        return self._session.put(metadata, resource, payload)
+        return dispatch.call(self._session, "updateNetworkWirelessSsidIdentityPsk", networkId, number, identityPskId, **kwargs)
 
     def deleteNetworkWirelessSsidIdentityPsk(self, networkId: str, number: str, identityPskId: str):
         """
@@ -2971,16 +1171,7 @@ class Wireless(object):
         - identityPskId (string): Identity psk ID
         """
 
-        metadata = {
-            "tags": ["wireless", "configure", "ssids", "identityPsks"],
-            "operation": "deleteNetworkWirelessSsidIdentityPsk",
-        }
-        networkId = urllib.parse.quote(str(networkId), safe="")
-        number = urllib.parse.quote(str(number), safe="")
-        identityPskId = urllib.parse.quote(str(identityPskId), safe="")
-        resource = f"/networks/{networkId}/wireless/ssids/{number}/identityPsks/{identityPskId}"
-
-        return self._session.delete(metadata, resource)
+        return dispatch.call(self._session, "deleteNetworkWirelessSsidIdentityPsk", networkId, number, identityPskId)
 
     def updateNetworkWirelessSsidOpenRoaming(self, networkId: str, number: str, **kwargs):
         """
@@ -2993,29 +1184,7 @@ class Wireless(object):
         - tenantId (string): The OpenRoaming DNA Spaces tenant ID.
         """
 
-        kwargs.update(locals())
-
-        metadata = {
-            "tags": ["wireless", "configure", "ssids", "openRoaming"],
-            "operation": "updateNetworkWirelessSsidOpenRoaming",
-        }
-        networkId = urllib.parse.quote(str(networkId), safe="")
-        number = urllib.parse.quote(str(number), safe="")
-        resource = f"/networks/{networkId}/wireless/ssids/{number}/openRoaming"
-
-        body_params = [
-            "enabled",
-            "tenantId",
-        ]
-        payload = {k.strip(): v for k, v in kwargs.items() if k.strip() in body_params}
-
-        if self._session._validate_kwargs:
-            all_params = [] + body_params
-            invalid = [k for k in kwargs if k.strip() not in all_params and k != "self"]
-            if invalid and self._session._logger:
-                self._session._logger.warning(f"updateNetworkWirelessSsidOpenRoaming: ignoring unrecognized kwargs: {invalid}")
-
-        return self._session.put(metadata, resource, payload)
+        return dispatch.call(self._session, "updateNetworkWirelessSsidOpenRoaming", networkId, number, **kwargs)
 
     def getNetworkWirelessSsidSchedules(self, networkId: str, number: str):
         """
@@ -3026,15 +1195,7 @@ class Wireless(object):
         - number (string): Number
         """
 
-        metadata = {
-            "tags": ["wireless", "configure", "ssids", "schedules"],
-            "operation": "getNetworkWirelessSsidSchedules",
-        }
-        networkId = urllib.parse.quote(str(networkId), safe="")
-        number = urllib.parse.quote(str(number), safe="")
-        resource = f"/networks/{networkId}/wireless/ssids/{number}/schedules"
-
-        return self._session.get(metadata, resource)
+        return dispatch.call(self._session, "getNetworkWirelessSsidSchedules", networkId, number)
 
     def updateNetworkWirelessSsidSchedules(self, networkId: str, number: str, **kwargs):
         """
@@ -3048,30 +1209,7 @@ class Wireless(object):
         - rangesInSeconds (array): List of outage ranges in seconds since Sunday at Midnight. Has a start and end. If this parameter is passed in along with the ranges parameter, ranges will take precedence.
         """
 
-        kwargs.update(locals())
-
-        metadata = {
-            "tags": ["wireless", "configure", "ssids", "schedules"],
-            "operation": "updateNetworkWirelessSsidSchedules",
-        }
-        networkId = urllib.parse.quote(str(networkId), safe="")
-        number = urllib.parse.quote(str(number), safe="")
-        resource = f"/networks/{networkId}/wireless/ssids/{number}/schedules"
-
-        body_params = [
-            "enabled",
-            "ranges",
-            "rangesInSeconds",
-        ]
-        payload = {k.strip(): v for k, v in kwargs.items() if k.strip() in body_params}
-
-        if self._session._validate_kwargs:
-            all_params = [] + body_params
-            invalid = [k for k in kwargs if k.strip() not in all_params and k != "self"]
-            if invalid and self._session._logger:
-                self._session._logger.warning(f"updateNetworkWirelessSsidSchedules: ignoring unrecognized kwargs: {invalid}")
-
-        return self._session.put(metadata, resource, payload)
+        return dispatch.call(self._session, "updateNetworkWirelessSsidSchedules", networkId, number, **kwargs)
 
     def getNetworkWirelessSsidSplashSettings(self, networkId: str, number: str):
         """
@@ -3082,15 +1220,7 @@ class Wireless(object):
         - number (string): Number
         """
 
-        metadata = {
-            "tags": ["wireless", "configure", "ssids", "splash", "settings"],
-            "operation": "getNetworkWirelessSsidSplashSettings",
-        }
-        networkId = urllib.parse.quote(str(networkId), safe="")
-        number = urllib.parse.quote(str(number), safe="")
-        resource = f"/networks/{networkId}/wireless/ssids/{number}/splash/settings"
-
-        return self._session.get(metadata, resource)
+        return dispatch.call(self._session, "getNetworkWirelessSsidSplashSettings", networkId, number)
 
     def updateNetworkWirelessSsidSplashSettings(self, networkId: str, number: str, **kwargs):
         """
@@ -3119,58 +1249,7 @@ class Wireless(object):
         - selfRegistration (object): Self-registration settings for splash with Meraki authentication.
         """
 
-        kwargs.update(locals())
-
-        if "splashTimeout" in kwargs:
-            options = [30, 60, 120, 240, 480, 720, 1080, 1440, 2880, 5760, 7200, 10080, 20160, 43200, 86400, 129600]
-            assert kwargs["splashTimeout"] in options, (
-                f'''"splashTimeout" cannot be "{kwargs["splashTimeout"]}", & must be set to one of: {options}'''
-            )
-        if "controllerDisconnectionBehavior" in kwargs:
-            options = ["default", "open", "restricted"]
-            assert kwargs["controllerDisconnectionBehavior"] in options, (
-                f'''"controllerDisconnectionBehavior" cannot be "{kwargs["controllerDisconnectionBehavior"]}", & must be set to one of: {options}'''
-            )
-
-        metadata = {
-            "tags": ["wireless", "configure", "ssids", "splash", "settings"],
-            "operation": "updateNetworkWirelessSsidSplashSettings",
-        }
-        networkId = urllib.parse.quote(str(networkId), safe="")
-        number = urllib.parse.quote(str(number), safe="")
-        resource = f"/networks/{networkId}/wireless/ssids/{number}/splash/settings"
-
-        body_params = [
-            "splashUrl",
-            "useSplashUrl",
-            "splashTimeout",
-            "redirectUrl",
-            "useRedirectUrl",
-            "welcomeMessage",
-            "userConsent",
-            "themeId",
-            "splashLogo",
-            "splashImage",
-            "splashPrepaidFront",
-            "blockAllTrafficBeforeSignOn",
-            "controllerDisconnectionBehavior",
-            "allowSimultaneousLogins",
-            "guestSponsorship",
-            "billing",
-            "sentryEnrollment",
-            "selfRegistration",
-        ]
-        payload = {k.strip(): v for k, v in kwargs.items() if k.strip() in body_params}
-
-        if self._session._validate_kwargs:
-            all_params = [] + body_params
-            invalid = [k for k in kwargs if k.strip() not in all_params and k != "self"]
-            if invalid and self._session._logger:
-                self._session._logger.warning(
-                    f"updateNetworkWirelessSsidSplashSettings: ignoring unrecognized kwargs: {invalid}"
-                )
-
-        return self._session.put(metadata, resource, payload)
+        return dispatch.call(self._session, "updateNetworkWirelessSsidSplashSettings", networkId, number, **kwargs)
 
     def updateNetworkWirelessSsidTrafficShapingRules(self, networkId: str, number: str, **kwargs):
         """
@@ -3187,32 +1266,7 @@ class Wireless(object):
 
         """
 
-        kwargs.update(locals())
-
-        metadata = {
-            "tags": ["wireless", "configure", "ssids", "trafficShaping", "rules"],
-            "operation": "updateNetworkWirelessSsidTrafficShapingRules",
-        }
-        networkId = urllib.parse.quote(str(networkId), safe="")
-        number = urllib.parse.quote(str(number), safe="")
-        resource = f"/networks/{networkId}/wireless/ssids/{number}/trafficShaping/rules"
-
-        body_params = [
-            "trafficShapingEnabled",
-            "defaultRulesEnabled",
-            "rules",
-        ]
-        payload = {k.strip(): v for k, v in kwargs.items() if k.strip() in body_params}
-
-        if self._session._validate_kwargs:
-            all_params = [] + body_params
-            invalid = [k for k in kwargs if k.strip() not in all_params and k != "self"]
-            if invalid and self._session._logger:
-                self._session._logger.warning(
-                    f"updateNetworkWirelessSsidTrafficShapingRules: ignoring unrecognized kwargs: {invalid}"
-                )
-
-        return self._session.put(metadata, resource, payload)
+        return dispatch.call(self._session, "updateNetworkWirelessSsidTrafficShapingRules", networkId, number, **kwargs)
 
     def getNetworkWirelessSsidTrafficShapingRules(self, networkId: str, number: str):
         """
@@ -3223,15 +1277,7 @@ class Wireless(object):
         - number (string): Number
         """
 
-        metadata = {
-            "tags": ["wireless", "configure", "ssids", "trafficShaping", "rules"],
-            "operation": "getNetworkWirelessSsidTrafficShapingRules",
-        }
-        networkId = urllib.parse.quote(str(networkId), safe="")
-        number = urllib.parse.quote(str(number), safe="")
-        resource = f"/networks/{networkId}/wireless/ssids/{number}/trafficShaping/rules"
-
-        return self._session.get(metadata, resource)
+        return dispatch.call(self._session, "getNetworkWirelessSsidTrafficShapingRules", networkId, number)
 
     def getNetworkWirelessSsidVpn(self, networkId: str, number: str):
         """
@@ -3242,15 +1288,7 @@ class Wireless(object):
         - number (string): Number
         """
 
-        metadata = {
-            "tags": ["wireless", "configure", "ssids", "vpn"],
-            "operation": "getNetworkWirelessSsidVpn",
-        }
-        networkId = urllib.parse.quote(str(networkId), safe="")
-        number = urllib.parse.quote(str(number), safe="")
-        resource = f"/networks/{networkId}/wireless/ssids/{number}/vpn"
-
-        return self._session.get(metadata, resource)
+        return dispatch.call(self._session, "getNetworkWirelessSsidVpn", networkId, number)
 
     def updateNetworkWirelessSsidVpn(self, networkId: str, number: str, **kwargs):
         """
@@ -3264,30 +1302,7 @@ class Wireless(object):
         - failover (object): Secondary VPN concentrator settings. This is only used when two VPN concentrators are configured on the SSID.
         """
 
-        kwargs.update(locals())
-
-        metadata = {
-            "tags": ["wireless", "configure", "ssids", "vpn"],
-            "operation": "updateNetworkWirelessSsidVpn",
-        }
-        networkId = urllib.parse.quote(str(networkId), safe="")
-        number = urllib.parse.quote(str(number), safe="")
-        resource = f"/networks/{networkId}/wireless/ssids/{number}/vpn"
-
-        body_params = [
-            "concentrator",
-            "splitTunnel",
-            "failover",
-        ]
-        payload = {k.strip(): v for k, v in kwargs.items() if k.strip() in body_params}
-
-        if self._session._validate_kwargs:
-            all_params = [] + body_params
-            invalid = [k for k in kwargs if k.strip() not in all_params and k != "self"]
-            if invalid and self._session._logger:
-                self._session._logger.warning(f"updateNetworkWirelessSsidVpn: ignoring unrecognized kwargs: {invalid}")
-
-        return self._session.put(metadata, resource, payload)
+        return dispatch.call(self._session, "updateNetworkWirelessSsidVpn", networkId, number, **kwargs)
 
     def getNetworkWirelessUsageHistory(self, networkId: str, **kwargs):
         """
@@ -3307,40 +1322,7 @@ class Wireless(object):
         - ssid (integer): Filter results by SSID number.
         """
 
-        kwargs.update(locals())
-
-        if "band" in kwargs:
-            options = ["2.4", "5", "6"]
-            assert kwargs["band"] in options, f'''"band" cannot be "{kwargs["band"]}", & must be set to one of: {options}'''
-
-        metadata = {
-            "tags": ["wireless", "monitor", "usageHistory"],
-            "operation": "getNetworkWirelessUsageHistory",
-        }
-        networkId = urllib.parse.quote(str(networkId), safe="")
-        resource = f"/networks/{networkId}/wireless/usageHistory"
-
-        query_params = [
-            "t0",
-            "t1",
-            "timespan",
-            "resolution",
-            "autoResolution",
-            "clientId",
-            "deviceSerial",
-            "apTag",
-            "band",
-            "ssid",
-        ]
-        params = {k.strip(): v for k, v in kwargs.items() if k.strip() in query_params}
-
-        if self._session._validate_kwargs:
-            all_params = query_params
-            invalid = [k for k in kwargs if k.strip() not in all_params and k != "self"]
-            if invalid and self._session._logger:
-                self._session._logger.warning(f"getNetworkWirelessUsageHistory: ignoring unrecognized kwargs: {invalid}")
-
-        return self._session.get(metadata, resource, params)
+        return dispatch.call(self._session, "getNetworkWirelessUsageHistory", networkId, **kwargs)
 
     def updateNetworkWirelessZigbee(self, networkId: str, **kwargs):
         """
@@ -3354,30 +1336,7 @@ class Wireless(object):
         - defaults (object): Default Settings for Zigbee Devices
         """
 
-        kwargs.update(locals())
-
-        metadata = {
-            "tags": ["wireless", "configure", "zigbee"],
-            "operation": "updateNetworkWirelessZigbee",
-        }
-        networkId = urllib.parse.quote(str(networkId), safe="")
-        resource = f"/networks/{networkId}/wireless/zigbee"
-
-        body_params = [
-            "enabled",
-            "iotController",
-            "lockManagement",
-            "defaults",
-        ]
-        payload = {k.strip(): v for k, v in kwargs.items() if k.strip() in body_params}
-
-        if self._session._validate_kwargs:
-            all_params = [] + body_params
-            invalid = [k for k in kwargs if k.strip() not in all_params and k != "self"]
-            if invalid and self._session._logger:
-                self._session._logger.warning(f"updateNetworkWirelessZigbee: ignoring unrecognized kwargs: {invalid}")
-
-        return self._session.put(metadata, resource, payload)
+        return dispatch.call(self._session, "updateNetworkWirelessZigbee", networkId, **kwargs)
 
     def getOrganizationWirelessAirMarshalRules(self, organizationId: str, total_pages=1, direction="next", **kwargs):
         """
@@ -3393,40 +1352,14 @@ class Wireless(object):
         - endingBefore (string): A token used by the server to indicate the end of the page. Often this is a timestamp or an ID but it is not limited to those. This parameter should not be defined by client applications. The link for the first, last, prev, or next page in the HTTP Link header should define it.
         """
 
-        kwargs.update(locals())
-
-        metadata = {
-            "tags": ["wireless", "configure", "airMarshal", "rules"],
-            "operation": "getOrganizationWirelessAirMarshalRules",
-        }
-        organizationId = urllib.parse.quote(str(organizationId), safe="")
-        resource = f"/organizations/{organizationId}/wireless/airMarshal/rules"
-
-        query_params = [
-            "networkIds",
-            "perPage",
-            "startingAfter",
-            "endingBefore",
-        ]
-        params = {k.strip(): v for k, v in kwargs.items() if k.strip() in query_params}
-
-        array_params = [
-            "networkIds",
-        ]
-        for k, v in kwargs.items():
-            if k.strip() in array_params:
-                params[f"{k.strip()}[]"] = kwargs[f"{k}"]
-                params.pop(k.strip())
-
-        if self._session._validate_kwargs:
-            all_params = query_params + array_params
-            invalid = [k for k in kwargs if k.strip() not in all_params and k != "self"]
-            if invalid and self._session._logger:
-                self._session._logger.warning(
-                    f"getOrganizationWirelessAirMarshalRules: ignoring unrecognized kwargs: {invalid}"
-                )
-
-        return self._session.get_pages(metadata, resource, params, total_pages, direction)
+        return dispatch.call(
+            self._session,
+            "getOrganizationWirelessAirMarshalRules",
+            organizationId,
+            total_pages=total_pages,
+            direction=direction,
+            **kwargs,
+        )
 
     def getOrganizationWirelessAirMarshalSettingsByNetwork(
         self, organizationId: str, total_pages=1, direction="next", **kwargs
@@ -3444,40 +1377,14 @@ class Wireless(object):
         - endingBefore (string): A token used by the server to indicate the end of the page. Often this is a timestamp or an ID but it is not limited to those. This parameter should not be defined by client applications. The link for the first, last, prev, or next page in the HTTP Link header should define it.
         """
 
-        kwargs.update(locals())
-
-        metadata = {
-            "tags": ["wireless", "configure", "airMarshal", "settings", "byNetwork"],
-            "operation": "getOrganizationWirelessAirMarshalSettingsByNetwork",
-        }
-        organizationId = urllib.parse.quote(str(organizationId), safe="")
-        resource = f"/organizations/{organizationId}/wireless/airMarshal/settings/byNetwork"
-
-        query_params = [
-            "networkIds",
-            "perPage",
-            "startingAfter",
-            "endingBefore",
-        ]
-        params = {k.strip(): v for k, v in kwargs.items() if k.strip() in query_params}
-
-        array_params = [
-            "networkIds",
-        ]
-        for k, v in kwargs.items():
-            if k.strip() in array_params:
-                params[f"{k.strip()}[]"] = kwargs[f"{k}"]
-                params.pop(k.strip())
-
-        if self._session._validate_kwargs:
-            all_params = query_params + array_params
-            invalid = [k for k in kwargs if k.strip() not in all_params and k != "self"]
-            if invalid and self._session._logger:
-                self._session._logger.warning(
-                    f"getOrganizationWirelessAirMarshalSettingsByNetwork: ignoring unrecognized kwargs: {invalid}"
-                )
-
-        return self._session.get_pages(metadata, resource, params, total_pages, direction)
+        return dispatch.call(
+            self._session,
+            "getOrganizationWirelessAirMarshalSettingsByNetwork",
+            organizationId,
+            total_pages=total_pages,
+            direction=direction,
+            **kwargs,
+        )
 
     def getOrganizationWirelessClientsOverviewByDevice(self, organizationId: str, total_pages=1, direction="next", **kwargs):
         """
@@ -3495,44 +1402,14 @@ class Wireless(object):
         - endingBefore (string): A token used by the server to indicate the end of the page. Often this is a timestamp or an ID but it is not limited to those. This parameter should not be defined by client applications. The link for the first, last, prev, or next page in the HTTP Link header should define it.
         """
 
-        kwargs.update(locals())
-
-        metadata = {
-            "tags": ["wireless", "monitor", "clients", "overview", "byDevice"],
-            "operation": "getOrganizationWirelessClientsOverviewByDevice",
-        }
-        organizationId = urllib.parse.quote(str(organizationId), safe="")
-        resource = f"/organizations/{organizationId}/wireless/clients/overview/byDevice"
-
-        query_params = [
-            "networkIds",
-            "serials",
-            "campusGatewayClusterIds",
-            "perPage",
-            "startingAfter",
-            "endingBefore",
-        ]
-        params = {k.strip(): v for k, v in kwargs.items() if k.strip() in query_params}
-
-        array_params = [
-            "networkIds",
-            "serials",
-            "campusGatewayClusterIds",
-        ]
-        for k, v in kwargs.items():
-            if k.strip() in array_params:
-                params[f"{k.strip()}[]"] = kwargs[f"{k}"]
-                params.pop(k.strip())
-
-        if self._session._validate_kwargs:
-            all_params = query_params + array_params
-            invalid = [k for k in kwargs if k.strip() not in all_params and k != "self"]
-            if invalid and self._session._logger:
-                self._session._logger.warning(
-                    f"getOrganizationWirelessClientsOverviewByDevice: ignoring unrecognized kwargs: {invalid}"
-                )
-
-        return self._session.get_pages(metadata, resource, params, total_pages, direction)
+        return dispatch.call(
+            self._session,
+            "getOrganizationWirelessClientsOverviewByDevice",
+            organizationId,
+            total_pages=total_pages,
+            direction=direction,
+            **kwargs,
+        )
 
     def getOrganizationWirelessDevicesChannelUtilizationByDevice(
         self, organizationId: str, total_pages=1, direction="next", **kwargs
@@ -3555,46 +1432,14 @@ class Wireless(object):
         - interval (integer): The time interval in seconds for returned data. The valid intervals are: 300, 600, 3600, 7200, 14400, 21600. The default is 3600.
         """
 
-        kwargs.update(locals())
-
-        metadata = {
-            "tags": ["wireless", "monitor", "devices", "channelUtilization", "byDevice"],
-            "operation": "getOrganizationWirelessDevicesChannelUtilizationByDevice",
-        }
-        organizationId = urllib.parse.quote(str(organizationId), safe="")
-        resource = f"/organizations/{organizationId}/wireless/devices/channelUtilization/byDevice"
-
-        query_params = [
-            "networkIds",
-            "serials",
-            "perPage",
-            "startingAfter",
-            "endingBefore",
-            "t0",
-            "t1",
-            "timespan",
-            "interval",
-        ]
-        params = {k.strip(): v for k, v in kwargs.items() if k.strip() in query_params}
-
-        array_params = [
-            "networkIds",
-            "serials",
-        ]
-        for k, v in kwargs.items():
-            if k.strip() in array_params:
-                params[f"{k.strip()}[]"] = kwargs[f"{k}"]
-                params.pop(k.strip())
-
-        if self._session._validate_kwargs:
-            all_params = query_params + array_params
-            invalid = [k for k in kwargs if k.strip() not in all_params and k != "self"]
-            if invalid and self._session._logger:
-                self._session._logger.warning(
-                    f"getOrganizationWirelessDevicesChannelUtilizationByDevice: ignoring unrecognized kwargs: {invalid}"
-                )
-
-        return self._session.get_pages(metadata, resource, params, total_pages, direction)
+        return dispatch.call(
+            self._session,
+            "getOrganizationWirelessDevicesChannelUtilizationByDevice",
+            organizationId,
+            total_pages=total_pages,
+            direction=direction,
+            **kwargs,
+        )
 
     def getOrganizationWirelessDevicesChannelUtilizationByNetwork(
         self, organizationId: str, total_pages=1, direction="next", **kwargs
@@ -3617,46 +1462,14 @@ class Wireless(object):
         - interval (integer): The time interval in seconds for returned data. The valid intervals are: 300, 600, 3600, 7200, 14400, 21600. The default is 3600.
         """
 
-        kwargs.update(locals())
-
-        metadata = {
-            "tags": ["wireless", "monitor", "devices", "channelUtilization", "byNetwork"],
-            "operation": "getOrganizationWirelessDevicesChannelUtilizationByNetwork",
-        }
-        organizationId = urllib.parse.quote(str(organizationId), safe="")
-        resource = f"/organizations/{organizationId}/wireless/devices/channelUtilization/byNetwork"
-
-        query_params = [
-            "networkIds",
-            "serials",
-            "perPage",
-            "startingAfter",
-            "endingBefore",
-            "t0",
-            "t1",
-            "timespan",
-            "interval",
-        ]
-        params = {k.strip(): v for k, v in kwargs.items() if k.strip() in query_params}
-
-        array_params = [
-            "networkIds",
-            "serials",
-        ]
-        for k, v in kwargs.items():
-            if k.strip() in array_params:
-                params[f"{k.strip()}[]"] = kwargs[f"{k}"]
-                params.pop(k.strip())
-
-        if self._session._validate_kwargs:
-            all_params = query_params + array_params
-            invalid = [k for k in kwargs if k.strip() not in all_params and k != "self"]
-            if invalid and self._session._logger:
-                self._session._logger.warning(
-                    f"getOrganizationWirelessDevicesChannelUtilizationByNetwork: ignoring unrecognized kwargs: {invalid}"
-                )
-
-        return self._session.get_pages(metadata, resource, params, total_pages, direction)
+        return dispatch.call(
+            self._session,
+            "getOrganizationWirelessDevicesChannelUtilizationByNetwork",
+            organizationId,
+            total_pages=total_pages,
+            direction=direction,
+            **kwargs,
+        )
 
     def getOrganizationWirelessDevicesChannelUtilizationHistoryByDeviceByInterval(
         self, organizationId: str, total_pages=1, direction="next", **kwargs
@@ -3679,46 +1492,14 @@ class Wireless(object):
         - interval (integer): The time interval in seconds for returned data. The valid intervals are: 300, 600, 3600, 7200, 14400, 21600. The default is 3600.
         """
 
-        kwargs.update(locals())
-
-        metadata = {
-            "tags": ["wireless", "monitor", "devices", "channelUtilization", "history", "byDevice", "byInterval"],
-            "operation": "getOrganizationWirelessDevicesChannelUtilizationHistoryByDeviceByInterval",
-        }
-        organizationId = urllib.parse.quote(str(organizationId), safe="")
-        resource = f"/organizations/{organizationId}/wireless/devices/channelUtilization/history/byDevice/byInterval"
-
-        query_params = [
-            "networkIds",
-            "serials",
-            "perPage",
-            "startingAfter",
-            "endingBefore",
-            "t0",
-            "t1",
-            "timespan",
-            "interval",
-        ]
-        params = {k.strip(): v for k, v in kwargs.items() if k.strip() in query_params}
-
-        array_params = [
-            "networkIds",
-            "serials",
-        ]
-        for k, v in kwargs.items():
-            if k.strip() in array_params:
-                params[f"{k.strip()}[]"] = kwargs[f"{k}"]
-                params.pop(k.strip())
-
-        if self._session._validate_kwargs:
-            all_params = query_params + array_params
-            invalid = [k for k in kwargs if k.strip() not in all_params and k != "self"]
-            if invalid and self._session._logger:
-                self._session._logger.warning(
-                    f"getOrganizationWirelessDevicesChannelUtilizationHistoryByDeviceByInterval: ignoring unrecognized kwargs: {invalid}"
-                )
-
-        return self._session.get_pages(metadata, resource, params, total_pages, direction)
+        return dispatch.call(
+            self._session,
+            "getOrganizationWirelessDevicesChannelUtilizationHistoryByDeviceByInterval",
+            organizationId,
+            total_pages=total_pages,
+            direction=direction,
+            **kwargs,
+        )
 
     def getOrganizationWirelessDevicesChannelUtilizationHistoryByNetworkByInterval(
         self, organizationId: str, total_pages=1, direction="next", **kwargs
@@ -3741,46 +1522,14 @@ class Wireless(object):
         - interval (integer): The time interval in seconds for returned data. The valid intervals are: 300, 600, 3600, 7200, 14400, 21600. The default is 3600.
         """
 
-        kwargs.update(locals())
-
-        metadata = {
-            "tags": ["wireless", "monitor", "devices", "channelUtilization", "history", "byNetwork", "byInterval"],
-            "operation": "getOrganizationWirelessDevicesChannelUtilizationHistoryByNetworkByInterval",
-        }
-        organizationId = urllib.parse.quote(str(organizationId), safe="")
-        resource = f"/organizations/{organizationId}/wireless/devices/channelUtilization/history/byNetwork/byInterval"
-
-        query_params = [
-            "networkIds",
-            "serials",
-            "perPage",
-            "startingAfter",
-            "endingBefore",
-            "t0",
-            "t1",
-            "timespan",
-            "interval",
-        ]
-        params = {k.strip(): v for k, v in kwargs.items() if k.strip() in query_params}
-
-        array_params = [
-            "networkIds",
-            "serials",
-        ]
-        for k, v in kwargs.items():
-            if k.strip() in array_params:
-                params[f"{k.strip()}[]"] = kwargs[f"{k}"]
-                params.pop(k.strip())
-
-        if self._session._validate_kwargs:
-            all_params = query_params + array_params
-            invalid = [k for k in kwargs if k.strip() not in all_params and k != "self"]
-            if invalid and self._session._logger:
-                self._session._logger.warning(
-                    f"getOrganizationWirelessDevicesChannelUtilizationHistoryByNetworkByInterval: ignoring unrecognized kwargs: {invalid}"
-                )
-
-        return self._session.get_pages(metadata, resource, params, total_pages, direction)
+        return dispatch.call(
+            self._session,
+            "getOrganizationWirelessDevicesChannelUtilizationHistoryByNetworkByInterval",
+            organizationId,
+            total_pages=total_pages,
+            direction=direction,
+            **kwargs,
+        )
 
     def getOrganizationWirelessDevicesEthernetStatuses(self, organizationId: str, total_pages=1, direction="next", **kwargs):
         """
@@ -3796,40 +1545,14 @@ class Wireless(object):
         - networkIds (array): A list of Meraki network IDs to filter results to contain only specified networks. E.g.: networkIds[]=N_12345678&networkIds[]=L_3456
         """
 
-        kwargs.update(locals())
-
-        metadata = {
-            "tags": ["wireless", "monitor", "devices", "ethernet", "statuses"],
-            "operation": "getOrganizationWirelessDevicesEthernetStatuses",
-        }
-        organizationId = urllib.parse.quote(str(organizationId), safe="")
-        resource = f"/organizations/{organizationId}/wireless/devices/ethernet/statuses"
-
-        query_params = [
-            "perPage",
-            "startingAfter",
-            "endingBefore",
-            "networkIds",
-        ]
-        params = {k.strip(): v for k, v in kwargs.items() if k.strip() in query_params}
-
-        array_params = [
-            "networkIds",
-        ]
-        for k, v in kwargs.items():
-            if k.strip() in array_params:
-                params[f"{k.strip()}[]"] = kwargs[f"{k}"]
-                params.pop(k.strip())
-
-        if self._session._validate_kwargs:
-            all_params = query_params + array_params
-            invalid = [k for k in kwargs if k.strip() not in all_params and k != "self"]
-            if invalid and self._session._logger:
-                self._session._logger.warning(
-                    f"getOrganizationWirelessDevicesEthernetStatuses: ignoring unrecognized kwargs: {invalid}"
-                )
-
-        return self._session.get_pages(metadata, resource, params, total_pages, direction)
+        return dispatch.call(
+            self._session,
+            "getOrganizationWirelessDevicesEthernetStatuses",
+            organizationId,
+            total_pages=total_pages,
+            direction=direction,
+            **kwargs,
+        )
 
     def getOrganizationWirelessDevicesPacketLossByClient(self, organizationId: str, total_pages=1, direction="next", **kwargs):
         """
@@ -3851,49 +1574,14 @@ class Wireless(object):
         - timespan (number): The timespan for which the information will be fetched. If specifying timespan, do not specify parameters t0 and t1. The value must be in seconds and be greater than or equal to 5 minutes and be less than or equal to 90 days. The default is 7 days.
         """
 
-        kwargs.update(locals())
-
-        metadata = {
-            "tags": ["wireless", "monitor", "devices", "packetLoss", "byClient"],
-            "operation": "getOrganizationWirelessDevicesPacketLossByClient",
-        }
-        organizationId = urllib.parse.quote(str(organizationId), safe="")
-        resource = f"/organizations/{organizationId}/wireless/devices/packetLoss/byClient"
-
-        query_params = [
-            "networkIds",
-            "ssids",
-            "bands",
-            "macs",
-            "perPage",
-            "startingAfter",
-            "endingBefore",
-            "t0",
-            "t1",
-            "timespan",
-        ]
-        params = {k.strip(): v for k, v in kwargs.items() if k.strip() in query_params}
-
-        array_params = [
-            "networkIds",
-            "ssids",
-            "bands",
-            "macs",
-        ]
-        for k, v in kwargs.items():
-            if k.strip() in array_params:
-                params[f"{k.strip()}[]"] = kwargs[f"{k}"]
-                params.pop(k.strip())
-
-        if self._session._validate_kwargs:
-            all_params = query_params + array_params
-            invalid = [k for k in kwargs if k.strip() not in all_params and k != "self"]
-            if invalid and self._session._logger:
-                self._session._logger.warning(
-                    f"getOrganizationWirelessDevicesPacketLossByClient: ignoring unrecognized kwargs: {invalid}"
-                )
-
-        return self._session.get_pages(metadata, resource, params, total_pages, direction)
+        return dispatch.call(
+            self._session,
+            "getOrganizationWirelessDevicesPacketLossByClient",
+            organizationId,
+            total_pages=total_pages,
+            direction=direction,
+            **kwargs,
+        )
 
     def getOrganizationWirelessDevicesPacketLossByDevice(self, organizationId: str, total_pages=1, direction="next", **kwargs):
         """
@@ -3915,49 +1603,14 @@ class Wireless(object):
         - timespan (number): The timespan for which the information will be fetched. If specifying timespan, do not specify parameters t0 and t1. The value must be in seconds and be greater than or equal to 5 minutes and be less than or equal to 90 days. The default is 7 days.
         """
 
-        kwargs.update(locals())
-
-        metadata = {
-            "tags": ["wireless", "monitor", "devices", "packetLoss", "byDevice"],
-            "operation": "getOrganizationWirelessDevicesPacketLossByDevice",
-        }
-        organizationId = urllib.parse.quote(str(organizationId), safe="")
-        resource = f"/organizations/{organizationId}/wireless/devices/packetLoss/byDevice"
-
-        query_params = [
-            "networkIds",
-            "serials",
-            "ssids",
-            "bands",
-            "perPage",
-            "startingAfter",
-            "endingBefore",
-            "t0",
-            "t1",
-            "timespan",
-        ]
-        params = {k.strip(): v for k, v in kwargs.items() if k.strip() in query_params}
-
-        array_params = [
-            "networkIds",
-            "serials",
-            "ssids",
-            "bands",
-        ]
-        for k, v in kwargs.items():
-            if k.strip() in array_params:
-                params[f"{k.strip()}[]"] = kwargs[f"{k}"]
-                params.pop(k.strip())
-
-        if self._session._validate_kwargs:
-            all_params = query_params + array_params
-            invalid = [k for k in kwargs if k.strip() not in all_params and k != "self"]
-            if invalid and self._session._logger:
-                self._session._logger.warning(
-                    f"getOrganizationWirelessDevicesPacketLossByDevice: ignoring unrecognized kwargs: {invalid}"
-                )
-
-        return self._session.get_pages(metadata, resource, params, total_pages, direction)
+        return dispatch.call(
+            self._session,
+            "getOrganizationWirelessDevicesPacketLossByDevice",
+            organizationId,
+            total_pages=total_pages,
+            direction=direction,
+            **kwargs,
+        )
 
     def getOrganizationWirelessDevicesPacketLossByNetwork(
         self, organizationId: str, total_pages=1, direction="next", **kwargs
@@ -3981,49 +1634,14 @@ class Wireless(object):
         - timespan (number): The timespan for which the information will be fetched. If specifying timespan, do not specify parameters t0 and t1. The value must be in seconds and be greater than or equal to 5 minutes and be less than or equal to 90 days. The default is 7 days.
         """
 
-        kwargs.update(locals())
-
-        metadata = {
-            "tags": ["wireless", "monitor", "devices", "packetLoss", "byNetwork"],
-            "operation": "getOrganizationWirelessDevicesPacketLossByNetwork",
-        }
-        organizationId = urllib.parse.quote(str(organizationId), safe="")
-        resource = f"/organizations/{organizationId}/wireless/devices/packetLoss/byNetwork"
-
-        query_params = [
-            "networkIds",
-            "serials",
-            "ssids",
-            "bands",
-            "perPage",
-            "startingAfter",
-            "endingBefore",
-            "t0",
-            "t1",
-            "timespan",
-        ]
-        params = {k.strip(): v for k, v in kwargs.items() if k.strip() in query_params}
-
-        array_params = [
-            "networkIds",
-            "serials",
-            "ssids",
-            "bands",
-        ]
-        for k, v in kwargs.items():
-            if k.strip() in array_params:
-                params[f"{k.strip()}[]"] = kwargs[f"{k}"]
-                params.pop(k.strip())
-
-        if self._session._validate_kwargs:
-            all_params = query_params + array_params
-            invalid = [k for k in kwargs if k.strip() not in all_params and k != "self"]
-            if invalid and self._session._logger:
-                self._session._logger.warning(
-                    f"getOrganizationWirelessDevicesPacketLossByNetwork: ignoring unrecognized kwargs: {invalid}"
-                )
-
-        return self._session.get_pages(metadata, resource, params, total_pages, direction)
+        return dispatch.call(
+            self._session,
+            "getOrganizationWirelessDevicesPacketLossByNetwork",
+            organizationId,
+            total_pages=total_pages,
+            direction=direction,
+            **kwargs,
+        )
 
     def getOrganizationWirelessDevicesPowerModeHistory(self, organizationId: str, total_pages=1, direction="next", **kwargs):
         """
@@ -4043,45 +1661,14 @@ class Wireless(object):
         - serials (array): Optional parameter to filter device availabilities history by device serial numbers
         """
 
-        kwargs.update(locals())
-
-        metadata = {
-            "tags": ["wireless", "monitor", "devices", "power", "mode", "history"],
-            "operation": "getOrganizationWirelessDevicesPowerModeHistory",
-        }
-        organizationId = urllib.parse.quote(str(organizationId), safe="")
-        resource = f"/organizations/{organizationId}/wireless/devices/power/mode/history"
-
-        query_params = [
-            "t0",
-            "t1",
-            "timespan",
-            "perPage",
-            "startingAfter",
-            "endingBefore",
-            "networkIds",
-            "serials",
-        ]
-        params = {k.strip(): v for k, v in kwargs.items() if k.strip() in query_params}
-
-        array_params = [
-            "networkIds",
-            "serials",
-        ]
-        for k, v in kwargs.items():
-            if k.strip() in array_params:
-                params[f"{k.strip()}[]"] = kwargs[f"{k}"]
-                params.pop(k.strip())
-
-        if self._session._validate_kwargs:
-            all_params = query_params + array_params
-            invalid = [k for k in kwargs if k.strip() not in all_params and k != "self"]
-            if invalid and self._session._logger:
-                self._session._logger.warning(
-                    f"getOrganizationWirelessDevicesPowerModeHistory: ignoring unrecognized kwargs: {invalid}"
-                )
-
-        return self._session.get_pages(metadata, resource, params, total_pages, direction)
+        return dispatch.call(
+            self._session,
+            "getOrganizationWirelessDevicesPowerModeHistory",
+            organizationId,
+            total_pages=total_pages,
+            direction=direction,
+            **kwargs,
+        )
 
     def getOrganizationWirelessDevicesProvisioningDeployments(
         self, organizationId: str, total_pages=1, direction="next", **kwargs
@@ -4102,51 +1689,14 @@ class Wireless(object):
         - deploymentType (string): Filter deployments by type.
         """
 
-        kwargs.update(locals())
-
-        if "sortBy" in kwargs:
-            options = ["afterAction", "createdAt", "deploymentId", "name", "status"]
-            assert kwargs["sortBy"] in options, (
-                f'''"sortBy" cannot be "{kwargs["sortBy"]}", & must be set to one of: {options}'''
-            )
-        if "sortOrder" in kwargs:
-            options = ["asc", "desc"]
-            assert kwargs["sortOrder"] in options, (
-                f'''"sortOrder" cannot be "{kwargs["sortOrder"]}", & must be set to one of: {options}'''
-            )
-        if "deploymentType" in kwargs:
-            options = ["deploy", "replace"]
-            assert kwargs["deploymentType"] in options, (
-                f'''"deploymentType" cannot be "{kwargs["deploymentType"]}", & must be set to one of: {options}'''
-            )
-
-        metadata = {
-            "tags": ["wireless", "configure", "devices", "provisioning", "deployments"],
-            "operation": "getOrganizationWirelessDevicesProvisioningDeployments",
-        }
-        organizationId = urllib.parse.quote(str(organizationId), safe="")
-        resource = f"/organizations/{organizationId}/wireless/devices/provisioning/deployments"
-
-        query_params = [
-            "perPage",
-            "startingAfter",
-            "endingBefore",
-            "search",
-            "sortBy",
-            "sortOrder",
-            "deploymentType",
-        ]
-        params = {k.strip(): v for k, v in kwargs.items() if k.strip() in query_params}
-
-        if self._session._validate_kwargs:
-            all_params = query_params
-            invalid = [k for k in kwargs if k.strip() not in all_params and k != "self"]
-            if invalid and self._session._logger:
-                self._session._logger.warning(
-                    f"getOrganizationWirelessDevicesProvisioningDeployments: ignoring unrecognized kwargs: {invalid}"
-                )
-
-        return self._session.get_pages(metadata, resource, params, total_pages, direction)
+        return dispatch.call(
+            self._session,
+            "getOrganizationWirelessDevicesProvisioningDeployments",
+            organizationId,
+            total_pages=total_pages,
+            direction=direction,
+            **kwargs,
+        )
 
     def createOrganizationWirelessDevicesProvisioningDeployment(self, organizationId: str, items: list, **kwargs):
         """
@@ -4158,30 +1708,9 @@ class Wireless(object):
         - meta (object): Metadata relevant to the paginated dataset
         """
 
-        kwargs.update(locals())
-
-        metadata = {
-            "tags": ["wireless", "configure", "devices", "provisioning", "deployments"],
-            "operation": "createOrganizationWirelessDevicesProvisioningDeployment",
-        }
-        organizationId = urllib.parse.quote(str(organizationId), safe="")
-        resource = f"/organizations/{organizationId}/wireless/devices/provisioning/deployments"
-
-        body_params = [
-            "items",
-            "meta",
-        ]
-        payload = {k.strip(): v for k, v in kwargs.items() if k.strip() in body_params}
-
-        if self._session._validate_kwargs:
-            all_params = [] + body_params
-            invalid = [k for k in kwargs if k.strip() not in all_params and k != "self"]
-            if invalid and self._session._logger:
-                self._session._logger.warning(
-                    f"createOrganizationWirelessDevicesProvisioningDeployment: ignoring unrecognized kwargs: {invalid}"
-                )
-
-        return self._session.post(metadata, resource, payload)
+        return dispatch.call(
+            self._session, "createOrganizationWirelessDevicesProvisioningDeployment", organizationId, items, **kwargs
+        )
 
     def updateOrganizationWirelessDevicesProvisioningDeployments(self, organizationId: str, items: list, **kwargs):
         """
@@ -4193,30 +1722,9 @@ class Wireless(object):
         - meta (object): Metadata relevant to the paginated dataset
         """
 
-        kwargs.update(locals())
-
-        metadata = {
-            "tags": ["wireless", "configure", "devices", "provisioning", "deployments"],
-            "operation": "updateOrganizationWirelessDevicesProvisioningDeployments",
-        }
-        organizationId = urllib.parse.quote(str(organizationId), safe="")
-        resource = f"/organizations/{organizationId}/wireless/devices/provisioning/deployments"
-
-        body_params = [
-            "items",
-            "meta",
-        ]
-        payload = {k.strip(): v for k, v in kwargs.items() if k.strip() in body_params}
-
-        if self._session._validate_kwargs:
-            all_params = [] + body_params
-            invalid = [k for k in kwargs if k.strip() not in all_params and k != "self"]
-            if invalid and self._session._logger:
-                self._session._logger.warning(
-                    f"updateOrganizationWirelessDevicesProvisioningDeployments: ignoring unrecognized kwargs: {invalid}"
-                )
-
-        return self._session.put(metadata, resource, payload)
+        return dispatch.call(
+            self._session, "updateOrganizationWirelessDevicesProvisioningDeployments", organizationId, items, **kwargs
+        )
 
     def deleteOrganizationWirelessDevicesProvisioningDeployment(self, organizationId: str, deploymentId: str):
         """
@@ -4227,15 +1735,9 @@ class Wireless(object):
         - deploymentId (string): Deployment ID
         """
 
-        metadata = {
-            "tags": ["wireless", "configure", "devices", "provisioning", "deployments"],
-            "operation": "deleteOrganizationWirelessDevicesProvisioningDeployment",
-        }
-        organizationId = urllib.parse.quote(str(organizationId), safe="")
-        deploymentId = urllib.parse.quote(str(deploymentId), safe="")
-        resource = f"/organizations/{organizationId}/wireless/devices/provisioning/deployments/{deploymentId}"
-
-        return self._session.delete(metadata, resource)
+        return dispatch.call(
+            self._session, "deleteOrganizationWirelessDevicesProvisioningDeployment", organizationId, deploymentId
+        )
 
     def getOrganizationWirelessDevicesRadsecCertificatesAuthorities(self, organizationId: str, **kwargs):
         """
@@ -4246,37 +1748,9 @@ class Wireless(object):
         - certificateAuthorityIds (array): Optional parameter to filter CAs by one or more CA IDs. All returned CAs will have an ID that is an exact match.
         """
 
-        kwargs.update(locals())
-
-        metadata = {
-            "tags": ["wireless", "configure", "devices", "radsec", "certificates", "authorities"],
-            "operation": "getOrganizationWirelessDevicesRadsecCertificatesAuthorities",
-        }
-        organizationId = urllib.parse.quote(str(organizationId), safe="")
-        resource = f"/organizations/{organizationId}/wireless/devices/radsec/certificates/authorities"
-
-        query_params = [
-            "certificateAuthorityIds",
-        ]
-        params = {k.strip(): v for k, v in kwargs.items() if k.strip() in query_params}
-
-        array_params = [
-            "certificateAuthorityIds",
-        ]
-        for k, v in kwargs.items():
-            if k.strip() in array_params:
-                params[f"{k.strip()}[]"] = kwargs[f"{k}"]
-                params.pop(k.strip())
-
-        if self._session._validate_kwargs:
-            all_params = query_params + array_params
-            invalid = [k for k in kwargs if k.strip() not in all_params and k != "self"]
-            if invalid and self._session._logger:
-                self._session._logger.warning(
-                    f"getOrganizationWirelessDevicesRadsecCertificatesAuthorities: ignoring unrecognized kwargs: {invalid}"
-                )
-
-        return self._session.get(metadata, resource, params)
+        return dispatch.call(
+            self._session, "getOrganizationWirelessDevicesRadsecCertificatesAuthorities", organizationId, **kwargs
+        )
 
     def updateOrganizationWirelessDevicesRadsecCertificatesAuthorities(self, organizationId: str, **kwargs):
         """
@@ -4288,30 +1762,9 @@ class Wireless(object):
         - certificateAuthorityId (string): The ID of the Certificate Authority to update.
         """
 
-        kwargs.update(locals())
-
-        metadata = {
-            "tags": ["wireless", "configure", "devices", "radsec", "certificates", "authorities"],
-            "operation": "updateOrganizationWirelessDevicesRadsecCertificatesAuthorities",
-        }
-        organizationId = urllib.parse.quote(str(organizationId), safe="")
-        resource = f"/organizations/{organizationId}/wireless/devices/radsec/certificates/authorities"
-
-        body_params = [
-            "status",
-            "certificateAuthorityId",
-        ]
-        payload = {k.strip(): v for k, v in kwargs.items() if k.strip() in body_params}
-
-        if self._session._validate_kwargs:
-            all_params = [] + body_params
-            invalid = [k for k in kwargs if k.strip() not in all_params and k != "self"]
-            if invalid and self._session._logger:
-                self._session._logger.warning(
-                    f"updateOrganizationWirelessDevicesRadsecCertificatesAuthorities: ignoring unrecognized kwargs: {invalid}"
-                )
-
-        return self._session.put(metadata, resource, payload)
+        return dispatch.call(
+            self._session, "updateOrganizationWirelessDevicesRadsecCertificatesAuthorities", organizationId, **kwargs
+        )
 
     def createOrganizationWirelessDevicesRadsecCertificatesAuthority(self, organizationId: str):
         """
@@ -4321,14 +1774,7 @@ class Wireless(object):
         - organizationId (string): Organization ID
         """
 
-        metadata = {
-            "tags": ["wireless", "configure", "devices", "radsec", "certificates", "authorities"],
-            "operation": "createOrganizationWirelessDevicesRadsecCertificatesAuthority",
-        }
-        organizationId = urllib.parse.quote(str(organizationId), safe="")
-        resource = f"/organizations/{organizationId}/wireless/devices/radsec/certificates/authorities"
-
-        return self._session.post(metadata, resource)
+        return dispatch.call(self._session, "createOrganizationWirelessDevicesRadsecCertificatesAuthority", organizationId)
 
     def getOrganizationWirelessDevicesRadsecCertificatesAuthoritiesCrls(self, organizationId: str, **kwargs):
         """
@@ -4339,37 +1785,9 @@ class Wireless(object):
         - certificateAuthorityIds (array): Optional parameter to filter CAs by one or more CA IDs. All returned CAs will have an ID that is an exact match.
         """
 
-        kwargs.update(locals())
-
-        metadata = {
-            "tags": ["wireless", "configure", "devices", "radsec", "certificates", "authorities", "crls"],
-            "operation": "getOrganizationWirelessDevicesRadsecCertificatesAuthoritiesCrls",
-        }
-        organizationId = urllib.parse.quote(str(organizationId), safe="")
-        resource = f"/organizations/{organizationId}/wireless/devices/radsec/certificates/authorities/crls"
-
-        query_params = [
-            "certificateAuthorityIds",
-        ]
-        params = {k.strip(): v for k, v in kwargs.items() if k.strip() in query_params}
-
-        array_params = [
-            "certificateAuthorityIds",
-        ]
-        for k, v in kwargs.items():
-            if k.strip() in array_params:
-                params[f"{k.strip()}[]"] = kwargs[f"{k}"]
-                params.pop(k.strip())
-
-        if self._session._validate_kwargs:
-            all_params = query_params + array_params
-            invalid = [k for k in kwargs if k.strip() not in all_params and k != "self"]
-            if invalid and self._session._logger:
-                self._session._logger.warning(
-                    f"getOrganizationWirelessDevicesRadsecCertificatesAuthoritiesCrls: ignoring unrecognized kwargs: {invalid}"
-                )
-
-        return self._session.get(metadata, resource, params)
+        return dispatch.call(
+            self._session, "getOrganizationWirelessDevicesRadsecCertificatesAuthoritiesCrls", organizationId, **kwargs
+        )
 
     def getOrganizationWirelessDevicesRadsecCertificatesAuthoritiesCrlsDeltas(self, organizationId: str, **kwargs):
         """
@@ -4380,37 +1798,9 @@ class Wireless(object):
         - certificateAuthorityIds (array): Parameter to filter CAs by one or more CA IDs. All returned CAs will have an ID that is an exact match.
         """
 
-        kwargs.update(locals())
-
-        metadata = {
-            "tags": ["wireless", "configure", "devices", "radsec", "certificates", "authorities", "crls", "deltas"],
-            "operation": "getOrganizationWirelessDevicesRadsecCertificatesAuthoritiesCrlsDeltas",
-        }
-        organizationId = urllib.parse.quote(str(organizationId), safe="")
-        resource = f"/organizations/{organizationId}/wireless/devices/radsec/certificates/authorities/crls/deltas"
-
-        query_params = [
-            "certificateAuthorityIds",
-        ]
-        params = {k.strip(): v for k, v in kwargs.items() if k.strip() in query_params}
-
-        array_params = [
-            "certificateAuthorityIds",
-        ]
-        for k, v in kwargs.items():
-            if k.strip() in array_params:
-                params[f"{k.strip()}[]"] = kwargs[f"{k}"]
-                params.pop(k.strip())
-
-        if self._session._validate_kwargs:
-            all_params = query_params + array_params
-            invalid = [k for k in kwargs if k.strip() not in all_params and k != "self"]
-            if invalid and self._session._logger:
-                self._session._logger.warning(
-                    f"getOrganizationWirelessDevicesRadsecCertificatesAuthoritiesCrlsDeltas: ignoring unrecognized kwargs: {invalid}"
-                )
-
-        return self._session.get(metadata, resource, params)
+        return dispatch.call(
+            self._session, "getOrganizationWirelessDevicesRadsecCertificatesAuthoritiesCrlsDeltas", organizationId, **kwargs
+        )
 
     def getOrganizationWirelessDevicesSystemCpuLoadHistory(
         self, organizationId: str, total_pages=1, direction="next", **kwargs
@@ -4432,45 +1822,14 @@ class Wireless(object):
         - serials (array): Optional parameter to filter device availabilities history by device serial numbers
         """
 
-        kwargs.update(locals())
-
-        metadata = {
-            "tags": ["wireless", "monitor", "devices", "system", "cpu", "load", "history"],
-            "operation": "getOrganizationWirelessDevicesSystemCpuLoadHistory",
-        }
-        organizationId = urllib.parse.quote(str(organizationId), safe="")
-        resource = f"/organizations/{organizationId}/wireless/devices/system/cpu/load/history"
-
-        query_params = [
-            "t0",
-            "t1",
-            "timespan",
-            "perPage",
-            "startingAfter",
-            "endingBefore",
-            "networkIds",
-            "serials",
-        ]
-        params = {k.strip(): v for k, v in kwargs.items() if k.strip() in query_params}
-
-        array_params = [
-            "networkIds",
-            "serials",
-        ]
-        for k, v in kwargs.items():
-            if k.strip() in array_params:
-                params[f"{k.strip()}[]"] = kwargs[f"{k}"]
-                params.pop(k.strip())
-
-        if self._session._validate_kwargs:
-            all_params = query_params + array_params
-            invalid = [k for k in kwargs if k.strip() not in all_params and k != "self"]
-            if invalid and self._session._logger:
-                self._session._logger.warning(
-                    f"getOrganizationWirelessDevicesSystemCpuLoadHistory: ignoring unrecognized kwargs: {invalid}"
-                )
-
-        return self._session.get_pages(metadata, resource, params, total_pages, direction)
+        return dispatch.call(
+            self._session,
+            "getOrganizationWirelessDevicesSystemCpuLoadHistory",
+            organizationId,
+            total_pages=total_pages,
+            direction=direction,
+            **kwargs,
+        )
 
     def getOrganizationWirelessDevicesWirelessControllersByDevice(
         self, organizationId: str, total_pages=1, direction="next", **kwargs
@@ -4490,44 +1849,14 @@ class Wireless(object):
         - endingBefore (string): A token used by the server to indicate the end of the page. Often this is a timestamp or an ID but it is not limited to those. This parameter should not be defined by client applications. The link for the first, last, prev, or next page in the HTTP Link header should define it.
         """
 
-        kwargs.update(locals())
-
-        metadata = {
-            "tags": ["wireless", "monitor", "devices", "wirelessControllers", "byDevice"],
-            "operation": "getOrganizationWirelessDevicesWirelessControllersByDevice",
-        }
-        organizationId = urllib.parse.quote(str(organizationId), safe="")
-        resource = f"/organizations/{organizationId}/wireless/devices/wirelessControllers/byDevice"
-
-        query_params = [
-            "networkIds",
-            "serials",
-            "controllerSerials",
-            "perPage",
-            "startingAfter",
-            "endingBefore",
-        ]
-        params = {k.strip(): v for k, v in kwargs.items() if k.strip() in query_params}
-
-        array_params = [
-            "networkIds",
-            "serials",
-            "controllerSerials",
-        ]
-        for k, v in kwargs.items():
-            if k.strip() in array_params:
-                params[f"{k.strip()}[]"] = kwargs[f"{k}"]
-                params.pop(k.strip())
-
-        if self._session._validate_kwargs:
-            all_params = query_params + array_params
-            invalid = [k for k in kwargs if k.strip() not in all_params and k != "self"]
-            if invalid and self._session._logger:
-                self._session._logger.warning(
-                    f"getOrganizationWirelessDevicesWirelessControllersByDevice: ignoring unrecognized kwargs: {invalid}"
-                )
-
-        return self._session.get_pages(metadata, resource, params, total_pages, direction)
+        return dispatch.call(
+            self._session,
+            "getOrganizationWirelessDevicesWirelessControllersByDevice",
+            organizationId,
+            total_pages=total_pages,
+            direction=direction,
+            **kwargs,
+        )
 
     def getOrganizationWirelessLocationScanningByNetwork(self, organizationId: str, total_pages=1, direction="next", **kwargs):
         """
@@ -4543,40 +1872,14 @@ class Wireless(object):
         - networkIds (array): Optional parameter to filter scanning settings by network ID.
         """
 
-        kwargs.update(locals())
-
-        metadata = {
-            "tags": ["wireless", "configure", "location", "scanning", "byNetwork"],
-            "operation": "getOrganizationWirelessLocationScanningByNetwork",
-        }
-        organizationId = urllib.parse.quote(str(organizationId), safe="")
-        resource = f"/organizations/{organizationId}/wireless/location/scanning/byNetwork"
-
-        query_params = [
-            "perPage",
-            "startingAfter",
-            "endingBefore",
-            "networkIds",
-        ]
-        params = {k.strip(): v for k, v in kwargs.items() if k.strip() in query_params}
-
-        array_params = [
-            "networkIds",
-        ]
-        for k, v in kwargs.items():
-            if k.strip() in array_params:
-                params[f"{k.strip()}[]"] = kwargs[f"{k}"]
-                params.pop(k.strip())
-
-        if self._session._validate_kwargs:
-            all_params = query_params + array_params
-            invalid = [k for k in kwargs if k.strip() not in all_params and k != "self"]
-            if invalid and self._session._logger:
-                self._session._logger.warning(
-                    f"getOrganizationWirelessLocationScanningByNetwork: ignoring unrecognized kwargs: {invalid}"
-                )
-
-        return self._session.get_pages(metadata, resource, params, total_pages, direction)
+        return dispatch.call(
+            self._session,
+            "getOrganizationWirelessLocationScanningByNetwork",
+            organizationId,
+            total_pages=total_pages,
+            direction=direction,
+            **kwargs,
+        )
 
     def getOrganizationWirelessLocationScanningReceivers(self, organizationId: str, total_pages=1, direction="next", **kwargs):
         """
@@ -4592,40 +1895,14 @@ class Wireless(object):
         - networkIds (array): Optional parameter to filter scanning API receivers by network ID.
         """
 
-        kwargs.update(locals())
-
-        metadata = {
-            "tags": ["wireless", "configure", "location", "scanning", "receivers"],
-            "operation": "getOrganizationWirelessLocationScanningReceivers",
-        }
-        organizationId = urllib.parse.quote(str(organizationId), safe="")
-        resource = f"/organizations/{organizationId}/wireless/location/scanning/receivers"
-
-        query_params = [
-            "perPage",
-            "startingAfter",
-            "endingBefore",
-            "networkIds",
-        ]
-        params = {k.strip(): v for k, v in kwargs.items() if k.strip() in query_params}
-
-        array_params = [
-            "networkIds",
-        ]
-        for k, v in kwargs.items():
-            if k.strip() in array_params:
-                params[f"{k.strip()}[]"] = kwargs[f"{k}"]
-                params.pop(k.strip())
-
-        if self._session._validate_kwargs:
-            all_params = query_params + array_params
-            invalid = [k for k in kwargs if k.strip() not in all_params and k != "self"]
-            if invalid and self._session._logger:
-                self._session._logger.warning(
-                    f"getOrganizationWirelessLocationScanningReceivers: ignoring unrecognized kwargs: {invalid}"
-                )
-
-        return self._session.get_pages(metadata, resource, params, total_pages, direction)
+        return dispatch.call(
+            self._session,
+            "getOrganizationWirelessLocationScanningReceivers",
+            organizationId,
+            total_pages=total_pages,
+            direction=direction,
+            **kwargs,
+        )
 
     def createOrganizationWirelessLocationScanningReceiver(
         self, organizationId: str, network: dict, url: str, version: str, radio: dict, sharedSecret: str, **kwargs
@@ -4642,33 +1919,17 @@ class Wireless(object):
         - sharedSecret (string): Secret Value for Receiver
         """
 
-        kwargs = locals()
-
-        metadata = {
-            "tags": ["wireless", "configure", "location", "scanning", "receivers"],
-            "operation": "createOrganizationWirelessLocationScanningReceiver",
-        }
-        organizationId = urllib.parse.quote(str(organizationId), safe="")
-        resource = f"/organizations/{organizationId}/wireless/location/scanning/receivers"
-
-        body_params = [
-            "network",
-            "url",
-            "version",
-            "radio",
-            "sharedSecret",
-        ]
-        payload = {k.strip(): v for k, v in kwargs.items() if k.strip() in body_params}
-
-        if self._session._validate_kwargs:
-            all_params = [] + body_params
-            invalid = [k for k in kwargs if k.strip() not in all_params and k != "self"]
-            if invalid and self._session._logger:
-                self._session._logger.warning(
-                    f"createOrganizationWirelessLocationScanningReceiver: ignoring unrecognized kwargs: {invalid}"
-                )
-
-        return self._session.post(metadata, resource, payload)
+        return dispatch.call(
+            self._session,
+            "createOrganizationWirelessLocationScanningReceiver",
+            organizationId,
+            network,
+            url,
+            version,
+            radio,
+            sharedSecret,
+            **kwargs,
+        )
 
     def updateOrganizationWirelessLocationScanningReceiver(self, organizationId: str, receiverId: str, **kwargs):
         """
@@ -4682,32 +1943,9 @@ class Wireless(object):
         - radio (object): Add scanning API Radio
         """
 
-        kwargs.update(locals())
-
-        metadata = {
-            "tags": ["wireless", "configure", "location", "scanning", "receivers"],
-            "operation": "updateOrganizationWirelessLocationScanningReceiver",
-        }
-        organizationId = urllib.parse.quote(str(organizationId), safe="")
-        receiverId = urllib.parse.quote(str(receiverId), safe="")
-        resource = f"/organizations/{organizationId}/wireless/location/scanning/receivers/{receiverId}"
-
-        body_params = [
-            "url",
-            "version",
-            "radio",
-        ]
-        payload = {k.strip(): v for k, v in kwargs.items() if k.strip() in body_params}
-
-        if self._session._validate_kwargs:
-            all_params = [] + body_params
-            invalid = [k for k in kwargs if k.strip() not in all_params and k != "self"]
-            if invalid and self._session._logger:
-                self._session._logger.warning(
-                    f"updateOrganizationWirelessLocationScanningReceiver: ignoring unrecognized kwargs: {invalid}"
-                )
-
-        return self._session.put(metadata, resource, payload)
+        return dispatch.call(
+            self._session, "updateOrganizationWirelessLocationScanningReceiver", organizationId, receiverId, **kwargs
+        )
 
     def deleteOrganizationWirelessLocationScanningReceiver(self, organizationId: str, receiverId: str):
         """
@@ -4718,15 +1956,7 @@ class Wireless(object):
         - receiverId (string): Receiver ID
         """
 
-        metadata = {
-            "tags": ["wireless", "configure", "location", "scanning", "receivers"],
-            "operation": "deleteOrganizationWirelessLocationScanningReceiver",
-        }
-        organizationId = urllib.parse.quote(str(organizationId), safe="")
-        receiverId = urllib.parse.quote(str(receiverId), safe="")
-        resource = f"/organizations/{organizationId}/wireless/location/scanning/receivers/{receiverId}"
-
-        return self._session.delete(metadata, resource)
+        return dispatch.call(self._session, "deleteOrganizationWirelessLocationScanningReceiver", organizationId, receiverId)
 
     def getOrganizationWirelessMqttSettings(self, organizationId: str, total_pages=1, direction="next", **kwargs):
         """
@@ -4742,38 +1972,14 @@ class Wireless(object):
         - networkIds (array): Optional parameter to filter mqtt settings by network ID.
         """
 
-        kwargs.update(locals())
-
-        metadata = {
-            "tags": ["wireless", "configure", "mqtt", "settings"],
-            "operation": "getOrganizationWirelessMqttSettings",
-        }
-        organizationId = urllib.parse.quote(str(organizationId), safe="")
-        resource = f"/organizations/{organizationId}/wireless/mqtt/settings"
-
-        query_params = [
-            "perPage",
-            "startingAfter",
-            "endingBefore",
-            "networkIds",
-        ]
-        params = {k.strip(): v for k, v in kwargs.items() if k.strip() in query_params}
-
-        array_params = [
-            "networkIds",
-        ]
-        for k, v in kwargs.items():
-            if k.strip() in array_params:
-                params[f"{k.strip()}[]"] = kwargs[f"{k}"]
-                params.pop(k.strip())
-
-        if self._session._validate_kwargs:
-            all_params = query_params + array_params
-            invalid = [k for k in kwargs if k.strip() not in all_params and k != "self"]
-            if invalid and self._session._logger:
-                self._session._logger.warning(f"getOrganizationWirelessMqttSettings: ignoring unrecognized kwargs: {invalid}")
-
-        return self._session.get_pages(metadata, resource, params, total_pages, direction)
+        return dispatch.call(
+            self._session,
+            "getOrganizationWirelessMqttSettings",
+            organizationId,
+            total_pages=total_pages,
+            direction=direction,
+            **kwargs,
+        )
 
     def updateOrganizationWirelessMqttSettings(self, organizationId: str, network: dict, mqtt: dict, **kwargs):
         """
@@ -4787,32 +1993,7 @@ class Wireless(object):
         - wifi (object): MQTT Wi-Fi Settings for network
         """
 
-        kwargs.update(locals())
-
-        metadata = {
-            "tags": ["wireless", "configure", "mqtt", "settings"],
-            "operation": "updateOrganizationWirelessMqttSettings",
-        }
-        organizationId = urllib.parse.quote(str(organizationId), safe="")
-        resource = f"/organizations/{organizationId}/wireless/mqtt/settings"
-
-        body_params = [
-            "network",
-            "mqtt",
-            "ble",
-            "wifi",
-        ]
-        payload = {k.strip(): v for k, v in kwargs.items() if k.strip() in body_params}
-
-        if self._session._validate_kwargs:
-            all_params = [] + body_params
-            invalid = [k for k in kwargs if k.strip() not in all_params and k != "self"]
-            if invalid and self._session._logger:
-                self._session._logger.warning(
-                    f"updateOrganizationWirelessMqttSettings: ignoring unrecognized kwargs: {invalid}"
-                )
-
-        return self._session.put(metadata, resource, payload)
+        return dispatch.call(self._session, "updateOrganizationWirelessMqttSettings", organizationId, network, mqtt, **kwargs)
 
     def recalculateOrganizationWirelessRadioAutoRfChannels(self, organizationId: str, networkIds: list, **kwargs):
         """
@@ -4823,29 +2004,9 @@ class Wireless(object):
         - networkIds (array): A list of network ids (limit: 15).
         """
 
-        kwargs = locals()
-
-        metadata = {
-            "tags": ["wireless", "configure", "radio", "autoRf", "channels"],
-            "operation": "recalculateOrganizationWirelessRadioAutoRfChannels",
-        }
-        organizationId = urllib.parse.quote(str(organizationId), safe="")
-        resource = f"/organizations/{organizationId}/wireless/radio/autoRf/channels/recalculate"
-
-        body_params = [
-            "networkIds",
-        ]
-        payload = {k.strip(): v for k, v in kwargs.items() if k.strip() in body_params}
-
-        if self._session._validate_kwargs:
-            all_params = [] + body_params
-            invalid = [k for k in kwargs if k.strip() not in all_params and k != "self"]
-            if invalid and self._session._logger:
-                self._session._logger.warning(
-                    f"recalculateOrganizationWirelessRadioAutoRfChannels: ignoring unrecognized kwargs: {invalid}"
-                )
-
-        return self._session.post(metadata, resource, payload)
+        return dispatch.call(
+            self._session, "recalculateOrganizationWirelessRadioAutoRfChannels", organizationId, networkIds, **kwargs
+        )
 
     def getOrganizationWirelessRadioRrmByNetwork(self, organizationId: str, total_pages=1, direction="next", **kwargs):
         """
@@ -4862,47 +2023,14 @@ class Wireless(object):
         - sortOrder (string): The sort order of items
         """
 
-        kwargs.update(locals())
-
-        if "sortOrder" in kwargs:
-            options = ["ascending", "descending"]
-            assert kwargs["sortOrder"] in options, (
-                f'''"sortOrder" cannot be "{kwargs["sortOrder"]}", & must be set to one of: {options}'''
-            )
-
-        metadata = {
-            "tags": ["wireless", "configure", "radio", "rrm", "byNetwork"],
-            "operation": "getOrganizationWirelessRadioRrmByNetwork",
-        }
-        organizationId = urllib.parse.quote(str(organizationId), safe="")
-        resource = f"/organizations/{organizationId}/wireless/radio/rrm/byNetwork"
-
-        query_params = [
-            "networkIds",
-            "startingAfter",
-            "endingBefore",
-            "perPage",
-            "sortOrder",
-        ]
-        params = {k.strip(): v for k, v in kwargs.items() if k.strip() in query_params}
-
-        array_params = [
-            "networkIds",
-        ]
-        for k, v in kwargs.items():
-            if k.strip() in array_params:
-                params[f"{k.strip()}[]"] = kwargs[f"{k}"]
-                params.pop(k.strip())
-
-        if self._session._validate_kwargs:
-            all_params = query_params + array_params
-            invalid = [k for k in kwargs if k.strip() not in all_params and k != "self"]
-            if invalid and self._session._logger:
-                self._session._logger.warning(
-                    f"getOrganizationWirelessRadioRrmByNetwork: ignoring unrecognized kwargs: {invalid}"
-                )
-
-        return self._session.get_pages(metadata, resource, params, total_pages, direction)
+        return dispatch.call(
+            self._session,
+            "getOrganizationWirelessRadioRrmByNetwork",
+            organizationId,
+            total_pages=total_pages,
+            direction=direction,
+            **kwargs,
+        )
 
     def getOrganizationWirelessRfProfilesAssignmentsByDevice(
         self, organizationId: str, total_pages=1, direction="next", **kwargs
@@ -4928,52 +2056,14 @@ class Wireless(object):
         - models (array): Optional parameter to filter RF profiles by one or more device models. All returned devices will have a model that is an exact match.
         """
 
-        kwargs.update(locals())
-
-        metadata = {
-            "tags": ["wireless", "configure", "rfProfiles", "assignments", "byDevice"],
-            "operation": "getOrganizationWirelessRfProfilesAssignmentsByDevice",
-        }
-        organizationId = urllib.parse.quote(str(organizationId), safe="")
-        resource = f"/organizations/{organizationId}/wireless/rfProfiles/assignments/byDevice"
-
-        query_params = [
-            "perPage",
-            "startingAfter",
-            "endingBefore",
-            "networkIds",
-            "productTypes",
-            "name",
-            "mac",
-            "serial",
-            "model",
-            "macs",
-            "serials",
-            "models",
-        ]
-        params = {k.strip(): v for k, v in kwargs.items() if k.strip() in query_params}
-
-        array_params = [
-            "networkIds",
-            "productTypes",
-            "macs",
-            "serials",
-            "models",
-        ]
-        for k, v in kwargs.items():
-            if k.strip() in array_params:
-                params[f"{k.strip()}[]"] = kwargs[f"{k}"]
-                params.pop(k.strip())
-
-        if self._session._validate_kwargs:
-            all_params = query_params + array_params
-            invalid = [k for k in kwargs if k.strip() not in all_params and k != "self"]
-            if invalid and self._session._logger:
-                self._session._logger.warning(
-                    f"getOrganizationWirelessRfProfilesAssignmentsByDevice: ignoring unrecognized kwargs: {invalid}"
-                )
-
-        return self._session.get_pages(metadata, resource, params, total_pages, direction)
+        return dispatch.call(
+            self._session,
+            "getOrganizationWirelessRfProfilesAssignmentsByDevice",
+            organizationId,
+            total_pages=total_pages,
+            direction=direction,
+            **kwargs,
+        )
 
     def getOrganizationWirelessSsidsFirewallIsolationAllowlistEntries(
         self, organizationId: str, total_pages=1, direction="next", **kwargs
@@ -4992,42 +2082,14 @@ class Wireless(object):
         - ssids (array): ssids number array to filter out results
         """
 
-        kwargs.update(locals())
-
-        metadata = {
-            "tags": ["wireless", "configure", "ssids", "firewall", "isolation", "allowlist", "entries"],
-            "operation": "getOrganizationWirelessSsidsFirewallIsolationAllowlistEntries",
-        }
-        organizationId = urllib.parse.quote(str(organizationId), safe="")
-        resource = f"/organizations/{organizationId}/wireless/ssids/firewall/isolation/allowlist/entries"
-
-        query_params = [
-            "perPage",
-            "startingAfter",
-            "endingBefore",
-            "networkIds",
-            "ssids",
-        ]
-        params = {k.strip(): v for k, v in kwargs.items() if k.strip() in query_params}
-
-        array_params = [
-            "networkIds",
-            "ssids",
-        ]
-        for k, v in kwargs.items():
-            if k.strip() in array_params:
-                params[f"{k.strip()}[]"] = kwargs[f"{k}"]
-                params.pop(k.strip())
-
-        if self._session._validate_kwargs:
-            all_params = query_params + array_params
-            invalid = [k for k in kwargs if k.strip() not in all_params and k != "self"]
-            if invalid and self._session._logger:
-                self._session._logger.warning(
-                    f"getOrganizationWirelessSsidsFirewallIsolationAllowlistEntries: ignoring unrecognized kwargs: {invalid}"
-                )
-
-        return self._session.get_pages(metadata, resource, params, total_pages, direction)
+        return dispatch.call(
+            self._session,
+            "getOrganizationWirelessSsidsFirewallIsolationAllowlistEntries",
+            organizationId,
+            total_pages=total_pages,
+            direction=direction,
+            **kwargs,
+        )
 
     def createOrganizationWirelessSsidsFirewallIsolationAllowlistEntry(
         self, organizationId: str, client: dict, ssid: dict, network: dict, **kwargs
@@ -5043,32 +2105,15 @@ class Wireless(object):
         - description (string): The description of mac address
         """
 
-        kwargs.update(locals())
-
-        metadata = {
-            "tags": ["wireless", "configure", "ssids", "firewall", "isolation", "allowlist", "entries"],
-            "operation": "createOrganizationWirelessSsidsFirewallIsolationAllowlistEntry",
-        }
-        organizationId = urllib.parse.quote(str(organizationId), safe="")
-        resource = f"/organizations/{organizationId}/wireless/ssids/firewall/isolation/allowlist/entries"
-
-        body_params = [
-            "description",
-            "client",
-            "ssid",
-            "network",
-        ]
-        payload = {k.strip(): v for k, v in kwargs.items() if k.strip() in body_params}
-
-        if self._session._validate_kwargs:
-            all_params = [] + body_params
-            invalid = [k for k in kwargs if k.strip() not in all_params and k != "self"]
-            if invalid and self._session._logger:
-                self._session._logger.warning(
-                    f"createOrganizationWirelessSsidsFirewallIsolationAllowlistEntry: ignoring unrecognized kwargs: {invalid}"
-                )
-
-        return self._session.post(metadata, resource, payload)
+        return dispatch.call(
+            self._session,
+            "createOrganizationWirelessSsidsFirewallIsolationAllowlistEntry",
+            organizationId,
+            client,
+            ssid,
+            network,
+            **kwargs,
+        )
 
     def deleteOrganizationWirelessSsidsFirewallIsolationAllowlistEntry(self, organizationId: str, entryId: str):
         """
@@ -5079,15 +2124,9 @@ class Wireless(object):
         - entryId (string): Entry ID
         """
 
-        metadata = {
-            "tags": ["wireless", "configure", "ssids", "firewall", "isolation", "allowlist", "entries"],
-            "operation": "deleteOrganizationWirelessSsidsFirewallIsolationAllowlistEntry",
-        }
-        organizationId = urllib.parse.quote(str(organizationId), safe="")
-        entryId = urllib.parse.quote(str(entryId), safe="")
-        resource = f"/organizations/{organizationId}/wireless/ssids/firewall/isolation/allowlist/entries/{entryId}"
-
-        return self._session.delete(metadata, resource)
+        return dispatch.call(
+            self._session, "deleteOrganizationWirelessSsidsFirewallIsolationAllowlistEntry", organizationId, entryId
+        )
 
     def updateOrganizationWirelessSsidsFirewallIsolationAllowlistEntry(self, organizationId: str, entryId: str, **kwargs):
         """
@@ -5100,31 +2139,9 @@ class Wireless(object):
         - client (object): The client of allowlist
         """
 
-        kwargs.update(locals())
-
-        metadata = {
-            "tags": ["wireless", "configure", "ssids", "firewall", "isolation", "allowlist", "entries"],
-            "operation": "updateOrganizationWirelessSsidsFirewallIsolationAllowlistEntry",
-        }
-        organizationId = urllib.parse.quote(str(organizationId), safe="")
-        entryId = urllib.parse.quote(str(entryId), safe="")
-        resource = f"/organizations/{organizationId}/wireless/ssids/firewall/isolation/allowlist/entries/{entryId}"
-
-        body_params = [
-            "description",
-            "client",
-        ]
-        payload = {k.strip(): v for k, v in kwargs.items() if k.strip() in body_params}
-
-        if self._session._validate_kwargs:
-            all_params = [] + body_params
-            invalid = [k for k in kwargs if k.strip() not in all_params and k != "self"]
-            if invalid and self._session._logger:
-                self._session._logger.warning(
-                    f"updateOrganizationWirelessSsidsFirewallIsolationAllowlistEntry: ignoring unrecognized kwargs: {invalid}"
-                )
-
-        return self._session.put(metadata, resource, payload)
+        return dispatch.call(
+            self._session, "updateOrganizationWirelessSsidsFirewallIsolationAllowlistEntry", organizationId, entryId, **kwargs
+        )
 
     def getOrganizationWirelessSsidsOpenRoamingByNetwork(self, organizationId: str, total_pages=1, direction="next", **kwargs):
         """
@@ -5141,41 +2158,14 @@ class Wireless(object):
         - includeDisabledSsids (boolean): Optional parameter to include OpenRoaming configuration for disabled ssids.
         """
 
-        kwargs.update(locals())
-
-        metadata = {
-            "tags": ["wireless", "configure", "ssids", "openRoaming", "byNetwork"],
-            "operation": "getOrganizationWirelessSsidsOpenRoamingByNetwork",
-        }
-        organizationId = urllib.parse.quote(str(organizationId), safe="")
-        resource = f"/organizations/{organizationId}/wireless/ssids/openRoaming/byNetwork"
-
-        query_params = [
-            "perPage",
-            "startingAfter",
-            "endingBefore",
-            "networkIds",
-            "includeDisabledSsids",
-        ]
-        params = {k.strip(): v for k, v in kwargs.items() if k.strip() in query_params}
-
-        array_params = [
-            "networkIds",
-        ]
-        for k, v in kwargs.items():
-            if k.strip() in array_params:
-                params[f"{k.strip()}[]"] = kwargs[f"{k}"]
-                params.pop(k.strip())
-
-        if self._session._validate_kwargs:
-            all_params = query_params + array_params
-            invalid = [k for k in kwargs if k.strip() not in all_params and k != "self"]
-            if invalid and self._session._logger:
-                self._session._logger.warning(
-                    f"getOrganizationWirelessSsidsOpenRoamingByNetwork: ignoring unrecognized kwargs: {invalid}"
-                )
-
-        return self._session.get_pages(metadata, resource, params, total_pages, direction)
+        return dispatch.call(
+            self._session,
+            "getOrganizationWirelessSsidsOpenRoamingByNetwork",
+            organizationId,
+            total_pages=total_pages,
+            direction=direction,
+            **kwargs,
+        )
 
     def getOrganizationWirelessSsidsStatusesByDevice(self, organizationId: str, total_pages=1, direction="next", **kwargs):
         """
@@ -5194,45 +2184,14 @@ class Wireless(object):
         - endingBefore (string): A token used by the server to indicate the end of the page. Often this is a timestamp or an ID but it is not limited to those. This parameter should not be defined by client applications. The link for the first, last, prev, or next page in the HTTP Link header should define it.
         """
 
-        kwargs.update(locals())
-
-        metadata = {
-            "tags": ["wireless", "monitor", "ssids", "statuses", "byDevice"],
-            "operation": "getOrganizationWirelessSsidsStatusesByDevice",
-        }
-        organizationId = urllib.parse.quote(str(organizationId), safe="")
-        resource = f"/organizations/{organizationId}/wireless/ssids/statuses/byDevice"
-
-        query_params = [
-            "networkIds",
-            "serials",
-            "bssids",
-            "hideDisabled",
-            "perPage",
-            "startingAfter",
-            "endingBefore",
-        ]
-        params = {k.strip(): v for k, v in kwargs.items() if k.strip() in query_params}
-
-        array_params = [
-            "networkIds",
-            "serials",
-            "bssids",
-        ]
-        for k, v in kwargs.items():
-            if k.strip() in array_params:
-                params[f"{k.strip()}[]"] = kwargs[f"{k}"]
-                params.pop(k.strip())
-
-        if self._session._validate_kwargs:
-            all_params = query_params + array_params
-            invalid = [k for k in kwargs if k.strip() not in all_params and k != "self"]
-            if invalid and self._session._logger:
-                self._session._logger.warning(
-                    f"getOrganizationWirelessSsidsStatusesByDevice: ignoring unrecognized kwargs: {invalid}"
-                )
-
-        return self._session.get_pages(metadata, resource, params, total_pages, direction)
+        return dispatch.call(
+            self._session,
+            "getOrganizationWirelessSsidsStatusesByDevice",
+            organizationId,
+            total_pages=total_pages,
+            direction=direction,
+            **kwargs,
+        )
 
     def getOrganizationWirelessZigbeeByNetwork(self, organizationId: str, total_pages=1, direction="next", **kwargs):
         """
@@ -5248,40 +2207,14 @@ class Wireless(object):
         - networkIds (array): Filter by specified Network IDs
         """
 
-        kwargs.update(locals())
-
-        metadata = {
-            "tags": ["wireless", "configure", "zigbee", "byNetwork"],
-            "operation": "getOrganizationWirelessZigbeeByNetwork",
-        }
-        organizationId = urllib.parse.quote(str(organizationId), safe="")
-        resource = f"/organizations/{organizationId}/wireless/zigbee/byNetwork"
-
-        query_params = [
-            "perPage",
-            "startingAfter",
-            "endingBefore",
-            "networkIds",
-        ]
-        params = {k.strip(): v for k, v in kwargs.items() if k.strip() in query_params}
-
-        array_params = [
-            "networkIds",
-        ]
-        for k, v in kwargs.items():
-            if k.strip() in array_params:
-                params[f"{k.strip()}[]"] = kwargs[f"{k}"]
-                params.pop(k.strip())
-
-        if self._session._validate_kwargs:
-            all_params = query_params + array_params
-            invalid = [k for k in kwargs if k.strip() not in all_params and k != "self"]
-            if invalid and self._session._logger:
-                self._session._logger.warning(
-                    f"getOrganizationWirelessZigbeeByNetwork: ignoring unrecognized kwargs: {invalid}"
-                )
-
-        return self._session.get_pages(metadata, resource, params, total_pages, direction)
+        return dispatch.call(
+            self._session,
+            "getOrganizationWirelessZigbeeByNetwork",
+            organizationId,
+            total_pages=total_pages,
+            direction=direction,
+            **kwargs,
+        )
 
     def getOrganizationWirelessZigbeeDevices(self, organizationId: str, total_pages=1, direction="next", **kwargs):
         """
@@ -5299,40 +2232,14 @@ class Wireless(object):
         - search (string): Filter devices by their name, tag or serial
         """
 
-        kwargs.update(locals())
-
-        metadata = {
-            "tags": ["wireless", "configure", "zigbee", "devices"],
-            "operation": "getOrganizationWirelessZigbeeDevices",
-        }
-        organizationId = urllib.parse.quote(str(organizationId), safe="")
-        resource = f"/organizations/{organizationId}/wireless/zigbee/devices"
-
-        query_params = [
-            "perPage",
-            "startingAfter",
-            "endingBefore",
-            "networkIds",
-            "isEnrolled",
-            "search",
-        ]
-        params = {k.strip(): v for k, v in kwargs.items() if k.strip() in query_params}
-
-        array_params = [
-            "networkIds",
-        ]
-        for k, v in kwargs.items():
-            if k.strip() in array_params:
-                params[f"{k.strip()}[]"] = kwargs[f"{k}"]
-                params.pop(k.strip())
-
-        if self._session._validate_kwargs:
-            all_params = query_params + array_params
-            invalid = [k for k in kwargs if k.strip() not in all_params and k != "self"]
-            if invalid and self._session._logger:
-                self._session._logger.warning(f"getOrganizationWirelessZigbeeDevices: ignoring unrecognized kwargs: {invalid}")
-
-        return self._session.get_pages(metadata, resource, params, total_pages, direction)
+        return dispatch.call(
+            self._session,
+            "getOrganizationWirelessZigbeeDevices",
+            organizationId,
+            total_pages=total_pages,
+            direction=direction,
+            **kwargs,
+        )
 
     def updateOrganizationWirelessZigbeeDevice(self, organizationId: str, id: str, enrolled: bool, **kwargs):
         """
@@ -5345,31 +2252,7 @@ class Wireless(object):
         - channel (string): The new channel for the zigbee device
         """
 
-        kwargs.update(locals())
-
-        metadata = {
-            "tags": ["wireless", "configure", "zigbee", "devices"],
-            "operation": "updateOrganizationWirelessZigbeeDevice",
-        }
-        organizationId = urllib.parse.quote(str(organizationId), safe="")
-        id = urllib.parse.quote(str(id), safe="")
-        resource = f"/organizations/{organizationId}/wireless/zigbee/devices/{id}"
-
-        body_params = [
-            "enrolled",
-            "channel",
-        ]
-        payload = {k.strip(): v for k, v in kwargs.items() if k.strip() in body_params}
-
-        if self._session._validate_kwargs:
-            all_params = [] + body_params
-            invalid = [k for k in kwargs if k.strip() not in all_params and k != "self"]
-            if invalid and self._session._logger:
-                self._session._logger.warning(
-                    f"updateOrganizationWirelessZigbeeDevice: ignoring unrecognized kwargs: {invalid}"
-                )
-
-        return self._session.put(metadata, resource, payload)
+        return dispatch.call(self._session, "updateOrganizationWirelessZigbeeDevice", organizationId, id, enrolled, **kwargs)
 
     def createOrganizationWirelessZigbeeDisenrollment(self, organizationId: str, **kwargs):
         """
@@ -5380,29 +2263,7 @@ class Wireless(object):
         - doorLockIds (array): A list of Meraki door lock ids to disenroll from the device
         """
 
-        kwargs.update(locals())
-
-        metadata = {
-            "tags": ["wireless", "configure", "zigbee", "disenrollments"],
-            "operation": "createOrganizationWirelessZigbeeDisenrollment",
-        }
-        organizationId = urllib.parse.quote(str(organizationId), safe="")
-        resource = f"/organizations/{organizationId}/wireless/zigbee/disenrollments"
-
-        body_params = [
-            "doorLockIds",
-        ]
-        payload = {k.strip(): v for k, v in kwargs.items() if k.strip() in body_params}
-
-        if self._session._validate_kwargs:
-            all_params = [] + body_params
-            invalid = [k for k in kwargs if k.strip() not in all_params and k != "self"]
-            if invalid and self._session._logger:
-                self._session._logger.warning(
-                    f"createOrganizationWirelessZigbeeDisenrollment: ignoring unrecognized kwargs: {invalid}"
-                )
-
-        return self._session.post(metadata, resource, payload)
+        return dispatch.call(self._session, "createOrganizationWirelessZigbeeDisenrollment", organizationId, **kwargs)
 
     def getOrganizationWirelessZigbeeDisenrollment(self, organizationId: str, disenrollmentId: str):
         """
@@ -5413,15 +2274,7 @@ class Wireless(object):
         - disenrollmentId (string): Disenrollment ID
         """
 
-        metadata = {
-            "tags": ["wireless", "configure", "zigbee", "disenrollments"],
-            "operation": "getOrganizationWirelessZigbeeDisenrollment",
-        }
-        organizationId = urllib.parse.quote(str(organizationId), safe="")
-        disenrollmentId = urllib.parse.quote(str(disenrollmentId), safe="")
-        resource = f"/organizations/{organizationId}/wireless/zigbee/disenrollments/{disenrollmentId}"
-
-        return self._session.get(metadata, resource)
+        return dispatch.call(self._session, "getOrganizationWirelessZigbeeDisenrollment", organizationId, disenrollmentId)
 
     def getOrganizationWirelessZigbeeDoorLocks(self, organizationId: str, total_pages=1, direction="next", **kwargs):
         """
@@ -5438,41 +2291,14 @@ class Wireless(object):
         - endingBefore (string): A token used by the server to indicate the end of the page. Often this is a timestamp or an ID but it is not limited to those. This parameter should not be defined by client applications. The link for the first, last, prev, or next page in the HTTP Link header should define it.
         """
 
-        kwargs.update(locals())
-
-        metadata = {
-            "tags": ["wireless", "configure", "zigbee", "doorLocks"],
-            "operation": "getOrganizationWirelessZigbeeDoorLocks",
-        }
-        organizationId = urllib.parse.quote(str(organizationId), safe="")
-        resource = f"/organizations/{organizationId}/wireless/zigbee/doorLocks"
-
-        query_params = [
-            "networkIds",
-            "serial",
-            "perPage",
-            "startingAfter",
-            "endingBefore",
-        ]
-        params = {k.strip(): v for k, v in kwargs.items() if k.strip() in query_params}
-
-        array_params = [
-            "networkIds",
-        ]
-        for k, v in kwargs.items():
-            if k.strip() in array_params:
-                params[f"{k.strip()}[]"] = kwargs[f"{k}"]
-                params.pop(k.strip())
-
-        if self._session._validate_kwargs:
-            all_params = query_params + array_params
-            invalid = [k for k in kwargs if k.strip() not in all_params and k != "self"]
-            if invalid and self._session._logger:
-                self._session._logger.warning(
-                    f"getOrganizationWirelessZigbeeDoorLocks: ignoring unrecognized kwargs: {invalid}"
-                )
-
-        return self._session.get_pages(metadata, resource, params, total_pages, direction)
+        return dispatch.call(
+            self._session,
+            "getOrganizationWirelessZigbeeDoorLocks",
+            organizationId,
+            total_pages=total_pages,
+            direction=direction,
+            **kwargs,
+        )
 
     def updateOrganizationWirelessZigbeeDoorLock(self, organizationId: str, doorLockId: str, **kwargs):
         """
@@ -5484,27 +2310,4 @@ class Wireless(object):
         - name (string): Door lock name to update
         """
 
-        kwargs.update(locals())
-
-        metadata = {
-            "tags": ["wireless", "configure", "zigbee", "doorLocks"],
-            "operation": "updateOrganizationWirelessZigbeeDoorLock",
-        }
-        organizationId = urllib.parse.quote(str(organizationId), safe="")
-        doorLockId = urllib.parse.quote(str(doorLockId), safe="")
-        resource = f"/organizations/{organizationId}/wireless/zigbee/doorLocks/{doorLockId}"
-
-        body_params = [
-            "name",
-        ]
-        payload = {k.strip(): v for k, v in kwargs.items() if k.strip() in body_params}
-
-        if self._session._validate_kwargs:
-            all_params = [] + body_params
-            invalid = [k for k in kwargs if k.strip() not in all_params and k != "self"]
-            if invalid and self._session._logger:
-                self._session._logger.warning(
-                    f"updateOrganizationWirelessZigbeeDoorLock: ignoring unrecognized kwargs: {invalid}"
-                )
-
-        return self._session.put(metadata, resource, payload)
+        return dispatch.call(self._session, "updateOrganizationWirelessZigbeeDoorLock", organizationId, doorLockId, **kwargs)
@@ -0,0 +1,105 @@
+"""Run one API call over many argument sets on a bounded thread pool.
+
+Synchronous scripts usually loop over networks or devices one call at a time, so
+the HTTP round trip caps them at a few requests per second. bulk() runs those calls
+concurrently over the session's shared httpx client instead:
+
+- At most max_workers calls run at once. At most 2 * max_workers are submitted
+  ahead of the consumer, so huge inputs don't queue up in memory
+- Smart flow budgets still apply; every call acquires its org and global tokens
+  under the priority in effect where the call was submitted
+- A failing call doesn't stop the run; its exception is returned in its BulkResult
+- Results come back in input order (ordered=True) or as each call completes
+"""
+
+from __future__ import annotations
+
+import contextvars
+from collections import deque
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
+from typing import Any, Callable, Deque, Dict, Iterable, Iterator, NamedTuple, Optional, Set, Tuple
+
+from meraki.config import BULK_MAXIMUM_WORKERS
+from meraki.exceptions import SessionInputError
+
+
+class BulkResult(NamedTuple):
+    """The outcome of one call in a bulk run."""
+
+    index: int
+    arguments: Any
+    result: Any
+    error: Optional[Exception]
+
+    @property
+    def ok(self) -> bool:
+        return self.error is None
+
+
+def _call(function: Callable[..., Any], arguments: Any) -> Any:
+    """Call function with one argument set: a dict is keyword arguments, a tuple is positional
+    arguments, and anything else is the single positional argument."""
+    if isinstance(arguments, dict):
+        return function(**arguments)
+    if isinstance(arguments, tuple):
+        return function(*arguments)
+    return function(arguments)
+
+
+def _settle(index: int, arguments: Any, future: Future) -> BulkResult:
+    try:
+        return BulkResult(index, arguments, future.result(), None)
+    except Exception as e:
+        return BulkResult(index, arguments, None, e)
+
+
+def run_bulk(
+    function: Callable[..., Any],
+    arguments: Iterable[Any],
+    max_workers: int = BULK_MAXIMUM_WORKERS,
+    ordered: bool = True,
+) -> Iterator[BulkResult]:
+    """Call function once per argument set on a thread pool, yielding a BulkResult per call.
+
+    The calls are submitted as the returned iterator is consumed. Closing it early
+    cancels calls that have not started yet. Calls that are already running finish
+    in the background.
+    """
+    if not isinstance(max_workers, int) or max_workers < 1:
+        raise SessionInputError("max_workers", max_workers, "max_workers must be a positive integer.", None)
+    return _run(function, arguments, max_workers, ordered)
+
+
+def _run(function: Callable[..., Any], arguments: Iterable[Any], max_workers: int, ordered: bool) -> Iterator[BulkResult]:
+    window = 2 * max_workers
+    pending = iter(enumerate(arguments))
+    pool = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="meraki-bulk")
+
+    def submit() -> Optional[Tuple[int, Any, Future]]:
+        for index, args in pending:
+            # Each call runs in a copy of the submitting context, so a priority() block reaches it
+            return index, args, pool.submit(contextvars.copy_context().run, _call, function, args)
+        return None
+
+    try:
+        if ordered:
+            queue: Deque[Tuple[int, Any, Future]] = deque()
+            while True:
+                while len(queue) < window and (job := submit()) is not None:
+                    queue.append(job)
+                if not queue:
+                    return
+                yield _settle(*queue.popleft())
+        else:
+            running: Dict[Future, Tuple[int, Any]] = {}
+            while True:
+                while len(running) < window and (job := submit()) is not None:
+                    running[job[2]] = job[:2]
+                if not running:
+                    return
+                done: Set[Future] = wait(running, return_when=FIRST_COMPLETED).done
+                for future in done:
+                    index, args = running.pop(future)
+                    yield _settle(index, args, future)
+    finally:
+        pool.shutdown(wait=False, cancel_futures=True)
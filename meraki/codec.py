@@ -0,0 +1,218 @@
+"""Pluggable JSON codecs for request and response bodies.
+
+The SDK decodes every response body and encodes every ``json=`` request body.
+For large list endpoints (getOrganizationDevicesStatuses, getOrganizationInventoryDevices)
+that work dominates client CPU, so the codec is selectable:
+
+- "stdlib" (default): the standard library ``json`` module
+- "orjson" / "ujson": optional third-party codecs, used only if installed
+- "auto": the fastest installed codec (orjson, then ujson, then stdlib)
+
+The stdlib codec is always the fallback; a missing optional codec never breaks the SDK.
+Codecs decode straight from ``response.content`` bytes and encode to UTF-8 bytes, so
+request bodies never pass through httpx's own ``json.dumps``.
+"""
+
+import json
+import re
+from typing import Any, Dict, List, Optional, Union
+
+from meraki.exceptions import SessionInputError
+
+JSON_CODEC_NAMES = ("auto", "orjson", "ujson", "stdlib")
+
+
+class JSONCodec:
+    """Standard library codec; also the base class for the optional codecs."""
+
+    name = "stdlib"
+
+    def loads(self, data: Union[bytes, str]) -> Any:
+        return json.loads(data)
+
+    def dumps(self, obj: Any) -> bytes:
+        # Same compact, non-ASCII-escaping form httpx produces for json=.
+        return json.dumps(obj, ensure_ascii=False, separators=(",", ":"), allow_nan=False).encode("utf-8")
+
+
+class OrjsonCodec(JSONCodec):
+    """orjson codec. Raises ImportError at construction if orjson is not installed."""
+
+    name = "orjson"
+
+    def __init__(self) -> None:
+        import orjson
+
+        self._orjson = orjson
+
+    def loads(self, data: Union[bytes, str]) -> Any:
+        return self._orjson.loads(data)
+
+    def dumps(self, obj: Any) -> bytes:
+        return self._orjson.dumps(obj)
+
+
+class UjsonCodec(JSONCodec):
+    """ujson codec. Raises ImportError at construction if ujson is not installed."""
+
+    name = "ujson"
+
+    def __init__(self) -> None:
+        import ujson
+
+        self._ujson = ujson
+
+    def loads(self, data: Union[bytes, str]) -> Any:
+        return self._ujson.loads(data)
+
+    def dumps(self, obj: Any) -> bytes:
+        return self._ujson.dumps(obj, ensure_ascii=False, escape_forward_slashes=False).encode("utf-8")
+
+
+_OPTIONAL_CODECS = {"orjson": OrjsonCodec, "ujson": UjsonCodec}
+
+
+def get_json_codec(codec: Union[str, JSONCodec, None] = "stdlib") -> JSONCodec:
+    """Return a codec instance for a name, or pass a JSONCodec instance through.
+
+    An optional codec that is not installed falls back to the stdlib codec; callers
+    can compare the returned codec's ``name`` to what they asked for.
+    """
+    if isinstance(codec, JSONCodec):
+        return codec
+    name = (codec or "stdlib").lower()
+    if name not in JSON_CODEC_NAMES:
+        raise SessionInputError(
+            "json_codec",
+            codec,
+            f"json_codec must be one of {', '.join(JSON_CODEC_NAMES)}, or a JSONCodec instance.",
+            None,
+        )
+
+    candidates = ["orjson", "ujson"] if name == "auto" else [name]
+    for candidate in candidates:
+        factory = _OPTIONAL_CODECS.get(candidate)
+        if factory is None:
+            break
+        try:
+            return factory()
+        except ImportError:
+            continue
+    return JSONCodec()
+
+
+_WORKER_CODECS: Dict[str, JSONCodec] = {}
+
+
+def loads_in_worker(codec_name: str, data: bytes) -> Any:
+    """Decode data with a named built-in codec; the entry point for process-pool decodes.
+
+    Codec instances hold module references and don't pickle, so workers build (and
+    keep) their own codec from its name.
+    """
+    codec = _WORKER_CODECS.get(codec_name)
+    if codec is None:
+        codec = _WORKER_CODECS[codec_name] = get_json_codec(codec_name)
+    return codec.loads(data)
+
+
+# A complete (or still-open) JSON string, or a structural byte that matters for item splitting.
+_STREAM_TOKEN = re.compile(rb'"[^"\\]*(?:\\.[^"\\]*)*(")?|[\[\]{},]', re.DOTALL)
+# Everything inside an item up to its next bracket: unstructured bytes and complete strings.
+_STREAM_ITEM_BODY = re.compile(rb'(?:[^"\[\]{}]+|"[^"\\]*(?:\\.[^"\\]*)*")*', re.DOTALL)
+_STREAM_ITEM_KEYS = (b"items", b"events")
+
+
+class JSONItemStream:
+    """Incremental decoder for the item list of a paginated response body.
+
+    Accepts the shapes get_pages flattens: a top-level array, or an object whose
+    "items" or "events" value is the array. Bytes are fed as they arrive; each item
+    is decoded with the codec as soon as its closing byte is seen, so only the item
+    in progress (plus one network chunk) is ever buffered.
+
+    ``key`` is None for a top-level array, otherwise "items" or "events" once found.
+    """
+
+    def __init__(self, codec: Optional[JSONCodec] = None) -> None:
+        self._codec = codec or JSONCodec()
+        self._buf = b""
+        self._pos = 0
+        self._depth = 0
+        self._object_root = False
+        self._last_key: Optional[bytes] = None
+        self._item_depth: Optional[int] = None
+        self._item_start = 0
+        self.key: Optional[str] = None
+
+    def feed(self, chunk: bytes) -> List[Any]:
+        """Consume a chunk and return the items it completed, in document order."""
+        buf = self._buf + chunk
+        items: List[Any] = []
+        pos, end = self._pos, len(buf)
+        while pos < end:
+            if self._item_depth is not None and 0 < self._item_depth < self._depth:
+                # Inside an item only brackets matter: skip strings, scalars and commas in one C-level match.
+                pos = _STREAM_ITEM_BODY.match(buf, pos).end()
+                if pos == end or buf[pos] == 0x22:
+                    break  # out of bytes, or a string continues in the next chunk
+                start, byte = pos, buf[pos]
+                pos += 1
+            else:
+                match = _STREAM_TOKEN.search(buf, pos)
+                if match is None:
+                    pos = end
+                    break
+                start, byte = match.start(), buf[match.start()]
+                if byte == 0x22 and match.group(1) is None:
+                    pos = start
+                    break  # string continues in the next chunk; rescan it from its opening quote
+                pos = match.end()
+                if byte == 0x22:
+                    if self._object_root and self._depth == 1:
+                        self._last_key = match.group()[1:-1]
+                    continue
+
+            if byte == 0x2C:  # ,
+                if self._depth == self._item_depth:
+                    self._emit(buf, start, items)
+                    self._item_start = start + 1
+            elif byte in (0x5B, 0x7B):  # [ {
+                self._depth += 1
+                if self._item_depth is None:
+                    self._maybe_open_items(byte, start)
+            else:  # ] }
+                if self._depth == self._item_depth:
+                    self._emit(buf, start, items)
+                    self._item_depth = -1
+                self._depth -= 1
+
+        # Keep only the bytes still needed: the item in progress, or an unterminated token.
+        keep = min(pos, self._item_start) if self._item_depth and self._item_depth > 0 else pos
+        self._buf = buf[keep:]
+        self._pos = pos - keep
+        self._item_start -= keep
+        return items
+
+    def close(self) -> None:
+        """Signal end of body; raises ValueError if the body was truncated."""
+        if self._depth != 0 or (self._pos < len(self._buf) and self._buf[self._pos] == 0x22):
+            raise ValueError("Truncated JSON list body")
+
+    def _maybe_open_items(self, byte: int, start: int) -> None:
+        if self._depth == 1:
+            # Root container: an array is the item list itself; an object may hold one.
+            self._object_root = byte == 0x7B
+            if self._object_root:
+                return
+        elif self._depth == 2 and self._object_root and byte == 0x5B and self._last_key in _STREAM_ITEM_KEYS:
+            self.key = self._last_key.decode()
+        else:
+            return
+        self._item_depth = self._depth
+        self._item_start = start + 1
+
+    def _emit(self, buf: bytes, end: int, items: List[Any]) -> None:
+        raw = buf[self._item_start : end]
+        if raw.strip():
+            items.append(self._codec.loads(raw))
@@ -1,3 +1,4 @@
+import importlib
 import platform
 import re
 import sys
@@ -73,6 +74,37 @@ def validate_custom_headers(custom_headers):
     return dict(custom_headers)
 
 
+def validate_egresses(egresses, requests_proxy=""):
+    # Egress pool: proxy URLs ("" for a direct connection) or dicts with "proxy" and/or "local_address".
+    # Returns one dict per egress; without a pool, the single requests_proxy egress.
+    if not egresses:
+        return [{"proxy": requests_proxy} if requests_proxy else {}]
+    if isinstance(egresses, (str, dict)) or not isinstance(egresses, (list, tuple)):
+        raise SessionInputError(
+            "requests_egresses",
+            egresses,
+            "requests_egresses must be a list of proxy URLs or {'proxy': ..., 'local_address': ...} dicts.",
+            None,
+        )
+    pool = []
+    for egress in egresses:
+        if isinstance(egress, str):
+            egress = {"proxy": egress}
+        if (
+            not isinstance(egress, dict)
+            or set(egress) - {"proxy", "local_address"}
+            or not all(isinstance(value, str) for value in egress.values())
+        ):
+            raise SessionInputError(
+                "requests_egresses",
+                egress,
+                "Each egress must be a proxy URL string or a dict of string proxy and/or local_address.",
+                None,
+            )
+        pool.append({key: value for key, value in egress.items() if value})
+    return pool
+
+
 def reject_v0_base_url(self):
     if "v0" in self._base_url:
         sys.exit(
@@ -113,3 +145,47 @@ def validate_base_url(self, url):
     else:
         abs_url = self._base_url + url
     return abs_url
+
+
+class LazySection:
+    """Client attribute that imports its API section module on first access.
+
+    The generated sections are tens of thousands of lines, and most scripts touch one
+    or two. DashboardAPI, AsyncDashboardAPI and Batch declare each section as a
+    LazySection class attribute. The first access imports the module, builds the
+    section and stores it on the instance, so later lookups never reach this
+    descriptor.
+    """
+
+    def __init__(self, module, class_name, pass_session=True):
+        self.module = module
+        self.class_name = class_name
+        self._pass_session = pass_session
+        self._name = class_name
+
+    def __set_name__(self, owner, name):
+        self._name = name
+
+    def __get__(self, instance, owner=None):
+        if instance is None:
+            return self
+        section_class = self.load()
+        section = section_class(instance._session) if self._pass_session else section_class()
+        instance.__dict__[self._name] = section
+        return section
+
+    def load(self):
+        """Import the section module and return the section class."""
+        return getattr(importlib.import_module(self.module), self.class_name)
+
+
+def lazy_section_class(client_class, module_name, name):
+    """Module-level __getattr__ helper: the section class called name, imported on demand.
+
+    Keeps imports like `from meraki import Organizations` working now that the
+    package no longer imports every section up front.
+    """
+    for section in vars(client_class).values():
+        if isinstance(section, LazySection) and section.class_name == name:
+            return section.load()
+    raise AttributeError(f"module {module_name!r} has no attribute {name!r}")
@@ -34,6 +34,15 @@ CERTIFICATE_PATH = ""
 # Proxy server and port, if needed, for HTTPS
 REQUESTS_PROXY = ""
 
+# Pool of egresses to spread requests across, for hosts that can leave through several HTTPS proxies
+# or NAT source addresses. The Dashboard's 100 req/s limit is per source IP, so with smart flow each
+# egress gets its own global budget of SMART_FLOW_GLOBAL_RATE and each request goes through the
+# least-loaded one; per-org limits still count requests from every egress together. Each entry is a
+# proxy URL ("" for a direct connection) or {"proxy": ..., "local_address": ...} to also bind the
+# connection to a local source address, e.g. ["http://egress-a:3128", "http://egress-b:3128"].
+# An empty list sends everything through REQUESTS_PROXY.
+REQUESTS_EGRESSES = []
+
 
 # =============================================================================
 # IDENTITY & ATTESTATION
@@ -76,6 +85,28 @@ BE_GEO_ID = ""
 # requests can be in-flight simultaneously. For rate limiting, see Smart Limiting below.
 AIO_MAXIMUM_CONCURRENT_REQUESTS = 90
 
+# Default number of worker threads for DashboardAPI.bulk(), which runs one synchronous API call over many argument
+# sets concurrently on the shared session. Keep smart flow enabled (or this number low) when a bulk run targets a
+# single organization: at typical latencies, 8 workers already exceed its 10 req/s budget.
+BULK_MAXIMUM_WORKERS = 8
+
+# Coalesce identical concurrent GETs in the async client? While a GET is in flight, other coroutines issuing the
+# same GET (same operation, URL and params) wait for it instead of sending their own request, so a fan-out of
+# hundreds of getOrganization(orgId) calls costs one API call. The shared request includes smart flow and retries.
+AIO_COALESCE_IDENTICAL_GETS = True
+
+# Response bodies of at least this many bytes are decoded off the event loop in the async client, so one
+# multi-megabyte page doesn't stall every other in-flight coroutine. Smaller bodies decode inline, where a thread
+# hop would cost more than the decode. 0 decodes everything on the loop.
+AIO_DECODE_OFFLOAD_THRESHOLD = 1048576
+
+# Where offloaded decodes run. Options: "thread", "process".
+# "thread" (default): the event loop's default thread pool. Cheap to hand off, but decoding still holds the GIL,
+#   so the loop gets a turn every few milliseconds rather than running fully in parallel.
+# "process": a process pool. Decodes run truly in parallel, at the cost of copying the body to the worker and
+#   the decoded result back. Only works with the built-in codecs (json_codec given by name).
+AIO_DECODE_OFFLOAD_EXECUTOR = "thread"
+
 # --- Smart Limiting ---
 # Proactive per-org rate limiting via token buckets. Unlike AIO_MAXIMUM_CONCURRENT_REQUESTS
 # (which caps how many requests are in-flight at once), smart limiting caps how many requests
@@ -101,9 +132,12 @@ SMART_FLOW_GLOBAL_RATE = 100
 
 # Path to the rate limit mapping cache file. The cache persists network -> org and
 # serial -> org mappings across sessions so subsequent runs skip the eager load API calls
-# if the cache is fresh. Set to empty string to disable persistence.
-# Default: ~/.meraki/.cache/rate_limit_cache.json (platform-agnostic)
-SMART_FLOW_CACHE_PATH = str(Path.home() / ".meraki" / ".cache" / "rate_limit_cache.json")
+# if the cache is fresh. It is an indexed SQLite file, read on demand, so opening it costs
+# the same however many devices it holds. A JSON cache from an older version, found at this
+# path or beside it with a .json suffix (the old default rate_limit_cache.json), is imported.
+# Set to empty string to disable persistence.
+# Default: ~/.meraki/.cache/rate_limit_cache.sqlite3 (platform-agnostic)
+SMART_FLOW_CACHE_PATH = str(Path.home() / ".meraki" / ".cache" / "rate_limit_cache.sqlite3")
 
 # How long (in seconds) before the disk cache is considered stale and re-fetched.
 # Default is 604800 (7 days). Set to None to never expire.
@@ -115,10 +149,62 @@ SMART_FLOW_CACHE_TTL = 604800.0
 # "lazy" (default): mappings are collected passively as API calls are made.
 # "eager": all mappings are fetched at session init via getOrganizations().
 #   Costs more API calls at startup for large deployments, but reduces cache misses during operation.
-#   You may notice a brief delay as the cache is created, which indicates either
-#   that your environment did not previously have a cache, or the previous cache had expired.
+#   The orgs are hydrated in the background, SMART_FLOW_HYDRATION_WORKERS at a time, so the client
+#   is ready as soon as the org list is in; requests for orgs not yet hydrated resolve lazily.
 SMART_FLOW_CACHE_MODE = "lazy"
 
+# Half-life, in seconds, of the org rates smart flow learns from 429s. The rate an org is slowed to
+# after a 429 is saved in the cache (SMART_FLOW_CACHE_PATH), and the next session starts the org there
+# instead of at SMART_FLOW_ORG_RATE; the gap to SMART_FLOW_ORG_RATE halves every half-life. The default of
+# 14400 (4 hours) lets an hourly job keep most of what the last run learned. Set to None or 0 to
+# always start at SMART_FLOW_ORG_RATE.
+SMART_FLOW_RATE_HALF_LIFE = 14400.0
+
+# Seconds between calibrations of each org's rate ceiling from its API usage telemetry. Other
+# integrations (SIEM, ticketing, the dashboard itself) share an org's 10 req/s; when set, smart
+# flow samples each org's request counts (getOrganizationApiRequestsOverviewResponseCodesByInterval,
+# one call per org per calibration), subtracts its own requests, and caps the org at what the
+# others leave of SMART_FLOW_ORG_RATE: the full rate for a quiet org, less for a busy one. Set
+# SMART_FLOW_ORG_RATE to the org's limit, less a reserve, for orgs whose limit is not 10 req/s.
+# The API key needs read access to each org. None disables it.
+SMART_FLOW_CALIBRATE_INTERVAL = None
+
+# Separate budgets for families of heavy operations, on top of the org and global ones. Each class
+# gets its own token bucket per org, taken before the org's, and a 429 on one of its calls slows
+# and pauses only that class, so a few expensive calls stop dragging every other call to the org
+# down with them. Keys are class names; each takes "rate" (req/s), optional "capacity" (burst,
+# default the rate) and "operations" (names or patterns) and/or "tags" (from the call's metadata):
+#   {"action_batches": {"rate": 1, "operations": ["createOrganizationActionBatch"]},
+#    "inventory": {"rate": 1, "operations": ["claim*", "release*"]},
+#    "snapshots": {"rate": 0.5, "operations": ["generateDeviceCameraSnapshot"]}}
+# An operation is in the first class it matches. Empty dict disables it.
+SMART_FLOW_ENDPOINT_CLASSES = {}
+
+# Maximum orgs whose networks and devices smart flow fetches at once, in eager mode and when lazy
+# resolution finds a new org. Each hydration request still takes a global bucket token, so more
+# workers finish sooner without exceeding SMART_FLOW_GLOBAL_RATE.
+SMART_FLOW_HYDRATION_WORKERS = 8
+
+# Directory for token bucket state shared by every process on this host. Each process normally
+# keeps its own buckets, so 8 worker processes against one org together send 8x SMART_FLOW_ORG_RATE.
+# Point all of them at the same directory and they draw from one global budget and one budget
+# per org instead; a 429 backoff in one process slows them all. Empty string keeps buckets per process.
+SMART_FLOW_SHARED_DIR = ""
+
+# Share one smart flow limiter (global bucket, org buckets and mapping cache) between every client
+# in this process that targets the same base URL. Without it, each DashboardAPI/AsyncDashboardAPI
+# paces itself, so a service that creates one client per request handler overruns the org and
+# source IP limits. True shares between clients using the same API key; a string shares between
+# all clients given that same string, whatever their key (e.g. one name per egress IP).
+SMART_FLOW_SHARE_LIMITER = False
+
+# Priority class of this client's requests when smart flow has to queue them: "interactive",
+# "normal" or "batch", or a positive number used as the weight. Queued requests are served by
+# weighted fair queuing, so an interactive request (weight 8) waiting behind a backlog of batch
+# requests (weight 0.25) goes ahead of them, while batch jobs still get the capacity nobody else
+# uses. Wrap calls in `with dashboard.priority("interactive"):` to override it for a block of calls.
+SMART_FLOW_PRIORITY = "normal"
+
 # Log smart flow activity (bucket creation, rate adjustments, learned mappings, cache events)
 # to the standard session log. Disable this if you don't want to see smart_flow log messages
 # in your logs.
@@ -152,6 +238,41 @@ RETRY_4XX_ERROR_WAIT_TIME = 60
 # Use iterator for pages. May offer improved performance in some instances.
 USE_ITERATOR_FOR_GET_PAGES = False
 
+# Stream iterator pages? Each item is decoded and yielded as its bytes arrive, so peak memory is one item rather
+# than one page. Only applies when USE_ITERATOR_FOR_GET_PAGES is True.
+STREAM_GET_PAGES = False
+
+# Split paginated pulls of t0/t1 endpoints into this many time sub-windows, fetched concurrently and merged back in
+# time order (e.g. getOrganizationApiRequests, getOrganizationConfigurationChanges). Applies only when both t0 and t1
+# are given and all pages are requested (total_pages=-1 or "all"). 1 disables sharding. Smart flow still paces
+# every page request.
+PAGINATION_TIME_SHARDS = 1
+
+# --- JSON Codec ---
+# Codec used to decode response bodies and encode request bodies. Options: "stdlib", "orjson", "ujson", "auto".
+# "orjson" and "ujson" are optional installs and are much faster on large list responses; if the chosen codec
+# is not installed, the SDK falls back to "stdlib". "auto" picks the fastest installed codec.
+JSON_CODEC = "stdlib"
+
+# --- Response Cache ---
+# Read-through cache for GET responses, so repeated reads of unchanged data don't spend org rate budget.
+# Options: "" (disabled), "memory" (per session), "disk" (SQLite file shared across runs and processes).
+# A successful POST/PUT/DELETE drops cached entries for the same resource path, its sub-resources and its parent.
+RESPONSE_CACHE = ""
+
+# Default number of seconds a cached GET response stays fresh
+RESPONSE_CACHE_TTL = 60.0
+
+# Per-operation TTL overrides in seconds, e.g. {"getOrganizationNetworks": 900, "getNetworkClients": 0}.
+# A TTL of 0 never caches that operation.
+RESPONSE_CACHE_TTLS = {}
+
+# Maximum cached responses; the least recently used are evicted first
+RESPONSE_CACHE_MAX_ENTRIES = 1024
+
+# Path to the SQLite file used by the "disk" response cache
+RESPONSE_CACHE_PATH = str(Path.home() / ".meraki" / ".cache" / "response_cache.sqlite3")
+
 
 # =============================================================================
 # LOGGING & OBSERVABILITY
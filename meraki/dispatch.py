@@ -0,0 +1,139 @@
+"""Table-driven execution of Dashboard API operations.
+
+The generator emits meraki/api/operations.py, one Operation descriptor per
+operationId: method, path template, the precomputed parameter sets and the
+pagination and enum details. call() executes a descriptor. The generated section
+methods keep their signatures and docstrings and delegate to it, and it can be
+called directly by operationId:
+
+    dashboard.call("getOrganizationNetworks", organization_id, total_pages="all")
+
+Parameters use their API names, so keyword clashes are passed as
+**{"from": value} rather than the generated methods' from_.
+"""
+
+from __future__ import annotations
+
+import re
+import urllib.parse
+from typing import Any, Dict, FrozenSet, NamedTuple, Optional, Tuple
+
+from meraki.exceptions import SessionInputError
+
+_EMPTY: FrozenSet[str] = frozenset()
+
+# Path values made only of these characters are left as they are by urllib.parse.quote(value, safe="")
+_UNRESERVED = re.compile(r"[A-Za-z0-9_.~-]*").fullmatch
+
+
+class Operation(NamedTuple):
+    """One API operation, as emitted into meraki/api/operations.py."""
+
+    method: str
+    path: str
+    tags: Tuple[str, ...]
+    path_params: Tuple[str, ...]
+    # Positional parameter order of the generated method, when it differs from path_params
+    arguments: Tuple[str, ...] = ()
+    query: FrozenSet[str] = _EMPTY
+    array: FrozenSet[str] = _EMPTY
+    body: FrozenSet[str] = _EMPTY
+    # Default pagination direction ("next" or "prev"), or None when not paginated
+    paginated: Optional[str] = None
+    # Allowed values per enum parameter; None is listed when the parameter is nullable
+    enums: Optional[Dict[str, Tuple[Any, ...]]] = None
+
+
+_operations: Optional[Dict[str, Operation]] = None
+
+
+def operations() -> Dict[str, Operation]:
+    """The generated operation table, imported on first use."""
+    global _operations
+    if _operations is None:
+        from meraki.api.operations import OPERATIONS
+
+        _operations = OPERATIONS
+    return _operations
+
+
+def get_operation(operation_id: str) -> Operation:
+    try:
+        return (_operations or operations())[operation_id]
+    except KeyError:
+        raise SessionInputError(
+            "operation",
+            operation_id,
+            f"{operation_id!r} is not a known Dashboard API operation.",
+            "https://developer.cisco.com/meraki/api-v1/",
+        ) from None
+
+
+def _quote(value: Any) -> str:
+    value = str(value)
+    return value if _UNRESERVED(value) else urllib.parse.quote(value, safe="")
+
+
+# Path templates rewritten for %-formatting, which is cheaper per call than str.format(**mapping)
+_path_templates: Dict[str, str] = {}
+
+
+def _path_template(path: str) -> str:
+    template = _path_templates.get(path)
+    if template is None:
+        template = _path_templates[path] = re.sub(r"\{\w+\}", "%s", path.replace("%", "%%"))
+    return template
+
+
+def call(session, operation_id: str, /, *args, **kwargs):
+    """Execute operation_id on session, like the generated method of the same name.
+
+    Positional arguments fill the operation's required parameters in the generated
+    method's order. Returns whatever the session returns, so on an async session
+    the result is awaited (or iterated) exactly as with the generated method.
+    """
+    op = get_operation(operation_id)
+    names = op.arguments or op.path_params
+    if len(args) > len(names):
+        raise TypeError(f"{operation_id}() takes {len(names)} positional arguments but {len(args)} were given")
+    kwargs.update(zip(names[: len(args)], args, strict=True))
+    if len(args) < len(names):
+        missing = [name for name in names if name not in kwargs]
+        if missing:
+            raise TypeError(f"{operation_id}() missing required arguments: {missing}")
+
+    if op.paginated:
+        total_pages = kwargs.pop("total_pages", 1)
+        direction = kwargs.pop("direction", op.paginated)
+        event_log_end_time = kwargs.pop("event_log_end_time", None)
+
+    if op.enums:
+        for param, options in op.enums.items():
+            if param in kwargs:
+                assert kwargs[param] in options, (
+                    f'''"{param}" cannot be "{kwargs[param]}", & must be set to one of: {list(options)}'''
+                )
+
+    metadata = {"tags": op.tags, "operation": operation_id}
+    resource = op.path
+    if op.path_params:
+        resource = _path_template(resource) % tuple([_quote(kwargs[p]) for p in op.path_params])
+
+    params = payload = None
+    if op.query:
+        params = {(f"{k}[]" if k in op.array else k): v for k, v in kwargs.items() if k in op.query}
+    if op.body:
+        payload = {k: v for k, v in kwargs.items() if k in op.body}
+
+    if session._validate_kwargs and session._logger:
+        invalid = [k for k in kwargs if k not in op.query and k not in op.body and k not in names]
+        if invalid:
+            session._logger.warning(f"{operation_id}: ignoring unrecognized kwargs: {invalid}")
+
+    if op.method == "get":
+        if op.paginated:
+            return session.get_pages(metadata, resource, params, total_pages, direction, event_log_end_time)
+        return session.get(metadata, resource, params)
+    if op.method == "delete":
+        return session.delete(metadata, resource, params)
+    return getattr(session, op.method)(metadata, resource, payload, params=params)
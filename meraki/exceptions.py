@@ -34,7 +34,7 @@ class APIResponseError(Exception):
 
 # To catch exceptions while making API calls
 class APIError(Exception):
-    def __init__(self, metadata, response):
+    def __init__(self, metadata, response, codec=None):
         self.response = response
         self.tag = metadata["tags"][0]
         self.operation = metadata["operation"]
@@ -43,7 +43,7 @@ class APIError(Exception):
             self.response.reason_phrase if self.response is not None and hasattr(self.response, "reason_phrase") else None
         )
         try:
-            self.message = self.response.json() if self.response is not None and self.response.json() else None
+            self.message = self._decode_body(codec) or None
         except ValueError:
             self.message = self.response.content[:100].decode("UTF-8").strip()
             if isinstance(self.message, str) and self.status == 404 and self.reason == "Not Found":
@@ -53,6 +53,15 @@ class APIError(Exception):
     def __repr__(self):
         return f"{self.tag}, {self.operation} - {self.status} {self.reason}, {self.message}"
 
+    def _decode_body(self, codec):
+        # Decode once, with the session's JSON codec when the raw body bytes are available
+        if self.response is None:
+            return None
+        content = getattr(self.response, "content", None)
+        if codec is not None and isinstance(content, bytes):
+            return codec.loads(content)
+        return self.response.json()
+
 
 # To catch exceptions while making AIO API calls
 class AsyncAPIError(APIError):
@@ -0,0 +1,532 @@
+"""Indexed on-disk store for the smart flow network/serial -> org mappings.
+
+The limiter used to keep every mapping in two dicts, parse the whole JSON cache
+file at session init and rewrite all of it every 50 new mappings, on the request
+path. With hundreds of thousands of devices that is seconds of blocking I/O and a
+dict entry per device whether or not the run ever touches it. The store keeps the
+mappings in a SQLite table instead:
+
+- A lookup is a primary-key query, so opening the cache costs the same for ten
+  devices as for a million; nothing is read until it is asked for
+- MappingTable keeps the entries this process has used (or learned) in memory,
+  bounded, with org IDs interned so repeated IDs share one string
+- New mappings are buffered and written in one transaction by a background
+  thread, after a short debounce; save/flush/close write them immediately
+- Freshness follows the old file: one saved_at timestamp, renewed on every write
+- Each org's adapted bucket rate is kept alongside, with the time it last changed,
+  so the next run can start from it rather than rediscover it through 429s
+
+A JSON cache left by an older version at the same path is imported once and
+replaced by the database. One at the old default name next to the database
+(rate_limit_cache.json beside rate_limit_cache.sqlite3) is imported when the
+database does not exist yet, and left in place for older versions.
+"""
+
+from __future__ import annotations
+
+import atexit
+import sqlite3
+import sys
+import threading
+import time
+import weakref
+from datetime import datetime, timezone
+from itertools import islice
+from pathlib import Path
+from typing import Any, Callable, Dict, Iterable, Iterator, List, Optional, Set, Tuple
+
+from meraki.codec import JSONCodec
+
+_SQLITE_HEADER = b"SQLite format 3\x00"
+_SCHEMA = (
+    "CREATE TABLE IF NOT EXISTS mappings ("
+    "kind TEXT NOT NULL, id TEXT NOT NULL, org_id TEXT NOT NULL, PRIMARY KEY (kind, id)) WITHOUT ROWID",
+    "CREATE TABLE IF NOT EXISTS meta (key TEXT PRIMARY KEY, value TEXT NOT NULL)",
+    "CREATE TABLE IF NOT EXISTS rates (org_id TEXT PRIMARY KEY, rate REAL NOT NULL, updated_at REAL NOT NULL)",
+)
+
+# Identifiers per get_many() query, under SQLite's default limit of 999 bound parameters
+_QUERY_CHUNK = 500
+
+# Stores with unwritten mappings are flushed at interpreter exit; the writer thread is a daemon.
+_open_stores: "weakref.WeakSet[MappingStore]" = weakref.WeakSet()
+
+
+@atexit.register
+def _flush_open_stores() -> None:
+    for store in list(_open_stores):
+        store.close()
+
+
+def _now_saved_at() -> str:
+    return datetime.now(timezone.utc).strftime("%Y-%m-%dT%H:%M:%SZ")
+
+
+def _parse_saved_at(value: Any) -> Optional[float]:
+    """Parse ISO 8601Z saved_at timestamp to epoch seconds."""
+    if not isinstance(value, str):
+        return None
+    try:
+        dt = datetime.strptime(value, "%Y-%m-%dT%H:%M:%SZ").replace(tzinfo=timezone.utc)
+        return dt.timestamp()
+    except ValueError:
+        return None
+
+
+class MappingStore:
+    """SQLite table of (kind, identifier) -> org ID, written in batches by a background thread.
+
+    Thread-safe. Storage errors are logged and treated as misses; the store never
+    fails a request. Mappings that could not be written stay buffered for the next flush.
+    """
+
+    def __init__(
+        self,
+        path: str,
+        ttl: Optional[float] = None,
+        codec: Optional[JSONCodec] = None,
+        log: Optional[Callable[[str], None]] = None,
+        debounce: float = 1.0,
+        max_batch: int = 1000,
+    ):
+        self.path = Path(path)
+        self.fresh = False
+        self._ttl = ttl
+        self._codec = codec or JSONCodec()
+        self._log = log or (lambda msg: None)
+        self._debounce = debounce
+        self._max_batch = max_batch
+
+        self._conn: Optional[sqlite3.Connection] = None
+        # Guards the connection; held for single queries and for one batch write
+        self._db_lock = threading.Lock()
+        # Guards the buffers and wakes the writer
+        self._cond = threading.Condition()
+        self._pending: Dict[Tuple[str, str], str] = {}
+        # The batch being written, still visible to lookups until it commits
+        self._inflight: Dict[Tuple[str, str], str] = {}
+        # org_id -> (rate, updated_at), buffered and written with the mappings
+        self._pending_rates: Dict[str, Tuple[float, float]] = {}
+        self._inflight_rates: Dict[str, Tuple[float, float]] = {}
+        self._urgent = False
+        self._writer: Optional[threading.Thread] = None
+        self._open_existing()
+
+    # ------------------------------------------------------------------
+    # Opening
+    # ------------------------------------------------------------------
+
+    def _open_existing(self) -> None:
+        """Check freshness of an existing cache file, importing a legacy JSON cache."""
+        try:
+            with open(self.path, "rb") as f:
+                header = f.read(len(_SQLITE_HEADER))
+        except OSError:
+            legacy = self.path.with_suffix(".json")
+            if legacy != self.path and legacy.is_file():
+                self._import_legacy(legacy)
+            return
+        if header != _SQLITE_HEADER:
+            self._import_legacy(self.path)
+            return
+        try:
+            with self._db_lock:
+                conn = self._connect()
+                row = conn.execute("SELECT value FROM meta WHERE key = 'saved_at'").fetchone()
+                if self._expired(row[0] if row else None):
+                    self._log("cache expired, will rebuild")
+                    conn.execute("DELETE FROM mappings")
+                    return
+        except sqlite3.Error as e:
+            self._log(f"unreadable cache {self.path} ({e}), will rebuild")
+            self._discard()
+            return
+        self.fresh = True
+        self._log(f"opened cache {self.path}")
+
+    def _expired(self, saved_at: Any) -> bool:
+        if self._ttl is None:
+            return False
+        saved_ts = _parse_saved_at(saved_at)
+        return saved_ts is None or (time.time() - saved_ts) > self._ttl
+
+    def _import_legacy(self, source: Path) -> None:
+        """Import a JSON cache from an older version into the database, keeping its mappings if fresh.
+
+        A cache at the database's own path is replaced by it; one beside it is only read.
+        """
+        rows: List[Tuple[str, str, str]] = []
+        saved_at = None
+        try:
+            data = self._codec.loads(source.read_bytes())
+            saved_at = data.get("saved_at")
+            if self._expired(saved_at):
+                self._log("cache expired, will rebuild")
+            else:
+                rows = [("network", net["id"], net["organization"]["id"]) for net in data.get("networks", [])]
+                rows += [("device", dev["serial"], dev["organization"]["id"]) for dev in data.get("devices", [])]
+                self.fresh = True
+        except Exception as e:
+            self._log(f"unreadable cache {source} ({e!r}), will rebuild")
+        if source == self.path:
+            self._discard()
+        if not self.fresh:
+            return
+        try:
+            with self._db_lock:
+                self._write_rows(self._connect(), rows, saved_at if isinstance(saved_at, str) else None)
+        except sqlite3.Error as e:
+            self._log(f"could not import cache {source} ({e})")
+            self.fresh = False
+            return
+        self._log(f"imported {len(rows)} mappings from JSON cache {source}")
+
+    def _discard(self) -> None:
+        with self._db_lock:
+            if self._conn is not None:
+                self._conn.close()
+                self._conn = None
+            try:
+                self.path.unlink()
+            except OSError:
+                pass
+
+    def _connect(self) -> sqlite3.Connection:
+        """The connection, opened (and the file created) on first use. Call with _db_lock held."""
+        if self._conn is None:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            conn = sqlite3.connect(str(self.path), timeout=5.0, check_same_thread=False, isolation_level=None)
+            try:
+                for statement in _SCHEMA:
+                    conn.execute(statement)
+            except sqlite3.Error:
+                conn.close()
+                raise
+            self._conn = conn
+            _open_stores.add(self)
+        return self._conn
+
+    # ------------------------------------------------------------------
+    # Lookups
+    # ------------------------------------------------------------------
+
+    def get(self, kind: str, identifier: str) -> Optional[str]:
+        key = (kind, identifier)
+        with self._cond:
+            org_id = self._pending.get(key) or self._inflight.get(key)
+        if org_id is not None:
+            return org_id
+        if self._conn is None and not self.path.exists():
+            return None
+        try:
+            with self._db_lock:
+                row = self._connect().execute("SELECT org_id FROM mappings WHERE kind = ? AND id = ?", key).fetchone()
+        except sqlite3.Error:
+            return None
+        return sys.intern(row[0]) if row else None
+
+    def get_many(self, kind: str, identifiers: List[str]) -> Dict[str, str]:
+        """The stored org ID of each identifier that has one, in a query per _QUERY_CHUNK identifiers."""
+        found: Dict[str, str] = {}
+        with self._cond:
+            for identifier in identifiers:
+                org_id = self._pending.get((kind, identifier)) or self._inflight.get((kind, identifier))
+                if org_id is not None:
+                    found[identifier] = org_id
+        missing = [identifier for identifier in identifiers if identifier not in found]
+        if not missing or (self._conn is None and not self.path.exists()):
+            return found
+        try:
+            with self._db_lock:
+                conn = self._connect()
+                for start in range(0, len(missing), _QUERY_CHUNK):
+                    chunk = missing[start : start + _QUERY_CHUNK]
+                    rows = conn.execute(
+                        f"SELECT id, org_id FROM mappings WHERE kind = ? AND id IN ({','.join('?' * len(chunk))})",
+                        (kind, *chunk),
+                    ).fetchall()
+                    found.update((identifier, sys.intern(org_id)) for identifier, org_id in rows)
+        except sqlite3.Error:
+            pass
+        return found
+
+    def get_rate(self, org_id: str) -> Optional[Tuple[float, float]]:
+        """The last stored (rate, updated_at) of an org's bucket, or None."""
+        with self._cond:
+            stored = self._pending_rates.get(org_id) or self._inflight_rates.get(org_id)
+        if stored is not None:
+            return stored
+        if self._conn is None and not self.path.exists():
+            return None
+        try:
+            with self._db_lock:
+                row = self._connect().execute("SELECT rate, updated_at FROM rates WHERE org_id = ?", (org_id,)).fetchone()
+        except sqlite3.Error:
+            return None
+        return (row[0], row[1]) if row else None
+
+    def rates(self) -> Dict[str, Tuple[float, float]]:
+        """Every org's stored (rate, updated_at), buffered ones included, in one query."""
+        found: Dict[str, Tuple[float, float]] = {}
+        if self._conn is not None or self.path.exists():
+            try:
+                with self._db_lock:
+                    rows = self._connect().execute("SELECT org_id, rate, updated_at FROM rates").fetchall()
+                found = {org_id: (rate, updated_at) for org_id, rate, updated_at in rows}
+            except sqlite3.Error:
+                pass
+        with self._cond:
+            found.update(self._inflight_rates)
+            found.update(self._pending_rates)
+        return found
+
+    def count(self, kind: str) -> int:
+        """Mappings of one kind, on disk and buffered. Flushes the buffer first."""
+        self.flush()
+        try:
+            with self._db_lock:
+                return self._connect().execute("SELECT COUNT(*) FROM mappings WHERE kind = ?", (kind,)).fetchone()[0]
+        except sqlite3.Error:
+            return 0
+
+    def items(self, kind: str) -> Iterator[Tuple[str, str]]:
+        """Every (identifier, org ID) of one kind. Flushes the buffer first."""
+        self.flush()
+        try:
+            with self._db_lock:
+                rows = self._connect().execute("SELECT id, org_id FROM mappings WHERE kind = ?", (kind,)).fetchall()
+        except sqlite3.Error:
+            rows = []
+        return iter(rows)
+
+    # ------------------------------------------------------------------
+    # Writes
+    # ------------------------------------------------------------------
+
+    def put(self, kind: str, identifier: str, org_id: str) -> None:
+        """Buffer a mapping; the writer thread stores it after the debounce interval."""
+        with self._cond:
+            self._pending[(kind, identifier)] = org_id
+            if self._writer is None or not self._writer.is_alive():
+                self._writer = threading.Thread(target=self._run, name="meraki-mapping-store", daemon=True)
+                self._writer.start()
+            if len(self._pending) == 1 or len(self._pending) >= self._max_batch:
+                self._cond.notify()
+
+    def put_many(self, kind: str, mapping: Dict[str, str]) -> None:
+        """Buffer many mappings of one kind at once; see put()."""
+        if not mapping:
+            return
+        with self._cond:
+            was_empty = not self._pending
+            self._pending.update(((kind, identifier), org_id) for identifier, org_id in mapping.items())
+            if self._writer is None or not self._writer.is_alive():
+                self._writer = threading.Thread(target=self._run, name="meraki-mapping-store", daemon=True)
+                self._writer.start()
+            if was_empty or len(self._pending) >= self._max_batch:
+                self._cond.notify()
+
+    def put_rate(self, org_id: str, rate: float, updated_at: Optional[float] = None) -> None:
+        """Buffer an org's bucket rate, as of updated_at (epoch seconds, default now); written like put()."""
+        with self._cond:
+            was_empty = not self._pending and not self._pending_rates
+            self._pending_rates[org_id] = (rate, time.time() if updated_at is None else updated_at)
+            if self._writer is None or not self._writer.is_alive():
+                self._writer = threading.Thread(target=self._run, name="meraki-mapping-store", daemon=True)
+                self._writer.start()
+            if was_empty:
+                self._cond.notify()
+
+    def flush_soon(self) -> None:
+        """Have the writer store the buffer now rather than after the debounce, without waiting for it."""
+        if self._conn is None:
+            # Create the file now, so it exists once this returns; the writer may be mid-batch otherwise
+            try:
+                with self._db_lock:
+                    self._connect()
+            except sqlite3.Error as e:
+                self._log(f"could not open cache {self.path} ({e})")
+        with self._cond:
+            self._urgent = True
+            self._cond.notify()
+
+    def flush(self) -> int:
+        """Store the buffer on the calling thread. Returns the number of mappings written."""
+        with self._db_lock:
+            with self._cond:
+                batch, self._pending = self._pending, {}
+                rates, self._pending_rates = self._pending_rates, {}
+                self._inflight = batch
+                self._inflight_rates = rates
+            try:
+                self._write_rows(
+                    self._connect(),
+                    [(kind, ident, org) for (kind, ident), org in batch.items()],
+                    rates=[(org, rate, at) for org, (rate, at) in rates.items()],
+                )
+            except sqlite3.Error as e:
+                self._log(f"could not write cache {self.path} ({e}), will retry")
+                with self._cond:
+                    # Mappings and rates learned during the write are newer than the failed batch
+                    self._pending = {**batch, **self._pending}
+                    self._pending_rates = {**rates, **self._pending_rates}
+                return 0
+            finally:
+                with self._cond:
+                    self._inflight = {}
+                    self._inflight_rates = {}
+        return len(batch)
+
+    @staticmethod
+    def _write_rows(
+        conn: sqlite3.Connection,
+        rows: List[Tuple[str, str, str]],
+        saved_at: Optional[str] = None,
+        rates: Iterable[Tuple[str, float, float]] = (),
+    ) -> None:
+        conn.execute("BEGIN IMMEDIATE")
+        try:
+            conn.executemany("INSERT OR REPLACE INTO mappings VALUES (?, ?, ?)", rows)
+            conn.executemany("INSERT OR REPLACE INTO rates VALUES (?, ?, ?)", rates)
+            conn.execute("INSERT OR REPLACE INTO meta VALUES ('saved_at', ?)", (saved_at or _now_saved_at(),))
+            conn.execute("COMMIT")
+        except sqlite3.Error:
+            conn.execute("ROLLBACK")
+            raise
+
+    def _run(self) -> None:
+        """Writer thread: wait for mappings, let more arrive for the debounce interval, write them in one batch."""
+        while True:
+            with self._cond:
+                while not self._pending and not self._pending_rates and not self._urgent:
+                    if not self._cond.wait(timeout=30.0) and not self._pending and not self._pending_rates:
+                        # Idle: exit, put() starts a new writer when needed
+                        self._writer = None
+                        return
+                if not self._urgent and len(self._pending) < self._max_batch:
+                    self._cond.wait(timeout=self._debounce)
+                self._urgent = False
+            written = self.flush()
+            if written:
+                self._log(f"saved {written} mappings to {self.path}")
+
+    def close(self) -> None:
+        """Write the buffer and close the connection. A later lookup or write reopens it."""
+        if self._pending or self._pending_rates:
+            self.flush()
+        with self._db_lock:
+            if self._conn is not None:
+                self._conn.close()
+                self._conn = None
+        _open_stores.discard(self)
+
+
+class MappingTable:
+    """Dict-like view of one kind of mapping, backed by a MappingStore.
+
+    Entries this process reads or writes are kept in memory, up to memo_size of
+    them; older ones are dropped and re-read from the store when needed. Identifiers
+    the store did not have are remembered too, so a miss is only queried once
+    until the identifier is set. Without a store it is a plain in-memory map.
+
+    get() may query the store on the calling thread. Callers that must not block
+    (the async limiter, on the event loop) use cached() and needs_lookup(), run
+    fetch() in a worker thread and hand its result to note().
+    """
+
+    def __init__(self, store: Optional[MappingStore], kind: str, memo_size: int = 100_000):
+        self._store = store
+        self._kind = kind
+        self._memo_size = memo_size
+        self._memo: Dict[str, str] = {}
+        # Identifiers the store had no mapping for
+        self._misses: Set[str] = set()
+
+    def _remember(self, identifier: str, org_id: str) -> None:
+        memo = self._memo
+        if self._store is not None and len(memo) >= self._memo_size and identifier not in memo:
+            # Drop the oldest quarter; they are in the store
+            for key in list(islice(memo, self._memo_size // 4)):
+                del memo[key]
+        memo[identifier] = org_id
+        self._misses.discard(identifier)
+
+    def get(self, identifier: str, default: Optional[str] = None) -> Optional[str]:
+        org_id = self._memo.get(identifier)
+        if org_id is None and self.needs_lookup(identifier):
+            org_id = self.fetch(identifier)
+            self.note(identifier, org_id)
+        return default if org_id is None else org_id
+
+    def cached(self, identifier: str) -> Optional[str]:
+        """The org ID of an identifier held in memory, without querying the store."""
+        return self._memo.get(identifier)
+
+    def needs_lookup(self, identifier: str) -> bool:
+        """Whether the store may have a mapping this table has not read yet."""
+        return self._store is not None and identifier not in self._memo and identifier not in self._misses
+
+    def fetch(self, identifier: str) -> Optional[str]:
+        """The store's org ID for an identifier. Only reads the store, so it may run on any thread."""
+        return self._store.get(self._kind, identifier) if self._store is not None else None
+
+    def note(self, identifier: str, org_id: Optional[str]) -> None:
+        """Record the result of fetch(): remember a mapping, or that the store has none.
+
+        An entry set while fetch() ran is newer and kept.
+        """
+        if identifier in self._memo:
+            return
+        if org_id is not None:
+            self._remember(identifier, org_id)
+        else:
+            if len(self._misses) >= self._memo_size:
+                self._misses.clear()
+            self._misses.add(identifier)
+
+    def __getitem__(self, identifier: str) -> str:
+        org_id = self.get(identifier)
+        if org_id is None:
+            raise KeyError(identifier)
+        return org_id
+
+    def __setitem__(self, identifier: str, org_id: str) -> None:
+        org_id = sys.intern(org_id)
+        self._remember(identifier, org_id)
+        if self._store is not None:
+            self._store.put(self._kind, identifier, org_id)
+
+    def update(self, mapping: Dict[str, str]) -> int:
+        """Set many entries at once, with one store lookup and write for the lot. Returns how many changed."""
+        memo = self._memo
+        stored: Dict[str, str] = {}
+        if self._store is not None:
+            unknown = [identifier for identifier in mapping if self.needs_lookup(identifier)]
+            if unknown:
+                stored = self._store.get_many(self._kind, unknown)
+        changed = {
+            identifier: sys.intern(org_id)
+            for identifier, org_id in mapping.items()
+            if (memo.get(identifier) or stored.get(identifier)) != org_id
+        }
+        for identifier, org_id in changed.items():
+            self._remember(identifier, org_id)
+        if self._store is not None:
+            self._store.put_many(self._kind, changed)
+        return len(changed)
+
+    def __contains__(self, identifier: object) -> bool:
+        return isinstance(identifier, str) and self.get(identifier) is not None
+
+    def __len__(self) -> int:
+        if self._store is None:
+            return len(self._memo)
+        return self._store.count(self._kind)
+
+    def __bool__(self) -> bool:
+        return bool(self._memo) or (self._store is not None and len(self) > 0)
+
+    def items(self) -> Iterator[Tuple[str, str]]:
+        if self._store is None:
+            return iter(list(self._memo.items()))
+        return self._store.items(self._kind)
@@ -0,0 +1,296 @@
+"""Read-through cache for GET responses.
+
+Reporting jobs often call the same read endpoints (getOrganizationNetworks, getNetwork)
+hundreds of times per run. Every one of those calls spends org rate budget on data that
+has not changed. This module caches successful GET responses, sitting under the
+session's retry loop:
+
+- Keys are the operation, the absolute URL and the encoded query params
+- Each operation can have its own TTL; a TTL of 0 disables caching for it
+- Entries are evicted least-recently-used once the backend is full
+- A successful POST/PUT/DELETE drops cached entries for the same resource path,
+  its sub-resources, and its parent collection (updateNetworkApplianceVlan on
+  /networks/N/appliance/vlans/10 drops getNetworkApplianceVlans on
+  /networks/N/appliance/vlans)
+
+Two backends are provided: MemoryCacheBackend (per process) and DiskCacheBackend
+(SQLite, shared across runs and processes). Entries store the raw body bytes and are
+decoded on every hit, so callers never share (or mutate) a cached object.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import sqlite3
+import threading
+import time
+from collections import OrderedDict
+from pathlib import Path
+from typing import Any, Dict, NamedTuple, Optional, Union
+from urllib.parse import urlsplit
+
+from meraki.encoding import encode_meraki_params
+from meraki.exceptions import SessionInputError
+
+RESPONSE_CACHE_BACKENDS = ("memory", "disk")
+
+# Response headers replayed on a cache hit (Link drives pagination).
+_REPLAYED_HEADERS = ("content-type", "link")
+
+
+class CacheEntry(NamedTuple):
+    """One cached GET response."""
+
+    expires_at: float
+    path: str
+    status_code: int
+    headers: Dict[str, str]
+    content: bytes
+
+
+def resource_path(url: str) -> str:
+    """The URL path without query string or trailing slash, used for invalidation."""
+    return urlsplit(url).path.rstrip("/")
+
+
+def request_key(operation: str, url: str, params: Any = None) -> str:
+    """Identity of a GET: operation, absolute URL and the encoded, sorted query params."""
+    if isinstance(params, dict):
+        params = sorted(params.items())
+    encoded = encode_meraki_params(params) if params else ""
+    return f"{operation} {url}?{encoded}"
+
+
+class MemoryCacheBackend:
+    """In-process LRU backend. Thread-safe."""
+
+    def __init__(self, max_entries: int = 1024):
+        self._max_entries = max_entries
+        self._entries: "OrderedDict[str, CacheEntry]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def get(self, key: str) -> Optional[CacheEntry]:
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None:
+                self._entries.move_to_end(key)
+            return entry
+
+    def set(self, key: str, entry: CacheEntry) -> None:
+        with self._lock:
+            self._entries[key] = entry
+            self._entries.move_to_end(key)
+            while len(self._entries) > self._max_entries:
+                self._entries.popitem(last=False)
+
+    def delete(self, key: str) -> None:
+        with self._lock:
+            self._entries.pop(key, None)
+
+    def invalidate(self, path: str, parent: str) -> int:
+        """Drop entries for path, anything under path, and parent. Returns the count dropped."""
+        prefix = path + "/"
+        with self._lock:
+            stale = [
+                key
+                for key, entry in self._entries.items()
+                if entry.path == path or entry.path == parent or entry.path.startswith(prefix)
+            ]
+            for key in stale:
+                del self._entries[key]
+        return len(stale)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+
+
+class DiskCacheBackend:
+    """SQLite backend, persisted across runs and safe to share between processes.
+
+    Storage errors (locked or unwritable database) are treated as cache misses;
+    the cache never fails a request.
+    """
+
+    _SCHEMA = (
+        "CREATE TABLE IF NOT EXISTS responses ("
+        "key TEXT PRIMARY KEY, path TEXT NOT NULL, expires_at REAL NOT NULL, accessed_at REAL NOT NULL, "
+        "status_code INTEGER NOT NULL, headers TEXT NOT NULL, content BLOB NOT NULL)"
+    )
+
+    def __init__(self, path: str, max_entries: int = 1024):
+        self._path = path
+        self._max_entries = max_entries
+        self._lock = threading.Lock()
+        Path(path).parent.mkdir(parents=True, exist_ok=True)
+        self._conn = sqlite3.connect(path, timeout=5.0, check_same_thread=False, isolation_level=None)
+        with self._lock:
+            self._conn.execute(self._SCHEMA)
+            self._conn.execute("CREATE INDEX IF NOT EXISTS responses_path ON responses (path)")
+
+    def __len__(self) -> int:
+        with self._lock:
+            return self._conn.execute("SELECT COUNT(*) FROM responses").fetchone()[0]
+
+    def get(self, key: str) -> Optional[CacheEntry]:
+        try:
+            with self._lock:
+                row = self._conn.execute(
+                    "SELECT expires_at, path, status_code, headers, content FROM responses WHERE key = ?", (key,)
+                ).fetchone()
+                if row is None:
+                    return None
+                self._conn.execute("UPDATE responses SET accessed_at = ? WHERE key = ?", (time.time(), key))
+        except sqlite3.Error:
+            return None
+        expires_at, path, status_code, headers, content = row
+        return CacheEntry(expires_at, path, status_code, _unpack_headers(headers), bytes(content))
+
+    def set(self, key: str, entry: CacheEntry) -> None:
+        try:
+            with self._lock:
+                self._conn.execute(
+                    "INSERT OR REPLACE INTO responses VALUES (?, ?, ?, ?, ?, ?, ?)",
+                    (
+                        key,
+                        entry.path,
+                        entry.expires_at,
+                        time.time(),
+                        entry.status_code,
+                        _pack_headers(entry.headers),
+                        entry.content,
+                    ),
+                )
+                self._conn.execute(
+                    "DELETE FROM responses WHERE key IN "
+                    "(SELECT key FROM responses ORDER BY accessed_at DESC LIMIT -1 OFFSET ?)",
+                    (self._max_entries,),
+                )
+        except sqlite3.Error:
+            pass
+
+    def delete(self, key: str) -> None:
+        try:
+            with self._lock:
+                self._conn.execute("DELETE FROM responses WHERE key = ?", (key,))
+        except sqlite3.Error:
+            pass
+
+    def invalidate(self, path: str, parent: str) -> int:
+        """Drop entries for path, anything under path, and parent. Returns the count dropped."""
+        # substr() rather than LIKE: resource IDs may contain LIKE wildcards (_ and %).
+        prefix = path + "/"
+        try:
+            with self._lock:
+                cursor = self._conn.execute(
+                    "DELETE FROM responses WHERE path = ? OR path = ? OR substr(path, 1, ?) = ?",
+                    (path, parent, len(prefix), prefix),
+                )
+                return cursor.rowcount
+        except sqlite3.Error:
+            return 0
+
+    def clear(self) -> None:
+        try:
+            with self._lock:
+                self._conn.execute("DELETE FROM responses")
+        except sqlite3.Error:
+            pass
+
+    def close(self) -> None:
+        with self._lock:
+            self._conn.close()
+
+
+def _pack_headers(headers: Dict[str, str]) -> str:
+    return "\n".join(f"{name}:{value}" for name, value in headers.items())
+
+
+def _unpack_headers(packed: str) -> Dict[str, str]:
+    return dict(line.split(":", 1) for line in packed.splitlines() if line)
+
+
+class ResponseCache:
+    """TTL and invalidation policy over a cache backend.
+
+    Args:
+        backend: "memory", "disk", or a backend instance.
+        ttl: default seconds a cached GET stays fresh.
+        ttls: per-operation TTL overrides, e.g. {"getNetworkClients": 0}.
+        max_entries: LRU bound for the built-in backends.
+        path: SQLite file for the "disk" backend.
+        namespace: key prefix isolating entries (the session passes an API key hash,
+            so a shared disk cache never serves one key's data to another).
+    """
+
+    def __init__(
+        self,
+        backend: Union[str, Any] = "memory",
+        ttl: float = 60.0,
+        ttls: Optional[Dict[str, float]] = None,
+        max_entries: int = 1024,
+        path: str = "",
+        namespace: str = "",
+    ):
+        if backend == "memory":
+            backend = MemoryCacheBackend(max_entries)
+        elif backend == "disk":
+            if not path:
+                raise SessionInputError("response_cache_path", path, "The disk response cache needs a file path.", None)
+            backend = DiskCacheBackend(path, max_entries)
+        elif isinstance(backend, str):
+            raise SessionInputError(
+                "response_cache",
+                backend,
+                f"response_cache must be one of {', '.join(RESPONSE_CACHE_BACKENDS)}, or a cache backend instance.",
+                None,
+            )
+        self.backend = backend
+        self._ttl = ttl
+        self._ttls = dict(ttls or {})
+        self._namespace = namespace
+        self.hits = 0
+        self.misses = 0
+
+    def ttl_for(self, operation: str) -> float:
+        return self._ttls.get(operation, self._ttl)
+
+    def key(self, operation: str, url: str, params: Any = None) -> str:
+        return self._namespace + request_key(operation, url, params)
+
+    def get(self, key: str) -> Optional[CacheEntry]:
+        """Return a fresh entry, or None (expired entries are dropped)."""
+        entry = self.backend.get(key)
+        if entry is not None and entry.expires_at <= time.time():
+            self.backend.delete(key)
+            entry = None
+        if entry is None:
+            self.misses += 1
+        else:
+            self.hits += 1
+        return entry
+
+    def put(self, key: str, operation: str, url: str, response: Any) -> None:
+        """Cache a successful GET response, unless its operation's TTL is 0."""
+        ttl = self.ttl_for(operation)
+        if ttl <= 0:
+            return
+        headers = {name: response.headers[name] for name in _REPLAYED_HEADERS if name in response.headers}
+        entry = CacheEntry(time.time() + ttl, resource_path(url), response.status_code, headers, response.content)
+        self.backend.set(key, entry)
+
+    def invalidate(self, url: str) -> int:
+        """Drop entries a write to url may have made stale."""
+        path = resource_path(url)
+        return self.backend.invalidate(path, path.rsplit("/", 1)[0])
+
+    def clear(self) -> None:
+        self.backend.clear()
+
+
+def api_key_namespace(api_key: str) -> str:
+    """Short, non-reversible key prefix for one API key."""
+    return hashlib.sha256(api_key.encode()).hexdigest()[:16] + ":"
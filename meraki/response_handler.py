@@ -3,5 +3,8 @@ def handle_3xx(self, response):
     substring = "meraki.com/api/v"
     if substring not in abs_url:
         substring = "meraki.cn/api/v"
-    self._base_url = abs_url[: abs_url.find(substring) + len(substring) + 1]
+    if substring in abs_url:
+        # Only a redirect to another Dashboard API host moves the base URL. For any other
+        # Location, find() is -1 and the slice would store the URL's first few characters.
+        self._base_url = abs_url[: abs_url.find(substring) + len(substring) + 1]
     return abs_url
@@ -5,17 +5,30 @@ from __future__ import annotations
 import asyncio
 import json
 import random
+import time
 import urllib.parse
+import weakref
+from concurrent.futures import ProcessPoolExecutor
 from datetime import datetime, timezone
-from typing import Any, Dict, Optional
+from typing import Any, AsyncIterator, Dict, Optional, Tuple
 
 import httpx
 
+from meraki.codec import JSON_CODEC_NAMES, JSONItemStream, loads_in_worker
 from meraki.common import validate_base_url, validate_user_agent
-from meraki.config import AIO_MAXIMUM_CONCURRENT_REQUESTS
+from meraki.config import (
+    AIO_COALESCE_IDENTICAL_GETS,
+    AIO_DECODE_OFFLOAD_EXECUTOR,
+    AIO_DECODE_OFFLOAD_THRESHOLD,
+    AIO_MAXIMUM_CONCURRENT_REQUESTS,
+)
 from meraki.exceptions import APIError, SessionInputError
-from meraki.smart_flow import AsyncOrgRateLimiter
-from meraki.session.base import SessionBase, apply_meraki_param_encoding
+from meraki.response_cache import request_key
+from meraki.smart_flow import AsyncOrgRateLimiter, request_priority
+from meraki.session.base import SessionBase, apply_meraki_param_encoding, retry_after_seconds
+from meraki.session.sharding import SHARD_BUFFER_ITEMS, SHARD_DONE, ShardFailed, ShardJoiner, merge_shard_results
+
+DECODE_OFFLOAD_EXECUTORS = ("thread", "process")
 
 
 class AsyncRestSession(SessionBase):
@@ -31,10 +44,42 @@ class AsyncRestSession(SessionBase):
         logger,
         api_key,
         maximum_concurrent_requests: int = AIO_MAXIMUM_CONCURRENT_REQUESTS,
+        coalesce_identical_gets: bool = AIO_COALESCE_IDENTICAL_GETS,
+        decode_offload_threshold: int = AIO_DECODE_OFFLOAD_THRESHOLD,
+        decode_offload_executor: str = AIO_DECODE_OFFLOAD_EXECUTOR,
         **kwargs: Any,
     ) -> None:
         super().__init__(logger, api_key, **kwargs)
 
+        # Single-flight GETs: request key -> the task every identical caller awaits
+        self._coalesce_identical_gets = coalesce_identical_gets
+        self._in_flight: Dict[str, asyncio.Future] = {}
+        self._parameters["coalesce_identical_gets"] = coalesce_identical_gets
+
+        # Large response bodies decode off the event loop; small ones inline, timed
+        if decode_offload_executor not in DECODE_OFFLOAD_EXECUTORS:
+            raise SessionInputError(
+                "decode_offload_executor",
+                decode_offload_executor,
+                f"decode_offload_executor must be one of {', '.join(DECODE_OFFLOAD_EXECUTORS)}.",
+                None,
+            )
+        if decode_offload_executor == "process" and self._codec.name not in JSON_CODEC_NAMES:
+            raise SessionInputError(
+                "decode_offload_executor",
+                decode_offload_executor,
+                "Process-pool decoding needs a built-in json_codec, given by name.",
+                None,
+            )
+        self._decode_offload_threshold = decode_offload_threshold
+        self._decode_offload_executor = decode_offload_executor
+        self._decode_process_pool: Optional[ProcessPoolExecutor] = None
+        self.decode_loop_seconds = 0.0
+        self.decodes_inline = 0
+        self.decodes_offloaded = 0
+        self._parameters["decode_offload_threshold"] = decode_offload_threshold
+        self._parameters["decode_offload_executor"] = decode_offload_executor
+
         # Build headers dict
         headers = self._build_headers()
         # Async user-agent prefix
@@ -48,24 +93,33 @@ class AsyncRestSession(SessionBase):
         }
         if self._certificate_path:
             client_kwargs["verify"] = self._certificate_path
-        if self._requests_proxy:
-            client_kwargs["proxy"] = self._requests_proxy
 
-        # Persistent async client with connection pooling
-        self._client = httpx.AsyncClient(**client_kwargs)
+        # Persistent async client with connection pooling, one per egress (requests_egresses)
+        self._clients = [
+            httpx.AsyncClient(**self._egress_client_kwargs(client_kwargs, egress, httpx.AsyncHTTPTransport))
+            for egress in self._egresses
+        ]
+        self._client = self._clients[0]
 
         # Per-org smart flow (opt-in)
         if self._smart_flow_enabled:
-            self._smart_flow = AsyncOrgRateLimiter(
-                rate=self._smart_flow_org_rate,
-                capacity=int(self._smart_flow_org_rate),
-                global_rate=self._smart_flow_global_rate,
-                cache_path=self._smart_flow_cache_path or None,
-                cache_ttl=self._smart_flow_cache_ttl,
-                logger=self._logger if self._smart_flow_logging else None,
+            self._attach_smart_flow(
+                lambda: AsyncOrgRateLimiter(
+                    rate=self._smart_flow_org_rate,
+                    capacity=int(self._smart_flow_org_rate),
+                    global_rate=self._smart_flow_global_rate,
+                    cache_path=self._smart_flow_cache_path or None,
+                    cache_ttl=self._smart_flow_cache_ttl,
+                    logger=self._logger if self._smart_flow_logging else None,
+                    codec=self._codec,
+                    shared_dir=self._smart_flow_shared_dir or None,
+                    hydration_workers=self._smart_flow_hydration_workers,
+                    rate_half_life=self._smart_flow_rate_half_life,
+                    calibrate_interval=self._smart_flow_calibrate_interval,
+                    endpoint_classes=self._smart_flow_endpoint_classes,
+                    egresses=len(self._egresses),
+                )
             )
-            self._smart_flow.set_resolver(self._resolve_org_for_limiter)
-            self._smart_flow.set_hydrator(self._hydrate_org_for_limiter)
 
         # Trigger the property setter to bind the correct get_pages implementation
         self.use_iterator_for_get_pages = self._use_iterator_for_get_pages
@@ -86,11 +140,19 @@ class AsyncRestSession(SessionBase):
     # Abstract method implementations
     # ------------------------------------------------------------------
 
-    async def _send_request(self, method: str, url: str, **kwargs: Any) -> httpx.Response:
-        """Send HTTP request via httpx.AsyncClient (pool limits enforce concurrency per D-02)."""
+    async def _send_request(self, method: str, url: str, egress: int = 0, **kwargs: Any) -> httpx.Response:
+        """Send HTTP request via the egress's httpx.AsyncClient (pool limits enforce concurrency per D-02)."""
+        client = self._clients[egress] if len(self._clients) > 1 else self._client
         # Pre-encode Meraki array-of-objects params; httpx mishandles them.
         url = apply_meraki_param_encoding(url, kwargs)
-        response = await self._client.request(method, url, follow_redirects=False, **kwargs)
+        if kwargs.pop("stream", False):
+            # Leave 2xx bodies on the wire for the caller; error handlers need the full body.
+            request = client.build_request(method, url, **kwargs)
+            response = await client.send(request, stream=True, follow_redirects=False)
+            if not 200 <= response.status_code < 300:
+                await response.aread()
+            return response
+        response = await client.request(method, url, follow_redirects=False, **kwargs)
         return response
 
     async def _sleep(self, seconds: float) -> None:
@@ -98,13 +160,52 @@ class AsyncRestSession(SessionBase):
         await asyncio.sleep(seconds)
 
     def _transport_kwargs(self, kwargs: Dict[str, Any]) -> Dict[str, Any]:
-        """No-op: httpx config handled at client initialization level."""
-        return kwargs
+        """Encode json= bodies with the session codec; other httpx config lives on the client."""
+        return self._encode_json_body(kwargs)
 
     # ------------------------------------------------------------------
     # Smart flow resolver
     # ------------------------------------------------------------------
 
+    async def _decode_async(self, response: httpx.Response) -> Any:
+        """Decode a response body, off the event loop once it reaches decode_offload_threshold bytes.
+
+        Inline decodes are timed into decode_loop_seconds: the time the loop spent
+        decoding instead of serving other coroutines.
+        """
+        content = response.content
+        if self._decode_offload_threshold and len(content) >= self._decode_offload_threshold:
+            self.decodes_offloaded += 1
+            loop = asyncio.get_running_loop()
+            if self._decode_offload_executor == "process":
+                if self._decode_process_pool is None:
+                    self._decode_process_pool = ProcessPoolExecutor()
+                return await loop.run_in_executor(self._decode_process_pool, loads_in_worker, self._codec.name, content)
+            return await loop.run_in_executor(None, self._codec.loads, content)
+
+        start = time.perf_counter()
+        try:
+            return self._codec.loads(content)
+        finally:
+            self.decode_loop_seconds += time.perf_counter() - start
+            self.decodes_inline += 1
+
+    async def _cache_hit_async(
+        self, cache_key: Optional[str], abs_url: str, metadata: Dict[str, Any]
+    ) -> Optional[tuple[httpx.Response, Any]]:
+        """SessionBase._cache_hit(), decoding through _decode_async()."""
+        response = self._cached_response(cache_key, abs_url)
+        if response is None:
+            return None
+        try:
+            body = await self._decode_async(response) if response.content.strip() else None
+        except ValueError:
+            self._response_cache.backend.delete(cache_key)
+            return None
+        if self._logger:
+            self._logger.info(f"{metadata['tags'][0]}, {metadata['operation']} - cache hit")
+        return response, body
+
     async def _acquire_global_bucket(self) -> None:
         """Gate internal hydration/resolution traffic on the global bucket.
 
@@ -128,12 +229,23 @@ class AsyncRestSession(SessionBase):
             await self._acquire_global_bucket()
             response = await self._client.request("GET", endpoint, follow_redirects=True)
             if response.status_code == 200:
-                data = response.json()
+                data = await self._decode_async(response)
                 return data.get("organizationId")
         except Exception:
             pass
         return None
 
+    async def _sample_usage_for_limiter(self, org_id: str, timespan: int) -> Any:
+        """Fetch an org's API request counts per 2-minute interval (the finest the API offers) for calibration."""
+        endpoint = f"{self._base_url}/organizations/{org_id}/apiRequests/overview/responseCodes/byInterval"
+        await self._acquire_global_bucket()
+        response = await self._client.request(
+            "GET", endpoint, params={"timespan": timespan, "interval": 120}, follow_redirects=True
+        )
+        if response.status_code == 200:
+            return await self._decode_async(response)
+        return None
+
     async def _hydrate_org_for_limiter(self, org_id: str) -> None:
         """Fetch all networks and devices for an org and register them with the limiter."""
         networks = await self._fetch_all_pages(f"{self._base_url}/organizations/{org_id}/networks?perPage=1000")
@@ -154,7 +266,7 @@ class AsyncRestSession(SessionBase):
             response = await self._client.request("GET", url, follow_redirects=True)
             if response.status_code != 200:
                 break
-            page = response.json()
+            page = await self._decode_async(response)
             if isinstance(page, list):
                 results.extend(page)
             next_link = response.links.get("next", {}).get("url")
@@ -170,11 +282,26 @@ class AsyncRestSession(SessionBase):
 
         Mirrors SessionBase.request() but awaits _send_request and _sleep.
         """
+        response, _ = await self._request(metadata, method, url, **kwargs)
+        return response
+
+    async def _request(
+        self, metadata: Dict[str, Any], method: str, url: str, stream: bool = False, **kwargs: Any
+    ) -> tuple[Optional[httpx.Response], Any]:
+        """Request pipeline behind request(); returns (response, parsed_body).
+
+        Mirrors SessionBase._request(): parsed_body is the GET JSON body decoded
+        once by _handle_success_async, so callers never re-parse it. With
+        stream=True a 2xx body is left unread for the caller (parsed_body is None).
+        Identical concurrent GETs are coalesced onto one request (see _join_flight).
+        """
         tag = metadata["tags"][0]
         operation = metadata["operation"]
 
         # Prepare transport-specific kwargs
         kwargs = self._transport_kwargs(kwargs)
+        if stream:
+            kwargs["stream"] = True
 
         # Coerce non-str URLs (e.g. yarl.URL from legacy callers) to plain str
         if not isinstance(url, str):
@@ -189,15 +316,74 @@ class AsyncRestSession(SessionBase):
         if self._simulate and method != "GET":
             if self._logger:
                 self._logger.info(f"{tag}, {operation} - SIMULATED")
-            return None
+            return None, None
+
+        # Serve fresh cached GETs without spending rate budget
+        cache_key = self._cache_key(metadata, method, abs_url, kwargs, stream)
+        cached = await self._cache_hit_async(cache_key, abs_url, metadata)
+        if cached is not None:
+            return cached
+
+        # Identical concurrent GETs share one in-flight request (smart flow acquire and retries included)
+        if self._coalesce_identical_gets and method == "GET" and not stream:
+            flight_key = request_key(operation, abs_url, kwargs.get("params"))
+            return await self._join_flight(flight_key, metadata, abs_url, kwargs, cache_key)
+
+        return await self._request_with_retries(metadata, method, abs_url, kwargs, stream, cache_key)
 
+    async def _join_flight(
+        self, flight_key: str, metadata: Dict[str, Any], abs_url: str, kwargs: Dict[str, Any], cache_key: Optional[str]
+    ) -> tuple[Optional[httpx.Response], Any]:
+        """Await the in-flight request for flight_key, starting it if none is running.
+
+        The request runs as its own task and every caller awaits it through
+        asyncio.shield(), so a cancelled caller never cancels the others. The first
+        caller gets the parsed body; later callers decode their own copy from the
+        shared response so no two callers hold the same mutable object.
+        """
+        flight = self._in_flight.get(flight_key)
+        leader = flight is None
+        if leader:
+            flight = asyncio.ensure_future(self._request_with_retries(metadata, "GET", abs_url, kwargs, False, cache_key))
+            self._in_flight[flight_key] = flight
+            flight.add_done_callback(lambda done: self._land_flight(flight_key, done))
+        elif self._logger:
+            self._logger.debug(f"{metadata['tags'][0]}, {metadata['operation']} - joined in-flight GET {abs_url}")
+
+        response, parsed_body = await asyncio.shield(flight)
+        if leader or parsed_body is None:
+            return response, parsed_body
+        return response, await self._decode_async(response)
+
+    def _land_flight(self, flight_key: str, flight: asyncio.Future) -> None:
+        if self._in_flight.get(flight_key) is flight:
+            del self._in_flight[flight_key]
+        # Mark the outcome retrieved even if every caller was cancelled.
+        if not flight.cancelled():
+            flight.exception()
+
+    async def _request_with_retries(
+        self,
+        metadata: Dict[str, Any],
+        method: str,
+        abs_url: str,
+        kwargs: Dict[str, Any],
+        stream: bool,
+        cache_key: Optional[str],
+    ) -> tuple[Optional[httpx.Response], Any]:
+        """The retry loop and status dispatch behind _request()."""
+        tag = metadata["tags"][0]
+        operation = metadata["operation"]
         retries = self._maximum_retries
         response: Optional[httpx.Response] = None
+        endpoint_class = self._smart_flow.endpoint_class(operation, metadata["tags"]) if self._smart_flow else None
 
         while retries > 0:
-            # Per-org rate limiting (proactive throttle before sending)
+            # Per-org rate limiting (proactive throttle before sending), which also picks the egress
             if self._smart_flow:
-                await self._smart_flow.acquire(abs_url)
+                egress = await self._smart_flow.acquire(abs_url, request_priority(self._smart_flow_priority), endpoint_class)
+            else:
+                egress = self._next_egress()
 
             # Attempt the request
             try:
@@ -205,7 +391,7 @@ class AsyncRestSession(SessionBase):
                     await response.aclose()
                 if self._logger:
                     self._logger.info(f"{method} {abs_url}")
-                response = await self._send_request(method, abs_url, **kwargs)
+                response = await self._send_request(method, abs_url, egress=egress, **kwargs)
             except httpx.HTTPError as e:
                 if self._logger:
                     self._logger.warning(f"{tag}, {operation} - {e}, retrying in 1 second")
@@ -230,31 +416,32 @@ class AsyncRestSession(SessionBase):
                 abs_url = self._handle_redirect_async(response)
             elif 200 <= status < 300:
                 if self._smart_flow:
-                    self._smart_flow.on_success(abs_url)
+                    self._smart_flow.on_success(abs_url, endpoint_class, egress)
                 # _handle_success_async returns (response, parsed_body); parsed_body
                 # is the decoded GET body (or None) so we don't parse JSON twice.
-                result, parsed_body = await self._handle_success_async(response, metadata, method)
+                result, parsed_body = await self._handle_success_async(response, metadata, method, stream)
                 if result is None:
                     # JSON decode failure, retry
                     retries -= 1
                     if retries == 0:
-                        raise APIError(metadata, response)
+                        raise APIError(metadata, response, codec=self._codec)
                     await self._sleep(1)
                     continue
-                if self._smart_flow and method == "GET" and parsed_body is not None:
+                if self._smart_flow and method == "GET" and (parsed_body is not None or stream):
                     try:
                         self._smart_flow.learn_from_response(abs_url, parsed_body)
                     except (ValueError, AttributeError):
                         pass
-                return result
+                self._cache_record(cache_key, metadata, method, abs_url, result, parsed_body)
+                return result, parsed_body
             elif status == 429:
                 if self._smart_flow:
-                    self._smart_flow.on_rate_limited(abs_url)
+                    self._smart_flow.on_rate_limited(abs_url, retry_after_seconds(response), endpoint_class, egress)
                 wait = self._handle_rate_limit_async(response, metadata, retries)
                 await self._sleep(wait)
                 retries -= 1
                 if retries == 0:
-                    raise APIError(metadata, response)
+                    raise APIError(metadata, response, codec=self._codec)
             elif status >= 500:
                 request_id = response.headers.get("X-Request-Id") or "none"
                 if self._logger:
@@ -269,11 +456,11 @@ class AsyncRestSession(SessionBase):
                             f"{tag}, {operation} - {status} {reason} failed after retries. "
                             f"Provide this X-Request-Id to Meraki for log lookup: {request_id}"
                         )
-                    raise APIError(metadata, response)
+                    raise APIError(metadata, response, codec=self._codec)
             elif 400 <= status < 500:
                 retries = await self._handle_client_error_async(response, metadata, retries)
 
-        return response
+        return response, None
 
     # ------------------------------------------------------------------
     # Async status handlers
@@ -284,12 +471,13 @@ class AsyncRestSession(SessionBase):
         response: Any,
         metadata: Dict[str, Any],
         method: str,
+        stream: bool = False,
     ) -> tuple[Optional[Any], Optional[Any]]:
         """Handle 2xx responses (async).
 
         Returns (response, parsed_body). parsed_body is the decoded GET JSON body
-        (or None for non-GET / empty bodies), parsed once here so callers do not
-        re-parse. On JSON decode failure returns (None, None) to signal a retry.
+        (or None for non-GET / empty / streamed bodies), parsed once here so callers
+        do not re-parse. On JSON decode failure returns (None, None) to signal a retry.
         """
         tag = metadata["tags"][0]
         operation = metadata["operation"]
@@ -306,8 +494,8 @@ class AsyncRestSession(SessionBase):
 
         # For non-empty GET responses, validate (and capture) the JSON once.
         try:
-            if method == "GET" and response.content.strip():
-                return response, response.json()
+            if not stream and self._has_json_body(method, response):
+                return response, await self._decode_async(response)
             return response, None
         except (json.decoder.JSONDecodeError, ValueError):
             if self._logger:
@@ -337,7 +525,7 @@ class AsyncRestSession(SessionBase):
         status = response.status_code
 
         if not self._wait_on_rate_limit or retries <= 0:
-            raise APIError(metadata, response)
+            raise APIError(metadata, response, codec=self._codec)
 
         if "Retry-After" in response.headers:
             wait = int(response.headers["Retry-After"])
@@ -366,7 +554,7 @@ class AsyncRestSession(SessionBase):
 
         # Parse response body
         try:
-            message = response.json()
+            message = await self._decode_async(response)
             message_is_dict = isinstance(message, dict)
         except (json.decoder.JSONDecodeError, ValueError):
             message_is_dict = False
@@ -389,7 +577,7 @@ class AsyncRestSession(SessionBase):
             await self._sleep(wait)
             retries -= 1
             if retries == 0:
-                raise APIError(metadata, response)
+                raise APIError(metadata, response, codec=self._codec)
             return retries
 
         # Action batch concurrency error
@@ -400,7 +588,7 @@ class AsyncRestSession(SessionBase):
             await self._sleep(wait)
             retries -= 1
             if retries == 0:
-                raise APIError(metadata, response)
+                raise APIError(metadata, response, codec=self._codec)
             return retries
 
         # Retry other 4xx if configured
@@ -411,13 +599,13 @@ class AsyncRestSession(SessionBase):
             await self._sleep(wait)
             retries -= 1
             if retries == 0:
-                raise APIError(metadata, response)
+                raise APIError(metadata, response, codec=self._codec)
             return retries
 
         # Non-retryable client error
         if self._logger:
             self._logger.error(f"{tag}, {operation} - {status} {reason}, {message}")
-        raise APIError(metadata, response)
+        raise APIError(metadata, response, codec=self._codec)
 
     # ------------------------------------------------------------------
     # Convenience HTTP methods
@@ -427,24 +615,12 @@ class AsyncRestSession(SessionBase):
         metadata["method"] = "GET"
         metadata["url"] = url
         metadata["params"] = params
-        response = await self.request(metadata, "GET", url, params=params)
-        if response:
-            if response.content.strip():
-                return response.json()
-        return None
+        _, ret = await self._request(metadata, "GET", url, params=params)
+        return ret
 
     async def get_pages(self, metadata, url, params=None, total_pages=-1, direction="next", event_log_end_time=None):
         pass
 
-    async def _download_page(self, request):
-        response = await request
-        # Guard against 204 No Content pages (empty body -> no JSON to parse).
-        if response.status_code == 204:
-            result = None
-        else:
-            result = response.json()
-        return response, result
-
     async def _get_pages_iterator(
         self,
         metadata,
@@ -454,6 +630,12 @@ class AsyncRestSession(SessionBase):
         direction="next",
         event_log_end_time=None,
     ):
+        shards = self._time_shards(metadata, params, total_pages)
+        if shards:
+            async for item in self._aiter_shards(metadata, url, shards, direction, event_log_end_time):
+                yield item
+            return
+
         if isinstance(total_pages, str) and total_pages.lower() == "all":
             total_pages = -1
         elif isinstance(total_pages, str) and total_pages.isnumeric():
@@ -466,8 +648,11 @@ class AsyncRestSession(SessionBase):
                 None,
             )
         metadata["page"] = 1
+        stream = self._stream_get_pages
 
-        request_task = asyncio.create_task(self._download_page(self.request(metadata, "GET", url, params=params)))
+        # Each task resolves to the (response, parsed_body) carrier from _request();
+        # 204 No Content pages carry a None body, and streamed pages an unread one.
+        request_task = asyncio.create_task(self._request(metadata, "GET", url, params=params, stream=stream))
 
         # Wrap in try/finally so an in-flight prefetch task is cancelled if the
         # consumer breaks early (avoids an orphaned request and "Task pending" warning).
@@ -511,28 +696,36 @@ class AsyncRestSession(SessionBase):
                 else:
                     total_pages = 1
 
-                await response.aclose()
+                if not stream:
+                    await response.aclose()
 
                 total_pages = total_pages - 1
 
                 if total_pages != 0:
-                    request_task = asyncio.create_task(self._download_page(self.request(metadata, "GET", nextlink)))
-
-                return_items = []
-                # just prepare the list
-                if isinstance(results, list):
-                    return_items = results
-                elif isinstance(results, dict) and "items" in results:
-                    return_items = results["items"]
-                # For event log endpoint
-                elif isinstance(results, dict):
-                    if direction == "next":
-                        return_items = results["events"][::-1]
-                    else:
-                        return_items = results["events"]
-
-                for item in return_items:
-                    yield item
+                    request_task = asyncio.create_task(self._request(metadata, "GET", nextlink, stream=stream))
+
+                if stream:
+                    try:
+                        async for item in self._aiter_streamed_items(response, direction):
+                            yield item
+                    finally:
+                        await response.aclose()
+                else:
+                    return_items = []
+                    # just prepare the list
+                    if isinstance(results, list):
+                        return_items = results
+                    elif isinstance(results, dict) and "items" in results:
+                        return_items = results["items"]
+                    # For event log endpoint
+                    elif isinstance(results, dict):
+                        if direction == "next":
+                            return_items = results["events"][::-1]
+                        else:
+                            return_items = results["events"]
+
+                    for item in return_items:
+                        yield item
         finally:
             # Cancel and drain any still-pending prefetch (e.g. consumer broke early).
             if request_task is not None and not request_task.done():
@@ -551,6 +744,77 @@ class AsyncRestSession(SessionBase):
                 except Exception:
                     pass
 
+    def _start_shards(self, metadata, url, shards, direction, event_log_end_time) -> list[asyncio.Task]:
+        """Paginate every time shard as its own task; tasks are returned in output order."""
+        return [
+            asyncio.create_task(
+                self._get_pages_legacy({**metadata, "shard": i + 1}, url, params, -1, direction, event_log_end_time)
+            )
+            for i, params in enumerate(shards)
+        ]
+
+    async def _aiter_shards(self, metadata, url, shards, direction, event_log_end_time) -> AsyncIterator[Any]:
+        """Yield a sharded pull's items in output order while every shard pages as its own task.
+
+        Each shard feeds a queue of at most SHARD_BUFFER_ITEMS items, so a shard later in
+        the output waits for the consumer instead of holding its whole window in memory.
+        """
+        queues = [asyncio.Queue(SHARD_BUFFER_ITEMS) for _ in shards]
+        tasks = [
+            asyncio.create_task(
+                self._feed_shard({**metadata, "shard": i + 1}, url, params, direction, event_log_end_time, queues[i])
+            )
+            for i, params in enumerate(shards)
+        ]
+        joiner = ShardJoiner()
+        try:
+            for items in queues:
+                joiner.begin()
+                while (item := await items.get()) is not SHARD_DONE:
+                    if isinstance(item, ShardFailed):
+                        raise item.error
+                    if joiner.keep(item):
+                        yield item
+                joiner.end()
+        finally:
+            await self._cancel_shards(tasks)
+
+    async def _feed_shard(self, metadata, url, params, direction, event_log_end_time, items: asyncio.Queue) -> None:
+        """Page through one shard into items, ending with SHARD_DONE, or ShardFailed if it raises."""
+        pages = self._get_pages_iterator(metadata, url, params, -1, direction, event_log_end_time)
+        try:
+            async for item in pages:
+                await items.put(item)
+        except Exception as e:
+            await items.put(ShardFailed(e))
+            return
+        finally:
+            await pages.aclose()
+        await items.put(SHARD_DONE)
+
+    @staticmethod
+    async def _cancel_shards(tasks: list[asyncio.Task]) -> None:
+        """Cancel and drain shards still running (consumer stopped early, or a shard failed)."""
+        for task in tasks:
+            task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
+
+    async def _aiter_streamed_items(self, response, direction):
+        """Yield a streamed page's items as they are decoded from the response bytes."""
+        items = JSONItemStream(self._codec)
+        # The event log returns newest-first; the "next" direction reverses each page,
+        # which needs the whole page, so only that case buffers.
+        buffered = []
+        async for chunk in response.aiter_bytes():
+            for item in items.feed(chunk):
+                if items.key == "events" and direction == "next":
+                    buffered.append(item)
+                else:
+                    yield item
+        items.close()
+        for item in reversed(buffered):
+            yield item
+
     async def _get_pages_legacy(
         self,
         metadata,
@@ -560,6 +824,14 @@ class AsyncRestSession(SessionBase):
         direction="next",
         event_log_end_time=None,
     ):
+        shards = self._time_shards(metadata, params, total_pages)
+        if shards:
+            tasks = self._start_shards(metadata, url, shards, direction, event_log_end_time)
+            try:
+                return merge_shard_results(await asyncio.gather(*tasks))
+            finally:
+                await self._cancel_shards(tasks)
+
         if isinstance(total_pages, str) and total_pages.lower() == "all":
             total_pages = -1
         elif isinstance(total_pages, str) and total_pages.isnumeric():
@@ -573,12 +845,8 @@ class AsyncRestSession(SessionBase):
             )
         metadata["page"] = 1
 
-        response = await self.request(metadata, "GET", url, params=params)
-
-        if response.status_code == 204:
-            results = None
-        else:
-            results = response.json()
+        # 204 No Content pages carry no parsed body, so results is None for them
+        response, results = await self._request(metadata, "GET", url, params=params)
 
         # For event log endpoint when using 'next' direction
         if isinstance(results, dict) and metadata["operation"] == "getNetworkEvents" and direction == "next":
@@ -613,18 +881,16 @@ class AsyncRestSession(SessionBase):
             else:
                 break
 
-            response = await self.request(metadata, "GET", nextlink)
+            response, json_response = await self._request(metadata, "GET", nextlink)
             links = response.links
             if isinstance(results, list):
-                results.extend(response.json())
+                results.extend(json_response)
             elif isinstance(results, dict) and "items" in results:
-                json_response = response.json()
                 results["items"].extend(json_response["items"])
                 if "meta" in results:
                     results["meta"]["counts"]["items"]["remaining"] = json_response["meta"]["counts"]["items"]["remaining"]
             # For event log endpoint
             elif isinstance(results, dict):
-                json_response = response.json()
                 start = json_response["pageStartAt"]
                 end = json_response["pageEndAt"]
                 events = json_response["events"]
@@ -649,7 +915,7 @@ class AsyncRestSession(SessionBase):
         response = await self.request(metadata, "POST", url, params=params, json=json)
         if response:
             if response.content.strip():
-                return response.json()
+                return await self._decode_async(response)
         return None
 
     async def put(self, metadata, url, json=None, params=None):
@@ -660,7 +926,7 @@ class AsyncRestSession(SessionBase):
         response = await self.request(metadata, "PUT", url, params=params, json=json)
         if response:
             if response.content.strip():
-                return response.json()
+                return await self._decode_async(response)
         return None
 
     async def patch(self, metadata, url, json=None, params=None):
@@ -671,7 +937,7 @@ class AsyncRestSession(SessionBase):
         response = await self.request(metadata, "PATCH", url, params=params, json=json)
         if response:
             if response.content.strip():
-                return response.json()
+                return await self._decode_async(response)
         return None
 
     async def delete(self, metadata, url, params=None):
@@ -681,9 +947,38 @@ class AsyncRestSession(SessionBase):
         await self.request(metadata, "DELETE", url, params=params)
         return None
 
+    def _smart_flow_scope(self) -> Tuple[Any, ...]:
+        """The running event loop: an async limiter's buckets and tasks belong to one loop.
+
+        Held by weak reference, so a closed loop's entry never matches a new loop that reuses its id.
+        Sessions created outside a running loop share among themselves.
+        """
+        try:
+            return (weakref.ref(asyncio.get_running_loop()),)
+        except RuntimeError:
+            return (None,)
+
+    async def shutdown_smart_flow(self) -> None:
+        """Drain the limiter's background work and persist its cache, unless other sessions still share it."""
+        if self._smart_flow_registry_key is None:
+            limiter = self._smart_flow
+        else:
+            limiter = self._detach_smart_flow()
+        if limiter:
+            await limiter.shutdown()
+
     async def close(self):
-        """Close the underlying httpx.AsyncClient and release connections."""
-        await self._client.aclose()
+        """Close the underlying httpx.AsyncClient and release connections (and the decode process pool).
+
+        A shared limiter is released first, and shut down if this was its last session.
+        """
+        if self._smart_flow_registry_key is not None:
+            await self.shutdown_smart_flow()
+        for client in (self._client, *self._clients[1:]):
+            await client.aclose()
+        if self._decode_process_pool is not None:
+            self._decode_process_pool.shutdown(wait=False, cancel_futures=True)
+            self._decode_process_pool = None
 
     async def __aenter__(self):
         return self
@@ -2,10 +2,11 @@
 
 from __future__ import annotations
 
+import itertools
 import json
 import random
 from abc import ABC, abstractmethod
-from typing import Any, Dict, Optional
+from typing import Any, Dict, List, Optional, Tuple, Union
 
 from meraki._version import __version__
 from meraki.common import (
@@ -13,6 +14,7 @@ from meraki.common import (
     reject_v0_base_url,
     validate_base_url,
     validate_custom_headers,
+    validate_egresses,
     validate_user_agent,
 )
 from meraki.config import (
@@ -39,11 +41,31 @@ from meraki.config import (
     SINGLE_REQUEST_TIMEOUT,
     USE_ITERATOR_FOR_GET_PAGES,
     WAIT_ON_RATE_LIMIT,
+    JSON_CODEC,
+    STREAM_GET_PAGES,
+    RESPONSE_CACHE,
+    RESPONSE_CACHE_TTL,
+    RESPONSE_CACHE_TTLS,
+    RESPONSE_CACHE_MAX_ENTRIES,
+    RESPONSE_CACHE_PATH,
+    PAGINATION_TIME_SHARDS,
+    SMART_FLOW_SHARED_DIR,
+    SMART_FLOW_SHARE_LIMITER,
+    SMART_FLOW_PRIORITY,
+    SMART_FLOW_HYDRATION_WORKERS,
+    SMART_FLOW_RATE_HALF_LIFE,
+    SMART_FLOW_CALIBRATE_INTERVAL,
+    SMART_FLOW_ENDPOINT_CLASSES,
+    REQUESTS_EGRESSES,
 )
 import httpx
 
+from meraki.codec import get_json_codec
 from meraki.exceptions import APIError, APIResponseError
+from meraki.response_cache import ResponseCache, api_key_namespace
 from meraki.response_handler import handle_3xx
+from meraki.session.sharding import newest_first, split_time_window
+from meraki.smart_flow import _priority_flow, limiter_registry, parse_endpoint_classes, request_priority
 
 
 def params_need_meraki_encoding(params: Any) -> bool:
@@ -84,6 +106,15 @@ def apply_meraki_param_encoding(url: str, kwargs: Dict[str, Any]) -> str:
     return f"{url}{separator}{query}"
 
 
+def retry_after_seconds(response: Any) -> Optional[float]:
+    """The 429 response's Retry-After in seconds, or None when it is missing or not a number."""
+    try:
+        seconds = float(response.headers["Retry-After"])
+    except (KeyError, TypeError, ValueError):
+        return None
+    return seconds if seconds > 0 else None
+
+
 class SessionBase(ABC):
     """Abstract base class providing config storage, URL resolution, retry loop, and status dispatch.
 
@@ -121,6 +152,22 @@ class SessionBase(ABC):
         smart_flow_cache_path: str = SMART_FLOW_CACHE_PATH,
         smart_flow_cache_ttl: Optional[float] = SMART_FLOW_CACHE_TTL,
         smart_flow_logging: bool = SMART_FLOW_LOGGING,
+        json_codec: Any = JSON_CODEC,
+        stream_get_pages: bool = STREAM_GET_PAGES,
+        response_cache: Any = RESPONSE_CACHE,
+        response_cache_ttl: float = RESPONSE_CACHE_TTL,
+        response_cache_ttls: Optional[Dict[str, float]] = RESPONSE_CACHE_TTLS,
+        response_cache_max_entries: int = RESPONSE_CACHE_MAX_ENTRIES,
+        response_cache_path: str = RESPONSE_CACHE_PATH,
+        pagination_time_shards: int = PAGINATION_TIME_SHARDS,
+        smart_flow_shared_dir: str = SMART_FLOW_SHARED_DIR,
+        smart_flow_share_limiter: Union[bool, str] = SMART_FLOW_SHARE_LIMITER,
+        smart_flow_priority: Union[str, float] = SMART_FLOW_PRIORITY,
+        smart_flow_hydration_workers: int = SMART_FLOW_HYDRATION_WORKERS,
+        smart_flow_rate_half_life: Optional[float] = SMART_FLOW_RATE_HALF_LIFE,
+        smart_flow_calibrate_interval: Optional[float] = SMART_FLOW_CALIBRATE_INTERVAL,
+        smart_flow_endpoint_classes: Optional[Dict[str, Dict[str, Any]]] = SMART_FLOW_ENDPOINT_CLASSES,
+        requests_egresses: Optional[List[Union[str, Dict[str, str]]]] = REQUESTS_EGRESSES,
     ) -> None:
         super().__init__()
 
@@ -132,6 +179,9 @@ class SessionBase(ABC):
         self._single_request_timeout = single_request_timeout
         self._certificate_path = certificate_path
         self._requests_proxy = requests_proxy
+        self._egresses = validate_egresses(requests_egresses, requests_proxy)
+        # Turn counter for spreading requests across egresses when smart flow is not picking them
+        self._egress_turn = itertools.count()
         self._wait_on_rate_limit = wait_on_rate_limit
         self._nginx_429_retry_wait_time = nginx_429_retry_wait_time
         self._action_batch_retry_wait_time = action_batch_retry_wait_time
@@ -143,6 +193,8 @@ class SessionBase(ABC):
         self._be_geo_id = be_geo_id
         self._caller = caller
         self._use_iterator_for_get_pages = use_iterator_for_get_pages
+        self._stream_get_pages = stream_get_pages
+        self._pagination_time_shards = pagination_time_shards
         self._validate_kwargs = validate_kwargs
         self._smart_flow_enabled = smart_flow_enabled
         self._smart_flow_org_rate = smart_flow_org_rate
@@ -151,10 +203,34 @@ class SessionBase(ABC):
         self._smart_flow_cache_path = smart_flow_cache_path
         self._smart_flow_cache_ttl = smart_flow_cache_ttl
         self._smart_flow_logging = smart_flow_logging
+        self._smart_flow_shared_dir = smart_flow_shared_dir
+        self._smart_flow_share_limiter = smart_flow_share_limiter
+        self._smart_flow_priority = smart_flow_priority
+        self._smart_flow_hydration_workers = smart_flow_hydration_workers
+        self._smart_flow_rate_half_life = smart_flow_rate_half_life
+        self._smart_flow_calibrate_interval = smart_flow_calibrate_interval
+        self._smart_flow_endpoint_classes = smart_flow_endpoint_classes
+        self._codec = get_json_codec(json_codec)
+        if isinstance(response_cache, ResponseCache) or not response_cache:
+            self._response_cache = response_cache or None
+        else:
+            self._response_cache = ResponseCache(
+                response_cache,
+                ttl=response_cache_ttl,
+                ttls=response_cache_ttls,
+                max_entries=response_cache_max_entries,
+                path=response_cache_path,
+                namespace=api_key_namespace(self._api_key),
+            )
 
         # Check Python version
         check_python_version()
 
+        # Reject unknown smart flow priority classes and bad endpoint classes up front rather than on the first request
+        if smart_flow_enabled:
+            _priority_flow(smart_flow_priority)
+            parse_endpoint_classes(smart_flow_endpoint_classes)
+
         # Reject v0 base URL
         reject_v0_base_url(self)
 
@@ -169,6 +245,7 @@ class SessionBase(ABC):
         self._parameters["single_request_timeout"] = self._single_request_timeout
         self._parameters["certificate_path"] = self._certificate_path
         self._parameters["requests_proxy"] = self._requests_proxy
+        self._parameters["requests_egresses"] = len(self._egresses)
         self._parameters["wait_on_rate_limit"] = self._wait_on_rate_limit
         self._parameters["nginx_429_retry_wait_time"] = self._nginx_429_retry_wait_time
         self._parameters["action_batch_retry_wait_time"] = self._action_batch_retry_wait_time
@@ -180,22 +257,36 @@ class SessionBase(ABC):
         self._parameters["be_geo_id"] = self._be_geo_id
         self._parameters["caller"] = self._caller
         self._parameters["use_iterator_for_get_pages"] = self._use_iterator_for_get_pages
+        self._parameters["stream_get_pages"] = self._stream_get_pages
+        self._parameters["pagination_time_shards"] = self._pagination_time_shards
         self._parameters["smart_flow"] = self._smart_flow_enabled
+        self._parameters["smart_flow_shared_dir"] = self._smart_flow_shared_dir
+        self._parameters["smart_flow_share_limiter"] = bool(self._smart_flow_share_limiter)
+        self._parameters["smart_flow_priority"] = self._smart_flow_priority
+        self._parameters["smart_flow_hydration_workers"] = self._smart_flow_hydration_workers
+        self._parameters["smart_flow_rate_half_life"] = self._smart_flow_rate_half_life
+        self._parameters["smart_flow_calibrate_interval"] = self._smart_flow_calibrate_interval
+        self._parameters["smart_flow_endpoint_classes"] = sorted(self._smart_flow_endpoint_classes or {})
+        self._parameters["json_codec"] = self._codec.name
+        self._parameters["response_cache"] = type(self._response_cache.backend).__name__ if self._response_cache else None
 
         # Smart flow limiter is initialized to None here; subclasses create the
         # appropriate sync or async variant when smart_flow is enabled.
         self._smart_flow = None
+        self._smart_flow_registry_key: Optional[Tuple[Any, ...]] = None
 
         if self._logger:
             self._logger.info(f"Meraki dashboard API session initialized with these parameters: {self._parameters}")
+            if isinstance(json_codec, str) and json_codec.lower() not in ("auto", self._codec.name):
+                self._logger.warning(f"json_codec {json_codec!r} is not installed, falling back to {self._codec.name}")
 
     # ------------------------------------------------------------------
     # Abstract methods (subclass contract)
     # ------------------------------------------------------------------
 
     @abstractmethod
-    def _send_request(self, method: str, url: str, **kwargs: Any) -> "httpx.Response":
-        """Send the HTTP request. Implemented by sync/async subclasses."""
+    def _send_request(self, method: str, url: str, egress: int = 0, **kwargs: Any) -> "httpx.Response":
+        """Send the HTTP request through the client for egress. Implemented by sync/async subclasses."""
         ...
 
     @abstractmethod
@@ -208,6 +299,62 @@ class SessionBase(ABC):
         """Prepare transport-specific kwargs (verify, proxy, timeout, etc.)."""
         ...
 
+    # ------------------------------------------------------------------
+    # Smart flow limiter sharing
+    # ------------------------------------------------------------------
+
+    def _attach_smart_flow(self, factory: Any) -> None:
+        """Build this session's limiter, or with smart_flow_share_limiter attach to the process-wide one for its key."""
+        share = self._smart_flow_share_limiter
+        if not share:
+            self._smart_flow = factory()
+            self._smart_flow.set_resolver(self._resolve_org_for_limiter)
+            self._smart_flow.set_hydrator(self._hydrate_org_for_limiter)
+            self._smart_flow.set_sampler(self._sample_usage_for_limiter)
+            return
+        # Keyed by session type (sync and async limiters differ) and base URL, then by API key or sharing name
+        identity = ("name", share) if isinstance(share, str) else ("key", api_key_namespace(self._api_key))
+        self._smart_flow_registry_key = (type(self).__name__, self._base_url, *identity, *self._smart_flow_scope())
+        if len(self._egresses) > 1:
+            # Global buckets are per egress, so only sessions with the same egress pool can share them
+            self._smart_flow_registry_key += (tuple(tuple(sorted(egress.items())) for egress in self._egresses),)
+        self._smart_flow = limiter_registry.attach(
+            self._smart_flow_registry_key,
+            self,
+            factory,
+            self._resolve_org_for_limiter,
+            self._hydrate_org_for_limiter,
+            self._sample_usage_for_limiter,
+        )
+
+    def _smart_flow_scope(self) -> Tuple[Any, ...]:
+        """Extra registry key parts limiting which sessions may share a limiter; none for sync sessions."""
+        return ()
+
+    def _egress_client_kwargs(self, client_kwargs: Dict[str, Any], egress: Dict[str, str], transport: Any) -> Dict[str, Any]:
+        """httpx client kwargs for one egress: its proxy, or a transport of that class bound to its local address."""
+        kwargs = dict(client_kwargs)
+        if egress.get("local_address"):
+            # A client's verify and limits only apply to the transport it builds itself
+            transport_kwargs = {key: kwargs.pop(key) for key in ("verify", "limits") if key in kwargs}
+            kwargs["transport"] = transport(
+                local_address=egress["local_address"], proxy=egress.get("proxy"), **transport_kwargs
+            )
+        elif egress.get("proxy"):
+            kwargs["proxy"] = egress["proxy"]
+        return kwargs
+
+    def _next_egress(self) -> int:
+        """The egress for a request sent without smart flow: each in turn."""
+        return next(self._egress_turn) % len(self._egresses)
+
+    def _detach_smart_flow(self) -> Optional[Any]:
+        """Drop this session's reference to a shared limiter. Returns the limiter if this was its last session."""
+        key, self._smart_flow_registry_key = self._smart_flow_registry_key, None
+        if key is None:
+            return None
+        return limiter_registry.detach(key, self)
+
     # ------------------------------------------------------------------
     # Template method: request
     # ------------------------------------------------------------------
@@ -224,11 +371,26 @@ class SessionBase(ABC):
         Returns:
             httpx.Response on success, or None if simulated.
         """
+        response, _ = self._request(metadata, method, url, **kwargs)
+        return response
+
+    def _request(
+        self, metadata: Dict[str, Any], method: str, url: str, stream: bool = False, **kwargs: Any
+    ) -> Tuple[Optional["httpx.Response"], Any]:
+        """Retry loop behind request(); returns (response, parsed_body).
+
+        parsed_body is the GET JSON body decoded once by _handle_success (None for
+        non-GET, empty, or simulated responses), so callers never re-parse it.
+        With stream=True a 2xx body is left unread for the caller to consume
+        incrementally (parsed_body is None); error bodies are still read in full.
+        """
         tag = metadata["tags"][0]
         operation = metadata["operation"]
 
         # Prepare transport-specific kwargs
         kwargs = self._transport_kwargs(kwargs)
+        if stream:
+            kwargs["stream"] = True
 
         # Resolve absolute URL
         abs_url = validate_base_url(self, url)
@@ -239,21 +401,30 @@ class SessionBase(ABC):
         if self._simulate and method != "GET":
             if self._logger:
                 self._logger.info(f"{tag}, {operation} - SIMULATED")
-            return None
+            return None, None
+
+        # Serve fresh cached GETs without spending rate budget
+        cache_key = self._cache_key(metadata, method, abs_url, kwargs, stream)
+        cached = self._cache_hit(cache_key, abs_url, metadata)
+        if cached is not None:
+            return cached
 
         retries = self._maximum_retries
         response: Optional["httpx.Response"] = None
+        endpoint_class = self._smart_flow.endpoint_class(operation, metadata["tags"]) if self._smart_flow else None
 
         while retries > 0:
-            # Per-org rate limiting (proactive throttle before sending)
+            # Per-org rate limiting (proactive throttle before sending), which also picks the egress
             if self._smart_flow:
-                self._smart_flow.acquire(abs_url)
+                egress = self._smart_flow.acquire(abs_url, request_priority(self._smart_flow_priority), endpoint_class)
+            else:
+                egress = self._next_egress()
 
             # Attempt the request
             try:
                 if self._logger:
                     self._logger.info(f"{method} {abs_url}")
-                response = self._send_request(method, abs_url, **kwargs)
+                response = self._send_request(method, abs_url, egress=egress, **kwargs)
             except httpx.HTTPError as e:
                 if self._logger:
                     self._logger.warning(f"{tag}, {operation} - {e}, retrying in 1 second")
@@ -273,40 +444,123 @@ class SessionBase(ABC):
                 abs_url = self._handle_redirect(response)
             elif 200 <= status < 300:
                 if self._smart_flow:
-                    self._smart_flow.on_success(abs_url)
-                result = self._handle_success(response, metadata, method, retries)
+                    self._smart_flow.on_success(abs_url, endpoint_class, egress)
+                result, parsed_body = self._handle_success(response, metadata, method, retries, stream)
                 if result is None:
                     # JSON decode failure, retry
                     retries -= 1
                     if retries == 0:
-                        raise APIError(metadata, response)
+                        raise APIError(metadata, response, codec=self._codec)
                     self._sleep(1)
                     continue
-                if self._smart_flow and method == "GET" and result.content.strip():
+                if self._smart_flow and method == "GET" and (parsed_body is not None or stream):
                     try:
-                        self._smart_flow.learn_from_response(abs_url, result.json())
+                        self._smart_flow.learn_from_response(abs_url, parsed_body)
                     except (ValueError, AttributeError):
                         pass
-                return result
+                self._cache_record(cache_key, metadata, method, abs_url, result, parsed_body)
+                return result, parsed_body
             elif status == 429:
                 if self._smart_flow:
-                    self._smart_flow.on_rate_limited(abs_url)
+                    self._smart_flow.on_rate_limited(abs_url, retry_after_seconds(response), endpoint_class, egress)
                 wait = self._handle_rate_limit(response, metadata, retries)
                 self._sleep(wait)
                 retries -= 1
                 if retries == 0:
-                    raise APIError(metadata, response)
+                    raise APIError(metadata, response, codec=self._codec)
             elif status >= 500:
                 self._handle_server_error(response, metadata)
                 self._sleep(1)
                 retries -= 1
                 if retries == 0:
                     self._log_server_error_exhausted(response, metadata)
-                    raise APIError(metadata, response)
+                    raise APIError(metadata, response, codec=self._codec)
             elif 400 <= status < 500:
                 retries = self._handle_client_error(response, metadata, retries)
 
-        return response
+        return response, None
+
+    # ------------------------------------------------------------------
+    # Time-window sharding
+    # ------------------------------------------------------------------
+
+    def _time_shards(
+        self, metadata: Dict[str, Any], params: Optional[Dict[str, Any]], total_pages: Any
+    ) -> Optional[List[Dict[str, Any]]]:
+        """Per-shard params, in output order, for a sharded all-pages pull; None to paginate serially.
+
+        Shards run newest window first for endpoints that list newest first, and oldest
+        first otherwise, matching the order serial pagination returns their items in.
+        """
+        if self._pagination_time_shards < 2 or "shard" in metadata:
+            return None
+        if total_pages != -1 and not (isinstance(total_pages, str) and total_pages.lower() == "all"):
+            return None
+        shards = split_time_window(params, self._pagination_time_shards, newest_first(metadata["operation"], params))
+        if shards and self._logger:
+            self._logger.info(f"{metadata['tags'][0]}, {metadata['operation']} - paginating {len(shards)} time shards")
+        return shards
+
+    # ------------------------------------------------------------------
+    # Response cache
+    # ------------------------------------------------------------------
+
+    def _cache_key(
+        self, metadata: Dict[str, Any], method: str, abs_url: str, kwargs: Dict[str, Any], stream: bool
+    ) -> Optional[str]:
+        """Cache key for a cacheable request (non-streamed GET with the cache on), else None."""
+        if not self._response_cache or method != "GET" or stream:
+            return None
+        return self._response_cache.key(metadata["operation"], abs_url, kwargs.get("params"))
+
+    def _cache_hit(
+        self, cache_key: Optional[str], abs_url: str, metadata: Dict[str, Any]
+    ) -> Optional[Tuple["httpx.Response", Any]]:
+        """Rebuild (response, parsed_body) from a fresh cache entry, or None on a miss."""
+        response = self._cached_response(cache_key, abs_url)
+        if response is None:
+            return None
+        try:
+            body = self._codec.loads(response.content) if response.content.strip() else None
+        except ValueError:
+            self._response_cache.backend.delete(cache_key)
+            return None
+        if self._logger:
+            self._logger.info(f"{metadata['tags'][0]}, {metadata['operation']} - cache hit")
+        return response, body
+
+    def _cached_response(self, cache_key: Optional[str], abs_url: str) -> Optional["httpx.Response"]:
+        """The response stored in a fresh cache entry, body not yet decoded, or None on a miss."""
+        if cache_key is None:
+            return None
+        entry = self._response_cache.get(cache_key)
+        if entry is None:
+            return None
+        return httpx.Response(
+            entry.status_code,
+            headers=entry.headers,
+            content=entry.content,
+            request=httpx.Request("GET", abs_url),
+        )
+
+    def _cache_record(
+        self,
+        cache_key: Optional[str],
+        metadata: Dict[str, Any],
+        method: str,
+        abs_url: str,
+        response: "httpx.Response",
+        parsed_body: Any,
+    ) -> None:
+        """Store a successful GET, or invalidate what a successful write may have changed."""
+        if not self._response_cache:
+            return
+        if cache_key is not None and parsed_body is not None:
+            self._response_cache.put(cache_key, metadata["operation"], abs_url, response)
+        elif method != "GET":
+            dropped = self._response_cache.invalidate(abs_url)
+            if dropped and self._logger:
+                self._logger.debug(f"{metadata['operation']} - invalidated {dropped} cached response(s)")
 
     # ------------------------------------------------------------------
     # Status handlers (each kept under cyclomatic complexity 10)
@@ -318,8 +572,14 @@ class SessionBase(ABC):
         metadata: Dict[str, Any],
         method: str,
         retries: int,
-    ) -> Optional["httpx.Response"]:
-        """Handle 2xx responses. Returns response or None if JSON validation fails."""
+        stream: bool = False,
+    ) -> Tuple[Optional["httpx.Response"], Any]:
+        """Handle 2xx responses.
+
+        Returns (response, parsed_body). parsed_body is the decoded GET JSON body
+        (or None for non-GET / empty / streamed bodies). On JSON decode failure
+        returns (None, None) to signal a retry.
+        """
         tag = metadata["tags"][0]
         operation = metadata["operation"]
         reason = response.reason_phrase if hasattr(response, "reason_phrase") else ""
@@ -333,15 +593,31 @@ class SessionBase(ABC):
             if self._logger:
                 self._logger.info(f"{tag}, {operation} - {status} {reason}")
 
-        # For non-empty GET responses, validate JSON
+        # For non-empty GET responses, validate (and capture) the JSON once.
         try:
-            if method == "GET" and response.content.strip():
-                response.json()
-            return response
+            if not stream and self._has_json_body(method, response):
+                return response, self._decode(response)
+            return response, None
         except (json.decoder.JSONDecodeError, ValueError):
             if self._logger:
                 self._logger.warning(f"{tag}, {operation} - JSON decode error, retrying in 1 second")
-            return None
+            return None, None
+
+    def _decode(self, response: "httpx.Response") -> Any:
+        """Decode a response body with the session codec, straight from the raw bytes."""
+        return self._codec.loads(response.content)
+
+    def _encode_json_body(self, kwargs: Dict[str, Any]) -> Dict[str, Any]:
+        """Replace a json= body with codec-encoded content= bytes (once, before any retry)."""
+        body = kwargs.pop("json", None)
+        if body is not None:
+            kwargs["content"] = self._codec.dumps(body)
+        return kwargs
+
+    @staticmethod
+    def _has_json_body(method: str, response: "httpx.Response") -> bool:
+        """True for non-empty GET responses; 204 No Content never carries a body."""
+        return method == "GET" and response.status_code != 204 and bool(response.content.strip())
 
     def _handle_redirect(self, response: "httpx.Response") -> str:
         """Handle 3xx redirects. Returns the new absolute URL."""
@@ -363,7 +639,7 @@ class SessionBase(ABC):
         status = response.status_code
 
         if not self._wait_on_rate_limit or retries <= 0:
-            raise APIError(metadata, response)
+            raise APIError(metadata, response, codec=self._codec)
 
         if "Retry-After" in response.headers:
             wait = int(response.headers["Retry-After"])
@@ -415,7 +691,7 @@ class SessionBase(ABC):
         """
         # Parse response body
         try:
-            message = response.json()
+            message = self._decode(response)
         except (ValueError, json.decoder.JSONDecodeError):
             message = response.content[:100]
 
@@ -432,7 +708,7 @@ class SessionBase(ABC):
         status = response.status_code
         if self._logger:
             self._logger.error(f"{tag}, {operation} - {status} {reason}, {message}")
-        raise APIError(metadata, response)
+        raise APIError(metadata, response, codec=self._codec)
 
     # ------------------------------------------------------------------
     # Helper methods
@@ -471,7 +747,7 @@ class SessionBase(ABC):
         self._sleep(wait)
         retries -= 1
         if retries == 0:
-            raise APIError(metadata, response)
+            raise APIError(metadata, response, codec=self._codec)
         return retries
 
     def _is_network_delete_concurrency(
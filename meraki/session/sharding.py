@@ -0,0 +1,222 @@
+"""Time-window sharding for paginated t0/t1 endpoints.
+
+Cursor pagination (startingAfter/endingBefore) makes a paginated pull strictly serial:
+each page's Link header names the next. Endpoints that take a t0/t1 window can be
+split instead. Each sub-window is paginated independently and concurrently, and
+the results are stitched back together in the endpoint's sort order. Smart flow
+still paces every page request, so the pull stays within the org budget.
+"""
+
+from __future__ import annotations
+
+import json
+from collections import deque
+from datetime import datetime, timezone
+from typing import Any, Deque, Dict, List, NamedTuple, Optional
+
+# Explicit cursors pin a pull to one position; never shard those.
+_CURSOR_PARAMS = ("startingAfter", "endingBefore")
+
+# Endpoints that list newest first and have no sortOrder parameter
+_NEWEST_FIRST = frozenset(
+    {
+        "getOrganizationApiRequests",
+        "getOrganizationConfigurationChanges",
+        "getOrganizationWebhooksLogs",
+    }
+)
+# Endpoints whose sortOrder parameter defaults to "descending"
+_DESCENDING_BY_DEFAULT = frozenset({"getDeviceSensorCommands", "getOrganizationDevicesPacketCaptureCaptures"})
+
+# Items at the end of a shard compared against the start of the next: an item stamped
+# exactly on the boundary second both share is returned by both windows
+_EDGE_ITEMS = 1000
+
+# Items a shard of an iterator pull may get ahead of the consumer: about one full page
+SHARD_BUFFER_ITEMS = 1000
+# Queue marker: the shard has no more items
+SHARD_DONE = object()
+
+
+class ShardFailed(NamedTuple):
+    """Queue marker: the shard raised error, which the consumer re-raises."""
+
+    error: BaseException
+
+
+def _parse_timestamp(value: Any) -> Optional[float]:
+    """Epoch seconds from an epoch number/string or an ISO 8601 timestamp (naive = UTC)."""
+    if isinstance(value, bool):
+        return None
+    if isinstance(value, (int, float)):
+        return float(value)
+    if not isinstance(value, str):
+        return None
+    try:
+        return float(value)
+    except ValueError:
+        pass
+    try:
+        dt = datetime.fromisoformat(value.replace("Z", "+00:00"))
+    except ValueError:
+        return None
+    if dt.tzinfo is None:
+        dt = dt.replace(tzinfo=timezone.utc)
+    return dt.timestamp()
+
+
+def _format_timestamp(epoch: int, like: Any) -> Any:
+    """Format a boundary in the same style (ISO 8601 Zulu or epoch) as the caller's t0."""
+    if isinstance(like, str) and _is_iso(like):
+        return datetime.fromtimestamp(epoch, timezone.utc).strftime("%Y-%m-%dT%H:%M:%SZ")
+    return epoch
+
+
+def _is_iso(value: str) -> bool:
+    try:
+        float(value)
+    except ValueError:
+        return True
+    return False
+
+
+def newest_first(operation: str, params: Optional[Dict[str, Any]]) -> bool:
+    """True if the endpoint lists items newest first: by its sortOrder parameter, else by operation."""
+    sort_order = (params or {}).get("sortOrder")
+    if sort_order is not None:
+        return str(sort_order).lower() == "descending"
+    return operation in _NEWEST_FIRST or operation in _DESCENDING_BY_DEFAULT
+
+
+def split_time_window(
+    params: Optional[Dict[str, Any]], shards: int, newest_first: bool = False
+) -> Optional[List[Dict[str, Any]]]:
+    """Split params' [t0, t1] window into up to `shards` contiguous sub-windows.
+
+    The sub-windows are returned oldest first, or newest first with newest_first, so
+    that they come in the order a serial pull lists their items in. Returns one params
+    dict per sub-window, or None when the request can't be sharded: no t0/t1 pair, an
+    explicit cursor, an unparseable or empty window, or a window too short to split at
+    one-second granularity. The outer edges keep the caller's exact t0/t1 values; inner
+    boundaries are whole seconds shared by adjacent sub-windows (see ShardJoiner).
+    """
+    if not params or "t0" not in params or "t1" not in params:
+        return None
+    if any(cursor in params for cursor in _CURSOR_PARAMS):
+        return None
+    start, end = _parse_timestamp(params["t0"]), _parse_timestamp(params["t1"])
+    if start is None or end is None or end <= start:
+        return None
+    shards = min(shards, int(end - start))
+    if shards < 2:
+        return None
+
+    step = (end - start) / shards
+    inner = [_format_timestamp(int(start + step * i), params["t0"]) for i in range(1, shards)]
+    bounds = [params["t0"], *inner, params["t1"]]
+    windows = [{**params, "t0": bounds[i], "t1": bounds[i + 1]} for i in range(shards)]
+    if newest_first:
+        windows.reverse()
+    return windows
+
+
+def shard_items(results: Any) -> List[Any]:
+    """The item list inside one shard's collected results (list, or an items/events body)."""
+    if isinstance(results, list):
+        return results
+    if isinstance(results, dict):
+        if "items" in results:
+            return results["items"]
+        return results.get("events", [])
+    return []
+
+
+def _edge_key(item: Any) -> str:
+    return json.dumps(item, sort_keys=True, default=str)
+
+
+class ShardJoiner:
+    """Joins shards' item lists in output order, dropping items repeated across a boundary.
+
+    Adjacent windows share their boundary second, so an item stamped on it comes back
+    from both: last in one shard and first in the next. Leading items of a shard that
+    equal one of the previous shard's last _EDGE_ITEMS items are dropped. A shard is
+    joined as a list with join(), or one item at a time with begin(), keep() and end().
+    """
+
+    def __init__(self):
+        self._edge: set = set()
+        self._leading = False
+        self._tail: Deque[Any] = deque(maxlen=_EDGE_ITEMS)
+
+    def begin(self) -> None:
+        """Start a shard whose items come one at a time through keep()."""
+        self._leading = bool(self._edge)
+        self._tail.clear()
+
+    def keep(self, item: Any) -> bool:
+        """Whether to return this item of the current shard: False for a leading repeat."""
+        self._tail.append(item)
+        if self._leading:
+            if _edge_key(item) in self._edge:
+                return False
+            self._leading = False
+        return True
+
+    def end(self) -> None:
+        """Finish the current shard; its last items become the edge the next one is checked against."""
+        if self._tail:
+            self._edge = {_edge_key(item) for item in self._tail}
+
+    def join(self, items: List[Any]) -> List[Any]:
+        """A shard's items, less those the previous shard already returned."""
+        skip = 0
+        if self._edge:
+            while skip < len(items) and _edge_key(items[skip]) in self._edge:
+                skip += 1
+        if items:
+            self._edge = {_edge_key(item) for item in items[-_EDGE_ITEMS:]}
+        return items[skip:] if skip else items
+
+
+def _merged_item_counts(bodies: List[Dict[str, Any]], repeats: int) -> Optional[Dict[str, Any]]:
+    """meta.counts.items over every shard: totals and remaining summed, less the repeats dropped."""
+    counts = [(body.get("meta") or {}).get("counts", {}).get("items") for body in bodies]
+    if not all(isinstance(count, dict) for count in counts):
+        return None
+    merged = dict(counts[0])
+    for key in ("total", "remaining"):
+        if all(isinstance(count.get(key), int) for count in counts):
+            merged[key] = sum(count[key] for count in counts)
+    if isinstance(merged.get("total"), int):
+        merged["total"] -= repeats
+    return merged
+
+
+def merge_shard_results(parts: List[Any]) -> Any:
+    """Join per-shard results (already in output order) into the shape get_pages returns.
+
+    An items or events body gets its page metadata rebuilt over every shard:
+    meta.counts.items sums the shards' counts (less boundary repeats), and
+    pageStartAt/pageEndAt span all the windows. Other fields are the first shard's.
+    """
+    joiner = ShardJoiner()
+    shards = [shard_items(part) for part in parts]
+    items = [item for shard in shards for item in joiner.join(shard)]
+    first = next((part for part in parts if part is not None), None)
+    if not isinstance(first, dict):
+        return items
+    bodies = [part for part in parts if isinstance(part, dict)]
+    merged = dict(first)
+    if "items" in first:
+        merged["items"] = items
+        counts = _merged_item_counts(bodies, sum(len(shard) for shard in shards) - len(items))
+        if counts is not None:
+            merged["meta"] = {**first["meta"], "counts": {**first["meta"]["counts"], "items": counts}}
+    else:
+        merged["events"] = items
+        for key, pick in (("pageStartAt", min), ("pageEndAt", max)):
+            values = [body[key] for body in bodies if body.get(key) is not None]
+            if values:
+                merged[key] = pick(values)
+    return merged
@@ -2,13 +2,18 @@
 
 from __future__ import annotations
 
+import contextvars
+import queue
+import threading
 import time
 import urllib.parse
+from concurrent.futures import Future, ThreadPoolExecutor
 from datetime import datetime, timezone
-from typing import Any, Dict, Optional
+from typing import Any, Dict, Iterator, List, Optional
 
 import httpx
 
+from meraki.codec import JSONItemStream
 from meraki.common import (
     iterator_for_get_pages_bool,
     use_iterator_for_get_pages_setter,
@@ -16,6 +21,7 @@ from meraki.common import (
 from meraki.exceptions import SessionInputError
 from meraki.smart_flow import OrgRateLimiter
 from meraki.session.base import SessionBase, apply_meraki_param_encoding
+from meraki.session.sharding import SHARD_BUFFER_ITEMS, SHARD_DONE, ShardFailed, ShardJoiner, merge_shard_results
 
 
 class RestSession(SessionBase):
@@ -23,6 +29,10 @@ class RestSession(SessionBase):
 
     Inherits config, retry loop, and status dispatch from SessionBase.
     Implements transport-specific sleep and request methods.
+
+    Safe to share between threads (see DashboardAPI.bulk): httpx.Client pools
+    connections across threads, request methods work on their own copy of the
+    caller's metadata, and smart flow and the response cache lock their state.
     """
 
     def __init__(self, logger, api_key, **kwargs: Any) -> None:
@@ -34,29 +44,48 @@ class RestSession(SessionBase):
         }
         if self._certificate_path:
             client_kwargs["verify"] = self._certificate_path
-        if self._requests_proxy:
-            client_kwargs["proxy"] = self._requests_proxy
 
-        # Persistent httpx client with connection pooling
-        self._client = httpx.Client(**client_kwargs)
-        self._client.headers.update(self._build_headers())
+        # Persistent httpx client with connection pooling, one per egress (requests_egresses)
+        self._clients = [
+            httpx.Client(**self._egress_client_kwargs(client_kwargs, egress, httpx.HTTPTransport)) for egress in self._egresses
+        ]
+        for client in self._clients:
+            client.headers.update(self._build_headers())
+        self._client = self._clients[0]
 
         # Per-org smart flow (opt-in)
         if self._smart_flow_enabled:
-            self._smart_flow = OrgRateLimiter(
-                rate=self._smart_flow_org_rate,
-                capacity=int(self._smart_flow_org_rate),
-                global_rate=self._smart_flow_global_rate,
-                cache_path=self._smart_flow_cache_path or None,
-                cache_ttl=self._smart_flow_cache_ttl,
-                logger=self._logger if self._smart_flow_logging else None,
+            self._attach_smart_flow(
+                lambda: OrgRateLimiter(
+                    rate=self._smart_flow_org_rate,
+                    capacity=int(self._smart_flow_org_rate),
+                    global_rate=self._smart_flow_global_rate,
+                    cache_path=self._smart_flow_cache_path or None,
+                    cache_ttl=self._smart_flow_cache_ttl,
+                    logger=self._logger if self._smart_flow_logging else None,
+                    codec=self._codec,
+                    shared_dir=self._smart_flow_shared_dir or None,
+                    hydration_workers=self._smart_flow_hydration_workers,
+                    rate_half_life=self._smart_flow_rate_half_life,
+                    calibrate_interval=self._smart_flow_calibrate_interval,
+                    endpoint_classes=self._smart_flow_endpoint_classes,
+                    egresses=len(self._egresses),
+                )
             )
-            self._smart_flow.set_resolver(self._resolve_org_for_limiter)
-            self._smart_flow.set_hydrator(self._hydrate_org_for_limiter)
 
     def close(self):
-        """Close the underlying httpx.Client and release connections."""
-        self._client.close()
+        """Close the underlying httpx.Client and release connections.
+
+        The limiter's cache is written and closed, unless other sessions still share the limiter.
+        """
+        if self._smart_flow_registry_key is None:
+            limiter = self._smart_flow
+        else:
+            limiter = self._detach_smart_flow()
+        if limiter:
+            limiter.close()
+        for client in (self._client, *self._clients[1:]):
+            client.close()
 
     def __enter__(self):
         return self
@@ -72,11 +101,19 @@ class RestSession(SessionBase):
     def use_iterator_for_get_pages(self, value):
         use_iterator_for_get_pages_setter(self, value)
 
-    def _send_request(self, method: str, url: str, **kwargs: Any) -> httpx.Response:
-        """Send HTTP request via persistent httpx.Client."""
+    def _send_request(self, method: str, url: str, egress: int = 0, **kwargs: Any) -> httpx.Response:
+        """Send HTTP request via the egress's persistent httpx.Client."""
+        client = self._clients[egress] if len(self._clients) > 1 else self._client
         # Pre-encode Meraki array-of-objects params; httpx mishandles them.
         url = apply_meraki_param_encoding(url, kwargs)
-        response = self._client.request(method, url, follow_redirects=False, **kwargs)
+        if kwargs.pop("stream", False):
+            # Leave 2xx bodies on the wire for the caller; error handlers need the full body.
+            request = client.build_request(method, url, **kwargs)
+            response = client.send(request, stream=True, follow_redirects=False)
+            if not 200 <= response.status_code < 300:
+                response.read()
+            return response
+        response = client.request(method, url, follow_redirects=False, **kwargs)
         return response
 
     def _sleep(self, seconds: float) -> None:
@@ -84,8 +121,8 @@ class RestSession(SessionBase):
         time.sleep(seconds)
 
     def _transport_kwargs(self, kwargs: Dict[str, Any]) -> Dict[str, Any]:
-        """No-op: httpx config handled at client initialization level."""
-        return kwargs
+        """Encode json= bodies with the session codec; other httpx config lives on the client."""
+        return self._encode_json_body(kwargs)
 
     # ------------------------------------------------------------------
     # Smart flow resolver
@@ -114,98 +151,92 @@ class RestSession(SessionBase):
             self._acquire_global_bucket()
             response = self._client.request("GET", endpoint, follow_redirects=True)
             if response.status_code == 200:
-                data = response.json()
+                data = self._decode(response)
                 return data.get("organizationId")
         except Exception:
             pass
         return None
 
+    def _sample_usage_for_limiter(self, org_id: str, timespan: int) -> Any:
+        """Fetch an org's API request counts per 2-minute interval (the finest the API offers) for calibration."""
+        endpoint = f"{self._base_url}/organizations/{org_id}/apiRequests/overview/responseCodes/byInterval"
+        self._acquire_global_bucket()
+        response = self._client.request("GET", endpoint, params={"timespan": timespan, "interval": 120}, follow_redirects=True)
+        if response.status_code == 200:
+            return self._decode(response)
+        return None
+
     def _hydrate_org_for_limiter(self, org_id: str) -> None:
-        """Fetch all networks and devices for an org and register them with the limiter."""
-        networks = self._fetch_all_pages(f"{self._base_url}/organizations/{org_id}/networks?perPage=1000")
-        for net in networks:
-            if "id" in net:
-                self._smart_flow.register_network(net["id"], org_id)
-
-        devices = self._fetch_all_pages(f"{self._base_url}/organizations/{org_id}/inventoryDevices?perPage=1000")
-        for dev in devices:
-            if "serial" in dev:
-                self._smart_flow.register_device(dev["serial"], org_id)
-
-    def _fetch_all_pages(self, url: str) -> list:
-        """Paginate through a Meraki list endpoint using Link headers."""
-        results = []
+        """Fetch all networks and devices for an org and register them with the limiter, page by page.
+
+        Runs on the limiter's hydration thread, so requests resolved meanwhile use the mappings already registered.
+        """
+        for page in self._iter_pages(f"{self._base_url}/organizations/{org_id}/networks?perPage=1000"):
+            for net in page:
+                if "id" in net:
+                    self._smart_flow.register_network(net["id"], org_id)
+
+        for page in self._iter_pages(f"{self._base_url}/organizations/{org_id}/inventoryDevices?perPage=1000"):
+            for dev in page:
+                if "serial" in dev:
+                    self._smart_flow.register_device(dev["serial"], org_id)
+
+    def _iter_pages(self, url: str) -> Iterator[list]:
+        """Paginate through a Meraki list endpoint using Link headers, yielding each page."""
         while url:
             self._acquire_global_bucket()
             response = self._client.request("GET", url, follow_redirects=True)
             if response.status_code != 200:
                 break
-            page = response.json()
+            page = self._decode(response)
             if isinstance(page, list):
-                results.extend(page)
+                yield page
             next_link = response.links.get("next", {}).get("url")
             url = next_link if next_link else None
-        return results
 
     # ------------------------------------------------------------------
     # Convenience HTTP methods
     # ------------------------------------------------------------------
 
     def get(self, metadata, url, params=None):
-        metadata["method"] = "GET"
-        metadata["url"] = url
-        metadata["params"] = params
-        response = self.request(metadata, "GET", url, params=params)
-        ret = None
+        metadata = {**metadata, "method": "GET", "url": url, "params": params}
+        response, ret = self._request(metadata, "GET", url, params=params)
         if response:
-            if response.content.strip():
-                ret = response.json()
             response.close()
         return ret
 
     def post(self, metadata, url, json=None, params=None):
-        metadata["method"] = "POST"
-        metadata["url"] = url
-        metadata["params"] = params
-        metadata["json"] = json
+        metadata = {**metadata, "method": "POST", "url": url, "params": params, "json": json}
         response = self.request(metadata, "POST", url, params=params, json=json)
         ret = None
         if response:
             if response.content.strip():
-                ret = response.json()
+                ret = self._decode(response)
             response.close()
         return ret
 
     def put(self, metadata, url, json=None, params=None):
-        metadata["method"] = "PUT"
-        metadata["url"] = url
-        metadata["params"] = params
-        metadata["json"] = json
+        metadata = {**metadata, "method": "PUT", "url": url, "params": params, "json": json}
         response = self.request(metadata, "PUT", url, params=params, json=json)
         ret = None
         if response:
             if response.content.strip():
-                ret = response.json()
+                ret = self._decode(response)
             response.close()
         return ret
 
     def patch(self, metadata, url, json=None, params=None):
-        metadata["method"] = "PATCH"
-        metadata["url"] = url
-        metadata["params"] = params
-        metadata["json"] = json
+        metadata = {**metadata, "method": "PATCH", "url": url, "params": params, "json": json}
         response = self.request(metadata, "PATCH", url, params=params, json=json)
         ret = None
         if response:
             if response.content.strip():
-                ret = response.json()
+                ret = self._decode(response)
             response.close()
         return ret
 
     def delete(self, metadata, url, params=None):
-        metadata["method"] = "DELETE"
-        metadata["url"] = url
-        metadata["params"] = params
+        metadata = {**metadata, "method": "DELETE", "url": url, "params": params}
         response = self.request(metadata, "DELETE", url, params=params)
         if response:
             response.close()
@@ -230,6 +261,11 @@ class RestSession(SessionBase):
         direction="next",
         event_log_end_time=None,
     ):
+        shards = self._time_shards(metadata, params, total_pages)
+        if shards:
+            yield from self._iter_shards(metadata, url, shards, direction, event_log_end_time)
+            return
+
         if isinstance(total_pages, str) and total_pages.lower() == "all":
             total_pages = -1
         elif isinstance(total_pages, str) and total_pages.isnumeric():
@@ -241,9 +277,10 @@ class RestSession(SessionBase):
                 "total_pages must be either an integer or 'all' as a string (remember to add the quotation marks).",
                 None,
             )
-        metadata["page"] = 1
+        metadata = {**metadata, "page": 1}
+        stream = self._stream_get_pages
 
-        response = self.request(metadata, "GET", url, params=params)
+        response, results = self._request(metadata, "GET", url, params=params, stream=stream)
 
         # Get additional pages if more than one requested
         while total_pages != 0:
@@ -252,7 +289,6 @@ class RestSession(SessionBase):
             if response.status_code == 204:
                 response.close()
                 return
-            results = response.json()
             links = response.links
 
             # GET the subsequent page
@@ -283,28 +319,148 @@ class RestSession(SessionBase):
             else:
                 total_pages = 1
 
-            response.close()
-
-            return_items = []
-            # Just prepare the list
-            if isinstance(results, list):
-                return_items = results
-            elif isinstance(results, dict) and "items" in results:
-                return_items = results["items"]
-            # For event log endpoint
-            elif isinstance(results, dict):
-                if direction == "next":
-                    return_items = results["events"][::-1]
-                else:
-                    return_items = results["events"]
+            if stream:
+                try:
+                    yield from self._iter_streamed_items(response, direction)
+                finally:
+                    response.close()
+            else:
+                response.close()
 
-            for item in return_items:
-                yield item
+                return_items = []
+                # Just prepare the list
+                if isinstance(results, list):
+                    return_items = results
+                elif isinstance(results, dict) and "items" in results:
+                    return_items = results["items"]
+                # For event log endpoint
+                elif isinstance(results, dict):
+                    if direction == "next":
+                        return_items = results["events"][::-1]
+                    else:
+                        return_items = results["events"]
+
+                for item in return_items:
+                    yield item
 
             total_pages = total_pages - 1
 
             if total_pages != 0:
-                response = self.request(metadata, "GET", nextlink)
+                response, results = self._request(metadata, "GET", nextlink, stream=stream)
+
+        # A getNetworkEvents window break leaves the current (possibly streamed) page open.
+        response.close()
+
+    def _start_shards(self, metadata, url, shards, direction, event_log_end_time, stop) -> List[Future]:
+        """Paginate every time shard on its own thread; futures are returned in output order.
+
+        A shard checks stop between pages, so setting it ends shards already running. Each
+        shard runs in its own copy of the caller's context, so it keeps the caller's priority.
+        """
+        pool = ThreadPoolExecutor(max_workers=len(shards), thread_name_prefix="meraki-shard")
+        futures = [
+            pool.submit(
+                contextvars.copy_context().run,
+                self._get_pages_legacy,
+                {**metadata, "shard": i + 1},
+                url,
+                params,
+                -1,
+                direction,
+                event_log_end_time,
+                stop,
+            )
+            for i, params in enumerate(shards)
+        ]
+        pool.shutdown(wait=False)
+        return futures
+
+    def _iter_shards(self, metadata, url, shards, direction, event_log_end_time) -> Iterator[Any]:
+        """Yield a sharded pull's items in output order while every shard pages on its own thread.
+
+        Each shard feeds a queue of at most SHARD_BUFFER_ITEMS items, so a shard later in
+        the output waits for the consumer instead of holding its whole window in memory.
+        """
+        stop = threading.Event()
+        queues: List[queue.Queue] = [queue.Queue(SHARD_BUFFER_ITEMS) for _ in shards]
+        pool = ThreadPoolExecutor(max_workers=len(shards), thread_name_prefix="meraki-shard")
+        futures = [
+            pool.submit(
+                contextvars.copy_context().run,
+                self._feed_shard,
+                {**metadata, "shard": i + 1},
+                url,
+                params,
+                direction,
+                event_log_end_time,
+                queues[i],
+                stop,
+            )
+            for i, params in enumerate(shards)
+        ]
+        pool.shutdown(wait=False)
+        joiner = ShardJoiner()
+        try:
+            for items in queues:
+                joiner.begin()
+                while (item := items.get()) is not SHARD_DONE:
+                    if isinstance(item, ShardFailed):
+                        raise item.error
+                    if joiner.keep(item):
+                        yield item
+                joiner.end()
+        finally:
+            self._stop_shards(futures, stop)
+
+    def _feed_shard(self, metadata, url, params, direction, event_log_end_time, items: queue.Queue, stop) -> None:
+        """Page through one shard into items, ending with SHARD_DONE, or ShardFailed if it raises.
+
+        Setting stop ends the shard at its next item; the page iterator is closed, so no
+        further page is requested.
+        """
+
+        def put(item: Any) -> bool:
+            while not stop.is_set():
+                try:
+                    items.put(item, timeout=0.1)
+                    return True
+                except queue.Full:
+                    continue
+            return False
+
+        pages = self._get_pages_iterator(metadata, url, params, -1, direction, event_log_end_time)
+        try:
+            for item in pages:
+                if not put(item):
+                    return
+        except Exception as e:
+            put(ShardFailed(e))
+            return
+        finally:
+            pages.close()
+        put(SHARD_DONE)
+
+    @staticmethod
+    def _stop_shards(futures: List[Future], stop: threading.Event) -> None:
+        """Stop shards still running (consumer stopped early, or a shard failed) after their current page."""
+        stop.set()
+        for future in futures:
+            future.cancel()
+
+    def _iter_streamed_items(self, response, direction):
+        """Yield a streamed page's items as they are decoded from the response bytes."""
+        items = JSONItemStream(self._codec)
+        # The event log returns newest-first; the "next" direction reverses each page,
+        # which needs the whole page, so only that case buffers.
+        buffered = []
+        for chunk in response.iter_bytes():
+            for item in items.feed(chunk):
+                if items.key == "events" and direction == "next":
+                    buffered.append(item)
+                else:
+                    yield item
+        items.close()
+        yield from reversed(buffered)
 
     def _get_pages_legacy(
         self,
@@ -314,7 +470,17 @@ class RestSession(SessionBase):
         total_pages=-1,
         direction="next",
         event_log_end_time=None,
+        stop: Optional[threading.Event] = None,
     ):
+        shards = self._time_shards(metadata, params, total_pages)
+        if shards:
+            stop = threading.Event()
+            futures = self._start_shards(metadata, url, shards, direction, event_log_end_time, stop)
+            try:
+                return merge_shard_results([future.result() for future in futures])
+            finally:
+                self._stop_shards(futures, stop)
+
         if isinstance(total_pages, str) and total_pages.lower() == "all":
             total_pages = -1
         elif isinstance(total_pages, str) and total_pages.isnumeric():
@@ -327,22 +493,17 @@ class RestSession(SessionBase):
                 None,
             )
 
-        metadata["page"] = 1
-
-        response = self.request(metadata, "GET", url, params=params)
+        metadata = {**metadata, "page": 1}
 
-        # Handle GETs that produce 204 No Content responses
-        if response.status_code == 204:
-            results = None
-        else:
-            results = response.json()
+        # 204 No Content pages carry no parsed body, so results is None for them
+        response, results = self._request(metadata, "GET", url, params=params)
 
         # For event log endpoint when using 'next' direction, so results/events are sorted chronologically
         if isinstance(results, dict) and metadata["operation"] == "getNetworkEvents" and direction == "next":
             results["events"] = results["events"][::-1]
 
-        # Get additional pages if more than one requested
-        while total_pages != 1:
+        # Get additional pages if more than one requested, unless a sharded pull was stopped
+        while total_pages != 1 and not (stop is not None and stop.is_set()):
             links = response.links
             response.close()
             response = None
@@ -361,7 +522,7 @@ class RestSession(SessionBase):
                         break
 
                 metadata["page"] += 1
-                response = self.request(metadata, "GET", links["next"]["url"])
+                response, page = self._request(metadata, "GET", links["next"]["url"])
             elif direction == "prev" and "prev" in links:
                 # Prevent getNetworkEvents from infinite loop as time goes backward (to epoch 0)
                 if metadata["operation"] == "getNetworkEvents":
@@ -371,27 +532,27 @@ class RestSession(SessionBase):
                         break
 
                 metadata["page"] += 1
-                response = self.request(metadata, "GET", links["prev"]["url"])
+                response, page = self._request(metadata, "GET", links["prev"]["url"])
             else:
                 break
 
             # Append that page's results, depending on the endpoint
             if isinstance(results, list):
-                results.extend(response.json())
+                results.extend(page)
             elif isinstance(results, dict) and "items" in results:
-                results["items"].extend(response.json()["items"])
+                results["items"].extend(page["items"])
                 if "meta" in results:
-                    results["meta"]["counts"]["items"]["remaining"] = response.json()["meta"]["counts"]["items"]["remaining"]
+                    results["meta"]["counts"]["items"]["remaining"] = page["meta"]["counts"]["items"]["remaining"]
             # For event log endpoint
             elif isinstance(results, dict):
                 try:
-                    start = response.json()["pageStartAt"]
+                    start = page["pageStartAt"]
                 except KeyError:
                     if self._logger:
                         self._logger.warning(f"pageStartAt missing from response: {response.headers}")
                     start = results["pageStartAt"]  # fallback: keep existing value
-                end = response.json()["pageEndAt"]
-                events = response.json()["events"]
+                end = page["pageEndAt"]
+                events = page["events"]
                 if direction == "next":
                     events = events[::-1]
                 if start < results["pageStartAt"]:
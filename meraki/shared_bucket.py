@@ -0,0 +1,205 @@
+"""Token buckets whose state is shared by every process on a host.
+
+Each process that builds its own OrgRateLimiter has its own buckets, so N worker
+processes hitting the same org together send N times the configured org rate.
+A shared bucket keeps its state in a small file in a directory that all processes
+use. Every acquire reserves a token under an exclusive OS file lock, so the
+processes draw from one budget:
+
+- The file holds three doubles: tokens, time of the last refill and current rate
+- The refill clock is wall-clock time.time(), since a file can outlive the boot
+  (or container) that wrote it; a refill time further ahead than _MAX_PAUSE, left
+  by a clock step, is read as now + _MAX_PAUSE
+- The file is opened per reservation, so idle buckets hold no descriptor
+- A rate change (a 429 backoff or a recovery step) applies to every process.
+  Reading the rate doesn't lock for writing: every reservation notes the rate it
+  saw, and a note older than _RATE_TTL is refreshed under a shared lock
+- The lock is held only for the read-modify-write, never while sleeping
+
+Buckets are keyed by name ("global", "org-<id>"), so sessions in different
+processes that target the same org share that org's budget.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import os
+import re
+import struct
+import threading
+import time
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Any, Iterator
+
+try:
+    import fcntl
+except ImportError:  # Windows
+    fcntl = None
+    import msvcrt
+
+_STATE = struct.Struct("<ddd")
+_UNSAFE_NAME = re.compile(r"[^A-Za-z0-9_.-]")
+# Longest pause a state file can hold: a refill time further ahead than this is a clock step, not a Retry-After
+_MAX_PAUSE = 3600.0
+# Seconds a process trusts the rate it last saw in the state file before reading it again
+_RATE_TTL = 1.0
+
+
+@contextmanager
+def _file_lock(fd: int, shared: bool = False) -> Iterator[None]:
+    """Hold a lock on fd across processes: exclusive, or shared with other readers where the OS has one."""
+    if fcntl is not None:
+        fcntl.flock(fd, fcntl.LOCK_SH if shared else fcntl.LOCK_EX)
+        try:
+            yield
+        finally:
+            fcntl.flock(fd, fcntl.LOCK_UN)
+    else:
+        os.lseek(fd, 0, os.SEEK_SET)
+        while True:
+            try:
+                msvcrt.locking(fd, msvcrt.LK_LOCK, 1)
+                break
+            except OSError:  # LK_LOCK gives up after ~10 s of contention
+                continue
+        try:
+            yield
+        finally:
+            os.lseek(fd, 0, os.SEEK_SET)
+            msvcrt.locking(fd, msvcrt.LK_UNLCK, 1)
+
+
+class SharedTokenBucket:
+    """Token bucket backed by a locked state file, for synchronous rate limiting.
+
+    Same reservation semantics as TokenBucket: the token is deducted up front, and
+    the caller sleeps off any deficit outside the lock.
+    """
+
+    def __init__(self, directory: str, name: str, rate: float, capacity: int):
+        self._capacity = capacity
+        self._initial_rate = rate
+        self.path = Path(directory) / f"{_UNSAFE_NAME.sub('_', name)}.bucket"
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        # The file is locked per reservation; threads of this process also take a
+        # thread lock, so they queue here rather than on the OS lock.
+        self._thread_lock = threading.Lock()
+        # (rate, time.monotonic()) as of this process's last look at the state file
+        self._rate_seen = (float(rate), float("-inf"))
+
+    def close(self) -> None:
+        """Nothing to release: the state file is only open during a reservation."""
+
+    @contextmanager
+    def _state(self) -> Iterator[list]:
+        """Lock the bucket and yield [tokens, last, rate], writing it back on exit."""
+        with self._thread_lock:
+            fd = os.open(self.path, os.O_RDWR | os.O_CREAT | getattr(os, "O_BINARY", 0), 0o600)
+            try:
+                with _file_lock(fd):
+                    raw = os.read(fd, _STATE.size)
+                    now = time.time()
+                    if len(raw) == _STATE.size:
+                        state = list(_STATE.unpack(raw))
+                        state[1] = min(state[1], now + _MAX_PAUSE)
+                    else:
+                        # First user of a new bucket file starts it full
+                        state = [float(self._capacity), now, float(self._initial_rate)]
+                    yield state
+                    os.lseek(fd, 0, os.SEEK_SET)
+                    os.write(fd, _STATE.pack(*state))
+                    self._rate_seen = (state[2], time.monotonic())
+            finally:
+                os.close(fd)
+
+    def _read_rate(self) -> float:
+        """The rate in the state file, read under a shared lock without rewriting the file."""
+        try:
+            fd = os.open(self.path, os.O_RDONLY | getattr(os, "O_BINARY", 0))
+        except FileNotFoundError:
+            return float(self._initial_rate)
+        try:
+            with _file_lock(fd, shared=True):
+                raw = os.read(fd, _STATE.size)
+        finally:
+            os.close(fd)
+        return _STATE.unpack(raw)[2] if len(raw) == _STATE.size else float(self._initial_rate)
+
+    @property
+    def rate(self) -> float:
+        """The shared rate, as of at most _RATE_TTL seconds ago."""
+        rate, seen_at = self._rate_seen
+        if time.monotonic() - seen_at < _RATE_TTL:
+            return rate
+        rate = self._read_rate()
+        self._rate_seen = (rate, time.monotonic())
+        return rate
+
+    @rate.setter
+    def rate(self, value: float) -> None:
+        with self._state() as state:
+            # Tokens earned so far were earned at the old rate
+            tokens, last, rate = state
+            now = time.time()
+            state[0] = min(self._capacity, tokens + max(0.0, now - last) * rate)
+            state[1] = max(now, last)
+            state[2] = max(0.5, value)
+
+    def reserve(self) -> float:
+        """Deduct one token and return how long the caller must wait for it."""
+        with self._state() as state:
+            tokens, last, rate = state
+            now = time.time()
+            tokens = min(self._capacity, tokens + max(0.0, now - last) * rate) - 1.0
+            state[0], state[1] = tokens, max(now, last)
+        # last is ahead of now while the bucket is paused; tokens accrue from then
+        return max(0.0, last - now) + (-tokens / rate if tokens < 0 else 0.0)
+
+    def pause(self, seconds: float) -> None:
+        """Hand out no tokens for the next seconds, in every process, then refill from empty."""
+        with self._state() as state:
+            tokens, last, rate = state
+            now = time.time()
+            tokens = min(self._capacity, tokens + max(0.0, now - last) * rate)
+            state[0], state[1] = min(tokens, 0.0), max(now + seconds, last)
+
+    def refund(self) -> None:
+        """Put back a token a caller reserved but did not use."""
+        with self._state() as state:
+            tokens, last, rate = state
+            now = time.time()
+            tokens = min(self._capacity, tokens + max(0.0, now - last) * rate)
+            state[0], state[1] = min(self._capacity, tokens + 1.0), max(now, last)
+
+    def acquire(self, priority: Any = None, held: Any = None, hold_limit: float = 0.0) -> bool:
+        """Reserve a token and sleep off its wait. Returns whether held's token was refunded.
+
+        The wait is known up front, so held's token is refunded before sleeping when it
+        is longer than hold_limit.
+        """
+        # Reservations are spread over processes, so there is no queue to order by priority
+        wait = self.reserve()
+        refunded = held is not None and wait > hold_limit
+        if refunded:
+            held.refund()
+        if wait > 0.0:
+            time.sleep(wait)
+        return refunded
+
+
+class AsyncSharedTokenBucket(SharedTokenBucket):
+    """SharedTokenBucket for asynchronous rate limiting.
+
+    The reservation blocks the event loop only for the file lock's read-modify-write;
+    the wait for the token is an asyncio.sleep.
+    """
+
+    async def acquire(self, priority: Any = None, held: Any = None, hold_limit: float = 0.0) -> bool:
+        wait = self.reserve()
+        refunded = held is not None and wait > hold_limit
+        if refunded:
+            held.refund()
+        if wait > 0.0:
+            await asyncio.sleep(wait)
+        return refunded
@@ -9,40 +9,338 @@ Key concepts:
 - A lazy cache maps network IDs and device serials to their parent org ID
 - Each org gets its own token bucket, refilling at the configured rate
 - Unknown identifiers route through a conservative shared bucket until resolved
+- Optionally, the buckets live in a directory shared by every process on the host
+- Optionally, requests leave through a pool of egresses, each with its own global bucket
+- Optionally, endpoint classes (families of heavy operations) get their own bucket per
+  org, taken before the org's, so their 429s slow only that class
+- Optionally, each org's ceiling is calibrated from its API usage telemetry, so the
+  org runs at whatever rate other clients leave free
 """
 
 from __future__ import annotations
 
 import asyncio
-import re
+import fnmatch
+import functools
+import heapq
+import itertools
 import threading
 import time
+import weakref
+from collections import deque
+from contextlib import contextmanager
+from contextvars import ContextVar
 from datetime import datetime, timezone
 from pathlib import Path
-from typing import Any, Callable, Coroutine, Dict, Optional, Set
+from typing import (
+    Any,
+    Callable,
+    Coroutine,
+    Deque,
+    Dict,
+    FrozenSet,
+    Iterable,
+    Iterator,
+    List,
+    NamedTuple,
+    Optional,
+    Set,
+    Tuple,
+    Union,
+)
+
+from meraki.codec import JSONCodec
+from meraki.exceptions import SessionInputError
+from meraki.mapping_store import MappingStore, MappingTable, _parse_saved_at  # noqa: F401
+from meraki.shared_bucket import AsyncSharedTokenBucket, SharedTokenBucket
+
+# Path segments followed by the ID of the scope a request is for, and the route field each fills
+_SCOPE_SEGMENTS = {"organizations": "org", "networks": "network", "devices": "serial"}
+# Request paths whose parsed route is kept; a job touching more paths than this reparses the least recent
+_ROUTE_CACHE_SIZE = 8192
+
+# Items of one response body learned at most; list pages hold up to 1000 items on most
+# endpoints, and a larger body should not hold up the request that returned it
+_LEARN_MAX_ITEMS = 5000
+
+# Seconds a request waits for its global token while holding an org token before handing the org token back
+_HELD_TOKEN_SECONDS = 1.0
+
+# Calibration: the lowest ceiling it sets
+_CALIBRATION_MIN_RATE = 1.0
+# Seconds of usage telemetry sampled per calibration
+_CALIBRATION_TIMESPAN = 600
+# Seconds per slot of the per-org count of requests this limiter sent
+_USAGE_SLOT = 10
+
+
+# Weighted fair queuing share of each named priority class. A caller may also give a
+# number, which is used as the weight directly.
+PRIORITY_CLASSES: Dict[str, float] = {"interactive": 8.0, "normal": 1.0, "batch": 0.25}
+
+Priority = Union[str, float, None]
+
+_request_priority: ContextVar[Priority] = ContextVar("meraki_smart_flow_priority", default=None)
+
+
+def _priority_flow(priority: Priority) -> Tuple[Any, float]:
+    """The fair queuing flow key and weight of a priority class or weight (None is "normal")."""
+    if priority is None:
+        priority = "normal"
+    if isinstance(priority, str):
+        weight = PRIORITY_CLASSES.get(priority)
+        if weight is not None:
+            return priority, weight
+    elif isinstance(priority, (int, float)) and not isinstance(priority, bool) and priority > 0:
+        return float(priority), float(priority)
+    raise SessionInputError(
+        "smart_flow_priority",
+        priority,
+        f"Use one of {list(PRIORITY_CLASSES)} or a positive weight.",
+        None,
+    )
+
+
+@contextmanager
+def priority(value: Priority) -> Iterator[None]:
+    """Send the requests made inside the block (in this thread or task) at this priority class or weight."""
+    _priority_flow(value)
+    token = _request_priority.set(value)
+    try:
+        yield
+    finally:
+        _request_priority.reset(token)
+
+
+def request_priority(default: Priority = None) -> Priority:
+    """The priority set by an enclosing priority() block, else default."""
+    value = _request_priority.get()
+    return default if value is None else value
+
+
+def _paused_for(retry_after: Optional[float]) -> str:
+    return f", paused for {retry_after:g}s" if retry_after else ""
 
-import json
 
+def _egress_label(egress: int) -> str:
+    return f" egress {egress}" if egress else ""
 
-# URL patterns for extracting resource identifiers
-_ORG_PATTERN = re.compile(r"/organizations/([^/]+)")
-_NETWORK_PATTERN = re.compile(r"/networks/([^/]+)")
-_DEVICE_PATTERN = re.compile(r"/devices/([^/]+)")
 
+def _decayed_rate(stored: Optional[Tuple[float, float]], rate: float, half_life: Optional[float], now: float) -> float:
+    """Starting rate for an org whose bucket was last at stored (rate, updated_at).
 
-def _parse_saved_at(value: Any) -> Optional[float]:
-    """Parse ISO 8601Z saved_at timestamp to epoch seconds."""
+    The gap between the stored rate and the configured rate halves every half_life
+    seconds, so a limit learned an hour ago mostly holds and one from last week is gone.
+    """
+    if not stored or not half_life or stored[0] >= rate:
+        return rate
+    learned, updated_at = stored
+    return rate - (rate - learned) * 0.5 ** (max(0.0, now - updated_at) / half_life)
+
+
+def _parse_timestamp(value: Any) -> Optional[float]:
+    """Parse an API ISO 8601 timestamp ("Z" or offset, optional fraction) to epoch seconds."""
     if not isinstance(value, str):
         return None
     try:
-        dt = datetime.strptime(value, "%Y-%m-%dT%H:%M:%SZ").replace(tzinfo=timezone.utc)
-        return dt.timestamp()
+        dt = datetime.fromisoformat(value.replace("Z", "+00:00"))
     except ValueError:
         return None
+    return (dt if dt.tzinfo else dt.replace(tzinfo=timezone.utc)).timestamp()
+
+
+def _others_rate(intervals: Any, sent: Dict[int, int], now: float) -> Optional[float]:
+    """Peak req/s that clients other than this limiter sent an org, from a byInterval usage body.
+
+    intervals is getOrganizationApiRequestsOverviewResponseCodesByInterval's body. sent
+    counts this limiter's requests per _USAGE_SLOT slot of epoch seconds; they are
+    subtracted from each interval's total. Intervals not over by now are skipped.
+    None when the body has no complete interval.
+    """
+    if not isinstance(intervals, list):
+        return None
+    peak = None
+    for interval in intervals:
+        if not isinstance(interval, dict):
+            continue
+        start, end = _parse_timestamp(interval.get("startTs")), _parse_timestamp(interval.get("endTs"))
+        if start is None or end is None or end <= start or end > now:
+            continue
+        total = sum(c.get("count", 0) for c in interval.get("counts") or () if isinstance(c, dict))
+        ours = sum(n for slot, n in sent.items() if start <= slot * _USAGE_SLOT < end)
+        rate = max(0.0, total - ours) / (end - start)
+        peak = rate if peak is None else max(peak, rate)
+    return peak
+
+
+def _calibrated_ceiling(org_rate: float, others_rate: float) -> float:
+    """An org's ceiling given the configured org rate and the peak rate other clients use: what they leave of it."""
+    return max(_CALIBRATION_MIN_RATE, org_rate - others_rate)
+
+
+class EndpointClass(NamedTuple):
+    """A budget for a family of operations, layered on the org and global buckets.
+
+    Each org gets its own bucket for the class (requests with no known org share one).
+    An operation is in the class if its name matches one of operations (names or
+    fnmatch patterns such as "claim*") or one of its tags is in tags.
+    """
+
+    name: str
+    rate: float
+    capacity: int
+    operations: Tuple[str, ...]
+    tags: FrozenSet[str]
+
+    def matches(self, operation: str, tags: Iterable[str]) -> bool:
+        return any(fnmatch.fnmatchcase(operation, pattern) for pattern in self.operations) or not self.tags.isdisjoint(tags)
+
+
+def parse_endpoint_classes(spec: Optional[Dict[str, Dict[str, Any]]]) -> Tuple[EndpointClass, ...]:
+    """Parse smart_flow_endpoint_classes, {name: {"rate": ..., "capacity": ..., "operations": [...], "tags": [...]}}.
+
+    Classes are matched in the order given. Raises SessionInputError on a bad spec.
+    """
+
+    def invalid(reason: str) -> SessionInputError:
+        return SessionInputError("smart_flow_endpoint_classes", spec, reason, None)
+
+    if not spec:
+        return ()
+    if not isinstance(spec, dict):
+        raise invalid("Use a dict of class name to its rate and the operations or tags it covers.")
+    classes = []
+    for name, entry in spec.items():
+        if not isinstance(entry, dict) or set(entry) - {"rate", "capacity", "operations", "tags"}:
+            raise invalid(f"Class {name!r} takes only rate, capacity, operations and tags.")
+        rate = entry.get("rate")
+        if isinstance(rate, bool) or not isinstance(rate, (int, float)) or rate <= 0:
+            raise invalid(f"Class {name!r} needs a positive rate in requests per second.")
+        capacity = entry.get("capacity", max(1, int(rate)))
+        if isinstance(capacity, bool) or not isinstance(capacity, int) or capacity < 1:
+            raise invalid(f"Class {name!r} capacity must be a positive integer.")
+        operations, tags = entry.get("operations", ()), entry.get("tags", ())
+        if isinstance(operations, str) or isinstance(tags, str) or not (operations or tags):
+            raise invalid(f"Class {name!r} needs a list of operations or tags.")
+        classes.append(EndpointClass(str(name), float(rate), capacity, tuple(operations), frozenset(tags)))
+    return tuple(classes)
+
+
+class _Route(NamedTuple):
+    """The scope IDs in a request path: the first segment after each of organizations, networks and devices.
+
+    network_list is set for an org's network list, whose items' "id" fields are network IDs.
+    """
+
+    org: Optional[str]
+    network: Optional[str]
+    serial: Optional[str]
+    network_list: bool = False
+
+
+_NO_ROUTE = _Route(None, None, None)
+
+
+def _route(url: str) -> _Route:
+    """The scope IDs in a URL, parsed once per path.
+
+    The query string is dropped first, so every page of a list shares one memo entry.
+    """
+    return _route_path(url.partition("?")[0])
+
+
+@functools.lru_cache(maxsize=_ROUTE_CACHE_SIZE)
+def _route_path(path: str) -> _Route:
+    ids: Dict[str, Any] = {}
+    segments = path.split("/")
+    for segment, identifier in itertools.pairwise(segments):
+        field = _SCOPE_SEGMENTS.get(segment)
+        if field and identifier and field not in ids:
+            ids[field] = identifier
+    if not ids:
+        return _NO_ROUTE
+    if segments[-1] == "":
+        del segments[-1]
+    ids["network_list"] = segments[-3:-2] == ["organizations"] and bool(segments[-2]) and segments[-1] == "networks"
+    return _NO_ROUTE._replace(**ids)
+
+
+def _ids_from_body(route: _Route, body: Any) -> Tuple[List[str], List[str]]:
+    """The network IDs and device serials a response body names: its own, or each list item's.
+
+    A list body, or a dict with an "items" list (paginated endpoints), is read item by
+    item, up to _LEARN_MAX_ITEMS of them.
+    """
+    if isinstance(body, dict):
+        items = body.get("items")
+        if not isinstance(items, list):
+            items = [body]
+    elif isinstance(body, list):
+        items = body
+    else:
+        return [], []
+    items = [item for item in itertools.islice(items, _LEARN_MAX_ITEMS) if isinstance(item, dict)]
+
+    networks = [item.get("networkId") for item in items]
+    networks += [net.get("id") for net in (item.get("network") for item in items) if isinstance(net, dict)]
+    if route.network_list:
+        networks += [item.get("id") for item in items]
+    serials = [item.get("serial") for item in items]
+    return [n for n in networks if isinstance(n, str)], [s for s in serials if isinstance(s, str)]
+
+
+class _FairQueue:
+    """Weighted fair queue (self-clocked) of callers waiting for a bucket's tokens.
+
+    Each waiter gets a finish tag: the later of the queue's virtual time and its
+    flow's last tag, plus 1/weight. Waiters are served in tag order, so while flows
+    are backlogged each gets tokens in proportion to its weight, and a flow with a
+    high weight is served ahead of a long queue of low-weight waiters.
+    """
+
+    def __init__(self):
+        self.heap: List[list] = []
+        self._seq = itertools.count()
+        self._vtime = 0.0
+        self._flow_finish: Dict[Any, float] = {}
+
+    def push(self, priority: Priority, handle: Any) -> list:
+        flow, weight = _priority_flow(priority)
+        tag = max(self._vtime, self._flow_finish.get(flow, 0.0)) + 1.0 / weight
+        self._flow_finish[flow] = tag
+        entry = [tag, next(self._seq), handle]
+        heapq.heappush(self.heap, entry)
+        return entry
+
+    def pop(self) -> list:
+        entry = heapq.heappop(self.heap)
+        self._vtime = entry[0]
+        if not self.heap:
+            # Idle: start the next busy period from scratch
+            self._vtime = 0.0
+            self._flow_finish.clear()
+        return entry
+
+    def remove(self, entry: list) -> None:
+        """Drop a waiter that gave up (cancelled or interrupted)."""
+        self.heap.remove(entry)
+        heapq.heapify(self.heap)
+        if not self.heap:
+            self._vtime = 0.0
+            self._flow_finish.clear()
 
 
 class TokenBucket:
-    """Thread-safe token bucket for synchronous rate limiting."""
+    """Thread-safe token bucket for synchronous rate limiting.
+
+    A caller takes a token straight away when one is available and nobody is
+    queued. Otherwise it joins the bucket's weighted fair queue: only the caller
+    at its head sleeps until the next token, takes it and wakes the new head.
+
+    A caller that holds another bucket's token while it waits here passes that
+    bucket as held: once the wait passes hold_limit seconds, the held token is
+    refunded, so it is not spent while the caller sits in this queue.
+    """
 
     def __init__(self, rate: float, capacity: int):
         self._rate = rate
@@ -50,6 +348,7 @@ class TokenBucket:
         self._tokens = float(capacity)
         self._last = time.monotonic()
         self._lock = threading.Lock()
+        self._queue = _FairQueue()
 
     @property
     def rate(self) -> float:
@@ -59,35 +358,99 @@ class TokenBucket:
     def rate(self, value: float) -> None:
         self._rate = max(0.5, value)
 
-    def acquire(self) -> None:
-        # Reserve the token (read-modify-write) under the lock, then sleep
-        # outside it so concurrent callers don't serialize behind one sleeper.
-        with self._lock:
-            now = time.monotonic()
-            # Refill, then deduct this request unconditionally. Tokens may go
-            # negative: that deficit IS the reservation, so concurrent callers
-            # each compute their own wait against the accumulated deficit rather
-            # than all colliding on the same instant.
-            elapsed = now - self._last
-            self._tokens = min(self._capacity, self._tokens + elapsed * self._rate)
+    def _refill(self) -> float:
+        now = time.monotonic()
+        # _last is ahead of now while the bucket is paused; nothing accrues until then
+        if now > self._last:
+            self._tokens = min(self._capacity, self._tokens + (now - self._last) * self._rate)
             self._last = now
-            self._tokens -= 1.0
+        return now
 
-            wait = -self._tokens / self._rate if self._tokens < 0 else 0.0
+    def pause(self, seconds: float) -> None:
+        """Hand out no tokens for the next seconds, then refill from empty at the current rate.
 
-        if wait > 0.0:
-            time.sleep(wait)
+        Queued callers stay queued and are released one token at a time after the pause.
+        """
+        with self._lock:
+            now = self._refill()
+            self._tokens = min(self._tokens, 0.0)
+            self._last = max(self._last, now + seconds)
+            if self._queue.heap:
+                # The head is sleeping off the old deficit; have it recompute
+                self._queue.heap[0][2].set()
+
+    def refund(self) -> None:
+        """Put back a token a caller took but did not use."""
+        with self._lock:
+            self._refill()
+            self._tokens = min(self._capacity, self._tokens + 1.0)
+            if self._queue.heap:
+                self._queue.heap[0][2].set()
+
+    def acquire(self, priority: Priority = None, held: Any = None, hold_limit: float = 0.0) -> bool:
+        """Take a token, waiting in the fair queue if need be. Returns whether held's token was refunded."""
+        with self._lock:
+            now = self._refill()
+            if not self._queue.heap and self._tokens >= 1.0:
+                self._tokens -= 1.0
+                return False
+            entry = self._queue.push(priority, threading.Event())
+        refund_at = now + hold_limit if held is not None else None
+        refunded = False
+
+        event = entry[2]
+        try:
+            while True:
+                with self._lock:
+                    now = self._refill()
+                    if self._queue.heap[0] is entry:
+                        if self._tokens >= 1.0:
+                            self._tokens -= 1.0
+                            self._queue.pop()
+                            if self._queue.heap:
+                                self._queue.heap[0][2].set()
+                            return refunded
+                        wait: Optional[float] = max(0.0, self._last - now) + (1.0 - self._tokens) / self._rate
+                    else:
+                        # Not at the head: sleep until the waiter ahead hands over
+                        wait = None
+                    event.clear()
+                if refund_at is not None:
+                    if now >= refund_at:
+                        held.refund()
+                        refund_at, refunded = None, True
+                        continue
+                    wait = refund_at - now if wait is None else min(wait, refund_at - now)
+                event.wait(wait)
+        except BaseException:
+            with self._lock:
+                if entry in self._queue.heap:
+                    self._queue.remove(entry)
+                    if self._queue.heap:
+                        self._queue.heap[0][2].set()
+            raise
 
 
 class AsyncTokenBucket:
-    """Async token bucket for asynchronous rate limiting."""
+    """Async token bucket for asynchronous rate limiting.
+
+    Same fair queue as TokenBucket, of futures. Instead of each waiter sleeping on
+    its own timer, the bucket keeps one timer, due when the head's token is: it
+    resolves the futures of as many waiters as there are tokens, then re-arms for
+    the next. A cancelled waiter is skipped when its turn comes, and a waiter
+    cancelled after its token was granted puts the token back. Every operation runs
+    on the event loop between awaits, so it needs no lock.
+    """
 
     def __init__(self, rate: float, capacity: int):
         self._rate = rate
         self._capacity = capacity
         self._tokens = float(capacity)
         self._last: Optional[float] = None
-        self._lock = asyncio.Lock()
+        self._queue = _FairQueue()
+        # Live (not cancelled) waiters in _queue, and the timer that releases them
+        self._waiting = 0
+        self._timer: Optional[asyncio.TimerHandle] = None
 
     @property
     def rate(self) -> float:
@@ -96,30 +459,114 @@ class AsyncTokenBucket:
     @rate.setter
     def rate(self, value: float) -> None:
         self._rate = max(0.5, value)
+        if self._timer is not None:
+            # The head's token is due sooner or later at the new rate
+            self._arm(asyncio.get_event_loop())
 
-    async def acquire(self) -> None:
-        # Reserve the token under the lock, then await the sleep OUTSIDE the
-        # lock so concurrent coroutines on the same bucket aren't serialized
-        # behind a single sleeper (preserving burst/parallelism).
-        loop = asyncio.get_event_loop()
-        async with self._lock:
-            now = loop.time()
-            if self._last is None:
-                self._last = now
-
-            # Refill, then deduct this request unconditionally. Tokens may go
-            # negative: that deficit IS the reservation, so concurrent callers
-            # each compute their own wait against the accumulated deficit rather
-            # than all colliding on the same instant.
-            elapsed = now - self._last
-            self._tokens = min(self._capacity, self._tokens + elapsed * self._rate)
+    def _refill(self, now: float) -> None:
+        if self._last is None:
+            self._last = now
+        if now > self._last:
+            self._tokens = min(self._capacity, self._tokens + (now - self._last) * self._rate)
             self._last = now
+
+    def pause(self, seconds: float) -> None:
+        """Hand out no tokens for the next seconds, then refill from empty at the current rate."""
+        loop = asyncio.get_event_loop()
+        now = loop.time()
+        self._refill(now)
+        self._tokens = min(self._tokens, 0.0)
+        self._last = max(self._last, now + seconds)
+        if self._timer is not None:
+            self._arm(loop)
+
+    def _arm(self, loop: asyncio.AbstractEventLoop) -> None:
+        """(Re)schedule the timer for when the next token is due."""
+        if self._timer is not None:
+            self._timer.cancel()
+        now = loop.time()
+        self._refill(now)
+        due = max(self._last, now) + max(0.0, 1.0 - self._tokens) / self._rate
+        self._timer = loop.call_at(due, self._release, loop)
+
+    def _release(self, loop: asyncio.AbstractEventLoop) -> None:
+        """Timer callback: grant a token to each waiter at the head while tokens last."""
+        self._timer = None
+        self._refill(loop.time())
+        heap = self._queue.heap
+        while heap and self._tokens >= 1.0:
+            future = self._queue.pop()[2]
+            if future.done():
+                continue
             self._tokens -= 1.0
+            self._waiting -= 1
+            future.set_result(None)
+        if self._waiting:
+            self._arm(loop)
+        elif heap:
+            self._clear_queue()
+
+    def _clear_queue(self) -> None:
+        # Only cancelled waiters are left: start the next busy period from scratch
+        self._queue = _FairQueue()
+
+    def refund(self) -> None:
+        """Put back a token a caller took but did not use."""
+        loop = asyncio.get_event_loop()
+        self._refill(loop.time())
+        self._tokens = min(self._capacity, self._tokens + 1.0)
+        if self._waiting:
+            self._arm(loop)
+
+    def _cancelled(self, future: asyncio.Future) -> None:
+        """Account for a waiter that gave up, returning its token if it had been granted one."""
+        if future.cancelled():
+            self._waiting -= 1
+            if not self._waiting:
+                if self._timer is not None:
+                    self._timer.cancel()
+                    self._timer = None
+                self._clear_queue()
+            elif len(self._queue.heap) > 2 * self._waiting + 64:
+                # Mostly cancelled entries: drop them so the heap stays proportional to live waiters
+                self._queue.heap = [entry for entry in self._queue.heap if not entry[2].done()]
+                heapq.heapify(self._queue.heap)
+        else:
+            self._tokens = min(self._capacity, self._tokens + 1.0)
+            if self._waiting:
+                # Due now: the next waiter gets it on the following loop iteration
+                self._arm(asyncio.get_event_loop())
+
+    async def acquire(self, priority: Priority = None, held: Any = None, hold_limit: float = 0.0) -> bool:
+        """Take a token, as TokenBucket.acquire. Returns whether held's token was refunded."""
+        loop = asyncio.get_running_loop()
+        self._refill(loop.time())
+        if not self._waiting and self._tokens >= 1.0:
+            self._tokens -= 1.0
+            return False
 
-            wait = -self._tokens / self._rate if self._tokens < 0 else 0.0
+        future = loop.create_future()
+        self._queue.push(priority, future)
+        self._waiting += 1
+        if self._timer is None:
+            self._arm(loop)
+        refunded = False
 
-        if wait > 0.0:
-            await asyncio.sleep(wait)
+        def give_back() -> None:
+            nonlocal refunded
+            refunded = True
+            held.refund()
+
+        refund = loop.call_later(hold_limit, give_back) if held is not None else None
+        try:
+            await future
+        except asyncio.CancelledError:
+            self._cancelled(future)
+            raise
+        finally:
+            if refund is not None:
+                refund.cancel()
+        return refunded
 
 
 class OrgRateLimiter:
@@ -128,6 +575,14 @@ class OrgRateLimiter:
     Maintains a token bucket per organization and a shared "unknown" bucket for
     requests whose org cannot yet be determined. The cache maps network IDs and
     device serials to org IDs, populated eagerly at init or lazily from responses.
+
+    Thread-safe: one limiter is shared by every thread using the session. Bucket
+    creation and mapping updates happen under a lock; resolver and hydrator API
+    calls and token waits happen outside it. The cache file is a MappingStore, read
+    on demand and written in batches by its own background thread.
+
+    With shared_dir set, the buckets are SharedTokenBucket files in that directory,
+    so every limiter on the host that uses the same directory draws from one budget.
     """
 
     def __init__(
@@ -138,29 +593,65 @@ class OrgRateLimiter:
         cache_path: Optional[str] = None,
         cache_ttl: Optional[float] = 604800.0,
         logger: Any = None,
+        codec: Optional[JSONCodec] = None,
+        shared_dir: Optional[str] = None,
+        hydration_workers: int = 8,
+        rate_half_life: Optional[float] = 14400.0,
+        calibrate_interval: Optional[float] = None,
+        endpoint_classes: Optional[Dict[str, Dict[str, Any]]] = None,
+        egresses: int = 1,
     ):
+        self._lock = threading.RLock()
+        self._shared_dir = shared_dir
         self._rate = rate
         self._capacity = capacity
         self._global_rate = global_rate
         self._logger = logger
         self._cache_path = Path(cache_path) if cache_path else None
         self._cache_ttl = cache_ttl
+        self._rate_half_life = rate_half_life
+        self._codec = codec or JSONCodec()
 
         # org_id -> bucket
         self._org_buckets: Dict[str, TokenBucket] = {}
-        # network_id -> org_id, serial -> org_id
-        self._network_to_org: Dict[str, str] = {}
-        self._serial_to_org: Dict[str, str] = {}
-        # Global bucket: source IP limit shared by all requests
-        self._global_bucket = TokenBucket(rate=global_rate, capacity=int(global_rate))
-
-        self._cache_fresh = False
+        # network_id -> org_id, serial -> org_id, read from the cache file on demand
+        self._store = self._open_store()
+        self._network_to_org = MappingTable(self._store, "network")
+        self._serial_to_org = MappingTable(self._store, "device")
+        # Global buckets: the source IP limit, one per egress (requests_egresses) requests can leave through
+        self._global_buckets = [
+            self._new_bucket(f"global-{i}" if i else "global", global_rate, int(global_rate)) for i in range(max(1, egresses))
+        ]
+        # Requests waiting on each egress's global bucket, and a turn counter rotating between equally loaded ones
+        self._egress_waiting = [0] * len(self._global_buckets)
+        self._egress_turn = itertools.count()
+        # Endpoint classes by name, in match order; (class name, org_id or None) -> bucket
+        self._endpoint_classes = {c.name: c for c in parse_endpoint_classes(endpoint_classes)}
+        self._class_buckets: Dict[Tuple[str, Optional[str]], TokenBucket] = {}
+        # operation -> its endpoint class; an operation's tags never change
+        self._operation_classes: Dict[str, Optional[str]] = {}
+
+        self._cache_fresh = self._store is not None and self._store.fresh
         self._dirty = 0
         self._pending_lookups: Set[str] = set()
         self._hydrated_orgs: Set[str] = set()
         self._resolver: Optional[Callable[[str, str], Optional[str]]] = None
         self._hydrator: Optional[Callable[[str], None]] = None
-        self._load_cache()
+        # (org_id, hydrator) waiting for a hydration thread; up to hydration_workers run while any are queued
+        self._hydration_queue: Deque[Tuple[str, Callable[[str], None]]] = deque()
+        self._hydration_cond = threading.Condition()
+        self._hydration_workers = max(1, hydration_workers)
+        self._hydration_threads = 0
+        # Calibration: per-org ceilings from usage telemetry, fetched by the sampler on a daemon thread
+        self._calibrate_interval = calibrate_interval
+        self._sampler: Optional[Callable[[str, int], Any]] = None
+        self._org_ceilings: Dict[str, float] = {}
+        # org_id -> {slot: requests sent}, only kept while calibrating
+        self._usage: Optional[Dict[str, Dict[int, int]]] = {} if calibrate_interval else None
+        self._calibrated_at: Dict[str, float] = {}
+        self._calibration_wake = threading.Event()
+        self._calibration_thread: Optional[threading.Thread] = None
+        self._closed = False
 
     def set_resolver(self, resolver: Callable[[str, str], Optional[str]]) -> None:
         """Set a callback to resolve unknown network/device IDs to org IDs.
@@ -173,139 +664,410 @@ class OrgRateLimiter:
     def set_hydrator(self, hydrator: Callable[[str], None]) -> None:
         """Set a callback to bulk-populate all networks/devices for an org.
 
-        Called once per org after first resolution. The callback should call
-        register_network/register_device for each mapping discovered.
+        Called once per org after first resolution, on a background thread so the
+        request that triggered it is not held up. The callback should call
+        register_network/register_device for each mapping discovered, as it goes.
         """
         self._hydrator = hydrator
 
+    def set_sampler(self, sampler: Callable[[str, int], Any]) -> None:
+        """Set a callback returning an org's API usage telemetry, and start calibrating if enabled.
+
+        The callback receives (org_id, timespan) and should return the body of
+        getOrganizationApiRequestsOverviewResponseCodesByInterval for the last timespan
+        seconds, or None. With calibrate_interval set, a daemon thread calls it for each
+        known org every calibrate_interval seconds and sets the org's ceiling from it.
+        """
+        self._sampler = sampler
+        with self._lock:
+            if self._calibrate_interval and self._calibration_thread is None and not self._closed:
+                self._calibration_thread = threading.Thread(
+                    target=self._calibrate_loop, name="meraki-smart-flow-calibrate", daemon=True
+                )
+                self._calibration_thread.start()
+
     @property
     def cache_fresh(self) -> bool:
         return self._cache_fresh
 
+    @property
+    def _global_bucket(self) -> TokenBucket:
+        """The first egress's global bucket, the only one without an egress pool."""
+        return self._global_buckets[0]
+
+    @_global_bucket.setter
+    def _global_bucket(self, bucket: TokenBucket) -> None:
+        self._global_buckets[0] = bucket
+
+    def _claim_egress(self) -> int:
+        """Pick the least loaded egress and count the caller as waiting on it, in one locked step.
+
+        Least loaded is the fewest waiters for its global bucket's rate, rotating between
+        ties. Concurrent callers each see the others' picks. With a pool, the caller
+        decrements _egress_waiting for the egress once its wait is over.
+        """
+        count = len(self._global_buckets)
+        if count == 1:
+            return 0
+        with self._lock:
+            start = next(self._egress_turn)
+            egress = min(
+                ((start + i) % count for i in range(count)),
+                key=lambda i: (self._egress_waiting[i] + 1) / self._global_buckets[i].rate,
+            )
+            self._egress_waiting[egress] += 1
+        return egress
+
     def _log(self, msg: str) -> None:
         if self._logger:
             self._logger.debug(f"smart_flow, {msg}")
 
+    def _ceiling(self, org_id: str) -> float:
+        """The most an org's bucket may speed up to: its calibrated ceiling, else the configured rate."""
+        return self._org_ceilings.get(org_id, self._rate)
+
+    def set_org_ceiling(self, org_id: str, ceiling: float) -> None:
+        """Cap an org's rate at ceiling.
+
+        A lower rate than the bucket's applies now; a higher one is reached by additive increase.
+        """
+        bucket = self._get_or_create_bucket(org_id)
+        with self._lock:
+            self._org_ceilings[org_id] = ceiling
+            if bucket.rate > ceiling:
+                bucket.rate = ceiling
+
+    def _record_usage(self, org_id: str) -> None:
+        slot = int(time.time() // _USAGE_SLOT)
+        with self._lock:
+            counts = self._usage.setdefault(org_id, {})
+            counts[slot] = counts.get(slot, 0) + 1
+
+    def _usage_for(self, org_id: str) -> Dict[int, int]:
+        """A copy of an org's request counts, dropping slots older than any sample can cover."""
+        oldest = int((time.time() - 2 * _CALIBRATION_TIMESPAN) // _USAGE_SLOT)
+        with self._lock:
+            counts = self._usage.get(org_id, {})
+            for slot in [slot for slot in counts if slot < oldest]:
+                del counts[slot]
+            return dict(counts)
+
+    def calibrate_org(self, org_id: str) -> Optional[float]:
+        """Sample an org's API usage and set its ceiling to the headroom other clients leave. Returns the ceiling."""
+        self._calibrated_at[org_id] = time.monotonic()
+        try:
+            intervals = self._sampler(org_id, _CALIBRATION_TIMESPAN) if self._sampler else None
+        except Exception as e:
+            self._log(f"calibration of org {org_id} failed: {e!r}")
+            return None
+        others = _others_rate(intervals, self._usage_for(org_id) if self._usage is not None else {}, time.time())
+        if others is None:
+            return None
+        ceiling = _calibrated_ceiling(self._rate, others)
+        self.set_org_ceiling(org_id, ceiling)
+        self._log(f"calibrated org {org_id}: others use {others:.1f} req/s, ceiling {ceiling:.1f} req/s")
+        return ceiling
+
+    def _calibrate_loop(self) -> None:
+        """Calibration thread: calibrate each org when it is new or its last calibration is calibrate_interval old."""
+        interval = self._calibrate_interval
+        while not self._closed:
+            # Cleared before the snapshot, so an org added during this pass wakes the next wait
+            self._calibration_wake.clear()
+            with self._lock:
+                orgs = list(self._org_buckets)
+            for org_id in orgs:
+                if self._closed:
+                    return
+                if time.monotonic() - self._calibrated_at.get(org_id, float("-inf")) >= interval:
+                    self.calibrate_org(org_id)
+            due = min((self._calibrated_at[org_id] + interval for org_id in orgs), default=time.monotonic() + interval)
+            # A new org bucket wakes the thread early
+            self._calibration_wake.wait(max(0.0, due - time.monotonic()))
+
+    def _schedule_hydration(self, org_id: str, hydrator: Optional[Callable[[str], None]] = None) -> None:
+        with self._hydration_cond:
+            self._hydration_queue.append((org_id, hydrator or self._hydrator))
+            if self._hydration_threads < self._hydration_workers:
+                self._hydration_threads += 1
+                threading.Thread(target=self._hydrate_queued, name="meraki-smart-flow-hydrate", daemon=True).start()
+
+    def _hydrate_queued(self) -> None:
+        """Hydration thread: hydrate queued orgs one at a time, exiting once the queue is empty."""
+        while True:
+            with self._hydration_cond:
+                if not self._hydration_queue:
+                    self._hydration_threads -= 1
+                    self._hydration_cond.notify_all()
+                    return
+                org_id, hydrator = self._hydration_queue.popleft()
+            self._log(f"hydrating org {org_id}")
+            try:
+                hydrator(org_id)
+                self._log(f"hydrated org {org_id}")
+            except Exception as e:
+                self._log(f"hydration of org {org_id} failed: {e!r}")
+
+    def hydrate_orgs(self, org_ids: Iterable[str], hydrator: Optional[Callable[[str], None]] = None) -> int:
+        """Queue orgs for hydration on up to hydration_workers background threads. Returns how many were queued.
+
+        hydrator replaces the one from set_hydrator for these orgs. Orgs already
+        hydrated or queued are skipped. Requests keep flowing meanwhile: each
+        hydrator registers mappings as its pages arrive.
+        """
+        hydrator = hydrator or self._hydrator
+        if hydrator is None:
+            return 0
+        queued = 0
+        for org_id in org_ids:
+            self._get_or_create_bucket(org_id)
+            with self._lock:
+                if org_id in self._hydrated_orgs:
+                    continue
+                self._hydrated_orgs.add(org_id)
+            self._schedule_hydration(org_id, hydrator)
+            queued += 1
+        return queued
+
+    def wait_for_hydration(self, timeout: Optional[float] = None) -> bool:
+        """Block until every scheduled org hydration has finished. Returns False on timeout."""
+        with self._hydration_cond:
+            return self._hydration_cond.wait_for(lambda: self._hydration_threads == 0, timeout)
+
     def _maybe_flush(self) -> None:
-        if self._dirty >= 50:
-            self.save_cache()
+        with self._lock:
+            if self._dirty < 50:
+                return
             self._dirty = 0
+        if self._store is not None:
+            self._store.flush_soon()
+
+    def _new_bucket(self, name: str, rate: float, capacity: int) -> TokenBucket:
+        """A bucket private to this process, or one shared through shared_dir by every process on the host."""
+        if self._shared_dir:
+            return SharedTokenBucket(self._shared_dir, name, rate, capacity)
+        return TokenBucket(rate, capacity)
 
     def _get_or_create_bucket(self, org_id: str) -> TokenBucket:
-        if org_id not in self._org_buckets:
-            self._org_buckets[org_id] = TokenBucket(self._rate, self._capacity)
-            self._log(f"new bucket for org {org_id} at {self._rate} req/s")
-        return self._org_buckets[org_id]
+        bucket = self._org_buckets.get(org_id)
+        if bucket is not None:
+            return bucket
+        rate = self._starting_rate(org_id)
+        with self._lock:
+            if org_id not in self._org_buckets:
+                # A learned rate also scales the burst the bucket starts with
+                capacity = min(self._capacity, max(1, int(rate)))
+                self._org_buckets[org_id] = self._new_bucket(f"org-{org_id}", rate, capacity)
+                self._log(f"new bucket for org {org_id} at {rate:g} req/s")
+                if self._calibration_thread is not None:
+                    self._calibration_wake.set()
+            return self._org_buckets[org_id]
+
+    def endpoint_class(self, operation: str, tags: Iterable[str] = ()) -> Optional[str]:
+        """The first endpoint class an operation (with its metadata tags) is in, or None."""
+        if not self._endpoint_classes:
+            return None
+        try:
+            return self._operation_classes[operation]
+        except KeyError:
+            name = next((c.name for c in self._endpoint_classes.values() if c.matches(operation, tags)), None)
+            self._operation_classes[operation] = name
+            return name
+
+    def _get_or_create_class_bucket(self, name: str, org_id: Optional[str]) -> Optional[TokenBucket]:
+        """An endpoint class's bucket for an org (None: orgs not yet resolved), or None for an unknown class."""
+        bucket = self._class_buckets.get((name, org_id))
+        if bucket is not None:
+            return bucket
+        endpoint = self._endpoint_classes.get(name)
+        if endpoint is None:
+            return None
+        with self._lock:
+            if (name, org_id) not in self._class_buckets:
+                self._class_buckets[(name, org_id)] = self._new_bucket(
+                    f"class-{name}-{org_id or 'unresolved'}", endpoint.rate, endpoint.capacity
+                )
+            return self._class_buckets[(name, org_id)]
 
-    def resolve_org(self, url: str) -> Optional[str]:
-        """Extract org ID from URL, using cache for network/device lookups."""
-        m = _ORG_PATTERN.search(url)
-        if m:
-            return m.group(1)
+    def _class_bucket_for(self, name: Optional[str], org_id: Optional[str]) -> Optional[TokenBucket]:
+        """The class bucket a request for org_id drew from: the org's, else the unresolved one."""
+        if not name:
+            return None
+        return self._class_buckets.get((name, org_id)) or self._class_buckets.get((name, None))
 
-        m = _NETWORK_PATTERN.search(url)
-        if m:
-            return self._network_to_org.get(m.group(1))
+    def _starting_rate(self, org_id: str) -> float:
+        """The configured rate, or the org's rate from the cache while it decays back toward it."""
+        if self._store is None or not self._rate_half_life:
+            return self._rate
+        return _decayed_rate(self._store.get_rate(org_id), self._rate, self._rate_half_life, time.time())
 
-        m = _DEVICE_PATTERN.search(url)
-        if m:
-            return self._serial_to_org.get(m.group(1))
+    def _save_rate(self, org_id: str, rate: float) -> None:
+        """Keep an org's rate after a 429 in the cache, for the next session's starting rate."""
+        if self._store is not None and self._rate_half_life:
+            self._store.put_rate(org_id, rate)
 
+    def resolve_org(self, url: str) -> Optional[str]:
+        """Extract org ID from URL, using cache for network/device lookups."""
+        return self._route_org(_route(url))
+
+    def _route_org(self, route: _Route) -> Optional[str]:
+        """The org of a parsed URL: its own, else the cached org of its network or device."""
+        if route.org:
+            return route.org
+        if route.network:
+            return self._network_to_org.get(route.network)
+        if route.serial:
+            return self._serial_to_org.get(route.serial)
         return None
 
-    def acquire(self, url: str) -> None:
-        """Block until tokens are available from both global and per-org buckets."""
-        self._global_bucket.acquire()
+    def acquire(self, url: str, priority: Priority = None, endpoint_class: Optional[str] = None) -> int:
+        """Block until tokens are available from the endpoint class, per-org and global buckets.
 
-        org_id = self.resolve_org(url)
-        if org_id:
-            self._get_or_create_bucket(org_id).acquire()
-        else:
-            self._resolve_inline(url)
-            org_id = self.resolve_org(url)
-            if org_id:
-                self._get_or_create_bucket(org_id).acquire()
+        The org token is taken (and waited for) first, and the global token only
+        after it, so a request queued behind a saturated org does not hold global
+        budget that requests for other orgs could be sending with. If the global wait
+        then passes _HELD_TOKEN_SECONDS, the org token is refunded, and a new one is
+        taken once the global token is in hand. While requests queue, each bucket
+        serves them by weighted fair queuing on their priority. A request in an
+        endpoint class takes its class token before either, for the same reason.
 
-    def _resolve_inline(self, url: str) -> None:
-        """Attempt a synchronous lookup for an unresolved network/device ID."""
+        Returns the egress to send through, whose global bucket the token came from.
+        """
+        route = _route(url)
+        org_id = self._route_org(route)
+        if not org_id:
+            self._resolve_inline(route)
+            org_id = self._route_org(route)
+        if endpoint_class:
+            class_bucket = self._get_or_create_class_bucket(endpoint_class, org_id)
+            if class_bucket is not None:
+                class_bucket.acquire(priority)
+        org_bucket = self._get_or_create_bucket(org_id) if org_id else None
+        if org_bucket is not None:
+            org_bucket.acquire(priority)
+            if self._usage is not None:
+                self._record_usage(org_id)
+
+        egress = self._claim_egress()
+        try:
+            refunded = self._global_buckets[egress].acquire(priority, org_bucket, _HELD_TOKEN_SECONDS)
+        finally:
+            if len(self._global_buckets) > 1:
+                with self._lock:
+                    self._egress_waiting[egress] -= 1
+        if refunded:
+            # The global budget was the bottleneck, so the org has usually refilled since
+            org_bucket.acquire(priority)
+        return egress
+
+    def _resolve_inline(self, route: _Route) -> None:
+        """Attempt a synchronous lookup for an unresolved network/device ID.
+
+        Only the single resolver call is inline; a newly seen org is hydrated on the hydration thread.
+        """
         if not self._resolver:
             return
 
-        m = _NETWORK_PATTERN.search(url)
-        if m:
-            identifier, id_type = m.group(1), "network"
+        if route.network:
+            identifier, id_type = route.network, "network"
+        elif route.serial:
+            identifier, id_type = route.serial, "device"
         else:
-            m = _DEVICE_PATTERN.search(url)
-            if m:
-                identifier, id_type = m.group(1), "device"
-            else:
-                return
-
-        if identifier in self._pending_lookups:
             return
-        self._pending_lookups.add(identifier)
+
+        with self._lock:
+            if identifier in self._pending_lookups:
+                return
+            self._pending_lookups.add(identifier)
         try:
             org_id = self._resolver(id_type, identifier)
             if org_id:
-                if id_type == "network":
-                    self._network_to_org[identifier] = org_id
-                else:
-                    self._serial_to_org[identifier] = org_id
+                with self._lock:
+                    if id_type == "network":
+                        self._network_to_org[identifier] = org_id
+                    else:
+                        self._serial_to_org[identifier] = org_id
+                    self._dirty += 1
                 self._get_or_create_bucket(org_id)
-                self._dirty += 1
                 self._log(f"resolved {id_type} {identifier} -> org {org_id}")
-                if self._hydrator and org_id not in self._hydrated_orgs:
-                    self._hydrated_orgs.add(org_id)
-                    self._log(f"hydrating org {org_id}")
-                    self._hydrator(org_id)
-                    self._log(
-                        f"hydrated org {org_id} "
-                        f"({len(self._network_to_org)} networks, {len(self._serial_to_org)} devices total)"
-                    )
+                self.hydrate_orgs([org_id])
                 self._maybe_flush()
         except Exception:
             pass
         finally:
-            self._pending_lookups.discard(identifier)
-
-    def on_rate_limited(self, url: str) -> None:
-        """Tighten the appropriate bucket (multiplicative decrease)."""
-        org_id = self.resolve_org(url)
-        if org_id and org_id in self._org_buckets:
+            with self._lock:
+                self._pending_lookups.discard(identifier)
+
+    def on_rate_limited(
+        self, url: str, retry_after: Optional[float] = None, endpoint_class: Optional[str] = None, egress: int = 0
+    ) -> None:
+        """Tighten the appropriate bucket (multiplicative decrease).
+
+        With the response's Retry-After, an org's bucket is also paused until then, so
+        the requests queued for that org wait out the limit instead of each collecting a
+        429. The global bucket is only slowed: pausing it would stall every other org.
+        A request in an endpoint class only tightens and pauses its class bucket, so the
+        org's other calls keep their rate.
+        """
+        route = _route(url)
+        org_id = self._route_org(route)
+        class_bucket = self._class_bucket_for(endpoint_class, org_id)
+        if class_bucket is not None:
+            with self._lock:
+                class_bucket.rate = class_bucket.rate * 0.7
+            if retry_after:
+                class_bucket.pause(retry_after)
+            self._log(
+                f"rate limited {endpoint_class} calls for org {org_id}, "
+                f"decreased to {class_bucket.rate:.1f} req/s{_paused_for(retry_after)}"
+            )
+        elif org_id and org_id in self._org_buckets:
             bucket = self._org_buckets[org_id]
-            bucket.rate = bucket.rate * 0.7
-            self._log(f"rate limited org {org_id}, decreased to {bucket.rate:.1f} req/s")
-        elif self._is_unresolved_scoped_url(url):
+            with self._lock:
+                bucket.rate = bucket.rate * 0.7
+            self._save_rate(org_id, bucket.rate)
+            if retry_after:
+                bucket.pause(retry_after)
+            self._log(f"rate limited org {org_id}, decreased to {bucket.rate:.1f} req/s{_paused_for(retry_after)}")
+        elif self._is_unresolved_scoped(route):
             # URL targets a specific network/device whose org isn't resolved
             # yet. Penalizing the global bucket would punish every other org for
             # one org's 429, so skip and let background resolution catch up.
             self._log("rate limited on unresolved network/device url, skipping global penalty")
         else:
-            self._global_bucket.rate = self._global_bucket.rate * 0.7
-            self._log(f"rate limited (global), decreased to {self._global_bucket.rate:.1f} req/s")
+            bucket = self._global_buckets[egress]
+            with self._lock:
+                bucket.rate = bucket.rate * 0.7
+            self._log(f"rate limited (global{_egress_label(egress)}), decreased to {bucket.rate:.1f} req/s")
 
     @staticmethod
-    def _is_unresolved_scoped_url(url: str) -> bool:
-        """True if the URL has a network/device component but no explicit org.
+    def _is_unresolved_scoped(route: _Route) -> bool:
+        """True if the parsed URL has a network/device component but no explicit org.
 
         These are the URLs whose org we can't yet attribute the 429 to; the
         offending org is specific (just unknown), so the global bucket must not
         be punished on its behalf. An explicit /organizations/<id> URL is NOT
         considered unresolved (it names its org directly).
         """
-        if OrgRateLimiter._org_id_from_url(url):
-            return False
-        return bool(OrgRateLimiter._network_id_from_url(url) or OrgRateLimiter._serial_from_url(url))
+        return not route.org and bool(route.network or route.serial)
 
-    def on_success(self, url: str) -> None:
+    def on_success(self, url: str, endpoint_class: Optional[str] = None, egress: int = 0) -> None:
         """Slowly widen buckets back toward configured rates (additive increase)."""
         org_id = self.resolve_org(url)
-        if org_id and org_id in self._org_buckets:
-            bucket = self._org_buckets[org_id]
-            if bucket.rate < self._rate:
-                bucket.rate = min(self._rate, bucket.rate + 0.2)
-        if self._global_bucket.rate < self._global_rate:
-            self._global_bucket.rate = min(self._global_rate, self._global_bucket.rate + 0.5)
+        class_bucket = self._class_bucket_for(endpoint_class, org_id)
+        with self._lock:
+            if class_bucket is not None:
+                rate = self._endpoint_classes[endpoint_class].rate
+                if class_bucket.rate < rate:
+                    class_bucket.rate = min(rate, class_bucket.rate + 0.2)
+            if org_id and org_id in self._org_buckets:
+                bucket = self._org_buckets[org_id]
+                ceiling = self._ceiling(org_id)
+                if bucket.rate < ceiling:
+                    bucket.rate = min(ceiling, bucket.rate + 0.2)
+            global_bucket = self._global_buckets[egress]
+            if global_bucket.rate < self._global_rate:
+                global_bucket.rate = min(self._global_rate, global_bucket.rate + 0.5)
 
     def register_org(self, org_id: str) -> None:
         """Ensure a bucket exists for this org."""
@@ -313,42 +1075,49 @@ class OrgRateLimiter:
 
     def register_network(self, network_id: str, org_id: str) -> None:
         """Cache a network -> org mapping."""
-        self._network_to_org[network_id] = org_id
+        with self._lock:
+            self._network_to_org[network_id] = org_id
 
     def register_device(self, serial: str, org_id: str) -> None:
         """Cache a serial -> org mapping."""
-        self._serial_to_org[serial] = org_id
+        with self._lock:
+            self._serial_to_org[serial] = org_id
+
+    def register_networks(self, network_ids: Iterable[str], org_id: str) -> int:
+        """Cache many network -> org mappings in one batch. Returns how many were new or changed."""
+        with self._lock:
+            return self._network_to_org.update(dict.fromkeys(network_ids, org_id))
+
+    def register_devices(self, serials: Iterable[str], org_id: str) -> int:
+        """Cache many serial -> org mappings in one batch. Returns how many were new or changed."""
+        with self._lock:
+            return self._serial_to_org.update(dict.fromkeys(serials, org_id))
 
     def learn_from_response(self, url: str, body: Any) -> None:
-        """Extract org/network/device mappings from a URL and response body."""
-        org_id = self._org_id_from_url(url)
-        if not org_id:
-            org_id = self._org_id_from_body(body)
+        """Extract org/network/device mappings from a URL and response body.
+
+        The org comes from the URL, the body, or a known network or device in the URL.
+        Every network ID and serial in the body is then mapped to it, including each
+        item of a list or paginated "items" body, in one batch per table.
+        """
+        route = _route(url)
+        org_id = route.org or self._org_id_from_body(body) or self._route_org(route)
         if not org_id:
             return
 
         self._get_or_create_bucket(org_id)
-        changed_networks = 0
-        changed_devices = 0
+        networks, serials = _ids_from_body(route, body)
+        if route.network:
+            networks.append(route.network)
+        if route.serial:
+            serials.append(route.serial)
 
-        network_id = self._network_id_from_url(url)
-        if network_id and self._network_to_org.get(network_id) != org_id:
-            self._network_to_org[network_id] = org_id
-            changed_networks += 1
-
-        serial = self._serial_from_url(url)
-        if serial and self._serial_to_org.get(serial) != org_id:
-            self._serial_to_org[serial] = org_id
-            changed_devices += 1
-
-        if isinstance(body, dict):
-            n, d = self._learn_from_body(body, org_id)
-            changed_networks += n
-            changed_devices += d
-
-        total = changed_networks + changed_devices
-        if total:
+        with self._lock:
+            changed_networks = self._network_to_org.update(dict.fromkeys(networks, org_id))
+            changed_devices = self._serial_to_org.update(dict.fromkeys(serials, org_id))
+            total = changed_networks + changed_devices
             self._dirty += total
+        if total:
             if self._logger:
                 self._log(
                     f"learned {total} new mapping{'s' if total != 1 else ''} "
@@ -358,40 +1127,13 @@ class OrgRateLimiter:
                 )
             self._maybe_flush()
 
-    def _learn_from_body(self, body: dict, org_id: str) -> tuple:
-        """Returns (changed_networks, changed_devices) counts."""
-        changed_networks = 0
-        changed_devices = 0
-        if "networkId" in body and self._network_to_org.get(body["networkId"]) != org_id:
-            self._network_to_org[body["networkId"]] = org_id
-            changed_networks += 1
-        if "serial" in body and self._serial_to_org.get(body["serial"]) != org_id:
-            self._serial_to_org[body["serial"]] = org_id
-            changed_devices += 1
-        net = body.get("network")
-        if isinstance(net, dict) and "id" in net:
-            if self._network_to_org.get(net["id"]) != org_id:
-                self._network_to_org[net["id"]] = org_id
-                changed_networks += 1
-        return changed_networks, changed_devices
-
-    @staticmethod
-    def _org_id_from_url(url: str) -> Optional[str]:
-        m = _ORG_PATTERN.search(url)
-        return m.group(1) if m else None
-
-    @staticmethod
-    def _network_id_from_url(url: str) -> Optional[str]:
-        m = _NETWORK_PATTERN.search(url)
-        return m.group(1) if m else None
-
-    @staticmethod
-    def _serial_from_url(url: str) -> Optional[str]:
-        m = _DEVICE_PATTERN.search(url)
-        return m.group(1) if m else None
-
     @staticmethod
     def _org_id_from_body(body: Any) -> Optional[str]:
+        if isinstance(body, dict) and isinstance(body.get("items"), list):
+            body = body["items"]
+        if isinstance(body, list):
+            # The items of one response share an org; the first says which
+            body = body[0] if body else None
         if not isinstance(body, dict):
             return None
         if "organizationId" in body:
@@ -401,50 +1143,36 @@ class OrgRateLimiter:
             return org["id"]
         return None
 
-    def save_cache(self) -> None:
-        """Persist the mapping cache to disk with a timestamp."""
+    def _open_store(self) -> Optional[MappingStore]:
         if not self._cache_path:
+            return None
+        return MappingStore(str(self._cache_path), ttl=self._cache_ttl, codec=self._codec, log=self._log)
+
+    def save_cache(self) -> None:
+        """Write mappings not yet on disk to the cache now, renewing its timestamp."""
+        if self._store is None:
             return
-        self._cache_path.parent.mkdir(parents=True, exist_ok=True)
-        data = {
-            "saved_at": datetime.now(timezone.utc).strftime("%Y-%m-%dT%H:%M:%SZ"),
-            "networks": [{"id": net_id, "organization": {"id": org_id}} for net_id, org_id in self._network_to_org.items()],
-            "devices": [{"serial": serial, "organization": {"id": org_id}} for serial, org_id in self._serial_to_org.items()],
-        }
-        self._cache_path.write_text(json.dumps(data), encoding="utf-8")
-        n = len(self._network_to_org) + len(self._serial_to_org)
-        self._log(f"saved cache ({n} mappings) to {self._cache_path}")
-
-    def _load_cache(self) -> None:
-        """Load mapping cache from disk if it exists and hasn't expired."""
-        if not self._cache_path or not self._cache_path.exists():
-            return
-        try:
-            data = json.loads(self._cache_path.read_text(encoding="utf-8"))
-            if self._cache_ttl is not None:
-                saved_at = data.get("saved_at")
-                if saved_at is None:
-                    self._log("cache expired, will rebuild")
-                    return
-                saved_ts = _parse_saved_at(saved_at)
-                if saved_ts is None or (time.time() - saved_ts) > self._cache_ttl:
-                    self._log("cache expired, will rebuild")
-                    return
-            for net in data.get("networks", []):
-                self._network_to_org[net["id"]] = net["organization"]["id"]
-            for dev in data.get("devices", []):
-                self._serial_to_org[dev["serial"]] = dev["organization"]["id"]
-            self._cache_fresh = True
-            n = len(self._network_to_org) + len(self._serial_to_org)
-            self._log(f"loaded cache ({n} mappings) from {self._cache_path}")
-        except (json.JSONDecodeError, OSError, KeyError):
-            pass
+        n = self._store.flush()
+        self._log(f"saved {n} mappings to {self._cache_path}")
+
+    def close(self) -> None:
+        """Drop queued org hydrations, stop calibrating, write pending mappings and close the cache file.
+
+        A hydration or calibration already running finishes (or fails once its session's client is closed) on its own thread.
+        """
+        self._closed = True
+        self._calibration_wake.set()
+        with self._hydration_cond:
+            self._hydration_queue.clear()
+        if self._store is not None:
+            self._store.close()
 
 
 class AsyncOrgRateLimiter:
     """Async per-org rate limiter with URL-based routing and org resolution cache.
 
-    Same strategy as OrgRateLimiter but uses AsyncTokenBucket for non-blocking waits.
+    Same strategy as OrgRateLimiter but uses AsyncTokenBucket (or AsyncSharedTokenBucket
+    with shared_dir) for non-blocking waits.
     """
 
     def __init__(
@@ -455,20 +1183,44 @@ class AsyncOrgRateLimiter:
         cache_path: Optional[str] = None,
         cache_ttl: Optional[float] = 604800.0,
         logger: Any = None,
+        codec: Optional[JSONCodec] = None,
+        shared_dir: Optional[str] = None,
+        hydration_workers: int = 8,
+        rate_half_life: Optional[float] = 14400.0,
+        calibrate_interval: Optional[float] = None,
+        endpoint_classes: Optional[Dict[str, Dict[str, Any]]] = None,
+        egresses: int = 1,
     ):
+        self._shared_dir = shared_dir
         self._rate = rate
         self._capacity = capacity
         self._global_rate = global_rate
         self._logger = logger
         self._cache_path = Path(cache_path) if cache_path else None
         self._cache_ttl = cache_ttl
+        self._rate_half_life = rate_half_life
+        self._codec = codec or JSONCodec()
 
         self._org_buckets: Dict[str, AsyncTokenBucket] = {}
-        self._network_to_org: Dict[str, str] = {}
-        self._serial_to_org: Dict[str, str] = {}
-        self._global_bucket = AsyncTokenBucket(rate=global_rate, capacity=int(global_rate))
-
-        self._cache_fresh = False
+        self._store = self._open_store()
+        self._network_to_org = MappingTable(self._store, "network")
+        self._serial_to_org = MappingTable(self._store, "device")
+        # Stored org rates, read once here rather than per new bucket on the event loop
+        self._stored_rates = self._store.rates() if self._store is not None and rate_half_life else {}
+        # Global buckets: the source IP limit, one per egress (requests_egresses) requests can leave through
+        self._global_buckets = [
+            self._new_bucket(f"global-{i}" if i else "global", global_rate, int(global_rate)) for i in range(max(1, egresses))
+        ]
+        # Requests waiting on each egress's global bucket, and a turn counter rotating between equally loaded ones
+        self._egress_waiting = [0] * len(self._global_buckets)
+        self._egress_turn = itertools.count()
+        # Endpoint classes by name, in match order; (class name, org_id or None) -> bucket
+        self._endpoint_classes = {c.name: c for c in parse_endpoint_classes(endpoint_classes)}
+        self._class_buckets: Dict[Tuple[str, Optional[str]], AsyncTokenBucket] = {}
+        # operation -> its endpoint class; an operation's tags never change
+        self._operation_classes: Dict[str, Optional[str]] = {}
+
+        self._cache_fresh = self._store is not None and self._store.fresh
         self._dirty = 0
         self._flush_task: Optional[asyncio.Task] = None
         # Hold strong refs to in-flight background tasks; the event loop only
@@ -478,7 +1230,21 @@ class AsyncOrgRateLimiter:
         self._hydrated_orgs: Set[str] = set()
         self._resolver: Optional[Callable[[str, str], Coroutine[Any, Any, Optional[str]]]] = None
         self._hydrator: Optional[Callable[[str], Coroutine[Any, Any, None]]] = None
-        self._load_cache()
+        # (org_id, hydrator) waiting for a hydration task; up to hydration_workers run while any are queued
+        self._hydration_queue: Deque[Tuple[str, Callable[[str], Coroutine[Any, Any, None]]]] = deque()
+        self._hydration_workers = max(1, hydration_workers)
+        self._hydration_running = 0
+        self._hydration_idle = asyncio.Event()
+        self._hydration_idle.set()
+        # Calibration, as in OrgRateLimiter, on a task started by the first acquire()
+        self._calibrate_interval = calibrate_interval
+        self._sampler: Optional[Callable[[str, int], Coroutine[Any, Any, Any]]] = None
+        self._org_ceilings: Dict[str, float] = {}
+        self._usage: Optional[Dict[str, Dict[int, int]]] = {} if calibrate_interval else None
+        self._calibrated_at: Dict[str, float] = {}
+        self._calibration_wake = asyncio.Event()
+        self._calibration_task: Optional[asyncio.Task] = None
+        self._closed = False
 
     def set_resolver(self, resolver: Callable[[str, str], Coroutine[Any, Any, Optional[str]]]) -> None:
         """Set a callback to resolve unknown network/device IDs to org IDs.
@@ -496,10 +1262,105 @@ class AsyncOrgRateLimiter:
         """
         self._hydrator = hydrator
 
+    def set_sampler(self, sampler: Callable[[str, int], Coroutine[Any, Any, Any]]) -> None:
+        """Set a coroutine callback returning an org's API usage telemetry; see OrgRateLimiter.set_sampler.
+
+        With calibrate_interval set, the calibration task starts with the first acquire().
+        """
+        self._sampler = sampler
+
     @property
     def cache_fresh(self) -> bool:
         return self._cache_fresh
 
+    @property
+    def _global_bucket(self) -> AsyncTokenBucket:
+        """The first egress's global bucket, the only one without an egress pool."""
+        return self._global_buckets[0]
+
+    @_global_bucket.setter
+    def _global_bucket(self, bucket: AsyncTokenBucket) -> None:
+        self._global_buckets[0] = bucket
+
+    def _claim_egress(self) -> int:
+        """Pick an egress and count the caller as waiting on it, as OrgRateLimiter._claim_egress.
+
+        There is no await between the two, so no other task picks in between.
+        """
+        count = len(self._global_buckets)
+        if count == 1:
+            self._egress_waiting[0] += 1
+            return 0
+        start = next(self._egress_turn)
+        egress = min(
+            ((start + i) % count for i in range(count)),
+            key=lambda i: (self._egress_waiting[i] + 1) / self._global_buckets[i].rate,
+        )
+        self._egress_waiting[egress] += 1
+        return egress
+
+    def _ceiling(self, org_id: str) -> float:
+        """The most an org's bucket may speed up to: its calibrated ceiling, else the configured rate."""
+        return self._org_ceilings.get(org_id, self._rate)
+
+    def set_org_ceiling(self, org_id: str, ceiling: float) -> None:
+        """Cap an org's rate at ceiling.
+
+        A lower rate than the bucket's applies now; a higher one is reached by additive increase.
+        """
+        bucket = self._get_or_create_bucket(org_id)
+        self._org_ceilings[org_id] = ceiling
+        if bucket.rate > ceiling:
+            bucket.rate = ceiling
+
+    def _record_usage(self, org_id: str) -> None:
+        slot = int(time.time() // _USAGE_SLOT)
+        counts = self._usage.setdefault(org_id, {})
+        counts[slot] = counts.get(slot, 0) + 1
+
+    def _usage_for(self, org_id: str) -> Dict[int, int]:
+        """An org's request counts, dropping slots older than any sample can cover."""
+        oldest = int((time.time() - 2 * _CALIBRATION_TIMESPAN) // _USAGE_SLOT)
+        counts = self._usage.get(org_id, {})
+        for slot in [slot for slot in counts if slot < oldest]:
+            del counts[slot]
+        return counts
+
+    async def calibrate_org(self, org_id: str) -> Optional[float]:
+        """Sample an org's API usage and set its ceiling to the headroom other clients leave. Returns the ceiling."""
+        self._calibrated_at[org_id] = time.monotonic()
+        try:
+            intervals = await self._sampler(org_id, _CALIBRATION_TIMESPAN) if self._sampler else None
+        except Exception as e:
+            self._log(f"calibration of org {org_id} failed: {e!r}")
+            return None
+        others = _others_rate(intervals, self._usage_for(org_id) if self._usage is not None else {}, time.time())
+        if others is None:
+            return None
+        ceiling = _calibrated_ceiling(self._rate, others)
+        self.set_org_ceiling(org_id, ceiling)
+        self._log(f"calibrated org {org_id}: others use {others:.1f} req/s, ceiling {ceiling:.1f} req/s")
+        return ceiling
+
+    def _start_calibration(self) -> None:
+        if self._calibrate_interval and self._sampler and self._calibration_task is None and not self._closed:
+            self._calibration_task = asyncio.ensure_future(self._calibrate_loop())
+
+    async def _calibrate_loop(self) -> None:
+        """Calibration task: calibrate each org when it is new or its last calibration is calibrate_interval old."""
+        interval = self._calibrate_interval
+        while True:
+            self._calibration_wake.clear()
+            orgs = list(self._org_buckets)
+            for org_id in orgs:
+                if time.monotonic() - self._calibrated_at.get(org_id, float("-inf")) >= interval:
+                    await self.calibrate_org(org_id)
+            due = min((self._calibrated_at[org_id] + interval for org_id in orgs), default=time.monotonic() + interval)
+            try:
+                await asyncio.wait_for(self._calibration_wake.wait(), max(0.0, due - time.monotonic()))
+            except asyncio.TimeoutError:
+                pass
+
     def _log(self, msg: str) -> None:
         if self._logger:
             self._logger.debug(f"smart_flow, {msg}")
@@ -521,52 +1382,150 @@ class AsyncOrgRateLimiter:
         # mappings were learned while the save was in flight.
         self._dirty = max(0, self._dirty - pending)
 
+    def _new_bucket(self, name: str, rate: float, capacity: int) -> AsyncTokenBucket:
+        """A bucket private to this process, or one shared through shared_dir by every process on the host."""
+        if self._shared_dir:
+            return AsyncSharedTokenBucket(self._shared_dir, name, rate, capacity)
+        return AsyncTokenBucket(rate, capacity)
+
     def _get_or_create_bucket(self, org_id: str) -> AsyncTokenBucket:
         if org_id not in self._org_buckets:
-            self._org_buckets[org_id] = AsyncTokenBucket(self._rate, self._capacity)
-            self._log(f"new bucket for org {org_id} at {self._rate} req/s")
+            rate = self._starting_rate(org_id)
+            capacity = min(self._capacity, max(1, int(rate)))
+            self._org_buckets[org_id] = self._new_bucket(f"org-{org_id}", rate, capacity)
+            self._log(f"new bucket for org {org_id} at {rate:g} req/s")
+            self._calibration_wake.set()
         return self._org_buckets[org_id]
 
-    def resolve_org(self, url: str) -> Optional[str]:
-        """Extract org ID from URL, using cache for network/device lookups."""
-        m = _ORG_PATTERN.search(url)
-        if m:
-            return m.group(1)
+    def endpoint_class(self, operation: str, tags: Iterable[str] = ()) -> Optional[str]:
+        """The first endpoint class an operation (with its metadata tags) is in, or None."""
+        if not self._endpoint_classes:
+            return None
+        try:
+            return self._operation_classes[operation]
+        except KeyError:
+            name = next((c.name for c in self._endpoint_classes.values() if c.matches(operation, tags)), None)
+            self._operation_classes[operation] = name
+            return name
+
+    def _get_or_create_class_bucket(self, name: str, org_id: Optional[str]) -> Optional[AsyncTokenBucket]:
+        """An endpoint class's bucket for an org (None: orgs not yet resolved), or None for an unknown class."""
+        bucket = self._class_buckets.get((name, org_id))
+        if bucket is not None:
+            return bucket
+        endpoint = self._endpoint_classes.get(name)
+        if endpoint is None:
+            return None
+        if (name, org_id) not in self._class_buckets:
+            self._class_buckets[(name, org_id)] = self._new_bucket(
+                f"class-{name}-{org_id or 'unresolved'}", endpoint.rate, endpoint.capacity
+            )
+        return self._class_buckets[(name, org_id)]
+
+    def _class_bucket_for(self, name: Optional[str], org_id: Optional[str]) -> Optional[AsyncTokenBucket]:
+        """The class bucket a request for org_id drew from: the org's, else the unresolved one."""
+        if not name:
+            return None
+        return self._class_buckets.get((name, org_id)) or self._class_buckets.get((name, None))
 
-        m = _NETWORK_PATTERN.search(url)
-        if m:
-            return self._network_to_org.get(m.group(1))
+    def _starting_rate(self, org_id: str) -> float:
+        """The configured rate, or the org's rate from the cache (as read at init) while it decays back toward it."""
+        if not self._stored_rates:
+            return self._rate
+        return _decayed_rate(self._stored_rates.get(org_id), self._rate, self._rate_half_life, time.time())
 
-        m = _DEVICE_PATTERN.search(url)
-        if m:
-            return self._serial_to_org.get(m.group(1))
+    def _save_rate(self, org_id: str, rate: float) -> None:
+        """Keep an org's rate after a 429 in the cache, for the next session's starting rate."""
+        if self._store is not None and self._rate_half_life:
+            self._store.put_rate(org_id, rate)
 
+    def resolve_org(self, url: str) -> Optional[str]:
+        """Extract org ID from URL, using cache for network/device lookups.
+
+        May query the cache file on the calling thread. The limiter's own lookups
+        on the event loop use only mappings in memory, and read one that is only
+        on disk in a worker thread (see acquire).
+        """
+        route = _route(url)
+        if route.org:
+            return route.org
+        if route.network:
+            return self._network_to_org.get(route.network)
+        if route.serial:
+            return self._serial_to_org.get(route.serial)
         return None
 
-    async def acquire(self, url: str) -> None:
-        """Await until tokens from both global and per-org buckets are available."""
-        await self._global_bucket.acquire()
+    def _route_org(self, route: _Route) -> Optional[str]:
+        """The org of a parsed URL: its own, else the org of its network or device held in memory."""
+        if route.org:
+            return route.org
+        if route.network:
+            return self._network_to_org.cached(route.network)
+        if route.serial:
+            return self._serial_to_org.cached(route.serial)
+        return None
 
-        org_id = self.resolve_org(url)
-        if org_id:
-            await self._get_or_create_bucket(org_id).acquire()
+    async def _stored_org(self, route: _Route) -> Optional[str]:
+        """The stored org of a URL's network or device, read in a worker thread. Known misses are not re-read."""
+        if route.network:
+            table, identifier = self._network_to_org, route.network
+        elif route.serial:
+            table, identifier = self._serial_to_org, route.serial
         else:
-            self._trigger_background_resolve(url)
+            return None
+        if not table.needs_lookup(identifier):
+            return None
+        org_id = await asyncio.get_running_loop().run_in_executor(None, table.fetch, identifier)
+        table.note(identifier, org_id)
+        return table.cached(identifier)
+
+    async def acquire(self, url: str, priority: Priority = None, endpoint_class: Optional[str] = None) -> int:
+        """Await until tokens from the endpoint class, per-org and global buckets are available.
+
+        As in OrgRateLimiter, the class token is taken first and the global token only
+        after the org token, the org token is refunded if the global wait passes
+        _HELD_TOKEN_SECONDS, and queued requests are served by weighted fair queuing
+        on their priority. Returns the egress to send through.
+
+        A network or device whose org is not in memory is looked up in the cache
+        file in a worker thread, once; one it does not have is resolved in the background.
+        """
+        if self._calibration_task is None and self._calibrate_interval:
+            self._start_calibration()
+        route = _route(url)
+        org_id = self._route_org(route) or await self._stored_org(route)
+        if endpoint_class:
+            class_bucket = self._get_or_create_class_bucket(endpoint_class, org_id)
+            if class_bucket is not None:
+                await class_bucket.acquire(priority)
+        org_bucket = self._get_or_create_bucket(org_id) if org_id else None
+        if org_bucket is not None:
+            await org_bucket.acquire(priority)
+            if self._usage is not None:
+                self._record_usage(org_id)
+        else:
+            self._trigger_background_resolve(route)
+
+        egress = self._claim_egress()
+        try:
+            refunded = await self._global_buckets[egress].acquire(priority, org_bucket, _HELD_TOKEN_SECONDS)
+        finally:
+            self._egress_waiting[egress] -= 1
+        if refunded:
+            await org_bucket.acquire(priority)
+        return egress
 
-    def _trigger_background_resolve(self, url: str) -> None:
+    def _trigger_background_resolve(self, route: _Route) -> None:
         """Fire a one-shot background lookup for an unresolved network/device ID."""
         if not self._resolver:
             return
 
-        m = _NETWORK_PATTERN.search(url)
-        if m:
-            identifier, id_type = m.group(1), "network"
+        if route.network:
+            identifier, id_type = route.network, "network"
+        elif route.serial:
+            identifier, id_type = route.serial, "device"
         else:
-            m = _DEVICE_PATTERN.search(url)
-            if m:
-                identifier, id_type = m.group(1), "device"
-            else:
-                return
+            return
 
         if identifier in self._pending_lookups:
             return
@@ -588,52 +1547,132 @@ class AsyncOrgRateLimiter:
             self._get_or_create_bucket(org_id)
             self._dirty += 1
             self._log(f"resolved {id_type} {identifier} -> org {org_id}")
-            if self._hydrator and org_id not in self._hydrated_orgs:
-                self._hydrated_orgs.add(org_id)
-                self._log(f"hydrating org {org_id}")
-                await self._hydrator(org_id)
-                self._log(
-                    f"hydrated org {org_id} ({len(self._network_to_org)} networks, {len(self._serial_to_org)} devices total)"
-                )
+            self.hydrate_orgs([org_id])
             self._maybe_flush()
         except Exception as e:
             self._log(f"background resolve of {id_type} {identifier} failed: {e!r}")
         finally:
             self._pending_lookups.discard(identifier)
 
-    def on_rate_limited(self, url: str) -> None:
-        """Tighten the appropriate bucket (multiplicative decrease)."""
-        org_id = self.resolve_org(url)
-        if org_id and org_id in self._org_buckets:
+    def hydrate_orgs(
+        self, org_ids: Iterable[str], hydrator: Optional[Callable[[str], Coroutine[Any, Any, None]]] = None
+    ) -> int:
+        """Queue orgs for hydration on up to hydration_workers background tasks. Returns how many were queued.
+
+        As OrgRateLimiter.hydrate_orgs: orgs already hydrated or queued are skipped,
+        and requests keep flowing while the hydrators register mappings page by page.
+        """
+        hydrator = hydrator or self._hydrator
+        if hydrator is None:
+            return 0
+        queued = 0
+        for org_id in org_ids:
+            self._get_or_create_bucket(org_id)
+            if org_id in self._hydrated_orgs:
+                continue
+            self._hydrated_orgs.add(org_id)
+            self._hydration_queue.append((org_id, hydrator))
+            queued += 1
+        # Tasks pop the queue once they run, so start one per queued org up to the limit
+        for _ in range(min(len(self._hydration_queue), self._hydration_workers - self._hydration_running)):
+            self._hydration_running += 1
+            self._hydration_idle.clear()
+            t = asyncio.ensure_future(self._hydrate_queued())
+            self._bg_tasks.add(t)
+            t.add_done_callback(self._bg_tasks.discard)
+        return queued
+
+    async def _hydrate_queued(self) -> None:
+        """Hydration task: hydrate queued orgs one at a time, ending once the queue is empty."""
+        try:
+            while self._hydration_queue:
+                org_id, hydrator = self._hydration_queue.popleft()
+                self._log(f"hydrating org {org_id}")
+                try:
+                    await hydrator(org_id)
+                    self._log(f"hydrated org {org_id}")
+                except Exception as e:
+                    self._log(f"hydration of org {org_id} failed: {e!r}")
+        finally:
+            self._hydration_running -= 1
+            if not self._hydration_running:
+                self._hydration_idle.set()
+
+    async def wait_for_hydration(self, timeout: Optional[float] = None) -> bool:
+        """Wait until every queued org hydration has finished. Returns False on timeout."""
+        if self._hydration_idle.is_set():
+            return True
+        try:
+            await asyncio.wait_for(self._hydration_idle.wait(), timeout)
+        except asyncio.TimeoutError:
+            return False
+        return True
+
+    def on_rate_limited(
+        self, url: str, retry_after: Optional[float] = None, endpoint_class: Optional[str] = None, egress: int = 0
+    ) -> None:
+        """Tighten the appropriate bucket (multiplicative decrease), pausing an org's until Retry-After if given.
+
+        As in OrgRateLimiter, a request in an endpoint class only tightens its class bucket.
+        """
+        route = _route(url)
+        org_id = self._route_org(route)
+        class_bucket = self._class_bucket_for(endpoint_class, org_id)
+        if class_bucket is not None:
+            class_bucket.rate = class_bucket.rate * 0.7
+            if retry_after:
+                class_bucket.pause(retry_after)
+            self._log(
+                f"rate limited {endpoint_class} calls for org {org_id}, "
+                f"decreased to {class_bucket.rate:.1f} req/s{_paused_for(retry_after)}"
+            )
+        elif org_id and org_id in self._org_buckets:
             bucket = self._org_buckets[org_id]
             bucket.rate = bucket.rate * 0.7
-            self._log(f"rate limited org {org_id}, decreased to {bucket.rate:.1f} req/s")
-        elif OrgRateLimiter._is_unresolved_scoped_url(url):
+            self._save_rate(org_id, bucket.rate)
+            if retry_after:
+                bucket.pause(retry_after)
+            self._log(f"rate limited org {org_id}, decreased to {bucket.rate:.1f} req/s{_paused_for(retry_after)}")
+        elif OrgRateLimiter._is_unresolved_scoped(route):
             # URL targets a specific network/device whose org isn't resolved
             # yet. Penalizing the global bucket would punish every other org for
             # one org's 429, so skip and let background resolution catch up.
             self._log("rate limited on unresolved network/device url, skipping global penalty")
         else:
-            self._global_bucket.rate = self._global_bucket.rate * 0.7
-            self._log(f"rate limited (global), decreased to {self._global_bucket.rate:.1f} req/s")
+            bucket = self._global_buckets[egress]
+            bucket.rate = bucket.rate * 0.7
+            self._log(f"rate limited (global{_egress_label(egress)}), decreased to {bucket.rate:.1f} req/s")
 
-    def on_success(self, url: str) -> None:
+    def on_success(self, url: str, endpoint_class: Optional[str] = None, egress: int = 0) -> None:
         """Slowly widen buckets back toward configured rates (additive increase)."""
-        org_id = self.resolve_org(url)
+        org_id = self._route_org(_route(url))
+        class_bucket = self._class_bucket_for(endpoint_class, org_id)
+        if class_bucket is not None:
+            rate = self._endpoint_classes[endpoint_class].rate
+            if class_bucket.rate < rate:
+                class_bucket.rate = min(rate, class_bucket.rate + 0.2)
         if org_id and org_id in self._org_buckets:
             bucket = self._org_buckets[org_id]
-            if bucket.rate < self._rate:
-                bucket.rate = min(self._rate, bucket.rate + 0.2)
-        if self._global_bucket.rate < self._global_rate:
-            self._global_bucket.rate = min(self._global_rate, self._global_bucket.rate + 0.5)
+            ceiling = self._ceiling(org_id)
+            if bucket.rate < ceiling:
+                bucket.rate = min(ceiling, bucket.rate + 0.2)
+        global_bucket = self._global_buckets[egress]
+        if global_bucket.rate < self._global_rate:
+            global_bucket.rate = min(self._global_rate, global_bucket.rate + 0.5)
 
     async def shutdown(self) -> None:
         """Gracefully drain background work and persist the cache.
 
-        Awaits/cancels all in-flight resolve tasks, awaits any pending flush,
-        then does a final save. Idempotent and safe to call when there is no
-        outstanding work (e.g. from an __aexit__ handler).
+        Stops calibrating, drops queued org hydrations, awaits in-flight resolve and
+        hydration tasks, awaits any pending flush, then does a final save and closes
+        the cache file. Idempotent and safe to call when there is no outstanding work
+        (e.g. from an __aexit__ handler).
         """
+        self._closed = True
+        if self._calibration_task is not None:
+            self._calibration_task.cancel()
+            await asyncio.gather(self._calibration_task, return_exceptions=True)
+        self._hydration_queue.clear()
         if self._bg_tasks:
             await asyncio.gather(*list(self._bg_tasks), return_exceptions=True)
         if self._flush_task is not None and not self._flush_task.done():
@@ -642,6 +1681,8 @@ class AsyncOrgRateLimiter:
             except Exception as e:
                 self._log(f"flush task errored during shutdown: {e!r}")
         await self.save_cache()
+        if self._store is not None:
+            self._store.close()
 
     def register_org(self, org_id: str) -> None:
         """Ensure a bucket exists for this org."""
@@ -655,41 +1696,30 @@ class AsyncOrgRateLimiter:
         """Cache a serial -> org mapping."""
         self._serial_to_org[serial] = org_id
 
+    def register_networks(self, network_ids: Iterable[str], org_id: str) -> int:
+        """Cache many network -> org mappings in one batch. Returns how many were new or changed."""
+        return self._network_to_org.update(dict.fromkeys(network_ids, org_id))
+
+    def register_devices(self, serials: Iterable[str], org_id: str) -> int:
+        """Cache many serial -> org mappings in one batch. Returns how many were new or changed."""
+        return self._serial_to_org.update(dict.fromkeys(serials, org_id))
+
     def learn_from_response(self, url: str, body: Any) -> None:
-        """Extract org/network/device mappings from a URL and response body."""
-        org_id = OrgRateLimiter._org_id_from_url(url)
-        if not org_id:
-            org_id = OrgRateLimiter._org_id_from_body(body)
+        """Extract org/network/device mappings from a URL and response body, as OrgRateLimiter does."""
+        route = _route(url)
+        org_id = route.org or OrgRateLimiter._org_id_from_body(body) or self._route_org(route)
         if not org_id:
             return
 
         self._get_or_create_bucket(org_id)
-        changed_networks = 0
-        changed_devices = 0
-
-        network_id = OrgRateLimiter._network_id_from_url(url)
-        if network_id and self._network_to_org.get(network_id) != org_id:
-            self._network_to_org[network_id] = org_id
-            changed_networks += 1
-
-        serial = OrgRateLimiter._serial_from_url(url)
-        if serial and self._serial_to_org.get(serial) != org_id:
-            self._serial_to_org[serial] = org_id
-            changed_devices += 1
-
-        if isinstance(body, dict):
-            if "networkId" in body and self._network_to_org.get(body["networkId"]) != org_id:
-                self._network_to_org[body["networkId"]] = org_id
-                changed_networks += 1
-            if "serial" in body and self._serial_to_org.get(body["serial"]) != org_id:
-                self._serial_to_org[body["serial"]] = org_id
-                changed_devices += 1
-            net = body.get("network")
-            if isinstance(net, dict) and "id" in net:
-                if self._network_to_org.get(net["id"]) != org_id:
-                    self._network_to_org[net["id"]] = org_id
-                    changed_networks += 1
-
+        networks, serials = _ids_from_body(route, body)
+        if route.network:
+            networks.append(route.network)
+        if route.serial:
+            serials.append(route.serial)
+
+        changed_networks = self._network_to_org.update(dict.fromkeys(networks, org_id))
+        changed_devices = self._serial_to_org.update(dict.fromkeys(serials, org_id))
         total = changed_networks + changed_devices
         if total:
             self._dirty += total
@@ -702,53 +1732,100 @@ class AsyncOrgRateLimiter:
                 )
             self._maybe_flush()
 
-    async def save_cache(self) -> None:
-        """Persist the mapping cache to disk in a background thread."""
+    def _open_store(self) -> Optional[MappingStore]:
         if not self._cache_path:
+            return None
+        return MappingStore(str(self._cache_path), ttl=self._cache_ttl, codec=self._codec, log=self._log)
+
+    async def save_cache(self) -> None:
+        """Write mappings not yet on disk to the cache in a background thread."""
+        if self._store is None:
             return
-        path = self._cache_path
-        data = json.dumps(
-            {
-                "saved_at": datetime.now(timezone.utc).strftime("%Y-%m-%dT%H:%M:%SZ"),
-                "networks": [
-                    {"id": net_id, "organization": {"id": org_id}} for net_id, org_id in self._network_to_org.items()
-                ],
-                "devices": [
-                    {"serial": serial, "organization": {"id": org_id}} for serial, org_id in self._serial_to_org.items()
-                ],
-            }
-        )
         loop = asyncio.get_event_loop()
-        await loop.run_in_executor(None, self._write_cache, path, data)
-        n = len(self._network_to_org) + len(self._serial_to_org)
-        self._log(f"saved cache ({n} mappings) to {path}")
+        n = await loop.run_in_executor(None, self._store.flush)
+        self._log(f"saved {n} mappings to {self._cache_path}")
+
+
+def _weak_callback(method: Callable) -> Callable:
+    """Wrap a session's bound method so the shared limiter does not keep that session alive."""
+    ref = weakref.WeakMethod(method)
+
+    def call(*args):
+        target = ref()
+        return target(*args) if target is not None else None
+
+    return call
+
+
+class LimiterRegistry:
+    """Process-wide smart flow limiters, shared by every session with the same key.
+
+    Sessions that opt in attach to the limiter for their key instead of building
+    their own, so one process's clients share one global bucket, one bucket per org
+    and one mapping cache. The limiter resolves unknown IDs through the most recently
+    attached session that is still open. A session's reference is released when it
+    closes or is garbage collected, and the entry is dropped with the last reference.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        # key -> (limiter, {id(session): ((resolver, hydrator, sampler) refs, finalizer)})
+        self._entries: Dict[Any, tuple] = {}
+
+    def attach(
+        self,
+        key: Any,
+        owner: Any,
+        factory: Callable[[], Any],
+        resolver: Callable,
+        hydrator: Callable,
+        sampler: Optional[Callable] = None,
+    ) -> Any:
+        """Return the limiter for key, creating it with factory() for the first session."""
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                entry = self._entries[key] = (factory(), {})
+            limiter, holders = entry
+            finalizer = weakref.finalize(owner, self._release, key, id(owner))
+            callbacks = tuple(_weak_callback(callback) if callback else None for callback in (resolver, hydrator, sampler))
+            holders[id(owner)] = (callbacks, finalizer)
+            self._wire(limiter, callbacks)
+            return limiter
 
     @staticmethod
-    def _write_cache(path: Path, data: str) -> None:
-        path.parent.mkdir(parents=True, exist_ok=True)
-        path.write_text(data, encoding="utf-8")
+    def _wire(limiter: Any, callbacks: tuple) -> None:
+        resolver, hydrator, sampler = callbacks
+        limiter.set_resolver(resolver)
+        limiter.set_hydrator(hydrator)
+        if sampler is not None:
+            limiter.set_sampler(sampler)
+
+    def detach(self, key: Any, owner: Any) -> Optional[Any]:
+        """Release owner's reference. Returns the limiter when owner was its last session, else None."""
+        with self._lock:
+            entry = self._entries.get(key)
+            holder = entry[1].get(id(owner)) if entry else None
+        return holder[1]() if holder else None
 
-    def _load_cache(self) -> None:
-        """Load mapping cache from disk if it exists and hasn't expired."""
-        if not self._cache_path or not self._cache_path.exists():
-            return
-        try:
-            data = json.loads(self._cache_path.read_text(encoding="utf-8"))
-            if self._cache_ttl is not None:
-                saved_at = data.get("saved_at")
-                if saved_at is None:
-                    self._log("cache expired, will rebuild")
-                    return
-                saved_ts = _parse_saved_at(saved_at)
-                if saved_ts is None or (time.time() - saved_ts) > self._cache_ttl:
-                    self._log("cache expired, will rebuild")
-                    return
-            for net in data.get("networks", []):
-                self._network_to_org[net["id"]] = net["organization"]["id"]
-            for dev in data.get("devices", []):
-                self._serial_to_org[dev["serial"]] = dev["organization"]["id"]
-            self._cache_fresh = True
-            n = len(self._network_to_org) + len(self._serial_to_org)
-            self._log(f"loaded cache ({n} mappings) from {self._cache_path}")
-        except (json.JSONDecodeError, OSError, KeyError):
-            pass
+    def _release(self, key: Any, owner_id: int) -> Optional[Any]:
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None or owner_id not in entry[1]:
+                return None
+            limiter, holders = entry
+            del holders[owner_id]
+            if holders:
+                self._wire(limiter, next(reversed(holders.values()))[0])
+                return None
+            del self._entries[key]
+            return limiter
+
+    def references(self, key: Any) -> int:
+        with self._lock:
+            entry = self._entries.get(key)
+            return len(entry[1]) if entry else 0
+
+
+# One registry per process, used by sessions created with smart_flow_share_limiter
+limiter_registry = LimiterRegistry()
@@ -0,0 +1,55 @@
+"""Acquire overhead of AsyncTokenBucket with 1k, 10k and 100k queued coroutines.
+
+Each round queues the waiters on a paused bucket, then lets it refill at a rate
+that drains all of them in IDEAL_SECONDS: drain_seconds past that is the
+bucket's (and the event loop's) overhead. In the half-cancelled variant every
+other waiter gives up while queued, as when callers time out during a long
+backlog.
+
+The bucket keeps one timer for all its waiters: timers is the number of times it
+was armed during the drain, not one per waiter.
+
+Run: pytest tests/benchmarks/test_async_bucket_benchmark.py --benchmark-json=async_bucket.json
+"""
+
+import asyncio
+from unittest.mock import patch
+
+import pytest
+
+from meraki.smart_flow import AsyncTokenBucket
+
+IDEAL_SECONDS = 0.1
+
+
+async def _drain(waiters, cancel_half):
+    loop = asyncio.get_running_loop()
+    rate = waiters / IDEAL_SECONDS
+    bucket = AsyncTokenBucket(rate=rate, capacity=waiters)
+    bucket._tokens = 0.0
+    bucket.pause(3600.0)
+    tasks = [asyncio.ensure_future(bucket.acquire()) for _ in range(waiters)]
+    await asyncio.sleep(0)
+    if cancel_half:
+        for task in tasks[::2]:
+            task.cancel()
+        await asyncio.sleep(0)
+
+    # Everyone is queued: end the pause and time the drain
+    done = asyncio.gather(*tasks, return_exceptions=True)
+    with patch.object(loop, "call_at", wraps=loop.call_at) as call_at:
+        start = loop.time()
+        bucket._last = start
+        bucket.rate = rate
+        await done
+        return loop.time() - start, call_at.call_count
+
+
+@pytest.mark.parametrize("cancel_half", [False, True], ids=["all", "half-cancelled"])
+@pytest.mark.parametrize("waiters", [1_000, 10_000, 100_000])
+def test_async_bucket_acquire_overhead(benchmark, waiters, cancel_half):
+    drain_seconds, timers = benchmark.pedantic(lambda: asyncio.run(_drain(waiters, cancel_half)), rounds=3, iterations=1)
+
+    benchmark.extra_info["drain_seconds"] = drain_seconds
+    benchmark.extra_info["timers"] = timers
+    assert timers < waiters
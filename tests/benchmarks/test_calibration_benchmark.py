@@ -0,0 +1,87 @@
+"""A job over a busy org and a quiet org, with a static org rate and with calibration.
+
+Other integrations use OTHERS_RATE of the busy org's 10 req/s and nothing on the quiet
+org. The stand-in Dashboard (respx) gives us what they leave, blocking until Retry-After
+once it is exceeded, and reports their usage through the API usage telemetry endpoint.
+The client is configured for CLIENT_RATE, the org's whole limit: too fast for the busy
+org, right for the quiet one. With calibration, each org's ceiling is set from the
+telemetry when its first request is made.
+
+Run: pytest tests/benchmarks/test_calibration_benchmark.py --benchmark-json=calibration.json
+"""
+
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+import httpx
+import respx
+
+import meraki
+from tests.benchmarks.test_retry_after_benchmark import BASE, StandInDashboard
+
+ORG_LIMIT = 10.0
+OTHERS_RATE = {"111": 6.0, "222": 0.0}
+CLIENT_RATE = ORG_LIMIT
+WORKERS_PER_ORG = 4
+REQUESTS_PER_ORG = 60
+
+
+def _telemetry(org_id):
+    def respond(request):
+        # The last few complete 2-minute intervals, with the other clients' requests
+        end = int(time.time()) // 120 * 120
+        intervals = [
+            {
+                "startTs": time.strftime("%Y-%m-%dT%H:%M:%SZ", time.gmtime(start)),
+                "endTs": time.strftime("%Y-%m-%dT%H:%M:%SZ", time.gmtime(start + 120)),
+                "counts": [{"code": 200, "count": int(OTHERS_RATE[org_id] * 120)}],
+            }
+            for start in range(end - 600, end, 120)
+        ]
+        return httpx.Response(200, json=intervals)
+
+    return respond
+
+
+def _run_job(calibrate_interval):
+    servers = {org_id: StandInDashboard(ORG_LIMIT - others) for org_id, others in OTHERS_RATE.items()}
+    dashboard = meraki.DashboardAPI(
+        "fake_key_1234567890123456789012345678901234567890",
+        suppress_logging=True,
+        maximum_retries=20,
+        smart_flow_org_rate=CLIENT_RATE,
+        smart_flow_cache_path="",
+        smart_flow_calibrate_interval=calibrate_interval,
+    )
+    finished = {}
+    with respx.mock(assert_all_called=False) as mock:
+        for org_id, server in servers.items():
+            mock.get(f"{BASE}/organizations/{org_id}/networks").mock(side_effect=server)
+            mock.get(f"{BASE}/organizations/{org_id}/apiRequests/overview/responseCodes/byInterval").mock(
+                side_effect=_telemetry(org_id)
+            )
+        start = time.monotonic()
+
+        def run_org(org_id):
+            # Each org has its own workers, so the busy org's waits do not hold up the quiet one
+            with ThreadPoolExecutor(WORKERS_PER_ORG) as pool:
+                list(pool.map(lambda _: dashboard.organizations.getOrganizationNetworks(org_id), range(REQUESTS_PER_ORG)))
+            finished[org_id] = time.monotonic() - start
+
+        with ThreadPoolExecutor(len(servers)) as pool:
+            list(pool.map(run_org, servers))
+    dashboard._session.close()
+    return {org_id: (server.rejected, finished[org_id]) for org_id, server in servers.items()}
+
+
+def test_calibrated_org_rates(benchmark):
+    static = _run_job(None)
+    calibrated = benchmark.pedantic(_run_job, args=(300,), rounds=1, iterations=1)
+
+    for name, result in (("static", static), ("calibrated", calibrated)):
+        benchmark.extra_info[f"busy_429s_{name}"] = result["111"][0]
+        benchmark.extra_info[f"quiet_seconds_{name}"] = result["222"][1]
+
+    assert calibrated["111"][0] < static["111"][0]
+    # The quiet org keeps the configured rate
+    assert calibrated["222"][1] < static["222"][1] * 1.2
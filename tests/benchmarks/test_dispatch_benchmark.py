@@ -0,0 +1,32 @@
+"""Per-call overhead of a generated section method, a wrapper over dispatch.call, against calling it directly.
+
+The session is a stub, so only the Python work before the HTTP request is measured.
+
+Run: pytest tests/benchmarks/test_dispatch_benchmark.py --benchmark-json=dispatch.json
+"""
+
+import pytest
+
+from meraki.api.organizations import Organizations
+from meraki.dispatch import call
+
+KWARGS = {"tags": ["branch"], "tagsFilterType": "withAnyTags", "perPage": 1000}
+
+
+class StubSession:
+    _validate_kwargs = False
+    _logger = None
+
+    def get_pages(self, metadata, url, params=None, total_pages=-1, direction="next", event_log_end_time=None):
+        return params
+
+
+@pytest.mark.parametrize("entry_point", ["generated", "call"])
+def test_dispatch_overhead(benchmark, entry_point):
+    """getOrganizationNetworks with array, enum and pagination parameters."""
+    session = StubSession()
+    if entry_point == "generated":
+        result = benchmark(Organizations(session).getOrganizationNetworks, "123456", **KWARGS)
+    else:
+        result = benchmark(call, session, "getOrganizationNetworks", "123456", **KWARGS)
+    assert result == {"tags[]": ["branch"], "tagsFilterType": "withAnyTags", "perPage": 1000}
@@ -0,0 +1,64 @@
+"""Time for eager mode to hydrate an API key's organizations.
+
+A stand-in Dashboard (respx) answers every call after LATENCY seconds. The key has
+ORGS organizations, each with one page of networks and one of devices. A client in
+eager mode is created and the time until every org is hydrated is measured, with
+one hydration worker (orgs in turn, as before) and with the default pool.
+
+Run: pytest tests/benchmarks/test_eager_hydration_benchmark.py --benchmark-json=eager_hydration.json
+"""
+
+import time
+
+import httpx
+import respx
+
+import meraki
+from meraki.config import SMART_FLOW_HYDRATION_WORKERS
+
+BASE = "https://api.meraki.com/api/v1"
+ORGS = 40
+LATENCY = 0.05
+
+
+def _answer(body):
+    def respond(request):
+        time.sleep(LATENCY)
+        return httpx.Response(200, json=body(request))
+
+    return respond
+
+
+def _hydrate(workers, tmp_path):
+    with respx.mock(assert_all_called=False) as mock:
+        mock.get(f"{BASE}/organizations").mock(side_effect=_answer(lambda r: [{"id": f"{i}"} for i in range(ORGS)]))
+        mock.get(url__regex=rf"{BASE}/organizations/\d+/networks").mock(
+            side_effect=_answer(lambda r: [{"id": f"N_{r.url.path.split('/')[4]}"}])
+        )
+        mock.get(url__regex=rf"{BASE}/organizations/\d+/inventory/devices").mock(
+            side_effect=_answer(lambda r: [{"serial": f"Q_{r.url.path.split('/')[4]}"}])
+        )
+        start = time.monotonic()
+        dashboard = meraki.DashboardAPI(
+            "fake_key_1234567890123456789012345678901234567890",
+            suppress_logging=True,
+            smart_flow_cache_mode="eager",
+            smart_flow_cache_path=str(tmp_path / f"cache-{workers}-{time.monotonic_ns()}.sqlite3"),
+            smart_flow_hydration_workers=workers,
+        )
+        limiter = dashboard._session._smart_flow
+        assert limiter.wait_for_hydration(60)
+        elapsed = time.monotonic() - start
+        assert limiter.resolve_org(f"/devices/Q_{ORGS - 1}/clients") == f"{ORGS - 1}"
+    dashboard._session.close()
+    return elapsed
+
+
+def test_eager_hydration_parallel(benchmark, tmp_path):
+    serial_seconds = _hydrate(1, tmp_path)
+    parallel_seconds = benchmark.pedantic(_hydrate, args=(SMART_FLOW_HYDRATION_WORKERS, tmp_path), rounds=1, iterations=1)
+
+    benchmark.extra_info["seconds_one_worker"] = serial_seconds
+    benchmark.extra_info["seconds_parallel"] = parallel_seconds
+
+    assert parallel_seconds * 3 <= serial_seconds
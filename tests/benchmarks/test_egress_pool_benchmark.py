@@ -0,0 +1,63 @@
+"""Aggregate throughput across many orgs with one egress and with a pool of egresses.
+
+ORGS orgs each have WORKERS_PER_ORG threads sending as fast as the limiter lets
+them; together they want far more than one source IP's GLOBAL_RATE. With EGRESSES
+egresses, each has its own global bucket and requests go to the least-loaded one, so
+the aggregate should scale with the pool while every org stays within ORG_RATE.
+
+Run: pytest tests/benchmarks/test_egress_pool_benchmark.py --benchmark-json=egress_pool.json
+"""
+
+import collections
+import threading
+import time
+
+from meraki.smart_flow import OrgRateLimiter
+
+GLOBAL_RATE = 100.0
+ORG_RATE = 10.0
+ORGS = 40
+WORKERS_PER_ORG = 3
+EGRESSES = 3
+WARMUP_SECONDS = 1.0
+MEASURE_SECONDS = 3.0
+
+
+def _aggregate_rate(egresses):
+    limiter = OrgRateLimiter(rate=ORG_RATE, capacity=int(ORG_RATE), global_rate=GLOBAL_RATE, egresses=egresses)
+    deadline = time.monotonic() + WARMUP_SECONDS + MEASURE_SECONDS
+    sent = []
+
+    def worker(org_id):
+        url = f"https://api.meraki.com/api/v1/organizations/{org_id}/networks"
+        while time.monotonic() < deadline:
+            egress = limiter.acquire(url)
+            sent.append((org_id, egress, time.monotonic()))
+
+    start = time.monotonic()
+    threads = [
+        threading.Thread(target=worker, args=(f"org-{i}",), daemon=True) for i in range(ORGS) for _ in range(WORKERS_PER_ORG)
+    ]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    window = [(org_id, egress) for org_id, egress, at in sent if start + WARMUP_SECONDS <= at < deadline]
+    per_org = collections.Counter(org_id for org_id, _ in window)
+    per_egress = collections.Counter(egress for _, egress in window)
+    return len(window) / MEASURE_SECONDS, max(per_org.values()) / MEASURE_SECONDS, per_egress
+
+
+def test_egress_pool_scales_global_budget(benchmark):
+    single_rate, _, _ = _aggregate_rate(1)
+    pool_rate, max_org_rate, per_egress = benchmark.pedantic(_aggregate_rate, args=(EGRESSES,), rounds=1, iterations=1)
+
+    benchmark.extra_info["aggregate_rate_one_egress"] = single_rate
+    benchmark.extra_info["aggregate_rate_pool"] = pool_rate
+    benchmark.extra_info["max_org_rate"] = max_org_rate
+    benchmark.extra_info["requests_per_egress"] = dict(per_egress)
+
+    assert single_rate <= GLOBAL_RATE * 1.1
+    assert pool_rate >= single_rate * EGRESSES * 0.8
+    assert max_org_rate <= ORG_RATE * 1.1
@@ -0,0 +1,64 @@
+"""Plain calls to an org while a heavy operation with its own, tighter budget runs alongside.
+
+The stand-in Dashboard (respx) gives the org ORG_RATE req/s for plain calls and a
+separate HEAVY_RATE for action batches, each blocking until Retry-After once
+exceeded. HEAVY_WORKERS threads create action batches while PLAIN_WORKERS threads
+list networks.
+
+Without an endpoint class, the action batch 429s slow and pause the whole org's
+bucket, and the network listing waits with them. With the action batches in their
+own class, only that class slows down.
+
+Run: pytest tests/benchmarks/test_endpoint_class_benchmark.py --benchmark-json=endpoint_class.json
+"""
+
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+import respx
+
+import meraki
+from tests.benchmarks.test_retry_after_benchmark import BASE, ORG_ID, StandInDashboard
+
+ORG_RATE = 10.0
+HEAVY_RATE = 1.0
+HEAVY_WORKERS = 4
+HEAVY_REQUESTS = 12
+PLAIN_WORKERS = 4
+PLAIN_REQUESTS = 80
+CLASSES = {"action_batches": {"rate": HEAVY_RATE, "operations": ["createOrganizationActionBatch"]}}
+
+
+def _run_job(endpoint_classes):
+    plain, heavy = StandInDashboard(ORG_RATE), StandInDashboard(HEAVY_RATE)
+    dashboard = meraki.DashboardAPI(
+        "fake_key_1234567890123456789012345678901234567890",
+        suppress_logging=True,
+        maximum_retries=20,
+        smart_flow_cache_path="",
+        smart_flow_endpoint_classes=endpoint_classes,
+    )
+    with respx.mock(assert_all_called=False) as mock:
+        mock.get(f"{BASE}/organizations/{ORG_ID}/networks").mock(side_effect=plain)
+        mock.post(f"{BASE}/organizations/{ORG_ID}/actionBatches").mock(side_effect=heavy)
+        start = time.monotonic()
+        with ThreadPoolExecutor(HEAVY_WORKERS) as heavy_pool, ThreadPoolExecutor(PLAIN_WORKERS) as plain_pool:
+            for _ in range(HEAVY_REQUESTS):
+                heavy_pool.submit(dashboard.organizations.createOrganizationActionBatch, ORG_ID, actions=[])
+            list(plain_pool.map(lambda _: dashboard.organizations.getOrganizationNetworks(ORG_ID), range(PLAIN_REQUESTS)))
+            plain_seconds = time.monotonic() - start
+    dashboard._session.close()
+    return plain_seconds, heavy.rejected
+
+
+def test_heavy_calls_in_own_class(benchmark):
+    shared_seconds, shared_429s = _run_job({})
+    class_seconds, class_429s = benchmark.pedantic(_run_job, args=(CLASSES,), rounds=1, iterations=1)
+
+    benchmark.extra_info["plain_seconds_without_class"] = shared_seconds
+    benchmark.extra_info["plain_seconds_with_class"] = class_seconds
+    benchmark.extra_info["heavy_429s_without_class"] = shared_429s
+    benchmark.extra_info["heavy_429s_with_class"] = class_429s
+
+    assert class_seconds < shared_seconds
+    assert class_429s < shared_429s
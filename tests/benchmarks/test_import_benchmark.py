@@ -0,0 +1,62 @@
+"""Import time and resident memory benchmarks for `import meraki`.
+
+Each round imports in a fresh interpreter, since a module imports only once per process.
+API sections load lazily, so a script that touches one section should not pay for the rest;
+the "all-sections" case imports every section, as `import meraki` used to.
+
+Run: pytest tests/benchmarks/test_import_benchmark.py --benchmark-json=import.json
+"""
+
+import subprocess
+import sys
+
+import pytest
+
+MAX_IMPORT_SECONDS = 1.0
+
+CLIENT = (
+    "meraki.DashboardAPI('fake_key_1234567890123456789012345678901234567890', suppress_logging=True, smart_flow_enabled=False)"
+)
+ALL_SECTIONS = (
+    "[getattr(dashboard, name) for name, attr in vars(meraki.DashboardAPI).items() if isinstance(attr, meraki.LazySection)]"
+)
+
+IMPORTS = {
+    "sync": "import meraki",
+    "aio": "import meraki.aio",
+    "one-section": f"import meraki; {CLIENT}.networks",
+    "all-sections": f"import meraki; dashboard = {CLIENT}; {ALL_SECTIONS}",
+}
+
+
+def _run(code):
+    return subprocess.run([sys.executable, "-c", code], capture_output=True, text=True, check=True).stdout
+
+
+def _import_seconds(statement):
+    # Timed inside the child so interpreter start-up is excluded.
+    return float(_run(f"import time; start = time.perf_counter(); {statement}; print(time.perf_counter() - start)"))
+
+
+def _retained_bytes(statement):
+    return int(_run(f"import tracemalloc; tracemalloc.start(); {statement}; print(tracemalloc.get_traced_memory()[0])"))
+
+
+@pytest.mark.parametrize("case", ["sync", "aio"])
+def test_cold_import_time(benchmark, case):
+    """Cold `import meraki` / `import meraki.aio` wall time."""
+    seconds = benchmark.pedantic(_import_seconds, args=(IMPORTS[case],), rounds=5, iterations=1)
+    assert seconds < MAX_IMPORT_SECONDS
+
+
+@pytest.mark.parametrize("case", ["one-section", "all-sections"])
+def test_cold_import_with_sections(benchmark, case):
+    """Cold import plus first access of one section, against every section (benchmark only, no threshold)."""
+    benchmark.pedantic(_import_seconds, args=(IMPORTS[case],), rounds=5, iterations=1)
+
+
+def test_import_memory_one_section_below_all():
+    """Memory still allocated after import: touching one section keeps less than loading all of them."""
+    one = _retained_bytes(IMPORTS["one-section"])
+    everything = _retained_bytes(IMPORTS["all-sections"])
+    assert one < everything, f"One section retained {one} bytes, all sections {everything}"
@@ -0,0 +1,37 @@
+"""Cost of learning org mappings from one page of an org-wide list response.
+
+Each round feeds a limiter, backed by a cache file, another PAGE_SIZE page of
+getOrganizationInventoryDevices. Every serial and network ID on it is new, so the
+round does the full lookup and write. This is the time the page's GET spends in
+learn_from_response before it returns.
+
+Run: pytest tests/benchmarks/test_learn_benchmark.py --benchmark-json=learn.json
+"""
+
+import itertools
+
+from meraki.smart_flow import OrgRateLimiter
+
+PAGE_SIZE = 1000
+URL = "https://api.meraki.com/api/v1/organizations/123456/inventory/devices?perPage=1000"
+
+
+def _page(number):
+    first = number * PAGE_SIZE
+    return [
+        {"serial": f"Q2XX-{i // 10000:04d}-{i % 10000:04d}", "networkId": f"N_{i // 20}", "model": "MR46"}
+        for i in range(first, first + PAGE_SIZE)
+    ]
+
+
+def test_learn_inventory_page(benchmark, tmp_path):
+    limiter = OrgRateLimiter(cache_path=str(tmp_path / "cache.sqlite3"))
+    limiter.learn_from_response(URL, _page(0))
+    pages = itertools.count(1)
+
+    def setup():
+        return (_page(next(pages)),), {}
+
+    benchmark.pedantic(lambda page: limiter.learn_from_response(URL, page), setup=setup, rounds=20, iterations=1)
+    last = f"Q2XX-{(21 * PAGE_SIZE - 1) // 10000:04d}-{(21 * PAGE_SIZE - 1) % 10000:04d}"
+    assert limiter.resolve_org(f"/devices/{last}/clients") == "123456"
@@ -0,0 +1,67 @@
+"""429s at the start of a recurring job against an org with less budget than configured.
+
+The stand-in Dashboard from the Retry-After benchmark gives the org ORG_RATE req/s,
+as when other applications use the rest of its budget; the client is configured for
+CLIENT_RATE. The opening REQUESTS calls of a job run twice against one cache file,
+as an hourly job would. The second run is measured: starting the org at the rate the
+first run slowed it to, it should collect far fewer 429s than a run that starts at
+CLIENT_RATE again and sends a full CLIENT_RATE burst into the org.
+
+Run: pytest tests/benchmarks/test_learned_rate_benchmark.py --benchmark-json=learned_rate.json
+"""
+
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+import respx
+
+import meraki
+from tests.benchmarks.test_retry_after_benchmark import BASE, ORG_ID, StandInDashboard
+
+ORG_RATE = 4.0
+CLIENT_RATE = 9.0
+WORKERS = 8
+REQUESTS = 16
+JOBS = 4
+
+
+def _run_job(cache_path, half_life):
+    server = StandInDashboard(ORG_RATE)
+    dashboard = meraki.DashboardAPI(
+        "fake_key_1234567890123456789012345678901234567890",
+        suppress_logging=True,
+        maximum_retries=20,
+        smart_flow_org_rate=CLIENT_RATE,
+        smart_flow_cache_path=cache_path,
+        smart_flow_rate_half_life=half_life,
+    )
+    with respx.mock(assert_all_called=False) as mock:
+        mock.get(f"{BASE}/organizations/{ORG_ID}/networks").mock(side_effect=server)
+        with ThreadPoolExecutor(WORKERS) as pool:
+            list(pool.map(lambda _: dashboard.organizations.getOrganizationNetworks(ORG_ID), range(REQUESTS)))
+    dashboard._session.close()
+    return server.rejected
+
+
+def _second_run(cache_path, half_life):
+    _run_job(cache_path, half_life)
+    # The stand-in's block from the first run is over by the next hour
+    time.sleep(1.0)
+    return _run_job(cache_path, half_life)
+
+
+def _second_runs(directory, half_life):
+    # Thread start-up jitter decides how much of a burst lands at once; sum a few jobs
+    return sum(_second_run(str(directory / f"cache-{i}.sqlite3"), half_life) for i in range(JOBS))
+
+
+def test_learned_rate_carried_to_next_run(benchmark, tmp_path):
+    (tmp_path / "fresh").mkdir()
+    (tmp_path / "learned").mkdir()
+    fresh_429s = _second_runs(tmp_path / "fresh", None)
+    learned_429s = benchmark.pedantic(_second_runs, args=(tmp_path / "learned", 14400.0), rounds=1, iterations=1)
+
+    benchmark.extra_info["429s_learned_rate"] = learned_429s
+    benchmark.extra_info["429s_configured_rate"] = fresh_429s
+
+    assert learned_429s < fresh_429s
@@ -0,0 +1,61 @@
+"""Session start-up cost of the smart flow mapping cache as the fleet grows.
+
+Builds a cache file with MAPPINGS serial -> org rows, then times constructing an
+OrgRateLimiter on it and resolving one device. The SQLite store only checks the
+timestamp at open, so the start-up time should stay flat as MAPPINGS grows. Parsing
+the same mappings from the old JSON format is shown for comparison.
+
+Run: pytest tests/benchmarks/test_mapping_store_benchmark.py --benchmark-json=mapping_store.json
+"""
+
+import json
+import time
+
+import pytest
+
+from meraki.mapping_store import MappingStore
+from meraki.smart_flow import OrgRateLimiter
+
+MAPPINGS = 400_000
+ORGS = 200
+
+
+def _serial(i):
+    return f"Q2XX-{i // 10000:04d}-{i % 10000:04d}"
+
+
+@pytest.fixture(scope="module")
+def sqlite_cache(tmp_path_factory):
+    path = str(tmp_path_factory.mktemp("store") / "cache.sqlite3")
+    store = MappingStore(path)
+    for i in range(MAPPINGS):
+        store.put("device", _serial(i), f"org_{i % ORGS}")
+    store.close()
+    return path
+
+
+def _open_and_resolve(path):
+    limiter = OrgRateLimiter(cache_path=path)
+    return limiter.resolve_org(f"/devices/{_serial(MAPPINGS - 1)}/clients")
+
+
+def test_startup_sqlite(benchmark, sqlite_cache):
+    org_id = benchmark(_open_and_resolve, sqlite_cache)
+    assert org_id == f"org_{(MAPPINGS - 1) % ORGS}"
+
+
+def test_legacy_json_parse(benchmark, tmp_path):
+    """What every session start used to cost: parsing the whole JSON cache."""
+    data = json.dumps(
+        {
+            "saved_at": time.strftime("%Y-%m-%dT%H:%M:%SZ", time.gmtime()),
+            "networks": [],
+            "devices": [{"serial": _serial(i), "organization": {"id": f"org_{i % ORGS}"}} for i in range(MAPPINGS)],
+        }
+    ).encode()
+
+    def parse():
+        return {dev["serial"]: dev["organization"]["id"] for dev in json.loads(data)["devices"]}
+
+    mappings = benchmark.pedantic(parse, rounds=3, iterations=1)
+    assert len(mappings) == MAPPINGS
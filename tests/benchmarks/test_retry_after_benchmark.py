@@ -0,0 +1,90 @@
+"""429s collected by one job against an org whose real budget is below the configured rate.
+
+A stand-in Dashboard (respx) enforces ORG_RATE per org with a token bucket. Like
+the real service, a request over the limit gets a 429 with Retry-After, and the org
+stays blocked until then: every request it receives before the deadline also gets
+a 429. The client is configured for CLIENT_RATE, as when another application is
+using part of the org's budget. WORKERS threads then send REQUESTS calls.
+
+If only the request that received the 429 waits, the other workers keep sending
+into the block and each collects its own 429. With the org bucket paused until
+Retry-After, they wait it out too.
+
+Run: pytest tests/benchmarks/test_retry_after_benchmark.py --benchmark-json=retry_after.json
+"""
+
+import math
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from unittest.mock import patch
+
+import httpx
+import respx
+
+import meraki
+from meraki.smart_flow import TokenBucket
+
+BASE = "https://api.meraki.com/api/v1"
+ORG_ID = "123456"
+ORG_RATE = 10.0
+CLIENT_RATE = 20.0
+WORKERS = 16
+REQUESTS = 80
+
+
+class StandInDashboard:
+    """One org's rate limit: a token bucket, and a block until Retry-After once exceeded."""
+
+    def __init__(self, rate=ORG_RATE):
+        self.rate = rate
+        self.lock = threading.Lock()
+        self.tokens = rate
+        self.last = time.monotonic()
+        self.blocked_until = 0.0
+        self.rejected = 0
+
+    def __call__(self, request):
+        with self.lock:
+            now = time.monotonic()
+            self.tokens = min(self.rate, self.tokens + (now - self.last) * self.rate)
+            self.last = now
+            if now < self.blocked_until or self.tokens < 1.0:
+                retry_after = max(1, math.ceil(max(self.blocked_until - now, (1.0 - self.tokens) / self.rate)))
+                self.blocked_until = max(self.blocked_until, now + retry_after)
+                self.rejected += 1
+                return httpx.Response(429, headers={"Retry-After": str(retry_after)}, json={"errors": ["Too many requests"]})
+            self.tokens -= 1.0
+        return httpx.Response(200, json=[{"id": "N_1", "organizationId": ORG_ID}])
+
+
+def _run_job():
+    server = StandInDashboard()
+    dashboard = meraki.DashboardAPI(
+        "fake_key_1234567890123456789012345678901234567890",
+        suppress_logging=True,
+        maximum_retries=20,
+        smart_flow_org_rate=CLIENT_RATE,
+        smart_flow_cache_path="",
+    )
+    with respx.mock(assert_all_called=False) as mock:
+        mock.get(f"{BASE}/organizations/{ORG_ID}/networks").mock(side_effect=server)
+        start = time.monotonic()
+        with ThreadPoolExecutor(WORKERS) as pool:
+            list(pool.map(lambda _: dashboard.organizations.getOrganizationNetworks(ORG_ID), range(REQUESTS)))
+        elapsed = time.monotonic() - start
+    dashboard._session.close()
+    return server.rejected, elapsed
+
+
+def test_retry_after_pauses_org(benchmark):
+    with patch.object(TokenBucket, "pause"):
+        unpaused_429s, unpaused_seconds = _run_job()
+    paused_429s, paused_seconds = benchmark.pedantic(_run_job, rounds=1, iterations=1)
+
+    benchmark.extra_info["429s_with_pause"] = paused_429s
+    benchmark.extra_info["429s_without_pause"] = unpaused_429s
+    benchmark.extra_info["seconds_with_pause"] = paused_seconds
+    benchmark.extra_info["seconds_without_pause"] = unpaused_seconds
+
+    assert paused_429s * 2 <= unpaused_429s
@@ -0,0 +1,42 @@
+"""Limiter CPU per request: acquire, on_success and learn_from_response for one URL.
+
+The buckets never run out, so only the limiter's bookkeeping is measured: working
+out which org each URL is for, taking the tokens and widening the buckets. The
+URLs mix org, network and device scopes over ORGS orgs, the network and device
+ones with their orgs already cached, some with a query string as list pages have.
+
+Run: pytest tests/benchmarks/test_route_benchmark.py --benchmark-json=route.json
+"""
+
+from meraki.smart_flow import OrgRateLimiter
+
+BASE = "https://api.meraki.com/api/v1"
+ORGS = 300
+
+
+def _urls():
+    urls = []
+    for i in range(ORGS):
+        urls.append(f"{BASE}/organizations/{i}/networks?perPage=1000")
+        urls.append(f"{BASE}/networks/N_{i}/clients?timespan=3600")
+        urls.append(f"{BASE}/devices/Q2XX-0000-{i:04d}/switch/ports")
+        urls.append(f"{BASE}/networks/N_{i}/appliance/vlans/1")
+    return urls
+
+
+def test_limiter_cpu_per_request(benchmark):
+    limiter = OrgRateLimiter(rate=1e9, global_rate=1e9)
+    for i in range(ORGS):
+        limiter.register_network(f"N_{i}", str(i))
+        limiter.register_device(f"Q2XX-0000-{i:04d}", str(i))
+    urls = _urls()
+
+    def requests():
+        for url in urls:
+            limiter.acquire(url)
+            limiter.on_success(url)
+            limiter.learn_from_response(url, None)
+
+    benchmark(requests)
+    benchmark.extra_info["requests_per_round"] = len(urls)
+    assert limiter.resolve_org(f"{BASE}/devices/Q2XX-0000-0299/switch/ports") == "299"
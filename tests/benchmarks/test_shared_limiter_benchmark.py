@@ -0,0 +1,61 @@
+"""Aggregate throughput of several worker processes against one org.
+
+Each worker process builds its own OrgRateLimiter and acquires tokens for the same
+org as fast as the limiter allows. With per-process buckets the host sends about
+WORKERS times the org rate. With a shared state directory the aggregate has to stay
+at the org rate.
+
+Run: pytest tests/benchmarks/test_shared_limiter_benchmark.py --benchmark-json=shared_limiter.json
+"""
+
+import multiprocessing
+import time
+
+import pytest
+
+from meraki.smart_flow import OrgRateLimiter
+
+WORKERS = 8
+ORG_RATE = 20.0
+DURATION_SECONDS = 3.0
+URL = "https://api.meraki.com/api/v1/organizations/123456/networks"
+
+
+def _worker(shared_dir, start, results):
+    limiter = OrgRateLimiter(rate=ORG_RATE, capacity=1, global_rate=1000.0, shared_dir=shared_dir)
+    deadline = start + DURATION_SECONDS
+    time.sleep(max(0.0, start - time.monotonic()))
+    count = 0
+    while True:
+        limiter.acquire(URL)
+        if time.monotonic() > deadline:
+            break
+        count += 1
+    results.put(count)
+
+
+def _aggregate_rate(shared_dir):
+    results = multiprocessing.Queue()
+    start = time.monotonic() + 1.0  # let every worker start before the clock runs
+    processes = [multiprocessing.Process(target=_worker, args=(shared_dir, start, results)) for _ in range(WORKERS)]
+    for process in processes:
+        process.start()
+    total = sum(results.get(timeout=60) for _ in processes)
+    for process in processes:
+        process.join()
+    return total / DURATION_SECONDS
+
+
+@pytest.mark.parametrize("backend", ["per-process", "shared"])
+def test_aggregate_throughput(benchmark, backend, tmp_path):
+    """Requests per second the workers send together, against the org limit."""
+    shared_dir = str(tmp_path) if backend == "shared" else None
+    rate = benchmark.pedantic(_aggregate_rate, args=(shared_dir,), rounds=1, iterations=1)
+    benchmark.extra_info["aggregate_rate"] = rate
+    benchmark.extra_info["org_rate"] = ORG_RATE
+
+    if backend == "shared":
+        # One token of start-up burst on top of the refill rate
+        assert ORG_RATE * 0.9 <= rate <= ORG_RATE + 1.0 / DURATION_SECONDS + 1.0
+    else:
+        assert rate > ORG_RATE * WORKERS * 0.8
@@ -1,4 +1,4 @@
-import urllib
+from meraki import dispatch
 
 
 class AsyncNetworks:
@@ -15,25 +15,7 @@ class AsyncNetworks:
         - name (string): Optional name filter
         """
 
-        metadata = {
-            "tags": ["networks", "configure"],
-            "operation": "getNetwork",
-        }
-        networkId = urllib.parse.quote(str(networkId), safe="")
-        resource = f"/networks/{networkId}"
-
-        query_params = [
-            "name",
-        ]
-        params = {k.strip(): v for k, v in kwargs.items() if k.strip() in query_params}
-
-        if self._session._validate_kwargs:
-            all_params = query_params
-            invalid = [k for k in kwargs if k.strip() not in all_params and k != "self"]
-            if invalid and self._session._logger:
-                self._session._logger.warning(f"getNetwork: ignoring unrecognized kwargs: {invalid}")
-
-        return self._session.get(metadata, resource, params)
+        return dispatch.call(self._session, "getNetwork", networkId, **kwargs)
 
     def updateNetwork(self, networkId: str, name: str, **kwargs):
         """
@@ -45,26 +27,7 @@ class AsyncNetworks:
         - tags (array): Network tags
         """
 
-        metadata = {
-            "tags": ["networks", "configure"],
-            "operation": "updateNetwork",
-        }
-        networkId = urllib.parse.quote(str(networkId), safe="")
-        resource = f"/networks/{networkId}"
-
-        body_params = [
-            "name",
-            "tags",
-        ]
-        payload = {k.strip(): v for k, v in kwargs.items() if k.strip() in body_params}
-
-        if self._session._validate_kwargs:
-            all_params = [] + body_params
-            invalid = [k for k in kwargs if k.strip() not in all_params and k != "self"]
-            if invalid and self._session._logger:
-                self._session._logger.warning(f"updateNetwork: ignoring unrecognized kwargs: {invalid}")
-
-        return self._session.put(metadata, resource, payload)
+        return dispatch.call(self._session, "updateNetwork", networkId, name, **kwargs)
 
     def deleteNetwork(self, networkId: str):
         """
@@ -74,14 +37,7 @@ class AsyncNetworks:
         - networkId (string): Network ID
         """
 
-        metadata = {
-            "tags": ["networks", "configure"],
-            "operation": "deleteNetwork",
-        }
-        networkId = urllib.parse.quote(str(networkId), safe="")
-        resource = f"/networks/{networkId}"
-
-        return self._session.delete(metadata, resource)
+        return dispatch.call(self._session, "deleteNetwork", networkId)
 
     def createNetwork(self, name: str, type: str, **kwargs):
         """
@@ -92,25 +48,7 @@ class AsyncNetworks:
         - type (string): Network type
         """
 
-        metadata = {
-            "tags": ["networks", "configure"],
-            "operation": "createNetwork",
-        }
-        resource = "/networks"
-
-        body_params = [
-            "name",
-            "type",
-        ]
-        payload = {k.strip(): v for k, v in kwargs.items() if k.strip() in body_params}
-
-        if self._session._validate_kwargs:
-            all_params = [] + body_params
-            invalid = [k for k in kwargs if k.strip() not in all_params and k != "self"]
-            if invalid and self._session._logger:
-                self._session._logger.warning(f"createNetwork: ignoring unrecognized kwargs: {invalid}")
-
-        return self._session.post(metadata, resource, payload)
+        return dispatch.call(self._session, "createNetwork", name, type, **kwargs)
 
     def updateNetworkSettings(self, networkId: str, **kwargs):
         """
@@ -121,25 +59,7 @@ class AsyncNetworks:
         - localStatusPageEnabled (boolean): Enable local status page
         """
 
-        metadata = {
-            "tags": ["networks", "configure"],
-            "operation": "updateNetworkSettings",
-        }
-        networkId = urllib.parse.quote(str(networkId), safe="")
-        resource = f"/networks/{networkId}/settings"
-
-        body_params = [
-            "localStatusPageEnabled",
-        ]
-        payload = {k.strip(): v for k, v in kwargs.items() if k.strip() in body_params}
-
-        if self._session._validate_kwargs:
-            all_params = [] + body_params
-            invalid = [k for k in kwargs if k.strip() not in all_params and k != "self"]
-            if invalid and self._session._logger:
-                self._session._logger.warning(f"updateNetworkSettings: ignoring unrecognized kwargs: {invalid}")
-
-        return self._session.put(metadata, resource, payload)
+        return dispatch.call(self._session, "updateNetworkSettings", networkId, **kwargs)
 
     def getNetworkClients(self, networkId: str, count: int, **kwargs):
         """
@@ -151,26 +71,7 @@ class AsyncNetworks:
         - filter (object or string): Client filter by string or object (object supports: mac)
         """
 
-        metadata = {
-            "tags": ["networks", "monitor"],
-            "operation": "getNetworkClients",
-        }
-        networkId = urllib.parse.quote(str(networkId), safe="")
-        resource = f"/networks/{networkId}/clients"
-
-        query_params = [
-            "count",
-            "filter",
-        ]
-        params = {k.strip(): v for k, v in kwargs.items() if k.strip() in query_params}
-
-        if self._session._validate_kwargs:
-            all_params = query_params
-            invalid = [k for k in kwargs if k.strip() not in all_params and k != "self"]
-            if invalid and self._session._logger:
-                self._session._logger.warning(f"getNetworkClients: ignoring unrecognized kwargs: {invalid}")
-
-        return self._session.get(metadata, resource, params)
+        return dispatch.call(self._session, "getNetworkClients", networkId, count, **kwargs)
 
     def provisionNetworkClients(self, networkId: str, deviceName: str, mac: str, **kwargs):
         """
@@ -182,23 +83,4 @@ class AsyncNetworks:
         - mac (string): Device MAC address
         """
 
-        metadata = {
-            "tags": ["networks", "configure"],
-            "operation": "provisionNetworkClients",
-        }
-        networkId = urllib.parse.quote(str(networkId), safe="")
-        resource = f"/networks/{networkId}/clients"
-
-        body_params = [
-            "deviceName",
-            "mac",
-        ]
-        payload = {k.strip(): v for k, v in kwargs.items() if k.strip() in body_params}
-
-        if self._session._validate_kwargs:
-            all_params = [] + body_params
-            invalid = [k for k in kwargs if k.strip() not in all_params and k != "self"]
-            if invalid and self._session._logger:
-                self._session._logger.warning(f"provisionNetworkClients: ignoring unrecognized kwargs: {invalid}")
-
-        return self._session.post(metadata, resource, payload)
+        return dispatch.call(self._session, "provisionNetworkClients", networkId, deviceName, mac, **kwargs)
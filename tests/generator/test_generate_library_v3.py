@@ -89,11 +89,13 @@ class TestV3GeneratorOutput:
         _run_v3_generation(v3_spec, output_dir)
         assert (output_dir / "meraki" / "api" / "batch" / "networks.py").exists()
 
-    def test_kwargs_merges_positional_params(self, v3_spec, output_dir):
-        """Required positional params must be merged into kwargs for payload construction."""
+    def test_methods_delegate_to_dispatch(self, v3_spec, output_dir):
+        """Section methods pass their required params positionally, in signature order, to dispatch.call."""
         _run_v3_generation(v3_spec, output_dir)
         content = (output_dir / "meraki" / "api" / "networks.py").read_text()
-        assert "kwargs.update(locals())" in content or "kwargs = locals()" in content
+        assert content.startswith("from meraki import dispatch\n")
+        assert 'return dispatch.call(self._session, "updateNetwork", networkId, name, **kwargs)' in content
+        assert 'return dispatch.call(self._session, "deleteNetwork", networkId)' in content
 
     def test_batch_action_count(self, v3_spec, output_dir):
         """GEN-04: All batchable actions produce batch methods."""
@@ -106,14 +108,29 @@ class TestV3GeneratorOutput:
         method_count -= 1
         assert method_count == expected_count, f"Expected {expected_count} batch methods, got {method_count}"
 
-    def test_explicit_param_construction(self, v3_spec, output_dir):
-        """GEN-02: Methods use explicit param list filtering."""
+    def test_params_not_rebuilt_per_method(self, v3_spec, output_dir):
+        """GEN-02: Parameter lists live in the operation table, not in each method body."""
         _run_v3_generation(v3_spec, output_dir)
         content = (output_dir / "meraki" / "api" / "networks.py").read_text()
-        # getNetwork has query param 'name', should appear in query_params list
-        assert '"name"' in content
-        # updateNetwork has body params, should appear in body_params list
-        assert "body_params" in content
+        for per_call_work in ("locals()", "query_params", "body_params", "urllib.parse.quote"):
+            assert per_call_work not in content
+
+    def test_operation_table_covers_every_method(self, v3_spec, output_dir):
+        """The descriptor table has one row per generated method, with its signature's positional order."""
+        _run_v3_generation(v3_spec, output_dir)
+        namespace = {}
+        exec((output_dir / "meraki" / "api" / "operations.py").read_text(), namespace)
+        operations = namespace["OPERATIONS"]
+        content = (output_dir / "meraki" / "api" / "networks.py").read_text()
+        method_count = content.count("    def ") - 1
+        assert len(operations) == method_count
+
+        update = operations["updateNetwork"]
+        assert (update.method, update.path, update.path_params) == ("put", "/networks/{networkId}", ("networkId",))
+        assert update.arguments == ("networkId", "name")
+        assert update.body == frozenset({"name", "tags"})
+        assert operations["getNetwork"].query == frozenset({"name"})
+        assert operations["createNetwork"].path_params == ()
 
 
 class TestV3CLI:
@@ -132,13 +132,19 @@ def test_patch_endpoint_generates_without_nameerror():
     output = io.StringIO()
     async_output = io.StringIO()
 
+    operations = {}
+
     # Would raise NameError (unbound call_line) before fix #16.
-    generate_library.generate_standard_and_async_functions(_jinja_env(), TEMPLATE_DIR, section, output, async_output, spec)
+    generate_library.generate_standard_and_async_functions(
+        _jinja_env(), TEMPLATE_DIR, section, output, async_output, spec, operations
+    )
 
+    # patch mirrors put/post: the descriptor sends the payload with the patch method.
+    assert operations["updateThing"]["method"] == "patch"
+    assert operations["updateThing"]["body"] == ["name"]
     rendered = output.getvalue()
     assert "def updateThing(self" in rendered
-    # patch mirrors put/post: dispatches to self._session.patch with the payload.
-    assert "self._session.patch(metadata, resource, payload)" in rendered
+    assert 'return dispatch.call(self._session, "updateThing", thingId, **kwargs)' in rendered
 
 
 # ---------------------------------------------------------------------------
@@ -181,15 +187,20 @@ def test_keyword_param_remapped_in_generated_function():
     output = io.StringIO()
     async_output = io.StringIO()
 
-    generate_library.generate_standard_and_async_functions(_jinja_env(), TEMPLATE_DIR, section, output, async_output, spec)
+    operations = {}
+
+    generate_library.generate_standard_and_async_functions(
+        _jinja_env(), TEMPLATE_DIR, section, output, async_output, spec, operations
+    )
 
     rendered = output.getvalue()
     # 'from' is a Python keyword -> signature uses 'from_'
     assert "from_: str" in rendered
-    # remap loop restores the original key so the value reaches the request
-    assert 'kwargs["from"] = kwargs.pop("from_")' in rendered
+    # from_ is passed positionally, and the descriptor maps that position back to 'from'
+    assert 'return dispatch.call(self._session, "getNetworkThings", networkId, from_, **kwargs)' in rendered
+    assert operations["getNetworkThings"]["arguments"] == ("networkId", "from")
     # 'from' must still be the query param key used to build params
-    assert '"from"' in rendered
+    assert operations["getNetworkThings"]["query"] == ["from"]
 
 
 def _write_query_spec():
@@ -233,7 +244,11 @@ def test_write_operations_generate_query_params_for_all_clients():
     async_output = io.StringIO()
     batch_output = io.StringIO()
 
-    generate_library.generate_standard_and_async_functions(_jinja_env(), TEMPLATE_DIR, section, output, async_output, spec)
+    operations = {}
+
+    generate_library.generate_standard_and_async_functions(
+        _jinja_env(), TEMPLATE_DIR, section, output, async_output, spec, operations
+    )
     generate_library.generate_action_batch_functions(
         _jinja_env(),
         TEMPLATE_DIR,
@@ -243,9 +258,10 @@ def test_write_operations_generate_query_params_for_all_clients():
         spec,
     )
 
+    assert operations["claimThings"]["query"] == ["validate"]
+    assert operations["claimThings"]["body"] == ["name"]
     for rendered in (output.getvalue(), async_output.getvalue()):
-        assert 'query_params = ["validate", ]' in rendered
-        assert "self._session.post(metadata, resource, payload, params=params)" in rendered
+        assert 'return dispatch.call(self._session, "claimThings", name, **kwargs)' in rendered
 
     batch_rendered = batch_output.getvalue()
     assert 'query_params = ["validate", ]' in batch_rendered
@@ -103,9 +103,9 @@ class TestGoldenSync:
             golden_params = sorted(re.findall(r"\w+", golden_methods[name]))
             assert fresh_params == golden_params, f"Signature mismatch for {name}"
 
-    def test_kwargs_update_locals_present(self, fresh_output):
+    def test_methods_delegate_to_dispatch(self, fresh_output):
         sync, _, _ = fresh_output
-        assert "kwargs.update(locals())" in sync or "kwargs = locals()" in sync
+        assert "return dispatch.call(self._session, " in sync
 
 
 class TestGoldenAsync:
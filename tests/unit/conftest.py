@@ -27,6 +27,8 @@ DEFAULT_SESSION_KWARGS = {
     "be_geo_id": "",
     "caller": "TestApp TestVendor",
     "use_iterator_for_get_pages": False,
+    # Keep smart flow mappings and learned org rates out of the user's cache between tests
+    "smart_flow_cache_path": "",
 }
 
 
@@ -90,6 +92,8 @@ def make_sync_session(logger=None, **overrides):
             s = RestSession(logger=logger, api_key=FAKE_API_KEY, **kwargs)
     if s._smart_flow:
         s._smart_flow = MagicMock()
+        s._smart_flow.endpoint_class.return_value = None
+        s._smart_flow.acquire.return_value = 0
     return s
 
 
@@ -1,12 +1,15 @@
+import asyncio
 import json
+import threading
 from unittest.mock import AsyncMock, MagicMock, patch
 
 import httpx
 import pytest
 
-from meraki.exceptions import APIError
+from meraki.codec import JSONCodec
+from meraki.exceptions import APIError, SessionInputError
 
-from tests.unit.conftest import make_metadata as _metadata, make_async_mock_response as _mock_aio_response
+from tests.unit.conftest import make_async_session, make_metadata as _metadata, make_async_mock_response as _mock_aio_response
 
 
 async def _noop_sleep(*args, **kwargs):
@@ -337,6 +340,7 @@ class TestAsync4xx:
         resp_400.headers = {}
         resp_400.links = {}
         resp_400.json = MagicMock(side_effect=json.decoder.JSONDecodeError("", "", 0))
+        resp_400.content = b"Some HTML error page content"
         resp_400.text = "Some HTML error page content"
         resp_400.close = MagicMock()
 
@@ -354,6 +358,7 @@ class TestAsync4xx:
         resp_400.headers = {}
         resp_400.links = {}
         resp_400.json = MagicMock(side_effect=ValueError("Invalid JSON"))
+        resp_400.content = b"<html>"
         resp_400.text = MagicMock(side_effect=Exception("read error"))
         resp_400.close = MagicMock()
 
@@ -465,6 +470,7 @@ class TestAsync2xxResponse:
         resp_bad_json.headers = {}
         resp_bad_json.links = {}
         resp_bad_json.json = MagicMock(side_effect=json.decoder.JSONDecodeError("", "", 0))
+        resp_bad_json.content = b"{not json"
         resp_bad_json.close = MagicMock(side_effect=RuntimeError("Attempted to call an sync close on an async stream."))
         resp_bad_json.aclose = AsyncMock()
 
@@ -563,6 +569,7 @@ class TestAsyncRequestLogging:
         resp_bad.headers = {}
         resp_bad.links = {}
         resp_bad.json = MagicMock(side_effect=ValueError("Invalid JSON"))
+        resp_bad.content = b"<html>not json</html>"
         resp_bad.close = MagicMock(side_effect=RuntimeError("Attempted to call an sync close on an async stream."))
         resp_bad.aclose = AsyncMock()
 
@@ -1066,28 +1073,37 @@ class TestAsyncPaginationIterator:
         assert items == [{"ts": "a"}]
 
 
-# --- download_page helper ---
+# --- (response, parsed_body) carrier from _request ---
 
 
-class TestAsyncDownloadPage:
+class TestAsyncRequestCarrier:
     @pytest.mark.asyncio
-    async def test_download_page(self, async_session):
+    async def test_request_returns_response_and_body(self, async_session):
         resp = _mock_aio_response(status_code=200, json_data=[{"id": 1}])
-        request_coro = AsyncMock(return_value=resp)()
-        response, result = await async_session._download_page(request_coro)
+        async_session._client.request = AsyncMock(return_value=resp)
+        response, result = await async_session._request(_metadata(), "GET", "/organizations")
         assert result == [{"id": 1}]
         assert response.status_code == 200
 
     @pytest.mark.asyncio
-    async def test_download_page_204_no_json(self, async_session):
-        """A 204 page yields result=None without calling .json()."""
+    async def test_request_204_no_json(self, async_session):
+        """A 204 page yields body=None without calling .json()."""
         resp = _mock_aio_response(status_code=204, reason_phrase="No Content", content=b"")
         resp.json = MagicMock(side_effect=json.decoder.JSONDecodeError("", "", 0))
-        request_coro = AsyncMock(return_value=resp)()
-        response, result = await async_session._download_page(request_coro)
+        async_session._client.request = AsyncMock(return_value=resp)
+        response, result = await async_session._request(_metadata(), "GET", "/organizations")
         assert result is None
         resp.json.assert_not_called()
 
+    @pytest.mark.asyncio
+    async def test_get_parses_json_once(self, async_session):
+        async_session._codec = MagicMock(wraps=JSONCodec())
+        resp = _mock_aio_response(status_code=200, json_data={"id": "1"})
+        async_session._client.request = AsyncMock(return_value=resp)
+        result = await async_session.get(_metadata(), "/organizations/1")
+        assert result == {"id": "1"}
+        assert async_session._codec.loads.call_count == 1
+
 
 # --- Fix #4: async iterator 204 guard ---
 
@@ -1117,6 +1133,7 @@ class TestAsyncSuccessSingleParse:
         """With smart flow on, a successful GET must call response.json() exactly once."""
         async_session._smart_flow = MagicMock()
         async_session._smart_flow.acquire = AsyncMock()
+        async_session._codec = MagicMock(wraps=JSONCodec())
 
         body = {"organizationId": "42", "id": "N_1"}
         resp = _mock_aio_response(status_code=200, json_data=body)
@@ -1124,7 +1141,7 @@ class TestAsyncSuccessSingleParse:
 
         await async_session.request(_metadata(), "GET", "/networks/N_1")
 
-        assert resp.json.call_count == 1
+        assert async_session._codec.loads.call_count == 1
         # learn_from_response receives the already-decoded body (same object)
         async_session._smart_flow.learn_from_response.assert_called_once()
         passed_body = async_session._smart_flow.learn_from_response.call_args.args[1]
@@ -1132,12 +1149,13 @@ class TestAsyncSuccessSingleParse:
 
     @pytest.mark.asyncio
     async def test_handle_success_async_returns_response_and_body(self, async_session):
+        async_session._codec = MagicMock(wraps=JSONCodec())
         body = [{"id": 1}]
         resp = _mock_aio_response(status_code=200, json_data=body)
         result, parsed = await async_session._handle_success_async(resp, _metadata(), "GET")
         assert result is resp
         assert parsed == body
-        assert resp.json.call_count == 1
+        assert async_session._codec.loads.call_count == 1
 
     @pytest.mark.asyncio
     async def test_handle_success_async_non_get_no_body(self, async_session):
@@ -1291,3 +1309,194 @@ class TestMerakiParamEncodingAsync:
 
         call = async_session._client.request.call_args
         assert call.kwargs.get("params") == params
+
+
+# --- Single-flight coalescing of identical GETs ---
+
+
+def _gated_request(responses):
+    """AsyncMock for _client.request that holds every call until gate is set."""
+    gate = asyncio.Event()
+
+    async def side_effect(*args, **kwargs):
+        await gate.wait()
+        return responses.pop(0)
+
+    return AsyncMock(side_effect=side_effect), gate
+
+
+class TestAsyncSingleFlight:
+    @pytest.mark.asyncio
+    async def test_identical_concurrent_gets_share_one_request(self, async_session):
+        async_session._client.request, gate = _gated_request([_mock_aio_response(200, json_data={"id": "1"})])
+
+        tasks = [asyncio.create_task(async_session.get(_metadata("getOrganization"), "/organizations/1")) for _ in range(50)]
+        await asyncio.sleep(0)
+        gate.set()
+        results = await asyncio.gather(*tasks)
+
+        assert async_session._client.request.await_count == 1
+        assert all(result == {"id": "1"} for result in results)
+        assert len({id(result) for result in results}) == 50
+        assert async_session._in_flight == {}
+
+    @pytest.mark.asyncio
+    async def test_different_params_not_coalesced(self, async_session):
+        responses = [_mock_aio_response(200, json_data=[]), _mock_aio_response(200, json_data=[])]
+        async_session._client.request, gate = _gated_request(responses)
+
+        tasks = [asyncio.create_task(async_session.get(_metadata(), "/organizations", params={"perPage": n})) for n in (5, 10)]
+        await asyncio.sleep(0)
+        gate.set()
+        await asyncio.gather(*tasks)
+
+        assert async_session._client.request.await_count == 2
+
+    @pytest.mark.asyncio
+    async def test_429_retry_is_shared(self, async_session):
+        responses = [
+            _mock_aio_response(429, reason_phrase="Too Many Requests", headers={"Retry-After": "1"}),
+            _mock_aio_response(200, json_data={"id": "1"}),
+        ]
+        async_session._client.request, gate = _gated_request(responses)
+
+        with patch(SLEEP_PATCH, new=_noop_sleep):
+            tasks = [asyncio.create_task(async_session.get(_metadata(), "/organizations/1")) for _ in range(10)]
+            await asyncio.sleep(0)
+            gate.set()
+            results = await asyncio.gather(*tasks)
+
+        assert async_session._client.request.await_count == 2
+        assert results == [{"id": "1"}] * 10
+
+    @pytest.mark.asyncio
+    async def test_error_raised_to_every_waiter(self, async_session):
+        async_session._client.request, gate = _gated_request([_mock_aio_response(404, reason_phrase="Not Found")])
+
+        tasks = [asyncio.create_task(async_session.get(_metadata(), "/organizations/9")) for _ in range(3)]
+        await asyncio.sleep(0)
+        gate.set()
+        results = await asyncio.gather(*tasks, return_exceptions=True)
+
+        assert all(isinstance(result, APIError) for result in results)
+        assert async_session._client.request.await_count == 1
+
+    @pytest.mark.asyncio
+    async def test_cancelled_leader_does_not_cancel_followers(self, async_session):
+        async_session._client.request, gate = _gated_request([_mock_aio_response(200, json_data={"id": "1"})])
+
+        leader = asyncio.create_task(async_session.get(_metadata(), "/organizations/1"))
+        await asyncio.sleep(0)
+        follower = asyncio.create_task(async_session.get(_metadata(), "/organizations/1"))
+        await asyncio.sleep(0)
+        leader.cancel()
+        gate.set()
+
+        assert await follower == {"id": "1"}
+        assert leader.cancelled()
+
+    @pytest.mark.asyncio
+    async def test_sequential_gets_not_coalesced(self, async_session):
+        async_session._client.request = AsyncMock(return_value=_mock_aio_response(200, json_data={"id": "1"}))
+
+        await async_session.get(_metadata(), "/organizations/1")
+        await async_session.get(_metadata(), "/organizations/1")
+
+        assert async_session._client.request.await_count == 2
+
+    @pytest.mark.asyncio
+    async def test_disabled(self):
+        session = make_async_session(coalesce_identical_gets=False)
+        responses = [_mock_aio_response(200, json_data={"id": "1"}), _mock_aio_response(200, json_data={"id": "1"})]
+        session._client.request, gate = _gated_request(responses)
+
+        tasks = [asyncio.create_task(session.get(_metadata(), "/organizations/1")) for _ in range(2)]
+        await asyncio.sleep(0)
+        gate.set()
+        await asyncio.gather(*tasks)
+
+        assert session._client.request.await_count == 2
+
+
+class TestAsyncDecodeOffload:
+    """Large response bodies decode off the event loop; small ones inline, timed."""
+
+    BODY = {"items": [{"serial": f"Q2XX-{i:04d}"} for i in range(50)]}
+
+    def _recording_codec(self, session):
+        threads = []
+        loads = session._codec.loads
+
+        def recording_loads(data):
+            threads.append(threading.get_ident())
+            return loads(data)
+
+        session._codec.loads = recording_loads
+        return threads
+
+    @pytest.mark.asyncio
+    async def test_large_body_decoded_in_thread(self):
+        session = make_async_session(decode_offload_threshold=100)
+        threads = self._recording_codec(session)
+        session._client.request.return_value = _mock_aio_response(200, json_data=self.BODY)
+
+        result = await session.get(_metadata(), "/organizations/1/devices")
+
+        assert result == self.BODY
+        assert threads and threads[0] != threading.get_ident()
+        assert session.decodes_offloaded == 1
+        assert session.decodes_inline == 0
+
+    @pytest.mark.asyncio
+    async def test_small_body_decoded_inline_and_timed(self):
+        session = make_async_session(decode_offload_threshold=100)
+        threads = self._recording_codec(session)
+        session._client.request.return_value = _mock_aio_response(200, json_data={"id": "1"})
+
+        assert await session.get(_metadata(), "/organizations/1") == {"id": "1"}
+
+        assert threads == [threading.get_ident()]
+        assert session.decodes_inline == 1
+        assert session.decode_loop_seconds > 0
+
+    @pytest.mark.asyncio
+    async def test_zero_threshold_never_offloads(self):
+        session = make_async_session(decode_offload_threshold=0)
+        session._client.request.return_value = _mock_aio_response(200, json_data=self.BODY)
+
+        await session.get(_metadata(), "/organizations/1/devices")
+
+        assert session.decodes_offloaded == 0
+
+    @pytest.mark.asyncio
+    async def test_offloaded_decode_error_retries(self):
+        session = make_async_session(decode_offload_threshold=10)
+        bad = _mock_aio_response(200, content=b"{not json" + b" " * 20)
+        good = _mock_aio_response(200, json_data=self.BODY)
+        session._client.request = AsyncMock(side_effect=[bad, good])
+
+        with patch.object(session, "_sleep", new_callable=AsyncMock):
+            assert await session.get(_metadata(), "/organizations/1/devices") == self.BODY
+
+    @pytest.mark.asyncio
+    async def test_process_pool(self):
+        session = make_async_session(decode_offload_threshold=100, decode_offload_executor="process")
+        session._client.aclose = AsyncMock()
+        session._client.request.return_value = _mock_aio_response(200, json_data=self.BODY)
+
+        assert await session.get(_metadata(), "/organizations/1/devices") == self.BODY
+        assert session._decode_process_pool is not None
+
+        await session.close()
+        assert session._decode_process_pool is None
+
+    def test_unknown_executor_raises(self):
+        with pytest.raises(SessionInputError):
+            make_async_session(decode_offload_executor="gpu")
+
+    def test_process_pool_needs_named_codec(self):
+        class CustomCodec(JSONCodec):
+            name = "custom"
+
+        with pytest.raises(SessionInputError):
+            make_async_session(decode_offload_executor="process", json_codec=CustomCodec())
@@ -1,5 +1,7 @@
 """Smoke tests: all generated API modules import and instantiate."""
 
+import subprocess
+import sys
 from unittest.mock import MagicMock, patch
 
 import pytest
@@ -101,3 +103,56 @@ class TestDashboardAPISectionsSmoke:
         for section in expected_sections:
             attr = getattr(api, section, None)
             assert attr is not None, f"DashboardAPI missing section: {section}"
+
+
+class TestLazySections:
+    def _dashboard(self):
+        with patch("meraki.session.base.check_python_version"):
+            import meraki
+
+            return meraki.DashboardAPI(
+                api_key="fake_key_1234567890123456789012345678901234567890",
+                suppress_logging=True,
+                smart_flow_enabled=False,
+            )
+
+    def test_import_loads_no_sections(self):
+        """`import meraki` and `import meraki.aio` leave every generated section unimported."""
+        code = (
+            "import sys, meraki, meraki.aio; "
+            "print(sorted(m for m in sys.modules if m.startswith(('meraki.api.', 'meraki.aio.api.'))))"
+        )
+        result = subprocess.run([sys.executable, "-c", code], capture_output=True, text=True, check=True)
+        assert result.stdout.strip() == "[]"
+
+    def test_section_built_once_on_first_access(self):
+        api = self._dashboard()
+        assert "organizations" not in vars(api)
+
+        organizations = api.organizations
+
+        assert organizations is api.organizations
+        assert vars(api)["organizations"] is organizations
+        assert organizations._session is api._session
+
+    def test_batch_sections_lazy(self):
+        api = self._dashboard()
+        assert "switch" not in vars(api.batch)
+        assert type(api.batch.switch).__name__ == "ActionBatchSwitch"
+
+    def test_section_can_be_replaced(self):
+        api = self._dashboard()
+        api.networks = MagicMock()
+        assert isinstance(api.networks, MagicMock)
+
+    def test_module_level_section_classes(self):
+        import meraki
+        import meraki.aio
+        from meraki.api import batch
+
+        assert meraki.Organizations.__name__ == "Organizations"
+        assert meraki.Batch.__name__ == "Batch"
+        assert meraki.aio.AsyncWireless.__name__ == "AsyncWireless"
+        assert batch.ActionBatchSm.__name__ == "ActionBatchSm"
+        with pytest.raises(AttributeError):
+            meraki.NotASection
@@ -0,0 +1,178 @@
+"""Tests for DashboardAPI.bulk and concurrent use of a shared RestSession."""
+
+import threading
+import time
+from unittest.mock import patch
+
+import httpx
+import pytest
+
+import meraki
+from meraki.bulk import BulkResult, run_bulk
+from meraki.exceptions import APIError, SessionInputError
+from meraki.smart_flow import OrgRateLimiter
+
+API_KEY = "test_key_1234567890123456789012345678901234567890"
+
+
+def _sleepy(delays):
+    """A callable that sleeps delays[value] seconds, then returns value * 10."""
+
+    def call(value):
+        time.sleep(delays.get(value, 0))
+        return value * 10
+
+    return call
+
+
+class TestRunBulk:
+    def test_ordered_results_follow_input_order(self):
+        results = list(run_bulk(_sleepy({0: 0.05}), [0, 1, 2], max_workers=3))
+
+        assert [r.result for r in results] == [0, 10, 20]
+        assert [r.index for r in results] == [0, 1, 2]
+        assert all(r.ok for r in results)
+
+    def test_unordered_results_as_completed(self):
+        results = list(run_bulk(_sleepy({0: 0.1}), [0, 1, 2], max_workers=3, ordered=False))
+
+        assert results[-1].index == 0
+        assert sorted(r.result for r in results) == [0, 10, 20]
+
+    def test_errors_collected_without_stopping(self):
+        def call(value):
+            if value == 1:
+                raise ValueError("bad network")
+            return value
+
+        results = list(run_bulk(call, [0, 1, 2]))
+
+        assert [r.ok for r in results] == [True, False, True]
+        assert isinstance(results[1].error, ValueError)
+        assert results[1].result is None
+        assert results[1].arguments == 1
+
+    def test_argument_set_forms(self):
+        def call(a, b=0):
+            return (a, b)
+
+        results = list(run_bulk(call, ["x", ("y", 1), {"a": "z", "b": 2}]))
+
+        assert [r.result for r in results] == [("x", 0), ("y", 1), ("z", 2)]
+
+    def test_concurrency_bounded_by_max_workers(self):
+        lock = threading.Lock()
+        active = []
+        peak = []
+
+        def call(value):
+            with lock:
+                active.append(value)
+                peak.append(len(active))
+            time.sleep(0.01)
+            with lock:
+                active.remove(value)
+
+        list(run_bulk(call, range(20), max_workers=3))
+
+        assert max(peak) <= 3
+
+    def test_early_close_cancels_unstarted_calls(self):
+        started = []
+
+        def call(value):
+            started.append(value)
+            time.sleep(0.02)
+
+        results = run_bulk(call, range(100), max_workers=2)
+        next(results)
+        results.close()
+        time.sleep(0.1)
+
+        assert len(started) < 10
+
+    @pytest.mark.parametrize("max_workers", [0, -1, 2.5])
+    def test_invalid_max_workers(self, max_workers):
+        with pytest.raises(SessionInputError):
+            run_bulk(lambda x: x, [1], max_workers=max_workers)
+
+
+class TestDashboardBulk:
+    @patch("meraki.session.base.check_python_version")
+    def test_bulk_over_shared_session(self, mock_check):
+        dashboard = meraki.DashboardAPI(API_KEY, suppress_logging=True, caller="TestApp TestVendor", smart_flow_enabled=False)
+        seen = []
+        lock = threading.Lock()
+
+        def handler(request):
+            network_id = request.url.path.rsplit("/", 1)[1]
+            with lock:
+                seen.append(network_id)
+            if network_id == "N_bad":
+                return httpx.Response(404, json={"errors": ["Not found"]})
+            return httpx.Response(200, json={"id": network_id, "organizationId": "1"})
+
+        dashboard._session._client = httpx.Client(transport=httpx.MockTransport(handler))
+        network_ids = [f"N_{i}" for i in range(20)] + ["N_bad"]
+
+        results = list(dashboard.bulk(dashboard.networks.getNetwork, network_ids, max_workers=6))
+
+        assert all(isinstance(r, BulkResult) for r in results)
+        assert [r.result["id"] for r in results[:-1]] == network_ids[:-1]
+        assert isinstance(results[-1].error, APIError)
+        assert sorted(seen) == sorted(network_ids)
+
+    def test_bulk_result_exported(self):
+        assert meraki.BulkResult is BulkResult
+
+
+class TestSessionThreadSafety:
+    def test_request_methods_leave_caller_metadata_alone(self):
+        from tests.unit.conftest import make_sync_session
+
+        session = make_sync_session()
+        session._client = httpx.Client(transport=httpx.MockTransport(lambda request: httpx.Response(200, json={})))
+        metadata = {"tags": ["networks"], "operation": "getNetwork"}
+
+        session.get(metadata, "/networks/N_1")
+        session.put(metadata, "/networks/N_1", json={"name": "x"})
+
+        assert metadata == {"tags": ["networks"], "operation": "getNetwork"}
+
+    def test_limiter_learns_and_saves_concurrently(self, tmp_path):
+        limiter = OrgRateLimiter(cache_path=str(tmp_path / "cache.json"))
+
+        def learn(worker):
+            for i in range(300):
+                limiter.learn_from_response(
+                    f"https://api.meraki.com/api/v1/organizations/{worker}/networks",
+                    {"networkId": f"N_{worker}_{i}", "serial": f"Q2-{worker}-{i}"},
+                )
+
+        threads = [threading.Thread(target=learn, args=(worker,)) for worker in range(4)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        limiter.save_cache()
+
+        reloaded = OrgRateLimiter(cache_path=str(tmp_path / "cache.json"))
+        assert len(reloaded._network_to_org) == 1200
+        assert len(limiter._org_buckets) == 4
+
+    def test_one_bucket_per_org_under_contention(self):
+        limiter = OrgRateLimiter()
+        barrier = threading.Barrier(8)
+        buckets = []
+
+        def create():
+            barrier.wait()
+            buckets.append(limiter._get_or_create_bucket("1"))
+
+        threads = [threading.Thread(target=create) for _ in range(8)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        assert len({id(bucket) for bucket in buckets}) == 1
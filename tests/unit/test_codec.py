@@ -0,0 +1,136 @@
+"""Tests for meraki.codec module."""
+
+import json
+import sys
+from unittest.mock import MagicMock
+
+import pytest
+
+from meraki.codec import JSONCodec, OrjsonCodec, get_json_codec, loads_in_worker
+from meraki.exceptions import APIError, SessionInputError
+from tests.unit.conftest import make_metadata as _metadata
+from tests.unit.conftest import make_mock_response as _mock_response
+from tests.unit.conftest import make_sync_session
+
+
+class TestGetJsonCodec:
+    def test_default_is_stdlib(self):
+        assert get_json_codec().name == "stdlib"
+        assert get_json_codec(None).name == "stdlib"
+
+    def test_instance_passthrough(self):
+        codec = JSONCodec()
+        assert get_json_codec(codec) is codec
+
+    def test_unknown_name_raises(self):
+        with pytest.raises(SessionInputError):
+            get_json_codec("simplejson")
+
+    def test_name_is_case_insensitive(self):
+        assert get_json_codec("STDLIB").name == "stdlib"
+
+    def test_missing_optional_codec_falls_back_to_stdlib(self, monkeypatch):
+        monkeypatch.setitem(sys.modules, "ujson", None)
+        assert get_json_codec("ujson").name == "stdlib"
+
+    def test_auto_falls_back_to_stdlib_when_nothing_installed(self, monkeypatch):
+        monkeypatch.setitem(sys.modules, "orjson", None)
+        monkeypatch.setitem(sys.modules, "ujson", None)
+        assert get_json_codec("auto").name == "stdlib"
+
+    def test_auto_prefers_orjson(self):
+        pytest.importorskip("orjson")
+        assert isinstance(get_json_codec("auto"), OrjsonCodec)
+
+    def test_loads_in_worker_reuses_named_codec(self):
+        assert loads_in_worker("stdlib", b'{"id": "1"}') == {"id": "1"}
+        assert loads_in_worker("stdlib", b"[1]") == [1]
+
+
+class TestStdlibCodec:
+    def test_loads_bytes_and_str(self):
+        codec = JSONCodec()
+        assert codec.loads(b'[{"id": "1"}]') == [{"id": "1"}]
+        assert codec.loads('{"a": 1}') == {"a": 1}
+
+    def test_dumps_is_compact_utf8_bytes(self):
+        out = JSONCodec().dumps({"name": "Zürich", "ids": [1, 2]})
+        assert out == '{"name":"Zürich","ids":[1,2]}'.encode()
+
+    def test_loads_invalid_raises_value_error(self):
+        with pytest.raises(ValueError):
+            JSONCodec().loads(b"{not json")
+
+
+class TestOrjsonCodec:
+    def test_round_trip(self):
+        pytest.importorskip("orjson")
+        codec = OrjsonCodec()
+        body = {"serial": "Q2XX-XXXX-XXXX", "tags": ["a", "b"]}
+        assert codec.loads(codec.dumps(body)) == body
+
+    def test_invalid_raises_value_error(self):
+        pytest.importorskip("orjson")
+        with pytest.raises(ValueError):
+            OrjsonCodec().loads(b"{not json")
+
+
+class TestSessionCodec:
+    def test_session_stores_codec_and_logs_name(self):
+        session = make_sync_session()
+        assert session._codec.name == "stdlib"
+        assert session._parameters["json_codec"] == "stdlib"
+
+    def test_invalid_codec_name_raises(self):
+        with pytest.raises(SessionInputError):
+            make_sync_session(json_codec="bogus")
+
+    def test_json_body_encoded_once_as_content(self):
+        session = make_sync_session()
+        session._client.request = MagicMock(return_value=_mock_response(201, json_data={"id": "new"}))
+
+        session.post(_metadata(), "/organizations", json={"name": "Test"})
+
+        kwargs = session._client.request.call_args.kwargs
+        assert "json" not in kwargs
+        assert json.loads(kwargs["content"]) == {"name": "Test"}
+
+    def test_no_body_sends_no_content(self):
+        session = make_sync_session()
+        session._client.request = MagicMock(return_value=_mock_response(201, json_data={"id": "new"}))
+
+        session.post(_metadata(), "/organizations")
+
+        assert "content" not in session._client.request.call_args.kwargs
+
+    def test_response_decoded_from_content_bytes(self):
+        session = make_sync_session()
+        session._codec = MagicMock(wraps=JSONCodec())
+        resp = _mock_response(200, json_data=[{"id": "1"}])
+        session._client.request = MagicMock(return_value=resp)
+
+        assert session.get(_metadata(), "/organizations") == [{"id": "1"}]
+        session._codec.loads.assert_called_once_with(resp.content)
+        resp.json.assert_not_called()
+
+
+class TestAPIErrorCodec:
+    def test_decodes_content_with_codec(self):
+        codec = MagicMock(wraps=JSONCodec())
+        resp = MagicMock()
+        resp.status_code = 400
+        resp.reason_phrase = "Bad Request"
+        resp.content = b'{"errors": ["bad"]}'
+        err = APIError(_metadata(), resp, codec=codec)
+        assert err.message == {"errors": ["bad"]}
+        codec.loads.assert_called_once_with(resp.content)
+        resp.json.assert_not_called()
+
+    def test_codec_ignored_without_bytes_content(self):
+        resp = MagicMock()
+        resp.status_code = 503
+        resp.reason_phrase = "timeout"
+        resp.content = None
+        resp.json.return_value = {"error": "timeout"}
+        err = APIError(_metadata(), resp, codec=JSONCodec())
+        assert err.message == {"error": "timeout"}
@@ -1,10 +1,13 @@
 import logging
 import os
-from unittest.mock import MagicMock, patch
+import threading
+import time
+from unittest.mock import AsyncMock, MagicMock, patch
 
 import pytest
 
 import meraki
+from meraki.aio import AsyncDashboardAPI
 from meraki.exceptions import APIKeyError
 
 
@@ -380,6 +383,7 @@ class TestDashboardAPIEagerLoad:
             with patch.object(d.organizations, "getOrganizationNetworks", return_value=mock_networks):
                 with patch.object(d.organizations, "getOrganizationInventoryDevices", return_value=mock_devices):
                     d._eager_load_rate_limit_cache()
+                    assert d._session._smart_flow.wait_for_hydration(5)
 
         limiter = d._session._smart_flow
         assert limiter.resolve_org("/organizations/org_1/x") == "org_1"
@@ -412,6 +416,7 @@ class TestDashboardAPIEagerLoad:
             with patch.object(d.organizations, "getOrganizationNetworks", side_effect=Exception("net fail")):
                 with patch.object(d.organizations, "getOrganizationInventoryDevices", return_value=[]):
                     d._eager_load_rate_limit_cache()
+                    assert d._session._smart_flow.wait_for_hydration(5)
         assert d._session._smart_flow.resolve_org("/organizations/org_1/x") == "org_1"
 
     @patch("meraki.session.base.check_python_version")
@@ -429,6 +434,7 @@ class TestDashboardAPIEagerLoad:
             with patch.object(d.organizations, "getOrganizationNetworks", return_value=mock_networks):
                 with patch.object(d.organizations, "getOrganizationInventoryDevices", side_effect=Exception("dev fail")):
                     d._eager_load_rate_limit_cache()
+                    assert d._session._smart_flow.wait_for_hydration(5)
         assert d._session._smart_flow.resolve_org("/networks/N_1/x") == "org_1"
 
     @patch("meraki.session.base.check_python_version")
@@ -446,9 +452,73 @@ class TestDashboardAPIEagerLoad:
             with patch.object(d.organizations, "getOrganizationNetworks", return_value=[]):
                 with patch.object(d.organizations, "getOrganizationInventoryDevices", return_value=mock_devices):
                     d._eager_load_rate_limit_cache()
+                    assert d._session._smart_flow.wait_for_hydration(5)
         limiter = d._session._smart_flow
         assert limiter.resolve_org("/devices/QABC-1234-5678/x") == "org_1"
 
+    @patch("meraki.session.base.check_python_version")
+    def test_eager_load_returns_before_orgs_hydrate(self, mock_check, tmp_path):
+        d = meraki.DashboardAPI(
+            "test_key_1234567890123456789012345678901234567890",
+            suppress_logging=True,
+            smart_flow_enabled=True,
+            smart_flow_cache_mode="lazy",
+            smart_flow_cache_path=str(tmp_path / "cache.sqlite3"),
+            smart_flow_hydration_workers=2,
+            caller="TestApp TestVendor",
+        )
+        release = threading.Event()
+        started = []
+
+        def networks(org_id, **kwargs):
+            started.append(org_id)
+            release.wait(5)
+            return [{"id": f"N_{org_id}"}]
+
+        mock_orgs = [{"id": "org_1"}, {"id": "org_2"}, {"id": "org_3"}]
+        limiter = d._session._smart_flow
+        with patch.object(d.organizations, "getOrganizations", return_value=mock_orgs):
+            with patch.object(d.organizations, "getOrganizationNetworks", side_effect=networks):
+                with patch.object(d.organizations, "getOrganizationInventoryDevices", return_value=[]):
+                    d._eager_load_rate_limit_cache()
+                    while len(started) < 2:
+                        time.sleep(0.001)
+
+                    # Two orgs hydrate at once; the third waits for a worker
+                    assert sorted(started) == ["org_1", "org_2"]
+                    assert limiter.resolve_org("/networks/N_org_1/x") is None
+                    release.set()
+                    assert limiter.wait_for_hydration(5)
+
+        assert sorted(started) == ["org_1", "org_2", "org_3"]
+        assert limiter.resolve_org("/networks/N_org_3/x") == "org_3"
+
+    async def test_async_eager_load_hydrates_orgs_in_background(self, tmp_path):
+        with patch("meraki.session.base.check_python_version"):
+            d = AsyncDashboardAPI(
+                "test_key_1234567890123456789012345678901234567890",
+                suppress_logging=True,
+                smart_flow_enabled=True,
+                smart_flow_cache_mode="lazy",
+                smart_flow_cache_path=str(tmp_path / "cache.sqlite3"),
+                caller="TestApp TestVendor",
+            )
+        mock_orgs = [{"id": "org_1"}, {"id": "org_2"}]
+        limiter = d._session._smart_flow
+        with patch.object(d.organizations, "getOrganizations", AsyncMock(return_value=mock_orgs)):
+            with patch.object(d.organizations, "getOrganizationNetworks", AsyncMock(return_value=[{"id": "N_1"}])):
+                with patch.object(
+                    d.organizations, "getOrganizationInventoryDevices", AsyncMock(return_value=[{"serial": "Q_1"}])
+                ):
+                    await d._eager_load_rate_limit_cache()
+                    assert limiter._hydration_running == 2
+                    assert await limiter.wait_for_hydration(5)
+
+        assert limiter.resolve_org("/networks/N_1/x") in ("org_1", "org_2")
+        assert limiter.resolve_org("/devices/Q_1/x") in ("org_1", "org_2")
+        await d._session.shutdown_smart_flow()
+        await d._session.close()
+
     @patch("meraki.session.base.check_python_version")
     def test_eager_load_noop_without_limiter(self, mock_check):
         d = meraki.DashboardAPI(
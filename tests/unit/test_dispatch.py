@@ -0,0 +1,175 @@
+"""Tests for the generated operation table and the table-driven dispatcher."""
+
+import importlib
+import inspect
+import logging
+from unittest.mock import patch
+
+import httpx
+import pytest
+
+import meraki
+import meraki.aio
+from meraki.dispatch import call, get_operation, operations
+from meraki.exceptions import SessionInputError
+from meraki.session.sync import RestSession
+from tests.unit.conftest import make_async_session, make_sync_session
+
+API_KEY = "test_key_1234567890123456789012345678901234567890"
+SECTIONS = [
+    name for name, attr in vars(meraki.DashboardAPI).items() if isinstance(attr, meraki.LazySection) and name != "batch"
+]
+
+
+class RecordingSession:
+    """Records the session calls a generated method or the dispatcher makes, with defaults filled in."""
+
+    def __init__(self, validate_kwargs=False, logger=None):
+        self._validate_kwargs = validate_kwargs
+        self._logger = logger
+        self.calls = []
+
+    def __getattr__(self, name):
+        signature = inspect.signature(getattr(RestSession, name))
+
+        def record(metadata, url, *args, **kwargs):
+            bound = signature.bind(None, metadata, url, *args, **kwargs)
+            bound.apply_defaults()
+            arguments = dict(bound.arguments, metadata=dict(metadata, tags=list(metadata["tags"])))
+            del arguments["self"]
+            self.calls.append((name, arguments))
+            return name
+
+        return record
+
+
+def _generated_methods():
+    for section in SECTIONS:
+        descriptor = vars(meraki.DashboardAPI)[section]
+        cls = getattr(importlib.import_module(descriptor.module), descriptor.class_name)
+        for name in vars(cls):
+            if not name.startswith("_"):
+                yield cls, name
+
+
+def _value(op, param):
+    """A placeholder value for param, or a valid option when it is an enum."""
+    options = (op.enums or {}).get(param)
+    return next(v for v in options if v is not None) if options else f"{param}/1"
+
+
+def _full_kwargs(op, positional):
+    return {p: _value(op, p) for p in op.query | op.body if p not in positional}
+
+
+class TestOperationTable:
+    def test_one_row_per_generated_method(self):
+        names = [name for _, name in _generated_methods()]
+        assert sorted(names) == sorted(operations())
+
+    @pytest.mark.parametrize("with_kwargs", [False, True])
+    def test_dispatch_matches_generated_methods(self, with_kwargs):
+        for cls, name in _generated_methods():
+            op = get_operation(name)
+            positional = op.arguments or op.path_params
+            args = [_value(op, p) for p in positional]
+            kwargs = _full_kwargs(op, positional) if with_kwargs else {}
+
+            expected, actual = RecordingSession(), RecordingSession()
+            getattr(cls(expected), name)(*args, **kwargs)
+            call(actual, name, *args, **kwargs)
+
+            assert actual.calls == expected.calls, name
+
+
+class TestCall:
+    def test_unknown_operation(self):
+        with pytest.raises(SessionInputError, match="getNothing"):
+            call(RecordingSession(), "getNothing")
+
+    def test_positional_arguments_checked(self):
+        with pytest.raises(TypeError, match="takes 1 positional"):
+            call(RecordingSession(), "getNetwork", "N_1", "extra")
+        with pytest.raises(TypeError, match="networkId"):
+            call(RecordingSession(), "getNetwork")
+
+    def test_section_methods_delegate(self):
+        session = RecordingSession()
+        with patch("meraki.dispatch.call", wraps=call) as dispatched:
+            meraki.api.organizations.Organizations(session).getOrganizationNetworks("1", total_pages="all", perPage=5)
+        dispatched.assert_called_once_with(
+            session, "getOrganizationNetworks", "1", total_pages="all", direction="next", perPage=5
+        )
+        assert session.calls[0][1]["total_pages"] == "all"
+
+    def test_required_parameters_by_keyword(self):
+        session = RecordingSession()
+        call(session, "getNetwork", networkId="N_1")
+        assert session.calls[0][1]["url"] == "/networks/N_1"
+
+    def test_path_parameters_quoted(self):
+        session = RecordingSession()
+        call(session, "getNetwork", "L_1/../x")
+        assert session.calls[0][1]["url"] == "/networks/L_1%2F..%2Fx"
+
+    def test_array_parameters_bracketed(self):
+        session = RecordingSession()
+        call(session, "getOrganizationNetworks", "1", tags=["a"], perPage=5)
+        assert session.calls[0][1]["params"] == {"tags[]": ["a"], "perPage": 5}
+
+    def test_enum_checked(self):
+        with pytest.raises(AssertionError, match="tagsFilterType"):
+            call(RecordingSession(), "getOrganizationNetworks", "1", tagsFilterType="some")
+
+    def test_pagination_defaults_and_overrides(self):
+        session = RecordingSession()
+        call(session, "getOrganizationNetworks", "1")
+        call(session, "getOrganizationConfigurationChanges", "1")
+        call(session, "getOrganizationNetworks", "1", total_pages="all", direction="prev")
+        assert [(c[1]["total_pages"], c[1]["direction"]) for c in session.calls] == [(1, "next"), (1, "prev"), ("all", "prev")]
+
+    def test_unrecognized_kwargs_warned(self, caplog):
+        session = RecordingSession(validate_kwargs=True, logger=logging.getLogger("test_dispatch"))
+        with caplog.at_level(logging.WARNING, logger="test_dispatch"):
+            call(session, "getOrganizationNetworks", "1", perPage=5, bogus=1)
+        assert "getOrganizationNetworks: ignoring unrecognized kwargs: ['bogus']" in caplog.text
+
+
+class TestDashboardCall:
+    @patch("meraki.session.base.check_python_version")
+    def test_sync_call(self, mock_check):
+        dashboard = meraki.DashboardAPI(API_KEY, suppress_logging=True, caller="TestApp TestVendor", smart_flow_enabled=False)
+        requests = []
+
+        def handler(request):
+            requests.append(request)
+            return httpx.Response(200, json={"id": "N_1", "name": "renamed"})
+
+        dashboard._session._client = httpx.Client(transport=httpx.MockTransport(handler))
+
+        result = dashboard.call("updateNetwork", "N_1", name="renamed")
+
+        assert result == {"id": "N_1", "name": "renamed"}
+        assert requests[0].method == "PUT"
+        assert requests[0].url.path == "/api/v1/networks/N_1"
+
+    async def test_async_call(self):
+        session = make_async_session()
+
+        async def handler(request):
+            return httpx.Response(200, json=[{"id": "N_1"}])
+
+        session._client = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+
+        assert await call(session, "getOrganizationNetworks", "1") == [{"id": "N_1"}]
+        await session.close()
+
+    def test_dashboard_classes_expose_call(self):
+        assert callable(meraki.DashboardAPI.call)
+        assert callable(meraki.aio.AsyncDashboardAPI.call)
+
+    def test_session_call_with_mock_transport(self):
+        session = make_sync_session()
+        session._client = httpx.Client(transport=httpx.MockTransport(lambda request: httpx.Response(200, json={"id": "N_1"})))
+
+        assert call(session, "getNetwork", "N_1") == {"id": "N_1"}
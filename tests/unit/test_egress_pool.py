@@ -0,0 +1,177 @@
+"""Tests for spreading requests across a pool of egresses (requests_egresses)."""
+
+import threading
+import time
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+import meraki
+from meraki.common import validate_egresses
+from meraki.exceptions import SessionInputError
+from meraki.session.sync import RestSession
+from meraki.smart_flow import AsyncOrgRateLimiter, OrgRateLimiter
+from tests.unit.conftest import make_metadata, make_mock_response, make_sync_session
+
+API_KEY = "test_key_1234567890123456789012345678901234567890"
+ORG_URL = "https://api.meraki.com/api/v1/organizations/org_A/networks"
+PROXIES = ["http://egress-a:3128", "http://egress-b:3128"]
+
+
+class TestValidateEgresses:
+    def test_no_pool_is_requests_proxy(self):
+        assert validate_egresses([], "http://proxy:8080") == [{"proxy": "http://proxy:8080"}]
+        assert validate_egresses(None) == [{}]
+
+    def test_strings_and_dicts(self):
+        pool = validate_egresses(["http://egress-a:3128", "", {"local_address": "10.0.0.2", "proxy": ""}])
+        assert pool == [{"proxy": "http://egress-a:3128"}, {}, {"local_address": "10.0.0.2"}]
+
+    @pytest.mark.parametrize(
+        "egresses",
+        ["http://egress-a:3128", {"proxy": "http://egress-a:3128"}, [1], [{"address": "10.0.0.2"}], [{"proxy": None}]],
+    )
+    def test_invalid_pool_rejected(self, egresses):
+        with pytest.raises(SessionInputError):
+            validate_egresses(egresses)
+
+
+class TestEgressSelection:
+    def test_global_bucket_per_egress(self):
+        limiter = OrgRateLimiter(global_rate=50.0, egresses=3)
+
+        assert len(limiter._global_buckets) == 3
+        assert limiter._global_bucket is limiter._global_buckets[0]
+        assert all(bucket.rate == 50.0 for bucket in limiter._global_buckets)
+
+    def test_idle_egresses_take_turns(self):
+        limiter = OrgRateLimiter(egresses=3)
+        assert sorted(limiter.acquire(ORG_URL) for _ in range(6)) == [0, 0, 1, 1, 2, 2]
+
+    def test_least_loaded_egress_chosen(self):
+        limiter = OrgRateLimiter(egresses=3)
+        limiter._egress_waiting[:] = [4, 1, 2]
+        assert limiter._claim_egress() == 1
+        assert limiter._egress_waiting == [4, 2, 2]
+
+    def test_slowed_egress_counts_as_more_loaded(self):
+        limiter = OrgRateLimiter(egresses=2)
+        limiter._egress_waiting[:] = [1, 1]
+        limiter._global_buckets[0].rate = 30.0
+        assert {limiter._claim_egress() for _ in range(4)} == {1}
+
+    def test_concurrent_requests_spread_evenly(self):
+        limiter = OrgRateLimiter(egresses=2)
+        release = threading.Event()
+        for bucket in limiter._global_buckets:
+            bucket.acquire = lambda *args: not release.wait()
+        threads = [threading.Thread(target=limiter.acquire, args=(ORG_URL,)) for _ in range(8)]
+        for thread in threads:
+            thread.start()
+
+        deadline = time.monotonic() + 5
+        while sum(limiter._egress_waiting) < 8 and time.monotonic() < deadline:
+            time.sleep(0.01)
+        assert limiter._egress_waiting == [4, 4]
+        release.set()
+        for thread in threads:
+            thread.join()
+        assert limiter._egress_waiting == [0, 0]
+
+    def test_single_egress_always_zero(self):
+        limiter = OrgRateLimiter()
+        assert {limiter.acquire(ORG_URL) for _ in range(3)} == {0}
+
+    def test_429_and_success_adjust_that_egress(self):
+        limiter = OrgRateLimiter(egresses=2)
+
+        limiter.on_rate_limited("https://api.meraki.com/api/v1/organizations", None, None, 1)
+        assert limiter._global_buckets[1].rate == pytest.approx(70.0)
+        assert limiter._global_buckets[0].rate == 100.0
+
+        limiter.on_success("https://api.meraki.com/api/v1/organizations", None, 1)
+        assert limiter._global_buckets[1].rate == pytest.approx(70.5)
+
+    def test_org_limit_spans_egresses(self):
+        limiter = OrgRateLimiter(rate=5.0, capacity=5, egresses=2)
+        for _ in range(5):
+            limiter.acquire(ORG_URL)
+        assert limiter._org_buckets["org_A"]._tokens < 1.0
+
+    async def test_async_acquire_returns_egress(self):
+        limiter = AsyncOrgRateLimiter(egresses=2)
+        assert sorted([await limiter.acquire(ORG_URL) for _ in range(4)]) == [0, 0, 1, 1]
+        assert limiter._egress_waiting == [0, 0]
+        await limiter.shutdown()
+
+
+class TestSessionEgresses:
+    def test_client_per_egress(self):
+        with patch("meraki.session.base.check_python_version"), patch("httpx.Client") as client_class:
+            client_class.side_effect = lambda **kwargs: MagicMock(kwargs=kwargs)
+            session = RestSession(None, API_KEY, requests_egresses=PROXIES, smart_flow_enabled=False)
+
+        assert [client.kwargs["proxy"] for client in session._clients] == PROXIES
+        assert session._client is session._clients[0]
+        assert session._parameters["requests_egresses"] == 2
+
+    def test_local_address_builds_transport(self):
+        session = make_sync_session()
+        transport = MagicMock()
+
+        kwargs = session._egress_client_kwargs(
+            {"timeout": 60, "verify": "/ca.pem"}, {"local_address": "10.0.0.2", "proxy": "http://egress-a:3128"}, transport
+        )
+
+        transport.assert_called_once_with(local_address="10.0.0.2", proxy="http://egress-a:3128", verify="/ca.pem")
+        assert kwargs == {"timeout": 60, "transport": transport.return_value}
+
+    def test_request_sent_through_limiter_egress(self):
+        session = make_sync_session(smart_flow_enabled=True)
+        session._clients = [MagicMock(), MagicMock()]
+        session._smart_flow.acquire.return_value = 1
+        session._clients[1].request.return_value = make_mock_response(200, json_data=[])
+
+        session.get(make_metadata("getOrganizationNetworks"), "/organizations/org_A/networks")
+
+        session._clients[1].request.assert_called_once()
+        session._clients[0].request.assert_not_called()
+        session._smart_flow.on_success.assert_called_once_with(ORG_URL, None, 1)
+
+    def test_without_smart_flow_egresses_take_turns(self):
+        session = make_sync_session(smart_flow_enabled=False, requests_egresses=PROXIES)
+        session._clients = [MagicMock(), MagicMock()]
+        for client in session._clients:
+            client.request.return_value = make_mock_response(200, json_data=[])
+
+        for _ in range(4):
+            session.get(make_metadata("getOrganizationNetworks"), "/organizations/org_A/networks")
+
+        assert [client.request.call_count for client in session._clients] == [2, 2]
+
+    @patch("meraki.session.base.check_python_version")
+    def test_dashboard_limiter_has_bucket_per_egress(self, mock_check):
+        dashboard = meraki.DashboardAPI(API_KEY, suppress_logging=True, smart_flow_cache_path="", requests_egresses=PROXIES)
+        try:
+            assert len(dashboard._session._smart_flow._global_buckets) == 2
+        finally:
+            dashboard._session.close()
+
+    @patch("meraki.session.base.check_python_version")
+    def test_shared_limiter_keyed_by_pool(self, mock_check):
+        def dashboard(egresses):
+            return meraki.DashboardAPI(
+                API_KEY,
+                suppress_logging=True,
+                smart_flow_cache_path="",
+                smart_flow_share_limiter=True,
+                requests_egresses=egresses,
+            )
+
+        first, second, single = dashboard(PROXIES), dashboard(PROXIES), dashboard([])
+        try:
+            assert first._session._smart_flow is second._session._smart_flow
+            assert single._session._smart_flow is not first._session._smart_flow
+        finally:
+            for d in (first, second, single):
+                d._session.close()
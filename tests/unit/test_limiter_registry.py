@@ -0,0 +1,163 @@
+"""Tests for the process-wide smart flow limiter registry."""
+
+import asyncio
+import gc
+from unittest.mock import AsyncMock, patch
+
+import pytest
+
+import meraki
+import meraki.aio
+from meraki.smart_flow import LimiterRegistry, OrgRateLimiter, limiter_registry
+
+KEY_A = "key_a_1234567890123456789012345678901234567890"
+KEY_B = "key_b_1234567890123456789012345678901234567890"
+
+
+@pytest.fixture(autouse=True)
+def _no_version_check():
+    with patch("meraki.session.base.check_python_version"):
+        yield
+
+
+def _dashboard(api_key=KEY_A, share=True, **kwargs):
+    return meraki.DashboardAPI(
+        api_key, suppress_logging=True, smart_flow_cache_path="", smart_flow_share_limiter=share, **kwargs
+    )
+
+
+def _async_dashboard(api_key=KEY_A, share=True):
+    return meraki.aio.AsyncDashboardAPI(
+        api_key, suppress_logging=True, smart_flow_cache_path="", smart_flow_share_limiter=share
+    )
+
+
+class OwnerStub:
+    def __init__(self, name="owner"):
+        self.name = name
+
+    def resolve(self, id_type, identifier):
+        return self.name
+
+    def hydrate(self, org_id):
+        return None
+
+    def sample(self, org_id, timespan):
+        return [self.name, org_id]
+
+
+class TestLimiterRegistry:
+    def test_last_detach_returns_limiter(self):
+        registry = LimiterRegistry()
+        first, second = OwnerStub(), OwnerStub()
+
+        limiter = registry.attach("k", first, OrgRateLimiter, first.resolve, first.hydrate)
+        assert registry.attach("k", second, OrgRateLimiter, second.resolve, second.hydrate) is limiter
+        assert registry.references("k") == 2
+
+        assert registry.detach("k", second) is None
+        assert registry.detach("k", second) is None
+        assert registry.detach("k", first) is limiter
+        assert registry.references("k") == 0
+
+    def test_resolver_moves_to_remaining_session(self):
+        registry = LimiterRegistry()
+        first, second = OwnerStub("first"), OwnerStub("second")
+        limiter = registry.attach("k", first, OrgRateLimiter, first.resolve, first.hydrate)
+        registry.attach("k", second, OrgRateLimiter, second.resolve, second.hydrate)
+        assert limiter._resolver("network", "N_1") == "second"
+
+        registry.detach("k", second)
+
+        assert limiter._resolver("network", "N_1") == "first"
+
+    def test_sampler_wired_when_given(self):
+        registry = LimiterRegistry()
+        owner = OwnerStub("first")
+        limiter = registry.attach("k", owner, OrgRateLimiter, owner.resolve, owner.hydrate, owner.sample)
+
+        assert limiter._sampler("org_1", 600) == ["first", "org_1"]
+
+    def test_garbage_collected_session_released(self):
+        registry = LimiterRegistry()
+        keep, drop = OwnerStub(), OwnerStub()
+        registry.attach("k", keep, OrgRateLimiter, keep.resolve, keep.hydrate)
+        registry.attach("k", drop, OrgRateLimiter, drop.resolve, drop.hydrate)
+
+        del drop
+        gc.collect()
+
+        assert registry.references("k") == 1
+
+
+class TestSharedDashboardLimiters:
+    def test_same_key_shares_limiter(self):
+        first, second = _dashboard(), _dashboard()
+        try:
+            assert first._session._smart_flow is second._session._smart_flow
+            assert limiter_registry.references(first._session._smart_flow_registry_key) == 2
+        finally:
+            first._session.close()
+            second._session.close()
+
+    def test_different_keys_do_not_share(self):
+        first, second = _dashboard(KEY_A), _dashboard(KEY_B)
+        try:
+            assert first._session._smart_flow is not second._session._smart_flow
+        finally:
+            first._session.close()
+            second._session.close()
+
+    def test_sharing_name_shares_across_keys(self):
+        first, second = _dashboard(KEY_A, share="egress-1"), _dashboard(KEY_B, share="egress-1")
+        try:
+            assert first._session._smart_flow is second._session._smart_flow
+        finally:
+            first._session.close()
+            second._session.close()
+
+    def test_not_shared_by_default(self):
+        assert _dashboard(share=False)._session._smart_flow is not _dashboard(share=False)._session._smart_flow
+
+    def test_closing_last_session_drops_entry(self):
+        first, second = _dashboard(), _dashboard()
+        key = first._session._smart_flow_registry_key
+        limiter = first._session._smart_flow
+
+        first._session.close()
+        assert limiter_registry.references(key) == 1
+        second._session.close()
+        assert limiter_registry.references(key) == 0
+
+        third = _dashboard()
+        assert third._session._smart_flow is not limiter
+        third._session.close()
+
+    def test_async_clients_on_different_loops_do_not_share(self):
+        async def make():
+            return _async_dashboard()
+
+        loop = asyncio.new_event_loop()
+        try:
+            first = loop.run_until_complete(make())
+            second = loop.run_until_complete(make())
+            other = asyncio.run(make())
+        finally:
+            loop.close()
+
+        assert first._session._smart_flow is second._session._smart_flow
+        assert other._session._smart_flow is not first._session._smart_flow
+
+    async def test_async_clients_shut_down_shared_limiter_once(self):
+        first, second = _async_dashboard(), _async_dashboard()
+        limiter = first._session._smart_flow
+        assert second._session._smart_flow is limiter
+        assert limiter is not _dashboard()._session._smart_flow
+
+        with patch.object(limiter, "shutdown", AsyncMock()) as shutdown:
+            async with first:
+                pass
+            shutdown.assert_not_awaited()
+            async with second:
+                pass
+            shutdown.assert_awaited_once()
@@ -0,0 +1,307 @@
+"""Tests for the SQLite-backed smart flow mapping cache."""
+
+import json
+import sqlite3
+import threading
+import time
+from unittest.mock import patch
+
+import pytest
+
+import meraki
+from meraki.mapping_store import MappingStore, MappingTable
+from meraki.smart_flow import AsyncOrgRateLimiter, OrgRateLimiter
+
+API_KEY = "test_key_1234567890123456789012345678901234567890"
+
+
+def _wait_for(predicate, timeout=5.0):
+    deadline = time.monotonic() + timeout
+    while not predicate():
+        assert time.monotonic() < deadline, "timed out"
+        time.sleep(0.01)
+
+
+class TestMappingStore:
+    def test_flushed_mappings_visible_to_new_store(self, tmp_path):
+        path = str(tmp_path / "cache.sqlite3")
+        store = MappingStore(path)
+        store.put("network", "N_1", "org_A")
+        store.put("device", "Q2AB-1234-ABCD", "org_B")
+        assert store.flush() == 2
+
+        reopened = MappingStore(path, ttl=60.0)
+        assert reopened.fresh is True
+        assert reopened.get("network", "N_1") == "org_A"
+        assert reopened.get("device", "Q2AB-1234-ABCD") == "org_B"
+        assert reopened.get("device", "N_1") is None
+
+    def test_buffered_mapping_readable_before_write(self, tmp_path):
+        store = MappingStore(str(tmp_path / "cache.sqlite3"), debounce=60.0)
+        store.put("network", "N_1", "org_A")
+        assert store.get("network", "N_1") == "org_A"
+
+    def test_writer_thread_batches_after_debounce(self, tmp_path):
+        path = str(tmp_path / "cache.sqlite3")
+        store = MappingStore(path, debounce=0.05)
+        for i in range(10):
+            store.put("network", f"N_{i}", "org_A")
+
+        _wait_for(lambda: not store._pending and not store._inflight)
+        with sqlite3.connect(path) as conn:
+            assert conn.execute("SELECT COUNT(*) FROM mappings").fetchone()[0] == 10
+
+    def test_nothing_created_until_first_write(self, tmp_path):
+        store = MappingStore(str(tmp_path / "cache.sqlite3"))
+        assert store.get("network", "N_1") is None
+        assert not (tmp_path / "cache.sqlite3").exists()
+
+    def test_expired_database_cleared(self, tmp_path):
+        path = str(tmp_path / "cache.sqlite3")
+        store = MappingStore(path)
+        store.put("network", "N_1", "org_A")
+        store.flush()
+
+        with patch("time.time", return_value=time.time() + 120):
+            reopened = MappingStore(path, ttl=60.0)
+        assert reopened.fresh is False
+        assert reopened.get("network", "N_1") is None
+
+    def test_legacy_json_imported(self, tmp_path):
+        path = tmp_path / "cache.json"
+        path.write_text(
+            json.dumps(
+                {
+                    "saved_at": time.strftime("%Y-%m-%dT%H:%M:%SZ", time.gmtime()),
+                    "networks": [{"id": "N_1", "organization": {"id": "org_A"}}],
+                    "devices": [{"serial": "Q2AB-1234-ABCD", "organization": {"id": "org_B"}}],
+                }
+            )
+        )
+
+        store = MappingStore(str(path), ttl=60.0)
+
+        assert store.fresh is True
+        assert path.read_bytes().startswith(b"SQLite format 3\x00")
+        assert store.get("device", "Q2AB-1234-ABCD") == "org_B"
+        assert MappingStore(str(path), ttl=60.0).get("network", "N_1") == "org_A"
+
+    def test_legacy_json_beside_database_imported(self, tmp_path):
+        legacy = tmp_path / "rate_limit_cache.json"
+        legacy.write_text(
+            json.dumps(
+                {
+                    "saved_at": time.strftime("%Y-%m-%dT%H:%M:%SZ", time.gmtime()),
+                    "networks": [{"id": "N_1", "organization": {"id": "org_A"}}],
+                }
+            )
+        )
+        path = tmp_path / "rate_limit_cache.sqlite3"
+
+        store = MappingStore(str(path), ttl=60.0)
+
+        assert store.fresh is True
+        assert store.get("network", "N_1") == "org_A"
+        assert path.read_bytes().startswith(b"SQLite format 3\x00")
+        assert legacy.exists()
+
+    def test_rates_read_in_one_call(self, tmp_path):
+        path = str(tmp_path / "cache.sqlite3")
+        store = MappingStore(path)
+        store.put_rate("org_A", 4.5, updated_at=1000.0)
+        store.flush()
+        store.put_rate("org_B", 2.0, updated_at=2000.0)
+
+        assert store.rates() == {"org_A": (4.5, 1000.0), "org_B": (2.0, 2000.0)}
+        assert MappingStore(str(tmp_path / "missing.sqlite3")).rates() == {}
+
+    def test_get_many_reads_buffer_and_disk(self, tmp_path):
+        store = MappingStore(str(tmp_path / "cache.sqlite3"), debounce=60.0)
+        store.put_many("device", {f"Q_{i}": "org_A" for i in range(600)})
+        store.flush()
+        store.put("device", "Q_new", "org_B")
+
+        found = store.get_many("device", ["Q_0", "Q_599", "Q_new", "Q_missing"])
+
+        assert found == {"Q_0": "org_A", "Q_599": "org_A", "Q_new": "org_B"}
+        assert len(store.get_many("device", [f"Q_{i}" for i in range(600)])) == 600
+
+    def test_failed_write_kept_for_next_flush(self, tmp_path):
+        store = MappingStore(str(tmp_path / "cache.sqlite3"), debounce=60.0)
+        store.put("network", "N_1", "org_A")
+
+        with patch.object(MappingStore, "_write_rows", side_effect=sqlite3.OperationalError("database is locked")):
+            assert store.flush() == 0
+        assert store.get("network", "N_1") == "org_A"
+        assert store.flush() == 1
+
+    def test_rates_stored_with_mappings(self, tmp_path):
+        path = str(tmp_path / "cache.sqlite3")
+        store = MappingStore(path)
+        store.put_rate("org_A", 4.5, updated_at=1000.0)
+        assert store.get_rate("org_A") == (4.5, 1000.0)
+        store.close()
+
+        reopened = MappingStore(path)
+        assert reopened.get_rate("org_A") == (4.5, 1000.0)
+        assert reopened.get_rate("org_B") is None
+
+    def test_failed_write_keeps_rates(self, tmp_path):
+        store = MappingStore(str(tmp_path / "cache.sqlite3"))
+        store.put_rate("org_A", 4.5)
+        with patch.object(MappingStore, "_write_rows", side_effect=sqlite3.OperationalError("locked")):
+            assert store.flush() == 0
+        assert store.get_rate("org_A")[0] == 4.5
+        store.flush()
+        assert store._pending_rates == {}
+
+
+class TestMappingTable:
+    def test_reads_on_demand(self, tmp_path):
+        path = str(tmp_path / "cache.sqlite3")
+        writer = MappingTable(MappingStore(path), "network")
+        for i in range(100):
+            writer[f"N_{i}"] = "org_A"
+        writer._store.flush()
+
+        table = MappingTable(MappingStore(path), "network")
+        assert table._memo == {}
+        assert table.get("N_42") == "org_A"
+        assert list(table._memo) == ["N_42"]
+        assert len(table) == 100
+
+    def test_update_counts_only_changes(self, tmp_path):
+        path = str(tmp_path / "cache.sqlite3")
+        writer = MappingTable(MappingStore(path), "network")
+        writer.update({"N_1": "org_A", "N_2": "org_A"})
+        writer._store.flush()
+
+        table = MappingTable(MappingStore(path), "network")
+        assert table.update({"N_1": "org_A", "N_2": "org_B", "N_3": "org_A"}) == 2
+        assert table.get("N_2") == "org_B"
+        assert table.update({"N_3": "org_A"}) == 0
+
+    def test_miss_queried_once_until_set(self, tmp_path):
+        table = MappingTable(MappingStore(str(tmp_path / "cache.sqlite3")), "network")
+
+        with patch.object(MappingStore, "get", return_value=None) as get:
+            assert table.get("N_1") is None
+            assert table.get("N_1") is None
+            assert "N_1" not in table
+        assert get.call_count == 1
+
+        table["N_1"] = "org_A"
+        assert table.get("N_1") == "org_A"
+        assert not table.needs_lookup("N_1")
+
+    def test_note_keeps_entry_set_during_fetch(self, tmp_path):
+        table = MappingTable(MappingStore(str(tmp_path / "cache.sqlite3")), "network")
+        table["N_1"] = "org_B"
+        table.note("N_1", "org_A")
+        table.note("N_1", None)
+        assert table.cached("N_1") == "org_B"
+
+    def test_org_ids_interned(self):
+        table = MappingTable(None, "network")
+        # Built at runtime so the two values are distinct, non-interned strings
+        table["N_1"] = "".join(["org", "_A"])  # noqa: FLY002
+        table["N_2"] = "".join(["org", "_A"])  # noqa: FLY002
+        assert table["N_1"] is table["N_2"]
+
+    def test_memo_bounded_with_store(self, tmp_path):
+        table = MappingTable(MappingStore(str(tmp_path / "cache.sqlite3")), "device", memo_size=8)
+        for i in range(20):
+            table[f"Q_{i}"] = "org_A"
+
+        assert len(table._memo) <= 8
+        assert table.get("Q_0") == "org_A"
+
+    def test_unbounded_without_store(self):
+        table = MappingTable(None, "device", memo_size=8)
+        for i in range(20):
+            table[f"Q_{i}"] = "org_A"
+        assert len(table) == 20
+        assert "Q_0" in table
+
+
+class TestLimiterCache:
+    def test_flush_threshold_does_not_write_on_caller(self, tmp_path):
+        limiter = OrgRateLimiter(cache_path=str(tmp_path / "cache.sqlite3"))
+        limiter._dirty = 50
+
+        with patch.object(limiter._store, "flush") as flush:
+            limiter._maybe_flush()
+
+        flush.assert_not_called()
+        assert limiter._store._urgent is True
+
+    def test_learned_mappings_written_in_background(self, tmp_path):
+        path = str(tmp_path / "cache.sqlite3")
+        limiter = OrgRateLimiter(cache_path=path)
+        for i in range(60):
+            limiter.learn_from_response(f"/networks/N_{i}", {"organizationId": "org_A"})
+
+        _wait_for(lambda: MappingStore(path).get("network", "N_59") == "org_A")
+
+    @patch("meraki.session.base.check_python_version")
+    def test_session_close_writes_cache(self, mock_check, tmp_path):
+        path = str(tmp_path / "cache.sqlite3")
+        dashboard = meraki.DashboardAPI(API_KEY, suppress_logging=True, smart_flow_cache_path=path)
+        dashboard._session._smart_flow.register_device("Q2AB-1234-ABCD", "org_A")
+
+        dashboard._session.close()
+
+        assert OrgRateLimiter(cache_path=path).resolve_org("/devices/Q2AB-1234-ABCD/clients") == "org_A"
+
+    async def test_async_shutdown_writes_cache(self, tmp_path):
+        path = str(tmp_path / "cache.sqlite3")
+        limiter = AsyncOrgRateLimiter(cache_path=path)
+        limiter.register_network("N_1", "org_A")
+
+        await limiter.shutdown()
+
+        assert AsyncOrgRateLimiter(cache_path=path).resolve_org("/networks/N_1/ssids") == "org_A"
+
+    async def test_async_acquire_reads_store_off_the_loop(self, tmp_path):
+        path = str(tmp_path / "cache.sqlite3")
+        store = MappingStore(path)
+        store.put("network", "N_1", "org_A")
+        store.close()
+        limiter = AsyncOrgRateLimiter(cache_path=path)
+        loop_thread = threading.get_ident()
+        reads = []
+
+        def get(store, kind, identifier):
+            reads.append((identifier, threading.get_ident()))
+            return "org_A" if identifier == "N_1" else None
+
+        with patch.object(MappingStore, "get", get):
+            await limiter.acquire("/networks/N_1/ssids")
+            await limiter.acquire("/networks/N_1/ssids")
+            limiter.on_success("/networks/N_2/ssids")
+            await limiter.acquire("/networks/N_2/ssids")
+            await limiter.acquire("/networks/N_2/ssids")
+
+        assert [identifier for identifier, _ in reads] == ["N_1", "N_2"]
+        assert all(thread != loop_thread for _, thread in reads)
+        assert "org_A" in limiter._org_buckets
+
+    async def test_async_stored_rates_read_at_init(self, tmp_path):
+        path = str(tmp_path / "cache.sqlite3")
+        store = MappingStore(path)
+        store.put_rate("org_A", 4.0)
+        store.close()
+        limiter = AsyncOrgRateLimiter(rate=10.0, cache_path=path)
+
+        with patch.object(MappingStore, "get_rate") as get_rate:
+            assert limiter._get_or_create_bucket("org_A").rate == pytest.approx(4.0, abs=0.01)
+            assert limiter._get_or_create_bucket("org_B").rate == 10.0
+        get_rate.assert_not_called()
+
+
+@pytest.mark.parametrize("kind", ["network", "device"])
+def test_items_lists_every_mapping(tmp_path, kind):
+    table = MappingTable(MappingStore(str(tmp_path / "cache.sqlite3")), kind)
+    table["A"] = "org_1"
+    table["B"] = "org_2"
+    assert sorted(table.items()) == [("A", "org_1"), ("B", "org_2")]
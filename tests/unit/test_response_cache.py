@@ -0,0 +1,229 @@
+"""Tests for meraki.response_cache and the session read-through cache."""
+
+import time
+from unittest.mock import MagicMock
+
+import pytest
+
+from meraki.exceptions import SessionInputError
+from meraki.response_cache import (
+    CacheEntry,
+    DiskCacheBackend,
+    MemoryCacheBackend,
+    ResponseCache,
+    api_key_namespace,
+    resource_path,
+)
+from tests.unit.conftest import (
+    make_async_mock_response as _async_mock_response,
+)
+from tests.unit.conftest import (
+    make_async_session,
+    make_sync_session,
+)
+from tests.unit.conftest import (
+    make_metadata as _metadata,
+)
+from tests.unit.conftest import (
+    make_mock_response as _mock_response,
+)
+
+BASE = "https://api.meraki.com/api/v1"
+
+
+def _entry(path="/api/v1/networks/N_1", expires_in=60.0, content=b'{"id": "N_1"}'):
+    return CacheEntry(time.time() + expires_in, path, 200, {"content-type": "application/json"}, content)
+
+
+@pytest.fixture(params=["memory", "disk"])
+def backend(request, tmp_path):
+    if request.param == "memory":
+        return MemoryCacheBackend(max_entries=3)
+    return DiskCacheBackend(str(tmp_path / "cache" / "responses.sqlite3"), max_entries=3)
+
+
+class TestBackends:
+    def test_set_get_delete(self, backend):
+        backend.set("k", _entry())
+        assert backend.get("k").content == b'{"id": "N_1"}'
+        backend.delete("k")
+        assert backend.get("k") is None
+
+    def test_lru_eviction(self, backend):
+        for key in ("a", "b", "c"):
+            backend.set(key, _entry())
+            time.sleep(0.001)
+        backend.get("a")  # a becomes most recently used
+        backend.set("d", _entry())
+
+        assert backend.get("b") is None
+        assert backend.get("a") is not None
+        assert len(backend) == 3
+
+    def test_invalidate_path_children_and_parent(self, backend):
+        backend.set("vlans", _entry("/api/v1/networks/N_1/appliance/vlans"))
+        backend.set("vlan", _entry("/api/v1/networks/N_1/appliance/vlans/10"))
+        backend.set("sibling", _entry("/api/v1/networks/N_1/appliance/vlans/100"))
+
+        dropped = backend.invalidate("/api/v1/networks/N_1/appliance/vlans/10", "/api/v1/networks/N_1/appliance/vlans")
+
+        assert dropped == 2
+        assert backend.get("sibling") is not None
+
+    def test_invalidate_children(self, backend):
+        backend.set("net", _entry("/api/v1/networks/N_1"))
+        backend.set("vlans", _entry("/api/v1/networks/N_1/appliance/vlans"))
+        backend.set("other", _entry("/api/v1/networks/N_12"))
+
+        backend.invalidate("/api/v1/networks/N_1", "/api/v1/networks")
+
+        assert backend.get("net") is None
+        assert backend.get("vlans") is None
+        assert backend.get("other") is not None
+
+    def test_headers_round_trip(self, backend):
+        entry = _entry()._replace(headers={"link": "<https://x/a?startingAfter=1>; rel=next"})
+        backend.set("k", entry)
+        assert backend.get("k").headers == entry.headers
+
+
+class TestDiskBackend:
+    def test_persists_across_instances(self, tmp_path):
+        path = str(tmp_path / "responses.sqlite3")
+        DiskCacheBackend(path).set("k", _entry())
+        assert DiskCacheBackend(path).get("k").content == b'{"id": "N_1"}'
+
+    def test_like_wildcards_in_path_are_literal(self, tmp_path):
+        backend = DiskCacheBackend(str(tmp_path / "responses.sqlite3"))
+        backend.set("k", _entry("/api/v1/networks/NX1/clients"))
+        backend.invalidate("/api/v1/networks/N_1", "/api/v1/networks")
+        assert backend.get("k") is not None
+
+
+class TestResponseCache:
+    def test_key_includes_operation_url_and_sorted_params(self):
+        cache = ResponseCache()
+        a = cache.key("getNetworkClients", f"{BASE}/networks/N_1/clients", {"perPage": 10, "timespan": 60})
+        b = cache.key("getNetworkClients", f"{BASE}/networks/N_1/clients", {"timespan": 60, "perPage": 10})
+        c = cache.key("getNetworkClients", f"{BASE}/networks/N_1/clients", {"perPage": 20, "timespan": 60})
+        assert a == b
+        assert a != c
+        assert "perPage=10" in a
+
+    def test_expired_entry_is_a_miss(self):
+        cache = ResponseCache()
+        cache.backend.set("k", _entry(expires_in=-1))
+        assert cache.get("k") is None
+        assert len(cache.backend) == 0
+        assert cache.misses == 1
+
+    def test_per_operation_ttl_zero_is_not_cached(self):
+        cache = ResponseCache(ttls={"getNetworkClients": 0})
+        cache.put("k", "getNetworkClients", f"{BASE}/networks/N_1/clients", _mock_response(200, json_data=[]))
+        assert cache.get("k") is None
+
+    def test_unknown_backend_raises(self):
+        with pytest.raises(SessionInputError):
+            ResponseCache("redis")
+
+    def test_disk_requires_path(self):
+        with pytest.raises(SessionInputError):
+            ResponseCache("disk", path="")
+
+    def test_resource_path(self):
+        assert resource_path(f"{BASE}/networks/N_1/?perPage=5") == "/api/v1/networks/N_1"
+
+
+class TestSyncSessionCache:
+    def test_repeat_get_served_from_cache(self):
+        session = make_sync_session(response_cache="memory")
+        session._client.request = MagicMock(return_value=_mock_response(200, json_data={"id": "N_1"}))
+
+        first = session.get(_metadata("getNetwork"), "/networks/N_1")
+        second = session.get(_metadata("getNetwork"), "/networks/N_1")
+
+        assert first == second == {"id": "N_1"}
+        assert first is not second
+        assert session._client.request.call_count == 1
+        assert session._response_cache.hits == 1
+
+    def test_hit_skips_smart_flow(self):
+        session = make_sync_session(response_cache="memory", smart_flow_enabled=True)
+        session._client.request = MagicMock(return_value=_mock_response(200, json_data={"id": "N_1"}))
+
+        session.get(_metadata("getNetwork"), "/networks/N_1")
+        session.get(_metadata("getNetwork"), "/networks/N_1")
+
+        assert session._smart_flow.acquire.call_count == 1
+
+    def test_write_invalidates_parent_collection(self):
+        session = make_sync_session(response_cache="memory")
+        session._client.request = MagicMock(return_value=_mock_response(200, json_data=[{"id": "10"}]))
+        session.get(_metadata("getNetworkApplianceVlans"), "/networks/N_1/appliance/vlans")
+
+        session._client.request.return_value = _mock_response(200, json_data={"id": "10"})
+        session.put(_metadata("updateNetworkApplianceVlan"), "/networks/N_1/appliance/vlans/10", json={"name": "x"})
+        session.get(_metadata("getNetworkApplianceVlans"), "/networks/N_1/appliance/vlans")
+
+        assert session._client.request.call_count == 3
+
+    def test_params_are_part_of_key(self):
+        session = make_sync_session(response_cache="memory")
+        session._client.request = MagicMock(return_value=_mock_response(200, json_data=[]))
+
+        session.get(_metadata("getOrganizationNetworks"), "/organizations/1/networks", params={"perPage": 5})
+        session.get(_metadata("getOrganizationNetworks"), "/organizations/1/networks", params={"perPage": 10})
+
+        assert session._client.request.call_count == 2
+
+    def test_pagination_link_replayed_from_cache(self):
+        session = make_sync_session(response_cache="memory")
+        page1 = _mock_response(
+            200, json_data=[{"id": "1"}], headers={"link": f"<{BASE}/organizations?startingAfter=1>; rel=next"}
+        )
+        page1.links = {"next": {"url": f"{BASE}/organizations?startingAfter=1"}}
+        page2 = _mock_response(200, json_data=[{"id": "2"}])
+        session._client.request = MagicMock(side_effect=[page1, page2])
+
+        assert session.get_pages(_metadata(), "/organizations") == [{"id": "1"}, {"id": "2"}]
+        assert session.get_pages(_metadata(), "/organizations") == [{"id": "1"}, {"id": "2"}]
+        assert session._client.request.call_count == 2
+
+    def test_disabled_by_default(self):
+        session = make_sync_session()
+        assert session._response_cache is None
+
+    def test_shared_cache_instance(self):
+        cache = ResponseCache()
+        session = make_sync_session(response_cache=cache)
+        assert session._response_cache is cache
+
+    def test_disk_cache_namespaced_by_api_key(self, tmp_path):
+        session = make_sync_session(response_cache="disk", response_cache_path=str(tmp_path / "r.sqlite3"))
+        key = session._response_cache.key("getNetwork", f"{BASE}/networks/N_1")
+        assert key.startswith(api_key_namespace(session._api_key))
+
+
+class TestAsyncSessionCache:
+    async def test_repeat_get_served_from_cache(self):
+        # Smart flow off: its background resolve of N_1 would also go through the client
+        session = make_async_session(response_cache="memory", smart_flow_enabled=False)
+        session._client.request.return_value = _async_mock_response(200, json_data={"id": "N_1"})
+
+        await session.get(_metadata("getNetwork"), "/networks/N_1")
+        result = await session.get(_metadata("getNetwork"), "/networks/N_1")
+
+        assert result == {"id": "N_1"}
+        assert session._client.request.await_count == 1
+
+    async def test_delete_invalidates_resource(self):
+        session = make_async_session(response_cache="memory", smart_flow_enabled=False)
+        session._client.request.return_value = _async_mock_response(200, json_data={"id": "N_1"})
+        await session.get(_metadata("getNetwork"), "/networks/N_1")
+
+        session._client.request.return_value = _async_mock_response(204, content=b"")
+        await session.delete(_metadata("deleteNetwork"), "/networks/N_1")
+        session._client.request.return_value = _async_mock_response(200, json_data={"id": "N_1"})
+        await session.get(_metadata("getNetwork"), "/networks/N_1")
+
+        assert session._client.request.await_count == 3
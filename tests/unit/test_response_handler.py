@@ -25,3 +25,14 @@ class TestHandle3xx:
 
         assert result == "https://n456.meraki.cn/api/v1/networks"
         assert session._base_url == "https://n456.meraki.cn/api/v1"
+
+    def test_non_dashboard_location_keeps_base_url(self):
+        session = MagicMock()
+        session._base_url = "https://api.meraki.com/api/v1"
+        response = MagicMock()
+        response.headers = {"Location": "https://login.example.com/sso?next=/api/v1/organizations"}
+
+        result = handle_3xx(session, response)
+
+        assert result == "https://login.example.com/sso?next=/api/v1/organizations"
+        assert session._base_url == "https://api.meraki.com/api/v1"
@@ -3,9 +3,11 @@ from unittest.mock import MagicMock, patch
 import httpx
 import pytest
 
+from meraki.codec import JSONCodec
 from meraki.exceptions import APIError, SessionInputError
+from meraki.session.base import retry_after_seconds
 
-from tests.unit.conftest import make_metadata as _metadata, make_mock_response as _mock_response
+from tests.unit.conftest import make_metadata as _metadata, make_mock_response as _mock_response, make_sync_session
 
 
 # --- Retry logic tests ---
@@ -108,6 +110,25 @@ class TestRetryLogic:
         session.request(_metadata(), "GET", "/organizations")
         mock_sleep.assert_called_with(7)
 
+    @patch("time.sleep", return_value=None)
+    def test_429_retry_after_passed_to_smart_flow(self, mock_sleep):
+        session = make_sync_session(smart_flow_enabled=True)
+        resp_429 = _mock_response(429, reason_phrase="Too Many Requests", headers={"Retry-After": "3"})
+        session._client.request = MagicMock(side_effect=[resp_429, _mock_response(200)])
+
+        session.request(_metadata(), "GET", "/organizations/1/networks")
+
+        session._smart_flow.on_rate_limited.assert_called_once_with(
+            "https://api.meraki.com/api/v1/organizations/1/networks", 3.0, None, 0
+        )
+
+    @pytest.mark.parametrize(
+        "headers, expected",
+        [({"Retry-After": "2"}, 2.0), ({}, None), ({"Retry-After": "soon"}, None), ({"Retry-After": "0"}, None)],
+    )
+    def test_retry_after_seconds(self, headers, expected):
+        assert retry_after_seconds(_mock_response(429, headers=headers)) == expected
+
     @patch("time.sleep", return_value=None)
     def test_server_error_retries_exactly_maximum_retries(self, mock_sleep, session):
         """Verify 5xx retries exhaust exactly maximum_retries attempts."""
@@ -501,7 +522,7 @@ class TestJSONDecodeRetryExhaustion:
         import json as json_mod
 
         session._maximum_retries = 2
-        resp = _mock_response(200, content=b'{"ok":true}')
+        resp = _mock_response(200, content=b'{"ok":tru')
         resp.json.side_effect = json_mod.decoder.JSONDecodeError("", "", 0)
         session._client.request = MagicMock(return_value=resp)
 
@@ -1042,8 +1063,100 @@ class TestSyncGlobalBucketAccounting:
         # one acquire per internal GET: 2 network pages + 1 devices page = 3
         assert s._smart_flow._global_bucket.acquire.call_count == 3
 
+    def test_hydrator_registers_each_page_before_fetching_next(self):
+        s = self._smart_flow_session()
+        s._smart_flow._global_bucket = MagicMock()
+        seen_before_page2 = []
+        page1 = _mock_response(
+            200,
+            json_data=[{"id": "N_1"}],
+            links={"next": {"url": "https://api.meraki.com/api/v1/organizations/9/networks?page=2"}},
+        )
+        page2 = _mock_response(200, json_data=[{"id": "N_2"}], links={})
+        empty = _mock_response(200, json_data=[], links={})
+
+        def request(method, url, **kwargs):
+            if "page=2" in url:
+                seen_before_page2.append(s._smart_flow.resolve_org("/networks/N_1"))
+                return page2
+            return page1 if "networks" in url else empty
+
+        s._client.request = MagicMock(side_effect=request)
+
+        s._hydrate_org_for_limiter("9")
+
+        assert seen_before_page2 == ["9"]
+        assert s._smart_flow.resolve_org("/networks/N_2") == "9"
+
+    def test_sampler_fetches_usage_by_interval(self):
+        s = self._smart_flow_session()
+        s._smart_flow._global_bucket = MagicMock()
+        body = [{"startTs": "2026-01-01T00:00:00Z", "endTs": "2026-01-01T00:02:00Z", "counts": []}]
+        s._client.request = MagicMock(return_value=_mock_response(200, json_data=body))
+
+        assert s._sample_usage_for_limiter("9", 600) == body
+        args, kwargs = s._client.request.call_args
+        assert args[1].endswith("/organizations/9/apiRequests/overview/responseCodes/byInterval")
+        assert kwargs["params"] == {"timespan": 600, "interval": 120}
+        s._smart_flow._global_bucket.acquire.assert_called_once()
+
     def test_acquire_global_bucket_defensive_no_smart_flow(self, session):
         """Helper is a no-op when smart flow is disabled (no bucket present)."""
         session._smart_flow = None
         # Should not raise
         session._acquire_global_bucket()
+
+
+# --- Single-parse response pipeline (sync) ---
+
+
+class TestSyncSingleParse:
+    def test_get_parses_json_once_with_smart_flow(self, session):
+        """GET decodes the body once and hands the same object to smart flow and the caller."""
+        session._smart_flow = MagicMock()
+        session._codec = MagicMock(wraps=JSONCodec())
+        body = {"organizationId": "42", "id": "N_1"}
+        resp = _mock_response(200, json_data=body)
+        session._client.request = MagicMock(return_value=resp)
+
+        result = session.get(_metadata(), "/networks/N_1")
+
+        assert result == body
+        assert session._codec.loads.call_count == 1
+        assert session._smart_flow.learn_from_response.call_args.args[1] is result
+
+    def test_request_returns_response_and_body(self, session):
+        resp = _mock_response(200, json_data=[{"id": "1"}])
+        session._client.request = MagicMock(return_value=resp)
+
+        response, body = session._request(_metadata(), "GET", "/organizations")
+        assert response is resp
+        assert body == [{"id": "1"}]
+
+    def test_request_non_get_has_no_parsed_body(self, session):
+        resp = _mock_response(201, json_data={"id": "x"})
+        session._client.request = MagicMock(return_value=resp)
+
+        response, body = session._request(_metadata(), "POST", "/organizations")
+        assert response is resp
+        assert body is None
+        resp.json.assert_not_called()
+
+    @patch("time.sleep", return_value=None)
+    def test_legacy_items_pages_parse_once_each(self, mock_sleep, session):
+        resp1 = _mock_response(
+            200,
+            json_data={"items": [{"id": "1"}], "meta": {"counts": {"items": {"remaining": 1}}}},
+            links={"next": {"url": "https://api.meraki.com/api/v1/things?startingAfter=1"}},
+        )
+        resp2 = _mock_response(
+            200,
+            json_data={"items": [{"id": "2"}], "meta": {"counts": {"items": {"remaining": 0}}}},
+            links={},
+        )
+        session._client.request = MagicMock(side_effect=[resp1, resp2])
+        session._codec = MagicMock(wraps=JSONCodec())
+
+        result = session._get_pages_legacy(_metadata(), "/things", total_pages=-1)
+        assert result["items"] == [{"id": "1"}, {"id": "2"}]
+        assert session._codec.loads.call_count == 2
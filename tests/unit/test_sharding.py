@@ -0,0 +1,317 @@
+"""Tests for time-window sharded pagination."""
+
+import asyncio
+import threading
+import time
+from unittest.mock import patch
+
+import httpx
+import pytest
+
+from meraki.session.sharding import ShardJoiner, merge_shard_results, newest_first, split_time_window
+from tests.unit.conftest import make_async_session, make_sync_session
+from tests.unit.conftest import make_metadata as _metadata
+
+BASE = "https://api.meraki.com/api/v1"
+T0 = "2024-01-01T00:00:00Z"
+T1 = "2024-01-05T00:00:00Z"
+
+
+class TestSplitTimeWindow:
+    def test_iso_window_split_evenly(self):
+        shards = split_time_window({"t0": T0, "t1": T1, "perPage": 1000}, 4)
+        assert [(s["t0"], s["t1"]) for s in shards] == [
+            (T0, "2024-01-02T00:00:00Z"),
+            ("2024-01-02T00:00:00Z", "2024-01-03T00:00:00Z"),
+            ("2024-01-03T00:00:00Z", "2024-01-04T00:00:00Z"),
+            ("2024-01-04T00:00:00Z", T1),
+        ]
+        assert all(s["perPage"] == 1000 for s in shards)
+
+    def test_epoch_window_keeps_epoch_style(self):
+        shards = split_time_window({"t0": 1000, "t1": 1100}, 2)
+        assert shards == [{"t0": 1000, "t1": 1050}, {"t0": 1050, "t1": 1100}]
+
+    def test_newest_first_windows_reversed(self):
+        shards = split_time_window({"t0": 1000, "t1": 1100}, 2, newest_first=True)
+        assert shards == [{"t0": 1050, "t1": 1100}, {"t0": 1000, "t1": 1050}]
+
+    def test_shards_capped_at_one_second_each(self):
+        assert len(split_time_window({"t0": 0, "t1": 3}, 10)) == 3
+
+    @pytest.mark.parametrize(
+        "params",
+        [
+            None,
+            {"t0": T0},
+            {"timespan": 86400},
+            {"t0": T1, "t1": T0},
+            {"t0": "yesterday", "t1": T1},
+            {"t0": T0, "t1": T1, "startingAfter": "abc"},
+            {"t0": 0, "t1": 1},
+        ],
+    )
+    def test_not_shardable(self, params):
+        assert split_time_window(params, 4) is None
+
+
+class TestNewestFirst:
+    @pytest.mark.parametrize(
+        "operation, params, expected",
+        [
+            ("getOrganizationConfigurationChanges", {}, True),
+            ("getOrganizationApiRequests", None, True),
+            ("getDeviceSensorCommands", {}, True),
+            ("getDeviceSensorCommands", {"sortOrder": "ascending"}, False),
+            ("getOrganizationApplianceSecurityEvents", {"sortOrder": "descending"}, True),
+            ("getOrganizationApplianceSecurityEvents", {}, False),
+            ("getNetworkClients", {}, False),
+        ],
+    )
+    def test_sort_direction(self, operation, params, expected):
+        assert newest_first(operation, params) is expected
+
+
+class TestMergeShardResults:
+    def test_lists_concatenated(self):
+        assert merge_shard_results([[1, 2], None, [3]]) == [1, 2, 3]
+
+    def test_items_bodies_merged_into_first(self):
+        merged = merge_shard_results([{"items": [1], "meta": {}}, {"items": [2, 3], "meta": {}}])
+        assert merged == {"items": [1, 2, 3], "meta": {}}
+
+    def test_items_body_counts_cover_every_shard(self):
+        parts = [
+            {"items": [1, 2], "meta": {"counts": {"items": {"total": 2, "remaining": 0}}}},
+            {"items": [2, 3, 4], "meta": {"counts": {"items": {"total": 3, "remaining": 0}}}},
+        ]
+
+        merged = merge_shard_results(parts)
+
+        assert merged == {"items": [1, 2, 3, 4], "meta": {"counts": {"items": {"total": 4, "remaining": 0}}}}
+        assert parts[0]["items"] == [1, 2]
+
+    def test_events_body_window_spans_every_shard(self):
+        parts = [
+            {"message": None, "pageStartAt": "2024-01-03T00:00:00Z", "pageEndAt": "2024-01-05T00:00:00Z", "events": [3]},
+            {"message": None, "pageStartAt": "2024-01-01T00:00:00Z", "pageEndAt": "2024-01-03T00:00:00Z", "events": [1]},
+        ]
+
+        merged = merge_shard_results(parts)
+
+        assert merged["pageStartAt"] == "2024-01-01T00:00:00Z"
+        assert merged["pageEndAt"] == "2024-01-05T00:00:00Z"
+        assert merged["events"] == [3, 1]
+
+    def test_items_on_a_boundary_returned_once(self):
+        boundary = {"ts": "2024-01-02T00:00:00Z", "id": 2}
+        parts = [[{"ts": "a", "id": 1}, boundary], [dict(boundary), {"ts": "b", "id": 3}]]
+
+        assert [item["id"] for item in merge_shard_results(parts)] == [1, 2, 3]
+
+    def test_only_leading_repeats_dropped(self):
+        joiner = ShardJoiner()
+        joiner.join([1, 2])
+        assert joiner.join([2, 3, 1]) == [3, 1]
+        assert joiner.join([]) == []
+        assert joiner.join([1, 4]) == [4]
+
+    def test_items_joined_one_at_a_time(self):
+        joiner = ShardJoiner()
+        kept = []
+        for shard in ([1, 2], [2, 3, 1], [], [1, 4]):
+            joiner.begin()
+            kept.append([item for item in shard if joiner.keep(item)])
+            joiner.end()
+
+        assert kept == [[1, 2], [3, 1], [], [4]]
+
+
+def _window_handler(calls, pages=2):
+    """Serve one item per request, named after the requested t0, with `pages` pages for every window."""
+    lock = threading.Lock()
+
+    def handler(request):
+        params = request.url.params
+        with lock:
+            calls.append(params["t0"])
+        page = int(params.get("startingAfter", 1))
+        headers = {}
+        if page < pages:
+            next_url = request.url.copy_set_param("startingAfter", str(page + 1))
+            headers["Link"] = f"<{next_url}>; rel=next"
+        return httpx.Response(200, json=[{"t0": params["t0"], "page": page}], headers=headers)
+
+    return handler
+
+
+def _expected(t0s, pages=2):
+    return [{"t0": t0, "page": page} for t0 in t0s for page in range(1, pages + 1)]
+
+
+SHARD_T0S = [T0, "2024-01-02T00:00:00Z", "2024-01-03T00:00:00Z", "2024-01-04T00:00:00Z"]
+
+
+class TestSyncShardedPagination:
+    def _session(self, handler, **overrides):
+        session = make_sync_session(**{"pagination_time_shards": 4, **overrides})
+        session._client = httpx.Client(transport=httpx.MockTransport(handler))
+        return session
+
+    def test_legacy_merges_in_time_order(self):
+        calls = []
+        session = self._session(_window_handler(calls))
+
+        results = session.get_pages(_metadata(), f"{BASE}/organizations/1/apiRequests", {"t0": T0, "t1": T1}, "all")
+
+        assert results == _expected(SHARD_T0S)
+        assert len(calls) == 8
+
+    def test_iterator_newest_first_endpoint_newest_window_first(self):
+        handler = _window_handler([])
+
+        def prev_handler(request):
+            response = handler(request)
+            link = response.headers.get("Link")
+            if link:
+                response.headers["Link"] = link.replace("rel=next", "rel=prev")
+            return response
+
+        session = self._session(prev_handler, use_iterator_for_get_pages=True)
+        params = {"t0": T0, "t1": T1}
+
+        metadata = _metadata("getOrganizationConfigurationChanges")
+        results = list(session.get_pages(metadata, f"{BASE}/organizations/1/configurationChanges", params, -1, "prev"))
+
+        assert results == _expected(SHARD_T0S[::-1])
+
+    def test_iterator_early_exit_stops_running_shards(self):
+        calls = []
+        handler = _window_handler(calls)
+        release = threading.Event()
+
+        def slow_handler(request):
+            response = handler(request)
+            # Hold the later shards' first pages until the consumer has left
+            if "startingAfter" not in request.url.params and request.url.params["t0"] != T0:
+                release.wait(5)
+            return response
+
+        session = self._session(slow_handler, use_iterator_for_get_pages=True)
+        iterator = session.get_pages(_metadata(), f"{BASE}/organizations/1/apiRequests", {"t0": T0, "t1": T1}, "all")
+
+        assert next(iterator) == {"t0": T0, "page": 1}
+        while len(calls) < 5:
+            time.sleep(0.01)
+        iterator.close()
+        release.set()
+        time.sleep(0.2)
+
+        # The three held shards stop after their first page instead of fetching the second
+        assert sorted(calls).count(T0) == 2
+        assert len(calls) == 5
+
+    @patch("meraki.session.sync.SHARD_BUFFER_ITEMS", 1)
+    def test_iterator_shards_wait_for_consumer(self):
+        calls = []
+        session = self._session(_window_handler(calls, pages=5), use_iterator_for_get_pages=True)
+        iterator = session.get_pages(_metadata(), f"{BASE}/organizations/1/apiRequests", {"t0": T0, "t1": T1}, "all")
+
+        assert next(iterator) == {"t0": T0, "page": 1}
+        time.sleep(0.3)
+
+        # Every shard stops paging once its one-item queue is full, instead of pulling all 5 pages
+        assert len(calls) <= 3 + 3 * 2
+        assert [next(iterator)] + list(iterator) == _expected(SHARD_T0S, pages=5)[1:]
+        assert len(calls) == 20
+
+    def test_limited_total_pages_not_sharded(self):
+        calls = []
+        session = self._session(_window_handler(calls))
+
+        results = session.get_pages(_metadata(), f"{BASE}/organizations/1/apiRequests", {"t0": T0, "t1": T1}, 1)
+
+        assert results == [{"t0": T0, "page": 1}]
+        assert calls == [T0]
+
+    def test_disabled_by_default(self):
+        calls = []
+        session = self._session(_window_handler(calls), pagination_time_shards=1)
+
+        session.get_pages(_metadata(), f"{BASE}/organizations/1/apiRequests", {"t0": T0, "t1": T1}, "all")
+
+        assert calls == [T0, T0]
+
+    def test_shard_metadata_is_separate(self):
+        calls = []
+        session = self._session(_window_handler(calls))
+        metadata = _metadata()
+
+        session.get_pages(metadata, f"{BASE}/organizations/1/apiRequests", {"t0": T0, "t1": T1}, "all")
+
+        assert "shard" not in metadata
+
+
+class TestAsyncShardedPagination:
+    def _session(self, **overrides):
+        calls = []
+        sync_handler = _window_handler(calls)
+
+        async def handler(request):
+            return sync_handler(request)
+
+        session = make_async_session(**{"pagination_time_shards": 4, **overrides})
+        session._client = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+        return session, calls
+
+    async def test_legacy_merges_in_time_order(self):
+        session, calls = self._session()
+
+        results = await session.get_pages(_metadata(), f"{BASE}/organizations/1/apiRequests", {"t0": T0, "t1": T1}, "all")
+
+        assert results == _expected(SHARD_T0S)
+        assert len(calls) == 8
+        await session.close()
+
+    async def test_iterator_yields_in_time_order(self):
+        session, _ = self._session(use_iterator_for_get_pages=True)
+
+        results = [
+            item
+            async for item in session.get_pages(
+                _metadata(), f"{BASE}/organizations/1/apiRequests", {"t0": T0, "t1": T1}, "all"
+            )
+        ]
+
+        assert results == _expected(SHARD_T0S)
+        await session.close()
+
+    @patch("meraki.session.async_.SHARD_BUFFER_ITEMS", 1)
+    async def test_iterator_shards_wait_for_consumer(self):
+        calls = []
+        sync_handler = _window_handler(calls, pages=5)
+
+        async def handler(request):
+            return sync_handler(request)
+
+        session = make_async_session(pagination_time_shards=4, use_iterator_for_get_pages=True)
+        session._client = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+        iterator = session.get_pages(_metadata(), f"{BASE}/organizations/1/apiRequests", {"t0": T0, "t1": T1}, "all")
+
+        assert await iterator.__anext__() == {"t0": T0, "page": 1}
+        await asyncio.sleep(0.1)
+
+        assert len(calls) <= 4 + 3 * 3
+        assert [item async for item in iterator] == _expected(SHARD_T0S, pages=5)[1:]
+        assert len(calls) == 20
+        await session.close()
+
+    async def test_iterator_early_exit_cancels_shards(self):
+        session, _ = self._session(use_iterator_for_get_pages=True)
+
+        iterator = session.get_pages(_metadata(), f"{BASE}/organizations/1/apiRequests", {"t0": T0, "t1": T1}, "all")
+        first = await iterator.__anext__()
+        await iterator.aclose()
+
+        assert first == {"t0": T0, "page": 1}
+        await session.close()
@@ -0,0 +1,188 @@
+"""Tests for token buckets shared across processes through a state directory."""
+
+import multiprocessing
+import os
+import threading
+import time
+from unittest.mock import patch
+
+import pytest
+
+import meraki
+from meraki.shared_bucket import _MAX_PAUSE, _STATE, AsyncSharedTokenBucket, SharedTokenBucket
+from meraki.smart_flow import AsyncOrgRateLimiter, OrgRateLimiter
+
+API_KEY = "test_key_1234567890123456789012345678901234567890"
+
+
+def _reserve_in_child(directory, count):
+    bucket = SharedTokenBucket(directory, "org-1", rate=0.5, capacity=15)
+    for _ in range(count):
+        bucket.reserve()
+    bucket.close()
+
+
+class TestSharedTokenBucket:
+    def test_instances_share_tokens(self, tmp_path):
+        a = SharedTokenBucket(str(tmp_path), "org-1", rate=1.0, capacity=2)
+        b = SharedTokenBucket(str(tmp_path), "org-1", rate=1.0, capacity=2)
+
+        assert a.reserve() == 0.0
+        assert b.reserve() == 0.0
+        assert a.reserve() == pytest.approx(1.0, abs=0.05)
+        assert b.reserve() == pytest.approx(2.0, abs=0.05)
+
+    def test_buckets_with_different_names_are_separate(self, tmp_path):
+        a = SharedTokenBucket(str(tmp_path), "org-1", rate=1.0, capacity=1)
+        b = SharedTokenBucket(str(tmp_path), "org-2", rate=1.0, capacity=1)
+
+        assert a.reserve() == 0.0
+        assert b.reserve() == 0.0
+
+    def test_rate_shared_and_floored(self, tmp_path):
+        a = SharedTokenBucket(str(tmp_path), "global", rate=10.0, capacity=10)
+        b = SharedTokenBucket(str(tmp_path), "global", rate=10.0, capacity=10)
+
+        a.rate = 7.0
+        assert b.rate == 7.0
+        b.rate = 0.1
+        # a sees the change at its next reservation, or once its last look is _RATE_TTL old
+        a.reserve()
+        assert a.rate == 0.5
+
+    def test_rate_read_without_rewriting_file(self, tmp_path):
+        a = SharedTokenBucket(str(tmp_path), "global", rate=10.0, capacity=10)
+        b = SharedTokenBucket(str(tmp_path), "global", rate=10.0, capacity=10)
+        a.reserve()
+        b.rate = 4.0
+
+        with patch("meraki.shared_bucket.os.open", wraps=os.open) as opened:
+            assert a.rate == 10.0
+        opened.assert_not_called()
+
+        with patch("meraki.shared_bucket._RATE_TTL", 0.0), patch("meraki.shared_bucket.os.write") as write:
+            assert a.rate == 4.0
+        write.assert_not_called()
+
+    def test_rate_change_keeps_tokens_earned_at_old_rate(self, tmp_path):
+        bucket = SharedTokenBucket(str(tmp_path), "org-1", rate=10.0, capacity=10)
+        now = time.time()
+        # Empty one second ago: 10 tokens earned at 10/s since
+        bucket.path.write_bytes(_STATE.pack(0.0, now - 1.0, 10.0))
+
+        with patch("meraki.shared_bucket.time.time", return_value=now):
+            bucket.rate = 1.0
+            waits = [bucket.reserve() for _ in range(11)]
+
+        assert waits[:10] == [0.0] * 10
+        assert waits[10] == pytest.approx(1.0)
+
+    def test_held_token_refunded_when_wait_exceeds_limit(self, tmp_path):
+        held = SharedTokenBucket(str(tmp_path), "org-1", rate=0.5, capacity=1)
+        held.reserve()
+        bucket = SharedTokenBucket(str(tmp_path), "global", rate=20.0, capacity=1)
+        bucket.reserve()
+
+        assert bucket.acquire(None, held, 0.01) is True
+        assert held.reserve() == 0.0
+        assert bucket.acquire(None, held, 1.0) is False
+        assert held.reserve() > 1.0
+
+    def test_refill_capped_at_capacity(self, tmp_path):
+        bucket = SharedTokenBucket(str(tmp_path), "org-1", rate=1000.0, capacity=3)
+        bucket.reserve()
+
+        with patch("meraki.shared_bucket.time.time", side_effect=lambda: 1e12):
+            waits = [bucket.reserve() for _ in range(4)]
+
+        assert waits[:3] == [0.0, 0.0, 0.0]
+        assert waits[3] > 0.0
+
+    def test_pause_applies_to_every_instance(self, tmp_path):
+        a = SharedTokenBucket(str(tmp_path), "org-1", rate=10.0, capacity=10)
+        b = SharedTokenBucket(str(tmp_path), "org-1", rate=10.0, capacity=10)
+
+        a.pause(2.0)
+
+        assert b.reserve() == pytest.approx(2.1, abs=0.05)
+        assert a.reserve() == pytest.approx(2.2, abs=0.05)
+
+    def test_refill_time_far_ahead_is_capped(self, tmp_path):
+        bucket = SharedTokenBucket(str(tmp_path), "org-1", rate=10.0, capacity=10)
+        # Left by a host whose clock was 20 days ahead
+        bucket.path.write_bytes(_STATE.pack(10.0, time.time() + 1_728_000, 10.0))
+
+        assert bucket.reserve() <= _MAX_PAUSE + 1.0
+
+    def test_no_descriptor_held_between_reservations(self, tmp_path):
+        bucket = SharedTokenBucket(str(tmp_path), "org-1", rate=10.0, capacity=10)
+        with patch("meraki.shared_bucket.os.close", wraps=os.close) as close:
+            bucket.reserve()
+        close.assert_called_once()
+
+    def test_unsafe_names_sanitized(self, tmp_path):
+        bucket = SharedTokenBucket(str(tmp_path), "org-../../x", rate=1.0, capacity=1)
+        assert bucket.path.parent == tmp_path
+
+    def test_threads_reserve_every_token_once(self, tmp_path):
+        bucket = SharedTokenBucket(str(tmp_path), "org-1", rate=0.5, capacity=40)
+        threads = [threading.Thread(target=lambda: [bucket.reserve() for _ in range(10)]) for _ in range(4)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        # 40 tokens spent, so the next caller waits for one token at 0.5 tokens/s
+        assert bucket.reserve() == pytest.approx(2.0, abs=0.1)
+
+    def test_processes_reserve_every_token_once(self, tmp_path):
+        processes = [multiprocessing.Process(target=_reserve_in_child, args=(str(tmp_path), 5)) for _ in range(3)]
+        for process in processes:
+            process.start()
+        for process in processes:
+            process.join(timeout=30)
+            assert process.exitcode == 0
+
+        bucket = SharedTokenBucket(str(tmp_path), "org-1", rate=0.5, capacity=15)
+        assert bucket.reserve() == pytest.approx(2.0, abs=0.1)
+
+    async def test_async_bucket_waits_for_deficit(self, tmp_path):
+        bucket = AsyncSharedTokenBucket(str(tmp_path), "org-1", rate=20.0, capacity=1)
+        await bucket.acquire()
+        await bucket.acquire()
+
+        assert bucket.reserve() == pytest.approx(0.05, abs=0.02)
+
+
+class TestSharedLimiters:
+    def test_limiters_share_org_and_global_budgets(self, tmp_path):
+        first = OrgRateLimiter(rate=5.0, capacity=5, shared_dir=str(tmp_path))
+        second = OrgRateLimiter(rate=5.0, capacity=5, shared_dir=str(tmp_path))
+        url = "https://api.meraki.com/api/v1/organizations/1/networks"
+
+        first.acquire(url)
+        second.acquire(url)
+        first.on_rate_limited(url)
+        second.acquire(url)
+
+        assert isinstance(second._global_bucket, SharedTokenBucket)
+        assert second._get_or_create_bucket("1").rate == pytest.approx(3.5)
+
+    def test_per_process_buckets_by_default(self):
+        limiter = OrgRateLimiter()
+        assert not isinstance(limiter._global_bucket, SharedTokenBucket)
+
+    async def test_async_limiter_uses_shared_buckets(self, tmp_path):
+        limiter = AsyncOrgRateLimiter(rate=5.0, capacity=5, shared_dir=str(tmp_path))
+        await limiter.acquire("https://api.meraki.com/api/v1/organizations/1/networks")
+
+        assert isinstance(limiter._org_buckets["1"], AsyncSharedTokenBucket)
+        assert (tmp_path / "org-1.bucket").exists()
+
+    @patch("meraki.session.base.check_python_version")
+    def test_dashboard_parameter_reaches_limiter(self, mock_check, tmp_path):
+        dashboard = meraki.DashboardAPI(
+            API_KEY, suppress_logging=True, smart_flow_cache_path="", smart_flow_shared_dir=str(tmp_path)
+        )
+
+        assert isinstance(dashboard._session._smart_flow._global_bucket, SharedTokenBucket)
@@ -2,8 +2,9 @@
 
 import asyncio
 import json
+import threading
 import time
-from unittest.mock import MagicMock, patch
+from unittest.mock import AsyncMock, MagicMock, patch
 
 import pytest
 
@@ -12,7 +13,12 @@ from meraki.smart_flow import (
     AsyncTokenBucket,
     OrgRateLimiter,
     TokenBucket,
+    _calibrated_ceiling,
+    _decayed_rate,
+    _others_rate,
     _parse_saved_at,
+    _route,
+    _route_path,
 )
 
 
@@ -68,8 +74,89 @@ class TestTokenBucket:
         elapsed = time.monotonic() - start
         assert elapsed < 0.05
 
+    def test_held_token_refunded_after_hold_limit(self):
+        held = TokenBucket(rate=1.0, capacity=1)
+        held.acquire()
+        bucket = TokenBucket(rate=5.0, capacity=1)
+        bucket.acquire()
+
+        assert bucket.acquire(None, held, 0.05) is True
+        assert held._tokens == pytest.approx(1.0)
+
+    def test_held_token_kept_for_short_wait(self):
+        held = TokenBucket(rate=1.0, capacity=1)
+        held.acquire()
+        bucket = TokenBucket(rate=100.0, capacity=1)
+        bucket.acquire()
+
+        assert bucket.acquire(None, held, 1.0) is False
+        assert held._tokens < 0.5
+
+
+class TestBucketPause:
+    def test_pause_holds_tokens_until_deadline(self):
+        bucket = TokenBucket(rate=20.0, capacity=10)
+        bucket.pause(0.2)
+        start = time.monotonic()
+        bucket.acquire()
+        assert time.monotonic() - start >= 0.2
+
+    def test_waiters_released_at_rate_after_pause(self):
+        bucket = TokenBucket(rate=20.0, capacity=10)
+        bucket.pause(0.1)
+        done = []
+
+        def worker():
+            bucket.acquire()
+            done.append(time.monotonic())
+
+        start = time.monotonic()
+        threads = [threading.Thread(target=worker) for _ in range(4)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join(timeout=5)
+
+        assert min(done) - start >= 0.1
+        # No burst at the deadline: the bucket refills from empty
+        assert max(done) - min(done) >= 3 * 0.05 * 0.9
+
+    def test_pause_does_not_shorten_longer_pause(self):
+        bucket = TokenBucket(rate=10.0, capacity=10)
+        bucket.pause(5.0)
+        deadline = bucket._last
+        bucket.pause(0.1)
+        assert bucket._last == deadline
+
+    async def test_async_pause_holds_waiters(self):
+        bucket = AsyncTokenBucket(rate=20.0, capacity=10)
+        await bucket.acquire()
+        loop = asyncio.get_event_loop()
+        start = loop.time()
+        bucket.pause(0.2)
+        await asyncio.gather(bucket.acquire(), bucket.acquire())
+        assert loop.time() - start >= 0.2 + 0.05 * 0.9
+
 
 class TestAsyncTokenBucket:
+    async def test_held_token_refunded_after_hold_limit(self):
+        held = AsyncTokenBucket(rate=1.0, capacity=1)
+        await held.acquire()
+        bucket = AsyncTokenBucket(rate=5.0, capacity=1)
+        await bucket.acquire()
+
+        assert await bucket.acquire(None, held, 0.05) is True
+        assert held._tokens == pytest.approx(1.0)
+
+    async def test_held_token_kept_for_short_wait(self):
+        held = AsyncTokenBucket(rate=1.0, capacity=1)
+        await held.acquire()
+        bucket = AsyncTokenBucket(rate=100.0, capacity=1)
+        await bucket.acquire()
+
+        assert await bucket.acquire(None, held, 1.0) is False
+        assert held._tokens < 0.5
+
     @pytest.mark.asyncio
     async def test_acquire_within_capacity_does_not_block(self):
         bucket = AsyncTokenBucket(rate=10.0, capacity=10)
@@ -100,6 +187,92 @@ class TestAsyncTokenBucket:
         bucket.rate = 7.0
         assert bucket.rate == 7.0
 
+    async def test_one_timer_for_all_waiters(self):
+        bucket = AsyncTokenBucket(rate=100.0, capacity=1)
+        await bucket.acquire()
+        loop = asyncio.get_running_loop()
+
+        with patch.object(loop, "call_at", wraps=loop.call_at) as call_at:
+            waiters = [asyncio.ensure_future(bucket.acquire()) for _ in range(50)]
+            await asyncio.sleep(0)
+            assert call_at.call_count == 1
+            await asyncio.gather(*waiters)
+
+        # Re-armed once per release, never once per waiter
+        assert call_at.call_count <= 50
+        assert bucket._timer is None
+        assert bucket._waiting == 0
+
+    async def test_released_in_queue_order(self):
+        bucket = AsyncTokenBucket(rate=200.0, capacity=1)
+        await bucket.acquire()
+        served = []
+
+        async def worker(i):
+            await bucket.acquire()
+            served.append(i)
+
+        await asyncio.gather(*(worker(i) for i in range(10)))
+        assert served == list(range(10))
+
+    async def test_granted_token_returned_on_cancel(self):
+        bucket = AsyncTokenBucket(rate=20.0, capacity=1)
+        await bucket.acquire()
+        first = asyncio.ensure_future(bucket.acquire())
+        second = asyncio.ensure_future(bucket.acquire())
+        await asyncio.sleep(0)
+
+        # The first waiter's token is granted, but it is cancelled before it resumes
+        loop = asyncio.get_running_loop()
+        bucket._timer.cancel()
+        bucket._tokens = 1.0
+        bucket._release(loop)
+        first.cancel()
+        start = loop.time()
+        with pytest.raises(asyncio.CancelledError):
+            await first
+        await second
+
+        # The second waiter took the returned token instead of waiting for the next one
+        assert loop.time() - start < 0.04
+
+    async def test_cancelled_waiters_skipped_and_compacted(self):
+        bucket = AsyncTokenBucket(rate=1.0, capacity=1)
+        await bucket.acquire()
+        waiters = [asyncio.ensure_future(bucket.acquire()) for _ in range(400)]
+        await asyncio.sleep(0)
+
+        for waiter in waiters[:-1]:
+            waiter.cancel()
+        await asyncio.gather(*waiters[:-1], return_exceptions=True)
+
+        assert bucket._waiting == 1
+        assert len(bucket._queue.heap) < 100
+        bucket.rate = 1000.0
+        await waiters[-1]
+        assert bucket._queue.heap == []
+
+    async def test_rate_change_reschedules_timer(self):
+        bucket = AsyncTokenBucket(rate=0.5, capacity=1)
+        await bucket.acquire()
+        waiter = asyncio.ensure_future(bucket.acquire())
+        await asyncio.sleep(0)
+
+        bucket.rate = 100.0
+        await asyncio.wait_for(waiter, 0.5)
+
+    async def test_pause_reschedules_timer(self):
+        bucket = AsyncTokenBucket(rate=100.0, capacity=1)
+        await bucket.acquire()
+        loop = asyncio.get_running_loop()
+        waiter = asyncio.ensure_future(bucket.acquire())
+        await asyncio.sleep(0)
+
+        start = loop.time()
+        bucket.pause(0.1)
+        await waiter
+        assert loop.time() - start >= 0.1
+
 
 class TestOrgResolveOrg:
     def test_resolves_org_from_url(self):
@@ -125,6 +298,49 @@ class TestOrgResolveOrg:
         assert limiter.resolve_org("/admin/something") is None
 
 
+class TestRoute:
+    def test_scope_ids_from_one_pass(self):
+        route = _route("https://api.meraki.com/api/v1/organizations/123/devices/Q2AB-CDE4-FGHI/uplinks")
+        assert (route.org, route.network, route.serial) == ("123", None, "Q2AB-CDE4-FGHI")
+
+    def test_query_string_ignored(self):
+        route = _route("/networks/N_1?timespan=3600&perPage=1000")
+        assert route.network == "N_1"
+        assert _route("/networks/N_1/clients?perPage=5") is _route("/networks/N_1/clients?perPage=10")
+
+    def test_first_id_after_each_segment_wins(self):
+        route = _route("/networks/N_1/appliance/networks/N_2")
+        assert route.network == "N_1"
+
+    def test_collection_without_id(self):
+        assert _route("/organizations").org is None
+        assert _route("/organizations/123/networks").network is None
+
+    @pytest.mark.parametrize(
+        "url, network_list",
+        [
+            ("/organizations/123/networks", True),
+            ("/organizations/123/networks/?perPage=1000", True),
+            ("/organizations/123/networks/N_1", False),
+            ("/networks/N_1/networks", False),
+        ],
+    )
+    def test_network_list(self, url, network_list):
+        assert _route(url).network_list is network_list
+
+    def test_parsed_once_per_path(self):
+        _route_path.cache_clear()
+        limiter = OrgRateLimiter()
+        url = "/organizations/123/networks?perPage=1000"
+
+        limiter.acquire(url)
+        limiter.on_success(url)
+        limiter.learn_from_response(url, [{"id": "N_1"}])
+
+        assert _route_path.cache_info().misses == 1
+        assert limiter.resolve_org("/networks/N_1") == "123"
+
+
 class TestOrgAIMD:
     def test_on_rate_limited_decreases_rate(self):
         limiter = OrgRateLimiter(rate=10.0)
@@ -181,6 +397,211 @@ class TestOrgAIMD:
         assert limiter._global_bucket.rate == 100.0
 
 
+class TestOrgRetryAfter:
+    def test_retry_after_pauses_org_bucket(self):
+        limiter = OrgRateLimiter(rate=10.0)
+        limiter.acquire("/organizations/org_1/networks")
+        with patch.object(TokenBucket, "pause") as pause:
+            limiter.on_rate_limited("/organizations/org_1/networks", 2.0)
+        pause.assert_called_once_with(2.0)
+        assert limiter._org_buckets["org_1"].rate == pytest.approx(7.0)
+
+    def test_retry_after_does_not_pause_global_bucket(self):
+        limiter = OrgRateLimiter()
+        limiter.on_rate_limited("/organizations", 2.0)
+        assert limiter._global_bucket._last <= time.monotonic()
+
+    def test_no_pause_without_retry_after(self):
+        limiter = OrgRateLimiter()
+        limiter.acquire("/organizations/org_1/networks")
+        with patch.object(TokenBucket, "pause") as pause:
+            limiter.on_rate_limited("/organizations/org_1/networks")
+        pause.assert_not_called()
+
+    async def test_async_retry_after_pauses_org_bucket(self):
+        limiter = AsyncOrgRateLimiter(rate=10.0)
+        await limiter.acquire("/organizations/org_1/networks")
+        limiter.on_rate_limited("/organizations/org_1/networks", 2.0)
+        assert limiter._org_buckets["org_1"]._last > asyncio.get_event_loop().time() + 1.5
+
+
+class TestLearnedRates:
+    def test_decay_halves_gap_per_half_life(self):
+        assert _decayed_rate((4.0, 1000.0), 9.0, 3600.0, 1000.0) == pytest.approx(4.0)
+        assert _decayed_rate((4.0, 1000.0), 9.0, 3600.0, 4600.0) == pytest.approx(6.5)
+        assert _decayed_rate((4.0, 1000.0), 9.0, 3600.0, 1000.0 + 3600 * 20) == pytest.approx(9.0, abs=0.001)
+
+    @pytest.mark.parametrize(
+        "stored, half_life", [(None, 3600.0), ((4.0, 1000.0), None), ((4.0, 1000.0), 0), ((12.0, 1000.0), 3600.0)]
+    )
+    def test_configured_rate_without_learned_limit(self, stored, half_life):
+        assert _decayed_rate(stored, 9.0, half_life, 1000.0) == 9.0
+
+    def test_next_limiter_starts_at_learned_rate(self, tmp_path):
+        path = str(tmp_path / "cache.sqlite3")
+        limiter = OrgRateLimiter(rate=10.0, cache_path=path)
+        limiter.acquire("/organizations/org_1/networks")
+        limiter.on_rate_limited("/organizations/org_1/networks")
+        limiter.on_rate_limited("/organizations/org_1/networks")
+        limiter.on_success("/organizations/org_1/networks")
+        limiter.close()
+
+        reopened = OrgRateLimiter(rate=10.0, cache_path=path)
+        reopened.acquire("/organizations/org_1/networks")
+        reopened.acquire("/organizations/org_2/networks")
+
+        # The rate after the last 429, with a matching burst; the increase after it only probed
+        assert reopened._org_buckets["org_1"].rate == pytest.approx(4.9, abs=0.01)
+        assert reopened._org_buckets["org_1"]._capacity == 4
+        assert reopened._org_buckets["org_2"].rate == 10.0
+        assert reopened._org_buckets["org_2"]._capacity == 10
+
+    def test_old_learned_rate_decays(self, tmp_path):
+        path = str(tmp_path / "cache.sqlite3")
+        limiter = OrgRateLimiter(rate=10.0, cache_path=path, rate_half_life=3600.0)
+        limiter._store.put_rate("org_1", 4.0, updated_at=time.time() - 3600.0)
+
+        assert limiter._get_or_create_bucket("org_1").rate == pytest.approx(7.0, abs=0.01)
+
+    def test_learned_rates_ignored_without_half_life(self, tmp_path):
+        path = str(tmp_path / "cache.sqlite3")
+        limiter = OrgRateLimiter(rate=10.0, cache_path=path, rate_half_life=None)
+        limiter._store.put_rate("org_1", 4.0)
+        limiter.acquire("/organizations/org_1/networks")
+        limiter.on_rate_limited("/organizations/org_1/networks")
+
+        assert limiter._store.get_rate("org_1") == (4.0, pytest.approx(time.time(), abs=5))
+        assert limiter._org_buckets["org_1"].rate == pytest.approx(7.0)
+
+    async def test_async_limiter_saves_and_restores_rate(self, tmp_path):
+        path = str(tmp_path / "cache.sqlite3")
+        limiter = AsyncOrgRateLimiter(rate=10.0, cache_path=path)
+        await limiter.acquire("/organizations/org_1/networks")
+        limiter.on_rate_limited("/organizations/org_1/networks")
+        await limiter.shutdown()
+
+        reopened = AsyncOrgRateLimiter(rate=10.0, cache_path=path)
+        await reopened.acquire("/organizations/org_1/networks")
+        assert reopened._org_buckets["org_1"].rate == pytest.approx(7.0, abs=0.01)
+
+
+def _usage_interval(start, counts):
+    return {
+        "startTs": time.strftime("%Y-%m-%dT%H:%M:%SZ", time.gmtime(start)),
+        "endTs": time.strftime("%Y-%m-%dT%H:%M:%SZ", time.gmtime(start + 120)),
+        "counts": [{"code": code, "count": count} for code, count in counts.items()],
+    }
+
+
+class TestCalibration:
+    def test_others_rate_is_peak_without_our_requests(self):
+        now = 1_800_000_000.0
+        intervals = [
+            _usage_interval(now - 360, {200: 240}),
+            _usage_interval(now - 240, {200: 600, 429: 120}),
+            # Still running: skipped
+            _usage_interval(now - 60, {200: 2000}),
+        ]
+        # 240 of the busiest interval's requests were ours
+        sent = {int((now - 240) // 10): 240}
+
+        assert _others_rate(intervals, sent, now) == pytest.approx((720 - 240) / 120)
+
+    @pytest.mark.parametrize("body", [None, {}, [], [{"startTs": "bad", "endTs": "bad", "counts": []}]])
+    def test_others_rate_none_without_complete_interval(self, body):
+        assert _others_rate(body, {}, time.time()) is None
+
+    def test_others_rate_reads_fractional_timestamps(self):
+        interval = {
+            "startTs": "2026-01-01T00:00:00.000Z",
+            "endTs": "2026-01-01T00:02:00.000Z",
+            "counts": [{"code": 200, "count": 60}],
+        }
+        assert _others_rate([interval], {}, time.time()) == pytest.approx(0.5)
+
+    def test_ceiling_is_what_others_leave_of_org_rate(self):
+        assert _calibrated_ceiling(9.0, 0.0) == 9.0
+        assert _calibrated_ceiling(9.0, 6.0) == 3.0
+        assert _calibrated_ceiling(9.0, 12.0) == 1.0
+        # An org with a raised limit, configured through smart_flow_org_rate
+        assert _calibrated_ceiling(50.0, 6.0) == 44.0
+
+    def test_calibrate_org_caps_bucket(self):
+        now = time.time()
+        limiter = OrgRateLimiter(rate=9.0, calibrate_interval=300)
+        limiter.set_sampler(lambda org_id, timespan: [_usage_interval(now - 300, {200: 720})])
+        limiter.acquire("/organizations/org_1/networks")
+
+        assert limiter.calibrate_org("org_1") == pytest.approx(3.0)
+        assert limiter._org_buckets["org_1"].rate == pytest.approx(3.0)
+        limiter.on_success("/organizations/org_1/networks")
+        assert limiter._org_buckets["org_1"].rate == pytest.approx(3.0)
+        limiter.close()
+
+    def test_set_ceiling_may_exceed_configured_rate(self):
+        limiter = OrgRateLimiter(rate=9.0)
+        limiter.set_org_ceiling("org_1", 9.5)
+        for _ in range(5):
+            limiter.on_success("/organizations/org_1/networks")
+        assert limiter._org_buckets["org_1"].rate == pytest.approx(9.5)
+
+    def test_failed_sample_keeps_ceiling(self):
+        logger = MagicMock()
+        limiter = OrgRateLimiter(rate=9.0, logger=logger)
+        limiter.set_sampler(MagicMock(side_effect=RuntimeError("boom")))
+
+        assert limiter.calibrate_org("org_1") is None
+        assert limiter._ceiling("org_1") == 9.0
+        assert any("calibration of org org_1 failed" in str(c) for c in logger.debug.call_args_list)
+
+    def test_thread_calibrates_new_orgs_until_closed(self):
+        sampled = []
+        limiter = OrgRateLimiter(rate=9.0, calibrate_interval=3600)
+        limiter.set_sampler(lambda org_id, timespan: sampled.append((org_id, timespan)))
+        limiter.acquire("/organizations/org_1/networks")
+        limiter.acquire("/organizations/org_2/networks")
+
+        deadline = time.monotonic() + 5
+        while len(sampled) < 2 and time.monotonic() < deadline:
+            time.sleep(0.01)
+        assert sorted(sampled) == [("org_1", 600), ("org_2", 600)]
+        # Our requests are counted for the next sample
+        assert sum(limiter._usage["org_1"].values()) == 1
+
+        limiter.close()
+        limiter._calibration_thread.join(timeout=5)
+        assert not limiter._calibration_thread.is_alive()
+
+    def test_usage_not_counted_without_calibration(self):
+        limiter = OrgRateLimiter(rate=9.0)
+        limiter.set_sampler(MagicMock())
+        limiter.acquire("/organizations/org_1/networks")
+
+        assert limiter._usage is None
+        assert limiter._calibration_thread is None
+
+    async def test_async_task_calibrates_and_stops_on_shutdown(self):
+        now = time.time()
+        sampled = []
+
+        async def sampler(org_id, timespan):
+            sampled.append(org_id)
+            return [_usage_interval(now - 300, {200: 720})]
+
+        limiter = AsyncOrgRateLimiter(rate=9.0, calibrate_interval=3600)
+        limiter.set_sampler(sampler)
+        await limiter.acquire("/organizations/org_1/networks")
+        for _ in range(100):
+            if sampled:
+                break
+            await asyncio.sleep(0.01)
+
+        assert sampled == ["org_1"]
+        assert limiter._org_buckets["org_1"].rate == pytest.approx(3.0)
+        await limiter.shutdown()
+        assert limiter._calibration_task.done()
+
+
 class TestOrgAcquire:
     def test_acquire_with_org_url(self):
         limiter = OrgRateLimiter(rate=10.0, global_rate=100.0)
@@ -247,6 +668,43 @@ class TestOrgAcquire:
         limiter.acquire("/networks/N_dup/ssids")
         assert call_count == 0
 
+    def test_global_token_taken_after_org_token(self):
+        limiter = OrgRateLimiter(rate=10.0)
+        order = MagicMock()
+        order.global_bucket.acquire.return_value = False
+        limiter._global_bucket = order.global_bucket
+        limiter._org_buckets["org_1"] = order.org_bucket
+
+        limiter.acquire("/organizations/org_1/networks")
+
+        assert [name for name, _, _ in order.mock_calls] == ["org_bucket.acquire", "global_bucket.acquire"]
+
+    def test_saturated_org_does_not_hold_global_tokens(self):
+        limiter = OrgRateLimiter(rate=0.5, capacity=1, global_rate=100.0)
+        limiter.acquire("/organizations/org_hot/networks")
+        waiter = threading.Thread(target=limiter.acquire, args=("/organizations/org_hot/networks",), daemon=True)
+        waiter.start()
+        time.sleep(0.05)
+
+        # The second hot request waits ~2 s on its org without having spent a global token
+        assert waiter.is_alive()
+        assert limiter._global_bucket._tokens == pytest.approx(99.0, abs=0.5)
+
+    @patch("meraki.smart_flow._HELD_TOKEN_SECONDS", 0.05)
+    def test_org_token_refunded_during_long_global_wait(self):
+        limiter = OrgRateLimiter(rate=10.0, capacity=10, global_rate=100.0)
+        limiter._global_bucket.pause(0.3)
+        waiter = threading.Thread(target=limiter.acquire, args=("/organizations/org_1/networks",), daemon=True)
+        waiter.start()
+        time.sleep(0.15)
+
+        # Queued on the paused global bucket with its org token handed back; a new one is taken after
+        org_bucket = limiter._org_buckets["org_1"]
+        assert waiter.is_alive()
+        assert org_bucket._tokens == pytest.approx(10.0)
+        waiter.join(2)
+        assert org_bucket._tokens == pytest.approx(9.0, abs=0.3)
+
 
 class TestOrgResolverHydrator:
     def test_resolver_triggers_hydrator_once(self):
@@ -260,6 +718,7 @@ class TestOrgResolverHydrator:
         limiter.set_hydrator(mock_hydrator)
         limiter.acquire("/networks/N_1/ssids")
         limiter.acquire("/networks/N_2/ssids")
+        assert limiter.wait_for_hydration(timeout=5)
         assert hydrated == ["org_h1"]
 
     def test_hydrator_not_called_without_resolver_result(self):
@@ -274,6 +733,104 @@ class TestOrgResolverHydrator:
         limiter.acquire("/networks/N_nope/ssids")
         assert hydrated == []
 
+    def test_request_not_held_up_by_hydration(self):
+        release = threading.Event()
+
+        def slow_hydrator(org_id):
+            limiter.register_network("N_early", org_id)
+            release.wait(5)
+            limiter.register_network("N_late", org_id)
+
+        limiter = OrgRateLimiter(rate=10.0)
+        limiter.set_resolver(lambda id_type, ident: "org_h1")
+        limiter.set_hydrator(slow_hydrator)
+        limiter.acquire("/networks/N_1/ssids")
+
+        assert "org_h1" in limiter._org_buckets
+        assert not limiter.wait_for_hydration(timeout=0.05)
+        # Mappings registered so far are already in use
+        assert limiter.resolve_org("/networks/N_early/ssids") == "org_h1"
+        assert limiter.resolve_org("/networks/N_late/ssids") is None
+
+        release.set()
+        assert limiter.wait_for_hydration(timeout=5)
+        assert limiter.resolve_org("/networks/N_late/ssids") == "org_h1"
+
+    def test_orgs_hydrated_in_turn_and_failures_logged(self):
+        logger = MagicMock()
+        hydrated = []
+
+        def hydrator(org_id):
+            hydrated.append(org_id)
+            if org_id == "org_bad":
+                raise RuntimeError("boom")
+
+        limiter = OrgRateLimiter(rate=10.0, logger=logger)
+        limiter.set_resolver(lambda id_type, ident: "org_bad" if ident == "N_1" else "org_ok")
+        limiter.set_hydrator(hydrator)
+        limiter.acquire("/networks/N_1/ssids")
+        limiter.acquire("/networks/N_2/ssids")
+
+        assert limiter.wait_for_hydration(timeout=5)
+        assert sorted(hydrated) == ["org_bad", "org_ok"]
+        assert any("hydration of org org_bad failed" in str(c) for c in logger.debug.call_args_list)
+
+    def test_hydrate_orgs_runs_up_to_workers_at_once(self):
+        lock = threading.Lock()
+        running = []
+        peak = []
+
+        def hydrator(org_id):
+            with lock:
+                running.append(org_id)
+                peak.append(len(running))
+            time.sleep(0.05)
+            with lock:
+                running.remove(org_id)
+
+        limiter = OrgRateLimiter(rate=10.0, hydration_workers=3)
+        assert limiter.hydrate_orgs([f"org_{i}" for i in range(9)], hydrator) == 9
+
+        assert limiter.wait_for_hydration(timeout=5)
+        assert len(peak) == 9
+        assert max(peak) == 3
+        assert limiter._hydration_threads == 0
+
+    def test_hydrate_orgs_skips_hydrated_orgs(self):
+        hydrated = []
+        limiter = OrgRateLimiter(rate=10.0)
+        limiter.set_resolver(lambda id_type, ident: "org_1")
+        limiter.set_hydrator(hydrated.append)
+        limiter.acquire("/networks/N_1/ssids")
+
+        assert limiter.hydrate_orgs(["org_1", "org_2"]) == 1
+        assert limiter.wait_for_hydration(timeout=5)
+        assert sorted(hydrated) == ["org_1", "org_2"]
+        assert "org_2" in limiter._org_buckets
+
+    def test_hydrate_orgs_without_hydrator_is_noop(self):
+        limiter = OrgRateLimiter(rate=10.0)
+        assert limiter.hydrate_orgs(["org_1"]) == 0
+        assert "org_1" not in limiter._hydrated_orgs
+
+    def test_register_many_counts_changes(self):
+        limiter = OrgRateLimiter(rate=10.0)
+        assert limiter.register_networks(["N_1", "N_2"], "org_A") == 2
+        assert limiter.register_networks(["N_1", "N_2"], "org_A") == 0
+        assert limiter.register_devices(["Q_1"], "org_B") == 1
+        assert limiter.resolve_org("/networks/N_2/ssids") == "org_A"
+        assert limiter.resolve_org("/devices/Q_1/clients") == "org_B"
+
+    def test_close_drops_queued_hydrations(self):
+        limiter = OrgRateLimiter(rate=10.0)
+        limiter.set_hydrator(lambda org_id: None)
+        limiter._hydration_queue.extend([("org_1", None), ("org_2", None)])
+
+        limiter.close()
+
+        assert not limiter._hydration_queue
+        assert limiter.wait_for_hydration(timeout=0)
+
 
 class TestOrgMaybeFlush:
     def test_flush_at_threshold(self, tmp_path):
@@ -507,6 +1064,64 @@ class TestLearnFromResponse:
         )
         assert logger.debug.call_count >= 1
 
+    def test_learns_every_item_of_list_body(self):
+        limiter = OrgRateLimiter()
+        limiter.learn_from_response(
+            "/organizations/org_1/inventory/devices?perPage=1000",
+            [{"serial": f"Q2AB-0000-{i:04d}", "networkId": f"N_{i % 3}"} for i in range(10)],
+        )
+        assert len(limiter._serial_to_org) == 10
+        assert {n: limiter._network_to_org.get(n) for n in ("N_0", "N_1", "N_2")} == dict.fromkeys(
+            ("N_0", "N_1", "N_2"), "org_1"
+        )
+        assert limiter._dirty == 13
+
+    def test_learns_ids_of_network_list(self):
+        limiter = OrgRateLimiter()
+        limiter.learn_from_response(
+            "/organizations/org_1/networks?perPage=1000",
+            [{"id": "N_1", "organizationId": "org_1"}, {"id": "L_2", "organizationId": "org_1"}],
+        )
+        assert limiter._network_to_org.get("N_1") == "org_1"
+        assert limiter._network_to_org.get("L_2") == "org_1"
+
+    def test_item_ids_of_other_lists_not_taken_as_networks(self):
+        limiter = OrgRateLimiter()
+        limiter.learn_from_response("/organizations/org_1/admins", [{"id": "admin_1"}])
+        assert limiter._network_to_org.get("admin_1") is None
+
+    def test_learns_paginated_items_body(self):
+        limiter = OrgRateLimiter()
+        limiter.learn_from_response(
+            "/organizations/org_1/devices/availabilities/changeHistory",
+            {"items": [{"device": {"serial": "x"}, "network": {"id": "N_1"}}, {"serial": "QXYZ-0000-1111"}], "meta": {}},
+        )
+        assert limiter._network_to_org.get("N_1") == "org_1"
+        assert limiter._serial_to_org.get("QXYZ-0000-1111") == "org_1"
+
+    def test_org_taken_from_list_items(self):
+        limiter = OrgRateLimiter()
+        limiter.learn_from_response("/devices/statuses", [{"organizationId": "org_2", "serial": "QXYZ-0000-1111"}])
+        assert limiter._serial_to_org.get("QXYZ-0000-1111") == "org_2"
+
+    def test_org_taken_from_known_network_in_url(self):
+        limiter = OrgRateLimiter()
+        limiter.register_network("N_1", "org_1")
+        limiter.learn_from_response("/networks/N_1/devices", [{"serial": "QXYZ-0000-1111", "networkId": "N_1"}])
+        assert limiter._serial_to_org.get("QXYZ-0000-1111") == "org_1"
+
+    def test_list_learning_bounded_per_body(self):
+        limiter = OrgRateLimiter()
+        with patch("meraki.smart_flow._LEARN_MAX_ITEMS", 5):
+            limiter.learn_from_response("/organizations/org_1/devices", [{"serial": f"Q_{i}"} for i in range(20)])
+        assert len(limiter._serial_to_org) == 5
+
+    def test_non_string_ids_ignored(self):
+        limiter = OrgRateLimiter()
+        limiter.learn_from_response("/organizations/org_1/devices", [{"serial": None, "networkId": 5}, "Q_1", None])
+        assert not limiter._network_to_org
+        assert not limiter._serial_to_org
+
 
 class TestAsyncTokenBucketRateSetter:
     @pytest.mark.asyncio
@@ -544,6 +1159,33 @@ class TestAsyncOrgRateLimiter:
         await limiter.acquire("/organizations/org_1/networks")
         assert "org_1" in limiter._org_buckets
 
+    @pytest.mark.asyncio
+    async def test_global_token_taken_after_org_token(self):
+        limiter = AsyncOrgRateLimiter(rate=10.0)
+        order = MagicMock()
+        order.global_bucket.acquire = AsyncMock(return_value=False)
+        order.org_bucket.acquire = AsyncMock()
+        limiter._global_bucket = order.global_bucket
+        limiter._org_buckets["org_1"] = order.org_bucket
+
+        await limiter.acquire("/organizations/org_1/networks")
+
+        assert [name for name, _, _ in order.mock_calls] == ["org_bucket.acquire", "global_bucket.acquire"]
+
+    @patch("meraki.smart_flow._HELD_TOKEN_SECONDS", 0.05)
+    async def test_org_token_refunded_during_long_global_wait(self):
+        limiter = AsyncOrgRateLimiter(rate=10.0, capacity=10, global_rate=100.0)
+        limiter._global_bucket._tokens = 0.0
+        limiter._global_bucket.pause(0.3)
+        waiter = asyncio.ensure_future(limiter.acquire("/organizations/org_1/networks"))
+        await asyncio.sleep(0.15)
+
+        org_bucket = limiter._org_buckets["org_1"]
+        assert not waiter.done()
+        assert org_bucket._tokens == pytest.approx(10.0)
+        await waiter
+        assert org_bucket._tokens == pytest.approx(9.0, abs=0.3)
+
     @pytest.mark.asyncio
     async def test_acquire_unknown_triggers_background_resolve(self):
         resolved = []
@@ -630,6 +1272,39 @@ class TestAsyncOrgRateLimiter:
         await asyncio.sleep(0.05)
         assert hydrated == ["org_h"]
 
+    async def test_hydrate_orgs_runs_up_to_workers_at_once(self):
+        running = []
+        peak = []
+
+        async def hydrator(org_id):
+            running.append(org_id)
+            peak.append(len(running))
+            await asyncio.sleep(0.02)
+            running.remove(org_id)
+
+        limiter = AsyncOrgRateLimiter(rate=10.0, hydration_workers=3)
+        assert limiter.hydrate_orgs([f"org_{i}" for i in range(9)], hydrator) == 9
+        assert limiter.hydrate_orgs(["org_0"], hydrator) == 0
+
+        assert await limiter.wait_for_hydration(timeout=5)
+        assert len(peak) == 9
+        assert max(peak) == 3
+
+    async def test_shutdown_drops_queued_hydrations(self):
+        hydrated = []
+
+        async def hydrator(org_id):
+            await asyncio.sleep(0.01)
+            hydrated.append(org_id)
+
+        limiter = AsyncOrgRateLimiter(rate=10.0, hydration_workers=1)
+        limiter.hydrate_orgs(["org_1", "org_2", "org_3"], hydrator)
+        await asyncio.sleep(0)
+        await limiter.shutdown()
+
+        assert hydrated == ["org_1"]
+        assert await limiter.wait_for_hydration(timeout=0)
+
     @pytest.mark.asyncio
     async def test_resolve_exception_is_swallowed(self):
         async def bad_resolver(id_type, ident):
@@ -765,6 +1440,17 @@ class TestAsyncOrgRateLimiter:
         )
         assert logger.debug.call_count >= 1
 
+    @pytest.mark.asyncio
+    async def test_learn_from_list_body(self):
+        limiter = AsyncOrgRateLimiter()
+        limiter.learn_from_response(
+            "/organizations/org_1/networks",
+            {"items": [{"id": "N_1"}, {"id": "N_2", "serial": "QABC-0000-1111"}]},
+        )
+        assert limiter._network_to_org.get("N_2") == "org_1"
+        assert limiter._serial_to_org.get("QABC-0000-1111") == "org_1"
+        assert limiter._dirty == 3
+
     @pytest.mark.asyncio
     async def test_maybe_flush_at_threshold(self, tmp_path):
         cache_file = str(tmp_path / "cache.json")
@@ -0,0 +1,203 @@
+"""Tests for smart flow endpoint-class buckets."""
+
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+
+import meraki
+from meraki.exceptions import SessionInputError
+from meraki.smart_flow import AsyncOrgRateLimiter, OrgRateLimiter, parse_endpoint_classes
+from tests.unit.conftest import (
+    make_async_mock_response,
+    make_async_session,
+    make_metadata,
+    make_mock_response,
+    make_sync_session,
+)
+
+API_KEY = "test_key_1234567890123456789012345678901234567890"
+ORG_URL = "https://api.meraki.com/api/v1/organizations/org_A/actionBatches"
+NETWORK_URL = "https://api.meraki.com/api/v1/networks/N_1/devices"
+
+CLASSES = {
+    "action_batches": {"rate": 2, "operations": ["createOrganizationActionBatch"]},
+    "inventory": {"rate": 1, "capacity": 3, "operations": ["claim*", "release*"]},
+    "camera": {"rate": 0.5, "tags": ["camera"]},
+}
+
+
+class TestParseEndpointClasses:
+    def test_parsed_in_order_with_defaults(self):
+        classes = parse_endpoint_classes(CLASSES)
+
+        assert [c.name for c in classes] == ["action_batches", "inventory", "camera"]
+        assert (classes[0].rate, classes[0].capacity) == (2.0, 2)
+        assert classes[1].capacity == 3
+        assert classes[2].capacity == 1
+        assert classes[2].tags == frozenset({"camera"})
+
+    @pytest.mark.parametrize("spec", [None, {}])
+    def test_empty_spec_has_no_classes(self, spec):
+        assert parse_endpoint_classes(spec) == ()
+
+    @pytest.mark.parametrize(
+        "spec",
+        [
+            ["createOrganizationActionBatch"],
+            {"a": {"operations": ["x"]}},
+            {"a": {"rate": 0, "operations": ["x"]}},
+            {"a": {"rate": True, "operations": ["x"]}},
+            {"a": {"rate": 1, "capacity": 0, "operations": ["x"]}},
+            {"a": {"rate": 1}},
+            {"a": {"rate": 1, "operations": "createOrganizationActionBatch"}},
+            {"a": {"rate": 1, "operations": ["x"], "scope": "org"}},
+        ],
+    )
+    def test_invalid_spec_rejected(self, spec):
+        with pytest.raises(SessionInputError):
+            parse_endpoint_classes(spec)
+
+
+class TestClassify:
+    def test_by_operation_pattern_and_tag(self):
+        limiter = OrgRateLimiter(endpoint_classes=CLASSES)
+
+        assert limiter.endpoint_class("createOrganizationActionBatch", ["organizations"]) == "action_batches"
+        assert limiter.endpoint_class("claimIntoOrganizationInventory", ["organizations"]) == "inventory"
+        assert limiter.endpoint_class("generateDeviceCameraSnapshot", ["camera", "monitor"]) == "camera"
+        assert limiter.endpoint_class("getOrganizationNetworks", ["organizations"]) is None
+
+    def test_first_matching_class_wins(self):
+        limiter = OrgRateLimiter(
+            endpoint_classes={"a": {"rate": 1, "operations": ["release*"]}, "b": {"rate": 5, "tags": ["organizations"]}}
+        )
+        assert limiter.endpoint_class("releaseFromOrganizationInventory", ["organizations"]) == "a"
+        assert limiter.endpoint_class("getOrganization", ["organizations"]) == "b"
+
+    def test_no_classes_configured(self):
+        assert OrgRateLimiter().endpoint_class("createOrganizationActionBatch", ["organizations"]) is None
+
+
+class TestClassBuckets:
+    def test_class_token_taken_before_org_and_global(self):
+        limiter = OrgRateLimiter(endpoint_classes=CLASSES)
+        calls = MagicMock()
+        limiter._class_buckets[("action_batches", "org_A")] = calls.class_bucket
+        limiter._org_buckets["org_A"] = calls.org_bucket
+        limiter._global_bucket = calls.global_bucket
+        calls.global_bucket.acquire.return_value = False
+
+        limiter.acquire(ORG_URL, "batch", "action_batches")
+
+        assert [name for name, _, _ in calls.mock_calls] == [
+            "class_bucket.acquire",
+            "org_bucket.acquire",
+            "global_bucket.acquire",
+        ]
+
+    def test_bucket_per_org_and_one_for_unresolved(self):
+        limiter = OrgRateLimiter(endpoint_classes=CLASSES)
+
+        limiter.acquire(ORG_URL, None, "action_batches")
+        limiter.acquire(ORG_URL.replace("org_A", "org_B"), None, "action_batches")
+        limiter.acquire(NETWORK_URL, None, "action_batches")
+
+        assert set(limiter._class_buckets) == {
+            ("action_batches", "org_A"),
+            ("action_batches", "org_B"),
+            ("action_batches", None),
+        }
+        assert limiter._class_buckets[("action_batches", "org_A")].rate == 2.0
+
+    def test_unknown_class_ignored(self):
+        limiter = OrgRateLimiter(endpoint_classes=CLASSES)
+        limiter.acquire(ORG_URL, None, "reports")
+        assert limiter._class_buckets == {}
+
+    def test_429_slows_only_class_bucket(self):
+        limiter = OrgRateLimiter(endpoint_classes=CLASSES)
+        limiter.acquire(ORG_URL, None, "action_batches")
+        class_bucket = limiter._class_buckets[("action_batches", "org_A")]
+        org_rate = limiter._org_buckets["org_A"].rate
+
+        with patch.object(class_bucket, "pause") as pause, patch.object(limiter, "_save_rate") as save_rate:
+            limiter.on_rate_limited(ORG_URL, 2.0, "action_batches")
+
+        assert class_bucket.rate == pytest.approx(1.4)
+        pause.assert_called_once_with(2.0)
+        save_rate.assert_not_called()
+        assert limiter._org_buckets["org_A"].rate == org_rate
+
+    def test_429_after_org_resolved_slows_unresolved_class_bucket(self):
+        limiter = OrgRateLimiter(endpoint_classes=CLASSES)
+        limiter.acquire(NETWORK_URL, None, "action_batches")
+        limiter.register_network("N_1", "org_A")
+
+        limiter.on_rate_limited(NETWORK_URL, None, "action_batches")
+
+        assert limiter._class_buckets[("action_batches", None)].rate == pytest.approx(1.4)
+        assert limiter._global_bucket.rate == 100.0
+
+    def test_success_restores_class_rate(self):
+        limiter = OrgRateLimiter(endpoint_classes=CLASSES)
+        limiter.acquire(ORG_URL, None, "action_batches")
+        limiter.on_rate_limited(ORG_URL, None, "action_batches")
+
+        for _ in range(5):
+            limiter.on_success(ORG_URL, "action_batches")
+
+        assert limiter._class_buckets[("action_batches", "org_A")].rate == 2.0
+
+    async def test_async_class_bucket(self):
+        limiter = AsyncOrgRateLimiter(endpoint_classes=CLASSES)
+        await limiter.acquire(ORG_URL, None, "action_batches")
+        class_bucket = limiter._class_buckets[("action_batches", "org_A")]
+
+        with patch.object(class_bucket, "pause") as pause:
+            limiter.on_rate_limited(ORG_URL, 3.0, "action_batches")
+
+        assert class_bucket.rate == pytest.approx(1.4)
+        pause.assert_called_once_with(3.0)
+        assert limiter._org_buckets["org_A"].rate == 10.0
+        limiter.on_success(ORG_URL, "action_batches")
+        assert class_bucket.rate == pytest.approx(1.6)
+        await limiter.shutdown()
+
+
+class TestSessionEndpointClasses:
+    def test_session_sends_operation_class(self):
+        session = make_sync_session(smart_flow_enabled=True)
+        session._smart_flow.endpoint_class.return_value = "action_batches"
+        session._client.request = MagicMock(return_value=make_mock_response(201, json_data={"id": "B_1"}))
+
+        session.request(make_metadata("createOrganizationActionBatch"), "POST", "/organizations/org_A/actionBatches")
+
+        session._smart_flow.endpoint_class.assert_called_once_with("createOrganizationActionBatch", ["organizations"])
+        assert session._smart_flow.acquire.call_args.args[2] == "action_batches"
+        session._smart_flow.on_success.assert_called_once_with(ORG_URL, "action_batches", 0)
+
+    async def test_async_session_sends_operation_class(self):
+        session = make_async_session(smart_flow_enabled=True, smart_flow_endpoint_classes=CLASSES)
+        session._smart_flow.acquire = AsyncMock(wraps=session._smart_flow.acquire)
+        session._client.request = AsyncMock(return_value=make_async_mock_response(201, json_data={"id": "B_1"}))
+
+        await session.request(make_metadata("createOrganizationActionBatch"), "POST", "/organizations/org_A/actionBatches")
+
+        assert session._smart_flow.acquire.await_args.args[2] == "action_batches"
+        assert ("action_batches", "org_A") in session._smart_flow._class_buckets
+
+    @patch("meraki.session.base.check_python_version")
+    def test_invalid_classes_rejected(self, mock_check):
+        with pytest.raises(SessionInputError):
+            meraki.DashboardAPI(
+                API_KEY, suppress_logging=True, smart_flow_cache_path="", smart_flow_endpoint_classes={"a": {"rate": 1}}
+            )
+
+    @patch("meraki.session.base.check_python_version")
+    def test_dashboard_passes_classes_to_limiter(self, mock_check):
+        dashboard = meraki.DashboardAPI(
+            API_KEY, suppress_logging=True, smart_flow_cache_path="", smart_flow_endpoint_classes=CLASSES
+        )
+        limiter = dashboard._session._smart_flow
+        assert limiter.endpoint_class("releaseFromOrganizationInventory", ["organizations"]) == "inventory"
+        assert dashboard._session._parameters["smart_flow_endpoint_classes"] == ["action_batches", "camera", "inventory"]
@@ -0,0 +1,234 @@
+"""Tests for smart flow priority classes and weighted fair queuing."""
+
+import asyncio
+import threading
+import time
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import httpx
+import pytest
+
+import meraki
+from meraki.bulk import run_bulk
+from meraki.exceptions import SessionInputError
+from meraki.smart_flow import (
+    _HELD_TOKEN_SECONDS,
+    AsyncTokenBucket,
+    OrgRateLimiter,
+    TokenBucket,
+    _FairQueue,
+    priority,
+    request_priority,
+)
+from tests.unit.conftest import (
+    make_async_mock_response,
+    make_async_session,
+    make_metadata,
+    make_mock_response,
+    make_sync_session,
+)
+
+API_KEY = "test_key_1234567890123456789012345678901234567890"
+
+
+def _drain(queue):
+    order = []
+    while queue.heap:
+        order.append(queue.pop()[2])
+    return order
+
+
+class TestFairQueue:
+    def test_interactive_served_ahead_of_batch_backlog(self):
+        queue = _FairQueue()
+        for i in range(5):
+            queue.push("batch", f"batch-{i}")
+        queue.push("interactive", "interactive")
+
+        assert _drain(queue)[0] == "interactive"
+
+    def test_backlogged_flows_share_by_weight(self):
+        queue = _FairQueue()
+        for _ in range(8):
+            queue.push("normal", "normal")
+            queue.push("batch", "batch")
+
+        served = _drain(queue)[:10]
+        assert served.count("normal") == 8
+        assert served.count("batch") == 2
+
+    def test_numeric_weight_is_its_own_flow(self):
+        queue = _FairQueue()
+        queue.push(1.0, "a")
+        queue.push(1.0, "b")
+        queue.push(2.0, "c")
+        assert _drain(queue) == ["c", "a", "b"]
+
+    def test_idle_queue_starts_fresh(self):
+        queue = _FairQueue()
+        for _ in range(4):
+            queue.push("batch", "old")
+        _drain(queue)
+
+        queue.push("batch", "new")
+        assert queue.heap[0][0] == 4.0
+
+    def test_removed_waiter_not_served(self):
+        queue = _FairQueue()
+        queue.push("normal", "a")
+        entry = queue.push("normal", "b")
+        queue.push("normal", "c")
+
+        queue.remove(entry)
+
+        assert _drain(queue) == ["a", "c"]
+
+
+class TestPriorityContext:
+    def test_block_overrides_default(self):
+        assert request_priority("normal") == "normal"
+        with priority("batch"):
+            assert request_priority("normal") == "batch"
+            with priority(4):
+                assert request_priority("normal") == 4
+            assert request_priority("normal") == "batch"
+        assert request_priority("normal") == "normal"
+
+    @pytest.mark.parametrize("value", ["urgent", 0, -1.0, True])
+    def test_invalid_priority_rejected(self, value):
+        with pytest.raises(SessionInputError), priority(value):
+            pass
+
+    async def test_block_scoped_to_task(self):
+        async def inner():
+            return request_priority()
+
+        with priority("interactive"):
+            task = asyncio.ensure_future(inner())
+        assert await task == "interactive"
+        assert await asyncio.ensure_future(inner()) is None
+
+
+class TestBucketPriority:
+    def test_interactive_waiter_jumps_batch_queue(self):
+        bucket = TokenBucket(rate=20.0, capacity=1)
+        bucket.acquire()
+        served = []
+
+        def worker(name, value):
+            bucket.acquire(value)
+            served.append(name)
+
+        threads = [threading.Thread(target=worker, args=(f"batch-{i}", "batch")) for i in range(4)]
+        for thread in threads:
+            thread.start()
+        while len(bucket._queue.heap) < 4:
+            time.sleep(0.001)
+        threads.append(threading.Thread(target=worker, args=("interactive", "interactive")))
+        threads[-1].start()
+        for thread in threads:
+            thread.join(timeout=5)
+
+        # At most the batch waiter already sleeping at the head goes first
+        assert served.index("interactive") <= 1
+        assert len(served) == 5
+
+    async def test_async_interactive_waiter_jumps_batch_queue(self):
+        bucket = AsyncTokenBucket(rate=20.0, capacity=1)
+        await bucket.acquire()
+        served = []
+
+        async def worker(name, value):
+            await bucket.acquire(value)
+            served.append(name)
+
+        tasks = [asyncio.ensure_future(worker(f"batch-{i}", "batch")) for i in range(4)]
+        await asyncio.sleep(0)
+        tasks.append(asyncio.ensure_future(worker("interactive", "interactive")))
+        await asyncio.gather(*tasks)
+
+        assert served.index("interactive") <= 1
+
+    async def test_cancelled_waiter_leaves_queue(self):
+        bucket = AsyncTokenBucket(rate=1.0, capacity=1)
+        await bucket.acquire()
+        waiter = asyncio.ensure_future(bucket.acquire("batch"))
+        await asyncio.sleep(0)
+        assert len(bucket._queue.heap) == 1
+
+        waiter.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await waiter
+
+        assert bucket._queue.heap == []
+
+    def test_limiter_passes_priority_to_both_buckets(self):
+        limiter = OrgRateLimiter()
+        org_bucket = MagicMock()
+        limiter._org_buckets["org_A"] = org_bucket
+        limiter._global_bucket = MagicMock()
+        limiter._global_bucket.acquire.return_value = False
+
+        limiter.acquire("/organizations/org_A/networks", "interactive")
+
+        org_bucket.acquire.assert_called_once_with("interactive")
+        limiter._global_bucket.acquire.assert_called_once_with("interactive", org_bucket, _HELD_TOKEN_SECONDS)
+
+
+class TestSessionPriority:
+    def test_session_default_sent_to_limiter(self):
+        session = make_sync_session(smart_flow_enabled=True, smart_flow_priority="batch")
+        session._client.request = MagicMock(return_value=make_mock_response(200, json_data={"id": "N_1"}))
+
+        session.get(make_metadata("getNetwork"), "/networks/N_1")
+        with priority("interactive"):
+            session.get(make_metadata("getNetwork"), "/networks/N_1")
+
+        assert [c.args[1] for c in session._smart_flow.acquire.call_args_list] == ["batch", "interactive"]
+
+    async def test_async_block_sent_to_limiter(self):
+        session = make_async_session(smart_flow_enabled=True)
+        session._smart_flow = MagicMock()
+        session._smart_flow.acquire = AsyncMock()
+        session._client.request = AsyncMock(return_value=make_async_mock_response(200, json_data={"id": "N_1"}))
+
+        with priority(3):
+            await session.request(make_metadata("getNetwork"), "GET", "/networks/N_1")
+
+        assert session._smart_flow.acquire.await_args.args[1] == 3
+
+    def test_bulk_calls_keep_enclosing_priority(self):
+        session = make_sync_session(smart_flow_enabled=True)
+        session._client.request = MagicMock(return_value=make_mock_response(200, json_data={"id": "N_1"}))
+
+        def get_network(network_id):
+            return session.get(make_metadata("getNetwork"), f"/networks/{network_id}")
+
+        with priority("batch"):
+            results = list(run_bulk(get_network, ["N_1", "N_2", "N_3"], max_workers=3))
+
+        assert all(result.ok for result in results)
+        assert [c.args[1] for c in session._smart_flow.acquire.call_args_list] == ["batch"] * 3
+
+    def test_sharded_pull_keeps_enclosing_priority(self):
+        session = make_sync_session(smart_flow_enabled=True, pagination_time_shards=4)
+        session._client = httpx.Client(transport=httpx.MockTransport(lambda request: httpx.Response(200, json=[])))
+        params = {"t0": "2024-01-01T00:00:00Z", "t1": "2024-01-05T00:00:00Z"}
+
+        with priority("batch"):
+            session.get_pages(make_metadata(), "https://api.meraki.com/api/v1/organizations/1/apiRequests", params, "all")
+
+        priorities = [c.args[1] for c in session._smart_flow.acquire.call_args_list]
+        assert priorities == ["batch"] * 4
+
+    @patch("meraki.session.base.check_python_version")
+    def test_invalid_session_priority_rejected(self, mock_check):
+        with pytest.raises(SessionInputError):
+            meraki.DashboardAPI(API_KEY, suppress_logging=True, smart_flow_cache_path="", smart_flow_priority="urgent")
+
+    @patch("meraki.session.base.check_python_version")
+    def test_dashboard_priority_block(self, mock_check):
+        dashboard = meraki.DashboardAPI(API_KEY, suppress_logging=True, smart_flow_cache_path="")
+        with dashboard.priority("batch"):
+            assert request_priority(dashboard._session._smart_flow_priority) == "batch"
+        assert dashboard._session._parameters["smart_flow_priority"] == "normal"
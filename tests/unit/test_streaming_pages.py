@@ -0,0 +1,205 @@
+"""Tests for streamed iterator pagination (stream_get_pages) and JSONItemStream."""
+
+import json
+
+import httpx
+import pytest
+
+from meraki.codec import JSONItemStream
+from meraki.exceptions import APIError
+from tests.unit.conftest import make_async_session, make_sync_session
+from tests.unit.conftest import make_metadata as _metadata
+
+BASE = "https://api.meraki.com/api/v1"
+
+
+def _chunks(data: bytes, size: int):
+    return [data[i : i + size] for i in range(0, len(data), size)]
+
+
+class TestJSONItemStream:
+    @pytest.mark.parametrize("size", [1, 3, 7, 64, 4096])
+    def test_top_level_array_any_chunking(self, size):
+        items = [{"id": str(i), "name": 'a "quoted", [bracketed] {name}', "tags": ["x", "y"]} for i in range(20)]
+        stream = JSONItemStream()
+        out = []
+        for chunk in _chunks(json.dumps(items).encode(), size):
+            out.extend(stream.feed(chunk))
+        stream.close()
+        assert out == items
+        assert stream.key is None
+
+    @pytest.mark.parametrize("key", ["items", "events"])
+    def test_object_wrapped_list(self, key):
+        body = {"meta": {"items": [0]}, key: [{"id": 1}, {"id": 2}], "pageEndAt": "2024-01-01"}
+        stream = JSONItemStream()
+        out = []
+        for chunk in _chunks(json.dumps(body).encode(), 5):
+            out.extend(stream.feed(chunk))
+        stream.close()
+        assert out == [{"id": 1}, {"id": 2}]
+        assert stream.key == key
+
+    def test_items_yielded_before_body_completes(self):
+        stream = JSONItemStream()
+        assert stream.feed(b'[{"id": 1}, {"id"') == [{"id": 1}]
+        assert stream.feed(b": 2}]") == [{"id": 2}]
+
+    def test_escapes_split_across_chunks(self):
+        stream = JSONItemStream()
+        out = stream.feed(b'["a\\') + stream.feed(b'"b", "c\\\\"]')
+        stream.close()
+        assert out == ['a"b', "c\\"]
+
+    def test_scalars_and_empty_array(self):
+        stream = JSONItemStream()
+        assert stream.feed(b"[1, true, null, 2.5]") == [1, True, None, 2.5]
+        empty = JSONItemStream()
+        assert empty.feed(b"[ ]") == []
+        empty.close()
+
+    def test_buffer_bounded_by_item(self):
+        stream = JSONItemStream()
+        for i in range(1000):
+            stream.feed(json.dumps({"id": i, "pad": "x" * 100}).encode() + b",")
+            assert len(stream._buf) < 200
+        stream.feed(b"1]")
+
+    def test_truncated_body_raises(self):
+        stream = JSONItemStream()
+        stream.feed(b'[{"id": 1}, {"id": 2')
+        with pytest.raises(ValueError):
+            stream.close()
+
+    def test_invalid_item_raises(self):
+        with pytest.raises(ValueError):
+            JSONItemStream().feed(b"[{bad}]")
+
+
+def _paged_handler(pages, calls):
+    """MockTransport handler serving pages[i] (a list or dict) with next links, in small chunks."""
+
+    def handler(request):
+        index = int(request.url.params.get("page", "0"))
+        calls.append(index)
+        headers = {}
+        if index + 1 < len(pages):
+            headers["Link"] = f"<{BASE}/organizations/1/clients?page={index + 1}>; rel=next"
+        body = json.dumps(pages[index]).encode()
+        return httpx.Response(200, headers=headers, content=iter(_chunks(body, 16)))
+
+    return handler
+
+
+class TestSyncStreamedPages:
+    def _session(self, handler, **overrides):
+        kwargs = {"use_iterator_for_get_pages": True, "stream_get_pages": True, **overrides}
+        session = make_sync_session(**kwargs)
+        session._client = httpx.Client(transport=httpx.MockTransport(handler))
+        return session
+
+    def test_yields_items_across_pages(self):
+        calls = []
+        pages = [[{"id": 1}, {"id": 2}], {"items": [{"id": 3}]}]
+        session = self._session(_paged_handler(pages, calls))
+
+        results = list(session.get_pages(_metadata(), f"{BASE}/organizations/1/clients"))
+
+        assert results == [{"id": 1}, {"id": 2}, {"id": 3}]
+        assert calls == [0, 1]
+
+    def test_first_item_before_next_page_requested(self):
+        calls = []
+        pages = [[{"id": 1}, {"id": 2}], [{"id": 3}]]
+        session = self._session(_paged_handler(pages, calls))
+
+        iterator = session.get_pages(_metadata(), f"{BASE}/organizations/1/clients")
+        assert next(iterator) == {"id": 1}
+        assert calls == [0]
+        iterator.close()
+
+    def test_events_next_direction_reversed(self):
+        calls = []
+        pages = [{"events": [{"n": 2}, {"n": 1}]}]
+        session = self._session(_paged_handler(pages, calls))
+
+        results = list(session.get_pages(_metadata(operation="getNetworkEvents"), f"{BASE}/networks/N_1/events"))
+
+        assert results == [{"n": 1}, {"n": 2}]
+
+    def test_decodes_with_session_codec(self):
+        calls = []
+        session = self._session(_paged_handler([[{"id": 1}]], calls))
+        assert session._codec.name == "stdlib"
+        session._codec.loads = lambda data: {"decoded": bytes(data)}
+
+        results = list(session.get_pages(_metadata(), f"{BASE}/organizations/1/clients"))
+
+        assert results == [{"decoded": b'{"id": 1}'}]
+
+    def test_error_body_read_before_dispatch(self):
+        def handler(request):
+            return httpx.Response(400, json={"errors": ["bad perPage"]})
+
+        session = self._session(handler)
+
+        with pytest.raises(APIError) as exc_info:
+            list(session.get_pages(_metadata(), f"{BASE}/organizations/1/clients"))
+        assert exc_info.value.message == {"errors": ["bad perPage"]}
+
+    def test_legacy_pagination_ignores_stream_flag(self):
+        calls = []
+        session = self._session(_paged_handler([[{"id": 1}], [{"id": 2}]], calls), use_iterator_for_get_pages=False)
+
+        results = session.get_pages(_metadata(), f"{BASE}/organizations/1/clients")
+
+        assert results == [{"id": 1}, {"id": 2}]
+
+
+class TestAsyncStreamedPages:
+    def _session(self, pages, calls):
+        sync_handler = _paged_handler(pages, calls)
+
+        async def handler(request):
+            response = sync_handler(request)
+            body = b"".join(response.stream)
+
+            async def chunks():
+                for chunk in _chunks(body, 16):
+                    yield chunk
+
+            return httpx.Response(200, headers=response.headers, content=chunks())
+
+        session = make_async_session(use_iterator_for_get_pages=True, stream_get_pages=True)
+        session._client = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+        return session
+
+    async def test_yields_items_across_pages(self):
+        calls = []
+        session = self._session([[{"id": 1}, {"id": 2}], {"items": [{"id": 3}]}], calls)
+
+        results = [item async for item in session.get_pages(_metadata(), f"{BASE}/organizations/1/clients")]
+
+        assert results == [{"id": 1}, {"id": 2}, {"id": 3}]
+        assert calls == [0, 1]
+        await session.close()
+
+    async def test_events_next_direction_reversed(self):
+        session = self._session([{"events": [{"n": 2}, {"n": 1}]}], [])
+
+        results = [
+            item async for item in session.get_pages(_metadata(operation="getNetworkEvents"), f"{BASE}/networks/N_1/events")
+        ]
+
+        assert results == [{"n": 1}, {"n": 2}]
+        await session.close()
+
+    async def test_early_break_closes_stream(self):
+        session = self._session([[{"id": 1}, {"id": 2}], [{"id": 3}]], [])
+
+        iterator = session.get_pages(_metadata(), f"{BASE}/organizations/1/clients")
+        first = await iterator.__anext__()
+        await iterator.aclose()
+
+        assert first == {"id": 1}
+        await session.close()